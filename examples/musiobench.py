@@ -0,0 +1,1314 @@
+#!/usr/bin/env python2
+# vim: sw=4:ts=4:sts=4:fdm=indent:fdl=0:
+# -*- coding: UTF8 -*-
+#
+# Musio micro-benchmarks.
+# Copyright (C) 2013 Josiah Gordon <josiahg@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" Musio micro-benchmarks.  Run with the name of a benchmark and its
+arguments, e.g. 'musiobench.py wrapper -n 1000000'.
+
+"""
+
+from __future__ import print_function
+
+from timeit import default_timer as timer
+
+# The most ms importing each module from a fresh interpreter should take.
+# Codec modules not listed get the '*_file' budget and the ctypes bindings
+# the 'bindings' budget.
+_IMPORT_BUDGETS = {
+    'musio': 20,
+    'musio.io_util': 20,
+    '*_file': 30,
+    'bindings': 15,
+}
+
+# The generated ctypes bindings that define their names lazily.
+_BINDINGS = ('musio.ffmpeg.av', 'musio.ffmpeg._av', 'musio.flac.flac',
+             'musio.mp4v2._mp4v2', 'musio.mpg123._mpg123', 'musio.lame.lame',
+             'musio.mikmod._mikmod', 'musio.alsa.pcm')
+
+# Imports the module named in argv and prints the ms it took and the
+# modules it loaded.
+_IMPORT_SCRIPT = """
+import sys
+from timeit import default_timer as timer
+before = set(sys.modules)
+start = timer()
+__import__(sys.argv[1])
+elapsed = (timer() - start) * 1000
+loaded = [name for name in set(sys.modules) - before if sys.modules[name]]
+sys.stdout.write('%f %d\\n' % (elapsed, len(loaded)))
+"""
+
+
+def _time_calls(func, args, count, repeat=5):
+    """ _time_calls(func, args, count, repeat=5) -> Call func(*args) count
+    times, repeat times, and return the best time per call in nanoseconds.
+
+    """
+
+    # Avoid looking up range in the loop.
+    loop = range(count)
+
+    best = None
+    for _ in range(repeat):
+        start = timer()
+        for _ in loop:
+            func(*args)
+        elapsed = timer() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best * 1e9 / count
+
+
+def bench_wrapper(args):
+    """ Measure the per call overhead io_wrapper adds to the io methods.
+
+    """
+
+    from musio.io_base import AudioIO, io_wrapper
+
+    class PlainIO(AudioIO):
+        """ An AudioIO with unwrapped methods.
+
+        """
+
+        def __init__(self):
+            super(PlainIO, self).__init__('', 'rw')
+            self._closed = False
+
+        def read(self, size):
+            return b''
+
+        def write(self, data):
+            return 0
+
+        def tell(self):
+            return 0
+
+    class WrappedIO(PlainIO):
+        """ The same AudioIO with wrapped methods.
+
+        """
+
+        @io_wrapper
+        def read(self, size):
+            return b''
+        read.__annotations__ = {'size': int, 'return': bytes}
+
+        @io_wrapper
+        def write(self, data):
+            return 0
+        write.__annotations__ = {'data': bytes, 'return': int}
+
+        @io_wrapper
+        def tell(self):
+            return 0
+
+    plain = PlainIO()
+    wrapped = WrappedIO()
+    data = b'\x00' * 8192
+
+    print("%-8s %12s %12s %12s" % ('method', 'plain (ns)', 'wrapped (ns)',
+                                   'overhead'))
+    for name, call_args in (('read', (8192, )), ('write', (data, )),
+                            ('tell', ())):
+        plain_func = getattr(plain, name)
+        wrapped_func = getattr(wrapped, name)
+
+        plain_ns = _time_calls(plain_func, call_args, args.count)
+        wrapped_ns = _time_calls(wrapped_func, call_args, args.count)
+
+        print("%-8s %12.1f %12.1f %12.1f" % (name, plain_ns, wrapped_ns,
+                                             wrapped_ns - plain_ns))
+
+    return 0
+
+
+def bench_ring(args):
+    """ Compare building large reads from small decoded blocks by
+    concatenating strings with using a RingBuffer.
+
+    """
+
+    from ctypes import c_ubyte, string_at
+
+    from musio.buffer_util import RingBuffer
+
+    try:
+        import tracemalloc
+    except ImportError:
+        tracemalloc = None
+
+    # Pretend to be a decoder that decodes into its own ctypes buffer.
+    block = (c_ubyte * args.block_size)()
+
+    def concat_read(size, state=[b'']):
+        """ The old data += chunk; self._data = data[size:] pattern.
+
+        """
+
+        data = state[0]
+        while len(data) < size:
+            data += string_at(block, args.block_size)
+        state[0] = data[size:]
+        return data[:size]
+
+    ring = RingBuffer()
+
+    def ring_read(size):
+        """ The RingBuffer pattern.
+
+        """
+
+        while len(ring) < size:
+            ring.append_from(block, args.block_size)
+        return ring.read(size)
+
+    print("%d byte reads from %d byte blocks" % (args.size, args.block_size))
+    print("%-8s %14s %14s" % ('method', 'time (ms)', 'peak mem (KB)'))
+    for name, func in (('concat', concat_read), ('ring', ring_read)):
+        # Warm up so the ring buffer has grown.
+        func(args.size)
+
+        # The peak memory allocated during a read shows how many copies of
+        # the data were alive at once.
+        peak = '-'
+        if tracemalloc:
+            tracemalloc.start()
+            func(args.size)
+            peak = '%.1f' % (tracemalloc.get_traced_memory()[1] / 1024.0)
+            tracemalloc.stop()
+
+        read_ms = _time_calls(func, (args.size, ), args.count) / 1e6
+
+        print("%-8s %14.3f %14s" % (name, read_ms, peak))
+
+    return 0
+
+
+def bench_prefetch(args):
+    """ Play blocks from a source with uneven decode times, directly and
+    through a PrefetchReader, and count the blocks that missed their
+    deadline.
+
+    """
+
+    from time import sleep
+
+    from musio.io_base import AudioIO, io_wrapper
+    from musio.queued_io import PrefetchReader
+
+    class SpikySource(AudioIO):
+        """ A source that takes decode ms per block, and spike ms every
+        spike_every blocks.
+
+        """
+
+        def __init__(self):
+            super(SpikySource, self).__init__('', 'r')
+            self._closed = False
+            self._decoded = 0
+
+        @io_wrapper
+        def readinto(self, barray):
+            self._decoded += 1
+
+            # Sleeping releases the GIL like the ctypes decoders do.
+            if self._decoded % args.spike_every == 0:
+                sleep(args.spike / 1000.0)
+            else:
+                sleep(args.decode / 1000.0)
+
+            return len(barray)
+
+        @io_wrapper
+        def read(self, size):
+            return self._read_with_readinto(size)
+
+    def play(source):
+        """ Read count blocks, sleeping play ms after each like a device
+        write, and return the number of late blocks and the longest wait.
+
+        """
+
+        late = 0
+        longest = 0.0
+
+        # Let the prefetcher fill up like the device would.
+        source.read(args.block_size)
+        sleep(args.play / 1000.0)
+
+        for _ in range(args.count):
+            start = timer()
+            source.read(args.block_size)
+            waited = (timer() - start) * 1000
+
+            # The device has play ms of audio queued so anything longer
+            # than the time left after the write is an underrun.
+            if waited > args.play - args.decode:
+                late += 1
+            longest = max(longest, waited)
+
+            sleep(args.play / 1000.0)
+
+        return late, longest
+
+    print("%d blocks, %.1fms decode, %.1fms spike every %d, %.1fms play" %
+          (args.count, args.decode, args.spike, args.spike_every, args.play))
+    print("%-10s %8s %16s" % ('method', 'late', 'longest wait (ms)'))
+
+    late, longest = play(SpikySource())
+    print("%-10s %8d %16.2f" % ('direct', late, longest))
+
+    reader = PrefetchReader(SpikySource(), blocks=args.blocks,
+                            block_size=args.block_size)
+    late, longest = play(reader)
+    stats = reader.stats
+    reader.close()
+    print("%-10s %8d %16.2f" % ('prefetch', late, longest))
+    print("prefetch stats: %s" % stats)
+
+    return 0
+
+
+def bench_codec(args):
+    """ Time choosing a codec with get_codec the way open_file does, and
+    count the codec modules it imported.
+
+    """
+
+    import sys
+
+    start = timer()
+    from musio.io_util import get_codec
+    import_ms = (timer() - start) * 1000
+
+    start = timer()
+    codec = get_codec(args.filename, cached=False)
+    first_ms = (timer() - start) * 1000
+
+    call_ms = _time_calls(get_codec, (args.filename, [], False), args.count,
+                          repeat=1) / 1e6
+
+    modules = [name for name in sys.modules
+               if name.endswith('_file') and sys.modules[name]]
+
+    print("codec: %s" % codec)
+    print("%-24s %10.3f" % ('import io_util (ms)', import_ms))
+    print("%-24s %10.3f" % ('first get_codec (ms)', first_ms))
+    print("%-24s %10.3f" % ('later get_codec (ms)', call_ms))
+    print("%-24s %10d" % ('codec modules imported', len(modules)))
+
+    return 0
+
+
+def bench_imports(args):
+    """ Import musio, musio.io_util and each codec module in a fresh
+    interpreter and compare the best time to its budget.  Returns 1 if any
+    are over budget so it can be used as a check.
+
+    """
+
+    import sys
+    from glob import glob
+    from os import environ, pathsep
+    from os.path import abspath, basename, dirname, join
+    from subprocess import Popen, PIPE
+
+    # Import the musio next to this script.
+    root = dirname(dirname(abspath(__file__)))
+    env = dict(environ)
+    env['PYTHONPATH'] = pathsep.join(filter(None, (root,
+                                              env.get('PYTHONPATH', ''))))
+
+    modules = ['musio', 'musio.io_util']
+    modules.extend('musio.%s' % basename(path)[:-3] for path in
+                   sorted(glob(join(root, 'musio', '*_file.py'))))
+    if args.bindings:
+        modules.extend(_BINDINGS)
+
+    print("best of %d runs" % args.count)
+    print("%-24s %10s %10s %8s %6s" % ('module', 'time (ms)', 'budget',
+                                       'modules', ''))
+
+    over = 0
+    for module in modules:
+        default = 'bindings' if module in _BINDINGS else '*_file'
+        budget = _IMPORT_BUDGETS.get(module, _IMPORT_BUDGETS[default])
+
+        best = None
+        for _ in range(args.count):
+            proc = Popen([sys.executable, '-c', _IMPORT_SCRIPT, module],
+                         stdout=PIPE, stderr=PIPE, env=env)
+            output = proc.communicate()[0].split()
+            if proc.returncode != 0:
+                break
+
+            elapsed, loaded = float(output[0]), int(output[1])
+            if best is None or elapsed < best:
+                best = elapsed
+
+        if best is None:
+            print("%-24s %10s %10d %8s %6s" % (module, '-', budget, '-',
+                                               'error'))
+            continue
+
+        status = 'ok' if best <= budget else 'over'
+        if status == 'over':
+            over += 1
+
+        print("%-24s %10.2f %10d %8d %6s" % (module, best, budget, loaded,
+                                             status))
+
+    return 1 if over else 0
+
+
+# Conversions to compare with audioop as (name, source, target).
+_CONVERSIONS = (
+    ('resample', {'rate': 44100}, {'rate': 48000}),
+    ('u8 mono 22050', {'depth': 8, 'unsigned': True, 'channels': 1,
+                       'rate': 22050}, {}),
+    ('to u8 mono', {}, {'depth': 8, 'unsigned': True, 'channels': 1}),
+    ('s32 to s16 be', {'depth': 32}, {'bigendian': True}),
+    ('48000 to mono', {'rate': 48000}, {'rate': 44100, 'channels': 1}),
+    ('s24 packed', {'depth': 24, 'three_byte': True}, {}),
+)
+
+
+def _audioop_convert(audioop, data, source, target, state):
+    """ _audioop_convert(audioop, data, source, target, state) -> Convert
+    data from the source to the target format with audioop the way
+    ConversionPlan does and return it and the new ratecv state.
+
+    """
+
+    width = 3 if source['three_byte'] else source['depth'] // 8
+    out_width = target['depth'] // 8
+
+    if source['unsigned']:
+        data = audioop.bias(data, width, -(1 << (width * 8 - 1)))
+    if width != out_width:
+        data = audioop.lin2lin(data, width, out_width)
+    if source['channels'] < target['channels']:
+        data = audioop.tostereo(data, out_width, 1, 1)
+    elif source['channels'] > target['channels']:
+        data = audioop.tomono(data, out_width, 0.5, 0.5)
+    if source['rate'] != target['rate']:
+        data, state = audioop.ratecv(data, out_width, target['channels'],
+                                     source['rate'], target['rate'], state)
+    if target['unsigned']:
+        data = audioop.bias(data, out_width, 1 << (out_width * 8 - 1))
+    if target['bigendian']:
+        # Python 2 audioop can't swap bytes.
+        if hasattr(audioop, 'byteswap'):
+            data = audioop.byteswap(data, out_width)
+        else:
+            from musio.conversion_util import swap_endian
+            data = swap_endian(data, out_width)
+
+    return data, state
+
+
+def bench_convert(args):
+    """ Convert random audio with ConversionPlan and with a chain of audioop
+    calls, where audioop is available, and check they match exactly.
+    Returns 1 if any differ.
+
+    """
+
+    import random
+
+    from musio.conversion_util import ConversionPlan, audio_format
+
+    try:
+        import warnings
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            import audioop
+    except ImportError:
+        audioop = None
+
+    rand = random.Random(args.seed)
+
+    print("%d blocks of %d frames" % (args.count, args.frames))
+    print("%-16s %12s %12s %8s" % ('conversion', 'plan (ms)', 'audioop (ms)',
+                                   'match'))
+
+    failed = 0
+    for name, source, target in _CONVERSIONS:
+        source = audio_format(**source)
+        target = audio_format(**target)
+
+        width = 3 if source['three_byte'] else source['depth'] // 8
+        size = args.frames * width * source['channels']
+        blocks = [bytes(bytearray(rand.getrandbits(8) for _ in range(size)))
+                  for _ in range(args.count)]
+
+        # Linear resampling is the same as audioop.ratecv.
+        plan = ConversionPlan(source, target, 'linear')
+        start = timer()
+        plan_out = b''.join(plan.convert(block).tobytes()
+                            for block in blocks)
+        plan_ms = (timer() - start) * 1000
+
+        if not audioop:
+            print("%-16s %12.3f %12s %8s" % (name, plan_ms, '-', '-'))
+            continue
+
+        state = None
+        audioop_out = []
+        start = timer()
+        try:
+            for block in blocks:
+                data, state = _audioop_convert(audioop, block, source,
+                                               target, state)
+                audioop_out.append(data)
+        except audioop.error:
+            # Older audioop doesn't handle 24-bit samples.
+            print("%-16s %12.3f %12s %8s" % (name, plan_ms, '-', '-'))
+            continue
+        audioop_ms = (timer() - start) * 1000
+
+        match = plan_out == b''.join(audioop_out)
+        if not match:
+            failed += 1
+
+        print("%-16s %12.3f %12.3f %8s" % (name, plan_ms, audioop_ms,
+                                           'yes' if match else 'NO'))
+
+    return 1 if failed else 0
+
+
+# The sample rate conversions timed by the resample benchmark.
+_RATIOS = ((44100, 48000), (22050, 48000), (32000, 44100))
+
+
+def bench_resample(args):
+    """ Resample seconds of random stereo 16-bit audio in blocks with each
+    quality and ratio, and print how many times faster than realtime it is.
+
+    """
+
+    import numpy
+
+    from musio.conversion_util import ConversionPlan, RESAMPLE_QUALITIES
+    from musio.conversion_util import audio_format
+
+    print("%d seconds in blocks of %d frames, times realtime" %
+          (args.seconds, args.frames))
+    print(("%-8s" + " %14s" * len(_RATIOS)) %
+          (('quality', ) + tuple('%d->%d' % ratio for ratio in _RATIOS)))
+
+    for quality in RESAMPLE_QUALITIES:
+        speeds = []
+        for inrate, outrate in _RATIOS:
+            frames = inrate * args.seconds
+            samples = numpy.random.randint(-32768, 32768, frames * 2)
+            data = samples.astype(numpy.int16).tobytes()
+            size = args.frames * 4
+
+            plan = ConversionPlan(audio_format(rate=inrate),
+                                  audio_format(rate=outrate), quality)
+            start = timer()
+            for offset in range(0, len(data), size):
+                plan.convert(data[offset:offset + size])
+            speeds.append(args.seconds / (timer() - start))
+
+        print(("%-8s" + " %14.1f" * len(speeds)) %
+              ((quality, ) + tuple(speeds)))
+
+    return 0
+
+
+# The depth, rate and channels of the FLAC streams the flac benchmark
+# decodes.
+_FLAC_FORMATS = ((16, 44100, 2), (24, 96000, 2), (24, 192000, 2),
+                 (16, 48000, 6), (24, 96000, 6), (24, 48000, 8))
+
+
+def bench_flac(args):
+    """ Feed FlacFile's write callback random blocks like libFLAC decodes
+    and read them back, and print how many times faster than realtime it is
+    for each format.  Streams with more than two channels are also timed
+    mixed down to stereo.
+
+    """
+
+    from ctypes import POINTER, c_int, cast, pointer
+
+    import numpy
+
+    from musio.buffer_util import RingBuffer
+    from musio.conversion_util import ConversionPlan, audio_format
+    from musio.flac import flac as _flac
+    from musio.flac_file import FlacFile
+
+    frames = args.frames
+
+    print("%d seconds in blocks of %d frames, times realtime" %
+          (args.seconds, frames))
+    print("%-16s %12s %12s" % ('format', 'decode', 'to stereo'))
+
+    for depth, rate, channels in _FLAC_FORMATS:
+        # The channel buffers libFLAC would pass to the callback.
+        channel_list = [(c_int * frames)() for _ in range(channels)]
+        buf = (POINTER(c_int) * channels)(*[cast(samples, POINTER(c_int))
+                                            for samples in channel_list])
+
+        for samples in channel_list:
+            limit = 1 << (depth - 1)
+            numpy.ctypeslib.as_array(samples)[:] = \
+                numpy.random.randint(-limit, limit, frames)
+
+        frame = _flac.FLAC__Frame()
+        frame.header.blocksize = frames
+        frame.header.channels = channels
+        frame.header.bits_per_sample = depth
+        frame.header.sample_rate = rate
+        frame_pointer = pointer(frame)
+
+        source = audio_format(depth=depth, rate=rate, channels=channels,
+                              three_byte=depth == 24)
+        size = frames * channels * (3 if depth == 24 else depth // 8)
+        blocks = rate * args.seconds // frames
+
+        speeds = []
+        for plan in (None, ConversionPlan(source, audio_format(rate=rate))):
+            if plan and channels == 2:
+                break
+
+            # Skip opening a file so only the callback is timed.
+            flac_file = FlacFile.__new__(FlacFile)
+            flac_file._data_buffer = RingBuffer()
+            flac_file._interleaved = None
+            flac_file._packed = None
+
+            start = timer()
+            for _ in range(blocks):
+                flac_file._write_status(None, frame_pointer, buf, None)
+                data = flac_file._data_buffer.read(size)
+                if plan:
+                    plan.convert(data)
+            speeds.append(blocks * frames / float(rate) / (timer() - start))
+
+        speeds.append(None)
+        print("%-16s %12.1f %12s" %
+              ('%d/%g %dch' % (depth, rate / 1000.0, channels), speeds[0],
+               '%.1f' % speeds[1] if speeds[1] else '-'))
+
+    return 0
+
+
+# The depth and rate of the streams the flacenc benchmark encodes.
+_FLAC_ENCODE_FORMATS = ((16, 44100), (24, 96000))
+
+
+def bench_flac_encode(args):
+    """ Encode a tone with noise to FLAC with FlacFile in one thread and in
+    args.threads, and print how many times faster than realtime it is.
+
+    """
+
+    import os
+    import tempfile
+
+    import numpy
+
+    from musio.conversion_util import pack_three_byte
+    from musio.flac_file import FlacFile
+
+    rng = numpy.random.RandomState(0)
+    handle, filename = tempfile.mkstemp(suffix='.flac')
+    os.close(handle)
+
+    print("%d seconds of stereo, compression level %d, times realtime" %
+          (args.seconds, args.level))
+    print("%-12s %10s %10s" % ('format', '1 thread',
+                               '%d threads' % args.threads))
+
+    try:
+        for depth, rate in _FLAC_ENCODE_FORMATS:
+            frames = rate * args.seconds
+            limit = 1 << (depth - 1)
+            tone = numpy.sin(numpy.arange(frames) * (2 * numpy.pi * 440.0 /
+                                                     rate)) * limit / 2
+            samples = (tone[:, numpy.newaxis] +
+                       rng.randint(-256, 256, (frames, 2))).astype('i4')
+
+            if depth == 24:
+                data = pack_three_byte(samples.reshape(-1)).tobytes()
+            else:
+                data = samples.astype('<i2').tobytes()
+            block_size = 4096 * 2 * (3 if depth == 24 else 2)
+
+            speeds = []
+            for threads in (1, args.threads):
+                start = timer()
+                with FlacFile(filename, 'w', depth=depth, rate=rate,
+                              compression_level=args.level,
+                              threads=threads) as flac_file:
+                    for offset in range(0, len(data), block_size):
+                        flac_file.write(data[offset:offset + block_size])
+                speeds.append(args.seconds / (timer() - start))
+
+            print("%-12s %10.1f %10.1f" %
+                  ('%d/%g' % (depth, rate / 1000.0), speeds[0], speeds[1]))
+    finally:
+        os.remove(filename)
+
+    return 0
+
+
+def bench_flac_seek(args):
+    """ Encode a FLAC file with and without a SEEKTABLE, and print how many
+    ms it takes to seek to a random sample and read a block from there.
+
+    """
+
+    import os
+    import random
+    import tempfile
+
+    import numpy
+
+    from musio.flac_file import FlacFile
+
+    rate = 44100
+    frames = rate * args.seconds
+    rng = numpy.random.RandomState(0)
+    samples = (numpy.sin(numpy.arange(frames) * (2 * numpy.pi * 440.0 /
+                                                 rate))[:, numpy.newaxis] *
+               8192 + rng.randint(-256, 256, (frames, 2))).astype('<i2')
+    data = samples.tobytes()
+
+    random.seed(0)
+    targets = [random.randrange(frames) for _ in range(args.count)]
+
+    print("%d seeks in %d seconds of 16/44.1 stereo, ms" %
+          (args.count, args.seconds))
+    print("%-16s %8s %8s %8s" % ('file', 'median', 'mean', 'max'))
+
+    for name, length in (('no seektable', 0), ('seektable', frames)):
+        handle, filename = tempfile.mkstemp(suffix='.flac')
+        os.close(handle)
+
+        try:
+            with FlacFile(filename, 'w', rate=rate, length=length,
+                          seek_spacing=args.spacing) as flac_file:
+                for offset in range(0, len(data), 65536):
+                    flac_file.write(data[offset:offset + 65536])
+
+            times = []
+            with FlacFile(filename) as flac_file:
+                for target in targets:
+                    start = timer()
+                    flac_file.position = target
+                    flac_file.read(4096)
+                    times.append((timer() - start) * 1000)
+        finally:
+            os.remove(filename)
+
+        times.sort()
+        print("%-16s %8.3f %8.3f %8.3f" % (name, times[len(times) // 2],
+                                           sum(times) / len(times),
+                                           times[-1]))
+
+    return 0
+
+
+def bench_mp3(args):
+    """ Decode an mp3 (a long VBR file shows it best) with readinto into one
+    buffer, with read, and with readinto inside silence the way every
+    buffer used to be decoded, and print the time per buffer.
+
+    """
+
+    import sys
+
+    from musio.mp3_file import MP3File
+    from musio.io_util import silence
+
+    def decode(mp3_file, buf):
+        count = 0
+        while mp3_file.readinto(buf):
+            count += 1
+        return count
+
+    def decode_read(mp3_file, buf):
+        count = 0
+        while mp3_file.read(len(buf)):
+            count += 1
+        return count
+
+    def decode_silenced(mp3_file, buf):
+        count = 0
+        while True:
+            with silence(sys.stderr):
+                if not mp3_file.readinto(buf):
+                    break
+            count += 1
+        return count
+
+    print("%-18s %10s %10s %10s" % ('loop', 'buffers', 'us/buffer',
+                                    'x realtime'))
+
+    for name, func in (('readinto', decode), ('read', decode_read),
+                       ('readinto+silence', decode_silenced)):
+        with MP3File(args.filename) as mp3_file:
+            mp3_file.loops = 0
+            buf = bytearray(args.size)
+            seconds = mp3_file.length / float(mp3_file.rate)
+
+            start = timer()
+            count = func(mp3_file, buf)
+            elapsed = timer() - start
+
+        print("%-18s %10d %10.2f %10.1f" % (name, count,
+                                            elapsed * 1e6 / max(count, 1),
+                                            seconds / elapsed))
+
+    return 0
+
+
+def bench_mp3_encode(args):
+    """ Encode a tone with noise to mp3 from 16-bit, 8-bit and float
+    samples, and print how many times faster than realtime it is.
+
+    """
+
+    import os
+    import tempfile
+
+    import numpy
+
+    from musio.conversion_util import convert_samples
+    from musio.mp3_file import MP3File
+
+    rate = 44100
+    frames = rate * args.seconds
+    rng = numpy.random.RandomState(0)
+    tone = (numpy.sin(numpy.arange(frames) * (2 * numpy.pi * 440.0 /
+                                              rate))[:, numpy.newaxis] * 0.25 +
+            rng.uniform(-0.01, 0.01, (frames, 2))).astype(numpy.float32)
+
+    handle, filename = tempfile.mkstemp(suffix='.mp3')
+    os.close(handle)
+
+    print("%d seconds of stereo, quality %d" % (args.seconds, args.quality))
+    print("%-10s %10s %10s" % ('format', 'KiB', 'x realtime'))
+
+    try:
+        for name, depth, unsigned, floatp in (('s16', 16, False, False),
+                                              ('u8', 8, True, False),
+                                              ('float', 32, False, True)):
+            if floatp:
+                data = tone.tobytes()
+            else:
+                dtype = numpy.uint8 if depth == 8 else numpy.int16
+                data = convert_samples(tone, 32, False, dtype).tobytes()
+            block_size = args.frames * 2 * (depth // 8)
+
+            start = timer()
+            with MP3File(filename, 'w', depth=depth, rate=rate, channels=2,
+                         unsigned=unsigned, quality=args.quality,
+                         comment_dict={}, floatp=floatp) as mp3_file:
+                for offset in range(0, len(data), block_size):
+                    mp3_file.write(data[offset:offset + block_size])
+            elapsed = timer() - start
+
+            print("%-10s %10d %10.1f" % (name,
+                                         os.path.getsize(filename) // 1024,
+                                         args.seconds / elapsed))
+    finally:
+        os.remove(filename)
+
+    return 0
+
+
+def bench_mp3_parallel(args):
+    """ Encode a tone with noise to mp3 with encode_parallel in one process
+    and in args.workers, and print how many times faster than realtime it
+    is and the speedup.
+
+    """
+
+    import os
+    import tempfile
+
+    import numpy
+
+    from musio.mp3_file import encode_parallel
+    from musio.raw_file import RawFile
+
+    rate = 44100
+    frames = rate * args.seconds
+    rng = numpy.random.RandomState(0)
+    samples = (numpy.sin(numpy.arange(frames) * (2 * numpy.pi * 440.0 /
+                                                 rate))[:, numpy.newaxis] *
+               8192 + rng.randint(-256, 256, (frames, 2))).astype('<i2')
+
+    handle, source = tempfile.mkstemp(suffix='.raw')
+    os.write(handle, samples.tobytes())
+    os.close(handle)
+    handle, dest = tempfile.mkstemp(suffix='.mp3')
+    os.close(handle)
+
+    print("%d seconds of stereo, quality %d" % (args.seconds, args.quality))
+    print("%-10s %10s %10s %10s" % ('workers', 'KiB', 'x realtime',
+                                    'speedup'))
+
+    try:
+        speeds = []
+        for workers in (1, args.workers):
+            with RawFile(source) as raw_file:
+                start = timer()
+                encode_parallel(raw_file, dest, workers=workers,
+                                quality=args.quality)
+                speeds.append(args.seconds / (timer() - start))
+
+            print("%-10d %10d %10.1f %10.2f" % (workers,
+                                                os.path.getsize(dest) // 1024,
+                                                speeds[-1],
+                                                speeds[-1] / speeds[0]))
+    finally:
+        os.remove(source)
+        os.remove(dest)
+
+    return 0
+
+
+def bench_vorbis_encode(args):
+    """ Encode a tone with noise to Vorbis from 8, 16, 24-bit and float
+    samples, and print how many times faster than realtime it is.
+
+    """
+
+    import os
+    import tempfile
+
+    import numpy
+
+    from musio.conversion_util import convert_samples, pack_three_byte
+    from musio.vorbis_file import VorbisFile
+
+    rate = 44100
+    frames = rate * args.seconds
+    rng = numpy.random.RandomState(0)
+    tone = (numpy.sin(numpy.arange(frames) * (2 * numpy.pi * 440.0 /
+                                              rate))[:, numpy.newaxis] * 0.25 +
+            rng.uniform(-0.01, 0.01, (frames, 2))).astype(numpy.float32)
+
+    handle, filename = tempfile.mkstemp(suffix='.ogg')
+    os.close(handle)
+
+    print("%d seconds of stereo, quality %g" % (args.seconds, args.quality))
+    print("%-10s %10s %10s" % ('format', 'KiB', 'x realtime'))
+
+    try:
+        for name, depth, unsigned, floatp in (('u8', 8, True, False),
+                                              ('s16', 16, False, False),
+                                              ('s24', 24, False, False),
+                                              ('float', 32, False, True)):
+            if floatp:
+                data = tone.tobytes()
+            elif depth == 24:
+                samples = convert_samples(tone, 32, False, numpy.int32,
+                                          out_depth=24)
+                data = pack_three_byte(samples.reshape(-1)).tobytes()
+            else:
+                dtype = numpy.uint8 if depth == 8 else numpy.int16
+                data = convert_samples(tone, 32, False, dtype).tobytes()
+            sample_size = 3 if depth == 24 else depth // 8
+            block_size = args.frames * 2 * sample_size
+
+            start = timer()
+            with VorbisFile(filename, 'w', depth=depth, rate=rate, channels=2,
+                            unsigned=unsigned, quality=args.quality,
+                            comment_dict={}, floatp=floatp) as vorbis_file:
+                for offset in range(0, len(data), block_size):
+                    vorbis_file.write(data[offset:offset + block_size])
+            elapsed = timer() - start
+
+            print("%-10s %10d %10.1f" % (name,
+                                         os.path.getsize(filename) // 1024,
+                                         args.seconds / elapsed))
+    finally:
+        os.remove(filename)
+
+    return 0
+
+
+def bench_vorbis(args):
+    """ Decode an ogg vorbis file with readinto into one buffer, with read,
+    and to floats with ov_read_float, and print the time per buffer.
+
+    """
+
+    from musio.vorbis_file import VorbisFile
+
+    def decode(vorbis_file, buf):
+        count = 0
+        while vorbis_file.readinto(buf):
+            count += 1
+        return count
+
+    def decode_read(vorbis_file, buf):
+        count = 0
+        while vorbis_file.read(len(buf)):
+            count += 1
+        return count
+
+    print("%-18s %10s %10s %10s" % ('loop', 'buffers', 'us/buffer',
+                                    'x realtime'))
+
+    for name, func, floatp in (('readinto', decode, False),
+                               ('read', decode_read, False),
+                               ('readinto float', decode, True)):
+        with VorbisFile(args.filename, floatp=floatp) as vorbis_file:
+            vorbis_file.loops = 0
+            buf = bytearray(args.size)
+            seconds = vorbis_file.length / float(vorbis_file.rate)
+
+            start = timer()
+            count = func(vorbis_file, buf)
+            elapsed = timer() - start
+
+        print("%-18s %10d %10.2f %10.1f" % (name, count,
+                                            elapsed * 1e6 / max(count, 1),
+                                            seconds / elapsed))
+
+    return 0
+
+
+def bench_ffmpeg(args):
+    """ Decode a file with FFmpegFile (a long AAC or WMA shows it best),
+    counting the frames and sample buffers FFmpeg allocates on the way, and
+    print them with the time per buffer.
+
+    """
+
+    from musio.ffmpeg import av
+    from musio.ffmpeg_file import FFmpegFile
+
+    counts = {}
+
+    def counted(name):
+        func = getattr(av, name)
+
+        def wrapper(*args):
+            counts[name] = counts.get(name, 0) + 1
+            return func(*args)
+
+        setattr(av, name, wrapper)
+        return func
+
+    names = ('avcodec_alloc_frame', 'av_samples_alloc')
+    originals = [(name, counted(name)) for name in names]
+
+    try:
+        with FFmpegFile(args.filename, floatp=args.floatp) as ffmpeg_file:
+            ffmpeg_file.loops = 0
+            seconds = ffmpeg_file.length / float(ffmpeg_file.rate)
+
+            count = 0
+            start = timer()
+            while ffmpeg_file.read(args.size):
+                count += 1
+            elapsed = timer() - start
+    finally:
+        for name, func in originals:
+            setattr(av, name, func)
+
+    print("%10s %10s %10s" % ('buffers', 'us/buffer', 'x realtime'))
+    print("%10d %10.2f %10.1f" % (count, elapsed * 1e6 / max(count, 1),
+                                  seconds / elapsed))
+    for name in names:
+        print("%-20s %d" % (name, counts.get(name, 0)))
+
+    return 0
+
+
+def bench_seek(args):
+    """ Seek an audio file to random frames with each precision, and print
+    how many ms a seek and the read after it take and how many frames from
+    the target the read started.
+
+    """
+
+    import random
+
+    from musio import open_file
+
+    print("%d seeks in %s, ms and frames from the target" %
+          (args.count, args.filename))
+    print("%-8s %8s %8s %8s %10s" % ('policy', 'median', 'mean', 'max',
+                                     'max error'))
+
+    for precision in ('fast', 'exact'):
+        times = []
+        errors = []
+        with open_file(args.filename) as audio_file:
+            random.seed(0)
+            targets = [random.randrange(max(1, audio_file.length))
+                       for _ in range(args.count)]
+            frame_size = audio_file.channels * audio_file.depth // 8
+            for target in targets:
+                start = timer()
+                audio_file.seek(target, precision=precision)
+                data = audio_file.read(4096)
+                times.append((timer() - start) * 1000)
+
+                # Where the data read started.
+                landed = audio_file.position - len(data) // frame_size
+                errors.append(abs(landed - target))
+
+        times.sort()
+        print("%-8s %8.3f %8.3f %8.3f %10d" % (precision,
+                                               times[len(times) // 2],
+                                               sum(times) / len(times),
+                                               times[-1], max(errors)))
+
+    return 0
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(description="Musio micro-benchmarks")
+    subparsers = parser.add_subparsers(title='benchmarks')
+
+    wrapper_parser = subparsers.add_parser('wrapper',
+                                           help='io_wrapper call overhead')
+    wrapper_parser.add_argument('-n', '--count', action='store',
+                                default=1000000, type=int,
+                                help='Number of calls to time', dest='count')
+    wrapper_parser.set_defaults(func=bench_wrapper)
+
+    ring_parser = subparsers.add_parser('ring',
+                                        help='RingBuffer against concatenation')
+    ring_parser.add_argument('-s', '--size', action='store', default=1048576,
+                             type=int, help='Size of each read', dest='size')
+    ring_parser.add_argument('-b', '--block-size', action='store',
+                             default=4608, type=int,
+                             help='Size of each decoded block',
+                             dest='block_size')
+    ring_parser.add_argument('-n', '--count', action='store', default=20,
+                             type=int, help='Number of reads to time',
+                             dest='count')
+    ring_parser.set_defaults(func=bench_ring)
+
+    prefetch_parser = subparsers.add_parser('prefetch',
+                                            help='PrefetchReader against '
+                                            'reading directly')
+    prefetch_parser.add_argument('-n', '--count', action='store', default=200,
+                                 type=int, help='Number of blocks to play',
+                                 dest='count')
+    prefetch_parser.add_argument('-k', '--blocks', action='store', default=8,
+                                 type=int, help='Blocks to decode ahead',
+                                 dest='blocks')
+    prefetch_parser.add_argument('-b', '--block-size', action='store',
+                                 default=4096, type=int,
+                                 help='Size of each block', dest='block_size')
+    prefetch_parser.add_argument('-d', '--decode', action='store', default=2.0,
+                                 type=float, help='Decode ms per block',
+                                 dest='decode')
+    prefetch_parser.add_argument('-s', '--spike', action='store', default=30.0,
+                                 type=float, help='Decode ms of a slow block',
+                                 dest='spike')
+    prefetch_parser.add_argument('-e', '--spike-every', action='store',
+                                 default=25, type=int,
+                                 help='How often a block is slow',
+                                 dest='spike_every')
+    prefetch_parser.add_argument('-p', '--play', action='store', default=10.0,
+                                 type=float, help='Play ms per block',
+                                 dest='play')
+    prefetch_parser.set_defaults(func=bench_prefetch)
+
+    codec_parser = subparsers.add_parser('codec',
+                                         help='get_codec lookup time')
+    codec_parser.add_argument('filename', action='store',
+                              help='File to find a codec for')
+    codec_parser.add_argument('-n', '--count', action='store', default=100,
+                              type=int, help='Number of lookups to time',
+                              dest='count')
+    codec_parser.set_defaults(func=bench_codec)
+
+    imports_parser = subparsers.add_parser('imports',
+                                           help='Import time of each module '
+                                           'against its budget')
+    imports_parser.add_argument('-n', '--count', action='store', default=5,
+                                type=int, help='Number of imports to time',
+                                dest='count')
+    imports_parser.add_argument('-b', '--bindings', action='store_true',
+                                default=False,
+                                help='Also time the ctypes bindings',
+                                dest='bindings')
+    imports_parser.set_defaults(func=bench_imports)
+
+    convert_parser = subparsers.add_parser('convert',
+                                           help='ConversionPlan against '
+                                           'audioop')
+    convert_parser.add_argument('-n', '--count', action='store', default=20,
+                                type=int, help='Number of blocks to convert',
+                                dest='count')
+    convert_parser.add_argument('-f', '--frames', action='store',
+                                default=4096, type=int,
+                                help='Frames in each block', dest='frames')
+    convert_parser.add_argument('-s', '--seed', action='store', default=0,
+                                type=int, help='Random seed', dest='seed')
+    convert_parser.set_defaults(func=bench_convert)
+
+    resample_parser = subparsers.add_parser('resample',
+                                            help='Resampling speed by '
+                                            'quality')
+    resample_parser.add_argument('-s', '--seconds', action='store',
+                                 default=10, type=int,
+                                 help='Seconds of audio to resample',
+                                 dest='seconds')
+    resample_parser.add_argument('-f', '--frames', action='store',
+                                 default=4096, type=int,
+                                 help='Frames in each block', dest='frames')
+    resample_parser.set_defaults(func=bench_resample)
+
+    flac_parser = subparsers.add_parser('flac',
+                                        help='FLAC write callback speed')
+    flac_parser.add_argument('-s', '--seconds', action='store', default=10,
+                             type=int, help='Seconds of audio to decode',
+                             dest='seconds')
+    flac_parser.add_argument('-f', '--frames', action='store', default=4096,
+                             type=int, help='Frames in each block',
+                             dest='frames')
+    flac_parser.set_defaults(func=bench_flac)
+
+    flacenc_parser = subparsers.add_parser('flacenc',
+                                           help='FLAC encoding speed')
+    flacenc_parser.add_argument('-s', '--seconds', action='store',
+                                default=10, type=int,
+                                help='Seconds of audio to encode',
+                                dest='seconds')
+    flacenc_parser.add_argument('-l', '--level', action='store', default=5,
+                                type=int, help='Compression level',
+                                dest='level')
+    flacenc_parser.add_argument('-t', '--threads', action='store',
+                                default=4, type=int,
+                                help='Threads to compare with one',
+                                dest='threads')
+    flacenc_parser.set_defaults(func=bench_flac_encode)
+
+    flacseek_parser = subparsers.add_parser('flacseek',
+                                            help='FLAC seek latency with and '
+                                            'without a SEEKTABLE')
+    flacseek_parser.add_argument('-s', '--seconds', action='store',
+                                 default=600, type=int,
+                                 help='Seconds of audio in the file',
+                                 dest='seconds')
+    flacseek_parser.add_argument('-n', '--count', action='store', default=200,
+                                 type=int, help='Number of seeks to time',
+                                 dest='count')
+    flacseek_parser.add_argument('-p', '--spacing', action='store',
+                                 default=10.0, type=float,
+                                 help='Seconds between seek points',
+                                 dest='spacing')
+    flacseek_parser.set_defaults(func=bench_flac_seek)
+
+    mp3_parser = subparsers.add_parser('mp3', help='MP3 decode loop time')
+    mp3_parser.add_argument('filename', action='store',
+                            help='MP3 file to decode, e.g. an hour of VBR')
+    mp3_parser.add_argument('-b', '--size', action='store', default=4096,
+                            type=int, help='Bytes per buffer', dest='size')
+    mp3_parser.set_defaults(func=bench_mp3)
+
+    mp3enc_parser = subparsers.add_parser('mp3enc',
+                                          help='MP3 encoding speed')
+    mp3enc_parser.add_argument('-s', '--seconds', action='store', default=60,
+                               type=int, help='Seconds of audio to encode',
+                               dest='seconds')
+    mp3enc_parser.add_argument('-q', '--quality', action='store', default=2,
+                               type=int, help='lame quality', dest='quality')
+    mp3enc_parser.add_argument('-f', '--frames', action='store',
+                               default=4096, type=int,
+                               help='Frames in each write', dest='frames')
+    mp3enc_parser.set_defaults(func=bench_mp3_encode)
+
+    mp3par_parser = subparsers.add_parser('mp3par',
+                                          help='Segmented MP3 encoding '
+                                          'speedup')
+    mp3par_parser.add_argument('-s', '--seconds', action='store',
+                               default=600, type=int,
+                               help='Seconds of audio to encode',
+                               dest='seconds')
+    mp3par_parser.add_argument('-q', '--quality', action='store', default=2,
+                               type=int, help='lame quality', dest='quality')
+    mp3par_parser.add_argument('-w', '--workers', action='store', default=0,
+                               type=int,
+                               help='Processes to compare with one (0 for '
+                               'one per cpu)', dest='workers')
+    mp3par_parser.set_defaults(func=bench_mp3_parallel)
+
+    vorbisenc_parser = subparsers.add_parser('vorbisenc',
+                                             help='Vorbis encoding speed')
+    vorbisenc_parser.add_argument('-s', '--seconds', action='store',
+                                  default=60, type=int,
+                                  help='Seconds of audio to encode',
+                                  dest='seconds')
+    vorbisenc_parser.add_argument('-q', '--quality', action='store',
+                                  default=0.5, type=float,
+                                  help='Vorbis quality (-0.1 to 1.0)',
+                                  dest='quality')
+    vorbisenc_parser.add_argument('-f', '--frames', action='store',
+                                  default=4096, type=int,
+                                  help='Frames in each write', dest='frames')
+    vorbisenc_parser.set_defaults(func=bench_vorbis_encode)
+
+    vorbis_parser = subparsers.add_parser('vorbis',
+                                          help='Vorbis decode loop time')
+    vorbis_parser.add_argument('filename', action='store',
+                               help='Ogg vorbis file to decode')
+    vorbis_parser.add_argument('-b', '--size', action='store', default=65536,
+                               type=int, help='Bytes per buffer', dest='size')
+    vorbis_parser.set_defaults(func=bench_vorbis)
+
+    ffmpeg_parser = subparsers.add_parser('ffmpeg',
+                                          help='FFmpeg decode loop time and '
+                                          'allocations')
+    ffmpeg_parser.add_argument('filename', action='store',
+                               help='File to decode, e.g. an hour of AAC or '
+                               'WMA')
+    ffmpeg_parser.add_argument('-b', '--size', action='store', default=65536,
+                               type=int, help='Bytes per buffer', dest='size')
+    ffmpeg_parser.add_argument('-f', '--float', action='store_true',
+                               default=False, help='Decode to floats',
+                               dest='floatp')
+    ffmpeg_parser.set_defaults(func=bench_ffmpeg)
+
+    seek_parser = subparsers.add_parser('seek',
+                                        help='Fast and exact seek latency')
+    seek_parser.add_argument('filename', action='store',
+                             help='Audio file to seek in')
+    seek_parser.add_argument('-n', '--count', action='store', default=200,
+                             type=int, help='Number of seeks to time',
+                             dest='count')
+    seek_parser.set_defaults(func=bench_seek)
+
+    args = parser.parse_args()
+
+    raise SystemExit(args.func(args))
@@ -88,7 +88,8 @@ def main(args):
 
             with open_file(output, 'w', depth=in_file.depth, rate=in_file.rate,
                         channels=in_file.channels, quality=quality,
-                        comment_dict=comment_dict) as out_file:
+                        comment_dict=comment_dict,
+                        workers=args['workers']) as out_file:
                 in_file.loops = 0
 
                 if args['show_position']:
@@ -184,6 +185,11 @@ if __name__ == '__main__':
                         default=False, 
                         help='Print a list of valid genres and exit.',
                         dest='list_genres')
+    parser.add_argument('-w', '--workers', action='store', default=1,
+                        type=int,
+                        help='Processes to encode mp3 segments in (0 for '
+                        'one per cpu)',
+                        dest='workers')
     parser.add_argument('-d', '--debug', action='store_true', default=False,
                         help='Enable debug error messages.',
                         dest='debug')
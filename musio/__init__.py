@@ -29,7 +29,9 @@ __all__ = ['aac_file',
            'all_file',
            'alsa_io',
            'audiality_file',
+           'buffer_util',
            'conversion_util',
+           'crc_util',
            'dumb_file',
            'dummy_file',
            'dummy_io',
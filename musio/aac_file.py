@@ -23,15 +23,23 @@
 
 """
 
-from os.path import getsize as os_getsize
+from bisect import bisect_right
 
 from .io_base import AudioIO, io_wrapper
+from .buffer_util import RingBuffer
 # from .faad import _neaacdec
 
 from .import_util import LazyImport
 
 _neaacdec = LazyImport('faad._neaacdec', globals(), locals(), ['_neaacdec'], 1)
 
+# The sample rate of each ADTS sampling frequency index.
+_ADTS_RATES = (96000, 88200, 64000, 48000, 44100, 32000, 24000, 22050,
+               16000, 12000, 11025, 8000, 7350)
+
+# How many bytes at a time the ADTS frame index is built from.
+_INDEX_CHUNK = 1 << 16
+
 __supported_dict = {
     'ext': ['.aac'],
     'handler': 'AACFile',
@@ -53,6 +61,62 @@ def bytes_to_pointer(data_type, data):
     return c_pointer.from_buffer_copy(data)
 
 
+def _adts_index(aac_file):
+    """ _adts_index(aac_file) -> Return the byte offset, sample rate and
+    frame count of every ADTS frame in aac_file, stopping at the first thing
+    that is not one.  The file is read in large chunks and the headers are
+    found in them.
+
+    """
+
+    index = []
+
+    # data holds the file from the offset base.
+    data = bytearray(aac_file.read(_INDEX_CHUNK))
+    base = 0
+
+    # Skip an ID3v2 tag.
+    offset = 0
+    if data[:3] == b'ID3' and len(data) >= 10:
+        offset = 10 + ((data[6] << 21) | (data[7] << 14) |
+                       (data[8] << 7) | data[9])
+
+    while True:
+        start = offset - base
+        if start + 7 > len(data):
+            if start > len(data):
+                # Skip what was never read, e.g. the rest of a big tag.
+                aac_file.seek(offset)
+                data = bytearray()
+            else:
+                del data[:start]
+            base = offset
+
+            chunk = aac_file.read(_INDEX_CHUNK)
+            if not chunk:
+                break
+            data += chunk
+            continue
+
+        if data[start] != 0xff or data[start + 1] & 0xf0 != 0xf0:
+            break
+
+        rate_index = (data[start + 2] >> 2) & 0xf
+        length = ((data[start + 3] & 0x3) << 11) | \
+            (data[start + 4] << 3) | (data[start + 5] >> 5)
+        if rate_index >= len(_ADTS_RATES) or length < 7:
+            break
+
+        # Each raw data block holds 1024 frames.
+        index.append((offset, _ADTS_RATES[rate_index],
+                      1024 * ((data[start + 6] & 0x3) + 1)))
+        offset += length
+
+    aac_file.seek(0)
+
+    return index
+
+
 class AACDecoder(object):
     """ An object to decode AAC audio data.
 
@@ -180,11 +244,9 @@ class AACDecoder(object):
         self._decoder = None
         self._frame_info = None
 
-    def decode(self, data, data_size):
-        """ Return raw audio data decoded from 'data.'
-
-        data must be of type _neaacdec.POINTER(ctypes._neaacdec.c_ubyte)
-        data_size must be of type ctypes.c_uint32
+    def _decode(self, data, data_size):
+        """ Decode the next frame in 'data' and return a pointer to the
+        decoded samples and their size in bytes.
 
         """
 
@@ -205,24 +267,59 @@ class AACDecoder(object):
             elif frame_info.error != 0:
                 raise BufferError(err.decode())
             elif frame_info.samples <= 0:
-                return b''
+                return None, 0
             else:
-                # Process the decoded data.
-
                 # Calculate the number of bytes read.
                 bytes_read = frame_info.samples * \
                     _neaacdec.sizeof(_neaacdec.c_short)
 
-                # Put the data in a buffer and return it.
-                byte_buffer = _neaacdec.string_at(sample_buffer, bytes_read)
-                return byte_buffer
+                return sample_buffer, bytes_read
 
         except BufferError as err:
             # Catch the errors that we raised and print a message about
             # them.
             print("Error decoding data: %s" % err)
+            return None, 0
+
+    def decode(self, data, data_size):
+        """ Return raw audio data decoded from 'data.'
+
+        data must be of type _neaacdec.POINTER(ctypes._neaacdec.c_ubyte)
+        data_size must be of type ctypes.c_uint32
+
+        """
+
+        sample_buffer, bytes_read = self._decode(data, data_size)
+
+        if not bytes_read:
             return b''
 
+        # Put the data in a buffer and return it.
+        return _neaacdec.string_at(sample_buffer, bytes_read)
+
+    def post_seek_reset(self, frame):
+        """ post_seek_reset(frame) -> Tell the decoder the next data it gets
+        is ADTS frame number frame.
+
+        """
+
+        _neaacdec.NeAACDecPostSeekReset(self._decoder, frame)
+
+    def decode_into(self, data, data_size, ring_buffer):
+        """ Decode 'data' straight into the RingBuffer ring_buffer and return
+        the number of bytes added.
+
+        data must be of type _neaacdec.POINTER(ctypes._neaacdec.c_ubyte)
+        data_size must be of type ctypes.c_uint32
+
+        """
+
+        sample_buffer, bytes_read = self._decode(data, data_size)
+
+        ring_buffer.append_from(sample_buffer, bytes_read)
+
+        return bytes_read
+
 
 class AACFile(AudioIO):
     """ A file like object for reading aacs.
@@ -243,24 +340,73 @@ class AACFile(AudioIO):
         self._info_dict['name'] = filename
 
         self._aac_file = None
+
+        # The byte offset and first frame of each ADTS frame.
+        self._offsets = []
+        self._starts = []
+
         self._aac_decoder = self._open(filename)
 
-        self._data = b''
+        self._data = RingBuffer()
+
+        # The frame after the last one decoded and the frame an exact seek
+        # drops decoded data up to.
+        self._decoded_end = 0
+        self._discard_to = -1
+
+    def to_seconds(self, position):
+        """ Convert the provided position/length to seconds.
+
+        """
+
+        return position / self._rate
 
     def _set_position(self, position):
-        """ Change the position of playback.
+        """ Change the position of playback to exactly frame position.  The
+        ADTS frame before the one holding it is decoded and dropped so the
+        decoder has warmed up by then.
 
         """
 
-        self._aac_file.seek(position)
+        if not self._starts:
+            # Without an index only the start can be found.
+            return self._seek_frame(0, 0)
+
+        index = max(0, bisect_right(self._starts, position) - 1)
+        self._seek_frame(max(0, index - 1), max(0, position))
+
+    def _set_position_fast(self, position):
+        """ Change the position of playback to the start of the ADTS frame
+        holding frame position.
+
+        """
+
+        if not self._starts:
+            return self._seek_frame(0, 0)
+
+        self._seek_frame(max(0, bisect_right(self._starts, position) - 1), -1)
+
+    def _seek_frame(self, index, discard_to):
+        """ _seek_frame(index, discard_to) -> Start decoding at ADTS frame
+        index, dropping decoded data up to frame discard_to.
+
+        """
+
+        self._aac_file.seek(self._offsets[index] if self._offsets else 0)
+        self._aac_decoder.post_seek_reset(index)
+
+        self._data.clear()
+        self._decoded_end = self._starts[index] if self._starts else 0
+        self._discard_to = discard_to
 
     def _get_position(self):
-        """ Updates the position variable.
+        """ Returns the frame that will be read next.
 
         """
 
-        # Update the position.
-        return self._aac_file.tell()
+        frame_size = self._channels * self._depth // 8
+
+        return self._decoded_end - len(self._data) // frame_size
 
     def _open(self, filename):
         """ _open(filename) -> Load the specified file.
@@ -269,7 +415,7 @@ class AACFile(AudioIO):
 
         self._aac_file = open(filename, 'rb', buffering=0)
 
-        self._length = os_getsize(filename.encode('utf-8', 'surrogateescape'))
+        index = _adts_index(self._aac_file)
 
         # Read the first 4 bytes from the file, so we can get the
         # channel count, depth, and sample rate of the file.
@@ -291,6 +437,16 @@ class AACFile(AudioIO):
         self._rate = aac_decoder.rate
         self._depth = aac_decoder.depth
 
+        # Implicit SBR is upsampled, so a frame can decode to more samples
+        # than its header says.
+        start = 0
+        for offset, rate, frames in index:
+            self._offsets.append(offset)
+            self._starts.append(start)
+            start += frames * self._rate // rate
+
+        self._length = start
+
         self._closed = False
 
         return aac_decoder
@@ -308,6 +464,8 @@ class AACFile(AudioIO):
 
         r_size = self._aac_decoder.min_stream_size
 
+        frame_size = self._channels * self._depth // 8
+
         while len(data) < size:
             # Read aac encoded data from the file.
             encoded_data += self._aac_file.read(r_size)
@@ -315,11 +473,18 @@ class AACFile(AudioIO):
             if len(encoded_data) == 0:
                 if self._loops != -1 and self._loop_count >= self._loops:
                     if len(data) != 0:
-                        data += b'\x00' * (size - len(data))
+                        data.pad(size)
                     break
                 else:
                     self._loop_count += 1
-                    self.seek(0)
+
+                    # Go back to the start keeping what is in the buffer,
+                    # which is then counted as before it.
+                    self._aac_file.seek(self._offsets[0] if self._offsets
+                                        else 0)
+                    self._aac_decoder.post_seek_reset(0)
+                    self._decoded_end = len(data) // frame_size
+                    self._discard_to = -1
 
                     # Reset the read size
                     r_size = self._aac_decoder.min_stream_size
@@ -329,9 +494,19 @@ class AACFile(AudioIO):
             # Cast the bytes object to a type POINTER(ctypes.c_ubyte).
             encoded_ubytes = bytes_to_pointer(_neaacdec.c_ubyte, encoded_data)
 
-            # Decode into a temporary buffer.
-            temp_data = self._aac_decoder.decode(encoded_ubytes,
-                                                 len(encoded_data))
+            # Decode into the data buffer.
+            decoded = self._aac_decoder.decode_into(encoded_ubytes,
+                                                    len(encoded_data), data)
+
+            start = self._decoded_end
+            self._decoded_end += decoded // frame_size
+
+            # Drop what decodes before the frame an exact seek was to.
+            if self._discard_to > start:
+                data.skip((min(self._discard_to, self._decoded_end) - start)
+                          * frame_size)
+                if self._discard_to <= self._decoded_end:
+                    self._discard_to = -1
 
             # Remove the number of bytes not used.
             encoded_data = encoded_data[self._aac_decoder.bytesconsumed:]
@@ -340,19 +515,14 @@ class AACFile(AudioIO):
             # size.
             r_size = self._aac_decoder.bytesconsumed
 
-            # Append the data to the buffer.
-            data += temp_data
-
         if len(encoded_data) > 0:
             # Seek back the bytes that were not used so we can read them again
             # the next time.
             self._aac_file.seek(-len(encoded_data), 1)
 
-        # Store extra data for next read.
-        self._data = data[size:]
-
-        # Make sure we return only the number of bytes requested.
-        return data[:size]
+        # Return only the number of bytes requested and keep the rest for
+        # the next read.
+        return data.read(size)
     read.__annotations__ = {'size': int, 'return': bytes}
 
     def close(self):
@@ -23,12 +23,12 @@
 
 """
 
-import audioop
 from os.path import basename as os_basename
 
 from .io_base import AudioIO, io_wrapper
 from .io_util import get_codec
-from .conversion_util import swap_endian
+from .conversion_util import ConversionPlan, audio_format
+from .buffer_util import RingBuffer
 
 __supported_dict = {
     'ext': ['.*'],
@@ -46,11 +46,13 @@ class AllFile(AudioIO):
     _valid_depth = (32, 16, 8)
 
     def __init__(self, filename, mode='r', depth=16, rate=44100, channels=2,
-                 bigendian=False, unsigned=False, **kwargs):
+                 bigendian=False, unsigned=False, floatp=False, **kwargs):
         """ AllFile(self, filename, mode='r', depth=16, rate=44100, channels=2,
-                    bigendian=False, unsigned=False, **kwargs) -> Loads the
-        correct codec for the file and acts as a wrapper providing additional
-        funcionality.
+                    bigendian=False, unsigned=False, floatp=False, **kwargs)
+        -> Loads the correct codec for the file and acts as a wrapper
+        providing additional funcionality.  If floatp is True the codec is
+        asked to decode to 32-bit floats, and the data is converted to them
+        if it can't.
 
         """
 
@@ -58,7 +60,7 @@ class AllFile(AudioIO):
 
         self._supported_modes = getattr(codec, '_supported_modes', 'r')
 
-        source = codec(filename, mode=mode, **kwargs)
+        source = codec(filename, mode=mode, floatp=floatp, **kwargs)
 
         super(AllFile, self).__init__(filename, mode, source.depth,
                                       source.rate, source.channels)
@@ -68,12 +70,10 @@ class AllFile(AudioIO):
         self._bigendian = bigendian
         self._unsigned = unsigned
 
-        self._state = None
-
         annotations = getattr(codec.read, '__annotations__')
         self.read.__annotations__.update(annotations)
 
-        self._buffer = annotations.get('return', bytes)()
+        self._buffer = RingBuffer()
         self._buffer_size = self._source.buffer_size
 
         self._length = self._source.length
@@ -82,45 +82,19 @@ class AllFile(AudioIO):
 
         self._closed = False
 
-        if self._depth != self._source.depth:
-            self._convert_depth = lambda data: \
-                audioop.lin2lin(data, self._source._width, self._width)
-        else:
-            self._convert_depth = lambda data: data
-
-        if self._unsigned != self._source.unsigned:
-            self._convert_unsigned = lambda data: \
-                audioop.bias(data, self._source._width, 128)
-        else:
-            self._convert_unsigned = lambda data: data
-
-        # Make it stereo
-        if self._source.channels < self._channels:
-            self._convert_channels = lambda data: audioop.tostereo(data,
-                                                                   self._width,
-                                                                   1, 1)
-        # Make it mono
-        elif self._source.channels > self._channels:
-            self._convert_channels = lambda data: audioop.tomono(data,
-                                                                 self._width,
-                                                                 1, 1)
-        else:
-            self._convert_channels = lambda data: data
-
-        # Convert the sample rate of the data to the requested rate.
-        if self._rate != self._source.rate:
-            self._convert_rate = lambda data: audioop.ratecv(data, self._width,
-                                                             self._channels,
-                                                             self._source.rate,
-                                                             self._rate,
-                                                             self._state)
-        else:
-            self._convert_rate = lambda data: (data, self._state)
-
-        if self._bigendian != self._source.bigendian:
-            self._convert_endian = swap_endian
-        else:
-            self._convert_endian = lambda data: data
+        if floatp:
+            # Float samples are 32 bits and always signed.
+            self._floatp = True
+            self._depth = 32
+            self._width = 4
+            self._unsigned = False
+            self.three_byte = False
+        elif self._source.three_byte:
+            self.three_byte = True
+
+        # Convert the data from the codec to this format in one step.
+        self._plan = ConversionPlan(audio_format(self._source),
+                                    audio_format(self))
 
     def __repr__(self):
         """ __repr__ -> Returns a python expression to recreate this instance.
@@ -148,6 +122,20 @@ class AllFile(AudioIO):
 
         self._source.position = position
 
+        # Don't resample across the seek.
+        self._plan.reset()
+
+    def _set_position_fast(self, position):
+        """ Change the position of playback to a point near position that
+        the source can get to quickly.
+
+        """
+
+        self._source.seek(position, precision='fast')
+
+        # Don't resample across the seek.
+        self._plan.reset()
+
     def _get_position(self):
         """ Returns the current position.
 
@@ -188,22 +176,13 @@ class AllFile(AudioIO):
                 return temp_data
 
             if not temp_data:
+                # The resampler holds back the end of the stream.
+                data.append(self._plan.flush())
                 if len(data) != 0:
-                    data += b'\x00' * (size - len(data))
+                    data.pad(size)
                 break
 
-            temp_data = self._convert_depth(temp_data)
-
-            temp_data = self._convert_unsigned(temp_data)
-
-            temp_data = self._convert_channels(temp_data)
-
-            temp_data, self._state = self._convert_rate(temp_data)
-
-            temp_data = self._convert_endian(temp_data)
-
-            data += temp_data
-
-        self._buffer = data[size:]
+            data.append(self._plan.convert(temp_data))
 
-        return data[:size]
+        return data.read(size)
+    read.__annotations__ = {'size': int, 'return': bytes}
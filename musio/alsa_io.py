@@ -86,6 +86,7 @@ class Alsa(DevIO):
         else:
             pcm_format = alsapcm.SND_PCM_FORMAT_U16_LE
 
+        self._floatp = floatp
         self._three_byte = three_byte
         self._pcm_format = pcm_format
         self._soft_resample = 1
@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+# vim: sw=4:ts=4:sts=4:fdm=indent:fdl=0:
+# -*- coding: UTF8 -*-
+#
+# Buffer utilities.
+# Copyright (C) 2013 Josiah Gordon <josiahg@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" RingBuffer      A reusable byte buffer for decoded audio data
+    reuse_array     Keep using a numpy array while it is big enough
+
+"""
+
+from ctypes import c_char, c_void_p
+from ctypes import addressof as ctypes_addressof
+from ctypes import cast as ctypes_cast
+from ctypes import memmove as ctypes_memmove
+from ctypes import memset as ctypes_memset
+
+
+class RingBuffer(object):
+    """ A growable ring buffer of bytes.  Decoders append what they decode
+    and read takes it back out, so the data is only copied once on the way in
+    and once on the way out.
+
+    """
+
+    def __init__(self, size=65536):
+        """ RingBuffer(size=65536) -> Create a ring buffer that can hold size
+        bytes before it has to grow.
+
+        """
+
+        super(RingBuffer, self).__init__()
+
+        self._capacity = 0
+
+        # Where the data starts and how much there is.
+        self._start = 0
+        self._length = 0
+
+        self._buffer = bytearray()
+        self._view = memoryview(self._buffer)
+        self._address = 0
+
+        self._grow(size)
+
+    def __repr__(self):
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        return '%s(size=%s)' % (self.__class__.__name__, self._capacity)
+
+    def __len__(self):
+        """ The number of bytes in the buffer.
+
+        """
+
+        return self._length
+
+    @property
+    def capacity(self):
+        """ How many bytes the buffer can hold before it has to grow.
+
+        """
+
+        return self._capacity
+
+    def _grow(self, size):
+        """ _grow(size) -> Make room for at least size bytes.  The data is
+        moved to the start of the new buffer.
+
+        """
+
+        capacity = max(self._capacity * 2, 4096)
+        while capacity < size:
+            capacity *= 2
+
+        new_buffer = bytearray(capacity)
+        self._copy_out(new_buffer, 0, self._length)
+
+        self._buffer = new_buffer
+        self._view = memoryview(new_buffer)
+
+        # The address of the buffer is used to copy from C pointers.
+        self._address = ctypes_addressof((c_char * capacity).from_buffer(
+                                         new_buffer))
+        self._capacity = capacity
+        self._start = 0
+
+    def _copy_out(self, barray, offset, size):
+        """ _copy_out(barray, offset, size) -> Copy size bytes from the start
+        of the data to barray at offset without consuming them.
+
+        """
+
+        first = min(size, self._capacity - self._start)
+
+        barray[offset:offset + first] = self._view[self._start:
+                                                   self._start + first]
+        if size > first:
+            barray[offset + first:offset + size] = self._view[:size - first]
+
+    def _consume(self, size):
+        """ _consume(size) -> Drop size bytes from the start of the data.
+
+        """
+
+        self._length -= size
+
+        if self._length:
+            self._start = (self._start + size) % self._capacity
+        else:
+            # Start over so the next read is not split.
+            self._start = 0
+
+    def _reserve(self, size):
+        """ _reserve(size) -> Make room for size more bytes and return the
+        two (offset, size) regions they will be written to.
+
+        """
+
+        if self._length + size > self._capacity:
+            self._grow(self._length + size)
+
+        end = (self._start + self._length) % self._capacity
+        first = min(size, self._capacity - end)
+
+        self._length += size
+
+        return (end, first), (0, size - first)
+
+    def append(self, data):
+        """ append(data) -> Copy the bytes in data into the buffer.
+
+        """
+
+        data = memoryview(data)
+        (end, first), (_, rest) = self._reserve(len(data))
+
+        self._view[end:end + first] = data[:first]
+        if rest:
+            self._view[:rest] = data[first:]
+
+    def append_from(self, pointer, size):
+        """ append_from(pointer, size) -> Copy size bytes from the ctypes
+        pointer, array or address into the buffer.
+
+        """
+
+        if not size:
+            return
+
+        # Get the address so it can be offset.
+        pointer = ctypes_cast(pointer, c_void_p).value
+
+        (end, first), (_, rest) = self._reserve(size)
+
+        ctypes_memmove(self._address + end, pointer, first)
+        if rest:
+            ctypes_memmove(self._address, pointer + first, rest)
+
+    def pad(self, size):
+        """ pad(size) -> Add zeros to the buffer until it holds at least size
+        bytes.
+
+        """
+
+        if self._length >= size:
+            return
+
+        (end, first), (_, rest) = self._reserve(size - self._length)
+
+        ctypes_memset(self._address + end, 0, first)
+        if rest:
+            ctypes_memset(self._address, 0, rest)
+
+    def consume_into(self, barray, offset=0):
+        """ consume_into(barray, offset=0) -> Move as many bytes as will fit
+        into the writable buffer barray starting at offset, and return how
+        many were moved.
+
+        """
+
+        size = min(len(barray) - offset, self._length)
+
+        self._copy_out(barray, offset, size)
+        self._consume(size)
+
+        return size
+
+    def read(self, size):
+        """ read(size) -> Remove and return up to size bytes.
+
+        """
+
+        size = min(size, self._length)
+
+        if self._start + size <= self._capacity:
+            # It is all in one piece so it only has to be copied once.
+            data = self._view[self._start:self._start + size].tobytes()
+        else:
+            data = bytearray(size)
+            self._copy_out(data, 0, size)
+            data = bytes(data)
+
+        self._consume(size)
+
+        return data
+
+    def skip(self, size):
+        """ skip(size) -> Drop up to size bytes from the start of the buffer
+        without copying them.
+
+        """
+
+        self._consume(min(size, self._length))
+
+    def clear(self):
+        """ clear() -> Empty the buffer.
+
+        """
+
+        self._start = 0
+        self._length = 0
+
+
+def reuse_array(array, size, dtype):
+    """ reuse_array(array, size, dtype) -> Return array if it is a numpy
+    array of dtype with room for size items, otherwise a new one that is.
+
+    """
+
+    import numpy
+
+    dtype = numpy.dtype(dtype)
+    if array is None or array.dtype != dtype or len(array) < size:
+        array = numpy.empty(max(size, 1), dtype)
+
+    return array
@@ -21,27 +21,1139 @@
 
 """ Audio conversion utilities.
 
-"""
+    audio_format        The sample format of an AudioIO as a dictionary
+    mix_matrix          The matrix to mix one channel layout into another
+    ConversionPlan      Convert audio data between two sample formats
+    LinearResampler     Change the sample rate of blocks of frames
+    PolyphaseResampler  Change the sample rate with a windowed sinc filter
+    ConvertReader       Reader that converts the data from another reader
+    interleave          Interleave separate arrays of channel samples
 
-from array import array
-try:
-    import audioop
-except ImportError as err:
-    print("audioop functionality will be disabled because of error: %s" % (err))
-    audioop = None
+"""
 
 from .io_base import AudioIO, io_wrapper
+from .buffer_util import RingBuffer
+
+
+def swap_endian(data, width=2):
+    """ swap_endian(data, width=2) -> Swap the endianness of the width byte
+    samples in data.
+
+    """
+
+    import numpy
+
+    if width == 1:
+        return bytes(data)
+
+    samples = numpy.frombuffer(data, numpy.uint8)
+    samples = samples[:len(samples) - len(samples) % width]
+
+    return samples.reshape(-1, width)[:, ::-1].tobytes()
+
+
+def sample_dtype(depth, unsigned=False, bigendian=False, floatp=False,
+                 three_byte=False):
+    """ sample_dtype(depth, unsigned=False, bigendian=False, floatp=False,
+    three_byte=False) -> Return the numpy dtype of one sample in the given
+    format.  Three byte samples have no dtype so they are unpacked into
+    native 32-bit integers.
+
+    """
+
+    import numpy
+
+    order = '>' if bigendian else '<'
+
+    if floatp:
+        return numpy.dtype('%sf%d' % (order, 8 if depth == 64 else 4))
+    elif three_byte:
+        return numpy.dtype('u4' if unsigned else 'i4')
+    elif depth == 8:
+        return numpy.dtype('u1' if unsigned else 'i1')
+
+    # 24-bit samples that are not packed use 32-bit containers.
+    width = 4 if depth == 24 else depth // 8
+
+    return numpy.dtype('%s%s%d' % (order, 'u' if unsigned else 'i', width))
+
+
+def unpack_three_byte(data, bigendian=False, unsigned=False, out=None):
+    """ unpack_three_byte(data, bigendian=False, unsigned=False, out=None) ->
+    Unpack the packed 24-bit samples in the uint8 array data into 32-bit
+    integers.
+
+    """
+
+    import numpy
+
+    data = numpy.asarray(data, numpy.uint8).reshape(-1, 3)
+    if bigendian:
+        data = data[:, ::-1]
+
+    if out is None:
+        out = numpy.empty(len(data), 'u4' if unsigned else 'i4')
+
+    # Put the three bytes at the top of each 32-bit sample and shift them
+    # down, which sign extends signed samples.
+    top = out.view(numpy.uint8).reshape(-1, 4)
+    if not numpy.little_endian:
+        top = top[:, ::-1]
+    top[:, 0] = 0
+    top[:, 1] = data[:, 0]
+    top[:, 2] = data[:, 1]
+    top[:, 3] = data[:, 2]
+    out >>= 8
+
+    return out
+
+
+def pack_three_byte(samples, bigendian=False, out=None):
+    """ pack_three_byte(samples, bigendian=False, out=None) -> Pack the
+    24-bit values in the 32-bit integer array samples into a uint8 array
+    three bytes per sample.
+
+    """
+
+    import numpy
+
+    if out is None:
+        out = numpy.empty(len(samples) * 3, numpy.uint8)
+
+    packed = out.reshape(-1, 3)
+    if bigendian:
+        packed = packed[:, ::-1]
+
+    # Storing to uint8 keeps the low byte of each shifted sample.
+    packed[:, 0] = samples
+    packed[:, 1] = samples >> 8
+    packed[:, 2] = samples >> 16
+
+    return out
+
+
+def interleave(channel_list, out):
+    """ interleave(channel_list, out) -> Interleave the samples of the
+    arrays in channel_list into the flat array out and return it.
+
+    """
+
+    channels = len(channel_list)
+    frames = out.reshape(-1, channels)
+
+    for channel, samples in enumerate(channel_list):
+        frames[:, channel] = samples
+
+    return out
+
+
+def convert_samples(samples, depth, unsigned, dtype, out=None,
+                    out_depth=None):
+    """ convert_samples(samples, depth, unsigned, dtype, out=None,
+    out_depth=None) -> Convert the numpy array samples of depth bit integers
+    (or floats between -1.0 and 1.0) to dtype and return the result.  Floats
+    are scaled to between -1.0 and 1.0 and integers are scaled to out_depth
+    bits, or the full size of dtype.
+
+    """
+
+    import numpy
+
+    dtype = numpy.dtype(dtype)
+
+    if out is None:
+        out = numpy.empty(samples.shape, dtype)
+
+    if samples.dtype.kind != 'f':
+        # Center unsigned samples around zero.
+        offset = (1 << (depth - 1)) if unsigned else 0
+
+    if dtype.kind == 'f':
+        if samples.dtype.kind == 'f':
+            out[...] = samples
+        else:
+            numpy.subtract(samples, offset, out=out, dtype=dtype)
+            out *= 1.0 / (1 << (depth - 1))
+        return out
+
+    out_depth = out_depth or dtype.itemsize * 8
+    out_offset = (1 << (out_depth - 1)) if dtype.kind == 'u' else 0
+
+    if samples.dtype.kind == 'f':
+        # Scale and clip to the integer range.
+        scale = 1 << (out_depth - 1)
+        temp = samples * float(scale)
+        numpy.clip(temp, -scale, scale - 1, out=temp)
+        temp += out_offset
+        out[...] = temp
+        return out
+
+    temp = samples.astype(numpy.int64)
+    temp -= offset
+
+    shift = out_depth - depth
+    if shift > 0:
+        temp <<= shift
+    elif shift < 0:
+        temp >>= -shift
+
+    temp += out_offset
+    out[...] = temp
+
+    return out
+
+
+def to_float32(data, depth, unsigned=False, bigendian=False,
+               three_byte=False):
+    """ to_float32(data, depth, unsigned=False, bigendian=False,
+    three_byte=False) -> Convert the integer samples in data to native
+    32-bit floats between -1.0 and 1.0 and return the bytes.
+
+    """
+
+    import numpy
+
+    samples = numpy.frombuffer(data, numpy.uint8)
+
+    if three_byte:
+        samples = unpack_three_byte(samples, bigendian, unsigned)
+    else:
+        dtype = sample_dtype(depth, unsigned, bigendian)
+        samples = samples[:len(samples) - len(samples) % dtype.itemsize]
+        samples = samples.view(dtype)
+
+    return convert_samples(samples, depth, unsigned,
+                           numpy.float32).tobytes()
+
+
+def from_float32(data, depth, unsigned=False, bigendian=False):
+    """ from_float32(data, depth, unsigned=False, bigendian=False) -> Convert
+    the native 32-bit float samples in data to depth bit integers and return
+    the bytes.
+
+    """
+
+    import numpy
+
+    samples = numpy.frombuffer(data, numpy.float32, len(data) // 4)
+
+    return convert_samples(samples, 32, False,
+                           sample_dtype(depth, unsigned, bigendian),
+                           out_depth=depth).tobytes()
+
+
+def audio_format(fileobj=None, **kwargs):
+    """ audio_format(fileobj=None, **kwargs) -> Return a dictionary of the
+    sample format of fileobj, or the defaults, updated with kwargs.
+
+    The keys are depth, rate, channels, bigendian, unsigned, floatp,
+    three_byte, planar and layout.  Planar data has all the samples of each
+    channel together instead of interleaved.  The layout is a tuple of the
+    channel names in order, or None for the one in CHANNEL_LAYOUTS.
+
+    """
+
+    format_dict = {
+        'depth': 16,
+        'rate': 44100,
+        'channels': 2,
+        'bigendian': False,
+        'unsigned': False,
+        'floatp': False,
+        'three_byte': False,
+        'planar': False,
+        'layout': None,
+    }
+
+    if fileobj is not None:
+        format_dict.update({
+            'depth': fileobj._depth,
+            'rate': fileobj._rate,
+            'channels': fileobj._channels,
+            'bigendian': fileobj._bigendian,
+            'unsigned': fileobj._unsigned,
+            'floatp': fileobj.floatp,
+            'three_byte': getattr(fileobj, 'three_byte', False),
+            'layout': getattr(fileobj, '_layout', None),
+        })
+
+    format_dict.update(kwargs)
+
+    return format_dict
+
+
+# The channel layouts by the number of channels, in the order WAVE, FLAC
+# and FFmpeg use.
+CHANNEL_LAYOUTS = {
+    1: ('FC', ),
+    2: ('FL', 'FR'),
+    3: ('FL', 'FR', 'FC'),
+    4: ('FL', 'FR', 'BL', 'BR'),
+    5: ('FL', 'FR', 'FC', 'BL', 'BR'),
+    6: ('FL', 'FR', 'FC', 'LFE', 'BL', 'BR'),
+    7: ('FL', 'FR', 'FC', 'LFE', 'BC', 'SL', 'SR'),
+    8: ('FL', 'FR', 'FC', 'LFE', 'BL', 'BR', 'SL', 'SR'),
+}
+
+# The channel layouts in the order Vorbis uses.
+VORBIS_LAYOUTS = {
+    1: ('FC', ),
+    2: ('FL', 'FR'),
+    3: ('FL', 'FC', 'FR'),
+    4: ('FL', 'FR', 'BL', 'BR'),
+    5: ('FL', 'FC', 'FR', 'BL', 'BR'),
+    6: ('FL', 'FC', 'FR', 'BL', 'BR', 'LFE'),
+    7: ('FL', 'FC', 'FR', 'SL', 'SR', 'BC', 'LFE'),
+    8: ('FL', 'FC', 'FR', 'SL', 'SR', 'BL', 'BR', 'LFE'),
+}
+
+# -3 dB.
+_HALF_POWER = 0.7071067811865476
+
+# Where to mix each channel that the target layout doesn't have, as
+# alternative groups of (channel, gain) tried in order.  These are the
+# ITU-R BS.775 downmix gains, and the LFE channel is left out.
+_CHANNEL_FOLDS = {
+    'FC': ((('FL', _HALF_POWER), ('FR', _HALF_POWER)), ),
+    'FL': ((('FC', _HALF_POWER), ), ),
+    'FR': ((('FC', _HALF_POWER), ), ),
+    'FLC': ((('FL', 1.0), ), (('FC', 1.0), )),
+    'FRC': ((('FR', 1.0), ), (('FC', 1.0), )),
+    'BL': ((('SL', 1.0), ), (('FL', _HALF_POWER), )),
+    'BR': ((('SR', 1.0), ), (('FR', _HALF_POWER), )),
+    'SL': ((('BL', 1.0), ), (('FL', _HALF_POWER), )),
+    'SR': ((('BR', 1.0), ), (('FR', _HALF_POWER), )),
+    'BC': ((('BL', _HALF_POWER), ('BR', _HALF_POWER)),
+           (('SL', _HALF_POWER), ('SR', _HALF_POWER)),
+           (('FL', 0.5), ('FR', 0.5))),
+    'LFE': (),
+}
+
 
+def _route_channel(name, layout, visited=()):
+    """ _route_channel(name, layout, visited=()) -> Return a dictionary of
+    the gain to mix the channel name into each channel of layout with.
 
-def swap_endian(data):
-    """ swap_endian(data) -> Swap the endianness of the data.
+    """
+
+    if name in layout:
+        return {name: 1.0}
+
+    visited += (name, )
+
+    for group in _CHANNEL_FOLDS.get(name, ()):
+        gains = {}
+        for channel, gain in group:
+            if channel in visited:
+                continue
+
+            routed = _route_channel(channel, layout, visited)
+            for target, target_gain in routed.items():
+                gains[target] = gains.get(target, 0.0) + gain * target_gain
+
+        if gains:
+            return gains
+
+    return {}
+
+
+def mix_matrix(source_layout, target_layout, normalize=True):
+    """ mix_matrix(source_layout, target_layout, normalize=True) -> Return
+    the (target channels, source channels) numpy array of gains to mix
+    frames in source_layout into target_layout.  If normalize is True the
+    gains into each target channel are scaled so they can't clip.
 
     """
 
-    data_array = array('h', data)
-    data_array.byteswap()
+    import numpy
+
+    matrix = numpy.zeros((len(target_layout), len(source_layout)))
+
+    for column, name in enumerate(source_layout):
+        for target, gain in _route_channel(name, target_layout).items():
+            matrix[target_layout.index(target), column] = gain
+
+    if normalize:
+        total = matrix.sum(axis=1)
+        total[total < 1.0] = 1.0
+        matrix /= total[:, numpy.newaxis]
+
+    return matrix
+
+
+def _gcd(a, b):
+    """ _gcd(a, b) -> Return the greatest common divisor of a and b.
+
+    """
+
+    while b:
+        a, b = b, a % b
+
+    return a
+
+
+class LinearResampler(object):
+    """ Change the sample rate of blocks of frames by linear interpolation,
+    keeping the state between blocks.  Integer samples give the same result
+    as audioop.ratecv.
+
+    """
+
+    def __init__(self, inrate, outrate, channels, depth=None):
+        """ LinearResampler(inrate, outrate, channels, depth=None) ->
+        Resample channels channel frames from inrate to outrate.  If depth is
+        given the samples are depth bit integers, otherwise floats.
+
+        """
+
+        super(LinearResampler, self).__init__()
+
+        # Some codecs give the rate as a float.
+        inrate, outrate = int(inrate), int(outrate)
+
+        divisor = _gcd(inrate, outrate)
+        self._inrate = inrate // divisor
+        self._outrate = outrate // divisor
+        self._channels = channels
+
+        # Integers are interpolated at 32 bits like audioop does.
+        self._shift = 32 - depth if depth else 0
+        self._integer = depth is not None
+
+        self._history = None
+        self.reset()
+
+    def reset(self):
+        """ reset() -> Forget the previous frames, e.g. after a seek.
+
+        """
+
+        import numpy
+
+        self._d = -self._outrate
+        self._history = numpy.zeros((2, self._channels),
+                                    numpy.int64 if self._integer
+                                    else numpy.float32)
+
+    def output_frames(self, frames):
+        """ output_frames(frames) -> Return how many frames resampling frames
+        more input frames will produce.
+
+        """
+
+        total = frames * self._outrate + self._d
+
+        return total // self._inrate + 1 if total >= 0 else 0
+
+    def resample(self, samples):
+        """ resample(samples) -> Return the resampled (frames, channels)
+        array samples.
+
+        """
+
+        import numpy
+
+        inrate, outrate = self._inrate, self._outrate
+        frames = len(samples)
+        count = self.output_frames(frames)
+
+        # The two previous frames come before the new ones.
+        history = numpy.empty((frames + 2, self._channels),
+                              self._history.dtype)
+        history[:2] = self._history
+        history[2:] = samples
+        if self._integer and self._shift:
+            history[2:] <<= self._shift
+
+        # Output frame k is between the input frames n - 1 and n, d / outrate
+        # of the way from n to n - 1.
+        k = numpy.arange(count, dtype=numpy.int64) * inrate - self._d
+        n = -(-k // outrate)
+        d = (n * outrate - k)[:, numpy.newaxis]
+
+        previous = history[n]
+        current = history[n + 1]
+
+        if self._integer:
+            total = previous * d + current * (outrate - d)
+
+            # Divide rounding toward zero like C.
+            out = total // outrate
+            out += (total < 0) & (out * outrate != total)
+            if self._shift:
+                out >>= self._shift
+        else:
+            out = (previous * d + current * (outrate - d)) * (1.0 / outrate)
+
+        self._d += frames * outrate - count * inrate
+        self._history[:] = history[frames:]
+
+        return out
+
+    def flush(self):
+        """ flush() -> Return the frames still to come at the end of the
+        stream, and forget the previous frames.  Linear interpolation
+        doesn't hold any back, like audioop.ratecv.
+
+        """
+
+        import numpy
+
+        self.reset()
+
+        return numpy.zeros((0, self._channels), self._history.dtype)
+
+
+# The taps per phase, fraction of the Nyquist frequency kept and Kaiser window
+# beta of each resampling quality.
+_QUALITY = {
+    'fast': (8, 0.85, 5.0),
+    'medium': (24, 0.9, 8.0),
+    'best': (64, 0.95, 12.0),
+}
+
+# The resampling qualities.  Linear is the same as audioop.ratecv.
+RESAMPLE_QUALITIES = ('linear', 'fast', 'medium', 'best')
+
+# The filter banks already made by (upsample, downsample, quality, dtype).
+_filter_banks = {}
+
+
+def _filter_bank(upsample, downsample, quality, dtype):
+    """ _filter_bank(upsample, downsample, quality, dtype) -> Return the
+    (upsample, taps) polyphase filter bank of a windowed sinc low pass
+    filter for resampling by upsample / downsample.
+
+    """
+
+    key = (upsample, downsample, quality, str(dtype))
+    bank = _filter_banks.get(key, None)
+    if bank is not None:
+        return bank
+
+    import numpy
+
+    taps, rolloff, beta = _QUALITY[quality]
+
+    # Cover the same number of zero crossings when downsampling.
+    if downsample > upsample:
+        taps = -(-taps * downsample // upsample)
+
+    length = taps * upsample
+    cutoff = rolloff * 0.5 / max(upsample, downsample)
+
+    index = numpy.arange(length, dtype=numpy.float64) - (length - 1) / 2.0
+    prototype = numpy.sinc(2 * cutoff * index) * numpy.kaiser(length, beta)
+
+    # Tap j of phase p is prototype[p + j * upsample].  Each phase is
+    # normalized so steady signals keep their level, and the taps are
+    # reversed to line up with the frames oldest first.
+    bank = prototype.reshape(taps, upsample).T[:, ::-1].copy()
+    bank /= bank.sum(axis=1)[:, numpy.newaxis]
+
+    bank = _filter_banks[key] = bank.astype(dtype)
+
+    return bank
+
+
+class PolyphaseResampler(object):
+    """ Change the sample rate of blocks of frames with a windowed sinc
+    polyphase filter, keeping the state between blocks.  The filter banks
+    are made once for each rate ratio and quality.
+
+    """
+
+    def __init__(self, inrate, outrate, channels, depth=None,
+                 quality='medium'):
+        """ PolyphaseResampler(inrate, outrate, channels, depth=None,
+        quality='medium') -> Resample channels channel frames from inrate to
+        outrate.  If depth is given the samples are depth bit integers,
+        otherwise floats.  The quality is 'fast', 'medium' or 'best'.
+
+        """
+
+        super(PolyphaseResampler, self).__init__()
+
+        if quality not in _QUALITY:
+            raise ValueError("Unknown resampling quality %r." % quality)
+
+        import numpy
+
+        # Some codecs give the rate as a float.
+        inrate, outrate = int(inrate), int(outrate)
+
+        divisor = _gcd(inrate, outrate)
+        self._upsample = outrate // divisor
+        self._downsample = inrate // divisor
+        self._channels = channels
+        self._quality = quality
+
+        self._depth = depth
 
-    return data_array.tostring()
+        # Filter 32-bit integers with doubles so they don't lose precision.
+        self._dtype = numpy.dtype(numpy.float64 if depth and depth > 24
+                                  else numpy.float32)
+
+        self._bank = _filter_bank(self._upsample, self._downsample, quality,
+                                  self._dtype)
+        self._taps = self._bank.shape[1]
+
+        self._history = None
+        self._buffer = None
+        self.reset()
+
+    def __repr__(self):
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        return '%s(%s, %s, %s, depth=%s, quality=%r)' % (
+            self.__class__.__name__, self._downsample, self._upsample,
+            self._channels, self._depth, self._quality)
+
+    def reset(self):
+        """ reset() -> Forget the previous frames, e.g. after a seek.
+
+        """
+
+        import numpy
+
+        self._history = numpy.zeros((self._taps - 1, self._channels),
+                                    self._dtype)
+
+        # The frames resampled and produced since the reset, so flush
+        # knows how many the filter still holds.
+        self._frames_in = 0
+        self._frames_out = 0
+
+        # The position of the next output frame at the upsampled rate,
+        # counted from the start of the history.  It starts half the filter
+        # in so the output isn't delayed.
+        self._position = (self._taps - 1) * self._upsample + \
+            (self._taps * self._upsample - 1) // 2
+
+    def output_frames(self, frames):
+        """ output_frames(frames) -> Return how many frames resampling frames
+        more input frames will produce.
+
+        """
+
+        end = (self._taps - 1 + frames) * self._upsample
+
+        if end <= self._position:
+            return 0
+
+        return (end - 1 - self._position) // self._downsample + 1
+
+    def _signal(self, frames):
+        """ _signal(frames) -> Return the reusable (frames, channels) array
+        for the kept and new frames, growing it if it is too small.
+
+        """
+
+        import numpy
+
+        size = frames * self._channels
+        if self._buffer is None or len(self._buffer) < size:
+            self._buffer = numpy.empty(size, self._dtype)
+
+        return self._buffer[:size].reshape(frames, self._channels)
+
+    def resample(self, samples):
+        """ resample(samples) -> Return the resampled (frames, channels)
+        array samples.
+
+        """
+
+        import numpy
+        from numpy.lib.stride_tricks import as_strided as numpy_as_strided
+
+        upsample, downsample = self._upsample, self._downsample
+        keep = self._taps - 1
+        frames = len(samples)
+        count = self.output_frames(frames)
+
+        # The frames kept from the last block come before the new ones.
+        signal = self._signal(keep + frames)
+        signal[:keep] = self._history
+        signal[keep:] = samples
+
+        # Output frame k is filtered from the taps frames ending at
+        # position // upsample with phase position % upsample.
+        position = numpy.arange(count, dtype=numpy.int64) * downsample
+        position += self._position
+        oldest = position // upsample - keep
+        phase = self._bank[position % upsample]
+
+        # A view of the taps frames starting at each frame, channels first,
+        # so every output frame is one matrix product.
+        frame_stride, sample_stride = signal.strides
+        windows = numpy_as_strided(signal,
+                                   (frames, self._channels, self._taps),
+                                   (frame_stride, sample_stride,
+                                    frame_stride))
+        out = numpy.matmul(windows[oldest],
+                           phase[:, :, numpy.newaxis])[:, :, 0]
+
+        self._position += count * downsample - frames * upsample
+        self._history[:] = signal[frames:]
+
+        self._frames_in += frames
+        self._frames_out += count
+
+        if self._depth:
+            # Round and clip back to integers.
+            limit = 1 << (self._depth - 1)
+            numpy.rint(out, out=out)
+            numpy.clip(out, -limit, limit - 1, out=out)
+
+        return out
+
+
+    def flush(self):
+        """ flush() -> Return the last frames the filter holds back, by
+        filtering silence after the end of the stream, and reset.
+
+        """
+
+        import numpy
+
+        # Each input frame gives upsample / downsample output frames.
+        expected = -(-self._frames_in * self._upsample // self._downsample)
+        missing = expected - self._frames_out
+
+        out = None
+        if missing > 0:
+            # The output lags half the filter, so the taps of silence
+            # after the stream bring out the rest of it.
+            silence = numpy.zeros((self._taps, self._channels), self._dtype)
+            out = self.resample(silence)[:missing]
+
+        self.reset()
+
+        if out is None:
+            return numpy.zeros((0, self._channels), self._dtype)
+
+        return out
+
+
+class ConversionPlan(object):
+    """ Convert audio data from one sample format to another.  The steps are
+    worked out once, done with numpy in as few passes as possible and the
+    buffers are reused between calls.
+
+    Integer samples are converted in the same way as the audioop functions,
+    lin2lin, bias, tostereo, tomono with factors of 0.5 and, with 'linear'
+    quality, ratecv.  Other channel layouts are mixed with one matrix
+    product per block.
+
+    """
+
+    def __init__(self, source, target, quality='medium', matrix=None):
+        """ ConversionPlan(source, target, quality='medium', matrix=None) ->
+        Plan to convert data in the source format to the target format.
+        Both are dictionaries like audio_format returns.  The quality of
+        resampling is one of RESAMPLE_QUALITIES.  The channels are mixed with
+        the (target channels, source channels) matrix of gains if it is
+        given, otherwise with the one mix_matrix makes for their layouts.
+
+        """
+
+        super(ConversionPlan, self).__init__()
+
+        self._quality = quality
+
+        self._source = audio_format(**source)
+        self._target = audio_format(**target)
+
+        source, target = self._source, self._target
+
+        # The steps taken, to show what the conversion does.
+        self.steps = []
+
+        source_layout = source['layout'] or \
+            CHANNEL_LAYOUTS.get(source['channels'], None)
+        target_layout = target['layout'] or \
+            CHANNEL_LAYOUTS.get(target['channels'], None)
+
+        # Mono and stereo are mixed like audioop does, and other layouts
+        # with a matrix.
+        if matrix is None and source_layout and target_layout and \
+                source_layout != target_layout and \
+                not (source['channels'] <= 2 and target['channels'] <= 2 and
+                     source_layout == CHANNEL_LAYOUTS[source['channels']] and
+                     target_layout == CHANNEL_LAYOUTS[target['channels']]):
+            matrix = mix_matrix(source_layout, target_layout)
+
+        self._matrix = matrix
+        self._gains = None if matrix is None else \
+            [[float(gain) for gain in row] for row in matrix]
+
+        if source['channels'] != target['channels'] or matrix is not None:
+            self.steps.append('channels')
+        if source['rate'] != target['rate']:
+            self.steps.append('rate')
+        if source['floatp'] != target['floatp'] or \
+                source['depth'] != target['depth']:
+            self.steps.append('depth')
+        if not target['floatp'] and source['unsigned'] != target['unsigned']:
+            self.steps.append('sign')
+        if source['three_byte'] != target['three_byte']:
+            self.steps.append('pack')
+        if source['planar'] != target['planar']:
+            self.steps.append('interleave')
+
+        width = self._width(source)
+        if width > 1 and source['bigendian'] != target['bigendian']:
+            self.steps.append('endian')
+
+        # Swapping the bytes is all that is needed.
+        self._swap_only = self.steps == ['endian'] and width
+
+        # Reusable buffers by name.
+        self._buffers = {}
+        self._resampler = None
+
+        # The bytes of a frame the last block ended with.
+        self._partial = None
+
+        if not self.steps:
+            return
+
+        import numpy
+
+        self._source_dtype = sample_dtype(source['depth'], source['unsigned'],
+                                          source['bigendian'],
+                                          source['floatp'],
+                                          source['three_byte'])
+        self._target_dtype = sample_dtype(target['depth'], target['unsigned'],
+                                          target['bigendian'],
+                                          target['floatp'],
+                                          target['three_byte'])
+
+        # Work on floats if the target is float, otherwise on integers at
+        # the target depth.  32-bit integers need room to mix.
+        if target['floatp']:
+            self._work_dtype = numpy.dtype(numpy.float32)
+            self._work_depth = None
+        else:
+            self._work_depth = target['depth']
+            self._work_dtype = numpy.dtype(numpy.int64 if
+                                           target['depth'] > 24 else
+                                           numpy.int32)
+
+        if matrix is not None:
+            # Mix 32-bit integers with doubles so they don't lose precision.
+            self._mix_dtype = numpy.dtype(numpy.float64
+                                          if self._work_depth and
+                                          self._work_depth > 24 else
+                                          numpy.float32)
+            matrix = numpy.array(matrix, self._mix_dtype)
+            if matrix.shape != (target['channels'], source['channels']):
+                raise ValueError("The mixing matrix must have a row for "
+                                 "each target channel and a column for "
+                                 "each source channel.")
+
+            # Transposed so each block of frames is multiplied by it, and
+            # scaled to go straight from the source samples to the work
+            # format.
+            self._matrix = matrix.T.copy()
+            if source['floatp']:
+                source_scale = 1.0
+            else:
+                source_scale = 1.0 / (1 << (source['depth'] - 1))
+            if self._work_depth:
+                work_scale = float(1 << (self._work_depth - 1))
+            else:
+                work_scale = 1.0
+            self._matrix *= source_scale * work_scale
+
+            # Unsigned samples are centered on zero first.
+            self._mix_offset = 1 << (source['depth'] - 1) \
+                if source['unsigned'] and not source['floatp'] else 0
+
+        if 'rate' in self.steps:
+            if quality == 'linear':
+                self._resampler = LinearResampler(source['rate'],
+                                                  target['rate'],
+                                                  target['channels'],
+                                                  self._work_depth)
+            else:
+                self._resampler = PolyphaseResampler(source['rate'],
+                                                     target['rate'],
+                                                     target['channels'],
+                                                     self._work_depth,
+                                                     quality)
+
+    @property
+    def source(self):
+        """ The format converted from.
+
+        """
+
+        return self._source
+
+    @property
+    def target(self):
+        """ The format converted to.
+
+        """
+
+        return self._target
+
+    @staticmethod
+    def _width(format_dict):
+        """ _width(format_dict) -> Return the bytes per sample of the format.
+
+        """
+
+        if format_dict['floatp']:
+            return 8 if format_dict['depth'] == 64 else 4
+        elif format_dict['three_byte']:
+            return 3
+
+        return 4 if format_dict['depth'] == 24 else format_dict['depth'] // 8
+
+    def __repr__(self):
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        return '%s(%s, %s, quality=%r, matrix=%r)' % (
+            self.__class__.__name__, self._source, self._target,
+            self._quality, self._gains)
+
+    def _buffer(self, name, shape, dtype):
+        """ _buffer(name, shape, dtype) -> Return an array of shape from the
+        reusable buffer name, growing it if it is too small.
+
+        """
+
+        import numpy
+
+        size = 1
+        for dim in shape:
+            size *= dim
+
+        dtype = numpy.dtype(dtype)
+        buf = self._buffers.get(name, None)
+        if buf is None or buf.dtype != dtype or len(buf) < size:
+            buf = self._buffers[name] = numpy.empty(max(size, 1), dtype)
+
+        return buf[:size].reshape(shape)
+
+    def reset(self):
+        """ reset() -> Forget the frames kept for resampling and any partial
+        frame, e.g. after a seek.
+
+        """
+
+        self._partial = None
+
+        if self._resampler:
+            self._resampler.reset()
+
+    def flush(self):
+        """ flush() -> Return a memoryview of the converted frames the
+        resampler still holds at the end of the stream, and reset.
+
+        """
+
+        self._partial = None
+
+        if not self._resampler:
+            return memoryview(b'')
+
+        work = self._resampler.flush()
+        if work.dtype != self._work_dtype:
+            work = work.astype(self._work_dtype)
+
+        return self._from_work(work)
+
+    def _read_samples(self, data):
+        """ _read_samples(data) -> Return the samples in data as a
+        (frames, channels) array without copying if possible.
+
+        """
+
+        import numpy
+
+        source = self._source
+        channels = source['channels']
+
+        raw = numpy.frombuffer(data, numpy.uint8)
+
+        if self._partial is not None:
+            raw = numpy.concatenate((self._partial, raw))
+            self._partial = None
+
+        # Keep the bytes of a partial frame for the next block.
+        frame_size = self._width(source) * channels
+        extra = len(raw) % frame_size
+        if extra:
+            self._partial = raw[len(raw) - extra:].copy()
+            raw = raw[:len(raw) - extra]
+
+        if source['three_byte']:
+            samples = self._buffer('unpack', (len(raw) // 3, ),
+                                   'u4' if source['unsigned'] else 'i4')
+            unpack_three_byte(raw, source['bigendian'], source['unsigned'],
+                              samples)
+        else:
+            samples = raw.view(self._source_dtype)
+
+        if source['planar']:
+            return samples.reshape(channels, -1).T
+
+        return samples.reshape(-1, channels)
+
+    def _to_work(self, samples):
+        """ _to_work(samples) -> Convert the samples to the work format in a
+        reused buffer.
+
+        """
+
+        source = self._source
+        work = self._buffer('work', samples.shape, self._work_dtype)
+
+        if self._work_depth is None or source['floatp']:
+            # Floats are scaled between -1.0 and 1.0.
+            return convert_samples(samples, source['depth'],
+                                   source['unsigned'], self._work_dtype,
+                                   work, self._work_depth)
+
+        work[...] = samples
+
+        if source['unsigned']:
+            work -= 1 << (source['depth'] - 1)
+
+        shift = self._work_depth - source['depth']
+        if shift > 0:
+            work <<= shift
+        elif shift < 0:
+            work >>= -shift
+
+        return work
+
+    def _mix_matrix(self, samples):
+        """ _mix_matrix(samples) -> Mix the source samples into the work
+        format with the matrix.
+
+        """
+
+        import numpy
+
+        if samples.dtype != self._mix_dtype or self._mix_offset:
+            mix_in = self._buffer('mix_in', samples.shape, self._mix_dtype)
+            mix_in[...] = samples
+            if self._mix_offset:
+                mix_in -= self._mix_offset
+            samples = mix_in
+
+        shape = (len(samples), self._target['channels'])
+
+        if self._work_dtype == self._mix_dtype:
+            mixed = self._buffer('mix', shape, self._work_dtype)
+            return numpy.dot(samples, self._matrix, out=mixed)
+
+        product = self._buffer('mix_out', shape, self._mix_dtype)
+        numpy.dot(samples, self._matrix, out=product)
+
+        # Round and clip back to integers.
+        limit = 1 << (self._work_depth - 1)
+        numpy.rint(product, out=product)
+        numpy.clip(product, -limit, limit - 1, out=product)
+
+        mixed = self._buffer('mix', shape, self._work_dtype)
+        mixed[...] = product
+
+        return mixed
+
+    def _mix(self, work):
+        """ _mix(work) -> Change the number of channels in work.  Extra
+        channels are averaged together and new ones are copies of the first.
+
+        """
+
+        import numpy
+
+        channels = self._target['channels']
+        mixed = self._buffer('mix', (len(work), channels), self._work_dtype)
+
+        if work.shape[1] > channels:
+            if self._work_depth is None:
+                mono = work.mean(axis=1, dtype=numpy.float32)
+            else:
+                # Floor the average like audioop.tomono does.
+                mono = work.sum(axis=1, dtype=numpy.int64)
+                mono //= work.shape[1]
+            mixed[...] = mono[:, numpy.newaxis]
+        else:
+            mixed[:, :work.shape[1]] = work
+            mixed[:, work.shape[1]:] = work[:, :1]
+
+        return mixed
+
+    def _from_work(self, work):
+        """ _from_work(work) -> Convert work to the target format and return
+        a memoryview of the bytes.
+
+        """
+
+        import numpy
+
+        target = self._target
+
+        if target['planar']:
+            work = work.T
+
+        if target['floatp']:
+            out = self._buffer('out', work.shape, self._target_dtype)
+            out[...] = work
+            return memoryview(out.reshape(-1).view(numpy.uint8))
+
+        if target['unsigned']:
+            work += 1 << (target['depth'] - 1)
+
+        if target['three_byte']:
+            packed = pack_three_byte(work.reshape(-1), target['bigendian'])
+            return memoryview(packed)
+
+        out = self._buffer('out', work.shape, self._target_dtype)
+        out[...] = work
+
+        return memoryview(out.reshape(-1).view(numpy.uint8))
+
+    def convert(self, data):
+        """ convert(data) -> Convert the bytes like object data and return a
+        memoryview of the converted bytes.  The memory is reused by the next
+        call so copy it if it has to be kept.
+
+        """
+
+        if not self.steps:
+            return memoryview(data)
+
+        if self._swap_only:
+            return memoryview(swap_endian(data, self._swap_only))
+
+        samples = self._read_samples(data)
+
+        if self._matrix is not None:
+            # Mixing converts the samples to the work format too.
+            work = self._mix_matrix(samples)
+        else:
+            work = self._to_work(samples)
+
+            if 'channels' in self.steps:
+                work = self._mix(work)
+
+        if self._resampler:
+            work = self._resampler.resample(work)
+            if work.dtype != self._work_dtype:
+                work = work.astype(self._work_dtype)
+
+        return self._from_work(work)
 
 
 class ConvertReader(AudioIO):
@@ -56,23 +1168,37 @@ class ConvertReader(AudioIO):
     _supported_modes = 'r'
 
     def __init__(self, source, depth=16, rate=44100, channels=2,
-                 bigendian=False, unsigned=False, **kwargs):
+                 bigendian=False, unsigned=False, floatp=False,
+                 quality='medium', matrix=None, **kwargs):
         """ ConvertReader(self, source, depth=16, rate=44100, channels=2,
-        bigendian=False, unsigned=False, **kwargs) -> Set up the format to
-        convert read data to.
+        bigendian=False, unsigned=False, floatp=False, quality='medium',
+        matrix=None, **kwargs) -> Set up the format to convert read data to.
+        If floatp is True the data is converted to 32-bit floats and depth is
+        ignored.  The quality of resampling is 'linear', 'fast', 'medium' or
+        'best'.  The channels are mixed with the (channels, source channels)
+        matrix of gains, or the standard downmix for their layouts.
 
         """
 
-        super(ConvertReader, self).__init__(source, 'r', depth, rate, channels)
+        super(ConvertReader, self).__init__(source._filename, 'r', depth,
+                                            rate, channels)
 
         self._source = source
 
         self._bigendian = bigendian
         self._unsigned = unsigned
 
-        self._state = 0
+        if floatp:
+            # Float samples are 32 bits and always signed.
+            self._floatp = True
+            self._depth = 32
+            self._width = 4
+            self._unsigned = False
+
+        self._plan = ConversionPlan(audio_format(source), audio_format(self),
+                                    quality, matrix)
 
-        self._buffer = b''
+        self._buffer = RingBuffer()
 
         self._closed = False
 
@@ -90,42 +1216,17 @@ class ConvertReader(AudioIO):
 
         """
 
-        if not audioop:
-            print("audioop not found so returning empty byte")
-            return b'\x00'
-
         data = self._buffer
 
         while len(data) < size:
             temp_data = self._source.read()
             if not temp_data:
+                # The resampler holds back the end of the stream.
+                data.append(self._plan.flush())
                 if len(data) != 0:
-                    data += b'\x00' * (size - len(data))
+                    data.pad(size)
                 break
 
-            if self._depth != self._source.depth:
-                temp_data = audioop.lin2lin(temp_data, self._source._width,
-                                            self._width)
-
-            if self._unsigned != self._source.unsigned:
-                temp_data = audioop.bias(temp_data, self._source._width, 128)
-
-            # Make it stereo
-            if self._source.channels < self._channels:
-                temp_data = audioop.tostereo(temp_data, self._width, 1, 1)
-            # Make it mono
-            elif self._source.channels > self._channels:
-                temp_data = audioop.tomono(temp_data, self._width, 1, 1)
-
-            # Convert the sample rate of the data to the requested rate.
-            if self._rate != self._source.rate and temp_data:
-                temp_data, self._state = audioop.ratecv(temp_data, self._width,
-                                                        self._channels,
-                                                        self._source.rate,
-                                                        self._rate,
-                                                        self._state)
-            data += temp_data
-
-        self._buffer = data[size:]
+            data.append(self._plan.convert(temp_data))
 
-        return data[:size]
+        return data.read(size)
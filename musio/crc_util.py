@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# vim: sw=4:ts=4:sts=4:fdm=indent:fdl=0:
+# -*- coding: UTF8 -*-
+#
+# CRC utilities.
+# Copyright (C) 2013 Josiah Gordon <josiahg@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" crc8                The CRC-8 of FLAC frame headers
+    crc16               The CRC-16 of FLAC frames
+    crc16_shift         Carry a CRC-16 across a run of zero bytes
+    crc16_lame          The bit reversed CRC-16 of the LAME tag
+    crc16_lame_combine  Join the LAME CRC-16s of two runs of bytes
+
+"""
+
+
+def _crc_table(poly, bits):
+    """ _crc_table(poly, bits) -> Return the table for a bits wide CRC with
+    the polynomial poly, most significant bit first.
+
+    """
+
+    top = 1 << (bits - 1)
+    mask = (1 << bits) - 1
+
+    table = []
+    for byte in range(256):
+        crc = byte << (bits - 8)
+        for _ in range(8):
+            crc = (crc << 1) ^ poly if crc & top else crc << 1
+        table.append(crc & mask)
+
+    return table
+
+
+def _crc16_lame_table():
+    """ _crc16_lame_table() -> Return the table for the CRC-16 of the LAME
+    tag, least significant bit first.
+
+    """
+
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xa001 if crc & 1 else crc >> 1
+        table.append(crc)
+
+    return table
+
+
+_CRC8_TABLE = _crc_table(0x07, 8)
+_CRC16_TABLE = _crc_table(0x8005, 16)
+_CRC16_LAME_TABLE = _crc16_lame_table()
+
+
+def crc8(data):
+    """ crc8(data) -> Return the CRC-8 of a FLAC frame header.
+
+    """
+
+    crc = 0
+    for byte in bytearray(data):
+        crc = _CRC8_TABLE[crc ^ byte]
+
+    return crc
+
+
+def crc16(data):
+    """ crc16(data) -> Return the CRC-16 of the bytes in data.
+
+    """
+
+    crc = 0
+    for byte in bytearray(data):
+        crc = ((crc << 8) & 0xffff) ^ _CRC16_TABLE[(crc >> 8) ^ byte]
+
+    return crc
+
+
+def _crc16_mulmod(a, b):
+    """ _crc16_mulmod(a, b) -> Return a * b modulo the CRC-16 polynomial.
+
+    """
+
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        b >>= 1
+        a <<= 1
+        if a & 0x10000:
+            a ^= 0x18005
+
+    return result
+
+
+def crc16_shift(crc, size):
+    """ crc16_shift(crc, size) -> Return what crc becomes after size zero
+    bytes.
+
+    """
+
+    # Multiply by x ** (8 * size) by squaring.
+    power = 0x100
+    while size:
+        if size & 1:
+            crc = _crc16_mulmod(crc, power)
+        power = _crc16_mulmod(power, power)
+        size >>= 1
+
+    return crc
+
+
+def crc16_lame(data, crc=0):
+    """ crc16_lame(data, crc=0) -> Return the CRC-16 of the bytes in data
+    the way the LAME tag has it, continuing from crc.
+
+    """
+
+    table = _CRC16_LAME_TABLE
+    for byte in bytearray(data):
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xff]
+
+    return crc
+
+
+def crc16_lame_combine(crc, next_crc, size):
+    """ crc16_lame_combine(crc, next_crc, size) -> Return the LAME CRC-16 of
+    two runs of bytes from the CRC-16 crc of the first, and next_crc of the
+    second which is size bytes long.
+
+    """
+
+    def reverse(crc):
+        return int('{0:016b}'.format(crc)[::-1], 2)
+
+    # This CRC is FLAC's with the bits reversed.
+    return reverse(crc16_shift(reverse(crc), size)) ^ next_crc
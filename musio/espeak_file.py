@@ -42,8 +42,9 @@ def issupported(filename, *args):
 
     import mimetypes
 
-    # Initialize mimetypes.
-    mimetypes.init()
+    # Initialize mimetypes once.
+    if not mimetypes.inited:
+        mimetypes.init()
 
     # Get the mime type of filename.
     mimetype, encoding = mimetypes.guess_type(filename)
@@ -1,12 +1,10 @@
 from ctypes import *
+from ..import_util import LazyLibraries as _LazyLibraries
+from ..import_util import bind_lazily as _bind_lazily
 
-_libraries = {}
-_libraries['/usr/lib/libavcodec.so'] = CDLL('/usr/lib/libavcodec.so')
+_libraries = _LazyLibraries()
 STRING = c_char_p
 WSTRING = c_wchar_p
-_libraries['/usr/lib/libavdevice.so'] = CDLL('/usr/lib/libavdevice.so')
-_libraries['/usr/lib/libavformat.so'] = CDLL('/usr/lib/libavformat.so')
-_libraries['/usr/lib/libswscale.so'] = CDLL('/usr/lib/libswscale.so')
 
 
 PIX_FMT_YUV444P12LE = 310
@@ -62,7 +60,6 @@ def be16toh(x): return __bswap_16 (x) # macro
 _POSIX2_BC_DIM_MAX = 2048 # Variable c_int '2048'
 BC_DIM_MAX = _POSIX2_BC_DIM_MAX # alias
 PIX_FMT_YUV422P14BE = 307
-def av_int_list_length(list,term): return av_int_list_length_for_size(sizeof(*(list)), list, term) # macro
 # def av_dlog(pctx,...): return do { if (0) av_log(pctx, AV_LOG_DEBUG, __VA_ARGS__); } while (0) # macro
 # def av_alloc_size(...): return __attribute__((alloc_size(__VA_ARGS__))) # macro
 AV_CODEC_ID_MLP = 86045
@@ -558,33 +555,7 @@ __off64_t = c_long
 _IO_off64_t = __off64_t # alias
 def FFMIN3(a,b,c): return FFMIN(FFMIN(a,b),c) # macro
 def av_printf_format(fmtpos,attrpos): return __attribute__((__format__(__printf__, fmtpos, attrpos))) # macro
-class _G_fpos_t(Structure):
-    pass
 __off_t = c_long
-class __mbstate_t(Structure):
-    pass
-class N11__mbstate_t3DOT_6E(Union):
-    pass
-N11__mbstate_t3DOT_6E._fields_ = [
-    ('__wch', c_uint),
-    ('__wchb', c_char * 4),
-]
-__mbstate_t._fields_ = [
-    ('__count', c_int),
-    ('__value', N11__mbstate_t3DOT_6E),
-]
-_G_fpos_t._fields_ = [
-    ('__pos', __off_t),
-    ('__state', __mbstate_t),
-]
-_IO_fpos_t = _G_fpos_t # alias
-class _G_fpos64_t(Structure):
-    pass
-_G_fpos64_t._fields_ = [
-    ('__pos', __off64_t),
-    ('__state', __mbstate_t),
-]
-_IO_fpos64_t = _G_fpos64_t # alias
 # _IO_file_flags = _flags # alias
 AV_CODEC_ID_WMV3IMAGE = 152
 _G_BUFSIZ = 8192 # Variable c_int '8192'
@@ -628,7 +599,6 @@ CODEC_ID_FIRST_AUDIO = 65536
 CODEC_ID_ESCAPE124 = 116
 AV_SAMPLE_FMT_U8P = 5
 AV_CODEC_ID_MSRLE = 46
-def major(dev): return gnu_dev_major (dev) # macro
 BYTE_ORDER = __BYTE_ORDER # alias
 AV_CODEC_ID_NONE = 0
 _POSIX_ = 2
@@ -1036,7 +1006,6 @@ CODEC_ID_MPEG1VIDEO = 1
 # _Mfloat_ = float # alias
 AV_CODEC_ID_ADPCM_AFC = 1095123744
 AVCOL_RANGE_NB = 3
-def minor(dev): return gnu_dev_minor (dev) # macro
 CODEC_ID_BMV_AUDIO = 86073
 CODEC_ID_S302M = 65562
 def UINT8_C(c): return c # macro
@@ -1048,7 +1017,6 @@ AV_CODEC_ID_RA_288 = 77825
 AV_CODEC_ID_CMV = 119
 _IO_off_t = __off_t # alias
 AV_SAMPLE_FMT_DBLP = 9
-def getc(_fp): return _IO_getc (_fp) # macro
 AV_CODEC_ID_CELT = 86068
 CODEC_ID_TSCC2 = 165
 # _IO_iconv_t = _G_iconv_t # alias
@@ -1085,12 +1053,6 @@ CODEC_ID_SHORTEN = 86031
 AV_CODEC_ID_WESTWOOD_SND1 = 86033
 AV_CODEC_ID_MPEG4SYSTEMS = 131073
 CODEC_ID_ADPCM_EA_R3 = 69653
-class __va_list_tag(Structure):
-    pass
-__va_list_tag._fields_ = [
-]
-__gnuc_va_list = __va_list_tag * 1
-_G_va_list = __gnuc_va_list # alias
 # def __FD_ZERO(fdsp): return do { int __d0, __d1; __asm__ __volatile__ ("cld; rep; " __FD_ZERO_STOS : "=c" (__d0), "=D" (__d1) : "a" (0), "0" (sizeof (fd_set) / sizeof (__fd_mask)), "1" (&__FDS_BITS (fdsp)[0]) : "memory"); } while (0) # macro
 AV_CODEC_ID_VPLAYER = 1448111218
 # def __FD_CLR(d,set): return ((void) (__FDS_BITS (set)[__FD_ELT (d)] &= ~__FD_MASK (d))) # macro
@@ -1149,7 +1111,6 @@ AV_CODEC_ID_ILBC = 86076
 AV_CODEC_ID_PCM_LXF = 65561
 AVMEDIA_TYPE_ATTACHMENT = 4
 AV_CODEC_ID_PCM_BLURAY = 65560
-def makedev(maj,min): return gnu_dev_makedev (maj, min) # macro
 _XOPEN_ = 1
 AV_CODEC_ID_PCM_DVD = 65555
 # def __FD_SET(d,set): return ((void) (__FDS_BITS (set)[__FD_ELT (d)] |= __FD_MASK (d))) # macro
@@ -1288,10 +1249,6 @@ AV_CODEC_ID_PCM_U32LE = 65546
 _POSIX2_BC_SCALE_MAX = 99 # Variable c_int '99'
 BC_SCALE_MAX = _POSIX2_BC_SCALE_MAX # alias
 AV_CODEC_ID_ADPCM_G722 = 69660
-class _IO_FILE(Structure):
-    pass
-stdout = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libavcodec.so'], 'stdout')
-stdout = stdout # alias
 CODEC_ID_RPZA = 43
 # NL_TEXTMAX = INT_MAX # alias
 AV_CODEC_ID_AMR_NB = 73728
@@ -1317,7 +1274,6 @@ AV_CODEC_ID_EVRC = 1936029283
 # def strndupa(s,n): return (__extension__ ({ const char *__old = (s); size_t __len = strnlen (__old, (n)); char *__new = (char *) __builtin_alloca (__len + 1); __new[__len] = '\0'; (char *) memcpy (__new, __old, __len); })) # macro
 AV_CODEC_ID_V408 = 1446260792
 # def signbit(x): return (sizeof (x) == sizeof (float) ? __signbitf (x) : sizeof (x) == sizeof (double) ? __signbit (x) : __signbitl (x)) # macro
-def putc(_ch,_fp): return _IO_putc (_ch, _fp) # macro
 AV_CODEC_ID_PCM_S16BE = 65537
 def le32toh(x): return (x) # macro
 def le16toh(x): return (x) # macro
@@ -1400,7 +1356,6 @@ AVMEDIA_TYPE_SUBTITLE = 3
 AV_CODEC_ID_V308 = 1446195256
 AV_CODEC_ID_CLLC = 167
 AV_CODEC_ID_ESCAPE130 = 1160852272
-_IO_va_list = __gnuc_va_list # alias
 CODEC_ID_JPEGLS = 12
 FP_ZERO = 2
 AVDISCARD_BIDIR = 16
@@ -1524,10 +1479,6 @@ CODEC_ID_NELLYMOSER = 86050
 AV_RESAMPLE_FILTER_TYPE_BLACKMAN_NUTTALL = 1
 LIBPOSTPROC_VERSION_INT = 3408740 # Variable c_int '3408740'
 LIBPOSTPROC_BUILD = LIBPOSTPROC_VERSION_INT # alias
-stdin = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libavcodec.so'], 'stdin')
-stdin = stdin # alias
-stderr = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libavcodec.so'], 'stderr')
-stderr = stderr # alias
 LIBAVUTIL_VERSION_INT = 3417700 # Variable c_int '3417700'
 LIBAVUTIL_BUILD = LIBAVUTIL_VERSION_INT # alias
 CODEC_ID_AMV = 108
@@ -2513,7 +2464,6 @@ FF_PROFILE_H264_BASELINE = 66 # Variable c_int '66'
 EPERM = 1 # Variable c_int '1'
 FF_LOSS_COLORSPACE = 4 # Variable c_int '4'
 AV_CH_LAYOUT_5POINT1_BACK = 63 # Variable c_int '63'
-errno = (c_int).in_dll(_libraries['/usr/lib/libavcodec.so'], 'errno')
 _XOPEN_LIM_H = 1 # Variable c_int '1'
 RAW_PACKET_BUFFER_SIZE = 2500000 # Variable c_int '2500000'
 FP_ILOGBNAN = -2147483648 # Variable c_int '-0x00000000080000000'
@@ -2619,1071 +2569,21 @@ AVERROR_BUG2 = -541545794 # Variable c_int '-0x00000000020475542'
 _IOLBF = 1 # Variable c_int '1'
 FF_DEFAULT_QUANT_BIAS = 999999 # Variable c_int '999999'
 FF_CODER_TYPE_RAW = 2 # Variable c_int '2'
-__errno_location = _libraries['/usr/lib/libavcodec.so'].__errno_location
-__errno_location.restype = POINTER(c_int)
-__errno_location.argtypes = []
-acosl = _libraries['/usr/lib/libavcodec.so'].acosl
-acosl.restype = c_longdouble
-acosl.argtypes = [c_longdouble]
-acos = _libraries['/usr/lib/libavcodec.so'].acos
-acos.restype = c_double
-acos.argtypes = [c_double]
-acosf = _libraries['/usr/lib/libavcodec.so'].acosf
-acosf.restype = c_float
-acosf.argtypes = [c_float]
-asin = _libraries['/usr/lib/libavcodec.so'].asin
-asin.restype = c_double
-asin.argtypes = [c_double]
-asinf = _libraries['/usr/lib/libavcodec.so'].asinf
-asinf.restype = c_float
-asinf.argtypes = [c_float]
-asinl = _libraries['/usr/lib/libavcodec.so'].asinl
-asinl.restype = c_longdouble
-asinl.argtypes = [c_longdouble]
-atanf = _libraries['/usr/lib/libavcodec.so'].atanf
-atanf.restype = c_float
-atanf.argtypes = [c_float]
-atanl = _libraries['/usr/lib/libavcodec.so'].atanl
-atanl.restype = c_longdouble
-atanl.argtypes = [c_longdouble]
-atan = _libraries['/usr/lib/libavcodec.so'].atan
-atan.restype = c_double
-atan.argtypes = [c_double]
-atan2f = _libraries['/usr/lib/libavcodec.so'].atan2f
-atan2f.restype = c_float
-atan2f.argtypes = [c_float, c_float]
-atan2l = _libraries['/usr/lib/libavcodec.so'].atan2l
-atan2l.restype = c_longdouble
-atan2l.argtypes = [c_longdouble, c_longdouble]
-atan2 = _libraries['/usr/lib/libavcodec.so'].atan2
-atan2.restype = c_double
-atan2.argtypes = [c_double, c_double]
-cos = _libraries['/usr/lib/libavcodec.so'].cos
-cos.restype = c_double
-cos.argtypes = [c_double]
-cosl = _libraries['/usr/lib/libavcodec.so'].cosl
-cosl.restype = c_longdouble
-cosl.argtypes = [c_longdouble]
-cosf = _libraries['/usr/lib/libavcodec.so'].cosf
-cosf.restype = c_float
-cosf.argtypes = [c_float]
-sinl = _libraries['/usr/lib/libavcodec.so'].sinl
-sinl.restype = c_longdouble
-sinl.argtypes = [c_longdouble]
-sinf = _libraries['/usr/lib/libavcodec.so'].sinf
-sinf.restype = c_float
-sinf.argtypes = [c_float]
-sin = _libraries['/usr/lib/libavcodec.so'].sin
-sin.restype = c_double
-sin.argtypes = [c_double]
-tanl = _libraries['/usr/lib/libavcodec.so'].tanl
-tanl.restype = c_longdouble
-tanl.argtypes = [c_longdouble]
-tanf = _libraries['/usr/lib/libavcodec.so'].tanf
-tanf.restype = c_float
-tanf.argtypes = [c_float]
-tan = _libraries['/usr/lib/libavcodec.so'].tan
-tan.restype = c_double
-tan.argtypes = [c_double]
-coshl = _libraries['/usr/lib/libavcodec.so'].coshl
-coshl.restype = c_longdouble
-coshl.argtypes = [c_longdouble]
-coshf = _libraries['/usr/lib/libavcodec.so'].coshf
-coshf.restype = c_float
-coshf.argtypes = [c_float]
-cosh = _libraries['/usr/lib/libavcodec.so'].cosh
-cosh.restype = c_double
-cosh.argtypes = [c_double]
-sinhl = _libraries['/usr/lib/libavcodec.so'].sinhl
-sinhl.restype = c_longdouble
-sinhl.argtypes = [c_longdouble]
-sinh = _libraries['/usr/lib/libavcodec.so'].sinh
-sinh.restype = c_double
-sinh.argtypes = [c_double]
-sinhf = _libraries['/usr/lib/libavcodec.so'].sinhf
-sinhf.restype = c_float
-sinhf.argtypes = [c_float]
-tanh = _libraries['/usr/lib/libavcodec.so'].tanh
-tanh.restype = c_double
-tanh.argtypes = [c_double]
-tanhl = _libraries['/usr/lib/libavcodec.so'].tanhl
-tanhl.restype = c_longdouble
-tanhl.argtypes = [c_longdouble]
-tanhf = _libraries['/usr/lib/libavcodec.so'].tanhf
-tanhf.restype = c_float
-tanhf.argtypes = [c_float]
-sincosf = _libraries['/usr/lib/libavcodec.so'].sincosf
-sincosf.restype = None
-sincosf.argtypes = [c_float, POINTER(c_float), POINTER(c_float)]
 # sincosl = _libraries['/usr/lib/libavcodec.so'].sincosl
 # sincosl.restype = None
 # sincosl.argtypes = [c_longdouble, POINTER(c_longdouble), POINTER(c_longdouble)]
-sincos = _libraries['/usr/lib/libavcodec.so'].sincos
-sincos.restype = None
-sincos.argtypes = [c_double, POINTER(c_double), POINTER(c_double)]
-acosh = _libraries['/usr/lib/libavcodec.so'].acosh
-acosh.restype = c_double
-acosh.argtypes = [c_double]
-acoshf = _libraries['/usr/lib/libavcodec.so'].acoshf
-acoshf.restype = c_float
-acoshf.argtypes = [c_float]
-acoshl = _libraries['/usr/lib/libavcodec.so'].acoshl
-acoshl.restype = c_longdouble
-acoshl.argtypes = [c_longdouble]
-asinhl = _libraries['/usr/lib/libavcodec.so'].asinhl
-asinhl.restype = c_longdouble
-asinhl.argtypes = [c_longdouble]
-asinhf = _libraries['/usr/lib/libavcodec.so'].asinhf
-asinhf.restype = c_float
-asinhf.argtypes = [c_float]
-asinh = _libraries['/usr/lib/libavcodec.so'].asinh
-asinh.restype = c_double
-asinh.argtypes = [c_double]
-atanhl = _libraries['/usr/lib/libavcodec.so'].atanhl
-atanhl.restype = c_longdouble
-atanhl.argtypes = [c_longdouble]
-atanh = _libraries['/usr/lib/libavcodec.so'].atanh
-atanh.restype = c_double
-atanh.argtypes = [c_double]
-atanhf = _libraries['/usr/lib/libavcodec.so'].atanhf
-atanhf.restype = c_float
-atanhf.argtypes = [c_float]
-expf = _libraries['/usr/lib/libavcodec.so'].expf
-expf.restype = c_float
-expf.argtypes = [c_float]
-expl = _libraries['/usr/lib/libavcodec.so'].expl
-expl.restype = c_longdouble
-expl.argtypes = [c_longdouble]
-exp = _libraries['/usr/lib/libavcodec.so'].exp
-exp.restype = c_double
-exp.argtypes = [c_double]
-frexpf = _libraries['/usr/lib/libavcodec.so'].frexpf
-frexpf.restype = c_float
-frexpf.argtypes = [c_float, POINTER(c_int)]
-frexpl = _libraries['/usr/lib/libavcodec.so'].frexpl
-frexpl.restype = c_longdouble
-frexpl.argtypes = [c_longdouble, POINTER(c_int)]
-frexp = _libraries['/usr/lib/libavcodec.so'].frexp
-frexp.restype = c_double
-frexp.argtypes = [c_double, POINTER(c_int)]
-ldexpl = _libraries['/usr/lib/libavcodec.so'].ldexpl
-ldexpl.restype = c_longdouble
-ldexpl.argtypes = [c_longdouble, c_int]
-ldexp = _libraries['/usr/lib/libavcodec.so'].ldexp
-ldexp.restype = c_double
-ldexp.argtypes = [c_double, c_int]
-ldexpf = _libraries['/usr/lib/libavcodec.so'].ldexpf
-ldexpf.restype = c_float
-ldexpf.argtypes = [c_float, c_int]
-logf = _libraries['/usr/lib/libavcodec.so'].logf
-logf.restype = c_float
-logf.argtypes = [c_float]
-logl = _libraries['/usr/lib/libavcodec.so'].logl
-logl.restype = c_longdouble
-logl.argtypes = [c_longdouble]
-log = _libraries['/usr/lib/libavcodec.so'].log
-log.restype = c_double
-log.argtypes = [c_double]
-log10l = _libraries['/usr/lib/libavcodec.so'].log10l
-log10l.restype = c_longdouble
-log10l.argtypes = [c_longdouble]
-log10f = _libraries['/usr/lib/libavcodec.so'].log10f
-log10f.restype = c_float
-log10f.argtypes = [c_float]
-log10 = _libraries['/usr/lib/libavcodec.so'].log10
-log10.restype = c_double
-log10.argtypes = [c_double]
 # modfl = _libraries['/usr/lib/libavcodec.so'].modfl
 # modfl.restype = c_longdouble
 # modfl.argtypes = [c_longdouble, POINTER(c_longdouble)]
-modf = _libraries['/usr/lib/libavcodec.so'].modf
-modf.restype = c_double
-modf.argtypes = [c_double, POINTER(c_double)]
-modff = _libraries['/usr/lib/libavcodec.so'].modff
-modff.restype = c_float
-modff.argtypes = [c_float, POINTER(c_float)]
-exp10 = _libraries['/usr/lib/libavcodec.so'].exp10
-exp10.restype = c_double
-exp10.argtypes = [c_double]
-exp10l = _libraries['/usr/lib/libavcodec.so'].exp10l
-exp10l.restype = c_longdouble
-exp10l.argtypes = [c_longdouble]
-exp10f = _libraries['/usr/lib/libavcodec.so'].exp10f
-exp10f.restype = c_float
-exp10f.argtypes = [c_float]
-pow10f = _libraries['/usr/lib/libavcodec.so'].pow10f
-pow10f.restype = c_float
-pow10f.argtypes = [c_float]
-pow10l = _libraries['/usr/lib/libavcodec.so'].pow10l
-pow10l.restype = c_longdouble
-pow10l.argtypes = [c_longdouble]
-pow10 = _libraries['/usr/lib/libavcodec.so'].pow10
-pow10.restype = c_double
-pow10.argtypes = [c_double]
-expm1 = _libraries['/usr/lib/libavcodec.so'].expm1
-expm1.restype = c_double
-expm1.argtypes = [c_double]
-expm1l = _libraries['/usr/lib/libavcodec.so'].expm1l
-expm1l.restype = c_longdouble
-expm1l.argtypes = [c_longdouble]
-expm1f = _libraries['/usr/lib/libavcodec.so'].expm1f
-expm1f.restype = c_float
-expm1f.argtypes = [c_float]
-log1p = _libraries['/usr/lib/libavcodec.so'].log1p
-log1p.restype = c_double
-log1p.argtypes = [c_double]
-log1pl = _libraries['/usr/lib/libavcodec.so'].log1pl
-log1pl.restype = c_longdouble
-log1pl.argtypes = [c_longdouble]
-log1pf = _libraries['/usr/lib/libavcodec.so'].log1pf
-log1pf.restype = c_float
-log1pf.argtypes = [c_float]
-logb = _libraries['/usr/lib/libavcodec.so'].logb
-logb.restype = c_double
-logb.argtypes = [c_double]
-logbf = _libraries['/usr/lib/libavcodec.so'].logbf
-logbf.restype = c_float
-logbf.argtypes = [c_float]
-logbl = _libraries['/usr/lib/libavcodec.so'].logbl
-logbl.restype = c_longdouble
-logbl.argtypes = [c_longdouble]
-exp2 = _libraries['/usr/lib/libavcodec.so'].exp2
-exp2.restype = c_double
-exp2.argtypes = [c_double]
-exp2f = _libraries['/usr/lib/libavcodec.so'].exp2f
-exp2f.restype = c_float
-exp2f.argtypes = [c_float]
-exp2l = _libraries['/usr/lib/libavcodec.so'].exp2l
-exp2l.restype = c_longdouble
-exp2l.argtypes = [c_longdouble]
-log2 = _libraries['/usr/lib/libavcodec.so'].log2
-log2.restype = c_double
-log2.argtypes = [c_double]
-log2l = _libraries['/usr/lib/libavcodec.so'].log2l
-log2l.restype = c_longdouble
-log2l.argtypes = [c_longdouble]
-log2f = _libraries['/usr/lib/libavcodec.so'].log2f
-log2f.restype = c_float
-log2f.argtypes = [c_float]
-powf = _libraries['/usr/lib/libavcodec.so'].powf
-powf.restype = c_float
-powf.argtypes = [c_float, c_float]
-powl = _libraries['/usr/lib/libavcodec.so'].powl
-powl.restype = c_longdouble
-powl.argtypes = [c_longdouble, c_longdouble]
-pow = _libraries['/usr/lib/libavcodec.so'].pow
-pow.restype = c_double
-pow.argtypes = [c_double, c_double]
-sqrt = _libraries['/usr/lib/libavcodec.so'].sqrt
-sqrt.restype = c_double
-sqrt.argtypes = [c_double]
-sqrtf = _libraries['/usr/lib/libavcodec.so'].sqrtf
-sqrtf.restype = c_float
-sqrtf.argtypes = [c_float]
-sqrtl = _libraries['/usr/lib/libavcodec.so'].sqrtl
-sqrtl.restype = c_longdouble
-sqrtl.argtypes = [c_longdouble]
-hypotf = _libraries['/usr/lib/libavcodec.so'].hypotf
-hypotf.restype = c_float
-hypotf.argtypes = [c_float, c_float]
-hypotl = _libraries['/usr/lib/libavcodec.so'].hypotl
-hypotl.restype = c_longdouble
-hypotl.argtypes = [c_longdouble, c_longdouble]
-hypot = _libraries['/usr/lib/libavcodec.so'].hypot
-hypot.restype = c_double
-hypot.argtypes = [c_double, c_double]
-cbrtf = _libraries['/usr/lib/libavcodec.so'].cbrtf
-cbrtf.restype = c_float
-cbrtf.argtypes = [c_float]
-cbrtl = _libraries['/usr/lib/libavcodec.so'].cbrtl
-cbrtl.restype = c_longdouble
-cbrtl.argtypes = [c_longdouble]
-cbrt = _libraries['/usr/lib/libavcodec.so'].cbrt
-cbrt.restype = c_double
-cbrt.argtypes = [c_double]
-ceil = _libraries['/usr/lib/libavcodec.so'].ceil
-ceil.restype = c_double
-ceil.argtypes = [c_double]
-ceilf = _libraries['/usr/lib/libavcodec.so'].ceilf
-ceilf.restype = c_float
-ceilf.argtypes = [c_float]
-ceill = _libraries['/usr/lib/libavcodec.so'].ceill
-ceill.restype = c_longdouble
-ceill.argtypes = [c_longdouble]
-fabs = _libraries['/usr/lib/libavcodec.so'].fabs
-fabs.restype = c_double
-fabs.argtypes = [c_double]
-fabsl = _libraries['/usr/lib/libavcodec.so'].fabsl
-fabsl.restype = c_longdouble
-fabsl.argtypes = [c_longdouble]
-fabsf = _libraries['/usr/lib/libavcodec.so'].fabsf
-fabsf.restype = c_float
-fabsf.argtypes = [c_float]
-floor = _libraries['/usr/lib/libavcodec.so'].floor
-floor.restype = c_double
-floor.argtypes = [c_double]
-floorf = _libraries['/usr/lib/libavcodec.so'].floorf
-floorf.restype = c_float
-floorf.argtypes = [c_float]
-floorl = _libraries['/usr/lib/libavcodec.so'].floorl
-floorl.restype = c_longdouble
-floorl.argtypes = [c_longdouble]
-fmod = _libraries['/usr/lib/libavcodec.so'].fmod
-fmod.restype = c_double
-fmod.argtypes = [c_double, c_double]
-fmodf = _libraries['/usr/lib/libavcodec.so'].fmodf
-fmodf.restype = c_float
-fmodf.argtypes = [c_float, c_float]
-fmodl = _libraries['/usr/lib/libavcodec.so'].fmodl
-fmodl.restype = c_longdouble
-fmodl.argtypes = [c_longdouble, c_longdouble]
-__isinfl = _libraries['/usr/lib/libavcodec.so'].__isinfl
-__isinfl.restype = c_int
-__isinfl.argtypes = [c_longdouble]
-__isinff = _libraries['/usr/lib/libavcodec.so'].__isinff
-__isinff.restype = c_int
-__isinff.argtypes = [c_float]
-__isinf = _libraries['/usr/lib/libavcodec.so'].__isinf
-__isinf.restype = c_int
-__isinf.argtypes = [c_double]
-__finitef = _libraries['/usr/lib/libavcodec.so'].__finitef
-__finitef.restype = c_int
-__finitef.argtypes = [c_float]
-__finitel = _libraries['/usr/lib/libavcodec.so'].__finitel
-__finitel.restype = c_int
-__finitel.argtypes = [c_longdouble]
-__finite = _libraries['/usr/lib/libavcodec.so'].__finite
-__finite.restype = c_int
-__finite.argtypes = [c_double]
-isinf = _libraries['/usr/lib/libavcodec.so'].isinf
-isinf.restype = c_int
-isinf.argtypes = [c_double]
-isinff = _libraries['/usr/lib/libavcodec.so'].isinff
-isinff.restype = c_int
-isinff.argtypes = [c_float]
-isinfl = _libraries['/usr/lib/libavcodec.so'].isinfl
-isinfl.restype = c_int
-isinfl.argtypes = [c_longdouble]
-finitel = _libraries['/usr/lib/libavcodec.so'].finitel
-finitel.restype = c_int
-finitel.argtypes = [c_longdouble]
-finitef = _libraries['/usr/lib/libavcodec.so'].finitef
-finitef.restype = c_int
-finitef.argtypes = [c_float]
-finite = _libraries['/usr/lib/libavcodec.so'].finite
-finite.restype = c_int
-finite.argtypes = [c_double]
-dremf = _libraries['/usr/lib/libavcodec.so'].dremf
-dremf.restype = c_float
-dremf.argtypes = [c_float, c_float]
-dreml = _libraries['/usr/lib/libavcodec.so'].dreml
-dreml.restype = c_longdouble
-dreml.argtypes = [c_longdouble, c_longdouble]
-drem = _libraries['/usr/lib/libavcodec.so'].drem
-drem.restype = c_double
-drem.argtypes = [c_double, c_double]
-significandf = _libraries['/usr/lib/libavcodec.so'].significandf
-significandf.restype = c_float
-significandf.argtypes = [c_float]
-significandl = _libraries['/usr/lib/libavcodec.so'].significandl
-significandl.restype = c_longdouble
-significandl.argtypes = [c_longdouble]
-significand = _libraries['/usr/lib/libavcodec.so'].significand
-significand.restype = c_double
-significand.argtypes = [c_double]
-copysign = _libraries['/usr/lib/libavcodec.so'].copysign
-copysign.restype = c_double
-copysign.argtypes = [c_double, c_double]
-copysignf = _libraries['/usr/lib/libavcodec.so'].copysignf
-copysignf.restype = c_float
-copysignf.argtypes = [c_float, c_float]
-copysignl = _libraries['/usr/lib/libavcodec.so'].copysignl
-copysignl.restype = c_longdouble
-copysignl.argtypes = [c_longdouble, c_longdouble]
-nanf = _libraries['/usr/lib/libavcodec.so'].nanf
-nanf.restype = c_float
-nanf.argtypes = [STRING]
-nan = _libraries['/usr/lib/libavcodec.so'].nan
-nan.restype = c_double
-nan.argtypes = [STRING]
-nanl = _libraries['/usr/lib/libavcodec.so'].nanl
-nanl.restype = c_longdouble
-nanl.argtypes = [STRING]
-__isnanf = _libraries['/usr/lib/libavcodec.so'].__isnanf
-__isnanf.restype = c_int
-__isnanf.argtypes = [c_float]
-__isnanl = _libraries['/usr/lib/libavcodec.so'].__isnanl
-__isnanl.restype = c_int
-__isnanl.argtypes = [c_longdouble]
-__isnan = _libraries['/usr/lib/libavcodec.so'].__isnan
-__isnan.restype = c_int
-__isnan.argtypes = [c_double]
-isnan = _libraries['/usr/lib/libavcodec.so'].isnan
-isnan.restype = c_int
-isnan.argtypes = [c_double]
-isnanl = _libraries['/usr/lib/libavcodec.so'].isnanl
-isnanl.restype = c_int
-isnanl.argtypes = [c_longdouble]
-isnanf = _libraries['/usr/lib/libavcodec.so'].isnanf
-isnanf.restype = c_int
-isnanf.argtypes = [c_float]
-j0f = _libraries['/usr/lib/libavcodec.so'].j0f
-j0f.restype = c_float
-j0f.argtypes = [c_float]
-j0l = _libraries['/usr/lib/libavcodec.so'].j0l
-j0l.restype = c_longdouble
-j0l.argtypes = [c_longdouble]
-j0 = _libraries['/usr/lib/libavcodec.so'].j0
-j0.restype = c_double
-j0.argtypes = [c_double]
-j1l = _libraries['/usr/lib/libavcodec.so'].j1l
-j1l.restype = c_longdouble
-j1l.argtypes = [c_longdouble]
-j1f = _libraries['/usr/lib/libavcodec.so'].j1f
-j1f.restype = c_float
-j1f.argtypes = [c_float]
-j1 = _libraries['/usr/lib/libavcodec.so'].j1
-j1.restype = c_double
-j1.argtypes = [c_double]
-jnl = _libraries['/usr/lib/libavcodec.so'].jnl
-jnl.restype = c_longdouble
-jnl.argtypes = [c_int, c_longdouble]
-jn = _libraries['/usr/lib/libavcodec.so'].jn
-jn.restype = c_double
-jn.argtypes = [c_int, c_double]
-jnf = _libraries['/usr/lib/libavcodec.so'].jnf
-jnf.restype = c_float
-jnf.argtypes = [c_int, c_float]
-y0f = _libraries['/usr/lib/libavcodec.so'].y0f
-y0f.restype = c_float
-y0f.argtypes = [c_float]
-y0l = _libraries['/usr/lib/libavcodec.so'].y0l
-y0l.restype = c_longdouble
-y0l.argtypes = [c_longdouble]
-y0 = _libraries['/usr/lib/libavcodec.so'].y0
-y0.restype = c_double
-y0.argtypes = [c_double]
-y1f = _libraries['/usr/lib/libavcodec.so'].y1f
-y1f.restype = c_float
-y1f.argtypes = [c_float]
-y1l = _libraries['/usr/lib/libavcodec.so'].y1l
-y1l.restype = c_longdouble
-y1l.argtypes = [c_longdouble]
-y1 = _libraries['/usr/lib/libavcodec.so'].y1
-y1.restype = c_double
-y1.argtypes = [c_double]
-ynf = _libraries['/usr/lib/libavcodec.so'].ynf
-ynf.restype = c_float
-ynf.argtypes = [c_int, c_float]
-ynl = _libraries['/usr/lib/libavcodec.so'].ynl
-ynl.restype = c_longdouble
-ynl.argtypes = [c_int, c_longdouble]
-yn = _libraries['/usr/lib/libavcodec.so'].yn
-yn.restype = c_double
-yn.argtypes = [c_int, c_double]
-erfl = _libraries['/usr/lib/libavcodec.so'].erfl
-erfl.restype = c_longdouble
-erfl.argtypes = [c_longdouble]
-erff = _libraries['/usr/lib/libavcodec.so'].erff
-erff.restype = c_float
-erff.argtypes = [c_float]
-erf = _libraries['/usr/lib/libavcodec.so'].erf
-erf.restype = c_double
-erf.argtypes = [c_double]
-erfcf = _libraries['/usr/lib/libavcodec.so'].erfcf
-erfcf.restype = c_float
-erfcf.argtypes = [c_float]
-erfcl = _libraries['/usr/lib/libavcodec.so'].erfcl
-erfcl.restype = c_longdouble
-erfcl.argtypes = [c_longdouble]
-erfc = _libraries['/usr/lib/libavcodec.so'].erfc
-erfc.restype = c_double
-erfc.argtypes = [c_double]
-lgammal = _libraries['/usr/lib/libavcodec.so'].lgammal
-lgammal.restype = c_longdouble
-lgammal.argtypes = [c_longdouble]
-lgammaf = _libraries['/usr/lib/libavcodec.so'].lgammaf
-lgammaf.restype = c_float
-lgammaf.argtypes = [c_float]
-lgamma = _libraries['/usr/lib/libavcodec.so'].lgamma
-lgamma.restype = c_double
-lgamma.argtypes = [c_double]
-tgamma = _libraries['/usr/lib/libavcodec.so'].tgamma
-tgamma.restype = c_double
-tgamma.argtypes = [c_double]
-tgammaf = _libraries['/usr/lib/libavcodec.so'].tgammaf
-tgammaf.restype = c_float
-tgammaf.argtypes = [c_float]
-tgammal = _libraries['/usr/lib/libavcodec.so'].tgammal
-tgammal.restype = c_longdouble
-tgammal.argtypes = [c_longdouble]
-gammal = _libraries['/usr/lib/libavcodec.so'].gammal
-gammal.restype = c_longdouble
-gammal.argtypes = [c_longdouble]
-gamma = _libraries['/usr/lib/libavcodec.so'].gamma
-gamma.restype = c_double
-gamma.argtypes = [c_double]
-gammaf = _libraries['/usr/lib/libavcodec.so'].gammaf
-gammaf.restype = c_float
-gammaf.argtypes = [c_float]
-lgammaf_r = _libraries['/usr/lib/libavcodec.so'].lgammaf_r
-lgammaf_r.restype = c_float
-lgammaf_r.argtypes = [c_float, POINTER(c_int)]
-lgammal_r = _libraries['/usr/lib/libavcodec.so'].lgammal_r
-lgammal_r.restype = c_longdouble
-lgammal_r.argtypes = [c_longdouble, POINTER(c_int)]
-lgamma_r = _libraries['/usr/lib/libavcodec.so'].lgamma_r
-lgamma_r.restype = c_double
-lgamma_r.argtypes = [c_double, POINTER(c_int)]
-rintf = _libraries['/usr/lib/libavcodec.so'].rintf
-rintf.restype = c_float
-rintf.argtypes = [c_float]
-rintl = _libraries['/usr/lib/libavcodec.so'].rintl
-rintl.restype = c_longdouble
-rintl.argtypes = [c_longdouble]
-rint = _libraries['/usr/lib/libavcodec.so'].rint
-rint.restype = c_double
-rint.argtypes = [c_double]
-nextafterf = _libraries['/usr/lib/libavcodec.so'].nextafterf
-nextafterf.restype = c_float
-nextafterf.argtypes = [c_float, c_float]
-nextafter = _libraries['/usr/lib/libavcodec.so'].nextafter
-nextafter.restype = c_double
-nextafter.argtypes = [c_double, c_double]
-nextafterl = _libraries['/usr/lib/libavcodec.so'].nextafterl
-nextafterl.restype = c_longdouble
-nextafterl.argtypes = [c_longdouble, c_longdouble]
-nexttowardl = _libraries['/usr/lib/libavcodec.so'].nexttowardl
-nexttowardl.restype = c_longdouble
-nexttowardl.argtypes = [c_longdouble, c_longdouble]
-nexttoward = _libraries['/usr/lib/libavcodec.so'].nexttoward
-nexttoward.restype = c_double
-nexttoward.argtypes = [c_double, c_longdouble]
-nexttowardf = _libraries['/usr/lib/libavcodec.so'].nexttowardf
-nexttowardf.restype = c_float
-nexttowardf.argtypes = [c_float, c_longdouble]
-remainderf = _libraries['/usr/lib/libavcodec.so'].remainderf
-remainderf.restype = c_float
-remainderf.argtypes = [c_float, c_float]
-remainder = _libraries['/usr/lib/libavcodec.so'].remainder
-remainder.restype = c_double
-remainder.argtypes = [c_double, c_double]
-remainderl = _libraries['/usr/lib/libavcodec.so'].remainderl
-remainderl.restype = c_longdouble
-remainderl.argtypes = [c_longdouble, c_longdouble]
-scalbnl = _libraries['/usr/lib/libavcodec.so'].scalbnl
-scalbnl.restype = c_longdouble
-scalbnl.argtypes = [c_longdouble, c_int]
-scalbnf = _libraries['/usr/lib/libavcodec.so'].scalbnf
-scalbnf.restype = c_float
-scalbnf.argtypes = [c_float, c_int]
-scalbn = _libraries['/usr/lib/libavcodec.so'].scalbn
-scalbn.restype = c_double
-scalbn.argtypes = [c_double, c_int]
-ilogbl = _libraries['/usr/lib/libavcodec.so'].ilogbl
-ilogbl.restype = c_int
-ilogbl.argtypes = [c_longdouble]
-ilogb = _libraries['/usr/lib/libavcodec.so'].ilogb
-ilogb.restype = c_int
-ilogb.argtypes = [c_double]
-ilogbf = _libraries['/usr/lib/libavcodec.so'].ilogbf
-ilogbf.restype = c_int
-ilogbf.argtypes = [c_float]
-scalblnf = _libraries['/usr/lib/libavcodec.so'].scalblnf
-scalblnf.restype = c_float
-scalblnf.argtypes = [c_float, c_long]
-scalblnl = _libraries['/usr/lib/libavcodec.so'].scalblnl
-scalblnl.restype = c_longdouble
-scalblnl.argtypes = [c_longdouble, c_long]
-scalbln = _libraries['/usr/lib/libavcodec.so'].scalbln
-scalbln.restype = c_double
-scalbln.argtypes = [c_double, c_long]
-nearbyint = _libraries['/usr/lib/libavcodec.so'].nearbyint
-nearbyint.restype = c_double
-nearbyint.argtypes = [c_double]
-nearbyintf = _libraries['/usr/lib/libavcodec.so'].nearbyintf
-nearbyintf.restype = c_float
-nearbyintf.argtypes = [c_float]
-nearbyintl = _libraries['/usr/lib/libavcodec.so'].nearbyintl
-nearbyintl.restype = c_longdouble
-nearbyintl.argtypes = [c_longdouble]
-roundl = _libraries['/usr/lib/libavcodec.so'].roundl
-roundl.restype = c_longdouble
-roundl.argtypes = [c_longdouble]
-round = _libraries['/usr/lib/libavcodec.so'].round
-round.restype = c_double
-round.argtypes = [c_double]
-roundf = _libraries['/usr/lib/libavcodec.so'].roundf
-roundf.restype = c_float
-roundf.argtypes = [c_float]
-truncf = _libraries['/usr/lib/libavcodec.so'].truncf
-truncf.restype = c_float
-truncf.argtypes = [c_float]
-trunc = _libraries['/usr/lib/libavcodec.so'].trunc
-trunc.restype = c_double
-trunc.argtypes = [c_double]
-truncl = _libraries['/usr/lib/libavcodec.so'].truncl
-truncl.restype = c_longdouble
-truncl.argtypes = [c_longdouble]
-remquo = _libraries['/usr/lib/libavcodec.so'].remquo
-remquo.restype = c_double
-remquo.argtypes = [c_double, c_double, POINTER(c_int)]
-remquof = _libraries['/usr/lib/libavcodec.so'].remquof
-remquof.restype = c_float
-remquof.argtypes = [c_float, c_float, POINTER(c_int)]
-remquol = _libraries['/usr/lib/libavcodec.so'].remquol
-remquol.restype = c_longdouble
-remquol.argtypes = [c_longdouble, c_longdouble, POINTER(c_int)]
-lrint = _libraries['/usr/lib/libavcodec.so'].lrint
-lrint.restype = c_long
-lrint.argtypes = [c_double]
-lrintf = _libraries['/usr/lib/libavcodec.so'].lrintf
-lrintf.restype = c_long
-lrintf.argtypes = [c_float]
-lrintl = _libraries['/usr/lib/libavcodec.so'].lrintl
-lrintl.restype = c_long
-lrintl.argtypes = [c_longdouble]
-llrintl = _libraries['/usr/lib/libavcodec.so'].llrintl
-llrintl.restype = c_longlong
-llrintl.argtypes = [c_longdouble]
-llrintf = _libraries['/usr/lib/libavcodec.so'].llrintf
-llrintf.restype = c_longlong
-llrintf.argtypes = [c_float]
-llrint = _libraries['/usr/lib/libavcodec.so'].llrint
-llrint.restype = c_longlong
-llrint.argtypes = [c_double]
-lround = _libraries['/usr/lib/libavcodec.so'].lround
-lround.restype = c_long
-lround.argtypes = [c_double]
-lroundl = _libraries['/usr/lib/libavcodec.so'].lroundl
-lroundl.restype = c_long
-lroundl.argtypes = [c_longdouble]
-lroundf = _libraries['/usr/lib/libavcodec.so'].lroundf
-lroundf.restype = c_long
-lroundf.argtypes = [c_float]
-llround = _libraries['/usr/lib/libavcodec.so'].llround
-llround.restype = c_longlong
-llround.argtypes = [c_double]
-llroundl = _libraries['/usr/lib/libavcodec.so'].llroundl
-llroundl.restype = c_longlong
-llroundl.argtypes = [c_longdouble]
-llroundf = _libraries['/usr/lib/libavcodec.so'].llroundf
-llroundf.restype = c_longlong
-llroundf.argtypes = [c_float]
-fdimf = _libraries['/usr/lib/libavcodec.so'].fdimf
-fdimf.restype = c_float
-fdimf.argtypes = [c_float, c_float]
-fdiml = _libraries['/usr/lib/libavcodec.so'].fdiml
-fdiml.restype = c_longdouble
-fdiml.argtypes = [c_longdouble, c_longdouble]
-fdim = _libraries['/usr/lib/libavcodec.so'].fdim
-fdim.restype = c_double
-fdim.argtypes = [c_double, c_double]
-fmaxf = _libraries['/usr/lib/libavcodec.so'].fmaxf
-fmaxf.restype = c_float
-fmaxf.argtypes = [c_float, c_float]
-fmaxl = _libraries['/usr/lib/libavcodec.so'].fmaxl
-fmaxl.restype = c_longdouble
-fmaxl.argtypes = [c_longdouble, c_longdouble]
-fmax = _libraries['/usr/lib/libavcodec.so'].fmax
-fmax.restype = c_double
-fmax.argtypes = [c_double, c_double]
-fminl = _libraries['/usr/lib/libavcodec.so'].fminl
-fminl.restype = c_longdouble
-fminl.argtypes = [c_longdouble, c_longdouble]
-fmin = _libraries['/usr/lib/libavcodec.so'].fmin
-fmin.restype = c_double
-fmin.argtypes = [c_double, c_double]
-fminf = _libraries['/usr/lib/libavcodec.so'].fminf
-fminf.restype = c_float
-fminf.argtypes = [c_float, c_float]
-__fpclassifyl = _libraries['/usr/lib/libavcodec.so'].__fpclassifyl
-__fpclassifyl.restype = c_int
-__fpclassifyl.argtypes = [c_longdouble]
-__fpclassifyf = _libraries['/usr/lib/libavcodec.so'].__fpclassifyf
-__fpclassifyf.restype = c_int
-__fpclassifyf.argtypes = [c_float]
-__fpclassify = _libraries['/usr/lib/libavcodec.so'].__fpclassify
-__fpclassify.restype = c_int
-__fpclassify.argtypes = [c_double]
-fma = _libraries['/usr/lib/libavcodec.so'].fma
-fma.restype = c_double
-fma.argtypes = [c_double, c_double, c_double]
-fmaf = _libraries['/usr/lib/libavcodec.so'].fmaf
-fmaf.restype = c_float
-fmaf.argtypes = [c_float, c_float, c_float]
-fmal = _libraries['/usr/lib/libavcodec.so'].fmal
-fmal.restype = c_longdouble
-fmal.argtypes = [c_longdouble, c_longdouble, c_longdouble]
-scalb = _libraries['/usr/lib/libavcodec.so'].scalb
-scalb.restype = c_double
-scalb.argtypes = [c_double, c_double]
-scalbl = _libraries['/usr/lib/libavcodec.so'].scalbl
-scalbl.restype = c_longdouble
-scalbl.argtypes = [c_longdouble, c_longdouble]
-scalbf = _libraries['/usr/lib/libavcodec.so'].scalbf
-scalbf.restype = c_float
-scalbf.argtypes = [c_float, c_float]
 float_t = c_float
 double_t = c_double
-__signbitf = _libraries['/usr/lib/libavcodec.so'].__signbitf
-__signbitf.restype = c_int
-__signbitf.argtypes = [c_float]
-__signbit = _libraries['/usr/lib/libavcodec.so'].__signbit
-__signbit.restype = c_int
-__signbit.argtypes = [c_double]
-__signbitl = _libraries['/usr/lib/libavcodec.so'].__signbitl
-__signbitl.restype = c_int
-__signbitl.argtypes = [c_longdouble]
 pthread_t = c_ulong
-class pthread_attr_t(Union):
-    pass
-pthread_attr_t._fields_ = [
-    ('__size', c_char * 56),
-    ('__align', c_long),
-]
-class __pthread_internal_list(Structure):
-    pass
-__pthread_internal_list._fields_ = [
-    ('__prev', POINTER(__pthread_internal_list)),
-    ('__next', POINTER(__pthread_internal_list)),
-]
-__pthread_list_t = __pthread_internal_list
-class __pthread_mutex_s(Structure):
-    pass
-__pthread_mutex_s._fields_ = [
-    ('__lock', c_int),
-    ('__count', c_uint),
-    ('__owner', c_int),
-    ('__nusers', c_uint),
-    ('__kind', c_int),
-    ('__spins', c_int),
-    ('__list', __pthread_list_t),
-]
-class pthread_mutex_t(Union):
-    pass
-pthread_mutex_t._fields_ = [
-    ('__data', __pthread_mutex_s),
-    ('__size', c_char * 40),
-    ('__align', c_long),
-]
-class pthread_mutexattr_t(Union):
-    pass
-pthread_mutexattr_t._fields_ = [
-    ('__size', c_char * 4),
-    ('__align', c_int),
-]
-class N14pthread_cond_t4DOT_20E(Structure):
-    pass
-N14pthread_cond_t4DOT_20E._fields_ = [
-    ('__lock', c_int),
-    ('__futex', c_uint),
-    ('__total_seq', c_ulonglong),
-    ('__wakeup_seq', c_ulonglong),
-    ('__woken_seq', c_ulonglong),
-    ('__mutex', c_void_p),
-    ('__nwaiters', c_uint),
-    ('__broadcast_seq', c_uint),
-]
-class pthread_cond_t(Union):
-    pass
-pthread_cond_t._fields_ = [
-    ('__data', N14pthread_cond_t4DOT_20E),
-    ('__size', c_char * 48),
-    ('__align', c_longlong),
-]
-class pthread_condattr_t(Union):
-    pass
-pthread_condattr_t._fields_ = [
-    ('__size', c_char * 4),
-    ('__align', c_int),
-]
 pthread_key_t = c_uint
 pthread_once_t = c_int
-class N16pthread_rwlock_t4DOT_23E(Structure):
-    pass
-N16pthread_rwlock_t4DOT_23E._fields_ = [
-    ('__lock', c_int),
-    ('__nr_readers', c_uint),
-    ('__readers_wakeup', c_uint),
-    ('__writer_wakeup', c_uint),
-    ('__nr_readers_queued', c_uint),
-    ('__nr_writers_queued', c_uint),
-    ('__writer', c_int),
-    ('__shared', c_int),
-    ('__pad1', c_ulong),
-    ('__pad2', c_ulong),
-    ('__flags', c_uint),
-]
-class pthread_rwlock_t(Union):
-    pass
-pthread_rwlock_t._fields_ = [
-    ('__data', N16pthread_rwlock_t4DOT_23E),
-    ('__size', c_char * 56),
-    ('__align', c_long),
-]
-class pthread_rwlockattr_t(Union):
-    pass
-pthread_rwlockattr_t._fields_ = [
-    ('__size', c_char * 8),
-    ('__align', c_long),
-]
 pthread_spinlock_t = c_int
-class pthread_barrier_t(Union):
-    pass
-pthread_barrier_t._fields_ = [
-    ('__size', c_char * 32),
-    ('__align', c_long),
-]
-class pthread_barrierattr_t(Union):
-    pass
-pthread_barrierattr_t._fields_ = [
-    ('__size', c_char * 4),
-    ('__align', c_int),
-]
-__fdelt_chk = _libraries['/usr/lib/libavcodec.so'].__fdelt_chk
-__fdelt_chk.restype = c_long
-__fdelt_chk.argtypes = [c_long]
-__fdelt_warn = _libraries['/usr/lib/libavcodec.so'].__fdelt_warn
-__fdelt_warn.restype = c_long
-__fdelt_warn.argtypes = [c_long]
 __sig_atomic_t = c_int
-class __sigset_t(Structure):
-    pass
-__sigset_t._fields_ = [
-    ('__val', c_ulong * 16),
-]
-getchar = _libraries['/usr/lib/libavcodec.so'].getchar
-getchar.restype = c_int
-getchar.argtypes = []
-FILE = _IO_FILE
-fgetc_unlocked = _libraries['/usr/lib/libavcodec.so'].fgetc_unlocked
-fgetc_unlocked.restype = c_int
-fgetc_unlocked.argtypes = [POINTER(FILE)]
-getc_unlocked = _libraries['/usr/lib/libavcodec.so'].getc_unlocked
-getc_unlocked.restype = c_int
-getc_unlocked.argtypes = [POINTER(FILE)]
-getchar_unlocked = _libraries['/usr/lib/libavcodec.so'].getchar_unlocked
-getchar_unlocked.restype = c_int
-getchar_unlocked.argtypes = []
-putchar = _libraries['/usr/lib/libavcodec.so'].putchar
-putchar.restype = c_int
-putchar.argtypes = [c_int]
-fputc_unlocked = _libraries['/usr/lib/libavcodec.so'].fputc_unlocked
-fputc_unlocked.restype = c_int
-fputc_unlocked.argtypes = [c_int, POINTER(FILE)]
-putc_unlocked = _libraries['/usr/lib/libavcodec.so'].putc_unlocked
-putc_unlocked.restype = c_int
-putc_unlocked.argtypes = [c_int, POINTER(FILE)]
-putchar_unlocked = _libraries['/usr/lib/libavcodec.so'].putchar_unlocked
-putchar_unlocked.restype = c_int
-putchar_unlocked.argtypes = [c_int]
-getline = _libraries['/usr/lib/libavcodec.so'].getline
-getline.restype = __ssize_t
-getline.argtypes = [POINTER(STRING), POINTER(size_t), POINTER(FILE)]
-feof_unlocked = _libraries['/usr/lib/libavcodec.so'].feof_unlocked
-feof_unlocked.restype = c_int
-feof_unlocked.argtypes = [POINTER(FILE)]
-ferror_unlocked = _libraries['/usr/lib/libavcodec.so'].ferror_unlocked
-ferror_unlocked.restype = c_int
-ferror_unlocked.argtypes = [POINTER(FILE)]
-__sprintf_chk = _libraries['/usr/lib/libavcodec.so'].__sprintf_chk
-__sprintf_chk.restype = c_int
-__sprintf_chk.argtypes = [STRING, c_int, size_t, STRING]
-__vsprintf_chk = _libraries['/usr/lib/libavcodec.so'].__vsprintf_chk
-__vsprintf_chk.restype = c_int
-__vsprintf_chk.argtypes = [STRING, c_int, size_t, STRING, POINTER(__va_list_tag)]
-sprintf = _libraries['/usr/lib/libavcodec.so'].sprintf
-sprintf.restype = c_int
-sprintf.argtypes = [STRING, STRING]
-vsprintf = _libraries['/usr/lib/libavcodec.so'].vsprintf
-vsprintf.restype = c_int
-vsprintf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]
-__snprintf_chk = _libraries['/usr/lib/libavcodec.so'].__snprintf_chk
-__snprintf_chk.restype = c_int
-__snprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING]
-__vsnprintf_chk = _libraries['/usr/lib/libavcodec.so'].__vsnprintf_chk
-__vsnprintf_chk.restype = c_int
-__vsnprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING, POINTER(__va_list_tag)]
-snprintf = _libraries['/usr/lib/libavcodec.so'].snprintf
-snprintf.restype = c_int
-snprintf.argtypes = [STRING, size_t, STRING]
-vsnprintf = _libraries['/usr/lib/libavcodec.so'].vsnprintf
-vsnprintf.restype = c_int
-vsnprintf.argtypes = [STRING, size_t, STRING, POINTER(__va_list_tag)]
-__fprintf_chk = _libraries['/usr/lib/libavcodec.so'].__fprintf_chk
-__fprintf_chk.restype = c_int
-__fprintf_chk.argtypes = [POINTER(FILE), c_int, STRING]
-__printf_chk = _libraries['/usr/lib/libavcodec.so'].__printf_chk
-__printf_chk.restype = c_int
-__printf_chk.argtypes = [c_int, STRING]
-__vfprintf_chk = _libraries['/usr/lib/libavcodec.so'].__vfprintf_chk
-__vfprintf_chk.restype = c_int
-__vfprintf_chk.argtypes = [POINTER(FILE), c_int, STRING, POINTER(__va_list_tag)]
-__vprintf_chk = _libraries['/usr/lib/libavcodec.so'].__vprintf_chk
-__vprintf_chk.restype = c_int
-__vprintf_chk.argtypes = [c_int, STRING, POINTER(__va_list_tag)]
-fprintf = _libraries['/usr/lib/libavcodec.so'].fprintf
-fprintf.restype = c_int
-fprintf.argtypes = [POINTER(FILE), STRING]
-printf = _libraries['/usr/lib/libavcodec.so'].printf
-printf.restype = c_int
-printf.argtypes = [STRING]
-vprintf = _libraries['/usr/lib/libavcodec.so'].vprintf
-vprintf.restype = c_int
-vprintf.argtypes = [STRING, POINTER(__va_list_tag)]
-vfprintf = _libraries['/usr/lib/libavcodec.so'].vfprintf
-vfprintf.restype = c_int
-vfprintf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]
-__dprintf_chk = _libraries['/usr/lib/libavcodec.so'].__dprintf_chk
-__dprintf_chk.restype = c_int
-__dprintf_chk.argtypes = [c_int, c_int, STRING]
-__vdprintf_chk = _libraries['/usr/lib/libavcodec.so'].__vdprintf_chk
-__vdprintf_chk.restype = c_int
-__vdprintf_chk.argtypes = [c_int, c_int, STRING, POINTER(__va_list_tag)]
-dprintf = _libraries['/usr/lib/libavcodec.so'].dprintf
-dprintf.restype = c_int
-dprintf.argtypes = [c_int, STRING]
-vdprintf = _libraries['/usr/lib/libavcodec.so'].vdprintf
-vdprintf.restype = c_int
-vdprintf.argtypes = [c_int, STRING, POINTER(__va_list_tag)]
-__asprintf_chk = _libraries['/usr/lib/libavcodec.so'].__asprintf_chk
-__asprintf_chk.restype = c_int
-__asprintf_chk.argtypes = [POINTER(STRING), c_int, STRING]
-__vasprintf_chk = _libraries['/usr/lib/libavcodec.so'].__vasprintf_chk
-__vasprintf_chk.restype = c_int
-__vasprintf_chk.argtypes = [POINTER(STRING), c_int, STRING, POINTER(__va_list_tag)]
-class obstack(Structure):
-    pass
-__obstack_printf_chk = _libraries['/usr/lib/libavcodec.so'].__obstack_printf_chk
-__obstack_printf_chk.restype = c_int
-__obstack_printf_chk.argtypes = [POINTER(obstack), c_int, STRING]
-__obstack_vprintf_chk = _libraries['/usr/lib/libavcodec.so'].__obstack_vprintf_chk
-__obstack_vprintf_chk.restype = c_int
-__obstack_vprintf_chk.argtypes = [POINTER(obstack), c_int, STRING, POINTER(__va_list_tag)]
-asprintf = _libraries['/usr/lib/libavcodec.so'].asprintf
-asprintf.restype = c_int
-asprintf.argtypes = [POINTER(STRING), STRING]
-__asprintf = _libraries['/usr/lib/libavcodec.so'].__asprintf
-__asprintf.restype = c_int
-__asprintf.argtypes = [POINTER(STRING), STRING]
-obstack_printf = _libraries['/usr/lib/libavcodec.so'].obstack_printf
-obstack_printf.restype = c_int
-obstack_printf.argtypes = [POINTER(obstack), STRING]
-vasprintf = _libraries['/usr/lib/libavcodec.so'].vasprintf
-vasprintf.restype = c_int
-vasprintf.argtypes = [POINTER(STRING), STRING, POINTER(__va_list_tag)]
-obstack_vprintf = _libraries['/usr/lib/libavcodec.so'].obstack_vprintf
-obstack_vprintf.restype = c_int
-obstack_vprintf.argtypes = [POINTER(obstack), STRING, POINTER(__va_list_tag)]
-__fgets_chk = _libraries['/usr/lib/libavcodec.so'].__fgets_chk
-__fgets_chk.restype = STRING
-__fgets_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]
-fgets = _libraries['/usr/lib/libavcodec.so'].fgets
-fgets.restype = STRING
-fgets.argtypes = [STRING, c_int, POINTER(FILE)]
-__fread_chk = _libraries['/usr/lib/libavcodec.so'].__fread_chk
-__fread_chk.restype = size_t
-__fread_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]
-fread = _libraries['/usr/lib/libavcodec.so'].fread
-fread.restype = size_t
-fread.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-__fgets_unlocked_chk = _libraries['/usr/lib/libavcodec.so'].__fgets_unlocked_chk
-__fgets_unlocked_chk.restype = STRING
-__fgets_unlocked_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]
-fgets_unlocked = _libraries['/usr/lib/libavcodec.so'].fgets_unlocked
-fgets_unlocked.restype = STRING
-fgets_unlocked.argtypes = [STRING, c_int, POINTER(FILE)]
-__fread_unlocked_chk = _libraries['/usr/lib/libavcodec.so'].__fread_unlocked_chk
-__fread_unlocked_chk.restype = size_t
-__fread_unlocked_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]
-fread_unlocked = _libraries['/usr/lib/libavcodec.so'].fread_unlocked
-fread_unlocked.restype = size_t
-fread_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-atof = _libraries['/usr/lib/libavcodec.so'].atof
-atof.restype = c_double
-atof.argtypes = [STRING]
-__realpath_chk = _libraries['/usr/lib/libavcodec.so'].__realpath_chk
-__realpath_chk.restype = STRING
-__realpath_chk.argtypes = [STRING, STRING, size_t]
-realpath = _libraries['/usr/lib/libavcodec.so'].realpath
-realpath.restype = STRING
-realpath.argtypes = [STRING, STRING]
-__ptsname_r_chk = _libraries['/usr/lib/libavcodec.so'].__ptsname_r_chk
-__ptsname_r_chk.restype = c_int
-__ptsname_r_chk.argtypes = [c_int, STRING, size_t, size_t]
-ptsname_r = _libraries['/usr/lib/libavcodec.so'].ptsname_r
-ptsname_r.restype = c_int
-ptsname_r.argtypes = [c_int, STRING, size_t]
-__wctomb_chk = _libraries['/usr/lib/libavcodec.so'].__wctomb_chk
-__wctomb_chk.restype = c_int
-__wctomb_chk.argtypes = [STRING, c_wchar, size_t]
-wctomb = _libraries['/usr/lib/libavcodec.so'].wctomb
-wctomb.restype = c_int
-wctomb.argtypes = [STRING, c_wchar]
-__mbstowcs_chk = _libraries['/usr/lib/libavcodec.so'].__mbstowcs_chk
-__mbstowcs_chk.restype = size_t
-__mbstowcs_chk.argtypes = [WSTRING, STRING, size_t, size_t]
-mbstowcs = _libraries['/usr/lib/libavcodec.so'].mbstowcs
-mbstowcs.restype = size_t
-mbstowcs.argtypes = [WSTRING, STRING, size_t]
-__wcstombs_chk = _libraries['/usr/lib/libavcodec.so'].__wcstombs_chk
-__wcstombs_chk.restype = size_t
-__wcstombs_chk.argtypes = [STRING, WSTRING, size_t, size_t]
-wcstombs = _libraries['/usr/lib/libavcodec.so'].wcstombs
-wcstombs.restype = size_t
-wcstombs.argtypes = [STRING, WSTRING, size_t]
-memcpy = _libraries['/usr/lib/libavcodec.so'].memcpy
-memcpy.restype = c_void_p
-memcpy.argtypes = [c_void_p, c_void_p, size_t]
-memmove = _libraries['/usr/lib/libavcodec.so'].memmove
-memmove.restype = c_void_p
-memmove.argtypes = [c_void_p, c_void_p, size_t]
-mempcpy = _libraries['/usr/lib/libavcodec.so'].mempcpy
-mempcpy.restype = c_void_p
-mempcpy.argtypes = [c_void_p, c_void_p, size_t]
-memset = _libraries['/usr/lib/libavcodec.so'].memset
-memset.restype = c_void_p
-memset.argtypes = [c_void_p, c_int, size_t]
-bcopy = _libraries['/usr/lib/libavcodec.so'].bcopy
-bcopy.restype = None
-bcopy.argtypes = [c_void_p, c_void_p, size_t]
-bzero = _libraries['/usr/lib/libavcodec.so'].bzero
-bzero.restype = None
-bzero.argtypes = [c_void_p, size_t]
-strcpy = _libraries['/usr/lib/libavcodec.so'].strcpy
-strcpy.restype = STRING
-strcpy.argtypes = [STRING, STRING]
-stpcpy = _libraries['/usr/lib/libavcodec.so'].stpcpy
-stpcpy.restype = STRING
-stpcpy.argtypes = [STRING, STRING]
-strncpy = _libraries['/usr/lib/libavcodec.so'].strncpy
-strncpy.restype = STRING
-strncpy.argtypes = [STRING, STRING, size_t]
-__stpncpy_chk = _libraries['/usr/lib/libavcodec.so'].__stpncpy_chk
-__stpncpy_chk.restype = STRING
-__stpncpy_chk.argtypes = [STRING, STRING, size_t, size_t]
-stpncpy = _libraries['/usr/lib/libavcodec.so'].stpncpy
-stpncpy.restype = STRING
-stpncpy.argtypes = [STRING, STRING, size_t]
-strcat = _libraries['/usr/lib/libavcodec.so'].strcat
-strcat.restype = STRING
-strcat.argtypes = [STRING, STRING]
-strncat = _libraries['/usr/lib/libavcodec.so'].strncat
-strncat.restype = STRING
-strncat.argtypes = [STRING, STRING, size_t]
-sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libavcodec.so'], 'sys_nerr')
-sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libavcodec.so'], 'sys_errlist')
-_sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libavcodec.so'], '_sys_nerr')
-_sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libavcodec.so'], '_sys_errlist')
-class timeval(Structure):
-    pass
 __time_t = c_long
 __suseconds_t = c_long
-timeval._fields_ = [
-    ('tv_sec', __time_t),
-    ('tv_usec', __suseconds_t),
-]
 __u_char = c_ubyte
 __u_short = c_ushort
 __u_int = c_uint
@@ -3704,11 +2604,6 @@ __ino_t = c_ulong
 __ino64_t = c_ulong
 __mode_t = c_uint
 __nlink_t = c_ulong
-class __fsid_t(Structure):
-    pass
-__fsid_t._fields_ = [
-    ('__val', c_int * 2),
-]
 __clock_t = c_long
 __rlim_t = c_ulong
 __rlim64_t = c_ulong
@@ -3733,84 +2628,15 @@ __qaddr_t = POINTER(__quad_t)
 __caddr_t = STRING
 __intptr_t = c_long
 __socklen_t = c_uint
-class wait(Union):
-    pass
-class N4wait4DOT_10E(Structure):
-    pass
-N4wait4DOT_10E._fields_ = [
-    ('__w_termsig', c_uint, 7),
-    ('__w_coredump', c_uint, 1),
-    ('__w_retcode', c_uint, 8),
-    ('', c_uint, 16),
-]
-class N4wait4DOT_11E(Structure):
-    pass
-N4wait4DOT_11E._fields_ = [
-    ('__w_stopval', c_uint, 8),
-    ('__w_stopsig', c_uint, 8),
-    ('', c_uint, 16),
-]
-wait._fields_ = [
-    ('w_status', c_int),
-    ('__wait_terminated', N4wait4DOT_10E),
-    ('__wait_stopped', N4wait4DOT_11E),
-]
-program_invocation_name = (STRING).in_dll(_libraries['/usr/lib/libavcodec.so'], 'program_invocation_name')
-program_invocation_short_name = (STRING).in_dll(_libraries['/usr/lib/libavcodec.so'], 'program_invocation_short_name')
 error_t = c_int
-class imaxdiv_t(Structure):
-    pass
-imaxdiv_t._fields_ = [
-    ('quot', c_long),
-    ('rem', c_long),
-]
 intmax_t = c_long
-imaxabs = _libraries['/usr/lib/libavcodec.so'].imaxabs
-imaxabs.restype = intmax_t
-imaxabs.argtypes = [intmax_t]
-imaxdiv = _libraries['/usr/lib/libavcodec.so'].imaxdiv
-imaxdiv.restype = imaxdiv_t
-imaxdiv.argtypes = [intmax_t, intmax_t]
-__strtol_internal = _libraries['/usr/lib/libavcodec.so'].__strtol_internal
-__strtol_internal.restype = c_long
-__strtol_internal.argtypes = [STRING, POINTER(STRING), c_int, c_int]
-strtoimax = _libraries['/usr/lib/libavcodec.so'].strtoimax
-strtoimax.restype = intmax_t
-strtoimax.argtypes = [STRING, POINTER(STRING), c_int]
-__strtoul_internal = _libraries['/usr/lib/libavcodec.so'].__strtoul_internal
-__strtoul_internal.restype = c_ulong
-__strtoul_internal.argtypes = [STRING, POINTER(STRING), c_int, c_int]
 uintmax_t = c_ulong
-strtoumax = _libraries['/usr/lib/libavcodec.so'].strtoumax
-strtoumax.restype = uintmax_t
-strtoumax.argtypes = [STRING, POINTER(STRING), c_int]
-__wcstol_internal = _libraries['/usr/lib/libavcodec.so'].__wcstol_internal
-__wcstol_internal.restype = c_long
-__wcstol_internal.argtypes = [WSTRING, POINTER(WSTRING), c_int, c_int]
-wcstoimax = _libraries['/usr/lib/libavcodec.so'].wcstoimax
-wcstoimax.restype = intmax_t
-wcstoimax.argtypes = [WSTRING, POINTER(WSTRING), c_int]
-__wcstoul_internal = _libraries['/usr/lib/libavcodec.so'].__wcstoul_internal
-__wcstoul_internal.restype = c_ulong
-__wcstoul_internal.argtypes = [WSTRING, POINTER(WSTRING), c_int, c_int]
-wcstoumax = _libraries['/usr/lib/libavcodec.so'].wcstoumax
-wcstoumax.restype = uintmax_t
-wcstoumax.argtypes = [WSTRING, POINTER(WSTRING), c_int]
 
 # values for enumeration 'AVCodecID'
 AVCodecID = c_int # enum
-class AVCodecDescriptor(Structure):
-    pass
 
 # values for enumeration 'AVMediaType'
 AVMediaType = c_int # enum
-AVCodecDescriptor._fields_ = [
-    ('id', AVCodecID),
-    ('type', AVMediaType),
-    ('name', STRING),
-    ('long_name', STRING),
-    ('props', c_int),
-]
 
 # values for enumeration 'Motion_Est_ID'
 Motion_Est_ID = c_int # enum
@@ -3835,1808 +2661,46 @@ AVChromaLocation = c_int # enum
 
 # values for enumeration 'AVAudioServiceType'
 AVAudioServiceType = c_int # enum
-class RcOverride(Structure):
-    pass
-RcOverride._fields_ = [
-    ('start_frame', c_int),
-    ('end_frame', c_int),
-    ('qscale', c_int),
-    ('quality_factor', c_float),
-]
-class AVPanScan(Structure):
-    pass
 int16_t = c_int16
-AVPanScan._fields_ = [
-    ('id', c_int),
-    ('width', c_int),
-    ('height', c_int),
-    ('position', int16_t * 2 * 3),
-]
 
 # values for enumeration 'AVPacketSideDataType'
 AVPacketSideDataType = c_int # enum
-class AVPacket(Structure):
-    pass
-class AVBufferRef(Structure):
-    pass
 int64_t = c_int64
 uint8_t = c_uint8
-class N8AVPacket4DOT_28E(Structure):
-    pass
-AVPacket._fields_ = [
-    ('buf', POINTER(AVBufferRef)),
-    ('pts', int64_t),
-    ('dts', int64_t),
-    ('data', POINTER(uint8_t)),
-    ('size', c_int),
-    ('stream_index', c_int),
-    ('flags', c_int),
-    ('side_data', POINTER(N8AVPacket4DOT_28E)),
-    ('side_data_elems', c_int),
-    ('duration', c_int),
-    ('destruct', CFUNCTYPE(None, POINTER(AVPacket))),
-    ('priv', c_void_p),
-    ('pos', int64_t),
-    ('convergence_duration', int64_t),
-]
-N8AVPacket4DOT_28E._fields_ = [
-    ('data', POINTER(uint8_t)),
-    ('size', c_int),
-    ('type', AVPacketSideDataType),
-]
 
 # values for enumeration 'AVSideDataParamChangeFlags'
 AVSideDataParamChangeFlags = c_int # enum
-class AVCodecInternal(Structure):
-    pass
-AVCodecInternal._fields_ = [
-]
 
 # values for enumeration 'AVFieldOrder'
 AVFieldOrder = c_int # enum
-class AVCodecContext(Structure):
-    pass
-class AVClass(Structure):
-    pass
-class AVCodec(Structure):
-    pass
-class AVRational(Structure):
-    pass
 
 # values for enumeration 'AVSampleFormat'
 AVSampleFormat = c_int # enum
 uint64_t = c_uint64
-class AVProfile(Structure):
-    pass
-class AVCodecDefault(Structure):
-    pass
-class AVSubtitle(Structure):
-    pass
 uint16_t = c_uint16
 uint32_t = c_uint32
-class AVSubtitleRect(Structure):
-    pass
-AVSubtitle._fields_ = [
-    ('format', uint16_t),
-    ('start_display_time', uint32_t),
-    ('end_display_time', uint32_t),
-    ('num_rects', c_uint),
-    ('rects', POINTER(POINTER(AVSubtitleRect))),
-    ('pts', int64_t),
-]
-class AVFrame(Structure):
-    pass
-AVCodec._fields_ = [
-    ('name', STRING),
-    ('long_name', STRING),
-    ('type', AVMediaType),
-    ('id', AVCodecID),
-    ('capabilities', c_int),
-    ('supported_framerates', POINTER(AVRational)),
-    ('pix_fmts', POINTER(AVPixelFormat)),
-    ('supported_samplerates', POINTER(c_int)),
-    ('sample_fmts', POINTER(AVSampleFormat)),
-    ('channel_layouts', POINTER(uint64_t)),
-    ('max_lowres', uint8_t),
-    ('priv_class', POINTER(AVClass)),
-    ('profiles', POINTER(AVProfile)),
-    ('priv_data_size', c_int),
-    ('next', POINTER(AVCodec)),
-    ('init_thread_copy', CFUNCTYPE(c_int, POINTER(AVCodecContext))),
-    ('update_thread_context', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(AVCodecContext))),
-    ('defaults', POINTER(AVCodecDefault)),
-    ('init_static_data', CFUNCTYPE(None, POINTER(AVCodec))),
-    ('init', CFUNCTYPE(c_int, POINTER(AVCodecContext))),
-    ('encode_sub', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(uint8_t), c_int, POINTER(AVSubtitle))),
-    ('encode2', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(AVPacket), POINTER(AVFrame), POINTER(c_int))),
-    ('decode', CFUNCTYPE(c_int, POINTER(AVCodecContext), c_void_p, POINTER(c_int), POINTER(AVPacket))),
-    ('close', CFUNCTYPE(c_int, POINTER(AVCodecContext))),
-    ('flush', CFUNCTYPE(None, POINTER(AVCodecContext))),
-]
-AVRational._fields_ = [
-    ('num', c_int),
-    ('den', c_int),
-]
-class AVHWAccel(Structure):
-    pass
-AVCodecContext._fields_ = [
-    ('av_class', POINTER(AVClass)),
-    ('log_level_offset', c_int),
-    ('codec_type', AVMediaType),
-    ('codec', POINTER(AVCodec)),
-    ('codec_name', c_char * 32),
-    ('codec_id', AVCodecID),
-    ('codec_tag', c_uint),
-    ('stream_codec_tag', c_uint),
-    ('priv_data', c_void_p),
-    ('internal', POINTER(AVCodecInternal)),
-    ('opaque', c_void_p),
-    ('bit_rate', c_int),
-    ('bit_rate_tolerance', c_int),
-    ('global_quality', c_int),
-    ('compression_level', c_int),
-    ('flags', c_int),
-    ('flags2', c_int),
-    ('extradata', POINTER(uint8_t)),
-    ('extradata_size', c_int),
-    ('time_base', AVRational),
-    ('ticks_per_frame', c_int),
-    ('delay', c_int),
-    ('width', c_int),
-    ('height', c_int),
-    ('coded_width', c_int),
-    ('coded_height', c_int),
-    ('gop_size', c_int),
-    ('pix_fmt', AVPixelFormat),
-    ('me_method', c_int),
-    ('draw_horiz_band', CFUNCTYPE(None, POINTER(AVCodecContext), POINTER(AVFrame), POINTER(c_int), c_int, c_int, c_int)),
-    ('get_format', CFUNCTYPE(AVPixelFormat, POINTER(AVCodecContext), POINTER(AVPixelFormat))),
-    ('max_b_frames', c_int),
-    ('b_quant_factor', c_float),
-    ('rc_strategy', c_int),
-    ('b_frame_strategy', c_int),
-    ('b_quant_offset', c_float),
-    ('has_b_frames', c_int),
-    ('mpeg_quant', c_int),
-    ('i_quant_factor', c_float),
-    ('i_quant_offset', c_float),
-    ('lumi_masking', c_float),
-    ('temporal_cplx_masking', c_float),
-    ('spatial_cplx_masking', c_float),
-    ('p_masking', c_float),
-    ('dark_masking', c_float),
-    ('slice_count', c_int),
-    ('prediction_method', c_int),
-    ('slice_offset', POINTER(c_int)),
-    ('sample_aspect_ratio', AVRational),
-    ('me_cmp', c_int),
-    ('me_sub_cmp', c_int),
-    ('mb_cmp', c_int),
-    ('ildct_cmp', c_int),
-    ('dia_size', c_int),
-    ('last_predictor_count', c_int),
-    ('pre_me', c_int),
-    ('me_pre_cmp', c_int),
-    ('pre_dia_size', c_int),
-    ('me_subpel_quality', c_int),
-    ('dtg_active_format', c_int),
-    ('me_range', c_int),
-    ('intra_quant_bias', c_int),
-    ('inter_quant_bias', c_int),
-    ('slice_flags', c_int),
-    ('xvmc_acceleration', c_int),
-    ('mb_decision', c_int),
-    ('intra_matrix', POINTER(uint16_t)),
-    ('inter_matrix', POINTER(uint16_t)),
-    ('scenechange_threshold', c_int),
-    ('noise_reduction', c_int),
-    ('me_threshold', c_int),
-    ('mb_threshold', c_int),
-    ('intra_dc_precision', c_int),
-    ('skip_top', c_int),
-    ('skip_bottom', c_int),
-    ('border_masking', c_float),
-    ('mb_lmin', c_int),
-    ('mb_lmax', c_int),
-    ('me_penalty_compensation', c_int),
-    ('bidir_refine', c_int),
-    ('brd_scale', c_int),
-    ('keyint_min', c_int),
-    ('refs', c_int),
-    ('chromaoffset', c_int),
-    ('scenechange_factor', c_int),
-    ('mv0_threshold', c_int),
-    ('b_sensitivity', c_int),
-    ('color_primaries', AVColorPrimaries),
-    ('color_trc', AVColorTransferCharacteristic),
-    ('colorspace', AVColorSpace),
-    ('color_range', AVColorRange),
-    ('chroma_sample_location', AVChromaLocation),
-    ('slices', c_int),
-    ('field_order', AVFieldOrder),
-    ('sample_rate', c_int),
-    ('channels', c_int),
-    ('sample_fmt', AVSampleFormat),
-    ('frame_size', c_int),
-    ('frame_number', c_int),
-    ('block_align', c_int),
-    ('cutoff', c_int),
-    ('request_channels', c_int),
-    ('channel_layout', uint64_t),
-    ('request_channel_layout', uint64_t),
-    ('audio_service_type', AVAudioServiceType),
-    ('request_sample_fmt', AVSampleFormat),
-    ('get_buffer', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(AVFrame))),
-    ('release_buffer', CFUNCTYPE(None, POINTER(AVCodecContext), POINTER(AVFrame))),
-    ('reget_buffer', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(AVFrame))),
-    ('get_buffer2', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(AVFrame), c_int)),
-    ('refcounted_frames', c_int),
-    ('qcompress', c_float),
-    ('qblur', c_float),
-    ('qmin', c_int),
-    ('qmax', c_int),
-    ('max_qdiff', c_int),
-    ('rc_qsquish', c_float),
-    ('rc_qmod_amp', c_float),
-    ('rc_qmod_freq', c_int),
-    ('rc_buffer_size', c_int),
-    ('rc_override_count', c_int),
-    ('rc_override', POINTER(RcOverride)),
-    ('rc_eq', STRING),
-    ('rc_max_rate', c_int),
-    ('rc_min_rate', c_int),
-    ('rc_buffer_aggressivity', c_float),
-    ('rc_initial_cplx', c_float),
-    ('rc_max_available_vbv_use', c_float),
-    ('rc_min_vbv_overflow_use', c_float),
-    ('rc_initial_buffer_occupancy', c_int),
-    ('coder_type', c_int),
-    ('context_model', c_int),
-    ('lmin', c_int),
-    ('lmax', c_int),
-    ('frame_skip_threshold', c_int),
-    ('frame_skip_factor', c_int),
-    ('frame_skip_exp', c_int),
-    ('frame_skip_cmp', c_int),
-    ('trellis', c_int),
-    ('min_prediction_order', c_int),
-    ('max_prediction_order', c_int),
-    ('timecode_frame_start', int64_t),
-    ('rtp_callback', CFUNCTYPE(None, POINTER(AVCodecContext), c_void_p, c_int, c_int)),
-    ('rtp_payload_size', c_int),
-    ('mv_bits', c_int),
-    ('header_bits', c_int),
-    ('i_tex_bits', c_int),
-    ('p_tex_bits', c_int),
-    ('i_count', c_int),
-    ('p_count', c_int),
-    ('skip_count', c_int),
-    ('misc_bits', c_int),
-    ('frame_bits', c_int),
-    ('stats_out', STRING),
-    ('stats_in', STRING),
-    ('workaround_bugs', c_int),
-    ('strict_std_compliance', c_int),
-    ('error_concealment', c_int),
-    ('debug', c_int),
-    ('debug_mv', c_int),
-    ('err_recognition', c_int),
-    ('reordered_opaque', int64_t),
-    ('hwaccel', POINTER(AVHWAccel)),
-    ('hwaccel_context', c_void_p),
-    ('error', uint64_t * 8),
-    ('dct_algo', c_int),
-    ('idct_algo', c_int),
-    ('bits_per_coded_sample', c_int),
-    ('bits_per_raw_sample', c_int),
-    ('lowres', c_int),
-    ('coded_frame', POINTER(AVFrame)),
-    ('thread_count', c_int),
-    ('thread_type', c_int),
-    ('active_thread_type', c_int),
-    ('thread_safe_callbacks', c_int),
-    ('execute', CFUNCTYPE(c_int, POINTER(AVCodecContext), CFUNCTYPE(c_int, POINTER(AVCodecContext), c_void_p), c_void_p, POINTER(c_int), c_int, c_int)),
-    ('execute2', CFUNCTYPE(c_int, POINTER(AVCodecContext), CFUNCTYPE(c_int, POINTER(AVCodecContext), c_void_p, c_int, c_int), c_void_p, POINTER(c_int), c_int)),
-    ('thread_opaque', c_void_p),
-    ('nsse_weight', c_int),
-    ('profile', c_int),
-    ('level', c_int),
-    ('skip_loop_filter', AVDiscard),
-    ('skip_idct', AVDiscard),
-    ('skip_frame', AVDiscard),
-    ('subtitle_header', POINTER(uint8_t)),
-    ('subtitle_header_size', c_int),
-    ('error_rate', c_int),
-    ('pkt', POINTER(AVPacket)),
-    ('vbv_delay', uint64_t),
-    ('pkt_timebase', AVRational),
-    ('codec_descriptor', POINTER(AVCodecDescriptor)),
-    ('pts_correction_num_faulty_pts', int64_t),
-    ('pts_correction_num_faulty_dts', int64_t),
-    ('pts_correction_last_pts', int64_t),
-    ('pts_correction_last_dts', int64_t),
-    ('sub_charenc', STRING),
-    ('sub_charenc_mode', c_int),
-]
-av_codec_get_pkt_timebase = _libraries['/usr/lib/libavcodec.so'].av_codec_get_pkt_timebase
-av_codec_get_pkt_timebase.restype = AVRational
-av_codec_get_pkt_timebase.argtypes = [POINTER(AVCodecContext)]
-av_codec_set_pkt_timebase = _libraries['/usr/lib/libavcodec.so'].av_codec_set_pkt_timebase
-av_codec_set_pkt_timebase.restype = None
-av_codec_set_pkt_timebase.argtypes = [POINTER(AVCodecContext), AVRational]
-av_codec_get_codec_descriptor = _libraries['/usr/lib/libavcodec.so'].av_codec_get_codec_descriptor
-av_codec_get_codec_descriptor.restype = POINTER(AVCodecDescriptor)
-av_codec_get_codec_descriptor.argtypes = [POINTER(AVCodecContext)]
-av_codec_set_codec_descriptor = _libraries['/usr/lib/libavcodec.so'].av_codec_set_codec_descriptor
-av_codec_set_codec_descriptor.restype = None
-av_codec_set_codec_descriptor.argtypes = [POINTER(AVCodecContext), POINTER(AVCodecDescriptor)]
-av_codec_get_lowres = _libraries['/usr/lib/libavcodec.so'].av_codec_get_lowres
-av_codec_get_lowres.restype = c_int
-av_codec_get_lowres.argtypes = [POINTER(AVCodecContext)]
-av_codec_set_lowres = _libraries['/usr/lib/libavcodec.so'].av_codec_set_lowres
-av_codec_set_lowres.restype = None
-av_codec_set_lowres.argtypes = [POINTER(AVCodecContext), c_int]
-AVProfile._fields_ = [
-    ('profile', c_int),
-    ('name', STRING),
-]
-AVCodecDefault._fields_ = [
-]
-AVHWAccel._fields_ = [
-    ('name', STRING),
-    ('type', AVMediaType),
-    ('id', AVCodecID),
-    ('pix_fmt', AVPixelFormat),
-    ('capabilities', c_int),
-    ('next', POINTER(AVHWAccel)),
-    ('start_frame', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(uint8_t), uint32_t)),
-    ('decode_slice', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(uint8_t), uint32_t)),
-    ('end_frame', CFUNCTYPE(c_int, POINTER(AVCodecContext))),
-    ('priv_data_size', c_int),
-]
-class AVPicture(Structure):
-    pass
-AVPicture._fields_ = [
-    ('data', POINTER(uint8_t) * 8),
-    ('linesize', c_int * 8),
-]
 
 # values for enumeration 'AVSubtitleType'
 AVSubtitleType = c_int # enum
-AVSubtitleRect._fields_ = [
-    ('x', c_int),
-    ('y', c_int),
-    ('w', c_int),
-    ('h', c_int),
-    ('nb_colors', c_int),
-    ('pict', AVPicture),
-    ('type', AVSubtitleType),
-    ('text', STRING),
-    ('ass', STRING),
-    ('flags', c_int),
-]
-av_codec_next = _libraries['/usr/lib/libavcodec.so'].av_codec_next
-av_codec_next.restype = POINTER(AVCodec)
-av_codec_next.argtypes = [POINTER(AVCodec)]
-avcodec_version = _libraries['/usr/lib/libavcodec.so'].avcodec_version
-avcodec_version.restype = c_uint
-avcodec_version.argtypes = []
-avcodec_configuration = _libraries['/usr/lib/libavcodec.so'].avcodec_configuration
-avcodec_configuration.restype = STRING
-avcodec_configuration.argtypes = []
-avcodec_license = _libraries['/usr/lib/libavcodec.so'].avcodec_license
-avcodec_license.restype = STRING
-avcodec_license.argtypes = []
-avcodec_register = _libraries['/usr/lib/libavcodec.so'].avcodec_register
-avcodec_register.restype = None
-avcodec_register.argtypes = [POINTER(AVCodec)]
-avcodec_register_all = _libraries['/usr/lib/libavcodec.so'].avcodec_register_all
-avcodec_register_all.restype = None
-avcodec_register_all.argtypes = []
-avcodec_alloc_context3 = _libraries['/usr/lib/libavcodec.so'].avcodec_alloc_context3
-avcodec_alloc_context3.restype = POINTER(AVCodecContext)
-avcodec_alloc_context3.argtypes = [POINTER(AVCodec)]
-avcodec_get_context_defaults3 = _libraries['/usr/lib/libavcodec.so'].avcodec_get_context_defaults3
-avcodec_get_context_defaults3.restype = c_int
-avcodec_get_context_defaults3.argtypes = [POINTER(AVCodecContext), POINTER(AVCodec)]
-avcodec_get_class = _libraries['/usr/lib/libavcodec.so'].avcodec_get_class
-avcodec_get_class.restype = POINTER(AVClass)
-avcodec_get_class.argtypes = []
-avcodec_get_frame_class = _libraries['/usr/lib/libavcodec.so'].avcodec_get_frame_class
-avcodec_get_frame_class.restype = POINTER(AVClass)
-avcodec_get_frame_class.argtypes = []
-avcodec_get_subtitle_rect_class = _libraries['/usr/lib/libavcodec.so'].avcodec_get_subtitle_rect_class
-avcodec_get_subtitle_rect_class.restype = POINTER(AVClass)
-avcodec_get_subtitle_rect_class.argtypes = []
-avcodec_copy_context = _libraries['/usr/lib/libavcodec.so'].avcodec_copy_context
-avcodec_copy_context.restype = c_int
-avcodec_copy_context.argtypes = [POINTER(AVCodecContext), POINTER(AVCodecContext)]
-avcodec_alloc_frame = _libraries['/usr/lib/libavcodec.so'].avcodec_alloc_frame
-avcodec_alloc_frame.restype = POINTER(AVFrame)
-avcodec_alloc_frame.argtypes = []
-avcodec_get_frame_defaults = _libraries['/usr/lib/libavcodec.so'].avcodec_get_frame_defaults
-avcodec_get_frame_defaults.restype = None
-avcodec_get_frame_defaults.argtypes = [POINTER(AVFrame)]
-avcodec_free_frame = _libraries['/usr/lib/libavcodec.so'].avcodec_free_frame
-avcodec_free_frame.restype = None
-avcodec_free_frame.argtypes = [POINTER(POINTER(AVFrame))]
-class AVDictionary(Structure):
-    pass
-avcodec_open2 = _libraries['/usr/lib/libavcodec.so'].avcodec_open2
-avcodec_open2.restype = c_int
-avcodec_open2.argtypes = [POINTER(AVCodecContext), POINTER(AVCodec), POINTER(POINTER(AVDictionary))]
-avcodec_close = _libraries['/usr/lib/libavcodec.so'].avcodec_close
-avcodec_close.restype = c_int
-avcodec_close.argtypes = [POINTER(AVCodecContext)]
-avsubtitle_free = _libraries['/usr/lib/libavcodec.so'].avsubtitle_free
-avsubtitle_free.restype = None
-avsubtitle_free.argtypes = [POINTER(AVSubtitle)]
-av_destruct_packet = _libraries['/usr/lib/libavcodec.so'].av_destruct_packet
-av_destruct_packet.restype = None
-av_destruct_packet.argtypes = [POINTER(AVPacket)]
-av_init_packet = _libraries['/usr/lib/libavcodec.so'].av_init_packet
-av_init_packet.restype = None
-av_init_packet.argtypes = [POINTER(AVPacket)]
-av_new_packet = _libraries['/usr/lib/libavcodec.so'].av_new_packet
-av_new_packet.restype = c_int
-av_new_packet.argtypes = [POINTER(AVPacket), c_int]
-av_shrink_packet = _libraries['/usr/lib/libavcodec.so'].av_shrink_packet
-av_shrink_packet.restype = None
-av_shrink_packet.argtypes = [POINTER(AVPacket), c_int]
-av_grow_packet = _libraries['/usr/lib/libavcodec.so'].av_grow_packet
-av_grow_packet.restype = c_int
-av_grow_packet.argtypes = [POINTER(AVPacket), c_int]
-av_packet_from_data = _libraries['/usr/lib/libavcodec.so'].av_packet_from_data
-av_packet_from_data.restype = c_int
-av_packet_from_data.argtypes = [POINTER(AVPacket), POINTER(uint8_t), c_int]
-av_dup_packet = _libraries['/usr/lib/libavcodec.so'].av_dup_packet
-av_dup_packet.restype = c_int
-av_dup_packet.argtypes = [POINTER(AVPacket)]
-av_copy_packet = _libraries['/usr/lib/libavcodec.so'].av_copy_packet
-av_copy_packet.restype = c_int
-av_copy_packet.argtypes = [POINTER(AVPacket), POINTER(AVPacket)]
-av_copy_packet_side_data = _libraries['/usr/lib/libavcodec.so'].av_copy_packet_side_data
-av_copy_packet_side_data.restype = c_int
-av_copy_packet_side_data.argtypes = [POINTER(AVPacket), POINTER(AVPacket)]
-av_free_packet = _libraries['/usr/lib/libavcodec.so'].av_free_packet
-av_free_packet.restype = None
-av_free_packet.argtypes = [POINTER(AVPacket)]
-av_packet_new_side_data = _libraries['/usr/lib/libavcodec.so'].av_packet_new_side_data
-av_packet_new_side_data.restype = POINTER(uint8_t)
-av_packet_new_side_data.argtypes = [POINTER(AVPacket), AVPacketSideDataType, c_int]
-av_packet_shrink_side_data = _libraries['/usr/lib/libavcodec.so'].av_packet_shrink_side_data
-av_packet_shrink_side_data.restype = c_int
-av_packet_shrink_side_data.argtypes = [POINTER(AVPacket), AVPacketSideDataType, c_int]
-av_packet_get_side_data = _libraries['/usr/lib/libavcodec.so'].av_packet_get_side_data
-av_packet_get_side_data.restype = POINTER(uint8_t)
-av_packet_get_side_data.argtypes = [POINTER(AVPacket), AVPacketSideDataType, POINTER(c_int)]
-av_packet_merge_side_data = _libraries['/usr/lib/libavcodec.so'].av_packet_merge_side_data
-av_packet_merge_side_data.restype = c_int
-av_packet_merge_side_data.argtypes = [POINTER(AVPacket)]
-av_packet_split_side_data = _libraries['/usr/lib/libavcodec.so'].av_packet_split_side_data
-av_packet_split_side_data.restype = c_int
-av_packet_split_side_data.argtypes = [POINTER(AVPacket)]
-avcodec_find_decoder = _libraries['/usr/lib/libavcodec.so'].avcodec_find_decoder
-avcodec_find_decoder.restype = POINTER(AVCodec)
-avcodec_find_decoder.argtypes = [AVCodecID]
-avcodec_find_decoder_by_name = _libraries['/usr/lib/libavcodec.so'].avcodec_find_decoder_by_name
-avcodec_find_decoder_by_name.restype = POINTER(AVCodec)
-avcodec_find_decoder_by_name.argtypes = [STRING]
-avcodec_default_get_buffer = _libraries['/usr/lib/libavcodec.so'].avcodec_default_get_buffer
-avcodec_default_get_buffer.restype = c_int
-avcodec_default_get_buffer.argtypes = [POINTER(AVCodecContext), POINTER(AVFrame)]
-avcodec_default_release_buffer = _libraries['/usr/lib/libavcodec.so'].avcodec_default_release_buffer
-avcodec_default_release_buffer.restype = None
-avcodec_default_release_buffer.argtypes = [POINTER(AVCodecContext), POINTER(AVFrame)]
-avcodec_default_reget_buffer = _libraries['/usr/lib/libavcodec.so'].avcodec_default_reget_buffer
-avcodec_default_reget_buffer.restype = c_int
-avcodec_default_reget_buffer.argtypes = [POINTER(AVCodecContext), POINTER(AVFrame)]
-avcodec_default_get_buffer2 = _libraries['/usr/lib/libavcodec.so'].avcodec_default_get_buffer2
-avcodec_default_get_buffer2.restype = c_int
-avcodec_default_get_buffer2.argtypes = [POINTER(AVCodecContext), POINTER(AVFrame), c_int]
-avcodec_get_edge_width = _libraries['/usr/lib/libavcodec.so'].avcodec_get_edge_width
-avcodec_get_edge_width.restype = c_uint
-avcodec_get_edge_width.argtypes = []
-avcodec_align_dimensions = _libraries['/usr/lib/libavcodec.so'].avcodec_align_dimensions
-avcodec_align_dimensions.restype = None
-avcodec_align_dimensions.argtypes = [POINTER(AVCodecContext), POINTER(c_int), POINTER(c_int)]
-avcodec_align_dimensions2 = _libraries['/usr/lib/libavcodec.so'].avcodec_align_dimensions2
-avcodec_align_dimensions2.restype = None
-avcodec_align_dimensions2.argtypes = [POINTER(AVCodecContext), POINTER(c_int), POINTER(c_int), POINTER(c_int)]
-avcodec_decode_audio3 = _libraries['/usr/lib/libavcodec.so'].avcodec_decode_audio3
-avcodec_decode_audio3.restype = c_int
-avcodec_decode_audio3.argtypes = [POINTER(AVCodecContext), POINTER(int16_t), POINTER(c_int), POINTER(AVPacket)]
-avcodec_decode_audio4 = _libraries['/usr/lib/libavcodec.so'].avcodec_decode_audio4
-avcodec_decode_audio4.restype = c_int
-avcodec_decode_audio4.argtypes = [POINTER(AVCodecContext), POINTER(AVFrame), POINTER(c_int), POINTER(AVPacket)]
-avcodec_decode_video2 = _libraries['/usr/lib/libavcodec.so'].avcodec_decode_video2
-avcodec_decode_video2.restype = c_int
-avcodec_decode_video2.argtypes = [POINTER(AVCodecContext), POINTER(AVFrame), POINTER(c_int), POINTER(AVPacket)]
-avcodec_decode_subtitle2 = _libraries['/usr/lib/libavcodec.so'].avcodec_decode_subtitle2
-avcodec_decode_subtitle2.restype = c_int
-avcodec_decode_subtitle2.argtypes = [POINTER(AVCodecContext), POINTER(AVSubtitle), POINTER(c_int), POINTER(AVPacket)]
 
 # values for enumeration 'AVPictureStructure'
 AVPictureStructure = c_int # enum
-class AVCodecParserContext(Structure):
-    pass
-class AVCodecParser(Structure):
-    pass
-AVCodecParserContext._fields_ = [
-    ('priv_data', c_void_p),
-    ('parser', POINTER(AVCodecParser)),
-    ('frame_offset', int64_t),
-    ('cur_offset', int64_t),
-    ('next_frame_offset', int64_t),
-    ('pict_type', c_int),
-    ('repeat_pict', c_int),
-    ('pts', int64_t),
-    ('dts', int64_t),
-    ('last_pts', int64_t),
-    ('last_dts', int64_t),
-    ('fetch_timestamp', c_int),
-    ('cur_frame_start_index', c_int),
-    ('cur_frame_offset', int64_t * 4),
-    ('cur_frame_pts', int64_t * 4),
-    ('cur_frame_dts', int64_t * 4),
-    ('flags', c_int),
-    ('offset', int64_t),
-    ('cur_frame_end', int64_t * 4),
-    ('key_frame', c_int),
-    ('convergence_duration', int64_t),
-    ('dts_sync_point', c_int),
-    ('dts_ref_dts_delta', c_int),
-    ('pts_dts_delta', c_int),
-    ('cur_frame_pos', int64_t * 4),
-    ('pos', int64_t),
-    ('last_pos', int64_t),
-    ('duration', c_int),
-    ('field_order', AVFieldOrder),
-    ('picture_structure', AVPictureStructure),
-]
-AVCodecParser._fields_ = [
-    ('codec_ids', c_int * 5),
-    ('priv_data_size', c_int),
-    ('parser_init', CFUNCTYPE(c_int, POINTER(AVCodecParserContext))),
-    ('parser_parse', CFUNCTYPE(c_int, POINTER(AVCodecParserContext), POINTER(AVCodecContext), POINTER(POINTER(uint8_t)), POINTER(c_int), POINTER(uint8_t), c_int)),
-    ('parser_close', CFUNCTYPE(None, POINTER(AVCodecParserContext))),
-    ('split', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(uint8_t), c_int)),
-    ('next', POINTER(AVCodecParser)),
-]
-av_parser_next = _libraries['/usr/lib/libavcodec.so'].av_parser_next
-av_parser_next.restype = POINTER(AVCodecParser)
-av_parser_next.argtypes = [POINTER(AVCodecParser)]
-av_register_codec_parser = _libraries['/usr/lib/libavcodec.so'].av_register_codec_parser
-av_register_codec_parser.restype = None
-av_register_codec_parser.argtypes = [POINTER(AVCodecParser)]
-av_parser_init = _libraries['/usr/lib/libavcodec.so'].av_parser_init
-av_parser_init.restype = POINTER(AVCodecParserContext)
-av_parser_init.argtypes = [c_int]
-av_parser_parse2 = _libraries['/usr/lib/libavcodec.so'].av_parser_parse2
-av_parser_parse2.restype = c_int
-av_parser_parse2.argtypes = [POINTER(AVCodecParserContext), POINTER(AVCodecContext), POINTER(POINTER(uint8_t)), POINTER(c_int), POINTER(uint8_t), c_int, int64_t, int64_t, int64_t]
-av_parser_change = _libraries['/usr/lib/libavcodec.so'].av_parser_change
-av_parser_change.restype = c_int
-av_parser_change.argtypes = [POINTER(AVCodecParserContext), POINTER(AVCodecContext), POINTER(POINTER(uint8_t)), POINTER(c_int), POINTER(uint8_t), c_int, c_int]
-av_parser_close = _libraries['/usr/lib/libavcodec.so'].av_parser_close
-av_parser_close.restype = None
-av_parser_close.argtypes = [POINTER(AVCodecParserContext)]
-avcodec_find_encoder = _libraries['/usr/lib/libavcodec.so'].avcodec_find_encoder
-avcodec_find_encoder.restype = POINTER(AVCodec)
-avcodec_find_encoder.argtypes = [AVCodecID]
-avcodec_find_encoder_by_name = _libraries['/usr/lib/libavcodec.so'].avcodec_find_encoder_by_name
-avcodec_find_encoder_by_name.restype = POINTER(AVCodec)
-avcodec_find_encoder_by_name.argtypes = [STRING]
-avcodec_encode_audio = _libraries['/usr/lib/libavcodec.so'].avcodec_encode_audio
-avcodec_encode_audio.restype = c_int
-avcodec_encode_audio.argtypes = [POINTER(AVCodecContext), POINTER(uint8_t), c_int, POINTER(c_short)]
-avcodec_encode_audio2 = _libraries['/usr/lib/libavcodec.so'].avcodec_encode_audio2
-avcodec_encode_audio2.restype = c_int
-avcodec_encode_audio2.argtypes = [POINTER(AVCodecContext), POINTER(AVPacket), POINTER(AVFrame), POINTER(c_int)]
-avcodec_encode_video = _libraries['/usr/lib/libavcodec.so'].avcodec_encode_video
-avcodec_encode_video.restype = c_int
-avcodec_encode_video.argtypes = [POINTER(AVCodecContext), POINTER(uint8_t), c_int, POINTER(AVFrame)]
-avcodec_encode_video2 = _libraries['/usr/lib/libavcodec.so'].avcodec_encode_video2
-avcodec_encode_video2.restype = c_int
-avcodec_encode_video2.argtypes = [POINTER(AVCodecContext), POINTER(AVPacket), POINTER(AVFrame), POINTER(c_int)]
-avcodec_encode_subtitle = _libraries['/usr/lib/libavcodec.so'].avcodec_encode_subtitle
-avcodec_encode_subtitle.restype = c_int
-avcodec_encode_subtitle.argtypes = [POINTER(AVCodecContext), POINTER(uint8_t), c_int, POINTER(AVSubtitle)]
-class ReSampleContext(Structure):
-    pass
-ReSampleContext._fields_ = [
-]
-class AVResampleContext(Structure):
-    pass
-AVResampleContext._fields_ = [
-]
-av_audio_resample_init = _libraries['/usr/lib/libavcodec.so'].av_audio_resample_init
-av_audio_resample_init.restype = POINTER(ReSampleContext)
-av_audio_resample_init.argtypes = [c_int, c_int, c_int, c_int, AVSampleFormat, AVSampleFormat, c_int, c_int, c_int, c_double]
-audio_resample = _libraries['/usr/lib/libavcodec.so'].audio_resample
-audio_resample.restype = c_int
-audio_resample.argtypes = [POINTER(ReSampleContext), POINTER(c_short), POINTER(c_short), c_int]
-audio_resample_close = _libraries['/usr/lib/libavcodec.so'].audio_resample_close
-audio_resample_close.restype = None
-audio_resample_close.argtypes = [POINTER(ReSampleContext)]
-av_resample_init = _libraries['/usr/lib/libavcodec.so'].av_resample_init
-av_resample_init.restype = POINTER(AVResampleContext)
-av_resample_init.argtypes = [c_int, c_int, c_int, c_int, c_int, c_double]
-av_resample = _libraries['/usr/lib/libavcodec.so'].av_resample
-av_resample.restype = c_int
-av_resample.argtypes = [POINTER(AVResampleContext), POINTER(c_short), POINTER(c_short), POINTER(c_int), c_int, c_int, c_int]
-av_resample_compensate = _libraries['/usr/lib/libavcodec.so'].av_resample_compensate
-av_resample_compensate.restype = None
-av_resample_compensate.argtypes = [POINTER(AVResampleContext), c_int, c_int]
-av_resample_close = _libraries['/usr/lib/libavcodec.so'].av_resample_close
-av_resample_close.restype = None
-av_resample_close.argtypes = [POINTER(AVResampleContext)]
-avpicture_alloc = _libraries['/usr/lib/libavcodec.so'].avpicture_alloc
-avpicture_alloc.restype = c_int
-avpicture_alloc.argtypes = [POINTER(AVPicture), AVPixelFormat, c_int, c_int]
-avpicture_free = _libraries['/usr/lib/libavcodec.so'].avpicture_free
-avpicture_free.restype = None
-avpicture_free.argtypes = [POINTER(AVPicture)]
-avpicture_fill = _libraries['/usr/lib/libavcodec.so'].avpicture_fill
-avpicture_fill.restype = c_int
-avpicture_fill.argtypes = [POINTER(AVPicture), POINTER(uint8_t), AVPixelFormat, c_int, c_int]
-avpicture_layout = _libraries['/usr/lib/libavcodec.so'].avpicture_layout
-avpicture_layout.restype = c_int
-avpicture_layout.argtypes = [POINTER(AVPicture), AVPixelFormat, c_int, c_int, POINTER(c_ubyte), c_int]
-avpicture_get_size = _libraries['/usr/lib/libavcodec.so'].avpicture_get_size
-avpicture_get_size.restype = c_int
-avpicture_get_size.argtypes = [AVPixelFormat, c_int, c_int]
-avpicture_deinterlace = _libraries['/usr/lib/libavcodec.so'].avpicture_deinterlace
-avpicture_deinterlace.restype = c_int
-avpicture_deinterlace.argtypes = [POINTER(AVPicture), POINTER(AVPicture), AVPixelFormat, c_int, c_int]
-av_picture_copy = _libraries['/usr/lib/libavcodec.so'].av_picture_copy
-av_picture_copy.restype = None
-av_picture_copy.argtypes = [POINTER(AVPicture), POINTER(AVPicture), AVPixelFormat, c_int, c_int]
-av_picture_crop = _libraries['/usr/lib/libavcodec.so'].av_picture_crop
-av_picture_crop.restype = c_int
-av_picture_crop.argtypes = [POINTER(AVPicture), POINTER(AVPicture), AVPixelFormat, c_int, c_int]
-av_picture_pad = _libraries['/usr/lib/libavcodec.so'].av_picture_pad
-av_picture_pad.restype = c_int
-av_picture_pad.argtypes = [POINTER(AVPicture), POINTER(AVPicture), c_int, c_int, AVPixelFormat, c_int, c_int, c_int, c_int, POINTER(c_int)]
-avcodec_get_chroma_sub_sample = _libraries['/usr/lib/libavcodec.so'].avcodec_get_chroma_sub_sample
-avcodec_get_chroma_sub_sample.restype = None
-avcodec_get_chroma_sub_sample.argtypes = [AVPixelFormat, POINTER(c_int), POINTER(c_int)]
-avcodec_pix_fmt_to_codec_tag = _libraries['/usr/lib/libavcodec.so'].avcodec_pix_fmt_to_codec_tag
-avcodec_pix_fmt_to_codec_tag.restype = c_uint
-avcodec_pix_fmt_to_codec_tag.argtypes = [AVPixelFormat]
-avcodec_get_pix_fmt_loss = _libraries['/usr/lib/libavcodec.so'].avcodec_get_pix_fmt_loss
-avcodec_get_pix_fmt_loss.restype = c_int
-avcodec_get_pix_fmt_loss.argtypes = [AVPixelFormat, AVPixelFormat, c_int]
-avcodec_find_best_pix_fmt_of_list = _libraries['/usr/lib/libavcodec.so'].avcodec_find_best_pix_fmt_of_list
-avcodec_find_best_pix_fmt_of_list.restype = AVPixelFormat
-avcodec_find_best_pix_fmt_of_list.argtypes = [POINTER(AVPixelFormat), AVPixelFormat, c_int, POINTER(c_int)]
-avcodec_find_best_pix_fmt_of_2 = _libraries['/usr/lib/libavcodec.so'].avcodec_find_best_pix_fmt_of_2
-avcodec_find_best_pix_fmt_of_2.restype = AVPixelFormat
-avcodec_find_best_pix_fmt_of_2.argtypes = [AVPixelFormat, AVPixelFormat, AVPixelFormat, c_int, POINTER(c_int)]
-avcodec_find_best_pix_fmt2 = _libraries['/usr/lib/libavcodec.so'].avcodec_find_best_pix_fmt2
-avcodec_find_best_pix_fmt2.restype = AVPixelFormat
-avcodec_find_best_pix_fmt2.argtypes = [AVPixelFormat, AVPixelFormat, AVPixelFormat, c_int, POINTER(c_int)]
-avcodec_default_get_format = _libraries['/usr/lib/libavcodec.so'].avcodec_default_get_format
-avcodec_default_get_format.restype = AVPixelFormat
-avcodec_default_get_format.argtypes = [POINTER(AVCodecContext), POINTER(AVPixelFormat)]
-avcodec_set_dimensions = _libraries['/usr/lib/libavcodec.so'].avcodec_set_dimensions
-avcodec_set_dimensions.restype = None
-avcodec_set_dimensions.argtypes = [POINTER(AVCodecContext), c_int, c_int]
-av_get_codec_tag_string = _libraries['/usr/lib/libavcodec.so'].av_get_codec_tag_string
-av_get_codec_tag_string.restype = size_t
-av_get_codec_tag_string.argtypes = [STRING, size_t, c_uint]
-avcodec_string = _libraries['/usr/lib/libavcodec.so'].avcodec_string
-avcodec_string.restype = None
-avcodec_string.argtypes = [STRING, c_int, POINTER(AVCodecContext), c_int]
-av_get_profile_name = _libraries['/usr/lib/libavcodec.so'].av_get_profile_name
-av_get_profile_name.restype = STRING
-av_get_profile_name.argtypes = [POINTER(AVCodec), c_int]
-avcodec_default_execute = _libraries['/usr/lib/libavcodec.so'].avcodec_default_execute
-avcodec_default_execute.restype = c_int
-avcodec_default_execute.argtypes = [POINTER(AVCodecContext), CFUNCTYPE(c_int, POINTER(AVCodecContext), c_void_p), c_void_p, POINTER(c_int), c_int, c_int]
-avcodec_default_execute2 = _libraries['/usr/lib/libavcodec.so'].avcodec_default_execute2
-avcodec_default_execute2.restype = c_int
-avcodec_default_execute2.argtypes = [POINTER(AVCodecContext), CFUNCTYPE(c_int, POINTER(AVCodecContext), c_void_p, c_int, c_int), c_void_p, POINTER(c_int), c_int]
-avcodec_fill_audio_frame = _libraries['/usr/lib/libavcodec.so'].avcodec_fill_audio_frame
-avcodec_fill_audio_frame.restype = c_int
-avcodec_fill_audio_frame.argtypes = [POINTER(AVFrame), c_int, AVSampleFormat, POINTER(uint8_t), c_int, c_int]
-avcodec_flush_buffers = _libraries['/usr/lib/libavcodec.so'].avcodec_flush_buffers
-avcodec_flush_buffers.restype = None
-avcodec_flush_buffers.argtypes = [POINTER(AVCodecContext)]
-av_get_bits_per_sample = _libraries['/usr/lib/libavcodec.so'].av_get_bits_per_sample
-av_get_bits_per_sample.restype = c_int
-av_get_bits_per_sample.argtypes = [AVCodecID]
-av_get_pcm_codec = _libraries['/usr/lib/libavcodec.so'].av_get_pcm_codec
-av_get_pcm_codec.restype = AVCodecID
-av_get_pcm_codec.argtypes = [AVSampleFormat, c_int]
-av_get_exact_bits_per_sample = _libraries['/usr/lib/libavcodec.so'].av_get_exact_bits_per_sample
-av_get_exact_bits_per_sample.restype = c_int
-av_get_exact_bits_per_sample.argtypes = [AVCodecID]
-av_get_audio_frame_duration = _libraries['/usr/lib/libavcodec.so'].av_get_audio_frame_duration
-av_get_audio_frame_duration.restype = c_int
-av_get_audio_frame_duration.argtypes = [POINTER(AVCodecContext), c_int]
-class AVBitStreamFilterContext(Structure):
-    pass
-class AVBitStreamFilter(Structure):
-    pass
-AVBitStreamFilterContext._fields_ = [
-    ('priv_data', c_void_p),
-    ('filter', POINTER(AVBitStreamFilter)),
-    ('parser', POINTER(AVCodecParserContext)),
-    ('next', POINTER(AVBitStreamFilterContext)),
-]
-AVBitStreamFilter._fields_ = [
-    ('name', STRING),
-    ('priv_data_size', c_int),
-    ('filter', CFUNCTYPE(c_int, POINTER(AVBitStreamFilterContext), POINTER(AVCodecContext), STRING, POINTER(POINTER(uint8_t)), POINTER(c_int), POINTER(uint8_t), c_int, c_int)),
-    ('close', CFUNCTYPE(None, POINTER(AVBitStreamFilterContext))),
-    ('next', POINTER(AVBitStreamFilter)),
-]
-av_register_bitstream_filter = _libraries['/usr/lib/libavcodec.so'].av_register_bitstream_filter
-av_register_bitstream_filter.restype = None
-av_register_bitstream_filter.argtypes = [POINTER(AVBitStreamFilter)]
-av_bitstream_filter_init = _libraries['/usr/lib/libavcodec.so'].av_bitstream_filter_init
-av_bitstream_filter_init.restype = POINTER(AVBitStreamFilterContext)
-av_bitstream_filter_init.argtypes = [STRING]
-av_bitstream_filter_filter = _libraries['/usr/lib/libavcodec.so'].av_bitstream_filter_filter
-av_bitstream_filter_filter.restype = c_int
-av_bitstream_filter_filter.argtypes = [POINTER(AVBitStreamFilterContext), POINTER(AVCodecContext), STRING, POINTER(POINTER(uint8_t)), POINTER(c_int), POINTER(uint8_t), c_int, c_int]
-av_bitstream_filter_close = _libraries['/usr/lib/libavcodec.so'].av_bitstream_filter_close
-av_bitstream_filter_close.restype = None
-av_bitstream_filter_close.argtypes = [POINTER(AVBitStreamFilterContext)]
-av_bitstream_filter_next = _libraries['/usr/lib/libavcodec.so'].av_bitstream_filter_next
-av_bitstream_filter_next.restype = POINTER(AVBitStreamFilter)
-av_bitstream_filter_next.argtypes = [POINTER(AVBitStreamFilter)]
-av_fast_realloc = _libraries['/usr/lib/libavcodec.so'].av_fast_realloc
-av_fast_realloc.restype = c_void_p
-av_fast_realloc.argtypes = [c_void_p, POINTER(c_uint), size_t]
-av_fast_malloc = _libraries['/usr/lib/libavcodec.so'].av_fast_malloc
-av_fast_malloc.restype = None
-av_fast_malloc.argtypes = [c_void_p, POINTER(c_uint), size_t]
-av_fast_padded_malloc = _libraries['/usr/lib/libavcodec.so'].av_fast_padded_malloc
-av_fast_padded_malloc.restype = None
-av_fast_padded_malloc.argtypes = [c_void_p, POINTER(c_uint), size_t]
-av_fast_padded_mallocz = _libraries['/usr/lib/libavcodec.so'].av_fast_padded_mallocz
-av_fast_padded_mallocz.restype = None
-av_fast_padded_mallocz.argtypes = [c_void_p, POINTER(c_uint), size_t]
-av_xiphlacing = _libraries['/usr/lib/libavcodec.so'].av_xiphlacing
-av_xiphlacing.restype = c_uint
-av_xiphlacing.argtypes = [POINTER(c_ubyte), c_uint]
-av_log_missing_feature = _libraries['/usr/lib/libavcodec.so'].av_log_missing_feature
-av_log_missing_feature.restype = None
-av_log_missing_feature.argtypes = [c_void_p, STRING, c_int]
-av_log_ask_for_sample = _libraries['/usr/lib/libavcodec.so'].av_log_ask_for_sample
-av_log_ask_for_sample.restype = None
-av_log_ask_for_sample.argtypes = [c_void_p, STRING]
-av_register_hwaccel = _libraries['/usr/lib/libavcodec.so'].av_register_hwaccel
-av_register_hwaccel.restype = None
-av_register_hwaccel.argtypes = [POINTER(AVHWAccel)]
-av_hwaccel_next = _libraries['/usr/lib/libavcodec.so'].av_hwaccel_next
-av_hwaccel_next.restype = POINTER(AVHWAccel)
-av_hwaccel_next.argtypes = [POINTER(AVHWAccel)]
 
 # values for enumeration 'AVLockOp'
 AVLockOp = c_int # enum
-av_lockmgr_register = _libraries['/usr/lib/libavcodec.so'].av_lockmgr_register
-av_lockmgr_register.restype = c_int
-av_lockmgr_register.argtypes = [CFUNCTYPE(c_int, POINTER(c_void_p), AVLockOp)]
-avcodec_get_type = _libraries['/usr/lib/libavcodec.so'].avcodec_get_type
-avcodec_get_type.restype = AVMediaType
-avcodec_get_type.argtypes = [AVCodecID]
-avcodec_get_name = _libraries['/usr/lib/libavcodec.so'].avcodec_get_name
-avcodec_get_name.restype = STRING
-avcodec_get_name.argtypes = [AVCodecID]
-avcodec_is_open = _libraries['/usr/lib/libavcodec.so'].avcodec_is_open
-avcodec_is_open.restype = c_int
-avcodec_is_open.argtypes = [POINTER(AVCodecContext)]
-av_codec_is_encoder = _libraries['/usr/lib/libavcodec.so'].av_codec_is_encoder
-av_codec_is_encoder.restype = c_int
-av_codec_is_encoder.argtypes = [POINTER(AVCodec)]
-av_codec_is_decoder = _libraries['/usr/lib/libavcodec.so'].av_codec_is_decoder
-av_codec_is_decoder.restype = c_int
-av_codec_is_decoder.argtypes = [POINTER(AVCodec)]
-avcodec_descriptor_get = _libraries['/usr/lib/libavcodec.so'].avcodec_descriptor_get
-avcodec_descriptor_get.restype = POINTER(AVCodecDescriptor)
-avcodec_descriptor_get.argtypes = [AVCodecID]
-avcodec_descriptor_next = _libraries['/usr/lib/libavcodec.so'].avcodec_descriptor_next
-avcodec_descriptor_next.restype = POINTER(AVCodecDescriptor)
-avcodec_descriptor_next.argtypes = [POINTER(AVCodecDescriptor)]
-avcodec_descriptor_get_by_name = _libraries['/usr/lib/libavcodec.so'].avcodec_descriptor_get_by_name
-avcodec_descriptor_get_by_name.restype = POINTER(AVCodecDescriptor)
-avcodec_descriptor_get_by_name.argtypes = [STRING]
-avdevice_version = _libraries['/usr/lib/libavdevice.so'].avdevice_version
-avdevice_version.restype = c_uint
-avdevice_version.argtypes = []
-avdevice_configuration = _libraries['/usr/lib/libavdevice.so'].avdevice_configuration
-avdevice_configuration.restype = STRING
-avdevice_configuration.argtypes = []
-avdevice_license = _libraries['/usr/lib/libavdevice.so'].avdevice_license
-avdevice_license.restype = STRING
-avdevice_license.argtypes = []
-avdevice_register_all = _libraries['/usr/lib/libavdevice.so'].avdevice_register_all
-avdevice_register_all.restype = None
-avdevice_register_all.argtypes = []
-avfilter_version = _libraries['/usr/lib/libavdevice.so'].avfilter_version
-avfilter_version.restype = c_uint
-avfilter_version.argtypes = []
-avfilter_configuration = _libraries['/usr/lib/libavdevice.so'].avfilter_configuration
-avfilter_configuration.restype = STRING
-avfilter_configuration.argtypes = []
-avfilter_license = _libraries['/usr/lib/libavdevice.so'].avfilter_license
-avfilter_license.restype = STRING
-avfilter_license.argtypes = []
-class AVFilterContext(Structure):
-    pass
-class AVFilterLink(Structure):
-    pass
-class AVFilterPad(Structure):
-    pass
-class AVFilterFormats(Structure):
-    pass
-AVFilterFormats._fields_ = [
-]
-class AVFilterBuffer(Structure):
-    pass
-AVFilterBuffer._fields_ = [
-    ('data', POINTER(uint8_t) * 8),
-    ('extended_data', POINTER(POINTER(uint8_t))),
-    ('linesize', c_int * 8),
-    ('priv', c_void_p),
-    ('free', CFUNCTYPE(None, POINTER(AVFilterBuffer))),
-    ('format', c_int),
-    ('w', c_int),
-    ('h', c_int),
-    ('refcount', c_uint),
-]
-class AVFilterBufferRefAudioProps(Structure):
-    pass
-AVFilterBufferRefAudioProps._fields_ = [
-    ('channel_layout', uint64_t),
-    ('nb_samples', c_int),
-    ('sample_rate', c_int),
-    ('channels', c_int),
-]
-class AVFilterBufferRefVideoProps(Structure):
-    pass
 
 # values for enumeration 'AVPictureType'
 AVPictureType = c_int # enum
-AVFilterBufferRefVideoProps._fields_ = [
-    ('w', c_int),
-    ('h', c_int),
-    ('sample_aspect_ratio', AVRational),
-    ('interlaced', c_int),
-    ('top_field_first', c_int),
-    ('pict_type', AVPictureType),
-    ('key_frame', c_int),
-    ('qp_table_linesize', c_int),
-    ('qp_table_size', c_int),
-    ('qp_table', POINTER(int8_t)),
-]
-class AVFilterBufferRef(Structure):
-    pass
-AVFilterBufferRef._fields_ = [
-    ('buf', POINTER(AVFilterBuffer)),
-    ('data', POINTER(uint8_t) * 8),
-    ('extended_data', POINTER(POINTER(uint8_t))),
-    ('linesize', c_int * 8),
-    ('video', POINTER(AVFilterBufferRefVideoProps)),
-    ('audio', POINTER(AVFilterBufferRefAudioProps)),
-    ('pts', int64_t),
-    ('pos', int64_t),
-    ('format', c_int),
-    ('perms', c_int),
-    ('type', AVMediaType),
-    ('metadata', POINTER(AVDictionary)),
-]
-avfilter_copy_buffer_ref_props = _libraries['/usr/lib/libavdevice.so'].avfilter_copy_buffer_ref_props
-avfilter_copy_buffer_ref_props.restype = None
-avfilter_copy_buffer_ref_props.argtypes = [POINTER(AVFilterBufferRef), POINTER(AVFilterBufferRef)]
-avfilter_ref_buffer = _libraries['/usr/lib/libavdevice.so'].avfilter_ref_buffer
-avfilter_ref_buffer.restype = POINTER(AVFilterBufferRef)
-avfilter_ref_buffer.argtypes = [POINTER(AVFilterBufferRef), c_int]
-avfilter_unref_buffer = _libraries['/usr/lib/libavdevice.so'].avfilter_unref_buffer
-avfilter_unref_buffer.restype = None
-avfilter_unref_buffer.argtypes = [POINTER(AVFilterBufferRef)]
-avfilter_unref_bufferp = _libraries['/usr/lib/libavdevice.so'].avfilter_unref_bufferp
-avfilter_unref_bufferp.restype = None
-avfilter_unref_bufferp.argtypes = [POINTER(POINTER(AVFilterBufferRef))]
-avfilter_ref_get_channels = _libraries['/usr/lib/libavdevice.so'].avfilter_ref_get_channels
-avfilter_ref_get_channels.restype = c_int
-avfilter_ref_get_channels.argtypes = [POINTER(AVFilterBufferRef)]
-AVFilterPad._fields_ = [
-    ('name', STRING),
-    ('type', AVMediaType),
-    ('min_perms', c_int),
-    ('rej_perms', c_int),
-    ('start_frame', CFUNCTYPE(c_int, POINTER(AVFilterLink), POINTER(AVFilterBufferRef))),
-    ('get_video_buffer', CFUNCTYPE(POINTER(AVFrame), POINTER(AVFilterLink), c_int, c_int)),
-    ('get_audio_buffer', CFUNCTYPE(POINTER(AVFrame), POINTER(AVFilterLink), c_int)),
-    ('end_frame', CFUNCTYPE(c_int, POINTER(AVFilterLink))),
-    ('draw_slice', CFUNCTYPE(c_int, POINTER(AVFilterLink), c_int, c_int, c_int)),
-    ('filter_frame', CFUNCTYPE(c_int, POINTER(AVFilterLink), POINTER(AVFrame))),
-    ('poll_frame', CFUNCTYPE(c_int, POINTER(AVFilterLink))),
-    ('request_frame', CFUNCTYPE(c_int, POINTER(AVFilterLink))),
-    ('config_props', CFUNCTYPE(c_int, POINTER(AVFilterLink))),
-    ('needs_fifo', c_int),
-    ('needs_writable', c_int),
-]
-avfilter_pad_count = _libraries['/usr/lib/libavdevice.so'].avfilter_pad_count
-avfilter_pad_count.restype = c_int
-avfilter_pad_count.argtypes = [POINTER(AVFilterPad)]
-avfilter_pad_get_name = _libraries['/usr/lib/libavdevice.so'].avfilter_pad_get_name
-avfilter_pad_get_name.restype = STRING
-avfilter_pad_get_name.argtypes = [POINTER(AVFilterPad), c_int]
-avfilter_pad_get_type = _libraries['/usr/lib/libavdevice.so'].avfilter_pad_get_type
-avfilter_pad_get_type.restype = AVMediaType
-avfilter_pad_get_type.argtypes = [POINTER(AVFilterPad), c_int]
-class AVFilter(Structure):
-    pass
-AVFilter._fields_ = [
-    ('name', STRING),
-    ('description', STRING),
-    ('inputs', POINTER(AVFilterPad)),
-    ('outputs', POINTER(AVFilterPad)),
-    ('priv_class', POINTER(AVClass)),
-    ('flags', c_int),
-    ('init', CFUNCTYPE(c_int, POINTER(AVFilterContext))),
-    ('init_dict', CFUNCTYPE(c_int, POINTER(AVFilterContext), POINTER(POINTER(AVDictionary)))),
-    ('uninit', CFUNCTYPE(None, POINTER(AVFilterContext))),
-    ('query_formats', CFUNCTYPE(c_int, POINTER(AVFilterContext))),
-    ('priv_size', c_int),
-    ('next', POINTER(AVFilter)),
-    ('process_command', CFUNCTYPE(c_int, POINTER(AVFilterContext), STRING, STRING, STRING, c_int, c_int)),
-    ('init_opaque', CFUNCTYPE(c_int, POINTER(AVFilterContext), c_void_p)),
-]
-class AVFilterInternal(Structure):
-    pass
-AVFilterInternal._fields_ = [
-]
-class AVFilterGraph(Structure):
-    pass
-class AVFilterCommand(Structure):
-    pass
-AVFilterContext._fields_ = [
-    ('av_class', POINTER(AVClass)),
-    ('filter', POINTER(AVFilter)),
-    ('name', STRING),
-    ('input_pads', POINTER(AVFilterPad)),
-    ('inputs', POINTER(POINTER(AVFilterLink))),
-    ('input_count', c_uint),
-    ('nb_inputs', c_uint),
-    ('output_pads', POINTER(AVFilterPad)),
-    ('outputs', POINTER(POINTER(AVFilterLink))),
-    ('output_count', c_uint),
-    ('nb_outputs', c_uint),
-    ('priv', c_void_p),
-    ('graph', POINTER(AVFilterGraph)),
-    ('thread_type', c_int),
-    ('internal', POINTER(AVFilterInternal)),
-    ('command_queue', POINTER(AVFilterCommand)),
-    ('enable_str', STRING),
-    ('enable', c_void_p),
-    ('var_values', POINTER(c_double)),
-    ('is_disabled', c_int),
-]
-AVFilterCommand._fields_ = [
-]
-class AVFilterChannelLayouts(Structure):
-    pass
 
 # values for unnamed enumeration
-class AVFilterPool(Structure):
-    pass
-AVFilterLink._fields_ = [
-    ('src', POINTER(AVFilterContext)),
-    ('srcpad', POINTER(AVFilterPad)),
-    ('dst', POINTER(AVFilterContext)),
-    ('dstpad', POINTER(AVFilterPad)),
-    ('type', AVMediaType),
-    ('w', c_int),
-    ('h', c_int),
-    ('sample_aspect_ratio', AVRational),
-    ('channel_layout', uint64_t),
-    ('sample_rate', c_int),
-    ('format', c_int),
-    ('time_base', AVRational),
-    ('in_formats', POINTER(AVFilterFormats)),
-    ('out_formats', POINTER(AVFilterFormats)),
-    ('in_samplerates', POINTER(AVFilterFormats)),
-    ('out_samplerates', POINTER(AVFilterFormats)),
-    ('in_channel_layouts', POINTER(AVFilterChannelLayouts)),
-    ('out_channel_layouts', POINTER(AVFilterChannelLayouts)),
-    ('request_samples', c_int),
-    ('init_state', c_int),
-    ('pool', POINTER(AVFilterPool)),
-    ('graph', POINTER(AVFilterGraph)),
-    ('current_pts', int64_t),
-    ('age_index', c_int),
-    ('frame_rate', AVRational),
-    ('partial_buf', POINTER(AVFrame)),
-    ('partial_buf_size', c_int),
-    ('min_samples', c_int),
-    ('max_samples', c_int),
-    ('cur_buf_copy', POINTER(AVFilterBufferRef)),
-    ('closed', c_int),
-    ('channels', c_int),
-    ('frame_requested', c_uint),
-    ('flags', c_uint),
-    ('frame_count', int64_t),
-]
-AVFilterChannelLayouts._fields_ = [
-]
-AVFilterPool._fields_ = [
-]
-avfilter_link = _libraries['/usr/lib/libavdevice.so'].avfilter_link
-avfilter_link.restype = c_int
-avfilter_link.argtypes = [POINTER(AVFilterContext), c_uint, POINTER(AVFilterContext), c_uint]
-avfilter_link_free = _libraries['/usr/lib/libavdevice.so'].avfilter_link_free
-avfilter_link_free.restype = None
-avfilter_link_free.argtypes = [POINTER(POINTER(AVFilterLink))]
-avfilter_link_get_channels = _libraries['/usr/lib/libavdevice.so'].avfilter_link_get_channels
-avfilter_link_get_channels.restype = c_int
-avfilter_link_get_channels.argtypes = [POINTER(AVFilterLink)]
-avfilter_link_set_closed = _libraries['/usr/lib/libavdevice.so'].avfilter_link_set_closed
-avfilter_link_set_closed.restype = None
-avfilter_link_set_closed.argtypes = [POINTER(AVFilterLink), c_int]
-avfilter_config_links = _libraries['/usr/lib/libavdevice.so'].avfilter_config_links
-avfilter_config_links.restype = c_int
-avfilter_config_links.argtypes = [POINTER(AVFilterContext)]
-avfilter_get_video_buffer_ref_from_arrays = _libraries['/usr/lib/libavdevice.so'].avfilter_get_video_buffer_ref_from_arrays
-avfilter_get_video_buffer_ref_from_arrays.restype = POINTER(AVFilterBufferRef)
-avfilter_get_video_buffer_ref_from_arrays.argtypes = [POINTER(POINTER(uint8_t)), POINTER(c_int), c_int, c_int, c_int, AVPixelFormat]
-avfilter_get_audio_buffer_ref_from_arrays = _libraries['/usr/lib/libavdevice.so'].avfilter_get_audio_buffer_ref_from_arrays
-avfilter_get_audio_buffer_ref_from_arrays.restype = POINTER(AVFilterBufferRef)
-avfilter_get_audio_buffer_ref_from_arrays.argtypes = [POINTER(POINTER(uint8_t)), c_int, c_int, c_int, AVSampleFormat, uint64_t]
-avfilter_get_audio_buffer_ref_from_arrays_channels = _libraries['/usr/lib/libavdevice.so'].avfilter_get_audio_buffer_ref_from_arrays_channels
-avfilter_get_audio_buffer_ref_from_arrays_channels.restype = POINTER(AVFilterBufferRef)
-avfilter_get_audio_buffer_ref_from_arrays_channels.argtypes = [POINTER(POINTER(uint8_t)), c_int, c_int, c_int, AVSampleFormat, c_int, uint64_t]
-avfilter_process_command = _libraries['/usr/lib/libavdevice.so'].avfilter_process_command
-avfilter_process_command.restype = c_int
-avfilter_process_command.argtypes = [POINTER(AVFilterContext), STRING, STRING, STRING, c_int, c_int]
-avfilter_register_all = _libraries['/usr/lib/libavdevice.so'].avfilter_register_all
-avfilter_register_all.restype = None
-avfilter_register_all.argtypes = []
-avfilter_uninit = _libraries['/usr/lib/libavdevice.so'].avfilter_uninit
-avfilter_uninit.restype = None
-avfilter_uninit.argtypes = []
-avfilter_register = _libraries['/usr/lib/libavdevice.so'].avfilter_register
-avfilter_register.restype = c_int
-avfilter_register.argtypes = [POINTER(AVFilter)]
-avfilter_get_by_name = _libraries['/usr/lib/libavdevice.so'].avfilter_get_by_name
-avfilter_get_by_name.restype = POINTER(AVFilter)
-avfilter_get_by_name.argtypes = [STRING]
-avfilter_next = _libraries['/usr/lib/libavdevice.so'].avfilter_next
-avfilter_next.restype = POINTER(AVFilter)
-avfilter_next.argtypes = [POINTER(AVFilter)]
-av_filter_next = _libraries['/usr/lib/libavdevice.so'].av_filter_next
-av_filter_next.restype = POINTER(POINTER(AVFilter))
-av_filter_next.argtypes = [POINTER(POINTER(AVFilter))]
-avfilter_open = _libraries['/usr/lib/libavdevice.so'].avfilter_open
-avfilter_open.restype = c_int
-avfilter_open.argtypes = [POINTER(POINTER(AVFilterContext)), POINTER(AVFilter), STRING]
-avfilter_init_filter = _libraries['/usr/lib/libavdevice.so'].avfilter_init_filter
-avfilter_init_filter.restype = c_int
-avfilter_init_filter.argtypes = [POINTER(AVFilterContext), STRING, c_void_p]
-avfilter_init_str = _libraries['/usr/lib/libavdevice.so'].avfilter_init_str
-avfilter_init_str.restype = c_int
-avfilter_init_str.argtypes = [POINTER(AVFilterContext), STRING]
-avfilter_init_dict = _libraries['/usr/lib/libavdevice.so'].avfilter_init_dict
-avfilter_init_dict.restype = c_int
-avfilter_init_dict.argtypes = [POINTER(AVFilterContext), POINTER(POINTER(AVDictionary))]
-avfilter_free = _libraries['/usr/lib/libavdevice.so'].avfilter_free
-avfilter_free.restype = None
-avfilter_free.argtypes = [POINTER(AVFilterContext)]
-avfilter_insert_filter = _libraries['/usr/lib/libavdevice.so'].avfilter_insert_filter
-avfilter_insert_filter.restype = c_int
-avfilter_insert_filter.argtypes = [POINTER(AVFilterLink), POINTER(AVFilterContext), c_uint, c_uint]
-avfilter_copy_frame_props = _libraries['/usr/lib/libavdevice.so'].avfilter_copy_frame_props
-avfilter_copy_frame_props.restype = c_int
-avfilter_copy_frame_props.argtypes = [POINTER(AVFilterBufferRef), POINTER(AVFrame)]
-avfilter_copy_buf_props = _libraries['/usr/lib/libavdevice.so'].avfilter_copy_buf_props
-avfilter_copy_buf_props.restype = c_int
-avfilter_copy_buf_props.argtypes = [POINTER(AVFrame), POINTER(AVFilterBufferRef)]
-avfilter_get_class = _libraries['/usr/lib/libavdevice.so'].avfilter_get_class
-avfilter_get_class.restype = POINTER(AVClass)
-avfilter_get_class.argtypes = []
-class AVFilterGraphInternal(Structure):
-    pass
-AVFilterGraphInternal._fields_ = [
-]
-AVFilterGraph._fields_ = [
-    ('av_class', POINTER(AVClass)),
-    ('filter_count_unused', c_uint),
-    ('filters', POINTER(POINTER(AVFilterContext))),
-    ('scale_sws_opts', STRING),
-    ('resample_lavr_opts', STRING),
-    ('nb_filters', c_uint),
-    ('thread_type', c_int),
-    ('nb_threads', c_int),
-    ('internal', POINTER(AVFilterGraphInternal)),
-    ('aresample_swr_opts', STRING),
-    ('sink_links', POINTER(POINTER(AVFilterLink))),
-    ('sink_links_count', c_int),
-    ('disable_auto_convert', c_uint),
-]
-avfilter_graph_alloc = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_alloc
-avfilter_graph_alloc.restype = POINTER(AVFilterGraph)
-avfilter_graph_alloc.argtypes = []
-avfilter_graph_alloc_filter = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_alloc_filter
-avfilter_graph_alloc_filter.restype = POINTER(AVFilterContext)
-avfilter_graph_alloc_filter.argtypes = [POINTER(AVFilterGraph), POINTER(AVFilter), STRING]
-avfilter_graph_get_filter = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_get_filter
-avfilter_graph_get_filter.restype = POINTER(AVFilterContext)
-avfilter_graph_get_filter.argtypes = [POINTER(AVFilterGraph), STRING]
-avfilter_graph_add_filter = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_add_filter
-avfilter_graph_add_filter.restype = c_int
-avfilter_graph_add_filter.argtypes = [POINTER(AVFilterGraph), POINTER(AVFilterContext)]
-avfilter_graph_create_filter = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_create_filter
-avfilter_graph_create_filter.restype = c_int
-avfilter_graph_create_filter.argtypes = [POINTER(POINTER(AVFilterContext)), POINTER(AVFilter), STRING, STRING, c_void_p, POINTER(AVFilterGraph)]
-avfilter_graph_set_auto_convert = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_set_auto_convert
-avfilter_graph_set_auto_convert.restype = None
-avfilter_graph_set_auto_convert.argtypes = [POINTER(AVFilterGraph), c_uint]
 
 # values for unnamed enumeration
-avfilter_graph_config = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_config
-avfilter_graph_config.restype = c_int
-avfilter_graph_config.argtypes = [POINTER(AVFilterGraph), c_void_p]
-avfilter_graph_free = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_free
-avfilter_graph_free.restype = None
-avfilter_graph_free.argtypes = [POINTER(POINTER(AVFilterGraph))]
-class AVFilterInOut(Structure):
-    pass
-AVFilterInOut._fields_ = [
-    ('name', STRING),
-    ('filter_ctx', POINTER(AVFilterContext)),
-    ('pad_idx', c_int),
-    ('next', POINTER(AVFilterInOut)),
-]
-avfilter_inout_alloc = _libraries['/usr/lib/libavdevice.so'].avfilter_inout_alloc
-avfilter_inout_alloc.restype = POINTER(AVFilterInOut)
-avfilter_inout_alloc.argtypes = []
-avfilter_inout_free = _libraries['/usr/lib/libavdevice.so'].avfilter_inout_free
-avfilter_inout_free.restype = None
-avfilter_inout_free.argtypes = [POINTER(POINTER(AVFilterInOut))]
-avfilter_graph_parse = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_parse
-avfilter_graph_parse.restype = c_int
-avfilter_graph_parse.argtypes = [POINTER(AVFilterGraph), STRING, POINTER(POINTER(AVFilterInOut)), POINTER(POINTER(AVFilterInOut)), c_void_p]
-avfilter_graph_parse_ptr = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_parse_ptr
-avfilter_graph_parse_ptr.restype = c_int
-avfilter_graph_parse_ptr.argtypes = [POINTER(AVFilterGraph), STRING, POINTER(POINTER(AVFilterInOut)), POINTER(POINTER(AVFilterInOut)), c_void_p]
-avfilter_graph_parse2 = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_parse2
-avfilter_graph_parse2.restype = c_int
-avfilter_graph_parse2.argtypes = [POINTER(AVFilterGraph), STRING, POINTER(POINTER(AVFilterInOut)), POINTER(POINTER(AVFilterInOut))]
-avfilter_graph_send_command = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_send_command
-avfilter_graph_send_command.restype = c_int
-avfilter_graph_send_command.argtypes = [POINTER(AVFilterGraph), STRING, STRING, STRING, STRING, c_int, c_int]
-avfilter_graph_queue_command = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_queue_command
-avfilter_graph_queue_command.restype = c_int
-avfilter_graph_queue_command.argtypes = [POINTER(AVFilterGraph), STRING, STRING, STRING, c_int, c_double]
-avfilter_graph_dump = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_dump
-avfilter_graph_dump.restype = STRING
-avfilter_graph_dump.argtypes = [POINTER(AVFilterGraph), STRING]
-avfilter_graph_request_oldest = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_request_oldest
-avfilter_graph_request_oldest.restype = c_int
-avfilter_graph_request_oldest.argtypes = [POINTER(AVFilterGraph)]
-class AVIOContext(Structure):
-    pass
-av_get_packet = _libraries['/usr/lib/libavformat.so'].av_get_packet
-av_get_packet.restype = c_int
-av_get_packet.argtypes = [POINTER(AVIOContext), POINTER(AVPacket), c_int]
-av_append_packet = _libraries['/usr/lib/libavformat.so'].av_append_packet
-av_append_packet.restype = c_int
-av_append_packet.argtypes = [POINTER(AVIOContext), POINTER(AVPacket), c_int]
-class AVFrac(Structure):
-    pass
-AVFrac._fields_ = [
-    ('val', int64_t),
-    ('num', int64_t),
-    ('den', int64_t),
-]
-class AVCodecTag(Structure):
-    pass
-AVCodecTag._fields_ = [
-]
-class AVProbeData(Structure):
-    pass
-AVProbeData._fields_ = [
-    ('filename', STRING),
-    ('buf', POINTER(c_ubyte)),
-    ('buf_size', c_int),
-]
-class AVOutputFormat(Structure):
-    pass
-class AVFormatContext(Structure):
-    pass
-AVOutputFormat._fields_ = [
-    ('name', STRING),
-    ('long_name', STRING),
-    ('mime_type', STRING),
-    ('extensions', STRING),
-    ('audio_codec', AVCodecID),
-    ('video_codec', AVCodecID),
-    ('subtitle_codec', AVCodecID),
-    ('flags', c_int),
-    ('codec_tag', POINTER(POINTER(AVCodecTag))),
-    ('priv_class', POINTER(AVClass)),
-    ('next', POINTER(AVOutputFormat)),
-    ('priv_data_size', c_int),
-    ('write_header', CFUNCTYPE(c_int, POINTER(AVFormatContext))),
-    ('write_packet', CFUNCTYPE(c_int, POINTER(AVFormatContext), POINTER(AVPacket))),
-    ('write_trailer', CFUNCTYPE(c_int, POINTER(AVFormatContext))),
-    ('interleave_packet', CFUNCTYPE(c_int, POINTER(AVFormatContext), POINTER(AVPacket), POINTER(AVPacket), c_int)),
-    ('query_codec', CFUNCTYPE(c_int, AVCodecID, c_int)),
-    ('get_output_timestamp', CFUNCTYPE(None, POINTER(AVFormatContext), c_int, POINTER(int64_t), POINTER(int64_t))),
-]
-class AVInputFormat(Structure):
-    pass
-AVInputFormat._fields_ = [
-    ('name', STRING),
-    ('long_name', STRING),
-    ('flags', c_int),
-    ('extensions', STRING),
-    ('codec_tag', POINTER(POINTER(AVCodecTag))),
-    ('priv_class', POINTER(AVClass)),
-    ('next', POINTER(AVInputFormat)),
-    ('raw_codec_id', c_int),
-    ('priv_data_size', c_int),
-    ('read_probe', CFUNCTYPE(c_int, POINTER(AVProbeData))),
-    ('read_header', CFUNCTYPE(c_int, POINTER(AVFormatContext))),
-    ('read_packet', CFUNCTYPE(c_int, POINTER(AVFormatContext), POINTER(AVPacket))),
-    ('read_close', CFUNCTYPE(c_int, POINTER(AVFormatContext))),
-    ('read_seek', CFUNCTYPE(c_int, POINTER(AVFormatContext), c_int, int64_t, c_int)),
-    ('read_timestamp', CFUNCTYPE(int64_t, POINTER(AVFormatContext), c_int, POINTER(int64_t), int64_t)),
-    ('read_play', CFUNCTYPE(c_int, POINTER(AVFormatContext))),
-    ('read_pause', CFUNCTYPE(c_int, POINTER(AVFormatContext))),
-    ('read_seek2', CFUNCTYPE(c_int, POINTER(AVFormatContext), c_int, int64_t, int64_t, int64_t, c_int)),
-]
 
 # values for enumeration 'AVStreamParseType'
 AVStreamParseType = c_int # enum
-class AVIndexEntry(Structure):
-    pass
-AVIndexEntry._fields_ = [
-    ('pos', int64_t),
-    ('timestamp', int64_t),
-    ('flags', c_int, 2),
-    ('size', c_int, 30),
-    ('min_distance', c_int),
-]
-class AVStream(Structure):
-    pass
-class N8AVStream4DOT_29E(Structure):
-    pass
-class AVPacketList(Structure):
-    pass
-AVStream._fields_ = [
-    ('index', c_int),
-    ('id', c_int),
-    ('codec', POINTER(AVCodecContext)),
-    ('priv_data', c_void_p),
-    ('pts', AVFrac),
-    ('time_base', AVRational),
-    ('start_time', int64_t),
-    ('duration', int64_t),
-    ('nb_frames', int64_t),
-    ('disposition', c_int),
-    ('discard', AVDiscard),
-    ('sample_aspect_ratio', AVRational),
-    ('metadata', POINTER(AVDictionary)),
-    ('avg_frame_rate', AVRational),
-    ('attached_pic', AVPacket),
-    ('info', POINTER(N8AVStream4DOT_29E)),
-    ('pts_wrap_bits', c_int),
-    ('reference_dts', int64_t),
-    ('first_dts', int64_t),
-    ('cur_dts', int64_t),
-    ('last_IP_pts', int64_t),
-    ('last_IP_duration', c_int),
-    ('probe_packets', c_int),
-    ('codec_info_nb_frames', c_int),
-    ('need_parsing', AVStreamParseType),
-    ('parser', POINTER(AVCodecParserContext)),
-    ('last_in_packet_buffer', POINTER(AVPacketList)),
-    ('probe_data', AVProbeData),
-    ('pts_buffer', int64_t * 17),
-    ('index_entries', POINTER(AVIndexEntry)),
-    ('nb_index_entries', c_int),
-    ('index_entries_allocated_size', c_uint),
-    ('r_frame_rate', AVRational),
-    ('stream_identifier', c_int),
-    ('interleaver_chunk_size', int64_t),
-    ('interleaver_chunk_duration', int64_t),
-    ('request_probe', c_int),
-    ('skip_to_keyframe', c_int),
-    ('skip_samples', c_int),
-    ('nb_decoded_frames', c_int),
-    ('mux_ts_offset', int64_t),
-    ('pts_wrap_reference', int64_t),
-    ('pts_wrap_behavior', c_int),
-]
-N8AVStream4DOT_29E._fields_ = [
-    ('last_dts', int64_t),
-    ('duration_gcd', int64_t),
-    ('duration_count', c_int),
-    ('duration_error', POINTER(c_double * 726 * 2)),
-    ('codec_info_duration', int64_t),
-    ('codec_info_duration_fields', int64_t),
-    ('found_decoder', c_int),
-    ('last_duration', int64_t),
-    ('fps_first_dts', int64_t),
-    ('fps_first_dts_idx', c_int),
-    ('fps_last_dts', int64_t),
-    ('fps_last_dts_idx', c_int),
-]
-av_stream_get_r_frame_rate = _libraries['/usr/lib/libavformat.so'].av_stream_get_r_frame_rate
-av_stream_get_r_frame_rate.restype = AVRational
-av_stream_get_r_frame_rate.argtypes = [POINTER(AVStream)]
-av_stream_set_r_frame_rate = _libraries['/usr/lib/libavformat.so'].av_stream_set_r_frame_rate
-av_stream_set_r_frame_rate.restype = None
-av_stream_set_r_frame_rate.argtypes = [POINTER(AVStream), AVRational]
-class AVProgram(Structure):
-    pass
-AVProgram._fields_ = [
-    ('id', c_int),
-    ('flags', c_int),
-    ('discard', AVDiscard),
-    ('stream_index', POINTER(c_uint)),
-    ('nb_stream_indexes', c_uint),
-    ('metadata', POINTER(AVDictionary)),
-    ('program_num', c_int),
-    ('pmt_pid', c_int),
-    ('pcr_pid', c_int),
-    ('start_time', int64_t),
-    ('end_time', int64_t),
-    ('pts_wrap_reference', int64_t),
-    ('pts_wrap_behavior', c_int),
-]
-class AVChapter(Structure):
-    pass
-AVChapter._fields_ = [
-    ('id', c_int),
-    ('time_base', AVRational),
-    ('start', int64_t),
-    ('end', int64_t),
-    ('metadata', POINTER(AVDictionary)),
-]
 
 # values for enumeration 'AVDurationEstimationMethod'
 AVDurationEstimationMethod = c_int # enum
-class AVIOInterruptCB(Structure):
-    pass
-AVIOInterruptCB._fields_ = [
-    ('callback', CFUNCTYPE(c_int, c_void_p)),
-    ('opaque', c_void_p),
-]
-AVFormatContext._fields_ = [
-    ('av_class', POINTER(AVClass)),
-    ('iformat', POINTER(AVInputFormat)),
-    ('oformat', POINTER(AVOutputFormat)),
-    ('priv_data', c_void_p),
-    ('pb', POINTER(AVIOContext)),
-    ('ctx_flags', c_int),
-    ('nb_streams', c_uint),
-    ('streams', POINTER(POINTER(AVStream))),
-    ('filename', c_char * 1024),
-    ('start_time', int64_t),
-    ('duration', int64_t),
-    ('bit_rate', c_int),
-    ('packet_size', c_uint),
-    ('max_delay', c_int),
-    ('flags', c_int),
-    ('probesize', c_uint),
-    ('max_analyze_duration', c_int),
-    ('key', POINTER(uint8_t)),
-    ('keylen', c_int),
-    ('nb_programs', c_uint),
-    ('programs', POINTER(POINTER(AVProgram))),
-    ('video_codec_id', AVCodecID),
-    ('audio_codec_id', AVCodecID),
-    ('subtitle_codec_id', AVCodecID),
-    ('max_index_size', c_uint),
-    ('max_picture_buffer', c_uint),
-    ('nb_chapters', c_uint),
-    ('chapters', POINTER(POINTER(AVChapter))),
-    ('metadata', POINTER(AVDictionary)),
-    ('start_time_realtime', int64_t),
-    ('fps_probe_size', c_int),
-    ('error_recognition', c_int),
-    ('interrupt_callback', AVIOInterruptCB),
-    ('debug', c_int),
-    ('ts_id', c_int),
-    ('audio_preload', c_int),
-    ('max_chunk_duration', c_int),
-    ('max_chunk_size', c_int),
-    ('use_wallclock_as_timestamps', c_int),
-    ('avoid_negative_ts', c_int),
-    ('avio_flags', c_int),
-    ('duration_estimation_method', AVDurationEstimationMethod),
-    ('skip_initial_bytes', c_uint),
-    ('correct_ts_overflow', c_uint),
-    ('seek2any', c_int),
-    ('flush_packets', c_int),
-    ('packet_buffer', POINTER(AVPacketList)),
-    ('packet_buffer_end', POINTER(AVPacketList)),
-    ('data_offset', int64_t),
-    ('raw_packet_buffer', POINTER(AVPacketList)),
-    ('raw_packet_buffer_end', POINTER(AVPacketList)),
-    ('parse_queue', POINTER(AVPacketList)),
-    ('parse_queue_end', POINTER(AVPacketList)),
-    ('raw_packet_buffer_remaining_size', c_int),
-    ('offset', int64_t),
-    ('offset_timebase', AVRational),
-    ('io_repositioned', c_int),
-]
-av_fmt_ctx_get_duration_estimation_method = _libraries['/usr/lib/libavformat.so'].av_fmt_ctx_get_duration_estimation_method
-av_fmt_ctx_get_duration_estimation_method.restype = AVDurationEstimationMethod
-av_fmt_ctx_get_duration_estimation_method.argtypes = [POINTER(AVFormatContext)]
-AVPacketList._fields_ = [
-    ('pkt', AVPacket),
-    ('next', POINTER(AVPacketList)),
-]
-avformat_version = _libraries['/usr/lib/libavformat.so'].avformat_version
-avformat_version.restype = c_uint
-avformat_version.argtypes = []
-avformat_configuration = _libraries['/usr/lib/libavformat.so'].avformat_configuration
-avformat_configuration.restype = STRING
-avformat_configuration.argtypes = []
-avformat_license = _libraries['/usr/lib/libavformat.so'].avformat_license
-avformat_license.restype = STRING
-avformat_license.argtypes = []
-av_register_all = _libraries['/usr/lib/libavformat.so'].av_register_all
-av_register_all.restype = None
-av_register_all.argtypes = []
-av_register_input_format = _libraries['/usr/lib/libavformat.so'].av_register_input_format
-av_register_input_format.restype = None
-av_register_input_format.argtypes = [POINTER(AVInputFormat)]
-av_register_output_format = _libraries['/usr/lib/libavformat.so'].av_register_output_format
-av_register_output_format.restype = None
-av_register_output_format.argtypes = [POINTER(AVOutputFormat)]
-avformat_network_init = _libraries['/usr/lib/libavformat.so'].avformat_network_init
-avformat_network_init.restype = c_int
-avformat_network_init.argtypes = []
-avformat_network_deinit = _libraries['/usr/lib/libavformat.so'].avformat_network_deinit
-avformat_network_deinit.restype = c_int
-avformat_network_deinit.argtypes = []
-av_iformat_next = _libraries['/usr/lib/libavformat.so'].av_iformat_next
-av_iformat_next.restype = POINTER(AVInputFormat)
-av_iformat_next.argtypes = [POINTER(AVInputFormat)]
-av_oformat_next = _libraries['/usr/lib/libavformat.so'].av_oformat_next
-av_oformat_next.restype = POINTER(AVOutputFormat)
-av_oformat_next.argtypes = [POINTER(AVOutputFormat)]
-avformat_alloc_context = _libraries['/usr/lib/libavformat.so'].avformat_alloc_context
-avformat_alloc_context.restype = POINTER(AVFormatContext)
-avformat_alloc_context.argtypes = []
-avformat_free_context = _libraries['/usr/lib/libavformat.so'].avformat_free_context
-avformat_free_context.restype = None
-avformat_free_context.argtypes = [POINTER(AVFormatContext)]
-avformat_get_class = _libraries['/usr/lib/libavformat.so'].avformat_get_class
-avformat_get_class.restype = POINTER(AVClass)
-avformat_get_class.argtypes = []
-avformat_new_stream = _libraries['/usr/lib/libavformat.so'].avformat_new_stream
-avformat_new_stream.restype = POINTER(AVStream)
-avformat_new_stream.argtypes = [POINTER(AVFormatContext), POINTER(AVCodec)]
-av_new_program = _libraries['/usr/lib/libavformat.so'].av_new_program
-av_new_program.restype = POINTER(AVProgram)
-av_new_program.argtypes = [POINTER(AVFormatContext), c_int]
-avformat_alloc_output_context = _libraries['/usr/lib/libavformat.so'].avformat_alloc_output_context
-avformat_alloc_output_context.restype = POINTER(AVFormatContext)
-avformat_alloc_output_context.argtypes = [STRING, POINTER(AVOutputFormat), STRING]
-avformat_alloc_output_context2 = _libraries['/usr/lib/libavformat.so'].avformat_alloc_output_context2
-avformat_alloc_output_context2.restype = c_int
-avformat_alloc_output_context2.argtypes = [POINTER(POINTER(AVFormatContext)), POINTER(AVOutputFormat), STRING, STRING]
-av_find_input_format = _libraries['/usr/lib/libavformat.so'].av_find_input_format
-av_find_input_format.restype = POINTER(AVInputFormat)
-av_find_input_format.argtypes = [STRING]
-av_probe_input_format = _libraries['/usr/lib/libavformat.so'].av_probe_input_format
-av_probe_input_format.restype = POINTER(AVInputFormat)
-av_probe_input_format.argtypes = [POINTER(AVProbeData), c_int]
-av_probe_input_format2 = _libraries['/usr/lib/libavformat.so'].av_probe_input_format2
-av_probe_input_format2.restype = POINTER(AVInputFormat)
-av_probe_input_format2.argtypes = [POINTER(AVProbeData), c_int, POINTER(c_int)]
-av_probe_input_format3 = _libraries['/usr/lib/libavformat.so'].av_probe_input_format3
-av_probe_input_format3.restype = POINTER(AVInputFormat)
-av_probe_input_format3.argtypes = [POINTER(AVProbeData), c_int, POINTER(c_int)]
-av_probe_input_buffer = _libraries['/usr/lib/libavformat.so'].av_probe_input_buffer
-av_probe_input_buffer.restype = c_int
-av_probe_input_buffer.argtypes = [POINTER(AVIOContext), POINTER(POINTER(AVInputFormat)), STRING, c_void_p, c_uint, c_uint]
-avformat_open_input = _libraries['/usr/lib/libavformat.so'].avformat_open_input
-avformat_open_input.restype = c_int
-avformat_open_input.argtypes = [POINTER(POINTER(AVFormatContext)), STRING, POINTER(AVInputFormat), POINTER(POINTER(AVDictionary))]
-av_demuxer_open = _libraries['/usr/lib/libavformat.so'].av_demuxer_open
-av_demuxer_open.restype = c_int
-av_demuxer_open.argtypes = [POINTER(AVFormatContext)]
-av_find_stream_info = _libraries['/usr/lib/libavformat.so'].av_find_stream_info
-av_find_stream_info.restype = c_int
-av_find_stream_info.argtypes = [POINTER(AVFormatContext)]
-avformat_find_stream_info = _libraries['/usr/lib/libavformat.so'].avformat_find_stream_info
-avformat_find_stream_info.restype = c_int
-avformat_find_stream_info.argtypes = [POINTER(AVFormatContext), POINTER(POINTER(AVDictionary))]
-av_find_program_from_stream = _libraries['/usr/lib/libavformat.so'].av_find_program_from_stream
-av_find_program_from_stream.restype = POINTER(AVProgram)
-av_find_program_from_stream.argtypes = [POINTER(AVFormatContext), POINTER(AVProgram), c_int]
-av_find_best_stream = _libraries['/usr/lib/libavformat.so'].av_find_best_stream
-av_find_best_stream.restype = c_int
-av_find_best_stream.argtypes = [POINTER(AVFormatContext), AVMediaType, c_int, c_int, POINTER(POINTER(AVCodec)), c_int]
-av_read_packet = _libraries['/usr/lib/libavformat.so'].av_read_packet
-av_read_packet.restype = c_int
-av_read_packet.argtypes = [POINTER(AVFormatContext), POINTER(AVPacket)]
-av_read_frame = _libraries['/usr/lib/libavformat.so'].av_read_frame
-av_read_frame.restype = c_int
-av_read_frame.argtypes = [POINTER(AVFormatContext), POINTER(AVPacket)]
-av_seek_frame = _libraries['/usr/lib/libavformat.so'].av_seek_frame
-av_seek_frame.restype = c_int
-av_seek_frame.argtypes = [POINTER(AVFormatContext), c_int, int64_t, c_int]
-avformat_seek_file = _libraries['/usr/lib/libavformat.so'].avformat_seek_file
-avformat_seek_file.restype = c_int
-avformat_seek_file.argtypes = [POINTER(AVFormatContext), c_int, int64_t, int64_t, int64_t, c_int]
-av_read_play = _libraries['/usr/lib/libavformat.so'].av_read_play
-av_read_play.restype = c_int
-av_read_play.argtypes = [POINTER(AVFormatContext)]
-av_read_pause = _libraries['/usr/lib/libavformat.so'].av_read_pause
-av_read_pause.restype = c_int
-av_read_pause.argtypes = [POINTER(AVFormatContext)]
-av_close_input_file = _libraries['/usr/lib/libavformat.so'].av_close_input_file
-av_close_input_file.restype = None
-av_close_input_file.argtypes = [POINTER(AVFormatContext)]
-avformat_close_input = _libraries['/usr/lib/libavformat.so'].avformat_close_input
-avformat_close_input.restype = None
-avformat_close_input.argtypes = [POINTER(POINTER(AVFormatContext))]
-av_new_stream = _libraries['/usr/lib/libavformat.so'].av_new_stream
-av_new_stream.restype = POINTER(AVStream)
-av_new_stream.argtypes = [POINTER(AVFormatContext), c_int]
-av_set_pts_info = _libraries['/usr/lib/libavformat.so'].av_set_pts_info
-av_set_pts_info.restype = None
-av_set_pts_info.argtypes = [POINTER(AVStream), c_int, c_uint, c_uint]
-avformat_write_header = _libraries['/usr/lib/libavformat.so'].avformat_write_header
-avformat_write_header.restype = c_int
-avformat_write_header.argtypes = [POINTER(AVFormatContext), POINTER(POINTER(AVDictionary))]
-av_write_frame = _libraries['/usr/lib/libavformat.so'].av_write_frame
-av_write_frame.restype = c_int
-av_write_frame.argtypes = [POINTER(AVFormatContext), POINTER(AVPacket)]
-av_interleaved_write_frame = _libraries['/usr/lib/libavformat.so'].av_interleaved_write_frame
-av_interleaved_write_frame.restype = c_int
-av_interleaved_write_frame.argtypes = [POINTER(AVFormatContext), POINTER(AVPacket)]
-av_write_trailer = _libraries['/usr/lib/libavformat.so'].av_write_trailer
-av_write_trailer.restype = c_int
-av_write_trailer.argtypes = [POINTER(AVFormatContext)]
-av_guess_format = _libraries['/usr/lib/libavformat.so'].av_guess_format
-av_guess_format.restype = POINTER(AVOutputFormat)
-av_guess_format.argtypes = [STRING, STRING, STRING]
-av_guess_codec = _libraries['/usr/lib/libavformat.so'].av_guess_codec
-av_guess_codec.restype = AVCodecID
-av_guess_codec.argtypes = [POINTER(AVOutputFormat), STRING, STRING, STRING, AVMediaType]
-av_get_output_timestamp = _libraries['/usr/lib/libavformat.so'].av_get_output_timestamp
-av_get_output_timestamp.restype = c_int
-av_get_output_timestamp.argtypes = [POINTER(AVFormatContext), c_int, POINTER(int64_t), POINTER(int64_t)]
-av_hex_dump = _libraries['/usr/lib/libavformat.so'].av_hex_dump
-av_hex_dump.restype = None
-av_hex_dump.argtypes = [POINTER(FILE), POINTER(uint8_t), c_int]
-av_hex_dump_log = _libraries['/usr/lib/libavformat.so'].av_hex_dump_log
-av_hex_dump_log.restype = None
-av_hex_dump_log.argtypes = [c_void_p, c_int, POINTER(uint8_t), c_int]
-av_pkt_dump2 = _libraries['/usr/lib/libavformat.so'].av_pkt_dump2
-av_pkt_dump2.restype = None
-av_pkt_dump2.argtypes = [POINTER(FILE), POINTER(AVPacket), c_int, POINTER(AVStream)]
-av_pkt_dump_log2 = _libraries['/usr/lib/libavformat.so'].av_pkt_dump_log2
-av_pkt_dump_log2.restype = None
-av_pkt_dump_log2.argtypes = [c_void_p, c_int, POINTER(AVPacket), c_int, POINTER(AVStream)]
-av_codec_get_id = _libraries['/usr/lib/libavformat.so'].av_codec_get_id
-av_codec_get_id.restype = AVCodecID
-av_codec_get_id.argtypes = [POINTER(POINTER(AVCodecTag)), c_uint]
-av_codec_get_tag = _libraries['/usr/lib/libavformat.so'].av_codec_get_tag
-av_codec_get_tag.restype = c_uint
-av_codec_get_tag.argtypes = [POINTER(POINTER(AVCodecTag)), AVCodecID]
-av_codec_get_tag2 = _libraries['/usr/lib/libavformat.so'].av_codec_get_tag2
-av_codec_get_tag2.restype = c_int
-av_codec_get_tag2.argtypes = [POINTER(POINTER(AVCodecTag)), AVCodecID, POINTER(c_uint)]
-av_find_default_stream_index = _libraries['/usr/lib/libavformat.so'].av_find_default_stream_index
-av_find_default_stream_index.restype = c_int
-av_find_default_stream_index.argtypes = [POINTER(AVFormatContext)]
-av_index_search_timestamp = _libraries['/usr/lib/libavformat.so'].av_index_search_timestamp
-av_index_search_timestamp.restype = c_int
-av_index_search_timestamp.argtypes = [POINTER(AVStream), int64_t, c_int]
-av_add_index_entry = _libraries['/usr/lib/libavformat.so'].av_add_index_entry
-av_add_index_entry.restype = c_int
-av_add_index_entry.argtypes = [POINTER(AVStream), int64_t, int64_t, c_int, c_int, c_int]
-av_url_split = _libraries['/usr/lib/libavformat.so'].av_url_split
-av_url_split.restype = None
-av_url_split.argtypes = [STRING, c_int, STRING, c_int, STRING, c_int, POINTER(c_int), STRING, c_int, STRING]
-av_dump_format = _libraries['/usr/lib/libavformat.so'].av_dump_format
-av_dump_format.restype = None
-av_dump_format.argtypes = [POINTER(AVFormatContext), c_int, STRING, c_int]
-av_get_frame_filename = _libraries['/usr/lib/libavformat.so'].av_get_frame_filename
-av_get_frame_filename.restype = c_int
-av_get_frame_filename.argtypes = [STRING, c_int, STRING, c_int]
-av_filename_number_test = _libraries['/usr/lib/libavformat.so'].av_filename_number_test
-av_filename_number_test.restype = c_int
-av_filename_number_test.argtypes = [STRING]
-av_sdp_create = _libraries['/usr/lib/libavformat.so'].av_sdp_create
-av_sdp_create.restype = c_int
-av_sdp_create.argtypes = [POINTER(POINTER(AVFormatContext)), c_int, STRING, c_int]
-av_match_ext = _libraries['/usr/lib/libavformat.so'].av_match_ext
-av_match_ext.restype = c_int
-av_match_ext.argtypes = [STRING, STRING]
-avformat_query_codec = _libraries['/usr/lib/libavformat.so'].avformat_query_codec
-avformat_query_codec.restype = c_int
-avformat_query_codec.argtypes = [POINTER(AVOutputFormat), AVCodecID, c_int]
-avformat_get_riff_video_tags = _libraries['/usr/lib/libavformat.so'].avformat_get_riff_video_tags
-avformat_get_riff_video_tags.restype = POINTER(AVCodecTag)
-avformat_get_riff_video_tags.argtypes = []
-avformat_get_riff_audio_tags = _libraries['/usr/lib/libavformat.so'].avformat_get_riff_audio_tags
-avformat_get_riff_audio_tags.restype = POINTER(AVCodecTag)
-avformat_get_riff_audio_tags.argtypes = []
-av_guess_sample_aspect_ratio = _libraries['/usr/lib/libavformat.so'].av_guess_sample_aspect_ratio
-av_guess_sample_aspect_ratio.restype = AVRational
-av_guess_sample_aspect_ratio.argtypes = [POINTER(AVFormatContext), POINTER(AVStream), POINTER(AVFrame)]
-av_guess_frame_rate = _libraries['/usr/lib/libavformat.so'].av_guess_frame_rate
-av_guess_frame_rate.restype = AVRational
-av_guess_frame_rate.argtypes = [POINTER(AVFormatContext), POINTER(AVStream), POINTER(AVFrame)]
-avformat_match_stream_specifier = _libraries['/usr/lib/libavformat.so'].avformat_match_stream_specifier
-avformat_match_stream_specifier.restype = c_int
-avformat_match_stream_specifier.argtypes = [POINTER(AVFormatContext), POINTER(AVStream), STRING]
-avformat_queue_attached_pictures = _libraries['/usr/lib/libavformat.so'].avformat_queue_attached_pictures
-avformat_queue_attached_pictures.restype = c_int
-avformat_queue_attached_pictures.argtypes = [POINTER(AVFormatContext)]
-AVIOContext._fields_ = [
-    ('av_class', POINTER(AVClass)),
-    ('buffer', POINTER(c_ubyte)),
-    ('buffer_size', c_int),
-    ('buf_ptr', POINTER(c_ubyte)),
-    ('buf_end', POINTER(c_ubyte)),
-    ('opaque', c_void_p),
-    ('read_packet', CFUNCTYPE(c_int, c_void_p, POINTER(uint8_t), c_int)),
-    ('write_packet', CFUNCTYPE(c_int, c_void_p, POINTER(uint8_t), c_int)),
-    ('seek', CFUNCTYPE(int64_t, c_void_p, int64_t, c_int)),
-    ('pos', int64_t),
-    ('must_flush', c_int),
-    ('eof_reached', c_int),
-    ('write_flag', c_int),
-    ('max_packet_size', c_int),
-    ('checksum', c_ulong),
-    ('checksum_ptr', POINTER(c_ubyte)),
-    ('update_checksum', CFUNCTYPE(c_ulong, c_ulong, POINTER(uint8_t), c_uint)),
-    ('error', c_int),
-    ('read_pause', CFUNCTYPE(c_int, c_void_p, c_int)),
-    ('read_seek', CFUNCTYPE(int64_t, c_void_p, c_int, int64_t, c_int)),
-    ('seekable', c_int),
-    ('maxsize', int64_t),
-    ('direct', c_int),
-    ('bytes_read', int64_t),
-    ('seek_count', c_int),
-    ('writeout_count', c_int),
-]
-avio_check = _libraries['/usr/lib/libavformat.so'].avio_check
-avio_check.restype = c_int
-avio_check.argtypes = [STRING, c_int]
-avio_alloc_context = _libraries['/usr/lib/libavformat.so'].avio_alloc_context
-avio_alloc_context.restype = POINTER(AVIOContext)
-avio_alloc_context.argtypes = [POINTER(c_ubyte), c_int, c_int, c_void_p, CFUNCTYPE(c_int, c_void_p, POINTER(uint8_t), c_int), CFUNCTYPE(c_int, c_void_p, POINTER(uint8_t), c_int), CFUNCTYPE(int64_t, c_void_p, int64_t, c_int)]
-avio_w8 = _libraries['/usr/lib/libavformat.so'].avio_w8
-avio_w8.restype = None
-avio_w8.argtypes = [POINTER(AVIOContext), c_int]
-avio_write = _libraries['/usr/lib/libavformat.so'].avio_write
-avio_write.restype = None
-avio_write.argtypes = [POINTER(AVIOContext), POINTER(c_ubyte), c_int]
-avio_wl64 = _libraries['/usr/lib/libavformat.so'].avio_wl64
-avio_wl64.restype = None
-avio_wl64.argtypes = [POINTER(AVIOContext), uint64_t]
-avio_wb64 = _libraries['/usr/lib/libavformat.so'].avio_wb64
-avio_wb64.restype = None
-avio_wb64.argtypes = [POINTER(AVIOContext), uint64_t]
-avio_wl32 = _libraries['/usr/lib/libavformat.so'].avio_wl32
-avio_wl32.restype = None
-avio_wl32.argtypes = [POINTER(AVIOContext), c_uint]
-avio_wb32 = _libraries['/usr/lib/libavformat.so'].avio_wb32
-avio_wb32.restype = None
-avio_wb32.argtypes = [POINTER(AVIOContext), c_uint]
-avio_wl24 = _libraries['/usr/lib/libavformat.so'].avio_wl24
-avio_wl24.restype = None
-avio_wl24.argtypes = [POINTER(AVIOContext), c_uint]
-avio_wb24 = _libraries['/usr/lib/libavformat.so'].avio_wb24
-avio_wb24.restype = None
-avio_wb24.argtypes = [POINTER(AVIOContext), c_uint]
-avio_wl16 = _libraries['/usr/lib/libavformat.so'].avio_wl16
-avio_wl16.restype = None
-avio_wl16.argtypes = [POINTER(AVIOContext), c_uint]
-avio_wb16 = _libraries['/usr/lib/libavformat.so'].avio_wb16
-avio_wb16.restype = None
-avio_wb16.argtypes = [POINTER(AVIOContext), c_uint]
-avio_put_str = _libraries['/usr/lib/libavformat.so'].avio_put_str
-avio_put_str.restype = c_int
-avio_put_str.argtypes = [POINTER(AVIOContext), STRING]
-avio_put_str16le = _libraries['/usr/lib/libavformat.so'].avio_put_str16le
-avio_put_str16le.restype = c_int
-avio_put_str16le.argtypes = [POINTER(AVIOContext), STRING]
-avio_seek = _libraries['/usr/lib/libavformat.so'].avio_seek
-avio_seek.restype = int64_t
-avio_seek.argtypes = [POINTER(AVIOContext), int64_t, c_int]
-avio_skip = _libraries['/usr/lib/libavformat.so'].avio_skip
-avio_skip.restype = int64_t
-avio_skip.argtypes = [POINTER(AVIOContext), int64_t]
-avio_size = _libraries['/usr/lib/libavformat.so'].avio_size
-avio_size.restype = int64_t
-avio_size.argtypes = [POINTER(AVIOContext)]
-url_feof = _libraries['/usr/lib/libavformat.so'].url_feof
-url_feof.restype = c_int
-url_feof.argtypes = [POINTER(AVIOContext)]
-avio_printf = _libraries['/usr/lib/libavformat.so'].avio_printf
-avio_printf.restype = c_int
-avio_printf.argtypes = [POINTER(AVIOContext), STRING]
-avio_flush = _libraries['/usr/lib/libavformat.so'].avio_flush
-avio_flush.restype = None
-avio_flush.argtypes = [POINTER(AVIOContext)]
-avio_read = _libraries['/usr/lib/libavformat.so'].avio_read
-avio_read.restype = c_int
-avio_read.argtypes = [POINTER(AVIOContext), POINTER(c_ubyte), c_int]
-avio_r8 = _libraries['/usr/lib/libavformat.so'].avio_r8
-avio_r8.restype = c_int
-avio_r8.argtypes = [POINTER(AVIOContext)]
-avio_rl16 = _libraries['/usr/lib/libavformat.so'].avio_rl16
-avio_rl16.restype = c_uint
-avio_rl16.argtypes = [POINTER(AVIOContext)]
-avio_rl24 = _libraries['/usr/lib/libavformat.so'].avio_rl24
-avio_rl24.restype = c_uint
-avio_rl24.argtypes = [POINTER(AVIOContext)]
-avio_rl32 = _libraries['/usr/lib/libavformat.so'].avio_rl32
-avio_rl32.restype = c_uint
-avio_rl32.argtypes = [POINTER(AVIOContext)]
-avio_rl64 = _libraries['/usr/lib/libavformat.so'].avio_rl64
-avio_rl64.restype = uint64_t
-avio_rl64.argtypes = [POINTER(AVIOContext)]
-avio_rb16 = _libraries['/usr/lib/libavformat.so'].avio_rb16
-avio_rb16.restype = c_uint
-avio_rb16.argtypes = [POINTER(AVIOContext)]
-avio_rb24 = _libraries['/usr/lib/libavformat.so'].avio_rb24
-avio_rb24.restype = c_uint
-avio_rb24.argtypes = [POINTER(AVIOContext)]
-avio_rb32 = _libraries['/usr/lib/libavformat.so'].avio_rb32
-avio_rb32.restype = c_uint
-avio_rb32.argtypes = [POINTER(AVIOContext)]
-avio_rb64 = _libraries['/usr/lib/libavformat.so'].avio_rb64
-avio_rb64.restype = uint64_t
-avio_rb64.argtypes = [POINTER(AVIOContext)]
-avio_get_str = _libraries['/usr/lib/libavformat.so'].avio_get_str
-avio_get_str.restype = c_int
-avio_get_str.argtypes = [POINTER(AVIOContext), c_int, STRING, c_int]
-avio_get_str16le = _libraries['/usr/lib/libavformat.so'].avio_get_str16le
-avio_get_str16le.restype = c_int
-avio_get_str16le.argtypes = [POINTER(AVIOContext), c_int, STRING, c_int]
-avio_get_str16be = _libraries['/usr/lib/libavformat.so'].avio_get_str16be
-avio_get_str16be.restype = c_int
-avio_get_str16be.argtypes = [POINTER(AVIOContext), c_int, STRING, c_int]
-avio_open = _libraries['/usr/lib/libavformat.so'].avio_open
-avio_open.restype = c_int
-avio_open.argtypes = [POINTER(POINTER(AVIOContext)), STRING, c_int]
-avio_open2 = _libraries['/usr/lib/libavformat.so'].avio_open2
-avio_open2.restype = c_int
-avio_open2.argtypes = [POINTER(POINTER(AVIOContext)), STRING, c_int, POINTER(AVIOInterruptCB), POINTER(POINTER(AVDictionary))]
-avio_close = _libraries['/usr/lib/libavformat.so'].avio_close
-avio_close.restype = c_int
-avio_close.argtypes = [POINTER(AVIOContext)]
-avio_closep = _libraries['/usr/lib/libavformat.so'].avio_closep
-avio_closep.restype = c_int
-avio_closep.argtypes = [POINTER(POINTER(AVIOContext))]
-avio_open_dyn_buf = _libraries['/usr/lib/libavformat.so'].avio_open_dyn_buf
-avio_open_dyn_buf.restype = c_int
-avio_open_dyn_buf.argtypes = [POINTER(POINTER(AVIOContext))]
-avio_close_dyn_buf = _libraries['/usr/lib/libavformat.so'].avio_close_dyn_buf
-avio_close_dyn_buf.restype = c_int
-avio_close_dyn_buf.argtypes = [POINTER(AVIOContext), POINTER(POINTER(uint8_t))]
-avio_enum_protocols = _libraries['/usr/lib/libavformat.so'].avio_enum_protocols
-avio_enum_protocols.restype = STRING
-avio_enum_protocols.argtypes = [POINTER(c_void_p), c_int]
-avio_pause = _libraries['/usr/lib/libavformat.so'].avio_pause
-avio_pause.restype = c_int
-avio_pause.argtypes = [POINTER(AVIOContext), c_int]
-avio_seek_time = _libraries['/usr/lib/libavformat.so'].avio_seek_time
-avio_seek_time.restype = int64_t
-avio_seek_time.argtypes = [POINTER(AVIOContext), c_int, int64_t, c_int]
-class AVAudioResampleContext(Structure):
-    pass
-AVAudioResampleContext._fields_ = [
-]
 
 # values for enumeration 'AVMixCoeffType'
 AVMixCoeffType = c_int # enum
@@ -5646,872 +2710,28 @@ AVResampleFilterType = c_int # enum
 
 # values for enumeration 'AVResampleDitherMethod'
 AVResampleDitherMethod = c_int # enum
-avresample_version = _libraries['/usr/lib/libavdevice.so'].avresample_version
-avresample_version.restype = c_uint
-avresample_version.argtypes = []
-avresample_configuration = _libraries['/usr/lib/libavdevice.so'].avresample_configuration
-avresample_configuration.restype = STRING
-avresample_configuration.argtypes = []
-avresample_license = _libraries['/usr/lib/libavdevice.so'].avresample_license
-avresample_license.restype = STRING
-avresample_license.argtypes = []
-avresample_get_class = _libraries['/usr/lib/libavdevice.so'].avresample_get_class
-avresample_get_class.restype = POINTER(AVClass)
-avresample_get_class.argtypes = []
-avresample_alloc_context = _libraries['/usr/lib/libavdevice.so'].avresample_alloc_context
-avresample_alloc_context.restype = POINTER(AVAudioResampleContext)
-avresample_alloc_context.argtypes = []
-avresample_open = _libraries['/usr/lib/libavdevice.so'].avresample_open
-avresample_open.restype = c_int
-avresample_open.argtypes = [POINTER(AVAudioResampleContext)]
-avresample_close = _libraries['/usr/lib/libavdevice.so'].avresample_close
-avresample_close.restype = None
-avresample_close.argtypes = [POINTER(AVAudioResampleContext)]
-avresample_free = _libraries['/usr/lib/libavdevice.so'].avresample_free
-avresample_free.restype = None
-avresample_free.argtypes = [POINTER(POINTER(AVAudioResampleContext))]
 
 # values for enumeration 'AVMatrixEncoding'
 AVMatrixEncoding = c_int # enum
-avresample_build_matrix = _libraries['/usr/lib/libavdevice.so'].avresample_build_matrix
-avresample_build_matrix.restype = c_int
-avresample_build_matrix.argtypes = [uint64_t, uint64_t, c_double, c_double, c_double, c_int, POINTER(c_double), c_int, AVMatrixEncoding]
-avresample_get_matrix = _libraries['/usr/lib/libavdevice.so'].avresample_get_matrix
-avresample_get_matrix.restype = c_int
-avresample_get_matrix.argtypes = [POINTER(AVAudioResampleContext), POINTER(c_double), c_int]
-avresample_set_matrix = _libraries['/usr/lib/libavdevice.so'].avresample_set_matrix
-avresample_set_matrix.restype = c_int
-avresample_set_matrix.argtypes = [POINTER(AVAudioResampleContext), POINTER(c_double), c_int]
-avresample_set_channel_mapping = _libraries['/usr/lib/libavdevice.so'].avresample_set_channel_mapping
-avresample_set_channel_mapping.restype = c_int
-avresample_set_channel_mapping.argtypes = [POINTER(AVAudioResampleContext), POINTER(c_int)]
-avresample_set_compensation = _libraries['/usr/lib/libavdevice.so'].avresample_set_compensation
-avresample_set_compensation.restype = c_int
-avresample_set_compensation.argtypes = [POINTER(AVAudioResampleContext), c_int, c_int]
-avresample_convert = _libraries['/usr/lib/libavdevice.so'].avresample_convert
-avresample_convert.restype = c_int
-avresample_convert.argtypes = [POINTER(AVAudioResampleContext), POINTER(POINTER(uint8_t)), c_int, c_int, POINTER(POINTER(uint8_t)), c_int, c_int]
-avresample_get_delay = _libraries['/usr/lib/libavdevice.so'].avresample_get_delay
-avresample_get_delay.restype = c_int
-avresample_get_delay.argtypes = [POINTER(AVAudioResampleContext)]
-avresample_available = _libraries['/usr/lib/libavdevice.so'].avresample_available
-avresample_available.restype = c_int
-avresample_available.argtypes = [POINTER(AVAudioResampleContext)]
-avresample_read = _libraries['/usr/lib/libavdevice.so'].avresample_read
-avresample_read.restype = c_int
-avresample_read.argtypes = [POINTER(AVAudioResampleContext), POINTER(POINTER(uint8_t)), c_int]
-avutil_version = _libraries['/usr/lib/libavcodec.so'].avutil_version
-avutil_version.restype = c_uint
-avutil_version.argtypes = []
-avutil_configuration = _libraries['/usr/lib/libavcodec.so'].avutil_configuration
-avutil_configuration.restype = STRING
-avutil_configuration.argtypes = []
-avutil_license = _libraries['/usr/lib/libavcodec.so'].avutil_license
-avutil_license.restype = STRING
-avutil_license.argtypes = []
-av_get_media_type_string = _libraries['/usr/lib/libavcodec.so'].av_get_media_type_string
-av_get_media_type_string.restype = STRING
-av_get_media_type_string.argtypes = [AVMediaType]
-av_get_picture_type_char = _libraries['/usr/lib/libavcodec.so'].av_get_picture_type_char
-av_get_picture_type_char.restype = c_char
-av_get_picture_type_char.argtypes = [AVPictureType]
-av_int_list_length_for_size = _libraries['/usr/lib/libavcodec.so'].av_int_list_length_for_size
-av_int_list_length_for_size.restype = c_uint
-av_int_list_length_for_size.argtypes = [c_uint, c_void_p, uint64_t]
-class AVBuffer(Structure):
-    pass
-AVBuffer._fields_ = [
-]
-AVBufferRef._fields_ = [
-    ('buffer', POINTER(AVBuffer)),
-    ('data', POINTER(uint8_t)),
-    ('size', c_int),
-]
-av_buffer_alloc = _libraries['/usr/lib/libavcodec.so'].av_buffer_alloc
-av_buffer_alloc.restype = POINTER(AVBufferRef)
-av_buffer_alloc.argtypes = [c_int]
-av_buffer_allocz = _libraries['/usr/lib/libavcodec.so'].av_buffer_allocz
-av_buffer_allocz.restype = POINTER(AVBufferRef)
-av_buffer_allocz.argtypes = [c_int]
-av_buffer_create = _libraries['/usr/lib/libavcodec.so'].av_buffer_create
-av_buffer_create.restype = POINTER(AVBufferRef)
-av_buffer_create.argtypes = [POINTER(uint8_t), c_int, CFUNCTYPE(None, c_void_p, POINTER(uint8_t)), c_void_p, c_int]
-av_buffer_default_free = _libraries['/usr/lib/libavcodec.so'].av_buffer_default_free
-av_buffer_default_free.restype = None
-av_buffer_default_free.argtypes = [c_void_p, POINTER(uint8_t)]
-av_buffer_ref = _libraries['/usr/lib/libavcodec.so'].av_buffer_ref
-av_buffer_ref.restype = POINTER(AVBufferRef)
-av_buffer_ref.argtypes = [POINTER(AVBufferRef)]
-av_buffer_unref = _libraries['/usr/lib/libavcodec.so'].av_buffer_unref
-av_buffer_unref.restype = None
-av_buffer_unref.argtypes = [POINTER(POINTER(AVBufferRef))]
-av_buffer_is_writable = _libraries['/usr/lib/libavcodec.so'].av_buffer_is_writable
-av_buffer_is_writable.restype = c_int
-av_buffer_is_writable.argtypes = [POINTER(AVBufferRef)]
-av_buffer_get_opaque = _libraries['/usr/lib/libavcodec.so'].av_buffer_get_opaque
-av_buffer_get_opaque.restype = c_void_p
-av_buffer_get_opaque.argtypes = [POINTER(AVBufferRef)]
-av_buffer_get_ref_count = _libraries['/usr/lib/libavcodec.so'].av_buffer_get_ref_count
-av_buffer_get_ref_count.restype = c_int
-av_buffer_get_ref_count.argtypes = [POINTER(AVBufferRef)]
-av_buffer_make_writable = _libraries['/usr/lib/libavcodec.so'].av_buffer_make_writable
-av_buffer_make_writable.restype = c_int
-av_buffer_make_writable.argtypes = [POINTER(POINTER(AVBufferRef))]
-av_buffer_realloc = _libraries['/usr/lib/libavcodec.so'].av_buffer_realloc
-av_buffer_realloc.restype = c_int
-av_buffer_realloc.argtypes = [POINTER(POINTER(AVBufferRef)), c_int]
-class AVBufferPool(Structure):
-    pass
-AVBufferPool._fields_ = [
-]
-av_buffer_pool_init = _libraries['/usr/lib/libavcodec.so'].av_buffer_pool_init
-av_buffer_pool_init.restype = POINTER(AVBufferPool)
-av_buffer_pool_init.argtypes = [c_int, CFUNCTYPE(POINTER(AVBufferRef), c_int)]
-av_buffer_pool_uninit = _libraries['/usr/lib/libavcodec.so'].av_buffer_pool_uninit
-av_buffer_pool_uninit.restype = None
-av_buffer_pool_uninit.argtypes = [POINTER(POINTER(AVBufferPool))]
-av_buffer_pool_get = _libraries['/usr/lib/libavcodec.so'].av_buffer_pool_get
-av_buffer_pool_get.restype = POINTER(AVBufferRef)
-av_buffer_pool_get.argtypes = [POINTER(AVBufferPool)]
-av_get_channel_layout = _libraries['/usr/lib/libavcodec.so'].av_get_channel_layout
-av_get_channel_layout.restype = uint64_t
-av_get_channel_layout.argtypes = [STRING]
-av_get_channel_layout_string = _libraries['/usr/lib/libavcodec.so'].av_get_channel_layout_string
-av_get_channel_layout_string.restype = None
-av_get_channel_layout_string.argtypes = [STRING, c_int, c_int, uint64_t]
-class AVBPrint(Structure):
-    pass
-AVBPrint._fields_ = [
-]
-av_bprint_channel_layout = _libraries['/usr/lib/libavcodec.so'].av_bprint_channel_layout
-av_bprint_channel_layout.restype = None
-av_bprint_channel_layout.argtypes = [POINTER(AVBPrint), c_int, uint64_t]
-av_get_channel_layout_nb_channels = _libraries['/usr/lib/libavcodec.so'].av_get_channel_layout_nb_channels
-av_get_channel_layout_nb_channels.restype = c_int
-av_get_channel_layout_nb_channels.argtypes = [uint64_t]
-av_get_default_channel_layout = _libraries['/usr/lib/libavcodec.so'].av_get_default_channel_layout
-av_get_default_channel_layout.restype = int64_t
-av_get_default_channel_layout.argtypes = [c_int]
-av_get_channel_layout_channel_index = _libraries['/usr/lib/libavcodec.so'].av_get_channel_layout_channel_index
-av_get_channel_layout_channel_index.restype = c_int
-av_get_channel_layout_channel_index.argtypes = [uint64_t, uint64_t]
-av_channel_layout_extract_channel = _libraries['/usr/lib/libavcodec.so'].av_channel_layout_extract_channel
-av_channel_layout_extract_channel.restype = uint64_t
-av_channel_layout_extract_channel.argtypes = [uint64_t, c_int]
-av_get_channel_name = _libraries['/usr/lib/libavcodec.so'].av_get_channel_name
-av_get_channel_name.restype = STRING
-av_get_channel_name.argtypes = [uint64_t]
-av_get_channel_description = _libraries['/usr/lib/libavcodec.so'].av_get_channel_description
-av_get_channel_description.restype = STRING
-av_get_channel_description.argtypes = [uint64_t]
-av_get_standard_channel_layout = _libraries['/usr/lib/libavcodec.so'].av_get_standard_channel_layout
-av_get_standard_channel_layout.restype = c_int
-av_get_standard_channel_layout.argtypes = [c_uint, POINTER(uint64_t), POINTER(STRING)]
-av_reverse = (uint8_t * 256).in_dll(_libraries['/usr/lib/libavcodec.so'], 'av_reverse')
-av_log2 = _libraries['/usr/lib/libavcodec.so'].av_log2
-av_log2.restype = c_int
-av_log2.argtypes = [c_uint]
-av_log2_16bit = _libraries['/usr/lib/libavcodec.so'].av_log2_16bit
-av_log2_16bit.restype = c_int
-av_log2_16bit.argtypes = [c_uint]
-av_get_cpu_flags = _libraries['/usr/lib/libavcodec.so'].av_get_cpu_flags
-av_get_cpu_flags.restype = c_int
-av_get_cpu_flags.argtypes = []
-av_force_cpu_flags = _libraries['/usr/lib/libavcodec.so'].av_force_cpu_flags
-av_force_cpu_flags.restype = None
-av_force_cpu_flags.argtypes = [c_int]
-av_set_cpu_flags_mask = _libraries['/usr/lib/libavcodec.so'].av_set_cpu_flags_mask
-av_set_cpu_flags_mask.restype = None
-av_set_cpu_flags_mask.argtypes = [c_int]
-av_parse_cpu_flags = _libraries['/usr/lib/libavcodec.so'].av_parse_cpu_flags
-av_parse_cpu_flags.restype = c_int
-av_parse_cpu_flags.argtypes = [STRING]
-av_parse_cpu_caps = _libraries['/usr/lib/libavcodec.so'].av_parse_cpu_caps
-av_parse_cpu_caps.restype = c_int
-av_parse_cpu_caps.argtypes = [POINTER(c_uint), STRING]
-av_cpu_count = _libraries['/usr/lib/libavcodec.so'].av_cpu_count
-av_cpu_count.restype = c_int
-av_cpu_count.argtypes = []
-ff_get_cpu_flags_x86 = _libraries['/usr/lib/libavcodec.so'].ff_get_cpu_flags_x86
-ff_get_cpu_flags_x86.restype = c_int
-ff_get_cpu_flags_x86.argtypes = []
-class AVDictionaryEntry(Structure):
-    pass
-AVDictionaryEntry._fields_ = [
-    ('key', STRING),
-    ('value', STRING),
-]
-AVDictionary._fields_ = [
-]
-av_dict_get = _libraries['/usr/lib/libavcodec.so'].av_dict_get
-av_dict_get.restype = POINTER(AVDictionaryEntry)
-av_dict_get.argtypes = [POINTER(AVDictionary), STRING, POINTER(AVDictionaryEntry), c_int]
-av_dict_count = _libraries['/usr/lib/libavcodec.so'].av_dict_count
-av_dict_count.restype = c_int
-av_dict_count.argtypes = [POINTER(AVDictionary)]
-av_dict_set = _libraries['/usr/lib/libavcodec.so'].av_dict_set
-av_dict_set.restype = c_int
-av_dict_set.argtypes = [POINTER(POINTER(AVDictionary)), STRING, STRING, c_int]
-av_dict_parse_string = _libraries['/usr/lib/libavcodec.so'].av_dict_parse_string
-av_dict_parse_string.restype = c_int
-av_dict_parse_string.argtypes = [POINTER(POINTER(AVDictionary)), STRING, STRING, STRING, c_int]
-av_dict_copy = _libraries['/usr/lib/libavcodec.so'].av_dict_copy
-av_dict_copy.restype = None
-av_dict_copy.argtypes = [POINTER(POINTER(AVDictionary)), POINTER(AVDictionary), c_int]
-av_dict_free = _libraries['/usr/lib/libavcodec.so'].av_dict_free
-av_dict_free.restype = None
-av_dict_free.argtypes = [POINTER(POINTER(AVDictionary))]
-av_strerror = _libraries['/usr/lib/libavcodec.so'].av_strerror
-av_strerror.restype = c_int
-av_strerror.argtypes = [c_int, STRING, size_t]
 
 # values for enumeration 'AVFrameSideDataType'
 AVFrameSideDataType = c_int # enum
-class AVFrameSideData(Structure):
-    pass
-AVFrameSideData._fields_ = [
-    ('type', AVFrameSideDataType),
-    ('data', POINTER(uint8_t)),
-    ('size', c_int),
-    ('metadata', POINTER(AVDictionary)),
-]
-AVFrame._fields_ = [
-    ('data', POINTER(uint8_t) * 8),
-    ('linesize', c_int * 8),
-    ('extended_data', POINTER(POINTER(uint8_t))),
-    ('width', c_int),
-    ('height', c_int),
-    ('nb_samples', c_int),
-    ('format', c_int),
-    ('key_frame', c_int),
-    ('pict_type', AVPictureType),
-    ('base', POINTER(uint8_t) * 8),
-    ('sample_aspect_ratio', AVRational),
-    ('pts', int64_t),
-    ('pkt_pts', int64_t),
-    ('pkt_dts', int64_t),
-    ('coded_picture_number', c_int),
-    ('display_picture_number', c_int),
-    ('quality', c_int),
-    ('reference', c_int),
-    ('qscale_table', POINTER(int8_t)),
-    ('qstride', c_int),
-    ('qscale_type', c_int),
-    ('mbskip_table', POINTER(uint8_t)),
-    ('motion_val', POINTER(int16_t * 2) * 2),
-    ('mb_type', POINTER(uint32_t)),
-    ('dct_coeff', POINTER(c_short)),
-    ('ref_index', POINTER(int8_t) * 2),
-    ('opaque', c_void_p),
-    ('error', uint64_t * 8),
-    ('type', c_int),
-    ('repeat_pict', c_int),
-    ('interlaced_frame', c_int),
-    ('top_field_first', c_int),
-    ('palette_has_changed', c_int),
-    ('buffer_hints', c_int),
-    ('pan_scan', POINTER(AVPanScan)),
-    ('reordered_opaque', int64_t),
-    ('hwaccel_picture_private', c_void_p),
-    ('owner', POINTER(AVCodecContext)),
-    ('thread_opaque', c_void_p),
-    ('motion_subsample_log2', uint8_t),
-    ('sample_rate', c_int),
-    ('channel_layout', uint64_t),
-    ('buf', POINTER(AVBufferRef) * 8),
-    ('extended_buf', POINTER(POINTER(AVBufferRef))),
-    ('nb_extended_buf', c_int),
-    ('side_data', POINTER(POINTER(AVFrameSideData))),
-    ('nb_side_data', c_int),
-    ('best_effort_timestamp', int64_t),
-    ('pkt_pos', int64_t),
-    ('pkt_duration', int64_t),
-    ('metadata', POINTER(AVDictionary)),
-    ('decode_error_flags', c_int),
-    ('channels', c_int),
-    ('pkt_size', c_int),
-    ('qp_table_buf', POINTER(AVBufferRef)),
-]
-av_frame_get_best_effort_timestamp = _libraries['/usr/lib/libavcodec.so'].av_frame_get_best_effort_timestamp
-av_frame_get_best_effort_timestamp.restype = int64_t
-av_frame_get_best_effort_timestamp.argtypes = [POINTER(AVFrame)]
-av_frame_set_best_effort_timestamp = _libraries['/usr/lib/libavcodec.so'].av_frame_set_best_effort_timestamp
-av_frame_set_best_effort_timestamp.restype = None
-av_frame_set_best_effort_timestamp.argtypes = [POINTER(AVFrame), int64_t]
-av_frame_get_pkt_duration = _libraries['/usr/lib/libavcodec.so'].av_frame_get_pkt_duration
-av_frame_get_pkt_duration.restype = int64_t
-av_frame_get_pkt_duration.argtypes = [POINTER(AVFrame)]
-av_frame_set_pkt_duration = _libraries['/usr/lib/libavcodec.so'].av_frame_set_pkt_duration
-av_frame_set_pkt_duration.restype = None
-av_frame_set_pkt_duration.argtypes = [POINTER(AVFrame), int64_t]
-av_frame_get_pkt_pos = _libraries['/usr/lib/libavcodec.so'].av_frame_get_pkt_pos
-av_frame_get_pkt_pos.restype = int64_t
-av_frame_get_pkt_pos.argtypes = [POINTER(AVFrame)]
-av_frame_set_pkt_pos = _libraries['/usr/lib/libavcodec.so'].av_frame_set_pkt_pos
-av_frame_set_pkt_pos.restype = None
-av_frame_set_pkt_pos.argtypes = [POINTER(AVFrame), int64_t]
-av_frame_get_channel_layout = _libraries['/usr/lib/libavcodec.so'].av_frame_get_channel_layout
-av_frame_get_channel_layout.restype = int64_t
-av_frame_get_channel_layout.argtypes = [POINTER(AVFrame)]
-av_frame_set_channel_layout = _libraries['/usr/lib/libavcodec.so'].av_frame_set_channel_layout
-av_frame_set_channel_layout.restype = None
-av_frame_set_channel_layout.argtypes = [POINTER(AVFrame), int64_t]
-av_frame_get_channels = _libraries['/usr/lib/libavcodec.so'].av_frame_get_channels
-av_frame_get_channels.restype = c_int
-av_frame_get_channels.argtypes = [POINTER(AVFrame)]
-av_frame_set_channels = _libraries['/usr/lib/libavcodec.so'].av_frame_set_channels
-av_frame_set_channels.restype = None
-av_frame_set_channels.argtypes = [POINTER(AVFrame), c_int]
-av_frame_get_sample_rate = _libraries['/usr/lib/libavcodec.so'].av_frame_get_sample_rate
-av_frame_get_sample_rate.restype = c_int
-av_frame_get_sample_rate.argtypes = [POINTER(AVFrame)]
-av_frame_set_sample_rate = _libraries['/usr/lib/libavcodec.so'].av_frame_set_sample_rate
-av_frame_set_sample_rate.restype = None
-av_frame_set_sample_rate.argtypes = [POINTER(AVFrame), c_int]
-av_frame_get_metadata = _libraries['/usr/lib/libavcodec.so'].av_frame_get_metadata
-av_frame_get_metadata.restype = POINTER(AVDictionary)
-av_frame_get_metadata.argtypes = [POINTER(AVFrame)]
-av_frame_set_metadata = _libraries['/usr/lib/libavcodec.so'].av_frame_set_metadata
-av_frame_set_metadata.restype = None
-av_frame_set_metadata.argtypes = [POINTER(AVFrame), POINTER(AVDictionary)]
-av_frame_get_decode_error_flags = _libraries['/usr/lib/libavcodec.so'].av_frame_get_decode_error_flags
-av_frame_get_decode_error_flags.restype = c_int
-av_frame_get_decode_error_flags.argtypes = [POINTER(AVFrame)]
-av_frame_set_decode_error_flags = _libraries['/usr/lib/libavcodec.so'].av_frame_set_decode_error_flags
-av_frame_set_decode_error_flags.restype = None
-av_frame_set_decode_error_flags.argtypes = [POINTER(AVFrame), c_int]
-av_frame_get_pkt_size = _libraries['/usr/lib/libavcodec.so'].av_frame_get_pkt_size
-av_frame_get_pkt_size.restype = c_int
-av_frame_get_pkt_size.argtypes = [POINTER(AVFrame)]
-av_frame_set_pkt_size = _libraries['/usr/lib/libavcodec.so'].av_frame_set_pkt_size
-av_frame_set_pkt_size.restype = None
-av_frame_set_pkt_size.argtypes = [POINTER(AVFrame), c_int]
-avpriv_frame_get_metadatap = _libraries['/usr/lib/libavcodec.so'].avpriv_frame_get_metadatap
-avpriv_frame_get_metadatap.restype = POINTER(POINTER(AVDictionary))
-avpriv_frame_get_metadatap.argtypes = [POINTER(AVFrame)]
-av_frame_get_qp_table = _libraries['/usr/lib/libavcodec.so'].av_frame_get_qp_table
-av_frame_get_qp_table.restype = POINTER(int8_t)
-av_frame_get_qp_table.argtypes = [POINTER(AVFrame), POINTER(c_int), POINTER(c_int)]
-av_frame_set_qp_table = _libraries['/usr/lib/libavcodec.so'].av_frame_set_qp_table
-av_frame_set_qp_table.restype = c_int
-av_frame_set_qp_table.argtypes = [POINTER(AVFrame), POINTER(AVBufferRef), c_int, c_int]
-av_frame_alloc = _libraries['/usr/lib/libavcodec.so'].av_frame_alloc
-av_frame_alloc.restype = POINTER(AVFrame)
-av_frame_alloc.argtypes = []
-av_frame_free = _libraries['/usr/lib/libavcodec.so'].av_frame_free
-av_frame_free.restype = None
-av_frame_free.argtypes = [POINTER(POINTER(AVFrame))]
-av_frame_ref = _libraries['/usr/lib/libavcodec.so'].av_frame_ref
-av_frame_ref.restype = c_int
-av_frame_ref.argtypes = [POINTER(AVFrame), POINTER(AVFrame)]
-av_frame_clone = _libraries['/usr/lib/libavcodec.so'].av_frame_clone
-av_frame_clone.restype = POINTER(AVFrame)
-av_frame_clone.argtypes = [POINTER(AVFrame)]
-av_frame_unref = _libraries['/usr/lib/libavcodec.so'].av_frame_unref
-av_frame_unref.restype = None
-av_frame_unref.argtypes = [POINTER(AVFrame)]
-av_frame_move_ref = _libraries['/usr/lib/libavcodec.so'].av_frame_move_ref
-av_frame_move_ref.restype = None
-av_frame_move_ref.argtypes = [POINTER(AVFrame), POINTER(AVFrame)]
-av_frame_get_buffer = _libraries['/usr/lib/libavcodec.so'].av_frame_get_buffer
-av_frame_get_buffer.restype = c_int
-av_frame_get_buffer.argtypes = [POINTER(AVFrame), c_int]
-av_frame_is_writable = _libraries['/usr/lib/libavcodec.so'].av_frame_is_writable
-av_frame_is_writable.restype = c_int
-av_frame_is_writable.argtypes = [POINTER(AVFrame)]
-av_frame_make_writable = _libraries['/usr/lib/libavcodec.so'].av_frame_make_writable
-av_frame_make_writable.restype = c_int
-av_frame_make_writable.argtypes = [POINTER(AVFrame)]
-av_frame_copy_props = _libraries['/usr/lib/libavcodec.so'].av_frame_copy_props
-av_frame_copy_props.restype = c_int
-av_frame_copy_props.argtypes = [POINTER(AVFrame), POINTER(AVFrame)]
-av_frame_get_plane_buffer = _libraries['/usr/lib/libavcodec.so'].av_frame_get_plane_buffer
-av_frame_get_plane_buffer.restype = POINTER(AVBufferRef)
-av_frame_get_plane_buffer.argtypes = [POINTER(AVFrame), c_int]
-av_frame_new_side_data = _libraries['/usr/lib/libavcodec.so'].av_frame_new_side_data
-av_frame_new_side_data.restype = POINTER(AVFrameSideData)
-av_frame_new_side_data.argtypes = [POINTER(AVFrame), AVFrameSideDataType, c_int]
-av_frame_get_side_data = _libraries['/usr/lib/libavcodec.so'].av_frame_get_side_data
-av_frame_get_side_data.restype = POINTER(AVFrameSideData)
-av_frame_get_side_data.argtypes = [POINTER(AVFrame), AVFrameSideDataType]
-class av_intfloat32(Union):
-    pass
-av_intfloat32._fields_ = [
-    ('i', uint32_t),
-    ('f', c_float),
-]
-class av_intfloat64(Union):
-    pass
-av_intfloat64._fields_ = [
-    ('i', uint64_t),
-    ('f', c_double),
-]
-class AVExtFloat(Structure):
-    pass
-AVExtFloat._fields_ = [
-    ('exponent', uint8_t * 2),
-    ('mantissa', uint8_t * 8),
-]
-av_int2dbl = _libraries['/usr/lib/libavcodec.so'].av_int2dbl
-av_int2dbl.restype = c_double
-av_int2dbl.argtypes = [int64_t]
 int32_t = c_int32
-av_int2flt = _libraries['/usr/lib/libavcodec.so'].av_int2flt
-av_int2flt.restype = c_float
-av_int2flt.argtypes = [int32_t]
-av_ext2dbl = _libraries['/usr/lib/libavcodec.so'].av_ext2dbl
-av_ext2dbl.restype = c_double
-av_ext2dbl.argtypes = [AVExtFloat]
-av_dbl2int = _libraries['/usr/lib/libavcodec.so'].av_dbl2int
-av_dbl2int.restype = int64_t
-av_dbl2int.argtypes = [c_double]
-av_flt2int = _libraries['/usr/lib/libavcodec.so'].av_flt2int
-av_flt2int.restype = int32_t
-av_flt2int.argtypes = [c_float]
-av_dbl2ext = _libraries['/usr/lib/libavcodec.so'].av_dbl2ext
-av_dbl2ext.restype = AVExtFloat
-av_dbl2ext.argtypes = [c_double]
 
 # values for enumeration 'AVClassCategory'
 AVClassCategory = c_int # enum
-class AVOption(Structure):
-    pass
 
 # values for enumeration 'AVOptionType'
 AVOptionType = c_int # enum
-class N8AVOption4DOT_32E(Union):
-    pass
-N8AVOption4DOT_32E._fields_ = [
-    ('i64', int64_t),
-    ('dbl', c_double),
-    ('str', STRING),
-    ('q', AVRational),
-]
-AVOption._fields_ = [
-    ('name', STRING),
-    ('help', STRING),
-    ('offset', c_int),
-    ('type', AVOptionType),
-    ('default_val', N8AVOption4DOT_32E),
-    ('min', c_double),
-    ('max', c_double),
-    ('flags', c_int),
-    ('unit', STRING),
-]
-class AVOptionRanges(Structure):
-    pass
-AVClass._fields_ = [
-    ('class_name', STRING),
-    ('item_name', CFUNCTYPE(STRING, c_void_p)),
-    ('option', POINTER(AVOption)),
-    ('version', c_int),
-    ('log_level_offset_offset', c_int),
-    ('parent_log_context_offset', c_int),
-    ('child_next', CFUNCTYPE(c_void_p, c_void_p, c_void_p)),
-    ('child_class_next', CFUNCTYPE(POINTER(AVClass), POINTER(AVClass))),
-    ('category', AVClassCategory),
-    ('get_category', CFUNCTYPE(AVClassCategory, c_void_p)),
-    ('query_ranges', CFUNCTYPE(c_int, POINTER(POINTER(AVOptionRanges)), c_void_p, STRING, c_int)),
-]
-av_log = _libraries['/usr/lib/libavcodec.so'].av_log
-av_log.restype = None
-av_log.argtypes = [c_void_p, c_int, STRING]
-av_vlog = _libraries['/usr/lib/libavcodec.so'].av_vlog
-av_vlog.restype = None
-av_vlog.argtypes = [c_void_p, c_int, STRING, POINTER(__va_list_tag)]
-av_log_get_level = _libraries['/usr/lib/libavcodec.so'].av_log_get_level
-av_log_get_level.restype = c_int
-av_log_get_level.argtypes = []
-av_log_set_level = _libraries['/usr/lib/libavcodec.so'].av_log_set_level
-av_log_set_level.restype = None
-av_log_set_level.argtypes = [c_int]
-av_log_set_callback = _libraries['/usr/lib/libavcodec.so'].av_log_set_callback
-av_log_set_callback.restype = None
-av_log_set_callback.argtypes = [CFUNCTYPE(None, c_void_p, c_int, STRING, POINTER(__va_list_tag))]
-av_log_default_callback = _libraries['/usr/lib/libavcodec.so'].av_log_default_callback
-av_log_default_callback.restype = None
-av_log_default_callback.argtypes = [c_void_p, c_int, STRING, POINTER(__va_list_tag)]
-av_default_item_name = _libraries['/usr/lib/libavcodec.so'].av_default_item_name
-av_default_item_name.restype = STRING
-av_default_item_name.argtypes = [c_void_p]
-av_default_get_category = _libraries['/usr/lib/libavcodec.so'].av_default_get_category
-av_default_get_category.restype = AVClassCategory
-av_default_get_category.argtypes = [c_void_p]
-av_log_format_line = _libraries['/usr/lib/libavcodec.so'].av_log_format_line
-av_log_format_line.restype = None
-av_log_format_line.argtypes = [c_void_p, c_int, STRING, POINTER(__va_list_tag), STRING, c_int, POINTER(c_int)]
-av_log_set_flags = _libraries['/usr/lib/libavcodec.so'].av_log_set_flags
-av_log_set_flags.restype = None
-av_log_set_flags.argtypes = [c_int]
 
 # values for enumeration 'AVRounding'
 AVRounding = c_int # enum
-av_gcd = _libraries['/usr/lib/libavcodec.so'].av_gcd
-av_gcd.restype = int64_t
-av_gcd.argtypes = [int64_t, int64_t]
-av_rescale = _libraries['/usr/lib/libavcodec.so'].av_rescale
-av_rescale.restype = int64_t
-av_rescale.argtypes = [int64_t, int64_t, int64_t]
-av_rescale_rnd = _libraries['/usr/lib/libavcodec.so'].av_rescale_rnd
-av_rescale_rnd.restype = int64_t
-av_rescale_rnd.argtypes = [int64_t, int64_t, int64_t, AVRounding]
-av_rescale_q = _libraries['/usr/lib/libavcodec.so'].av_rescale_q
-av_rescale_q.restype = int64_t
-av_rescale_q.argtypes = [int64_t, AVRational, AVRational]
-av_rescale_q_rnd = _libraries['/usr/lib/libavcodec.so'].av_rescale_q_rnd
-av_rescale_q_rnd.restype = int64_t
-av_rescale_q_rnd.argtypes = [int64_t, AVRational, AVRational, AVRounding]
-av_compare_ts = _libraries['/usr/lib/libavcodec.so'].av_compare_ts
-av_compare_ts.restype = c_int
-av_compare_ts.argtypes = [int64_t, AVRational, int64_t, AVRational]
-av_compare_mod = _libraries['/usr/lib/libavcodec.so'].av_compare_mod
-av_compare_mod.restype = int64_t
-av_compare_mod.argtypes = [uint64_t, uint64_t, uint64_t]
-av_rescale_delta = _libraries['/usr/lib/libavcodec.so'].av_rescale_delta
-av_rescale_delta.restype = int64_t
-av_rescale_delta.argtypes = [AVRational, int64_t, AVRational, c_int, POINTER(int64_t), AVRational]
-av_malloc = _libraries['/usr/lib/libavcodec.so'].av_malloc
-av_malloc.restype = c_void_p
-av_malloc.argtypes = [size_t]
-av_realloc = _libraries['/usr/lib/libavcodec.so'].av_realloc
-av_realloc.restype = c_void_p
-av_realloc.argtypes = [c_void_p, size_t]
-av_realloc_f = _libraries['/usr/lib/libavcodec.so'].av_realloc_f
-av_realloc_f.restype = c_void_p
-av_realloc_f.argtypes = [c_void_p, size_t, size_t]
-av_realloc_array = _libraries['/usr/lib/libavcodec.so'].av_realloc_array
-av_realloc_array.restype = c_void_p
-av_realloc_array.argtypes = [c_void_p, size_t, size_t]
-av_reallocp_array = _libraries['/usr/lib/libavcodec.so'].av_reallocp_array
-av_reallocp_array.restype = c_int
-av_reallocp_array.argtypes = [c_void_p, size_t, size_t]
-av_free = _libraries['/usr/lib/libavcodec.so'].av_free
-av_free.restype = None
-av_free.argtypes = [c_void_p]
-av_mallocz = _libraries['/usr/lib/libavcodec.so'].av_mallocz
-av_mallocz.restype = c_void_p
-av_mallocz.argtypes = [size_t]
-av_calloc = _libraries['/usr/lib/libavcodec.so'].av_calloc
-av_calloc.restype = c_void_p
-av_calloc.argtypes = [size_t, size_t]
-av_strdup = _libraries['/usr/lib/libavcodec.so'].av_strdup
-av_strdup.restype = STRING
-av_strdup.argtypes = [STRING]
-av_memdup = _libraries['/usr/lib/libavcodec.so'].av_memdup
-av_memdup.restype = c_void_p
-av_memdup.argtypes = [c_void_p, size_t]
-av_freep = _libraries['/usr/lib/libavcodec.so'].av_freep
-av_freep.restype = None
-av_freep.argtypes = [c_void_p]
-av_dynarray_add = _libraries['/usr/lib/libavcodec.so'].av_dynarray_add
-av_dynarray_add.restype = None
-av_dynarray_add.argtypes = [c_void_p, POINTER(c_int), c_void_p]
-av_dynarray2_add = _libraries['/usr/lib/libavcodec.so'].av_dynarray2_add
-av_dynarray2_add.restype = c_void_p
-av_dynarray2_add.argtypes = [POINTER(c_void_p), POINTER(c_int), size_t, POINTER(uint8_t)]
-av_max_alloc = _libraries['/usr/lib/libavcodec.so'].av_max_alloc
-av_max_alloc.restype = None
-av_max_alloc.argtypes = [size_t]
-av_memcpy_backptr = _libraries['/usr/lib/libavcodec.so'].av_memcpy_backptr
-av_memcpy_backptr.restype = None
-av_memcpy_backptr.argtypes = [POINTER(uint8_t), c_int, c_int]
-class AVOptionRange(Structure):
-    pass
-AVOptionRange._fields_ = [
-    ('str', STRING),
-    ('value_min', c_double),
-    ('value_max', c_double),
-    ('component_min', c_double),
-    ('component_max', c_double),
-    ('is_range', c_int),
-]
-AVOptionRanges._fields_ = [
-    ('range', POINTER(POINTER(AVOptionRange))),
-    ('nb_ranges', c_int),
-]
-av_find_opt = _libraries['/usr/lib/libavcodec.so'].av_find_opt
-av_find_opt.restype = POINTER(AVOption)
-av_find_opt.argtypes = [c_void_p, STRING, STRING, c_int, c_int]
-av_set_string3 = _libraries['/usr/lib/libavcodec.so'].av_set_string3
-av_set_string3.restype = c_int
-av_set_string3.argtypes = [c_void_p, STRING, STRING, c_int, POINTER(POINTER(AVOption))]
-av_set_double = _libraries['/usr/lib/libavcodec.so'].av_set_double
-av_set_double.restype = POINTER(AVOption)
-av_set_double.argtypes = [c_void_p, STRING, c_double]
-av_set_q = _libraries['/usr/lib/libavcodec.so'].av_set_q
-av_set_q.restype = POINTER(AVOption)
-av_set_q.argtypes = [c_void_p, STRING, AVRational]
-av_set_int = _libraries['/usr/lib/libavcodec.so'].av_set_int
-av_set_int.restype = POINTER(AVOption)
-av_set_int.argtypes = [c_void_p, STRING, int64_t]
-av_get_double = _libraries['/usr/lib/libavcodec.so'].av_get_double
-av_get_double.restype = c_double
-av_get_double.argtypes = [c_void_p, STRING, POINTER(POINTER(AVOption))]
-av_get_q = _libraries['/usr/lib/libavcodec.so'].av_get_q
-av_get_q.restype = AVRational
-av_get_q.argtypes = [c_void_p, STRING, POINTER(POINTER(AVOption))]
-av_get_int = _libraries['/usr/lib/libavcodec.so'].av_get_int
-av_get_int.restype = int64_t
-av_get_int.argtypes = [c_void_p, STRING, POINTER(POINTER(AVOption))]
-av_get_string = _libraries['/usr/lib/libavcodec.so'].av_get_string
-av_get_string.restype = STRING
-av_get_string.argtypes = [c_void_p, STRING, POINTER(POINTER(AVOption)), STRING, c_int]
-av_next_option = _libraries['/usr/lib/libavcodec.so'].av_next_option
-av_next_option.restype = POINTER(AVOption)
-av_next_option.argtypes = [c_void_p, POINTER(AVOption)]
-av_opt_show2 = _libraries['/usr/lib/libavcodec.so'].av_opt_show2
-av_opt_show2.restype = c_int
-av_opt_show2.argtypes = [c_void_p, c_void_p, c_int, c_int]
-av_opt_set_defaults = _libraries['/usr/lib/libavcodec.so'].av_opt_set_defaults
-av_opt_set_defaults.restype = None
-av_opt_set_defaults.argtypes = [c_void_p]
-av_opt_set_defaults2 = _libraries['/usr/lib/libavcodec.so'].av_opt_set_defaults2
-av_opt_set_defaults2.restype = None
-av_opt_set_defaults2.argtypes = [c_void_p, c_int, c_int]
-av_set_options_string = _libraries['/usr/lib/libavcodec.so'].av_set_options_string
-av_set_options_string.restype = c_int
-av_set_options_string.argtypes = [c_void_p, STRING, STRING, STRING]
-av_opt_set_from_string = _libraries['/usr/lib/libavcodec.so'].av_opt_set_from_string
-av_opt_set_from_string.restype = c_int
-av_opt_set_from_string.argtypes = [c_void_p, STRING, POINTER(STRING), STRING, STRING]
-av_opt_free = _libraries['/usr/lib/libavcodec.so'].av_opt_free
-av_opt_free.restype = None
-av_opt_free.argtypes = [c_void_p]
-av_opt_flag_is_set = _libraries['/usr/lib/libavcodec.so'].av_opt_flag_is_set
-av_opt_flag_is_set.restype = c_int
-av_opt_flag_is_set.argtypes = [c_void_p, STRING, STRING]
-av_opt_set_dict = _libraries['/usr/lib/libavcodec.so'].av_opt_set_dict
-av_opt_set_dict.restype = c_int
-av_opt_set_dict.argtypes = [c_void_p, POINTER(POINTER(AVDictionary))]
-av_opt_get_key_value = _libraries['/usr/lib/libavcodec.so'].av_opt_get_key_value
-av_opt_get_key_value.restype = c_int
-av_opt_get_key_value.argtypes = [POINTER(STRING), STRING, STRING, c_uint, POINTER(STRING), POINTER(STRING)]
 
 # values for unnamed enumeration
-av_opt_eval_flags = _libraries['/usr/lib/libavcodec.so'].av_opt_eval_flags
-av_opt_eval_flags.restype = c_int
-av_opt_eval_flags.argtypes = [c_void_p, POINTER(AVOption), STRING, POINTER(c_int)]
-av_opt_eval_int = _libraries['/usr/lib/libavcodec.so'].av_opt_eval_int
-av_opt_eval_int.restype = c_int
-av_opt_eval_int.argtypes = [c_void_p, POINTER(AVOption), STRING, POINTER(c_int)]
-av_opt_eval_int64 = _libraries['/usr/lib/libavcodec.so'].av_opt_eval_int64
-av_opt_eval_int64.restype = c_int
-av_opt_eval_int64.argtypes = [c_void_p, POINTER(AVOption), STRING, POINTER(int64_t)]
-av_opt_eval_float = _libraries['/usr/lib/libavcodec.so'].av_opt_eval_float
-av_opt_eval_float.restype = c_int
-av_opt_eval_float.argtypes = [c_void_p, POINTER(AVOption), STRING, POINTER(c_float)]
-av_opt_eval_double = _libraries['/usr/lib/libavcodec.so'].av_opt_eval_double
-av_opt_eval_double.restype = c_int
-av_opt_eval_double.argtypes = [c_void_p, POINTER(AVOption), STRING, POINTER(c_double)]
-av_opt_eval_q = _libraries['/usr/lib/libavcodec.so'].av_opt_eval_q
-av_opt_eval_q.restype = c_int
-av_opt_eval_q.argtypes = [c_void_p, POINTER(AVOption), STRING, POINTER(AVRational)]
-av_opt_find = _libraries['/usr/lib/libavcodec.so'].av_opt_find
-av_opt_find.restype = POINTER(AVOption)
-av_opt_find.argtypes = [c_void_p, STRING, STRING, c_int, c_int]
-av_opt_find2 = _libraries['/usr/lib/libavcodec.so'].av_opt_find2
-av_opt_find2.restype = POINTER(AVOption)
-av_opt_find2.argtypes = [c_void_p, STRING, STRING, c_int, c_int, POINTER(c_void_p)]
-av_opt_next = _libraries['/usr/lib/libavcodec.so'].av_opt_next
-av_opt_next.restype = POINTER(AVOption)
-av_opt_next.argtypes = [c_void_p, POINTER(AVOption)]
-av_opt_child_next = _libraries['/usr/lib/libavcodec.so'].av_opt_child_next
-av_opt_child_next.restype = c_void_p
-av_opt_child_next.argtypes = [c_void_p, c_void_p]
-av_opt_child_class_next = _libraries['/usr/lib/libavcodec.so'].av_opt_child_class_next
-av_opt_child_class_next.restype = POINTER(AVClass)
-av_opt_child_class_next.argtypes = [POINTER(AVClass), POINTER(AVClass)]
-av_opt_set = _libraries['/usr/lib/libavcodec.so'].av_opt_set
-av_opt_set.restype = c_int
-av_opt_set.argtypes = [c_void_p, STRING, STRING, c_int]
-av_opt_set_int = _libraries['/usr/lib/libavcodec.so'].av_opt_set_int
-av_opt_set_int.restype = c_int
-av_opt_set_int.argtypes = [c_void_p, STRING, int64_t, c_int]
-av_opt_set_double = _libraries['/usr/lib/libavcodec.so'].av_opt_set_double
-av_opt_set_double.restype = c_int
-av_opt_set_double.argtypes = [c_void_p, STRING, c_double, c_int]
-av_opt_set_q = _libraries['/usr/lib/libavcodec.so'].av_opt_set_q
-av_opt_set_q.restype = c_int
-av_opt_set_q.argtypes = [c_void_p, STRING, AVRational, c_int]
-av_opt_set_bin = _libraries['/usr/lib/libavcodec.so'].av_opt_set_bin
-av_opt_set_bin.restype = c_int
-av_opt_set_bin.argtypes = [c_void_p, STRING, POINTER(uint8_t), c_int, c_int]
-av_opt_set_image_size = _libraries['/usr/lib/libavcodec.so'].av_opt_set_image_size
-av_opt_set_image_size.restype = c_int
-av_opt_set_image_size.argtypes = [c_void_p, STRING, c_int, c_int, c_int]
-av_opt_set_pixel_fmt = _libraries['/usr/lib/libavcodec.so'].av_opt_set_pixel_fmt
-av_opt_set_pixel_fmt.restype = c_int
-av_opt_set_pixel_fmt.argtypes = [c_void_p, STRING, AVPixelFormat, c_int]
-av_opt_set_sample_fmt = _libraries['/usr/lib/libavcodec.so'].av_opt_set_sample_fmt
-av_opt_set_sample_fmt.restype = c_int
-av_opt_set_sample_fmt.argtypes = [c_void_p, STRING, AVSampleFormat, c_int]
-av_opt_set_video_rate = _libraries['/usr/lib/libavcodec.so'].av_opt_set_video_rate
-av_opt_set_video_rate.restype = c_int
-av_opt_set_video_rate.argtypes = [c_void_p, STRING, AVRational, c_int]
-av_opt_get = _libraries['/usr/lib/libavcodec.so'].av_opt_get
-av_opt_get.restype = c_int
-av_opt_get.argtypes = [c_void_p, STRING, c_int, POINTER(POINTER(uint8_t))]
-av_opt_get_int = _libraries['/usr/lib/libavcodec.so'].av_opt_get_int
-av_opt_get_int.restype = c_int
-av_opt_get_int.argtypes = [c_void_p, STRING, c_int, POINTER(int64_t)]
-av_opt_get_double = _libraries['/usr/lib/libavcodec.so'].av_opt_get_double
-av_opt_get_double.restype = c_int
-av_opt_get_double.argtypes = [c_void_p, STRING, c_int, POINTER(c_double)]
-av_opt_get_q = _libraries['/usr/lib/libavcodec.so'].av_opt_get_q
-av_opt_get_q.restype = c_int
-av_opt_get_q.argtypes = [c_void_p, STRING, c_int, POINTER(AVRational)]
-av_opt_get_image_size = _libraries['/usr/lib/libavcodec.so'].av_opt_get_image_size
-av_opt_get_image_size.restype = c_int
-av_opt_get_image_size.argtypes = [c_void_p, STRING, c_int, POINTER(c_int), POINTER(c_int)]
-av_opt_get_pixel_fmt = _libraries['/usr/lib/libavcodec.so'].av_opt_get_pixel_fmt
-av_opt_get_pixel_fmt.restype = c_int
-av_opt_get_pixel_fmt.argtypes = [c_void_p, STRING, c_int, POINTER(AVPixelFormat)]
-av_opt_get_sample_fmt = _libraries['/usr/lib/libavcodec.so'].av_opt_get_sample_fmt
-av_opt_get_sample_fmt.restype = c_int
-av_opt_get_sample_fmt.argtypes = [c_void_p, STRING, c_int, POINTER(AVSampleFormat)]
-av_opt_get_video_rate = _libraries['/usr/lib/libavcodec.so'].av_opt_get_video_rate
-av_opt_get_video_rate.restype = c_int
-av_opt_get_video_rate.argtypes = [c_void_p, STRING, c_int, POINTER(AVRational)]
-av_opt_ptr = _libraries['/usr/lib/libavcodec.so'].av_opt_ptr
-av_opt_ptr.restype = c_void_p
-av_opt_ptr.argtypes = [POINTER(AVClass), c_void_p, STRING]
-av_opt_freep_ranges = _libraries['/usr/lib/libavcodec.so'].av_opt_freep_ranges
-av_opt_freep_ranges.restype = None
-av_opt_freep_ranges.argtypes = [POINTER(POINTER(AVOptionRanges))]
-av_opt_query_ranges = _libraries['/usr/lib/libavcodec.so'].av_opt_query_ranges
-av_opt_query_ranges.restype = c_int
-av_opt_query_ranges.argtypes = [POINTER(POINTER(AVOptionRanges)), c_void_p, STRING, c_int]
-av_opt_query_ranges_default = _libraries['/usr/lib/libavcodec.so'].av_opt_query_ranges_default
-av_opt_query_ranges_default.restype = c_int
-av_opt_query_ranges_default.argtypes = [POINTER(POINTER(AVOptionRanges)), c_void_p, STRING, c_int]
-av_reduce = _libraries['/usr/lib/libavcodec.so'].av_reduce
-av_reduce.restype = c_int
-av_reduce.argtypes = [POINTER(c_int), POINTER(c_int), int64_t, int64_t, int64_t]
-av_mul_q = _libraries['/usr/lib/libavcodec.so'].av_mul_q
-av_mul_q.restype = AVRational
-av_mul_q.argtypes = [AVRational, AVRational]
-av_div_q = _libraries['/usr/lib/libavcodec.so'].av_div_q
-av_div_q.restype = AVRational
-av_div_q.argtypes = [AVRational, AVRational]
-av_add_q = _libraries['/usr/lib/libavcodec.so'].av_add_q
-av_add_q.restype = AVRational
-av_add_q.argtypes = [AVRational, AVRational]
-av_sub_q = _libraries['/usr/lib/libavcodec.so'].av_sub_q
-av_sub_q.restype = AVRational
-av_sub_q.argtypes = [AVRational, AVRational]
-av_d2q = _libraries['/usr/lib/libavcodec.so'].av_d2q
-av_d2q.restype = AVRational
-av_d2q.argtypes = [c_double, c_int]
-av_nearer_q = _libraries['/usr/lib/libavcodec.so'].av_nearer_q
-av_nearer_q.restype = c_int
-av_nearer_q.argtypes = [AVRational, AVRational, AVRational]
-av_find_nearest_q_idx = _libraries['/usr/lib/libavcodec.so'].av_find_nearest_q_idx
-av_find_nearest_q_idx.restype = c_int
-av_find_nearest_q_idx.argtypes = [AVRational, POINTER(AVRational)]
-av_get_sample_fmt_name = _libraries['/usr/lib/libavcodec.so'].av_get_sample_fmt_name
-av_get_sample_fmt_name.restype = STRING
-av_get_sample_fmt_name.argtypes = [AVSampleFormat]
-av_get_sample_fmt = _libraries['/usr/lib/libavcodec.so'].av_get_sample_fmt
-av_get_sample_fmt.restype = AVSampleFormat
-av_get_sample_fmt.argtypes = [STRING]
-av_get_alt_sample_fmt = _libraries['/usr/lib/libavcodec.so'].av_get_alt_sample_fmt
-av_get_alt_sample_fmt.restype = AVSampleFormat
-av_get_alt_sample_fmt.argtypes = [AVSampleFormat, c_int]
-av_get_packed_sample_fmt = _libraries['/usr/lib/libavcodec.so'].av_get_packed_sample_fmt
-av_get_packed_sample_fmt.restype = AVSampleFormat
-av_get_packed_sample_fmt.argtypes = [AVSampleFormat]
-av_get_planar_sample_fmt = _libraries['/usr/lib/libavcodec.so'].av_get_planar_sample_fmt
-av_get_planar_sample_fmt.restype = AVSampleFormat
-av_get_planar_sample_fmt.argtypes = [AVSampleFormat]
-av_get_sample_fmt_string = _libraries['/usr/lib/libavcodec.so'].av_get_sample_fmt_string
-av_get_sample_fmt_string.restype = STRING
-av_get_sample_fmt_string.argtypes = [STRING, c_int, AVSampleFormat]
-av_get_bits_per_sample_fmt = _libraries['/usr/lib/libavcodec.so'].av_get_bits_per_sample_fmt
-av_get_bits_per_sample_fmt.restype = c_int
-av_get_bits_per_sample_fmt.argtypes = [AVSampleFormat]
-av_get_bytes_per_sample = _libraries['/usr/lib/libavcodec.so'].av_get_bytes_per_sample
-av_get_bytes_per_sample.restype = c_int
-av_get_bytes_per_sample.argtypes = [AVSampleFormat]
-av_sample_fmt_is_planar = _libraries['/usr/lib/libavcodec.so'].av_sample_fmt_is_planar
-av_sample_fmt_is_planar.restype = c_int
-av_sample_fmt_is_planar.argtypes = [AVSampleFormat]
-av_samples_get_buffer_size = _libraries['/usr/lib/libavcodec.so'].av_samples_get_buffer_size
-av_samples_get_buffer_size.restype = c_int
-av_samples_get_buffer_size.argtypes = [POINTER(c_int), c_int, c_int, AVSampleFormat, c_int]
-av_samples_fill_arrays = _libraries['/usr/lib/libavcodec.so'].av_samples_fill_arrays
-av_samples_fill_arrays.restype = c_int
-av_samples_fill_arrays.argtypes = [POINTER(POINTER(uint8_t)), POINTER(c_int), POINTER(uint8_t), c_int, c_int, AVSampleFormat, c_int]
-av_samples_alloc = _libraries['/usr/lib/libavcodec.so'].av_samples_alloc
-av_samples_alloc.restype = c_int
-av_samples_alloc.argtypes = [POINTER(POINTER(uint8_t)), POINTER(c_int), c_int, c_int, AVSampleFormat, c_int]
-av_samples_alloc_array_and_samples = _libraries['/usr/lib/libavcodec.so'].av_samples_alloc_array_and_samples
-av_samples_alloc_array_and_samples.restype = c_int
-av_samples_alloc_array_and_samples.argtypes = [POINTER(POINTER(POINTER(uint8_t))), POINTER(c_int), c_int, c_int, AVSampleFormat, c_int]
-av_samples_copy = _libraries['/usr/lib/libavcodec.so'].av_samples_copy
-av_samples_copy.restype = c_int
-av_samples_copy.argtypes = [POINTER(POINTER(uint8_t)), POINTER(POINTER(uint8_t)), c_int, c_int, c_int, c_int, AVSampleFormat]
-av_samples_set_silence = _libraries['/usr/lib/libavcodec.so'].av_samples_set_silence
-av_samples_set_silence.restype = c_int
-av_samples_set_silence.argtypes = [POINTER(POINTER(uint8_t)), c_int, c_int, c_int, AVSampleFormat]
-av_gettime = _libraries['/usr/lib/libavcodec.so'].av_gettime
-av_gettime.restype = int64_t
-av_gettime.argtypes = []
-av_usleep = _libraries['/usr/lib/libavcodec.so'].av_usleep
-av_usleep.restype = c_int
-av_usleep.argtypes = [c_uint]
-class _IO_jump_t(Structure):
-    pass
-_IO_jump_t._fields_ = [
-]
 _IO_lock_t = None
-class _IO_marker(Structure):
-    pass
-_IO_marker._fields_ = [
-    ('_next', POINTER(_IO_marker)),
-    ('_sbuf', POINTER(_IO_FILE)),
-    ('_pos', c_int),
-]
 
 # values for enumeration '__codecvt_result'
 __codecvt_result = c_int # enum
-_IO_FILE._fields_ = [
-    ('_flags', c_int),
-    ('_IO_read_ptr', STRING),
-    ('_IO_read_end', STRING),
-    ('_IO_read_base', STRING),
-    ('_IO_write_base', STRING),
-    ('_IO_write_ptr', STRING),
-    ('_IO_write_end', STRING),
-    ('_IO_buf_base', STRING),
-    ('_IO_buf_end', STRING),
-    ('_IO_save_base', STRING),
-    ('_IO_backup_base', STRING),
-    ('_IO_save_end', STRING),
-    ('_markers', POINTER(_IO_marker)),
-    ('_chain', POINTER(_IO_FILE)),
-    ('_fileno', c_int),
-    ('_flags2', c_int),
-    ('_old_offset', __off_t),
-    ('_cur_column', c_ushort),
-    ('_vtable_offset', c_byte),
-    ('_shortbuf', c_char * 1),
-    ('_lock', POINTER(_IO_lock_t)),
-    ('_offset', __off64_t),
-    ('__pad1', c_void_p),
-    ('__pad2', c_void_p),
-    ('__pad3', c_void_p),
-    ('__pad4', c_void_p),
-    ('__pad5', size_t),
-    ('_mode', c_int),
-    ('_unused2', c_char * 20),
-]
-class _IO_FILE_plus(Structure):
-    pass
-_IO_FILE_plus._fields_ = [
-]
-_IO_2_1_stdin_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libavcodec.so'], '_IO_2_1_stdin_')
-_IO_2_1_stdout_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libavcodec.so'], '_IO_2_1_stdout_')
-_IO_2_1_stderr_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libavcodec.so'], '_IO_2_1_stderr_')
 __io_read_fn = CFUNCTYPE(__ssize_t, c_void_p, STRING, size_t)
 __io_write_fn = CFUNCTYPE(__ssize_t, c_void_p, STRING, size_t)
 __io_seek_fn = CFUNCTYPE(c_int, c_void_p, POINTER(__off64_t), c_int)
@@ -6520,236 +2740,13 @@ cookie_read_function_t = __io_read_fn
 cookie_write_function_t = __io_write_fn
 cookie_seek_function_t = __io_seek_fn
 cookie_close_function_t = __io_close_fn
-class _IO_cookie_io_functions_t(Structure):
-    pass
-_IO_cookie_io_functions_t._fields_ = [
-    ('read', POINTER(__io_read_fn)),
-    ('write', POINTER(__io_write_fn)),
-    ('seek', POINTER(__io_seek_fn)),
-    ('close', POINTER(__io_close_fn)),
-]
-cookie_io_functions_t = _IO_cookie_io_functions_t
-class _IO_cookie_file(Structure):
-    pass
-_IO_cookie_file._fields_ = [
-]
-__underflow = _libraries['/usr/lib/libavcodec.so'].__underflow
-__underflow.restype = c_int
-__underflow.argtypes = [POINTER(_IO_FILE)]
-__uflow = _libraries['/usr/lib/libavcodec.so'].__uflow
-__uflow.restype = c_int
-__uflow.argtypes = [POINTER(_IO_FILE)]
-__overflow = _libraries['/usr/lib/libavcodec.so'].__overflow
-__overflow.restype = c_int
-__overflow.argtypes = [POINTER(_IO_FILE), c_int]
-_IO_getc = _libraries['/usr/lib/libavcodec.so']._IO_getc
-_IO_getc.restype = c_int
-_IO_getc.argtypes = [POINTER(_IO_FILE)]
-_IO_putc = _libraries['/usr/lib/libavcodec.so']._IO_putc
-_IO_putc.restype = c_int
-_IO_putc.argtypes = [c_int, POINTER(_IO_FILE)]
-_IO_feof = _libraries['/usr/lib/libavcodec.so']._IO_feof
-_IO_feof.restype = c_int
-_IO_feof.argtypes = [POINTER(_IO_FILE)]
-_IO_ferror = _libraries['/usr/lib/libavcodec.so']._IO_ferror
-_IO_ferror.restype = c_int
-_IO_ferror.argtypes = [POINTER(_IO_FILE)]
-_IO_peekc_locked = _libraries['/usr/lib/libavcodec.so']._IO_peekc_locked
-_IO_peekc_locked.restype = c_int
-_IO_peekc_locked.argtypes = [POINTER(_IO_FILE)]
-_IO_flockfile = _libraries['/usr/lib/libavcodec.so']._IO_flockfile
-_IO_flockfile.restype = None
-_IO_flockfile.argtypes = [POINTER(_IO_FILE)]
-_IO_funlockfile = _libraries['/usr/lib/libavcodec.so']._IO_funlockfile
-_IO_funlockfile.restype = None
-_IO_funlockfile.argtypes = [POINTER(_IO_FILE)]
-_IO_ftrylockfile = _libraries['/usr/lib/libavcodec.so']._IO_ftrylockfile
-_IO_ftrylockfile.restype = c_int
-_IO_ftrylockfile.argtypes = [POINTER(_IO_FILE)]
-_IO_vfscanf = _libraries['/usr/lib/libavcodec.so']._IO_vfscanf
-_IO_vfscanf.restype = c_int
-_IO_vfscanf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag), POINTER(c_int)]
-_IO_vfprintf = _libraries['/usr/lib/libavcodec.so']._IO_vfprintf
-_IO_vfprintf.restype = c_int
-_IO_vfprintf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag)]
-_IO_padn = _libraries['/usr/lib/libavcodec.so']._IO_padn
-_IO_padn.restype = __ssize_t
-_IO_padn.argtypes = [POINTER(_IO_FILE), c_int, __ssize_t]
-_IO_sgetn = _libraries['/usr/lib/libavcodec.so']._IO_sgetn
-_IO_sgetn.restype = size_t
-_IO_sgetn.argtypes = [POINTER(_IO_FILE), c_void_p, size_t]
-_IO_seekoff = _libraries['/usr/lib/libavcodec.so']._IO_seekoff
-_IO_seekoff.restype = __off64_t
-_IO_seekoff.argtypes = [POINTER(_IO_FILE), __off64_t, c_int, c_int]
-_IO_seekpos = _libraries['/usr/lib/libavcodec.so']._IO_seekpos
-_IO_seekpos.restype = __off64_t
-_IO_seekpos.argtypes = [POINTER(_IO_FILE), __off64_t, c_int]
-_IO_free_backup_area = _libraries['/usr/lib/libavcodec.so']._IO_free_backup_area
-_IO_free_backup_area.restype = None
-_IO_free_backup_area.argtypes = [POINTER(_IO_FILE)]
-postproc_version = _libraries['/usr/lib/libavdevice.so'].postproc_version
-postproc_version.restype = c_uint
-postproc_version.argtypes = []
-postproc_configuration = _libraries['/usr/lib/libavdevice.so'].postproc_configuration
-postproc_configuration.restype = STRING
-postproc_configuration.argtypes = []
-postproc_license = _libraries['/usr/lib/libavdevice.so'].postproc_license
-postproc_license.restype = STRING
-postproc_license.argtypes = []
 pp_context = None
 pp_mode = None
-pp_help = (c_char * 0).in_dll(_libraries['/usr/lib/libavdevice.so'], 'pp_help')
-pp_postprocess = _libraries['/usr/lib/libavdevice.so'].pp_postprocess
-pp_postprocess.restype = None
-pp_postprocess.argtypes = [POINTER(POINTER(uint8_t)), POINTER(c_int), POINTER(POINTER(uint8_t)), POINTER(c_int), c_int, c_int, POINTER(int8_t), c_int, POINTER(pp_mode), POINTER(pp_context), c_int]
-pp_get_mode_by_name_and_quality = _libraries['/usr/lib/libavdevice.so'].pp_get_mode_by_name_and_quality
-pp_get_mode_by_name_and_quality.restype = POINTER(pp_mode)
-pp_get_mode_by_name_and_quality.argtypes = [STRING, c_int]
-pp_free_mode = _libraries['/usr/lib/libavdevice.so'].pp_free_mode
-pp_free_mode.restype = None
-pp_free_mode.argtypes = [POINTER(pp_mode)]
-pp_get_context = _libraries['/usr/lib/libavdevice.so'].pp_get_context
-pp_get_context.restype = POINTER(pp_context)
-pp_get_context.argtypes = [c_int, c_int, c_int]
-pp_free_context = _libraries['/usr/lib/libavdevice.so'].pp_free_context
-pp_free_context.restype = None
-pp_free_context.argtypes = [POINTER(pp_context)]
-swscale_version = _libraries['/usr/lib/libswscale.so'].swscale_version
-swscale_version.restype = c_uint
-swscale_version.argtypes = []
-swscale_configuration = _libraries['/usr/lib/libswscale.so'].swscale_configuration
-swscale_configuration.restype = STRING
-swscale_configuration.argtypes = []
-swscale_license = _libraries['/usr/lib/libswscale.so'].swscale_license
-swscale_license.restype = STRING
-swscale_license.argtypes = []
-sws_getCoefficients = _libraries['/usr/lib/libswscale.so'].sws_getCoefficients
-sws_getCoefficients.restype = POINTER(c_int)
-sws_getCoefficients.argtypes = [c_int]
-class SwsVector(Structure):
-    pass
-SwsVector._fields_ = [
-    ('coeff', POINTER(c_double)),
-    ('length', c_int),
-]
-class SwsFilter(Structure):
-    pass
-SwsFilter._fields_ = [
-    ('lumH', POINTER(SwsVector)),
-    ('lumV', POINTER(SwsVector)),
-    ('chrH', POINTER(SwsVector)),
-    ('chrV', POINTER(SwsVector)),
-]
-class SwsContext(Structure):
-    pass
-SwsContext._fields_ = [
-]
-sws_isSupportedInput = _libraries['/usr/lib/libswscale.so'].sws_isSupportedInput
-sws_isSupportedInput.restype = c_int
-sws_isSupportedInput.argtypes = [AVPixelFormat]
-sws_isSupportedOutput = _libraries['/usr/lib/libswscale.so'].sws_isSupportedOutput
-sws_isSupportedOutput.restype = c_int
-sws_isSupportedOutput.argtypes = [AVPixelFormat]
-sws_isSupportedEndiannessConversion = _libraries['/usr/lib/libswscale.so'].sws_isSupportedEndiannessConversion
-sws_isSupportedEndiannessConversion.restype = c_int
-sws_isSupportedEndiannessConversion.argtypes = [AVPixelFormat]
-sws_alloc_context = _libraries['/usr/lib/libswscale.so'].sws_alloc_context
-sws_alloc_context.restype = POINTER(SwsContext)
-sws_alloc_context.argtypes = []
-sws_init_context = _libraries['/usr/lib/libswscale.so'].sws_init_context
-sws_init_context.restype = c_int
-sws_init_context.argtypes = [POINTER(SwsContext), POINTER(SwsFilter), POINTER(SwsFilter)]
-sws_freeContext = _libraries['/usr/lib/libswscale.so'].sws_freeContext
-sws_freeContext.restype = None
-sws_freeContext.argtypes = [POINTER(SwsContext)]
-sws_getContext = _libraries['/usr/lib/libswscale.so'].sws_getContext
-sws_getContext.restype = POINTER(SwsContext)
-sws_getContext.argtypes = [c_int, c_int, AVPixelFormat, c_int, c_int, AVPixelFormat, c_int, POINTER(SwsFilter), POINTER(SwsFilter), POINTER(c_double)]
-sws_scale = _libraries['/usr/lib/libswscale.so'].sws_scale
-sws_scale.restype = c_int
-sws_scale.argtypes = [POINTER(SwsContext), POINTER(POINTER(uint8_t)), POINTER(c_int), c_int, c_int, POINTER(POINTER(uint8_t)), POINTER(c_int)]
-sws_setColorspaceDetails = _libraries['/usr/lib/libswscale.so'].sws_setColorspaceDetails
-sws_setColorspaceDetails.restype = c_int
-sws_setColorspaceDetails.argtypes = [POINTER(SwsContext), POINTER(c_int), c_int, POINTER(c_int), c_int, c_int, c_int, c_int]
-sws_getColorspaceDetails = _libraries['/usr/lib/libswscale.so'].sws_getColorspaceDetails
-sws_getColorspaceDetails.restype = c_int
-sws_getColorspaceDetails.argtypes = [POINTER(SwsContext), POINTER(POINTER(c_int)), POINTER(c_int), POINTER(POINTER(c_int)), POINTER(c_int), POINTER(c_int), POINTER(c_int), POINTER(c_int)]
-sws_allocVec = _libraries['/usr/lib/libswscale.so'].sws_allocVec
-sws_allocVec.restype = POINTER(SwsVector)
-sws_allocVec.argtypes = [c_int]
-sws_getGaussianVec = _libraries['/usr/lib/libswscale.so'].sws_getGaussianVec
-sws_getGaussianVec.restype = POINTER(SwsVector)
-sws_getGaussianVec.argtypes = [c_double, c_double]
-sws_getConstVec = _libraries['/usr/lib/libswscale.so'].sws_getConstVec
-sws_getConstVec.restype = POINTER(SwsVector)
-sws_getConstVec.argtypes = [c_double, c_int]
-sws_getIdentityVec = _libraries['/usr/lib/libswscale.so'].sws_getIdentityVec
-sws_getIdentityVec.restype = POINTER(SwsVector)
-sws_getIdentityVec.argtypes = []
-sws_scaleVec = _libraries['/usr/lib/libswscale.so'].sws_scaleVec
-sws_scaleVec.restype = None
-sws_scaleVec.argtypes = [POINTER(SwsVector), c_double]
-sws_normalizeVec = _libraries['/usr/lib/libswscale.so'].sws_normalizeVec
-sws_normalizeVec.restype = None
-sws_normalizeVec.argtypes = [POINTER(SwsVector), c_double]
-sws_convVec = _libraries['/usr/lib/libswscale.so'].sws_convVec
-sws_convVec.restype = None
-sws_convVec.argtypes = [POINTER(SwsVector), POINTER(SwsVector)]
-sws_addVec = _libraries['/usr/lib/libswscale.so'].sws_addVec
-sws_addVec.restype = None
-sws_addVec.argtypes = [POINTER(SwsVector), POINTER(SwsVector)]
-sws_subVec = _libraries['/usr/lib/libswscale.so'].sws_subVec
-sws_subVec.restype = None
-sws_subVec.argtypes = [POINTER(SwsVector), POINTER(SwsVector)]
-sws_shiftVec = _libraries['/usr/lib/libswscale.so'].sws_shiftVec
-sws_shiftVec.restype = None
-sws_shiftVec.argtypes = [POINTER(SwsVector), c_int]
-sws_cloneVec = _libraries['/usr/lib/libswscale.so'].sws_cloneVec
-sws_cloneVec.restype = POINTER(SwsVector)
-sws_cloneVec.argtypes = [POINTER(SwsVector)]
-sws_printVec2 = _libraries['/usr/lib/libswscale.so'].sws_printVec2
-sws_printVec2.restype = None
-sws_printVec2.argtypes = [POINTER(SwsVector), POINTER(AVClass), c_int]
-sws_freeVec = _libraries['/usr/lib/libswscale.so'].sws_freeVec
-sws_freeVec.restype = None
-sws_freeVec.argtypes = [POINTER(SwsVector)]
-sws_getDefaultFilter = _libraries['/usr/lib/libswscale.so'].sws_getDefaultFilter
-sws_getDefaultFilter.restype = POINTER(SwsFilter)
-sws_getDefaultFilter.argtypes = [c_float, c_float, c_float, c_float, c_float, c_float, c_int]
-sws_freeFilter = _libraries['/usr/lib/libswscale.so'].sws_freeFilter
-sws_freeFilter.restype = None
-sws_freeFilter.argtypes = [POINTER(SwsFilter)]
-sws_getCachedContext = _libraries['/usr/lib/libswscale.so'].sws_getCachedContext
-sws_getCachedContext.restype = POINTER(SwsContext)
-sws_getCachedContext.argtypes = [POINTER(SwsContext), c_int, c_int, AVPixelFormat, c_int, c_int, AVPixelFormat, c_int, POINTER(SwsFilter), POINTER(SwsFilter), POINTER(c_double)]
-sws_convertPalette8ToPacked32 = _libraries['/usr/lib/libswscale.so'].sws_convertPalette8ToPacked32
-sws_convertPalette8ToPacked32.restype = None
-sws_convertPalette8ToPacked32.argtypes = [POINTER(uint8_t), POINTER(uint8_t), c_int, POINTER(uint8_t)]
-sws_convertPalette8ToPacked24 = _libraries['/usr/lib/libswscale.so'].sws_convertPalette8ToPacked24
-sws_convertPalette8ToPacked24.restype = None
-sws_convertPalette8ToPacked24.argtypes = [POINTER(uint8_t), POINTER(uint8_t), c_int, POINTER(uint8_t)]
-sws_get_class = _libraries['/usr/lib/libswscale.so'].sws_get_class
-sws_get_class.restype = POINTER(AVClass)
-sws_get_class.argtypes = []
-signgam = (c_int).in_dll(_libraries['/usr/lib/libavcodec.so'], 'signgam')
 
 # values for unnamed enumeration
 
 # values for enumeration '_LIB_VERSION_TYPE'
 _LIB_VERSION_TYPE = c_int # enum
-_LIB_VERSION = (_LIB_VERSION_TYPE).in_dll(_libraries['/usr/lib/libavcodec.so'], '_LIB_VERSION')
-class __exception(Structure):
-    pass
-__exception._fields_ = [
-    ('type', c_int),
-    ('name', STRING),
-    ('arg1', c_double),
-    ('arg2', c_double),
-    ('retval', c_double),
-]
-matherr = _libraries['/usr/lib/libavcodec.so'].matherr
-matherr.restype = c_int
-matherr.argtypes = [POINTER(__exception)]
 int_least8_t = c_byte
 int_least16_t = c_short
 int_least32_t = c_int
@@ -6768,822 +2765,20 @@ uint_fast32_t = c_ulong
 uint_fast64_t = c_ulong
 intptr_t = c_long
 uintptr_t = c_ulong
-__FILE = _IO_FILE
-va_list = __gnuc_va_list
 off_t = __off_t
 off64_t = __off64_t
 ssize_t = __ssize_t
-fpos_t = _G_fpos_t
-fpos64_t = _G_fpos64_t
-remove = _libraries['/usr/lib/libavcodec.so'].remove
-remove.restype = c_int
-remove.argtypes = [STRING]
-rename = _libraries['/usr/lib/libavcodec.so'].rename
-rename.restype = c_int
-rename.argtypes = [STRING, STRING]
-renameat = _libraries['/usr/lib/libavcodec.so'].renameat
-renameat.restype = c_int
-renameat.argtypes = [c_int, STRING, c_int, STRING]
-tmpfile = _libraries['/usr/lib/libavcodec.so'].tmpfile
-tmpfile.restype = POINTER(FILE)
-tmpfile.argtypes = []
-tmpfile64 = _libraries['/usr/lib/libavcodec.so'].tmpfile64
-tmpfile64.restype = POINTER(FILE)
-tmpfile64.argtypes = []
-tmpnam = _libraries['/usr/lib/libavcodec.so'].tmpnam
-tmpnam.restype = STRING
-tmpnam.argtypes = [STRING]
-tmpnam_r = _libraries['/usr/lib/libavcodec.so'].tmpnam_r
-tmpnam_r.restype = STRING
-tmpnam_r.argtypes = [STRING]
-tempnam = _libraries['/usr/lib/libavcodec.so'].tempnam
-tempnam.restype = STRING
-tempnam.argtypes = [STRING, STRING]
-fclose = _libraries['/usr/lib/libavcodec.so'].fclose
-fclose.restype = c_int
-fclose.argtypes = [POINTER(FILE)]
-fflush = _libraries['/usr/lib/libavcodec.so'].fflush
-fflush.restype = c_int
-fflush.argtypes = [POINTER(FILE)]
-fflush_unlocked = _libraries['/usr/lib/libavcodec.so'].fflush_unlocked
-fflush_unlocked.restype = c_int
-fflush_unlocked.argtypes = [POINTER(FILE)]
-fcloseall = _libraries['/usr/lib/libavcodec.so'].fcloseall
-fcloseall.restype = c_int
-fcloseall.argtypes = []
-fopen = _libraries['/usr/lib/libavcodec.so'].fopen
-fopen.restype = POINTER(FILE)
-fopen.argtypes = [STRING, STRING]
-freopen = _libraries['/usr/lib/libavcodec.so'].freopen
-freopen.restype = POINTER(FILE)
-freopen.argtypes = [STRING, STRING, POINTER(FILE)]
-fopen64 = _libraries['/usr/lib/libavcodec.so'].fopen64
-fopen64.restype = POINTER(FILE)
-fopen64.argtypes = [STRING, STRING]
-freopen64 = _libraries['/usr/lib/libavcodec.so'].freopen64
-freopen64.restype = POINTER(FILE)
-freopen64.argtypes = [STRING, STRING, POINTER(FILE)]
-fdopen = _libraries['/usr/lib/libavcodec.so'].fdopen
-fdopen.restype = POINTER(FILE)
-fdopen.argtypes = [c_int, STRING]
-fopencookie = _libraries['/usr/lib/libavcodec.so'].fopencookie
-fopencookie.restype = POINTER(FILE)
-fopencookie.argtypes = [c_void_p, STRING, _IO_cookie_io_functions_t]
-fmemopen = _libraries['/usr/lib/libavcodec.so'].fmemopen
-fmemopen.restype = POINTER(FILE)
-fmemopen.argtypes = [c_void_p, size_t, STRING]
-open_memstream = _libraries['/usr/lib/libavcodec.so'].open_memstream
-open_memstream.restype = POINTER(FILE)
-open_memstream.argtypes = [POINTER(STRING), POINTER(size_t)]
-setbuf = _libraries['/usr/lib/libavcodec.so'].setbuf
-setbuf.restype = None
-setbuf.argtypes = [POINTER(FILE), STRING]
-setvbuf = _libraries['/usr/lib/libavcodec.so'].setvbuf
-setvbuf.restype = c_int
-setvbuf.argtypes = [POINTER(FILE), STRING, c_int, size_t]
-setbuffer = _libraries['/usr/lib/libavcodec.so'].setbuffer
-setbuffer.restype = None
-setbuffer.argtypes = [POINTER(FILE), STRING, size_t]
-setlinebuf = _libraries['/usr/lib/libavcodec.so'].setlinebuf
-setlinebuf.restype = None
-setlinebuf.argtypes = [POINTER(FILE)]
-fscanf = _libraries['/usr/lib/libavcodec.so'].fscanf
-fscanf.restype = c_int
-fscanf.argtypes = [POINTER(FILE), STRING]
-scanf = _libraries['/usr/lib/libavcodec.so'].scanf
-scanf.restype = c_int
-scanf.argtypes = [STRING]
-sscanf = _libraries['/usr/lib/libavcodec.so'].sscanf
-sscanf.restype = c_int
-sscanf.argtypes = [STRING, STRING]
-vfscanf = _libraries['/usr/lib/libavcodec.so'].vfscanf
-vfscanf.restype = c_int
-vfscanf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]
-vscanf = _libraries['/usr/lib/libavcodec.so'].vscanf
-vscanf.restype = c_int
-vscanf.argtypes = [STRING, POINTER(__va_list_tag)]
-vsscanf = _libraries['/usr/lib/libavcodec.so'].vsscanf
-vsscanf.restype = c_int
-vsscanf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]
-fgetc = _libraries['/usr/lib/libavcodec.so'].fgetc
-fgetc.restype = c_int
-fgetc.argtypes = [POINTER(FILE)]
-getc = _libraries['/usr/lib/libavcodec.so'].getc
-getc.restype = c_int
-getc.argtypes = [POINTER(FILE)]
-fputc = _libraries['/usr/lib/libavcodec.so'].fputc
-fputc.restype = c_int
-fputc.argtypes = [c_int, POINTER(FILE)]
-putc = _libraries['/usr/lib/libavcodec.so'].putc
-putc.restype = c_int
-putc.argtypes = [c_int, POINTER(FILE)]
-getw = _libraries['/usr/lib/libavcodec.so'].getw
-getw.restype = c_int
-getw.argtypes = [POINTER(FILE)]
-putw = _libraries['/usr/lib/libavcodec.so'].putw
-putw.restype = c_int
-putw.argtypes = [c_int, POINTER(FILE)]
-gets = _libraries['/usr/lib/libavcodec.so'].gets
-gets.restype = STRING
-gets.argtypes = [STRING]
-__getdelim = _libraries['/usr/lib/libavcodec.so'].__getdelim
-__getdelim.restype = __ssize_t
-__getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]
-getdelim = _libraries['/usr/lib/libavcodec.so'].getdelim
-getdelim.restype = __ssize_t
-getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]
-fputs = _libraries['/usr/lib/libavcodec.so'].fputs
-fputs.restype = c_int
-fputs.argtypes = [STRING, POINTER(FILE)]
-puts = _libraries['/usr/lib/libavcodec.so'].puts
-puts.restype = c_int
-puts.argtypes = [STRING]
-ungetc = _libraries['/usr/lib/libavcodec.so'].ungetc
-ungetc.restype = c_int
-ungetc.argtypes = [c_int, POINTER(FILE)]
-fwrite = _libraries['/usr/lib/libavcodec.so'].fwrite
-fwrite.restype = size_t
-fwrite.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-fputs_unlocked = _libraries['/usr/lib/libavcodec.so'].fputs_unlocked
-fputs_unlocked.restype = c_int
-fputs_unlocked.argtypes = [STRING, POINTER(FILE)]
-fwrite_unlocked = _libraries['/usr/lib/libavcodec.so'].fwrite_unlocked
-fwrite_unlocked.restype = size_t
-fwrite_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-fseek = _libraries['/usr/lib/libavcodec.so'].fseek
-fseek.restype = c_int
-fseek.argtypes = [POINTER(FILE), c_long, c_int]
-ftell = _libraries['/usr/lib/libavcodec.so'].ftell
-ftell.restype = c_long
-ftell.argtypes = [POINTER(FILE)]
-rewind = _libraries['/usr/lib/libavcodec.so'].rewind
-rewind.restype = None
-rewind.argtypes = [POINTER(FILE)]
-fseeko = _libraries['/usr/lib/libavcodec.so'].fseeko
-fseeko.restype = c_int
-fseeko.argtypes = [POINTER(FILE), __off_t, c_int]
-ftello = _libraries['/usr/lib/libavcodec.so'].ftello
-ftello.restype = __off_t
-ftello.argtypes = [POINTER(FILE)]
-fgetpos = _libraries['/usr/lib/libavcodec.so'].fgetpos
-fgetpos.restype = c_int
-fgetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]
-fsetpos = _libraries['/usr/lib/libavcodec.so'].fsetpos
-fsetpos.restype = c_int
-fsetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]
-fseeko64 = _libraries['/usr/lib/libavcodec.so'].fseeko64
-fseeko64.restype = c_int
-fseeko64.argtypes = [POINTER(FILE), __off64_t, c_int]
-ftello64 = _libraries['/usr/lib/libavcodec.so'].ftello64
-ftello64.restype = __off64_t
-ftello64.argtypes = [POINTER(FILE)]
-fgetpos64 = _libraries['/usr/lib/libavcodec.so'].fgetpos64
-fgetpos64.restype = c_int
-fgetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]
-fsetpos64 = _libraries['/usr/lib/libavcodec.so'].fsetpos64
-fsetpos64.restype = c_int
-fsetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]
-clearerr = _libraries['/usr/lib/libavcodec.so'].clearerr
-clearerr.restype = None
-clearerr.argtypes = [POINTER(FILE)]
-feof = _libraries['/usr/lib/libavcodec.so'].feof
-feof.restype = c_int
-feof.argtypes = [POINTER(FILE)]
-ferror = _libraries['/usr/lib/libavcodec.so'].ferror
-ferror.restype = c_int
-ferror.argtypes = [POINTER(FILE)]
-clearerr_unlocked = _libraries['/usr/lib/libavcodec.so'].clearerr_unlocked
-clearerr_unlocked.restype = None
-clearerr_unlocked.argtypes = [POINTER(FILE)]
-perror = _libraries['/usr/lib/libavcodec.so'].perror
-perror.restype = None
-perror.argtypes = [STRING]
-fileno = _libraries['/usr/lib/libavcodec.so'].fileno
-fileno.restype = c_int
-fileno.argtypes = [POINTER(FILE)]
-fileno_unlocked = _libraries['/usr/lib/libavcodec.so'].fileno_unlocked
-fileno_unlocked.restype = c_int
-fileno_unlocked.argtypes = [POINTER(FILE)]
-popen = _libraries['/usr/lib/libavcodec.so'].popen
-popen.restype = POINTER(FILE)
-popen.argtypes = [STRING, STRING]
-pclose = _libraries['/usr/lib/libavcodec.so'].pclose
-pclose.restype = c_int
-pclose.argtypes = [POINTER(FILE)]
-ctermid = _libraries['/usr/lib/libavcodec.so'].ctermid
-ctermid.restype = STRING
-ctermid.argtypes = [STRING]
-cuserid = _libraries['/usr/lib/libavcodec.so'].cuserid
-cuserid.restype = STRING
-cuserid.argtypes = [STRING]
-obstack._fields_ = [
-]
-flockfile = _libraries['/usr/lib/libavcodec.so'].flockfile
-flockfile.restype = None
-flockfile.argtypes = [POINTER(FILE)]
-ftrylockfile = _libraries['/usr/lib/libavcodec.so'].ftrylockfile
-ftrylockfile.restype = c_int
-ftrylockfile.argtypes = [POINTER(FILE)]
-funlockfile = _libraries['/usr/lib/libavcodec.so'].funlockfile
-funlockfile.restype = None
-funlockfile.argtypes = [POINTER(FILE)]
-class div_t(Structure):
-    pass
-div_t._fields_ = [
-    ('quot', c_int),
-    ('rem', c_int),
-]
-class ldiv_t(Structure):
-    pass
-ldiv_t._fields_ = [
-    ('quot', c_long),
-    ('rem', c_long),
-]
-class lldiv_t(Structure):
-    pass
-lldiv_t._fields_ = [
-    ('quot', c_longlong),
-    ('rem', c_longlong),
-]
-__ctype_get_mb_cur_max = _libraries['/usr/lib/libavcodec.so'].__ctype_get_mb_cur_max
-__ctype_get_mb_cur_max.restype = size_t
-__ctype_get_mb_cur_max.argtypes = []
-strtod = _libraries['/usr/lib/libavcodec.so'].strtod
-strtod.restype = c_double
-strtod.argtypes = [STRING, POINTER(STRING)]
-strtof = _libraries['/usr/lib/libavcodec.so'].strtof
-strtof.restype = c_float
-strtof.argtypes = [STRING, POINTER(STRING)]
-strtold = _libraries['/usr/lib/libavcodec.so'].strtold
-strtold.restype = c_longdouble
-strtold.argtypes = [STRING, POINTER(STRING)]
-strtol = _libraries['/usr/lib/libavcodec.so'].strtol
-strtol.restype = c_long
-strtol.argtypes = [STRING, POINTER(STRING), c_int]
-strtoul = _libraries['/usr/lib/libavcodec.so'].strtoul
-strtoul.restype = c_ulong
-strtoul.argtypes = [STRING, POINTER(STRING), c_int]
-strtoq = _libraries['/usr/lib/libavcodec.so'].strtoq
-strtoq.restype = c_longlong
-strtoq.argtypes = [STRING, POINTER(STRING), c_int]
-strtouq = _libraries['/usr/lib/libavcodec.so'].strtouq
-strtouq.restype = c_ulonglong
-strtouq.argtypes = [STRING, POINTER(STRING), c_int]
-strtoll = _libraries['/usr/lib/libavcodec.so'].strtoll
-strtoll.restype = c_longlong
-strtoll.argtypes = [STRING, POINTER(STRING), c_int]
-strtoull = _libraries['/usr/lib/libavcodec.so'].strtoull
-strtoull.restype = c_ulonglong
-strtoull.argtypes = [STRING, POINTER(STRING), c_int]
-class __locale_struct(Structure):
-    pass
-__locale_t = POINTER(__locale_struct)
-strtol_l = _libraries['/usr/lib/libavcodec.so'].strtol_l
-strtol_l.restype = c_long
-strtol_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtoul_l = _libraries['/usr/lib/libavcodec.so'].strtoul_l
-strtoul_l.restype = c_ulong
-strtoul_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtoll_l = _libraries['/usr/lib/libavcodec.so'].strtoll_l
-strtoll_l.restype = c_longlong
-strtoll_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtoull_l = _libraries['/usr/lib/libavcodec.so'].strtoull_l
-strtoull_l.restype = c_ulonglong
-strtoull_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtod_l = _libraries['/usr/lib/libavcodec.so'].strtod_l
-strtod_l.restype = c_double
-strtod_l.argtypes = [STRING, POINTER(STRING), __locale_t]
-strtof_l = _libraries['/usr/lib/libavcodec.so'].strtof_l
-strtof_l.restype = c_float
-strtof_l.argtypes = [STRING, POINTER(STRING), __locale_t]
-strtold_l = _libraries['/usr/lib/libavcodec.so'].strtold_l
-strtold_l.restype = c_longdouble
-strtold_l.argtypes = [STRING, POINTER(STRING), __locale_t]
-atoi = _libraries['/usr/lib/libavcodec.so'].atoi
-atoi.restype = c_int
-atoi.argtypes = [STRING]
-atol = _libraries['/usr/lib/libavcodec.so'].atol
-atol.restype = c_long
-atol.argtypes = [STRING]
-atoll = _libraries['/usr/lib/libavcodec.so'].atoll
-atoll.restype = c_longlong
-atoll.argtypes = [STRING]
-l64a = _libraries['/usr/lib/libavcodec.so'].l64a
-l64a.restype = STRING
-l64a.argtypes = [c_long]
-a64l = _libraries['/usr/lib/libavcodec.so'].a64l
-a64l.restype = c_long
-a64l.argtypes = [STRING]
-random = _libraries['/usr/lib/libavcodec.so'].random
-random.restype = c_long
-random.argtypes = []
-srandom = _libraries['/usr/lib/libavcodec.so'].srandom
-srandom.restype = None
-srandom.argtypes = [c_uint]
-initstate = _libraries['/usr/lib/libavcodec.so'].initstate
-initstate.restype = STRING
-initstate.argtypes = [c_uint, STRING, size_t]
-setstate = _libraries['/usr/lib/libavcodec.so'].setstate
-setstate.restype = STRING
-setstate.argtypes = [STRING]
-class random_data(Structure):
-    pass
-random_data._fields_ = [
-    ('fptr', POINTER(int32_t)),
-    ('rptr', POINTER(int32_t)),
-    ('state', POINTER(int32_t)),
-    ('rand_type', c_int),
-    ('rand_deg', c_int),
-    ('rand_sep', c_int),
-    ('end_ptr', POINTER(int32_t)),
-]
-random_r = _libraries['/usr/lib/libavcodec.so'].random_r
-random_r.restype = c_int
-random_r.argtypes = [POINTER(random_data), POINTER(int32_t)]
-srandom_r = _libraries['/usr/lib/libavcodec.so'].srandom_r
-srandom_r.restype = c_int
-srandom_r.argtypes = [c_uint, POINTER(random_data)]
-initstate_r = _libraries['/usr/lib/libavcodec.so'].initstate_r
-initstate_r.restype = c_int
-initstate_r.argtypes = [c_uint, STRING, size_t, POINTER(random_data)]
-setstate_r = _libraries['/usr/lib/libavcodec.so'].setstate_r
-setstate_r.restype = c_int
-setstate_r.argtypes = [STRING, POINTER(random_data)]
-rand = _libraries['/usr/lib/libavcodec.so'].rand
-rand.restype = c_int
-rand.argtypes = []
-srand = _libraries['/usr/lib/libavcodec.so'].srand
-srand.restype = None
-srand.argtypes = [c_uint]
-rand_r = _libraries['/usr/lib/libavcodec.so'].rand_r
-rand_r.restype = c_int
-rand_r.argtypes = [POINTER(c_uint)]
-drand48 = _libraries['/usr/lib/libavcodec.so'].drand48
-drand48.restype = c_double
-drand48.argtypes = []
-erand48 = _libraries['/usr/lib/libavcodec.so'].erand48
-erand48.restype = c_double
-erand48.argtypes = [POINTER(c_ushort)]
-lrand48 = _libraries['/usr/lib/libavcodec.so'].lrand48
-lrand48.restype = c_long
-lrand48.argtypes = []
-nrand48 = _libraries['/usr/lib/libavcodec.so'].nrand48
-nrand48.restype = c_long
-nrand48.argtypes = [POINTER(c_ushort)]
-mrand48 = _libraries['/usr/lib/libavcodec.so'].mrand48
-mrand48.restype = c_long
-mrand48.argtypes = []
-jrand48 = _libraries['/usr/lib/libavcodec.so'].jrand48
-jrand48.restype = c_long
-jrand48.argtypes = [POINTER(c_ushort)]
-srand48 = _libraries['/usr/lib/libavcodec.so'].srand48
-srand48.restype = None
-srand48.argtypes = [c_long]
-seed48 = _libraries['/usr/lib/libavcodec.so'].seed48
-seed48.restype = POINTER(c_ushort)
-seed48.argtypes = [POINTER(c_ushort)]
-lcong48 = _libraries['/usr/lib/libavcodec.so'].lcong48
-lcong48.restype = None
-lcong48.argtypes = [POINTER(c_ushort)]
-class drand48_data(Structure):
-    pass
-drand48_data._fields_ = [
-    ('__x', c_ushort * 3),
-    ('__old_x', c_ushort * 3),
-    ('__c', c_ushort),
-    ('__init', c_ushort),
-    ('__a', c_ulonglong),
-]
-drand48_r = _libraries['/usr/lib/libavcodec.so'].drand48_r
-drand48_r.restype = c_int
-drand48_r.argtypes = [POINTER(drand48_data), POINTER(c_double)]
-erand48_r = _libraries['/usr/lib/libavcodec.so'].erand48_r
-erand48_r.restype = c_int
-erand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_double)]
-lrand48_r = _libraries['/usr/lib/libavcodec.so'].lrand48_r
-lrand48_r.restype = c_int
-lrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]
-nrand48_r = _libraries['/usr/lib/libavcodec.so'].nrand48_r
-nrand48_r.restype = c_int
-nrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]
-mrand48_r = _libraries['/usr/lib/libavcodec.so'].mrand48_r
-mrand48_r.restype = c_int
-mrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]
-jrand48_r = _libraries['/usr/lib/libavcodec.so'].jrand48_r
-jrand48_r.restype = c_int
-jrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]
-srand48_r = _libraries['/usr/lib/libavcodec.so'].srand48_r
-srand48_r.restype = c_int
-srand48_r.argtypes = [c_long, POINTER(drand48_data)]
-seed48_r = _libraries['/usr/lib/libavcodec.so'].seed48_r
-seed48_r.restype = c_int
-seed48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]
-lcong48_r = _libraries['/usr/lib/libavcodec.so'].lcong48_r
-lcong48_r.restype = c_int
-lcong48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]
-malloc = _libraries['/usr/lib/libavcodec.so'].malloc
-malloc.restype = c_void_p
-malloc.argtypes = [size_t]
-calloc = _libraries['/usr/lib/libavcodec.so'].calloc
-calloc.restype = c_void_p
-calloc.argtypes = [size_t, size_t]
-realloc = _libraries['/usr/lib/libavcodec.so'].realloc
-realloc.restype = c_void_p
-realloc.argtypes = [c_void_p, size_t]
-free = _libraries['/usr/lib/libavcodec.so'].free
-free.restype = None
-free.argtypes = [c_void_p]
-cfree = _libraries['/usr/lib/libavcodec.so'].cfree
-cfree.restype = None
-cfree.argtypes = [c_void_p]
-valloc = _libraries['/usr/lib/libavcodec.so'].valloc
-valloc.restype = c_void_p
-valloc.argtypes = [size_t]
-posix_memalign = _libraries['/usr/lib/libavcodec.so'].posix_memalign
-posix_memalign.restype = c_int
-posix_memalign.argtypes = [POINTER(c_void_p), size_t, size_t]
-aligned_alloc = _libraries['/usr/lib/libavcodec.so'].aligned_alloc
-aligned_alloc.restype = c_void_p
-aligned_alloc.argtypes = [size_t, size_t]
-abort = _libraries['/usr/lib/libavcodec.so'].abort
-abort.restype = None
-abort.argtypes = []
-on_exit = _libraries['/usr/lib/libavcodec.so'].on_exit
-on_exit.restype = c_int
-on_exit.argtypes = [CFUNCTYPE(None, c_int, c_void_p), c_void_p]
-exit = _libraries['/usr/lib/libavcodec.so'].exit
-exit.restype = None
-exit.argtypes = [c_int]
-quick_exit = _libraries['/usr/lib/libavcodec.so'].quick_exit
-quick_exit.restype = None
-quick_exit.argtypes = [c_int]
-_Exit = _libraries['/usr/lib/libavcodec.so']._Exit
-_Exit.restype = None
-_Exit.argtypes = [c_int]
-getenv = _libraries['/usr/lib/libavcodec.so'].getenv
-getenv.restype = STRING
-getenv.argtypes = [STRING]
-secure_getenv = _libraries['/usr/lib/libavcodec.so'].secure_getenv
-secure_getenv.restype = STRING
-secure_getenv.argtypes = [STRING]
-putenv = _libraries['/usr/lib/libavcodec.so'].putenv
-putenv.restype = c_int
-putenv.argtypes = [STRING]
-setenv = _libraries['/usr/lib/libavcodec.so'].setenv
-setenv.restype = c_int
-setenv.argtypes = [STRING, STRING, c_int]
-unsetenv = _libraries['/usr/lib/libavcodec.so'].unsetenv
-unsetenv.restype = c_int
-unsetenv.argtypes = [STRING]
-clearenv = _libraries['/usr/lib/libavcodec.so'].clearenv
-clearenv.restype = c_int
-clearenv.argtypes = []
-mktemp = _libraries['/usr/lib/libavcodec.so'].mktemp
-mktemp.restype = STRING
-mktemp.argtypes = [STRING]
-mkstemp = _libraries['/usr/lib/libavcodec.so'].mkstemp
-mkstemp.restype = c_int
-mkstemp.argtypes = [STRING]
-mkstemp64 = _libraries['/usr/lib/libavcodec.so'].mkstemp64
-mkstemp64.restype = c_int
-mkstemp64.argtypes = [STRING]
-mkstemps = _libraries['/usr/lib/libavcodec.so'].mkstemps
-mkstemps.restype = c_int
-mkstemps.argtypes = [STRING, c_int]
-mkstemps64 = _libraries['/usr/lib/libavcodec.so'].mkstemps64
-mkstemps64.restype = c_int
-mkstemps64.argtypes = [STRING, c_int]
-mkdtemp = _libraries['/usr/lib/libavcodec.so'].mkdtemp
-mkdtemp.restype = STRING
-mkdtemp.argtypes = [STRING]
-mkostemp = _libraries['/usr/lib/libavcodec.so'].mkostemp
-mkostemp.restype = c_int
-mkostemp.argtypes = [STRING, c_int]
-mkostemp64 = _libraries['/usr/lib/libavcodec.so'].mkostemp64
-mkostemp64.restype = c_int
-mkostemp64.argtypes = [STRING, c_int]
-mkostemps = _libraries['/usr/lib/libavcodec.so'].mkostemps
-mkostemps.restype = c_int
-mkostemps.argtypes = [STRING, c_int, c_int]
-mkostemps64 = _libraries['/usr/lib/libavcodec.so'].mkostemps64
-mkostemps64.restype = c_int
-mkostemps64.argtypes = [STRING, c_int, c_int]
-system = _libraries['/usr/lib/libavcodec.so'].system
-system.restype = c_int
-system.argtypes = [STRING]
-canonicalize_file_name = _libraries['/usr/lib/libavcodec.so'].canonicalize_file_name
-canonicalize_file_name.restype = STRING
-canonicalize_file_name.argtypes = [STRING]
 __compar_fn_t = CFUNCTYPE(c_int, c_void_p, c_void_p)
 comparison_fn_t = __compar_fn_t
 __compar_d_fn_t = CFUNCTYPE(c_int, c_void_p, c_void_p, c_void_p)
-bsearch = _libraries['/usr/lib/libavcodec.so'].bsearch
-bsearch.restype = c_void_p
-bsearch.argtypes = [c_void_p, c_void_p, size_t, size_t, __compar_fn_t]
-qsort = _libraries['/usr/lib/libavcodec.so'].qsort
-qsort.restype = None
-qsort.argtypes = [c_void_p, size_t, size_t, __compar_fn_t]
-qsort_r = _libraries['/usr/lib/libavcodec.so'].qsort_r
-qsort_r.restype = None
-qsort_r.argtypes = [c_void_p, size_t, size_t, __compar_d_fn_t, c_void_p]
-abs = _libraries['/usr/lib/libavcodec.so'].abs
-abs.restype = c_int
-abs.argtypes = [c_int]
-labs = _libraries['/usr/lib/libavcodec.so'].labs
-labs.restype = c_long
-labs.argtypes = [c_long]
-llabs = _libraries['/usr/lib/libavcodec.so'].llabs
-llabs.restype = c_longlong
-llabs.argtypes = [c_longlong]
-div = _libraries['/usr/lib/libavcodec.so'].div
-div.restype = div_t
-div.argtypes = [c_int, c_int]
-ldiv = _libraries['/usr/lib/libavcodec.so'].ldiv
-ldiv.restype = ldiv_t
-ldiv.argtypes = [c_long, c_long]
-lldiv = _libraries['/usr/lib/libavcodec.so'].lldiv
-lldiv.restype = lldiv_t
-lldiv.argtypes = [c_longlong, c_longlong]
-ecvt = _libraries['/usr/lib/libavcodec.so'].ecvt
-ecvt.restype = STRING
-ecvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]
-fcvt = _libraries['/usr/lib/libavcodec.so'].fcvt
-fcvt.restype = STRING
-fcvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]
-gcvt = _libraries['/usr/lib/libavcodec.so'].gcvt
-gcvt.restype = STRING
-gcvt.argtypes = [c_double, c_int, STRING]
-qecvt = _libraries['/usr/lib/libavcodec.so'].qecvt
-qecvt.restype = STRING
-qecvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]
-qfcvt = _libraries['/usr/lib/libavcodec.so'].qfcvt
-qfcvt.restype = STRING
-qfcvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]
-qgcvt = _libraries['/usr/lib/libavcodec.so'].qgcvt
-qgcvt.restype = STRING
-qgcvt.argtypes = [c_longdouble, c_int, STRING]
-ecvt_r = _libraries['/usr/lib/libavcodec.so'].ecvt_r
-ecvt_r.restype = c_int
-ecvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-fcvt_r = _libraries['/usr/lib/libavcodec.so'].fcvt_r
-fcvt_r.restype = c_int
-fcvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-qecvt_r = _libraries['/usr/lib/libavcodec.so'].qecvt_r
-qecvt_r.restype = c_int
-qecvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-qfcvt_r = _libraries['/usr/lib/libavcodec.so'].qfcvt_r
-qfcvt_r.restype = c_int
-qfcvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-mblen = _libraries['/usr/lib/libavcodec.so'].mblen
-mblen.restype = c_int
-mblen.argtypes = [STRING, size_t]
-mbtowc = _libraries['/usr/lib/libavcodec.so'].mbtowc
-mbtowc.restype = c_int
-mbtowc.argtypes = [WSTRING, STRING, size_t]
-rpmatch = _libraries['/usr/lib/libavcodec.so'].rpmatch
-rpmatch.restype = c_int
-rpmatch.argtypes = [STRING]
-getsubopt = _libraries['/usr/lib/libavcodec.so'].getsubopt
-getsubopt.restype = c_int
-getsubopt.argtypes = [POINTER(STRING), POINTER(STRING), POINTER(STRING)]
-posix_openpt = _libraries['/usr/lib/libavcodec.so'].posix_openpt
-posix_openpt.restype = c_int
-posix_openpt.argtypes = [c_int]
-grantpt = _libraries['/usr/lib/libavcodec.so'].grantpt
-grantpt.restype = c_int
-grantpt.argtypes = [c_int]
-unlockpt = _libraries['/usr/lib/libavcodec.so'].unlockpt
-unlockpt.restype = c_int
-unlockpt.argtypes = [c_int]
-ptsname = _libraries['/usr/lib/libavcodec.so'].ptsname
-ptsname.restype = STRING
-ptsname.argtypes = [c_int]
-getpt = _libraries['/usr/lib/libavcodec.so'].getpt
-getpt.restype = c_int
-getpt.argtypes = []
-getloadavg = _libraries['/usr/lib/libavcodec.so'].getloadavg
-getloadavg.restype = c_int
-getloadavg.argtypes = [POINTER(c_double), c_int]
-memccpy = _libraries['/usr/lib/libavcodec.so'].memccpy
-memccpy.restype = c_void_p
-memccpy.argtypes = [c_void_p, c_void_p, c_int, size_t]
-memcmp = _libraries['/usr/lib/libavcodec.so'].memcmp
-memcmp.restype = c_int
-memcmp.argtypes = [c_void_p, c_void_p, size_t]
-memchr = _libraries['/usr/lib/libavcodec.so'].memchr
-memchr.restype = c_void_p
-memchr.argtypes = [c_void_p, c_int, size_t]
-memchr = _libraries['/usr/lib/libavcodec.so'].memchr
-memchr.restype = c_void_p
-memchr.argtypes = [c_void_p, c_int, size_t]
-rawmemchr = _libraries['/usr/lib/libavcodec.so'].rawmemchr
-rawmemchr.restype = c_void_p
-rawmemchr.argtypes = [c_void_p, c_int]
-rawmemchr = _libraries['/usr/lib/libavcodec.so'].rawmemchr
-rawmemchr.restype = c_void_p
-rawmemchr.argtypes = [c_void_p, c_int]
-memrchr = _libraries['/usr/lib/libavcodec.so'].memrchr
-memrchr.restype = c_void_p
-memrchr.argtypes = [c_void_p, c_int, size_t]
-memrchr = _libraries['/usr/lib/libavcodec.so'].memrchr
-memrchr.restype = c_void_p
-memrchr.argtypes = [c_void_p, c_int, size_t]
-strcmp = _libraries['/usr/lib/libavcodec.so'].strcmp
-strcmp.restype = c_int
-strcmp.argtypes = [STRING, STRING]
-strncmp = _libraries['/usr/lib/libavcodec.so'].strncmp
-strncmp.restype = c_int
-strncmp.argtypes = [STRING, STRING, size_t]
-strcoll = _libraries['/usr/lib/libavcodec.so'].strcoll
-strcoll.restype = c_int
-strcoll.argtypes = [STRING, STRING]
-strxfrm = _libraries['/usr/lib/libavcodec.so'].strxfrm
-strxfrm.restype = size_t
-strxfrm.argtypes = [STRING, STRING, size_t]
-strcoll_l = _libraries['/usr/lib/libavcodec.so'].strcoll_l
-strcoll_l.restype = c_int
-strcoll_l.argtypes = [STRING, STRING, __locale_t]
-strxfrm_l = _libraries['/usr/lib/libavcodec.so'].strxfrm_l
-strxfrm_l.restype = size_t
-strxfrm_l.argtypes = [STRING, STRING, size_t, __locale_t]
-strdup = _libraries['/usr/lib/libavcodec.so'].strdup
-strdup.restype = STRING
-strdup.argtypes = [STRING]
-strndup = _libraries['/usr/lib/libavcodec.so'].strndup
-strndup.restype = STRING
-strndup.argtypes = [STRING, size_t]
-strchr = _libraries['/usr/lib/libavcodec.so'].strchr
-strchr.restype = STRING
-strchr.argtypes = [STRING, c_int]
-strchr = _libraries['/usr/lib/libavcodec.so'].strchr
-strchr.restype = STRING
-strchr.argtypes = [STRING, c_int]
-strrchr = _libraries['/usr/lib/libavcodec.so'].strrchr
-strrchr.restype = STRING
-strrchr.argtypes = [STRING, c_int]
-strrchr = _libraries['/usr/lib/libavcodec.so'].strrchr
-strrchr.restype = STRING
-strrchr.argtypes = [STRING, c_int]
-strchrnul = _libraries['/usr/lib/libavcodec.so'].strchrnul
-strchrnul.restype = STRING
-strchrnul.argtypes = [STRING, c_int]
-strchrnul = _libraries['/usr/lib/libavcodec.so'].strchrnul
-strchrnul.restype = STRING
-strchrnul.argtypes = [STRING, c_int]
-strcspn = _libraries['/usr/lib/libavcodec.so'].strcspn
-strcspn.restype = size_t
-strcspn.argtypes = [STRING, STRING]
-strspn = _libraries['/usr/lib/libavcodec.so'].strspn
-strspn.restype = size_t
-strspn.argtypes = [STRING, STRING]
-strpbrk = _libraries['/usr/lib/libavcodec.so'].strpbrk
-strpbrk.restype = STRING
-strpbrk.argtypes = [STRING, STRING]
-strpbrk = _libraries['/usr/lib/libavcodec.so'].strpbrk
-strpbrk.restype = STRING
-strpbrk.argtypes = [STRING, STRING]
-strstr = _libraries['/usr/lib/libavcodec.so'].strstr
-strstr.restype = STRING
-strstr.argtypes = [STRING, STRING]
-strstr = _libraries['/usr/lib/libavcodec.so'].strstr
-strstr.restype = STRING
-strstr.argtypes = [STRING, STRING]
-strtok = _libraries['/usr/lib/libavcodec.so'].strtok
-strtok.restype = STRING
-strtok.argtypes = [STRING, STRING]
-__strtok_r = _libraries['/usr/lib/libavcodec.so'].__strtok_r
-__strtok_r.restype = STRING
-__strtok_r.argtypes = [STRING, STRING, POINTER(STRING)]
-strtok_r = _libraries['/usr/lib/libavcodec.so'].strtok_r
-strtok_r.restype = STRING
-strtok_r.argtypes = [STRING, STRING, POINTER(STRING)]
-strcasestr = _libraries['/usr/lib/libavcodec.so'].strcasestr
-strcasestr.restype = STRING
-strcasestr.argtypes = [STRING, STRING]
-strcasestr = _libraries['/usr/lib/libavcodec.so'].strcasestr
-strcasestr.restype = STRING
-strcasestr.argtypes = [STRING, STRING]
-memmem = _libraries['/usr/lib/libavcodec.so'].memmem
-memmem.restype = c_void_p
-memmem.argtypes = [c_void_p, size_t, c_void_p, size_t]
-__mempcpy = _libraries['/usr/lib/libavcodec.so'].__mempcpy
-__mempcpy.restype = c_void_p
-__mempcpy.argtypes = [c_void_p, c_void_p, size_t]
-strlen = _libraries['/usr/lib/libavcodec.so'].strlen
-strlen.restype = size_t
-strlen.argtypes = [STRING]
-strnlen = _libraries['/usr/lib/libavcodec.so'].strnlen
-strnlen.restype = size_t
-strnlen.argtypes = [STRING, size_t]
-strerror = _libraries['/usr/lib/libavcodec.so'].strerror
-strerror.restype = STRING
-strerror.argtypes = [c_int]
-strerror_r = _libraries['/usr/lib/libavcodec.so'].strerror_r
-strerror_r.restype = STRING
-strerror_r.argtypes = [c_int, STRING, size_t]
-strerror_l = _libraries['/usr/lib/libavcodec.so'].strerror_l
-strerror_l.restype = STRING
-strerror_l.argtypes = [c_int, __locale_t]
-__bzero = _libraries['/usr/lib/libavcodec.so'].__bzero
-__bzero.restype = None
-__bzero.argtypes = [c_void_p, size_t]
-bcmp = _libraries['/usr/lib/libavcodec.so'].bcmp
-bcmp.restype = c_int
-bcmp.argtypes = [c_void_p, c_void_p, size_t]
-index = _libraries['/usr/lib/libavcodec.so'].index
-index.restype = STRING
-index.argtypes = [STRING, c_int]
-index = _libraries['/usr/lib/libavcodec.so'].index
-index.restype = STRING
-index.argtypes = [STRING, c_int]
-rindex = _libraries['/usr/lib/libavcodec.so'].rindex
-rindex.restype = STRING
-rindex.argtypes = [STRING, c_int]
-rindex = _libraries['/usr/lib/libavcodec.so'].rindex
-rindex.restype = STRING
-rindex.argtypes = [STRING, c_int]
-ffs = _libraries['/usr/lib/libavcodec.so'].ffs
-ffs.restype = c_int
-ffs.argtypes = [c_int]
-ffsl = _libraries['/usr/lib/libavcodec.so'].ffsl
-ffsl.restype = c_int
-ffsl.argtypes = [c_long]
-ffsll = _libraries['/usr/lib/libavcodec.so'].ffsll
-ffsll.restype = c_int
-ffsll.argtypes = [c_longlong]
-strcasecmp = _libraries['/usr/lib/libavcodec.so'].strcasecmp
-strcasecmp.restype = c_int
-strcasecmp.argtypes = [STRING, STRING]
-strncasecmp = _libraries['/usr/lib/libavcodec.so'].strncasecmp
-strncasecmp.restype = c_int
-strncasecmp.argtypes = [STRING, STRING, size_t]
-strcasecmp_l = _libraries['/usr/lib/libavcodec.so'].strcasecmp_l
-strcasecmp_l.restype = c_int
-strcasecmp_l.argtypes = [STRING, STRING, __locale_t]
-strncasecmp_l = _libraries['/usr/lib/libavcodec.so'].strncasecmp_l
-strncasecmp_l.restype = c_int
-strncasecmp_l.argtypes = [STRING, STRING, size_t, __locale_t]
-strsep = _libraries['/usr/lib/libavcodec.so'].strsep
-strsep.restype = STRING
-strsep.argtypes = [POINTER(STRING), STRING]
-strsignal = _libraries['/usr/lib/libavcodec.so'].strsignal
-strsignal.restype = STRING
-strsignal.argtypes = [c_int]
-__stpcpy = _libraries['/usr/lib/libavcodec.so'].__stpcpy
-__stpcpy.restype = STRING
-__stpcpy.argtypes = [STRING, STRING]
-__stpncpy = _libraries['/usr/lib/libavcodec.so'].__stpncpy
-__stpncpy.restype = STRING
-__stpncpy.argtypes = [STRING, STRING, size_t]
-strverscmp = _libraries['/usr/lib/libavcodec.so'].strverscmp
-strverscmp.restype = c_int
-strverscmp.argtypes = [STRING, STRING]
-strfry = _libraries['/usr/lib/libavcodec.so'].strfry
-strfry.restype = STRING
-strfry.argtypes = [STRING]
-memfrob = _libraries['/usr/lib/libavcodec.so'].memfrob
-memfrob.restype = c_void_p
-memfrob.argtypes = [c_void_p, size_t]
-basename = _libraries['/usr/lib/libavcodec.so'].basename
-basename.restype = STRING
-basename.argtypes = [STRING]
-basename = _libraries['/usr/lib/libavcodec.so'].basename
-basename.restype = STRING
-basename.argtypes = [STRING]
-sigset_t = __sigset_t
 __fd_mask = c_long
-class fd_set(Structure):
-    pass
-fd_set._fields_ = [
-    ('fds_bits', __fd_mask * 16),
-]
 fd_mask = __fd_mask
-select = _libraries['/usr/lib/libavcodec.so'].select
-select.restype = c_int
-select.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timeval)]
-class timespec(Structure):
-    pass
-timespec._fields_ = [
-]
-pselect = _libraries['/usr/lib/libavcodec.so'].pselect
-pselect.restype = c_int
-pselect.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timespec), POINTER(__sigset_t)]
-gnu_dev_major = _libraries['/usr/lib/libavcodec.so'].gnu_dev_major
-gnu_dev_major.restype = c_uint
-gnu_dev_major.argtypes = [c_ulonglong]
-gnu_dev_minor = _libraries['/usr/lib/libavcodec.so'].gnu_dev_minor
-gnu_dev_minor.restype = c_uint
-gnu_dev_minor.argtypes = [c_ulonglong]
-gnu_dev_makedev = _libraries['/usr/lib/libavcodec.so'].gnu_dev_makedev
-gnu_dev_makedev.restype = c_ulonglong
-gnu_dev_makedev.argtypes = [c_uint, c_uint]
 u_char = __u_char
 u_short = __u_short
 u_int = __u_int
 u_long = __u_long
 quad_t = __quad_t
 u_quad_t = __u_quad_t
-fsid_t = __fsid_t
 loff_t = __loff_t
 ino_t = __ino_t
 ino64_t = __ino64_t
@@ -7614,18 +2809,6 @@ fsfilcnt_t = __fsfilcnt_t
 blkcnt64_t = __blkcnt64_t
 fsblkcnt64_t = __fsblkcnt64_t
 fsfilcnt64_t = __fsfilcnt64_t
-class __locale_data(Structure):
-    pass
-__locale_struct._fields_ = [
-    ('__locales', POINTER(__locale_data) * 13),
-    ('__ctype_b', POINTER(c_ushort)),
-    ('__ctype_tolower', POINTER(c_int)),
-    ('__ctype_toupper', POINTER(c_int)),
-    ('__names', STRING * 13),
-]
-__locale_data._fields_ = [
-]
-locale_t = __locale_t
 ptrdiff_t = c_long
 __all__ = ['AVFMT_NOBINSEARCH', 'CODEC_ID_ADPCM_IMA_AMV', 'ETXTBSY',
            'AV_CODEC_ID_TEXT', 'math_errhandling', 'AV_ROUND_UP',
@@ -9083,3 +4266,7144 @@ __all__ = ['AVFMT_NOBINSEARCH', 'CODEC_ID_ADPCM_IMA_AMV', 'ETXTBSY',
            'FF_PROFILE_MPEG2_AAC_LOW', 'AVERROR_BUG2', 'asinhf',
            '_IOLBF', 'CODEC_ID_QDM2',
            'PIX_FMT_YUV444P14LE', 'sincosf', 'asinhl']
+
+
+# The base class, lazy names used and code that finishes defining each
+# lazy name.
+_definitions = {
+    'av_int_list_length': (None, ('av_int_list_length_for_size',),
+        'def av_int_list_length(list,term): return av_int_list_length_for_size(sizeof(*(list)), list, term) # macro'
+        ),
+    '_G_fpos_t': ('Structure', ('__mbstate_t',),
+        '_G_fpos_t._fields_ = [\n'
+        "    ('__pos', __off_t),\n"
+        "    ('__state', __mbstate_t),\n"
+        ']'
+        ),
+    '__mbstate_t': ('Structure', ('N11__mbstate_t3DOT_6E',),
+        '__mbstate_t._fields_ = [\n'
+        "    ('__count', c_int),\n"
+        "    ('__value', N11__mbstate_t3DOT_6E),\n"
+        ']'
+        ),
+    'N11__mbstate_t3DOT_6E': ('Union', (),
+        'N11__mbstate_t3DOT_6E._fields_ = [\n'
+        "    ('__wch', c_uint),\n"
+        "    ('__wchb', c_char * 4),\n"
+        ']'
+        ),
+    '_IO_fpos_t': (None, ('_G_fpos_t',),
+        '_IO_fpos_t = _G_fpos_t # alias'
+        ),
+    '_G_fpos64_t': ('Structure', ('__mbstate_t',),
+        '_G_fpos64_t._fields_ = [\n'
+        "    ('__pos', __off64_t),\n"
+        "    ('__state', __mbstate_t),\n"
+        ']'
+        ),
+    '_IO_fpos64_t': (None, ('_G_fpos64_t',),
+        '_IO_fpos64_t = _G_fpos64_t # alias'
+        ),
+    'major': (None, ('gnu_dev_major',),
+        'def major(dev): return gnu_dev_major (dev) # macro'
+        ),
+    'minor': (None, ('gnu_dev_minor',),
+        'def minor(dev): return gnu_dev_minor (dev) # macro'
+        ),
+    'getc': (None, ('FILE', '_IO_getc'),
+        'def getc(_fp): return _IO_getc (_fp) # macro\n'
+        "getc = _libraries['/usr/lib/libavcodec.so'].getc\n"
+        'getc.restype = c_int\n'
+        'getc.argtypes = [POINTER(FILE)]'
+        ),
+    '__va_list_tag': ('Structure', (),
+        '__va_list_tag._fields_ = [\n'
+        ']'
+        ),
+    '__gnuc_va_list': (None, ('__va_list_tag',),
+        '__gnuc_va_list = __va_list_tag * 1'
+        ),
+    '_G_va_list': (None, ('__gnuc_va_list',),
+        '_G_va_list = __gnuc_va_list # alias'
+        ),
+    'makedev': (None, ('gnu_dev_makedev',),
+        'def makedev(maj,min): return gnu_dev_makedev (maj, min) # macro'
+        ),
+    '_IO_FILE': ('Structure', ('_IO_marker',),
+        '_IO_FILE._fields_ = [\n'
+        "    ('_flags', c_int),\n"
+        "    ('_IO_read_ptr', STRING),\n"
+        "    ('_IO_read_end', STRING),\n"
+        "    ('_IO_read_base', STRING),\n"
+        "    ('_IO_write_base', STRING),\n"
+        "    ('_IO_write_ptr', STRING),\n"
+        "    ('_IO_write_end', STRING),\n"
+        "    ('_IO_buf_base', STRING),\n"
+        "    ('_IO_buf_end', STRING),\n"
+        "    ('_IO_save_base', STRING),\n"
+        "    ('_IO_backup_base', STRING),\n"
+        "    ('_IO_save_end', STRING),\n"
+        "    ('_markers', POINTER(_IO_marker)),\n"
+        "    ('_chain', POINTER(_IO_FILE)),\n"
+        "    ('_fileno', c_int),\n"
+        "    ('_flags2', c_int),\n"
+        "    ('_old_offset', __off_t),\n"
+        "    ('_cur_column', c_ushort),\n"
+        "    ('_vtable_offset', c_byte),\n"
+        "    ('_shortbuf', c_char * 1),\n"
+        "    ('_lock', POINTER(_IO_lock_t)),\n"
+        "    ('_offset', __off64_t),\n"
+        "    ('__pad1', c_void_p),\n"
+        "    ('__pad2', c_void_p),\n"
+        "    ('__pad3', c_void_p),\n"
+        "    ('__pad4', c_void_p),\n"
+        "    ('__pad5', size_t),\n"
+        "    ('_mode', c_int),\n"
+        "    ('_unused2', c_char * 20),\n"
+        ']'
+        ),
+    'stdout': (None, ('_IO_FILE',),
+        "stdout = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libavcodec.so'], 'stdout')\n"
+        'stdout = stdout # alias'
+        ),
+    'putc': (None, ('FILE', '_IO_putc'),
+        'def putc(_ch,_fp): return _IO_putc (_ch, _fp) # macro\n'
+        "putc = _libraries['/usr/lib/libavcodec.so'].putc\n"
+        'putc.restype = c_int\n'
+        'putc.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    '_IO_va_list': (None, ('__gnuc_va_list',),
+        '_IO_va_list = __gnuc_va_list # alias'
+        ),
+    'stdin': (None, ('_IO_FILE',),
+        "stdin = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libavcodec.so'], 'stdin')\n"
+        'stdin = stdin # alias'
+        ),
+    'stderr': (None, ('_IO_FILE',),
+        "stderr = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libavcodec.so'], 'stderr')\n"
+        'stderr = stderr # alias'
+        ),
+    'errno': (None, (),
+        "errno = (c_int).in_dll(_libraries['/usr/lib/libavcodec.so'], 'errno')"
+        ),
+    '__errno_location': (None, (),
+        "__errno_location = _libraries['/usr/lib/libavcodec.so'].__errno_location\n"
+        '__errno_location.restype = POINTER(c_int)\n'
+        '__errno_location.argtypes = []'
+        ),
+    'acosl': (None, (),
+        "acosl = _libraries['/usr/lib/libavcodec.so'].acosl\n"
+        'acosl.restype = c_longdouble\n'
+        'acosl.argtypes = [c_longdouble]'
+        ),
+    'acos': (None, (),
+        "acos = _libraries['/usr/lib/libavcodec.so'].acos\n"
+        'acos.restype = c_double\n'
+        'acos.argtypes = [c_double]'
+        ),
+    'acosf': (None, (),
+        "acosf = _libraries['/usr/lib/libavcodec.so'].acosf\n"
+        'acosf.restype = c_float\n'
+        'acosf.argtypes = [c_float]'
+        ),
+    'asin': (None, (),
+        "asin = _libraries['/usr/lib/libavcodec.so'].asin\n"
+        'asin.restype = c_double\n'
+        'asin.argtypes = [c_double]'
+        ),
+    'asinf': (None, (),
+        "asinf = _libraries['/usr/lib/libavcodec.so'].asinf\n"
+        'asinf.restype = c_float\n'
+        'asinf.argtypes = [c_float]'
+        ),
+    'asinl': (None, (),
+        "asinl = _libraries['/usr/lib/libavcodec.so'].asinl\n"
+        'asinl.restype = c_longdouble\n'
+        'asinl.argtypes = [c_longdouble]'
+        ),
+    'atanf': (None, (),
+        "atanf = _libraries['/usr/lib/libavcodec.so'].atanf\n"
+        'atanf.restype = c_float\n'
+        'atanf.argtypes = [c_float]'
+        ),
+    'atanl': (None, (),
+        "atanl = _libraries['/usr/lib/libavcodec.so'].atanl\n"
+        'atanl.restype = c_longdouble\n'
+        'atanl.argtypes = [c_longdouble]'
+        ),
+    'atan': (None, (),
+        "atan = _libraries['/usr/lib/libavcodec.so'].atan\n"
+        'atan.restype = c_double\n'
+        'atan.argtypes = [c_double]'
+        ),
+    'atan2f': (None, (),
+        "atan2f = _libraries['/usr/lib/libavcodec.so'].atan2f\n"
+        'atan2f.restype = c_float\n'
+        'atan2f.argtypes = [c_float, c_float]'
+        ),
+    'atan2l': (None, (),
+        "atan2l = _libraries['/usr/lib/libavcodec.so'].atan2l\n"
+        'atan2l.restype = c_longdouble\n'
+        'atan2l.argtypes = [c_longdouble, c_longdouble]'
+        ),
+    'atan2': (None, (),
+        "atan2 = _libraries['/usr/lib/libavcodec.so'].atan2\n"
+        'atan2.restype = c_double\n'
+        'atan2.argtypes = [c_double, c_double]'
+        ),
+    'cos': (None, (),
+        "cos = _libraries['/usr/lib/libavcodec.so'].cos\n"
+        'cos.restype = c_double\n'
+        'cos.argtypes = [c_double]'
+        ),
+    'cosl': (None, (),
+        "cosl = _libraries['/usr/lib/libavcodec.so'].cosl\n"
+        'cosl.restype = c_longdouble\n'
+        'cosl.argtypes = [c_longdouble]'
+        ),
+    'cosf': (None, (),
+        "cosf = _libraries['/usr/lib/libavcodec.so'].cosf\n"
+        'cosf.restype = c_float\n'
+        'cosf.argtypes = [c_float]'
+        ),
+    'sinl': (None, (),
+        "sinl = _libraries['/usr/lib/libavcodec.so'].sinl\n"
+        'sinl.restype = c_longdouble\n'
+        'sinl.argtypes = [c_longdouble]'
+        ),
+    'sinf': (None, (),
+        "sinf = _libraries['/usr/lib/libavcodec.so'].sinf\n"
+        'sinf.restype = c_float\n'
+        'sinf.argtypes = [c_float]'
+        ),
+    'sin': (None, (),
+        "sin = _libraries['/usr/lib/libavcodec.so'].sin\n"
+        'sin.restype = c_double\n'
+        'sin.argtypes = [c_double]'
+        ),
+    'tanl': (None, (),
+        "tanl = _libraries['/usr/lib/libavcodec.so'].tanl\n"
+        'tanl.restype = c_longdouble\n'
+        'tanl.argtypes = [c_longdouble]'
+        ),
+    'tanf': (None, (),
+        "tanf = _libraries['/usr/lib/libavcodec.so'].tanf\n"
+        'tanf.restype = c_float\n'
+        'tanf.argtypes = [c_float]'
+        ),
+    'tan': (None, (),
+        "tan = _libraries['/usr/lib/libavcodec.so'].tan\n"
+        'tan.restype = c_double\n'
+        'tan.argtypes = [c_double]'
+        ),
+    'coshl': (None, (),
+        "coshl = _libraries['/usr/lib/libavcodec.so'].coshl\n"
+        'coshl.restype = c_longdouble\n'
+        'coshl.argtypes = [c_longdouble]'
+        ),
+    'coshf': (None, (),
+        "coshf = _libraries['/usr/lib/libavcodec.so'].coshf\n"
+        'coshf.restype = c_float\n'
+        'coshf.argtypes = [c_float]'
+        ),
+    'cosh': (None, (),
+        "cosh = _libraries['/usr/lib/libavcodec.so'].cosh\n"
+        'cosh.restype = c_double\n'
+        'cosh.argtypes = [c_double]'
+        ),
+    'sinhl': (None, (),
+        "sinhl = _libraries['/usr/lib/libavcodec.so'].sinhl\n"
+        'sinhl.restype = c_longdouble\n'
+        'sinhl.argtypes = [c_longdouble]'
+        ),
+    'sinh': (None, (),
+        "sinh = _libraries['/usr/lib/libavcodec.so'].sinh\n"
+        'sinh.restype = c_double\n'
+        'sinh.argtypes = [c_double]'
+        ),
+    'sinhf': (None, (),
+        "sinhf = _libraries['/usr/lib/libavcodec.so'].sinhf\n"
+        'sinhf.restype = c_float\n'
+        'sinhf.argtypes = [c_float]'
+        ),
+    'tanh': (None, (),
+        "tanh = _libraries['/usr/lib/libavcodec.so'].tanh\n"
+        'tanh.restype = c_double\n'
+        'tanh.argtypes = [c_double]'
+        ),
+    'tanhl': (None, (),
+        "tanhl = _libraries['/usr/lib/libavcodec.so'].tanhl\n"
+        'tanhl.restype = c_longdouble\n'
+        'tanhl.argtypes = [c_longdouble]'
+        ),
+    'tanhf': (None, (),
+        "tanhf = _libraries['/usr/lib/libavcodec.so'].tanhf\n"
+        'tanhf.restype = c_float\n'
+        'tanhf.argtypes = [c_float]'
+        ),
+    'sincosf': (None, (),
+        "sincosf = _libraries['/usr/lib/libavcodec.so'].sincosf\n"
+        'sincosf.restype = None\n'
+        'sincosf.argtypes = [c_float, POINTER(c_float), POINTER(c_float)]'
+        ),
+    'sincos': (None, (),
+        "sincos = _libraries['/usr/lib/libavcodec.so'].sincos\n"
+        'sincos.restype = None\n'
+        'sincos.argtypes = [c_double, POINTER(c_double), POINTER(c_double)]'
+        ),
+    'acosh': (None, (),
+        "acosh = _libraries['/usr/lib/libavcodec.so'].acosh\n"
+        'acosh.restype = c_double\n'
+        'acosh.argtypes = [c_double]'
+        ),
+    'acoshf': (None, (),
+        "acoshf = _libraries['/usr/lib/libavcodec.so'].acoshf\n"
+        'acoshf.restype = c_float\n'
+        'acoshf.argtypes = [c_float]'
+        ),
+    'acoshl': (None, (),
+        "acoshl = _libraries['/usr/lib/libavcodec.so'].acoshl\n"
+        'acoshl.restype = c_longdouble\n'
+        'acoshl.argtypes = [c_longdouble]'
+        ),
+    'asinhl': (None, (),
+        "asinhl = _libraries['/usr/lib/libavcodec.so'].asinhl\n"
+        'asinhl.restype = c_longdouble\n'
+        'asinhl.argtypes = [c_longdouble]'
+        ),
+    'asinhf': (None, (),
+        "asinhf = _libraries['/usr/lib/libavcodec.so'].asinhf\n"
+        'asinhf.restype = c_float\n'
+        'asinhf.argtypes = [c_float]'
+        ),
+    'asinh': (None, (),
+        "asinh = _libraries['/usr/lib/libavcodec.so'].asinh\n"
+        'asinh.restype = c_double\n'
+        'asinh.argtypes = [c_double]'
+        ),
+    'atanhl': (None, (),
+        "atanhl = _libraries['/usr/lib/libavcodec.so'].atanhl\n"
+        'atanhl.restype = c_longdouble\n'
+        'atanhl.argtypes = [c_longdouble]'
+        ),
+    'atanh': (None, (),
+        "atanh = _libraries['/usr/lib/libavcodec.so'].atanh\n"
+        'atanh.restype = c_double\n'
+        'atanh.argtypes = [c_double]'
+        ),
+    'atanhf': (None, (),
+        "atanhf = _libraries['/usr/lib/libavcodec.so'].atanhf\n"
+        'atanhf.restype = c_float\n'
+        'atanhf.argtypes = [c_float]'
+        ),
+    'expf': (None, (),
+        "expf = _libraries['/usr/lib/libavcodec.so'].expf\n"
+        'expf.restype = c_float\n'
+        'expf.argtypes = [c_float]'
+        ),
+    'expl': (None, (),
+        "expl = _libraries['/usr/lib/libavcodec.so'].expl\n"
+        'expl.restype = c_longdouble\n'
+        'expl.argtypes = [c_longdouble]'
+        ),
+    'exp': (None, (),
+        "exp = _libraries['/usr/lib/libavcodec.so'].exp\n"
+        'exp.restype = c_double\n'
+        'exp.argtypes = [c_double]'
+        ),
+    'frexpf': (None, (),
+        "frexpf = _libraries['/usr/lib/libavcodec.so'].frexpf\n"
+        'frexpf.restype = c_float\n'
+        'frexpf.argtypes = [c_float, POINTER(c_int)]'
+        ),
+    'frexpl': (None, (),
+        "frexpl = _libraries['/usr/lib/libavcodec.so'].frexpl\n"
+        'frexpl.restype = c_longdouble\n'
+        'frexpl.argtypes = [c_longdouble, POINTER(c_int)]'
+        ),
+    'frexp': (None, (),
+        "frexp = _libraries['/usr/lib/libavcodec.so'].frexp\n"
+        'frexp.restype = c_double\n'
+        'frexp.argtypes = [c_double, POINTER(c_int)]'
+        ),
+    'ldexpl': (None, (),
+        "ldexpl = _libraries['/usr/lib/libavcodec.so'].ldexpl\n"
+        'ldexpl.restype = c_longdouble\n'
+        'ldexpl.argtypes = [c_longdouble, c_int]'
+        ),
+    'ldexp': (None, (),
+        "ldexp = _libraries['/usr/lib/libavcodec.so'].ldexp\n"
+        'ldexp.restype = c_double\n'
+        'ldexp.argtypes = [c_double, c_int]'
+        ),
+    'ldexpf': (None, (),
+        "ldexpf = _libraries['/usr/lib/libavcodec.so'].ldexpf\n"
+        'ldexpf.restype = c_float\n'
+        'ldexpf.argtypes = [c_float, c_int]'
+        ),
+    'logf': (None, (),
+        "logf = _libraries['/usr/lib/libavcodec.so'].logf\n"
+        'logf.restype = c_float\n'
+        'logf.argtypes = [c_float]'
+        ),
+    'logl': (None, (),
+        "logl = _libraries['/usr/lib/libavcodec.so'].logl\n"
+        'logl.restype = c_longdouble\n'
+        'logl.argtypes = [c_longdouble]'
+        ),
+    'log': (None, (),
+        "log = _libraries['/usr/lib/libavcodec.so'].log\n"
+        'log.restype = c_double\n'
+        'log.argtypes = [c_double]'
+        ),
+    'log10l': (None, (),
+        "log10l = _libraries['/usr/lib/libavcodec.so'].log10l\n"
+        'log10l.restype = c_longdouble\n'
+        'log10l.argtypes = [c_longdouble]'
+        ),
+    'log10f': (None, (),
+        "log10f = _libraries['/usr/lib/libavcodec.so'].log10f\n"
+        'log10f.restype = c_float\n'
+        'log10f.argtypes = [c_float]'
+        ),
+    'log10': (None, (),
+        "log10 = _libraries['/usr/lib/libavcodec.so'].log10\n"
+        'log10.restype = c_double\n'
+        'log10.argtypes = [c_double]'
+        ),
+    'modf': (None, (),
+        "modf = _libraries['/usr/lib/libavcodec.so'].modf\n"
+        'modf.restype = c_double\n'
+        'modf.argtypes = [c_double, POINTER(c_double)]'
+        ),
+    'modff': (None, (),
+        "modff = _libraries['/usr/lib/libavcodec.so'].modff\n"
+        'modff.restype = c_float\n'
+        'modff.argtypes = [c_float, POINTER(c_float)]'
+        ),
+    'exp10': (None, (),
+        "exp10 = _libraries['/usr/lib/libavcodec.so'].exp10\n"
+        'exp10.restype = c_double\n'
+        'exp10.argtypes = [c_double]'
+        ),
+    'exp10l': (None, (),
+        "exp10l = _libraries['/usr/lib/libavcodec.so'].exp10l\n"
+        'exp10l.restype = c_longdouble\n'
+        'exp10l.argtypes = [c_longdouble]'
+        ),
+    'exp10f': (None, (),
+        "exp10f = _libraries['/usr/lib/libavcodec.so'].exp10f\n"
+        'exp10f.restype = c_float\n'
+        'exp10f.argtypes = [c_float]'
+        ),
+    'pow10f': (None, (),
+        "pow10f = _libraries['/usr/lib/libavcodec.so'].pow10f\n"
+        'pow10f.restype = c_float\n'
+        'pow10f.argtypes = [c_float]'
+        ),
+    'pow10l': (None, (),
+        "pow10l = _libraries['/usr/lib/libavcodec.so'].pow10l\n"
+        'pow10l.restype = c_longdouble\n'
+        'pow10l.argtypes = [c_longdouble]'
+        ),
+    'pow10': (None, (),
+        "pow10 = _libraries['/usr/lib/libavcodec.so'].pow10\n"
+        'pow10.restype = c_double\n'
+        'pow10.argtypes = [c_double]'
+        ),
+    'expm1': (None, (),
+        "expm1 = _libraries['/usr/lib/libavcodec.so'].expm1\n"
+        'expm1.restype = c_double\n'
+        'expm1.argtypes = [c_double]'
+        ),
+    'expm1l': (None, (),
+        "expm1l = _libraries['/usr/lib/libavcodec.so'].expm1l\n"
+        'expm1l.restype = c_longdouble\n'
+        'expm1l.argtypes = [c_longdouble]'
+        ),
+    'expm1f': (None, (),
+        "expm1f = _libraries['/usr/lib/libavcodec.so'].expm1f\n"
+        'expm1f.restype = c_float\n'
+        'expm1f.argtypes = [c_float]'
+        ),
+    'log1p': (None, (),
+        "log1p = _libraries['/usr/lib/libavcodec.so'].log1p\n"
+        'log1p.restype = c_double\n'
+        'log1p.argtypes = [c_double]'
+        ),
+    'log1pl': (None, (),
+        "log1pl = _libraries['/usr/lib/libavcodec.so'].log1pl\n"
+        'log1pl.restype = c_longdouble\n'
+        'log1pl.argtypes = [c_longdouble]'
+        ),
+    'log1pf': (None, (),
+        "log1pf = _libraries['/usr/lib/libavcodec.so'].log1pf\n"
+        'log1pf.restype = c_float\n'
+        'log1pf.argtypes = [c_float]'
+        ),
+    'logb': (None, (),
+        "logb = _libraries['/usr/lib/libavcodec.so'].logb\n"
+        'logb.restype = c_double\n'
+        'logb.argtypes = [c_double]'
+        ),
+    'logbf': (None, (),
+        "logbf = _libraries['/usr/lib/libavcodec.so'].logbf\n"
+        'logbf.restype = c_float\n'
+        'logbf.argtypes = [c_float]'
+        ),
+    'logbl': (None, (),
+        "logbl = _libraries['/usr/lib/libavcodec.so'].logbl\n"
+        'logbl.restype = c_longdouble\n'
+        'logbl.argtypes = [c_longdouble]'
+        ),
+    'exp2': (None, (),
+        "exp2 = _libraries['/usr/lib/libavcodec.so'].exp2\n"
+        'exp2.restype = c_double\n'
+        'exp2.argtypes = [c_double]'
+        ),
+    'exp2f': (None, (),
+        "exp2f = _libraries['/usr/lib/libavcodec.so'].exp2f\n"
+        'exp2f.restype = c_float\n'
+        'exp2f.argtypes = [c_float]'
+        ),
+    'exp2l': (None, (),
+        "exp2l = _libraries['/usr/lib/libavcodec.so'].exp2l\n"
+        'exp2l.restype = c_longdouble\n'
+        'exp2l.argtypes = [c_longdouble]'
+        ),
+    'log2': (None, (),
+        "log2 = _libraries['/usr/lib/libavcodec.so'].log2\n"
+        'log2.restype = c_double\n'
+        'log2.argtypes = [c_double]'
+        ),
+    'log2l': (None, (),
+        "log2l = _libraries['/usr/lib/libavcodec.so'].log2l\n"
+        'log2l.restype = c_longdouble\n'
+        'log2l.argtypes = [c_longdouble]'
+        ),
+    'log2f': (None, (),
+        "log2f = _libraries['/usr/lib/libavcodec.so'].log2f\n"
+        'log2f.restype = c_float\n'
+        'log2f.argtypes = [c_float]'
+        ),
+    'powf': (None, (),
+        "powf = _libraries['/usr/lib/libavcodec.so'].powf\n"
+        'powf.restype = c_float\n'
+        'powf.argtypes = [c_float, c_float]'
+        ),
+    'powl': (None, (),
+        "powl = _libraries['/usr/lib/libavcodec.so'].powl\n"
+        'powl.restype = c_longdouble\n'
+        'powl.argtypes = [c_longdouble, c_longdouble]'
+        ),
+    'pow': (None, (),
+        "pow = _libraries['/usr/lib/libavcodec.so'].pow\n"
+        'pow.restype = c_double\n'
+        'pow.argtypes = [c_double, c_double]'
+        ),
+    'sqrt': (None, (),
+        "sqrt = _libraries['/usr/lib/libavcodec.so'].sqrt\n"
+        'sqrt.restype = c_double\n'
+        'sqrt.argtypes = [c_double]'
+        ),
+    'sqrtf': (None, (),
+        "sqrtf = _libraries['/usr/lib/libavcodec.so'].sqrtf\n"
+        'sqrtf.restype = c_float\n'
+        'sqrtf.argtypes = [c_float]'
+        ),
+    'sqrtl': (None, (),
+        "sqrtl = _libraries['/usr/lib/libavcodec.so'].sqrtl\n"
+        'sqrtl.restype = c_longdouble\n'
+        'sqrtl.argtypes = [c_longdouble]'
+        ),
+    'hypotf': (None, (),
+        "hypotf = _libraries['/usr/lib/libavcodec.so'].hypotf\n"
+        'hypotf.restype = c_float\n'
+        'hypotf.argtypes = [c_float, c_float]'
+        ),
+    'hypotl': (None, (),
+        "hypotl = _libraries['/usr/lib/libavcodec.so'].hypotl\n"
+        'hypotl.restype = c_longdouble\n'
+        'hypotl.argtypes = [c_longdouble, c_longdouble]'
+        ),
+    'hypot': (None, (),
+        "hypot = _libraries['/usr/lib/libavcodec.so'].hypot\n"
+        'hypot.restype = c_double\n'
+        'hypot.argtypes = [c_double, c_double]'
+        ),
+    'cbrtf': (None, (),
+        "cbrtf = _libraries['/usr/lib/libavcodec.so'].cbrtf\n"
+        'cbrtf.restype = c_float\n'
+        'cbrtf.argtypes = [c_float]'
+        ),
+    'cbrtl': (None, (),
+        "cbrtl = _libraries['/usr/lib/libavcodec.so'].cbrtl\n"
+        'cbrtl.restype = c_longdouble\n'
+        'cbrtl.argtypes = [c_longdouble]'
+        ),
+    'cbrt': (None, (),
+        "cbrt = _libraries['/usr/lib/libavcodec.so'].cbrt\n"
+        'cbrt.restype = c_double\n'
+        'cbrt.argtypes = [c_double]'
+        ),
+    'ceil': (None, (),
+        "ceil = _libraries['/usr/lib/libavcodec.so'].ceil\n"
+        'ceil.restype = c_double\n'
+        'ceil.argtypes = [c_double]'
+        ),
+    'ceilf': (None, (),
+        "ceilf = _libraries['/usr/lib/libavcodec.so'].ceilf\n"
+        'ceilf.restype = c_float\n'
+        'ceilf.argtypes = [c_float]'
+        ),
+    'ceill': (None, (),
+        "ceill = _libraries['/usr/lib/libavcodec.so'].ceill\n"
+        'ceill.restype = c_longdouble\n'
+        'ceill.argtypes = [c_longdouble]'
+        ),
+    'fabs': (None, (),
+        "fabs = _libraries['/usr/lib/libavcodec.so'].fabs\n"
+        'fabs.restype = c_double\n'
+        'fabs.argtypes = [c_double]'
+        ),
+    'fabsl': (None, (),
+        "fabsl = _libraries['/usr/lib/libavcodec.so'].fabsl\n"
+        'fabsl.restype = c_longdouble\n'
+        'fabsl.argtypes = [c_longdouble]'
+        ),
+    'fabsf': (None, (),
+        "fabsf = _libraries['/usr/lib/libavcodec.so'].fabsf\n"
+        'fabsf.restype = c_float\n'
+        'fabsf.argtypes = [c_float]'
+        ),
+    'floor': (None, (),
+        "floor = _libraries['/usr/lib/libavcodec.so'].floor\n"
+        'floor.restype = c_double\n'
+        'floor.argtypes = [c_double]'
+        ),
+    'floorf': (None, (),
+        "floorf = _libraries['/usr/lib/libavcodec.so'].floorf\n"
+        'floorf.restype = c_float\n'
+        'floorf.argtypes = [c_float]'
+        ),
+    'floorl': (None, (),
+        "floorl = _libraries['/usr/lib/libavcodec.so'].floorl\n"
+        'floorl.restype = c_longdouble\n'
+        'floorl.argtypes = [c_longdouble]'
+        ),
+    'fmod': (None, (),
+        "fmod = _libraries['/usr/lib/libavcodec.so'].fmod\n"
+        'fmod.restype = c_double\n'
+        'fmod.argtypes = [c_double, c_double]'
+        ),
+    'fmodf': (None, (),
+        "fmodf = _libraries['/usr/lib/libavcodec.so'].fmodf\n"
+        'fmodf.restype = c_float\n'
+        'fmodf.argtypes = [c_float, c_float]'
+        ),
+    'fmodl': (None, (),
+        "fmodl = _libraries['/usr/lib/libavcodec.so'].fmodl\n"
+        'fmodl.restype = c_longdouble\n'
+        'fmodl.argtypes = [c_longdouble, c_longdouble]'
+        ),
+    '__isinfl': (None, (),
+        "__isinfl = _libraries['/usr/lib/libavcodec.so'].__isinfl\n"
+        '__isinfl.restype = c_int\n'
+        '__isinfl.argtypes = [c_longdouble]'
+        ),
+    '__isinff': (None, (),
+        "__isinff = _libraries['/usr/lib/libavcodec.so'].__isinff\n"
+        '__isinff.restype = c_int\n'
+        '__isinff.argtypes = [c_float]'
+        ),
+    '__isinf': (None, (),
+        "__isinf = _libraries['/usr/lib/libavcodec.so'].__isinf\n"
+        '__isinf.restype = c_int\n'
+        '__isinf.argtypes = [c_double]'
+        ),
+    '__finitef': (None, (),
+        "__finitef = _libraries['/usr/lib/libavcodec.so'].__finitef\n"
+        '__finitef.restype = c_int\n'
+        '__finitef.argtypes = [c_float]'
+        ),
+    '__finitel': (None, (),
+        "__finitel = _libraries['/usr/lib/libavcodec.so'].__finitel\n"
+        '__finitel.restype = c_int\n'
+        '__finitel.argtypes = [c_longdouble]'
+        ),
+    '__finite': (None, (),
+        "__finite = _libraries['/usr/lib/libavcodec.so'].__finite\n"
+        '__finite.restype = c_int\n'
+        '__finite.argtypes = [c_double]'
+        ),
+    'isinf': (None, (),
+        "isinf = _libraries['/usr/lib/libavcodec.so'].isinf\n"
+        'isinf.restype = c_int\n'
+        'isinf.argtypes = [c_double]'
+        ),
+    'isinff': (None, (),
+        "isinff = _libraries['/usr/lib/libavcodec.so'].isinff\n"
+        'isinff.restype = c_int\n'
+        'isinff.argtypes = [c_float]'
+        ),
+    'isinfl': (None, (),
+        "isinfl = _libraries['/usr/lib/libavcodec.so'].isinfl\n"
+        'isinfl.restype = c_int\n'
+        'isinfl.argtypes = [c_longdouble]'
+        ),
+    'finitel': (None, (),
+        "finitel = _libraries['/usr/lib/libavcodec.so'].finitel\n"
+        'finitel.restype = c_int\n'
+        'finitel.argtypes = [c_longdouble]'
+        ),
+    'finitef': (None, (),
+        "finitef = _libraries['/usr/lib/libavcodec.so'].finitef\n"
+        'finitef.restype = c_int\n'
+        'finitef.argtypes = [c_float]'
+        ),
+    'finite': (None, (),
+        "finite = _libraries['/usr/lib/libavcodec.so'].finite\n"
+        'finite.restype = c_int\n'
+        'finite.argtypes = [c_double]'
+        ),
+    'dremf': (None, (),
+        "dremf = _libraries['/usr/lib/libavcodec.so'].dremf\n"
+        'dremf.restype = c_float\n'
+        'dremf.argtypes = [c_float, c_float]'
+        ),
+    'dreml': (None, (),
+        "dreml = _libraries['/usr/lib/libavcodec.so'].dreml\n"
+        'dreml.restype = c_longdouble\n'
+        'dreml.argtypes = [c_longdouble, c_longdouble]'
+        ),
+    'drem': (None, (),
+        "drem = _libraries['/usr/lib/libavcodec.so'].drem\n"
+        'drem.restype = c_double\n'
+        'drem.argtypes = [c_double, c_double]'
+        ),
+    'significandf': (None, (),
+        "significandf = _libraries['/usr/lib/libavcodec.so'].significandf\n"
+        'significandf.restype = c_float\n'
+        'significandf.argtypes = [c_float]'
+        ),
+    'significandl': (None, (),
+        "significandl = _libraries['/usr/lib/libavcodec.so'].significandl\n"
+        'significandl.restype = c_longdouble\n'
+        'significandl.argtypes = [c_longdouble]'
+        ),
+    'significand': (None, (),
+        "significand = _libraries['/usr/lib/libavcodec.so'].significand\n"
+        'significand.restype = c_double\n'
+        'significand.argtypes = [c_double]'
+        ),
+    'copysign': (None, (),
+        "copysign = _libraries['/usr/lib/libavcodec.so'].copysign\n"
+        'copysign.restype = c_double\n'
+        'copysign.argtypes = [c_double, c_double]'
+        ),
+    'copysignf': (None, (),
+        "copysignf = _libraries['/usr/lib/libavcodec.so'].copysignf\n"
+        'copysignf.restype = c_float\n'
+        'copysignf.argtypes = [c_float, c_float]'
+        ),
+    'copysignl': (None, (),
+        "copysignl = _libraries['/usr/lib/libavcodec.so'].copysignl\n"
+        'copysignl.restype = c_longdouble\n'
+        'copysignl.argtypes = [c_longdouble, c_longdouble]'
+        ),
+    'nanf': (None, (),
+        "nanf = _libraries['/usr/lib/libavcodec.so'].nanf\n"
+        'nanf.restype = c_float\n'
+        'nanf.argtypes = [STRING]'
+        ),
+    'nan': (None, (),
+        "nan = _libraries['/usr/lib/libavcodec.so'].nan\n"
+        'nan.restype = c_double\n'
+        'nan.argtypes = [STRING]'
+        ),
+    'nanl': (None, (),
+        "nanl = _libraries['/usr/lib/libavcodec.so'].nanl\n"
+        'nanl.restype = c_longdouble\n'
+        'nanl.argtypes = [STRING]'
+        ),
+    '__isnanf': (None, (),
+        "__isnanf = _libraries['/usr/lib/libavcodec.so'].__isnanf\n"
+        '__isnanf.restype = c_int\n'
+        '__isnanf.argtypes = [c_float]'
+        ),
+    '__isnanl': (None, (),
+        "__isnanl = _libraries['/usr/lib/libavcodec.so'].__isnanl\n"
+        '__isnanl.restype = c_int\n'
+        '__isnanl.argtypes = [c_longdouble]'
+        ),
+    '__isnan': (None, (),
+        "__isnan = _libraries['/usr/lib/libavcodec.so'].__isnan\n"
+        '__isnan.restype = c_int\n'
+        '__isnan.argtypes = [c_double]'
+        ),
+    'isnan': (None, (),
+        "isnan = _libraries['/usr/lib/libavcodec.so'].isnan\n"
+        'isnan.restype = c_int\n'
+        'isnan.argtypes = [c_double]'
+        ),
+    'isnanl': (None, (),
+        "isnanl = _libraries['/usr/lib/libavcodec.so'].isnanl\n"
+        'isnanl.restype = c_int\n'
+        'isnanl.argtypes = [c_longdouble]'
+        ),
+    'isnanf': (None, (),
+        "isnanf = _libraries['/usr/lib/libavcodec.so'].isnanf\n"
+        'isnanf.restype = c_int\n'
+        'isnanf.argtypes = [c_float]'
+        ),
+    'j0f': (None, (),
+        "j0f = _libraries['/usr/lib/libavcodec.so'].j0f\n"
+        'j0f.restype = c_float\n'
+        'j0f.argtypes = [c_float]'
+        ),
+    'j0l': (None, (),
+        "j0l = _libraries['/usr/lib/libavcodec.so'].j0l\n"
+        'j0l.restype = c_longdouble\n'
+        'j0l.argtypes = [c_longdouble]'
+        ),
+    'j0': (None, (),
+        "j0 = _libraries['/usr/lib/libavcodec.so'].j0\n"
+        'j0.restype = c_double\n'
+        'j0.argtypes = [c_double]'
+        ),
+    'j1l': (None, (),
+        "j1l = _libraries['/usr/lib/libavcodec.so'].j1l\n"
+        'j1l.restype = c_longdouble\n'
+        'j1l.argtypes = [c_longdouble]'
+        ),
+    'j1f': (None, (),
+        "j1f = _libraries['/usr/lib/libavcodec.so'].j1f\n"
+        'j1f.restype = c_float\n'
+        'j1f.argtypes = [c_float]'
+        ),
+    'j1': (None, (),
+        "j1 = _libraries['/usr/lib/libavcodec.so'].j1\n"
+        'j1.restype = c_double\n'
+        'j1.argtypes = [c_double]'
+        ),
+    'jnl': (None, (),
+        "jnl = _libraries['/usr/lib/libavcodec.so'].jnl\n"
+        'jnl.restype = c_longdouble\n'
+        'jnl.argtypes = [c_int, c_longdouble]'
+        ),
+    'jn': (None, (),
+        "jn = _libraries['/usr/lib/libavcodec.so'].jn\n"
+        'jn.restype = c_double\n'
+        'jn.argtypes = [c_int, c_double]'
+        ),
+    'jnf': (None, (),
+        "jnf = _libraries['/usr/lib/libavcodec.so'].jnf\n"
+        'jnf.restype = c_float\n'
+        'jnf.argtypes = [c_int, c_float]'
+        ),
+    'y0f': (None, (),
+        "y0f = _libraries['/usr/lib/libavcodec.so'].y0f\n"
+        'y0f.restype = c_float\n'
+        'y0f.argtypes = [c_float]'
+        ),
+    'y0l': (None, (),
+        "y0l = _libraries['/usr/lib/libavcodec.so'].y0l\n"
+        'y0l.restype = c_longdouble\n'
+        'y0l.argtypes = [c_longdouble]'
+        ),
+    'y0': (None, (),
+        "y0 = _libraries['/usr/lib/libavcodec.so'].y0\n"
+        'y0.restype = c_double\n'
+        'y0.argtypes = [c_double]'
+        ),
+    'y1f': (None, (),
+        "y1f = _libraries['/usr/lib/libavcodec.so'].y1f\n"
+        'y1f.restype = c_float\n'
+        'y1f.argtypes = [c_float]'
+        ),
+    'y1l': (None, (),
+        "y1l = _libraries['/usr/lib/libavcodec.so'].y1l\n"
+        'y1l.restype = c_longdouble\n'
+        'y1l.argtypes = [c_longdouble]'
+        ),
+    'y1': (None, (),
+        "y1 = _libraries['/usr/lib/libavcodec.so'].y1\n"
+        'y1.restype = c_double\n'
+        'y1.argtypes = [c_double]'
+        ),
+    'ynf': (None, (),
+        "ynf = _libraries['/usr/lib/libavcodec.so'].ynf\n"
+        'ynf.restype = c_float\n'
+        'ynf.argtypes = [c_int, c_float]'
+        ),
+    'ynl': (None, (),
+        "ynl = _libraries['/usr/lib/libavcodec.so'].ynl\n"
+        'ynl.restype = c_longdouble\n'
+        'ynl.argtypes = [c_int, c_longdouble]'
+        ),
+    'yn': (None, (),
+        "yn = _libraries['/usr/lib/libavcodec.so'].yn\n"
+        'yn.restype = c_double\n'
+        'yn.argtypes = [c_int, c_double]'
+        ),
+    'erfl': (None, (),
+        "erfl = _libraries['/usr/lib/libavcodec.so'].erfl\n"
+        'erfl.restype = c_longdouble\n'
+        'erfl.argtypes = [c_longdouble]'
+        ),
+    'erff': (None, (),
+        "erff = _libraries['/usr/lib/libavcodec.so'].erff\n"
+        'erff.restype = c_float\n'
+        'erff.argtypes = [c_float]'
+        ),
+    'erf': (None, (),
+        "erf = _libraries['/usr/lib/libavcodec.so'].erf\n"
+        'erf.restype = c_double\n'
+        'erf.argtypes = [c_double]'
+        ),
+    'erfcf': (None, (),
+        "erfcf = _libraries['/usr/lib/libavcodec.so'].erfcf\n"
+        'erfcf.restype = c_float\n'
+        'erfcf.argtypes = [c_float]'
+        ),
+    'erfcl': (None, (),
+        "erfcl = _libraries['/usr/lib/libavcodec.so'].erfcl\n"
+        'erfcl.restype = c_longdouble\n'
+        'erfcl.argtypes = [c_longdouble]'
+        ),
+    'erfc': (None, (),
+        "erfc = _libraries['/usr/lib/libavcodec.so'].erfc\n"
+        'erfc.restype = c_double\n'
+        'erfc.argtypes = [c_double]'
+        ),
+    'lgammal': (None, (),
+        "lgammal = _libraries['/usr/lib/libavcodec.so'].lgammal\n"
+        'lgammal.restype = c_longdouble\n'
+        'lgammal.argtypes = [c_longdouble]'
+        ),
+    'lgammaf': (None, (),
+        "lgammaf = _libraries['/usr/lib/libavcodec.so'].lgammaf\n"
+        'lgammaf.restype = c_float\n'
+        'lgammaf.argtypes = [c_float]'
+        ),
+    'lgamma': (None, (),
+        "lgamma = _libraries['/usr/lib/libavcodec.so'].lgamma\n"
+        'lgamma.restype = c_double\n'
+        'lgamma.argtypes = [c_double]'
+        ),
+    'tgamma': (None, (),
+        "tgamma = _libraries['/usr/lib/libavcodec.so'].tgamma\n"
+        'tgamma.restype = c_double\n'
+        'tgamma.argtypes = [c_double]'
+        ),
+    'tgammaf': (None, (),
+        "tgammaf = _libraries['/usr/lib/libavcodec.so'].tgammaf\n"
+        'tgammaf.restype = c_float\n'
+        'tgammaf.argtypes = [c_float]'
+        ),
+    'tgammal': (None, (),
+        "tgammal = _libraries['/usr/lib/libavcodec.so'].tgammal\n"
+        'tgammal.restype = c_longdouble\n'
+        'tgammal.argtypes = [c_longdouble]'
+        ),
+    'gammal': (None, (),
+        "gammal = _libraries['/usr/lib/libavcodec.so'].gammal\n"
+        'gammal.restype = c_longdouble\n'
+        'gammal.argtypes = [c_longdouble]'
+        ),
+    'gamma': (None, (),
+        "gamma = _libraries['/usr/lib/libavcodec.so'].gamma\n"
+        'gamma.restype = c_double\n'
+        'gamma.argtypes = [c_double]'
+        ),
+    'gammaf': (None, (),
+        "gammaf = _libraries['/usr/lib/libavcodec.so'].gammaf\n"
+        'gammaf.restype = c_float\n'
+        'gammaf.argtypes = [c_float]'
+        ),
+    'lgammaf_r': (None, (),
+        "lgammaf_r = _libraries['/usr/lib/libavcodec.so'].lgammaf_r\n"
+        'lgammaf_r.restype = c_float\n'
+        'lgammaf_r.argtypes = [c_float, POINTER(c_int)]'
+        ),
+    'lgammal_r': (None, (),
+        "lgammal_r = _libraries['/usr/lib/libavcodec.so'].lgammal_r\n"
+        'lgammal_r.restype = c_longdouble\n'
+        'lgammal_r.argtypes = [c_longdouble, POINTER(c_int)]'
+        ),
+    'lgamma_r': (None, (),
+        "lgamma_r = _libraries['/usr/lib/libavcodec.so'].lgamma_r\n"
+        'lgamma_r.restype = c_double\n'
+        'lgamma_r.argtypes = [c_double, POINTER(c_int)]'
+        ),
+    'rintf': (None, (),
+        "rintf = _libraries['/usr/lib/libavcodec.so'].rintf\n"
+        'rintf.restype = c_float\n'
+        'rintf.argtypes = [c_float]'
+        ),
+    'rintl': (None, (),
+        "rintl = _libraries['/usr/lib/libavcodec.so'].rintl\n"
+        'rintl.restype = c_longdouble\n'
+        'rintl.argtypes = [c_longdouble]'
+        ),
+    'rint': (None, (),
+        "rint = _libraries['/usr/lib/libavcodec.so'].rint\n"
+        'rint.restype = c_double\n'
+        'rint.argtypes = [c_double]'
+        ),
+    'nextafterf': (None, (),
+        "nextafterf = _libraries['/usr/lib/libavcodec.so'].nextafterf\n"
+        'nextafterf.restype = c_float\n'
+        'nextafterf.argtypes = [c_float, c_float]'
+        ),
+    'nextafter': (None, (),
+        "nextafter = _libraries['/usr/lib/libavcodec.so'].nextafter\n"
+        'nextafter.restype = c_double\n'
+        'nextafter.argtypes = [c_double, c_double]'
+        ),
+    'nextafterl': (None, (),
+        "nextafterl = _libraries['/usr/lib/libavcodec.so'].nextafterl\n"
+        'nextafterl.restype = c_longdouble\n'
+        'nextafterl.argtypes = [c_longdouble, c_longdouble]'
+        ),
+    'nexttowardl': (None, (),
+        "nexttowardl = _libraries['/usr/lib/libavcodec.so'].nexttowardl\n"
+        'nexttowardl.restype = c_longdouble\n'
+        'nexttowardl.argtypes = [c_longdouble, c_longdouble]'
+        ),
+    'nexttoward': (None, (),
+        "nexttoward = _libraries['/usr/lib/libavcodec.so'].nexttoward\n"
+        'nexttoward.restype = c_double\n'
+        'nexttoward.argtypes = [c_double, c_longdouble]'
+        ),
+    'nexttowardf': (None, (),
+        "nexttowardf = _libraries['/usr/lib/libavcodec.so'].nexttowardf\n"
+        'nexttowardf.restype = c_float\n'
+        'nexttowardf.argtypes = [c_float, c_longdouble]'
+        ),
+    'remainderf': (None, (),
+        "remainderf = _libraries['/usr/lib/libavcodec.so'].remainderf\n"
+        'remainderf.restype = c_float\n'
+        'remainderf.argtypes = [c_float, c_float]'
+        ),
+    'remainder': (None, (),
+        "remainder = _libraries['/usr/lib/libavcodec.so'].remainder\n"
+        'remainder.restype = c_double\n'
+        'remainder.argtypes = [c_double, c_double]'
+        ),
+    'remainderl': (None, (),
+        "remainderl = _libraries['/usr/lib/libavcodec.so'].remainderl\n"
+        'remainderl.restype = c_longdouble\n'
+        'remainderl.argtypes = [c_longdouble, c_longdouble]'
+        ),
+    'scalbnl': (None, (),
+        "scalbnl = _libraries['/usr/lib/libavcodec.so'].scalbnl\n"
+        'scalbnl.restype = c_longdouble\n'
+        'scalbnl.argtypes = [c_longdouble, c_int]'
+        ),
+    'scalbnf': (None, (),
+        "scalbnf = _libraries['/usr/lib/libavcodec.so'].scalbnf\n"
+        'scalbnf.restype = c_float\n'
+        'scalbnf.argtypes = [c_float, c_int]'
+        ),
+    'scalbn': (None, (),
+        "scalbn = _libraries['/usr/lib/libavcodec.so'].scalbn\n"
+        'scalbn.restype = c_double\n'
+        'scalbn.argtypes = [c_double, c_int]'
+        ),
+    'ilogbl': (None, (),
+        "ilogbl = _libraries['/usr/lib/libavcodec.so'].ilogbl\n"
+        'ilogbl.restype = c_int\n'
+        'ilogbl.argtypes = [c_longdouble]'
+        ),
+    'ilogb': (None, (),
+        "ilogb = _libraries['/usr/lib/libavcodec.so'].ilogb\n"
+        'ilogb.restype = c_int\n'
+        'ilogb.argtypes = [c_double]'
+        ),
+    'ilogbf': (None, (),
+        "ilogbf = _libraries['/usr/lib/libavcodec.so'].ilogbf\n"
+        'ilogbf.restype = c_int\n'
+        'ilogbf.argtypes = [c_float]'
+        ),
+    'scalblnf': (None, (),
+        "scalblnf = _libraries['/usr/lib/libavcodec.so'].scalblnf\n"
+        'scalblnf.restype = c_float\n'
+        'scalblnf.argtypes = [c_float, c_long]'
+        ),
+    'scalblnl': (None, (),
+        "scalblnl = _libraries['/usr/lib/libavcodec.so'].scalblnl\n"
+        'scalblnl.restype = c_longdouble\n'
+        'scalblnl.argtypes = [c_longdouble, c_long]'
+        ),
+    'scalbln': (None, (),
+        "scalbln = _libraries['/usr/lib/libavcodec.so'].scalbln\n"
+        'scalbln.restype = c_double\n'
+        'scalbln.argtypes = [c_double, c_long]'
+        ),
+    'nearbyint': (None, (),
+        "nearbyint = _libraries['/usr/lib/libavcodec.so'].nearbyint\n"
+        'nearbyint.restype = c_double\n'
+        'nearbyint.argtypes = [c_double]'
+        ),
+    'nearbyintf': (None, (),
+        "nearbyintf = _libraries['/usr/lib/libavcodec.so'].nearbyintf\n"
+        'nearbyintf.restype = c_float\n'
+        'nearbyintf.argtypes = [c_float]'
+        ),
+    'nearbyintl': (None, (),
+        "nearbyintl = _libraries['/usr/lib/libavcodec.so'].nearbyintl\n"
+        'nearbyintl.restype = c_longdouble\n'
+        'nearbyintl.argtypes = [c_longdouble]'
+        ),
+    'roundl': (None, (),
+        "roundl = _libraries['/usr/lib/libavcodec.so'].roundl\n"
+        'roundl.restype = c_longdouble\n'
+        'roundl.argtypes = [c_longdouble]'
+        ),
+    'round': (None, (),
+        "round = _libraries['/usr/lib/libavcodec.so'].round\n"
+        'round.restype = c_double\n'
+        'round.argtypes = [c_double]'
+        ),
+    'roundf': (None, (),
+        "roundf = _libraries['/usr/lib/libavcodec.so'].roundf\n"
+        'roundf.restype = c_float\n'
+        'roundf.argtypes = [c_float]'
+        ),
+    'truncf': (None, (),
+        "truncf = _libraries['/usr/lib/libavcodec.so'].truncf\n"
+        'truncf.restype = c_float\n'
+        'truncf.argtypes = [c_float]'
+        ),
+    'trunc': (None, (),
+        "trunc = _libraries['/usr/lib/libavcodec.so'].trunc\n"
+        'trunc.restype = c_double\n'
+        'trunc.argtypes = [c_double]'
+        ),
+    'truncl': (None, (),
+        "truncl = _libraries['/usr/lib/libavcodec.so'].truncl\n"
+        'truncl.restype = c_longdouble\n'
+        'truncl.argtypes = [c_longdouble]'
+        ),
+    'remquo': (None, (),
+        "remquo = _libraries['/usr/lib/libavcodec.so'].remquo\n"
+        'remquo.restype = c_double\n'
+        'remquo.argtypes = [c_double, c_double, POINTER(c_int)]'
+        ),
+    'remquof': (None, (),
+        "remquof = _libraries['/usr/lib/libavcodec.so'].remquof\n"
+        'remquof.restype = c_float\n'
+        'remquof.argtypes = [c_float, c_float, POINTER(c_int)]'
+        ),
+    'remquol': (None, (),
+        "remquol = _libraries['/usr/lib/libavcodec.so'].remquol\n"
+        'remquol.restype = c_longdouble\n'
+        'remquol.argtypes = [c_longdouble, c_longdouble, POINTER(c_int)]'
+        ),
+    'lrint': (None, (),
+        "lrint = _libraries['/usr/lib/libavcodec.so'].lrint\n"
+        'lrint.restype = c_long\n'
+        'lrint.argtypes = [c_double]'
+        ),
+    'lrintf': (None, (),
+        "lrintf = _libraries['/usr/lib/libavcodec.so'].lrintf\n"
+        'lrintf.restype = c_long\n'
+        'lrintf.argtypes = [c_float]'
+        ),
+    'lrintl': (None, (),
+        "lrintl = _libraries['/usr/lib/libavcodec.so'].lrintl\n"
+        'lrintl.restype = c_long\n'
+        'lrintl.argtypes = [c_longdouble]'
+        ),
+    'llrintl': (None, (),
+        "llrintl = _libraries['/usr/lib/libavcodec.so'].llrintl\n"
+        'llrintl.restype = c_longlong\n'
+        'llrintl.argtypes = [c_longdouble]'
+        ),
+    'llrintf': (None, (),
+        "llrintf = _libraries['/usr/lib/libavcodec.so'].llrintf\n"
+        'llrintf.restype = c_longlong\n'
+        'llrintf.argtypes = [c_float]'
+        ),
+    'llrint': (None, (),
+        "llrint = _libraries['/usr/lib/libavcodec.so'].llrint\n"
+        'llrint.restype = c_longlong\n'
+        'llrint.argtypes = [c_double]'
+        ),
+    'lround': (None, (),
+        "lround = _libraries['/usr/lib/libavcodec.so'].lround\n"
+        'lround.restype = c_long\n'
+        'lround.argtypes = [c_double]'
+        ),
+    'lroundl': (None, (),
+        "lroundl = _libraries['/usr/lib/libavcodec.so'].lroundl\n"
+        'lroundl.restype = c_long\n'
+        'lroundl.argtypes = [c_longdouble]'
+        ),
+    'lroundf': (None, (),
+        "lroundf = _libraries['/usr/lib/libavcodec.so'].lroundf\n"
+        'lroundf.restype = c_long\n'
+        'lroundf.argtypes = [c_float]'
+        ),
+    'llround': (None, (),
+        "llround = _libraries['/usr/lib/libavcodec.so'].llround\n"
+        'llround.restype = c_longlong\n'
+        'llround.argtypes = [c_double]'
+        ),
+    'llroundl': (None, (),
+        "llroundl = _libraries['/usr/lib/libavcodec.so'].llroundl\n"
+        'llroundl.restype = c_longlong\n'
+        'llroundl.argtypes = [c_longdouble]'
+        ),
+    'llroundf': (None, (),
+        "llroundf = _libraries['/usr/lib/libavcodec.so'].llroundf\n"
+        'llroundf.restype = c_longlong\n'
+        'llroundf.argtypes = [c_float]'
+        ),
+    'fdimf': (None, (),
+        "fdimf = _libraries['/usr/lib/libavcodec.so'].fdimf\n"
+        'fdimf.restype = c_float\n'
+        'fdimf.argtypes = [c_float, c_float]'
+        ),
+    'fdiml': (None, (),
+        "fdiml = _libraries['/usr/lib/libavcodec.so'].fdiml\n"
+        'fdiml.restype = c_longdouble\n'
+        'fdiml.argtypes = [c_longdouble, c_longdouble]'
+        ),
+    'fdim': (None, (),
+        "fdim = _libraries['/usr/lib/libavcodec.so'].fdim\n"
+        'fdim.restype = c_double\n'
+        'fdim.argtypes = [c_double, c_double]'
+        ),
+    'fmaxf': (None, (),
+        "fmaxf = _libraries['/usr/lib/libavcodec.so'].fmaxf\n"
+        'fmaxf.restype = c_float\n'
+        'fmaxf.argtypes = [c_float, c_float]'
+        ),
+    'fmaxl': (None, (),
+        "fmaxl = _libraries['/usr/lib/libavcodec.so'].fmaxl\n"
+        'fmaxl.restype = c_longdouble\n'
+        'fmaxl.argtypes = [c_longdouble, c_longdouble]'
+        ),
+    'fmax': (None, (),
+        "fmax = _libraries['/usr/lib/libavcodec.so'].fmax\n"
+        'fmax.restype = c_double\n'
+        'fmax.argtypes = [c_double, c_double]'
+        ),
+    'fminl': (None, (),
+        "fminl = _libraries['/usr/lib/libavcodec.so'].fminl\n"
+        'fminl.restype = c_longdouble\n'
+        'fminl.argtypes = [c_longdouble, c_longdouble]'
+        ),
+    'fmin': (None, (),
+        "fmin = _libraries['/usr/lib/libavcodec.so'].fmin\n"
+        'fmin.restype = c_double\n'
+        'fmin.argtypes = [c_double, c_double]'
+        ),
+    'fminf': (None, (),
+        "fminf = _libraries['/usr/lib/libavcodec.so'].fminf\n"
+        'fminf.restype = c_float\n'
+        'fminf.argtypes = [c_float, c_float]'
+        ),
+    '__fpclassifyl': (None, (),
+        "__fpclassifyl = _libraries['/usr/lib/libavcodec.so'].__fpclassifyl\n"
+        '__fpclassifyl.restype = c_int\n'
+        '__fpclassifyl.argtypes = [c_longdouble]'
+        ),
+    '__fpclassifyf': (None, (),
+        "__fpclassifyf = _libraries['/usr/lib/libavcodec.so'].__fpclassifyf\n"
+        '__fpclassifyf.restype = c_int\n'
+        '__fpclassifyf.argtypes = [c_float]'
+        ),
+    '__fpclassify': (None, (),
+        "__fpclassify = _libraries['/usr/lib/libavcodec.so'].__fpclassify\n"
+        '__fpclassify.restype = c_int\n'
+        '__fpclassify.argtypes = [c_double]'
+        ),
+    'fma': (None, (),
+        "fma = _libraries['/usr/lib/libavcodec.so'].fma\n"
+        'fma.restype = c_double\n'
+        'fma.argtypes = [c_double, c_double, c_double]'
+        ),
+    'fmaf': (None, (),
+        "fmaf = _libraries['/usr/lib/libavcodec.so'].fmaf\n"
+        'fmaf.restype = c_float\n'
+        'fmaf.argtypes = [c_float, c_float, c_float]'
+        ),
+    'fmal': (None, (),
+        "fmal = _libraries['/usr/lib/libavcodec.so'].fmal\n"
+        'fmal.restype = c_longdouble\n'
+        'fmal.argtypes = [c_longdouble, c_longdouble, c_longdouble]'
+        ),
+    'scalb': (None, (),
+        "scalb = _libraries['/usr/lib/libavcodec.so'].scalb\n"
+        'scalb.restype = c_double\n'
+        'scalb.argtypes = [c_double, c_double]'
+        ),
+    'scalbl': (None, (),
+        "scalbl = _libraries['/usr/lib/libavcodec.so'].scalbl\n"
+        'scalbl.restype = c_longdouble\n'
+        'scalbl.argtypes = [c_longdouble, c_longdouble]'
+        ),
+    'scalbf': (None, (),
+        "scalbf = _libraries['/usr/lib/libavcodec.so'].scalbf\n"
+        'scalbf.restype = c_float\n'
+        'scalbf.argtypes = [c_float, c_float]'
+        ),
+    '__signbitf': (None, (),
+        "__signbitf = _libraries['/usr/lib/libavcodec.so'].__signbitf\n"
+        '__signbitf.restype = c_int\n'
+        '__signbitf.argtypes = [c_float]'
+        ),
+    '__signbit': (None, (),
+        "__signbit = _libraries['/usr/lib/libavcodec.so'].__signbit\n"
+        '__signbit.restype = c_int\n'
+        '__signbit.argtypes = [c_double]'
+        ),
+    '__signbitl': (None, (),
+        "__signbitl = _libraries['/usr/lib/libavcodec.so'].__signbitl\n"
+        '__signbitl.restype = c_int\n'
+        '__signbitl.argtypes = [c_longdouble]'
+        ),
+    'pthread_attr_t': ('Union', (),
+        'pthread_attr_t._fields_ = [\n'
+        "    ('__size', c_char * 56),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    '__pthread_internal_list': ('Structure', (),
+        '__pthread_internal_list._fields_ = [\n'
+        "    ('__prev', POINTER(__pthread_internal_list)),\n"
+        "    ('__next', POINTER(__pthread_internal_list)),\n"
+        ']'
+        ),
+    '__pthread_list_t': (None, ('__pthread_internal_list',),
+        '__pthread_list_t = __pthread_internal_list'
+        ),
+    '__pthread_mutex_s': ('Structure', ('__pthread_list_t',),
+        '__pthread_mutex_s._fields_ = [\n'
+        "    ('__lock', c_int),\n"
+        "    ('__count', c_uint),\n"
+        "    ('__owner', c_int),\n"
+        "    ('__nusers', c_uint),\n"
+        "    ('__kind', c_int),\n"
+        "    ('__spins', c_int),\n"
+        "    ('__list', __pthread_list_t),\n"
+        ']'
+        ),
+    'pthread_mutex_t': ('Union', ('__pthread_mutex_s',),
+        'pthread_mutex_t._fields_ = [\n'
+        "    ('__data', __pthread_mutex_s),\n"
+        "    ('__size', c_char * 40),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_mutexattr_t': ('Union', (),
+        'pthread_mutexattr_t._fields_ = [\n'
+        "    ('__size', c_char * 4),\n"
+        "    ('__align', c_int),\n"
+        ']'
+        ),
+    'N14pthread_cond_t4DOT_20E': ('Structure', (),
+        'N14pthread_cond_t4DOT_20E._fields_ = [\n'
+        "    ('__lock', c_int),\n"
+        "    ('__futex', c_uint),\n"
+        "    ('__total_seq', c_ulonglong),\n"
+        "    ('__wakeup_seq', c_ulonglong),\n"
+        "    ('__woken_seq', c_ulonglong),\n"
+        "    ('__mutex', c_void_p),\n"
+        "    ('__nwaiters', c_uint),\n"
+        "    ('__broadcast_seq', c_uint),\n"
+        ']'
+        ),
+    'pthread_cond_t': ('Union', ('N14pthread_cond_t4DOT_20E',),
+        'pthread_cond_t._fields_ = [\n'
+        "    ('__data', N14pthread_cond_t4DOT_20E),\n"
+        "    ('__size', c_char * 48),\n"
+        "    ('__align', c_longlong),\n"
+        ']'
+        ),
+    'pthread_condattr_t': ('Union', (),
+        'pthread_condattr_t._fields_ = [\n'
+        "    ('__size', c_char * 4),\n"
+        "    ('__align', c_int),\n"
+        ']'
+        ),
+    'N16pthread_rwlock_t4DOT_23E': ('Structure', (),
+        'N16pthread_rwlock_t4DOT_23E._fields_ = [\n'
+        "    ('__lock', c_int),\n"
+        "    ('__nr_readers', c_uint),\n"
+        "    ('__readers_wakeup', c_uint),\n"
+        "    ('__writer_wakeup', c_uint),\n"
+        "    ('__nr_readers_queued', c_uint),\n"
+        "    ('__nr_writers_queued', c_uint),\n"
+        "    ('__writer', c_int),\n"
+        "    ('__shared', c_int),\n"
+        "    ('__pad1', c_ulong),\n"
+        "    ('__pad2', c_ulong),\n"
+        "    ('__flags', c_uint),\n"
+        ']'
+        ),
+    'pthread_rwlock_t': ('Union', ('N16pthread_rwlock_t4DOT_23E',),
+        'pthread_rwlock_t._fields_ = [\n'
+        "    ('__data', N16pthread_rwlock_t4DOT_23E),\n"
+        "    ('__size', c_char * 56),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_rwlockattr_t': ('Union', (),
+        'pthread_rwlockattr_t._fields_ = [\n'
+        "    ('__size', c_char * 8),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_barrier_t': ('Union', (),
+        'pthread_barrier_t._fields_ = [\n'
+        "    ('__size', c_char * 32),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_barrierattr_t': ('Union', (),
+        'pthread_barrierattr_t._fields_ = [\n'
+        "    ('__size', c_char * 4),\n"
+        "    ('__align', c_int),\n"
+        ']'
+        ),
+    '__fdelt_chk': (None, (),
+        "__fdelt_chk = _libraries['/usr/lib/libavcodec.so'].__fdelt_chk\n"
+        '__fdelt_chk.restype = c_long\n'
+        '__fdelt_chk.argtypes = [c_long]'
+        ),
+    '__fdelt_warn': (None, (),
+        "__fdelt_warn = _libraries['/usr/lib/libavcodec.so'].__fdelt_warn\n"
+        '__fdelt_warn.restype = c_long\n'
+        '__fdelt_warn.argtypes = [c_long]'
+        ),
+    '__sigset_t': ('Structure', (),
+        '__sigset_t._fields_ = [\n'
+        "    ('__val', c_ulong * 16),\n"
+        ']'
+        ),
+    'getchar': (None, (),
+        "getchar = _libraries['/usr/lib/libavcodec.so'].getchar\n"
+        'getchar.restype = c_int\n'
+        'getchar.argtypes = []'
+        ),
+    'FILE': (None, ('_IO_FILE',),
+        'FILE = _IO_FILE'
+        ),
+    'fgetc_unlocked': (None, ('FILE',),
+        "fgetc_unlocked = _libraries['/usr/lib/libavcodec.so'].fgetc_unlocked\n"
+        'fgetc_unlocked.restype = c_int\n'
+        'fgetc_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'getc_unlocked': (None, ('FILE',),
+        "getc_unlocked = _libraries['/usr/lib/libavcodec.so'].getc_unlocked\n"
+        'getc_unlocked.restype = c_int\n'
+        'getc_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'getchar_unlocked': (None, (),
+        "getchar_unlocked = _libraries['/usr/lib/libavcodec.so'].getchar_unlocked\n"
+        'getchar_unlocked.restype = c_int\n'
+        'getchar_unlocked.argtypes = []'
+        ),
+    'putchar': (None, (),
+        "putchar = _libraries['/usr/lib/libavcodec.so'].putchar\n"
+        'putchar.restype = c_int\n'
+        'putchar.argtypes = [c_int]'
+        ),
+    'fputc_unlocked': (None, ('FILE',),
+        "fputc_unlocked = _libraries['/usr/lib/libavcodec.so'].fputc_unlocked\n"
+        'fputc_unlocked.restype = c_int\n'
+        'fputc_unlocked.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'putc_unlocked': (None, ('FILE',),
+        "putc_unlocked = _libraries['/usr/lib/libavcodec.so'].putc_unlocked\n"
+        'putc_unlocked.restype = c_int\n'
+        'putc_unlocked.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'putchar_unlocked': (None, (),
+        "putchar_unlocked = _libraries['/usr/lib/libavcodec.so'].putchar_unlocked\n"
+        'putchar_unlocked.restype = c_int\n'
+        'putchar_unlocked.argtypes = [c_int]'
+        ),
+    'getline': (None, ('FILE',),
+        "getline = _libraries['/usr/lib/libavcodec.so'].getline\n"
+        'getline.restype = __ssize_t\n'
+        'getline.argtypes = [POINTER(STRING), POINTER(size_t), POINTER(FILE)]'
+        ),
+    'feof_unlocked': (None, ('FILE',),
+        "feof_unlocked = _libraries['/usr/lib/libavcodec.so'].feof_unlocked\n"
+        'feof_unlocked.restype = c_int\n'
+        'feof_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'ferror_unlocked': (None, ('FILE',),
+        "ferror_unlocked = _libraries['/usr/lib/libavcodec.so'].ferror_unlocked\n"
+        'ferror_unlocked.restype = c_int\n'
+        'ferror_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    '__sprintf_chk': (None, (),
+        "__sprintf_chk = _libraries['/usr/lib/libavcodec.so'].__sprintf_chk\n"
+        '__sprintf_chk.restype = c_int\n'
+        '__sprintf_chk.argtypes = [STRING, c_int, size_t, STRING]'
+        ),
+    '__vsprintf_chk': (None, ('__va_list_tag',),
+        "__vsprintf_chk = _libraries['/usr/lib/libavcodec.so'].__vsprintf_chk\n"
+        '__vsprintf_chk.restype = c_int\n'
+        '__vsprintf_chk.argtypes = [STRING, c_int, size_t, STRING, POINTER(__va_list_tag)]'
+        ),
+    'sprintf': (None, (),
+        "sprintf = _libraries['/usr/lib/libavcodec.so'].sprintf\n"
+        'sprintf.restype = c_int\n'
+        'sprintf.argtypes = [STRING, STRING]'
+        ),
+    'vsprintf': (None, ('__va_list_tag',),
+        "vsprintf = _libraries['/usr/lib/libavcodec.so'].vsprintf\n"
+        'vsprintf.restype = c_int\n'
+        'vsprintf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__snprintf_chk': (None, (),
+        "__snprintf_chk = _libraries['/usr/lib/libavcodec.so'].__snprintf_chk\n"
+        '__snprintf_chk.restype = c_int\n'
+        '__snprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING]'
+        ),
+    '__vsnprintf_chk': (None, ('__va_list_tag',),
+        "__vsnprintf_chk = _libraries['/usr/lib/libavcodec.so'].__vsnprintf_chk\n"
+        '__vsnprintf_chk.restype = c_int\n'
+        '__vsnprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING, POINTER(__va_list_tag)]'
+        ),
+    'snprintf': (None, (),
+        "snprintf = _libraries['/usr/lib/libavcodec.so'].snprintf\n"
+        'snprintf.restype = c_int\n'
+        'snprintf.argtypes = [STRING, size_t, STRING]'
+        ),
+    'vsnprintf': (None, ('__va_list_tag',),
+        "vsnprintf = _libraries['/usr/lib/libavcodec.so'].vsnprintf\n"
+        'vsnprintf.restype = c_int\n'
+        'vsnprintf.argtypes = [STRING, size_t, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__fprintf_chk': (None, ('FILE',),
+        "__fprintf_chk = _libraries['/usr/lib/libavcodec.so'].__fprintf_chk\n"
+        '__fprintf_chk.restype = c_int\n'
+        '__fprintf_chk.argtypes = [POINTER(FILE), c_int, STRING]'
+        ),
+    '__printf_chk': (None, (),
+        "__printf_chk = _libraries['/usr/lib/libavcodec.so'].__printf_chk\n"
+        '__printf_chk.restype = c_int\n'
+        '__printf_chk.argtypes = [c_int, STRING]'
+        ),
+    '__vfprintf_chk': (None, ('FILE', '__va_list_tag'),
+        "__vfprintf_chk = _libraries['/usr/lib/libavcodec.so'].__vfprintf_chk\n"
+        '__vfprintf_chk.restype = c_int\n'
+        '__vfprintf_chk.argtypes = [POINTER(FILE), c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__vprintf_chk': (None, ('__va_list_tag',),
+        "__vprintf_chk = _libraries['/usr/lib/libavcodec.so'].__vprintf_chk\n"
+        '__vprintf_chk.restype = c_int\n'
+        '__vprintf_chk.argtypes = [c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'fprintf': (None, ('FILE',),
+        "fprintf = _libraries['/usr/lib/libavcodec.so'].fprintf\n"
+        'fprintf.restype = c_int\n'
+        'fprintf.argtypes = [POINTER(FILE), STRING]'
+        ),
+    'printf': (None, (),
+        "printf = _libraries['/usr/lib/libavcodec.so'].printf\n"
+        'printf.restype = c_int\n'
+        'printf.argtypes = [STRING]'
+        ),
+    'vprintf': (None, ('__va_list_tag',),
+        "vprintf = _libraries['/usr/lib/libavcodec.so'].vprintf\n"
+        'vprintf.restype = c_int\n'
+        'vprintf.argtypes = [STRING, POINTER(__va_list_tag)]'
+        ),
+    'vfprintf': (None, ('FILE', '__va_list_tag'),
+        "vfprintf = _libraries['/usr/lib/libavcodec.so'].vfprintf\n"
+        'vfprintf.restype = c_int\n'
+        'vfprintf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]'
+        ),
+    '__dprintf_chk': (None, (),
+        "__dprintf_chk = _libraries['/usr/lib/libavcodec.so'].__dprintf_chk\n"
+        '__dprintf_chk.restype = c_int\n'
+        '__dprintf_chk.argtypes = [c_int, c_int, STRING]'
+        ),
+    '__vdprintf_chk': (None, ('__va_list_tag',),
+        "__vdprintf_chk = _libraries['/usr/lib/libavcodec.so'].__vdprintf_chk\n"
+        '__vdprintf_chk.restype = c_int\n'
+        '__vdprintf_chk.argtypes = [c_int, c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'dprintf': (None, (),
+        "dprintf = _libraries['/usr/lib/libavcodec.so'].dprintf\n"
+        'dprintf.restype = c_int\n'
+        'dprintf.argtypes = [c_int, STRING]'
+        ),
+    'vdprintf': (None, ('__va_list_tag',),
+        "vdprintf = _libraries['/usr/lib/libavcodec.so'].vdprintf\n"
+        'vdprintf.restype = c_int\n'
+        'vdprintf.argtypes = [c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__asprintf_chk': (None, (),
+        "__asprintf_chk = _libraries['/usr/lib/libavcodec.so'].__asprintf_chk\n"
+        '__asprintf_chk.restype = c_int\n'
+        '__asprintf_chk.argtypes = [POINTER(STRING), c_int, STRING]'
+        ),
+    '__vasprintf_chk': (None, ('__va_list_tag',),
+        "__vasprintf_chk = _libraries['/usr/lib/libavcodec.so'].__vasprintf_chk\n"
+        '__vasprintf_chk.restype = c_int\n'
+        '__vasprintf_chk.argtypes = [POINTER(STRING), c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'obstack': ('Structure', (),
+        'obstack._fields_ = [\n'
+        ']'
+        ),
+    '__obstack_printf_chk': (None, ('obstack',),
+        "__obstack_printf_chk = _libraries['/usr/lib/libavcodec.so'].__obstack_printf_chk\n"
+        '__obstack_printf_chk.restype = c_int\n'
+        '__obstack_printf_chk.argtypes = [POINTER(obstack), c_int, STRING]'
+        ),
+    '__obstack_vprintf_chk': (None, ('__va_list_tag', 'obstack'),
+        "__obstack_vprintf_chk = _libraries['/usr/lib/libavcodec.so'].__obstack_vprintf_chk\n"
+        '__obstack_vprintf_chk.restype = c_int\n'
+        '__obstack_vprintf_chk.argtypes = [POINTER(obstack), c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'asprintf': (None, (),
+        "asprintf = _libraries['/usr/lib/libavcodec.so'].asprintf\n"
+        'asprintf.restype = c_int\n'
+        'asprintf.argtypes = [POINTER(STRING), STRING]'
+        ),
+    '__asprintf': (None, (),
+        "__asprintf = _libraries['/usr/lib/libavcodec.so'].__asprintf\n"
+        '__asprintf.restype = c_int\n'
+        '__asprintf.argtypes = [POINTER(STRING), STRING]'
+        ),
+    'obstack_printf': (None, ('obstack',),
+        "obstack_printf = _libraries['/usr/lib/libavcodec.so'].obstack_printf\n"
+        'obstack_printf.restype = c_int\n'
+        'obstack_printf.argtypes = [POINTER(obstack), STRING]'
+        ),
+    'vasprintf': (None, ('__va_list_tag',),
+        "vasprintf = _libraries['/usr/lib/libavcodec.so'].vasprintf\n"
+        'vasprintf.restype = c_int\n'
+        'vasprintf.argtypes = [POINTER(STRING), STRING, POINTER(__va_list_tag)]'
+        ),
+    'obstack_vprintf': (None, ('__va_list_tag', 'obstack'),
+        "obstack_vprintf = _libraries['/usr/lib/libavcodec.so'].obstack_vprintf\n"
+        'obstack_vprintf.restype = c_int\n'
+        'obstack_vprintf.argtypes = [POINTER(obstack), STRING, POINTER(__va_list_tag)]'
+        ),
+    '__fgets_chk': (None, ('FILE',),
+        "__fgets_chk = _libraries['/usr/lib/libavcodec.so'].__fgets_chk\n"
+        '__fgets_chk.restype = STRING\n'
+        '__fgets_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]'
+        ),
+    'fgets': (None, ('FILE',),
+        "fgets = _libraries['/usr/lib/libavcodec.so'].fgets\n"
+        'fgets.restype = STRING\n'
+        'fgets.argtypes = [STRING, c_int, POINTER(FILE)]'
+        ),
+    '__fread_chk': (None, ('FILE',),
+        "__fread_chk = _libraries['/usr/lib/libavcodec.so'].__fread_chk\n"
+        '__fread_chk.restype = size_t\n'
+        '__fread_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fread': (None, ('FILE',),
+        "fread = _libraries['/usr/lib/libavcodec.so'].fread\n"
+        'fread.restype = size_t\n'
+        'fread.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    '__fgets_unlocked_chk': (None, ('FILE',),
+        "__fgets_unlocked_chk = _libraries['/usr/lib/libavcodec.so'].__fgets_unlocked_chk\n"
+        '__fgets_unlocked_chk.restype = STRING\n'
+        '__fgets_unlocked_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]'
+        ),
+    'fgets_unlocked': (None, ('FILE',),
+        "fgets_unlocked = _libraries['/usr/lib/libavcodec.so'].fgets_unlocked\n"
+        'fgets_unlocked.restype = STRING\n'
+        'fgets_unlocked.argtypes = [STRING, c_int, POINTER(FILE)]'
+        ),
+    '__fread_unlocked_chk': (None, ('FILE',),
+        "__fread_unlocked_chk = _libraries['/usr/lib/libavcodec.so'].__fread_unlocked_chk\n"
+        '__fread_unlocked_chk.restype = size_t\n'
+        '__fread_unlocked_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fread_unlocked': (None, ('FILE',),
+        "fread_unlocked = _libraries['/usr/lib/libavcodec.so'].fread_unlocked\n"
+        'fread_unlocked.restype = size_t\n'
+        'fread_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'atof': (None, (),
+        "atof = _libraries['/usr/lib/libavcodec.so'].atof\n"
+        'atof.restype = c_double\n'
+        'atof.argtypes = [STRING]'
+        ),
+    '__realpath_chk': (None, (),
+        "__realpath_chk = _libraries['/usr/lib/libavcodec.so'].__realpath_chk\n"
+        '__realpath_chk.restype = STRING\n'
+        '__realpath_chk.argtypes = [STRING, STRING, size_t]'
+        ),
+    'realpath': (None, (),
+        "realpath = _libraries['/usr/lib/libavcodec.so'].realpath\n"
+        'realpath.restype = STRING\n'
+        'realpath.argtypes = [STRING, STRING]'
+        ),
+    '__ptsname_r_chk': (None, (),
+        "__ptsname_r_chk = _libraries['/usr/lib/libavcodec.so'].__ptsname_r_chk\n"
+        '__ptsname_r_chk.restype = c_int\n'
+        '__ptsname_r_chk.argtypes = [c_int, STRING, size_t, size_t]'
+        ),
+    'ptsname_r': (None, (),
+        "ptsname_r = _libraries['/usr/lib/libavcodec.so'].ptsname_r\n"
+        'ptsname_r.restype = c_int\n'
+        'ptsname_r.argtypes = [c_int, STRING, size_t]'
+        ),
+    '__wctomb_chk': (None, (),
+        "__wctomb_chk = _libraries['/usr/lib/libavcodec.so'].__wctomb_chk\n"
+        '__wctomb_chk.restype = c_int\n'
+        '__wctomb_chk.argtypes = [STRING, c_wchar, size_t]'
+        ),
+    'wctomb': (None, (),
+        "wctomb = _libraries['/usr/lib/libavcodec.so'].wctomb\n"
+        'wctomb.restype = c_int\n'
+        'wctomb.argtypes = [STRING, c_wchar]'
+        ),
+    '__mbstowcs_chk': (None, (),
+        "__mbstowcs_chk = _libraries['/usr/lib/libavcodec.so'].__mbstowcs_chk\n"
+        '__mbstowcs_chk.restype = size_t\n'
+        '__mbstowcs_chk.argtypes = [WSTRING, STRING, size_t, size_t]'
+        ),
+    'mbstowcs': (None, (),
+        "mbstowcs = _libraries['/usr/lib/libavcodec.so'].mbstowcs\n"
+        'mbstowcs.restype = size_t\n'
+        'mbstowcs.argtypes = [WSTRING, STRING, size_t]'
+        ),
+    '__wcstombs_chk': (None, (),
+        "__wcstombs_chk = _libraries['/usr/lib/libavcodec.so'].__wcstombs_chk\n"
+        '__wcstombs_chk.restype = size_t\n'
+        '__wcstombs_chk.argtypes = [STRING, WSTRING, size_t, size_t]'
+        ),
+    'wcstombs': (None, (),
+        "wcstombs = _libraries['/usr/lib/libavcodec.so'].wcstombs\n"
+        'wcstombs.restype = size_t\n'
+        'wcstombs.argtypes = [STRING, WSTRING, size_t]'
+        ),
+    'memcpy': (None, (),
+        "memcpy = _libraries['/usr/lib/libavcodec.so'].memcpy\n"
+        'memcpy.restype = c_void_p\n'
+        'memcpy.argtypes = [c_void_p, c_void_p, size_t]'
+        ),
+    'memmove': (None, (),
+        "memmove = _libraries['/usr/lib/libavcodec.so'].memmove\n"
+        'memmove.restype = c_void_p\n'
+        'memmove.argtypes = [c_void_p, c_void_p, size_t]'
+        ),
+    'mempcpy': (None, (),
+        "mempcpy = _libraries['/usr/lib/libavcodec.so'].mempcpy\n"
+        'mempcpy.restype = c_void_p\n'
+        'mempcpy.argtypes = [c_void_p, c_void_p, size_t]'
+        ),
+    'memset': (None, (),
+        "memset = _libraries['/usr/lib/libavcodec.so'].memset\n"
+        'memset.restype = c_void_p\n'
+        'memset.argtypes = [c_void_p, c_int, size_t]'
+        ),
+    'bcopy': (None, (),
+        "bcopy = _libraries['/usr/lib/libavcodec.so'].bcopy\n"
+        'bcopy.restype = None\n'
+        'bcopy.argtypes = [c_void_p, c_void_p, size_t]'
+        ),
+    'bzero': (None, (),
+        "bzero = _libraries['/usr/lib/libavcodec.so'].bzero\n"
+        'bzero.restype = None\n'
+        'bzero.argtypes = [c_void_p, size_t]'
+        ),
+    'strcpy': (None, (),
+        "strcpy = _libraries['/usr/lib/libavcodec.so'].strcpy\n"
+        'strcpy.restype = STRING\n'
+        'strcpy.argtypes = [STRING, STRING]'
+        ),
+    'stpcpy': (None, (),
+        "stpcpy = _libraries['/usr/lib/libavcodec.so'].stpcpy\n"
+        'stpcpy.restype = STRING\n'
+        'stpcpy.argtypes = [STRING, STRING]'
+        ),
+    'strncpy': (None, (),
+        "strncpy = _libraries['/usr/lib/libavcodec.so'].strncpy\n"
+        'strncpy.restype = STRING\n'
+        'strncpy.argtypes = [STRING, STRING, size_t]'
+        ),
+    '__stpncpy_chk': (None, (),
+        "__stpncpy_chk = _libraries['/usr/lib/libavcodec.so'].__stpncpy_chk\n"
+        '__stpncpy_chk.restype = STRING\n'
+        '__stpncpy_chk.argtypes = [STRING, STRING, size_t, size_t]'
+        ),
+    'stpncpy': (None, (),
+        "stpncpy = _libraries['/usr/lib/libavcodec.so'].stpncpy\n"
+        'stpncpy.restype = STRING\n'
+        'stpncpy.argtypes = [STRING, STRING, size_t]'
+        ),
+    'strcat': (None, (),
+        "strcat = _libraries['/usr/lib/libavcodec.so'].strcat\n"
+        'strcat.restype = STRING\n'
+        'strcat.argtypes = [STRING, STRING]'
+        ),
+    'strncat': (None, (),
+        "strncat = _libraries['/usr/lib/libavcodec.so'].strncat\n"
+        'strncat.restype = STRING\n'
+        'strncat.argtypes = [STRING, STRING, size_t]'
+        ),
+    'sys_nerr': (None, (),
+        "sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libavcodec.so'], 'sys_nerr')"
+        ),
+    'sys_errlist': (None, (),
+        "sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libavcodec.so'], 'sys_errlist')"
+        ),
+    '_sys_nerr': (None, (),
+        "_sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libavcodec.so'], '_sys_nerr')"
+        ),
+    '_sys_errlist': (None, (),
+        "_sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libavcodec.so'], '_sys_errlist')"
+        ),
+    'timeval': ('Structure', (),
+        'timeval._fields_ = [\n'
+        "    ('tv_sec', __time_t),\n"
+        "    ('tv_usec', __suseconds_t),\n"
+        ']'
+        ),
+    '__fsid_t': ('Structure', (),
+        '__fsid_t._fields_ = [\n'
+        "    ('__val', c_int * 2),\n"
+        ']'
+        ),
+    'wait': ('Union', ('N4wait4DOT_10E', 'N4wait4DOT_11E'),
+        'wait._fields_ = [\n'
+        "    ('w_status', c_int),\n"
+        "    ('__wait_terminated', N4wait4DOT_10E),\n"
+        "    ('__wait_stopped', N4wait4DOT_11E),\n"
+        ']'
+        ),
+    'N4wait4DOT_10E': ('Structure', (),
+        'N4wait4DOT_10E._fields_ = [\n'
+        "    ('__w_termsig', c_uint, 7),\n"
+        "    ('__w_coredump', c_uint, 1),\n"
+        "    ('__w_retcode', c_uint, 8),\n"
+        "    ('', c_uint, 16),\n"
+        ']'
+        ),
+    'N4wait4DOT_11E': ('Structure', (),
+        'N4wait4DOT_11E._fields_ = [\n'
+        "    ('__w_stopval', c_uint, 8),\n"
+        "    ('__w_stopsig', c_uint, 8),\n"
+        "    ('', c_uint, 16),\n"
+        ']'
+        ),
+    'program_invocation_name': (None, (),
+        "program_invocation_name = (STRING).in_dll(_libraries['/usr/lib/libavcodec.so'], 'program_invocation_name')"
+        ),
+    'program_invocation_short_name': (None, (),
+        "program_invocation_short_name = (STRING).in_dll(_libraries['/usr/lib/libavcodec.so'], 'program_invocation_short_name')"
+        ),
+    'imaxdiv_t': ('Structure', (),
+        'imaxdiv_t._fields_ = [\n'
+        "    ('quot', c_long),\n"
+        "    ('rem', c_long),\n"
+        ']'
+        ),
+    'imaxabs': (None, (),
+        "imaxabs = _libraries['/usr/lib/libavcodec.so'].imaxabs\n"
+        'imaxabs.restype = intmax_t\n'
+        'imaxabs.argtypes = [intmax_t]'
+        ),
+    'imaxdiv': (None, ('imaxdiv_t',),
+        "imaxdiv = _libraries['/usr/lib/libavcodec.so'].imaxdiv\n"
+        'imaxdiv.restype = imaxdiv_t\n'
+        'imaxdiv.argtypes = [intmax_t, intmax_t]'
+        ),
+    '__strtol_internal': (None, (),
+        "__strtol_internal = _libraries['/usr/lib/libavcodec.so'].__strtol_internal\n"
+        '__strtol_internal.restype = c_long\n'
+        '__strtol_internal.argtypes = [STRING, POINTER(STRING), c_int, c_int]'
+        ),
+    'strtoimax': (None, (),
+        "strtoimax = _libraries['/usr/lib/libavcodec.so'].strtoimax\n"
+        'strtoimax.restype = intmax_t\n'
+        'strtoimax.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    '__strtoul_internal': (None, (),
+        "__strtoul_internal = _libraries['/usr/lib/libavcodec.so'].__strtoul_internal\n"
+        '__strtoul_internal.restype = c_ulong\n'
+        '__strtoul_internal.argtypes = [STRING, POINTER(STRING), c_int, c_int]'
+        ),
+    'strtoumax': (None, (),
+        "strtoumax = _libraries['/usr/lib/libavcodec.so'].strtoumax\n"
+        'strtoumax.restype = uintmax_t\n'
+        'strtoumax.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    '__wcstol_internal': (None, (),
+        "__wcstol_internal = _libraries['/usr/lib/libavcodec.so'].__wcstol_internal\n"
+        '__wcstol_internal.restype = c_long\n'
+        '__wcstol_internal.argtypes = [WSTRING, POINTER(WSTRING), c_int, c_int]'
+        ),
+    'wcstoimax': (None, (),
+        "wcstoimax = _libraries['/usr/lib/libavcodec.so'].wcstoimax\n"
+        'wcstoimax.restype = intmax_t\n'
+        'wcstoimax.argtypes = [WSTRING, POINTER(WSTRING), c_int]'
+        ),
+    '__wcstoul_internal': (None, (),
+        "__wcstoul_internal = _libraries['/usr/lib/libavcodec.so'].__wcstoul_internal\n"
+        '__wcstoul_internal.restype = c_ulong\n'
+        '__wcstoul_internal.argtypes = [WSTRING, POINTER(WSTRING), c_int, c_int]'
+        ),
+    'wcstoumax': (None, (),
+        "wcstoumax = _libraries['/usr/lib/libavcodec.so'].wcstoumax\n"
+        'wcstoumax.restype = uintmax_t\n'
+        'wcstoumax.argtypes = [WSTRING, POINTER(WSTRING), c_int]'
+        ),
+    'AVCodecDescriptor': ('Structure', (),
+        'AVCodecDescriptor._fields_ = [\n'
+        "    ('id', AVCodecID),\n"
+        "    ('type', AVMediaType),\n"
+        "    ('name', STRING),\n"
+        "    ('long_name', STRING),\n"
+        "    ('props', c_int),\n"
+        ']'
+        ),
+    'RcOverride': ('Structure', (),
+        'RcOverride._fields_ = [\n'
+        "    ('start_frame', c_int),\n"
+        "    ('end_frame', c_int),\n"
+        "    ('qscale', c_int),\n"
+        "    ('quality_factor', c_float),\n"
+        ']'
+        ),
+    'AVPanScan': ('Structure', (),
+        'AVPanScan._fields_ = [\n'
+        "    ('id', c_int),\n"
+        "    ('width', c_int),\n"
+        "    ('height', c_int),\n"
+        "    ('position', int16_t * 2 * 3),\n"
+        ']'
+        ),
+    'AVPacket': ('Structure', ('AVBufferRef', 'N8AVPacket4DOT_28E'),
+        'AVPacket._fields_ = [\n'
+        "    ('buf', POINTER(AVBufferRef)),\n"
+        "    ('pts', int64_t),\n"
+        "    ('dts', int64_t),\n"
+        "    ('data', POINTER(uint8_t)),\n"
+        "    ('size', c_int),\n"
+        "    ('stream_index', c_int),\n"
+        "    ('flags', c_int),\n"
+        "    ('side_data', POINTER(N8AVPacket4DOT_28E)),\n"
+        "    ('side_data_elems', c_int),\n"
+        "    ('duration', c_int),\n"
+        "    ('destruct', CFUNCTYPE(None, POINTER(AVPacket))),\n"
+        "    ('priv', c_void_p),\n"
+        "    ('pos', int64_t),\n"
+        "    ('convergence_duration', int64_t),\n"
+        ']'
+        ),
+    'AVBufferRef': ('Structure', ('AVBuffer',),
+        'AVBufferRef._fields_ = [\n'
+        "    ('buffer', POINTER(AVBuffer)),\n"
+        "    ('data', POINTER(uint8_t)),\n"
+        "    ('size', c_int),\n"
+        ']'
+        ),
+    'N8AVPacket4DOT_28E': ('Structure', (),
+        'N8AVPacket4DOT_28E._fields_ = [\n'
+        "    ('data', POINTER(uint8_t)),\n"
+        "    ('size', c_int),\n"
+        "    ('type', AVPacketSideDataType),\n"
+        ']'
+        ),
+    'AVCodecInternal': ('Structure', (),
+        'AVCodecInternal._fields_ = [\n'
+        ']'
+        ),
+    'AVCodecContext': ('Structure', ('AVClass', 'AVCodec', 'AVCodecDescriptor', 'AVCodecInternal', 'AVFrame', 'AVHWAccel', 'AVPacket', 'AVRational', 'RcOverride'),
+        'AVCodecContext._fields_ = [\n'
+        "    ('av_class', POINTER(AVClass)),\n"
+        "    ('log_level_offset', c_int),\n"
+        "    ('codec_type', AVMediaType),\n"
+        "    ('codec', POINTER(AVCodec)),\n"
+        "    ('codec_name', c_char * 32),\n"
+        "    ('codec_id', AVCodecID),\n"
+        "    ('codec_tag', c_uint),\n"
+        "    ('stream_codec_tag', c_uint),\n"
+        "    ('priv_data', c_void_p),\n"
+        "    ('internal', POINTER(AVCodecInternal)),\n"
+        "    ('opaque', c_void_p),\n"
+        "    ('bit_rate', c_int),\n"
+        "    ('bit_rate_tolerance', c_int),\n"
+        "    ('global_quality', c_int),\n"
+        "    ('compression_level', c_int),\n"
+        "    ('flags', c_int),\n"
+        "    ('flags2', c_int),\n"
+        "    ('extradata', POINTER(uint8_t)),\n"
+        "    ('extradata_size', c_int),\n"
+        "    ('time_base', AVRational),\n"
+        "    ('ticks_per_frame', c_int),\n"
+        "    ('delay', c_int),\n"
+        "    ('width', c_int),\n"
+        "    ('height', c_int),\n"
+        "    ('coded_width', c_int),\n"
+        "    ('coded_height', c_int),\n"
+        "    ('gop_size', c_int),\n"
+        "    ('pix_fmt', AVPixelFormat),\n"
+        "    ('me_method', c_int),\n"
+        "    ('draw_horiz_band', CFUNCTYPE(None, POINTER(AVCodecContext), POINTER(AVFrame), POINTER(c_int), c_int, c_int, c_int)),\n"
+        "    ('get_format', CFUNCTYPE(AVPixelFormat, POINTER(AVCodecContext), POINTER(AVPixelFormat))),\n"
+        "    ('max_b_frames', c_int),\n"
+        "    ('b_quant_factor', c_float),\n"
+        "    ('rc_strategy', c_int),\n"
+        "    ('b_frame_strategy', c_int),\n"
+        "    ('b_quant_offset', c_float),\n"
+        "    ('has_b_frames', c_int),\n"
+        "    ('mpeg_quant', c_int),\n"
+        "    ('i_quant_factor', c_float),\n"
+        "    ('i_quant_offset', c_float),\n"
+        "    ('lumi_masking', c_float),\n"
+        "    ('temporal_cplx_masking', c_float),\n"
+        "    ('spatial_cplx_masking', c_float),\n"
+        "    ('p_masking', c_float),\n"
+        "    ('dark_masking', c_float),\n"
+        "    ('slice_count', c_int),\n"
+        "    ('prediction_method', c_int),\n"
+        "    ('slice_offset', POINTER(c_int)),\n"
+        "    ('sample_aspect_ratio', AVRational),\n"
+        "    ('me_cmp', c_int),\n"
+        "    ('me_sub_cmp', c_int),\n"
+        "    ('mb_cmp', c_int),\n"
+        "    ('ildct_cmp', c_int),\n"
+        "    ('dia_size', c_int),\n"
+        "    ('last_predictor_count', c_int),\n"
+        "    ('pre_me', c_int),\n"
+        "    ('me_pre_cmp', c_int),\n"
+        "    ('pre_dia_size', c_int),\n"
+        "    ('me_subpel_quality', c_int),\n"
+        "    ('dtg_active_format', c_int),\n"
+        "    ('me_range', c_int),\n"
+        "    ('intra_quant_bias', c_int),\n"
+        "    ('inter_quant_bias', c_int),\n"
+        "    ('slice_flags', c_int),\n"
+        "    ('xvmc_acceleration', c_int),\n"
+        "    ('mb_decision', c_int),\n"
+        "    ('intra_matrix', POINTER(uint16_t)),\n"
+        "    ('inter_matrix', POINTER(uint16_t)),\n"
+        "    ('scenechange_threshold', c_int),\n"
+        "    ('noise_reduction', c_int),\n"
+        "    ('me_threshold', c_int),\n"
+        "    ('mb_threshold', c_int),\n"
+        "    ('intra_dc_precision', c_int),\n"
+        "    ('skip_top', c_int),\n"
+        "    ('skip_bottom', c_int),\n"
+        "    ('border_masking', c_float),\n"
+        "    ('mb_lmin', c_int),\n"
+        "    ('mb_lmax', c_int),\n"
+        "    ('me_penalty_compensation', c_int),\n"
+        "    ('bidir_refine', c_int),\n"
+        "    ('brd_scale', c_int),\n"
+        "    ('keyint_min', c_int),\n"
+        "    ('refs', c_int),\n"
+        "    ('chromaoffset', c_int),\n"
+        "    ('scenechange_factor', c_int),\n"
+        "    ('mv0_threshold', c_int),\n"
+        "    ('b_sensitivity', c_int),\n"
+        "    ('color_primaries', AVColorPrimaries),\n"
+        "    ('color_trc', AVColorTransferCharacteristic),\n"
+        "    ('colorspace', AVColorSpace),\n"
+        "    ('color_range', AVColorRange),\n"
+        "    ('chroma_sample_location', AVChromaLocation),\n"
+        "    ('slices', c_int),\n"
+        "    ('field_order', AVFieldOrder),\n"
+        "    ('sample_rate', c_int),\n"
+        "    ('channels', c_int),\n"
+        "    ('sample_fmt', AVSampleFormat),\n"
+        "    ('frame_size', c_int),\n"
+        "    ('frame_number', c_int),\n"
+        "    ('block_align', c_int),\n"
+        "    ('cutoff', c_int),\n"
+        "    ('request_channels', c_int),\n"
+        "    ('channel_layout', uint64_t),\n"
+        "    ('request_channel_layout', uint64_t),\n"
+        "    ('audio_service_type', AVAudioServiceType),\n"
+        "    ('request_sample_fmt', AVSampleFormat),\n"
+        "    ('get_buffer', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(AVFrame))),\n"
+        "    ('release_buffer', CFUNCTYPE(None, POINTER(AVCodecContext), POINTER(AVFrame))),\n"
+        "    ('reget_buffer', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(AVFrame))),\n"
+        "    ('get_buffer2', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(AVFrame), c_int)),\n"
+        "    ('refcounted_frames', c_int),\n"
+        "    ('qcompress', c_float),\n"
+        "    ('qblur', c_float),\n"
+        "    ('qmin', c_int),\n"
+        "    ('qmax', c_int),\n"
+        "    ('max_qdiff', c_int),\n"
+        "    ('rc_qsquish', c_float),\n"
+        "    ('rc_qmod_amp', c_float),\n"
+        "    ('rc_qmod_freq', c_int),\n"
+        "    ('rc_buffer_size', c_int),\n"
+        "    ('rc_override_count', c_int),\n"
+        "    ('rc_override', POINTER(RcOverride)),\n"
+        "    ('rc_eq', STRING),\n"
+        "    ('rc_max_rate', c_int),\n"
+        "    ('rc_min_rate', c_int),\n"
+        "    ('rc_buffer_aggressivity', c_float),\n"
+        "    ('rc_initial_cplx', c_float),\n"
+        "    ('rc_max_available_vbv_use', c_float),\n"
+        "    ('rc_min_vbv_overflow_use', c_float),\n"
+        "    ('rc_initial_buffer_occupancy', c_int),\n"
+        "    ('coder_type', c_int),\n"
+        "    ('context_model', c_int),\n"
+        "    ('lmin', c_int),\n"
+        "    ('lmax', c_int),\n"
+        "    ('frame_skip_threshold', c_int),\n"
+        "    ('frame_skip_factor', c_int),\n"
+        "    ('frame_skip_exp', c_int),\n"
+        "    ('frame_skip_cmp', c_int),\n"
+        "    ('trellis', c_int),\n"
+        "    ('min_prediction_order', c_int),\n"
+        "    ('max_prediction_order', c_int),\n"
+        "    ('timecode_frame_start', int64_t),\n"
+        "    ('rtp_callback', CFUNCTYPE(None, POINTER(AVCodecContext), c_void_p, c_int, c_int)),\n"
+        "    ('rtp_payload_size', c_int),\n"
+        "    ('mv_bits', c_int),\n"
+        "    ('header_bits', c_int),\n"
+        "    ('i_tex_bits', c_int),\n"
+        "    ('p_tex_bits', c_int),\n"
+        "    ('i_count', c_int),\n"
+        "    ('p_count', c_int),\n"
+        "    ('skip_count', c_int),\n"
+        "    ('misc_bits', c_int),\n"
+        "    ('frame_bits', c_int),\n"
+        "    ('stats_out', STRING),\n"
+        "    ('stats_in', STRING),\n"
+        "    ('workaround_bugs', c_int),\n"
+        "    ('strict_std_compliance', c_int),\n"
+        "    ('error_concealment', c_int),\n"
+        "    ('debug', c_int),\n"
+        "    ('debug_mv', c_int),\n"
+        "    ('err_recognition', c_int),\n"
+        "    ('reordered_opaque', int64_t),\n"
+        "    ('hwaccel', POINTER(AVHWAccel)),\n"
+        "    ('hwaccel_context', c_void_p),\n"
+        "    ('error', uint64_t * 8),\n"
+        "    ('dct_algo', c_int),\n"
+        "    ('idct_algo', c_int),\n"
+        "    ('bits_per_coded_sample', c_int),\n"
+        "    ('bits_per_raw_sample', c_int),\n"
+        "    ('lowres', c_int),\n"
+        "    ('coded_frame', POINTER(AVFrame)),\n"
+        "    ('thread_count', c_int),\n"
+        "    ('thread_type', c_int),\n"
+        "    ('active_thread_type', c_int),\n"
+        "    ('thread_safe_callbacks', c_int),\n"
+        "    ('execute', CFUNCTYPE(c_int, POINTER(AVCodecContext), CFUNCTYPE(c_int, POINTER(AVCodecContext), c_void_p), c_void_p, POINTER(c_int), c_int, c_int)),\n"
+        "    ('execute2', CFUNCTYPE(c_int, POINTER(AVCodecContext), CFUNCTYPE(c_int, POINTER(AVCodecContext), c_void_p, c_int, c_int), c_void_p, POINTER(c_int), c_int)),\n"
+        "    ('thread_opaque', c_void_p),\n"
+        "    ('nsse_weight', c_int),\n"
+        "    ('profile', c_int),\n"
+        "    ('level', c_int),\n"
+        "    ('skip_loop_filter', AVDiscard),\n"
+        "    ('skip_idct', AVDiscard),\n"
+        "    ('skip_frame', AVDiscard),\n"
+        "    ('subtitle_header', POINTER(uint8_t)),\n"
+        "    ('subtitle_header_size', c_int),\n"
+        "    ('error_rate', c_int),\n"
+        "    ('pkt', POINTER(AVPacket)),\n"
+        "    ('vbv_delay', uint64_t),\n"
+        "    ('pkt_timebase', AVRational),\n"
+        "    ('codec_descriptor', POINTER(AVCodecDescriptor)),\n"
+        "    ('pts_correction_num_faulty_pts', int64_t),\n"
+        "    ('pts_correction_num_faulty_dts', int64_t),\n"
+        "    ('pts_correction_last_pts', int64_t),\n"
+        "    ('pts_correction_last_dts', int64_t),\n"
+        "    ('sub_charenc', STRING),\n"
+        "    ('sub_charenc_mode', c_int),\n"
+        ']'
+        ),
+    'AVClass': ('Structure', ('AVOption', 'AVOptionRanges'),
+        'AVClass._fields_ = [\n'
+        "    ('class_name', STRING),\n"
+        "    ('item_name', CFUNCTYPE(STRING, c_void_p)),\n"
+        "    ('option', POINTER(AVOption)),\n"
+        "    ('version', c_int),\n"
+        "    ('log_level_offset_offset', c_int),\n"
+        "    ('parent_log_context_offset', c_int),\n"
+        "    ('child_next', CFUNCTYPE(c_void_p, c_void_p, c_void_p)),\n"
+        "    ('child_class_next', CFUNCTYPE(POINTER(AVClass), POINTER(AVClass))),\n"
+        "    ('category', AVClassCategory),\n"
+        "    ('get_category', CFUNCTYPE(AVClassCategory, c_void_p)),\n"
+        "    ('query_ranges', CFUNCTYPE(c_int, POINTER(POINTER(AVOptionRanges)), c_void_p, STRING, c_int)),\n"
+        ']'
+        ),
+    'AVCodec': ('Structure', ('AVClass', 'AVCodecContext', 'AVCodecDefault', 'AVFrame', 'AVPacket', 'AVProfile', 'AVRational', 'AVSubtitle'),
+        'AVCodec._fields_ = [\n'
+        "    ('name', STRING),\n"
+        "    ('long_name', STRING),\n"
+        "    ('type', AVMediaType),\n"
+        "    ('id', AVCodecID),\n"
+        "    ('capabilities', c_int),\n"
+        "    ('supported_framerates', POINTER(AVRational)),\n"
+        "    ('pix_fmts', POINTER(AVPixelFormat)),\n"
+        "    ('supported_samplerates', POINTER(c_int)),\n"
+        "    ('sample_fmts', POINTER(AVSampleFormat)),\n"
+        "    ('channel_layouts', POINTER(uint64_t)),\n"
+        "    ('max_lowres', uint8_t),\n"
+        "    ('priv_class', POINTER(AVClass)),\n"
+        "    ('profiles', POINTER(AVProfile)),\n"
+        "    ('priv_data_size', c_int),\n"
+        "    ('next', POINTER(AVCodec)),\n"
+        "    ('init_thread_copy', CFUNCTYPE(c_int, POINTER(AVCodecContext))),\n"
+        "    ('update_thread_context', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(AVCodecContext))),\n"
+        "    ('defaults', POINTER(AVCodecDefault)),\n"
+        "    ('init_static_data', CFUNCTYPE(None, POINTER(AVCodec))),\n"
+        "    ('init', CFUNCTYPE(c_int, POINTER(AVCodecContext))),\n"
+        "    ('encode_sub', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(uint8_t), c_int, POINTER(AVSubtitle))),\n"
+        "    ('encode2', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(AVPacket), POINTER(AVFrame), POINTER(c_int))),\n"
+        "    ('decode', CFUNCTYPE(c_int, POINTER(AVCodecContext), c_void_p, POINTER(c_int), POINTER(AVPacket))),\n"
+        "    ('close', CFUNCTYPE(c_int, POINTER(AVCodecContext))),\n"
+        "    ('flush', CFUNCTYPE(None, POINTER(AVCodecContext))),\n"
+        ']'
+        ),
+    'AVRational': ('Structure', (),
+        'AVRational._fields_ = [\n'
+        "    ('num', c_int),\n"
+        "    ('den', c_int),\n"
+        ']'
+        ),
+    'AVProfile': ('Structure', (),
+        'AVProfile._fields_ = [\n'
+        "    ('profile', c_int),\n"
+        "    ('name', STRING),\n"
+        ']'
+        ),
+    'AVCodecDefault': ('Structure', (),
+        'AVCodecDefault._fields_ = [\n'
+        ']'
+        ),
+    'AVSubtitle': ('Structure', ('AVSubtitleRect',),
+        'AVSubtitle._fields_ = [\n'
+        "    ('format', uint16_t),\n"
+        "    ('start_display_time', uint32_t),\n"
+        "    ('end_display_time', uint32_t),\n"
+        "    ('num_rects', c_uint),\n"
+        "    ('rects', POINTER(POINTER(AVSubtitleRect))),\n"
+        "    ('pts', int64_t),\n"
+        ']'
+        ),
+    'AVSubtitleRect': ('Structure', ('AVPicture',),
+        'AVSubtitleRect._fields_ = [\n'
+        "    ('x', c_int),\n"
+        "    ('y', c_int),\n"
+        "    ('w', c_int),\n"
+        "    ('h', c_int),\n"
+        "    ('nb_colors', c_int),\n"
+        "    ('pict', AVPicture),\n"
+        "    ('type', AVSubtitleType),\n"
+        "    ('text', STRING),\n"
+        "    ('ass', STRING),\n"
+        "    ('flags', c_int),\n"
+        ']'
+        ),
+    'AVFrame': ('Structure', ('AVBufferRef', 'AVCodecContext', 'AVDictionary', 'AVFrameSideData', 'AVPanScan', 'AVRational'),
+        'AVFrame._fields_ = [\n'
+        "    ('data', POINTER(uint8_t) * 8),\n"
+        "    ('linesize', c_int * 8),\n"
+        "    ('extended_data', POINTER(POINTER(uint8_t))),\n"
+        "    ('width', c_int),\n"
+        "    ('height', c_int),\n"
+        "    ('nb_samples', c_int),\n"
+        "    ('format', c_int),\n"
+        "    ('key_frame', c_int),\n"
+        "    ('pict_type', AVPictureType),\n"
+        "    ('base', POINTER(uint8_t) * 8),\n"
+        "    ('sample_aspect_ratio', AVRational),\n"
+        "    ('pts', int64_t),\n"
+        "    ('pkt_pts', int64_t),\n"
+        "    ('pkt_dts', int64_t),\n"
+        "    ('coded_picture_number', c_int),\n"
+        "    ('display_picture_number', c_int),\n"
+        "    ('quality', c_int),\n"
+        "    ('reference', c_int),\n"
+        "    ('qscale_table', POINTER(int8_t)),\n"
+        "    ('qstride', c_int),\n"
+        "    ('qscale_type', c_int),\n"
+        "    ('mbskip_table', POINTER(uint8_t)),\n"
+        "    ('motion_val', POINTER(int16_t * 2) * 2),\n"
+        "    ('mb_type', POINTER(uint32_t)),\n"
+        "    ('dct_coeff', POINTER(c_short)),\n"
+        "    ('ref_index', POINTER(int8_t) * 2),\n"
+        "    ('opaque', c_void_p),\n"
+        "    ('error', uint64_t * 8),\n"
+        "    ('type', c_int),\n"
+        "    ('repeat_pict', c_int),\n"
+        "    ('interlaced_frame', c_int),\n"
+        "    ('top_field_first', c_int),\n"
+        "    ('palette_has_changed', c_int),\n"
+        "    ('buffer_hints', c_int),\n"
+        "    ('pan_scan', POINTER(AVPanScan)),\n"
+        "    ('reordered_opaque', int64_t),\n"
+        "    ('hwaccel_picture_private', c_void_p),\n"
+        "    ('owner', POINTER(AVCodecContext)),\n"
+        "    ('thread_opaque', c_void_p),\n"
+        "    ('motion_subsample_log2', uint8_t),\n"
+        "    ('sample_rate', c_int),\n"
+        "    ('channel_layout', uint64_t),\n"
+        "    ('buf', POINTER(AVBufferRef) * 8),\n"
+        "    ('extended_buf', POINTER(POINTER(AVBufferRef))),\n"
+        "    ('nb_extended_buf', c_int),\n"
+        "    ('side_data', POINTER(POINTER(AVFrameSideData))),\n"
+        "    ('nb_side_data', c_int),\n"
+        "    ('best_effort_timestamp', int64_t),\n"
+        "    ('pkt_pos', int64_t),\n"
+        "    ('pkt_duration', int64_t),\n"
+        "    ('metadata', POINTER(AVDictionary)),\n"
+        "    ('decode_error_flags', c_int),\n"
+        "    ('channels', c_int),\n"
+        "    ('pkt_size', c_int),\n"
+        "    ('qp_table_buf', POINTER(AVBufferRef)),\n"
+        ']'
+        ),
+    'AVHWAccel': ('Structure', ('AVCodecContext',),
+        'AVHWAccel._fields_ = [\n'
+        "    ('name', STRING),\n"
+        "    ('type', AVMediaType),\n"
+        "    ('id', AVCodecID),\n"
+        "    ('pix_fmt', AVPixelFormat),\n"
+        "    ('capabilities', c_int),\n"
+        "    ('next', POINTER(AVHWAccel)),\n"
+        "    ('start_frame', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(uint8_t), uint32_t)),\n"
+        "    ('decode_slice', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(uint8_t), uint32_t)),\n"
+        "    ('end_frame', CFUNCTYPE(c_int, POINTER(AVCodecContext))),\n"
+        "    ('priv_data_size', c_int),\n"
+        ']'
+        ),
+    'av_codec_get_pkt_timebase': (None, ('AVCodecContext', 'AVRational'),
+        "av_codec_get_pkt_timebase = _libraries['/usr/lib/libavcodec.so'].av_codec_get_pkt_timebase\n"
+        'av_codec_get_pkt_timebase.restype = AVRational\n'
+        'av_codec_get_pkt_timebase.argtypes = [POINTER(AVCodecContext)]'
+        ),
+    'av_codec_set_pkt_timebase': (None, ('AVCodecContext', 'AVRational'),
+        "av_codec_set_pkt_timebase = _libraries['/usr/lib/libavcodec.so'].av_codec_set_pkt_timebase\n"
+        'av_codec_set_pkt_timebase.restype = None\n'
+        'av_codec_set_pkt_timebase.argtypes = [POINTER(AVCodecContext), AVRational]'
+        ),
+    'av_codec_get_codec_descriptor': (None, ('AVCodecContext', 'AVCodecDescriptor'),
+        "av_codec_get_codec_descriptor = _libraries['/usr/lib/libavcodec.so'].av_codec_get_codec_descriptor\n"
+        'av_codec_get_codec_descriptor.restype = POINTER(AVCodecDescriptor)\n'
+        'av_codec_get_codec_descriptor.argtypes = [POINTER(AVCodecContext)]'
+        ),
+    'av_codec_set_codec_descriptor': (None, ('AVCodecContext', 'AVCodecDescriptor'),
+        "av_codec_set_codec_descriptor = _libraries['/usr/lib/libavcodec.so'].av_codec_set_codec_descriptor\n"
+        'av_codec_set_codec_descriptor.restype = None\n'
+        'av_codec_set_codec_descriptor.argtypes = [POINTER(AVCodecContext), POINTER(AVCodecDescriptor)]'
+        ),
+    'av_codec_get_lowres': (None, ('AVCodecContext',),
+        "av_codec_get_lowres = _libraries['/usr/lib/libavcodec.so'].av_codec_get_lowres\n"
+        'av_codec_get_lowres.restype = c_int\n'
+        'av_codec_get_lowres.argtypes = [POINTER(AVCodecContext)]'
+        ),
+    'av_codec_set_lowres': (None, ('AVCodecContext',),
+        "av_codec_set_lowres = _libraries['/usr/lib/libavcodec.so'].av_codec_set_lowres\n"
+        'av_codec_set_lowres.restype = None\n'
+        'av_codec_set_lowres.argtypes = [POINTER(AVCodecContext), c_int]'
+        ),
+    'AVPicture': ('Structure', (),
+        'AVPicture._fields_ = [\n'
+        "    ('data', POINTER(uint8_t) * 8),\n"
+        "    ('linesize', c_int * 8),\n"
+        ']'
+        ),
+    'av_codec_next': (None, ('AVCodec',),
+        "av_codec_next = _libraries['/usr/lib/libavcodec.so'].av_codec_next\n"
+        'av_codec_next.restype = POINTER(AVCodec)\n'
+        'av_codec_next.argtypes = [POINTER(AVCodec)]'
+        ),
+    'avcodec_version': (None, (),
+        "avcodec_version = _libraries['/usr/lib/libavcodec.so'].avcodec_version\n"
+        'avcodec_version.restype = c_uint\n'
+        'avcodec_version.argtypes = []'
+        ),
+    'avcodec_configuration': (None, (),
+        "avcodec_configuration = _libraries['/usr/lib/libavcodec.so'].avcodec_configuration\n"
+        'avcodec_configuration.restype = STRING\n'
+        'avcodec_configuration.argtypes = []'
+        ),
+    'avcodec_license': (None, (),
+        "avcodec_license = _libraries['/usr/lib/libavcodec.so'].avcodec_license\n"
+        'avcodec_license.restype = STRING\n'
+        'avcodec_license.argtypes = []'
+        ),
+    'avcodec_register': (None, ('AVCodec',),
+        "avcodec_register = _libraries['/usr/lib/libavcodec.so'].avcodec_register\n"
+        'avcodec_register.restype = None\n'
+        'avcodec_register.argtypes = [POINTER(AVCodec)]'
+        ),
+    'avcodec_register_all': (None, (),
+        "avcodec_register_all = _libraries['/usr/lib/libavcodec.so'].avcodec_register_all\n"
+        'avcodec_register_all.restype = None\n'
+        'avcodec_register_all.argtypes = []'
+        ),
+    'avcodec_alloc_context3': (None, ('AVCodec', 'AVCodecContext'),
+        "avcodec_alloc_context3 = _libraries['/usr/lib/libavcodec.so'].avcodec_alloc_context3\n"
+        'avcodec_alloc_context3.restype = POINTER(AVCodecContext)\n'
+        'avcodec_alloc_context3.argtypes = [POINTER(AVCodec)]'
+        ),
+    'avcodec_get_context_defaults3': (None, ('AVCodec', 'AVCodecContext'),
+        "avcodec_get_context_defaults3 = _libraries['/usr/lib/libavcodec.so'].avcodec_get_context_defaults3\n"
+        'avcodec_get_context_defaults3.restype = c_int\n'
+        'avcodec_get_context_defaults3.argtypes = [POINTER(AVCodecContext), POINTER(AVCodec)]'
+        ),
+    'avcodec_get_class': (None, ('AVClass',),
+        "avcodec_get_class = _libraries['/usr/lib/libavcodec.so'].avcodec_get_class\n"
+        'avcodec_get_class.restype = POINTER(AVClass)\n'
+        'avcodec_get_class.argtypes = []'
+        ),
+    'avcodec_get_frame_class': (None, ('AVClass',),
+        "avcodec_get_frame_class = _libraries['/usr/lib/libavcodec.so'].avcodec_get_frame_class\n"
+        'avcodec_get_frame_class.restype = POINTER(AVClass)\n'
+        'avcodec_get_frame_class.argtypes = []'
+        ),
+    'avcodec_get_subtitle_rect_class': (None, ('AVClass',),
+        "avcodec_get_subtitle_rect_class = _libraries['/usr/lib/libavcodec.so'].avcodec_get_subtitle_rect_class\n"
+        'avcodec_get_subtitle_rect_class.restype = POINTER(AVClass)\n'
+        'avcodec_get_subtitle_rect_class.argtypes = []'
+        ),
+    'avcodec_copy_context': (None, ('AVCodecContext',),
+        "avcodec_copy_context = _libraries['/usr/lib/libavcodec.so'].avcodec_copy_context\n"
+        'avcodec_copy_context.restype = c_int\n'
+        'avcodec_copy_context.argtypes = [POINTER(AVCodecContext), POINTER(AVCodecContext)]'
+        ),
+    'avcodec_alloc_frame': (None, ('AVFrame',),
+        "avcodec_alloc_frame = _libraries['/usr/lib/libavcodec.so'].avcodec_alloc_frame\n"
+        'avcodec_alloc_frame.restype = POINTER(AVFrame)\n'
+        'avcodec_alloc_frame.argtypes = []'
+        ),
+    'avcodec_get_frame_defaults': (None, ('AVFrame',),
+        "avcodec_get_frame_defaults = _libraries['/usr/lib/libavcodec.so'].avcodec_get_frame_defaults\n"
+        'avcodec_get_frame_defaults.restype = None\n'
+        'avcodec_get_frame_defaults.argtypes = [POINTER(AVFrame)]'
+        ),
+    'avcodec_free_frame': (None, ('AVFrame',),
+        "avcodec_free_frame = _libraries['/usr/lib/libavcodec.so'].avcodec_free_frame\n"
+        'avcodec_free_frame.restype = None\n'
+        'avcodec_free_frame.argtypes = [POINTER(POINTER(AVFrame))]'
+        ),
+    'AVDictionary': ('Structure', (),
+        'AVDictionary._fields_ = [\n'
+        ']'
+        ),
+    'avcodec_open2': (None, ('AVCodec', 'AVCodecContext', 'AVDictionary'),
+        "avcodec_open2 = _libraries['/usr/lib/libavcodec.so'].avcodec_open2\n"
+        'avcodec_open2.restype = c_int\n'
+        'avcodec_open2.argtypes = [POINTER(AVCodecContext), POINTER(AVCodec), POINTER(POINTER(AVDictionary))]'
+        ),
+    'avcodec_close': (None, ('AVCodecContext',),
+        "avcodec_close = _libraries['/usr/lib/libavcodec.so'].avcodec_close\n"
+        'avcodec_close.restype = c_int\n'
+        'avcodec_close.argtypes = [POINTER(AVCodecContext)]'
+        ),
+    'avsubtitle_free': (None, ('AVSubtitle',),
+        "avsubtitle_free = _libraries['/usr/lib/libavcodec.so'].avsubtitle_free\n"
+        'avsubtitle_free.restype = None\n'
+        'avsubtitle_free.argtypes = [POINTER(AVSubtitle)]'
+        ),
+    'av_destruct_packet': (None, ('AVPacket',),
+        "av_destruct_packet = _libraries['/usr/lib/libavcodec.so'].av_destruct_packet\n"
+        'av_destruct_packet.restype = None\n'
+        'av_destruct_packet.argtypes = [POINTER(AVPacket)]'
+        ),
+    'av_init_packet': (None, ('AVPacket',),
+        "av_init_packet = _libraries['/usr/lib/libavcodec.so'].av_init_packet\n"
+        'av_init_packet.restype = None\n'
+        'av_init_packet.argtypes = [POINTER(AVPacket)]'
+        ),
+    'av_new_packet': (None, ('AVPacket',),
+        "av_new_packet = _libraries['/usr/lib/libavcodec.so'].av_new_packet\n"
+        'av_new_packet.restype = c_int\n'
+        'av_new_packet.argtypes = [POINTER(AVPacket), c_int]'
+        ),
+    'av_shrink_packet': (None, ('AVPacket',),
+        "av_shrink_packet = _libraries['/usr/lib/libavcodec.so'].av_shrink_packet\n"
+        'av_shrink_packet.restype = None\n'
+        'av_shrink_packet.argtypes = [POINTER(AVPacket), c_int]'
+        ),
+    'av_grow_packet': (None, ('AVPacket',),
+        "av_grow_packet = _libraries['/usr/lib/libavcodec.so'].av_grow_packet\n"
+        'av_grow_packet.restype = c_int\n'
+        'av_grow_packet.argtypes = [POINTER(AVPacket), c_int]'
+        ),
+    'av_packet_from_data': (None, ('AVPacket',),
+        "av_packet_from_data = _libraries['/usr/lib/libavcodec.so'].av_packet_from_data\n"
+        'av_packet_from_data.restype = c_int\n'
+        'av_packet_from_data.argtypes = [POINTER(AVPacket), POINTER(uint8_t), c_int]'
+        ),
+    'av_dup_packet': (None, ('AVPacket',),
+        "av_dup_packet = _libraries['/usr/lib/libavcodec.so'].av_dup_packet\n"
+        'av_dup_packet.restype = c_int\n'
+        'av_dup_packet.argtypes = [POINTER(AVPacket)]'
+        ),
+    'av_copy_packet': (None, ('AVPacket',),
+        "av_copy_packet = _libraries['/usr/lib/libavcodec.so'].av_copy_packet\n"
+        'av_copy_packet.restype = c_int\n'
+        'av_copy_packet.argtypes = [POINTER(AVPacket), POINTER(AVPacket)]'
+        ),
+    'av_copy_packet_side_data': (None, ('AVPacket',),
+        "av_copy_packet_side_data = _libraries['/usr/lib/libavcodec.so'].av_copy_packet_side_data\n"
+        'av_copy_packet_side_data.restype = c_int\n'
+        'av_copy_packet_side_data.argtypes = [POINTER(AVPacket), POINTER(AVPacket)]'
+        ),
+    'av_free_packet': (None, ('AVPacket',),
+        "av_free_packet = _libraries['/usr/lib/libavcodec.so'].av_free_packet\n"
+        'av_free_packet.restype = None\n'
+        'av_free_packet.argtypes = [POINTER(AVPacket)]'
+        ),
+    'av_packet_new_side_data': (None, ('AVPacket',),
+        "av_packet_new_side_data = _libraries['/usr/lib/libavcodec.so'].av_packet_new_side_data\n"
+        'av_packet_new_side_data.restype = POINTER(uint8_t)\n'
+        'av_packet_new_side_data.argtypes = [POINTER(AVPacket), AVPacketSideDataType, c_int]'
+        ),
+    'av_packet_shrink_side_data': (None, ('AVPacket',),
+        "av_packet_shrink_side_data = _libraries['/usr/lib/libavcodec.so'].av_packet_shrink_side_data\n"
+        'av_packet_shrink_side_data.restype = c_int\n'
+        'av_packet_shrink_side_data.argtypes = [POINTER(AVPacket), AVPacketSideDataType, c_int]'
+        ),
+    'av_packet_get_side_data': (None, ('AVPacket',),
+        "av_packet_get_side_data = _libraries['/usr/lib/libavcodec.so'].av_packet_get_side_data\n"
+        'av_packet_get_side_data.restype = POINTER(uint8_t)\n'
+        'av_packet_get_side_data.argtypes = [POINTER(AVPacket), AVPacketSideDataType, POINTER(c_int)]'
+        ),
+    'av_packet_merge_side_data': (None, ('AVPacket',),
+        "av_packet_merge_side_data = _libraries['/usr/lib/libavcodec.so'].av_packet_merge_side_data\n"
+        'av_packet_merge_side_data.restype = c_int\n'
+        'av_packet_merge_side_data.argtypes = [POINTER(AVPacket)]'
+        ),
+    'av_packet_split_side_data': (None, ('AVPacket',),
+        "av_packet_split_side_data = _libraries['/usr/lib/libavcodec.so'].av_packet_split_side_data\n"
+        'av_packet_split_side_data.restype = c_int\n'
+        'av_packet_split_side_data.argtypes = [POINTER(AVPacket)]'
+        ),
+    'avcodec_find_decoder': (None, ('AVCodec',),
+        "avcodec_find_decoder = _libraries['/usr/lib/libavcodec.so'].avcodec_find_decoder\n"
+        'avcodec_find_decoder.restype = POINTER(AVCodec)\n'
+        'avcodec_find_decoder.argtypes = [AVCodecID]'
+        ),
+    'avcodec_find_decoder_by_name': (None, ('AVCodec',),
+        "avcodec_find_decoder_by_name = _libraries['/usr/lib/libavcodec.so'].avcodec_find_decoder_by_name\n"
+        'avcodec_find_decoder_by_name.restype = POINTER(AVCodec)\n'
+        'avcodec_find_decoder_by_name.argtypes = [STRING]'
+        ),
+    'avcodec_default_get_buffer': (None, ('AVCodecContext', 'AVFrame'),
+        "avcodec_default_get_buffer = _libraries['/usr/lib/libavcodec.so'].avcodec_default_get_buffer\n"
+        'avcodec_default_get_buffer.restype = c_int\n'
+        'avcodec_default_get_buffer.argtypes = [POINTER(AVCodecContext), POINTER(AVFrame)]'
+        ),
+    'avcodec_default_release_buffer': (None, ('AVCodecContext', 'AVFrame'),
+        "avcodec_default_release_buffer = _libraries['/usr/lib/libavcodec.so'].avcodec_default_release_buffer\n"
+        'avcodec_default_release_buffer.restype = None\n'
+        'avcodec_default_release_buffer.argtypes = [POINTER(AVCodecContext), POINTER(AVFrame)]'
+        ),
+    'avcodec_default_reget_buffer': (None, ('AVCodecContext', 'AVFrame'),
+        "avcodec_default_reget_buffer = _libraries['/usr/lib/libavcodec.so'].avcodec_default_reget_buffer\n"
+        'avcodec_default_reget_buffer.restype = c_int\n'
+        'avcodec_default_reget_buffer.argtypes = [POINTER(AVCodecContext), POINTER(AVFrame)]'
+        ),
+    'avcodec_default_get_buffer2': (None, ('AVCodecContext', 'AVFrame'),
+        "avcodec_default_get_buffer2 = _libraries['/usr/lib/libavcodec.so'].avcodec_default_get_buffer2\n"
+        'avcodec_default_get_buffer2.restype = c_int\n'
+        'avcodec_default_get_buffer2.argtypes = [POINTER(AVCodecContext), POINTER(AVFrame), c_int]'
+        ),
+    'avcodec_get_edge_width': (None, (),
+        "avcodec_get_edge_width = _libraries['/usr/lib/libavcodec.so'].avcodec_get_edge_width\n"
+        'avcodec_get_edge_width.restype = c_uint\n'
+        'avcodec_get_edge_width.argtypes = []'
+        ),
+    'avcodec_align_dimensions': (None, ('AVCodecContext',),
+        "avcodec_align_dimensions = _libraries['/usr/lib/libavcodec.so'].avcodec_align_dimensions\n"
+        'avcodec_align_dimensions.restype = None\n'
+        'avcodec_align_dimensions.argtypes = [POINTER(AVCodecContext), POINTER(c_int), POINTER(c_int)]'
+        ),
+    'avcodec_align_dimensions2': (None, ('AVCodecContext',),
+        "avcodec_align_dimensions2 = _libraries['/usr/lib/libavcodec.so'].avcodec_align_dimensions2\n"
+        'avcodec_align_dimensions2.restype = None\n'
+        'avcodec_align_dimensions2.argtypes = [POINTER(AVCodecContext), POINTER(c_int), POINTER(c_int), POINTER(c_int)]'
+        ),
+    'avcodec_decode_audio3': (None, ('AVCodecContext', 'AVPacket'),
+        "avcodec_decode_audio3 = _libraries['/usr/lib/libavcodec.so'].avcodec_decode_audio3\n"
+        'avcodec_decode_audio3.restype = c_int\n'
+        'avcodec_decode_audio3.argtypes = [POINTER(AVCodecContext), POINTER(int16_t), POINTER(c_int), POINTER(AVPacket)]'
+        ),
+    'avcodec_decode_audio4': (None, ('AVCodecContext', 'AVFrame', 'AVPacket'),
+        "avcodec_decode_audio4 = _libraries['/usr/lib/libavcodec.so'].avcodec_decode_audio4\n"
+        'avcodec_decode_audio4.restype = c_int\n'
+        'avcodec_decode_audio4.argtypes = [POINTER(AVCodecContext), POINTER(AVFrame), POINTER(c_int), POINTER(AVPacket)]'
+        ),
+    'avcodec_decode_video2': (None, ('AVCodecContext', 'AVFrame', 'AVPacket'),
+        "avcodec_decode_video2 = _libraries['/usr/lib/libavcodec.so'].avcodec_decode_video2\n"
+        'avcodec_decode_video2.restype = c_int\n'
+        'avcodec_decode_video2.argtypes = [POINTER(AVCodecContext), POINTER(AVFrame), POINTER(c_int), POINTER(AVPacket)]'
+        ),
+    'avcodec_decode_subtitle2': (None, ('AVCodecContext', 'AVPacket', 'AVSubtitle'),
+        "avcodec_decode_subtitle2 = _libraries['/usr/lib/libavcodec.so'].avcodec_decode_subtitle2\n"
+        'avcodec_decode_subtitle2.restype = c_int\n'
+        'avcodec_decode_subtitle2.argtypes = [POINTER(AVCodecContext), POINTER(AVSubtitle), POINTER(c_int), POINTER(AVPacket)]'
+        ),
+    'AVCodecParserContext': ('Structure', ('AVCodecParser',),
+        'AVCodecParserContext._fields_ = [\n'
+        "    ('priv_data', c_void_p),\n"
+        "    ('parser', POINTER(AVCodecParser)),\n"
+        "    ('frame_offset', int64_t),\n"
+        "    ('cur_offset', int64_t),\n"
+        "    ('next_frame_offset', int64_t),\n"
+        "    ('pict_type', c_int),\n"
+        "    ('repeat_pict', c_int),\n"
+        "    ('pts', int64_t),\n"
+        "    ('dts', int64_t),\n"
+        "    ('last_pts', int64_t),\n"
+        "    ('last_dts', int64_t),\n"
+        "    ('fetch_timestamp', c_int),\n"
+        "    ('cur_frame_start_index', c_int),\n"
+        "    ('cur_frame_offset', int64_t * 4),\n"
+        "    ('cur_frame_pts', int64_t * 4),\n"
+        "    ('cur_frame_dts', int64_t * 4),\n"
+        "    ('flags', c_int),\n"
+        "    ('offset', int64_t),\n"
+        "    ('cur_frame_end', int64_t * 4),\n"
+        "    ('key_frame', c_int),\n"
+        "    ('convergence_duration', int64_t),\n"
+        "    ('dts_sync_point', c_int),\n"
+        "    ('dts_ref_dts_delta', c_int),\n"
+        "    ('pts_dts_delta', c_int),\n"
+        "    ('cur_frame_pos', int64_t * 4),\n"
+        "    ('pos', int64_t),\n"
+        "    ('last_pos', int64_t),\n"
+        "    ('duration', c_int),\n"
+        "    ('field_order', AVFieldOrder),\n"
+        "    ('picture_structure', AVPictureStructure),\n"
+        ']'
+        ),
+    'AVCodecParser': ('Structure', ('AVCodecContext', 'AVCodecParserContext'),
+        'AVCodecParser._fields_ = [\n'
+        "    ('codec_ids', c_int * 5),\n"
+        "    ('priv_data_size', c_int),\n"
+        "    ('parser_init', CFUNCTYPE(c_int, POINTER(AVCodecParserContext))),\n"
+        "    ('parser_parse', CFUNCTYPE(c_int, POINTER(AVCodecParserContext), POINTER(AVCodecContext), POINTER(POINTER(uint8_t)), POINTER(c_int), POINTER(uint8_t), c_int)),\n"
+        "    ('parser_close', CFUNCTYPE(None, POINTER(AVCodecParserContext))),\n"
+        "    ('split', CFUNCTYPE(c_int, POINTER(AVCodecContext), POINTER(uint8_t), c_int)),\n"
+        "    ('next', POINTER(AVCodecParser)),\n"
+        ']'
+        ),
+    'av_parser_next': (None, ('AVCodecParser',),
+        "av_parser_next = _libraries['/usr/lib/libavcodec.so'].av_parser_next\n"
+        'av_parser_next.restype = POINTER(AVCodecParser)\n'
+        'av_parser_next.argtypes = [POINTER(AVCodecParser)]'
+        ),
+    'av_register_codec_parser': (None, ('AVCodecParser',),
+        "av_register_codec_parser = _libraries['/usr/lib/libavcodec.so'].av_register_codec_parser\n"
+        'av_register_codec_parser.restype = None\n'
+        'av_register_codec_parser.argtypes = [POINTER(AVCodecParser)]'
+        ),
+    'av_parser_init': (None, ('AVCodecParserContext',),
+        "av_parser_init = _libraries['/usr/lib/libavcodec.so'].av_parser_init\n"
+        'av_parser_init.restype = POINTER(AVCodecParserContext)\n'
+        'av_parser_init.argtypes = [c_int]'
+        ),
+    'av_parser_parse2': (None, ('AVCodecContext', 'AVCodecParserContext'),
+        "av_parser_parse2 = _libraries['/usr/lib/libavcodec.so'].av_parser_parse2\n"
+        'av_parser_parse2.restype = c_int\n'
+        'av_parser_parse2.argtypes = [POINTER(AVCodecParserContext), POINTER(AVCodecContext), POINTER(POINTER(uint8_t)), POINTER(c_int), POINTER(uint8_t), c_int, int64_t, int64_t, int64_t]'
+        ),
+    'av_parser_change': (None, ('AVCodecContext', 'AVCodecParserContext'),
+        "av_parser_change = _libraries['/usr/lib/libavcodec.so'].av_parser_change\n"
+        'av_parser_change.restype = c_int\n'
+        'av_parser_change.argtypes = [POINTER(AVCodecParserContext), POINTER(AVCodecContext), POINTER(POINTER(uint8_t)), POINTER(c_int), POINTER(uint8_t), c_int, c_int]'
+        ),
+    'av_parser_close': (None, ('AVCodecParserContext',),
+        "av_parser_close = _libraries['/usr/lib/libavcodec.so'].av_parser_close\n"
+        'av_parser_close.restype = None\n'
+        'av_parser_close.argtypes = [POINTER(AVCodecParserContext)]'
+        ),
+    'avcodec_find_encoder': (None, ('AVCodec',),
+        "avcodec_find_encoder = _libraries['/usr/lib/libavcodec.so'].avcodec_find_encoder\n"
+        'avcodec_find_encoder.restype = POINTER(AVCodec)\n'
+        'avcodec_find_encoder.argtypes = [AVCodecID]'
+        ),
+    'avcodec_find_encoder_by_name': (None, ('AVCodec',),
+        "avcodec_find_encoder_by_name = _libraries['/usr/lib/libavcodec.so'].avcodec_find_encoder_by_name\n"
+        'avcodec_find_encoder_by_name.restype = POINTER(AVCodec)\n'
+        'avcodec_find_encoder_by_name.argtypes = [STRING]'
+        ),
+    'avcodec_encode_audio': (None, ('AVCodecContext',),
+        "avcodec_encode_audio = _libraries['/usr/lib/libavcodec.so'].avcodec_encode_audio\n"
+        'avcodec_encode_audio.restype = c_int\n'
+        'avcodec_encode_audio.argtypes = [POINTER(AVCodecContext), POINTER(uint8_t), c_int, POINTER(c_short)]'
+        ),
+    'avcodec_encode_audio2': (None, ('AVCodecContext', 'AVFrame', 'AVPacket'),
+        "avcodec_encode_audio2 = _libraries['/usr/lib/libavcodec.so'].avcodec_encode_audio2\n"
+        'avcodec_encode_audio2.restype = c_int\n'
+        'avcodec_encode_audio2.argtypes = [POINTER(AVCodecContext), POINTER(AVPacket), POINTER(AVFrame), POINTER(c_int)]'
+        ),
+    'avcodec_encode_video': (None, ('AVCodecContext', 'AVFrame'),
+        "avcodec_encode_video = _libraries['/usr/lib/libavcodec.so'].avcodec_encode_video\n"
+        'avcodec_encode_video.restype = c_int\n'
+        'avcodec_encode_video.argtypes = [POINTER(AVCodecContext), POINTER(uint8_t), c_int, POINTER(AVFrame)]'
+        ),
+    'avcodec_encode_video2': (None, ('AVCodecContext', 'AVFrame', 'AVPacket'),
+        "avcodec_encode_video2 = _libraries['/usr/lib/libavcodec.so'].avcodec_encode_video2\n"
+        'avcodec_encode_video2.restype = c_int\n'
+        'avcodec_encode_video2.argtypes = [POINTER(AVCodecContext), POINTER(AVPacket), POINTER(AVFrame), POINTER(c_int)]'
+        ),
+    'avcodec_encode_subtitle': (None, ('AVCodecContext', 'AVSubtitle'),
+        "avcodec_encode_subtitle = _libraries['/usr/lib/libavcodec.so'].avcodec_encode_subtitle\n"
+        'avcodec_encode_subtitle.restype = c_int\n'
+        'avcodec_encode_subtitle.argtypes = [POINTER(AVCodecContext), POINTER(uint8_t), c_int, POINTER(AVSubtitle)]'
+        ),
+    'ReSampleContext': ('Structure', (),
+        'ReSampleContext._fields_ = [\n'
+        ']'
+        ),
+    'AVResampleContext': ('Structure', (),
+        'AVResampleContext._fields_ = [\n'
+        ']'
+        ),
+    'av_audio_resample_init': (None, ('ReSampleContext',),
+        "av_audio_resample_init = _libraries['/usr/lib/libavcodec.so'].av_audio_resample_init\n"
+        'av_audio_resample_init.restype = POINTER(ReSampleContext)\n'
+        'av_audio_resample_init.argtypes = [c_int, c_int, c_int, c_int, AVSampleFormat, AVSampleFormat, c_int, c_int, c_int, c_double]'
+        ),
+    'audio_resample': (None, ('ReSampleContext',),
+        "audio_resample = _libraries['/usr/lib/libavcodec.so'].audio_resample\n"
+        'audio_resample.restype = c_int\n'
+        'audio_resample.argtypes = [POINTER(ReSampleContext), POINTER(c_short), POINTER(c_short), c_int]'
+        ),
+    'audio_resample_close': (None, ('ReSampleContext',),
+        "audio_resample_close = _libraries['/usr/lib/libavcodec.so'].audio_resample_close\n"
+        'audio_resample_close.restype = None\n'
+        'audio_resample_close.argtypes = [POINTER(ReSampleContext)]'
+        ),
+    'av_resample_init': (None, ('AVResampleContext',),
+        "av_resample_init = _libraries['/usr/lib/libavcodec.so'].av_resample_init\n"
+        'av_resample_init.restype = POINTER(AVResampleContext)\n'
+        'av_resample_init.argtypes = [c_int, c_int, c_int, c_int, c_int, c_double]'
+        ),
+    'av_resample': (None, ('AVResampleContext',),
+        "av_resample = _libraries['/usr/lib/libavcodec.so'].av_resample\n"
+        'av_resample.restype = c_int\n'
+        'av_resample.argtypes = [POINTER(AVResampleContext), POINTER(c_short), POINTER(c_short), POINTER(c_int), c_int, c_int, c_int]'
+        ),
+    'av_resample_compensate': (None, ('AVResampleContext',),
+        "av_resample_compensate = _libraries['/usr/lib/libavcodec.so'].av_resample_compensate\n"
+        'av_resample_compensate.restype = None\n'
+        'av_resample_compensate.argtypes = [POINTER(AVResampleContext), c_int, c_int]'
+        ),
+    'av_resample_close': (None, ('AVResampleContext',),
+        "av_resample_close = _libraries['/usr/lib/libavcodec.so'].av_resample_close\n"
+        'av_resample_close.restype = None\n'
+        'av_resample_close.argtypes = [POINTER(AVResampleContext)]'
+        ),
+    'avpicture_alloc': (None, ('AVPicture',),
+        "avpicture_alloc = _libraries['/usr/lib/libavcodec.so'].avpicture_alloc\n"
+        'avpicture_alloc.restype = c_int\n'
+        'avpicture_alloc.argtypes = [POINTER(AVPicture), AVPixelFormat, c_int, c_int]'
+        ),
+    'avpicture_free': (None, ('AVPicture',),
+        "avpicture_free = _libraries['/usr/lib/libavcodec.so'].avpicture_free\n"
+        'avpicture_free.restype = None\n'
+        'avpicture_free.argtypes = [POINTER(AVPicture)]'
+        ),
+    'avpicture_fill': (None, ('AVPicture',),
+        "avpicture_fill = _libraries['/usr/lib/libavcodec.so'].avpicture_fill\n"
+        'avpicture_fill.restype = c_int\n'
+        'avpicture_fill.argtypes = [POINTER(AVPicture), POINTER(uint8_t), AVPixelFormat, c_int, c_int]'
+        ),
+    'avpicture_layout': (None, ('AVPicture',),
+        "avpicture_layout = _libraries['/usr/lib/libavcodec.so'].avpicture_layout\n"
+        'avpicture_layout.restype = c_int\n'
+        'avpicture_layout.argtypes = [POINTER(AVPicture), AVPixelFormat, c_int, c_int, POINTER(c_ubyte), c_int]'
+        ),
+    'avpicture_get_size': (None, (),
+        "avpicture_get_size = _libraries['/usr/lib/libavcodec.so'].avpicture_get_size\n"
+        'avpicture_get_size.restype = c_int\n'
+        'avpicture_get_size.argtypes = [AVPixelFormat, c_int, c_int]'
+        ),
+    'avpicture_deinterlace': (None, ('AVPicture',),
+        "avpicture_deinterlace = _libraries['/usr/lib/libavcodec.so'].avpicture_deinterlace\n"
+        'avpicture_deinterlace.restype = c_int\n'
+        'avpicture_deinterlace.argtypes = [POINTER(AVPicture), POINTER(AVPicture), AVPixelFormat, c_int, c_int]'
+        ),
+    'av_picture_copy': (None, ('AVPicture',),
+        "av_picture_copy = _libraries['/usr/lib/libavcodec.so'].av_picture_copy\n"
+        'av_picture_copy.restype = None\n'
+        'av_picture_copy.argtypes = [POINTER(AVPicture), POINTER(AVPicture), AVPixelFormat, c_int, c_int]'
+        ),
+    'av_picture_crop': (None, ('AVPicture',),
+        "av_picture_crop = _libraries['/usr/lib/libavcodec.so'].av_picture_crop\n"
+        'av_picture_crop.restype = c_int\n'
+        'av_picture_crop.argtypes = [POINTER(AVPicture), POINTER(AVPicture), AVPixelFormat, c_int, c_int]'
+        ),
+    'av_picture_pad': (None, ('AVPicture',),
+        "av_picture_pad = _libraries['/usr/lib/libavcodec.so'].av_picture_pad\n"
+        'av_picture_pad.restype = c_int\n'
+        'av_picture_pad.argtypes = [POINTER(AVPicture), POINTER(AVPicture), c_int, c_int, AVPixelFormat, c_int, c_int, c_int, c_int, POINTER(c_int)]'
+        ),
+    'avcodec_get_chroma_sub_sample': (None, (),
+        "avcodec_get_chroma_sub_sample = _libraries['/usr/lib/libavcodec.so'].avcodec_get_chroma_sub_sample\n"
+        'avcodec_get_chroma_sub_sample.restype = None\n'
+        'avcodec_get_chroma_sub_sample.argtypes = [AVPixelFormat, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'avcodec_pix_fmt_to_codec_tag': (None, (),
+        "avcodec_pix_fmt_to_codec_tag = _libraries['/usr/lib/libavcodec.so'].avcodec_pix_fmt_to_codec_tag\n"
+        'avcodec_pix_fmt_to_codec_tag.restype = c_uint\n'
+        'avcodec_pix_fmt_to_codec_tag.argtypes = [AVPixelFormat]'
+        ),
+    'avcodec_get_pix_fmt_loss': (None, (),
+        "avcodec_get_pix_fmt_loss = _libraries['/usr/lib/libavcodec.so'].avcodec_get_pix_fmt_loss\n"
+        'avcodec_get_pix_fmt_loss.restype = c_int\n'
+        'avcodec_get_pix_fmt_loss.argtypes = [AVPixelFormat, AVPixelFormat, c_int]'
+        ),
+    'avcodec_find_best_pix_fmt_of_list': (None, (),
+        "avcodec_find_best_pix_fmt_of_list = _libraries['/usr/lib/libavcodec.so'].avcodec_find_best_pix_fmt_of_list\n"
+        'avcodec_find_best_pix_fmt_of_list.restype = AVPixelFormat\n'
+        'avcodec_find_best_pix_fmt_of_list.argtypes = [POINTER(AVPixelFormat), AVPixelFormat, c_int, POINTER(c_int)]'
+        ),
+    'avcodec_find_best_pix_fmt_of_2': (None, (),
+        "avcodec_find_best_pix_fmt_of_2 = _libraries['/usr/lib/libavcodec.so'].avcodec_find_best_pix_fmt_of_2\n"
+        'avcodec_find_best_pix_fmt_of_2.restype = AVPixelFormat\n'
+        'avcodec_find_best_pix_fmt_of_2.argtypes = [AVPixelFormat, AVPixelFormat, AVPixelFormat, c_int, POINTER(c_int)]'
+        ),
+    'avcodec_find_best_pix_fmt2': (None, (),
+        "avcodec_find_best_pix_fmt2 = _libraries['/usr/lib/libavcodec.so'].avcodec_find_best_pix_fmt2\n"
+        'avcodec_find_best_pix_fmt2.restype = AVPixelFormat\n'
+        'avcodec_find_best_pix_fmt2.argtypes = [AVPixelFormat, AVPixelFormat, AVPixelFormat, c_int, POINTER(c_int)]'
+        ),
+    'avcodec_default_get_format': (None, ('AVCodecContext',),
+        "avcodec_default_get_format = _libraries['/usr/lib/libavcodec.so'].avcodec_default_get_format\n"
+        'avcodec_default_get_format.restype = AVPixelFormat\n'
+        'avcodec_default_get_format.argtypes = [POINTER(AVCodecContext), POINTER(AVPixelFormat)]'
+        ),
+    'avcodec_set_dimensions': (None, ('AVCodecContext',),
+        "avcodec_set_dimensions = _libraries['/usr/lib/libavcodec.so'].avcodec_set_dimensions\n"
+        'avcodec_set_dimensions.restype = None\n'
+        'avcodec_set_dimensions.argtypes = [POINTER(AVCodecContext), c_int, c_int]'
+        ),
+    'av_get_codec_tag_string': (None, (),
+        "av_get_codec_tag_string = _libraries['/usr/lib/libavcodec.so'].av_get_codec_tag_string\n"
+        'av_get_codec_tag_string.restype = size_t\n'
+        'av_get_codec_tag_string.argtypes = [STRING, size_t, c_uint]'
+        ),
+    'avcodec_string': (None, ('AVCodecContext',),
+        "avcodec_string = _libraries['/usr/lib/libavcodec.so'].avcodec_string\n"
+        'avcodec_string.restype = None\n'
+        'avcodec_string.argtypes = [STRING, c_int, POINTER(AVCodecContext), c_int]'
+        ),
+    'av_get_profile_name': (None, ('AVCodec',),
+        "av_get_profile_name = _libraries['/usr/lib/libavcodec.so'].av_get_profile_name\n"
+        'av_get_profile_name.restype = STRING\n'
+        'av_get_profile_name.argtypes = [POINTER(AVCodec), c_int]'
+        ),
+    'avcodec_default_execute': (None, ('AVCodecContext',),
+        "avcodec_default_execute = _libraries['/usr/lib/libavcodec.so'].avcodec_default_execute\n"
+        'avcodec_default_execute.restype = c_int\n'
+        'avcodec_default_execute.argtypes = [POINTER(AVCodecContext), CFUNCTYPE(c_int, POINTER(AVCodecContext), c_void_p), c_void_p, POINTER(c_int), c_int, c_int]'
+        ),
+    'avcodec_default_execute2': (None, ('AVCodecContext',),
+        "avcodec_default_execute2 = _libraries['/usr/lib/libavcodec.so'].avcodec_default_execute2\n"
+        'avcodec_default_execute2.restype = c_int\n'
+        'avcodec_default_execute2.argtypes = [POINTER(AVCodecContext), CFUNCTYPE(c_int, POINTER(AVCodecContext), c_void_p, c_int, c_int), c_void_p, POINTER(c_int), c_int]'
+        ),
+    'avcodec_fill_audio_frame': (None, ('AVFrame',),
+        "avcodec_fill_audio_frame = _libraries['/usr/lib/libavcodec.so'].avcodec_fill_audio_frame\n"
+        'avcodec_fill_audio_frame.restype = c_int\n'
+        'avcodec_fill_audio_frame.argtypes = [POINTER(AVFrame), c_int, AVSampleFormat, POINTER(uint8_t), c_int, c_int]'
+        ),
+    'avcodec_flush_buffers': (None, ('AVCodecContext',),
+        "avcodec_flush_buffers = _libraries['/usr/lib/libavcodec.so'].avcodec_flush_buffers\n"
+        'avcodec_flush_buffers.restype = None\n'
+        'avcodec_flush_buffers.argtypes = [POINTER(AVCodecContext)]'
+        ),
+    'av_get_bits_per_sample': (None, (),
+        "av_get_bits_per_sample = _libraries['/usr/lib/libavcodec.so'].av_get_bits_per_sample\n"
+        'av_get_bits_per_sample.restype = c_int\n'
+        'av_get_bits_per_sample.argtypes = [AVCodecID]'
+        ),
+    'av_get_pcm_codec': (None, (),
+        "av_get_pcm_codec = _libraries['/usr/lib/libavcodec.so'].av_get_pcm_codec\n"
+        'av_get_pcm_codec.restype = AVCodecID\n'
+        'av_get_pcm_codec.argtypes = [AVSampleFormat, c_int]'
+        ),
+    'av_get_exact_bits_per_sample': (None, (),
+        "av_get_exact_bits_per_sample = _libraries['/usr/lib/libavcodec.so'].av_get_exact_bits_per_sample\n"
+        'av_get_exact_bits_per_sample.restype = c_int\n'
+        'av_get_exact_bits_per_sample.argtypes = [AVCodecID]'
+        ),
+    'av_get_audio_frame_duration': (None, ('AVCodecContext',),
+        "av_get_audio_frame_duration = _libraries['/usr/lib/libavcodec.so'].av_get_audio_frame_duration\n"
+        'av_get_audio_frame_duration.restype = c_int\n'
+        'av_get_audio_frame_duration.argtypes = [POINTER(AVCodecContext), c_int]'
+        ),
+    'AVBitStreamFilterContext': ('Structure', ('AVBitStreamFilter', 'AVCodecParserContext'),
+        'AVBitStreamFilterContext._fields_ = [\n'
+        "    ('priv_data', c_void_p),\n"
+        "    ('filter', POINTER(AVBitStreamFilter)),\n"
+        "    ('parser', POINTER(AVCodecParserContext)),\n"
+        "    ('next', POINTER(AVBitStreamFilterContext)),\n"
+        ']'
+        ),
+    'AVBitStreamFilter': ('Structure', ('AVBitStreamFilterContext', 'AVCodecContext'),
+        'AVBitStreamFilter._fields_ = [\n'
+        "    ('name', STRING),\n"
+        "    ('priv_data_size', c_int),\n"
+        "    ('filter', CFUNCTYPE(c_int, POINTER(AVBitStreamFilterContext), POINTER(AVCodecContext), STRING, POINTER(POINTER(uint8_t)), POINTER(c_int), POINTER(uint8_t), c_int, c_int)),\n"
+        "    ('close', CFUNCTYPE(None, POINTER(AVBitStreamFilterContext))),\n"
+        "    ('next', POINTER(AVBitStreamFilter)),\n"
+        ']'
+        ),
+    'av_register_bitstream_filter': (None, ('AVBitStreamFilter',),
+        "av_register_bitstream_filter = _libraries['/usr/lib/libavcodec.so'].av_register_bitstream_filter\n"
+        'av_register_bitstream_filter.restype = None\n'
+        'av_register_bitstream_filter.argtypes = [POINTER(AVBitStreamFilter)]'
+        ),
+    'av_bitstream_filter_init': (None, ('AVBitStreamFilterContext',),
+        "av_bitstream_filter_init = _libraries['/usr/lib/libavcodec.so'].av_bitstream_filter_init\n"
+        'av_bitstream_filter_init.restype = POINTER(AVBitStreamFilterContext)\n'
+        'av_bitstream_filter_init.argtypes = [STRING]'
+        ),
+    'av_bitstream_filter_filter': (None, ('AVBitStreamFilterContext', 'AVCodecContext'),
+        "av_bitstream_filter_filter = _libraries['/usr/lib/libavcodec.so'].av_bitstream_filter_filter\n"
+        'av_bitstream_filter_filter.restype = c_int\n'
+        'av_bitstream_filter_filter.argtypes = [POINTER(AVBitStreamFilterContext), POINTER(AVCodecContext), STRING, POINTER(POINTER(uint8_t)), POINTER(c_int), POINTER(uint8_t), c_int, c_int]'
+        ),
+    'av_bitstream_filter_close': (None, ('AVBitStreamFilterContext',),
+        "av_bitstream_filter_close = _libraries['/usr/lib/libavcodec.so'].av_bitstream_filter_close\n"
+        'av_bitstream_filter_close.restype = None\n'
+        'av_bitstream_filter_close.argtypes = [POINTER(AVBitStreamFilterContext)]'
+        ),
+    'av_bitstream_filter_next': (None, ('AVBitStreamFilter',),
+        "av_bitstream_filter_next = _libraries['/usr/lib/libavcodec.so'].av_bitstream_filter_next\n"
+        'av_bitstream_filter_next.restype = POINTER(AVBitStreamFilter)\n'
+        'av_bitstream_filter_next.argtypes = [POINTER(AVBitStreamFilter)]'
+        ),
+    'av_fast_realloc': (None, (),
+        "av_fast_realloc = _libraries['/usr/lib/libavcodec.so'].av_fast_realloc\n"
+        'av_fast_realloc.restype = c_void_p\n'
+        'av_fast_realloc.argtypes = [c_void_p, POINTER(c_uint), size_t]'
+        ),
+    'av_fast_malloc': (None, (),
+        "av_fast_malloc = _libraries['/usr/lib/libavcodec.so'].av_fast_malloc\n"
+        'av_fast_malloc.restype = None\n'
+        'av_fast_malloc.argtypes = [c_void_p, POINTER(c_uint), size_t]'
+        ),
+    'av_fast_padded_malloc': (None, (),
+        "av_fast_padded_malloc = _libraries['/usr/lib/libavcodec.so'].av_fast_padded_malloc\n"
+        'av_fast_padded_malloc.restype = None\n'
+        'av_fast_padded_malloc.argtypes = [c_void_p, POINTER(c_uint), size_t]'
+        ),
+    'av_fast_padded_mallocz': (None, (),
+        "av_fast_padded_mallocz = _libraries['/usr/lib/libavcodec.so'].av_fast_padded_mallocz\n"
+        'av_fast_padded_mallocz.restype = None\n'
+        'av_fast_padded_mallocz.argtypes = [c_void_p, POINTER(c_uint), size_t]'
+        ),
+    'av_xiphlacing': (None, (),
+        "av_xiphlacing = _libraries['/usr/lib/libavcodec.so'].av_xiphlacing\n"
+        'av_xiphlacing.restype = c_uint\n'
+        'av_xiphlacing.argtypes = [POINTER(c_ubyte), c_uint]'
+        ),
+    'av_log_missing_feature': (None, (),
+        "av_log_missing_feature = _libraries['/usr/lib/libavcodec.so'].av_log_missing_feature\n"
+        'av_log_missing_feature.restype = None\n'
+        'av_log_missing_feature.argtypes = [c_void_p, STRING, c_int]'
+        ),
+    'av_log_ask_for_sample': (None, (),
+        "av_log_ask_for_sample = _libraries['/usr/lib/libavcodec.so'].av_log_ask_for_sample\n"
+        'av_log_ask_for_sample.restype = None\n'
+        'av_log_ask_for_sample.argtypes = [c_void_p, STRING]'
+        ),
+    'av_register_hwaccel': (None, ('AVHWAccel',),
+        "av_register_hwaccel = _libraries['/usr/lib/libavcodec.so'].av_register_hwaccel\n"
+        'av_register_hwaccel.restype = None\n'
+        'av_register_hwaccel.argtypes = [POINTER(AVHWAccel)]'
+        ),
+    'av_hwaccel_next': (None, ('AVHWAccel',),
+        "av_hwaccel_next = _libraries['/usr/lib/libavcodec.so'].av_hwaccel_next\n"
+        'av_hwaccel_next.restype = POINTER(AVHWAccel)\n'
+        'av_hwaccel_next.argtypes = [POINTER(AVHWAccel)]'
+        ),
+    'av_lockmgr_register': (None, (),
+        "av_lockmgr_register = _libraries['/usr/lib/libavcodec.so'].av_lockmgr_register\n"
+        'av_lockmgr_register.restype = c_int\n'
+        'av_lockmgr_register.argtypes = [CFUNCTYPE(c_int, POINTER(c_void_p), AVLockOp)]'
+        ),
+    'avcodec_get_type': (None, (),
+        "avcodec_get_type = _libraries['/usr/lib/libavcodec.so'].avcodec_get_type\n"
+        'avcodec_get_type.restype = AVMediaType\n'
+        'avcodec_get_type.argtypes = [AVCodecID]'
+        ),
+    'avcodec_get_name': (None, (),
+        "avcodec_get_name = _libraries['/usr/lib/libavcodec.so'].avcodec_get_name\n"
+        'avcodec_get_name.restype = STRING\n'
+        'avcodec_get_name.argtypes = [AVCodecID]'
+        ),
+    'avcodec_is_open': (None, ('AVCodecContext',),
+        "avcodec_is_open = _libraries['/usr/lib/libavcodec.so'].avcodec_is_open\n"
+        'avcodec_is_open.restype = c_int\n'
+        'avcodec_is_open.argtypes = [POINTER(AVCodecContext)]'
+        ),
+    'av_codec_is_encoder': (None, ('AVCodec',),
+        "av_codec_is_encoder = _libraries['/usr/lib/libavcodec.so'].av_codec_is_encoder\n"
+        'av_codec_is_encoder.restype = c_int\n'
+        'av_codec_is_encoder.argtypes = [POINTER(AVCodec)]'
+        ),
+    'av_codec_is_decoder': (None, ('AVCodec',),
+        "av_codec_is_decoder = _libraries['/usr/lib/libavcodec.so'].av_codec_is_decoder\n"
+        'av_codec_is_decoder.restype = c_int\n'
+        'av_codec_is_decoder.argtypes = [POINTER(AVCodec)]'
+        ),
+    'avcodec_descriptor_get': (None, ('AVCodecDescriptor',),
+        "avcodec_descriptor_get = _libraries['/usr/lib/libavcodec.so'].avcodec_descriptor_get\n"
+        'avcodec_descriptor_get.restype = POINTER(AVCodecDescriptor)\n'
+        'avcodec_descriptor_get.argtypes = [AVCodecID]'
+        ),
+    'avcodec_descriptor_next': (None, ('AVCodecDescriptor',),
+        "avcodec_descriptor_next = _libraries['/usr/lib/libavcodec.so'].avcodec_descriptor_next\n"
+        'avcodec_descriptor_next.restype = POINTER(AVCodecDescriptor)\n'
+        'avcodec_descriptor_next.argtypes = [POINTER(AVCodecDescriptor)]'
+        ),
+    'avcodec_descriptor_get_by_name': (None, ('AVCodecDescriptor',),
+        "avcodec_descriptor_get_by_name = _libraries['/usr/lib/libavcodec.so'].avcodec_descriptor_get_by_name\n"
+        'avcodec_descriptor_get_by_name.restype = POINTER(AVCodecDescriptor)\n'
+        'avcodec_descriptor_get_by_name.argtypes = [STRING]'
+        ),
+    'avdevice_version': (None, (),
+        "avdevice_version = _libraries['/usr/lib/libavdevice.so'].avdevice_version\n"
+        'avdevice_version.restype = c_uint\n'
+        'avdevice_version.argtypes = []'
+        ),
+    'avdevice_configuration': (None, (),
+        "avdevice_configuration = _libraries['/usr/lib/libavdevice.so'].avdevice_configuration\n"
+        'avdevice_configuration.restype = STRING\n'
+        'avdevice_configuration.argtypes = []'
+        ),
+    'avdevice_license': (None, (),
+        "avdevice_license = _libraries['/usr/lib/libavdevice.so'].avdevice_license\n"
+        'avdevice_license.restype = STRING\n'
+        'avdevice_license.argtypes = []'
+        ),
+    'avdevice_register_all': (None, (),
+        "avdevice_register_all = _libraries['/usr/lib/libavdevice.so'].avdevice_register_all\n"
+        'avdevice_register_all.restype = None\n'
+        'avdevice_register_all.argtypes = []'
+        ),
+    'avfilter_version': (None, (),
+        "avfilter_version = _libraries['/usr/lib/libavdevice.so'].avfilter_version\n"
+        'avfilter_version.restype = c_uint\n'
+        'avfilter_version.argtypes = []'
+        ),
+    'avfilter_configuration': (None, (),
+        "avfilter_configuration = _libraries['/usr/lib/libavdevice.so'].avfilter_configuration\n"
+        'avfilter_configuration.restype = STRING\n'
+        'avfilter_configuration.argtypes = []'
+        ),
+    'avfilter_license': (None, (),
+        "avfilter_license = _libraries['/usr/lib/libavdevice.so'].avfilter_license\n"
+        'avfilter_license.restype = STRING\n'
+        'avfilter_license.argtypes = []'
+        ),
+    'AVFilterContext': ('Structure', ('AVClass', 'AVFilter', 'AVFilterCommand', 'AVFilterGraph', 'AVFilterInternal', 'AVFilterLink', 'AVFilterPad'),
+        'AVFilterContext._fields_ = [\n'
+        "    ('av_class', POINTER(AVClass)),\n"
+        "    ('filter', POINTER(AVFilter)),\n"
+        "    ('name', STRING),\n"
+        "    ('input_pads', POINTER(AVFilterPad)),\n"
+        "    ('inputs', POINTER(POINTER(AVFilterLink))),\n"
+        "    ('input_count', c_uint),\n"
+        "    ('nb_inputs', c_uint),\n"
+        "    ('output_pads', POINTER(AVFilterPad)),\n"
+        "    ('outputs', POINTER(POINTER(AVFilterLink))),\n"
+        "    ('output_count', c_uint),\n"
+        "    ('nb_outputs', c_uint),\n"
+        "    ('priv', c_void_p),\n"
+        "    ('graph', POINTER(AVFilterGraph)),\n"
+        "    ('thread_type', c_int),\n"
+        "    ('internal', POINTER(AVFilterInternal)),\n"
+        "    ('command_queue', POINTER(AVFilterCommand)),\n"
+        "    ('enable_str', STRING),\n"
+        "    ('enable', c_void_p),\n"
+        "    ('var_values', POINTER(c_double)),\n"
+        "    ('is_disabled', c_int),\n"
+        ']'
+        ),
+    'AVFilterLink': ('Structure', ('AVFilterBufferRef', 'AVFilterChannelLayouts', 'AVFilterContext', 'AVFilterFormats', 'AVFilterGraph', 'AVFilterPad', 'AVFilterPool', 'AVFrame', 'AVRational'),
+        'AVFilterLink._fields_ = [\n'
+        "    ('src', POINTER(AVFilterContext)),\n"
+        "    ('srcpad', POINTER(AVFilterPad)),\n"
+        "    ('dst', POINTER(AVFilterContext)),\n"
+        "    ('dstpad', POINTER(AVFilterPad)),\n"
+        "    ('type', AVMediaType),\n"
+        "    ('w', c_int),\n"
+        "    ('h', c_int),\n"
+        "    ('sample_aspect_ratio', AVRational),\n"
+        "    ('channel_layout', uint64_t),\n"
+        "    ('sample_rate', c_int),\n"
+        "    ('format', c_int),\n"
+        "    ('time_base', AVRational),\n"
+        "    ('in_formats', POINTER(AVFilterFormats)),\n"
+        "    ('out_formats', POINTER(AVFilterFormats)),\n"
+        "    ('in_samplerates', POINTER(AVFilterFormats)),\n"
+        "    ('out_samplerates', POINTER(AVFilterFormats)),\n"
+        "    ('in_channel_layouts', POINTER(AVFilterChannelLayouts)),\n"
+        "    ('out_channel_layouts', POINTER(AVFilterChannelLayouts)),\n"
+        "    ('request_samples', c_int),\n"
+        "    ('init_state', c_int),\n"
+        "    ('pool', POINTER(AVFilterPool)),\n"
+        "    ('graph', POINTER(AVFilterGraph)),\n"
+        "    ('current_pts', int64_t),\n"
+        "    ('age_index', c_int),\n"
+        "    ('frame_rate', AVRational),\n"
+        "    ('partial_buf', POINTER(AVFrame)),\n"
+        "    ('partial_buf_size', c_int),\n"
+        "    ('min_samples', c_int),\n"
+        "    ('max_samples', c_int),\n"
+        "    ('cur_buf_copy', POINTER(AVFilterBufferRef)),\n"
+        "    ('closed', c_int),\n"
+        "    ('channels', c_int),\n"
+        "    ('frame_requested', c_uint),\n"
+        "    ('flags', c_uint),\n"
+        "    ('frame_count', int64_t),\n"
+        ']'
+        ),
+    'AVFilterPad': ('Structure', ('AVFilterBufferRef', 'AVFilterLink', 'AVFrame'),
+        'AVFilterPad._fields_ = [\n'
+        "    ('name', STRING),\n"
+        "    ('type', AVMediaType),\n"
+        "    ('min_perms', c_int),\n"
+        "    ('rej_perms', c_int),\n"
+        "    ('start_frame', CFUNCTYPE(c_int, POINTER(AVFilterLink), POINTER(AVFilterBufferRef))),\n"
+        "    ('get_video_buffer', CFUNCTYPE(POINTER(AVFrame), POINTER(AVFilterLink), c_int, c_int)),\n"
+        "    ('get_audio_buffer', CFUNCTYPE(POINTER(AVFrame), POINTER(AVFilterLink), c_int)),\n"
+        "    ('end_frame', CFUNCTYPE(c_int, POINTER(AVFilterLink))),\n"
+        "    ('draw_slice', CFUNCTYPE(c_int, POINTER(AVFilterLink), c_int, c_int, c_int)),\n"
+        "    ('filter_frame', CFUNCTYPE(c_int, POINTER(AVFilterLink), POINTER(AVFrame))),\n"
+        "    ('poll_frame', CFUNCTYPE(c_int, POINTER(AVFilterLink))),\n"
+        "    ('request_frame', CFUNCTYPE(c_int, POINTER(AVFilterLink))),\n"
+        "    ('config_props', CFUNCTYPE(c_int, POINTER(AVFilterLink))),\n"
+        "    ('needs_fifo', c_int),\n"
+        "    ('needs_writable', c_int),\n"
+        ']'
+        ),
+    'AVFilterFormats': ('Structure', (),
+        'AVFilterFormats._fields_ = [\n'
+        ']'
+        ),
+    'AVFilterBuffer': ('Structure', (),
+        'AVFilterBuffer._fields_ = [\n'
+        "    ('data', POINTER(uint8_t) * 8),\n"
+        "    ('extended_data', POINTER(POINTER(uint8_t))),\n"
+        "    ('linesize', c_int * 8),\n"
+        "    ('priv', c_void_p),\n"
+        "    ('free', CFUNCTYPE(None, POINTER(AVFilterBuffer))),\n"
+        "    ('format', c_int),\n"
+        "    ('w', c_int),\n"
+        "    ('h', c_int),\n"
+        "    ('refcount', c_uint),\n"
+        ']'
+        ),
+    'AVFilterBufferRefAudioProps': ('Structure', (),
+        'AVFilterBufferRefAudioProps._fields_ = [\n'
+        "    ('channel_layout', uint64_t),\n"
+        "    ('nb_samples', c_int),\n"
+        "    ('sample_rate', c_int),\n"
+        "    ('channels', c_int),\n"
+        ']'
+        ),
+    'AVFilterBufferRefVideoProps': ('Structure', ('AVRational',),
+        'AVFilterBufferRefVideoProps._fields_ = [\n'
+        "    ('w', c_int),\n"
+        "    ('h', c_int),\n"
+        "    ('sample_aspect_ratio', AVRational),\n"
+        "    ('interlaced', c_int),\n"
+        "    ('top_field_first', c_int),\n"
+        "    ('pict_type', AVPictureType),\n"
+        "    ('key_frame', c_int),\n"
+        "    ('qp_table_linesize', c_int),\n"
+        "    ('qp_table_size', c_int),\n"
+        "    ('qp_table', POINTER(int8_t)),\n"
+        ']'
+        ),
+    'AVFilterBufferRef': ('Structure', ('AVDictionary', 'AVFilterBuffer', 'AVFilterBufferRefAudioProps', 'AVFilterBufferRefVideoProps'),
+        'AVFilterBufferRef._fields_ = [\n'
+        "    ('buf', POINTER(AVFilterBuffer)),\n"
+        "    ('data', POINTER(uint8_t) * 8),\n"
+        "    ('extended_data', POINTER(POINTER(uint8_t))),\n"
+        "    ('linesize', c_int * 8),\n"
+        "    ('video', POINTER(AVFilterBufferRefVideoProps)),\n"
+        "    ('audio', POINTER(AVFilterBufferRefAudioProps)),\n"
+        "    ('pts', int64_t),\n"
+        "    ('pos', int64_t),\n"
+        "    ('format', c_int),\n"
+        "    ('perms', c_int),\n"
+        "    ('type', AVMediaType),\n"
+        "    ('metadata', POINTER(AVDictionary)),\n"
+        ']'
+        ),
+    'avfilter_copy_buffer_ref_props': (None, ('AVFilterBufferRef',),
+        "avfilter_copy_buffer_ref_props = _libraries['/usr/lib/libavdevice.so'].avfilter_copy_buffer_ref_props\n"
+        'avfilter_copy_buffer_ref_props.restype = None\n'
+        'avfilter_copy_buffer_ref_props.argtypes = [POINTER(AVFilterBufferRef), POINTER(AVFilterBufferRef)]'
+        ),
+    'avfilter_ref_buffer': (None, ('AVFilterBufferRef',),
+        "avfilter_ref_buffer = _libraries['/usr/lib/libavdevice.so'].avfilter_ref_buffer\n"
+        'avfilter_ref_buffer.restype = POINTER(AVFilterBufferRef)\n'
+        'avfilter_ref_buffer.argtypes = [POINTER(AVFilterBufferRef), c_int]'
+        ),
+    'avfilter_unref_buffer': (None, ('AVFilterBufferRef',),
+        "avfilter_unref_buffer = _libraries['/usr/lib/libavdevice.so'].avfilter_unref_buffer\n"
+        'avfilter_unref_buffer.restype = None\n'
+        'avfilter_unref_buffer.argtypes = [POINTER(AVFilterBufferRef)]'
+        ),
+    'avfilter_unref_bufferp': (None, ('AVFilterBufferRef',),
+        "avfilter_unref_bufferp = _libraries['/usr/lib/libavdevice.so'].avfilter_unref_bufferp\n"
+        'avfilter_unref_bufferp.restype = None\n'
+        'avfilter_unref_bufferp.argtypes = [POINTER(POINTER(AVFilterBufferRef))]'
+        ),
+    'avfilter_ref_get_channels': (None, ('AVFilterBufferRef',),
+        "avfilter_ref_get_channels = _libraries['/usr/lib/libavdevice.so'].avfilter_ref_get_channels\n"
+        'avfilter_ref_get_channels.restype = c_int\n'
+        'avfilter_ref_get_channels.argtypes = [POINTER(AVFilterBufferRef)]'
+        ),
+    'avfilter_pad_count': (None, ('AVFilterPad',),
+        "avfilter_pad_count = _libraries['/usr/lib/libavdevice.so'].avfilter_pad_count\n"
+        'avfilter_pad_count.restype = c_int\n'
+        'avfilter_pad_count.argtypes = [POINTER(AVFilterPad)]'
+        ),
+    'avfilter_pad_get_name': (None, ('AVFilterPad',),
+        "avfilter_pad_get_name = _libraries['/usr/lib/libavdevice.so'].avfilter_pad_get_name\n"
+        'avfilter_pad_get_name.restype = STRING\n'
+        'avfilter_pad_get_name.argtypes = [POINTER(AVFilterPad), c_int]'
+        ),
+    'avfilter_pad_get_type': (None, ('AVFilterPad',),
+        "avfilter_pad_get_type = _libraries['/usr/lib/libavdevice.so'].avfilter_pad_get_type\n"
+        'avfilter_pad_get_type.restype = AVMediaType\n'
+        'avfilter_pad_get_type.argtypes = [POINTER(AVFilterPad), c_int]'
+        ),
+    'AVFilter': ('Structure', ('AVClass', 'AVDictionary', 'AVFilterContext', 'AVFilterPad'),
+        'AVFilter._fields_ = [\n'
+        "    ('name', STRING),\n"
+        "    ('description', STRING),\n"
+        "    ('inputs', POINTER(AVFilterPad)),\n"
+        "    ('outputs', POINTER(AVFilterPad)),\n"
+        "    ('priv_class', POINTER(AVClass)),\n"
+        "    ('flags', c_int),\n"
+        "    ('init', CFUNCTYPE(c_int, POINTER(AVFilterContext))),\n"
+        "    ('init_dict', CFUNCTYPE(c_int, POINTER(AVFilterContext), POINTER(POINTER(AVDictionary)))),\n"
+        "    ('uninit', CFUNCTYPE(None, POINTER(AVFilterContext))),\n"
+        "    ('query_formats', CFUNCTYPE(c_int, POINTER(AVFilterContext))),\n"
+        "    ('priv_size', c_int),\n"
+        "    ('next', POINTER(AVFilter)),\n"
+        "    ('process_command', CFUNCTYPE(c_int, POINTER(AVFilterContext), STRING, STRING, STRING, c_int, c_int)),\n"
+        "    ('init_opaque', CFUNCTYPE(c_int, POINTER(AVFilterContext), c_void_p)),\n"
+        ']'
+        ),
+    'AVFilterInternal': ('Structure', (),
+        'AVFilterInternal._fields_ = [\n'
+        ']'
+        ),
+    'AVFilterGraph': ('Structure', ('AVClass', 'AVFilterContext', 'AVFilterGraphInternal', 'AVFilterLink'),
+        'AVFilterGraph._fields_ = [\n'
+        "    ('av_class', POINTER(AVClass)),\n"
+        "    ('filter_count_unused', c_uint),\n"
+        "    ('filters', POINTER(POINTER(AVFilterContext))),\n"
+        "    ('scale_sws_opts', STRING),\n"
+        "    ('resample_lavr_opts', STRING),\n"
+        "    ('nb_filters', c_uint),\n"
+        "    ('thread_type', c_int),\n"
+        "    ('nb_threads', c_int),\n"
+        "    ('internal', POINTER(AVFilterGraphInternal)),\n"
+        "    ('aresample_swr_opts', STRING),\n"
+        "    ('sink_links', POINTER(POINTER(AVFilterLink))),\n"
+        "    ('sink_links_count', c_int),\n"
+        "    ('disable_auto_convert', c_uint),\n"
+        ']'
+        ),
+    'AVFilterCommand': ('Structure', (),
+        'AVFilterCommand._fields_ = [\n'
+        ']'
+        ),
+    'AVFilterChannelLayouts': ('Structure', (),
+        'AVFilterChannelLayouts._fields_ = [\n'
+        ']'
+        ),
+    'AVFilterPool': ('Structure', (),
+        'AVFilterPool._fields_ = [\n'
+        ']'
+        ),
+    'avfilter_link': (None, ('AVFilterContext',),
+        "avfilter_link = _libraries['/usr/lib/libavdevice.so'].avfilter_link\n"
+        'avfilter_link.restype = c_int\n'
+        'avfilter_link.argtypes = [POINTER(AVFilterContext), c_uint, POINTER(AVFilterContext), c_uint]'
+        ),
+    'avfilter_link_free': (None, ('AVFilterLink',),
+        "avfilter_link_free = _libraries['/usr/lib/libavdevice.so'].avfilter_link_free\n"
+        'avfilter_link_free.restype = None\n'
+        'avfilter_link_free.argtypes = [POINTER(POINTER(AVFilterLink))]'
+        ),
+    'avfilter_link_get_channels': (None, ('AVFilterLink',),
+        "avfilter_link_get_channels = _libraries['/usr/lib/libavdevice.so'].avfilter_link_get_channels\n"
+        'avfilter_link_get_channels.restype = c_int\n'
+        'avfilter_link_get_channels.argtypes = [POINTER(AVFilterLink)]'
+        ),
+    'avfilter_link_set_closed': (None, ('AVFilterLink',),
+        "avfilter_link_set_closed = _libraries['/usr/lib/libavdevice.so'].avfilter_link_set_closed\n"
+        'avfilter_link_set_closed.restype = None\n'
+        'avfilter_link_set_closed.argtypes = [POINTER(AVFilterLink), c_int]'
+        ),
+    'avfilter_config_links': (None, ('AVFilterContext',),
+        "avfilter_config_links = _libraries['/usr/lib/libavdevice.so'].avfilter_config_links\n"
+        'avfilter_config_links.restype = c_int\n'
+        'avfilter_config_links.argtypes = [POINTER(AVFilterContext)]'
+        ),
+    'avfilter_get_video_buffer_ref_from_arrays': (None, ('AVFilterBufferRef',),
+        "avfilter_get_video_buffer_ref_from_arrays = _libraries['/usr/lib/libavdevice.so'].avfilter_get_video_buffer_ref_from_arrays\n"
+        'avfilter_get_video_buffer_ref_from_arrays.restype = POINTER(AVFilterBufferRef)\n'
+        'avfilter_get_video_buffer_ref_from_arrays.argtypes = [POINTER(POINTER(uint8_t)), POINTER(c_int), c_int, c_int, c_int, AVPixelFormat]'
+        ),
+    'avfilter_get_audio_buffer_ref_from_arrays': (None, ('AVFilterBufferRef',),
+        "avfilter_get_audio_buffer_ref_from_arrays = _libraries['/usr/lib/libavdevice.so'].avfilter_get_audio_buffer_ref_from_arrays\n"
+        'avfilter_get_audio_buffer_ref_from_arrays.restype = POINTER(AVFilterBufferRef)\n'
+        'avfilter_get_audio_buffer_ref_from_arrays.argtypes = [POINTER(POINTER(uint8_t)), c_int, c_int, c_int, AVSampleFormat, uint64_t]'
+        ),
+    'avfilter_get_audio_buffer_ref_from_arrays_channels': (None, ('AVFilterBufferRef',),
+        "avfilter_get_audio_buffer_ref_from_arrays_channels = _libraries['/usr/lib/libavdevice.so'].avfilter_get_audio_buffer_ref_from_arrays_channels\n"
+        'avfilter_get_audio_buffer_ref_from_arrays_channels.restype = POINTER(AVFilterBufferRef)\n'
+        'avfilter_get_audio_buffer_ref_from_arrays_channels.argtypes = [POINTER(POINTER(uint8_t)), c_int, c_int, c_int, AVSampleFormat, c_int, uint64_t]'
+        ),
+    'avfilter_process_command': (None, ('AVFilterContext',),
+        "avfilter_process_command = _libraries['/usr/lib/libavdevice.so'].avfilter_process_command\n"
+        'avfilter_process_command.restype = c_int\n'
+        'avfilter_process_command.argtypes = [POINTER(AVFilterContext), STRING, STRING, STRING, c_int, c_int]'
+        ),
+    'avfilter_register_all': (None, (),
+        "avfilter_register_all = _libraries['/usr/lib/libavdevice.so'].avfilter_register_all\n"
+        'avfilter_register_all.restype = None\n'
+        'avfilter_register_all.argtypes = []'
+        ),
+    'avfilter_uninit': (None, (),
+        "avfilter_uninit = _libraries['/usr/lib/libavdevice.so'].avfilter_uninit\n"
+        'avfilter_uninit.restype = None\n'
+        'avfilter_uninit.argtypes = []'
+        ),
+    'avfilter_register': (None, ('AVFilter',),
+        "avfilter_register = _libraries['/usr/lib/libavdevice.so'].avfilter_register\n"
+        'avfilter_register.restype = c_int\n'
+        'avfilter_register.argtypes = [POINTER(AVFilter)]'
+        ),
+    'avfilter_get_by_name': (None, ('AVFilter',),
+        "avfilter_get_by_name = _libraries['/usr/lib/libavdevice.so'].avfilter_get_by_name\n"
+        'avfilter_get_by_name.restype = POINTER(AVFilter)\n'
+        'avfilter_get_by_name.argtypes = [STRING]'
+        ),
+    'avfilter_next': (None, ('AVFilter',),
+        "avfilter_next = _libraries['/usr/lib/libavdevice.so'].avfilter_next\n"
+        'avfilter_next.restype = POINTER(AVFilter)\n'
+        'avfilter_next.argtypes = [POINTER(AVFilter)]'
+        ),
+    'av_filter_next': (None, ('AVFilter',),
+        "av_filter_next = _libraries['/usr/lib/libavdevice.so'].av_filter_next\n"
+        'av_filter_next.restype = POINTER(POINTER(AVFilter))\n'
+        'av_filter_next.argtypes = [POINTER(POINTER(AVFilter))]'
+        ),
+    'avfilter_open': (None, ('AVFilter', 'AVFilterContext'),
+        "avfilter_open = _libraries['/usr/lib/libavdevice.so'].avfilter_open\n"
+        'avfilter_open.restype = c_int\n'
+        'avfilter_open.argtypes = [POINTER(POINTER(AVFilterContext)), POINTER(AVFilter), STRING]'
+        ),
+    'avfilter_init_filter': (None, ('AVFilterContext',),
+        "avfilter_init_filter = _libraries['/usr/lib/libavdevice.so'].avfilter_init_filter\n"
+        'avfilter_init_filter.restype = c_int\n'
+        'avfilter_init_filter.argtypes = [POINTER(AVFilterContext), STRING, c_void_p]'
+        ),
+    'avfilter_init_str': (None, ('AVFilterContext',),
+        "avfilter_init_str = _libraries['/usr/lib/libavdevice.so'].avfilter_init_str\n"
+        'avfilter_init_str.restype = c_int\n'
+        'avfilter_init_str.argtypes = [POINTER(AVFilterContext), STRING]'
+        ),
+    'avfilter_init_dict': (None, ('AVDictionary', 'AVFilterContext'),
+        "avfilter_init_dict = _libraries['/usr/lib/libavdevice.so'].avfilter_init_dict\n"
+        'avfilter_init_dict.restype = c_int\n'
+        'avfilter_init_dict.argtypes = [POINTER(AVFilterContext), POINTER(POINTER(AVDictionary))]'
+        ),
+    'avfilter_free': (None, ('AVFilterContext',),
+        "avfilter_free = _libraries['/usr/lib/libavdevice.so'].avfilter_free\n"
+        'avfilter_free.restype = None\n'
+        'avfilter_free.argtypes = [POINTER(AVFilterContext)]'
+        ),
+    'avfilter_insert_filter': (None, ('AVFilterContext', 'AVFilterLink'),
+        "avfilter_insert_filter = _libraries['/usr/lib/libavdevice.so'].avfilter_insert_filter\n"
+        'avfilter_insert_filter.restype = c_int\n'
+        'avfilter_insert_filter.argtypes = [POINTER(AVFilterLink), POINTER(AVFilterContext), c_uint, c_uint]'
+        ),
+    'avfilter_copy_frame_props': (None, ('AVFilterBufferRef', 'AVFrame'),
+        "avfilter_copy_frame_props = _libraries['/usr/lib/libavdevice.so'].avfilter_copy_frame_props\n"
+        'avfilter_copy_frame_props.restype = c_int\n'
+        'avfilter_copy_frame_props.argtypes = [POINTER(AVFilterBufferRef), POINTER(AVFrame)]'
+        ),
+    'avfilter_copy_buf_props': (None, ('AVFilterBufferRef', 'AVFrame'),
+        "avfilter_copy_buf_props = _libraries['/usr/lib/libavdevice.so'].avfilter_copy_buf_props\n"
+        'avfilter_copy_buf_props.restype = c_int\n'
+        'avfilter_copy_buf_props.argtypes = [POINTER(AVFrame), POINTER(AVFilterBufferRef)]'
+        ),
+    'avfilter_get_class': (None, ('AVClass',),
+        "avfilter_get_class = _libraries['/usr/lib/libavdevice.so'].avfilter_get_class\n"
+        'avfilter_get_class.restype = POINTER(AVClass)\n'
+        'avfilter_get_class.argtypes = []'
+        ),
+    'AVFilterGraphInternal': ('Structure', (),
+        'AVFilterGraphInternal._fields_ = [\n'
+        ']'
+        ),
+    'avfilter_graph_alloc': (None, ('AVFilterGraph',),
+        "avfilter_graph_alloc = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_alloc\n"
+        'avfilter_graph_alloc.restype = POINTER(AVFilterGraph)\n'
+        'avfilter_graph_alloc.argtypes = []'
+        ),
+    'avfilter_graph_alloc_filter': (None, ('AVFilter', 'AVFilterContext', 'AVFilterGraph'),
+        "avfilter_graph_alloc_filter = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_alloc_filter\n"
+        'avfilter_graph_alloc_filter.restype = POINTER(AVFilterContext)\n'
+        'avfilter_graph_alloc_filter.argtypes = [POINTER(AVFilterGraph), POINTER(AVFilter), STRING]'
+        ),
+    'avfilter_graph_get_filter': (None, ('AVFilterContext', 'AVFilterGraph'),
+        "avfilter_graph_get_filter = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_get_filter\n"
+        'avfilter_graph_get_filter.restype = POINTER(AVFilterContext)\n'
+        'avfilter_graph_get_filter.argtypes = [POINTER(AVFilterGraph), STRING]'
+        ),
+    'avfilter_graph_add_filter': (None, ('AVFilterContext', 'AVFilterGraph'),
+        "avfilter_graph_add_filter = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_add_filter\n"
+        'avfilter_graph_add_filter.restype = c_int\n'
+        'avfilter_graph_add_filter.argtypes = [POINTER(AVFilterGraph), POINTER(AVFilterContext)]'
+        ),
+    'avfilter_graph_create_filter': (None, ('AVFilter', 'AVFilterContext', 'AVFilterGraph'),
+        "avfilter_graph_create_filter = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_create_filter\n"
+        'avfilter_graph_create_filter.restype = c_int\n'
+        'avfilter_graph_create_filter.argtypes = [POINTER(POINTER(AVFilterContext)), POINTER(AVFilter), STRING, STRING, c_void_p, POINTER(AVFilterGraph)]'
+        ),
+    'avfilter_graph_set_auto_convert': (None, ('AVFilterGraph',),
+        "avfilter_graph_set_auto_convert = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_set_auto_convert\n"
+        'avfilter_graph_set_auto_convert.restype = None\n'
+        'avfilter_graph_set_auto_convert.argtypes = [POINTER(AVFilterGraph), c_uint]'
+        ),
+    'avfilter_graph_config': (None, ('AVFilterGraph',),
+        "avfilter_graph_config = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_config\n"
+        'avfilter_graph_config.restype = c_int\n'
+        'avfilter_graph_config.argtypes = [POINTER(AVFilterGraph), c_void_p]'
+        ),
+    'avfilter_graph_free': (None, ('AVFilterGraph',),
+        "avfilter_graph_free = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_free\n"
+        'avfilter_graph_free.restype = None\n'
+        'avfilter_graph_free.argtypes = [POINTER(POINTER(AVFilterGraph))]'
+        ),
+    'AVFilterInOut': ('Structure', ('AVFilterContext',),
+        'AVFilterInOut._fields_ = [\n'
+        "    ('name', STRING),\n"
+        "    ('filter_ctx', POINTER(AVFilterContext)),\n"
+        "    ('pad_idx', c_int),\n"
+        "    ('next', POINTER(AVFilterInOut)),\n"
+        ']'
+        ),
+    'avfilter_inout_alloc': (None, ('AVFilterInOut',),
+        "avfilter_inout_alloc = _libraries['/usr/lib/libavdevice.so'].avfilter_inout_alloc\n"
+        'avfilter_inout_alloc.restype = POINTER(AVFilterInOut)\n'
+        'avfilter_inout_alloc.argtypes = []'
+        ),
+    'avfilter_inout_free': (None, ('AVFilterInOut',),
+        "avfilter_inout_free = _libraries['/usr/lib/libavdevice.so'].avfilter_inout_free\n"
+        'avfilter_inout_free.restype = None\n'
+        'avfilter_inout_free.argtypes = [POINTER(POINTER(AVFilterInOut))]'
+        ),
+    'avfilter_graph_parse': (None, ('AVFilterGraph', 'AVFilterInOut'),
+        "avfilter_graph_parse = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_parse\n"
+        'avfilter_graph_parse.restype = c_int\n'
+        'avfilter_graph_parse.argtypes = [POINTER(AVFilterGraph), STRING, POINTER(POINTER(AVFilterInOut)), POINTER(POINTER(AVFilterInOut)), c_void_p]'
+        ),
+    'avfilter_graph_parse_ptr': (None, ('AVFilterGraph', 'AVFilterInOut'),
+        "avfilter_graph_parse_ptr = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_parse_ptr\n"
+        'avfilter_graph_parse_ptr.restype = c_int\n'
+        'avfilter_graph_parse_ptr.argtypes = [POINTER(AVFilterGraph), STRING, POINTER(POINTER(AVFilterInOut)), POINTER(POINTER(AVFilterInOut)), c_void_p]'
+        ),
+    'avfilter_graph_parse2': (None, ('AVFilterGraph', 'AVFilterInOut'),
+        "avfilter_graph_parse2 = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_parse2\n"
+        'avfilter_graph_parse2.restype = c_int\n'
+        'avfilter_graph_parse2.argtypes = [POINTER(AVFilterGraph), STRING, POINTER(POINTER(AVFilterInOut)), POINTER(POINTER(AVFilterInOut))]'
+        ),
+    'avfilter_graph_send_command': (None, ('AVFilterGraph',),
+        "avfilter_graph_send_command = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_send_command\n"
+        'avfilter_graph_send_command.restype = c_int\n'
+        'avfilter_graph_send_command.argtypes = [POINTER(AVFilterGraph), STRING, STRING, STRING, STRING, c_int, c_int]'
+        ),
+    'avfilter_graph_queue_command': (None, ('AVFilterGraph',),
+        "avfilter_graph_queue_command = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_queue_command\n"
+        'avfilter_graph_queue_command.restype = c_int\n'
+        'avfilter_graph_queue_command.argtypes = [POINTER(AVFilterGraph), STRING, STRING, STRING, c_int, c_double]'
+        ),
+    'avfilter_graph_dump': (None, ('AVFilterGraph',),
+        "avfilter_graph_dump = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_dump\n"
+        'avfilter_graph_dump.restype = STRING\n'
+        'avfilter_graph_dump.argtypes = [POINTER(AVFilterGraph), STRING]'
+        ),
+    'avfilter_graph_request_oldest': (None, ('AVFilterGraph',),
+        "avfilter_graph_request_oldest = _libraries['/usr/lib/libavdevice.so'].avfilter_graph_request_oldest\n"
+        'avfilter_graph_request_oldest.restype = c_int\n'
+        'avfilter_graph_request_oldest.argtypes = [POINTER(AVFilterGraph)]'
+        ),
+    'AVIOContext': ('Structure', ('AVClass',),
+        'AVIOContext._fields_ = [\n'
+        "    ('av_class', POINTER(AVClass)),\n"
+        "    ('buffer', POINTER(c_ubyte)),\n"
+        "    ('buffer_size', c_int),\n"
+        "    ('buf_ptr', POINTER(c_ubyte)),\n"
+        "    ('buf_end', POINTER(c_ubyte)),\n"
+        "    ('opaque', c_void_p),\n"
+        "    ('read_packet', CFUNCTYPE(c_int, c_void_p, POINTER(uint8_t), c_int)),\n"
+        "    ('write_packet', CFUNCTYPE(c_int, c_void_p, POINTER(uint8_t), c_int)),\n"
+        "    ('seek', CFUNCTYPE(int64_t, c_void_p, int64_t, c_int)),\n"
+        "    ('pos', int64_t),\n"
+        "    ('must_flush', c_int),\n"
+        "    ('eof_reached', c_int),\n"
+        "    ('write_flag', c_int),\n"
+        "    ('max_packet_size', c_int),\n"
+        "    ('checksum', c_ulong),\n"
+        "    ('checksum_ptr', POINTER(c_ubyte)),\n"
+        "    ('update_checksum', CFUNCTYPE(c_ulong, c_ulong, POINTER(uint8_t), c_uint)),\n"
+        "    ('error', c_int),\n"
+        "    ('read_pause', CFUNCTYPE(c_int, c_void_p, c_int)),\n"
+        "    ('read_seek', CFUNCTYPE(int64_t, c_void_p, c_int, int64_t, c_int)),\n"
+        "    ('seekable', c_int),\n"
+        "    ('maxsize', int64_t),\n"
+        "    ('direct', c_int),\n"
+        "    ('bytes_read', int64_t),\n"
+        "    ('seek_count', c_int),\n"
+        "    ('writeout_count', c_int),\n"
+        ']'
+        ),
+    'av_get_packet': (None, ('AVIOContext', 'AVPacket'),
+        "av_get_packet = _libraries['/usr/lib/libavformat.so'].av_get_packet\n"
+        'av_get_packet.restype = c_int\n'
+        'av_get_packet.argtypes = [POINTER(AVIOContext), POINTER(AVPacket), c_int]'
+        ),
+    'av_append_packet': (None, ('AVIOContext', 'AVPacket'),
+        "av_append_packet = _libraries['/usr/lib/libavformat.so'].av_append_packet\n"
+        'av_append_packet.restype = c_int\n'
+        'av_append_packet.argtypes = [POINTER(AVIOContext), POINTER(AVPacket), c_int]'
+        ),
+    'AVFrac': ('Structure', (),
+        'AVFrac._fields_ = [\n'
+        "    ('val', int64_t),\n"
+        "    ('num', int64_t),\n"
+        "    ('den', int64_t),\n"
+        ']'
+        ),
+    'AVCodecTag': ('Structure', (),
+        'AVCodecTag._fields_ = [\n'
+        ']'
+        ),
+    'AVProbeData': ('Structure', (),
+        'AVProbeData._fields_ = [\n'
+        "    ('filename', STRING),\n"
+        "    ('buf', POINTER(c_ubyte)),\n"
+        "    ('buf_size', c_int),\n"
+        ']'
+        ),
+    'AVOutputFormat': ('Structure', ('AVClass', 'AVCodecTag', 'AVFormatContext', 'AVPacket'),
+        'AVOutputFormat._fields_ = [\n'
+        "    ('name', STRING),\n"
+        "    ('long_name', STRING),\n"
+        "    ('mime_type', STRING),\n"
+        "    ('extensions', STRING),\n"
+        "    ('audio_codec', AVCodecID),\n"
+        "    ('video_codec', AVCodecID),\n"
+        "    ('subtitle_codec', AVCodecID),\n"
+        "    ('flags', c_int),\n"
+        "    ('codec_tag', POINTER(POINTER(AVCodecTag))),\n"
+        "    ('priv_class', POINTER(AVClass)),\n"
+        "    ('next', POINTER(AVOutputFormat)),\n"
+        "    ('priv_data_size', c_int),\n"
+        "    ('write_header', CFUNCTYPE(c_int, POINTER(AVFormatContext))),\n"
+        "    ('write_packet', CFUNCTYPE(c_int, POINTER(AVFormatContext), POINTER(AVPacket))),\n"
+        "    ('write_trailer', CFUNCTYPE(c_int, POINTER(AVFormatContext))),\n"
+        "    ('interleave_packet', CFUNCTYPE(c_int, POINTER(AVFormatContext), POINTER(AVPacket), POINTER(AVPacket), c_int)),\n"
+        "    ('query_codec', CFUNCTYPE(c_int, AVCodecID, c_int)),\n"
+        "    ('get_output_timestamp', CFUNCTYPE(None, POINTER(AVFormatContext), c_int, POINTER(int64_t), POINTER(int64_t))),\n"
+        ']'
+        ),
+    'AVFormatContext': ('Structure', ('AVChapter', 'AVClass', 'AVDictionary', 'AVIOContext', 'AVIOInterruptCB', 'AVInputFormat', 'AVOutputFormat', 'AVPacketList', 'AVProgram', 'AVRational', 'AVStream'),
+        'AVFormatContext._fields_ = [\n'
+        "    ('av_class', POINTER(AVClass)),\n"
+        "    ('iformat', POINTER(AVInputFormat)),\n"
+        "    ('oformat', POINTER(AVOutputFormat)),\n"
+        "    ('priv_data', c_void_p),\n"
+        "    ('pb', POINTER(AVIOContext)),\n"
+        "    ('ctx_flags', c_int),\n"
+        "    ('nb_streams', c_uint),\n"
+        "    ('streams', POINTER(POINTER(AVStream))),\n"
+        "    ('filename', c_char * 1024),\n"
+        "    ('start_time', int64_t),\n"
+        "    ('duration', int64_t),\n"
+        "    ('bit_rate', c_int),\n"
+        "    ('packet_size', c_uint),\n"
+        "    ('max_delay', c_int),\n"
+        "    ('flags', c_int),\n"
+        "    ('probesize', c_uint),\n"
+        "    ('max_analyze_duration', c_int),\n"
+        "    ('key', POINTER(uint8_t)),\n"
+        "    ('keylen', c_int),\n"
+        "    ('nb_programs', c_uint),\n"
+        "    ('programs', POINTER(POINTER(AVProgram))),\n"
+        "    ('video_codec_id', AVCodecID),\n"
+        "    ('audio_codec_id', AVCodecID),\n"
+        "    ('subtitle_codec_id', AVCodecID),\n"
+        "    ('max_index_size', c_uint),\n"
+        "    ('max_picture_buffer', c_uint),\n"
+        "    ('nb_chapters', c_uint),\n"
+        "    ('chapters', POINTER(POINTER(AVChapter))),\n"
+        "    ('metadata', POINTER(AVDictionary)),\n"
+        "    ('start_time_realtime', int64_t),\n"
+        "    ('fps_probe_size', c_int),\n"
+        "    ('error_recognition', c_int),\n"
+        "    ('interrupt_callback', AVIOInterruptCB),\n"
+        "    ('debug', c_int),\n"
+        "    ('ts_id', c_int),\n"
+        "    ('audio_preload', c_int),\n"
+        "    ('max_chunk_duration', c_int),\n"
+        "    ('max_chunk_size', c_int),\n"
+        "    ('use_wallclock_as_timestamps', c_int),\n"
+        "    ('avoid_negative_ts', c_int),\n"
+        "    ('avio_flags', c_int),\n"
+        "    ('duration_estimation_method', AVDurationEstimationMethod),\n"
+        "    ('skip_initial_bytes', c_uint),\n"
+        "    ('correct_ts_overflow', c_uint),\n"
+        "    ('seek2any', c_int),\n"
+        "    ('flush_packets', c_int),\n"
+        "    ('packet_buffer', POINTER(AVPacketList)),\n"
+        "    ('packet_buffer_end', POINTER(AVPacketList)),\n"
+        "    ('data_offset', int64_t),\n"
+        "    ('raw_packet_buffer', POINTER(AVPacketList)),\n"
+        "    ('raw_packet_buffer_end', POINTER(AVPacketList)),\n"
+        "    ('parse_queue', POINTER(AVPacketList)),\n"
+        "    ('parse_queue_end', POINTER(AVPacketList)),\n"
+        "    ('raw_packet_buffer_remaining_size', c_int),\n"
+        "    ('offset', int64_t),\n"
+        "    ('offset_timebase', AVRational),\n"
+        "    ('io_repositioned', c_int),\n"
+        ']'
+        ),
+    'AVInputFormat': ('Structure', ('AVClass', 'AVCodecTag', 'AVFormatContext', 'AVPacket', 'AVProbeData'),
+        'AVInputFormat._fields_ = [\n'
+        "    ('name', STRING),\n"
+        "    ('long_name', STRING),\n"
+        "    ('flags', c_int),\n"
+        "    ('extensions', STRING),\n"
+        "    ('codec_tag', POINTER(POINTER(AVCodecTag))),\n"
+        "    ('priv_class', POINTER(AVClass)),\n"
+        "    ('next', POINTER(AVInputFormat)),\n"
+        "    ('raw_codec_id', c_int),\n"
+        "    ('priv_data_size', c_int),\n"
+        "    ('read_probe', CFUNCTYPE(c_int, POINTER(AVProbeData))),\n"
+        "    ('read_header', CFUNCTYPE(c_int, POINTER(AVFormatContext))),\n"
+        "    ('read_packet', CFUNCTYPE(c_int, POINTER(AVFormatContext), POINTER(AVPacket))),\n"
+        "    ('read_close', CFUNCTYPE(c_int, POINTER(AVFormatContext))),\n"
+        "    ('read_seek', CFUNCTYPE(c_int, POINTER(AVFormatContext), c_int, int64_t, c_int)),\n"
+        "    ('read_timestamp', CFUNCTYPE(int64_t, POINTER(AVFormatContext), c_int, POINTER(int64_t), int64_t)),\n"
+        "    ('read_play', CFUNCTYPE(c_int, POINTER(AVFormatContext))),\n"
+        "    ('read_pause', CFUNCTYPE(c_int, POINTER(AVFormatContext))),\n"
+        "    ('read_seek2', CFUNCTYPE(c_int, POINTER(AVFormatContext), c_int, int64_t, int64_t, int64_t, c_int)),\n"
+        ']'
+        ),
+    'AVIndexEntry': ('Structure', (),
+        'AVIndexEntry._fields_ = [\n'
+        "    ('pos', int64_t),\n"
+        "    ('timestamp', int64_t),\n"
+        "    ('flags', c_int, 2),\n"
+        "    ('size', c_int, 30),\n"
+        "    ('min_distance', c_int),\n"
+        ']'
+        ),
+    'AVStream': ('Structure', ('AVCodecContext', 'AVCodecParserContext', 'AVDictionary', 'AVFrac', 'AVIndexEntry', 'AVPacket', 'AVPacketList', 'AVProbeData', 'AVRational', 'N8AVStream4DOT_29E'),
+        'AVStream._fields_ = [\n'
+        "    ('index', c_int),\n"
+        "    ('id', c_int),\n"
+        "    ('codec', POINTER(AVCodecContext)),\n"
+        "    ('priv_data', c_void_p),\n"
+        "    ('pts', AVFrac),\n"
+        "    ('time_base', AVRational),\n"
+        "    ('start_time', int64_t),\n"
+        "    ('duration', int64_t),\n"
+        "    ('nb_frames', int64_t),\n"
+        "    ('disposition', c_int),\n"
+        "    ('discard', AVDiscard),\n"
+        "    ('sample_aspect_ratio', AVRational),\n"
+        "    ('metadata', POINTER(AVDictionary)),\n"
+        "    ('avg_frame_rate', AVRational),\n"
+        "    ('attached_pic', AVPacket),\n"
+        "    ('info', POINTER(N8AVStream4DOT_29E)),\n"
+        "    ('pts_wrap_bits', c_int),\n"
+        "    ('reference_dts', int64_t),\n"
+        "    ('first_dts', int64_t),\n"
+        "    ('cur_dts', int64_t),\n"
+        "    ('last_IP_pts', int64_t),\n"
+        "    ('last_IP_duration', c_int),\n"
+        "    ('probe_packets', c_int),\n"
+        "    ('codec_info_nb_frames', c_int),\n"
+        "    ('need_parsing', AVStreamParseType),\n"
+        "    ('parser', POINTER(AVCodecParserContext)),\n"
+        "    ('last_in_packet_buffer', POINTER(AVPacketList)),\n"
+        "    ('probe_data', AVProbeData),\n"
+        "    ('pts_buffer', int64_t * 17),\n"
+        "    ('index_entries', POINTER(AVIndexEntry)),\n"
+        "    ('nb_index_entries', c_int),\n"
+        "    ('index_entries_allocated_size', c_uint),\n"
+        "    ('r_frame_rate', AVRational),\n"
+        "    ('stream_identifier', c_int),\n"
+        "    ('interleaver_chunk_size', int64_t),\n"
+        "    ('interleaver_chunk_duration', int64_t),\n"
+        "    ('request_probe', c_int),\n"
+        "    ('skip_to_keyframe', c_int),\n"
+        "    ('skip_samples', c_int),\n"
+        "    ('nb_decoded_frames', c_int),\n"
+        "    ('mux_ts_offset', int64_t),\n"
+        "    ('pts_wrap_reference', int64_t),\n"
+        "    ('pts_wrap_behavior', c_int),\n"
+        ']'
+        ),
+    'N8AVStream4DOT_29E': ('Structure', (),
+        'N8AVStream4DOT_29E._fields_ = [\n'
+        "    ('last_dts', int64_t),\n"
+        "    ('duration_gcd', int64_t),\n"
+        "    ('duration_count', c_int),\n"
+        "    ('duration_error', POINTER(c_double * 726 * 2)),\n"
+        "    ('codec_info_duration', int64_t),\n"
+        "    ('codec_info_duration_fields', int64_t),\n"
+        "    ('found_decoder', c_int),\n"
+        "    ('last_duration', int64_t),\n"
+        "    ('fps_first_dts', int64_t),\n"
+        "    ('fps_first_dts_idx', c_int),\n"
+        "    ('fps_last_dts', int64_t),\n"
+        "    ('fps_last_dts_idx', c_int),\n"
+        ']'
+        ),
+    'AVPacketList': ('Structure', ('AVPacket',),
+        'AVPacketList._fields_ = [\n'
+        "    ('pkt', AVPacket),\n"
+        "    ('next', POINTER(AVPacketList)),\n"
+        ']'
+        ),
+    'av_stream_get_r_frame_rate': (None, ('AVRational', 'AVStream'),
+        "av_stream_get_r_frame_rate = _libraries['/usr/lib/libavformat.so'].av_stream_get_r_frame_rate\n"
+        'av_stream_get_r_frame_rate.restype = AVRational\n'
+        'av_stream_get_r_frame_rate.argtypes = [POINTER(AVStream)]'
+        ),
+    'av_stream_set_r_frame_rate': (None, ('AVRational', 'AVStream'),
+        "av_stream_set_r_frame_rate = _libraries['/usr/lib/libavformat.so'].av_stream_set_r_frame_rate\n"
+        'av_stream_set_r_frame_rate.restype = None\n'
+        'av_stream_set_r_frame_rate.argtypes = [POINTER(AVStream), AVRational]'
+        ),
+    'AVProgram': ('Structure', ('AVDictionary',),
+        'AVProgram._fields_ = [\n'
+        "    ('id', c_int),\n"
+        "    ('flags', c_int),\n"
+        "    ('discard', AVDiscard),\n"
+        "    ('stream_index', POINTER(c_uint)),\n"
+        "    ('nb_stream_indexes', c_uint),\n"
+        "    ('metadata', POINTER(AVDictionary)),\n"
+        "    ('program_num', c_int),\n"
+        "    ('pmt_pid', c_int),\n"
+        "    ('pcr_pid', c_int),\n"
+        "    ('start_time', int64_t),\n"
+        "    ('end_time', int64_t),\n"
+        "    ('pts_wrap_reference', int64_t),\n"
+        "    ('pts_wrap_behavior', c_int),\n"
+        ']'
+        ),
+    'AVChapter': ('Structure', ('AVDictionary', 'AVRational'),
+        'AVChapter._fields_ = [\n'
+        "    ('id', c_int),\n"
+        "    ('time_base', AVRational),\n"
+        "    ('start', int64_t),\n"
+        "    ('end', int64_t),\n"
+        "    ('metadata', POINTER(AVDictionary)),\n"
+        ']'
+        ),
+    'AVIOInterruptCB': ('Structure', (),
+        'AVIOInterruptCB._fields_ = [\n'
+        "    ('callback', CFUNCTYPE(c_int, c_void_p)),\n"
+        "    ('opaque', c_void_p),\n"
+        ']'
+        ),
+    'av_fmt_ctx_get_duration_estimation_method': (None, ('AVFormatContext',),
+        "av_fmt_ctx_get_duration_estimation_method = _libraries['/usr/lib/libavformat.so'].av_fmt_ctx_get_duration_estimation_method\n"
+        'av_fmt_ctx_get_duration_estimation_method.restype = AVDurationEstimationMethod\n'
+        'av_fmt_ctx_get_duration_estimation_method.argtypes = [POINTER(AVFormatContext)]'
+        ),
+    'avformat_version': (None, (),
+        "avformat_version = _libraries['/usr/lib/libavformat.so'].avformat_version\n"
+        'avformat_version.restype = c_uint\n'
+        'avformat_version.argtypes = []'
+        ),
+    'avformat_configuration': (None, (),
+        "avformat_configuration = _libraries['/usr/lib/libavformat.so'].avformat_configuration\n"
+        'avformat_configuration.restype = STRING\n'
+        'avformat_configuration.argtypes = []'
+        ),
+    'avformat_license': (None, (),
+        "avformat_license = _libraries['/usr/lib/libavformat.so'].avformat_license\n"
+        'avformat_license.restype = STRING\n'
+        'avformat_license.argtypes = []'
+        ),
+    'av_register_all': (None, (),
+        "av_register_all = _libraries['/usr/lib/libavformat.so'].av_register_all\n"
+        'av_register_all.restype = None\n'
+        'av_register_all.argtypes = []'
+        ),
+    'av_register_input_format': (None, ('AVInputFormat',),
+        "av_register_input_format = _libraries['/usr/lib/libavformat.so'].av_register_input_format\n"
+        'av_register_input_format.restype = None\n'
+        'av_register_input_format.argtypes = [POINTER(AVInputFormat)]'
+        ),
+    'av_register_output_format': (None, ('AVOutputFormat',),
+        "av_register_output_format = _libraries['/usr/lib/libavformat.so'].av_register_output_format\n"
+        'av_register_output_format.restype = None\n'
+        'av_register_output_format.argtypes = [POINTER(AVOutputFormat)]'
+        ),
+    'avformat_network_init': (None, (),
+        "avformat_network_init = _libraries['/usr/lib/libavformat.so'].avformat_network_init\n"
+        'avformat_network_init.restype = c_int\n'
+        'avformat_network_init.argtypes = []'
+        ),
+    'avformat_network_deinit': (None, (),
+        "avformat_network_deinit = _libraries['/usr/lib/libavformat.so'].avformat_network_deinit\n"
+        'avformat_network_deinit.restype = c_int\n'
+        'avformat_network_deinit.argtypes = []'
+        ),
+    'av_iformat_next': (None, ('AVInputFormat',),
+        "av_iformat_next = _libraries['/usr/lib/libavformat.so'].av_iformat_next\n"
+        'av_iformat_next.restype = POINTER(AVInputFormat)\n'
+        'av_iformat_next.argtypes = [POINTER(AVInputFormat)]'
+        ),
+    'av_oformat_next': (None, ('AVOutputFormat',),
+        "av_oformat_next = _libraries['/usr/lib/libavformat.so'].av_oformat_next\n"
+        'av_oformat_next.restype = POINTER(AVOutputFormat)\n'
+        'av_oformat_next.argtypes = [POINTER(AVOutputFormat)]'
+        ),
+    'avformat_alloc_context': (None, ('AVFormatContext',),
+        "avformat_alloc_context = _libraries['/usr/lib/libavformat.so'].avformat_alloc_context\n"
+        'avformat_alloc_context.restype = POINTER(AVFormatContext)\n'
+        'avformat_alloc_context.argtypes = []'
+        ),
+    'avformat_free_context': (None, ('AVFormatContext',),
+        "avformat_free_context = _libraries['/usr/lib/libavformat.so'].avformat_free_context\n"
+        'avformat_free_context.restype = None\n'
+        'avformat_free_context.argtypes = [POINTER(AVFormatContext)]'
+        ),
+    'avformat_get_class': (None, ('AVClass',),
+        "avformat_get_class = _libraries['/usr/lib/libavformat.so'].avformat_get_class\n"
+        'avformat_get_class.restype = POINTER(AVClass)\n'
+        'avformat_get_class.argtypes = []'
+        ),
+    'avformat_new_stream': (None, ('AVCodec', 'AVFormatContext', 'AVStream'),
+        "avformat_new_stream = _libraries['/usr/lib/libavformat.so'].avformat_new_stream\n"
+        'avformat_new_stream.restype = POINTER(AVStream)\n'
+        'avformat_new_stream.argtypes = [POINTER(AVFormatContext), POINTER(AVCodec)]'
+        ),
+    'av_new_program': (None, ('AVFormatContext', 'AVProgram'),
+        "av_new_program = _libraries['/usr/lib/libavformat.so'].av_new_program\n"
+        'av_new_program.restype = POINTER(AVProgram)\n'
+        'av_new_program.argtypes = [POINTER(AVFormatContext), c_int]'
+        ),
+    'avformat_alloc_output_context': (None, ('AVFormatContext', 'AVOutputFormat'),
+        "avformat_alloc_output_context = _libraries['/usr/lib/libavformat.so'].avformat_alloc_output_context\n"
+        'avformat_alloc_output_context.restype = POINTER(AVFormatContext)\n'
+        'avformat_alloc_output_context.argtypes = [STRING, POINTER(AVOutputFormat), STRING]'
+        ),
+    'avformat_alloc_output_context2': (None, ('AVFormatContext', 'AVOutputFormat'),
+        "avformat_alloc_output_context2 = _libraries['/usr/lib/libavformat.so'].avformat_alloc_output_context2\n"
+        'avformat_alloc_output_context2.restype = c_int\n'
+        'avformat_alloc_output_context2.argtypes = [POINTER(POINTER(AVFormatContext)), POINTER(AVOutputFormat), STRING, STRING]'
+        ),
+    'av_find_input_format': (None, ('AVInputFormat',),
+        "av_find_input_format = _libraries['/usr/lib/libavformat.so'].av_find_input_format\n"
+        'av_find_input_format.restype = POINTER(AVInputFormat)\n'
+        'av_find_input_format.argtypes = [STRING]'
+        ),
+    'av_probe_input_format': (None, ('AVInputFormat', 'AVProbeData'),
+        "av_probe_input_format = _libraries['/usr/lib/libavformat.so'].av_probe_input_format\n"
+        'av_probe_input_format.restype = POINTER(AVInputFormat)\n'
+        'av_probe_input_format.argtypes = [POINTER(AVProbeData), c_int]'
+        ),
+    'av_probe_input_format2': (None, ('AVInputFormat', 'AVProbeData'),
+        "av_probe_input_format2 = _libraries['/usr/lib/libavformat.so'].av_probe_input_format2\n"
+        'av_probe_input_format2.restype = POINTER(AVInputFormat)\n'
+        'av_probe_input_format2.argtypes = [POINTER(AVProbeData), c_int, POINTER(c_int)]'
+        ),
+    'av_probe_input_format3': (None, ('AVInputFormat', 'AVProbeData'),
+        "av_probe_input_format3 = _libraries['/usr/lib/libavformat.so'].av_probe_input_format3\n"
+        'av_probe_input_format3.restype = POINTER(AVInputFormat)\n'
+        'av_probe_input_format3.argtypes = [POINTER(AVProbeData), c_int, POINTER(c_int)]'
+        ),
+    'av_probe_input_buffer': (None, ('AVIOContext', 'AVInputFormat'),
+        "av_probe_input_buffer = _libraries['/usr/lib/libavformat.so'].av_probe_input_buffer\n"
+        'av_probe_input_buffer.restype = c_int\n'
+        'av_probe_input_buffer.argtypes = [POINTER(AVIOContext), POINTER(POINTER(AVInputFormat)), STRING, c_void_p, c_uint, c_uint]'
+        ),
+    'avformat_open_input': (None, ('AVDictionary', 'AVFormatContext', 'AVInputFormat'),
+        "avformat_open_input = _libraries['/usr/lib/libavformat.so'].avformat_open_input\n"
+        'avformat_open_input.restype = c_int\n'
+        'avformat_open_input.argtypes = [POINTER(POINTER(AVFormatContext)), STRING, POINTER(AVInputFormat), POINTER(POINTER(AVDictionary))]'
+        ),
+    'av_demuxer_open': (None, ('AVFormatContext',),
+        "av_demuxer_open = _libraries['/usr/lib/libavformat.so'].av_demuxer_open\n"
+        'av_demuxer_open.restype = c_int\n'
+        'av_demuxer_open.argtypes = [POINTER(AVFormatContext)]'
+        ),
+    'av_find_stream_info': (None, ('AVFormatContext',),
+        "av_find_stream_info = _libraries['/usr/lib/libavformat.so'].av_find_stream_info\n"
+        'av_find_stream_info.restype = c_int\n'
+        'av_find_stream_info.argtypes = [POINTER(AVFormatContext)]'
+        ),
+    'avformat_find_stream_info': (None, ('AVDictionary', 'AVFormatContext'),
+        "avformat_find_stream_info = _libraries['/usr/lib/libavformat.so'].avformat_find_stream_info\n"
+        'avformat_find_stream_info.restype = c_int\n'
+        'avformat_find_stream_info.argtypes = [POINTER(AVFormatContext), POINTER(POINTER(AVDictionary))]'
+        ),
+    'av_find_program_from_stream': (None, ('AVFormatContext', 'AVProgram'),
+        "av_find_program_from_stream = _libraries['/usr/lib/libavformat.so'].av_find_program_from_stream\n"
+        'av_find_program_from_stream.restype = POINTER(AVProgram)\n'
+        'av_find_program_from_stream.argtypes = [POINTER(AVFormatContext), POINTER(AVProgram), c_int]'
+        ),
+    'av_find_best_stream': (None, ('AVCodec', 'AVFormatContext'),
+        "av_find_best_stream = _libraries['/usr/lib/libavformat.so'].av_find_best_stream\n"
+        'av_find_best_stream.restype = c_int\n'
+        'av_find_best_stream.argtypes = [POINTER(AVFormatContext), AVMediaType, c_int, c_int, POINTER(POINTER(AVCodec)), c_int]'
+        ),
+    'av_read_packet': (None, ('AVFormatContext', 'AVPacket'),
+        "av_read_packet = _libraries['/usr/lib/libavformat.so'].av_read_packet\n"
+        'av_read_packet.restype = c_int\n'
+        'av_read_packet.argtypes = [POINTER(AVFormatContext), POINTER(AVPacket)]'
+        ),
+    'av_read_frame': (None, ('AVFormatContext', 'AVPacket'),
+        "av_read_frame = _libraries['/usr/lib/libavformat.so'].av_read_frame\n"
+        'av_read_frame.restype = c_int\n'
+        'av_read_frame.argtypes = [POINTER(AVFormatContext), POINTER(AVPacket)]'
+        ),
+    'av_seek_frame': (None, ('AVFormatContext',),
+        "av_seek_frame = _libraries['/usr/lib/libavformat.so'].av_seek_frame\n"
+        'av_seek_frame.restype = c_int\n'
+        'av_seek_frame.argtypes = [POINTER(AVFormatContext), c_int, int64_t, c_int]'
+        ),
+    'avformat_seek_file': (None, ('AVFormatContext',),
+        "avformat_seek_file = _libraries['/usr/lib/libavformat.so'].avformat_seek_file\n"
+        'avformat_seek_file.restype = c_int\n'
+        'avformat_seek_file.argtypes = [POINTER(AVFormatContext), c_int, int64_t, int64_t, int64_t, c_int]'
+        ),
+    'av_read_play': (None, ('AVFormatContext',),
+        "av_read_play = _libraries['/usr/lib/libavformat.so'].av_read_play\n"
+        'av_read_play.restype = c_int\n'
+        'av_read_play.argtypes = [POINTER(AVFormatContext)]'
+        ),
+    'av_read_pause': (None, ('AVFormatContext',),
+        "av_read_pause = _libraries['/usr/lib/libavformat.so'].av_read_pause\n"
+        'av_read_pause.restype = c_int\n'
+        'av_read_pause.argtypes = [POINTER(AVFormatContext)]'
+        ),
+    'av_close_input_file': (None, ('AVFormatContext',),
+        "av_close_input_file = _libraries['/usr/lib/libavformat.so'].av_close_input_file\n"
+        'av_close_input_file.restype = None\n'
+        'av_close_input_file.argtypes = [POINTER(AVFormatContext)]'
+        ),
+    'avformat_close_input': (None, ('AVFormatContext',),
+        "avformat_close_input = _libraries['/usr/lib/libavformat.so'].avformat_close_input\n"
+        'avformat_close_input.restype = None\n'
+        'avformat_close_input.argtypes = [POINTER(POINTER(AVFormatContext))]'
+        ),
+    'av_new_stream': (None, ('AVFormatContext', 'AVStream'),
+        "av_new_stream = _libraries['/usr/lib/libavformat.so'].av_new_stream\n"
+        'av_new_stream.restype = POINTER(AVStream)\n'
+        'av_new_stream.argtypes = [POINTER(AVFormatContext), c_int]'
+        ),
+    'av_set_pts_info': (None, ('AVStream',),
+        "av_set_pts_info = _libraries['/usr/lib/libavformat.so'].av_set_pts_info\n"
+        'av_set_pts_info.restype = None\n'
+        'av_set_pts_info.argtypes = [POINTER(AVStream), c_int, c_uint, c_uint]'
+        ),
+    'avformat_write_header': (None, ('AVDictionary', 'AVFormatContext'),
+        "avformat_write_header = _libraries['/usr/lib/libavformat.so'].avformat_write_header\n"
+        'avformat_write_header.restype = c_int\n'
+        'avformat_write_header.argtypes = [POINTER(AVFormatContext), POINTER(POINTER(AVDictionary))]'
+        ),
+    'av_write_frame': (None, ('AVFormatContext', 'AVPacket'),
+        "av_write_frame = _libraries['/usr/lib/libavformat.so'].av_write_frame\n"
+        'av_write_frame.restype = c_int\n'
+        'av_write_frame.argtypes = [POINTER(AVFormatContext), POINTER(AVPacket)]'
+        ),
+    'av_interleaved_write_frame': (None, ('AVFormatContext', 'AVPacket'),
+        "av_interleaved_write_frame = _libraries['/usr/lib/libavformat.so'].av_interleaved_write_frame\n"
+        'av_interleaved_write_frame.restype = c_int\n'
+        'av_interleaved_write_frame.argtypes = [POINTER(AVFormatContext), POINTER(AVPacket)]'
+        ),
+    'av_write_trailer': (None, ('AVFormatContext',),
+        "av_write_trailer = _libraries['/usr/lib/libavformat.so'].av_write_trailer\n"
+        'av_write_trailer.restype = c_int\n'
+        'av_write_trailer.argtypes = [POINTER(AVFormatContext)]'
+        ),
+    'av_guess_format': (None, ('AVOutputFormat',),
+        "av_guess_format = _libraries['/usr/lib/libavformat.so'].av_guess_format\n"
+        'av_guess_format.restype = POINTER(AVOutputFormat)\n'
+        'av_guess_format.argtypes = [STRING, STRING, STRING]'
+        ),
+    'av_guess_codec': (None, ('AVOutputFormat',),
+        "av_guess_codec = _libraries['/usr/lib/libavformat.so'].av_guess_codec\n"
+        'av_guess_codec.restype = AVCodecID\n'
+        'av_guess_codec.argtypes = [POINTER(AVOutputFormat), STRING, STRING, STRING, AVMediaType]'
+        ),
+    'av_get_output_timestamp': (None, ('AVFormatContext',),
+        "av_get_output_timestamp = _libraries['/usr/lib/libavformat.so'].av_get_output_timestamp\n"
+        'av_get_output_timestamp.restype = c_int\n'
+        'av_get_output_timestamp.argtypes = [POINTER(AVFormatContext), c_int, POINTER(int64_t), POINTER(int64_t)]'
+        ),
+    'av_hex_dump': (None, ('FILE',),
+        "av_hex_dump = _libraries['/usr/lib/libavformat.so'].av_hex_dump\n"
+        'av_hex_dump.restype = None\n'
+        'av_hex_dump.argtypes = [POINTER(FILE), POINTER(uint8_t), c_int]'
+        ),
+    'av_hex_dump_log': (None, (),
+        "av_hex_dump_log = _libraries['/usr/lib/libavformat.so'].av_hex_dump_log\n"
+        'av_hex_dump_log.restype = None\n'
+        'av_hex_dump_log.argtypes = [c_void_p, c_int, POINTER(uint8_t), c_int]'
+        ),
+    'av_pkt_dump2': (None, ('AVPacket', 'AVStream', 'FILE'),
+        "av_pkt_dump2 = _libraries['/usr/lib/libavformat.so'].av_pkt_dump2\n"
+        'av_pkt_dump2.restype = None\n'
+        'av_pkt_dump2.argtypes = [POINTER(FILE), POINTER(AVPacket), c_int, POINTER(AVStream)]'
+        ),
+    'av_pkt_dump_log2': (None, ('AVPacket', 'AVStream'),
+        "av_pkt_dump_log2 = _libraries['/usr/lib/libavformat.so'].av_pkt_dump_log2\n"
+        'av_pkt_dump_log2.restype = None\n'
+        'av_pkt_dump_log2.argtypes = [c_void_p, c_int, POINTER(AVPacket), c_int, POINTER(AVStream)]'
+        ),
+    'av_codec_get_id': (None, ('AVCodecTag',),
+        "av_codec_get_id = _libraries['/usr/lib/libavformat.so'].av_codec_get_id\n"
+        'av_codec_get_id.restype = AVCodecID\n'
+        'av_codec_get_id.argtypes = [POINTER(POINTER(AVCodecTag)), c_uint]'
+        ),
+    'av_codec_get_tag': (None, ('AVCodecTag',),
+        "av_codec_get_tag = _libraries['/usr/lib/libavformat.so'].av_codec_get_tag\n"
+        'av_codec_get_tag.restype = c_uint\n'
+        'av_codec_get_tag.argtypes = [POINTER(POINTER(AVCodecTag)), AVCodecID]'
+        ),
+    'av_codec_get_tag2': (None, ('AVCodecTag',),
+        "av_codec_get_tag2 = _libraries['/usr/lib/libavformat.so'].av_codec_get_tag2\n"
+        'av_codec_get_tag2.restype = c_int\n'
+        'av_codec_get_tag2.argtypes = [POINTER(POINTER(AVCodecTag)), AVCodecID, POINTER(c_uint)]'
+        ),
+    'av_find_default_stream_index': (None, ('AVFormatContext',),
+        "av_find_default_stream_index = _libraries['/usr/lib/libavformat.so'].av_find_default_stream_index\n"
+        'av_find_default_stream_index.restype = c_int\n'
+        'av_find_default_stream_index.argtypes = [POINTER(AVFormatContext)]'
+        ),
+    'av_index_search_timestamp': (None, ('AVStream',),
+        "av_index_search_timestamp = _libraries['/usr/lib/libavformat.so'].av_index_search_timestamp\n"
+        'av_index_search_timestamp.restype = c_int\n'
+        'av_index_search_timestamp.argtypes = [POINTER(AVStream), int64_t, c_int]'
+        ),
+    'av_add_index_entry': (None, ('AVStream',),
+        "av_add_index_entry = _libraries['/usr/lib/libavformat.so'].av_add_index_entry\n"
+        'av_add_index_entry.restype = c_int\n'
+        'av_add_index_entry.argtypes = [POINTER(AVStream), int64_t, int64_t, c_int, c_int, c_int]'
+        ),
+    'av_url_split': (None, (),
+        "av_url_split = _libraries['/usr/lib/libavformat.so'].av_url_split\n"
+        'av_url_split.restype = None\n'
+        'av_url_split.argtypes = [STRING, c_int, STRING, c_int, STRING, c_int, POINTER(c_int), STRING, c_int, STRING]'
+        ),
+    'av_dump_format': (None, ('AVFormatContext',),
+        "av_dump_format = _libraries['/usr/lib/libavformat.so'].av_dump_format\n"
+        'av_dump_format.restype = None\n'
+        'av_dump_format.argtypes = [POINTER(AVFormatContext), c_int, STRING, c_int]'
+        ),
+    'av_get_frame_filename': (None, (),
+        "av_get_frame_filename = _libraries['/usr/lib/libavformat.so'].av_get_frame_filename\n"
+        'av_get_frame_filename.restype = c_int\n'
+        'av_get_frame_filename.argtypes = [STRING, c_int, STRING, c_int]'
+        ),
+    'av_filename_number_test': (None, (),
+        "av_filename_number_test = _libraries['/usr/lib/libavformat.so'].av_filename_number_test\n"
+        'av_filename_number_test.restype = c_int\n'
+        'av_filename_number_test.argtypes = [STRING]'
+        ),
+    'av_sdp_create': (None, ('AVFormatContext',),
+        "av_sdp_create = _libraries['/usr/lib/libavformat.so'].av_sdp_create\n"
+        'av_sdp_create.restype = c_int\n'
+        'av_sdp_create.argtypes = [POINTER(POINTER(AVFormatContext)), c_int, STRING, c_int]'
+        ),
+    'av_match_ext': (None, (),
+        "av_match_ext = _libraries['/usr/lib/libavformat.so'].av_match_ext\n"
+        'av_match_ext.restype = c_int\n'
+        'av_match_ext.argtypes = [STRING, STRING]'
+        ),
+    'avformat_query_codec': (None, ('AVOutputFormat',),
+        "avformat_query_codec = _libraries['/usr/lib/libavformat.so'].avformat_query_codec\n"
+        'avformat_query_codec.restype = c_int\n'
+        'avformat_query_codec.argtypes = [POINTER(AVOutputFormat), AVCodecID, c_int]'
+        ),
+    'avformat_get_riff_video_tags': (None, ('AVCodecTag',),
+        "avformat_get_riff_video_tags = _libraries['/usr/lib/libavformat.so'].avformat_get_riff_video_tags\n"
+        'avformat_get_riff_video_tags.restype = POINTER(AVCodecTag)\n'
+        'avformat_get_riff_video_tags.argtypes = []'
+        ),
+    'avformat_get_riff_audio_tags': (None, ('AVCodecTag',),
+        "avformat_get_riff_audio_tags = _libraries['/usr/lib/libavformat.so'].avformat_get_riff_audio_tags\n"
+        'avformat_get_riff_audio_tags.restype = POINTER(AVCodecTag)\n'
+        'avformat_get_riff_audio_tags.argtypes = []'
+        ),
+    'av_guess_sample_aspect_ratio': (None, ('AVFormatContext', 'AVFrame', 'AVRational', 'AVStream'),
+        "av_guess_sample_aspect_ratio = _libraries['/usr/lib/libavformat.so'].av_guess_sample_aspect_ratio\n"
+        'av_guess_sample_aspect_ratio.restype = AVRational\n'
+        'av_guess_sample_aspect_ratio.argtypes = [POINTER(AVFormatContext), POINTER(AVStream), POINTER(AVFrame)]'
+        ),
+    'av_guess_frame_rate': (None, ('AVFormatContext', 'AVFrame', 'AVRational', 'AVStream'),
+        "av_guess_frame_rate = _libraries['/usr/lib/libavformat.so'].av_guess_frame_rate\n"
+        'av_guess_frame_rate.restype = AVRational\n'
+        'av_guess_frame_rate.argtypes = [POINTER(AVFormatContext), POINTER(AVStream), POINTER(AVFrame)]'
+        ),
+    'avformat_match_stream_specifier': (None, ('AVFormatContext', 'AVStream'),
+        "avformat_match_stream_specifier = _libraries['/usr/lib/libavformat.so'].avformat_match_stream_specifier\n"
+        'avformat_match_stream_specifier.restype = c_int\n'
+        'avformat_match_stream_specifier.argtypes = [POINTER(AVFormatContext), POINTER(AVStream), STRING]'
+        ),
+    'avformat_queue_attached_pictures': (None, ('AVFormatContext',),
+        "avformat_queue_attached_pictures = _libraries['/usr/lib/libavformat.so'].avformat_queue_attached_pictures\n"
+        'avformat_queue_attached_pictures.restype = c_int\n'
+        'avformat_queue_attached_pictures.argtypes = [POINTER(AVFormatContext)]'
+        ),
+    'avio_check': (None, (),
+        "avio_check = _libraries['/usr/lib/libavformat.so'].avio_check\n"
+        'avio_check.restype = c_int\n'
+        'avio_check.argtypes = [STRING, c_int]'
+        ),
+    'avio_alloc_context': (None, ('AVIOContext',),
+        "avio_alloc_context = _libraries['/usr/lib/libavformat.so'].avio_alloc_context\n"
+        'avio_alloc_context.restype = POINTER(AVIOContext)\n'
+        'avio_alloc_context.argtypes = [POINTER(c_ubyte), c_int, c_int, c_void_p, CFUNCTYPE(c_int, c_void_p, POINTER(uint8_t), c_int), CFUNCTYPE(c_int, c_void_p, POINTER(uint8_t), c_int), CFUNCTYPE(int64_t, c_void_p, int64_t, c_int)]'
+        ),
+    'avio_w8': (None, ('AVIOContext',),
+        "avio_w8 = _libraries['/usr/lib/libavformat.so'].avio_w8\n"
+        'avio_w8.restype = None\n'
+        'avio_w8.argtypes = [POINTER(AVIOContext), c_int]'
+        ),
+    'avio_write': (None, ('AVIOContext',),
+        "avio_write = _libraries['/usr/lib/libavformat.so'].avio_write\n"
+        'avio_write.restype = None\n'
+        'avio_write.argtypes = [POINTER(AVIOContext), POINTER(c_ubyte), c_int]'
+        ),
+    'avio_wl64': (None, ('AVIOContext',),
+        "avio_wl64 = _libraries['/usr/lib/libavformat.so'].avio_wl64\n"
+        'avio_wl64.restype = None\n'
+        'avio_wl64.argtypes = [POINTER(AVIOContext), uint64_t]'
+        ),
+    'avio_wb64': (None, ('AVIOContext',),
+        "avio_wb64 = _libraries['/usr/lib/libavformat.so'].avio_wb64\n"
+        'avio_wb64.restype = None\n'
+        'avio_wb64.argtypes = [POINTER(AVIOContext), uint64_t]'
+        ),
+    'avio_wl32': (None, ('AVIOContext',),
+        "avio_wl32 = _libraries['/usr/lib/libavformat.so'].avio_wl32\n"
+        'avio_wl32.restype = None\n'
+        'avio_wl32.argtypes = [POINTER(AVIOContext), c_uint]'
+        ),
+    'avio_wb32': (None, ('AVIOContext',),
+        "avio_wb32 = _libraries['/usr/lib/libavformat.so'].avio_wb32\n"
+        'avio_wb32.restype = None\n'
+        'avio_wb32.argtypes = [POINTER(AVIOContext), c_uint]'
+        ),
+    'avio_wl24': (None, ('AVIOContext',),
+        "avio_wl24 = _libraries['/usr/lib/libavformat.so'].avio_wl24\n"
+        'avio_wl24.restype = None\n'
+        'avio_wl24.argtypes = [POINTER(AVIOContext), c_uint]'
+        ),
+    'avio_wb24': (None, ('AVIOContext',),
+        "avio_wb24 = _libraries['/usr/lib/libavformat.so'].avio_wb24\n"
+        'avio_wb24.restype = None\n'
+        'avio_wb24.argtypes = [POINTER(AVIOContext), c_uint]'
+        ),
+    'avio_wl16': (None, ('AVIOContext',),
+        "avio_wl16 = _libraries['/usr/lib/libavformat.so'].avio_wl16\n"
+        'avio_wl16.restype = None\n'
+        'avio_wl16.argtypes = [POINTER(AVIOContext), c_uint]'
+        ),
+    'avio_wb16': (None, ('AVIOContext',),
+        "avio_wb16 = _libraries['/usr/lib/libavformat.so'].avio_wb16\n"
+        'avio_wb16.restype = None\n'
+        'avio_wb16.argtypes = [POINTER(AVIOContext), c_uint]'
+        ),
+    'avio_put_str': (None, ('AVIOContext',),
+        "avio_put_str = _libraries['/usr/lib/libavformat.so'].avio_put_str\n"
+        'avio_put_str.restype = c_int\n'
+        'avio_put_str.argtypes = [POINTER(AVIOContext), STRING]'
+        ),
+    'avio_put_str16le': (None, ('AVIOContext',),
+        "avio_put_str16le = _libraries['/usr/lib/libavformat.so'].avio_put_str16le\n"
+        'avio_put_str16le.restype = c_int\n'
+        'avio_put_str16le.argtypes = [POINTER(AVIOContext), STRING]'
+        ),
+    'avio_seek': (None, ('AVIOContext',),
+        "avio_seek = _libraries['/usr/lib/libavformat.so'].avio_seek\n"
+        'avio_seek.restype = int64_t\n'
+        'avio_seek.argtypes = [POINTER(AVIOContext), int64_t, c_int]'
+        ),
+    'avio_skip': (None, ('AVIOContext',),
+        "avio_skip = _libraries['/usr/lib/libavformat.so'].avio_skip\n"
+        'avio_skip.restype = int64_t\n'
+        'avio_skip.argtypes = [POINTER(AVIOContext), int64_t]'
+        ),
+    'avio_size': (None, ('AVIOContext',),
+        "avio_size = _libraries['/usr/lib/libavformat.so'].avio_size\n"
+        'avio_size.restype = int64_t\n'
+        'avio_size.argtypes = [POINTER(AVIOContext)]'
+        ),
+    'url_feof': (None, ('AVIOContext',),
+        "url_feof = _libraries['/usr/lib/libavformat.so'].url_feof\n"
+        'url_feof.restype = c_int\n'
+        'url_feof.argtypes = [POINTER(AVIOContext)]'
+        ),
+    'avio_printf': (None, ('AVIOContext',),
+        "avio_printf = _libraries['/usr/lib/libavformat.so'].avio_printf\n"
+        'avio_printf.restype = c_int\n'
+        'avio_printf.argtypes = [POINTER(AVIOContext), STRING]'
+        ),
+    'avio_flush': (None, ('AVIOContext',),
+        "avio_flush = _libraries['/usr/lib/libavformat.so'].avio_flush\n"
+        'avio_flush.restype = None\n'
+        'avio_flush.argtypes = [POINTER(AVIOContext)]'
+        ),
+    'avio_read': (None, ('AVIOContext',),
+        "avio_read = _libraries['/usr/lib/libavformat.so'].avio_read\n"
+        'avio_read.restype = c_int\n'
+        'avio_read.argtypes = [POINTER(AVIOContext), POINTER(c_ubyte), c_int]'
+        ),
+    'avio_r8': (None, ('AVIOContext',),
+        "avio_r8 = _libraries['/usr/lib/libavformat.so'].avio_r8\n"
+        'avio_r8.restype = c_int\n'
+        'avio_r8.argtypes = [POINTER(AVIOContext)]'
+        ),
+    'avio_rl16': (None, ('AVIOContext',),
+        "avio_rl16 = _libraries['/usr/lib/libavformat.so'].avio_rl16\n"
+        'avio_rl16.restype = c_uint\n'
+        'avio_rl16.argtypes = [POINTER(AVIOContext)]'
+        ),
+    'avio_rl24': (None, ('AVIOContext',),
+        "avio_rl24 = _libraries['/usr/lib/libavformat.so'].avio_rl24\n"
+        'avio_rl24.restype = c_uint\n'
+        'avio_rl24.argtypes = [POINTER(AVIOContext)]'
+        ),
+    'avio_rl32': (None, ('AVIOContext',),
+        "avio_rl32 = _libraries['/usr/lib/libavformat.so'].avio_rl32\n"
+        'avio_rl32.restype = c_uint\n'
+        'avio_rl32.argtypes = [POINTER(AVIOContext)]'
+        ),
+    'avio_rl64': (None, ('AVIOContext',),
+        "avio_rl64 = _libraries['/usr/lib/libavformat.so'].avio_rl64\n"
+        'avio_rl64.restype = uint64_t\n'
+        'avio_rl64.argtypes = [POINTER(AVIOContext)]'
+        ),
+    'avio_rb16': (None, ('AVIOContext',),
+        "avio_rb16 = _libraries['/usr/lib/libavformat.so'].avio_rb16\n"
+        'avio_rb16.restype = c_uint\n'
+        'avio_rb16.argtypes = [POINTER(AVIOContext)]'
+        ),
+    'avio_rb24': (None, ('AVIOContext',),
+        "avio_rb24 = _libraries['/usr/lib/libavformat.so'].avio_rb24\n"
+        'avio_rb24.restype = c_uint\n'
+        'avio_rb24.argtypes = [POINTER(AVIOContext)]'
+        ),
+    'avio_rb32': (None, ('AVIOContext',),
+        "avio_rb32 = _libraries['/usr/lib/libavformat.so'].avio_rb32\n"
+        'avio_rb32.restype = c_uint\n'
+        'avio_rb32.argtypes = [POINTER(AVIOContext)]'
+        ),
+    'avio_rb64': (None, ('AVIOContext',),
+        "avio_rb64 = _libraries['/usr/lib/libavformat.so'].avio_rb64\n"
+        'avio_rb64.restype = uint64_t\n'
+        'avio_rb64.argtypes = [POINTER(AVIOContext)]'
+        ),
+    'avio_get_str': (None, ('AVIOContext',),
+        "avio_get_str = _libraries['/usr/lib/libavformat.so'].avio_get_str\n"
+        'avio_get_str.restype = c_int\n'
+        'avio_get_str.argtypes = [POINTER(AVIOContext), c_int, STRING, c_int]'
+        ),
+    'avio_get_str16le': (None, ('AVIOContext',),
+        "avio_get_str16le = _libraries['/usr/lib/libavformat.so'].avio_get_str16le\n"
+        'avio_get_str16le.restype = c_int\n'
+        'avio_get_str16le.argtypes = [POINTER(AVIOContext), c_int, STRING, c_int]'
+        ),
+    'avio_get_str16be': (None, ('AVIOContext',),
+        "avio_get_str16be = _libraries['/usr/lib/libavformat.so'].avio_get_str16be\n"
+        'avio_get_str16be.restype = c_int\n'
+        'avio_get_str16be.argtypes = [POINTER(AVIOContext), c_int, STRING, c_int]'
+        ),
+    'avio_open': (None, ('AVIOContext',),
+        "avio_open = _libraries['/usr/lib/libavformat.so'].avio_open\n"
+        'avio_open.restype = c_int\n'
+        'avio_open.argtypes = [POINTER(POINTER(AVIOContext)), STRING, c_int]'
+        ),
+    'avio_open2': (None, ('AVDictionary', 'AVIOContext', 'AVIOInterruptCB'),
+        "avio_open2 = _libraries['/usr/lib/libavformat.so'].avio_open2\n"
+        'avio_open2.restype = c_int\n'
+        'avio_open2.argtypes = [POINTER(POINTER(AVIOContext)), STRING, c_int, POINTER(AVIOInterruptCB), POINTER(POINTER(AVDictionary))]'
+        ),
+    'avio_close': (None, ('AVIOContext',),
+        "avio_close = _libraries['/usr/lib/libavformat.so'].avio_close\n"
+        'avio_close.restype = c_int\n'
+        'avio_close.argtypes = [POINTER(AVIOContext)]'
+        ),
+    'avio_closep': (None, ('AVIOContext',),
+        "avio_closep = _libraries['/usr/lib/libavformat.so'].avio_closep\n"
+        'avio_closep.restype = c_int\n'
+        'avio_closep.argtypes = [POINTER(POINTER(AVIOContext))]'
+        ),
+    'avio_open_dyn_buf': (None, ('AVIOContext',),
+        "avio_open_dyn_buf = _libraries['/usr/lib/libavformat.so'].avio_open_dyn_buf\n"
+        'avio_open_dyn_buf.restype = c_int\n'
+        'avio_open_dyn_buf.argtypes = [POINTER(POINTER(AVIOContext))]'
+        ),
+    'avio_close_dyn_buf': (None, ('AVIOContext',),
+        "avio_close_dyn_buf = _libraries['/usr/lib/libavformat.so'].avio_close_dyn_buf\n"
+        'avio_close_dyn_buf.restype = c_int\n'
+        'avio_close_dyn_buf.argtypes = [POINTER(AVIOContext), POINTER(POINTER(uint8_t))]'
+        ),
+    'avio_enum_protocols': (None, (),
+        "avio_enum_protocols = _libraries['/usr/lib/libavformat.so'].avio_enum_protocols\n"
+        'avio_enum_protocols.restype = STRING\n'
+        'avio_enum_protocols.argtypes = [POINTER(c_void_p), c_int]'
+        ),
+    'avio_pause': (None, ('AVIOContext',),
+        "avio_pause = _libraries['/usr/lib/libavformat.so'].avio_pause\n"
+        'avio_pause.restype = c_int\n'
+        'avio_pause.argtypes = [POINTER(AVIOContext), c_int]'
+        ),
+    'avio_seek_time': (None, ('AVIOContext',),
+        "avio_seek_time = _libraries['/usr/lib/libavformat.so'].avio_seek_time\n"
+        'avio_seek_time.restype = int64_t\n'
+        'avio_seek_time.argtypes = [POINTER(AVIOContext), c_int, int64_t, c_int]'
+        ),
+    'AVAudioResampleContext': ('Structure', (),
+        'AVAudioResampleContext._fields_ = [\n'
+        ']'
+        ),
+    'avresample_version': (None, (),
+        "avresample_version = _libraries['/usr/lib/libavdevice.so'].avresample_version\n"
+        'avresample_version.restype = c_uint\n'
+        'avresample_version.argtypes = []'
+        ),
+    'avresample_configuration': (None, (),
+        "avresample_configuration = _libraries['/usr/lib/libavdevice.so'].avresample_configuration\n"
+        'avresample_configuration.restype = STRING\n'
+        'avresample_configuration.argtypes = []'
+        ),
+    'avresample_license': (None, (),
+        "avresample_license = _libraries['/usr/lib/libavdevice.so'].avresample_license\n"
+        'avresample_license.restype = STRING\n'
+        'avresample_license.argtypes = []'
+        ),
+    'avresample_get_class': (None, ('AVClass',),
+        "avresample_get_class = _libraries['/usr/lib/libavdevice.so'].avresample_get_class\n"
+        'avresample_get_class.restype = POINTER(AVClass)\n'
+        'avresample_get_class.argtypes = []'
+        ),
+    'avresample_alloc_context': (None, ('AVAudioResampleContext',),
+        "avresample_alloc_context = _libraries['/usr/lib/libavdevice.so'].avresample_alloc_context\n"
+        'avresample_alloc_context.restype = POINTER(AVAudioResampleContext)\n'
+        'avresample_alloc_context.argtypes = []'
+        ),
+    'avresample_open': (None, ('AVAudioResampleContext',),
+        "avresample_open = _libraries['/usr/lib/libavdevice.so'].avresample_open\n"
+        'avresample_open.restype = c_int\n'
+        'avresample_open.argtypes = [POINTER(AVAudioResampleContext)]'
+        ),
+    'avresample_close': (None, ('AVAudioResampleContext',),
+        "avresample_close = _libraries['/usr/lib/libavdevice.so'].avresample_close\n"
+        'avresample_close.restype = None\n'
+        'avresample_close.argtypes = [POINTER(AVAudioResampleContext)]'
+        ),
+    'avresample_free': (None, ('AVAudioResampleContext',),
+        "avresample_free = _libraries['/usr/lib/libavdevice.so'].avresample_free\n"
+        'avresample_free.restype = None\n'
+        'avresample_free.argtypes = [POINTER(POINTER(AVAudioResampleContext))]'
+        ),
+    'avresample_build_matrix': (None, (),
+        "avresample_build_matrix = _libraries['/usr/lib/libavdevice.so'].avresample_build_matrix\n"
+        'avresample_build_matrix.restype = c_int\n'
+        'avresample_build_matrix.argtypes = [uint64_t, uint64_t, c_double, c_double, c_double, c_int, POINTER(c_double), c_int, AVMatrixEncoding]'
+        ),
+    'avresample_get_matrix': (None, ('AVAudioResampleContext',),
+        "avresample_get_matrix = _libraries['/usr/lib/libavdevice.so'].avresample_get_matrix\n"
+        'avresample_get_matrix.restype = c_int\n'
+        'avresample_get_matrix.argtypes = [POINTER(AVAudioResampleContext), POINTER(c_double), c_int]'
+        ),
+    'avresample_set_matrix': (None, ('AVAudioResampleContext',),
+        "avresample_set_matrix = _libraries['/usr/lib/libavdevice.so'].avresample_set_matrix\n"
+        'avresample_set_matrix.restype = c_int\n'
+        'avresample_set_matrix.argtypes = [POINTER(AVAudioResampleContext), POINTER(c_double), c_int]'
+        ),
+    'avresample_set_channel_mapping': (None, ('AVAudioResampleContext',),
+        "avresample_set_channel_mapping = _libraries['/usr/lib/libavdevice.so'].avresample_set_channel_mapping\n"
+        'avresample_set_channel_mapping.restype = c_int\n'
+        'avresample_set_channel_mapping.argtypes = [POINTER(AVAudioResampleContext), POINTER(c_int)]'
+        ),
+    'avresample_set_compensation': (None, ('AVAudioResampleContext',),
+        "avresample_set_compensation = _libraries['/usr/lib/libavdevice.so'].avresample_set_compensation\n"
+        'avresample_set_compensation.restype = c_int\n'
+        'avresample_set_compensation.argtypes = [POINTER(AVAudioResampleContext), c_int, c_int]'
+        ),
+    'avresample_convert': (None, ('AVAudioResampleContext',),
+        "avresample_convert = _libraries['/usr/lib/libavdevice.so'].avresample_convert\n"
+        'avresample_convert.restype = c_int\n'
+        'avresample_convert.argtypes = [POINTER(AVAudioResampleContext), POINTER(POINTER(uint8_t)), c_int, c_int, POINTER(POINTER(uint8_t)), c_int, c_int]'
+        ),
+    'avresample_get_delay': (None, ('AVAudioResampleContext',),
+        "avresample_get_delay = _libraries['/usr/lib/libavdevice.so'].avresample_get_delay\n"
+        'avresample_get_delay.restype = c_int\n'
+        'avresample_get_delay.argtypes = [POINTER(AVAudioResampleContext)]'
+        ),
+    'avresample_available': (None, ('AVAudioResampleContext',),
+        "avresample_available = _libraries['/usr/lib/libavdevice.so'].avresample_available\n"
+        'avresample_available.restype = c_int\n'
+        'avresample_available.argtypes = [POINTER(AVAudioResampleContext)]'
+        ),
+    'avresample_read': (None, ('AVAudioResampleContext',),
+        "avresample_read = _libraries['/usr/lib/libavdevice.so'].avresample_read\n"
+        'avresample_read.restype = c_int\n'
+        'avresample_read.argtypes = [POINTER(AVAudioResampleContext), POINTER(POINTER(uint8_t)), c_int]'
+        ),
+    'avutil_version': (None, (),
+        "avutil_version = _libraries['/usr/lib/libavcodec.so'].avutil_version\n"
+        'avutil_version.restype = c_uint\n'
+        'avutil_version.argtypes = []'
+        ),
+    'avutil_configuration': (None, (),
+        "avutil_configuration = _libraries['/usr/lib/libavcodec.so'].avutil_configuration\n"
+        'avutil_configuration.restype = STRING\n'
+        'avutil_configuration.argtypes = []'
+        ),
+    'avutil_license': (None, (),
+        "avutil_license = _libraries['/usr/lib/libavcodec.so'].avutil_license\n"
+        'avutil_license.restype = STRING\n'
+        'avutil_license.argtypes = []'
+        ),
+    'av_get_media_type_string': (None, (),
+        "av_get_media_type_string = _libraries['/usr/lib/libavcodec.so'].av_get_media_type_string\n"
+        'av_get_media_type_string.restype = STRING\n'
+        'av_get_media_type_string.argtypes = [AVMediaType]'
+        ),
+    'av_get_picture_type_char': (None, (),
+        "av_get_picture_type_char = _libraries['/usr/lib/libavcodec.so'].av_get_picture_type_char\n"
+        'av_get_picture_type_char.restype = c_char\n'
+        'av_get_picture_type_char.argtypes = [AVPictureType]'
+        ),
+    'av_int_list_length_for_size': (None, (),
+        "av_int_list_length_for_size = _libraries['/usr/lib/libavcodec.so'].av_int_list_length_for_size\n"
+        'av_int_list_length_for_size.restype = c_uint\n'
+        'av_int_list_length_for_size.argtypes = [c_uint, c_void_p, uint64_t]'
+        ),
+    'AVBuffer': ('Structure', (),
+        'AVBuffer._fields_ = [\n'
+        ']'
+        ),
+    'av_buffer_alloc': (None, ('AVBufferRef',),
+        "av_buffer_alloc = _libraries['/usr/lib/libavcodec.so'].av_buffer_alloc\n"
+        'av_buffer_alloc.restype = POINTER(AVBufferRef)\n'
+        'av_buffer_alloc.argtypes = [c_int]'
+        ),
+    'av_buffer_allocz': (None, ('AVBufferRef',),
+        "av_buffer_allocz = _libraries['/usr/lib/libavcodec.so'].av_buffer_allocz\n"
+        'av_buffer_allocz.restype = POINTER(AVBufferRef)\n'
+        'av_buffer_allocz.argtypes = [c_int]'
+        ),
+    'av_buffer_create': (None, ('AVBufferRef',),
+        "av_buffer_create = _libraries['/usr/lib/libavcodec.so'].av_buffer_create\n"
+        'av_buffer_create.restype = POINTER(AVBufferRef)\n'
+        'av_buffer_create.argtypes = [POINTER(uint8_t), c_int, CFUNCTYPE(None, c_void_p, POINTER(uint8_t)), c_void_p, c_int]'
+        ),
+    'av_buffer_default_free': (None, (),
+        "av_buffer_default_free = _libraries['/usr/lib/libavcodec.so'].av_buffer_default_free\n"
+        'av_buffer_default_free.restype = None\n'
+        'av_buffer_default_free.argtypes = [c_void_p, POINTER(uint8_t)]'
+        ),
+    'av_buffer_ref': (None, ('AVBufferRef',),
+        "av_buffer_ref = _libraries['/usr/lib/libavcodec.so'].av_buffer_ref\n"
+        'av_buffer_ref.restype = POINTER(AVBufferRef)\n'
+        'av_buffer_ref.argtypes = [POINTER(AVBufferRef)]'
+        ),
+    'av_buffer_unref': (None, ('AVBufferRef',),
+        "av_buffer_unref = _libraries['/usr/lib/libavcodec.so'].av_buffer_unref\n"
+        'av_buffer_unref.restype = None\n'
+        'av_buffer_unref.argtypes = [POINTER(POINTER(AVBufferRef))]'
+        ),
+    'av_buffer_is_writable': (None, ('AVBufferRef',),
+        "av_buffer_is_writable = _libraries['/usr/lib/libavcodec.so'].av_buffer_is_writable\n"
+        'av_buffer_is_writable.restype = c_int\n'
+        'av_buffer_is_writable.argtypes = [POINTER(AVBufferRef)]'
+        ),
+    'av_buffer_get_opaque': (None, ('AVBufferRef',),
+        "av_buffer_get_opaque = _libraries['/usr/lib/libavcodec.so'].av_buffer_get_opaque\n"
+        'av_buffer_get_opaque.restype = c_void_p\n'
+        'av_buffer_get_opaque.argtypes = [POINTER(AVBufferRef)]'
+        ),
+    'av_buffer_get_ref_count': (None, ('AVBufferRef',),
+        "av_buffer_get_ref_count = _libraries['/usr/lib/libavcodec.so'].av_buffer_get_ref_count\n"
+        'av_buffer_get_ref_count.restype = c_int\n'
+        'av_buffer_get_ref_count.argtypes = [POINTER(AVBufferRef)]'
+        ),
+    'av_buffer_make_writable': (None, ('AVBufferRef',),
+        "av_buffer_make_writable = _libraries['/usr/lib/libavcodec.so'].av_buffer_make_writable\n"
+        'av_buffer_make_writable.restype = c_int\n'
+        'av_buffer_make_writable.argtypes = [POINTER(POINTER(AVBufferRef))]'
+        ),
+    'av_buffer_realloc': (None, ('AVBufferRef',),
+        "av_buffer_realloc = _libraries['/usr/lib/libavcodec.so'].av_buffer_realloc\n"
+        'av_buffer_realloc.restype = c_int\n'
+        'av_buffer_realloc.argtypes = [POINTER(POINTER(AVBufferRef)), c_int]'
+        ),
+    'AVBufferPool': ('Structure', (),
+        'AVBufferPool._fields_ = [\n'
+        ']'
+        ),
+    'av_buffer_pool_init': (None, ('AVBufferPool', 'AVBufferRef'),
+        "av_buffer_pool_init = _libraries['/usr/lib/libavcodec.so'].av_buffer_pool_init\n"
+        'av_buffer_pool_init.restype = POINTER(AVBufferPool)\n'
+        'av_buffer_pool_init.argtypes = [c_int, CFUNCTYPE(POINTER(AVBufferRef), c_int)]'
+        ),
+    'av_buffer_pool_uninit': (None, ('AVBufferPool',),
+        "av_buffer_pool_uninit = _libraries['/usr/lib/libavcodec.so'].av_buffer_pool_uninit\n"
+        'av_buffer_pool_uninit.restype = None\n'
+        'av_buffer_pool_uninit.argtypes = [POINTER(POINTER(AVBufferPool))]'
+        ),
+    'av_buffer_pool_get': (None, ('AVBufferPool', 'AVBufferRef'),
+        "av_buffer_pool_get = _libraries['/usr/lib/libavcodec.so'].av_buffer_pool_get\n"
+        'av_buffer_pool_get.restype = POINTER(AVBufferRef)\n'
+        'av_buffer_pool_get.argtypes = [POINTER(AVBufferPool)]'
+        ),
+    'av_get_channel_layout': (None, (),
+        "av_get_channel_layout = _libraries['/usr/lib/libavcodec.so'].av_get_channel_layout\n"
+        'av_get_channel_layout.restype = uint64_t\n'
+        'av_get_channel_layout.argtypes = [STRING]'
+        ),
+    'av_get_channel_layout_string': (None, (),
+        "av_get_channel_layout_string = _libraries['/usr/lib/libavcodec.so'].av_get_channel_layout_string\n"
+        'av_get_channel_layout_string.restype = None\n'
+        'av_get_channel_layout_string.argtypes = [STRING, c_int, c_int, uint64_t]'
+        ),
+    'AVBPrint': ('Structure', (),
+        'AVBPrint._fields_ = [\n'
+        ']'
+        ),
+    'av_bprint_channel_layout': (None, ('AVBPrint',),
+        "av_bprint_channel_layout = _libraries['/usr/lib/libavcodec.so'].av_bprint_channel_layout\n"
+        'av_bprint_channel_layout.restype = None\n'
+        'av_bprint_channel_layout.argtypes = [POINTER(AVBPrint), c_int, uint64_t]'
+        ),
+    'av_get_channel_layout_nb_channels': (None, (),
+        "av_get_channel_layout_nb_channels = _libraries['/usr/lib/libavcodec.so'].av_get_channel_layout_nb_channels\n"
+        'av_get_channel_layout_nb_channels.restype = c_int\n'
+        'av_get_channel_layout_nb_channels.argtypes = [uint64_t]'
+        ),
+    'av_get_default_channel_layout': (None, (),
+        "av_get_default_channel_layout = _libraries['/usr/lib/libavcodec.so'].av_get_default_channel_layout\n"
+        'av_get_default_channel_layout.restype = int64_t\n'
+        'av_get_default_channel_layout.argtypes = [c_int]'
+        ),
+    'av_get_channel_layout_channel_index': (None, (),
+        "av_get_channel_layout_channel_index = _libraries['/usr/lib/libavcodec.so'].av_get_channel_layout_channel_index\n"
+        'av_get_channel_layout_channel_index.restype = c_int\n'
+        'av_get_channel_layout_channel_index.argtypes = [uint64_t, uint64_t]'
+        ),
+    'av_channel_layout_extract_channel': (None, (),
+        "av_channel_layout_extract_channel = _libraries['/usr/lib/libavcodec.so'].av_channel_layout_extract_channel\n"
+        'av_channel_layout_extract_channel.restype = uint64_t\n'
+        'av_channel_layout_extract_channel.argtypes = [uint64_t, c_int]'
+        ),
+    'av_get_channel_name': (None, (),
+        "av_get_channel_name = _libraries['/usr/lib/libavcodec.so'].av_get_channel_name\n"
+        'av_get_channel_name.restype = STRING\n'
+        'av_get_channel_name.argtypes = [uint64_t]'
+        ),
+    'av_get_channel_description': (None, (),
+        "av_get_channel_description = _libraries['/usr/lib/libavcodec.so'].av_get_channel_description\n"
+        'av_get_channel_description.restype = STRING\n'
+        'av_get_channel_description.argtypes = [uint64_t]'
+        ),
+    'av_get_standard_channel_layout': (None, (),
+        "av_get_standard_channel_layout = _libraries['/usr/lib/libavcodec.so'].av_get_standard_channel_layout\n"
+        'av_get_standard_channel_layout.restype = c_int\n'
+        'av_get_standard_channel_layout.argtypes = [c_uint, POINTER(uint64_t), POINTER(STRING)]'
+        ),
+    'av_reverse': (None, (),
+        "av_reverse = (uint8_t * 256).in_dll(_libraries['/usr/lib/libavcodec.so'], 'av_reverse')"
+        ),
+    'av_log2': (None, (),
+        "av_log2 = _libraries['/usr/lib/libavcodec.so'].av_log2\n"
+        'av_log2.restype = c_int\n'
+        'av_log2.argtypes = [c_uint]'
+        ),
+    'av_log2_16bit': (None, (),
+        "av_log2_16bit = _libraries['/usr/lib/libavcodec.so'].av_log2_16bit\n"
+        'av_log2_16bit.restype = c_int\n'
+        'av_log2_16bit.argtypes = [c_uint]'
+        ),
+    'av_get_cpu_flags': (None, (),
+        "av_get_cpu_flags = _libraries['/usr/lib/libavcodec.so'].av_get_cpu_flags\n"
+        'av_get_cpu_flags.restype = c_int\n'
+        'av_get_cpu_flags.argtypes = []'
+        ),
+    'av_force_cpu_flags': (None, (),
+        "av_force_cpu_flags = _libraries['/usr/lib/libavcodec.so'].av_force_cpu_flags\n"
+        'av_force_cpu_flags.restype = None\n'
+        'av_force_cpu_flags.argtypes = [c_int]'
+        ),
+    'av_set_cpu_flags_mask': (None, (),
+        "av_set_cpu_flags_mask = _libraries['/usr/lib/libavcodec.so'].av_set_cpu_flags_mask\n"
+        'av_set_cpu_flags_mask.restype = None\n'
+        'av_set_cpu_flags_mask.argtypes = [c_int]'
+        ),
+    'av_parse_cpu_flags': (None, (),
+        "av_parse_cpu_flags = _libraries['/usr/lib/libavcodec.so'].av_parse_cpu_flags\n"
+        'av_parse_cpu_flags.restype = c_int\n'
+        'av_parse_cpu_flags.argtypes = [STRING]'
+        ),
+    'av_parse_cpu_caps': (None, (),
+        "av_parse_cpu_caps = _libraries['/usr/lib/libavcodec.so'].av_parse_cpu_caps\n"
+        'av_parse_cpu_caps.restype = c_int\n'
+        'av_parse_cpu_caps.argtypes = [POINTER(c_uint), STRING]'
+        ),
+    'av_cpu_count': (None, (),
+        "av_cpu_count = _libraries['/usr/lib/libavcodec.so'].av_cpu_count\n"
+        'av_cpu_count.restype = c_int\n'
+        'av_cpu_count.argtypes = []'
+        ),
+    'ff_get_cpu_flags_x86': (None, (),
+        "ff_get_cpu_flags_x86 = _libraries['/usr/lib/libavcodec.so'].ff_get_cpu_flags_x86\n"
+        'ff_get_cpu_flags_x86.restype = c_int\n'
+        'ff_get_cpu_flags_x86.argtypes = []'
+        ),
+    'AVDictionaryEntry': ('Structure', (),
+        'AVDictionaryEntry._fields_ = [\n'
+        "    ('key', STRING),\n"
+        "    ('value', STRING),\n"
+        ']'
+        ),
+    'av_dict_get': (None, ('AVDictionary', 'AVDictionaryEntry'),
+        "av_dict_get = _libraries['/usr/lib/libavcodec.so'].av_dict_get\n"
+        'av_dict_get.restype = POINTER(AVDictionaryEntry)\n'
+        'av_dict_get.argtypes = [POINTER(AVDictionary), STRING, POINTER(AVDictionaryEntry), c_int]'
+        ),
+    'av_dict_count': (None, ('AVDictionary',),
+        "av_dict_count = _libraries['/usr/lib/libavcodec.so'].av_dict_count\n"
+        'av_dict_count.restype = c_int\n'
+        'av_dict_count.argtypes = [POINTER(AVDictionary)]'
+        ),
+    'av_dict_set': (None, ('AVDictionary',),
+        "av_dict_set = _libraries['/usr/lib/libavcodec.so'].av_dict_set\n"
+        'av_dict_set.restype = c_int\n'
+        'av_dict_set.argtypes = [POINTER(POINTER(AVDictionary)), STRING, STRING, c_int]'
+        ),
+    'av_dict_parse_string': (None, ('AVDictionary',),
+        "av_dict_parse_string = _libraries['/usr/lib/libavcodec.so'].av_dict_parse_string\n"
+        'av_dict_parse_string.restype = c_int\n'
+        'av_dict_parse_string.argtypes = [POINTER(POINTER(AVDictionary)), STRING, STRING, STRING, c_int]'
+        ),
+    'av_dict_copy': (None, ('AVDictionary',),
+        "av_dict_copy = _libraries['/usr/lib/libavcodec.so'].av_dict_copy\n"
+        'av_dict_copy.restype = None\n'
+        'av_dict_copy.argtypes = [POINTER(POINTER(AVDictionary)), POINTER(AVDictionary), c_int]'
+        ),
+    'av_dict_free': (None, ('AVDictionary',),
+        "av_dict_free = _libraries['/usr/lib/libavcodec.so'].av_dict_free\n"
+        'av_dict_free.restype = None\n'
+        'av_dict_free.argtypes = [POINTER(POINTER(AVDictionary))]'
+        ),
+    'av_strerror': (None, (),
+        "av_strerror = _libraries['/usr/lib/libavcodec.so'].av_strerror\n"
+        'av_strerror.restype = c_int\n'
+        'av_strerror.argtypes = [c_int, STRING, size_t]'
+        ),
+    'AVFrameSideData': ('Structure', ('AVDictionary',),
+        'AVFrameSideData._fields_ = [\n'
+        "    ('type', AVFrameSideDataType),\n"
+        "    ('data', POINTER(uint8_t)),\n"
+        "    ('size', c_int),\n"
+        "    ('metadata', POINTER(AVDictionary)),\n"
+        ']'
+        ),
+    'av_frame_get_best_effort_timestamp': (None, ('AVFrame',),
+        "av_frame_get_best_effort_timestamp = _libraries['/usr/lib/libavcodec.so'].av_frame_get_best_effort_timestamp\n"
+        'av_frame_get_best_effort_timestamp.restype = int64_t\n'
+        'av_frame_get_best_effort_timestamp.argtypes = [POINTER(AVFrame)]'
+        ),
+    'av_frame_set_best_effort_timestamp': (None, ('AVFrame',),
+        "av_frame_set_best_effort_timestamp = _libraries['/usr/lib/libavcodec.so'].av_frame_set_best_effort_timestamp\n"
+        'av_frame_set_best_effort_timestamp.restype = None\n'
+        'av_frame_set_best_effort_timestamp.argtypes = [POINTER(AVFrame), int64_t]'
+        ),
+    'av_frame_get_pkt_duration': (None, ('AVFrame',),
+        "av_frame_get_pkt_duration = _libraries['/usr/lib/libavcodec.so'].av_frame_get_pkt_duration\n"
+        'av_frame_get_pkt_duration.restype = int64_t\n'
+        'av_frame_get_pkt_duration.argtypes = [POINTER(AVFrame)]'
+        ),
+    'av_frame_set_pkt_duration': (None, ('AVFrame',),
+        "av_frame_set_pkt_duration = _libraries['/usr/lib/libavcodec.so'].av_frame_set_pkt_duration\n"
+        'av_frame_set_pkt_duration.restype = None\n'
+        'av_frame_set_pkt_duration.argtypes = [POINTER(AVFrame), int64_t]'
+        ),
+    'av_frame_get_pkt_pos': (None, ('AVFrame',),
+        "av_frame_get_pkt_pos = _libraries['/usr/lib/libavcodec.so'].av_frame_get_pkt_pos\n"
+        'av_frame_get_pkt_pos.restype = int64_t\n'
+        'av_frame_get_pkt_pos.argtypes = [POINTER(AVFrame)]'
+        ),
+    'av_frame_set_pkt_pos': (None, ('AVFrame',),
+        "av_frame_set_pkt_pos = _libraries['/usr/lib/libavcodec.so'].av_frame_set_pkt_pos\n"
+        'av_frame_set_pkt_pos.restype = None\n'
+        'av_frame_set_pkt_pos.argtypes = [POINTER(AVFrame), int64_t]'
+        ),
+    'av_frame_get_channel_layout': (None, ('AVFrame',),
+        "av_frame_get_channel_layout = _libraries['/usr/lib/libavcodec.so'].av_frame_get_channel_layout\n"
+        'av_frame_get_channel_layout.restype = int64_t\n'
+        'av_frame_get_channel_layout.argtypes = [POINTER(AVFrame)]'
+        ),
+    'av_frame_set_channel_layout': (None, ('AVFrame',),
+        "av_frame_set_channel_layout = _libraries['/usr/lib/libavcodec.so'].av_frame_set_channel_layout\n"
+        'av_frame_set_channel_layout.restype = None\n'
+        'av_frame_set_channel_layout.argtypes = [POINTER(AVFrame), int64_t]'
+        ),
+    'av_frame_get_channels': (None, ('AVFrame',),
+        "av_frame_get_channels = _libraries['/usr/lib/libavcodec.so'].av_frame_get_channels\n"
+        'av_frame_get_channels.restype = c_int\n'
+        'av_frame_get_channels.argtypes = [POINTER(AVFrame)]'
+        ),
+    'av_frame_set_channels': (None, ('AVFrame',),
+        "av_frame_set_channels = _libraries['/usr/lib/libavcodec.so'].av_frame_set_channels\n"
+        'av_frame_set_channels.restype = None\n'
+        'av_frame_set_channels.argtypes = [POINTER(AVFrame), c_int]'
+        ),
+    'av_frame_get_sample_rate': (None, ('AVFrame',),
+        "av_frame_get_sample_rate = _libraries['/usr/lib/libavcodec.so'].av_frame_get_sample_rate\n"
+        'av_frame_get_sample_rate.restype = c_int\n'
+        'av_frame_get_sample_rate.argtypes = [POINTER(AVFrame)]'
+        ),
+    'av_frame_set_sample_rate': (None, ('AVFrame',),
+        "av_frame_set_sample_rate = _libraries['/usr/lib/libavcodec.so'].av_frame_set_sample_rate\n"
+        'av_frame_set_sample_rate.restype = None\n'
+        'av_frame_set_sample_rate.argtypes = [POINTER(AVFrame), c_int]'
+        ),
+    'av_frame_get_metadata': (None, ('AVDictionary', 'AVFrame'),
+        "av_frame_get_metadata = _libraries['/usr/lib/libavcodec.so'].av_frame_get_metadata\n"
+        'av_frame_get_metadata.restype = POINTER(AVDictionary)\n'
+        'av_frame_get_metadata.argtypes = [POINTER(AVFrame)]'
+        ),
+    'av_frame_set_metadata': (None, ('AVDictionary', 'AVFrame'),
+        "av_frame_set_metadata = _libraries['/usr/lib/libavcodec.so'].av_frame_set_metadata\n"
+        'av_frame_set_metadata.restype = None\n'
+        'av_frame_set_metadata.argtypes = [POINTER(AVFrame), POINTER(AVDictionary)]'
+        ),
+    'av_frame_get_decode_error_flags': (None, ('AVFrame',),
+        "av_frame_get_decode_error_flags = _libraries['/usr/lib/libavcodec.so'].av_frame_get_decode_error_flags\n"
+        'av_frame_get_decode_error_flags.restype = c_int\n'
+        'av_frame_get_decode_error_flags.argtypes = [POINTER(AVFrame)]'
+        ),
+    'av_frame_set_decode_error_flags': (None, ('AVFrame',),
+        "av_frame_set_decode_error_flags = _libraries['/usr/lib/libavcodec.so'].av_frame_set_decode_error_flags\n"
+        'av_frame_set_decode_error_flags.restype = None\n'
+        'av_frame_set_decode_error_flags.argtypes = [POINTER(AVFrame), c_int]'
+        ),
+    'av_frame_get_pkt_size': (None, ('AVFrame',),
+        "av_frame_get_pkt_size = _libraries['/usr/lib/libavcodec.so'].av_frame_get_pkt_size\n"
+        'av_frame_get_pkt_size.restype = c_int\n'
+        'av_frame_get_pkt_size.argtypes = [POINTER(AVFrame)]'
+        ),
+    'av_frame_set_pkt_size': (None, ('AVFrame',),
+        "av_frame_set_pkt_size = _libraries['/usr/lib/libavcodec.so'].av_frame_set_pkt_size\n"
+        'av_frame_set_pkt_size.restype = None\n'
+        'av_frame_set_pkt_size.argtypes = [POINTER(AVFrame), c_int]'
+        ),
+    'avpriv_frame_get_metadatap': (None, ('AVDictionary', 'AVFrame'),
+        "avpriv_frame_get_metadatap = _libraries['/usr/lib/libavcodec.so'].avpriv_frame_get_metadatap\n"
+        'avpriv_frame_get_metadatap.restype = POINTER(POINTER(AVDictionary))\n'
+        'avpriv_frame_get_metadatap.argtypes = [POINTER(AVFrame)]'
+        ),
+    'av_frame_get_qp_table': (None, ('AVFrame',),
+        "av_frame_get_qp_table = _libraries['/usr/lib/libavcodec.so'].av_frame_get_qp_table\n"
+        'av_frame_get_qp_table.restype = POINTER(int8_t)\n'
+        'av_frame_get_qp_table.argtypes = [POINTER(AVFrame), POINTER(c_int), POINTER(c_int)]'
+        ),
+    'av_frame_set_qp_table': (None, ('AVBufferRef', 'AVFrame'),
+        "av_frame_set_qp_table = _libraries['/usr/lib/libavcodec.so'].av_frame_set_qp_table\n"
+        'av_frame_set_qp_table.restype = c_int\n'
+        'av_frame_set_qp_table.argtypes = [POINTER(AVFrame), POINTER(AVBufferRef), c_int, c_int]'
+        ),
+    'av_frame_alloc': (None, ('AVFrame',),
+        "av_frame_alloc = _libraries['/usr/lib/libavcodec.so'].av_frame_alloc\n"
+        'av_frame_alloc.restype = POINTER(AVFrame)\n'
+        'av_frame_alloc.argtypes = []'
+        ),
+    'av_frame_free': (None, ('AVFrame',),
+        "av_frame_free = _libraries['/usr/lib/libavcodec.so'].av_frame_free\n"
+        'av_frame_free.restype = None\n'
+        'av_frame_free.argtypes = [POINTER(POINTER(AVFrame))]'
+        ),
+    'av_frame_ref': (None, ('AVFrame',),
+        "av_frame_ref = _libraries['/usr/lib/libavcodec.so'].av_frame_ref\n"
+        'av_frame_ref.restype = c_int\n'
+        'av_frame_ref.argtypes = [POINTER(AVFrame), POINTER(AVFrame)]'
+        ),
+    'av_frame_clone': (None, ('AVFrame',),
+        "av_frame_clone = _libraries['/usr/lib/libavcodec.so'].av_frame_clone\n"
+        'av_frame_clone.restype = POINTER(AVFrame)\n'
+        'av_frame_clone.argtypes = [POINTER(AVFrame)]'
+        ),
+    'av_frame_unref': (None, ('AVFrame',),
+        "av_frame_unref = _libraries['/usr/lib/libavcodec.so'].av_frame_unref\n"
+        'av_frame_unref.restype = None\n'
+        'av_frame_unref.argtypes = [POINTER(AVFrame)]'
+        ),
+    'av_frame_move_ref': (None, ('AVFrame',),
+        "av_frame_move_ref = _libraries['/usr/lib/libavcodec.so'].av_frame_move_ref\n"
+        'av_frame_move_ref.restype = None\n'
+        'av_frame_move_ref.argtypes = [POINTER(AVFrame), POINTER(AVFrame)]'
+        ),
+    'av_frame_get_buffer': (None, ('AVFrame',),
+        "av_frame_get_buffer = _libraries['/usr/lib/libavcodec.so'].av_frame_get_buffer\n"
+        'av_frame_get_buffer.restype = c_int\n'
+        'av_frame_get_buffer.argtypes = [POINTER(AVFrame), c_int]'
+        ),
+    'av_frame_is_writable': (None, ('AVFrame',),
+        "av_frame_is_writable = _libraries['/usr/lib/libavcodec.so'].av_frame_is_writable\n"
+        'av_frame_is_writable.restype = c_int\n'
+        'av_frame_is_writable.argtypes = [POINTER(AVFrame)]'
+        ),
+    'av_frame_make_writable': (None, ('AVFrame',),
+        "av_frame_make_writable = _libraries['/usr/lib/libavcodec.so'].av_frame_make_writable\n"
+        'av_frame_make_writable.restype = c_int\n'
+        'av_frame_make_writable.argtypes = [POINTER(AVFrame)]'
+        ),
+    'av_frame_copy_props': (None, ('AVFrame',),
+        "av_frame_copy_props = _libraries['/usr/lib/libavcodec.so'].av_frame_copy_props\n"
+        'av_frame_copy_props.restype = c_int\n'
+        'av_frame_copy_props.argtypes = [POINTER(AVFrame), POINTER(AVFrame)]'
+        ),
+    'av_frame_get_plane_buffer': (None, ('AVBufferRef', 'AVFrame'),
+        "av_frame_get_plane_buffer = _libraries['/usr/lib/libavcodec.so'].av_frame_get_plane_buffer\n"
+        'av_frame_get_plane_buffer.restype = POINTER(AVBufferRef)\n'
+        'av_frame_get_plane_buffer.argtypes = [POINTER(AVFrame), c_int]'
+        ),
+    'av_frame_new_side_data': (None, ('AVFrame', 'AVFrameSideData'),
+        "av_frame_new_side_data = _libraries['/usr/lib/libavcodec.so'].av_frame_new_side_data\n"
+        'av_frame_new_side_data.restype = POINTER(AVFrameSideData)\n'
+        'av_frame_new_side_data.argtypes = [POINTER(AVFrame), AVFrameSideDataType, c_int]'
+        ),
+    'av_frame_get_side_data': (None, ('AVFrame', 'AVFrameSideData'),
+        "av_frame_get_side_data = _libraries['/usr/lib/libavcodec.so'].av_frame_get_side_data\n"
+        'av_frame_get_side_data.restype = POINTER(AVFrameSideData)\n'
+        'av_frame_get_side_data.argtypes = [POINTER(AVFrame), AVFrameSideDataType]'
+        ),
+    'av_intfloat32': ('Union', (),
+        'av_intfloat32._fields_ = [\n'
+        "    ('i', uint32_t),\n"
+        "    ('f', c_float),\n"
+        ']'
+        ),
+    'av_intfloat64': ('Union', (),
+        'av_intfloat64._fields_ = [\n'
+        "    ('i', uint64_t),\n"
+        "    ('f', c_double),\n"
+        ']'
+        ),
+    'AVExtFloat': ('Structure', (),
+        'AVExtFloat._fields_ = [\n'
+        "    ('exponent', uint8_t * 2),\n"
+        "    ('mantissa', uint8_t * 8),\n"
+        ']'
+        ),
+    'av_int2dbl': (None, (),
+        "av_int2dbl = _libraries['/usr/lib/libavcodec.so'].av_int2dbl\n"
+        'av_int2dbl.restype = c_double\n'
+        'av_int2dbl.argtypes = [int64_t]'
+        ),
+    'av_int2flt': (None, (),
+        "av_int2flt = _libraries['/usr/lib/libavcodec.so'].av_int2flt\n"
+        'av_int2flt.restype = c_float\n'
+        'av_int2flt.argtypes = [int32_t]'
+        ),
+    'av_ext2dbl': (None, ('AVExtFloat',),
+        "av_ext2dbl = _libraries['/usr/lib/libavcodec.so'].av_ext2dbl\n"
+        'av_ext2dbl.restype = c_double\n'
+        'av_ext2dbl.argtypes = [AVExtFloat]'
+        ),
+    'av_dbl2int': (None, (),
+        "av_dbl2int = _libraries['/usr/lib/libavcodec.so'].av_dbl2int\n"
+        'av_dbl2int.restype = int64_t\n'
+        'av_dbl2int.argtypes = [c_double]'
+        ),
+    'av_flt2int': (None, (),
+        "av_flt2int = _libraries['/usr/lib/libavcodec.so'].av_flt2int\n"
+        'av_flt2int.restype = int32_t\n'
+        'av_flt2int.argtypes = [c_float]'
+        ),
+    'av_dbl2ext': (None, ('AVExtFloat',),
+        "av_dbl2ext = _libraries['/usr/lib/libavcodec.so'].av_dbl2ext\n"
+        'av_dbl2ext.restype = AVExtFloat\n'
+        'av_dbl2ext.argtypes = [c_double]'
+        ),
+    'AVOption': ('Structure', ('N8AVOption4DOT_32E',),
+        'AVOption._fields_ = [\n'
+        "    ('name', STRING),\n"
+        "    ('help', STRING),\n"
+        "    ('offset', c_int),\n"
+        "    ('type', AVOptionType),\n"
+        "    ('default_val', N8AVOption4DOT_32E),\n"
+        "    ('min', c_double),\n"
+        "    ('max', c_double),\n"
+        "    ('flags', c_int),\n"
+        "    ('unit', STRING),\n"
+        ']'
+        ),
+    'N8AVOption4DOT_32E': ('Union', ('AVRational',),
+        'N8AVOption4DOT_32E._fields_ = [\n'
+        "    ('i64', int64_t),\n"
+        "    ('dbl', c_double),\n"
+        "    ('str', STRING),\n"
+        "    ('q', AVRational),\n"
+        ']'
+        ),
+    'AVOptionRanges': ('Structure', ('AVOptionRange',),
+        'AVOptionRanges._fields_ = [\n'
+        "    ('range', POINTER(POINTER(AVOptionRange))),\n"
+        "    ('nb_ranges', c_int),\n"
+        ']'
+        ),
+    'av_log': (None, (),
+        "av_log = _libraries['/usr/lib/libavcodec.so'].av_log\n"
+        'av_log.restype = None\n'
+        'av_log.argtypes = [c_void_p, c_int, STRING]'
+        ),
+    'av_vlog': (None, ('__va_list_tag',),
+        "av_vlog = _libraries['/usr/lib/libavcodec.so'].av_vlog\n"
+        'av_vlog.restype = None\n'
+        'av_vlog.argtypes = [c_void_p, c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'av_log_get_level': (None, (),
+        "av_log_get_level = _libraries['/usr/lib/libavcodec.so'].av_log_get_level\n"
+        'av_log_get_level.restype = c_int\n'
+        'av_log_get_level.argtypes = []'
+        ),
+    'av_log_set_level': (None, (),
+        "av_log_set_level = _libraries['/usr/lib/libavcodec.so'].av_log_set_level\n"
+        'av_log_set_level.restype = None\n'
+        'av_log_set_level.argtypes = [c_int]'
+        ),
+    'av_log_set_callback': (None, ('__va_list_tag',),
+        "av_log_set_callback = _libraries['/usr/lib/libavcodec.so'].av_log_set_callback\n"
+        'av_log_set_callback.restype = None\n'
+        'av_log_set_callback.argtypes = [CFUNCTYPE(None, c_void_p, c_int, STRING, POINTER(__va_list_tag))]'
+        ),
+    'av_log_default_callback': (None, ('__va_list_tag',),
+        "av_log_default_callback = _libraries['/usr/lib/libavcodec.so'].av_log_default_callback\n"
+        'av_log_default_callback.restype = None\n'
+        'av_log_default_callback.argtypes = [c_void_p, c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'av_default_item_name': (None, (),
+        "av_default_item_name = _libraries['/usr/lib/libavcodec.so'].av_default_item_name\n"
+        'av_default_item_name.restype = STRING\n'
+        'av_default_item_name.argtypes = [c_void_p]'
+        ),
+    'av_default_get_category': (None, (),
+        "av_default_get_category = _libraries['/usr/lib/libavcodec.so'].av_default_get_category\n"
+        'av_default_get_category.restype = AVClassCategory\n'
+        'av_default_get_category.argtypes = [c_void_p]'
+        ),
+    'av_log_format_line': (None, ('__va_list_tag',),
+        "av_log_format_line = _libraries['/usr/lib/libavcodec.so'].av_log_format_line\n"
+        'av_log_format_line.restype = None\n'
+        'av_log_format_line.argtypes = [c_void_p, c_int, STRING, POINTER(__va_list_tag), STRING, c_int, POINTER(c_int)]'
+        ),
+    'av_log_set_flags': (None, (),
+        "av_log_set_flags = _libraries['/usr/lib/libavcodec.so'].av_log_set_flags\n"
+        'av_log_set_flags.restype = None\n'
+        'av_log_set_flags.argtypes = [c_int]'
+        ),
+    'av_gcd': (None, (),
+        "av_gcd = _libraries['/usr/lib/libavcodec.so'].av_gcd\n"
+        'av_gcd.restype = int64_t\n'
+        'av_gcd.argtypes = [int64_t, int64_t]'
+        ),
+    'av_rescale': (None, (),
+        "av_rescale = _libraries['/usr/lib/libavcodec.so'].av_rescale\n"
+        'av_rescale.restype = int64_t\n'
+        'av_rescale.argtypes = [int64_t, int64_t, int64_t]'
+        ),
+    'av_rescale_rnd': (None, (),
+        "av_rescale_rnd = _libraries['/usr/lib/libavcodec.so'].av_rescale_rnd\n"
+        'av_rescale_rnd.restype = int64_t\n'
+        'av_rescale_rnd.argtypes = [int64_t, int64_t, int64_t, AVRounding]'
+        ),
+    'av_rescale_q': (None, ('AVRational',),
+        "av_rescale_q = _libraries['/usr/lib/libavcodec.so'].av_rescale_q\n"
+        'av_rescale_q.restype = int64_t\n'
+        'av_rescale_q.argtypes = [int64_t, AVRational, AVRational]'
+        ),
+    'av_rescale_q_rnd': (None, ('AVRational',),
+        "av_rescale_q_rnd = _libraries['/usr/lib/libavcodec.so'].av_rescale_q_rnd\n"
+        'av_rescale_q_rnd.restype = int64_t\n'
+        'av_rescale_q_rnd.argtypes = [int64_t, AVRational, AVRational, AVRounding]'
+        ),
+    'av_compare_ts': (None, ('AVRational',),
+        "av_compare_ts = _libraries['/usr/lib/libavcodec.so'].av_compare_ts\n"
+        'av_compare_ts.restype = c_int\n'
+        'av_compare_ts.argtypes = [int64_t, AVRational, int64_t, AVRational]'
+        ),
+    'av_compare_mod': (None, (),
+        "av_compare_mod = _libraries['/usr/lib/libavcodec.so'].av_compare_mod\n"
+        'av_compare_mod.restype = int64_t\n'
+        'av_compare_mod.argtypes = [uint64_t, uint64_t, uint64_t]'
+        ),
+    'av_rescale_delta': (None, ('AVRational',),
+        "av_rescale_delta = _libraries['/usr/lib/libavcodec.so'].av_rescale_delta\n"
+        'av_rescale_delta.restype = int64_t\n'
+        'av_rescale_delta.argtypes = [AVRational, int64_t, AVRational, c_int, POINTER(int64_t), AVRational]'
+        ),
+    'av_malloc': (None, (),
+        "av_malloc = _libraries['/usr/lib/libavcodec.so'].av_malloc\n"
+        'av_malloc.restype = c_void_p\n'
+        'av_malloc.argtypes = [size_t]'
+        ),
+    'av_realloc': (None, (),
+        "av_realloc = _libraries['/usr/lib/libavcodec.so'].av_realloc\n"
+        'av_realloc.restype = c_void_p\n'
+        'av_realloc.argtypes = [c_void_p, size_t]'
+        ),
+    'av_realloc_f': (None, (),
+        "av_realloc_f = _libraries['/usr/lib/libavcodec.so'].av_realloc_f\n"
+        'av_realloc_f.restype = c_void_p\n'
+        'av_realloc_f.argtypes = [c_void_p, size_t, size_t]'
+        ),
+    'av_realloc_array': (None, (),
+        "av_realloc_array = _libraries['/usr/lib/libavcodec.so'].av_realloc_array\n"
+        'av_realloc_array.restype = c_void_p\n'
+        'av_realloc_array.argtypes = [c_void_p, size_t, size_t]'
+        ),
+    'av_reallocp_array': (None, (),
+        "av_reallocp_array = _libraries['/usr/lib/libavcodec.so'].av_reallocp_array\n"
+        'av_reallocp_array.restype = c_int\n'
+        'av_reallocp_array.argtypes = [c_void_p, size_t, size_t]'
+        ),
+    'av_free': (None, (),
+        "av_free = _libraries['/usr/lib/libavcodec.so'].av_free\n"
+        'av_free.restype = None\n'
+        'av_free.argtypes = [c_void_p]'
+        ),
+    'av_mallocz': (None, (),
+        "av_mallocz = _libraries['/usr/lib/libavcodec.so'].av_mallocz\n"
+        'av_mallocz.restype = c_void_p\n'
+        'av_mallocz.argtypes = [size_t]'
+        ),
+    'av_calloc': (None, (),
+        "av_calloc = _libraries['/usr/lib/libavcodec.so'].av_calloc\n"
+        'av_calloc.restype = c_void_p\n'
+        'av_calloc.argtypes = [size_t, size_t]'
+        ),
+    'av_strdup': (None, (),
+        "av_strdup = _libraries['/usr/lib/libavcodec.so'].av_strdup\n"
+        'av_strdup.restype = STRING\n'
+        'av_strdup.argtypes = [STRING]'
+        ),
+    'av_memdup': (None, (),
+        "av_memdup = _libraries['/usr/lib/libavcodec.so'].av_memdup\n"
+        'av_memdup.restype = c_void_p\n'
+        'av_memdup.argtypes = [c_void_p, size_t]'
+        ),
+    'av_freep': (None, (),
+        "av_freep = _libraries['/usr/lib/libavcodec.so'].av_freep\n"
+        'av_freep.restype = None\n'
+        'av_freep.argtypes = [c_void_p]'
+        ),
+    'av_dynarray_add': (None, (),
+        "av_dynarray_add = _libraries['/usr/lib/libavcodec.so'].av_dynarray_add\n"
+        'av_dynarray_add.restype = None\n'
+        'av_dynarray_add.argtypes = [c_void_p, POINTER(c_int), c_void_p]'
+        ),
+    'av_dynarray2_add': (None, (),
+        "av_dynarray2_add = _libraries['/usr/lib/libavcodec.so'].av_dynarray2_add\n"
+        'av_dynarray2_add.restype = c_void_p\n'
+        'av_dynarray2_add.argtypes = [POINTER(c_void_p), POINTER(c_int), size_t, POINTER(uint8_t)]'
+        ),
+    'av_max_alloc': (None, (),
+        "av_max_alloc = _libraries['/usr/lib/libavcodec.so'].av_max_alloc\n"
+        'av_max_alloc.restype = None\n'
+        'av_max_alloc.argtypes = [size_t]'
+        ),
+    'av_memcpy_backptr': (None, (),
+        "av_memcpy_backptr = _libraries['/usr/lib/libavcodec.so'].av_memcpy_backptr\n"
+        'av_memcpy_backptr.restype = None\n'
+        'av_memcpy_backptr.argtypes = [POINTER(uint8_t), c_int, c_int]'
+        ),
+    'AVOptionRange': ('Structure', (),
+        'AVOptionRange._fields_ = [\n'
+        "    ('str', STRING),\n"
+        "    ('value_min', c_double),\n"
+        "    ('value_max', c_double),\n"
+        "    ('component_min', c_double),\n"
+        "    ('component_max', c_double),\n"
+        "    ('is_range', c_int),\n"
+        ']'
+        ),
+    'av_find_opt': (None, ('AVOption',),
+        "av_find_opt = _libraries['/usr/lib/libavcodec.so'].av_find_opt\n"
+        'av_find_opt.restype = POINTER(AVOption)\n'
+        'av_find_opt.argtypes = [c_void_p, STRING, STRING, c_int, c_int]'
+        ),
+    'av_set_string3': (None, ('AVOption',),
+        "av_set_string3 = _libraries['/usr/lib/libavcodec.so'].av_set_string3\n"
+        'av_set_string3.restype = c_int\n'
+        'av_set_string3.argtypes = [c_void_p, STRING, STRING, c_int, POINTER(POINTER(AVOption))]'
+        ),
+    'av_set_double': (None, ('AVOption',),
+        "av_set_double = _libraries['/usr/lib/libavcodec.so'].av_set_double\n"
+        'av_set_double.restype = POINTER(AVOption)\n'
+        'av_set_double.argtypes = [c_void_p, STRING, c_double]'
+        ),
+    'av_set_q': (None, ('AVOption', 'AVRational'),
+        "av_set_q = _libraries['/usr/lib/libavcodec.so'].av_set_q\n"
+        'av_set_q.restype = POINTER(AVOption)\n'
+        'av_set_q.argtypes = [c_void_p, STRING, AVRational]'
+        ),
+    'av_set_int': (None, ('AVOption',),
+        "av_set_int = _libraries['/usr/lib/libavcodec.so'].av_set_int\n"
+        'av_set_int.restype = POINTER(AVOption)\n'
+        'av_set_int.argtypes = [c_void_p, STRING, int64_t]'
+        ),
+    'av_get_double': (None, ('AVOption',),
+        "av_get_double = _libraries['/usr/lib/libavcodec.so'].av_get_double\n"
+        'av_get_double.restype = c_double\n'
+        'av_get_double.argtypes = [c_void_p, STRING, POINTER(POINTER(AVOption))]'
+        ),
+    'av_get_q': (None, ('AVOption', 'AVRational'),
+        "av_get_q = _libraries['/usr/lib/libavcodec.so'].av_get_q\n"
+        'av_get_q.restype = AVRational\n'
+        'av_get_q.argtypes = [c_void_p, STRING, POINTER(POINTER(AVOption))]'
+        ),
+    'av_get_int': (None, ('AVOption',),
+        "av_get_int = _libraries['/usr/lib/libavcodec.so'].av_get_int\n"
+        'av_get_int.restype = int64_t\n'
+        'av_get_int.argtypes = [c_void_p, STRING, POINTER(POINTER(AVOption))]'
+        ),
+    'av_get_string': (None, ('AVOption',),
+        "av_get_string = _libraries['/usr/lib/libavcodec.so'].av_get_string\n"
+        'av_get_string.restype = STRING\n'
+        'av_get_string.argtypes = [c_void_p, STRING, POINTER(POINTER(AVOption)), STRING, c_int]'
+        ),
+    'av_next_option': (None, ('AVOption',),
+        "av_next_option = _libraries['/usr/lib/libavcodec.so'].av_next_option\n"
+        'av_next_option.restype = POINTER(AVOption)\n'
+        'av_next_option.argtypes = [c_void_p, POINTER(AVOption)]'
+        ),
+    'av_opt_show2': (None, (),
+        "av_opt_show2 = _libraries['/usr/lib/libavcodec.so'].av_opt_show2\n"
+        'av_opt_show2.restype = c_int\n'
+        'av_opt_show2.argtypes = [c_void_p, c_void_p, c_int, c_int]'
+        ),
+    'av_opt_set_defaults': (None, (),
+        "av_opt_set_defaults = _libraries['/usr/lib/libavcodec.so'].av_opt_set_defaults\n"
+        'av_opt_set_defaults.restype = None\n'
+        'av_opt_set_defaults.argtypes = [c_void_p]'
+        ),
+    'av_opt_set_defaults2': (None, (),
+        "av_opt_set_defaults2 = _libraries['/usr/lib/libavcodec.so'].av_opt_set_defaults2\n"
+        'av_opt_set_defaults2.restype = None\n'
+        'av_opt_set_defaults2.argtypes = [c_void_p, c_int, c_int]'
+        ),
+    'av_set_options_string': (None, (),
+        "av_set_options_string = _libraries['/usr/lib/libavcodec.so'].av_set_options_string\n"
+        'av_set_options_string.restype = c_int\n'
+        'av_set_options_string.argtypes = [c_void_p, STRING, STRING, STRING]'
+        ),
+    'av_opt_set_from_string': (None, (),
+        "av_opt_set_from_string = _libraries['/usr/lib/libavcodec.so'].av_opt_set_from_string\n"
+        'av_opt_set_from_string.restype = c_int\n'
+        'av_opt_set_from_string.argtypes = [c_void_p, STRING, POINTER(STRING), STRING, STRING]'
+        ),
+    'av_opt_free': (None, (),
+        "av_opt_free = _libraries['/usr/lib/libavcodec.so'].av_opt_free\n"
+        'av_opt_free.restype = None\n'
+        'av_opt_free.argtypes = [c_void_p]'
+        ),
+    'av_opt_flag_is_set': (None, (),
+        "av_opt_flag_is_set = _libraries['/usr/lib/libavcodec.so'].av_opt_flag_is_set\n"
+        'av_opt_flag_is_set.restype = c_int\n'
+        'av_opt_flag_is_set.argtypes = [c_void_p, STRING, STRING]'
+        ),
+    'av_opt_set_dict': (None, ('AVDictionary',),
+        "av_opt_set_dict = _libraries['/usr/lib/libavcodec.so'].av_opt_set_dict\n"
+        'av_opt_set_dict.restype = c_int\n'
+        'av_opt_set_dict.argtypes = [c_void_p, POINTER(POINTER(AVDictionary))]'
+        ),
+    'av_opt_get_key_value': (None, (),
+        "av_opt_get_key_value = _libraries['/usr/lib/libavcodec.so'].av_opt_get_key_value\n"
+        'av_opt_get_key_value.restype = c_int\n'
+        'av_opt_get_key_value.argtypes = [POINTER(STRING), STRING, STRING, c_uint, POINTER(STRING), POINTER(STRING)]'
+        ),
+    'av_opt_eval_flags': (None, ('AVOption',),
+        "av_opt_eval_flags = _libraries['/usr/lib/libavcodec.so'].av_opt_eval_flags\n"
+        'av_opt_eval_flags.restype = c_int\n'
+        'av_opt_eval_flags.argtypes = [c_void_p, POINTER(AVOption), STRING, POINTER(c_int)]'
+        ),
+    'av_opt_eval_int': (None, ('AVOption',),
+        "av_opt_eval_int = _libraries['/usr/lib/libavcodec.so'].av_opt_eval_int\n"
+        'av_opt_eval_int.restype = c_int\n'
+        'av_opt_eval_int.argtypes = [c_void_p, POINTER(AVOption), STRING, POINTER(c_int)]'
+        ),
+    'av_opt_eval_int64': (None, ('AVOption',),
+        "av_opt_eval_int64 = _libraries['/usr/lib/libavcodec.so'].av_opt_eval_int64\n"
+        'av_opt_eval_int64.restype = c_int\n'
+        'av_opt_eval_int64.argtypes = [c_void_p, POINTER(AVOption), STRING, POINTER(int64_t)]'
+        ),
+    'av_opt_eval_float': (None, ('AVOption',),
+        "av_opt_eval_float = _libraries['/usr/lib/libavcodec.so'].av_opt_eval_float\n"
+        'av_opt_eval_float.restype = c_int\n'
+        'av_opt_eval_float.argtypes = [c_void_p, POINTER(AVOption), STRING, POINTER(c_float)]'
+        ),
+    'av_opt_eval_double': (None, ('AVOption',),
+        "av_opt_eval_double = _libraries['/usr/lib/libavcodec.so'].av_opt_eval_double\n"
+        'av_opt_eval_double.restype = c_int\n'
+        'av_opt_eval_double.argtypes = [c_void_p, POINTER(AVOption), STRING, POINTER(c_double)]'
+        ),
+    'av_opt_eval_q': (None, ('AVOption', 'AVRational'),
+        "av_opt_eval_q = _libraries['/usr/lib/libavcodec.so'].av_opt_eval_q\n"
+        'av_opt_eval_q.restype = c_int\n'
+        'av_opt_eval_q.argtypes = [c_void_p, POINTER(AVOption), STRING, POINTER(AVRational)]'
+        ),
+    'av_opt_find': (None, ('AVOption',),
+        "av_opt_find = _libraries['/usr/lib/libavcodec.so'].av_opt_find\n"
+        'av_opt_find.restype = POINTER(AVOption)\n'
+        'av_opt_find.argtypes = [c_void_p, STRING, STRING, c_int, c_int]'
+        ),
+    'av_opt_find2': (None, ('AVOption',),
+        "av_opt_find2 = _libraries['/usr/lib/libavcodec.so'].av_opt_find2\n"
+        'av_opt_find2.restype = POINTER(AVOption)\n'
+        'av_opt_find2.argtypes = [c_void_p, STRING, STRING, c_int, c_int, POINTER(c_void_p)]'
+        ),
+    'av_opt_next': (None, ('AVOption',),
+        "av_opt_next = _libraries['/usr/lib/libavcodec.so'].av_opt_next\n"
+        'av_opt_next.restype = POINTER(AVOption)\n'
+        'av_opt_next.argtypes = [c_void_p, POINTER(AVOption)]'
+        ),
+    'av_opt_child_next': (None, (),
+        "av_opt_child_next = _libraries['/usr/lib/libavcodec.so'].av_opt_child_next\n"
+        'av_opt_child_next.restype = c_void_p\n'
+        'av_opt_child_next.argtypes = [c_void_p, c_void_p]'
+        ),
+    'av_opt_child_class_next': (None, ('AVClass',),
+        "av_opt_child_class_next = _libraries['/usr/lib/libavcodec.so'].av_opt_child_class_next\n"
+        'av_opt_child_class_next.restype = POINTER(AVClass)\n'
+        'av_opt_child_class_next.argtypes = [POINTER(AVClass), POINTER(AVClass)]'
+        ),
+    'av_opt_set': (None, (),
+        "av_opt_set = _libraries['/usr/lib/libavcodec.so'].av_opt_set\n"
+        'av_opt_set.restype = c_int\n'
+        'av_opt_set.argtypes = [c_void_p, STRING, STRING, c_int]'
+        ),
+    'av_opt_set_int': (None, (),
+        "av_opt_set_int = _libraries['/usr/lib/libavcodec.so'].av_opt_set_int\n"
+        'av_opt_set_int.restype = c_int\n'
+        'av_opt_set_int.argtypes = [c_void_p, STRING, int64_t, c_int]'
+        ),
+    'av_opt_set_double': (None, (),
+        "av_opt_set_double = _libraries['/usr/lib/libavcodec.so'].av_opt_set_double\n"
+        'av_opt_set_double.restype = c_int\n'
+        'av_opt_set_double.argtypes = [c_void_p, STRING, c_double, c_int]'
+        ),
+    'av_opt_set_q': (None, ('AVRational',),
+        "av_opt_set_q = _libraries['/usr/lib/libavcodec.so'].av_opt_set_q\n"
+        'av_opt_set_q.restype = c_int\n'
+        'av_opt_set_q.argtypes = [c_void_p, STRING, AVRational, c_int]'
+        ),
+    'av_opt_set_bin': (None, (),
+        "av_opt_set_bin = _libraries['/usr/lib/libavcodec.so'].av_opt_set_bin\n"
+        'av_opt_set_bin.restype = c_int\n'
+        'av_opt_set_bin.argtypes = [c_void_p, STRING, POINTER(uint8_t), c_int, c_int]'
+        ),
+    'av_opt_set_image_size': (None, (),
+        "av_opt_set_image_size = _libraries['/usr/lib/libavcodec.so'].av_opt_set_image_size\n"
+        'av_opt_set_image_size.restype = c_int\n'
+        'av_opt_set_image_size.argtypes = [c_void_p, STRING, c_int, c_int, c_int]'
+        ),
+    'av_opt_set_pixel_fmt': (None, (),
+        "av_opt_set_pixel_fmt = _libraries['/usr/lib/libavcodec.so'].av_opt_set_pixel_fmt\n"
+        'av_opt_set_pixel_fmt.restype = c_int\n'
+        'av_opt_set_pixel_fmt.argtypes = [c_void_p, STRING, AVPixelFormat, c_int]'
+        ),
+    'av_opt_set_sample_fmt': (None, (),
+        "av_opt_set_sample_fmt = _libraries['/usr/lib/libavcodec.so'].av_opt_set_sample_fmt\n"
+        'av_opt_set_sample_fmt.restype = c_int\n'
+        'av_opt_set_sample_fmt.argtypes = [c_void_p, STRING, AVSampleFormat, c_int]'
+        ),
+    'av_opt_set_video_rate': (None, ('AVRational',),
+        "av_opt_set_video_rate = _libraries['/usr/lib/libavcodec.so'].av_opt_set_video_rate\n"
+        'av_opt_set_video_rate.restype = c_int\n'
+        'av_opt_set_video_rate.argtypes = [c_void_p, STRING, AVRational, c_int]'
+        ),
+    'av_opt_get': (None, (),
+        "av_opt_get = _libraries['/usr/lib/libavcodec.so'].av_opt_get\n"
+        'av_opt_get.restype = c_int\n'
+        'av_opt_get.argtypes = [c_void_p, STRING, c_int, POINTER(POINTER(uint8_t))]'
+        ),
+    'av_opt_get_int': (None, (),
+        "av_opt_get_int = _libraries['/usr/lib/libavcodec.so'].av_opt_get_int\n"
+        'av_opt_get_int.restype = c_int\n'
+        'av_opt_get_int.argtypes = [c_void_p, STRING, c_int, POINTER(int64_t)]'
+        ),
+    'av_opt_get_double': (None, (),
+        "av_opt_get_double = _libraries['/usr/lib/libavcodec.so'].av_opt_get_double\n"
+        'av_opt_get_double.restype = c_int\n'
+        'av_opt_get_double.argtypes = [c_void_p, STRING, c_int, POINTER(c_double)]'
+        ),
+    'av_opt_get_q': (None, ('AVRational',),
+        "av_opt_get_q = _libraries['/usr/lib/libavcodec.so'].av_opt_get_q\n"
+        'av_opt_get_q.restype = c_int\n'
+        'av_opt_get_q.argtypes = [c_void_p, STRING, c_int, POINTER(AVRational)]'
+        ),
+    'av_opt_get_image_size': (None, (),
+        "av_opt_get_image_size = _libraries['/usr/lib/libavcodec.so'].av_opt_get_image_size\n"
+        'av_opt_get_image_size.restype = c_int\n'
+        'av_opt_get_image_size.argtypes = [c_void_p, STRING, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'av_opt_get_pixel_fmt': (None, (),
+        "av_opt_get_pixel_fmt = _libraries['/usr/lib/libavcodec.so'].av_opt_get_pixel_fmt\n"
+        'av_opt_get_pixel_fmt.restype = c_int\n'
+        'av_opt_get_pixel_fmt.argtypes = [c_void_p, STRING, c_int, POINTER(AVPixelFormat)]'
+        ),
+    'av_opt_get_sample_fmt': (None, (),
+        "av_opt_get_sample_fmt = _libraries['/usr/lib/libavcodec.so'].av_opt_get_sample_fmt\n"
+        'av_opt_get_sample_fmt.restype = c_int\n'
+        'av_opt_get_sample_fmt.argtypes = [c_void_p, STRING, c_int, POINTER(AVSampleFormat)]'
+        ),
+    'av_opt_get_video_rate': (None, ('AVRational',),
+        "av_opt_get_video_rate = _libraries['/usr/lib/libavcodec.so'].av_opt_get_video_rate\n"
+        'av_opt_get_video_rate.restype = c_int\n'
+        'av_opt_get_video_rate.argtypes = [c_void_p, STRING, c_int, POINTER(AVRational)]'
+        ),
+    'av_opt_ptr': (None, ('AVClass',),
+        "av_opt_ptr = _libraries['/usr/lib/libavcodec.so'].av_opt_ptr\n"
+        'av_opt_ptr.restype = c_void_p\n'
+        'av_opt_ptr.argtypes = [POINTER(AVClass), c_void_p, STRING]'
+        ),
+    'av_opt_freep_ranges': (None, ('AVOptionRanges',),
+        "av_opt_freep_ranges = _libraries['/usr/lib/libavcodec.so'].av_opt_freep_ranges\n"
+        'av_opt_freep_ranges.restype = None\n'
+        'av_opt_freep_ranges.argtypes = [POINTER(POINTER(AVOptionRanges))]'
+        ),
+    'av_opt_query_ranges': (None, ('AVOptionRanges',),
+        "av_opt_query_ranges = _libraries['/usr/lib/libavcodec.so'].av_opt_query_ranges\n"
+        'av_opt_query_ranges.restype = c_int\n'
+        'av_opt_query_ranges.argtypes = [POINTER(POINTER(AVOptionRanges)), c_void_p, STRING, c_int]'
+        ),
+    'av_opt_query_ranges_default': (None, ('AVOptionRanges',),
+        "av_opt_query_ranges_default = _libraries['/usr/lib/libavcodec.so'].av_opt_query_ranges_default\n"
+        'av_opt_query_ranges_default.restype = c_int\n'
+        'av_opt_query_ranges_default.argtypes = [POINTER(POINTER(AVOptionRanges)), c_void_p, STRING, c_int]'
+        ),
+    'av_reduce': (None, (),
+        "av_reduce = _libraries['/usr/lib/libavcodec.so'].av_reduce\n"
+        'av_reduce.restype = c_int\n'
+        'av_reduce.argtypes = [POINTER(c_int), POINTER(c_int), int64_t, int64_t, int64_t]'
+        ),
+    'av_mul_q': (None, ('AVRational',),
+        "av_mul_q = _libraries['/usr/lib/libavcodec.so'].av_mul_q\n"
+        'av_mul_q.restype = AVRational\n'
+        'av_mul_q.argtypes = [AVRational, AVRational]'
+        ),
+    'av_div_q': (None, ('AVRational',),
+        "av_div_q = _libraries['/usr/lib/libavcodec.so'].av_div_q\n"
+        'av_div_q.restype = AVRational\n'
+        'av_div_q.argtypes = [AVRational, AVRational]'
+        ),
+    'av_add_q': (None, ('AVRational',),
+        "av_add_q = _libraries['/usr/lib/libavcodec.so'].av_add_q\n"
+        'av_add_q.restype = AVRational\n'
+        'av_add_q.argtypes = [AVRational, AVRational]'
+        ),
+    'av_sub_q': (None, ('AVRational',),
+        "av_sub_q = _libraries['/usr/lib/libavcodec.so'].av_sub_q\n"
+        'av_sub_q.restype = AVRational\n'
+        'av_sub_q.argtypes = [AVRational, AVRational]'
+        ),
+    'av_d2q': (None, ('AVRational',),
+        "av_d2q = _libraries['/usr/lib/libavcodec.so'].av_d2q\n"
+        'av_d2q.restype = AVRational\n'
+        'av_d2q.argtypes = [c_double, c_int]'
+        ),
+    'av_nearer_q': (None, ('AVRational',),
+        "av_nearer_q = _libraries['/usr/lib/libavcodec.so'].av_nearer_q\n"
+        'av_nearer_q.restype = c_int\n'
+        'av_nearer_q.argtypes = [AVRational, AVRational, AVRational]'
+        ),
+    'av_find_nearest_q_idx': (None, ('AVRational',),
+        "av_find_nearest_q_idx = _libraries['/usr/lib/libavcodec.so'].av_find_nearest_q_idx\n"
+        'av_find_nearest_q_idx.restype = c_int\n'
+        'av_find_nearest_q_idx.argtypes = [AVRational, POINTER(AVRational)]'
+        ),
+    'av_get_sample_fmt_name': (None, (),
+        "av_get_sample_fmt_name = _libraries['/usr/lib/libavcodec.so'].av_get_sample_fmt_name\n"
+        'av_get_sample_fmt_name.restype = STRING\n'
+        'av_get_sample_fmt_name.argtypes = [AVSampleFormat]'
+        ),
+    'av_get_sample_fmt': (None, (),
+        "av_get_sample_fmt = _libraries['/usr/lib/libavcodec.so'].av_get_sample_fmt\n"
+        'av_get_sample_fmt.restype = AVSampleFormat\n'
+        'av_get_sample_fmt.argtypes = [STRING]'
+        ),
+    'av_get_alt_sample_fmt': (None, (),
+        "av_get_alt_sample_fmt = _libraries['/usr/lib/libavcodec.so'].av_get_alt_sample_fmt\n"
+        'av_get_alt_sample_fmt.restype = AVSampleFormat\n'
+        'av_get_alt_sample_fmt.argtypes = [AVSampleFormat, c_int]'
+        ),
+    'av_get_packed_sample_fmt': (None, (),
+        "av_get_packed_sample_fmt = _libraries['/usr/lib/libavcodec.so'].av_get_packed_sample_fmt\n"
+        'av_get_packed_sample_fmt.restype = AVSampleFormat\n'
+        'av_get_packed_sample_fmt.argtypes = [AVSampleFormat]'
+        ),
+    'av_get_planar_sample_fmt': (None, (),
+        "av_get_planar_sample_fmt = _libraries['/usr/lib/libavcodec.so'].av_get_planar_sample_fmt\n"
+        'av_get_planar_sample_fmt.restype = AVSampleFormat\n'
+        'av_get_planar_sample_fmt.argtypes = [AVSampleFormat]'
+        ),
+    'av_get_sample_fmt_string': (None, (),
+        "av_get_sample_fmt_string = _libraries['/usr/lib/libavcodec.so'].av_get_sample_fmt_string\n"
+        'av_get_sample_fmt_string.restype = STRING\n'
+        'av_get_sample_fmt_string.argtypes = [STRING, c_int, AVSampleFormat]'
+        ),
+    'av_get_bits_per_sample_fmt': (None, (),
+        "av_get_bits_per_sample_fmt = _libraries['/usr/lib/libavcodec.so'].av_get_bits_per_sample_fmt\n"
+        'av_get_bits_per_sample_fmt.restype = c_int\n'
+        'av_get_bits_per_sample_fmt.argtypes = [AVSampleFormat]'
+        ),
+    'av_get_bytes_per_sample': (None, (),
+        "av_get_bytes_per_sample = _libraries['/usr/lib/libavcodec.so'].av_get_bytes_per_sample\n"
+        'av_get_bytes_per_sample.restype = c_int\n'
+        'av_get_bytes_per_sample.argtypes = [AVSampleFormat]'
+        ),
+    'av_sample_fmt_is_planar': (None, (),
+        "av_sample_fmt_is_planar = _libraries['/usr/lib/libavcodec.so'].av_sample_fmt_is_planar\n"
+        'av_sample_fmt_is_planar.restype = c_int\n'
+        'av_sample_fmt_is_planar.argtypes = [AVSampleFormat]'
+        ),
+    'av_samples_get_buffer_size': (None, (),
+        "av_samples_get_buffer_size = _libraries['/usr/lib/libavcodec.so'].av_samples_get_buffer_size\n"
+        'av_samples_get_buffer_size.restype = c_int\n'
+        'av_samples_get_buffer_size.argtypes = [POINTER(c_int), c_int, c_int, AVSampleFormat, c_int]'
+        ),
+    'av_samples_fill_arrays': (None, (),
+        "av_samples_fill_arrays = _libraries['/usr/lib/libavcodec.so'].av_samples_fill_arrays\n"
+        'av_samples_fill_arrays.restype = c_int\n'
+        'av_samples_fill_arrays.argtypes = [POINTER(POINTER(uint8_t)), POINTER(c_int), POINTER(uint8_t), c_int, c_int, AVSampleFormat, c_int]'
+        ),
+    'av_samples_alloc': (None, (),
+        "av_samples_alloc = _libraries['/usr/lib/libavcodec.so'].av_samples_alloc\n"
+        'av_samples_alloc.restype = c_int\n'
+        'av_samples_alloc.argtypes = [POINTER(POINTER(uint8_t)), POINTER(c_int), c_int, c_int, AVSampleFormat, c_int]'
+        ),
+    'av_samples_alloc_array_and_samples': (None, (),
+        "av_samples_alloc_array_and_samples = _libraries['/usr/lib/libavcodec.so'].av_samples_alloc_array_and_samples\n"
+        'av_samples_alloc_array_and_samples.restype = c_int\n'
+        'av_samples_alloc_array_and_samples.argtypes = [POINTER(POINTER(POINTER(uint8_t))), POINTER(c_int), c_int, c_int, AVSampleFormat, c_int]'
+        ),
+    'av_samples_copy': (None, (),
+        "av_samples_copy = _libraries['/usr/lib/libavcodec.so'].av_samples_copy\n"
+        'av_samples_copy.restype = c_int\n'
+        'av_samples_copy.argtypes = [POINTER(POINTER(uint8_t)), POINTER(POINTER(uint8_t)), c_int, c_int, c_int, c_int, AVSampleFormat]'
+        ),
+    'av_samples_set_silence': (None, (),
+        "av_samples_set_silence = _libraries['/usr/lib/libavcodec.so'].av_samples_set_silence\n"
+        'av_samples_set_silence.restype = c_int\n'
+        'av_samples_set_silence.argtypes = [POINTER(POINTER(uint8_t)), c_int, c_int, c_int, AVSampleFormat]'
+        ),
+    'av_gettime': (None, (),
+        "av_gettime = _libraries['/usr/lib/libavcodec.so'].av_gettime\n"
+        'av_gettime.restype = int64_t\n'
+        'av_gettime.argtypes = []'
+        ),
+    'av_usleep': (None, (),
+        "av_usleep = _libraries['/usr/lib/libavcodec.so'].av_usleep\n"
+        'av_usleep.restype = c_int\n'
+        'av_usleep.argtypes = [c_uint]'
+        ),
+    '_IO_jump_t': ('Structure', (),
+        '_IO_jump_t._fields_ = [\n'
+        ']'
+        ),
+    '_IO_marker': ('Structure', ('_IO_FILE',),
+        '_IO_marker._fields_ = [\n'
+        "    ('_next', POINTER(_IO_marker)),\n"
+        "    ('_sbuf', POINTER(_IO_FILE)),\n"
+        "    ('_pos', c_int),\n"
+        ']'
+        ),
+    '_IO_FILE_plus': ('Structure', (),
+        '_IO_FILE_plus._fields_ = [\n'
+        ']'
+        ),
+    '_IO_2_1_stdin_': (None, ('_IO_FILE_plus',),
+        "_IO_2_1_stdin_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libavcodec.so'], '_IO_2_1_stdin_')"
+        ),
+    '_IO_2_1_stdout_': (None, ('_IO_FILE_plus',),
+        "_IO_2_1_stdout_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libavcodec.so'], '_IO_2_1_stdout_')"
+        ),
+    '_IO_2_1_stderr_': (None, ('_IO_FILE_plus',),
+        "_IO_2_1_stderr_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libavcodec.so'], '_IO_2_1_stderr_')"
+        ),
+    '_IO_cookie_io_functions_t': ('Structure', (),
+        '_IO_cookie_io_functions_t._fields_ = [\n'
+        "    ('read', POINTER(__io_read_fn)),\n"
+        "    ('write', POINTER(__io_write_fn)),\n"
+        "    ('seek', POINTER(__io_seek_fn)),\n"
+        "    ('close', POINTER(__io_close_fn)),\n"
+        ']'
+        ),
+    'cookie_io_functions_t': (None, ('_IO_cookie_io_functions_t',),
+        'cookie_io_functions_t = _IO_cookie_io_functions_t'
+        ),
+    '_IO_cookie_file': ('Structure', (),
+        '_IO_cookie_file._fields_ = [\n'
+        ']'
+        ),
+    '__underflow': (None, ('_IO_FILE',),
+        "__underflow = _libraries['/usr/lib/libavcodec.so'].__underflow\n"
+        '__underflow.restype = c_int\n'
+        '__underflow.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '__uflow': (None, ('_IO_FILE',),
+        "__uflow = _libraries['/usr/lib/libavcodec.so'].__uflow\n"
+        '__uflow.restype = c_int\n'
+        '__uflow.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '__overflow': (None, ('_IO_FILE',),
+        "__overflow = _libraries['/usr/lib/libavcodec.so'].__overflow\n"
+        '__overflow.restype = c_int\n'
+        '__overflow.argtypes = [POINTER(_IO_FILE), c_int]'
+        ),
+    '_IO_getc': (None, ('_IO_FILE',),
+        "_IO_getc = _libraries['/usr/lib/libavcodec.so']._IO_getc\n"
+        '_IO_getc.restype = c_int\n'
+        '_IO_getc.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_putc': (None, ('_IO_FILE',),
+        "_IO_putc = _libraries['/usr/lib/libavcodec.so']._IO_putc\n"
+        '_IO_putc.restype = c_int\n'
+        '_IO_putc.argtypes = [c_int, POINTER(_IO_FILE)]'
+        ),
+    '_IO_feof': (None, ('_IO_FILE',),
+        "_IO_feof = _libraries['/usr/lib/libavcodec.so']._IO_feof\n"
+        '_IO_feof.restype = c_int\n'
+        '_IO_feof.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_ferror': (None, ('_IO_FILE',),
+        "_IO_ferror = _libraries['/usr/lib/libavcodec.so']._IO_ferror\n"
+        '_IO_ferror.restype = c_int\n'
+        '_IO_ferror.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_peekc_locked': (None, ('_IO_FILE',),
+        "_IO_peekc_locked = _libraries['/usr/lib/libavcodec.so']._IO_peekc_locked\n"
+        '_IO_peekc_locked.restype = c_int\n'
+        '_IO_peekc_locked.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_flockfile': (None, ('_IO_FILE',),
+        "_IO_flockfile = _libraries['/usr/lib/libavcodec.so']._IO_flockfile\n"
+        '_IO_flockfile.restype = None\n'
+        '_IO_flockfile.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_funlockfile': (None, ('_IO_FILE',),
+        "_IO_funlockfile = _libraries['/usr/lib/libavcodec.so']._IO_funlockfile\n"
+        '_IO_funlockfile.restype = None\n'
+        '_IO_funlockfile.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_ftrylockfile': (None, ('_IO_FILE',),
+        "_IO_ftrylockfile = _libraries['/usr/lib/libavcodec.so']._IO_ftrylockfile\n"
+        '_IO_ftrylockfile.restype = c_int\n'
+        '_IO_ftrylockfile.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_vfscanf': (None, ('_IO_FILE', '__va_list_tag'),
+        "_IO_vfscanf = _libraries['/usr/lib/libavcodec.so']._IO_vfscanf\n"
+        '_IO_vfscanf.restype = c_int\n'
+        '_IO_vfscanf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag), POINTER(c_int)]'
+        ),
+    '_IO_vfprintf': (None, ('_IO_FILE', '__va_list_tag'),
+        "_IO_vfprintf = _libraries['/usr/lib/libavcodec.so']._IO_vfprintf\n"
+        '_IO_vfprintf.restype = c_int\n'
+        '_IO_vfprintf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag)]'
+        ),
+    '_IO_padn': (None, ('_IO_FILE',),
+        "_IO_padn = _libraries['/usr/lib/libavcodec.so']._IO_padn\n"
+        '_IO_padn.restype = __ssize_t\n'
+        '_IO_padn.argtypes = [POINTER(_IO_FILE), c_int, __ssize_t]'
+        ),
+    '_IO_sgetn': (None, ('_IO_FILE',),
+        "_IO_sgetn = _libraries['/usr/lib/libavcodec.so']._IO_sgetn\n"
+        '_IO_sgetn.restype = size_t\n'
+        '_IO_sgetn.argtypes = [POINTER(_IO_FILE), c_void_p, size_t]'
+        ),
+    '_IO_seekoff': (None, ('_IO_FILE',),
+        "_IO_seekoff = _libraries['/usr/lib/libavcodec.so']._IO_seekoff\n"
+        '_IO_seekoff.restype = __off64_t\n'
+        '_IO_seekoff.argtypes = [POINTER(_IO_FILE), __off64_t, c_int, c_int]'
+        ),
+    '_IO_seekpos': (None, ('_IO_FILE',),
+        "_IO_seekpos = _libraries['/usr/lib/libavcodec.so']._IO_seekpos\n"
+        '_IO_seekpos.restype = __off64_t\n'
+        '_IO_seekpos.argtypes = [POINTER(_IO_FILE), __off64_t, c_int]'
+        ),
+    '_IO_free_backup_area': (None, ('_IO_FILE',),
+        "_IO_free_backup_area = _libraries['/usr/lib/libavcodec.so']._IO_free_backup_area\n"
+        '_IO_free_backup_area.restype = None\n'
+        '_IO_free_backup_area.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    'postproc_version': (None, (),
+        "postproc_version = _libraries['/usr/lib/libavdevice.so'].postproc_version\n"
+        'postproc_version.restype = c_uint\n'
+        'postproc_version.argtypes = []'
+        ),
+    'postproc_configuration': (None, (),
+        "postproc_configuration = _libraries['/usr/lib/libavdevice.so'].postproc_configuration\n"
+        'postproc_configuration.restype = STRING\n'
+        'postproc_configuration.argtypes = []'
+        ),
+    'postproc_license': (None, (),
+        "postproc_license = _libraries['/usr/lib/libavdevice.so'].postproc_license\n"
+        'postproc_license.restype = STRING\n'
+        'postproc_license.argtypes = []'
+        ),
+    'pp_help': (None, (),
+        "pp_help = (c_char * 0).in_dll(_libraries['/usr/lib/libavdevice.so'], 'pp_help')"
+        ),
+    'pp_postprocess': (None, (),
+        "pp_postprocess = _libraries['/usr/lib/libavdevice.so'].pp_postprocess\n"
+        'pp_postprocess.restype = None\n'
+        'pp_postprocess.argtypes = [POINTER(POINTER(uint8_t)), POINTER(c_int), POINTER(POINTER(uint8_t)), POINTER(c_int), c_int, c_int, POINTER(int8_t), c_int, POINTER(pp_mode), POINTER(pp_context), c_int]'
+        ),
+    'pp_get_mode_by_name_and_quality': (None, (),
+        "pp_get_mode_by_name_and_quality = _libraries['/usr/lib/libavdevice.so'].pp_get_mode_by_name_and_quality\n"
+        'pp_get_mode_by_name_and_quality.restype = POINTER(pp_mode)\n'
+        'pp_get_mode_by_name_and_quality.argtypes = [STRING, c_int]'
+        ),
+    'pp_free_mode': (None, (),
+        "pp_free_mode = _libraries['/usr/lib/libavdevice.so'].pp_free_mode\n"
+        'pp_free_mode.restype = None\n'
+        'pp_free_mode.argtypes = [POINTER(pp_mode)]'
+        ),
+    'pp_get_context': (None, (),
+        "pp_get_context = _libraries['/usr/lib/libavdevice.so'].pp_get_context\n"
+        'pp_get_context.restype = POINTER(pp_context)\n'
+        'pp_get_context.argtypes = [c_int, c_int, c_int]'
+        ),
+    'pp_free_context': (None, (),
+        "pp_free_context = _libraries['/usr/lib/libavdevice.so'].pp_free_context\n"
+        'pp_free_context.restype = None\n'
+        'pp_free_context.argtypes = [POINTER(pp_context)]'
+        ),
+    'swscale_version': (None, (),
+        "swscale_version = _libraries['/usr/lib/libswscale.so'].swscale_version\n"
+        'swscale_version.restype = c_uint\n'
+        'swscale_version.argtypes = []'
+        ),
+    'swscale_configuration': (None, (),
+        "swscale_configuration = _libraries['/usr/lib/libswscale.so'].swscale_configuration\n"
+        'swscale_configuration.restype = STRING\n'
+        'swscale_configuration.argtypes = []'
+        ),
+    'swscale_license': (None, (),
+        "swscale_license = _libraries['/usr/lib/libswscale.so'].swscale_license\n"
+        'swscale_license.restype = STRING\n'
+        'swscale_license.argtypes = []'
+        ),
+    'sws_getCoefficients': (None, (),
+        "sws_getCoefficients = _libraries['/usr/lib/libswscale.so'].sws_getCoefficients\n"
+        'sws_getCoefficients.restype = POINTER(c_int)\n'
+        'sws_getCoefficients.argtypes = [c_int]'
+        ),
+    'SwsVector': ('Structure', (),
+        'SwsVector._fields_ = [\n'
+        "    ('coeff', POINTER(c_double)),\n"
+        "    ('length', c_int),\n"
+        ']'
+        ),
+    'SwsFilter': ('Structure', ('SwsVector',),
+        'SwsFilter._fields_ = [\n'
+        "    ('lumH', POINTER(SwsVector)),\n"
+        "    ('lumV', POINTER(SwsVector)),\n"
+        "    ('chrH', POINTER(SwsVector)),\n"
+        "    ('chrV', POINTER(SwsVector)),\n"
+        ']'
+        ),
+    'SwsContext': ('Structure', (),
+        'SwsContext._fields_ = [\n'
+        ']'
+        ),
+    'sws_isSupportedInput': (None, (),
+        "sws_isSupportedInput = _libraries['/usr/lib/libswscale.so'].sws_isSupportedInput\n"
+        'sws_isSupportedInput.restype = c_int\n'
+        'sws_isSupportedInput.argtypes = [AVPixelFormat]'
+        ),
+    'sws_isSupportedOutput': (None, (),
+        "sws_isSupportedOutput = _libraries['/usr/lib/libswscale.so'].sws_isSupportedOutput\n"
+        'sws_isSupportedOutput.restype = c_int\n'
+        'sws_isSupportedOutput.argtypes = [AVPixelFormat]'
+        ),
+    'sws_isSupportedEndiannessConversion': (None, (),
+        "sws_isSupportedEndiannessConversion = _libraries['/usr/lib/libswscale.so'].sws_isSupportedEndiannessConversion\n"
+        'sws_isSupportedEndiannessConversion.restype = c_int\n'
+        'sws_isSupportedEndiannessConversion.argtypes = [AVPixelFormat]'
+        ),
+    'sws_alloc_context': (None, ('SwsContext',),
+        "sws_alloc_context = _libraries['/usr/lib/libswscale.so'].sws_alloc_context\n"
+        'sws_alloc_context.restype = POINTER(SwsContext)\n'
+        'sws_alloc_context.argtypes = []'
+        ),
+    'sws_init_context': (None, ('SwsContext', 'SwsFilter'),
+        "sws_init_context = _libraries['/usr/lib/libswscale.so'].sws_init_context\n"
+        'sws_init_context.restype = c_int\n'
+        'sws_init_context.argtypes = [POINTER(SwsContext), POINTER(SwsFilter), POINTER(SwsFilter)]'
+        ),
+    'sws_freeContext': (None, ('SwsContext',),
+        "sws_freeContext = _libraries['/usr/lib/libswscale.so'].sws_freeContext\n"
+        'sws_freeContext.restype = None\n'
+        'sws_freeContext.argtypes = [POINTER(SwsContext)]'
+        ),
+    'sws_getContext': (None, ('SwsContext', 'SwsFilter'),
+        "sws_getContext = _libraries['/usr/lib/libswscale.so'].sws_getContext\n"
+        'sws_getContext.restype = POINTER(SwsContext)\n'
+        'sws_getContext.argtypes = [c_int, c_int, AVPixelFormat, c_int, c_int, AVPixelFormat, c_int, POINTER(SwsFilter), POINTER(SwsFilter), POINTER(c_double)]'
+        ),
+    'sws_scale': (None, ('SwsContext',),
+        "sws_scale = _libraries['/usr/lib/libswscale.so'].sws_scale\n"
+        'sws_scale.restype = c_int\n'
+        'sws_scale.argtypes = [POINTER(SwsContext), POINTER(POINTER(uint8_t)), POINTER(c_int), c_int, c_int, POINTER(POINTER(uint8_t)), POINTER(c_int)]'
+        ),
+    'sws_setColorspaceDetails': (None, ('SwsContext',),
+        "sws_setColorspaceDetails = _libraries['/usr/lib/libswscale.so'].sws_setColorspaceDetails\n"
+        'sws_setColorspaceDetails.restype = c_int\n'
+        'sws_setColorspaceDetails.argtypes = [POINTER(SwsContext), POINTER(c_int), c_int, POINTER(c_int), c_int, c_int, c_int, c_int]'
+        ),
+    'sws_getColorspaceDetails': (None, ('SwsContext',),
+        "sws_getColorspaceDetails = _libraries['/usr/lib/libswscale.so'].sws_getColorspaceDetails\n"
+        'sws_getColorspaceDetails.restype = c_int\n'
+        'sws_getColorspaceDetails.argtypes = [POINTER(SwsContext), POINTER(POINTER(c_int)), POINTER(c_int), POINTER(POINTER(c_int)), POINTER(c_int), POINTER(c_int), POINTER(c_int), POINTER(c_int)]'
+        ),
+    'sws_allocVec': (None, ('SwsVector',),
+        "sws_allocVec = _libraries['/usr/lib/libswscale.so'].sws_allocVec\n"
+        'sws_allocVec.restype = POINTER(SwsVector)\n'
+        'sws_allocVec.argtypes = [c_int]'
+        ),
+    'sws_getGaussianVec': (None, ('SwsVector',),
+        "sws_getGaussianVec = _libraries['/usr/lib/libswscale.so'].sws_getGaussianVec\n"
+        'sws_getGaussianVec.restype = POINTER(SwsVector)\n'
+        'sws_getGaussianVec.argtypes = [c_double, c_double]'
+        ),
+    'sws_getConstVec': (None, ('SwsVector',),
+        "sws_getConstVec = _libraries['/usr/lib/libswscale.so'].sws_getConstVec\n"
+        'sws_getConstVec.restype = POINTER(SwsVector)\n'
+        'sws_getConstVec.argtypes = [c_double, c_int]'
+        ),
+    'sws_getIdentityVec': (None, ('SwsVector',),
+        "sws_getIdentityVec = _libraries['/usr/lib/libswscale.so'].sws_getIdentityVec\n"
+        'sws_getIdentityVec.restype = POINTER(SwsVector)\n'
+        'sws_getIdentityVec.argtypes = []'
+        ),
+    'sws_scaleVec': (None, ('SwsVector',),
+        "sws_scaleVec = _libraries['/usr/lib/libswscale.so'].sws_scaleVec\n"
+        'sws_scaleVec.restype = None\n'
+        'sws_scaleVec.argtypes = [POINTER(SwsVector), c_double]'
+        ),
+    'sws_normalizeVec': (None, ('SwsVector',),
+        "sws_normalizeVec = _libraries['/usr/lib/libswscale.so'].sws_normalizeVec\n"
+        'sws_normalizeVec.restype = None\n'
+        'sws_normalizeVec.argtypes = [POINTER(SwsVector), c_double]'
+        ),
+    'sws_convVec': (None, ('SwsVector',),
+        "sws_convVec = _libraries['/usr/lib/libswscale.so'].sws_convVec\n"
+        'sws_convVec.restype = None\n'
+        'sws_convVec.argtypes = [POINTER(SwsVector), POINTER(SwsVector)]'
+        ),
+    'sws_addVec': (None, ('SwsVector',),
+        "sws_addVec = _libraries['/usr/lib/libswscale.so'].sws_addVec\n"
+        'sws_addVec.restype = None\n'
+        'sws_addVec.argtypes = [POINTER(SwsVector), POINTER(SwsVector)]'
+        ),
+    'sws_subVec': (None, ('SwsVector',),
+        "sws_subVec = _libraries['/usr/lib/libswscale.so'].sws_subVec\n"
+        'sws_subVec.restype = None\n'
+        'sws_subVec.argtypes = [POINTER(SwsVector), POINTER(SwsVector)]'
+        ),
+    'sws_shiftVec': (None, ('SwsVector',),
+        "sws_shiftVec = _libraries['/usr/lib/libswscale.so'].sws_shiftVec\n"
+        'sws_shiftVec.restype = None\n'
+        'sws_shiftVec.argtypes = [POINTER(SwsVector), c_int]'
+        ),
+    'sws_cloneVec': (None, ('SwsVector',),
+        "sws_cloneVec = _libraries['/usr/lib/libswscale.so'].sws_cloneVec\n"
+        'sws_cloneVec.restype = POINTER(SwsVector)\n'
+        'sws_cloneVec.argtypes = [POINTER(SwsVector)]'
+        ),
+    'sws_printVec2': (None, ('AVClass', 'SwsVector'),
+        "sws_printVec2 = _libraries['/usr/lib/libswscale.so'].sws_printVec2\n"
+        'sws_printVec2.restype = None\n'
+        'sws_printVec2.argtypes = [POINTER(SwsVector), POINTER(AVClass), c_int]'
+        ),
+    'sws_freeVec': (None, ('SwsVector',),
+        "sws_freeVec = _libraries['/usr/lib/libswscale.so'].sws_freeVec\n"
+        'sws_freeVec.restype = None\n'
+        'sws_freeVec.argtypes = [POINTER(SwsVector)]'
+        ),
+    'sws_getDefaultFilter': (None, ('SwsFilter',),
+        "sws_getDefaultFilter = _libraries['/usr/lib/libswscale.so'].sws_getDefaultFilter\n"
+        'sws_getDefaultFilter.restype = POINTER(SwsFilter)\n'
+        'sws_getDefaultFilter.argtypes = [c_float, c_float, c_float, c_float, c_float, c_float, c_int]'
+        ),
+    'sws_freeFilter': (None, ('SwsFilter',),
+        "sws_freeFilter = _libraries['/usr/lib/libswscale.so'].sws_freeFilter\n"
+        'sws_freeFilter.restype = None\n'
+        'sws_freeFilter.argtypes = [POINTER(SwsFilter)]'
+        ),
+    'sws_getCachedContext': (None, ('SwsContext', 'SwsFilter'),
+        "sws_getCachedContext = _libraries['/usr/lib/libswscale.so'].sws_getCachedContext\n"
+        'sws_getCachedContext.restype = POINTER(SwsContext)\n'
+        'sws_getCachedContext.argtypes = [POINTER(SwsContext), c_int, c_int, AVPixelFormat, c_int, c_int, AVPixelFormat, c_int, POINTER(SwsFilter), POINTER(SwsFilter), POINTER(c_double)]'
+        ),
+    'sws_convertPalette8ToPacked32': (None, (),
+        "sws_convertPalette8ToPacked32 = _libraries['/usr/lib/libswscale.so'].sws_convertPalette8ToPacked32\n"
+        'sws_convertPalette8ToPacked32.restype = None\n'
+        'sws_convertPalette8ToPacked32.argtypes = [POINTER(uint8_t), POINTER(uint8_t), c_int, POINTER(uint8_t)]'
+        ),
+    'sws_convertPalette8ToPacked24': (None, (),
+        "sws_convertPalette8ToPacked24 = _libraries['/usr/lib/libswscale.so'].sws_convertPalette8ToPacked24\n"
+        'sws_convertPalette8ToPacked24.restype = None\n'
+        'sws_convertPalette8ToPacked24.argtypes = [POINTER(uint8_t), POINTER(uint8_t), c_int, POINTER(uint8_t)]'
+        ),
+    'sws_get_class': (None, ('AVClass',),
+        "sws_get_class = _libraries['/usr/lib/libswscale.so'].sws_get_class\n"
+        'sws_get_class.restype = POINTER(AVClass)\n'
+        'sws_get_class.argtypes = []'
+        ),
+    'signgam': (None, (),
+        "signgam = (c_int).in_dll(_libraries['/usr/lib/libavcodec.so'], 'signgam')"
+        ),
+    '_LIB_VERSION': (None, (),
+        "_LIB_VERSION = (_LIB_VERSION_TYPE).in_dll(_libraries['/usr/lib/libavcodec.so'], '_LIB_VERSION')"
+        ),
+    '__exception': ('Structure', (),
+        '__exception._fields_ = [\n'
+        "    ('type', c_int),\n"
+        "    ('name', STRING),\n"
+        "    ('arg1', c_double),\n"
+        "    ('arg2', c_double),\n"
+        "    ('retval', c_double),\n"
+        ']'
+        ),
+    'matherr': (None, ('__exception',),
+        "matherr = _libraries['/usr/lib/libavcodec.so'].matherr\n"
+        'matherr.restype = c_int\n'
+        'matherr.argtypes = [POINTER(__exception)]'
+        ),
+    '__FILE': (None, ('_IO_FILE',),
+        '__FILE = _IO_FILE'
+        ),
+    'va_list': (None, ('__gnuc_va_list',),
+        'va_list = __gnuc_va_list'
+        ),
+    'fpos_t': (None, ('_G_fpos_t',),
+        'fpos_t = _G_fpos_t'
+        ),
+    'fpos64_t': (None, ('_G_fpos64_t',),
+        'fpos64_t = _G_fpos64_t'
+        ),
+    'remove': (None, (),
+        "remove = _libraries['/usr/lib/libavcodec.so'].remove\n"
+        'remove.restype = c_int\n'
+        'remove.argtypes = [STRING]'
+        ),
+    'rename': (None, (),
+        "rename = _libraries['/usr/lib/libavcodec.so'].rename\n"
+        'rename.restype = c_int\n'
+        'rename.argtypes = [STRING, STRING]'
+        ),
+    'renameat': (None, (),
+        "renameat = _libraries['/usr/lib/libavcodec.so'].renameat\n"
+        'renameat.restype = c_int\n'
+        'renameat.argtypes = [c_int, STRING, c_int, STRING]'
+        ),
+    'tmpfile': (None, ('FILE',),
+        "tmpfile = _libraries['/usr/lib/libavcodec.so'].tmpfile\n"
+        'tmpfile.restype = POINTER(FILE)\n'
+        'tmpfile.argtypes = []'
+        ),
+    'tmpfile64': (None, ('FILE',),
+        "tmpfile64 = _libraries['/usr/lib/libavcodec.so'].tmpfile64\n"
+        'tmpfile64.restype = POINTER(FILE)\n'
+        'tmpfile64.argtypes = []'
+        ),
+    'tmpnam': (None, (),
+        "tmpnam = _libraries['/usr/lib/libavcodec.so'].tmpnam\n"
+        'tmpnam.restype = STRING\n'
+        'tmpnam.argtypes = [STRING]'
+        ),
+    'tmpnam_r': (None, (),
+        "tmpnam_r = _libraries['/usr/lib/libavcodec.so'].tmpnam_r\n"
+        'tmpnam_r.restype = STRING\n'
+        'tmpnam_r.argtypes = [STRING]'
+        ),
+    'tempnam': (None, (),
+        "tempnam = _libraries['/usr/lib/libavcodec.so'].tempnam\n"
+        'tempnam.restype = STRING\n'
+        'tempnam.argtypes = [STRING, STRING]'
+        ),
+    'fclose': (None, ('FILE',),
+        "fclose = _libraries['/usr/lib/libavcodec.so'].fclose\n"
+        'fclose.restype = c_int\n'
+        'fclose.argtypes = [POINTER(FILE)]'
+        ),
+    'fflush': (None, ('FILE',),
+        "fflush = _libraries['/usr/lib/libavcodec.so'].fflush\n"
+        'fflush.restype = c_int\n'
+        'fflush.argtypes = [POINTER(FILE)]'
+        ),
+    'fflush_unlocked': (None, ('FILE',),
+        "fflush_unlocked = _libraries['/usr/lib/libavcodec.so'].fflush_unlocked\n"
+        'fflush_unlocked.restype = c_int\n'
+        'fflush_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'fcloseall': (None, (),
+        "fcloseall = _libraries['/usr/lib/libavcodec.so'].fcloseall\n"
+        'fcloseall.restype = c_int\n'
+        'fcloseall.argtypes = []'
+        ),
+    'fopen': (None, ('FILE',),
+        "fopen = _libraries['/usr/lib/libavcodec.so'].fopen\n"
+        'fopen.restype = POINTER(FILE)\n'
+        'fopen.argtypes = [STRING, STRING]'
+        ),
+    'freopen': (None, ('FILE',),
+        "freopen = _libraries['/usr/lib/libavcodec.so'].freopen\n"
+        'freopen.restype = POINTER(FILE)\n'
+        'freopen.argtypes = [STRING, STRING, POINTER(FILE)]'
+        ),
+    'fopen64': (None, ('FILE',),
+        "fopen64 = _libraries['/usr/lib/libavcodec.so'].fopen64\n"
+        'fopen64.restype = POINTER(FILE)\n'
+        'fopen64.argtypes = [STRING, STRING]'
+        ),
+    'freopen64': (None, ('FILE',),
+        "freopen64 = _libraries['/usr/lib/libavcodec.so'].freopen64\n"
+        'freopen64.restype = POINTER(FILE)\n'
+        'freopen64.argtypes = [STRING, STRING, POINTER(FILE)]'
+        ),
+    'fdopen': (None, ('FILE',),
+        "fdopen = _libraries['/usr/lib/libavcodec.so'].fdopen\n"
+        'fdopen.restype = POINTER(FILE)\n'
+        'fdopen.argtypes = [c_int, STRING]'
+        ),
+    'fopencookie': (None, ('FILE', '_IO_cookie_io_functions_t'),
+        "fopencookie = _libraries['/usr/lib/libavcodec.so'].fopencookie\n"
+        'fopencookie.restype = POINTER(FILE)\n'
+        'fopencookie.argtypes = [c_void_p, STRING, _IO_cookie_io_functions_t]'
+        ),
+    'fmemopen': (None, ('FILE',),
+        "fmemopen = _libraries['/usr/lib/libavcodec.so'].fmemopen\n"
+        'fmemopen.restype = POINTER(FILE)\n'
+        'fmemopen.argtypes = [c_void_p, size_t, STRING]'
+        ),
+    'open_memstream': (None, ('FILE',),
+        "open_memstream = _libraries['/usr/lib/libavcodec.so'].open_memstream\n"
+        'open_memstream.restype = POINTER(FILE)\n'
+        'open_memstream.argtypes = [POINTER(STRING), POINTER(size_t)]'
+        ),
+    'setbuf': (None, ('FILE',),
+        "setbuf = _libraries['/usr/lib/libavcodec.so'].setbuf\n"
+        'setbuf.restype = None\n'
+        'setbuf.argtypes = [POINTER(FILE), STRING]'
+        ),
+    'setvbuf': (None, ('FILE',),
+        "setvbuf = _libraries['/usr/lib/libavcodec.so'].setvbuf\n"
+        'setvbuf.restype = c_int\n'
+        'setvbuf.argtypes = [POINTER(FILE), STRING, c_int, size_t]'
+        ),
+    'setbuffer': (None, ('FILE',),
+        "setbuffer = _libraries['/usr/lib/libavcodec.so'].setbuffer\n"
+        'setbuffer.restype = None\n'
+        'setbuffer.argtypes = [POINTER(FILE), STRING, size_t]'
+        ),
+    'setlinebuf': (None, ('FILE',),
+        "setlinebuf = _libraries['/usr/lib/libavcodec.so'].setlinebuf\n"
+        'setlinebuf.restype = None\n'
+        'setlinebuf.argtypes = [POINTER(FILE)]'
+        ),
+    'fscanf': (None, ('FILE',),
+        "fscanf = _libraries['/usr/lib/libavcodec.so'].fscanf\n"
+        'fscanf.restype = c_int\n'
+        'fscanf.argtypes = [POINTER(FILE), STRING]'
+        ),
+    'scanf': (None, (),
+        "scanf = _libraries['/usr/lib/libavcodec.so'].scanf\n"
+        'scanf.restype = c_int\n'
+        'scanf.argtypes = [STRING]'
+        ),
+    'sscanf': (None, (),
+        "sscanf = _libraries['/usr/lib/libavcodec.so'].sscanf\n"
+        'sscanf.restype = c_int\n'
+        'sscanf.argtypes = [STRING, STRING]'
+        ),
+    'vfscanf': (None, ('FILE', '__va_list_tag'),
+        "vfscanf = _libraries['/usr/lib/libavcodec.so'].vfscanf\n"
+        'vfscanf.restype = c_int\n'
+        'vfscanf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]'
+        ),
+    'vscanf': (None, ('__va_list_tag',),
+        "vscanf = _libraries['/usr/lib/libavcodec.so'].vscanf\n"
+        'vscanf.restype = c_int\n'
+        'vscanf.argtypes = [STRING, POINTER(__va_list_tag)]'
+        ),
+    'vsscanf': (None, ('__va_list_tag',),
+        "vsscanf = _libraries['/usr/lib/libavcodec.so'].vsscanf\n"
+        'vsscanf.restype = c_int\n'
+        'vsscanf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]'
+        ),
+    'fgetc': (None, ('FILE',),
+        "fgetc = _libraries['/usr/lib/libavcodec.so'].fgetc\n"
+        'fgetc.restype = c_int\n'
+        'fgetc.argtypes = [POINTER(FILE)]'
+        ),
+    'fputc': (None, ('FILE',),
+        "fputc = _libraries['/usr/lib/libavcodec.so'].fputc\n"
+        'fputc.restype = c_int\n'
+        'fputc.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'getw': (None, ('FILE',),
+        "getw = _libraries['/usr/lib/libavcodec.so'].getw\n"
+        'getw.restype = c_int\n'
+        'getw.argtypes = [POINTER(FILE)]'
+        ),
+    'putw': (None, ('FILE',),
+        "putw = _libraries['/usr/lib/libavcodec.so'].putw\n"
+        'putw.restype = c_int\n'
+        'putw.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'gets': (None, (),
+        "gets = _libraries['/usr/lib/libavcodec.so'].gets\n"
+        'gets.restype = STRING\n'
+        'gets.argtypes = [STRING]'
+        ),
+    '__getdelim': (None, ('FILE',),
+        "__getdelim = _libraries['/usr/lib/libavcodec.so'].__getdelim\n"
+        '__getdelim.restype = __ssize_t\n'
+        '__getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]'
+        ),
+    'getdelim': (None, ('FILE',),
+        "getdelim = _libraries['/usr/lib/libavcodec.so'].getdelim\n"
+        'getdelim.restype = __ssize_t\n'
+        'getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]'
+        ),
+    'fputs': (None, ('FILE',),
+        "fputs = _libraries['/usr/lib/libavcodec.so'].fputs\n"
+        'fputs.restype = c_int\n'
+        'fputs.argtypes = [STRING, POINTER(FILE)]'
+        ),
+    'puts': (None, (),
+        "puts = _libraries['/usr/lib/libavcodec.so'].puts\n"
+        'puts.restype = c_int\n'
+        'puts.argtypes = [STRING]'
+        ),
+    'ungetc': (None, ('FILE',),
+        "ungetc = _libraries['/usr/lib/libavcodec.so'].ungetc\n"
+        'ungetc.restype = c_int\n'
+        'ungetc.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'fwrite': (None, ('FILE',),
+        "fwrite = _libraries['/usr/lib/libavcodec.so'].fwrite\n"
+        'fwrite.restype = size_t\n'
+        'fwrite.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fputs_unlocked': (None, ('FILE',),
+        "fputs_unlocked = _libraries['/usr/lib/libavcodec.so'].fputs_unlocked\n"
+        'fputs_unlocked.restype = c_int\n'
+        'fputs_unlocked.argtypes = [STRING, POINTER(FILE)]'
+        ),
+    'fwrite_unlocked': (None, ('FILE',),
+        "fwrite_unlocked = _libraries['/usr/lib/libavcodec.so'].fwrite_unlocked\n"
+        'fwrite_unlocked.restype = size_t\n'
+        'fwrite_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fseek': (None, ('FILE',),
+        "fseek = _libraries['/usr/lib/libavcodec.so'].fseek\n"
+        'fseek.restype = c_int\n'
+        'fseek.argtypes = [POINTER(FILE), c_long, c_int]'
+        ),
+    'ftell': (None, ('FILE',),
+        "ftell = _libraries['/usr/lib/libavcodec.so'].ftell\n"
+        'ftell.restype = c_long\n'
+        'ftell.argtypes = [POINTER(FILE)]'
+        ),
+    'rewind': (None, ('FILE',),
+        "rewind = _libraries['/usr/lib/libavcodec.so'].rewind\n"
+        'rewind.restype = None\n'
+        'rewind.argtypes = [POINTER(FILE)]'
+        ),
+    'fseeko': (None, ('FILE',),
+        "fseeko = _libraries['/usr/lib/libavcodec.so'].fseeko\n"
+        'fseeko.restype = c_int\n'
+        'fseeko.argtypes = [POINTER(FILE), __off_t, c_int]'
+        ),
+    'ftello': (None, ('FILE',),
+        "ftello = _libraries['/usr/lib/libavcodec.so'].ftello\n"
+        'ftello.restype = __off_t\n'
+        'ftello.argtypes = [POINTER(FILE)]'
+        ),
+    'fgetpos': (None, ('FILE', 'fpos_t'),
+        "fgetpos = _libraries['/usr/lib/libavcodec.so'].fgetpos\n"
+        'fgetpos.restype = c_int\n'
+        'fgetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]'
+        ),
+    'fsetpos': (None, ('FILE', 'fpos_t'),
+        "fsetpos = _libraries['/usr/lib/libavcodec.so'].fsetpos\n"
+        'fsetpos.restype = c_int\n'
+        'fsetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]'
+        ),
+    'fseeko64': (None, ('FILE',),
+        "fseeko64 = _libraries['/usr/lib/libavcodec.so'].fseeko64\n"
+        'fseeko64.restype = c_int\n'
+        'fseeko64.argtypes = [POINTER(FILE), __off64_t, c_int]'
+        ),
+    'ftello64': (None, ('FILE',),
+        "ftello64 = _libraries['/usr/lib/libavcodec.so'].ftello64\n"
+        'ftello64.restype = __off64_t\n'
+        'ftello64.argtypes = [POINTER(FILE)]'
+        ),
+    'fgetpos64': (None, ('FILE', 'fpos64_t'),
+        "fgetpos64 = _libraries['/usr/lib/libavcodec.so'].fgetpos64\n"
+        'fgetpos64.restype = c_int\n'
+        'fgetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]'
+        ),
+    'fsetpos64': (None, ('FILE', 'fpos64_t'),
+        "fsetpos64 = _libraries['/usr/lib/libavcodec.so'].fsetpos64\n"
+        'fsetpos64.restype = c_int\n'
+        'fsetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]'
+        ),
+    'clearerr': (None, ('FILE',),
+        "clearerr = _libraries['/usr/lib/libavcodec.so'].clearerr\n"
+        'clearerr.restype = None\n'
+        'clearerr.argtypes = [POINTER(FILE)]'
+        ),
+    'feof': (None, ('FILE',),
+        "feof = _libraries['/usr/lib/libavcodec.so'].feof\n"
+        'feof.restype = c_int\n'
+        'feof.argtypes = [POINTER(FILE)]'
+        ),
+    'ferror': (None, ('FILE',),
+        "ferror = _libraries['/usr/lib/libavcodec.so'].ferror\n"
+        'ferror.restype = c_int\n'
+        'ferror.argtypes = [POINTER(FILE)]'
+        ),
+    'clearerr_unlocked': (None, ('FILE',),
+        "clearerr_unlocked = _libraries['/usr/lib/libavcodec.so'].clearerr_unlocked\n"
+        'clearerr_unlocked.restype = None\n'
+        'clearerr_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'perror': (None, (),
+        "perror = _libraries['/usr/lib/libavcodec.so'].perror\n"
+        'perror.restype = None\n'
+        'perror.argtypes = [STRING]'
+        ),
+    'fileno': (None, ('FILE',),
+        "fileno = _libraries['/usr/lib/libavcodec.so'].fileno\n"
+        'fileno.restype = c_int\n'
+        'fileno.argtypes = [POINTER(FILE)]'
+        ),
+    'fileno_unlocked': (None, ('FILE',),
+        "fileno_unlocked = _libraries['/usr/lib/libavcodec.so'].fileno_unlocked\n"
+        'fileno_unlocked.restype = c_int\n'
+        'fileno_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'popen': (None, ('FILE',),
+        "popen = _libraries['/usr/lib/libavcodec.so'].popen\n"
+        'popen.restype = POINTER(FILE)\n'
+        'popen.argtypes = [STRING, STRING]'
+        ),
+    'pclose': (None, ('FILE',),
+        "pclose = _libraries['/usr/lib/libavcodec.so'].pclose\n"
+        'pclose.restype = c_int\n'
+        'pclose.argtypes = [POINTER(FILE)]'
+        ),
+    'ctermid': (None, (),
+        "ctermid = _libraries['/usr/lib/libavcodec.so'].ctermid\n"
+        'ctermid.restype = STRING\n'
+        'ctermid.argtypes = [STRING]'
+        ),
+    'cuserid': (None, (),
+        "cuserid = _libraries['/usr/lib/libavcodec.so'].cuserid\n"
+        'cuserid.restype = STRING\n'
+        'cuserid.argtypes = [STRING]'
+        ),
+    'flockfile': (None, ('FILE',),
+        "flockfile = _libraries['/usr/lib/libavcodec.so'].flockfile\n"
+        'flockfile.restype = None\n'
+        'flockfile.argtypes = [POINTER(FILE)]'
+        ),
+    'ftrylockfile': (None, ('FILE',),
+        "ftrylockfile = _libraries['/usr/lib/libavcodec.so'].ftrylockfile\n"
+        'ftrylockfile.restype = c_int\n'
+        'ftrylockfile.argtypes = [POINTER(FILE)]'
+        ),
+    'funlockfile': (None, ('FILE',),
+        "funlockfile = _libraries['/usr/lib/libavcodec.so'].funlockfile\n"
+        'funlockfile.restype = None\n'
+        'funlockfile.argtypes = [POINTER(FILE)]'
+        ),
+    'div_t': ('Structure', (),
+        'div_t._fields_ = [\n'
+        "    ('quot', c_int),\n"
+        "    ('rem', c_int),\n"
+        ']'
+        ),
+    'ldiv_t': ('Structure', (),
+        'ldiv_t._fields_ = [\n'
+        "    ('quot', c_long),\n"
+        "    ('rem', c_long),\n"
+        ']'
+        ),
+    'lldiv_t': ('Structure', (),
+        'lldiv_t._fields_ = [\n'
+        "    ('quot', c_longlong),\n"
+        "    ('rem', c_longlong),\n"
+        ']'
+        ),
+    '__ctype_get_mb_cur_max': (None, (),
+        "__ctype_get_mb_cur_max = _libraries['/usr/lib/libavcodec.so'].__ctype_get_mb_cur_max\n"
+        '__ctype_get_mb_cur_max.restype = size_t\n'
+        '__ctype_get_mb_cur_max.argtypes = []'
+        ),
+    'strtod': (None, (),
+        "strtod = _libraries['/usr/lib/libavcodec.so'].strtod\n"
+        'strtod.restype = c_double\n'
+        'strtod.argtypes = [STRING, POINTER(STRING)]'
+        ),
+    'strtof': (None, (),
+        "strtof = _libraries['/usr/lib/libavcodec.so'].strtof\n"
+        'strtof.restype = c_float\n'
+        'strtof.argtypes = [STRING, POINTER(STRING)]'
+        ),
+    'strtold': (None, (),
+        "strtold = _libraries['/usr/lib/libavcodec.so'].strtold\n"
+        'strtold.restype = c_longdouble\n'
+        'strtold.argtypes = [STRING, POINTER(STRING)]'
+        ),
+    'strtol': (None, (),
+        "strtol = _libraries['/usr/lib/libavcodec.so'].strtol\n"
+        'strtol.restype = c_long\n'
+        'strtol.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoul': (None, (),
+        "strtoul = _libraries['/usr/lib/libavcodec.so'].strtoul\n"
+        'strtoul.restype = c_ulong\n'
+        'strtoul.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoq': (None, (),
+        "strtoq = _libraries['/usr/lib/libavcodec.so'].strtoq\n"
+        'strtoq.restype = c_longlong\n'
+        'strtoq.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtouq': (None, (),
+        "strtouq = _libraries['/usr/lib/libavcodec.so'].strtouq\n"
+        'strtouq.restype = c_ulonglong\n'
+        'strtouq.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoll': (None, (),
+        "strtoll = _libraries['/usr/lib/libavcodec.so'].strtoll\n"
+        'strtoll.restype = c_longlong\n'
+        'strtoll.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoull': (None, (),
+        "strtoull = _libraries['/usr/lib/libavcodec.so'].strtoull\n"
+        'strtoull.restype = c_ulonglong\n'
+        'strtoull.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    '__locale_struct': ('Structure', ('__locale_data',),
+        '__locale_struct._fields_ = [\n'
+        "    ('__locales', POINTER(__locale_data) * 13),\n"
+        "    ('__ctype_b', POINTER(c_ushort)),\n"
+        "    ('__ctype_tolower', POINTER(c_int)),\n"
+        "    ('__ctype_toupper', POINTER(c_int)),\n"
+        "    ('__names', STRING * 13),\n"
+        ']'
+        ),
+    '__locale_t': (None, ('__locale_struct',),
+        '__locale_t = POINTER(__locale_struct)'
+        ),
+    'strtol_l': (None, ('__locale_t',),
+        "strtol_l = _libraries['/usr/lib/libavcodec.so'].strtol_l\n"
+        'strtol_l.restype = c_long\n'
+        'strtol_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtoul_l': (None, ('__locale_t',),
+        "strtoul_l = _libraries['/usr/lib/libavcodec.so'].strtoul_l\n"
+        'strtoul_l.restype = c_ulong\n'
+        'strtoul_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtoll_l': (None, ('__locale_t',),
+        "strtoll_l = _libraries['/usr/lib/libavcodec.so'].strtoll_l\n"
+        'strtoll_l.restype = c_longlong\n'
+        'strtoll_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtoull_l': (None, ('__locale_t',),
+        "strtoull_l = _libraries['/usr/lib/libavcodec.so'].strtoull_l\n"
+        'strtoull_l.restype = c_ulonglong\n'
+        'strtoull_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtod_l': (None, ('__locale_t',),
+        "strtod_l = _libraries['/usr/lib/libavcodec.so'].strtod_l\n"
+        'strtod_l.restype = c_double\n'
+        'strtod_l.argtypes = [STRING, POINTER(STRING), __locale_t]'
+        ),
+    'strtof_l': (None, ('__locale_t',),
+        "strtof_l = _libraries['/usr/lib/libavcodec.so'].strtof_l\n"
+        'strtof_l.restype = c_float\n'
+        'strtof_l.argtypes = [STRING, POINTER(STRING), __locale_t]'
+        ),
+    'strtold_l': (None, ('__locale_t',),
+        "strtold_l = _libraries['/usr/lib/libavcodec.so'].strtold_l\n"
+        'strtold_l.restype = c_longdouble\n'
+        'strtold_l.argtypes = [STRING, POINTER(STRING), __locale_t]'
+        ),
+    'atoi': (None, (),
+        "atoi = _libraries['/usr/lib/libavcodec.so'].atoi\n"
+        'atoi.restype = c_int\n'
+        'atoi.argtypes = [STRING]'
+        ),
+    'atol': (None, (),
+        "atol = _libraries['/usr/lib/libavcodec.so'].atol\n"
+        'atol.restype = c_long\n'
+        'atol.argtypes = [STRING]'
+        ),
+    'atoll': (None, (),
+        "atoll = _libraries['/usr/lib/libavcodec.so'].atoll\n"
+        'atoll.restype = c_longlong\n'
+        'atoll.argtypes = [STRING]'
+        ),
+    'l64a': (None, (),
+        "l64a = _libraries['/usr/lib/libavcodec.so'].l64a\n"
+        'l64a.restype = STRING\n'
+        'l64a.argtypes = [c_long]'
+        ),
+    'a64l': (None, (),
+        "a64l = _libraries['/usr/lib/libavcodec.so'].a64l\n"
+        'a64l.restype = c_long\n'
+        'a64l.argtypes = [STRING]'
+        ),
+    'random': (None, (),
+        "random = _libraries['/usr/lib/libavcodec.so'].random\n"
+        'random.restype = c_long\n'
+        'random.argtypes = []'
+        ),
+    'srandom': (None, (),
+        "srandom = _libraries['/usr/lib/libavcodec.so'].srandom\n"
+        'srandom.restype = None\n'
+        'srandom.argtypes = [c_uint]'
+        ),
+    'initstate': (None, (),
+        "initstate = _libraries['/usr/lib/libavcodec.so'].initstate\n"
+        'initstate.restype = STRING\n'
+        'initstate.argtypes = [c_uint, STRING, size_t]'
+        ),
+    'setstate': (None, (),
+        "setstate = _libraries['/usr/lib/libavcodec.so'].setstate\n"
+        'setstate.restype = STRING\n'
+        'setstate.argtypes = [STRING]'
+        ),
+    'random_data': ('Structure', (),
+        'random_data._fields_ = [\n'
+        "    ('fptr', POINTER(int32_t)),\n"
+        "    ('rptr', POINTER(int32_t)),\n"
+        "    ('state', POINTER(int32_t)),\n"
+        "    ('rand_type', c_int),\n"
+        "    ('rand_deg', c_int),\n"
+        "    ('rand_sep', c_int),\n"
+        "    ('end_ptr', POINTER(int32_t)),\n"
+        ']'
+        ),
+    'random_r': (None, ('random_data',),
+        "random_r = _libraries['/usr/lib/libavcodec.so'].random_r\n"
+        'random_r.restype = c_int\n'
+        'random_r.argtypes = [POINTER(random_data), POINTER(int32_t)]'
+        ),
+    'srandom_r': (None, ('random_data',),
+        "srandom_r = _libraries['/usr/lib/libavcodec.so'].srandom_r\n"
+        'srandom_r.restype = c_int\n'
+        'srandom_r.argtypes = [c_uint, POINTER(random_data)]'
+        ),
+    'initstate_r': (None, ('random_data',),
+        "initstate_r = _libraries['/usr/lib/libavcodec.so'].initstate_r\n"
+        'initstate_r.restype = c_int\n'
+        'initstate_r.argtypes = [c_uint, STRING, size_t, POINTER(random_data)]'
+        ),
+    'setstate_r': (None, ('random_data',),
+        "setstate_r = _libraries['/usr/lib/libavcodec.so'].setstate_r\n"
+        'setstate_r.restype = c_int\n'
+        'setstate_r.argtypes = [STRING, POINTER(random_data)]'
+        ),
+    'rand': (None, (),
+        "rand = _libraries['/usr/lib/libavcodec.so'].rand\n"
+        'rand.restype = c_int\n'
+        'rand.argtypes = []'
+        ),
+    'srand': (None, (),
+        "srand = _libraries['/usr/lib/libavcodec.so'].srand\n"
+        'srand.restype = None\n'
+        'srand.argtypes = [c_uint]'
+        ),
+    'rand_r': (None, (),
+        "rand_r = _libraries['/usr/lib/libavcodec.so'].rand_r\n"
+        'rand_r.restype = c_int\n'
+        'rand_r.argtypes = [POINTER(c_uint)]'
+        ),
+    'drand48': (None, (),
+        "drand48 = _libraries['/usr/lib/libavcodec.so'].drand48\n"
+        'drand48.restype = c_double\n'
+        'drand48.argtypes = []'
+        ),
+    'erand48': (None, (),
+        "erand48 = _libraries['/usr/lib/libavcodec.so'].erand48\n"
+        'erand48.restype = c_double\n'
+        'erand48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'lrand48': (None, (),
+        "lrand48 = _libraries['/usr/lib/libavcodec.so'].lrand48\n"
+        'lrand48.restype = c_long\n'
+        'lrand48.argtypes = []'
+        ),
+    'nrand48': (None, (),
+        "nrand48 = _libraries['/usr/lib/libavcodec.so'].nrand48\n"
+        'nrand48.restype = c_long\n'
+        'nrand48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'mrand48': (None, (),
+        "mrand48 = _libraries['/usr/lib/libavcodec.so'].mrand48\n"
+        'mrand48.restype = c_long\n'
+        'mrand48.argtypes = []'
+        ),
+    'jrand48': (None, (),
+        "jrand48 = _libraries['/usr/lib/libavcodec.so'].jrand48\n"
+        'jrand48.restype = c_long\n'
+        'jrand48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'srand48': (None, (),
+        "srand48 = _libraries['/usr/lib/libavcodec.so'].srand48\n"
+        'srand48.restype = None\n'
+        'srand48.argtypes = [c_long]'
+        ),
+    'seed48': (None, (),
+        "seed48 = _libraries['/usr/lib/libavcodec.so'].seed48\n"
+        'seed48.restype = POINTER(c_ushort)\n'
+        'seed48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'lcong48': (None, (),
+        "lcong48 = _libraries['/usr/lib/libavcodec.so'].lcong48\n"
+        'lcong48.restype = None\n'
+        'lcong48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'drand48_data': ('Structure', (),
+        'drand48_data._fields_ = [\n'
+        "    ('__x', c_ushort * 3),\n"
+        "    ('__old_x', c_ushort * 3),\n"
+        "    ('__c', c_ushort),\n"
+        "    ('__init', c_ushort),\n"
+        "    ('__a', c_ulonglong),\n"
+        ']'
+        ),
+    'drand48_r': (None, ('drand48_data',),
+        "drand48_r = _libraries['/usr/lib/libavcodec.so'].drand48_r\n"
+        'drand48_r.restype = c_int\n'
+        'drand48_r.argtypes = [POINTER(drand48_data), POINTER(c_double)]'
+        ),
+    'erand48_r': (None, ('drand48_data',),
+        "erand48_r = _libraries['/usr/lib/libavcodec.so'].erand48_r\n"
+        'erand48_r.restype = c_int\n'
+        'erand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_double)]'
+        ),
+    'lrand48_r': (None, ('drand48_data',),
+        "lrand48_r = _libraries['/usr/lib/libavcodec.so'].lrand48_r\n"
+        'lrand48_r.restype = c_int\n'
+        'lrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'nrand48_r': (None, ('drand48_data',),
+        "nrand48_r = _libraries['/usr/lib/libavcodec.so'].nrand48_r\n"
+        'nrand48_r.restype = c_int\n'
+        'nrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'mrand48_r': (None, ('drand48_data',),
+        "mrand48_r = _libraries['/usr/lib/libavcodec.so'].mrand48_r\n"
+        'mrand48_r.restype = c_int\n'
+        'mrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'jrand48_r': (None, ('drand48_data',),
+        "jrand48_r = _libraries['/usr/lib/libavcodec.so'].jrand48_r\n"
+        'jrand48_r.restype = c_int\n'
+        'jrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'srand48_r': (None, ('drand48_data',),
+        "srand48_r = _libraries['/usr/lib/libavcodec.so'].srand48_r\n"
+        'srand48_r.restype = c_int\n'
+        'srand48_r.argtypes = [c_long, POINTER(drand48_data)]'
+        ),
+    'seed48_r': (None, ('drand48_data',),
+        "seed48_r = _libraries['/usr/lib/libavcodec.so'].seed48_r\n"
+        'seed48_r.restype = c_int\n'
+        'seed48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]'
+        ),
+    'lcong48_r': (None, ('drand48_data',),
+        "lcong48_r = _libraries['/usr/lib/libavcodec.so'].lcong48_r\n"
+        'lcong48_r.restype = c_int\n'
+        'lcong48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]'
+        ),
+    'malloc': (None, (),
+        "malloc = _libraries['/usr/lib/libavcodec.so'].malloc\n"
+        'malloc.restype = c_void_p\n'
+        'malloc.argtypes = [size_t]'
+        ),
+    'calloc': (None, (),
+        "calloc = _libraries['/usr/lib/libavcodec.so'].calloc\n"
+        'calloc.restype = c_void_p\n'
+        'calloc.argtypes = [size_t, size_t]'
+        ),
+    'realloc': (None, (),
+        "realloc = _libraries['/usr/lib/libavcodec.so'].realloc\n"
+        'realloc.restype = c_void_p\n'
+        'realloc.argtypes = [c_void_p, size_t]'
+        ),
+    'free': (None, (),
+        "free = _libraries['/usr/lib/libavcodec.so'].free\n"
+        'free.restype = None\n'
+        'free.argtypes = [c_void_p]'
+        ),
+    'cfree': (None, (),
+        "cfree = _libraries['/usr/lib/libavcodec.so'].cfree\n"
+        'cfree.restype = None\n'
+        'cfree.argtypes = [c_void_p]'
+        ),
+    'valloc': (None, (),
+        "valloc = _libraries['/usr/lib/libavcodec.so'].valloc\n"
+        'valloc.restype = c_void_p\n'
+        'valloc.argtypes = [size_t]'
+        ),
+    'posix_memalign': (None, (),
+        "posix_memalign = _libraries['/usr/lib/libavcodec.so'].posix_memalign\n"
+        'posix_memalign.restype = c_int\n'
+        'posix_memalign.argtypes = [POINTER(c_void_p), size_t, size_t]'
+        ),
+    'aligned_alloc': (None, (),
+        "aligned_alloc = _libraries['/usr/lib/libavcodec.so'].aligned_alloc\n"
+        'aligned_alloc.restype = c_void_p\n'
+        'aligned_alloc.argtypes = [size_t, size_t]'
+        ),
+    'abort': (None, (),
+        "abort = _libraries['/usr/lib/libavcodec.so'].abort\n"
+        'abort.restype = None\n'
+        'abort.argtypes = []'
+        ),
+    'on_exit': (None, (),
+        "on_exit = _libraries['/usr/lib/libavcodec.so'].on_exit\n"
+        'on_exit.restype = c_int\n'
+        'on_exit.argtypes = [CFUNCTYPE(None, c_int, c_void_p), c_void_p]'
+        ),
+    'exit': (None, (),
+        "exit = _libraries['/usr/lib/libavcodec.so'].exit\n"
+        'exit.restype = None\n'
+        'exit.argtypes = [c_int]'
+        ),
+    'quick_exit': (None, (),
+        "quick_exit = _libraries['/usr/lib/libavcodec.so'].quick_exit\n"
+        'quick_exit.restype = None\n'
+        'quick_exit.argtypes = [c_int]'
+        ),
+    '_Exit': (None, (),
+        "_Exit = _libraries['/usr/lib/libavcodec.so']._Exit\n"
+        '_Exit.restype = None\n'
+        '_Exit.argtypes = [c_int]'
+        ),
+    'getenv': (None, (),
+        "getenv = _libraries['/usr/lib/libavcodec.so'].getenv\n"
+        'getenv.restype = STRING\n'
+        'getenv.argtypes = [STRING]'
+        ),
+    'secure_getenv': (None, (),
+        "secure_getenv = _libraries['/usr/lib/libavcodec.so'].secure_getenv\n"
+        'secure_getenv.restype = STRING\n'
+        'secure_getenv.argtypes = [STRING]'
+        ),
+    'putenv': (None, (),
+        "putenv = _libraries['/usr/lib/libavcodec.so'].putenv\n"
+        'putenv.restype = c_int\n'
+        'putenv.argtypes = [STRING]'
+        ),
+    'setenv': (None, (),
+        "setenv = _libraries['/usr/lib/libavcodec.so'].setenv\n"
+        'setenv.restype = c_int\n'
+        'setenv.argtypes = [STRING, STRING, c_int]'
+        ),
+    'unsetenv': (None, (),
+        "unsetenv = _libraries['/usr/lib/libavcodec.so'].unsetenv\n"
+        'unsetenv.restype = c_int\n'
+        'unsetenv.argtypes = [STRING]'
+        ),
+    'clearenv': (None, (),
+        "clearenv = _libraries['/usr/lib/libavcodec.so'].clearenv\n"
+        'clearenv.restype = c_int\n'
+        'clearenv.argtypes = []'
+        ),
+    'mktemp': (None, (),
+        "mktemp = _libraries['/usr/lib/libavcodec.so'].mktemp\n"
+        'mktemp.restype = STRING\n'
+        'mktemp.argtypes = [STRING]'
+        ),
+    'mkstemp': (None, (),
+        "mkstemp = _libraries['/usr/lib/libavcodec.so'].mkstemp\n"
+        'mkstemp.restype = c_int\n'
+        'mkstemp.argtypes = [STRING]'
+        ),
+    'mkstemp64': (None, (),
+        "mkstemp64 = _libraries['/usr/lib/libavcodec.so'].mkstemp64\n"
+        'mkstemp64.restype = c_int\n'
+        'mkstemp64.argtypes = [STRING]'
+        ),
+    'mkstemps': (None, (),
+        "mkstemps = _libraries['/usr/lib/libavcodec.so'].mkstemps\n"
+        'mkstemps.restype = c_int\n'
+        'mkstemps.argtypes = [STRING, c_int]'
+        ),
+    'mkstemps64': (None, (),
+        "mkstemps64 = _libraries['/usr/lib/libavcodec.so'].mkstemps64\n"
+        'mkstemps64.restype = c_int\n'
+        'mkstemps64.argtypes = [STRING, c_int]'
+        ),
+    'mkdtemp': (None, (),
+        "mkdtemp = _libraries['/usr/lib/libavcodec.so'].mkdtemp\n"
+        'mkdtemp.restype = STRING\n'
+        'mkdtemp.argtypes = [STRING]'
+        ),
+    'mkostemp': (None, (),
+        "mkostemp = _libraries['/usr/lib/libavcodec.so'].mkostemp\n"
+        'mkostemp.restype = c_int\n'
+        'mkostemp.argtypes = [STRING, c_int]'
+        ),
+    'mkostemp64': (None, (),
+        "mkostemp64 = _libraries['/usr/lib/libavcodec.so'].mkostemp64\n"
+        'mkostemp64.restype = c_int\n'
+        'mkostemp64.argtypes = [STRING, c_int]'
+        ),
+    'mkostemps': (None, (),
+        "mkostemps = _libraries['/usr/lib/libavcodec.so'].mkostemps\n"
+        'mkostemps.restype = c_int\n'
+        'mkostemps.argtypes = [STRING, c_int, c_int]'
+        ),
+    'mkostemps64': (None, (),
+        "mkostemps64 = _libraries['/usr/lib/libavcodec.so'].mkostemps64\n"
+        'mkostemps64.restype = c_int\n'
+        'mkostemps64.argtypes = [STRING, c_int, c_int]'
+        ),
+    'system': (None, (),
+        "system = _libraries['/usr/lib/libavcodec.so'].system\n"
+        'system.restype = c_int\n'
+        'system.argtypes = [STRING]'
+        ),
+    'canonicalize_file_name': (None, (),
+        "canonicalize_file_name = _libraries['/usr/lib/libavcodec.so'].canonicalize_file_name\n"
+        'canonicalize_file_name.restype = STRING\n'
+        'canonicalize_file_name.argtypes = [STRING]'
+        ),
+    'bsearch': (None, (),
+        "bsearch = _libraries['/usr/lib/libavcodec.so'].bsearch\n"
+        'bsearch.restype = c_void_p\n'
+        'bsearch.argtypes = [c_void_p, c_void_p, size_t, size_t, __compar_fn_t]'
+        ),
+    'qsort': (None, (),
+        "qsort = _libraries['/usr/lib/libavcodec.so'].qsort\n"
+        'qsort.restype = None\n'
+        'qsort.argtypes = [c_void_p, size_t, size_t, __compar_fn_t]'
+        ),
+    'qsort_r': (None, (),
+        "qsort_r = _libraries['/usr/lib/libavcodec.so'].qsort_r\n"
+        'qsort_r.restype = None\n'
+        'qsort_r.argtypes = [c_void_p, size_t, size_t, __compar_d_fn_t, c_void_p]'
+        ),
+    'abs': (None, (),
+        "abs = _libraries['/usr/lib/libavcodec.so'].abs\n"
+        'abs.restype = c_int\n'
+        'abs.argtypes = [c_int]'
+        ),
+    'labs': (None, (),
+        "labs = _libraries['/usr/lib/libavcodec.so'].labs\n"
+        'labs.restype = c_long\n'
+        'labs.argtypes = [c_long]'
+        ),
+    'llabs': (None, (),
+        "llabs = _libraries['/usr/lib/libavcodec.so'].llabs\n"
+        'llabs.restype = c_longlong\n'
+        'llabs.argtypes = [c_longlong]'
+        ),
+    'div': (None, ('div_t',),
+        "div = _libraries['/usr/lib/libavcodec.so'].div\n"
+        'div.restype = div_t\n'
+        'div.argtypes = [c_int, c_int]'
+        ),
+    'ldiv': (None, ('ldiv_t',),
+        "ldiv = _libraries['/usr/lib/libavcodec.so'].ldiv\n"
+        'ldiv.restype = ldiv_t\n'
+        'ldiv.argtypes = [c_long, c_long]'
+        ),
+    'lldiv': (None, ('lldiv_t',),
+        "lldiv = _libraries['/usr/lib/libavcodec.so'].lldiv\n"
+        'lldiv.restype = lldiv_t\n'
+        'lldiv.argtypes = [c_longlong, c_longlong]'
+        ),
+    'ecvt': (None, (),
+        "ecvt = _libraries['/usr/lib/libavcodec.so'].ecvt\n"
+        'ecvt.restype = STRING\n'
+        'ecvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'fcvt': (None, (),
+        "fcvt = _libraries['/usr/lib/libavcodec.so'].fcvt\n"
+        'fcvt.restype = STRING\n'
+        'fcvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'gcvt': (None, (),
+        "gcvt = _libraries['/usr/lib/libavcodec.so'].gcvt\n"
+        'gcvt.restype = STRING\n'
+        'gcvt.argtypes = [c_double, c_int, STRING]'
+        ),
+    'qecvt': (None, (),
+        "qecvt = _libraries['/usr/lib/libavcodec.so'].qecvt\n"
+        'qecvt.restype = STRING\n'
+        'qecvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'qfcvt': (None, (),
+        "qfcvt = _libraries['/usr/lib/libavcodec.so'].qfcvt\n"
+        'qfcvt.restype = STRING\n'
+        'qfcvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'qgcvt': (None, (),
+        "qgcvt = _libraries['/usr/lib/libavcodec.so'].qgcvt\n"
+        'qgcvt.restype = STRING\n'
+        'qgcvt.argtypes = [c_longdouble, c_int, STRING]'
+        ),
+    'ecvt_r': (None, (),
+        "ecvt_r = _libraries['/usr/lib/libavcodec.so'].ecvt_r\n"
+        'ecvt_r.restype = c_int\n'
+        'ecvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'fcvt_r': (None, (),
+        "fcvt_r = _libraries['/usr/lib/libavcodec.so'].fcvt_r\n"
+        'fcvt_r.restype = c_int\n'
+        'fcvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'qecvt_r': (None, (),
+        "qecvt_r = _libraries['/usr/lib/libavcodec.so'].qecvt_r\n"
+        'qecvt_r.restype = c_int\n'
+        'qecvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'qfcvt_r': (None, (),
+        "qfcvt_r = _libraries['/usr/lib/libavcodec.so'].qfcvt_r\n"
+        'qfcvt_r.restype = c_int\n'
+        'qfcvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'mblen': (None, (),
+        "mblen = _libraries['/usr/lib/libavcodec.so'].mblen\n"
+        'mblen.restype = c_int\n'
+        'mblen.argtypes = [STRING, size_t]'
+        ),
+    'mbtowc': (None, (),
+        "mbtowc = _libraries['/usr/lib/libavcodec.so'].mbtowc\n"
+        'mbtowc.restype = c_int\n'
+        'mbtowc.argtypes = [WSTRING, STRING, size_t]'
+        ),
+    'rpmatch': (None, (),
+        "rpmatch = _libraries['/usr/lib/libavcodec.so'].rpmatch\n"
+        'rpmatch.restype = c_int\n'
+        'rpmatch.argtypes = [STRING]'
+        ),
+    'getsubopt': (None, (),
+        "getsubopt = _libraries['/usr/lib/libavcodec.so'].getsubopt\n"
+        'getsubopt.restype = c_int\n'
+        'getsubopt.argtypes = [POINTER(STRING), POINTER(STRING), POINTER(STRING)]'
+        ),
+    'posix_openpt': (None, (),
+        "posix_openpt = _libraries['/usr/lib/libavcodec.so'].posix_openpt\n"
+        'posix_openpt.restype = c_int\n'
+        'posix_openpt.argtypes = [c_int]'
+        ),
+    'grantpt': (None, (),
+        "grantpt = _libraries['/usr/lib/libavcodec.so'].grantpt\n"
+        'grantpt.restype = c_int\n'
+        'grantpt.argtypes = [c_int]'
+        ),
+    'unlockpt': (None, (),
+        "unlockpt = _libraries['/usr/lib/libavcodec.so'].unlockpt\n"
+        'unlockpt.restype = c_int\n'
+        'unlockpt.argtypes = [c_int]'
+        ),
+    'ptsname': (None, (),
+        "ptsname = _libraries['/usr/lib/libavcodec.so'].ptsname\n"
+        'ptsname.restype = STRING\n'
+        'ptsname.argtypes = [c_int]'
+        ),
+    'getpt': (None, (),
+        "getpt = _libraries['/usr/lib/libavcodec.so'].getpt\n"
+        'getpt.restype = c_int\n'
+        'getpt.argtypes = []'
+        ),
+    'getloadavg': (None, (),
+        "getloadavg = _libraries['/usr/lib/libavcodec.so'].getloadavg\n"
+        'getloadavg.restype = c_int\n'
+        'getloadavg.argtypes = [POINTER(c_double), c_int]'
+        ),
+    'memccpy': (None, (),
+        "memccpy = _libraries['/usr/lib/libavcodec.so'].memccpy\n"
+        'memccpy.restype = c_void_p\n'
+        'memccpy.argtypes = [c_void_p, c_void_p, c_int, size_t]'
+        ),
+    'memcmp': (None, (),
+        "memcmp = _libraries['/usr/lib/libavcodec.so'].memcmp\n"
+        'memcmp.restype = c_int\n'
+        'memcmp.argtypes = [c_void_p, c_void_p, size_t]'
+        ),
+    'memchr': (None, (),
+        "memchr = _libraries['/usr/lib/libavcodec.so'].memchr\n"
+        'memchr.restype = c_void_p\n'
+        'memchr.argtypes = [c_void_p, c_int, size_t]\n'
+        "memchr = _libraries['/usr/lib/libavcodec.so'].memchr\n"
+        'memchr.restype = c_void_p\n'
+        'memchr.argtypes = [c_void_p, c_int, size_t]'
+        ),
+    'rawmemchr': (None, (),
+        "rawmemchr = _libraries['/usr/lib/libavcodec.so'].rawmemchr\n"
+        'rawmemchr.restype = c_void_p\n'
+        'rawmemchr.argtypes = [c_void_p, c_int]\n'
+        "rawmemchr = _libraries['/usr/lib/libavcodec.so'].rawmemchr\n"
+        'rawmemchr.restype = c_void_p\n'
+        'rawmemchr.argtypes = [c_void_p, c_int]'
+        ),
+    'memrchr': (None, (),
+        "memrchr = _libraries['/usr/lib/libavcodec.so'].memrchr\n"
+        'memrchr.restype = c_void_p\n'
+        'memrchr.argtypes = [c_void_p, c_int, size_t]\n'
+        "memrchr = _libraries['/usr/lib/libavcodec.so'].memrchr\n"
+        'memrchr.restype = c_void_p\n'
+        'memrchr.argtypes = [c_void_p, c_int, size_t]'
+        ),
+    'strcmp': (None, (),
+        "strcmp = _libraries['/usr/lib/libavcodec.so'].strcmp\n"
+        'strcmp.restype = c_int\n'
+        'strcmp.argtypes = [STRING, STRING]'
+        ),
+    'strncmp': (None, (),
+        "strncmp = _libraries['/usr/lib/libavcodec.so'].strncmp\n"
+        'strncmp.restype = c_int\n'
+        'strncmp.argtypes = [STRING, STRING, size_t]'
+        ),
+    'strcoll': (None, (),
+        "strcoll = _libraries['/usr/lib/libavcodec.so'].strcoll\n"
+        'strcoll.restype = c_int\n'
+        'strcoll.argtypes = [STRING, STRING]'
+        ),
+    'strxfrm': (None, (),
+        "strxfrm = _libraries['/usr/lib/libavcodec.so'].strxfrm\n"
+        'strxfrm.restype = size_t\n'
+        'strxfrm.argtypes = [STRING, STRING, size_t]'
+        ),
+    'strcoll_l': (None, ('__locale_t',),
+        "strcoll_l = _libraries['/usr/lib/libavcodec.so'].strcoll_l\n"
+        'strcoll_l.restype = c_int\n'
+        'strcoll_l.argtypes = [STRING, STRING, __locale_t]'
+        ),
+    'strxfrm_l': (None, ('__locale_t',),
+        "strxfrm_l = _libraries['/usr/lib/libavcodec.so'].strxfrm_l\n"
+        'strxfrm_l.restype = size_t\n'
+        'strxfrm_l.argtypes = [STRING, STRING, size_t, __locale_t]'
+        ),
+    'strdup': (None, (),
+        "strdup = _libraries['/usr/lib/libavcodec.so'].strdup\n"
+        'strdup.restype = STRING\n'
+        'strdup.argtypes = [STRING]'
+        ),
+    'strndup': (None, (),
+        "strndup = _libraries['/usr/lib/libavcodec.so'].strndup\n"
+        'strndup.restype = STRING\n'
+        'strndup.argtypes = [STRING, size_t]'
+        ),
+    'strchr': (None, (),
+        "strchr = _libraries['/usr/lib/libavcodec.so'].strchr\n"
+        'strchr.restype = STRING\n'
+        'strchr.argtypes = [STRING, c_int]\n'
+        "strchr = _libraries['/usr/lib/libavcodec.so'].strchr\n"
+        'strchr.restype = STRING\n'
+        'strchr.argtypes = [STRING, c_int]'
+        ),
+    'strrchr': (None, (),
+        "strrchr = _libraries['/usr/lib/libavcodec.so'].strrchr\n"
+        'strrchr.restype = STRING\n'
+        'strrchr.argtypes = [STRING, c_int]\n'
+        "strrchr = _libraries['/usr/lib/libavcodec.so'].strrchr\n"
+        'strrchr.restype = STRING\n'
+        'strrchr.argtypes = [STRING, c_int]'
+        ),
+    'strchrnul': (None, (),
+        "strchrnul = _libraries['/usr/lib/libavcodec.so'].strchrnul\n"
+        'strchrnul.restype = STRING\n'
+        'strchrnul.argtypes = [STRING, c_int]\n'
+        "strchrnul = _libraries['/usr/lib/libavcodec.so'].strchrnul\n"
+        'strchrnul.restype = STRING\n'
+        'strchrnul.argtypes = [STRING, c_int]'
+        ),
+    'strcspn': (None, (),
+        "strcspn = _libraries['/usr/lib/libavcodec.so'].strcspn\n"
+        'strcspn.restype = size_t\n'
+        'strcspn.argtypes = [STRING, STRING]'
+        ),
+    'strspn': (None, (),
+        "strspn = _libraries['/usr/lib/libavcodec.so'].strspn\n"
+        'strspn.restype = size_t\n'
+        'strspn.argtypes = [STRING, STRING]'
+        ),
+    'strpbrk': (None, (),
+        "strpbrk = _libraries['/usr/lib/libavcodec.so'].strpbrk\n"
+        'strpbrk.restype = STRING\n'
+        'strpbrk.argtypes = [STRING, STRING]\n'
+        "strpbrk = _libraries['/usr/lib/libavcodec.so'].strpbrk\n"
+        'strpbrk.restype = STRING\n'
+        'strpbrk.argtypes = [STRING, STRING]'
+        ),
+    'strstr': (None, (),
+        "strstr = _libraries['/usr/lib/libavcodec.so'].strstr\n"
+        'strstr.restype = STRING\n'
+        'strstr.argtypes = [STRING, STRING]\n'
+        "strstr = _libraries['/usr/lib/libavcodec.so'].strstr\n"
+        'strstr.restype = STRING\n'
+        'strstr.argtypes = [STRING, STRING]'
+        ),
+    'strtok': (None, (),
+        "strtok = _libraries['/usr/lib/libavcodec.so'].strtok\n"
+        'strtok.restype = STRING\n'
+        'strtok.argtypes = [STRING, STRING]'
+        ),
+    '__strtok_r': (None, (),
+        "__strtok_r = _libraries['/usr/lib/libavcodec.so'].__strtok_r\n"
+        '__strtok_r.restype = STRING\n'
+        '__strtok_r.argtypes = [STRING, STRING, POINTER(STRING)]'
+        ),
+    'strtok_r': (None, (),
+        "strtok_r = _libraries['/usr/lib/libavcodec.so'].strtok_r\n"
+        'strtok_r.restype = STRING\n'
+        'strtok_r.argtypes = [STRING, STRING, POINTER(STRING)]'
+        ),
+    'strcasestr': (None, (),
+        "strcasestr = _libraries['/usr/lib/libavcodec.so'].strcasestr\n"
+        'strcasestr.restype = STRING\n'
+        'strcasestr.argtypes = [STRING, STRING]\n'
+        "strcasestr = _libraries['/usr/lib/libavcodec.so'].strcasestr\n"
+        'strcasestr.restype = STRING\n'
+        'strcasestr.argtypes = [STRING, STRING]'
+        ),
+    'memmem': (None, (),
+        "memmem = _libraries['/usr/lib/libavcodec.so'].memmem\n"
+        'memmem.restype = c_void_p\n'
+        'memmem.argtypes = [c_void_p, size_t, c_void_p, size_t]'
+        ),
+    '__mempcpy': (None, (),
+        "__mempcpy = _libraries['/usr/lib/libavcodec.so'].__mempcpy\n"
+        '__mempcpy.restype = c_void_p\n'
+        '__mempcpy.argtypes = [c_void_p, c_void_p, size_t]'
+        ),
+    'strlen': (None, (),
+        "strlen = _libraries['/usr/lib/libavcodec.so'].strlen\n"
+        'strlen.restype = size_t\n'
+        'strlen.argtypes = [STRING]'
+        ),
+    'strnlen': (None, (),
+        "strnlen = _libraries['/usr/lib/libavcodec.so'].strnlen\n"
+        'strnlen.restype = size_t\n'
+        'strnlen.argtypes = [STRING, size_t]'
+        ),
+    'strerror': (None, (),
+        "strerror = _libraries['/usr/lib/libavcodec.so'].strerror\n"
+        'strerror.restype = STRING\n'
+        'strerror.argtypes = [c_int]'
+        ),
+    'strerror_r': (None, (),
+        "strerror_r = _libraries['/usr/lib/libavcodec.so'].strerror_r\n"
+        'strerror_r.restype = STRING\n'
+        'strerror_r.argtypes = [c_int, STRING, size_t]'
+        ),
+    'strerror_l': (None, ('__locale_t',),
+        "strerror_l = _libraries['/usr/lib/libavcodec.so'].strerror_l\n"
+        'strerror_l.restype = STRING\n'
+        'strerror_l.argtypes = [c_int, __locale_t]'
+        ),
+    '__bzero': (None, (),
+        "__bzero = _libraries['/usr/lib/libavcodec.so'].__bzero\n"
+        '__bzero.restype = None\n'
+        '__bzero.argtypes = [c_void_p, size_t]'
+        ),
+    'bcmp': (None, (),
+        "bcmp = _libraries['/usr/lib/libavcodec.so'].bcmp\n"
+        'bcmp.restype = c_int\n'
+        'bcmp.argtypes = [c_void_p, c_void_p, size_t]'
+        ),
+    'index': (None, (),
+        "index = _libraries['/usr/lib/libavcodec.so'].index\n"
+        'index.restype = STRING\n'
+        'index.argtypes = [STRING, c_int]\n'
+        "index = _libraries['/usr/lib/libavcodec.so'].index\n"
+        'index.restype = STRING\n'
+        'index.argtypes = [STRING, c_int]'
+        ),
+    'rindex': (None, (),
+        "rindex = _libraries['/usr/lib/libavcodec.so'].rindex\n"
+        'rindex.restype = STRING\n'
+        'rindex.argtypes = [STRING, c_int]\n'
+        "rindex = _libraries['/usr/lib/libavcodec.so'].rindex\n"
+        'rindex.restype = STRING\n'
+        'rindex.argtypes = [STRING, c_int]'
+        ),
+    'ffs': (None, (),
+        "ffs = _libraries['/usr/lib/libavcodec.so'].ffs\n"
+        'ffs.restype = c_int\n'
+        'ffs.argtypes = [c_int]'
+        ),
+    'ffsl': (None, (),
+        "ffsl = _libraries['/usr/lib/libavcodec.so'].ffsl\n"
+        'ffsl.restype = c_int\n'
+        'ffsl.argtypes = [c_long]'
+        ),
+    'ffsll': (None, (),
+        "ffsll = _libraries['/usr/lib/libavcodec.so'].ffsll\n"
+        'ffsll.restype = c_int\n'
+        'ffsll.argtypes = [c_longlong]'
+        ),
+    'strcasecmp': (None, (),
+        "strcasecmp = _libraries['/usr/lib/libavcodec.so'].strcasecmp\n"
+        'strcasecmp.restype = c_int\n'
+        'strcasecmp.argtypes = [STRING, STRING]'
+        ),
+    'strncasecmp': (None, (),
+        "strncasecmp = _libraries['/usr/lib/libavcodec.so'].strncasecmp\n"
+        'strncasecmp.restype = c_int\n'
+        'strncasecmp.argtypes = [STRING, STRING, size_t]'
+        ),
+    'strcasecmp_l': (None, ('__locale_t',),
+        "strcasecmp_l = _libraries['/usr/lib/libavcodec.so'].strcasecmp_l\n"
+        'strcasecmp_l.restype = c_int\n'
+        'strcasecmp_l.argtypes = [STRING, STRING, __locale_t]'
+        ),
+    'strncasecmp_l': (None, ('__locale_t',),
+        "strncasecmp_l = _libraries['/usr/lib/libavcodec.so'].strncasecmp_l\n"
+        'strncasecmp_l.restype = c_int\n'
+        'strncasecmp_l.argtypes = [STRING, STRING, size_t, __locale_t]'
+        ),
+    'strsep': (None, (),
+        "strsep = _libraries['/usr/lib/libavcodec.so'].strsep\n"
+        'strsep.restype = STRING\n'
+        'strsep.argtypes = [POINTER(STRING), STRING]'
+        ),
+    'strsignal': (None, (),
+        "strsignal = _libraries['/usr/lib/libavcodec.so'].strsignal\n"
+        'strsignal.restype = STRING\n'
+        'strsignal.argtypes = [c_int]'
+        ),
+    '__stpcpy': (None, (),
+        "__stpcpy = _libraries['/usr/lib/libavcodec.so'].__stpcpy\n"
+        '__stpcpy.restype = STRING\n'
+        '__stpcpy.argtypes = [STRING, STRING]'
+        ),
+    '__stpncpy': (None, (),
+        "__stpncpy = _libraries['/usr/lib/libavcodec.so'].__stpncpy\n"
+        '__stpncpy.restype = STRING\n'
+        '__stpncpy.argtypes = [STRING, STRING, size_t]'
+        ),
+    'strverscmp': (None, (),
+        "strverscmp = _libraries['/usr/lib/libavcodec.so'].strverscmp\n"
+        'strverscmp.restype = c_int\n'
+        'strverscmp.argtypes = [STRING, STRING]'
+        ),
+    'strfry': (None, (),
+        "strfry = _libraries['/usr/lib/libavcodec.so'].strfry\n"
+        'strfry.restype = STRING\n'
+        'strfry.argtypes = [STRING]'
+        ),
+    'memfrob': (None, (),
+        "memfrob = _libraries['/usr/lib/libavcodec.so'].memfrob\n"
+        'memfrob.restype = c_void_p\n'
+        'memfrob.argtypes = [c_void_p, size_t]'
+        ),
+    'basename': (None, (),
+        "basename = _libraries['/usr/lib/libavcodec.so'].basename\n"
+        'basename.restype = STRING\n'
+        'basename.argtypes = [STRING]\n'
+        "basename = _libraries['/usr/lib/libavcodec.so'].basename\n"
+        'basename.restype = STRING\n'
+        'basename.argtypes = [STRING]'
+        ),
+    'sigset_t': (None, ('__sigset_t',),
+        'sigset_t = __sigset_t'
+        ),
+    'fd_set': ('Structure', (),
+        'fd_set._fields_ = [\n'
+        "    ('fds_bits', __fd_mask * 16),\n"
+        ']'
+        ),
+    'select': (None, ('fd_set', 'timeval'),
+        "select = _libraries['/usr/lib/libavcodec.so'].select\n"
+        'select.restype = c_int\n'
+        'select.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timeval)]'
+        ),
+    'timespec': ('Structure', (),
+        'timespec._fields_ = [\n'
+        ']'
+        ),
+    'pselect': (None, ('__sigset_t', 'fd_set', 'timespec'),
+        "pselect = _libraries['/usr/lib/libavcodec.so'].pselect\n"
+        'pselect.restype = c_int\n'
+        'pselect.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timespec), POINTER(__sigset_t)]'
+        ),
+    'gnu_dev_major': (None, (),
+        "gnu_dev_major = _libraries['/usr/lib/libavcodec.so'].gnu_dev_major\n"
+        'gnu_dev_major.restype = c_uint\n'
+        'gnu_dev_major.argtypes = [c_ulonglong]'
+        ),
+    'gnu_dev_minor': (None, (),
+        "gnu_dev_minor = _libraries['/usr/lib/libavcodec.so'].gnu_dev_minor\n"
+        'gnu_dev_minor.restype = c_uint\n'
+        'gnu_dev_minor.argtypes = [c_ulonglong]'
+        ),
+    'gnu_dev_makedev': (None, (),
+        "gnu_dev_makedev = _libraries['/usr/lib/libavcodec.so'].gnu_dev_makedev\n"
+        'gnu_dev_makedev.restype = c_ulonglong\n'
+        'gnu_dev_makedev.argtypes = [c_uint, c_uint]'
+        ),
+    'fsid_t': (None, ('__fsid_t',),
+        'fsid_t = __fsid_t'
+        ),
+    '__locale_data': ('Structure', (),
+        '__locale_data._fields_ = [\n'
+        ']'
+        ),
+    'locale_t': (None, ('__locale_t',),
+        'locale_t = __locale_t'
+        ),
+}
+
+_bind_lazily(__name__, _definitions)
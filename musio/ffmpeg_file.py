@@ -25,12 +25,17 @@
 
 from .io_base import AudioIO, io_wrapper
 from .io_util import msg_out
+from .buffer_util import RingBuffer
 # from .ffmpeg import _av
 
 from .import_util import LazyImport
 
 _av = LazyImport('ffmpeg.av', globals(), locals(), ['av'], 1)
 
+# The channel of each bit of an FFmpeg channel layout.
+_CHANNEL_NAMES = ('FL', 'FR', 'FC', 'LFE', 'BL', 'BR', 'FLC', 'FRC', 'BC',
+                  'SL', 'SR')
+
 __supported_dict = {
     'ext': ['.webm', '.flv', '.iflv', '.wma', '.wmv', '.avi', '.mpg', '.m4a'],
     'protocol': ['http'],
@@ -50,14 +55,18 @@ class FFmpegFile(AudioIO):
     # Only reading is supported
     _supported_modes = 'r'
 
-    def __init__(self, filename, depth=16, rate=44100, channels=2, **kwargs):
-        """ FFmpegFile(filename, depth=16, rate=44100, channels=2) ->
-        Initialize the playback settings of the player.
+    def __init__(self, filename, depth=16, rate=44100, channels=2,
+                 floatp=False, **kwargs):
+        """ FFmpegFile(filename, depth=16, rate=44100, channels=2,
+        floatp=False) -> Initialize the playback settings of the player.  If
+        floatp is True the audio is converted to packed 32-bit floats.
 
         """
 
         super(FFmpegFile, self).__init__(filename, 'r', depth, rate, channels)
 
+        self._floatp = floatp
+
         self.__network_stream = False
 
         self.__codec_context = None
@@ -65,12 +74,23 @@ class FFmpegFile(AudioIO):
 
         self.__format_context = self._open(filename)
 
-        # The length of the file is in av time base units.  To get the actual
-        # time devide it by 1000, but we use this to seek.
-        self._length = self.__format_context.contents.duration
+        # The duration is in av time base units, so convert it to frames.
+        duration = self.__format_context.contents.duration
+        self._length = max(0, duration) * self._rate // _av.AV_TIME_BASE
 
-        self._data = b''
+        self._data = RingBuffer()
+
+        # The frame to seek to before the next read, and whether to decode
+        # and drop everything before it or start at the keyframe before it.
         self._seek_pos = -1
+        self._seek_exact = True
+
+        # The frame after the last one decoded, whether it is still the
+        # frame seeked to until the first frame decoded after the seek
+        # gives its timestamp, and the frame decoded data is dropped up to.
+        self._decoded_end = 0
+        self._timestamp_pending = False
+        self._discard_to = -1
 
     def _check(self, err):
         """ Check if there was an error and print the result.
@@ -84,26 +104,85 @@ class FFmpegFile(AudioIO):
 
         return err
 
+    def to_seconds(self, position):
+        """ Convert the provided position/length to seconds.
+
+        """
+
+        return position / self._rate
+
     def _set_position(self, position):
-        """ Change the position of playback.
+        """ Change the position of playback to exactly frame position.
 
         """
 
         # We have to seek when the stream is ready not now.
-        self._seek_pos = position
+        self._seek_pos = max(0, position)
+        self._seek_exact = True
+
+    def _set_position_fast(self, position):
+        """ Change the position of playback to the keyframe at or before
+        frame position.
+
+        """
+
+        self._seek_pos = max(0, position)
+        self._seek_exact = False
 
     def _get_position(self):
-        """ Updates the position variable.
+        """ Returns the frame that will be read next.
+
+        """
+
+        if self._seek_pos > -1:
+            return self._seek_pos
+
+        return self._decoded_end - len(self._data) // self._frame_size
+
+    def _seek(self, position, exact):
+        """ _seek(position, exact) -> Seek the audio stream to the keyframe
+        at or before frame position, and if exact drop what is decoded
+        before it.
+
+        """
+
+        stream = self.__format_context.contents.streams[self.__audio_stream]
+        time_base = stream.contents.time_base
+
+        # Convert the frame to a timestamp in the stream time base.
+        timestamp = _av.av_rescale(position, time_base.den,
+                                   self._rate * time_base.num)
+        if stream.contents.start_time != _av.AV_NOPTS_VALUE:
+            timestamp += stream.contents.start_time
+
+        self._check(_av.av_seek_frame(self.__format_context,
+                                      self.__audio_stream, timestamp,
+                                      _av.AVSEEK_FLAG_BACKWARD))
+        _av.avcodec_flush_buffers(self.__codec_context)
+
+        self._data.clear()
+        self._decoded_end = position
+        self._timestamp_pending = True
+        self._discard_to = position if exact else -1
+
+    def _frame_start(self, frame):
+        """ _frame_start(frame) -> Return the frame number of the first
+        sample in the decoded frame, or the frame seeked to if it has no
+        timestamp.
 
         """
 
-        # return _av.avio_seek(self.__format_context.contents.pb, 0, _av.SEEK_CUR)
+        timestamp = _av.av_frame_get_best_effort_timestamp(frame)
+        if timestamp == _av.AV_NOPTS_VALUE:
+            return self._decoded_end
 
-        # Update the position.
         stream = self.__format_context.contents.streams[self.__audio_stream]
-        # We have to multiply the current position by the time base units so it
-        # will correspond to the duration, and allow us to seek.
-        return stream.contents.cur_dts * stream.contents.time_base.den
+        if stream.contents.start_time != _av.AV_NOPTS_VALUE:
+            timestamp -= stream.contents.start_time
+
+        time_base = stream.contents.time_base
+        return _av.av_rescale(timestamp, self._rate * time_base.num,
+                              time_base.den)
 
     def _open(self, filename):
         """ _open(filename) -> Load the specified file.
@@ -181,20 +260,39 @@ class FFmpegFile(AudioIO):
         # string.
         self._unsigned = 'u' in d_str.lower()
 
-        # if 'flt' in d_str:
-        #     self._floatp = True
-
         # self._unsigned = d_str[0].lower() == 'u'
         # self._depth = int(d_str[1:])
 
-        self._sample_fmt = getattr(_av, 'AV_SAMPLE_FMT_%s%s' %
-                                   ('U' if self._unsigned else 'S',
-                                    self._depth))
+        if self._floatp:
+            # Have avresample convert to packed floats.
+            self._sample_fmt = _av.AV_SAMPLE_FMT_FLT
+            self._depth = 32
+            self._unsigned = False
+        else:
+            self._sample_fmt = getattr(_av, 'AV_SAMPLE_FMT_%s%s' %
+                                       ('U' if self._unsigned else 'S',
+                                        self._depth))
+
+        self._width = self._depth // 8
+        self._frame_size = self._width * self._channels
 
         self._avr = self._get_avr(codec_context)
 
         self.__codec_context = codec_context
 
+        # The decode loop reuses one frame and packet, and converts into
+        # one output buffer that only grows, for as long as the file is
+        # open.
+        self._frame = _av.avcodec_alloc_frame()
+        self._packet = _av.AVPacket()
+        _av.av_init_packet(self._packet)
+        self._decode_packet = _av.AVPacket()
+        self._got_frame = _av.c_int()
+
+        self._output = _av.POINTER(_av.uint8_t)()
+        self._output_linesize = _av.c_int()
+        self._output_samples = 0
+
         # The file is now open.
         self._closed = False
 
@@ -210,10 +308,17 @@ class FFmpegFile(AudioIO):
             raise(Exception("Unable to allocate avresample context"))
 
         if codec_context.contents.channel_layout == 0:
-            channel_layout = _av.AV_CH_LAYOUT_STEREO
+            channel_layout = _av.av_get_default_channel_layout(
+                codec_context.contents.channels)
         else:
             channel_layout = codec_context.contents.channel_layout
 
+        # The output is in the order of the bits in the layout.
+        self._layout = tuple(name for bit, name in enumerate(_CHANNEL_NAMES)
+                             if channel_layout & (1 << bit))
+        if len(self._layout) != self._channels:
+            self._layout = None
+
         _av.av_opt_set_int(avr, b"in_channel_layout", channel_layout, 0)
         _av.av_opt_set_int(avr, b"out_channel_layout", channel_layout, 0)
         _av.av_opt_set_int(avr, b"in_sample_fmt",
@@ -239,46 +344,32 @@ class FFmpegFile(AudioIO):
         # Only update the global data buffer.
         data = self._data
 
-        # Create the packet.
-        av_packet = _av.AVPacket()
-
-        # Create and setup a frame to read the data into.
-        frame = _av.avcodec_alloc_frame()
-        _av.avcodec_get_frame_defaults(frame)
-
-        # Create and setup a frame to read the data into.
-        outframe = _av.avcodec_alloc_frame()
-        _av.avcodec_get_frame_defaults(outframe)
-
-        # Used to tell if we read a frame or not.
-        got_frame = _av.c_int()
+        packet = self._packet
+        decode_packet = self._decode_packet
+        frame = self._frame
+        got_frame = self._got_frame
+        codec_context = self.__codec_context
 
         # Seek before next read begins.
         if self._seek_pos > -1:
-            self._check(_av.avformat_seek_file(self.__format_context, -1, 0,
-                                               self._seek_pos, self._length,
-                                               _av.SEEK_SET))
-            _av.avcodec_flush_buffers(self.__codec_context)
+            self._seek(self._seek_pos, self._seek_exact)
 
             # Reset the seek so we don't continue seeking.
             self._seek_pos = -1
 
-        while not data or len(data) < size:
+        while len(data) < size:
             # Read the next frame breaking.
-            if _av.av_read_frame(self.__format_context, av_packet) < 0:
+            if _av.av_read_frame(self.__format_context, packet) < 0:
                 # If no data was read then we have reached the end of the
                 # file so restart or exit.
                 if self._loops != -1 and self._loop_count >= self._loops:
-                    # Free the packet.
-                    _av.av_free_packet(av_packet)
-
                     # Fill the data buffer with nothing so it will be a
                     # frame size for output.
                     if len(data) != 0:
-                        data += b'\x00' * (size - len(data))
+                        data.pad(size)
                 else:
                     # Fill the buffer so we return the requested size.
-                    data += b'\x00' * (size - len(data))
+                    data.pad(size)
 
                     # Update the loop count and seek to the start.
                     self._loop_count += 1
@@ -288,106 +379,113 @@ class FFmpegFile(AudioIO):
                 break
 
             # If the packet read is not audio then skip it.
-            if av_packet.stream_index != self.__audio_stream:
-                _av.av_free_packet(av_packet)
+            if packet.stream_index != self.__audio_stream:
+                _av.av_free_packet(packet)
                 continue
 
-            # Reset the frame, (I don't know if this is necessary).
-            _av.avcodec_get_frame_defaults(frame)
-
-            # Initialize the packet before using it but after decoding
-            # into it, otherwise it could segfault when freed.
-            _av.av_init_packet(av_packet)
+            # Decode from a copy of the packet so moving its data along
+            # leaves the packet read with what it has to free.
+            _av.memmove(_av.byref(decode_packet), _av.byref(packet),
+                        _av.sizeof(packet))
 
             # Decode the data in the packet until there is no more.
-            while av_packet.size > 0:
+            while decode_packet.size > 0:
                 # Decode the packet data.
-                data_len = _av.avcodec_decode_audio4(self.__codec_context,
-                                                     frame,
+                data_len = _av.avcodec_decode_audio4(codec_context, frame,
                                                      _av.byref(got_frame),
-                                                     av_packet)
+                                                     decode_packet)
 
                 # Exit loop if no data was decoded.
                 if data_len < 0:
                     break
 
-                # Don't finish the loop if we didn't get a frame.
-                # if not got_frame:
-                #     continue
-
-                # Calculate the size of the decoded data.
-                data_size = _av.av_samples_get_buffer_size(
-                        frame.contents.linesize,
-                        self.__codec_context.contents.channels,
-                        frame.contents.nb_samples,
-                        self.__codec_context.contents.sample_fmt, 1)
-
                 # We decoded 'data_len' amount of data, so remove it from the
                 # packet.
-                av_packet.size -= data_len
-                #av_packet.data = \
-                        #_av.POINTER(_av.c_uint8).from_address(
-                                #_av.addressof(av_packet.data) + data_len)
-                _av.memmove(av_packet.data, av_packet.data, av_packet.size)
+                decode_packet.size -= data_len
+                if decode_packet.size > 0:
+                    address = _av.cast(decode_packet.data, _av.c_void_p).value
+                    decode_packet.data = _av.cast(address + data_len,
+                                                  _av.POINTER(_av.uint8_t))
 
-                # Append the decoded data to the buffer.
-                # data += _av.string_at(output, out_linesize)
-                data += self._resample(frame)
+                if got_frame.value:
+                    # Convert the decoded data into the buffer.
+                    self._resample_into(frame, data)
 
             # Free the packet.
-            _av.av_free_packet(av_packet)
-
-        # Free the frame and packet.
-        _av.av_free(frame)
-        _av.av_free_packet(av_packet)
+            _av.av_free_packet(packet)
 
-        # Store extra data for next time.
-        self._data = data[size:]
-
-        # Make sure we return only the number of bytes requested.
-        return data[:size]
+        # Return only the number of bytes requested and keep the rest for
+        # next time.
+        return data.read(size)
     read.__annotations__ = {'size': int, 'return': bytes}
 
-    def _resample(self, frame):
-        """ Resample the data in frame and return a byte string of the result.
+    def _resample_into(self, frame, data):
+        """ _resample_into(frame, data) -> Convert the samples in frame to
+        the output format and append them to the RingBuffer data.
 
         """
 
+        nb_samples = frame.contents.nb_samples
+
         # Don't resample null data.
-        if not frame.contents.linesize[0]:
-            return b''
+        if not nb_samples or not frame.contents.linesize[0]:
+            return
 
-        output = _av.POINTER(_av.uint8_t)()
-        out_linesize = _av.c_int()
+        avr = self._avr
+        rate = self.__codec_context.contents.sample_rate
 
         # Calculate how many resampled samples there will be.
-        r_rnd = _av.av_rescale_rnd(_av.avresample_get_delay(self._avr) +
-                                   frame.contents.nb_samples,
-                                   self.__codec_context.contents.sample_rate,
-                                   self.__codec_context.contents.sample_rate,
-                                   _av.AV_ROUND_UP)
-        out_samples = _av.avresample_available(self._avr) + r_rnd
-
-        # Allocate a buffer large enough to hold the resampled data.
-        _av.av_samples_alloc(_av.byref(output), _av.byref(out_linesize),
-                             self.__codec_context.contents.channels,
-                             out_samples, self._sample_fmt, 0)
+        r_rnd = _av.av_rescale_rnd(_av.avresample_get_delay(avr) +
+                                   nb_samples, rate, rate, _av.AV_ROUND_UP)
+        out_samples = _av.avresample_available(avr) + r_rnd
+
+        # Only allocate a bigger output buffer when this frame won't fit in
+        # the one there is.
+        if out_samples > self._output_samples:
+            if self._output:
+                _av.av_freep(_av.byref(self._output))
+            self._check(_av.av_samples_alloc(_av.byref(self._output),
+                                             _av.byref(self._output_linesize),
+                                             self._channels, out_samples,
+                                             self._sample_fmt, 0))
+            self._output_samples = out_samples
 
         # Resample the data in the frame to match the settings in avr.
-        _av.avresample_convert(self._avr, _av.byref(output), out_linesize,
-                               out_samples, frame.contents.data,
-                               frame.contents.linesize[0],
-                               frame.contents.nb_samples)
-        # print(_av.avresample_available(avr))
-        # print(_av.avresample_read(avr, outframe.contents.data, frame.contents.nb_samples))
+        converted = _av.avresample_convert(avr, _av.byref(self._output),
+                                           self._output_linesize,
+                                           out_samples, frame.contents.data,
+                                           frame.contents.linesize[0],
+                                           nb_samples)
+        if converted <= 0:
+            return
+
+        data.append_from(self._output, converted * self._frame_size)
 
-        # Get the bytes in the output buffer.
-        data = _av.string_at(output, out_linesize)
+        self._advance(frame, converted)
 
-        # Free the output buffer.
-        _av.av_freep(_av.byref(output))
+    def _advance(self, frame, frames):
+        """ _advance(frame, frames) -> Move the decoded position past the
+        frames just converted from frame, and drop any of them that are
+        before the frame an exact seek was to.
 
-        return data
+        """
+
+        start = self._decoded_end
+        if self._timestamp_pending:
+            start = self._frame_start(frame)
+            self._timestamp_pending = False
+
+        end = start + frames
+        self._decoded_end = end
+
+        if self._discard_to > start:
+            # Everything in the buffer is from after the seek, so these are
+            # at its start.
+            self._data.skip((min(self._discard_to, end) - start) *
+                            self._frame_size)
+
+            if self._discard_to <= end:
+                self._discard_to = -1
 
     def close(self):
         """ close -> Closes and cleans up.
@@ -398,6 +496,12 @@ class FFmpegFile(AudioIO):
             # Close and free the resample context.
             _av.avresample_free(self._avr)
 
+            # Free the decoded frame and the output buffer.
+            _av.avcodec_free_frame(_av.byref(self._frame))
+            if self._output:
+                _av.av_freep(_av.byref(self._output))
+            self._output_samples = 0
+
             # Close the file and free all contexts.
             _av.avformat_free_context(self.__format_context)
             self.__format_context = None
@@ -1,7 +1,8 @@
 from ctypes import *
+from ..import_util import LazyLibraries as _LazyLibraries
+from ..import_util import bind_lazily as _bind_lazily
 
-_libraries = {}
-_libraries['/usr/lib/libFLAC.so'] = CDLL('/usr/lib/libFLAC.so')
+_libraries = _LazyLibraries()
 STRING = c_char_p
 WSTRING = c_wchar_p
 
@@ -21,6 +22,7 @@ FLAC__STREAM_ENCODER_VERIFY_MISMATCH_IN_AUDIO_DATA = 4
 FLAC__STREAM_ENCODER_VERIFY_DECODER_ERROR = 3
 FLAC__STREAM_ENCODER_OGG_ERROR = 2
 FLAC__STREAM_ENCODER_OK = 0
+FLAC__STREAM_ENCODER_SET_NUM_THREADS_OK = 0
 FLAC__SUBFRAME_TYPE_LPC = 3
 FLAC__SUBFRAME_TYPE_FIXED = 2
 FLAC__SUBFRAME_TYPE_VERBATIM = 1
@@ -37,44 +39,11 @@ FLAC__METADATA_SIMPLE_ITERATOR_STATUS_NOT_WRITABLE = 4
 __LITTLE_ENDIAN = 1234 # Variable c_int '1234'
 __BYTE_ORDER = __LITTLE_ENDIAN # alias
 # __BLKCNT64_T_TYPE = __SQUAD_TYPE # alias
-class __va_list_tag(Structure):
-    pass
-__va_list_tag._fields_ = [
-]
-__gnuc_va_list = __va_list_tag * 1
-_IO_va_list = __gnuc_va_list # alias
 __ssize_t = c_long
 _IO_ssize_t = __ssize_t # alias
 size_t = c_ulong
 _IO_size_t = size_t # alias
-class _G_fpos_t(Structure):
-    pass
 __off_t = c_long
-class __mbstate_t(Structure):
-    pass
-class N11__mbstate_t4DOT_56E(Union):
-    pass
-N11__mbstate_t4DOT_56E._fields_ = [
-    ('__wch', c_uint),
-    ('__wchb', c_char * 4),
-]
-__mbstate_t._fields_ = [
-    ('__count', c_int),
-    ('__value', N11__mbstate_t4DOT_56E),
-]
-_G_fpos_t._fields_ = [
-    ('__pos', __off_t),
-    ('__state', __mbstate_t),
-]
-_IO_fpos_t = _G_fpos_t # alias
-class _IO_FILE(Structure):
-    pass
-stdout = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libFLAC.so'], 'stdout')
-stdout = stdout # alias
-stdin = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libFLAC.so'], 'stdin')
-stdin = stdin # alias
-stderr = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libFLAC.so'], 'stderr')
-stderr = stderr # alias
 # __wur = __attribute_warn_unused_result__ # alias
 # __WCHAR_MIN = __WCHAR_MIN__ # alias
 # __WCHAR_MAX = __WCHAR_MAX__ # alias
@@ -128,13 +97,6 @@ _IO_off_t = __off_t # alias
 __off64_t = c_long
 _IO_off64_t = __off64_t # alias
 # _IO_iconv_t = _G_iconv_t # alias
-class _G_fpos64_t(Structure):
-    pass
-_G_fpos64_t._fields_ = [
-    ('__pos', __off64_t),
-    ('__state', __mbstate_t),
-]
-_IO_fpos64_t = _G_fpos64_t # alias
 # _IO_file_flags = _flags # alias
 # _IO_HAVE_ST_BLKSIZE = _G_HAVE_ST_BLKSIZE # alias
 FLAC__STREAM_ENCODER_INIT_STATUS_INVALID_SAMPLE_RATE = 6
@@ -250,7 +212,6 @@ FLAC__STREAM_ENCODER_READ_STATUS_UNSUPPORTED = 3
 FLAC__STREAM_ENCODER_READ_STATUS_ABORT = 2
 FLAC__STREAM_ENCODER_READ_STATUS_END_OF_STREAM = 1
 FLAC__STREAM_ENCODER_READ_STATUS_CONTINUE = 0
-_G_va_list = __gnuc_va_list # alias
 # WCHAR_MIN = __WCHAR_MIN # alias
 # WCHAR_MAX = __WCHAR_MAX # alias
 __PDP_ENDIAN = 3412 # Variable c_int '3412'
@@ -268,10 +229,6 @@ BUFSIZ = _IO_BUFSIZ # alias
 __BIG_ENDIAN = 4321 # Variable c_int '4321'
 BIG_ENDIAN = __BIG_ENDIAN # alias
 def _IO_peekc(_fp): return _IO_peekc_unlocked (_fp) # macro
-def putc(_ch,_fp): return _IO_putc (_ch, _fp) # macro
-def minor(dev): return gnu_dev_minor (dev) # macro
-def makedev(maj,min): return gnu_dev_makedev (maj, min) # macro
-def major(dev): return gnu_dev_major (dev) # macro
 def le64toh(x): return (x) # macro
 def le32toh(x): return (x) # macro
 def le16toh(x): return (x) # macro
@@ -282,7 +239,6 @@ def htobe64(x): return __bswap_64 (x) # macro
 def htobe32(x): return __bswap_32 (x) # macro
 # def _IO_feof_unlocked(__fp): return (((__fp)->_flags & _IO_EOF_SEEN) != 0) # macro
 def htobe16(x): return __bswap_16 (x) # macro
-def getc(_fp): return _IO_getc (_fp) # macro
 def be64toh(x): return __bswap_64 (x) # macro
 def be32toh(x): return __bswap_32 (x) # macro
 def be16toh(x): return __bswap_16 (x) # macro
@@ -614,663 +570,43 @@ FLAC__IOCallback_Seek = CFUNCTYPE(c_int, FLAC__IOHandle, FLAC__int64, c_int)
 FLAC__IOCallback_Tell = CFUNCTYPE(FLAC__int64, FLAC__IOHandle)
 FLAC__IOCallback_Eof = CFUNCTYPE(c_int, FLAC__IOHandle)
 FLAC__IOCallback_Close = CFUNCTYPE(c_int, FLAC__IOHandle)
-class FLAC__IOCallbacks(Structure):
-    pass
-FLAC__IOCallbacks._fields_ = [
-    ('read', FLAC__IOCallback_Read),
-    ('write', FLAC__IOCallback_Write),
-    ('seek', FLAC__IOCallback_Seek),
-    ('tell', FLAC__IOCallback_Tell),
-    ('eof', FLAC__IOCallback_Eof),
-    ('close', FLAC__IOCallback_Close),
-]
-FLAC_API_SUPPORTS_OGG_FLAC = (c_int).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC_API_SUPPORTS_OGG_FLAC')
-FLAC__VERSION_STRING = (STRING).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__VERSION_STRING')
-FLAC__VENDOR_STRING = (STRING).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__VENDOR_STRING')
 uint8_t = c_uint8
 FLAC__uint8 = uint8_t
 FLAC__byte = FLAC__uint8
-FLAC__STREAM_SYNC_STRING = (FLAC__byte * 4).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_SYNC_STRING')
-FLAC__STREAM_SYNC = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_SYNC')
-FLAC__STREAM_SYNC_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_SYNC_LEN')
 
 # values for enumeration 'FLAC__EntropyCodingMethodType'
 FLAC__EntropyCodingMethodType = c_int # enum
-FLAC__EntropyCodingMethodTypeString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__EntropyCodingMethodTypeString')
-class FLAC__EntropyCodingMethod_PartitionedRiceContents(Structure):
-    pass
-FLAC__EntropyCodingMethod_PartitionedRiceContents._fields_ = [
-    ('parameters', POINTER(c_uint)),
-    ('raw_bits', POINTER(c_uint)),
-    ('capacity_by_order', c_uint),
-]
-class FLAC__EntropyCodingMethod_PartitionedRice(Structure):
-    pass
-FLAC__EntropyCodingMethod_PartitionedRice._fields_ = [
-    ('order', c_uint),
-    ('contents', POINTER(FLAC__EntropyCodingMethod_PartitionedRiceContents)),
-]
-FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_ORDER_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_ORDER_LEN')
-FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_PARAMETER_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_PARAMETER_LEN')
-FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE2_PARAMETER_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE2_PARAMETER_LEN')
-FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_RAW_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_RAW_LEN')
-FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_ESCAPE_PARAMETER = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_ESCAPE_PARAMETER')
-FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE2_ESCAPE_PARAMETER = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE2_ESCAPE_PARAMETER')
-class N25FLAC__EntropyCodingMethod4DOT_23E(Union):
-    pass
-N25FLAC__EntropyCodingMethod4DOT_23E._fields_ = [
-    ('partitioned_rice', FLAC__EntropyCodingMethod_PartitionedRice),
-]
-class FLAC__EntropyCodingMethod(Structure):
-    pass
-FLAC__EntropyCodingMethod._fields_ = [
-    ('type', FLAC__EntropyCodingMethodType),
-    ('data', N25FLAC__EntropyCodingMethod4DOT_23E),
-]
-FLAC__ENTROPY_CODING_METHOD_TYPE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ENTROPY_CODING_METHOD_TYPE_LEN')
 
 # values for enumeration 'FLAC__SubframeType'
 FLAC__SubframeType = c_int # enum
-FLAC__SubframeTypeString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SubframeTypeString')
-class FLAC__Subframe_Constant(Structure):
-    pass
 int32_t = c_int32
 FLAC__int32 = int32_t
-FLAC__Subframe_Constant._fields_ = [
-    ('value', FLAC__int32),
-]
-class FLAC__Subframe_Verbatim(Structure):
-    pass
-FLAC__Subframe_Verbatim._fields_ = [
-    ('data', POINTER(FLAC__int32)),
-]
-class FLAC__Subframe_Fixed(Structure):
-    pass
-FLAC__Subframe_Fixed._fields_ = [
-    ('entropy_coding_method', FLAC__EntropyCodingMethod),
-    ('order', c_uint),
-    ('warmup', FLAC__int32 * 4),
-    ('residual', POINTER(FLAC__int32)),
-]
-class FLAC__Subframe_LPC(Structure):
-    pass
-FLAC__Subframe_LPC._fields_ = [
-    ('entropy_coding_method', FLAC__EntropyCodingMethod),
-    ('order', c_uint),
-    ('qlp_coeff_precision', c_uint),
-    ('quantization_level', c_int),
-    ('qlp_coeff', FLAC__int32 * 32),
-    ('warmup', FLAC__int32 * 32),
-    ('residual', POINTER(FLAC__int32)),
-]
-FLAC__SUBFRAME_LPC_QLP_COEFF_PRECISION_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_LPC_QLP_COEFF_PRECISION_LEN')
-FLAC__SUBFRAME_LPC_QLP_SHIFT_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_LPC_QLP_SHIFT_LEN')
-class N14FLAC__Subframe4DOT_30E(Union):
-    pass
-N14FLAC__Subframe4DOT_30E._fields_ = [
-    ('constant', FLAC__Subframe_Constant),
-    ('fixed', FLAC__Subframe_Fixed),
-    ('lpc', FLAC__Subframe_LPC),
-    ('verbatim', FLAC__Subframe_Verbatim),
-]
-class FLAC__Subframe(Structure):
-    pass
-FLAC__Subframe._fields_ = [
-    ('type', FLAC__SubframeType),
-    ('data', N14FLAC__Subframe4DOT_30E),
-    ('wasted_bits', c_uint),
-]
-FLAC__SUBFRAME_ZERO_PAD_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_ZERO_PAD_LEN')
-FLAC__SUBFRAME_TYPE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_TYPE_LEN')
-FLAC__SUBFRAME_WASTED_BITS_FLAG_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_WASTED_BITS_FLAG_LEN')
-FLAC__SUBFRAME_TYPE_CONSTANT_BYTE_ALIGNED_MASK = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_TYPE_CONSTANT_BYTE_ALIGNED_MASK')
-FLAC__SUBFRAME_TYPE_VERBATIM_BYTE_ALIGNED_MASK = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_TYPE_VERBATIM_BYTE_ALIGNED_MASK')
-FLAC__SUBFRAME_TYPE_FIXED_BYTE_ALIGNED_MASK = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_TYPE_FIXED_BYTE_ALIGNED_MASK')
-FLAC__SUBFRAME_TYPE_LPC_BYTE_ALIGNED_MASK = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_TYPE_LPC_BYTE_ALIGNED_MASK')
 
 # values for enumeration 'FLAC__ChannelAssignment'
 FLAC__ChannelAssignment = c_int # enum
-FLAC__ChannelAssignmentString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ChannelAssignmentString')
 
 # values for enumeration 'FLAC__FrameNumberType'
 FLAC__FrameNumberType = c_int # enum
-FLAC__FrameNumberTypeString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FrameNumberTypeString')
-class N17FLAC__FrameHeader4DOT_34E(Union):
-    pass
 uint32_t = c_uint32
 FLAC__uint32 = uint32_t
 uint64_t = c_uint64
 FLAC__uint64 = uint64_t
-N17FLAC__FrameHeader4DOT_34E._fields_ = [
-    ('frame_number', FLAC__uint32),
-    ('sample_number', FLAC__uint64),
-]
-class FLAC__FrameHeader(Structure):
-    pass
-FLAC__FrameHeader._fields_ = [
-    ('blocksize', c_uint),
-    ('sample_rate', c_uint),
-    ('channels', c_uint),
-    ('channel_assignment', FLAC__ChannelAssignment),
-    ('bits_per_sample', c_uint),
-    ('number_type', FLAC__FrameNumberType),
-    ('number', N17FLAC__FrameHeader4DOT_34E),
-    ('crc', FLAC__uint8),
-]
-FLAC__FRAME_HEADER_SYNC = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_SYNC')
-FLAC__FRAME_HEADER_SYNC_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_SYNC_LEN')
-FLAC__FRAME_HEADER_RESERVED_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_RESERVED_LEN')
-FLAC__FRAME_HEADER_BLOCKING_STRATEGY_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_BLOCKING_STRATEGY_LEN')
-FLAC__FRAME_HEADER_BLOCK_SIZE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_BLOCK_SIZE_LEN')
-FLAC__FRAME_HEADER_SAMPLE_RATE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_SAMPLE_RATE_LEN')
-FLAC__FRAME_HEADER_CHANNEL_ASSIGNMENT_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_CHANNEL_ASSIGNMENT_LEN')
-FLAC__FRAME_HEADER_BITS_PER_SAMPLE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_BITS_PER_SAMPLE_LEN')
-FLAC__FRAME_HEADER_ZERO_PAD_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_ZERO_PAD_LEN')
-FLAC__FRAME_HEADER_CRC_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_CRC_LEN')
-class FLAC__FrameFooter(Structure):
-    pass
 uint16_t = c_uint16
 FLAC__uint16 = uint16_t
-FLAC__FrameFooter._fields_ = [
-    ('crc', FLAC__uint16),
-]
-FLAC__FRAME_FOOTER_CRC_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_FOOTER_CRC_LEN')
-class FLAC__Frame(Structure):
-    pass
-FLAC__Frame._fields_ = [
-    ('header', FLAC__FrameHeader),
-    ('subframes', FLAC__Subframe * 8),
-    ('footer', FLAC__FrameFooter),
-]
 
 # values for enumeration 'FLAC__MetadataType'
 FLAC__MetadataType = c_int # enum
-FLAC__MetadataTypeString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__MetadataTypeString')
-class FLAC__StreamMetadata_StreamInfo(Structure):
-    pass
-FLAC__StreamMetadata_StreamInfo._fields_ = [
-    ('min_blocksize', c_uint),
-    ('max_blocksize', c_uint),
-    ('min_framesize', c_uint),
-    ('max_framesize', c_uint),
-    ('sample_rate', c_uint),
-    ('channels', c_uint),
-    ('bits_per_sample', c_uint),
-    ('total_samples', FLAC__uint64),
-    ('md5sum', FLAC__byte * 16),
-]
-FLAC__STREAM_METADATA_STREAMINFO_MIN_BLOCK_SIZE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_MIN_BLOCK_SIZE_LEN')
-FLAC__STREAM_METADATA_STREAMINFO_MAX_BLOCK_SIZE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_MAX_BLOCK_SIZE_LEN')
-FLAC__STREAM_METADATA_STREAMINFO_MIN_FRAME_SIZE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_MIN_FRAME_SIZE_LEN')
-FLAC__STREAM_METADATA_STREAMINFO_MAX_FRAME_SIZE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_MAX_FRAME_SIZE_LEN')
-FLAC__STREAM_METADATA_STREAMINFO_SAMPLE_RATE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_SAMPLE_RATE_LEN')
-FLAC__STREAM_METADATA_STREAMINFO_CHANNELS_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_CHANNELS_LEN')
-FLAC__STREAM_METADATA_STREAMINFO_BITS_PER_SAMPLE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_BITS_PER_SAMPLE_LEN')
-FLAC__STREAM_METADATA_STREAMINFO_TOTAL_SAMPLES_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_TOTAL_SAMPLES_LEN')
-FLAC__STREAM_METADATA_STREAMINFO_MD5SUM_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_MD5SUM_LEN')
-class FLAC__StreamMetadata_Padding(Structure):
-    pass
-FLAC__StreamMetadata_Padding._fields_ = [
-    ('dummy', c_int),
-]
-class FLAC__StreamMetadata_Application(Structure):
-    pass
-FLAC__StreamMetadata_Application._fields_ = [
-    ('id', FLAC__byte * 4),
-    ('data', POINTER(FLAC__byte)),
-]
-FLAC__STREAM_METADATA_APPLICATION_ID_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_APPLICATION_ID_LEN')
-class FLAC__StreamMetadata_SeekPoint(Structure):
-    pass
-FLAC__StreamMetadata_SeekPoint._fields_ = [
-    ('sample_number', FLAC__uint64),
-    ('stream_offset', FLAC__uint64),
-    ('frame_samples', c_uint),
-]
-FLAC__STREAM_METADATA_SEEKPOINT_SAMPLE_NUMBER_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_SEEKPOINT_SAMPLE_NUMBER_LEN')
-FLAC__STREAM_METADATA_SEEKPOINT_STREAM_OFFSET_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_SEEKPOINT_STREAM_OFFSET_LEN')
-FLAC__STREAM_METADATA_SEEKPOINT_FRAME_SAMPLES_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_SEEKPOINT_FRAME_SAMPLES_LEN')
-FLAC__STREAM_METADATA_SEEKPOINT_PLACEHOLDER = (FLAC__uint64).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_SEEKPOINT_PLACEHOLDER')
-class FLAC__StreamMetadata_SeekTable(Structure):
-    pass
-FLAC__StreamMetadata_SeekTable._fields_ = [
-    ('num_points', c_uint),
-    ('points', POINTER(FLAC__StreamMetadata_SeekPoint)),
-]
-class FLAC__StreamMetadata_VorbisComment_Entry(Structure):
-    pass
-FLAC__StreamMetadata_VorbisComment_Entry._fields_ = [
-    ('length', FLAC__uint32),
-    ('entry', POINTER(FLAC__byte)),
-]
-FLAC__STREAM_METADATA_VORBIS_COMMENT_ENTRY_LENGTH_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_VORBIS_COMMENT_ENTRY_LENGTH_LEN')
-class FLAC__StreamMetadata_VorbisComment(Structure):
-    pass
-FLAC__StreamMetadata_VorbisComment._fields_ = [
-    ('vendor_string', FLAC__StreamMetadata_VorbisComment_Entry),
-    ('num_comments', FLAC__uint32),
-    ('comments', POINTER(FLAC__StreamMetadata_VorbisComment_Entry)),
-]
-FLAC__STREAM_METADATA_VORBIS_COMMENT_NUM_COMMENTS_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_VORBIS_COMMENT_NUM_COMMENTS_LEN')
-class FLAC__StreamMetadata_CueSheet_Index(Structure):
-    pass
-FLAC__StreamMetadata_CueSheet_Index._fields_ = [
-    ('offset', FLAC__uint64),
-    ('number', FLAC__byte),
-]
-FLAC__STREAM_METADATA_CUESHEET_INDEX_OFFSET_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_INDEX_OFFSET_LEN')
-FLAC__STREAM_METADATA_CUESHEET_INDEX_NUMBER_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_INDEX_NUMBER_LEN')
-FLAC__STREAM_METADATA_CUESHEET_INDEX_RESERVED_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_INDEX_RESERVED_LEN')
-class FLAC__StreamMetadata_CueSheet_Track(Structure):
-    pass
-FLAC__StreamMetadata_CueSheet_Track._fields_ = [
-    ('offset', FLAC__uint64),
-    ('number', FLAC__byte),
-    ('isrc', c_char * 13),
-    ('type', c_uint, 1),
-    ('pre_emphasis', c_uint, 1),
-    ('num_indices', FLAC__byte),
-    ('indices', POINTER(FLAC__StreamMetadata_CueSheet_Index)),
-]
-FLAC__STREAM_METADATA_CUESHEET_TRACK_OFFSET_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_TRACK_OFFSET_LEN')
-FLAC__STREAM_METADATA_CUESHEET_TRACK_NUMBER_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_TRACK_NUMBER_LEN')
-FLAC__STREAM_METADATA_CUESHEET_TRACK_ISRC_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_TRACK_ISRC_LEN')
-FLAC__STREAM_METADATA_CUESHEET_TRACK_TYPE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_TRACK_TYPE_LEN')
-FLAC__STREAM_METADATA_CUESHEET_TRACK_PRE_EMPHASIS_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_TRACK_PRE_EMPHASIS_LEN')
-FLAC__STREAM_METADATA_CUESHEET_TRACK_RESERVED_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_TRACK_RESERVED_LEN')
-FLAC__STREAM_METADATA_CUESHEET_TRACK_NUM_INDICES_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_TRACK_NUM_INDICES_LEN')
-class FLAC__StreamMetadata_CueSheet(Structure):
-    pass
 FLAC__bool = c_int
-FLAC__StreamMetadata_CueSheet._fields_ = [
-    ('media_catalog_number', c_char * 129),
-    ('lead_in', FLAC__uint64),
-    ('is_cd', FLAC__bool),
-    ('num_tracks', c_uint),
-    ('tracks', POINTER(FLAC__StreamMetadata_CueSheet_Track)),
-]
-FLAC__STREAM_METADATA_CUESHEET_MEDIA_CATALOG_NUMBER_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_MEDIA_CATALOG_NUMBER_LEN')
-FLAC__STREAM_METADATA_CUESHEET_LEAD_IN_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_LEAD_IN_LEN')
-FLAC__STREAM_METADATA_CUESHEET_IS_CD_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_IS_CD_LEN')
-FLAC__STREAM_METADATA_CUESHEET_RESERVED_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_RESERVED_LEN')
-FLAC__STREAM_METADATA_CUESHEET_NUM_TRACKS_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_NUM_TRACKS_LEN')
 
 # values for enumeration 'FLAC__StreamMetadata_Picture_Type'
 FLAC__StreamMetadata_Picture_Type = c_int # enum
-FLAC__StreamMetadata_Picture_TypeString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamMetadata_Picture_TypeString')
-class FLAC__StreamMetadata_Picture(Structure):
-    pass
-FLAC__StreamMetadata_Picture._fields_ = [
-    ('type', FLAC__StreamMetadata_Picture_Type),
-    ('mime_type', STRING),
-    ('description', POINTER(FLAC__byte)),
-    ('width', FLAC__uint32),
-    ('height', FLAC__uint32),
-    ('depth', FLAC__uint32),
-    ('colors', FLAC__uint32),
-    ('data_length', FLAC__uint32),
-    ('data', POINTER(FLAC__byte)),
-]
-FLAC__STREAM_METADATA_PICTURE_TYPE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_TYPE_LEN')
-FLAC__STREAM_METADATA_PICTURE_MIME_TYPE_LENGTH_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_MIME_TYPE_LENGTH_LEN')
-FLAC__STREAM_METADATA_PICTURE_DESCRIPTION_LENGTH_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_DESCRIPTION_LENGTH_LEN')
-FLAC__STREAM_METADATA_PICTURE_WIDTH_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_WIDTH_LEN')
-FLAC__STREAM_METADATA_PICTURE_HEIGHT_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_HEIGHT_LEN')
-FLAC__STREAM_METADATA_PICTURE_DEPTH_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_DEPTH_LEN')
-FLAC__STREAM_METADATA_PICTURE_COLORS_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_COLORS_LEN')
-FLAC__STREAM_METADATA_PICTURE_DATA_LENGTH_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_DATA_LENGTH_LEN')
-class FLAC__StreamMetadata_Unknown(Structure):
-    pass
-FLAC__StreamMetadata_Unknown._fields_ = [
-    ('data', POINTER(FLAC__byte)),
-]
-class N20FLAC__StreamMetadata4DOT_52E(Union):
-    pass
-N20FLAC__StreamMetadata4DOT_52E._fields_ = [
-    ('stream_info', FLAC__StreamMetadata_StreamInfo),
-    ('padding', FLAC__StreamMetadata_Padding),
-    ('application', FLAC__StreamMetadata_Application),
-    ('seek_table', FLAC__StreamMetadata_SeekTable),
-    ('vorbis_comment', FLAC__StreamMetadata_VorbisComment),
-    ('cue_sheet', FLAC__StreamMetadata_CueSheet),
-    ('picture', FLAC__StreamMetadata_Picture),
-    ('unknown', FLAC__StreamMetadata_Unknown),
-]
-class FLAC__StreamMetadata(Structure):
-    pass
-FLAC__StreamMetadata._fields_ = [
-    ('type', FLAC__MetadataType),
-    ('is_last', FLAC__bool),
-    ('length', c_uint),
-    ('data', N20FLAC__StreamMetadata4DOT_52E),
-]
-FLAC__STREAM_METADATA_IS_LAST_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_IS_LAST_LEN')
-FLAC__STREAM_METADATA_TYPE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_TYPE_LEN')
-FLAC__STREAM_METADATA_LENGTH_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_LENGTH_LEN')
-FLAC__format_sample_rate_is_valid = _libraries['/usr/lib/libFLAC.so'].FLAC__format_sample_rate_is_valid
-FLAC__format_sample_rate_is_valid.restype = FLAC__bool
-FLAC__format_sample_rate_is_valid.argtypes = [c_uint]
-FLAC__format_blocksize_is_subset = _libraries['/usr/lib/libFLAC.so'].FLAC__format_blocksize_is_subset
-FLAC__format_blocksize_is_subset.restype = FLAC__bool
-FLAC__format_blocksize_is_subset.argtypes = [c_uint, c_uint]
-FLAC__format_sample_rate_is_subset = _libraries['/usr/lib/libFLAC.so'].FLAC__format_sample_rate_is_subset
-FLAC__format_sample_rate_is_subset.restype = FLAC__bool
-FLAC__format_sample_rate_is_subset.argtypes = [c_uint]
-FLAC__format_vorbiscomment_entry_name_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__format_vorbiscomment_entry_name_is_legal
-FLAC__format_vorbiscomment_entry_name_is_legal.restype = FLAC__bool
-FLAC__format_vorbiscomment_entry_name_is_legal.argtypes = [STRING]
-FLAC__format_vorbiscomment_entry_value_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__format_vorbiscomment_entry_value_is_legal
-FLAC__format_vorbiscomment_entry_value_is_legal.restype = FLAC__bool
-FLAC__format_vorbiscomment_entry_value_is_legal.argtypes = [POINTER(FLAC__byte), c_uint]
-FLAC__format_vorbiscomment_entry_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__format_vorbiscomment_entry_is_legal
-FLAC__format_vorbiscomment_entry_is_legal.restype = FLAC__bool
-FLAC__format_vorbiscomment_entry_is_legal.argtypes = [POINTER(FLAC__byte), c_uint]
-FLAC__format_seektable_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__format_seektable_is_legal
-FLAC__format_seektable_is_legal.restype = FLAC__bool
-FLAC__format_seektable_is_legal.argtypes = [POINTER(FLAC__StreamMetadata_SeekTable)]
-FLAC__format_seektable_sort = _libraries['/usr/lib/libFLAC.so'].FLAC__format_seektable_sort
-FLAC__format_seektable_sort.restype = c_uint
-FLAC__format_seektable_sort.argtypes = [POINTER(FLAC__StreamMetadata_SeekTable)]
-FLAC__format_cuesheet_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__format_cuesheet_is_legal
-FLAC__format_cuesheet_is_legal.restype = FLAC__bool
-FLAC__format_cuesheet_is_legal.argtypes = [POINTER(FLAC__StreamMetadata_CueSheet), FLAC__bool, POINTER(STRING)]
-FLAC__format_picture_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__format_picture_is_legal
-FLAC__format_picture_is_legal.restype = FLAC__bool
-FLAC__format_picture_is_legal.argtypes = [POINTER(FLAC__StreamMetadata_Picture), POINTER(STRING)]
-FLAC__metadata_get_streaminfo = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_get_streaminfo
-FLAC__metadata_get_streaminfo.restype = FLAC__bool
-FLAC__metadata_get_streaminfo.argtypes = [STRING, POINTER(FLAC__StreamMetadata)]
-FLAC__metadata_get_tags = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_get_tags
-FLAC__metadata_get_tags.restype = FLAC__bool
-FLAC__metadata_get_tags.argtypes = [STRING, POINTER(POINTER(FLAC__StreamMetadata))]
-FLAC__metadata_get_cuesheet = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_get_cuesheet
-FLAC__metadata_get_cuesheet.restype = FLAC__bool
-FLAC__metadata_get_cuesheet.argtypes = [STRING, POINTER(POINTER(FLAC__StreamMetadata))]
-FLAC__metadata_get_picture = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_get_picture
-FLAC__metadata_get_picture.restype = FLAC__bool
-FLAC__metadata_get_picture.argtypes = [STRING, POINTER(POINTER(FLAC__StreamMetadata)), FLAC__StreamMetadata_Picture_Type, STRING, POINTER(FLAC__byte), c_uint, c_uint, c_uint, c_uint]
-class FLAC__Metadata_SimpleIterator(Structure):
-    pass
-FLAC__Metadata_SimpleIterator._fields_ = [
-]
 
 # values for enumeration 'FLAC__Metadata_SimpleIteratorStatus'
 FLAC__Metadata_SimpleIteratorStatus = c_int # enum
-FLAC__Metadata_SimpleIteratorStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__Metadata_SimpleIteratorStatusString')
-FLAC__metadata_simple_iterator_new = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_new
-FLAC__metadata_simple_iterator_new.restype = POINTER(FLAC__Metadata_SimpleIterator)
-FLAC__metadata_simple_iterator_new.argtypes = []
-FLAC__metadata_simple_iterator_delete = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_delete
-FLAC__metadata_simple_iterator_delete.restype = None
-FLAC__metadata_simple_iterator_delete.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]
-FLAC__metadata_simple_iterator_status = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_status
-FLAC__metadata_simple_iterator_status.restype = FLAC__Metadata_SimpleIteratorStatus
-FLAC__metadata_simple_iterator_status.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]
-FLAC__metadata_simple_iterator_init = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_init
-FLAC__metadata_simple_iterator_init.restype = FLAC__bool
-FLAC__metadata_simple_iterator_init.argtypes = [POINTER(FLAC__Metadata_SimpleIterator), STRING, FLAC__bool, FLAC__bool]
-FLAC__metadata_simple_iterator_is_writable = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_is_writable
-FLAC__metadata_simple_iterator_is_writable.restype = FLAC__bool
-FLAC__metadata_simple_iterator_is_writable.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]
-FLAC__metadata_simple_iterator_next = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_next
-FLAC__metadata_simple_iterator_next.restype = FLAC__bool
-FLAC__metadata_simple_iterator_next.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]
-FLAC__metadata_simple_iterator_prev = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_prev
-FLAC__metadata_simple_iterator_prev.restype = FLAC__bool
-FLAC__metadata_simple_iterator_prev.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]
-FLAC__metadata_simple_iterator_is_last = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_is_last
-FLAC__metadata_simple_iterator_is_last.restype = FLAC__bool
-FLAC__metadata_simple_iterator_is_last.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]
 off_t = __off_t
-FLAC__metadata_simple_iterator_get_block_offset = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_get_block_offset
-FLAC__metadata_simple_iterator_get_block_offset.restype = off_t
-FLAC__metadata_simple_iterator_get_block_offset.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]
-FLAC__metadata_simple_iterator_get_block_type = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_get_block_type
-FLAC__metadata_simple_iterator_get_block_type.restype = FLAC__MetadataType
-FLAC__metadata_simple_iterator_get_block_type.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]
-FLAC__metadata_simple_iterator_get_block_length = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_get_block_length
-FLAC__metadata_simple_iterator_get_block_length.restype = c_uint
-FLAC__metadata_simple_iterator_get_block_length.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]
-FLAC__metadata_simple_iterator_get_application_id = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_get_application_id
-FLAC__metadata_simple_iterator_get_application_id.restype = FLAC__bool
-FLAC__metadata_simple_iterator_get_application_id.argtypes = [POINTER(FLAC__Metadata_SimpleIterator), POINTER(FLAC__byte)]
-FLAC__metadata_simple_iterator_get_block = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_get_block
-FLAC__metadata_simple_iterator_get_block.restype = POINTER(FLAC__StreamMetadata)
-FLAC__metadata_simple_iterator_get_block.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]
-FLAC__metadata_simple_iterator_set_block = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_set_block
-FLAC__metadata_simple_iterator_set_block.restype = FLAC__bool
-FLAC__metadata_simple_iterator_set_block.argtypes = [POINTER(FLAC__Metadata_SimpleIterator), POINTER(FLAC__StreamMetadata), FLAC__bool]
-FLAC__metadata_simple_iterator_insert_block_after = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_insert_block_after
-FLAC__metadata_simple_iterator_insert_block_after.restype = FLAC__bool
-FLAC__metadata_simple_iterator_insert_block_after.argtypes = [POINTER(FLAC__Metadata_SimpleIterator), POINTER(FLAC__StreamMetadata), FLAC__bool]
-FLAC__metadata_simple_iterator_delete_block = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_delete_block
-FLAC__metadata_simple_iterator_delete_block.restype = FLAC__bool
-FLAC__metadata_simple_iterator_delete_block.argtypes = [POINTER(FLAC__Metadata_SimpleIterator), FLAC__bool]
-class FLAC__Metadata_Chain(Structure):
-    pass
-FLAC__Metadata_Chain._fields_ = [
-]
-class FLAC__Metadata_Iterator(Structure):
-    pass
-FLAC__Metadata_Iterator._fields_ = [
-]
 
 # values for enumeration 'FLAC__Metadata_ChainStatus'
 FLAC__Metadata_ChainStatus = c_int # enum
-FLAC__Metadata_ChainStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__Metadata_ChainStatusString')
-FLAC__metadata_chain_new = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_new
-FLAC__metadata_chain_new.restype = POINTER(FLAC__Metadata_Chain)
-FLAC__metadata_chain_new.argtypes = []
-FLAC__metadata_chain_delete = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_delete
-FLAC__metadata_chain_delete.restype = None
-FLAC__metadata_chain_delete.argtypes = [POINTER(FLAC__Metadata_Chain)]
-FLAC__metadata_chain_status = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_status
-FLAC__metadata_chain_status.restype = FLAC__Metadata_ChainStatus
-FLAC__metadata_chain_status.argtypes = [POINTER(FLAC__Metadata_Chain)]
-FLAC__metadata_chain_read = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_read
-FLAC__metadata_chain_read.restype = FLAC__bool
-FLAC__metadata_chain_read.argtypes = [POINTER(FLAC__Metadata_Chain), STRING]
-FLAC__metadata_chain_read_ogg = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_read_ogg
-FLAC__metadata_chain_read_ogg.restype = FLAC__bool
-FLAC__metadata_chain_read_ogg.argtypes = [POINTER(FLAC__Metadata_Chain), STRING]
-FLAC__metadata_chain_read_with_callbacks = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_read_with_callbacks
-FLAC__metadata_chain_read_with_callbacks.restype = FLAC__bool
-FLAC__metadata_chain_read_with_callbacks.argtypes = [POINTER(FLAC__Metadata_Chain), FLAC__IOHandle, FLAC__IOCallbacks]
-FLAC__metadata_chain_read_ogg_with_callbacks = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_read_ogg_with_callbacks
-FLAC__metadata_chain_read_ogg_with_callbacks.restype = FLAC__bool
-FLAC__metadata_chain_read_ogg_with_callbacks.argtypes = [POINTER(FLAC__Metadata_Chain), FLAC__IOHandle, FLAC__IOCallbacks]
-FLAC__metadata_chain_check_if_tempfile_needed = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_check_if_tempfile_needed
-FLAC__metadata_chain_check_if_tempfile_needed.restype = FLAC__bool
-FLAC__metadata_chain_check_if_tempfile_needed.argtypes = [POINTER(FLAC__Metadata_Chain), FLAC__bool]
-FLAC__metadata_chain_write = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_write
-FLAC__metadata_chain_write.restype = FLAC__bool
-FLAC__metadata_chain_write.argtypes = [POINTER(FLAC__Metadata_Chain), FLAC__bool, FLAC__bool]
-FLAC__metadata_chain_write_with_callbacks = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_write_with_callbacks
-FLAC__metadata_chain_write_with_callbacks.restype = FLAC__bool
-FLAC__metadata_chain_write_with_callbacks.argtypes = [POINTER(FLAC__Metadata_Chain), FLAC__bool, FLAC__IOHandle, FLAC__IOCallbacks]
-FLAC__metadata_chain_write_with_callbacks_and_tempfile = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_write_with_callbacks_and_tempfile
-FLAC__metadata_chain_write_with_callbacks_and_tempfile.restype = FLAC__bool
-FLAC__metadata_chain_write_with_callbacks_and_tempfile.argtypes = [POINTER(FLAC__Metadata_Chain), FLAC__bool, FLAC__IOHandle, FLAC__IOCallbacks, FLAC__IOHandle, FLAC__IOCallbacks]
-FLAC__metadata_chain_merge_padding = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_merge_padding
-FLAC__metadata_chain_merge_padding.restype = None
-FLAC__metadata_chain_merge_padding.argtypes = [POINTER(FLAC__Metadata_Chain)]
-FLAC__metadata_chain_sort_padding = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_sort_padding
-FLAC__metadata_chain_sort_padding.restype = None
-FLAC__metadata_chain_sort_padding.argtypes = [POINTER(FLAC__Metadata_Chain)]
-FLAC__metadata_iterator_new = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_new
-FLAC__metadata_iterator_new.restype = POINTER(FLAC__Metadata_Iterator)
-FLAC__metadata_iterator_new.argtypes = []
-FLAC__metadata_iterator_delete = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_delete
-FLAC__metadata_iterator_delete.restype = None
-FLAC__metadata_iterator_delete.argtypes = [POINTER(FLAC__Metadata_Iterator)]
-FLAC__metadata_iterator_init = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_init
-FLAC__metadata_iterator_init.restype = None
-FLAC__metadata_iterator_init.argtypes = [POINTER(FLAC__Metadata_Iterator), POINTER(FLAC__Metadata_Chain)]
-FLAC__metadata_iterator_next = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_next
-FLAC__metadata_iterator_next.restype = FLAC__bool
-FLAC__metadata_iterator_next.argtypes = [POINTER(FLAC__Metadata_Iterator)]
-FLAC__metadata_iterator_prev = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_prev
-FLAC__metadata_iterator_prev.restype = FLAC__bool
-FLAC__metadata_iterator_prev.argtypes = [POINTER(FLAC__Metadata_Iterator)]
-FLAC__metadata_iterator_get_block_type = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_get_block_type
-FLAC__metadata_iterator_get_block_type.restype = FLAC__MetadataType
-FLAC__metadata_iterator_get_block_type.argtypes = [POINTER(FLAC__Metadata_Iterator)]
-FLAC__metadata_iterator_get_block = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_get_block
-FLAC__metadata_iterator_get_block.restype = POINTER(FLAC__StreamMetadata)
-FLAC__metadata_iterator_get_block.argtypes = [POINTER(FLAC__Metadata_Iterator)]
-FLAC__metadata_iterator_set_block = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_set_block
-FLAC__metadata_iterator_set_block.restype = FLAC__bool
-FLAC__metadata_iterator_set_block.argtypes = [POINTER(FLAC__Metadata_Iterator), POINTER(FLAC__StreamMetadata)]
-FLAC__metadata_iterator_delete_block = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_delete_block
-FLAC__metadata_iterator_delete_block.restype = FLAC__bool
-FLAC__metadata_iterator_delete_block.argtypes = [POINTER(FLAC__Metadata_Iterator), FLAC__bool]
-FLAC__metadata_iterator_insert_block_before = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_insert_block_before
-FLAC__metadata_iterator_insert_block_before.restype = FLAC__bool
-FLAC__metadata_iterator_insert_block_before.argtypes = [POINTER(FLAC__Metadata_Iterator), POINTER(FLAC__StreamMetadata)]
-FLAC__metadata_iterator_insert_block_after = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_insert_block_after
-FLAC__metadata_iterator_insert_block_after.restype = FLAC__bool
-FLAC__metadata_iterator_insert_block_after.argtypes = [POINTER(FLAC__Metadata_Iterator), POINTER(FLAC__StreamMetadata)]
-FLAC__metadata_object_new = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_new
-FLAC__metadata_object_new.restype = POINTER(FLAC__StreamMetadata)
-FLAC__metadata_object_new.argtypes = [FLAC__MetadataType]
-FLAC__metadata_object_clone = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_clone
-FLAC__metadata_object_clone.restype = POINTER(FLAC__StreamMetadata)
-FLAC__metadata_object_clone.argtypes = [POINTER(FLAC__StreamMetadata)]
-FLAC__metadata_object_delete = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_delete
-FLAC__metadata_object_delete.restype = None
-FLAC__metadata_object_delete.argtypes = [POINTER(FLAC__StreamMetadata)]
-FLAC__metadata_object_is_equal = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_is_equal
-FLAC__metadata_object_is_equal.restype = FLAC__bool
-FLAC__metadata_object_is_equal.argtypes = [POINTER(FLAC__StreamMetadata), POINTER(FLAC__StreamMetadata)]
-FLAC__metadata_object_application_set_data = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_application_set_data
-FLAC__metadata_object_application_set_data.restype = FLAC__bool
-FLAC__metadata_object_application_set_data.argtypes = [POINTER(FLAC__StreamMetadata), POINTER(FLAC__byte), c_uint, FLAC__bool]
-FLAC__metadata_object_seektable_resize_points = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_resize_points
-FLAC__metadata_object_seektable_resize_points.restype = FLAC__bool
-FLAC__metadata_object_seektable_resize_points.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]
-FLAC__metadata_object_seektable_set_point = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_set_point
-FLAC__metadata_object_seektable_set_point.restype = None
-FLAC__metadata_object_seektable_set_point.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, FLAC__StreamMetadata_SeekPoint]
-FLAC__metadata_object_seektable_insert_point = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_insert_point
-FLAC__metadata_object_seektable_insert_point.restype = FLAC__bool
-FLAC__metadata_object_seektable_insert_point.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, FLAC__StreamMetadata_SeekPoint]
-FLAC__metadata_object_seektable_delete_point = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_delete_point
-FLAC__metadata_object_seektable_delete_point.restype = FLAC__bool
-FLAC__metadata_object_seektable_delete_point.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]
-FLAC__metadata_object_seektable_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_is_legal
-FLAC__metadata_object_seektable_is_legal.restype = FLAC__bool
-FLAC__metadata_object_seektable_is_legal.argtypes = [POINTER(FLAC__StreamMetadata)]
-FLAC__metadata_object_seektable_template_append_placeholders = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_template_append_placeholders
-FLAC__metadata_object_seektable_template_append_placeholders.restype = FLAC__bool
-FLAC__metadata_object_seektable_template_append_placeholders.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]
-FLAC__metadata_object_seektable_template_append_point = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_template_append_point
-FLAC__metadata_object_seektable_template_append_point.restype = FLAC__bool
-FLAC__metadata_object_seektable_template_append_point.argtypes = [POINTER(FLAC__StreamMetadata), FLAC__uint64]
-FLAC__metadata_object_seektable_template_append_points = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_template_append_points
-FLAC__metadata_object_seektable_template_append_points.restype = FLAC__bool
-FLAC__metadata_object_seektable_template_append_points.argtypes = [POINTER(FLAC__StreamMetadata), POINTER(FLAC__uint64), c_uint]
-FLAC__metadata_object_seektable_template_append_spaced_points = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_template_append_spaced_points
-FLAC__metadata_object_seektable_template_append_spaced_points.restype = FLAC__bool
-FLAC__metadata_object_seektable_template_append_spaced_points.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, FLAC__uint64]
-FLAC__metadata_object_seektable_template_append_spaced_points_by_samples = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_template_append_spaced_points_by_samples
-FLAC__metadata_object_seektable_template_append_spaced_points_by_samples.restype = FLAC__bool
-FLAC__metadata_object_seektable_template_append_spaced_points_by_samples.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, FLAC__uint64]
-FLAC__metadata_object_seektable_template_sort = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_template_sort
-FLAC__metadata_object_seektable_template_sort.restype = FLAC__bool
-FLAC__metadata_object_seektable_template_sort.argtypes = [POINTER(FLAC__StreamMetadata), FLAC__bool]
-FLAC__metadata_object_vorbiscomment_set_vendor_string = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_set_vendor_string
-FLAC__metadata_object_vorbiscomment_set_vendor_string.restype = FLAC__bool
-FLAC__metadata_object_vorbiscomment_set_vendor_string.argtypes = [POINTER(FLAC__StreamMetadata), FLAC__StreamMetadata_VorbisComment_Entry, FLAC__bool]
-FLAC__metadata_object_vorbiscomment_resize_comments = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_resize_comments
-FLAC__metadata_object_vorbiscomment_resize_comments.restype = FLAC__bool
-FLAC__metadata_object_vorbiscomment_resize_comments.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]
-FLAC__metadata_object_vorbiscomment_set_comment = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_set_comment
-FLAC__metadata_object_vorbiscomment_set_comment.restype = FLAC__bool
-FLAC__metadata_object_vorbiscomment_set_comment.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, FLAC__StreamMetadata_VorbisComment_Entry, FLAC__bool]
-FLAC__metadata_object_vorbiscomment_insert_comment = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_insert_comment
-FLAC__metadata_object_vorbiscomment_insert_comment.restype = FLAC__bool
-FLAC__metadata_object_vorbiscomment_insert_comment.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, FLAC__StreamMetadata_VorbisComment_Entry, FLAC__bool]
-FLAC__metadata_object_vorbiscomment_append_comment = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_append_comment
-FLAC__metadata_object_vorbiscomment_append_comment.restype = FLAC__bool
-FLAC__metadata_object_vorbiscomment_append_comment.argtypes = [POINTER(FLAC__StreamMetadata), FLAC__StreamMetadata_VorbisComment_Entry, FLAC__bool]
-FLAC__metadata_object_vorbiscomment_replace_comment = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_replace_comment
-FLAC__metadata_object_vorbiscomment_replace_comment.restype = FLAC__bool
-FLAC__metadata_object_vorbiscomment_replace_comment.argtypes = [POINTER(FLAC__StreamMetadata), FLAC__StreamMetadata_VorbisComment_Entry, FLAC__bool, FLAC__bool]
-FLAC__metadata_object_vorbiscomment_delete_comment = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_delete_comment
-FLAC__metadata_object_vorbiscomment_delete_comment.restype = FLAC__bool
-FLAC__metadata_object_vorbiscomment_delete_comment.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]
-FLAC__metadata_object_vorbiscomment_entry_from_name_value_pair = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_entry_from_name_value_pair
-FLAC__metadata_object_vorbiscomment_entry_from_name_value_pair.restype = FLAC__bool
-FLAC__metadata_object_vorbiscomment_entry_from_name_value_pair.argtypes = [POINTER(FLAC__StreamMetadata_VorbisComment_Entry), STRING, STRING]
-FLAC__metadata_object_vorbiscomment_entry_to_name_value_pair = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_entry_to_name_value_pair
-FLAC__metadata_object_vorbiscomment_entry_to_name_value_pair.restype = FLAC__bool
-FLAC__metadata_object_vorbiscomment_entry_to_name_value_pair.argtypes = [FLAC__StreamMetadata_VorbisComment_Entry, POINTER(STRING), POINTER(STRING)]
-FLAC__metadata_object_vorbiscomment_entry_matches = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_entry_matches
-FLAC__metadata_object_vorbiscomment_entry_matches.restype = FLAC__bool
-FLAC__metadata_object_vorbiscomment_entry_matches.argtypes = [FLAC__StreamMetadata_VorbisComment_Entry, STRING, c_uint]
-FLAC__metadata_object_vorbiscomment_find_entry_from = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_find_entry_from
-FLAC__metadata_object_vorbiscomment_find_entry_from.restype = c_int
-FLAC__metadata_object_vorbiscomment_find_entry_from.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, STRING]
-FLAC__metadata_object_vorbiscomment_remove_entry_matching = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_remove_entry_matching
-FLAC__metadata_object_vorbiscomment_remove_entry_matching.restype = c_int
-FLAC__metadata_object_vorbiscomment_remove_entry_matching.argtypes = [POINTER(FLAC__StreamMetadata), STRING]
-FLAC__metadata_object_vorbiscomment_remove_entries_matching = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_remove_entries_matching
-FLAC__metadata_object_vorbiscomment_remove_entries_matching.restype = c_int
-FLAC__metadata_object_vorbiscomment_remove_entries_matching.argtypes = [POINTER(FLAC__StreamMetadata), STRING]
-FLAC__metadata_object_cuesheet_track_new = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_track_new
-FLAC__metadata_object_cuesheet_track_new.restype = POINTER(FLAC__StreamMetadata_CueSheet_Track)
-FLAC__metadata_object_cuesheet_track_new.argtypes = []
-FLAC__metadata_object_cuesheet_track_clone = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_track_clone
-FLAC__metadata_object_cuesheet_track_clone.restype = POINTER(FLAC__StreamMetadata_CueSheet_Track)
-FLAC__metadata_object_cuesheet_track_clone.argtypes = [POINTER(FLAC__StreamMetadata_CueSheet_Track)]
-FLAC__metadata_object_cuesheet_track_delete = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_track_delete
-FLAC__metadata_object_cuesheet_track_delete.restype = None
-FLAC__metadata_object_cuesheet_track_delete.argtypes = [POINTER(FLAC__StreamMetadata_CueSheet_Track)]
-FLAC__metadata_object_cuesheet_track_resize_indices = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_track_resize_indices
-FLAC__metadata_object_cuesheet_track_resize_indices.restype = FLAC__bool
-FLAC__metadata_object_cuesheet_track_resize_indices.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, c_uint]
-FLAC__metadata_object_cuesheet_track_insert_index = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_track_insert_index
-FLAC__metadata_object_cuesheet_track_insert_index.restype = FLAC__bool
-FLAC__metadata_object_cuesheet_track_insert_index.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, c_uint, FLAC__StreamMetadata_CueSheet_Index]
-FLAC__metadata_object_cuesheet_track_insert_blank_index = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_track_insert_blank_index
-FLAC__metadata_object_cuesheet_track_insert_blank_index.restype = FLAC__bool
-FLAC__metadata_object_cuesheet_track_insert_blank_index.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, c_uint]
-FLAC__metadata_object_cuesheet_track_delete_index = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_track_delete_index
-FLAC__metadata_object_cuesheet_track_delete_index.restype = FLAC__bool
-FLAC__metadata_object_cuesheet_track_delete_index.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, c_uint]
-FLAC__metadata_object_cuesheet_resize_tracks = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_resize_tracks
-FLAC__metadata_object_cuesheet_resize_tracks.restype = FLAC__bool
-FLAC__metadata_object_cuesheet_resize_tracks.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]
-FLAC__metadata_object_cuesheet_set_track = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_set_track
-FLAC__metadata_object_cuesheet_set_track.restype = FLAC__bool
-FLAC__metadata_object_cuesheet_set_track.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, POINTER(FLAC__StreamMetadata_CueSheet_Track), FLAC__bool]
-FLAC__metadata_object_cuesheet_insert_track = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_insert_track
-FLAC__metadata_object_cuesheet_insert_track.restype = FLAC__bool
-FLAC__metadata_object_cuesheet_insert_track.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, POINTER(FLAC__StreamMetadata_CueSheet_Track), FLAC__bool]
-FLAC__metadata_object_cuesheet_insert_blank_track = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_insert_blank_track
-FLAC__metadata_object_cuesheet_insert_blank_track.restype = FLAC__bool
-FLAC__metadata_object_cuesheet_insert_blank_track.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]
-FLAC__metadata_object_cuesheet_delete_track = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_delete_track
-FLAC__metadata_object_cuesheet_delete_track.restype = FLAC__bool
-FLAC__metadata_object_cuesheet_delete_track.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]
-FLAC__metadata_object_cuesheet_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_is_legal
-FLAC__metadata_object_cuesheet_is_legal.restype = FLAC__bool
-FLAC__metadata_object_cuesheet_is_legal.argtypes = [POINTER(FLAC__StreamMetadata), FLAC__bool, POINTER(STRING)]
-FLAC__metadata_object_cuesheet_calculate_cddb_id = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_calculate_cddb_id
-FLAC__metadata_object_cuesheet_calculate_cddb_id.restype = FLAC__uint32
-FLAC__metadata_object_cuesheet_calculate_cddb_id.argtypes = [POINTER(FLAC__StreamMetadata)]
-FLAC__metadata_object_picture_set_mime_type = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_picture_set_mime_type
-FLAC__metadata_object_picture_set_mime_type.restype = FLAC__bool
-FLAC__metadata_object_picture_set_mime_type.argtypes = [POINTER(FLAC__StreamMetadata), STRING, FLAC__bool]
-FLAC__metadata_object_picture_set_description = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_picture_set_description
-FLAC__metadata_object_picture_set_description.restype = FLAC__bool
-FLAC__metadata_object_picture_set_description.argtypes = [POINTER(FLAC__StreamMetadata), POINTER(FLAC__byte), FLAC__bool]
-FLAC__metadata_object_picture_set_data = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_picture_set_data
-FLAC__metadata_object_picture_set_data.restype = FLAC__bool
-FLAC__metadata_object_picture_set_data.argtypes = [POINTER(FLAC__StreamMetadata), POINTER(FLAC__byte), FLAC__uint32, FLAC__bool]
-FLAC__metadata_object_picture_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_picture_is_legal
-FLAC__metadata_object_picture_is_legal.restype = FLAC__bool
-FLAC__metadata_object_picture_is_legal.argtypes = [POINTER(FLAC__StreamMetadata), POINTER(STRING)]
 int8_t = c_int8
 FLAC__int8 = int8_t
 int16_t = c_int16
@@ -1278,678 +614,53 @@ FLAC__int16 = int16_t
 
 # values for enumeration 'FLAC__StreamDecoderState'
 FLAC__StreamDecoderState = c_int # enum
-FLAC__StreamDecoderStateString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderStateString')
 
 # values for enumeration 'FLAC__StreamDecoderInitStatus'
 FLAC__StreamDecoderInitStatus = c_int # enum
-FLAC__StreamDecoderInitStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderInitStatusString')
 
 # values for enumeration 'FLAC__StreamDecoderReadStatus'
 FLAC__StreamDecoderReadStatus = c_int # enum
-FLAC__StreamDecoderReadStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderReadStatusString')
 
 # values for enumeration 'FLAC__StreamDecoderSeekStatus'
 FLAC__StreamDecoderSeekStatus = c_int # enum
-FLAC__StreamDecoderSeekStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderSeekStatusString')
 
 # values for enumeration 'FLAC__StreamDecoderTellStatus'
 FLAC__StreamDecoderTellStatus = c_int # enum
-FLAC__StreamDecoderTellStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderTellStatusString')
 
 # values for enumeration 'FLAC__StreamDecoderLengthStatus'
 FLAC__StreamDecoderLengthStatus = c_int # enum
-FLAC__StreamDecoderLengthStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderLengthStatusString')
 
 # values for enumeration 'FLAC__StreamDecoderWriteStatus'
 FLAC__StreamDecoderWriteStatus = c_int # enum
-FLAC__StreamDecoderWriteStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderWriteStatusString')
 
 # values for enumeration 'FLAC__StreamDecoderErrorStatus'
 FLAC__StreamDecoderErrorStatus = c_int # enum
-FLAC__StreamDecoderErrorStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderErrorStatusString')
-class FLAC__StreamDecoderProtected(Structure):
-    pass
-FLAC__StreamDecoderProtected._fields_ = [
-]
-class FLAC__StreamDecoderPrivate(Structure):
-    pass
-FLAC__StreamDecoderPrivate._fields_ = [
-]
-class FLAC__StreamDecoder(Structure):
-    pass
-FLAC__StreamDecoder._fields_ = [
-    ('protected_', POINTER(FLAC__StreamDecoderProtected)),
-    ('private_', POINTER(FLAC__StreamDecoderPrivate)),
-]
-FLAC__StreamDecoderReadCallback = CFUNCTYPE(FLAC__StreamDecoderReadStatus, POINTER(FLAC__StreamDecoder), POINTER(FLAC__byte), POINTER(size_t), c_void_p)
-FLAC__StreamDecoderSeekCallback = CFUNCTYPE(FLAC__StreamDecoderSeekStatus, POINTER(FLAC__StreamDecoder), FLAC__uint64, c_void_p)
-FLAC__StreamDecoderTellCallback = CFUNCTYPE(FLAC__StreamDecoderTellStatus, POINTER(FLAC__StreamDecoder), POINTER(FLAC__uint64), c_void_p)
-FLAC__StreamDecoderLengthCallback = CFUNCTYPE(FLAC__StreamDecoderLengthStatus, POINTER(FLAC__StreamDecoder), POINTER(FLAC__uint64), c_void_p)
-FLAC__StreamDecoderEofCallback = CFUNCTYPE(FLAC__bool, POINTER(FLAC__StreamDecoder), c_void_p)
-FLAC__StreamDecoderWriteCallback = CFUNCTYPE(FLAC__StreamDecoderWriteStatus, POINTER(FLAC__StreamDecoder), POINTER(FLAC__Frame), POINTER(POINTER(FLAC__int32)), c_void_p)
-FLAC__StreamDecoderMetadataCallback = CFUNCTYPE(None, POINTER(FLAC__StreamDecoder), POINTER(FLAC__StreamMetadata), c_void_p)
-FLAC__StreamDecoderErrorCallback = CFUNCTYPE(None, POINTER(FLAC__StreamDecoder), FLAC__StreamDecoderErrorStatus, c_void_p)
-FLAC__stream_decoder_new = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_new
-FLAC__stream_decoder_new.restype = POINTER(FLAC__StreamDecoder)
-FLAC__stream_decoder_new.argtypes = []
-FLAC__stream_decoder_delete = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_delete
-FLAC__stream_decoder_delete.restype = None
-FLAC__stream_decoder_delete.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_set_ogg_serial_number = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_ogg_serial_number
-FLAC__stream_decoder_set_ogg_serial_number.restype = FLAC__bool
-FLAC__stream_decoder_set_ogg_serial_number.argtypes = [POINTER(FLAC__StreamDecoder), c_long]
-FLAC__stream_decoder_set_md5_checking = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_md5_checking
-FLAC__stream_decoder_set_md5_checking.restype = FLAC__bool
-FLAC__stream_decoder_set_md5_checking.argtypes = [POINTER(FLAC__StreamDecoder), FLAC__bool]
-FLAC__stream_decoder_set_metadata_respond = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_metadata_respond
-FLAC__stream_decoder_set_metadata_respond.restype = FLAC__bool
-FLAC__stream_decoder_set_metadata_respond.argtypes = [POINTER(FLAC__StreamDecoder), FLAC__MetadataType]
-FLAC__stream_decoder_set_metadata_respond_application = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_metadata_respond_application
-FLAC__stream_decoder_set_metadata_respond_application.restype = FLAC__bool
-FLAC__stream_decoder_set_metadata_respond_application.argtypes = [POINTER(FLAC__StreamDecoder), POINTER(FLAC__byte)]
-FLAC__stream_decoder_set_metadata_respond_all = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_metadata_respond_all
-FLAC__stream_decoder_set_metadata_respond_all.restype = FLAC__bool
-FLAC__stream_decoder_set_metadata_respond_all.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_set_metadata_ignore = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_metadata_ignore
-FLAC__stream_decoder_set_metadata_ignore.restype = FLAC__bool
-FLAC__stream_decoder_set_metadata_ignore.argtypes = [POINTER(FLAC__StreamDecoder), FLAC__MetadataType]
-FLAC__stream_decoder_set_metadata_ignore_application = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_metadata_ignore_application
-FLAC__stream_decoder_set_metadata_ignore_application.restype = FLAC__bool
-FLAC__stream_decoder_set_metadata_ignore_application.argtypes = [POINTER(FLAC__StreamDecoder), POINTER(FLAC__byte)]
-FLAC__stream_decoder_set_metadata_ignore_all = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_metadata_ignore_all
-FLAC__stream_decoder_set_metadata_ignore_all.restype = FLAC__bool
-FLAC__stream_decoder_set_metadata_ignore_all.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_get_state = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_state
-FLAC__stream_decoder_get_state.restype = FLAC__StreamDecoderState
-FLAC__stream_decoder_get_state.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_get_resolved_state_string = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_resolved_state_string
-FLAC__stream_decoder_get_resolved_state_string.restype = STRING
-FLAC__stream_decoder_get_resolved_state_string.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_get_md5_checking = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_md5_checking
-FLAC__stream_decoder_get_md5_checking.restype = FLAC__bool
-FLAC__stream_decoder_get_md5_checking.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_get_total_samples = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_total_samples
-FLAC__stream_decoder_get_total_samples.restype = FLAC__uint64
-FLAC__stream_decoder_get_total_samples.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_get_channels = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_channels
-FLAC__stream_decoder_get_channels.restype = c_uint
-FLAC__stream_decoder_get_channels.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_get_channel_assignment = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_channel_assignment
-FLAC__stream_decoder_get_channel_assignment.restype = FLAC__ChannelAssignment
-FLAC__stream_decoder_get_channel_assignment.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_get_bits_per_sample = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_bits_per_sample
-FLAC__stream_decoder_get_bits_per_sample.restype = c_uint
-FLAC__stream_decoder_get_bits_per_sample.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_get_sample_rate = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_sample_rate
-FLAC__stream_decoder_get_sample_rate.restype = c_uint
-FLAC__stream_decoder_get_sample_rate.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_get_blocksize = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_blocksize
-FLAC__stream_decoder_get_blocksize.restype = c_uint
-FLAC__stream_decoder_get_blocksize.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_get_decode_position = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_decode_position
-FLAC__stream_decoder_get_decode_position.restype = FLAC__bool
-FLAC__stream_decoder_get_decode_position.argtypes = [POINTER(FLAC__StreamDecoder), POINTER(FLAC__uint64)]
-FLAC__stream_decoder_init_stream = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_init_stream
-FLAC__stream_decoder_init_stream.restype = FLAC__StreamDecoderInitStatus
-FLAC__stream_decoder_init_stream.argtypes = [POINTER(FLAC__StreamDecoder), FLAC__StreamDecoderReadCallback, FLAC__StreamDecoderSeekCallback, FLAC__StreamDecoderTellCallback, FLAC__StreamDecoderLengthCallback, FLAC__StreamDecoderEofCallback, FLAC__StreamDecoderWriteCallback, FLAC__StreamDecoderMetadataCallback, FLAC__StreamDecoderErrorCallback, c_void_p]
-FLAC__stream_decoder_init_ogg_stream = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_init_ogg_stream
-FLAC__stream_decoder_init_ogg_stream.restype = FLAC__StreamDecoderInitStatus
-FLAC__stream_decoder_init_ogg_stream.argtypes = [POINTER(FLAC__StreamDecoder), FLAC__StreamDecoderReadCallback, FLAC__StreamDecoderSeekCallback, FLAC__StreamDecoderTellCallback, FLAC__StreamDecoderLengthCallback, FLAC__StreamDecoderEofCallback, FLAC__StreamDecoderWriteCallback, FLAC__StreamDecoderMetadataCallback, FLAC__StreamDecoderErrorCallback, c_void_p]
-FILE = _IO_FILE
-FLAC__stream_decoder_init_FILE = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_init_FILE
-FLAC__stream_decoder_init_FILE.restype = FLAC__StreamDecoderInitStatus
-FLAC__stream_decoder_init_FILE.argtypes = [POINTER(FLAC__StreamDecoder), POINTER(FILE), FLAC__StreamDecoderWriteCallback, FLAC__StreamDecoderMetadataCallback, FLAC__StreamDecoderErrorCallback, c_void_p]
-FLAC__stream_decoder_init_ogg_FILE = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_init_ogg_FILE
-FLAC__stream_decoder_init_ogg_FILE.restype = FLAC__StreamDecoderInitStatus
-FLAC__stream_decoder_init_ogg_FILE.argtypes = [POINTER(FLAC__StreamDecoder), POINTER(FILE), FLAC__StreamDecoderWriteCallback, FLAC__StreamDecoderMetadataCallback, FLAC__StreamDecoderErrorCallback, c_void_p]
-FLAC__stream_decoder_init_file = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_init_file
-FLAC__stream_decoder_init_file.restype = FLAC__StreamDecoderInitStatus
-FLAC__stream_decoder_init_file.argtypes = [POINTER(FLAC__StreamDecoder), STRING, FLAC__StreamDecoderWriteCallback, FLAC__StreamDecoderMetadataCallback, FLAC__StreamDecoderErrorCallback, c_void_p]
-FLAC__stream_decoder_init_ogg_file = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_init_ogg_file
-FLAC__stream_decoder_init_ogg_file.restype = FLAC__StreamDecoderInitStatus
-FLAC__stream_decoder_init_ogg_file.argtypes = [POINTER(FLAC__StreamDecoder), STRING, FLAC__StreamDecoderWriteCallback, FLAC__StreamDecoderMetadataCallback, FLAC__StreamDecoderErrorCallback, c_void_p]
-FLAC__stream_decoder_finish = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_finish
-FLAC__stream_decoder_finish.restype = FLAC__bool
-FLAC__stream_decoder_finish.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_flush = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_flush
-FLAC__stream_decoder_flush.restype = FLAC__bool
-FLAC__stream_decoder_flush.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_reset = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_reset
-FLAC__stream_decoder_reset.restype = FLAC__bool
-FLAC__stream_decoder_reset.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_process_single = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_process_single
-FLAC__stream_decoder_process_single.restype = FLAC__bool
-FLAC__stream_decoder_process_single.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_process_until_end_of_metadata = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_process_until_end_of_metadata
-FLAC__stream_decoder_process_until_end_of_metadata.restype = FLAC__bool
-FLAC__stream_decoder_process_until_end_of_metadata.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_process_until_end_of_stream = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_process_until_end_of_stream
-FLAC__stream_decoder_process_until_end_of_stream.restype = FLAC__bool
-FLAC__stream_decoder_process_until_end_of_stream.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_skip_single_frame = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_skip_single_frame
-FLAC__stream_decoder_skip_single_frame.restype = FLAC__bool
-FLAC__stream_decoder_skip_single_frame.argtypes = [POINTER(FLAC__StreamDecoder)]
-FLAC__stream_decoder_seek_absolute = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_seek_absolute
-FLAC__stream_decoder_seek_absolute.restype = FLAC__bool
-FLAC__stream_decoder_seek_absolute.argtypes = [POINTER(FLAC__StreamDecoder), FLAC__uint64]
 
 # values for enumeration 'FLAC__StreamEncoderState'
 FLAC__StreamEncoderState = c_int # enum
-FLAC__StreamEncoderStateString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamEncoderStateString')
 
 # values for enumeration 'FLAC__StreamEncoderInitStatus'
 FLAC__StreamEncoderInitStatus = c_int # enum
-FLAC__StreamEncoderInitStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamEncoderInitStatusString')
 
 # values for enumeration 'FLAC__StreamEncoderReadStatus'
 FLAC__StreamEncoderReadStatus = c_int # enum
-FLAC__StreamEncoderReadStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamEncoderReadStatusString')
 
 # values for enumeration 'FLAC__StreamEncoderWriteStatus'
 FLAC__StreamEncoderWriteStatus = c_int # enum
-FLAC__StreamEncoderWriteStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamEncoderWriteStatusString')
 
 # values for enumeration 'FLAC__StreamEncoderSeekStatus'
 FLAC__StreamEncoderSeekStatus = c_int # enum
-FLAC__StreamEncoderSeekStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamEncoderSeekStatusString')
 
 # values for enumeration 'FLAC__StreamEncoderTellStatus'
 FLAC__StreamEncoderTellStatus = c_int # enum
-FLAC__StreamEncoderTellStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamEncoderTellStatusString')
-class FLAC__StreamEncoderProtected(Structure):
-    pass
-FLAC__StreamEncoderProtected._fields_ = [
-]
-class FLAC__StreamEncoderPrivate(Structure):
-    pass
-FLAC__StreamEncoderPrivate._fields_ = [
-]
-class FLAC__StreamEncoder(Structure):
-    pass
-FLAC__StreamEncoder._fields_ = [
-    ('protected_', POINTER(FLAC__StreamEncoderProtected)),
-    ('private_', POINTER(FLAC__StreamEncoderPrivate)),
-]
-FLAC__StreamEncoderReadCallback = CFUNCTYPE(FLAC__StreamEncoderReadStatus, POINTER(FLAC__StreamEncoder), POINTER(FLAC__byte), POINTER(size_t), c_void_p)
-FLAC__StreamEncoderWriteCallback = CFUNCTYPE(FLAC__StreamEncoderWriteStatus, POINTER(FLAC__StreamEncoder), POINTER(FLAC__byte), size_t, c_uint, c_uint, c_void_p)
-FLAC__StreamEncoderSeekCallback = CFUNCTYPE(FLAC__StreamEncoderSeekStatus, POINTER(FLAC__StreamEncoder), FLAC__uint64, c_void_p)
-FLAC__StreamEncoderTellCallback = CFUNCTYPE(FLAC__StreamEncoderTellStatus, POINTER(FLAC__StreamEncoder), POINTER(FLAC__uint64), c_void_p)
-FLAC__StreamEncoderMetadataCallback = CFUNCTYPE(None, POINTER(FLAC__StreamEncoder), POINTER(FLAC__StreamMetadata), c_void_p)
-FLAC__StreamEncoderProgressCallback = CFUNCTYPE(None, POINTER(FLAC__StreamEncoder), FLAC__uint64, FLAC__uint64, c_uint, c_uint, c_void_p)
-FLAC__stream_encoder_new = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_new
-FLAC__stream_encoder_new.restype = POINTER(FLAC__StreamEncoder)
-FLAC__stream_encoder_new.argtypes = []
-FLAC__stream_encoder_delete = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_delete
-FLAC__stream_encoder_delete.restype = None
-FLAC__stream_encoder_delete.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_set_ogg_serial_number = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_ogg_serial_number
-FLAC__stream_encoder_set_ogg_serial_number.restype = FLAC__bool
-FLAC__stream_encoder_set_ogg_serial_number.argtypes = [POINTER(FLAC__StreamEncoder), c_long]
-FLAC__stream_encoder_set_verify = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_verify
-FLAC__stream_encoder_set_verify.restype = FLAC__bool
-FLAC__stream_encoder_set_verify.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__bool]
-FLAC__stream_encoder_set_streamable_subset = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_streamable_subset
-FLAC__stream_encoder_set_streamable_subset.restype = FLAC__bool
-FLAC__stream_encoder_set_streamable_subset.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__bool]
-FLAC__stream_encoder_set_channels = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_channels
-FLAC__stream_encoder_set_channels.restype = FLAC__bool
-FLAC__stream_encoder_set_channels.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]
-FLAC__stream_encoder_set_bits_per_sample = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_bits_per_sample
-FLAC__stream_encoder_set_bits_per_sample.restype = FLAC__bool
-FLAC__stream_encoder_set_bits_per_sample.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]
-FLAC__stream_encoder_set_sample_rate = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_sample_rate
-FLAC__stream_encoder_set_sample_rate.restype = FLAC__bool
-FLAC__stream_encoder_set_sample_rate.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]
-FLAC__stream_encoder_set_compression_level = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_compression_level
-FLAC__stream_encoder_set_compression_level.restype = FLAC__bool
-FLAC__stream_encoder_set_compression_level.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]
-FLAC__stream_encoder_set_blocksize = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_blocksize
-FLAC__stream_encoder_set_blocksize.restype = FLAC__bool
-FLAC__stream_encoder_set_blocksize.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]
-FLAC__stream_encoder_set_do_mid_side_stereo = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_do_mid_side_stereo
-FLAC__stream_encoder_set_do_mid_side_stereo.restype = FLAC__bool
-FLAC__stream_encoder_set_do_mid_side_stereo.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__bool]
-FLAC__stream_encoder_set_loose_mid_side_stereo = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_loose_mid_side_stereo
-FLAC__stream_encoder_set_loose_mid_side_stereo.restype = FLAC__bool
-FLAC__stream_encoder_set_loose_mid_side_stereo.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__bool]
-FLAC__stream_encoder_set_apodization = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_apodization
-FLAC__stream_encoder_set_apodization.restype = FLAC__bool
-FLAC__stream_encoder_set_apodization.argtypes = [POINTER(FLAC__StreamEncoder), STRING]
-FLAC__stream_encoder_set_max_lpc_order = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_max_lpc_order
-FLAC__stream_encoder_set_max_lpc_order.restype = FLAC__bool
-FLAC__stream_encoder_set_max_lpc_order.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]
-FLAC__stream_encoder_set_qlp_coeff_precision = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_qlp_coeff_precision
-FLAC__stream_encoder_set_qlp_coeff_precision.restype = FLAC__bool
-FLAC__stream_encoder_set_qlp_coeff_precision.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]
-FLAC__stream_encoder_set_do_qlp_coeff_prec_search = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_do_qlp_coeff_prec_search
-FLAC__stream_encoder_set_do_qlp_coeff_prec_search.restype = FLAC__bool
-FLAC__stream_encoder_set_do_qlp_coeff_prec_search.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__bool]
-FLAC__stream_encoder_set_do_escape_coding = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_do_escape_coding
-FLAC__stream_encoder_set_do_escape_coding.restype = FLAC__bool
-FLAC__stream_encoder_set_do_escape_coding.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__bool]
-FLAC__stream_encoder_set_do_exhaustive_model_search = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_do_exhaustive_model_search
-FLAC__stream_encoder_set_do_exhaustive_model_search.restype = FLAC__bool
-FLAC__stream_encoder_set_do_exhaustive_model_search.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__bool]
-FLAC__stream_encoder_set_min_residual_partition_order = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_min_residual_partition_order
-FLAC__stream_encoder_set_min_residual_partition_order.restype = FLAC__bool
-FLAC__stream_encoder_set_min_residual_partition_order.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]
-FLAC__stream_encoder_set_max_residual_partition_order = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_max_residual_partition_order
-FLAC__stream_encoder_set_max_residual_partition_order.restype = FLAC__bool
-FLAC__stream_encoder_set_max_residual_partition_order.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]
-FLAC__stream_encoder_set_rice_parameter_search_dist = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_rice_parameter_search_dist
-FLAC__stream_encoder_set_rice_parameter_search_dist.restype = FLAC__bool
-FLAC__stream_encoder_set_rice_parameter_search_dist.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]
-FLAC__stream_encoder_set_total_samples_estimate = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_total_samples_estimate
-FLAC__stream_encoder_set_total_samples_estimate.restype = FLAC__bool
-FLAC__stream_encoder_set_total_samples_estimate.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__uint64]
-FLAC__stream_encoder_set_metadata = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_metadata
-FLAC__stream_encoder_set_metadata.restype = FLAC__bool
-FLAC__stream_encoder_set_metadata.argtypes = [POINTER(FLAC__StreamEncoder), POINTER(POINTER(FLAC__StreamMetadata)), c_uint]
-FLAC__stream_encoder_get_state = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_state
-FLAC__stream_encoder_get_state.restype = FLAC__StreamEncoderState
-FLAC__stream_encoder_get_state.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_verify_decoder_state = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_verify_decoder_state
-FLAC__stream_encoder_get_verify_decoder_state.restype = FLAC__StreamDecoderState
-FLAC__stream_encoder_get_verify_decoder_state.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_resolved_state_string = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_resolved_state_string
-FLAC__stream_encoder_get_resolved_state_string.restype = STRING
-FLAC__stream_encoder_get_resolved_state_string.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_verify_decoder_error_stats = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_verify_decoder_error_stats
-FLAC__stream_encoder_get_verify_decoder_error_stats.restype = None
-FLAC__stream_encoder_get_verify_decoder_error_stats.argtypes = [POINTER(FLAC__StreamEncoder), POINTER(FLAC__uint64), POINTER(c_uint), POINTER(c_uint), POINTER(c_uint), POINTER(FLAC__int32), POINTER(FLAC__int32)]
-FLAC__stream_encoder_get_verify = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_verify
-FLAC__stream_encoder_get_verify.restype = FLAC__bool
-FLAC__stream_encoder_get_verify.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_streamable_subset = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_streamable_subset
-FLAC__stream_encoder_get_streamable_subset.restype = FLAC__bool
-FLAC__stream_encoder_get_streamable_subset.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_channels = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_channels
-FLAC__stream_encoder_get_channels.restype = c_uint
-FLAC__stream_encoder_get_channels.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_bits_per_sample = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_bits_per_sample
-FLAC__stream_encoder_get_bits_per_sample.restype = c_uint
-FLAC__stream_encoder_get_bits_per_sample.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_sample_rate = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_sample_rate
-FLAC__stream_encoder_get_sample_rate.restype = c_uint
-FLAC__stream_encoder_get_sample_rate.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_blocksize = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_blocksize
-FLAC__stream_encoder_get_blocksize.restype = c_uint
-FLAC__stream_encoder_get_blocksize.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_do_mid_side_stereo = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_do_mid_side_stereo
-FLAC__stream_encoder_get_do_mid_side_stereo.restype = FLAC__bool
-FLAC__stream_encoder_get_do_mid_side_stereo.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_loose_mid_side_stereo = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_loose_mid_side_stereo
-FLAC__stream_encoder_get_loose_mid_side_stereo.restype = FLAC__bool
-FLAC__stream_encoder_get_loose_mid_side_stereo.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_max_lpc_order = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_max_lpc_order
-FLAC__stream_encoder_get_max_lpc_order.restype = c_uint
-FLAC__stream_encoder_get_max_lpc_order.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_qlp_coeff_precision = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_qlp_coeff_precision
-FLAC__stream_encoder_get_qlp_coeff_precision.restype = c_uint
-FLAC__stream_encoder_get_qlp_coeff_precision.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_do_qlp_coeff_prec_search = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_do_qlp_coeff_prec_search
-FLAC__stream_encoder_get_do_qlp_coeff_prec_search.restype = FLAC__bool
-FLAC__stream_encoder_get_do_qlp_coeff_prec_search.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_do_escape_coding = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_do_escape_coding
-FLAC__stream_encoder_get_do_escape_coding.restype = FLAC__bool
-FLAC__stream_encoder_get_do_escape_coding.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_do_exhaustive_model_search = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_do_exhaustive_model_search
-FLAC__stream_encoder_get_do_exhaustive_model_search.restype = FLAC__bool
-FLAC__stream_encoder_get_do_exhaustive_model_search.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_min_residual_partition_order = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_min_residual_partition_order
-FLAC__stream_encoder_get_min_residual_partition_order.restype = c_uint
-FLAC__stream_encoder_get_min_residual_partition_order.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_max_residual_partition_order = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_max_residual_partition_order
-FLAC__stream_encoder_get_max_residual_partition_order.restype = c_uint
-FLAC__stream_encoder_get_max_residual_partition_order.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_rice_parameter_search_dist = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_rice_parameter_search_dist
-FLAC__stream_encoder_get_rice_parameter_search_dist.restype = c_uint
-FLAC__stream_encoder_get_rice_parameter_search_dist.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_get_total_samples_estimate = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_total_samples_estimate
-FLAC__stream_encoder_get_total_samples_estimate.restype = FLAC__uint64
-FLAC__stream_encoder_get_total_samples_estimate.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_init_stream = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_init_stream
-FLAC__stream_encoder_init_stream.restype = FLAC__StreamEncoderInitStatus
-FLAC__stream_encoder_init_stream.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__StreamEncoderWriteCallback, FLAC__StreamEncoderSeekCallback, FLAC__StreamEncoderTellCallback, FLAC__StreamEncoderMetadataCallback, c_void_p]
-FLAC__stream_encoder_init_ogg_stream = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_init_ogg_stream
-FLAC__stream_encoder_init_ogg_stream.restype = FLAC__StreamEncoderInitStatus
-FLAC__stream_encoder_init_ogg_stream.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__StreamEncoderReadCallback, FLAC__StreamEncoderWriteCallback, FLAC__StreamEncoderSeekCallback, FLAC__StreamEncoderTellCallback, FLAC__StreamEncoderMetadataCallback, c_void_p]
-FLAC__stream_encoder_init_FILE = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_init_FILE
-FLAC__stream_encoder_init_FILE.restype = FLAC__StreamEncoderInitStatus
-FLAC__stream_encoder_init_FILE.argtypes = [POINTER(FLAC__StreamEncoder), POINTER(FILE), FLAC__StreamEncoderProgressCallback, c_void_p]
-FLAC__stream_encoder_init_ogg_FILE = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_init_ogg_FILE
-FLAC__stream_encoder_init_ogg_FILE.restype = FLAC__StreamEncoderInitStatus
-FLAC__stream_encoder_init_ogg_FILE.argtypes = [POINTER(FLAC__StreamEncoder), POINTER(FILE), FLAC__StreamEncoderProgressCallback, c_void_p]
-FLAC__stream_encoder_init_file = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_init_file
-FLAC__stream_encoder_init_file.restype = FLAC__StreamEncoderInitStatus
-FLAC__stream_encoder_init_file.argtypes = [POINTER(FLAC__StreamEncoder), STRING, FLAC__StreamEncoderProgressCallback, c_void_p]
-FLAC__stream_encoder_init_ogg_file = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_init_ogg_file
-FLAC__stream_encoder_init_ogg_file.restype = FLAC__StreamEncoderInitStatus
-FLAC__stream_encoder_init_ogg_file.argtypes = [POINTER(FLAC__StreamEncoder), STRING, FLAC__StreamEncoderProgressCallback, c_void_p]
-FLAC__stream_encoder_finish = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_finish
-FLAC__stream_encoder_finish.restype = FLAC__bool
-FLAC__stream_encoder_finish.argtypes = [POINTER(FLAC__StreamEncoder)]
-FLAC__stream_encoder_process = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_process
-FLAC__stream_encoder_process.restype = FLAC__bool
-FLAC__stream_encoder_process.argtypes = [POINTER(FLAC__StreamEncoder), POINTER(POINTER(FLAC__int32)), c_uint]
-FLAC__stream_encoder_process_interleaved = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_process_interleaved
-FLAC__stream_encoder_process_interleaved.restype = FLAC__bool
-FLAC__stream_encoder_process_interleaved.argtypes = [POINTER(FLAC__StreamEncoder), POINTER(FLAC__int32), c_uint]
 pthread_t = c_ulong
-class pthread_attr_t(Union):
-    pass
-pthread_attr_t._fields_ = [
-    ('__size', c_char * 56),
-    ('__align', c_long),
-]
-class __pthread_internal_list(Structure):
-    pass
-__pthread_internal_list._fields_ = [
-    ('__prev', POINTER(__pthread_internal_list)),
-    ('__next', POINTER(__pthread_internal_list)),
-]
-__pthread_list_t = __pthread_internal_list
-class __pthread_mutex_s(Structure):
-    pass
-__pthread_mutex_s._fields_ = [
-    ('__lock', c_int),
-    ('__count', c_uint),
-    ('__owner', c_int),
-    ('__nusers', c_uint),
-    ('__kind', c_int),
-    ('__spins', c_short),
-    ('__elision', c_short),
-    ('__list', __pthread_list_t),
-]
-class pthread_mutex_t(Union):
-    pass
-pthread_mutex_t._fields_ = [
-    ('__data', __pthread_mutex_s),
-    ('__size', c_char * 40),
-    ('__align', c_long),
-]
-class pthread_mutexattr_t(Union):
-    pass
-pthread_mutexattr_t._fields_ = [
-    ('__size', c_char * 4),
-    ('__align', c_int),
-]
-class N14pthread_cond_t4DOT_11E(Structure):
-    pass
-N14pthread_cond_t4DOT_11E._fields_ = [
-    ('__lock', c_int),
-    ('__futex', c_uint),
-    ('__total_seq', c_ulonglong),
-    ('__wakeup_seq', c_ulonglong),
-    ('__woken_seq', c_ulonglong),
-    ('__mutex', c_void_p),
-    ('__nwaiters', c_uint),
-    ('__broadcast_seq', c_uint),
-]
-class pthread_cond_t(Union):
-    pass
-pthread_cond_t._fields_ = [
-    ('__data', N14pthread_cond_t4DOT_11E),
-    ('__size', c_char * 48),
-    ('__align', c_longlong),
-]
-class pthread_condattr_t(Union):
-    pass
-pthread_condattr_t._fields_ = [
-    ('__size', c_char * 4),
-    ('__align', c_int),
-]
 pthread_key_t = c_uint
 pthread_once_t = c_int
-class N16pthread_rwlock_t4DOT_14E(Structure):
-    pass
-N16pthread_rwlock_t4DOT_14E._fields_ = [
-    ('__lock', c_int),
-    ('__nr_readers', c_uint),
-    ('__readers_wakeup', c_uint),
-    ('__writer_wakeup', c_uint),
-    ('__nr_readers_queued', c_uint),
-    ('__nr_writers_queued', c_uint),
-    ('__writer', c_int),
-    ('__shared', c_int),
-    ('__rwelision', c_byte),
-    ('__pad1', c_ubyte * 7),
-    ('__pad2', c_ulong),
-    ('__flags', c_uint),
-]
-class pthread_rwlock_t(Union):
-    pass
-pthread_rwlock_t._fields_ = [
-    ('__data', N16pthread_rwlock_t4DOT_14E),
-    ('__size', c_char * 56),
-    ('__align', c_long),
-]
-class pthread_rwlockattr_t(Union):
-    pass
-pthread_rwlockattr_t._fields_ = [
-    ('__size', c_char * 8),
-    ('__align', c_long),
-]
 pthread_spinlock_t = c_int
-class pthread_barrier_t(Union):
-    pass
-pthread_barrier_t._fields_ = [
-    ('__size', c_char * 32),
-    ('__align', c_long),
-]
-class pthread_barrierattr_t(Union):
-    pass
-pthread_barrierattr_t._fields_ = [
-    ('__size', c_char * 4),
-    ('__align', c_int),
-]
-__fdelt_chk = _libraries['/usr/lib/libFLAC.so'].__fdelt_chk
-__fdelt_chk.restype = c_long
-__fdelt_chk.argtypes = [c_long]
-__fdelt_warn = _libraries['/usr/lib/libFLAC.so'].__fdelt_warn
-__fdelt_warn.restype = c_long
-__fdelt_warn.argtypes = [c_long]
 __sig_atomic_t = c_int
-class __sigset_t(Structure):
-    pass
-__sigset_t._fields_ = [
-    ('__val', c_ulong * 16),
-]
-getchar = _libraries['/usr/lib/libFLAC.so'].getchar
-getchar.restype = c_int
-getchar.argtypes = []
-fgetc_unlocked = _libraries['/usr/lib/libFLAC.so'].fgetc_unlocked
-fgetc_unlocked.restype = c_int
-fgetc_unlocked.argtypes = [POINTER(FILE)]
-getc_unlocked = _libraries['/usr/lib/libFLAC.so'].getc_unlocked
-getc_unlocked.restype = c_int
-getc_unlocked.argtypes = [POINTER(FILE)]
-getchar_unlocked = _libraries['/usr/lib/libFLAC.so'].getchar_unlocked
-getchar_unlocked.restype = c_int
-getchar_unlocked.argtypes = []
-putchar = _libraries['/usr/lib/libFLAC.so'].putchar
-putchar.restype = c_int
-putchar.argtypes = [c_int]
-fputc_unlocked = _libraries['/usr/lib/libFLAC.so'].fputc_unlocked
-fputc_unlocked.restype = c_int
-fputc_unlocked.argtypes = [c_int, POINTER(FILE)]
-putc_unlocked = _libraries['/usr/lib/libFLAC.so'].putc_unlocked
-putc_unlocked.restype = c_int
-putc_unlocked.argtypes = [c_int, POINTER(FILE)]
-putchar_unlocked = _libraries['/usr/lib/libFLAC.so'].putchar_unlocked
-putchar_unlocked.restype = c_int
-putchar_unlocked.argtypes = [c_int]
-getline = _libraries['/usr/lib/libFLAC.so'].getline
-getline.restype = __ssize_t
-getline.argtypes = [POINTER(STRING), POINTER(size_t), POINTER(FILE)]
-feof_unlocked = _libraries['/usr/lib/libFLAC.so'].feof_unlocked
-feof_unlocked.restype = c_int
-feof_unlocked.argtypes = [POINTER(FILE)]
-ferror_unlocked = _libraries['/usr/lib/libFLAC.so'].ferror_unlocked
-ferror_unlocked.restype = c_int
-ferror_unlocked.argtypes = [POINTER(FILE)]
-__sprintf_chk = _libraries['/usr/lib/libFLAC.so'].__sprintf_chk
-__sprintf_chk.restype = c_int
-__sprintf_chk.argtypes = [STRING, c_int, size_t, STRING]
-__vsprintf_chk = _libraries['/usr/lib/libFLAC.so'].__vsprintf_chk
-__vsprintf_chk.restype = c_int
-__vsprintf_chk.argtypes = [STRING, c_int, size_t, STRING, POINTER(__va_list_tag)]
-sprintf = _libraries['/usr/lib/libFLAC.so'].sprintf
-sprintf.restype = c_int
-sprintf.argtypes = [STRING, STRING]
-vsprintf = _libraries['/usr/lib/libFLAC.so'].vsprintf
-vsprintf.restype = c_int
-vsprintf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]
-__snprintf_chk = _libraries['/usr/lib/libFLAC.so'].__snprintf_chk
-__snprintf_chk.restype = c_int
-__snprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING]
-__vsnprintf_chk = _libraries['/usr/lib/libFLAC.so'].__vsnprintf_chk
-__vsnprintf_chk.restype = c_int
-__vsnprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING, POINTER(__va_list_tag)]
-snprintf = _libraries['/usr/lib/libFLAC.so'].snprintf
-snprintf.restype = c_int
-snprintf.argtypes = [STRING, size_t, STRING]
-vsnprintf = _libraries['/usr/lib/libFLAC.so'].vsnprintf
-vsnprintf.restype = c_int
-vsnprintf.argtypes = [STRING, size_t, STRING, POINTER(__va_list_tag)]
-__fprintf_chk = _libraries['/usr/lib/libFLAC.so'].__fprintf_chk
-__fprintf_chk.restype = c_int
-__fprintf_chk.argtypes = [POINTER(FILE), c_int, STRING]
-__printf_chk = _libraries['/usr/lib/libFLAC.so'].__printf_chk
-__printf_chk.restype = c_int
-__printf_chk.argtypes = [c_int, STRING]
-__vfprintf_chk = _libraries['/usr/lib/libFLAC.so'].__vfprintf_chk
-__vfprintf_chk.restype = c_int
-__vfprintf_chk.argtypes = [POINTER(FILE), c_int, STRING, POINTER(__va_list_tag)]
-__vprintf_chk = _libraries['/usr/lib/libFLAC.so'].__vprintf_chk
-__vprintf_chk.restype = c_int
-__vprintf_chk.argtypes = [c_int, STRING, POINTER(__va_list_tag)]
-fprintf = _libraries['/usr/lib/libFLAC.so'].fprintf
-fprintf.restype = c_int
-fprintf.argtypes = [POINTER(FILE), STRING]
-printf = _libraries['/usr/lib/libFLAC.so'].printf
-printf.restype = c_int
-printf.argtypes = [STRING]
-vprintf = _libraries['/usr/lib/libFLAC.so'].vprintf
-vprintf.restype = c_int
-vprintf.argtypes = [STRING, POINTER(__va_list_tag)]
-vfprintf = _libraries['/usr/lib/libFLAC.so'].vfprintf
-vfprintf.restype = c_int
-vfprintf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]
-__dprintf_chk = _libraries['/usr/lib/libFLAC.so'].__dprintf_chk
-__dprintf_chk.restype = c_int
-__dprintf_chk.argtypes = [c_int, c_int, STRING]
-__vdprintf_chk = _libraries['/usr/lib/libFLAC.so'].__vdprintf_chk
-__vdprintf_chk.restype = c_int
-__vdprintf_chk.argtypes = [c_int, c_int, STRING, POINTER(__va_list_tag)]
-dprintf = _libraries['/usr/lib/libFLAC.so'].dprintf
-dprintf.restype = c_int
-dprintf.argtypes = [c_int, STRING]
-vdprintf = _libraries['/usr/lib/libFLAC.so'].vdprintf
-vdprintf.restype = c_int
-vdprintf.argtypes = [c_int, STRING, POINTER(__va_list_tag)]
-__asprintf_chk = _libraries['/usr/lib/libFLAC.so'].__asprintf_chk
-__asprintf_chk.restype = c_int
-__asprintf_chk.argtypes = [POINTER(STRING), c_int, STRING]
-__vasprintf_chk = _libraries['/usr/lib/libFLAC.so'].__vasprintf_chk
-__vasprintf_chk.restype = c_int
-__vasprintf_chk.argtypes = [POINTER(STRING), c_int, STRING, POINTER(__va_list_tag)]
-class obstack(Structure):
-    pass
-__obstack_printf_chk = _libraries['/usr/lib/libFLAC.so'].__obstack_printf_chk
-__obstack_printf_chk.restype = c_int
-__obstack_printf_chk.argtypes = [POINTER(obstack), c_int, STRING]
-__obstack_vprintf_chk = _libraries['/usr/lib/libFLAC.so'].__obstack_vprintf_chk
-__obstack_vprintf_chk.restype = c_int
-__obstack_vprintf_chk.argtypes = [POINTER(obstack), c_int, STRING, POINTER(__va_list_tag)]
-asprintf = _libraries['/usr/lib/libFLAC.so'].asprintf
-asprintf.restype = c_int
-asprintf.argtypes = [POINTER(STRING), STRING]
-__asprintf = _libraries['/usr/lib/libFLAC.so'].__asprintf
-__asprintf.restype = c_int
-__asprintf.argtypes = [POINTER(STRING), STRING]
-obstack_printf = _libraries['/usr/lib/libFLAC.so'].obstack_printf
-obstack_printf.restype = c_int
-obstack_printf.argtypes = [POINTER(obstack), STRING]
-vasprintf = _libraries['/usr/lib/libFLAC.so'].vasprintf
-vasprintf.restype = c_int
-vasprintf.argtypes = [POINTER(STRING), STRING, POINTER(__va_list_tag)]
-obstack_vprintf = _libraries['/usr/lib/libFLAC.so'].obstack_vprintf
-obstack_vprintf.restype = c_int
-obstack_vprintf.argtypes = [POINTER(obstack), STRING, POINTER(__va_list_tag)]
-__fgets_chk = _libraries['/usr/lib/libFLAC.so'].__fgets_chk
-__fgets_chk.restype = STRING
-__fgets_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]
-fgets = _libraries['/usr/lib/libFLAC.so'].fgets
-fgets.restype = STRING
-fgets.argtypes = [STRING, c_int, POINTER(FILE)]
-__fread_chk = _libraries['/usr/lib/libFLAC.so'].__fread_chk
-__fread_chk.restype = size_t
-__fread_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]
-fread = _libraries['/usr/lib/libFLAC.so'].fread
-fread.restype = size_t
-fread.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-__fgets_unlocked_chk = _libraries['/usr/lib/libFLAC.so'].__fgets_unlocked_chk
-__fgets_unlocked_chk.restype = STRING
-__fgets_unlocked_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]
-fgets_unlocked = _libraries['/usr/lib/libFLAC.so'].fgets_unlocked
-fgets_unlocked.restype = STRING
-fgets_unlocked.argtypes = [STRING, c_int, POINTER(FILE)]
-__fread_unlocked_chk = _libraries['/usr/lib/libFLAC.so'].__fread_unlocked_chk
-__fread_unlocked_chk.restype = size_t
-__fread_unlocked_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]
-fread_unlocked = _libraries['/usr/lib/libFLAC.so'].fread_unlocked
-fread_unlocked.restype = size_t
-fread_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
 __compar_fn_t = CFUNCTYPE(c_int, c_void_p, c_void_p)
-bsearch = _libraries['/usr/lib/libFLAC.so'].bsearch
-bsearch.restype = c_void_p
-bsearch.argtypes = [c_void_p, c_void_p, size_t, size_t, __compar_fn_t]
-atof = _libraries['/usr/lib/libFLAC.so'].atof
-atof.restype = c_double
-atof.argtypes = [STRING]
-__realpath_chk = _libraries['/usr/lib/libFLAC.so'].__realpath_chk
-__realpath_chk.restype = STRING
-__realpath_chk.argtypes = [STRING, STRING, size_t]
-realpath = _libraries['/usr/lib/libFLAC.so'].realpath
-realpath.restype = STRING
-realpath.argtypes = [STRING, STRING]
-__ptsname_r_chk = _libraries['/usr/lib/libFLAC.so'].__ptsname_r_chk
-__ptsname_r_chk.restype = c_int
-__ptsname_r_chk.argtypes = [c_int, STRING, size_t, size_t]
-ptsname_r = _libraries['/usr/lib/libFLAC.so'].ptsname_r
-ptsname_r.restype = c_int
-ptsname_r.argtypes = [c_int, STRING, size_t]
-__wctomb_chk = _libraries['/usr/lib/libFLAC.so'].__wctomb_chk
-__wctomb_chk.restype = c_int
-__wctomb_chk.argtypes = [STRING, c_wchar, size_t]
-wctomb = _libraries['/usr/lib/libFLAC.so'].wctomb
-wctomb.restype = c_int
-wctomb.argtypes = [STRING, c_wchar]
-__mbstowcs_chk = _libraries['/usr/lib/libFLAC.so'].__mbstowcs_chk
-__mbstowcs_chk.restype = size_t
-__mbstowcs_chk.argtypes = [WSTRING, STRING, size_t, size_t]
-mbstowcs = _libraries['/usr/lib/libFLAC.so'].mbstowcs
-mbstowcs.restype = size_t
-mbstowcs.argtypes = [WSTRING, STRING, size_t]
-__wcstombs_chk = _libraries['/usr/lib/libFLAC.so'].__wcstombs_chk
-__wcstombs_chk.restype = size_t
-__wcstombs_chk.argtypes = [STRING, WSTRING, size_t, size_t]
-wcstombs = _libraries['/usr/lib/libFLAC.so'].wcstombs
-wcstombs.restype = size_t
-wcstombs.argtypes = [STRING, WSTRING, size_t]
-sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libFLAC.so'], 'sys_nerr')
-sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'sys_errlist')
-_sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libFLAC.so'], '_sys_nerr')
-_sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], '_sys_errlist')
-class timeval(Structure):
-    pass
 __time_t = c_long
 __suseconds_t = c_long
-timeval._fields_ = [
-    ('tv_sec', __time_t),
-    ('tv_usec', __suseconds_t),
-]
 __u_char = c_ubyte
 __u_short = c_ushort
 __u_int = c_uint
@@ -1970,11 +681,6 @@ __ino_t = c_ulong
 __ino64_t = c_ulong
 __mode_t = c_uint
 __nlink_t = c_ulong
-class __fsid_t(Structure):
-    pass
-__fsid_t._fields_ = [
-    ('__val', c_int * 2),
-]
 __clock_t = c_long
 __rlim_t = c_ulong
 __rlim64_t = c_ulong
@@ -1999,81 +705,10 @@ __qaddr_t = POINTER(__quad_t)
 __caddr_t = STRING
 __intptr_t = c_long
 __socklen_t = c_uint
-class wait(Union):
-    pass
-class N4wait3DOT_1E(Structure):
-    pass
-N4wait3DOT_1E._fields_ = [
-    ('__w_termsig', c_uint, 7),
-    ('__w_coredump', c_uint, 1),
-    ('__w_retcode', c_uint, 8),
-    ('', c_uint, 16),
-]
-class N4wait3DOT_2E(Structure):
-    pass
-N4wait3DOT_2E._fields_ = [
-    ('__w_stopval', c_uint, 8),
-    ('__w_stopsig', c_uint, 8),
-    ('', c_uint, 16),
-]
-wait._fields_ = [
-    ('w_status', c_int),
-    ('__wait_terminated', N4wait3DOT_1E),
-    ('__wait_stopped', N4wait3DOT_2E),
-]
-class _IO_jump_t(Structure):
-    pass
-_IO_jump_t._fields_ = [
-]
 _IO_lock_t = None
-class _IO_marker(Structure):
-    pass
-_IO_marker._fields_ = [
-    ('_next', POINTER(_IO_marker)),
-    ('_sbuf', POINTER(_IO_FILE)),
-    ('_pos', c_int),
-]
 
 # values for enumeration '__codecvt_result'
 __codecvt_result = c_int # enum
-_IO_FILE._fields_ = [
-    ('_flags', c_int),
-    ('_IO_read_ptr', STRING),
-    ('_IO_read_end', STRING),
-    ('_IO_read_base', STRING),
-    ('_IO_write_base', STRING),
-    ('_IO_write_ptr', STRING),
-    ('_IO_write_end', STRING),
-    ('_IO_buf_base', STRING),
-    ('_IO_buf_end', STRING),
-    ('_IO_save_base', STRING),
-    ('_IO_backup_base', STRING),
-    ('_IO_save_end', STRING),
-    ('_markers', POINTER(_IO_marker)),
-    ('_chain', POINTER(_IO_FILE)),
-    ('_fileno', c_int),
-    ('_flags2', c_int),
-    ('_old_offset', __off_t),
-    ('_cur_column', c_ushort),
-    ('_vtable_offset', c_byte),
-    ('_shortbuf', c_char * 1),
-    ('_lock', POINTER(_IO_lock_t)),
-    ('_offset', __off64_t),
-    ('__pad1', c_void_p),
-    ('__pad2', c_void_p),
-    ('__pad3', c_void_p),
-    ('__pad4', c_void_p),
-    ('__pad5', size_t),
-    ('_mode', c_int),
-    ('_unused2', c_char * 20),
-]
-class _IO_FILE_plus(Structure):
-    pass
-_IO_FILE_plus._fields_ = [
-]
-_IO_2_1_stdin_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libFLAC.so'], '_IO_2_1_stdin_')
-_IO_2_1_stdout_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libFLAC.so'], '_IO_2_1_stdout_')
-_IO_2_1_stderr_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libFLAC.so'], '_IO_2_1_stderr_')
 __io_read_fn = CFUNCTYPE(__ssize_t, c_void_p, STRING, size_t)
 __io_write_fn = CFUNCTYPE(__ssize_t, c_void_p, STRING, size_t)
 __io_seek_fn = CFUNCTYPE(c_int, c_void_p, POINTER(__off64_t), c_int)
@@ -2082,73 +717,6 @@ cookie_read_function_t = __io_read_fn
 cookie_write_function_t = __io_write_fn
 cookie_seek_function_t = __io_seek_fn
 cookie_close_function_t = __io_close_fn
-class _IO_cookie_io_functions_t(Structure):
-    pass
-_IO_cookie_io_functions_t._fields_ = [
-    ('read', POINTER(__io_read_fn)),
-    ('write', POINTER(__io_write_fn)),
-    ('seek', POINTER(__io_seek_fn)),
-    ('close', POINTER(__io_close_fn)),
-]
-cookie_io_functions_t = _IO_cookie_io_functions_t
-class _IO_cookie_file(Structure):
-    pass
-_IO_cookie_file._fields_ = [
-]
-__underflow = _libraries['/usr/lib/libFLAC.so'].__underflow
-__underflow.restype = c_int
-__underflow.argtypes = [POINTER(_IO_FILE)]
-__uflow = _libraries['/usr/lib/libFLAC.so'].__uflow
-__uflow.restype = c_int
-__uflow.argtypes = [POINTER(_IO_FILE)]
-__overflow = _libraries['/usr/lib/libFLAC.so'].__overflow
-__overflow.restype = c_int
-__overflow.argtypes = [POINTER(_IO_FILE), c_int]
-_IO_getc = _libraries['/usr/lib/libFLAC.so']._IO_getc
-_IO_getc.restype = c_int
-_IO_getc.argtypes = [POINTER(_IO_FILE)]
-_IO_putc = _libraries['/usr/lib/libFLAC.so']._IO_putc
-_IO_putc.restype = c_int
-_IO_putc.argtypes = [c_int, POINTER(_IO_FILE)]
-_IO_feof = _libraries['/usr/lib/libFLAC.so']._IO_feof
-_IO_feof.restype = c_int
-_IO_feof.argtypes = [POINTER(_IO_FILE)]
-_IO_ferror = _libraries['/usr/lib/libFLAC.so']._IO_ferror
-_IO_ferror.restype = c_int
-_IO_ferror.argtypes = [POINTER(_IO_FILE)]
-_IO_peekc_locked = _libraries['/usr/lib/libFLAC.so']._IO_peekc_locked
-_IO_peekc_locked.restype = c_int
-_IO_peekc_locked.argtypes = [POINTER(_IO_FILE)]
-_IO_flockfile = _libraries['/usr/lib/libFLAC.so']._IO_flockfile
-_IO_flockfile.restype = None
-_IO_flockfile.argtypes = [POINTER(_IO_FILE)]
-_IO_funlockfile = _libraries['/usr/lib/libFLAC.so']._IO_funlockfile
-_IO_funlockfile.restype = None
-_IO_funlockfile.argtypes = [POINTER(_IO_FILE)]
-_IO_ftrylockfile = _libraries['/usr/lib/libFLAC.so']._IO_ftrylockfile
-_IO_ftrylockfile.restype = c_int
-_IO_ftrylockfile.argtypes = [POINTER(_IO_FILE)]
-_IO_vfscanf = _libraries['/usr/lib/libFLAC.so']._IO_vfscanf
-_IO_vfscanf.restype = c_int
-_IO_vfscanf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag), POINTER(c_int)]
-_IO_vfprintf = _libraries['/usr/lib/libFLAC.so']._IO_vfprintf
-_IO_vfprintf.restype = c_int
-_IO_vfprintf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag)]
-_IO_padn = _libraries['/usr/lib/libFLAC.so']._IO_padn
-_IO_padn.restype = __ssize_t
-_IO_padn.argtypes = [POINTER(_IO_FILE), c_int, __ssize_t]
-_IO_sgetn = _libraries['/usr/lib/libFLAC.so']._IO_sgetn
-_IO_sgetn.restype = size_t
-_IO_sgetn.argtypes = [POINTER(_IO_FILE), c_void_p, size_t]
-_IO_seekoff = _libraries['/usr/lib/libFLAC.so']._IO_seekoff
-_IO_seekoff.restype = __off64_t
-_IO_seekoff.argtypes = [POINTER(_IO_FILE), __off64_t, c_int, c_int]
-_IO_seekpos = _libraries['/usr/lib/libFLAC.so']._IO_seekpos
-_IO_seekpos.restype = __off64_t
-_IO_seekpos.argtypes = [POINTER(_IO_FILE), __off64_t, c_int]
-_IO_free_backup_area = _libraries['/usr/lib/libFLAC.so']._IO_free_backup_area
-_IO_free_backup_area.restype = None
-_IO_free_backup_area.argtypes = [POINTER(_IO_FILE)]
 int_least8_t = c_byte
 int_least16_t = c_short
 int_least32_t = c_int
@@ -2169,631 +737,16 @@ intptr_t = c_long
 uintptr_t = c_ulong
 intmax_t = c_long
 uintmax_t = c_ulong
-__FILE = _IO_FILE
-va_list = __gnuc_va_list
-fpos_t = _G_fpos_t
-fpos64_t = _G_fpos64_t
-remove = _libraries['/usr/lib/libFLAC.so'].remove
-remove.restype = c_int
-remove.argtypes = [STRING]
-rename = _libraries['/usr/lib/libFLAC.so'].rename
-rename.restype = c_int
-rename.argtypes = [STRING, STRING]
-renameat = _libraries['/usr/lib/libFLAC.so'].renameat
-renameat.restype = c_int
-renameat.argtypes = [c_int, STRING, c_int, STRING]
-tmpfile = _libraries['/usr/lib/libFLAC.so'].tmpfile
-tmpfile.restype = POINTER(FILE)
-tmpfile.argtypes = []
-tmpfile64 = _libraries['/usr/lib/libFLAC.so'].tmpfile64
-tmpfile64.restype = POINTER(FILE)
-tmpfile64.argtypes = []
-tmpnam = _libraries['/usr/lib/libFLAC.so'].tmpnam
-tmpnam.restype = STRING
-tmpnam.argtypes = [STRING]
-tmpnam_r = _libraries['/usr/lib/libFLAC.so'].tmpnam_r
-tmpnam_r.restype = STRING
-tmpnam_r.argtypes = [STRING]
-tempnam = _libraries['/usr/lib/libFLAC.so'].tempnam
-tempnam.restype = STRING
-tempnam.argtypes = [STRING, STRING]
-fclose = _libraries['/usr/lib/libFLAC.so'].fclose
-fclose.restype = c_int
-fclose.argtypes = [POINTER(FILE)]
-fflush = _libraries['/usr/lib/libFLAC.so'].fflush
-fflush.restype = c_int
-fflush.argtypes = [POINTER(FILE)]
-fflush_unlocked = _libraries['/usr/lib/libFLAC.so'].fflush_unlocked
-fflush_unlocked.restype = c_int
-fflush_unlocked.argtypes = [POINTER(FILE)]
-fcloseall = _libraries['/usr/lib/libFLAC.so'].fcloseall
-fcloseall.restype = c_int
-fcloseall.argtypes = []
-fopen = _libraries['/usr/lib/libFLAC.so'].fopen
-fopen.restype = POINTER(FILE)
-fopen.argtypes = [STRING, STRING]
-freopen = _libraries['/usr/lib/libFLAC.so'].freopen
-freopen.restype = POINTER(FILE)
-freopen.argtypes = [STRING, STRING, POINTER(FILE)]
-fopen64 = _libraries['/usr/lib/libFLAC.so'].fopen64
-fopen64.restype = POINTER(FILE)
-fopen64.argtypes = [STRING, STRING]
-freopen64 = _libraries['/usr/lib/libFLAC.so'].freopen64
-freopen64.restype = POINTER(FILE)
-freopen64.argtypes = [STRING, STRING, POINTER(FILE)]
-fdopen = _libraries['/usr/lib/libFLAC.so'].fdopen
-fdopen.restype = POINTER(FILE)
-fdopen.argtypes = [c_int, STRING]
-fopencookie = _libraries['/usr/lib/libFLAC.so'].fopencookie
-fopencookie.restype = POINTER(FILE)
-fopencookie.argtypes = [c_void_p, STRING, _IO_cookie_io_functions_t]
-fmemopen = _libraries['/usr/lib/libFLAC.so'].fmemopen
-fmemopen.restype = POINTER(FILE)
-fmemopen.argtypes = [c_void_p, size_t, STRING]
-open_memstream = _libraries['/usr/lib/libFLAC.so'].open_memstream
-open_memstream.restype = POINTER(FILE)
-open_memstream.argtypes = [POINTER(STRING), POINTER(size_t)]
-setbuf = _libraries['/usr/lib/libFLAC.so'].setbuf
-setbuf.restype = None
-setbuf.argtypes = [POINTER(FILE), STRING]
-setvbuf = _libraries['/usr/lib/libFLAC.so'].setvbuf
-setvbuf.restype = c_int
-setvbuf.argtypes = [POINTER(FILE), STRING, c_int, size_t]
-setbuffer = _libraries['/usr/lib/libFLAC.so'].setbuffer
-setbuffer.restype = None
-setbuffer.argtypes = [POINTER(FILE), STRING, size_t]
-setlinebuf = _libraries['/usr/lib/libFLAC.so'].setlinebuf
-setlinebuf.restype = None
-setlinebuf.argtypes = [POINTER(FILE)]
-fscanf = _libraries['/usr/lib/libFLAC.so'].fscanf
-fscanf.restype = c_int
-fscanf.argtypes = [POINTER(FILE), STRING]
-scanf = _libraries['/usr/lib/libFLAC.so'].scanf
-scanf.restype = c_int
-scanf.argtypes = [STRING]
-sscanf = _libraries['/usr/lib/libFLAC.so'].sscanf
-sscanf.restype = c_int
-sscanf.argtypes = [STRING, STRING]
-vfscanf = _libraries['/usr/lib/libFLAC.so'].vfscanf
-vfscanf.restype = c_int
-vfscanf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]
-vscanf = _libraries['/usr/lib/libFLAC.so'].vscanf
-vscanf.restype = c_int
-vscanf.argtypes = [STRING, POINTER(__va_list_tag)]
-vsscanf = _libraries['/usr/lib/libFLAC.so'].vsscanf
-vsscanf.restype = c_int
-vsscanf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]
-fgetc = _libraries['/usr/lib/libFLAC.so'].fgetc
-fgetc.restype = c_int
-fgetc.argtypes = [POINTER(FILE)]
-getc = _libraries['/usr/lib/libFLAC.so'].getc
-getc.restype = c_int
-getc.argtypes = [POINTER(FILE)]
-fputc = _libraries['/usr/lib/libFLAC.so'].fputc
-fputc.restype = c_int
-fputc.argtypes = [c_int, POINTER(FILE)]
-putc = _libraries['/usr/lib/libFLAC.so'].putc
-putc.restype = c_int
-putc.argtypes = [c_int, POINTER(FILE)]
-getw = _libraries['/usr/lib/libFLAC.so'].getw
-getw.restype = c_int
-getw.argtypes = [POINTER(FILE)]
-putw = _libraries['/usr/lib/libFLAC.so'].putw
-putw.restype = c_int
-putw.argtypes = [c_int, POINTER(FILE)]
-gets = _libraries['/usr/lib/libFLAC.so'].gets
-gets.restype = STRING
-gets.argtypes = [STRING]
-__getdelim = _libraries['/usr/lib/libFLAC.so'].__getdelim
-__getdelim.restype = __ssize_t
-__getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]
-getdelim = _libraries['/usr/lib/libFLAC.so'].getdelim
-getdelim.restype = __ssize_t
-getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]
-fputs = _libraries['/usr/lib/libFLAC.so'].fputs
-fputs.restype = c_int
-fputs.argtypes = [STRING, POINTER(FILE)]
-puts = _libraries['/usr/lib/libFLAC.so'].puts
-puts.restype = c_int
-puts.argtypes = [STRING]
-ungetc = _libraries['/usr/lib/libFLAC.so'].ungetc
-ungetc.restype = c_int
-ungetc.argtypes = [c_int, POINTER(FILE)]
-fwrite = _libraries['/usr/lib/libFLAC.so'].fwrite
-fwrite.restype = size_t
-fwrite.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-fputs_unlocked = _libraries['/usr/lib/libFLAC.so'].fputs_unlocked
-fputs_unlocked.restype = c_int
-fputs_unlocked.argtypes = [STRING, POINTER(FILE)]
-fwrite_unlocked = _libraries['/usr/lib/libFLAC.so'].fwrite_unlocked
-fwrite_unlocked.restype = size_t
-fwrite_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-fseek = _libraries['/usr/lib/libFLAC.so'].fseek
-fseek.restype = c_int
-fseek.argtypes = [POINTER(FILE), c_long, c_int]
-ftell = _libraries['/usr/lib/libFLAC.so'].ftell
-ftell.restype = c_long
-ftell.argtypes = [POINTER(FILE)]
-rewind = _libraries['/usr/lib/libFLAC.so'].rewind
-rewind.restype = None
-rewind.argtypes = [POINTER(FILE)]
-fseeko = _libraries['/usr/lib/libFLAC.so'].fseeko
-fseeko.restype = c_int
-fseeko.argtypes = [POINTER(FILE), __off_t, c_int]
-ftello = _libraries['/usr/lib/libFLAC.so'].ftello
-ftello.restype = __off_t
-ftello.argtypes = [POINTER(FILE)]
-fgetpos = _libraries['/usr/lib/libFLAC.so'].fgetpos
-fgetpos.restype = c_int
-fgetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]
-fsetpos = _libraries['/usr/lib/libFLAC.so'].fsetpos
-fsetpos.restype = c_int
-fsetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]
-fseeko64 = _libraries['/usr/lib/libFLAC.so'].fseeko64
-fseeko64.restype = c_int
-fseeko64.argtypes = [POINTER(FILE), __off64_t, c_int]
-ftello64 = _libraries['/usr/lib/libFLAC.so'].ftello64
-ftello64.restype = __off64_t
-ftello64.argtypes = [POINTER(FILE)]
-fgetpos64 = _libraries['/usr/lib/libFLAC.so'].fgetpos64
-fgetpos64.restype = c_int
-fgetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]
-fsetpos64 = _libraries['/usr/lib/libFLAC.so'].fsetpos64
-fsetpos64.restype = c_int
-fsetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]
-clearerr = _libraries['/usr/lib/libFLAC.so'].clearerr
-clearerr.restype = None
-clearerr.argtypes = [POINTER(FILE)]
-feof = _libraries['/usr/lib/libFLAC.so'].feof
-feof.restype = c_int
-feof.argtypes = [POINTER(FILE)]
-ferror = _libraries['/usr/lib/libFLAC.so'].ferror
-ferror.restype = c_int
-ferror.argtypes = [POINTER(FILE)]
-clearerr_unlocked = _libraries['/usr/lib/libFLAC.so'].clearerr_unlocked
-clearerr_unlocked.restype = None
-clearerr_unlocked.argtypes = [POINTER(FILE)]
-perror = _libraries['/usr/lib/libFLAC.so'].perror
-perror.restype = None
-perror.argtypes = [STRING]
-fileno = _libraries['/usr/lib/libFLAC.so'].fileno
-fileno.restype = c_int
-fileno.argtypes = [POINTER(FILE)]
-fileno_unlocked = _libraries['/usr/lib/libFLAC.so'].fileno_unlocked
-fileno_unlocked.restype = c_int
-fileno_unlocked.argtypes = [POINTER(FILE)]
-popen = _libraries['/usr/lib/libFLAC.so'].popen
-popen.restype = POINTER(FILE)
-popen.argtypes = [STRING, STRING]
-pclose = _libraries['/usr/lib/libFLAC.so'].pclose
-pclose.restype = c_int
-pclose.argtypes = [POINTER(FILE)]
-ctermid = _libraries['/usr/lib/libFLAC.so'].ctermid
-ctermid.restype = STRING
-ctermid.argtypes = [STRING]
-cuserid = _libraries['/usr/lib/libFLAC.so'].cuserid
-cuserid.restype = STRING
-cuserid.argtypes = [STRING]
-obstack._fields_ = [
-]
-flockfile = _libraries['/usr/lib/libFLAC.so'].flockfile
-flockfile.restype = None
-flockfile.argtypes = [POINTER(FILE)]
-ftrylockfile = _libraries['/usr/lib/libFLAC.so'].ftrylockfile
-ftrylockfile.restype = c_int
-ftrylockfile.argtypes = [POINTER(FILE)]
-funlockfile = _libraries['/usr/lib/libFLAC.so'].funlockfile
-funlockfile.restype = None
-funlockfile.argtypes = [POINTER(FILE)]
-class div_t(Structure):
-    pass
-div_t._fields_ = [
-    ('quot', c_int),
-    ('rem', c_int),
-]
-class ldiv_t(Structure):
-    pass
-ldiv_t._fields_ = [
-    ('quot', c_long),
-    ('rem', c_long),
-]
-class lldiv_t(Structure):
-    pass
-lldiv_t._fields_ = [
-    ('quot', c_longlong),
-    ('rem', c_longlong),
-]
-__ctype_get_mb_cur_max = _libraries['/usr/lib/libFLAC.so'].__ctype_get_mb_cur_max
-__ctype_get_mb_cur_max.restype = size_t
-__ctype_get_mb_cur_max.argtypes = []
-strtod = _libraries['/usr/lib/libFLAC.so'].strtod
-strtod.restype = c_double
-strtod.argtypes = [STRING, POINTER(STRING)]
-strtof = _libraries['/usr/lib/libFLAC.so'].strtof
-strtof.restype = c_float
-strtof.argtypes = [STRING, POINTER(STRING)]
-strtold = _libraries['/usr/lib/libFLAC.so'].strtold
-strtold.restype = c_longdouble
-strtold.argtypes = [STRING, POINTER(STRING)]
-strtol = _libraries['/usr/lib/libFLAC.so'].strtol
-strtol.restype = c_long
-strtol.argtypes = [STRING, POINTER(STRING), c_int]
-strtoul = _libraries['/usr/lib/libFLAC.so'].strtoul
-strtoul.restype = c_ulong
-strtoul.argtypes = [STRING, POINTER(STRING), c_int]
-strtoq = _libraries['/usr/lib/libFLAC.so'].strtoq
-strtoq.restype = c_longlong
-strtoq.argtypes = [STRING, POINTER(STRING), c_int]
-strtouq = _libraries['/usr/lib/libFLAC.so'].strtouq
-strtouq.restype = c_ulonglong
-strtouq.argtypes = [STRING, POINTER(STRING), c_int]
-strtoll = _libraries['/usr/lib/libFLAC.so'].strtoll
-strtoll.restype = c_longlong
-strtoll.argtypes = [STRING, POINTER(STRING), c_int]
-strtoull = _libraries['/usr/lib/libFLAC.so'].strtoull
-strtoull.restype = c_ulonglong
-strtoull.argtypes = [STRING, POINTER(STRING), c_int]
-class __locale_struct(Structure):
-    pass
-__locale_t = POINTER(__locale_struct)
-strtol_l = _libraries['/usr/lib/libFLAC.so'].strtol_l
-strtol_l.restype = c_long
-strtol_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtoul_l = _libraries['/usr/lib/libFLAC.so'].strtoul_l
-strtoul_l.restype = c_ulong
-strtoul_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtoll_l = _libraries['/usr/lib/libFLAC.so'].strtoll_l
-strtoll_l.restype = c_longlong
-strtoll_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtoull_l = _libraries['/usr/lib/libFLAC.so'].strtoull_l
-strtoull_l.restype = c_ulonglong
-strtoull_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtod_l = _libraries['/usr/lib/libFLAC.so'].strtod_l
-strtod_l.restype = c_double
-strtod_l.argtypes = [STRING, POINTER(STRING), __locale_t]
-strtof_l = _libraries['/usr/lib/libFLAC.so'].strtof_l
-strtof_l.restype = c_float
-strtof_l.argtypes = [STRING, POINTER(STRING), __locale_t]
-strtold_l = _libraries['/usr/lib/libFLAC.so'].strtold_l
-strtold_l.restype = c_longdouble
-strtold_l.argtypes = [STRING, POINTER(STRING), __locale_t]
-atoi = _libraries['/usr/lib/libFLAC.so'].atoi
-atoi.restype = c_int
-atoi.argtypes = [STRING]
-atol = _libraries['/usr/lib/libFLAC.so'].atol
-atol.restype = c_long
-atol.argtypes = [STRING]
-atoll = _libraries['/usr/lib/libFLAC.so'].atoll
-atoll.restype = c_longlong
-atoll.argtypes = [STRING]
-l64a = _libraries['/usr/lib/libFLAC.so'].l64a
-l64a.restype = STRING
-l64a.argtypes = [c_long]
-a64l = _libraries['/usr/lib/libFLAC.so'].a64l
-a64l.restype = c_long
-a64l.argtypes = [STRING]
-random = _libraries['/usr/lib/libFLAC.so'].random
-random.restype = c_long
-random.argtypes = []
-srandom = _libraries['/usr/lib/libFLAC.so'].srandom
-srandom.restype = None
-srandom.argtypes = [c_uint]
-initstate = _libraries['/usr/lib/libFLAC.so'].initstate
-initstate.restype = STRING
-initstate.argtypes = [c_uint, STRING, size_t]
-setstate = _libraries['/usr/lib/libFLAC.so'].setstate
-setstate.restype = STRING
-setstate.argtypes = [STRING]
-class random_data(Structure):
-    pass
-random_data._fields_ = [
-    ('fptr', POINTER(int32_t)),
-    ('rptr', POINTER(int32_t)),
-    ('state', POINTER(int32_t)),
-    ('rand_type', c_int),
-    ('rand_deg', c_int),
-    ('rand_sep', c_int),
-    ('end_ptr', POINTER(int32_t)),
-]
-random_r = _libraries['/usr/lib/libFLAC.so'].random_r
-random_r.restype = c_int
-random_r.argtypes = [POINTER(random_data), POINTER(int32_t)]
-srandom_r = _libraries['/usr/lib/libFLAC.so'].srandom_r
-srandom_r.restype = c_int
-srandom_r.argtypes = [c_uint, POINTER(random_data)]
-initstate_r = _libraries['/usr/lib/libFLAC.so'].initstate_r
-initstate_r.restype = c_int
-initstate_r.argtypes = [c_uint, STRING, size_t, POINTER(random_data)]
-setstate_r = _libraries['/usr/lib/libFLAC.so'].setstate_r
-setstate_r.restype = c_int
-setstate_r.argtypes = [STRING, POINTER(random_data)]
-rand = _libraries['/usr/lib/libFLAC.so'].rand
-rand.restype = c_int
-rand.argtypes = []
-srand = _libraries['/usr/lib/libFLAC.so'].srand
-srand.restype = None
-srand.argtypes = [c_uint]
-rand_r = _libraries['/usr/lib/libFLAC.so'].rand_r
-rand_r.restype = c_int
-rand_r.argtypes = [POINTER(c_uint)]
-drand48 = _libraries['/usr/lib/libFLAC.so'].drand48
-drand48.restype = c_double
-drand48.argtypes = []
-erand48 = _libraries['/usr/lib/libFLAC.so'].erand48
-erand48.restype = c_double
-erand48.argtypes = [POINTER(c_ushort)]
-lrand48 = _libraries['/usr/lib/libFLAC.so'].lrand48
-lrand48.restype = c_long
-lrand48.argtypes = []
-nrand48 = _libraries['/usr/lib/libFLAC.so'].nrand48
-nrand48.restype = c_long
-nrand48.argtypes = [POINTER(c_ushort)]
-mrand48 = _libraries['/usr/lib/libFLAC.so'].mrand48
-mrand48.restype = c_long
-mrand48.argtypes = []
-jrand48 = _libraries['/usr/lib/libFLAC.so'].jrand48
-jrand48.restype = c_long
-jrand48.argtypes = [POINTER(c_ushort)]
-srand48 = _libraries['/usr/lib/libFLAC.so'].srand48
-srand48.restype = None
-srand48.argtypes = [c_long]
-seed48 = _libraries['/usr/lib/libFLAC.so'].seed48
-seed48.restype = POINTER(c_ushort)
-seed48.argtypes = [POINTER(c_ushort)]
-lcong48 = _libraries['/usr/lib/libFLAC.so'].lcong48
-lcong48.restype = None
-lcong48.argtypes = [POINTER(c_ushort)]
-class drand48_data(Structure):
-    pass
-drand48_data._fields_ = [
-    ('__x', c_ushort * 3),
-    ('__old_x', c_ushort * 3),
-    ('__c', c_ushort),
-    ('__init', c_ushort),
-    ('__a', c_ulonglong),
-]
-drand48_r = _libraries['/usr/lib/libFLAC.so'].drand48_r
-drand48_r.restype = c_int
-drand48_r.argtypes = [POINTER(drand48_data), POINTER(c_double)]
-erand48_r = _libraries['/usr/lib/libFLAC.so'].erand48_r
-erand48_r.restype = c_int
-erand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_double)]
-lrand48_r = _libraries['/usr/lib/libFLAC.so'].lrand48_r
-lrand48_r.restype = c_int
-lrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]
-nrand48_r = _libraries['/usr/lib/libFLAC.so'].nrand48_r
-nrand48_r.restype = c_int
-nrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]
-mrand48_r = _libraries['/usr/lib/libFLAC.so'].mrand48_r
-mrand48_r.restype = c_int
-mrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]
-jrand48_r = _libraries['/usr/lib/libFLAC.so'].jrand48_r
-jrand48_r.restype = c_int
-jrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]
-srand48_r = _libraries['/usr/lib/libFLAC.so'].srand48_r
-srand48_r.restype = c_int
-srand48_r.argtypes = [c_long, POINTER(drand48_data)]
-seed48_r = _libraries['/usr/lib/libFLAC.so'].seed48_r
-seed48_r.restype = c_int
-seed48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]
-lcong48_r = _libraries['/usr/lib/libFLAC.so'].lcong48_r
-lcong48_r.restype = c_int
-lcong48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]
-malloc = _libraries['/usr/lib/libFLAC.so'].malloc
-malloc.restype = c_void_p
-malloc.argtypes = [size_t]
-calloc = _libraries['/usr/lib/libFLAC.so'].calloc
-calloc.restype = c_void_p
-calloc.argtypes = [size_t, size_t]
-realloc = _libraries['/usr/lib/libFLAC.so'].realloc
-realloc.restype = c_void_p
-realloc.argtypes = [c_void_p, size_t]
-free = _libraries['/usr/lib/libFLAC.so'].free
-free.restype = None
-free.argtypes = [c_void_p]
-cfree = _libraries['/usr/lib/libFLAC.so'].cfree
-cfree.restype = None
-cfree.argtypes = [c_void_p]
-valloc = _libraries['/usr/lib/libFLAC.so'].valloc
-valloc.restype = c_void_p
-valloc.argtypes = [size_t]
-posix_memalign = _libraries['/usr/lib/libFLAC.so'].posix_memalign
-posix_memalign.restype = c_int
-posix_memalign.argtypes = [POINTER(c_void_p), size_t, size_t]
-aligned_alloc = _libraries['/usr/lib/libFLAC.so'].aligned_alloc
-aligned_alloc.restype = c_void_p
-aligned_alloc.argtypes = [size_t, size_t]
-abort = _libraries['/usr/lib/libFLAC.so'].abort
-abort.restype = None
-abort.argtypes = []
-on_exit = _libraries['/usr/lib/libFLAC.so'].on_exit
-on_exit.restype = c_int
-on_exit.argtypes = [CFUNCTYPE(None, c_int, c_void_p), c_void_p]
-exit = _libraries['/usr/lib/libFLAC.so'].exit
-exit.restype = None
-exit.argtypes = [c_int]
-quick_exit = _libraries['/usr/lib/libFLAC.so'].quick_exit
-quick_exit.restype = None
-quick_exit.argtypes = [c_int]
-_Exit = _libraries['/usr/lib/libFLAC.so']._Exit
-_Exit.restype = None
-_Exit.argtypes = [c_int]
-getenv = _libraries['/usr/lib/libFLAC.so'].getenv
-getenv.restype = STRING
-getenv.argtypes = [STRING]
-secure_getenv = _libraries['/usr/lib/libFLAC.so'].secure_getenv
-secure_getenv.restype = STRING
-secure_getenv.argtypes = [STRING]
-putenv = _libraries['/usr/lib/libFLAC.so'].putenv
-putenv.restype = c_int
-putenv.argtypes = [STRING]
-setenv = _libraries['/usr/lib/libFLAC.so'].setenv
-setenv.restype = c_int
-setenv.argtypes = [STRING, STRING, c_int]
-unsetenv = _libraries['/usr/lib/libFLAC.so'].unsetenv
-unsetenv.restype = c_int
-unsetenv.argtypes = [STRING]
-clearenv = _libraries['/usr/lib/libFLAC.so'].clearenv
-clearenv.restype = c_int
-clearenv.argtypes = []
-mktemp = _libraries['/usr/lib/libFLAC.so'].mktemp
-mktemp.restype = STRING
-mktemp.argtypes = [STRING]
-mkstemp = _libraries['/usr/lib/libFLAC.so'].mkstemp
-mkstemp.restype = c_int
-mkstemp.argtypes = [STRING]
-mkstemp64 = _libraries['/usr/lib/libFLAC.so'].mkstemp64
-mkstemp64.restype = c_int
-mkstemp64.argtypes = [STRING]
-mkstemps = _libraries['/usr/lib/libFLAC.so'].mkstemps
-mkstemps.restype = c_int
-mkstemps.argtypes = [STRING, c_int]
-mkstemps64 = _libraries['/usr/lib/libFLAC.so'].mkstemps64
-mkstemps64.restype = c_int
-mkstemps64.argtypes = [STRING, c_int]
-mkdtemp = _libraries['/usr/lib/libFLAC.so'].mkdtemp
-mkdtemp.restype = STRING
-mkdtemp.argtypes = [STRING]
-mkostemp = _libraries['/usr/lib/libFLAC.so'].mkostemp
-mkostemp.restype = c_int
-mkostemp.argtypes = [STRING, c_int]
-mkostemp64 = _libraries['/usr/lib/libFLAC.so'].mkostemp64
-mkostemp64.restype = c_int
-mkostemp64.argtypes = [STRING, c_int]
-mkostemps = _libraries['/usr/lib/libFLAC.so'].mkostemps
-mkostemps.restype = c_int
-mkostemps.argtypes = [STRING, c_int, c_int]
-mkostemps64 = _libraries['/usr/lib/libFLAC.so'].mkostemps64
-mkostemps64.restype = c_int
-mkostemps64.argtypes = [STRING, c_int, c_int]
-system = _libraries['/usr/lib/libFLAC.so'].system
-system.restype = c_int
-system.argtypes = [STRING]
-canonicalize_file_name = _libraries['/usr/lib/libFLAC.so'].canonicalize_file_name
-canonicalize_file_name.restype = STRING
-canonicalize_file_name.argtypes = [STRING]
 comparison_fn_t = __compar_fn_t
 __compar_d_fn_t = CFUNCTYPE(c_int, c_void_p, c_void_p, c_void_p)
-qsort = _libraries['/usr/lib/libFLAC.so'].qsort
-qsort.restype = None
-qsort.argtypes = [c_void_p, size_t, size_t, __compar_fn_t]
-qsort_r = _libraries['/usr/lib/libFLAC.so'].qsort_r
-qsort_r.restype = None
-qsort_r.argtypes = [c_void_p, size_t, size_t, __compar_d_fn_t, c_void_p]
-abs = _libraries['/usr/lib/libFLAC.so'].abs
-abs.restype = c_int
-abs.argtypes = [c_int]
-labs = _libraries['/usr/lib/libFLAC.so'].labs
-labs.restype = c_long
-labs.argtypes = [c_long]
-llabs = _libraries['/usr/lib/libFLAC.so'].llabs
-llabs.restype = c_longlong
-llabs.argtypes = [c_longlong]
-div = _libraries['/usr/lib/libFLAC.so'].div
-div.restype = div_t
-div.argtypes = [c_int, c_int]
-ldiv = _libraries['/usr/lib/libFLAC.so'].ldiv
-ldiv.restype = ldiv_t
-ldiv.argtypes = [c_long, c_long]
-lldiv = _libraries['/usr/lib/libFLAC.so'].lldiv
-lldiv.restype = lldiv_t
-lldiv.argtypes = [c_longlong, c_longlong]
-ecvt = _libraries['/usr/lib/libFLAC.so'].ecvt
-ecvt.restype = STRING
-ecvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]
-fcvt = _libraries['/usr/lib/libFLAC.so'].fcvt
-fcvt.restype = STRING
-fcvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]
-gcvt = _libraries['/usr/lib/libFLAC.so'].gcvt
-gcvt.restype = STRING
-gcvt.argtypes = [c_double, c_int, STRING]
-qecvt = _libraries['/usr/lib/libFLAC.so'].qecvt
-qecvt.restype = STRING
-qecvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]
-qfcvt = _libraries['/usr/lib/libFLAC.so'].qfcvt
-qfcvt.restype = STRING
-qfcvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]
-qgcvt = _libraries['/usr/lib/libFLAC.so'].qgcvt
-qgcvt.restype = STRING
-qgcvt.argtypes = [c_longdouble, c_int, STRING]
-ecvt_r = _libraries['/usr/lib/libFLAC.so'].ecvt_r
-ecvt_r.restype = c_int
-ecvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-fcvt_r = _libraries['/usr/lib/libFLAC.so'].fcvt_r
-fcvt_r.restype = c_int
-fcvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-qecvt_r = _libraries['/usr/lib/libFLAC.so'].qecvt_r
-qecvt_r.restype = c_int
-qecvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-qfcvt_r = _libraries['/usr/lib/libFLAC.so'].qfcvt_r
-qfcvt_r.restype = c_int
-qfcvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-mblen = _libraries['/usr/lib/libFLAC.so'].mblen
-mblen.restype = c_int
-mblen.argtypes = [STRING, size_t]
-mbtowc = _libraries['/usr/lib/libFLAC.so'].mbtowc
-mbtowc.restype = c_int
-mbtowc.argtypes = [WSTRING, STRING, size_t]
-rpmatch = _libraries['/usr/lib/libFLAC.so'].rpmatch
-rpmatch.restype = c_int
-rpmatch.argtypes = [STRING]
-getsubopt = _libraries['/usr/lib/libFLAC.so'].getsubopt
-getsubopt.restype = c_int
-getsubopt.argtypes = [POINTER(STRING), POINTER(STRING), POINTER(STRING)]
-posix_openpt = _libraries['/usr/lib/libFLAC.so'].posix_openpt
-posix_openpt.restype = c_int
-posix_openpt.argtypes = [c_int]
-grantpt = _libraries['/usr/lib/libFLAC.so'].grantpt
-grantpt.restype = c_int
-grantpt.argtypes = [c_int]
-unlockpt = _libraries['/usr/lib/libFLAC.so'].unlockpt
-unlockpt.restype = c_int
-unlockpt.argtypes = [c_int]
-ptsname = _libraries['/usr/lib/libFLAC.so'].ptsname
-ptsname.restype = STRING
-ptsname.argtypes = [c_int]
-getpt = _libraries['/usr/lib/libFLAC.so'].getpt
-getpt.restype = c_int
-getpt.argtypes = []
-getloadavg = _libraries['/usr/lib/libFLAC.so'].getloadavg
-getloadavg.restype = c_int
-getloadavg.argtypes = [POINTER(c_double), c_int]
-sigset_t = __sigset_t
 __fd_mask = c_long
-class fd_set(Structure):
-    pass
-fd_set._fields_ = [
-    ('fds_bits', __fd_mask * 16),
-]
 fd_mask = __fd_mask
-select = _libraries['/usr/lib/libFLAC.so'].select
-select.restype = c_int
-select.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timeval)]
-class timespec(Structure):
-    pass
-timespec._fields_ = [
-    ('tv_sec', __time_t),
-    ('tv_nsec', __syscall_slong_t),
-]
-pselect = _libraries['/usr/lib/libFLAC.so'].pselect
-pselect.restype = c_int
-pselect.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timespec), POINTER(__sigset_t)]
-gnu_dev_major = _libraries['/usr/lib/libFLAC.so'].gnu_dev_major
-gnu_dev_major.restype = c_uint
-gnu_dev_major.argtypes = [c_ulonglong]
-gnu_dev_minor = _libraries['/usr/lib/libFLAC.so'].gnu_dev_minor
-gnu_dev_minor.restype = c_uint
-gnu_dev_minor.argtypes = [c_ulonglong]
-gnu_dev_makedev = _libraries['/usr/lib/libFLAC.so'].gnu_dev_makedev
-gnu_dev_makedev.restype = c_ulonglong
-gnu_dev_makedev.argtypes = [c_uint, c_uint]
 u_char = __u_char
 u_short = __u_short
 u_int = __u_int
 u_long = __u_long
 quad_t = __quad_t
 u_quad_t = __u_quad_t
-fsid_t = __fsid_t
 loff_t = __loff_t
 ino_t = __ino_t
 ino64_t = __ino64_t
@@ -2830,18 +783,6 @@ clock_t = __clock_t
 time_t = __time_t
 clockid_t = __clockid_t
 timer_t = __timer_t
-class __locale_data(Structure):
-    pass
-__locale_struct._fields_ = [
-    ('__locales', POINTER(__locale_data) * 13),
-    ('__ctype_b', POINTER(c_ushort)),
-    ('__ctype_tolower', POINTER(c_int)),
-    ('__ctype_toupper', POINTER(c_int)),
-    ('__names', STRING * 13),
-]
-__locale_data._fields_ = [
-]
-locale_t = __locale_t
 __all__ = ['FLAC__Metadata_Chain',
            'FLAC__METADATA_CHAIN_STATUS_INVALID_CALLBACKS',
            'FLAC__Metadata_SimpleIterator', '_ATFILE_SOURCE', 'EOF',
@@ -3330,6 +1271,8 @@ __all__ = ['FLAC__Metadata_Chain',
            'obstack', 'aligned_alloc', 'WIFEXITED', 'RAND_MAX',
            'FLAC__stream_decoder_set_metadata_respond', 'nrand48_r',
            'FLAC__stream_encoder_process_interleaved', 'tmpnam_r',
+           'FLAC__stream_encoder_set_num_threads',
+           'FLAC__STREAM_ENCODER_SET_NUM_THREADS_OK',
            'putc', 'FLAC__METADATA_CHAIN_STATUS_NOT_A_FLAC_FILE',
            'FLAC__metadata_simple_iterator_insert_block_after',
            'rand', '_IO_HEX',
@@ -3580,3 +1523,3263 @@ __all__ = ['FLAC__Metadata_Chain',
            '__codecvt_noconv', '_IOLBF',
            'FLAC__STREAM_METADATA_PICTURE_TYPE_BAND', 'int_least8_t',
            'ecvt', 'NFDBITS']
+
+
+# The base class, lazy names used and code that finishes defining each
+# lazy name.
+_definitions = {
+    '__va_list_tag': ('Structure', (),
+        '__va_list_tag._fields_ = [\n'
+        ']'
+        ),
+    '__gnuc_va_list': (None, ('__va_list_tag',),
+        '__gnuc_va_list = __va_list_tag * 1'
+        ),
+    '_IO_va_list': (None, ('__gnuc_va_list',),
+        '_IO_va_list = __gnuc_va_list # alias'
+        ),
+    '_G_fpos_t': ('Structure', ('__mbstate_t',),
+        '_G_fpos_t._fields_ = [\n'
+        "    ('__pos', __off_t),\n"
+        "    ('__state', __mbstate_t),\n"
+        ']'
+        ),
+    '__mbstate_t': ('Structure', ('N11__mbstate_t4DOT_56E',),
+        '__mbstate_t._fields_ = [\n'
+        "    ('__count', c_int),\n"
+        "    ('__value', N11__mbstate_t4DOT_56E),\n"
+        ']'
+        ),
+    'N11__mbstate_t4DOT_56E': ('Union', (),
+        'N11__mbstate_t4DOT_56E._fields_ = [\n'
+        "    ('__wch', c_uint),\n"
+        "    ('__wchb', c_char * 4),\n"
+        ']'
+        ),
+    '_IO_fpos_t': (None, ('_G_fpos_t',),
+        '_IO_fpos_t = _G_fpos_t # alias'
+        ),
+    '_IO_FILE': ('Structure', ('_IO_marker',),
+        '_IO_FILE._fields_ = [\n'
+        "    ('_flags', c_int),\n"
+        "    ('_IO_read_ptr', STRING),\n"
+        "    ('_IO_read_end', STRING),\n"
+        "    ('_IO_read_base', STRING),\n"
+        "    ('_IO_write_base', STRING),\n"
+        "    ('_IO_write_ptr', STRING),\n"
+        "    ('_IO_write_end', STRING),\n"
+        "    ('_IO_buf_base', STRING),\n"
+        "    ('_IO_buf_end', STRING),\n"
+        "    ('_IO_save_base', STRING),\n"
+        "    ('_IO_backup_base', STRING),\n"
+        "    ('_IO_save_end', STRING),\n"
+        "    ('_markers', POINTER(_IO_marker)),\n"
+        "    ('_chain', POINTER(_IO_FILE)),\n"
+        "    ('_fileno', c_int),\n"
+        "    ('_flags2', c_int),\n"
+        "    ('_old_offset', __off_t),\n"
+        "    ('_cur_column', c_ushort),\n"
+        "    ('_vtable_offset', c_byte),\n"
+        "    ('_shortbuf', c_char * 1),\n"
+        "    ('_lock', POINTER(_IO_lock_t)),\n"
+        "    ('_offset', __off64_t),\n"
+        "    ('__pad1', c_void_p),\n"
+        "    ('__pad2', c_void_p),\n"
+        "    ('__pad3', c_void_p),\n"
+        "    ('__pad4', c_void_p),\n"
+        "    ('__pad5', size_t),\n"
+        "    ('_mode', c_int),\n"
+        "    ('_unused2', c_char * 20),\n"
+        ']'
+        ),
+    'stdout': (None, ('_IO_FILE',),
+        "stdout = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libFLAC.so'], 'stdout')\n"
+        'stdout = stdout # alias'
+        ),
+    'stdin': (None, ('_IO_FILE',),
+        "stdin = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libFLAC.so'], 'stdin')\n"
+        'stdin = stdin # alias'
+        ),
+    'stderr': (None, ('_IO_FILE',),
+        "stderr = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libFLAC.so'], 'stderr')\n"
+        'stderr = stderr # alias'
+        ),
+    '_G_fpos64_t': ('Structure', ('__mbstate_t',),
+        '_G_fpos64_t._fields_ = [\n'
+        "    ('__pos', __off64_t),\n"
+        "    ('__state', __mbstate_t),\n"
+        ']'
+        ),
+    '_IO_fpos64_t': (None, ('_G_fpos64_t',),
+        '_IO_fpos64_t = _G_fpos64_t # alias'
+        ),
+    '_G_va_list': (None, ('__gnuc_va_list',),
+        '_G_va_list = __gnuc_va_list # alias'
+        ),
+    'putc': (None, ('FILE', '_IO_putc'),
+        'def putc(_ch,_fp): return _IO_putc (_ch, _fp) # macro\n'
+        "putc = _libraries['/usr/lib/libFLAC.so'].putc\n"
+        'putc.restype = c_int\n'
+        'putc.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'minor': (None, ('gnu_dev_minor',),
+        'def minor(dev): return gnu_dev_minor (dev) # macro'
+        ),
+    'makedev': (None, ('gnu_dev_makedev',),
+        'def makedev(maj,min): return gnu_dev_makedev (maj, min) # macro'
+        ),
+    'major': (None, ('gnu_dev_major',),
+        'def major(dev): return gnu_dev_major (dev) # macro'
+        ),
+    'getc': (None, ('FILE', '_IO_getc'),
+        'def getc(_fp): return _IO_getc (_fp) # macro\n'
+        "getc = _libraries['/usr/lib/libFLAC.so'].getc\n"
+        'getc.restype = c_int\n'
+        'getc.argtypes = [POINTER(FILE)]'
+        ),
+    'FLAC__IOCallbacks': ('Structure', (),
+        'FLAC__IOCallbacks._fields_ = [\n'
+        "    ('read', FLAC__IOCallback_Read),\n"
+        "    ('write', FLAC__IOCallback_Write),\n"
+        "    ('seek', FLAC__IOCallback_Seek),\n"
+        "    ('tell', FLAC__IOCallback_Tell),\n"
+        "    ('eof', FLAC__IOCallback_Eof),\n"
+        "    ('close', FLAC__IOCallback_Close),\n"
+        ']'
+        ),
+    'FLAC_API_SUPPORTS_OGG_FLAC': (None, (),
+        "FLAC_API_SUPPORTS_OGG_FLAC = (c_int).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC_API_SUPPORTS_OGG_FLAC')"
+        ),
+    'FLAC__VERSION_STRING': (None, (),
+        "FLAC__VERSION_STRING = (STRING).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__VERSION_STRING')"
+        ),
+    'FLAC__VENDOR_STRING': (None, (),
+        "FLAC__VENDOR_STRING = (STRING).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__VENDOR_STRING')"
+        ),
+    'FLAC__STREAM_SYNC_STRING': (None, (),
+        "FLAC__STREAM_SYNC_STRING = (FLAC__byte * 4).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_SYNC_STRING')"
+        ),
+    'FLAC__STREAM_SYNC': (None, (),
+        "FLAC__STREAM_SYNC = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_SYNC')"
+        ),
+    'FLAC__STREAM_SYNC_LEN': (None, (),
+        "FLAC__STREAM_SYNC_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_SYNC_LEN')"
+        ),
+    'FLAC__EntropyCodingMethodTypeString': (None, (),
+        "FLAC__EntropyCodingMethodTypeString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__EntropyCodingMethodTypeString')"
+        ),
+    'FLAC__EntropyCodingMethod_PartitionedRiceContents': ('Structure', (),
+        'FLAC__EntropyCodingMethod_PartitionedRiceContents._fields_ = [\n'
+        "    ('parameters', POINTER(c_uint)),\n"
+        "    ('raw_bits', POINTER(c_uint)),\n"
+        "    ('capacity_by_order', c_uint),\n"
+        ']'
+        ),
+    'FLAC__EntropyCodingMethod_PartitionedRice': ('Structure', ('FLAC__EntropyCodingMethod_PartitionedRiceContents',),
+        'FLAC__EntropyCodingMethod_PartitionedRice._fields_ = [\n'
+        "    ('order', c_uint),\n"
+        "    ('contents', POINTER(FLAC__EntropyCodingMethod_PartitionedRiceContents)),\n"
+        ']'
+        ),
+    'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_ORDER_LEN': (None, (),
+        "FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_ORDER_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_ORDER_LEN')"
+        ),
+    'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_PARAMETER_LEN': (None, (),
+        "FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_PARAMETER_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_PARAMETER_LEN')"
+        ),
+    'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE2_PARAMETER_LEN': (None, (),
+        "FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE2_PARAMETER_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE2_PARAMETER_LEN')"
+        ),
+    'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_RAW_LEN': (None, (),
+        "FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_RAW_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_RAW_LEN')"
+        ),
+    'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_ESCAPE_PARAMETER': (None, (),
+        "FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_ESCAPE_PARAMETER = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE_ESCAPE_PARAMETER')"
+        ),
+    'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE2_ESCAPE_PARAMETER': (None, (),
+        "FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE2_ESCAPE_PARAMETER = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ENTROPY_CODING_METHOD_PARTITIONED_RICE2_ESCAPE_PARAMETER')"
+        ),
+    'N25FLAC__EntropyCodingMethod4DOT_23E': ('Union', ('FLAC__EntropyCodingMethod_PartitionedRice',),
+        'N25FLAC__EntropyCodingMethod4DOT_23E._fields_ = [\n'
+        "    ('partitioned_rice', FLAC__EntropyCodingMethod_PartitionedRice),\n"
+        ']'
+        ),
+    'FLAC__EntropyCodingMethod': ('Structure', ('N25FLAC__EntropyCodingMethod4DOT_23E',),
+        'FLAC__EntropyCodingMethod._fields_ = [\n'
+        "    ('type', FLAC__EntropyCodingMethodType),\n"
+        "    ('data', N25FLAC__EntropyCodingMethod4DOT_23E),\n"
+        ']'
+        ),
+    'FLAC__ENTROPY_CODING_METHOD_TYPE_LEN': (None, (),
+        "FLAC__ENTROPY_CODING_METHOD_TYPE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ENTROPY_CODING_METHOD_TYPE_LEN')"
+        ),
+    'FLAC__SubframeTypeString': (None, (),
+        "FLAC__SubframeTypeString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SubframeTypeString')"
+        ),
+    'FLAC__Subframe_Constant': ('Structure', (),
+        'FLAC__Subframe_Constant._fields_ = [\n'
+        "    ('value', FLAC__int32),\n"
+        ']'
+        ),
+    'FLAC__Subframe_Verbatim': ('Structure', (),
+        'FLAC__Subframe_Verbatim._fields_ = [\n'
+        "    ('data', POINTER(FLAC__int32)),\n"
+        ']'
+        ),
+    'FLAC__Subframe_Fixed': ('Structure', ('FLAC__EntropyCodingMethod',),
+        'FLAC__Subframe_Fixed._fields_ = [\n'
+        "    ('entropy_coding_method', FLAC__EntropyCodingMethod),\n"
+        "    ('order', c_uint),\n"
+        "    ('warmup', FLAC__int32 * 4),\n"
+        "    ('residual', POINTER(FLAC__int32)),\n"
+        ']'
+        ),
+    'FLAC__Subframe_LPC': ('Structure', ('FLAC__EntropyCodingMethod',),
+        'FLAC__Subframe_LPC._fields_ = [\n'
+        "    ('entropy_coding_method', FLAC__EntropyCodingMethod),\n"
+        "    ('order', c_uint),\n"
+        "    ('qlp_coeff_precision', c_uint),\n"
+        "    ('quantization_level', c_int),\n"
+        "    ('qlp_coeff', FLAC__int32 * 32),\n"
+        "    ('warmup', FLAC__int32 * 32),\n"
+        "    ('residual', POINTER(FLAC__int32)),\n"
+        ']'
+        ),
+    'FLAC__SUBFRAME_LPC_QLP_COEFF_PRECISION_LEN': (None, (),
+        "FLAC__SUBFRAME_LPC_QLP_COEFF_PRECISION_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_LPC_QLP_COEFF_PRECISION_LEN')"
+        ),
+    'FLAC__SUBFRAME_LPC_QLP_SHIFT_LEN': (None, (),
+        "FLAC__SUBFRAME_LPC_QLP_SHIFT_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_LPC_QLP_SHIFT_LEN')"
+        ),
+    'N14FLAC__Subframe4DOT_30E': ('Union', ('FLAC__Subframe_Constant', 'FLAC__Subframe_Fixed', 'FLAC__Subframe_LPC', 'FLAC__Subframe_Verbatim'),
+        'N14FLAC__Subframe4DOT_30E._fields_ = [\n'
+        "    ('constant', FLAC__Subframe_Constant),\n"
+        "    ('fixed', FLAC__Subframe_Fixed),\n"
+        "    ('lpc', FLAC__Subframe_LPC),\n"
+        "    ('verbatim', FLAC__Subframe_Verbatim),\n"
+        ']'
+        ),
+    'FLAC__Subframe': ('Structure', ('N14FLAC__Subframe4DOT_30E',),
+        'FLAC__Subframe._fields_ = [\n'
+        "    ('type', FLAC__SubframeType),\n"
+        "    ('data', N14FLAC__Subframe4DOT_30E),\n"
+        "    ('wasted_bits', c_uint),\n"
+        ']'
+        ),
+    'FLAC__SUBFRAME_ZERO_PAD_LEN': (None, (),
+        "FLAC__SUBFRAME_ZERO_PAD_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_ZERO_PAD_LEN')"
+        ),
+    'FLAC__SUBFRAME_TYPE_LEN': (None, (),
+        "FLAC__SUBFRAME_TYPE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_TYPE_LEN')"
+        ),
+    'FLAC__SUBFRAME_WASTED_BITS_FLAG_LEN': (None, (),
+        "FLAC__SUBFRAME_WASTED_BITS_FLAG_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_WASTED_BITS_FLAG_LEN')"
+        ),
+    'FLAC__SUBFRAME_TYPE_CONSTANT_BYTE_ALIGNED_MASK': (None, (),
+        "FLAC__SUBFRAME_TYPE_CONSTANT_BYTE_ALIGNED_MASK = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_TYPE_CONSTANT_BYTE_ALIGNED_MASK')"
+        ),
+    'FLAC__SUBFRAME_TYPE_VERBATIM_BYTE_ALIGNED_MASK': (None, (),
+        "FLAC__SUBFRAME_TYPE_VERBATIM_BYTE_ALIGNED_MASK = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_TYPE_VERBATIM_BYTE_ALIGNED_MASK')"
+        ),
+    'FLAC__SUBFRAME_TYPE_FIXED_BYTE_ALIGNED_MASK': (None, (),
+        "FLAC__SUBFRAME_TYPE_FIXED_BYTE_ALIGNED_MASK = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_TYPE_FIXED_BYTE_ALIGNED_MASK')"
+        ),
+    'FLAC__SUBFRAME_TYPE_LPC_BYTE_ALIGNED_MASK': (None, (),
+        "FLAC__SUBFRAME_TYPE_LPC_BYTE_ALIGNED_MASK = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__SUBFRAME_TYPE_LPC_BYTE_ALIGNED_MASK')"
+        ),
+    'FLAC__ChannelAssignmentString': (None, (),
+        "FLAC__ChannelAssignmentString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__ChannelAssignmentString')"
+        ),
+    'FLAC__FrameNumberTypeString': (None, (),
+        "FLAC__FrameNumberTypeString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FrameNumberTypeString')"
+        ),
+    'N17FLAC__FrameHeader4DOT_34E': ('Union', (),
+        'N17FLAC__FrameHeader4DOT_34E._fields_ = [\n'
+        "    ('frame_number', FLAC__uint32),\n"
+        "    ('sample_number', FLAC__uint64),\n"
+        ']'
+        ),
+    'FLAC__FrameHeader': ('Structure', ('N17FLAC__FrameHeader4DOT_34E',),
+        'FLAC__FrameHeader._fields_ = [\n'
+        "    ('blocksize', c_uint),\n"
+        "    ('sample_rate', c_uint),\n"
+        "    ('channels', c_uint),\n"
+        "    ('channel_assignment', FLAC__ChannelAssignment),\n"
+        "    ('bits_per_sample', c_uint),\n"
+        "    ('number_type', FLAC__FrameNumberType),\n"
+        "    ('number', N17FLAC__FrameHeader4DOT_34E),\n"
+        "    ('crc', FLAC__uint8),\n"
+        ']'
+        ),
+    'FLAC__FRAME_HEADER_SYNC': (None, (),
+        "FLAC__FRAME_HEADER_SYNC = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_SYNC')"
+        ),
+    'FLAC__FRAME_HEADER_SYNC_LEN': (None, (),
+        "FLAC__FRAME_HEADER_SYNC_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_SYNC_LEN')"
+        ),
+    'FLAC__FRAME_HEADER_RESERVED_LEN': (None, (),
+        "FLAC__FRAME_HEADER_RESERVED_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_RESERVED_LEN')"
+        ),
+    'FLAC__FRAME_HEADER_BLOCKING_STRATEGY_LEN': (None, (),
+        "FLAC__FRAME_HEADER_BLOCKING_STRATEGY_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_BLOCKING_STRATEGY_LEN')"
+        ),
+    'FLAC__FRAME_HEADER_BLOCK_SIZE_LEN': (None, (),
+        "FLAC__FRAME_HEADER_BLOCK_SIZE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_BLOCK_SIZE_LEN')"
+        ),
+    'FLAC__FRAME_HEADER_SAMPLE_RATE_LEN': (None, (),
+        "FLAC__FRAME_HEADER_SAMPLE_RATE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_SAMPLE_RATE_LEN')"
+        ),
+    'FLAC__FRAME_HEADER_CHANNEL_ASSIGNMENT_LEN': (None, (),
+        "FLAC__FRAME_HEADER_CHANNEL_ASSIGNMENT_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_CHANNEL_ASSIGNMENT_LEN')"
+        ),
+    'FLAC__FRAME_HEADER_BITS_PER_SAMPLE_LEN': (None, (),
+        "FLAC__FRAME_HEADER_BITS_PER_SAMPLE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_BITS_PER_SAMPLE_LEN')"
+        ),
+    'FLAC__FRAME_HEADER_ZERO_PAD_LEN': (None, (),
+        "FLAC__FRAME_HEADER_ZERO_PAD_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_ZERO_PAD_LEN')"
+        ),
+    'FLAC__FRAME_HEADER_CRC_LEN': (None, (),
+        "FLAC__FRAME_HEADER_CRC_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_HEADER_CRC_LEN')"
+        ),
+    'FLAC__FrameFooter': ('Structure', (),
+        'FLAC__FrameFooter._fields_ = [\n'
+        "    ('crc', FLAC__uint16),\n"
+        ']'
+        ),
+    'FLAC__FRAME_FOOTER_CRC_LEN': (None, (),
+        "FLAC__FRAME_FOOTER_CRC_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__FRAME_FOOTER_CRC_LEN')"
+        ),
+    'FLAC__Frame': ('Structure', ('FLAC__FrameFooter', 'FLAC__FrameHeader', 'FLAC__Subframe'),
+        'FLAC__Frame._fields_ = [\n'
+        "    ('header', FLAC__FrameHeader),\n"
+        "    ('subframes', FLAC__Subframe * 8),\n"
+        "    ('footer', FLAC__FrameFooter),\n"
+        ']'
+        ),
+    'FLAC__MetadataTypeString': (None, (),
+        "FLAC__MetadataTypeString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__MetadataTypeString')"
+        ),
+    'FLAC__StreamMetadata_StreamInfo': ('Structure', (),
+        'FLAC__StreamMetadata_StreamInfo._fields_ = [\n'
+        "    ('min_blocksize', c_uint),\n"
+        "    ('max_blocksize', c_uint),\n"
+        "    ('min_framesize', c_uint),\n"
+        "    ('max_framesize', c_uint),\n"
+        "    ('sample_rate', c_uint),\n"
+        "    ('channels', c_uint),\n"
+        "    ('bits_per_sample', c_uint),\n"
+        "    ('total_samples', FLAC__uint64),\n"
+        "    ('md5sum', FLAC__byte * 16),\n"
+        ']'
+        ),
+    'FLAC__STREAM_METADATA_STREAMINFO_MIN_BLOCK_SIZE_LEN': (None, (),
+        "FLAC__STREAM_METADATA_STREAMINFO_MIN_BLOCK_SIZE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_MIN_BLOCK_SIZE_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_STREAMINFO_MAX_BLOCK_SIZE_LEN': (None, (),
+        "FLAC__STREAM_METADATA_STREAMINFO_MAX_BLOCK_SIZE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_MAX_BLOCK_SIZE_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_STREAMINFO_MIN_FRAME_SIZE_LEN': (None, (),
+        "FLAC__STREAM_METADATA_STREAMINFO_MIN_FRAME_SIZE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_MIN_FRAME_SIZE_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_STREAMINFO_MAX_FRAME_SIZE_LEN': (None, (),
+        "FLAC__STREAM_METADATA_STREAMINFO_MAX_FRAME_SIZE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_MAX_FRAME_SIZE_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_STREAMINFO_SAMPLE_RATE_LEN': (None, (),
+        "FLAC__STREAM_METADATA_STREAMINFO_SAMPLE_RATE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_SAMPLE_RATE_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_STREAMINFO_CHANNELS_LEN': (None, (),
+        "FLAC__STREAM_METADATA_STREAMINFO_CHANNELS_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_CHANNELS_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_STREAMINFO_BITS_PER_SAMPLE_LEN': (None, (),
+        "FLAC__STREAM_METADATA_STREAMINFO_BITS_PER_SAMPLE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_BITS_PER_SAMPLE_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_STREAMINFO_TOTAL_SAMPLES_LEN': (None, (),
+        "FLAC__STREAM_METADATA_STREAMINFO_TOTAL_SAMPLES_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_TOTAL_SAMPLES_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_STREAMINFO_MD5SUM_LEN': (None, (),
+        "FLAC__STREAM_METADATA_STREAMINFO_MD5SUM_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_STREAMINFO_MD5SUM_LEN')"
+        ),
+    'FLAC__StreamMetadata_Padding': ('Structure', (),
+        'FLAC__StreamMetadata_Padding._fields_ = [\n'
+        "    ('dummy', c_int),\n"
+        ']'
+        ),
+    'FLAC__StreamMetadata_Application': ('Structure', (),
+        'FLAC__StreamMetadata_Application._fields_ = [\n'
+        "    ('id', FLAC__byte * 4),\n"
+        "    ('data', POINTER(FLAC__byte)),\n"
+        ']'
+        ),
+    'FLAC__STREAM_METADATA_APPLICATION_ID_LEN': (None, (),
+        "FLAC__STREAM_METADATA_APPLICATION_ID_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_APPLICATION_ID_LEN')"
+        ),
+    'FLAC__StreamMetadata_SeekPoint': ('Structure', (),
+        'FLAC__StreamMetadata_SeekPoint._fields_ = [\n'
+        "    ('sample_number', FLAC__uint64),\n"
+        "    ('stream_offset', FLAC__uint64),\n"
+        "    ('frame_samples', c_uint),\n"
+        ']'
+        ),
+    'FLAC__STREAM_METADATA_SEEKPOINT_SAMPLE_NUMBER_LEN': (None, (),
+        "FLAC__STREAM_METADATA_SEEKPOINT_SAMPLE_NUMBER_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_SEEKPOINT_SAMPLE_NUMBER_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_SEEKPOINT_STREAM_OFFSET_LEN': (None, (),
+        "FLAC__STREAM_METADATA_SEEKPOINT_STREAM_OFFSET_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_SEEKPOINT_STREAM_OFFSET_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_SEEKPOINT_FRAME_SAMPLES_LEN': (None, (),
+        "FLAC__STREAM_METADATA_SEEKPOINT_FRAME_SAMPLES_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_SEEKPOINT_FRAME_SAMPLES_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_SEEKPOINT_PLACEHOLDER': (None, (),
+        "FLAC__STREAM_METADATA_SEEKPOINT_PLACEHOLDER = (FLAC__uint64).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_SEEKPOINT_PLACEHOLDER')"
+        ),
+    'FLAC__StreamMetadata_SeekTable': ('Structure', ('FLAC__StreamMetadata_SeekPoint',),
+        'FLAC__StreamMetadata_SeekTable._fields_ = [\n'
+        "    ('num_points', c_uint),\n"
+        "    ('points', POINTER(FLAC__StreamMetadata_SeekPoint)),\n"
+        ']'
+        ),
+    'FLAC__StreamMetadata_VorbisComment_Entry': ('Structure', (),
+        'FLAC__StreamMetadata_VorbisComment_Entry._fields_ = [\n'
+        "    ('length', FLAC__uint32),\n"
+        "    ('entry', POINTER(FLAC__byte)),\n"
+        ']'
+        ),
+    'FLAC__STREAM_METADATA_VORBIS_COMMENT_ENTRY_LENGTH_LEN': (None, (),
+        "FLAC__STREAM_METADATA_VORBIS_COMMENT_ENTRY_LENGTH_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_VORBIS_COMMENT_ENTRY_LENGTH_LEN')"
+        ),
+    'FLAC__StreamMetadata_VorbisComment': ('Structure', ('FLAC__StreamMetadata_VorbisComment_Entry',),
+        'FLAC__StreamMetadata_VorbisComment._fields_ = [\n'
+        "    ('vendor_string', FLAC__StreamMetadata_VorbisComment_Entry),\n"
+        "    ('num_comments', FLAC__uint32),\n"
+        "    ('comments', POINTER(FLAC__StreamMetadata_VorbisComment_Entry)),\n"
+        ']'
+        ),
+    'FLAC__STREAM_METADATA_VORBIS_COMMENT_NUM_COMMENTS_LEN': (None, (),
+        "FLAC__STREAM_METADATA_VORBIS_COMMENT_NUM_COMMENTS_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_VORBIS_COMMENT_NUM_COMMENTS_LEN')"
+        ),
+    'FLAC__StreamMetadata_CueSheet_Index': ('Structure', (),
+        'FLAC__StreamMetadata_CueSheet_Index._fields_ = [\n'
+        "    ('offset', FLAC__uint64),\n"
+        "    ('number', FLAC__byte),\n"
+        ']'
+        ),
+    'FLAC__STREAM_METADATA_CUESHEET_INDEX_OFFSET_LEN': (None, (),
+        "FLAC__STREAM_METADATA_CUESHEET_INDEX_OFFSET_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_INDEX_OFFSET_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_CUESHEET_INDEX_NUMBER_LEN': (None, (),
+        "FLAC__STREAM_METADATA_CUESHEET_INDEX_NUMBER_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_INDEX_NUMBER_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_CUESHEET_INDEX_RESERVED_LEN': (None, (),
+        "FLAC__STREAM_METADATA_CUESHEET_INDEX_RESERVED_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_INDEX_RESERVED_LEN')"
+        ),
+    'FLAC__StreamMetadata_CueSheet_Track': ('Structure', ('FLAC__StreamMetadata_CueSheet_Index',),
+        'FLAC__StreamMetadata_CueSheet_Track._fields_ = [\n'
+        "    ('offset', FLAC__uint64),\n"
+        "    ('number', FLAC__byte),\n"
+        "    ('isrc', c_char * 13),\n"
+        "    ('type', c_uint, 1),\n"
+        "    ('pre_emphasis', c_uint, 1),\n"
+        "    ('num_indices', FLAC__byte),\n"
+        "    ('indices', POINTER(FLAC__StreamMetadata_CueSheet_Index)),\n"
+        ']'
+        ),
+    'FLAC__STREAM_METADATA_CUESHEET_TRACK_OFFSET_LEN': (None, (),
+        "FLAC__STREAM_METADATA_CUESHEET_TRACK_OFFSET_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_TRACK_OFFSET_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_CUESHEET_TRACK_NUMBER_LEN': (None, (),
+        "FLAC__STREAM_METADATA_CUESHEET_TRACK_NUMBER_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_TRACK_NUMBER_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_CUESHEET_TRACK_ISRC_LEN': (None, (),
+        "FLAC__STREAM_METADATA_CUESHEET_TRACK_ISRC_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_TRACK_ISRC_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_CUESHEET_TRACK_TYPE_LEN': (None, (),
+        "FLAC__STREAM_METADATA_CUESHEET_TRACK_TYPE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_TRACK_TYPE_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_CUESHEET_TRACK_PRE_EMPHASIS_LEN': (None, (),
+        "FLAC__STREAM_METADATA_CUESHEET_TRACK_PRE_EMPHASIS_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_TRACK_PRE_EMPHASIS_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_CUESHEET_TRACK_RESERVED_LEN': (None, (),
+        "FLAC__STREAM_METADATA_CUESHEET_TRACK_RESERVED_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_TRACK_RESERVED_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_CUESHEET_TRACK_NUM_INDICES_LEN': (None, (),
+        "FLAC__STREAM_METADATA_CUESHEET_TRACK_NUM_INDICES_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_TRACK_NUM_INDICES_LEN')"
+        ),
+    'FLAC__StreamMetadata_CueSheet': ('Structure', ('FLAC__StreamMetadata_CueSheet_Track',),
+        'FLAC__StreamMetadata_CueSheet._fields_ = [\n'
+        "    ('media_catalog_number', c_char * 129),\n"
+        "    ('lead_in', FLAC__uint64),\n"
+        "    ('is_cd', FLAC__bool),\n"
+        "    ('num_tracks', c_uint),\n"
+        "    ('tracks', POINTER(FLAC__StreamMetadata_CueSheet_Track)),\n"
+        ']'
+        ),
+    'FLAC__STREAM_METADATA_CUESHEET_MEDIA_CATALOG_NUMBER_LEN': (None, (),
+        "FLAC__STREAM_METADATA_CUESHEET_MEDIA_CATALOG_NUMBER_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_MEDIA_CATALOG_NUMBER_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_CUESHEET_LEAD_IN_LEN': (None, (),
+        "FLAC__STREAM_METADATA_CUESHEET_LEAD_IN_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_LEAD_IN_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_CUESHEET_IS_CD_LEN': (None, (),
+        "FLAC__STREAM_METADATA_CUESHEET_IS_CD_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_IS_CD_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_CUESHEET_RESERVED_LEN': (None, (),
+        "FLAC__STREAM_METADATA_CUESHEET_RESERVED_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_RESERVED_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_CUESHEET_NUM_TRACKS_LEN': (None, (),
+        "FLAC__STREAM_METADATA_CUESHEET_NUM_TRACKS_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_CUESHEET_NUM_TRACKS_LEN')"
+        ),
+    'FLAC__StreamMetadata_Picture_TypeString': (None, (),
+        "FLAC__StreamMetadata_Picture_TypeString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamMetadata_Picture_TypeString')"
+        ),
+    'FLAC__StreamMetadata_Picture': ('Structure', (),
+        'FLAC__StreamMetadata_Picture._fields_ = [\n'
+        "    ('type', FLAC__StreamMetadata_Picture_Type),\n"
+        "    ('mime_type', STRING),\n"
+        "    ('description', POINTER(FLAC__byte)),\n"
+        "    ('width', FLAC__uint32),\n"
+        "    ('height', FLAC__uint32),\n"
+        "    ('depth', FLAC__uint32),\n"
+        "    ('colors', FLAC__uint32),\n"
+        "    ('data_length', FLAC__uint32),\n"
+        "    ('data', POINTER(FLAC__byte)),\n"
+        ']'
+        ),
+    'FLAC__STREAM_METADATA_PICTURE_TYPE_LEN': (None, (),
+        "FLAC__STREAM_METADATA_PICTURE_TYPE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_TYPE_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_PICTURE_MIME_TYPE_LENGTH_LEN': (None, (),
+        "FLAC__STREAM_METADATA_PICTURE_MIME_TYPE_LENGTH_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_MIME_TYPE_LENGTH_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_PICTURE_DESCRIPTION_LENGTH_LEN': (None, (),
+        "FLAC__STREAM_METADATA_PICTURE_DESCRIPTION_LENGTH_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_DESCRIPTION_LENGTH_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_PICTURE_WIDTH_LEN': (None, (),
+        "FLAC__STREAM_METADATA_PICTURE_WIDTH_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_WIDTH_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_PICTURE_HEIGHT_LEN': (None, (),
+        "FLAC__STREAM_METADATA_PICTURE_HEIGHT_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_HEIGHT_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_PICTURE_DEPTH_LEN': (None, (),
+        "FLAC__STREAM_METADATA_PICTURE_DEPTH_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_DEPTH_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_PICTURE_COLORS_LEN': (None, (),
+        "FLAC__STREAM_METADATA_PICTURE_COLORS_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_COLORS_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_PICTURE_DATA_LENGTH_LEN': (None, (),
+        "FLAC__STREAM_METADATA_PICTURE_DATA_LENGTH_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_PICTURE_DATA_LENGTH_LEN')"
+        ),
+    'FLAC__StreamMetadata_Unknown': ('Structure', (),
+        'FLAC__StreamMetadata_Unknown._fields_ = [\n'
+        "    ('data', POINTER(FLAC__byte)),\n"
+        ']'
+        ),
+    'N20FLAC__StreamMetadata4DOT_52E': ('Union', ('FLAC__StreamMetadata_Application', 'FLAC__StreamMetadata_CueSheet', 'FLAC__StreamMetadata_Padding', 'FLAC__StreamMetadata_Picture', 'FLAC__StreamMetadata_SeekTable', 'FLAC__StreamMetadata_StreamInfo', 'FLAC__StreamMetadata_Unknown', 'FLAC__StreamMetadata_VorbisComment'),
+        'N20FLAC__StreamMetadata4DOT_52E._fields_ = [\n'
+        "    ('stream_info', FLAC__StreamMetadata_StreamInfo),\n"
+        "    ('padding', FLAC__StreamMetadata_Padding),\n"
+        "    ('application', FLAC__StreamMetadata_Application),\n"
+        "    ('seek_table', FLAC__StreamMetadata_SeekTable),\n"
+        "    ('vorbis_comment', FLAC__StreamMetadata_VorbisComment),\n"
+        "    ('cue_sheet', FLAC__StreamMetadata_CueSheet),\n"
+        "    ('picture', FLAC__StreamMetadata_Picture),\n"
+        "    ('unknown', FLAC__StreamMetadata_Unknown),\n"
+        ']'
+        ),
+    'FLAC__StreamMetadata': ('Structure', ('N20FLAC__StreamMetadata4DOT_52E',),
+        'FLAC__StreamMetadata._fields_ = [\n'
+        "    ('type', FLAC__MetadataType),\n"
+        "    ('is_last', FLAC__bool),\n"
+        "    ('length', c_uint),\n"
+        "    ('data', N20FLAC__StreamMetadata4DOT_52E),\n"
+        ']'
+        ),
+    'FLAC__STREAM_METADATA_IS_LAST_LEN': (None, (),
+        "FLAC__STREAM_METADATA_IS_LAST_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_IS_LAST_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_TYPE_LEN': (None, (),
+        "FLAC__STREAM_METADATA_TYPE_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_TYPE_LEN')"
+        ),
+    'FLAC__STREAM_METADATA_LENGTH_LEN': (None, (),
+        "FLAC__STREAM_METADATA_LENGTH_LEN = (c_uint).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__STREAM_METADATA_LENGTH_LEN')"
+        ),
+    'FLAC__format_sample_rate_is_valid': (None, (),
+        "FLAC__format_sample_rate_is_valid = _libraries['/usr/lib/libFLAC.so'].FLAC__format_sample_rate_is_valid\n"
+        'FLAC__format_sample_rate_is_valid.restype = FLAC__bool\n'
+        'FLAC__format_sample_rate_is_valid.argtypes = [c_uint]'
+        ),
+    'FLAC__format_blocksize_is_subset': (None, (),
+        "FLAC__format_blocksize_is_subset = _libraries['/usr/lib/libFLAC.so'].FLAC__format_blocksize_is_subset\n"
+        'FLAC__format_blocksize_is_subset.restype = FLAC__bool\n'
+        'FLAC__format_blocksize_is_subset.argtypes = [c_uint, c_uint]'
+        ),
+    'FLAC__format_sample_rate_is_subset': (None, (),
+        "FLAC__format_sample_rate_is_subset = _libraries['/usr/lib/libFLAC.so'].FLAC__format_sample_rate_is_subset\n"
+        'FLAC__format_sample_rate_is_subset.restype = FLAC__bool\n'
+        'FLAC__format_sample_rate_is_subset.argtypes = [c_uint]'
+        ),
+    'FLAC__format_vorbiscomment_entry_name_is_legal': (None, (),
+        "FLAC__format_vorbiscomment_entry_name_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__format_vorbiscomment_entry_name_is_legal\n"
+        'FLAC__format_vorbiscomment_entry_name_is_legal.restype = FLAC__bool\n'
+        'FLAC__format_vorbiscomment_entry_name_is_legal.argtypes = [STRING]'
+        ),
+    'FLAC__format_vorbiscomment_entry_value_is_legal': (None, (),
+        "FLAC__format_vorbiscomment_entry_value_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__format_vorbiscomment_entry_value_is_legal\n"
+        'FLAC__format_vorbiscomment_entry_value_is_legal.restype = FLAC__bool\n'
+        'FLAC__format_vorbiscomment_entry_value_is_legal.argtypes = [POINTER(FLAC__byte), c_uint]'
+        ),
+    'FLAC__format_vorbiscomment_entry_is_legal': (None, (),
+        "FLAC__format_vorbiscomment_entry_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__format_vorbiscomment_entry_is_legal\n"
+        'FLAC__format_vorbiscomment_entry_is_legal.restype = FLAC__bool\n'
+        'FLAC__format_vorbiscomment_entry_is_legal.argtypes = [POINTER(FLAC__byte), c_uint]'
+        ),
+    'FLAC__format_seektable_is_legal': (None, ('FLAC__StreamMetadata_SeekTable',),
+        "FLAC__format_seektable_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__format_seektable_is_legal\n"
+        'FLAC__format_seektable_is_legal.restype = FLAC__bool\n'
+        'FLAC__format_seektable_is_legal.argtypes = [POINTER(FLAC__StreamMetadata_SeekTable)]'
+        ),
+    'FLAC__format_seektable_sort': (None, ('FLAC__StreamMetadata_SeekTable',),
+        "FLAC__format_seektable_sort = _libraries['/usr/lib/libFLAC.so'].FLAC__format_seektable_sort\n"
+        'FLAC__format_seektable_sort.restype = c_uint\n'
+        'FLAC__format_seektable_sort.argtypes = [POINTER(FLAC__StreamMetadata_SeekTable)]'
+        ),
+    'FLAC__format_cuesheet_is_legal': (None, ('FLAC__StreamMetadata_CueSheet',),
+        "FLAC__format_cuesheet_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__format_cuesheet_is_legal\n"
+        'FLAC__format_cuesheet_is_legal.restype = FLAC__bool\n'
+        'FLAC__format_cuesheet_is_legal.argtypes = [POINTER(FLAC__StreamMetadata_CueSheet), FLAC__bool, POINTER(STRING)]'
+        ),
+    'FLAC__format_picture_is_legal': (None, ('FLAC__StreamMetadata_Picture',),
+        "FLAC__format_picture_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__format_picture_is_legal\n"
+        'FLAC__format_picture_is_legal.restype = FLAC__bool\n'
+        'FLAC__format_picture_is_legal.argtypes = [POINTER(FLAC__StreamMetadata_Picture), POINTER(STRING)]'
+        ),
+    'FLAC__metadata_get_streaminfo': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_get_streaminfo = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_get_streaminfo\n"
+        'FLAC__metadata_get_streaminfo.restype = FLAC__bool\n'
+        'FLAC__metadata_get_streaminfo.argtypes = [STRING, POINTER(FLAC__StreamMetadata)]'
+        ),
+    'FLAC__metadata_get_tags': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_get_tags = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_get_tags\n"
+        'FLAC__metadata_get_tags.restype = FLAC__bool\n'
+        'FLAC__metadata_get_tags.argtypes = [STRING, POINTER(POINTER(FLAC__StreamMetadata))]'
+        ),
+    'FLAC__metadata_get_cuesheet': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_get_cuesheet = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_get_cuesheet\n"
+        'FLAC__metadata_get_cuesheet.restype = FLAC__bool\n'
+        'FLAC__metadata_get_cuesheet.argtypes = [STRING, POINTER(POINTER(FLAC__StreamMetadata))]'
+        ),
+    'FLAC__metadata_get_picture': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_get_picture = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_get_picture\n"
+        'FLAC__metadata_get_picture.restype = FLAC__bool\n'
+        'FLAC__metadata_get_picture.argtypes = [STRING, POINTER(POINTER(FLAC__StreamMetadata)), FLAC__StreamMetadata_Picture_Type, STRING, POINTER(FLAC__byte), c_uint, c_uint, c_uint, c_uint]'
+        ),
+    'FLAC__Metadata_SimpleIterator': ('Structure', (),
+        'FLAC__Metadata_SimpleIterator._fields_ = [\n'
+        ']'
+        ),
+    'FLAC__Metadata_SimpleIteratorStatusString': (None, (),
+        "FLAC__Metadata_SimpleIteratorStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__Metadata_SimpleIteratorStatusString')"
+        ),
+    'FLAC__metadata_simple_iterator_new': (None, ('FLAC__Metadata_SimpleIterator',),
+        "FLAC__metadata_simple_iterator_new = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_new\n"
+        'FLAC__metadata_simple_iterator_new.restype = POINTER(FLAC__Metadata_SimpleIterator)\n'
+        'FLAC__metadata_simple_iterator_new.argtypes = []'
+        ),
+    'FLAC__metadata_simple_iterator_delete': (None, ('FLAC__Metadata_SimpleIterator',),
+        "FLAC__metadata_simple_iterator_delete = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_delete\n"
+        'FLAC__metadata_simple_iterator_delete.restype = None\n'
+        'FLAC__metadata_simple_iterator_delete.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]'
+        ),
+    'FLAC__metadata_simple_iterator_status': (None, ('FLAC__Metadata_SimpleIterator',),
+        "FLAC__metadata_simple_iterator_status = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_status\n"
+        'FLAC__metadata_simple_iterator_status.restype = FLAC__Metadata_SimpleIteratorStatus\n'
+        'FLAC__metadata_simple_iterator_status.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]'
+        ),
+    'FLAC__metadata_simple_iterator_init': (None, ('FLAC__Metadata_SimpleIterator',),
+        "FLAC__metadata_simple_iterator_init = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_init\n"
+        'FLAC__metadata_simple_iterator_init.restype = FLAC__bool\n'
+        'FLAC__metadata_simple_iterator_init.argtypes = [POINTER(FLAC__Metadata_SimpleIterator), STRING, FLAC__bool, FLAC__bool]'
+        ),
+    'FLAC__metadata_simple_iterator_is_writable': (None, ('FLAC__Metadata_SimpleIterator',),
+        "FLAC__metadata_simple_iterator_is_writable = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_is_writable\n"
+        'FLAC__metadata_simple_iterator_is_writable.restype = FLAC__bool\n'
+        'FLAC__metadata_simple_iterator_is_writable.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]'
+        ),
+    'FLAC__metadata_simple_iterator_next': (None, ('FLAC__Metadata_SimpleIterator',),
+        "FLAC__metadata_simple_iterator_next = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_next\n"
+        'FLAC__metadata_simple_iterator_next.restype = FLAC__bool\n'
+        'FLAC__metadata_simple_iterator_next.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]'
+        ),
+    'FLAC__metadata_simple_iterator_prev': (None, ('FLAC__Metadata_SimpleIterator',),
+        "FLAC__metadata_simple_iterator_prev = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_prev\n"
+        'FLAC__metadata_simple_iterator_prev.restype = FLAC__bool\n'
+        'FLAC__metadata_simple_iterator_prev.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]'
+        ),
+    'FLAC__metadata_simple_iterator_is_last': (None, ('FLAC__Metadata_SimpleIterator',),
+        "FLAC__metadata_simple_iterator_is_last = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_is_last\n"
+        'FLAC__metadata_simple_iterator_is_last.restype = FLAC__bool\n'
+        'FLAC__metadata_simple_iterator_is_last.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]'
+        ),
+    'FLAC__metadata_simple_iterator_get_block_offset': (None, ('FLAC__Metadata_SimpleIterator',),
+        "FLAC__metadata_simple_iterator_get_block_offset = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_get_block_offset\n"
+        'FLAC__metadata_simple_iterator_get_block_offset.restype = off_t\n'
+        'FLAC__metadata_simple_iterator_get_block_offset.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]'
+        ),
+    'FLAC__metadata_simple_iterator_get_block_type': (None, ('FLAC__Metadata_SimpleIterator',),
+        "FLAC__metadata_simple_iterator_get_block_type = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_get_block_type\n"
+        'FLAC__metadata_simple_iterator_get_block_type.restype = FLAC__MetadataType\n'
+        'FLAC__metadata_simple_iterator_get_block_type.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]'
+        ),
+    'FLAC__metadata_simple_iterator_get_block_length': (None, ('FLAC__Metadata_SimpleIterator',),
+        "FLAC__metadata_simple_iterator_get_block_length = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_get_block_length\n"
+        'FLAC__metadata_simple_iterator_get_block_length.restype = c_uint\n'
+        'FLAC__metadata_simple_iterator_get_block_length.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]'
+        ),
+    'FLAC__metadata_simple_iterator_get_application_id': (None, ('FLAC__Metadata_SimpleIterator',),
+        "FLAC__metadata_simple_iterator_get_application_id = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_get_application_id\n"
+        'FLAC__metadata_simple_iterator_get_application_id.restype = FLAC__bool\n'
+        'FLAC__metadata_simple_iterator_get_application_id.argtypes = [POINTER(FLAC__Metadata_SimpleIterator), POINTER(FLAC__byte)]'
+        ),
+    'FLAC__metadata_simple_iterator_get_block': (None, ('FLAC__Metadata_SimpleIterator', 'FLAC__StreamMetadata'),
+        "FLAC__metadata_simple_iterator_get_block = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_get_block\n"
+        'FLAC__metadata_simple_iterator_get_block.restype = POINTER(FLAC__StreamMetadata)\n'
+        'FLAC__metadata_simple_iterator_get_block.argtypes = [POINTER(FLAC__Metadata_SimpleIterator)]'
+        ),
+    'FLAC__metadata_simple_iterator_set_block': (None, ('FLAC__Metadata_SimpleIterator', 'FLAC__StreamMetadata'),
+        "FLAC__metadata_simple_iterator_set_block = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_set_block\n"
+        'FLAC__metadata_simple_iterator_set_block.restype = FLAC__bool\n'
+        'FLAC__metadata_simple_iterator_set_block.argtypes = [POINTER(FLAC__Metadata_SimpleIterator), POINTER(FLAC__StreamMetadata), FLAC__bool]'
+        ),
+    'FLAC__metadata_simple_iterator_insert_block_after': (None, ('FLAC__Metadata_SimpleIterator', 'FLAC__StreamMetadata'),
+        "FLAC__metadata_simple_iterator_insert_block_after = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_insert_block_after\n"
+        'FLAC__metadata_simple_iterator_insert_block_after.restype = FLAC__bool\n'
+        'FLAC__metadata_simple_iterator_insert_block_after.argtypes = [POINTER(FLAC__Metadata_SimpleIterator), POINTER(FLAC__StreamMetadata), FLAC__bool]'
+        ),
+    'FLAC__metadata_simple_iterator_delete_block': (None, ('FLAC__Metadata_SimpleIterator',),
+        "FLAC__metadata_simple_iterator_delete_block = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_simple_iterator_delete_block\n"
+        'FLAC__metadata_simple_iterator_delete_block.restype = FLAC__bool\n'
+        'FLAC__metadata_simple_iterator_delete_block.argtypes = [POINTER(FLAC__Metadata_SimpleIterator), FLAC__bool]'
+        ),
+    'FLAC__Metadata_Chain': ('Structure', (),
+        'FLAC__Metadata_Chain._fields_ = [\n'
+        ']'
+        ),
+    'FLAC__Metadata_Iterator': ('Structure', (),
+        'FLAC__Metadata_Iterator._fields_ = [\n'
+        ']'
+        ),
+    'FLAC__Metadata_ChainStatusString': (None, (),
+        "FLAC__Metadata_ChainStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__Metadata_ChainStatusString')"
+        ),
+    'FLAC__metadata_chain_new': (None, ('FLAC__Metadata_Chain',),
+        "FLAC__metadata_chain_new = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_new\n"
+        'FLAC__metadata_chain_new.restype = POINTER(FLAC__Metadata_Chain)\n'
+        'FLAC__metadata_chain_new.argtypes = []'
+        ),
+    'FLAC__metadata_chain_delete': (None, ('FLAC__Metadata_Chain',),
+        "FLAC__metadata_chain_delete = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_delete\n"
+        'FLAC__metadata_chain_delete.restype = None\n'
+        'FLAC__metadata_chain_delete.argtypes = [POINTER(FLAC__Metadata_Chain)]'
+        ),
+    'FLAC__metadata_chain_status': (None, ('FLAC__Metadata_Chain',),
+        "FLAC__metadata_chain_status = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_status\n"
+        'FLAC__metadata_chain_status.restype = FLAC__Metadata_ChainStatus\n'
+        'FLAC__metadata_chain_status.argtypes = [POINTER(FLAC__Metadata_Chain)]'
+        ),
+    'FLAC__metadata_chain_read': (None, ('FLAC__Metadata_Chain',),
+        "FLAC__metadata_chain_read = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_read\n"
+        'FLAC__metadata_chain_read.restype = FLAC__bool\n'
+        'FLAC__metadata_chain_read.argtypes = [POINTER(FLAC__Metadata_Chain), STRING]'
+        ),
+    'FLAC__metadata_chain_read_ogg': (None, ('FLAC__Metadata_Chain',),
+        "FLAC__metadata_chain_read_ogg = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_read_ogg\n"
+        'FLAC__metadata_chain_read_ogg.restype = FLAC__bool\n'
+        'FLAC__metadata_chain_read_ogg.argtypes = [POINTER(FLAC__Metadata_Chain), STRING]'
+        ),
+    'FLAC__metadata_chain_read_with_callbacks': (None, ('FLAC__IOCallbacks', 'FLAC__Metadata_Chain'),
+        "FLAC__metadata_chain_read_with_callbacks = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_read_with_callbacks\n"
+        'FLAC__metadata_chain_read_with_callbacks.restype = FLAC__bool\n'
+        'FLAC__metadata_chain_read_with_callbacks.argtypes = [POINTER(FLAC__Metadata_Chain), FLAC__IOHandle, FLAC__IOCallbacks]'
+        ),
+    'FLAC__metadata_chain_read_ogg_with_callbacks': (None, ('FLAC__IOCallbacks', 'FLAC__Metadata_Chain'),
+        "FLAC__metadata_chain_read_ogg_with_callbacks = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_read_ogg_with_callbacks\n"
+        'FLAC__metadata_chain_read_ogg_with_callbacks.restype = FLAC__bool\n'
+        'FLAC__metadata_chain_read_ogg_with_callbacks.argtypes = [POINTER(FLAC__Metadata_Chain), FLAC__IOHandle, FLAC__IOCallbacks]'
+        ),
+    'FLAC__metadata_chain_check_if_tempfile_needed': (None, ('FLAC__Metadata_Chain',),
+        "FLAC__metadata_chain_check_if_tempfile_needed = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_check_if_tempfile_needed\n"
+        'FLAC__metadata_chain_check_if_tempfile_needed.restype = FLAC__bool\n'
+        'FLAC__metadata_chain_check_if_tempfile_needed.argtypes = [POINTER(FLAC__Metadata_Chain), FLAC__bool]'
+        ),
+    'FLAC__metadata_chain_write': (None, ('FLAC__Metadata_Chain',),
+        "FLAC__metadata_chain_write = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_write\n"
+        'FLAC__metadata_chain_write.restype = FLAC__bool\n'
+        'FLAC__metadata_chain_write.argtypes = [POINTER(FLAC__Metadata_Chain), FLAC__bool, FLAC__bool]'
+        ),
+    'FLAC__metadata_chain_write_with_callbacks': (None, ('FLAC__IOCallbacks', 'FLAC__Metadata_Chain'),
+        "FLAC__metadata_chain_write_with_callbacks = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_write_with_callbacks\n"
+        'FLAC__metadata_chain_write_with_callbacks.restype = FLAC__bool\n'
+        'FLAC__metadata_chain_write_with_callbacks.argtypes = [POINTER(FLAC__Metadata_Chain), FLAC__bool, FLAC__IOHandle, FLAC__IOCallbacks]'
+        ),
+    'FLAC__metadata_chain_write_with_callbacks_and_tempfile': (None, ('FLAC__IOCallbacks', 'FLAC__Metadata_Chain'),
+        "FLAC__metadata_chain_write_with_callbacks_and_tempfile = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_write_with_callbacks_and_tempfile\n"
+        'FLAC__metadata_chain_write_with_callbacks_and_tempfile.restype = FLAC__bool\n'
+        'FLAC__metadata_chain_write_with_callbacks_and_tempfile.argtypes = [POINTER(FLAC__Metadata_Chain), FLAC__bool, FLAC__IOHandle, FLAC__IOCallbacks, FLAC__IOHandle, FLAC__IOCallbacks]'
+        ),
+    'FLAC__metadata_chain_merge_padding': (None, ('FLAC__Metadata_Chain',),
+        "FLAC__metadata_chain_merge_padding = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_merge_padding\n"
+        'FLAC__metadata_chain_merge_padding.restype = None\n'
+        'FLAC__metadata_chain_merge_padding.argtypes = [POINTER(FLAC__Metadata_Chain)]'
+        ),
+    'FLAC__metadata_chain_sort_padding': (None, ('FLAC__Metadata_Chain',),
+        "FLAC__metadata_chain_sort_padding = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_chain_sort_padding\n"
+        'FLAC__metadata_chain_sort_padding.restype = None\n'
+        'FLAC__metadata_chain_sort_padding.argtypes = [POINTER(FLAC__Metadata_Chain)]'
+        ),
+    'FLAC__metadata_iterator_new': (None, ('FLAC__Metadata_Iterator',),
+        "FLAC__metadata_iterator_new = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_new\n"
+        'FLAC__metadata_iterator_new.restype = POINTER(FLAC__Metadata_Iterator)\n'
+        'FLAC__metadata_iterator_new.argtypes = []'
+        ),
+    'FLAC__metadata_iterator_delete': (None, ('FLAC__Metadata_Iterator',),
+        "FLAC__metadata_iterator_delete = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_delete\n"
+        'FLAC__metadata_iterator_delete.restype = None\n'
+        'FLAC__metadata_iterator_delete.argtypes = [POINTER(FLAC__Metadata_Iterator)]'
+        ),
+    'FLAC__metadata_iterator_init': (None, ('FLAC__Metadata_Chain', 'FLAC__Metadata_Iterator'),
+        "FLAC__metadata_iterator_init = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_init\n"
+        'FLAC__metadata_iterator_init.restype = None\n'
+        'FLAC__metadata_iterator_init.argtypes = [POINTER(FLAC__Metadata_Iterator), POINTER(FLAC__Metadata_Chain)]'
+        ),
+    'FLAC__metadata_iterator_next': (None, ('FLAC__Metadata_Iterator',),
+        "FLAC__metadata_iterator_next = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_next\n"
+        'FLAC__metadata_iterator_next.restype = FLAC__bool\n'
+        'FLAC__metadata_iterator_next.argtypes = [POINTER(FLAC__Metadata_Iterator)]'
+        ),
+    'FLAC__metadata_iterator_prev': (None, ('FLAC__Metadata_Iterator',),
+        "FLAC__metadata_iterator_prev = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_prev\n"
+        'FLAC__metadata_iterator_prev.restype = FLAC__bool\n'
+        'FLAC__metadata_iterator_prev.argtypes = [POINTER(FLAC__Metadata_Iterator)]'
+        ),
+    'FLAC__metadata_iterator_get_block_type': (None, ('FLAC__Metadata_Iterator',),
+        "FLAC__metadata_iterator_get_block_type = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_get_block_type\n"
+        'FLAC__metadata_iterator_get_block_type.restype = FLAC__MetadataType\n'
+        'FLAC__metadata_iterator_get_block_type.argtypes = [POINTER(FLAC__Metadata_Iterator)]'
+        ),
+    'FLAC__metadata_iterator_get_block': (None, ('FLAC__Metadata_Iterator', 'FLAC__StreamMetadata'),
+        "FLAC__metadata_iterator_get_block = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_get_block\n"
+        'FLAC__metadata_iterator_get_block.restype = POINTER(FLAC__StreamMetadata)\n'
+        'FLAC__metadata_iterator_get_block.argtypes = [POINTER(FLAC__Metadata_Iterator)]'
+        ),
+    'FLAC__metadata_iterator_set_block': (None, ('FLAC__Metadata_Iterator', 'FLAC__StreamMetadata'),
+        "FLAC__metadata_iterator_set_block = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_set_block\n"
+        'FLAC__metadata_iterator_set_block.restype = FLAC__bool\n'
+        'FLAC__metadata_iterator_set_block.argtypes = [POINTER(FLAC__Metadata_Iterator), POINTER(FLAC__StreamMetadata)]'
+        ),
+    'FLAC__metadata_iterator_delete_block': (None, ('FLAC__Metadata_Iterator',),
+        "FLAC__metadata_iterator_delete_block = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_delete_block\n"
+        'FLAC__metadata_iterator_delete_block.restype = FLAC__bool\n'
+        'FLAC__metadata_iterator_delete_block.argtypes = [POINTER(FLAC__Metadata_Iterator), FLAC__bool]'
+        ),
+    'FLAC__metadata_iterator_insert_block_before': (None, ('FLAC__Metadata_Iterator', 'FLAC__StreamMetadata'),
+        "FLAC__metadata_iterator_insert_block_before = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_insert_block_before\n"
+        'FLAC__metadata_iterator_insert_block_before.restype = FLAC__bool\n'
+        'FLAC__metadata_iterator_insert_block_before.argtypes = [POINTER(FLAC__Metadata_Iterator), POINTER(FLAC__StreamMetadata)]'
+        ),
+    'FLAC__metadata_iterator_insert_block_after': (None, ('FLAC__Metadata_Iterator', 'FLAC__StreamMetadata'),
+        "FLAC__metadata_iterator_insert_block_after = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_iterator_insert_block_after\n"
+        'FLAC__metadata_iterator_insert_block_after.restype = FLAC__bool\n'
+        'FLAC__metadata_iterator_insert_block_after.argtypes = [POINTER(FLAC__Metadata_Iterator), POINTER(FLAC__StreamMetadata)]'
+        ),
+    'FLAC__metadata_object_new': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_new = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_new\n"
+        'FLAC__metadata_object_new.restype = POINTER(FLAC__StreamMetadata)\n'
+        'FLAC__metadata_object_new.argtypes = [FLAC__MetadataType]'
+        ),
+    'FLAC__metadata_object_clone': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_clone = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_clone\n"
+        'FLAC__metadata_object_clone.restype = POINTER(FLAC__StreamMetadata)\n'
+        'FLAC__metadata_object_clone.argtypes = [POINTER(FLAC__StreamMetadata)]'
+        ),
+    'FLAC__metadata_object_delete': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_delete = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_delete\n"
+        'FLAC__metadata_object_delete.restype = None\n'
+        'FLAC__metadata_object_delete.argtypes = [POINTER(FLAC__StreamMetadata)]'
+        ),
+    'FLAC__metadata_object_is_equal': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_is_equal = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_is_equal\n"
+        'FLAC__metadata_object_is_equal.restype = FLAC__bool\n'
+        'FLAC__metadata_object_is_equal.argtypes = [POINTER(FLAC__StreamMetadata), POINTER(FLAC__StreamMetadata)]'
+        ),
+    'FLAC__metadata_object_application_set_data': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_application_set_data = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_application_set_data\n"
+        'FLAC__metadata_object_application_set_data.restype = FLAC__bool\n'
+        'FLAC__metadata_object_application_set_data.argtypes = [POINTER(FLAC__StreamMetadata), POINTER(FLAC__byte), c_uint, FLAC__bool]'
+        ),
+    'FLAC__metadata_object_seektable_resize_points': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_seektable_resize_points = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_resize_points\n"
+        'FLAC__metadata_object_seektable_resize_points.restype = FLAC__bool\n'
+        'FLAC__metadata_object_seektable_resize_points.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]'
+        ),
+    'FLAC__metadata_object_seektable_set_point': (None, ('FLAC__StreamMetadata', 'FLAC__StreamMetadata_SeekPoint'),
+        "FLAC__metadata_object_seektable_set_point = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_set_point\n"
+        'FLAC__metadata_object_seektable_set_point.restype = None\n'
+        'FLAC__metadata_object_seektable_set_point.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, FLAC__StreamMetadata_SeekPoint]'
+        ),
+    'FLAC__metadata_object_seektable_insert_point': (None, ('FLAC__StreamMetadata', 'FLAC__StreamMetadata_SeekPoint'),
+        "FLAC__metadata_object_seektable_insert_point = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_insert_point\n"
+        'FLAC__metadata_object_seektable_insert_point.restype = FLAC__bool\n'
+        'FLAC__metadata_object_seektable_insert_point.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, FLAC__StreamMetadata_SeekPoint]'
+        ),
+    'FLAC__metadata_object_seektable_delete_point': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_seektable_delete_point = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_delete_point\n"
+        'FLAC__metadata_object_seektable_delete_point.restype = FLAC__bool\n'
+        'FLAC__metadata_object_seektable_delete_point.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]'
+        ),
+    'FLAC__metadata_object_seektable_is_legal': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_seektable_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_is_legal\n"
+        'FLAC__metadata_object_seektable_is_legal.restype = FLAC__bool\n'
+        'FLAC__metadata_object_seektable_is_legal.argtypes = [POINTER(FLAC__StreamMetadata)]'
+        ),
+    'FLAC__metadata_object_seektable_template_append_placeholders': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_seektable_template_append_placeholders = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_template_append_placeholders\n"
+        'FLAC__metadata_object_seektable_template_append_placeholders.restype = FLAC__bool\n'
+        'FLAC__metadata_object_seektable_template_append_placeholders.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]'
+        ),
+    'FLAC__metadata_object_seektable_template_append_point': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_seektable_template_append_point = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_template_append_point\n"
+        'FLAC__metadata_object_seektable_template_append_point.restype = FLAC__bool\n'
+        'FLAC__metadata_object_seektable_template_append_point.argtypes = [POINTER(FLAC__StreamMetadata), FLAC__uint64]'
+        ),
+    'FLAC__metadata_object_seektable_template_append_points': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_seektable_template_append_points = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_template_append_points\n"
+        'FLAC__metadata_object_seektable_template_append_points.restype = FLAC__bool\n'
+        'FLAC__metadata_object_seektable_template_append_points.argtypes = [POINTER(FLAC__StreamMetadata), POINTER(FLAC__uint64), c_uint]'
+        ),
+    'FLAC__metadata_object_seektable_template_append_spaced_points': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_seektable_template_append_spaced_points = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_template_append_spaced_points\n"
+        'FLAC__metadata_object_seektable_template_append_spaced_points.restype = FLAC__bool\n'
+        'FLAC__metadata_object_seektable_template_append_spaced_points.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, FLAC__uint64]'
+        ),
+    'FLAC__metadata_object_seektable_template_append_spaced_points_by_samples': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_seektable_template_append_spaced_points_by_samples = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_template_append_spaced_points_by_samples\n"
+        'FLAC__metadata_object_seektable_template_append_spaced_points_by_samples.restype = FLAC__bool\n'
+        'FLAC__metadata_object_seektable_template_append_spaced_points_by_samples.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, FLAC__uint64]'
+        ),
+    'FLAC__metadata_object_seektable_template_sort': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_seektable_template_sort = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_seektable_template_sort\n"
+        'FLAC__metadata_object_seektable_template_sort.restype = FLAC__bool\n'
+        'FLAC__metadata_object_seektable_template_sort.argtypes = [POINTER(FLAC__StreamMetadata), FLAC__bool]'
+        ),
+    'FLAC__metadata_object_vorbiscomment_set_vendor_string': (None, ('FLAC__StreamMetadata', 'FLAC__StreamMetadata_VorbisComment_Entry'),
+        "FLAC__metadata_object_vorbiscomment_set_vendor_string = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_set_vendor_string\n"
+        'FLAC__metadata_object_vorbiscomment_set_vendor_string.restype = FLAC__bool\n'
+        'FLAC__metadata_object_vorbiscomment_set_vendor_string.argtypes = [POINTER(FLAC__StreamMetadata), FLAC__StreamMetadata_VorbisComment_Entry, FLAC__bool]'
+        ),
+    'FLAC__metadata_object_vorbiscomment_resize_comments': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_vorbiscomment_resize_comments = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_resize_comments\n"
+        'FLAC__metadata_object_vorbiscomment_resize_comments.restype = FLAC__bool\n'
+        'FLAC__metadata_object_vorbiscomment_resize_comments.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]'
+        ),
+    'FLAC__metadata_object_vorbiscomment_set_comment': (None, ('FLAC__StreamMetadata', 'FLAC__StreamMetadata_VorbisComment_Entry'),
+        "FLAC__metadata_object_vorbiscomment_set_comment = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_set_comment\n"
+        'FLAC__metadata_object_vorbiscomment_set_comment.restype = FLAC__bool\n'
+        'FLAC__metadata_object_vorbiscomment_set_comment.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, FLAC__StreamMetadata_VorbisComment_Entry, FLAC__bool]'
+        ),
+    'FLAC__metadata_object_vorbiscomment_insert_comment': (None, ('FLAC__StreamMetadata', 'FLAC__StreamMetadata_VorbisComment_Entry'),
+        "FLAC__metadata_object_vorbiscomment_insert_comment = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_insert_comment\n"
+        'FLAC__metadata_object_vorbiscomment_insert_comment.restype = FLAC__bool\n'
+        'FLAC__metadata_object_vorbiscomment_insert_comment.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, FLAC__StreamMetadata_VorbisComment_Entry, FLAC__bool]'
+        ),
+    'FLAC__metadata_object_vorbiscomment_append_comment': (None, ('FLAC__StreamMetadata', 'FLAC__StreamMetadata_VorbisComment_Entry'),
+        "FLAC__metadata_object_vorbiscomment_append_comment = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_append_comment\n"
+        'FLAC__metadata_object_vorbiscomment_append_comment.restype = FLAC__bool\n'
+        'FLAC__metadata_object_vorbiscomment_append_comment.argtypes = [POINTER(FLAC__StreamMetadata), FLAC__StreamMetadata_VorbisComment_Entry, FLAC__bool]'
+        ),
+    'FLAC__metadata_object_vorbiscomment_replace_comment': (None, ('FLAC__StreamMetadata', 'FLAC__StreamMetadata_VorbisComment_Entry'),
+        "FLAC__metadata_object_vorbiscomment_replace_comment = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_replace_comment\n"
+        'FLAC__metadata_object_vorbiscomment_replace_comment.restype = FLAC__bool\n'
+        'FLAC__metadata_object_vorbiscomment_replace_comment.argtypes = [POINTER(FLAC__StreamMetadata), FLAC__StreamMetadata_VorbisComment_Entry, FLAC__bool, FLAC__bool]'
+        ),
+    'FLAC__metadata_object_vorbiscomment_delete_comment': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_vorbiscomment_delete_comment = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_delete_comment\n"
+        'FLAC__metadata_object_vorbiscomment_delete_comment.restype = FLAC__bool\n'
+        'FLAC__metadata_object_vorbiscomment_delete_comment.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]'
+        ),
+    'FLAC__metadata_object_vorbiscomment_entry_from_name_value_pair': (None, ('FLAC__StreamMetadata_VorbisComment_Entry',),
+        "FLAC__metadata_object_vorbiscomment_entry_from_name_value_pair = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_entry_from_name_value_pair\n"
+        'FLAC__metadata_object_vorbiscomment_entry_from_name_value_pair.restype = FLAC__bool\n'
+        'FLAC__metadata_object_vorbiscomment_entry_from_name_value_pair.argtypes = [POINTER(FLAC__StreamMetadata_VorbisComment_Entry), STRING, STRING]'
+        ),
+    'FLAC__metadata_object_vorbiscomment_entry_to_name_value_pair': (None, ('FLAC__StreamMetadata_VorbisComment_Entry',),
+        "FLAC__metadata_object_vorbiscomment_entry_to_name_value_pair = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_entry_to_name_value_pair\n"
+        'FLAC__metadata_object_vorbiscomment_entry_to_name_value_pair.restype = FLAC__bool\n'
+        'FLAC__metadata_object_vorbiscomment_entry_to_name_value_pair.argtypes = [FLAC__StreamMetadata_VorbisComment_Entry, POINTER(STRING), POINTER(STRING)]'
+        ),
+    'FLAC__metadata_object_vorbiscomment_entry_matches': (None, ('FLAC__StreamMetadata_VorbisComment_Entry',),
+        "FLAC__metadata_object_vorbiscomment_entry_matches = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_entry_matches\n"
+        'FLAC__metadata_object_vorbiscomment_entry_matches.restype = FLAC__bool\n'
+        'FLAC__metadata_object_vorbiscomment_entry_matches.argtypes = [FLAC__StreamMetadata_VorbisComment_Entry, STRING, c_uint]'
+        ),
+    'FLAC__metadata_object_vorbiscomment_find_entry_from': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_vorbiscomment_find_entry_from = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_find_entry_from\n"
+        'FLAC__metadata_object_vorbiscomment_find_entry_from.restype = c_int\n'
+        'FLAC__metadata_object_vorbiscomment_find_entry_from.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, STRING]'
+        ),
+    'FLAC__metadata_object_vorbiscomment_remove_entry_matching': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_vorbiscomment_remove_entry_matching = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_remove_entry_matching\n"
+        'FLAC__metadata_object_vorbiscomment_remove_entry_matching.restype = c_int\n'
+        'FLAC__metadata_object_vorbiscomment_remove_entry_matching.argtypes = [POINTER(FLAC__StreamMetadata), STRING]'
+        ),
+    'FLAC__metadata_object_vorbiscomment_remove_entries_matching': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_vorbiscomment_remove_entries_matching = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_vorbiscomment_remove_entries_matching\n"
+        'FLAC__metadata_object_vorbiscomment_remove_entries_matching.restype = c_int\n'
+        'FLAC__metadata_object_vorbiscomment_remove_entries_matching.argtypes = [POINTER(FLAC__StreamMetadata), STRING]'
+        ),
+    'FLAC__metadata_object_cuesheet_track_new': (None, ('FLAC__StreamMetadata_CueSheet_Track',),
+        "FLAC__metadata_object_cuesheet_track_new = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_track_new\n"
+        'FLAC__metadata_object_cuesheet_track_new.restype = POINTER(FLAC__StreamMetadata_CueSheet_Track)\n'
+        'FLAC__metadata_object_cuesheet_track_new.argtypes = []'
+        ),
+    'FLAC__metadata_object_cuesheet_track_clone': (None, ('FLAC__StreamMetadata_CueSheet_Track',),
+        "FLAC__metadata_object_cuesheet_track_clone = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_track_clone\n"
+        'FLAC__metadata_object_cuesheet_track_clone.restype = POINTER(FLAC__StreamMetadata_CueSheet_Track)\n'
+        'FLAC__metadata_object_cuesheet_track_clone.argtypes = [POINTER(FLAC__StreamMetadata_CueSheet_Track)]'
+        ),
+    'FLAC__metadata_object_cuesheet_track_delete': (None, ('FLAC__StreamMetadata_CueSheet_Track',),
+        "FLAC__metadata_object_cuesheet_track_delete = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_track_delete\n"
+        'FLAC__metadata_object_cuesheet_track_delete.restype = None\n'
+        'FLAC__metadata_object_cuesheet_track_delete.argtypes = [POINTER(FLAC__StreamMetadata_CueSheet_Track)]'
+        ),
+    'FLAC__metadata_object_cuesheet_track_resize_indices': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_cuesheet_track_resize_indices = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_track_resize_indices\n"
+        'FLAC__metadata_object_cuesheet_track_resize_indices.restype = FLAC__bool\n'
+        'FLAC__metadata_object_cuesheet_track_resize_indices.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, c_uint]'
+        ),
+    'FLAC__metadata_object_cuesheet_track_insert_index': (None, ('FLAC__StreamMetadata', 'FLAC__StreamMetadata_CueSheet_Index'),
+        "FLAC__metadata_object_cuesheet_track_insert_index = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_track_insert_index\n"
+        'FLAC__metadata_object_cuesheet_track_insert_index.restype = FLAC__bool\n'
+        'FLAC__metadata_object_cuesheet_track_insert_index.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, c_uint, FLAC__StreamMetadata_CueSheet_Index]'
+        ),
+    'FLAC__metadata_object_cuesheet_track_insert_blank_index': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_cuesheet_track_insert_blank_index = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_track_insert_blank_index\n"
+        'FLAC__metadata_object_cuesheet_track_insert_blank_index.restype = FLAC__bool\n'
+        'FLAC__metadata_object_cuesheet_track_insert_blank_index.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, c_uint]'
+        ),
+    'FLAC__metadata_object_cuesheet_track_delete_index': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_cuesheet_track_delete_index = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_track_delete_index\n"
+        'FLAC__metadata_object_cuesheet_track_delete_index.restype = FLAC__bool\n'
+        'FLAC__metadata_object_cuesheet_track_delete_index.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, c_uint]'
+        ),
+    'FLAC__metadata_object_cuesheet_resize_tracks': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_cuesheet_resize_tracks = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_resize_tracks\n"
+        'FLAC__metadata_object_cuesheet_resize_tracks.restype = FLAC__bool\n'
+        'FLAC__metadata_object_cuesheet_resize_tracks.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]'
+        ),
+    'FLAC__metadata_object_cuesheet_set_track': (None, ('FLAC__StreamMetadata', 'FLAC__StreamMetadata_CueSheet_Track'),
+        "FLAC__metadata_object_cuesheet_set_track = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_set_track\n"
+        'FLAC__metadata_object_cuesheet_set_track.restype = FLAC__bool\n'
+        'FLAC__metadata_object_cuesheet_set_track.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, POINTER(FLAC__StreamMetadata_CueSheet_Track), FLAC__bool]'
+        ),
+    'FLAC__metadata_object_cuesheet_insert_track': (None, ('FLAC__StreamMetadata', 'FLAC__StreamMetadata_CueSheet_Track'),
+        "FLAC__metadata_object_cuesheet_insert_track = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_insert_track\n"
+        'FLAC__metadata_object_cuesheet_insert_track.restype = FLAC__bool\n'
+        'FLAC__metadata_object_cuesheet_insert_track.argtypes = [POINTER(FLAC__StreamMetadata), c_uint, POINTER(FLAC__StreamMetadata_CueSheet_Track), FLAC__bool]'
+        ),
+    'FLAC__metadata_object_cuesheet_insert_blank_track': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_cuesheet_insert_blank_track = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_insert_blank_track\n"
+        'FLAC__metadata_object_cuesheet_insert_blank_track.restype = FLAC__bool\n'
+        'FLAC__metadata_object_cuesheet_insert_blank_track.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]'
+        ),
+    'FLAC__metadata_object_cuesheet_delete_track': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_cuesheet_delete_track = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_delete_track\n"
+        'FLAC__metadata_object_cuesheet_delete_track.restype = FLAC__bool\n'
+        'FLAC__metadata_object_cuesheet_delete_track.argtypes = [POINTER(FLAC__StreamMetadata), c_uint]'
+        ),
+    'FLAC__metadata_object_cuesheet_is_legal': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_cuesheet_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_is_legal\n"
+        'FLAC__metadata_object_cuesheet_is_legal.restype = FLAC__bool\n'
+        'FLAC__metadata_object_cuesheet_is_legal.argtypes = [POINTER(FLAC__StreamMetadata), FLAC__bool, POINTER(STRING)]'
+        ),
+    'FLAC__metadata_object_cuesheet_calculate_cddb_id': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_cuesheet_calculate_cddb_id = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_cuesheet_calculate_cddb_id\n"
+        'FLAC__metadata_object_cuesheet_calculate_cddb_id.restype = FLAC__uint32\n'
+        'FLAC__metadata_object_cuesheet_calculate_cddb_id.argtypes = [POINTER(FLAC__StreamMetadata)]'
+        ),
+    'FLAC__metadata_object_picture_set_mime_type': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_picture_set_mime_type = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_picture_set_mime_type\n"
+        'FLAC__metadata_object_picture_set_mime_type.restype = FLAC__bool\n'
+        'FLAC__metadata_object_picture_set_mime_type.argtypes = [POINTER(FLAC__StreamMetadata), STRING, FLAC__bool]'
+        ),
+    'FLAC__metadata_object_picture_set_description': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_picture_set_description = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_picture_set_description\n"
+        'FLAC__metadata_object_picture_set_description.restype = FLAC__bool\n'
+        'FLAC__metadata_object_picture_set_description.argtypes = [POINTER(FLAC__StreamMetadata), POINTER(FLAC__byte), FLAC__bool]'
+        ),
+    'FLAC__metadata_object_picture_set_data': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_picture_set_data = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_picture_set_data\n"
+        'FLAC__metadata_object_picture_set_data.restype = FLAC__bool\n'
+        'FLAC__metadata_object_picture_set_data.argtypes = [POINTER(FLAC__StreamMetadata), POINTER(FLAC__byte), FLAC__uint32, FLAC__bool]'
+        ),
+    'FLAC__metadata_object_picture_is_legal': (None, ('FLAC__StreamMetadata',),
+        "FLAC__metadata_object_picture_is_legal = _libraries['/usr/lib/libFLAC.so'].FLAC__metadata_object_picture_is_legal\n"
+        'FLAC__metadata_object_picture_is_legal.restype = FLAC__bool\n'
+        'FLAC__metadata_object_picture_is_legal.argtypes = [POINTER(FLAC__StreamMetadata), POINTER(STRING)]'
+        ),
+    'FLAC__StreamDecoderStateString': (None, (),
+        "FLAC__StreamDecoderStateString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderStateString')"
+        ),
+    'FLAC__StreamDecoderInitStatusString': (None, (),
+        "FLAC__StreamDecoderInitStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderInitStatusString')"
+        ),
+    'FLAC__StreamDecoderReadStatusString': (None, (),
+        "FLAC__StreamDecoderReadStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderReadStatusString')"
+        ),
+    'FLAC__StreamDecoderSeekStatusString': (None, (),
+        "FLAC__StreamDecoderSeekStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderSeekStatusString')"
+        ),
+    'FLAC__StreamDecoderTellStatusString': (None, (),
+        "FLAC__StreamDecoderTellStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderTellStatusString')"
+        ),
+    'FLAC__StreamDecoderLengthStatusString': (None, (),
+        "FLAC__StreamDecoderLengthStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderLengthStatusString')"
+        ),
+    'FLAC__StreamDecoderWriteStatusString': (None, (),
+        "FLAC__StreamDecoderWriteStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderWriteStatusString')"
+        ),
+    'FLAC__StreamDecoderErrorStatusString': (None, (),
+        "FLAC__StreamDecoderErrorStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamDecoderErrorStatusString')"
+        ),
+    'FLAC__StreamDecoderProtected': ('Structure', (),
+        'FLAC__StreamDecoderProtected._fields_ = [\n'
+        ']'
+        ),
+    'FLAC__StreamDecoderPrivate': ('Structure', (),
+        'FLAC__StreamDecoderPrivate._fields_ = [\n'
+        ']'
+        ),
+    'FLAC__StreamDecoder': ('Structure', ('FLAC__StreamDecoderPrivate', 'FLAC__StreamDecoderProtected'),
+        'FLAC__StreamDecoder._fields_ = [\n'
+        "    ('protected_', POINTER(FLAC__StreamDecoderProtected)),\n"
+        "    ('private_', POINTER(FLAC__StreamDecoderPrivate)),\n"
+        ']'
+        ),
+    'FLAC__StreamDecoderReadCallback': (None, ('FLAC__StreamDecoder',),
+        'FLAC__StreamDecoderReadCallback = CFUNCTYPE(FLAC__StreamDecoderReadStatus, POINTER(FLAC__StreamDecoder), POINTER(FLAC__byte), POINTER(size_t), c_void_p)'
+        ),
+    'FLAC__StreamDecoderSeekCallback': (None, ('FLAC__StreamDecoder',),
+        'FLAC__StreamDecoderSeekCallback = CFUNCTYPE(FLAC__StreamDecoderSeekStatus, POINTER(FLAC__StreamDecoder), FLAC__uint64, c_void_p)'
+        ),
+    'FLAC__StreamDecoderTellCallback': (None, ('FLAC__StreamDecoder',),
+        'FLAC__StreamDecoderTellCallback = CFUNCTYPE(FLAC__StreamDecoderTellStatus, POINTER(FLAC__StreamDecoder), POINTER(FLAC__uint64), c_void_p)'
+        ),
+    'FLAC__StreamDecoderLengthCallback': (None, ('FLAC__StreamDecoder',),
+        'FLAC__StreamDecoderLengthCallback = CFUNCTYPE(FLAC__StreamDecoderLengthStatus, POINTER(FLAC__StreamDecoder), POINTER(FLAC__uint64), c_void_p)'
+        ),
+    'FLAC__StreamDecoderEofCallback': (None, ('FLAC__StreamDecoder',),
+        'FLAC__StreamDecoderEofCallback = CFUNCTYPE(FLAC__bool, POINTER(FLAC__StreamDecoder), c_void_p)'
+        ),
+    'FLAC__StreamDecoderWriteCallback': (None, ('FLAC__Frame', 'FLAC__StreamDecoder'),
+        'FLAC__StreamDecoderWriteCallback = CFUNCTYPE(FLAC__StreamDecoderWriteStatus, POINTER(FLAC__StreamDecoder), POINTER(FLAC__Frame), POINTER(POINTER(FLAC__int32)), c_void_p)'
+        ),
+    'FLAC__StreamDecoderMetadataCallback': (None, ('FLAC__StreamDecoder', 'FLAC__StreamMetadata'),
+        'FLAC__StreamDecoderMetadataCallback = CFUNCTYPE(None, POINTER(FLAC__StreamDecoder), POINTER(FLAC__StreamMetadata), c_void_p)'
+        ),
+    'FLAC__StreamDecoderErrorCallback': (None, ('FLAC__StreamDecoder',),
+        'FLAC__StreamDecoderErrorCallback = CFUNCTYPE(None, POINTER(FLAC__StreamDecoder), FLAC__StreamDecoderErrorStatus, c_void_p)'
+        ),
+    'FLAC__stream_decoder_new': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_new = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_new\n"
+        'FLAC__stream_decoder_new.restype = POINTER(FLAC__StreamDecoder)\n'
+        'FLAC__stream_decoder_new.argtypes = []'
+        ),
+    'FLAC__stream_decoder_delete': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_delete = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_delete\n"
+        'FLAC__stream_decoder_delete.restype = None\n'
+        'FLAC__stream_decoder_delete.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_set_ogg_serial_number': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_set_ogg_serial_number = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_ogg_serial_number\n"
+        'FLAC__stream_decoder_set_ogg_serial_number.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_set_ogg_serial_number.argtypes = [POINTER(FLAC__StreamDecoder), c_long]'
+        ),
+    'FLAC__stream_decoder_set_md5_checking': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_set_md5_checking = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_md5_checking\n"
+        'FLAC__stream_decoder_set_md5_checking.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_set_md5_checking.argtypes = [POINTER(FLAC__StreamDecoder), FLAC__bool]'
+        ),
+    'FLAC__stream_decoder_set_metadata_respond': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_set_metadata_respond = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_metadata_respond\n"
+        'FLAC__stream_decoder_set_metadata_respond.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_set_metadata_respond.argtypes = [POINTER(FLAC__StreamDecoder), FLAC__MetadataType]'
+        ),
+    'FLAC__stream_decoder_set_metadata_respond_application': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_set_metadata_respond_application = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_metadata_respond_application\n"
+        'FLAC__stream_decoder_set_metadata_respond_application.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_set_metadata_respond_application.argtypes = [POINTER(FLAC__StreamDecoder), POINTER(FLAC__byte)]'
+        ),
+    'FLAC__stream_decoder_set_metadata_respond_all': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_set_metadata_respond_all = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_metadata_respond_all\n"
+        'FLAC__stream_decoder_set_metadata_respond_all.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_set_metadata_respond_all.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_set_metadata_ignore': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_set_metadata_ignore = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_metadata_ignore\n"
+        'FLAC__stream_decoder_set_metadata_ignore.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_set_metadata_ignore.argtypes = [POINTER(FLAC__StreamDecoder), FLAC__MetadataType]'
+        ),
+    'FLAC__stream_decoder_set_metadata_ignore_application': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_set_metadata_ignore_application = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_metadata_ignore_application\n"
+        'FLAC__stream_decoder_set_metadata_ignore_application.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_set_metadata_ignore_application.argtypes = [POINTER(FLAC__StreamDecoder), POINTER(FLAC__byte)]'
+        ),
+    'FLAC__stream_decoder_set_metadata_ignore_all': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_set_metadata_ignore_all = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_set_metadata_ignore_all\n"
+        'FLAC__stream_decoder_set_metadata_ignore_all.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_set_metadata_ignore_all.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_get_state': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_get_state = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_state\n"
+        'FLAC__stream_decoder_get_state.restype = FLAC__StreamDecoderState\n'
+        'FLAC__stream_decoder_get_state.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_get_resolved_state_string': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_get_resolved_state_string = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_resolved_state_string\n"
+        'FLAC__stream_decoder_get_resolved_state_string.restype = STRING\n'
+        'FLAC__stream_decoder_get_resolved_state_string.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_get_md5_checking': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_get_md5_checking = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_md5_checking\n"
+        'FLAC__stream_decoder_get_md5_checking.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_get_md5_checking.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_get_total_samples': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_get_total_samples = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_total_samples\n"
+        'FLAC__stream_decoder_get_total_samples.restype = FLAC__uint64\n'
+        'FLAC__stream_decoder_get_total_samples.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_get_channels': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_get_channels = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_channels\n"
+        'FLAC__stream_decoder_get_channels.restype = c_uint\n'
+        'FLAC__stream_decoder_get_channels.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_get_channel_assignment': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_get_channel_assignment = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_channel_assignment\n"
+        'FLAC__stream_decoder_get_channel_assignment.restype = FLAC__ChannelAssignment\n'
+        'FLAC__stream_decoder_get_channel_assignment.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_get_bits_per_sample': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_get_bits_per_sample = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_bits_per_sample\n"
+        'FLAC__stream_decoder_get_bits_per_sample.restype = c_uint\n'
+        'FLAC__stream_decoder_get_bits_per_sample.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_get_sample_rate': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_get_sample_rate = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_sample_rate\n"
+        'FLAC__stream_decoder_get_sample_rate.restype = c_uint\n'
+        'FLAC__stream_decoder_get_sample_rate.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_get_blocksize': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_get_blocksize = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_blocksize\n"
+        'FLAC__stream_decoder_get_blocksize.restype = c_uint\n'
+        'FLAC__stream_decoder_get_blocksize.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_get_decode_position': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_get_decode_position = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_get_decode_position\n"
+        'FLAC__stream_decoder_get_decode_position.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_get_decode_position.argtypes = [POINTER(FLAC__StreamDecoder), POINTER(FLAC__uint64)]'
+        ),
+    'FLAC__stream_decoder_init_stream': (None, ('FLAC__StreamDecoder', 'FLAC__StreamDecoderEofCallback', 'FLAC__StreamDecoderErrorCallback', 'FLAC__StreamDecoderLengthCallback', 'FLAC__StreamDecoderMetadataCallback', 'FLAC__StreamDecoderReadCallback', 'FLAC__StreamDecoderSeekCallback', 'FLAC__StreamDecoderTellCallback', 'FLAC__StreamDecoderWriteCallback'),
+        "FLAC__stream_decoder_init_stream = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_init_stream\n"
+        'FLAC__stream_decoder_init_stream.restype = FLAC__StreamDecoderInitStatus\n'
+        'FLAC__stream_decoder_init_stream.argtypes = [POINTER(FLAC__StreamDecoder), FLAC__StreamDecoderReadCallback, FLAC__StreamDecoderSeekCallback, FLAC__StreamDecoderTellCallback, FLAC__StreamDecoderLengthCallback, FLAC__StreamDecoderEofCallback, FLAC__StreamDecoderWriteCallback, FLAC__StreamDecoderMetadataCallback, FLAC__StreamDecoderErrorCallback, c_void_p]'
+        ),
+    'FLAC__stream_decoder_init_ogg_stream': (None, ('FLAC__StreamDecoder', 'FLAC__StreamDecoderEofCallback', 'FLAC__StreamDecoderErrorCallback', 'FLAC__StreamDecoderLengthCallback', 'FLAC__StreamDecoderMetadataCallback', 'FLAC__StreamDecoderReadCallback', 'FLAC__StreamDecoderSeekCallback', 'FLAC__StreamDecoderTellCallback', 'FLAC__StreamDecoderWriteCallback'),
+        "FLAC__stream_decoder_init_ogg_stream = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_init_ogg_stream\n"
+        'FLAC__stream_decoder_init_ogg_stream.restype = FLAC__StreamDecoderInitStatus\n'
+        'FLAC__stream_decoder_init_ogg_stream.argtypes = [POINTER(FLAC__StreamDecoder), FLAC__StreamDecoderReadCallback, FLAC__StreamDecoderSeekCallback, FLAC__StreamDecoderTellCallback, FLAC__StreamDecoderLengthCallback, FLAC__StreamDecoderEofCallback, FLAC__StreamDecoderWriteCallback, FLAC__StreamDecoderMetadataCallback, FLAC__StreamDecoderErrorCallback, c_void_p]'
+        ),
+    'FILE': (None, ('_IO_FILE',),
+        'FILE = _IO_FILE'
+        ),
+    'FLAC__stream_decoder_init_FILE': (None, ('FILE', 'FLAC__StreamDecoder', 'FLAC__StreamDecoderErrorCallback', 'FLAC__StreamDecoderMetadataCallback', 'FLAC__StreamDecoderWriteCallback'),
+        "FLAC__stream_decoder_init_FILE = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_init_FILE\n"
+        'FLAC__stream_decoder_init_FILE.restype = FLAC__StreamDecoderInitStatus\n'
+        'FLAC__stream_decoder_init_FILE.argtypes = [POINTER(FLAC__StreamDecoder), POINTER(FILE), FLAC__StreamDecoderWriteCallback, FLAC__StreamDecoderMetadataCallback, FLAC__StreamDecoderErrorCallback, c_void_p]'
+        ),
+    'FLAC__stream_decoder_init_ogg_FILE': (None, ('FILE', 'FLAC__StreamDecoder', 'FLAC__StreamDecoderErrorCallback', 'FLAC__StreamDecoderMetadataCallback', 'FLAC__StreamDecoderWriteCallback'),
+        "FLAC__stream_decoder_init_ogg_FILE = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_init_ogg_FILE\n"
+        'FLAC__stream_decoder_init_ogg_FILE.restype = FLAC__StreamDecoderInitStatus\n'
+        'FLAC__stream_decoder_init_ogg_FILE.argtypes = [POINTER(FLAC__StreamDecoder), POINTER(FILE), FLAC__StreamDecoderWriteCallback, FLAC__StreamDecoderMetadataCallback, FLAC__StreamDecoderErrorCallback, c_void_p]'
+        ),
+    'FLAC__stream_decoder_init_file': (None, ('FLAC__StreamDecoder', 'FLAC__StreamDecoderErrorCallback', 'FLAC__StreamDecoderMetadataCallback', 'FLAC__StreamDecoderWriteCallback'),
+        "FLAC__stream_decoder_init_file = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_init_file\n"
+        'FLAC__stream_decoder_init_file.restype = FLAC__StreamDecoderInitStatus\n'
+        'FLAC__stream_decoder_init_file.argtypes = [POINTER(FLAC__StreamDecoder), STRING, FLAC__StreamDecoderWriteCallback, FLAC__StreamDecoderMetadataCallback, FLAC__StreamDecoderErrorCallback, c_void_p]'
+        ),
+    'FLAC__stream_decoder_init_ogg_file': (None, ('FLAC__StreamDecoder', 'FLAC__StreamDecoderErrorCallback', 'FLAC__StreamDecoderMetadataCallback', 'FLAC__StreamDecoderWriteCallback'),
+        "FLAC__stream_decoder_init_ogg_file = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_init_ogg_file\n"
+        'FLAC__stream_decoder_init_ogg_file.restype = FLAC__StreamDecoderInitStatus\n'
+        'FLAC__stream_decoder_init_ogg_file.argtypes = [POINTER(FLAC__StreamDecoder), STRING, FLAC__StreamDecoderWriteCallback, FLAC__StreamDecoderMetadataCallback, FLAC__StreamDecoderErrorCallback, c_void_p]'
+        ),
+    'FLAC__stream_decoder_finish': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_finish = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_finish\n"
+        'FLAC__stream_decoder_finish.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_finish.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_flush': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_flush = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_flush\n"
+        'FLAC__stream_decoder_flush.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_flush.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_reset': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_reset = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_reset\n"
+        'FLAC__stream_decoder_reset.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_reset.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_process_single': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_process_single = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_process_single\n"
+        'FLAC__stream_decoder_process_single.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_process_single.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_process_until_end_of_metadata': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_process_until_end_of_metadata = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_process_until_end_of_metadata\n"
+        'FLAC__stream_decoder_process_until_end_of_metadata.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_process_until_end_of_metadata.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_process_until_end_of_stream': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_process_until_end_of_stream = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_process_until_end_of_stream\n"
+        'FLAC__stream_decoder_process_until_end_of_stream.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_process_until_end_of_stream.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_skip_single_frame': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_skip_single_frame = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_skip_single_frame\n"
+        'FLAC__stream_decoder_skip_single_frame.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_skip_single_frame.argtypes = [POINTER(FLAC__StreamDecoder)]'
+        ),
+    'FLAC__stream_decoder_seek_absolute': (None, ('FLAC__StreamDecoder',),
+        "FLAC__stream_decoder_seek_absolute = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_decoder_seek_absolute\n"
+        'FLAC__stream_decoder_seek_absolute.restype = FLAC__bool\n'
+        'FLAC__stream_decoder_seek_absolute.argtypes = [POINTER(FLAC__StreamDecoder), FLAC__uint64]'
+        ),
+    'FLAC__StreamEncoderStateString': (None, (),
+        "FLAC__StreamEncoderStateString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamEncoderStateString')"
+        ),
+    'FLAC__StreamEncoderInitStatusString': (None, (),
+        "FLAC__StreamEncoderInitStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamEncoderInitStatusString')"
+        ),
+    'FLAC__StreamEncoderReadStatusString': (None, (),
+        "FLAC__StreamEncoderReadStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamEncoderReadStatusString')"
+        ),
+    'FLAC__StreamEncoderWriteStatusString': (None, (),
+        "FLAC__StreamEncoderWriteStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamEncoderWriteStatusString')"
+        ),
+    'FLAC__StreamEncoderSeekStatusString': (None, (),
+        "FLAC__StreamEncoderSeekStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamEncoderSeekStatusString')"
+        ),
+    'FLAC__StreamEncoderTellStatusString': (None, (),
+        "FLAC__StreamEncoderTellStatusString = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'FLAC__StreamEncoderTellStatusString')"
+        ),
+    'FLAC__StreamEncoderProtected': ('Structure', (),
+        'FLAC__StreamEncoderProtected._fields_ = [\n'
+        ']'
+        ),
+    'FLAC__StreamEncoderPrivate': ('Structure', (),
+        'FLAC__StreamEncoderPrivate._fields_ = [\n'
+        ']'
+        ),
+    'FLAC__StreamEncoder': ('Structure', ('FLAC__StreamEncoderPrivate', 'FLAC__StreamEncoderProtected'),
+        'FLAC__StreamEncoder._fields_ = [\n'
+        "    ('protected_', POINTER(FLAC__StreamEncoderProtected)),\n"
+        "    ('private_', POINTER(FLAC__StreamEncoderPrivate)),\n"
+        ']'
+        ),
+    'FLAC__StreamEncoderReadCallback': (None, ('FLAC__StreamEncoder',),
+        'FLAC__StreamEncoderReadCallback = CFUNCTYPE(FLAC__StreamEncoderReadStatus, POINTER(FLAC__StreamEncoder), POINTER(FLAC__byte), POINTER(size_t), c_void_p)'
+        ),
+    'FLAC__StreamEncoderWriteCallback': (None, ('FLAC__StreamEncoder',),
+        'FLAC__StreamEncoderWriteCallback = CFUNCTYPE(FLAC__StreamEncoderWriteStatus, POINTER(FLAC__StreamEncoder), POINTER(FLAC__byte), size_t, c_uint, c_uint, c_void_p)'
+        ),
+    'FLAC__StreamEncoderSeekCallback': (None, ('FLAC__StreamEncoder',),
+        'FLAC__StreamEncoderSeekCallback = CFUNCTYPE(FLAC__StreamEncoderSeekStatus, POINTER(FLAC__StreamEncoder), FLAC__uint64, c_void_p)'
+        ),
+    'FLAC__StreamEncoderTellCallback': (None, ('FLAC__StreamEncoder',),
+        'FLAC__StreamEncoderTellCallback = CFUNCTYPE(FLAC__StreamEncoderTellStatus, POINTER(FLAC__StreamEncoder), POINTER(FLAC__uint64), c_void_p)'
+        ),
+    'FLAC__StreamEncoderMetadataCallback': (None, ('FLAC__StreamEncoder', 'FLAC__StreamMetadata'),
+        'FLAC__StreamEncoderMetadataCallback = CFUNCTYPE(None, POINTER(FLAC__StreamEncoder), POINTER(FLAC__StreamMetadata), c_void_p)'
+        ),
+    'FLAC__StreamEncoderProgressCallback': (None, ('FLAC__StreamEncoder',),
+        'FLAC__StreamEncoderProgressCallback = CFUNCTYPE(None, POINTER(FLAC__StreamEncoder), FLAC__uint64, FLAC__uint64, c_uint, c_uint, c_void_p)'
+        ),
+    'FLAC__stream_encoder_new': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_new = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_new\n"
+        'FLAC__stream_encoder_new.restype = POINTER(FLAC__StreamEncoder)\n'
+        'FLAC__stream_encoder_new.argtypes = []'
+        ),
+    'FLAC__stream_encoder_delete': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_delete = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_delete\n"
+        'FLAC__stream_encoder_delete.restype = None\n'
+        'FLAC__stream_encoder_delete.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_set_ogg_serial_number': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_ogg_serial_number = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_ogg_serial_number\n"
+        'FLAC__stream_encoder_set_ogg_serial_number.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_ogg_serial_number.argtypes = [POINTER(FLAC__StreamEncoder), c_long]'
+        ),
+    'FLAC__stream_encoder_set_verify': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_verify = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_verify\n"
+        'FLAC__stream_encoder_set_verify.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_verify.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__bool]'
+        ),
+    'FLAC__stream_encoder_set_streamable_subset': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_streamable_subset = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_streamable_subset\n"
+        'FLAC__stream_encoder_set_streamable_subset.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_streamable_subset.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__bool]'
+        ),
+    'FLAC__stream_encoder_set_channels': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_channels = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_channels\n"
+        'FLAC__stream_encoder_set_channels.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_channels.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]'
+        ),
+    'FLAC__stream_encoder_set_bits_per_sample': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_bits_per_sample = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_bits_per_sample\n"
+        'FLAC__stream_encoder_set_bits_per_sample.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_bits_per_sample.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]'
+        ),
+    'FLAC__stream_encoder_set_sample_rate': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_sample_rate = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_sample_rate\n"
+        'FLAC__stream_encoder_set_sample_rate.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_sample_rate.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]'
+        ),
+    'FLAC__stream_encoder_set_compression_level': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_compression_level = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_compression_level\n"
+        'FLAC__stream_encoder_set_compression_level.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_compression_level.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]'
+        ),
+    'FLAC__stream_encoder_set_blocksize': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_blocksize = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_blocksize\n"
+        'FLAC__stream_encoder_set_blocksize.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_blocksize.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]'
+        ),
+    'FLAC__stream_encoder_set_do_mid_side_stereo': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_do_mid_side_stereo = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_do_mid_side_stereo\n"
+        'FLAC__stream_encoder_set_do_mid_side_stereo.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_do_mid_side_stereo.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__bool]'
+        ),
+    'FLAC__stream_encoder_set_loose_mid_side_stereo': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_loose_mid_side_stereo = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_loose_mid_side_stereo\n"
+        'FLAC__stream_encoder_set_loose_mid_side_stereo.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_loose_mid_side_stereo.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__bool]'
+        ),
+    'FLAC__stream_encoder_set_apodization': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_apodization = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_apodization\n"
+        'FLAC__stream_encoder_set_apodization.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_apodization.argtypes = [POINTER(FLAC__StreamEncoder), STRING]'
+        ),
+    'FLAC__stream_encoder_set_max_lpc_order': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_max_lpc_order = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_max_lpc_order\n"
+        'FLAC__stream_encoder_set_max_lpc_order.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_max_lpc_order.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]'
+        ),
+    'FLAC__stream_encoder_set_qlp_coeff_precision': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_qlp_coeff_precision = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_qlp_coeff_precision\n"
+        'FLAC__stream_encoder_set_qlp_coeff_precision.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_qlp_coeff_precision.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]'
+        ),
+    'FLAC__stream_encoder_set_do_qlp_coeff_prec_search': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_do_qlp_coeff_prec_search = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_do_qlp_coeff_prec_search\n"
+        'FLAC__stream_encoder_set_do_qlp_coeff_prec_search.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_do_qlp_coeff_prec_search.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__bool]'
+        ),
+    'FLAC__stream_encoder_set_do_escape_coding': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_do_escape_coding = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_do_escape_coding\n"
+        'FLAC__stream_encoder_set_do_escape_coding.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_do_escape_coding.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__bool]'
+        ),
+    'FLAC__stream_encoder_set_do_exhaustive_model_search': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_do_exhaustive_model_search = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_do_exhaustive_model_search\n"
+        'FLAC__stream_encoder_set_do_exhaustive_model_search.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_do_exhaustive_model_search.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__bool]'
+        ),
+    'FLAC__stream_encoder_set_min_residual_partition_order': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_min_residual_partition_order = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_min_residual_partition_order\n"
+        'FLAC__stream_encoder_set_min_residual_partition_order.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_min_residual_partition_order.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]'
+        ),
+    'FLAC__stream_encoder_set_max_residual_partition_order': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_max_residual_partition_order = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_max_residual_partition_order\n"
+        'FLAC__stream_encoder_set_max_residual_partition_order.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_max_residual_partition_order.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]'
+        ),
+    'FLAC__stream_encoder_set_rice_parameter_search_dist': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_rice_parameter_search_dist = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_rice_parameter_search_dist\n"
+        'FLAC__stream_encoder_set_rice_parameter_search_dist.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_rice_parameter_search_dist.argtypes = [POINTER(FLAC__StreamEncoder), c_uint]'
+        ),
+    'FLAC__stream_encoder_set_total_samples_estimate': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_total_samples_estimate = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_total_samples_estimate\n"
+        'FLAC__stream_encoder_set_total_samples_estimate.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_total_samples_estimate.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__uint64]'
+        ),
+    'FLAC__stream_encoder_set_metadata': (None, ('FLAC__StreamEncoder', 'FLAC__StreamMetadata'),
+        "FLAC__stream_encoder_set_metadata = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_metadata\n"
+        'FLAC__stream_encoder_set_metadata.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_set_metadata.argtypes = [POINTER(FLAC__StreamEncoder), POINTER(POINTER(FLAC__StreamMetadata)), c_uint]'
+        ),
+    'FLAC__stream_encoder_get_state': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_state = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_state\n"
+        'FLAC__stream_encoder_get_state.restype = FLAC__StreamEncoderState\n'
+        'FLAC__stream_encoder_get_state.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_verify_decoder_state': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_verify_decoder_state = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_verify_decoder_state\n"
+        'FLAC__stream_encoder_get_verify_decoder_state.restype = FLAC__StreamDecoderState\n'
+        'FLAC__stream_encoder_get_verify_decoder_state.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_resolved_state_string': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_resolved_state_string = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_resolved_state_string\n"
+        'FLAC__stream_encoder_get_resolved_state_string.restype = STRING\n'
+        'FLAC__stream_encoder_get_resolved_state_string.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_verify_decoder_error_stats': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_verify_decoder_error_stats = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_verify_decoder_error_stats\n"
+        'FLAC__stream_encoder_get_verify_decoder_error_stats.restype = None\n'
+        'FLAC__stream_encoder_get_verify_decoder_error_stats.argtypes = [POINTER(FLAC__StreamEncoder), POINTER(FLAC__uint64), POINTER(c_uint), POINTER(c_uint), POINTER(c_uint), POINTER(FLAC__int32), POINTER(FLAC__int32)]'
+        ),
+    'FLAC__stream_encoder_get_verify': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_verify = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_verify\n"
+        'FLAC__stream_encoder_get_verify.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_get_verify.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_streamable_subset': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_streamable_subset = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_streamable_subset\n"
+        'FLAC__stream_encoder_get_streamable_subset.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_get_streamable_subset.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_channels': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_channels = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_channels\n"
+        'FLAC__stream_encoder_get_channels.restype = c_uint\n'
+        'FLAC__stream_encoder_get_channels.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_bits_per_sample': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_bits_per_sample = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_bits_per_sample\n"
+        'FLAC__stream_encoder_get_bits_per_sample.restype = c_uint\n'
+        'FLAC__stream_encoder_get_bits_per_sample.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_sample_rate': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_sample_rate = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_sample_rate\n"
+        'FLAC__stream_encoder_get_sample_rate.restype = c_uint\n'
+        'FLAC__stream_encoder_get_sample_rate.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_blocksize': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_blocksize = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_blocksize\n"
+        'FLAC__stream_encoder_get_blocksize.restype = c_uint\n'
+        'FLAC__stream_encoder_get_blocksize.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_do_mid_side_stereo': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_do_mid_side_stereo = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_do_mid_side_stereo\n"
+        'FLAC__stream_encoder_get_do_mid_side_stereo.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_get_do_mid_side_stereo.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_loose_mid_side_stereo': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_loose_mid_side_stereo = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_loose_mid_side_stereo\n"
+        'FLAC__stream_encoder_get_loose_mid_side_stereo.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_get_loose_mid_side_stereo.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_max_lpc_order': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_max_lpc_order = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_max_lpc_order\n"
+        'FLAC__stream_encoder_get_max_lpc_order.restype = c_uint\n'
+        'FLAC__stream_encoder_get_max_lpc_order.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_qlp_coeff_precision': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_qlp_coeff_precision = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_qlp_coeff_precision\n"
+        'FLAC__stream_encoder_get_qlp_coeff_precision.restype = c_uint\n'
+        'FLAC__stream_encoder_get_qlp_coeff_precision.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_do_qlp_coeff_prec_search': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_do_qlp_coeff_prec_search = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_do_qlp_coeff_prec_search\n"
+        'FLAC__stream_encoder_get_do_qlp_coeff_prec_search.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_get_do_qlp_coeff_prec_search.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_do_escape_coding': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_do_escape_coding = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_do_escape_coding\n"
+        'FLAC__stream_encoder_get_do_escape_coding.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_get_do_escape_coding.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_do_exhaustive_model_search': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_do_exhaustive_model_search = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_do_exhaustive_model_search\n"
+        'FLAC__stream_encoder_get_do_exhaustive_model_search.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_get_do_exhaustive_model_search.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_min_residual_partition_order': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_min_residual_partition_order = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_min_residual_partition_order\n"
+        'FLAC__stream_encoder_get_min_residual_partition_order.restype = c_uint\n'
+        'FLAC__stream_encoder_get_min_residual_partition_order.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_max_residual_partition_order': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_max_residual_partition_order = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_max_residual_partition_order\n"
+        'FLAC__stream_encoder_get_max_residual_partition_order.restype = c_uint\n'
+        'FLAC__stream_encoder_get_max_residual_partition_order.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_rice_parameter_search_dist': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_rice_parameter_search_dist = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_rice_parameter_search_dist\n"
+        'FLAC__stream_encoder_get_rice_parameter_search_dist.restype = c_uint\n'
+        'FLAC__stream_encoder_get_rice_parameter_search_dist.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_get_total_samples_estimate': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_get_total_samples_estimate = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_get_total_samples_estimate\n"
+        'FLAC__stream_encoder_get_total_samples_estimate.restype = FLAC__uint64\n'
+        'FLAC__stream_encoder_get_total_samples_estimate.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_init_stream': (None, ('FLAC__StreamEncoder', 'FLAC__StreamEncoderMetadataCallback', 'FLAC__StreamEncoderSeekCallback', 'FLAC__StreamEncoderTellCallback', 'FLAC__StreamEncoderWriteCallback'),
+        "FLAC__stream_encoder_init_stream = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_init_stream\n"
+        'FLAC__stream_encoder_init_stream.restype = FLAC__StreamEncoderInitStatus\n'
+        'FLAC__stream_encoder_init_stream.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__StreamEncoderWriteCallback, FLAC__StreamEncoderSeekCallback, FLAC__StreamEncoderTellCallback, FLAC__StreamEncoderMetadataCallback, c_void_p]'
+        ),
+    'FLAC__stream_encoder_init_ogg_stream': (None, ('FLAC__StreamEncoder', 'FLAC__StreamEncoderMetadataCallback', 'FLAC__StreamEncoderReadCallback', 'FLAC__StreamEncoderSeekCallback', 'FLAC__StreamEncoderTellCallback', 'FLAC__StreamEncoderWriteCallback'),
+        "FLAC__stream_encoder_init_ogg_stream = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_init_ogg_stream\n"
+        'FLAC__stream_encoder_init_ogg_stream.restype = FLAC__StreamEncoderInitStatus\n'
+        'FLAC__stream_encoder_init_ogg_stream.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__StreamEncoderReadCallback, FLAC__StreamEncoderWriteCallback, FLAC__StreamEncoderSeekCallback, FLAC__StreamEncoderTellCallback, FLAC__StreamEncoderMetadataCallback, c_void_p]'
+        ),
+    'FLAC__stream_encoder_init_FILE': (None, ('FILE', 'FLAC__StreamEncoder', 'FLAC__StreamEncoderProgressCallback'),
+        "FLAC__stream_encoder_init_FILE = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_init_FILE\n"
+        'FLAC__stream_encoder_init_FILE.restype = FLAC__StreamEncoderInitStatus\n'
+        'FLAC__stream_encoder_init_FILE.argtypes = [POINTER(FLAC__StreamEncoder), POINTER(FILE), FLAC__StreamEncoderProgressCallback, c_void_p]'
+        ),
+    'FLAC__stream_encoder_init_ogg_FILE': (None, ('FILE', 'FLAC__StreamEncoder', 'FLAC__StreamEncoderProgressCallback'),
+        "FLAC__stream_encoder_init_ogg_FILE = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_init_ogg_FILE\n"
+        'FLAC__stream_encoder_init_ogg_FILE.restype = FLAC__StreamEncoderInitStatus\n'
+        'FLAC__stream_encoder_init_ogg_FILE.argtypes = [POINTER(FLAC__StreamEncoder), POINTER(FILE), FLAC__StreamEncoderProgressCallback, c_void_p]'
+        ),
+    'FLAC__stream_encoder_init_file': (None, ('FLAC__StreamEncoder', 'FLAC__StreamEncoderProgressCallback'),
+        "FLAC__stream_encoder_init_file = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_init_file\n"
+        'FLAC__stream_encoder_init_file.restype = FLAC__StreamEncoderInitStatus\n'
+        'FLAC__stream_encoder_init_file.argtypes = [POINTER(FLAC__StreamEncoder), STRING, FLAC__StreamEncoderProgressCallback, c_void_p]'
+        ),
+    'FLAC__stream_encoder_init_ogg_file': (None, ('FLAC__StreamEncoder', 'FLAC__StreamEncoderProgressCallback'),
+        "FLAC__stream_encoder_init_ogg_file = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_init_ogg_file\n"
+        'FLAC__stream_encoder_init_ogg_file.restype = FLAC__StreamEncoderInitStatus\n'
+        'FLAC__stream_encoder_init_ogg_file.argtypes = [POINTER(FLAC__StreamEncoder), STRING, FLAC__StreamEncoderProgressCallback, c_void_p]'
+        ),
+    'FLAC__stream_encoder_finish': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_finish = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_finish\n"
+        'FLAC__stream_encoder_finish.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_finish.argtypes = [POINTER(FLAC__StreamEncoder)]'
+        ),
+    'FLAC__stream_encoder_process': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_process = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_process\n"
+        'FLAC__stream_encoder_process.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_process.argtypes = [POINTER(FLAC__StreamEncoder), POINTER(POINTER(FLAC__int32)), c_uint]'
+        ),
+    'FLAC__stream_encoder_process_interleaved': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_process_interleaved = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_process_interleaved\n"
+        'FLAC__stream_encoder_process_interleaved.restype = FLAC__bool\n'
+        'FLAC__stream_encoder_process_interleaved.argtypes = [POINTER(FLAC__StreamEncoder), POINTER(FLAC__int32), c_uint]'
+        ),
+    'FLAC__stream_encoder_set_num_threads': (None, ('FLAC__StreamEncoder',),
+        "FLAC__stream_encoder_set_num_threads = _libraries['/usr/lib/libFLAC.so'].FLAC__stream_encoder_set_num_threads\n"
+        'FLAC__stream_encoder_set_num_threads.restype = FLAC__uint32\n'
+        'FLAC__stream_encoder_set_num_threads.argtypes = [POINTER(FLAC__StreamEncoder), FLAC__uint32]'
+        ),
+    'pthread_attr_t': ('Union', (),
+        'pthread_attr_t._fields_ = [\n'
+        "    ('__size', c_char * 56),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    '__pthread_internal_list': ('Structure', (),
+        '__pthread_internal_list._fields_ = [\n'
+        "    ('__prev', POINTER(__pthread_internal_list)),\n"
+        "    ('__next', POINTER(__pthread_internal_list)),\n"
+        ']'
+        ),
+    '__pthread_list_t': (None, ('__pthread_internal_list',),
+        '__pthread_list_t = __pthread_internal_list'
+        ),
+    '__pthread_mutex_s': ('Structure', ('__pthread_list_t',),
+        '__pthread_mutex_s._fields_ = [\n'
+        "    ('__lock', c_int),\n"
+        "    ('__count', c_uint),\n"
+        "    ('__owner', c_int),\n"
+        "    ('__nusers', c_uint),\n"
+        "    ('__kind', c_int),\n"
+        "    ('__spins', c_short),\n"
+        "    ('__elision', c_short),\n"
+        "    ('__list', __pthread_list_t),\n"
+        ']'
+        ),
+    'pthread_mutex_t': ('Union', ('__pthread_mutex_s',),
+        'pthread_mutex_t._fields_ = [\n'
+        "    ('__data', __pthread_mutex_s),\n"
+        "    ('__size', c_char * 40),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_mutexattr_t': ('Union', (),
+        'pthread_mutexattr_t._fields_ = [\n'
+        "    ('__size', c_char * 4),\n"
+        "    ('__align', c_int),\n"
+        ']'
+        ),
+    'N14pthread_cond_t4DOT_11E': ('Structure', (),
+        'N14pthread_cond_t4DOT_11E._fields_ = [\n'
+        "    ('__lock', c_int),\n"
+        "    ('__futex', c_uint),\n"
+        "    ('__total_seq', c_ulonglong),\n"
+        "    ('__wakeup_seq', c_ulonglong),\n"
+        "    ('__woken_seq', c_ulonglong),\n"
+        "    ('__mutex', c_void_p),\n"
+        "    ('__nwaiters', c_uint),\n"
+        "    ('__broadcast_seq', c_uint),\n"
+        ']'
+        ),
+    'pthread_cond_t': ('Union', ('N14pthread_cond_t4DOT_11E',),
+        'pthread_cond_t._fields_ = [\n'
+        "    ('__data', N14pthread_cond_t4DOT_11E),\n"
+        "    ('__size', c_char * 48),\n"
+        "    ('__align', c_longlong),\n"
+        ']'
+        ),
+    'pthread_condattr_t': ('Union', (),
+        'pthread_condattr_t._fields_ = [\n'
+        "    ('__size', c_char * 4),\n"
+        "    ('__align', c_int),\n"
+        ']'
+        ),
+    'N16pthread_rwlock_t4DOT_14E': ('Structure', (),
+        'N16pthread_rwlock_t4DOT_14E._fields_ = [\n'
+        "    ('__lock', c_int),\n"
+        "    ('__nr_readers', c_uint),\n"
+        "    ('__readers_wakeup', c_uint),\n"
+        "    ('__writer_wakeup', c_uint),\n"
+        "    ('__nr_readers_queued', c_uint),\n"
+        "    ('__nr_writers_queued', c_uint),\n"
+        "    ('__writer', c_int),\n"
+        "    ('__shared', c_int),\n"
+        "    ('__rwelision', c_byte),\n"
+        "    ('__pad1', c_ubyte * 7),\n"
+        "    ('__pad2', c_ulong),\n"
+        "    ('__flags', c_uint),\n"
+        ']'
+        ),
+    'pthread_rwlock_t': ('Union', ('N16pthread_rwlock_t4DOT_14E',),
+        'pthread_rwlock_t._fields_ = [\n'
+        "    ('__data', N16pthread_rwlock_t4DOT_14E),\n"
+        "    ('__size', c_char * 56),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_rwlockattr_t': ('Union', (),
+        'pthread_rwlockattr_t._fields_ = [\n'
+        "    ('__size', c_char * 8),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_barrier_t': ('Union', (),
+        'pthread_barrier_t._fields_ = [\n'
+        "    ('__size', c_char * 32),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_barrierattr_t': ('Union', (),
+        'pthread_barrierattr_t._fields_ = [\n'
+        "    ('__size', c_char * 4),\n"
+        "    ('__align', c_int),\n"
+        ']'
+        ),
+    '__fdelt_chk': (None, (),
+        "__fdelt_chk = _libraries['/usr/lib/libFLAC.so'].__fdelt_chk\n"
+        '__fdelt_chk.restype = c_long\n'
+        '__fdelt_chk.argtypes = [c_long]'
+        ),
+    '__fdelt_warn': (None, (),
+        "__fdelt_warn = _libraries['/usr/lib/libFLAC.so'].__fdelt_warn\n"
+        '__fdelt_warn.restype = c_long\n'
+        '__fdelt_warn.argtypes = [c_long]'
+        ),
+    '__sigset_t': ('Structure', (),
+        '__sigset_t._fields_ = [\n'
+        "    ('__val', c_ulong * 16),\n"
+        ']'
+        ),
+    'getchar': (None, (),
+        "getchar = _libraries['/usr/lib/libFLAC.so'].getchar\n"
+        'getchar.restype = c_int\n'
+        'getchar.argtypes = []'
+        ),
+    'fgetc_unlocked': (None, ('FILE',),
+        "fgetc_unlocked = _libraries['/usr/lib/libFLAC.so'].fgetc_unlocked\n"
+        'fgetc_unlocked.restype = c_int\n'
+        'fgetc_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'getc_unlocked': (None, ('FILE',),
+        "getc_unlocked = _libraries['/usr/lib/libFLAC.so'].getc_unlocked\n"
+        'getc_unlocked.restype = c_int\n'
+        'getc_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'getchar_unlocked': (None, (),
+        "getchar_unlocked = _libraries['/usr/lib/libFLAC.so'].getchar_unlocked\n"
+        'getchar_unlocked.restype = c_int\n'
+        'getchar_unlocked.argtypes = []'
+        ),
+    'putchar': (None, (),
+        "putchar = _libraries['/usr/lib/libFLAC.so'].putchar\n"
+        'putchar.restype = c_int\n'
+        'putchar.argtypes = [c_int]'
+        ),
+    'fputc_unlocked': (None, ('FILE',),
+        "fputc_unlocked = _libraries['/usr/lib/libFLAC.so'].fputc_unlocked\n"
+        'fputc_unlocked.restype = c_int\n'
+        'fputc_unlocked.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'putc_unlocked': (None, ('FILE',),
+        "putc_unlocked = _libraries['/usr/lib/libFLAC.so'].putc_unlocked\n"
+        'putc_unlocked.restype = c_int\n'
+        'putc_unlocked.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'putchar_unlocked': (None, (),
+        "putchar_unlocked = _libraries['/usr/lib/libFLAC.so'].putchar_unlocked\n"
+        'putchar_unlocked.restype = c_int\n'
+        'putchar_unlocked.argtypes = [c_int]'
+        ),
+    'getline': (None, ('FILE',),
+        "getline = _libraries['/usr/lib/libFLAC.so'].getline\n"
+        'getline.restype = __ssize_t\n'
+        'getline.argtypes = [POINTER(STRING), POINTER(size_t), POINTER(FILE)]'
+        ),
+    'feof_unlocked': (None, ('FILE',),
+        "feof_unlocked = _libraries['/usr/lib/libFLAC.so'].feof_unlocked\n"
+        'feof_unlocked.restype = c_int\n'
+        'feof_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'ferror_unlocked': (None, ('FILE',),
+        "ferror_unlocked = _libraries['/usr/lib/libFLAC.so'].ferror_unlocked\n"
+        'ferror_unlocked.restype = c_int\n'
+        'ferror_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    '__sprintf_chk': (None, (),
+        "__sprintf_chk = _libraries['/usr/lib/libFLAC.so'].__sprintf_chk\n"
+        '__sprintf_chk.restype = c_int\n'
+        '__sprintf_chk.argtypes = [STRING, c_int, size_t, STRING]'
+        ),
+    '__vsprintf_chk': (None, ('__va_list_tag',),
+        "__vsprintf_chk = _libraries['/usr/lib/libFLAC.so'].__vsprintf_chk\n"
+        '__vsprintf_chk.restype = c_int\n'
+        '__vsprintf_chk.argtypes = [STRING, c_int, size_t, STRING, POINTER(__va_list_tag)]'
+        ),
+    'sprintf': (None, (),
+        "sprintf = _libraries['/usr/lib/libFLAC.so'].sprintf\n"
+        'sprintf.restype = c_int\n'
+        'sprintf.argtypes = [STRING, STRING]'
+        ),
+    'vsprintf': (None, ('__va_list_tag',),
+        "vsprintf = _libraries['/usr/lib/libFLAC.so'].vsprintf\n"
+        'vsprintf.restype = c_int\n'
+        'vsprintf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__snprintf_chk': (None, (),
+        "__snprintf_chk = _libraries['/usr/lib/libFLAC.so'].__snprintf_chk\n"
+        '__snprintf_chk.restype = c_int\n'
+        '__snprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING]'
+        ),
+    '__vsnprintf_chk': (None, ('__va_list_tag',),
+        "__vsnprintf_chk = _libraries['/usr/lib/libFLAC.so'].__vsnprintf_chk\n"
+        '__vsnprintf_chk.restype = c_int\n'
+        '__vsnprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING, POINTER(__va_list_tag)]'
+        ),
+    'snprintf': (None, (),
+        "snprintf = _libraries['/usr/lib/libFLAC.so'].snprintf\n"
+        'snprintf.restype = c_int\n'
+        'snprintf.argtypes = [STRING, size_t, STRING]'
+        ),
+    'vsnprintf': (None, ('__va_list_tag',),
+        "vsnprintf = _libraries['/usr/lib/libFLAC.so'].vsnprintf\n"
+        'vsnprintf.restype = c_int\n'
+        'vsnprintf.argtypes = [STRING, size_t, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__fprintf_chk': (None, ('FILE',),
+        "__fprintf_chk = _libraries['/usr/lib/libFLAC.so'].__fprintf_chk\n"
+        '__fprintf_chk.restype = c_int\n'
+        '__fprintf_chk.argtypes = [POINTER(FILE), c_int, STRING]'
+        ),
+    '__printf_chk': (None, (),
+        "__printf_chk = _libraries['/usr/lib/libFLAC.so'].__printf_chk\n"
+        '__printf_chk.restype = c_int\n'
+        '__printf_chk.argtypes = [c_int, STRING]'
+        ),
+    '__vfprintf_chk': (None, ('FILE', '__va_list_tag'),
+        "__vfprintf_chk = _libraries['/usr/lib/libFLAC.so'].__vfprintf_chk\n"
+        '__vfprintf_chk.restype = c_int\n'
+        '__vfprintf_chk.argtypes = [POINTER(FILE), c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__vprintf_chk': (None, ('__va_list_tag',),
+        "__vprintf_chk = _libraries['/usr/lib/libFLAC.so'].__vprintf_chk\n"
+        '__vprintf_chk.restype = c_int\n'
+        '__vprintf_chk.argtypes = [c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'fprintf': (None, ('FILE',),
+        "fprintf = _libraries['/usr/lib/libFLAC.so'].fprintf\n"
+        'fprintf.restype = c_int\n'
+        'fprintf.argtypes = [POINTER(FILE), STRING]'
+        ),
+    'printf': (None, (),
+        "printf = _libraries['/usr/lib/libFLAC.so'].printf\n"
+        'printf.restype = c_int\n'
+        'printf.argtypes = [STRING]'
+        ),
+    'vprintf': (None, ('__va_list_tag',),
+        "vprintf = _libraries['/usr/lib/libFLAC.so'].vprintf\n"
+        'vprintf.restype = c_int\n'
+        'vprintf.argtypes = [STRING, POINTER(__va_list_tag)]'
+        ),
+    'vfprintf': (None, ('FILE', '__va_list_tag'),
+        "vfprintf = _libraries['/usr/lib/libFLAC.so'].vfprintf\n"
+        'vfprintf.restype = c_int\n'
+        'vfprintf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]'
+        ),
+    '__dprintf_chk': (None, (),
+        "__dprintf_chk = _libraries['/usr/lib/libFLAC.so'].__dprintf_chk\n"
+        '__dprintf_chk.restype = c_int\n'
+        '__dprintf_chk.argtypes = [c_int, c_int, STRING]'
+        ),
+    '__vdprintf_chk': (None, ('__va_list_tag',),
+        "__vdprintf_chk = _libraries['/usr/lib/libFLAC.so'].__vdprintf_chk\n"
+        '__vdprintf_chk.restype = c_int\n'
+        '__vdprintf_chk.argtypes = [c_int, c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'dprintf': (None, (),
+        "dprintf = _libraries['/usr/lib/libFLAC.so'].dprintf\n"
+        'dprintf.restype = c_int\n'
+        'dprintf.argtypes = [c_int, STRING]'
+        ),
+    'vdprintf': (None, ('__va_list_tag',),
+        "vdprintf = _libraries['/usr/lib/libFLAC.so'].vdprintf\n"
+        'vdprintf.restype = c_int\n'
+        'vdprintf.argtypes = [c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__asprintf_chk': (None, (),
+        "__asprintf_chk = _libraries['/usr/lib/libFLAC.so'].__asprintf_chk\n"
+        '__asprintf_chk.restype = c_int\n'
+        '__asprintf_chk.argtypes = [POINTER(STRING), c_int, STRING]'
+        ),
+    '__vasprintf_chk': (None, ('__va_list_tag',),
+        "__vasprintf_chk = _libraries['/usr/lib/libFLAC.so'].__vasprintf_chk\n"
+        '__vasprintf_chk.restype = c_int\n'
+        '__vasprintf_chk.argtypes = [POINTER(STRING), c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'obstack': ('Structure', (),
+        'obstack._fields_ = [\n'
+        ']'
+        ),
+    '__obstack_printf_chk': (None, ('obstack',),
+        "__obstack_printf_chk = _libraries['/usr/lib/libFLAC.so'].__obstack_printf_chk\n"
+        '__obstack_printf_chk.restype = c_int\n'
+        '__obstack_printf_chk.argtypes = [POINTER(obstack), c_int, STRING]'
+        ),
+    '__obstack_vprintf_chk': (None, ('__va_list_tag', 'obstack'),
+        "__obstack_vprintf_chk = _libraries['/usr/lib/libFLAC.so'].__obstack_vprintf_chk\n"
+        '__obstack_vprintf_chk.restype = c_int\n'
+        '__obstack_vprintf_chk.argtypes = [POINTER(obstack), c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'asprintf': (None, (),
+        "asprintf = _libraries['/usr/lib/libFLAC.so'].asprintf\n"
+        'asprintf.restype = c_int\n'
+        'asprintf.argtypes = [POINTER(STRING), STRING]'
+        ),
+    '__asprintf': (None, (),
+        "__asprintf = _libraries['/usr/lib/libFLAC.so'].__asprintf\n"
+        '__asprintf.restype = c_int\n'
+        '__asprintf.argtypes = [POINTER(STRING), STRING]'
+        ),
+    'obstack_printf': (None, ('obstack',),
+        "obstack_printf = _libraries['/usr/lib/libFLAC.so'].obstack_printf\n"
+        'obstack_printf.restype = c_int\n'
+        'obstack_printf.argtypes = [POINTER(obstack), STRING]'
+        ),
+    'vasprintf': (None, ('__va_list_tag',),
+        "vasprintf = _libraries['/usr/lib/libFLAC.so'].vasprintf\n"
+        'vasprintf.restype = c_int\n'
+        'vasprintf.argtypes = [POINTER(STRING), STRING, POINTER(__va_list_tag)]'
+        ),
+    'obstack_vprintf': (None, ('__va_list_tag', 'obstack'),
+        "obstack_vprintf = _libraries['/usr/lib/libFLAC.so'].obstack_vprintf\n"
+        'obstack_vprintf.restype = c_int\n'
+        'obstack_vprintf.argtypes = [POINTER(obstack), STRING, POINTER(__va_list_tag)]'
+        ),
+    '__fgets_chk': (None, ('FILE',),
+        "__fgets_chk = _libraries['/usr/lib/libFLAC.so'].__fgets_chk\n"
+        '__fgets_chk.restype = STRING\n'
+        '__fgets_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]'
+        ),
+    'fgets': (None, ('FILE',),
+        "fgets = _libraries['/usr/lib/libFLAC.so'].fgets\n"
+        'fgets.restype = STRING\n'
+        'fgets.argtypes = [STRING, c_int, POINTER(FILE)]'
+        ),
+    '__fread_chk': (None, ('FILE',),
+        "__fread_chk = _libraries['/usr/lib/libFLAC.so'].__fread_chk\n"
+        '__fread_chk.restype = size_t\n'
+        '__fread_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fread': (None, ('FILE',),
+        "fread = _libraries['/usr/lib/libFLAC.so'].fread\n"
+        'fread.restype = size_t\n'
+        'fread.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    '__fgets_unlocked_chk': (None, ('FILE',),
+        "__fgets_unlocked_chk = _libraries['/usr/lib/libFLAC.so'].__fgets_unlocked_chk\n"
+        '__fgets_unlocked_chk.restype = STRING\n'
+        '__fgets_unlocked_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]'
+        ),
+    'fgets_unlocked': (None, ('FILE',),
+        "fgets_unlocked = _libraries['/usr/lib/libFLAC.so'].fgets_unlocked\n"
+        'fgets_unlocked.restype = STRING\n'
+        'fgets_unlocked.argtypes = [STRING, c_int, POINTER(FILE)]'
+        ),
+    '__fread_unlocked_chk': (None, ('FILE',),
+        "__fread_unlocked_chk = _libraries['/usr/lib/libFLAC.so'].__fread_unlocked_chk\n"
+        '__fread_unlocked_chk.restype = size_t\n'
+        '__fread_unlocked_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fread_unlocked': (None, ('FILE',),
+        "fread_unlocked = _libraries['/usr/lib/libFLAC.so'].fread_unlocked\n"
+        'fread_unlocked.restype = size_t\n'
+        'fread_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'bsearch': (None, (),
+        "bsearch = _libraries['/usr/lib/libFLAC.so'].bsearch\n"
+        'bsearch.restype = c_void_p\n'
+        'bsearch.argtypes = [c_void_p, c_void_p, size_t, size_t, __compar_fn_t]'
+        ),
+    'atof': (None, (),
+        "atof = _libraries['/usr/lib/libFLAC.so'].atof\n"
+        'atof.restype = c_double\n'
+        'atof.argtypes = [STRING]'
+        ),
+    '__realpath_chk': (None, (),
+        "__realpath_chk = _libraries['/usr/lib/libFLAC.so'].__realpath_chk\n"
+        '__realpath_chk.restype = STRING\n'
+        '__realpath_chk.argtypes = [STRING, STRING, size_t]'
+        ),
+    'realpath': (None, (),
+        "realpath = _libraries['/usr/lib/libFLAC.so'].realpath\n"
+        'realpath.restype = STRING\n'
+        'realpath.argtypes = [STRING, STRING]'
+        ),
+    '__ptsname_r_chk': (None, (),
+        "__ptsname_r_chk = _libraries['/usr/lib/libFLAC.so'].__ptsname_r_chk\n"
+        '__ptsname_r_chk.restype = c_int\n'
+        '__ptsname_r_chk.argtypes = [c_int, STRING, size_t, size_t]'
+        ),
+    'ptsname_r': (None, (),
+        "ptsname_r = _libraries['/usr/lib/libFLAC.so'].ptsname_r\n"
+        'ptsname_r.restype = c_int\n'
+        'ptsname_r.argtypes = [c_int, STRING, size_t]'
+        ),
+    '__wctomb_chk': (None, (),
+        "__wctomb_chk = _libraries['/usr/lib/libFLAC.so'].__wctomb_chk\n"
+        '__wctomb_chk.restype = c_int\n'
+        '__wctomb_chk.argtypes = [STRING, c_wchar, size_t]'
+        ),
+    'wctomb': (None, (),
+        "wctomb = _libraries['/usr/lib/libFLAC.so'].wctomb\n"
+        'wctomb.restype = c_int\n'
+        'wctomb.argtypes = [STRING, c_wchar]'
+        ),
+    '__mbstowcs_chk': (None, (),
+        "__mbstowcs_chk = _libraries['/usr/lib/libFLAC.so'].__mbstowcs_chk\n"
+        '__mbstowcs_chk.restype = size_t\n'
+        '__mbstowcs_chk.argtypes = [WSTRING, STRING, size_t, size_t]'
+        ),
+    'mbstowcs': (None, (),
+        "mbstowcs = _libraries['/usr/lib/libFLAC.so'].mbstowcs\n"
+        'mbstowcs.restype = size_t\n'
+        'mbstowcs.argtypes = [WSTRING, STRING, size_t]'
+        ),
+    '__wcstombs_chk': (None, (),
+        "__wcstombs_chk = _libraries['/usr/lib/libFLAC.so'].__wcstombs_chk\n"
+        '__wcstombs_chk.restype = size_t\n'
+        '__wcstombs_chk.argtypes = [STRING, WSTRING, size_t, size_t]'
+        ),
+    'wcstombs': (None, (),
+        "wcstombs = _libraries['/usr/lib/libFLAC.so'].wcstombs\n"
+        'wcstombs.restype = size_t\n'
+        'wcstombs.argtypes = [STRING, WSTRING, size_t]'
+        ),
+    'sys_nerr': (None, (),
+        "sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libFLAC.so'], 'sys_nerr')"
+        ),
+    'sys_errlist': (None, (),
+        "sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], 'sys_errlist')"
+        ),
+    '_sys_nerr': (None, (),
+        "_sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libFLAC.so'], '_sys_nerr')"
+        ),
+    '_sys_errlist': (None, (),
+        "_sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libFLAC.so'], '_sys_errlist')"
+        ),
+    'timeval': ('Structure', (),
+        'timeval._fields_ = [\n'
+        "    ('tv_sec', __time_t),\n"
+        "    ('tv_usec', __suseconds_t),\n"
+        ']'
+        ),
+    '__fsid_t': ('Structure', (),
+        '__fsid_t._fields_ = [\n'
+        "    ('__val', c_int * 2),\n"
+        ']'
+        ),
+    'wait': ('Union', ('N4wait3DOT_1E', 'N4wait3DOT_2E'),
+        'wait._fields_ = [\n'
+        "    ('w_status', c_int),\n"
+        "    ('__wait_terminated', N4wait3DOT_1E),\n"
+        "    ('__wait_stopped', N4wait3DOT_2E),\n"
+        ']'
+        ),
+    'N4wait3DOT_1E': ('Structure', (),
+        'N4wait3DOT_1E._fields_ = [\n'
+        "    ('__w_termsig', c_uint, 7),\n"
+        "    ('__w_coredump', c_uint, 1),\n"
+        "    ('__w_retcode', c_uint, 8),\n"
+        "    ('', c_uint, 16),\n"
+        ']'
+        ),
+    'N4wait3DOT_2E': ('Structure', (),
+        'N4wait3DOT_2E._fields_ = [\n'
+        "    ('__w_stopval', c_uint, 8),\n"
+        "    ('__w_stopsig', c_uint, 8),\n"
+        "    ('', c_uint, 16),\n"
+        ']'
+        ),
+    '_IO_jump_t': ('Structure', (),
+        '_IO_jump_t._fields_ = [\n'
+        ']'
+        ),
+    '_IO_marker': ('Structure', ('_IO_FILE',),
+        '_IO_marker._fields_ = [\n'
+        "    ('_next', POINTER(_IO_marker)),\n"
+        "    ('_sbuf', POINTER(_IO_FILE)),\n"
+        "    ('_pos', c_int),\n"
+        ']'
+        ),
+    '_IO_FILE_plus': ('Structure', (),
+        '_IO_FILE_plus._fields_ = [\n'
+        ']'
+        ),
+    '_IO_2_1_stdin_': (None, ('_IO_FILE_plus',),
+        "_IO_2_1_stdin_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libFLAC.so'], '_IO_2_1_stdin_')"
+        ),
+    '_IO_2_1_stdout_': (None, ('_IO_FILE_plus',),
+        "_IO_2_1_stdout_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libFLAC.so'], '_IO_2_1_stdout_')"
+        ),
+    '_IO_2_1_stderr_': (None, ('_IO_FILE_plus',),
+        "_IO_2_1_stderr_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libFLAC.so'], '_IO_2_1_stderr_')"
+        ),
+    '_IO_cookie_io_functions_t': ('Structure', (),
+        '_IO_cookie_io_functions_t._fields_ = [\n'
+        "    ('read', POINTER(__io_read_fn)),\n"
+        "    ('write', POINTER(__io_write_fn)),\n"
+        "    ('seek', POINTER(__io_seek_fn)),\n"
+        "    ('close', POINTER(__io_close_fn)),\n"
+        ']'
+        ),
+    'cookie_io_functions_t': (None, ('_IO_cookie_io_functions_t',),
+        'cookie_io_functions_t = _IO_cookie_io_functions_t'
+        ),
+    '_IO_cookie_file': ('Structure', (),
+        '_IO_cookie_file._fields_ = [\n'
+        ']'
+        ),
+    '__underflow': (None, ('_IO_FILE',),
+        "__underflow = _libraries['/usr/lib/libFLAC.so'].__underflow\n"
+        '__underflow.restype = c_int\n'
+        '__underflow.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '__uflow': (None, ('_IO_FILE',),
+        "__uflow = _libraries['/usr/lib/libFLAC.so'].__uflow\n"
+        '__uflow.restype = c_int\n'
+        '__uflow.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '__overflow': (None, ('_IO_FILE',),
+        "__overflow = _libraries['/usr/lib/libFLAC.so'].__overflow\n"
+        '__overflow.restype = c_int\n'
+        '__overflow.argtypes = [POINTER(_IO_FILE), c_int]'
+        ),
+    '_IO_getc': (None, ('_IO_FILE',),
+        "_IO_getc = _libraries['/usr/lib/libFLAC.so']._IO_getc\n"
+        '_IO_getc.restype = c_int\n'
+        '_IO_getc.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_putc': (None, ('_IO_FILE',),
+        "_IO_putc = _libraries['/usr/lib/libFLAC.so']._IO_putc\n"
+        '_IO_putc.restype = c_int\n'
+        '_IO_putc.argtypes = [c_int, POINTER(_IO_FILE)]'
+        ),
+    '_IO_feof': (None, ('_IO_FILE',),
+        "_IO_feof = _libraries['/usr/lib/libFLAC.so']._IO_feof\n"
+        '_IO_feof.restype = c_int\n'
+        '_IO_feof.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_ferror': (None, ('_IO_FILE',),
+        "_IO_ferror = _libraries['/usr/lib/libFLAC.so']._IO_ferror\n"
+        '_IO_ferror.restype = c_int\n'
+        '_IO_ferror.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_peekc_locked': (None, ('_IO_FILE',),
+        "_IO_peekc_locked = _libraries['/usr/lib/libFLAC.so']._IO_peekc_locked\n"
+        '_IO_peekc_locked.restype = c_int\n'
+        '_IO_peekc_locked.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_flockfile': (None, ('_IO_FILE',),
+        "_IO_flockfile = _libraries['/usr/lib/libFLAC.so']._IO_flockfile\n"
+        '_IO_flockfile.restype = None\n'
+        '_IO_flockfile.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_funlockfile': (None, ('_IO_FILE',),
+        "_IO_funlockfile = _libraries['/usr/lib/libFLAC.so']._IO_funlockfile\n"
+        '_IO_funlockfile.restype = None\n'
+        '_IO_funlockfile.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_ftrylockfile': (None, ('_IO_FILE',),
+        "_IO_ftrylockfile = _libraries['/usr/lib/libFLAC.so']._IO_ftrylockfile\n"
+        '_IO_ftrylockfile.restype = c_int\n'
+        '_IO_ftrylockfile.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_vfscanf': (None, ('_IO_FILE', '__va_list_tag'),
+        "_IO_vfscanf = _libraries['/usr/lib/libFLAC.so']._IO_vfscanf\n"
+        '_IO_vfscanf.restype = c_int\n'
+        '_IO_vfscanf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag), POINTER(c_int)]'
+        ),
+    '_IO_vfprintf': (None, ('_IO_FILE', '__va_list_tag'),
+        "_IO_vfprintf = _libraries['/usr/lib/libFLAC.so']._IO_vfprintf\n"
+        '_IO_vfprintf.restype = c_int\n'
+        '_IO_vfprintf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag)]'
+        ),
+    '_IO_padn': (None, ('_IO_FILE',),
+        "_IO_padn = _libraries['/usr/lib/libFLAC.so']._IO_padn\n"
+        '_IO_padn.restype = __ssize_t\n'
+        '_IO_padn.argtypes = [POINTER(_IO_FILE), c_int, __ssize_t]'
+        ),
+    '_IO_sgetn': (None, ('_IO_FILE',),
+        "_IO_sgetn = _libraries['/usr/lib/libFLAC.so']._IO_sgetn\n"
+        '_IO_sgetn.restype = size_t\n'
+        '_IO_sgetn.argtypes = [POINTER(_IO_FILE), c_void_p, size_t]'
+        ),
+    '_IO_seekoff': (None, ('_IO_FILE',),
+        "_IO_seekoff = _libraries['/usr/lib/libFLAC.so']._IO_seekoff\n"
+        '_IO_seekoff.restype = __off64_t\n'
+        '_IO_seekoff.argtypes = [POINTER(_IO_FILE), __off64_t, c_int, c_int]'
+        ),
+    '_IO_seekpos': (None, ('_IO_FILE',),
+        "_IO_seekpos = _libraries['/usr/lib/libFLAC.so']._IO_seekpos\n"
+        '_IO_seekpos.restype = __off64_t\n'
+        '_IO_seekpos.argtypes = [POINTER(_IO_FILE), __off64_t, c_int]'
+        ),
+    '_IO_free_backup_area': (None, ('_IO_FILE',),
+        "_IO_free_backup_area = _libraries['/usr/lib/libFLAC.so']._IO_free_backup_area\n"
+        '_IO_free_backup_area.restype = None\n'
+        '_IO_free_backup_area.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '__FILE': (None, ('_IO_FILE',),
+        '__FILE = _IO_FILE'
+        ),
+    'va_list': (None, ('__gnuc_va_list',),
+        'va_list = __gnuc_va_list'
+        ),
+    'fpos_t': (None, ('_G_fpos_t',),
+        'fpos_t = _G_fpos_t'
+        ),
+    'fpos64_t': (None, ('_G_fpos64_t',),
+        'fpos64_t = _G_fpos64_t'
+        ),
+    'remove': (None, (),
+        "remove = _libraries['/usr/lib/libFLAC.so'].remove\n"
+        'remove.restype = c_int\n'
+        'remove.argtypes = [STRING]'
+        ),
+    'rename': (None, (),
+        "rename = _libraries['/usr/lib/libFLAC.so'].rename\n"
+        'rename.restype = c_int\n'
+        'rename.argtypes = [STRING, STRING]'
+        ),
+    'renameat': (None, (),
+        "renameat = _libraries['/usr/lib/libFLAC.so'].renameat\n"
+        'renameat.restype = c_int\n'
+        'renameat.argtypes = [c_int, STRING, c_int, STRING]'
+        ),
+    'tmpfile': (None, ('FILE',),
+        "tmpfile = _libraries['/usr/lib/libFLAC.so'].tmpfile\n"
+        'tmpfile.restype = POINTER(FILE)\n'
+        'tmpfile.argtypes = []'
+        ),
+    'tmpfile64': (None, ('FILE',),
+        "tmpfile64 = _libraries['/usr/lib/libFLAC.so'].tmpfile64\n"
+        'tmpfile64.restype = POINTER(FILE)\n'
+        'tmpfile64.argtypes = []'
+        ),
+    'tmpnam': (None, (),
+        "tmpnam = _libraries['/usr/lib/libFLAC.so'].tmpnam\n"
+        'tmpnam.restype = STRING\n'
+        'tmpnam.argtypes = [STRING]'
+        ),
+    'tmpnam_r': (None, (),
+        "tmpnam_r = _libraries['/usr/lib/libFLAC.so'].tmpnam_r\n"
+        'tmpnam_r.restype = STRING\n'
+        'tmpnam_r.argtypes = [STRING]'
+        ),
+    'tempnam': (None, (),
+        "tempnam = _libraries['/usr/lib/libFLAC.so'].tempnam\n"
+        'tempnam.restype = STRING\n'
+        'tempnam.argtypes = [STRING, STRING]'
+        ),
+    'fclose': (None, ('FILE',),
+        "fclose = _libraries['/usr/lib/libFLAC.so'].fclose\n"
+        'fclose.restype = c_int\n'
+        'fclose.argtypes = [POINTER(FILE)]'
+        ),
+    'fflush': (None, ('FILE',),
+        "fflush = _libraries['/usr/lib/libFLAC.so'].fflush\n"
+        'fflush.restype = c_int\n'
+        'fflush.argtypes = [POINTER(FILE)]'
+        ),
+    'fflush_unlocked': (None, ('FILE',),
+        "fflush_unlocked = _libraries['/usr/lib/libFLAC.so'].fflush_unlocked\n"
+        'fflush_unlocked.restype = c_int\n'
+        'fflush_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'fcloseall': (None, (),
+        "fcloseall = _libraries['/usr/lib/libFLAC.so'].fcloseall\n"
+        'fcloseall.restype = c_int\n'
+        'fcloseall.argtypes = []'
+        ),
+    'fopen': (None, ('FILE',),
+        "fopen = _libraries['/usr/lib/libFLAC.so'].fopen\n"
+        'fopen.restype = POINTER(FILE)\n'
+        'fopen.argtypes = [STRING, STRING]'
+        ),
+    'freopen': (None, ('FILE',),
+        "freopen = _libraries['/usr/lib/libFLAC.so'].freopen\n"
+        'freopen.restype = POINTER(FILE)\n'
+        'freopen.argtypes = [STRING, STRING, POINTER(FILE)]'
+        ),
+    'fopen64': (None, ('FILE',),
+        "fopen64 = _libraries['/usr/lib/libFLAC.so'].fopen64\n"
+        'fopen64.restype = POINTER(FILE)\n'
+        'fopen64.argtypes = [STRING, STRING]'
+        ),
+    'freopen64': (None, ('FILE',),
+        "freopen64 = _libraries['/usr/lib/libFLAC.so'].freopen64\n"
+        'freopen64.restype = POINTER(FILE)\n'
+        'freopen64.argtypes = [STRING, STRING, POINTER(FILE)]'
+        ),
+    'fdopen': (None, ('FILE',),
+        "fdopen = _libraries['/usr/lib/libFLAC.so'].fdopen\n"
+        'fdopen.restype = POINTER(FILE)\n'
+        'fdopen.argtypes = [c_int, STRING]'
+        ),
+    'fopencookie': (None, ('FILE', '_IO_cookie_io_functions_t'),
+        "fopencookie = _libraries['/usr/lib/libFLAC.so'].fopencookie\n"
+        'fopencookie.restype = POINTER(FILE)\n'
+        'fopencookie.argtypes = [c_void_p, STRING, _IO_cookie_io_functions_t]'
+        ),
+    'fmemopen': (None, ('FILE',),
+        "fmemopen = _libraries['/usr/lib/libFLAC.so'].fmemopen\n"
+        'fmemopen.restype = POINTER(FILE)\n'
+        'fmemopen.argtypes = [c_void_p, size_t, STRING]'
+        ),
+    'open_memstream': (None, ('FILE',),
+        "open_memstream = _libraries['/usr/lib/libFLAC.so'].open_memstream\n"
+        'open_memstream.restype = POINTER(FILE)\n'
+        'open_memstream.argtypes = [POINTER(STRING), POINTER(size_t)]'
+        ),
+    'setbuf': (None, ('FILE',),
+        "setbuf = _libraries['/usr/lib/libFLAC.so'].setbuf\n"
+        'setbuf.restype = None\n'
+        'setbuf.argtypes = [POINTER(FILE), STRING]'
+        ),
+    'setvbuf': (None, ('FILE',),
+        "setvbuf = _libraries['/usr/lib/libFLAC.so'].setvbuf\n"
+        'setvbuf.restype = c_int\n'
+        'setvbuf.argtypes = [POINTER(FILE), STRING, c_int, size_t]'
+        ),
+    'setbuffer': (None, ('FILE',),
+        "setbuffer = _libraries['/usr/lib/libFLAC.so'].setbuffer\n"
+        'setbuffer.restype = None\n'
+        'setbuffer.argtypes = [POINTER(FILE), STRING, size_t]'
+        ),
+    'setlinebuf': (None, ('FILE',),
+        "setlinebuf = _libraries['/usr/lib/libFLAC.so'].setlinebuf\n"
+        'setlinebuf.restype = None\n'
+        'setlinebuf.argtypes = [POINTER(FILE)]'
+        ),
+    'fscanf': (None, ('FILE',),
+        "fscanf = _libraries['/usr/lib/libFLAC.so'].fscanf\n"
+        'fscanf.restype = c_int\n'
+        'fscanf.argtypes = [POINTER(FILE), STRING]'
+        ),
+    'scanf': (None, (),
+        "scanf = _libraries['/usr/lib/libFLAC.so'].scanf\n"
+        'scanf.restype = c_int\n'
+        'scanf.argtypes = [STRING]'
+        ),
+    'sscanf': (None, (),
+        "sscanf = _libraries['/usr/lib/libFLAC.so'].sscanf\n"
+        'sscanf.restype = c_int\n'
+        'sscanf.argtypes = [STRING, STRING]'
+        ),
+    'vfscanf': (None, ('FILE', '__va_list_tag'),
+        "vfscanf = _libraries['/usr/lib/libFLAC.so'].vfscanf\n"
+        'vfscanf.restype = c_int\n'
+        'vfscanf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]'
+        ),
+    'vscanf': (None, ('__va_list_tag',),
+        "vscanf = _libraries['/usr/lib/libFLAC.so'].vscanf\n"
+        'vscanf.restype = c_int\n'
+        'vscanf.argtypes = [STRING, POINTER(__va_list_tag)]'
+        ),
+    'vsscanf': (None, ('__va_list_tag',),
+        "vsscanf = _libraries['/usr/lib/libFLAC.so'].vsscanf\n"
+        'vsscanf.restype = c_int\n'
+        'vsscanf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]'
+        ),
+    'fgetc': (None, ('FILE',),
+        "fgetc = _libraries['/usr/lib/libFLAC.so'].fgetc\n"
+        'fgetc.restype = c_int\n'
+        'fgetc.argtypes = [POINTER(FILE)]'
+        ),
+    'fputc': (None, ('FILE',),
+        "fputc = _libraries['/usr/lib/libFLAC.so'].fputc\n"
+        'fputc.restype = c_int\n'
+        'fputc.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'getw': (None, ('FILE',),
+        "getw = _libraries['/usr/lib/libFLAC.so'].getw\n"
+        'getw.restype = c_int\n'
+        'getw.argtypes = [POINTER(FILE)]'
+        ),
+    'putw': (None, ('FILE',),
+        "putw = _libraries['/usr/lib/libFLAC.so'].putw\n"
+        'putw.restype = c_int\n'
+        'putw.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'gets': (None, (),
+        "gets = _libraries['/usr/lib/libFLAC.so'].gets\n"
+        'gets.restype = STRING\n'
+        'gets.argtypes = [STRING]'
+        ),
+    '__getdelim': (None, ('FILE',),
+        "__getdelim = _libraries['/usr/lib/libFLAC.so'].__getdelim\n"
+        '__getdelim.restype = __ssize_t\n'
+        '__getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]'
+        ),
+    'getdelim': (None, ('FILE',),
+        "getdelim = _libraries['/usr/lib/libFLAC.so'].getdelim\n"
+        'getdelim.restype = __ssize_t\n'
+        'getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]'
+        ),
+    'fputs': (None, ('FILE',),
+        "fputs = _libraries['/usr/lib/libFLAC.so'].fputs\n"
+        'fputs.restype = c_int\n'
+        'fputs.argtypes = [STRING, POINTER(FILE)]'
+        ),
+    'puts': (None, (),
+        "puts = _libraries['/usr/lib/libFLAC.so'].puts\n"
+        'puts.restype = c_int\n'
+        'puts.argtypes = [STRING]'
+        ),
+    'ungetc': (None, ('FILE',),
+        "ungetc = _libraries['/usr/lib/libFLAC.so'].ungetc\n"
+        'ungetc.restype = c_int\n'
+        'ungetc.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'fwrite': (None, ('FILE',),
+        "fwrite = _libraries['/usr/lib/libFLAC.so'].fwrite\n"
+        'fwrite.restype = size_t\n'
+        'fwrite.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fputs_unlocked': (None, ('FILE',),
+        "fputs_unlocked = _libraries['/usr/lib/libFLAC.so'].fputs_unlocked\n"
+        'fputs_unlocked.restype = c_int\n'
+        'fputs_unlocked.argtypes = [STRING, POINTER(FILE)]'
+        ),
+    'fwrite_unlocked': (None, ('FILE',),
+        "fwrite_unlocked = _libraries['/usr/lib/libFLAC.so'].fwrite_unlocked\n"
+        'fwrite_unlocked.restype = size_t\n'
+        'fwrite_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fseek': (None, ('FILE',),
+        "fseek = _libraries['/usr/lib/libFLAC.so'].fseek\n"
+        'fseek.restype = c_int\n'
+        'fseek.argtypes = [POINTER(FILE), c_long, c_int]'
+        ),
+    'ftell': (None, ('FILE',),
+        "ftell = _libraries['/usr/lib/libFLAC.so'].ftell\n"
+        'ftell.restype = c_long\n'
+        'ftell.argtypes = [POINTER(FILE)]'
+        ),
+    'rewind': (None, ('FILE',),
+        "rewind = _libraries['/usr/lib/libFLAC.so'].rewind\n"
+        'rewind.restype = None\n'
+        'rewind.argtypes = [POINTER(FILE)]'
+        ),
+    'fseeko': (None, ('FILE',),
+        "fseeko = _libraries['/usr/lib/libFLAC.so'].fseeko\n"
+        'fseeko.restype = c_int\n'
+        'fseeko.argtypes = [POINTER(FILE), __off_t, c_int]'
+        ),
+    'ftello': (None, ('FILE',),
+        "ftello = _libraries['/usr/lib/libFLAC.so'].ftello\n"
+        'ftello.restype = __off_t\n'
+        'ftello.argtypes = [POINTER(FILE)]'
+        ),
+    'fgetpos': (None, ('FILE', 'fpos_t'),
+        "fgetpos = _libraries['/usr/lib/libFLAC.so'].fgetpos\n"
+        'fgetpos.restype = c_int\n'
+        'fgetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]'
+        ),
+    'fsetpos': (None, ('FILE', 'fpos_t'),
+        "fsetpos = _libraries['/usr/lib/libFLAC.so'].fsetpos\n"
+        'fsetpos.restype = c_int\n'
+        'fsetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]'
+        ),
+    'fseeko64': (None, ('FILE',),
+        "fseeko64 = _libraries['/usr/lib/libFLAC.so'].fseeko64\n"
+        'fseeko64.restype = c_int\n'
+        'fseeko64.argtypes = [POINTER(FILE), __off64_t, c_int]'
+        ),
+    'ftello64': (None, ('FILE',),
+        "ftello64 = _libraries['/usr/lib/libFLAC.so'].ftello64\n"
+        'ftello64.restype = __off64_t\n'
+        'ftello64.argtypes = [POINTER(FILE)]'
+        ),
+    'fgetpos64': (None, ('FILE', 'fpos64_t'),
+        "fgetpos64 = _libraries['/usr/lib/libFLAC.so'].fgetpos64\n"
+        'fgetpos64.restype = c_int\n'
+        'fgetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]'
+        ),
+    'fsetpos64': (None, ('FILE', 'fpos64_t'),
+        "fsetpos64 = _libraries['/usr/lib/libFLAC.so'].fsetpos64\n"
+        'fsetpos64.restype = c_int\n'
+        'fsetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]'
+        ),
+    'clearerr': (None, ('FILE',),
+        "clearerr = _libraries['/usr/lib/libFLAC.so'].clearerr\n"
+        'clearerr.restype = None\n'
+        'clearerr.argtypes = [POINTER(FILE)]'
+        ),
+    'feof': (None, ('FILE',),
+        "feof = _libraries['/usr/lib/libFLAC.so'].feof\n"
+        'feof.restype = c_int\n'
+        'feof.argtypes = [POINTER(FILE)]'
+        ),
+    'ferror': (None, ('FILE',),
+        "ferror = _libraries['/usr/lib/libFLAC.so'].ferror\n"
+        'ferror.restype = c_int\n'
+        'ferror.argtypes = [POINTER(FILE)]'
+        ),
+    'clearerr_unlocked': (None, ('FILE',),
+        "clearerr_unlocked = _libraries['/usr/lib/libFLAC.so'].clearerr_unlocked\n"
+        'clearerr_unlocked.restype = None\n'
+        'clearerr_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'perror': (None, (),
+        "perror = _libraries['/usr/lib/libFLAC.so'].perror\n"
+        'perror.restype = None\n'
+        'perror.argtypes = [STRING]'
+        ),
+    'fileno': (None, ('FILE',),
+        "fileno = _libraries['/usr/lib/libFLAC.so'].fileno\n"
+        'fileno.restype = c_int\n'
+        'fileno.argtypes = [POINTER(FILE)]'
+        ),
+    'fileno_unlocked': (None, ('FILE',),
+        "fileno_unlocked = _libraries['/usr/lib/libFLAC.so'].fileno_unlocked\n"
+        'fileno_unlocked.restype = c_int\n'
+        'fileno_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'popen': (None, ('FILE',),
+        "popen = _libraries['/usr/lib/libFLAC.so'].popen\n"
+        'popen.restype = POINTER(FILE)\n'
+        'popen.argtypes = [STRING, STRING]'
+        ),
+    'pclose': (None, ('FILE',),
+        "pclose = _libraries['/usr/lib/libFLAC.so'].pclose\n"
+        'pclose.restype = c_int\n'
+        'pclose.argtypes = [POINTER(FILE)]'
+        ),
+    'ctermid': (None, (),
+        "ctermid = _libraries['/usr/lib/libFLAC.so'].ctermid\n"
+        'ctermid.restype = STRING\n'
+        'ctermid.argtypes = [STRING]'
+        ),
+    'cuserid': (None, (),
+        "cuserid = _libraries['/usr/lib/libFLAC.so'].cuserid\n"
+        'cuserid.restype = STRING\n'
+        'cuserid.argtypes = [STRING]'
+        ),
+    'flockfile': (None, ('FILE',),
+        "flockfile = _libraries['/usr/lib/libFLAC.so'].flockfile\n"
+        'flockfile.restype = None\n'
+        'flockfile.argtypes = [POINTER(FILE)]'
+        ),
+    'ftrylockfile': (None, ('FILE',),
+        "ftrylockfile = _libraries['/usr/lib/libFLAC.so'].ftrylockfile\n"
+        'ftrylockfile.restype = c_int\n'
+        'ftrylockfile.argtypes = [POINTER(FILE)]'
+        ),
+    'funlockfile': (None, ('FILE',),
+        "funlockfile = _libraries['/usr/lib/libFLAC.so'].funlockfile\n"
+        'funlockfile.restype = None\n'
+        'funlockfile.argtypes = [POINTER(FILE)]'
+        ),
+    'div_t': ('Structure', (),
+        'div_t._fields_ = [\n'
+        "    ('quot', c_int),\n"
+        "    ('rem', c_int),\n"
+        ']'
+        ),
+    'ldiv_t': ('Structure', (),
+        'ldiv_t._fields_ = [\n'
+        "    ('quot', c_long),\n"
+        "    ('rem', c_long),\n"
+        ']'
+        ),
+    'lldiv_t': ('Structure', (),
+        'lldiv_t._fields_ = [\n'
+        "    ('quot', c_longlong),\n"
+        "    ('rem', c_longlong),\n"
+        ']'
+        ),
+    '__ctype_get_mb_cur_max': (None, (),
+        "__ctype_get_mb_cur_max = _libraries['/usr/lib/libFLAC.so'].__ctype_get_mb_cur_max\n"
+        '__ctype_get_mb_cur_max.restype = size_t\n'
+        '__ctype_get_mb_cur_max.argtypes = []'
+        ),
+    'strtod': (None, (),
+        "strtod = _libraries['/usr/lib/libFLAC.so'].strtod\n"
+        'strtod.restype = c_double\n'
+        'strtod.argtypes = [STRING, POINTER(STRING)]'
+        ),
+    'strtof': (None, (),
+        "strtof = _libraries['/usr/lib/libFLAC.so'].strtof\n"
+        'strtof.restype = c_float\n'
+        'strtof.argtypes = [STRING, POINTER(STRING)]'
+        ),
+    'strtold': (None, (),
+        "strtold = _libraries['/usr/lib/libFLAC.so'].strtold\n"
+        'strtold.restype = c_longdouble\n'
+        'strtold.argtypes = [STRING, POINTER(STRING)]'
+        ),
+    'strtol': (None, (),
+        "strtol = _libraries['/usr/lib/libFLAC.so'].strtol\n"
+        'strtol.restype = c_long\n'
+        'strtol.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoul': (None, (),
+        "strtoul = _libraries['/usr/lib/libFLAC.so'].strtoul\n"
+        'strtoul.restype = c_ulong\n'
+        'strtoul.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoq': (None, (),
+        "strtoq = _libraries['/usr/lib/libFLAC.so'].strtoq\n"
+        'strtoq.restype = c_longlong\n'
+        'strtoq.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtouq': (None, (),
+        "strtouq = _libraries['/usr/lib/libFLAC.so'].strtouq\n"
+        'strtouq.restype = c_ulonglong\n'
+        'strtouq.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoll': (None, (),
+        "strtoll = _libraries['/usr/lib/libFLAC.so'].strtoll\n"
+        'strtoll.restype = c_longlong\n'
+        'strtoll.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoull': (None, (),
+        "strtoull = _libraries['/usr/lib/libFLAC.so'].strtoull\n"
+        'strtoull.restype = c_ulonglong\n'
+        'strtoull.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    '__locale_struct': ('Structure', ('__locale_data',),
+        '__locale_struct._fields_ = [\n'
+        "    ('__locales', POINTER(__locale_data) * 13),\n"
+        "    ('__ctype_b', POINTER(c_ushort)),\n"
+        "    ('__ctype_tolower', POINTER(c_int)),\n"
+        "    ('__ctype_toupper', POINTER(c_int)),\n"
+        "    ('__names', STRING * 13),\n"
+        ']'
+        ),
+    '__locale_t': (None, ('__locale_struct',),
+        '__locale_t = POINTER(__locale_struct)'
+        ),
+    'strtol_l': (None, ('__locale_t',),
+        "strtol_l = _libraries['/usr/lib/libFLAC.so'].strtol_l\n"
+        'strtol_l.restype = c_long\n'
+        'strtol_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtoul_l': (None, ('__locale_t',),
+        "strtoul_l = _libraries['/usr/lib/libFLAC.so'].strtoul_l\n"
+        'strtoul_l.restype = c_ulong\n'
+        'strtoul_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtoll_l': (None, ('__locale_t',),
+        "strtoll_l = _libraries['/usr/lib/libFLAC.so'].strtoll_l\n"
+        'strtoll_l.restype = c_longlong\n'
+        'strtoll_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtoull_l': (None, ('__locale_t',),
+        "strtoull_l = _libraries['/usr/lib/libFLAC.so'].strtoull_l\n"
+        'strtoull_l.restype = c_ulonglong\n'
+        'strtoull_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtod_l': (None, ('__locale_t',),
+        "strtod_l = _libraries['/usr/lib/libFLAC.so'].strtod_l\n"
+        'strtod_l.restype = c_double\n'
+        'strtod_l.argtypes = [STRING, POINTER(STRING), __locale_t]'
+        ),
+    'strtof_l': (None, ('__locale_t',),
+        "strtof_l = _libraries['/usr/lib/libFLAC.so'].strtof_l\n"
+        'strtof_l.restype = c_float\n'
+        'strtof_l.argtypes = [STRING, POINTER(STRING), __locale_t]'
+        ),
+    'strtold_l': (None, ('__locale_t',),
+        "strtold_l = _libraries['/usr/lib/libFLAC.so'].strtold_l\n"
+        'strtold_l.restype = c_longdouble\n'
+        'strtold_l.argtypes = [STRING, POINTER(STRING), __locale_t]'
+        ),
+    'atoi': (None, (),
+        "atoi = _libraries['/usr/lib/libFLAC.so'].atoi\n"
+        'atoi.restype = c_int\n'
+        'atoi.argtypes = [STRING]'
+        ),
+    'atol': (None, (),
+        "atol = _libraries['/usr/lib/libFLAC.so'].atol\n"
+        'atol.restype = c_long\n'
+        'atol.argtypes = [STRING]'
+        ),
+    'atoll': (None, (),
+        "atoll = _libraries['/usr/lib/libFLAC.so'].atoll\n"
+        'atoll.restype = c_longlong\n'
+        'atoll.argtypes = [STRING]'
+        ),
+    'l64a': (None, (),
+        "l64a = _libraries['/usr/lib/libFLAC.so'].l64a\n"
+        'l64a.restype = STRING\n'
+        'l64a.argtypes = [c_long]'
+        ),
+    'a64l': (None, (),
+        "a64l = _libraries['/usr/lib/libFLAC.so'].a64l\n"
+        'a64l.restype = c_long\n'
+        'a64l.argtypes = [STRING]'
+        ),
+    'random': (None, (),
+        "random = _libraries['/usr/lib/libFLAC.so'].random\n"
+        'random.restype = c_long\n'
+        'random.argtypes = []'
+        ),
+    'srandom': (None, (),
+        "srandom = _libraries['/usr/lib/libFLAC.so'].srandom\n"
+        'srandom.restype = None\n'
+        'srandom.argtypes = [c_uint]'
+        ),
+    'initstate': (None, (),
+        "initstate = _libraries['/usr/lib/libFLAC.so'].initstate\n"
+        'initstate.restype = STRING\n'
+        'initstate.argtypes = [c_uint, STRING, size_t]'
+        ),
+    'setstate': (None, (),
+        "setstate = _libraries['/usr/lib/libFLAC.so'].setstate\n"
+        'setstate.restype = STRING\n'
+        'setstate.argtypes = [STRING]'
+        ),
+    'random_data': ('Structure', (),
+        'random_data._fields_ = [\n'
+        "    ('fptr', POINTER(int32_t)),\n"
+        "    ('rptr', POINTER(int32_t)),\n"
+        "    ('state', POINTER(int32_t)),\n"
+        "    ('rand_type', c_int),\n"
+        "    ('rand_deg', c_int),\n"
+        "    ('rand_sep', c_int),\n"
+        "    ('end_ptr', POINTER(int32_t)),\n"
+        ']'
+        ),
+    'random_r': (None, ('random_data',),
+        "random_r = _libraries['/usr/lib/libFLAC.so'].random_r\n"
+        'random_r.restype = c_int\n'
+        'random_r.argtypes = [POINTER(random_data), POINTER(int32_t)]'
+        ),
+    'srandom_r': (None, ('random_data',),
+        "srandom_r = _libraries['/usr/lib/libFLAC.so'].srandom_r\n"
+        'srandom_r.restype = c_int\n'
+        'srandom_r.argtypes = [c_uint, POINTER(random_data)]'
+        ),
+    'initstate_r': (None, ('random_data',),
+        "initstate_r = _libraries['/usr/lib/libFLAC.so'].initstate_r\n"
+        'initstate_r.restype = c_int\n'
+        'initstate_r.argtypes = [c_uint, STRING, size_t, POINTER(random_data)]'
+        ),
+    'setstate_r': (None, ('random_data',),
+        "setstate_r = _libraries['/usr/lib/libFLAC.so'].setstate_r\n"
+        'setstate_r.restype = c_int\n'
+        'setstate_r.argtypes = [STRING, POINTER(random_data)]'
+        ),
+    'rand': (None, (),
+        "rand = _libraries['/usr/lib/libFLAC.so'].rand\n"
+        'rand.restype = c_int\n'
+        'rand.argtypes = []'
+        ),
+    'srand': (None, (),
+        "srand = _libraries['/usr/lib/libFLAC.so'].srand\n"
+        'srand.restype = None\n'
+        'srand.argtypes = [c_uint]'
+        ),
+    'rand_r': (None, (),
+        "rand_r = _libraries['/usr/lib/libFLAC.so'].rand_r\n"
+        'rand_r.restype = c_int\n'
+        'rand_r.argtypes = [POINTER(c_uint)]'
+        ),
+    'drand48': (None, (),
+        "drand48 = _libraries['/usr/lib/libFLAC.so'].drand48\n"
+        'drand48.restype = c_double\n'
+        'drand48.argtypes = []'
+        ),
+    'erand48': (None, (),
+        "erand48 = _libraries['/usr/lib/libFLAC.so'].erand48\n"
+        'erand48.restype = c_double\n'
+        'erand48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'lrand48': (None, (),
+        "lrand48 = _libraries['/usr/lib/libFLAC.so'].lrand48\n"
+        'lrand48.restype = c_long\n'
+        'lrand48.argtypes = []'
+        ),
+    'nrand48': (None, (),
+        "nrand48 = _libraries['/usr/lib/libFLAC.so'].nrand48\n"
+        'nrand48.restype = c_long\n'
+        'nrand48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'mrand48': (None, (),
+        "mrand48 = _libraries['/usr/lib/libFLAC.so'].mrand48\n"
+        'mrand48.restype = c_long\n'
+        'mrand48.argtypes = []'
+        ),
+    'jrand48': (None, (),
+        "jrand48 = _libraries['/usr/lib/libFLAC.so'].jrand48\n"
+        'jrand48.restype = c_long\n'
+        'jrand48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'srand48': (None, (),
+        "srand48 = _libraries['/usr/lib/libFLAC.so'].srand48\n"
+        'srand48.restype = None\n'
+        'srand48.argtypes = [c_long]'
+        ),
+    'seed48': (None, (),
+        "seed48 = _libraries['/usr/lib/libFLAC.so'].seed48\n"
+        'seed48.restype = POINTER(c_ushort)\n'
+        'seed48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'lcong48': (None, (),
+        "lcong48 = _libraries['/usr/lib/libFLAC.so'].lcong48\n"
+        'lcong48.restype = None\n'
+        'lcong48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'drand48_data': ('Structure', (),
+        'drand48_data._fields_ = [\n'
+        "    ('__x', c_ushort * 3),\n"
+        "    ('__old_x', c_ushort * 3),\n"
+        "    ('__c', c_ushort),\n"
+        "    ('__init', c_ushort),\n"
+        "    ('__a', c_ulonglong),\n"
+        ']'
+        ),
+    'drand48_r': (None, ('drand48_data',),
+        "drand48_r = _libraries['/usr/lib/libFLAC.so'].drand48_r\n"
+        'drand48_r.restype = c_int\n'
+        'drand48_r.argtypes = [POINTER(drand48_data), POINTER(c_double)]'
+        ),
+    'erand48_r': (None, ('drand48_data',),
+        "erand48_r = _libraries['/usr/lib/libFLAC.so'].erand48_r\n"
+        'erand48_r.restype = c_int\n'
+        'erand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_double)]'
+        ),
+    'lrand48_r': (None, ('drand48_data',),
+        "lrand48_r = _libraries['/usr/lib/libFLAC.so'].lrand48_r\n"
+        'lrand48_r.restype = c_int\n'
+        'lrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'nrand48_r': (None, ('drand48_data',),
+        "nrand48_r = _libraries['/usr/lib/libFLAC.so'].nrand48_r\n"
+        'nrand48_r.restype = c_int\n'
+        'nrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'mrand48_r': (None, ('drand48_data',),
+        "mrand48_r = _libraries['/usr/lib/libFLAC.so'].mrand48_r\n"
+        'mrand48_r.restype = c_int\n'
+        'mrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'jrand48_r': (None, ('drand48_data',),
+        "jrand48_r = _libraries['/usr/lib/libFLAC.so'].jrand48_r\n"
+        'jrand48_r.restype = c_int\n'
+        'jrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'srand48_r': (None, ('drand48_data',),
+        "srand48_r = _libraries['/usr/lib/libFLAC.so'].srand48_r\n"
+        'srand48_r.restype = c_int\n'
+        'srand48_r.argtypes = [c_long, POINTER(drand48_data)]'
+        ),
+    'seed48_r': (None, ('drand48_data',),
+        "seed48_r = _libraries['/usr/lib/libFLAC.so'].seed48_r\n"
+        'seed48_r.restype = c_int\n'
+        'seed48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]'
+        ),
+    'lcong48_r': (None, ('drand48_data',),
+        "lcong48_r = _libraries['/usr/lib/libFLAC.so'].lcong48_r\n"
+        'lcong48_r.restype = c_int\n'
+        'lcong48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]'
+        ),
+    'malloc': (None, (),
+        "malloc = _libraries['/usr/lib/libFLAC.so'].malloc\n"
+        'malloc.restype = c_void_p\n'
+        'malloc.argtypes = [size_t]'
+        ),
+    'calloc': (None, (),
+        "calloc = _libraries['/usr/lib/libFLAC.so'].calloc\n"
+        'calloc.restype = c_void_p\n'
+        'calloc.argtypes = [size_t, size_t]'
+        ),
+    'realloc': (None, (),
+        "realloc = _libraries['/usr/lib/libFLAC.so'].realloc\n"
+        'realloc.restype = c_void_p\n'
+        'realloc.argtypes = [c_void_p, size_t]'
+        ),
+    'free': (None, (),
+        "free = _libraries['/usr/lib/libFLAC.so'].free\n"
+        'free.restype = None\n'
+        'free.argtypes = [c_void_p]'
+        ),
+    'cfree': (None, (),
+        "cfree = _libraries['/usr/lib/libFLAC.so'].cfree\n"
+        'cfree.restype = None\n'
+        'cfree.argtypes = [c_void_p]'
+        ),
+    'valloc': (None, (),
+        "valloc = _libraries['/usr/lib/libFLAC.so'].valloc\n"
+        'valloc.restype = c_void_p\n'
+        'valloc.argtypes = [size_t]'
+        ),
+    'posix_memalign': (None, (),
+        "posix_memalign = _libraries['/usr/lib/libFLAC.so'].posix_memalign\n"
+        'posix_memalign.restype = c_int\n'
+        'posix_memalign.argtypes = [POINTER(c_void_p), size_t, size_t]'
+        ),
+    'aligned_alloc': (None, (),
+        "aligned_alloc = _libraries['/usr/lib/libFLAC.so'].aligned_alloc\n"
+        'aligned_alloc.restype = c_void_p\n'
+        'aligned_alloc.argtypes = [size_t, size_t]'
+        ),
+    'abort': (None, (),
+        "abort = _libraries['/usr/lib/libFLAC.so'].abort\n"
+        'abort.restype = None\n'
+        'abort.argtypes = []'
+        ),
+    'on_exit': (None, (),
+        "on_exit = _libraries['/usr/lib/libFLAC.so'].on_exit\n"
+        'on_exit.restype = c_int\n'
+        'on_exit.argtypes = [CFUNCTYPE(None, c_int, c_void_p), c_void_p]'
+        ),
+    'exit': (None, (),
+        "exit = _libraries['/usr/lib/libFLAC.so'].exit\n"
+        'exit.restype = None\n'
+        'exit.argtypes = [c_int]'
+        ),
+    'quick_exit': (None, (),
+        "quick_exit = _libraries['/usr/lib/libFLAC.so'].quick_exit\n"
+        'quick_exit.restype = None\n'
+        'quick_exit.argtypes = [c_int]'
+        ),
+    '_Exit': (None, (),
+        "_Exit = _libraries['/usr/lib/libFLAC.so']._Exit\n"
+        '_Exit.restype = None\n'
+        '_Exit.argtypes = [c_int]'
+        ),
+    'getenv': (None, (),
+        "getenv = _libraries['/usr/lib/libFLAC.so'].getenv\n"
+        'getenv.restype = STRING\n'
+        'getenv.argtypes = [STRING]'
+        ),
+    'secure_getenv': (None, (),
+        "secure_getenv = _libraries['/usr/lib/libFLAC.so'].secure_getenv\n"
+        'secure_getenv.restype = STRING\n'
+        'secure_getenv.argtypes = [STRING]'
+        ),
+    'putenv': (None, (),
+        "putenv = _libraries['/usr/lib/libFLAC.so'].putenv\n"
+        'putenv.restype = c_int\n'
+        'putenv.argtypes = [STRING]'
+        ),
+    'setenv': (None, (),
+        "setenv = _libraries['/usr/lib/libFLAC.so'].setenv\n"
+        'setenv.restype = c_int\n'
+        'setenv.argtypes = [STRING, STRING, c_int]'
+        ),
+    'unsetenv': (None, (),
+        "unsetenv = _libraries['/usr/lib/libFLAC.so'].unsetenv\n"
+        'unsetenv.restype = c_int\n'
+        'unsetenv.argtypes = [STRING]'
+        ),
+    'clearenv': (None, (),
+        "clearenv = _libraries['/usr/lib/libFLAC.so'].clearenv\n"
+        'clearenv.restype = c_int\n'
+        'clearenv.argtypes = []'
+        ),
+    'mktemp': (None, (),
+        "mktemp = _libraries['/usr/lib/libFLAC.so'].mktemp\n"
+        'mktemp.restype = STRING\n'
+        'mktemp.argtypes = [STRING]'
+        ),
+    'mkstemp': (None, (),
+        "mkstemp = _libraries['/usr/lib/libFLAC.so'].mkstemp\n"
+        'mkstemp.restype = c_int\n'
+        'mkstemp.argtypes = [STRING]'
+        ),
+    'mkstemp64': (None, (),
+        "mkstemp64 = _libraries['/usr/lib/libFLAC.so'].mkstemp64\n"
+        'mkstemp64.restype = c_int\n'
+        'mkstemp64.argtypes = [STRING]'
+        ),
+    'mkstemps': (None, (),
+        "mkstemps = _libraries['/usr/lib/libFLAC.so'].mkstemps\n"
+        'mkstemps.restype = c_int\n'
+        'mkstemps.argtypes = [STRING, c_int]'
+        ),
+    'mkstemps64': (None, (),
+        "mkstemps64 = _libraries['/usr/lib/libFLAC.so'].mkstemps64\n"
+        'mkstemps64.restype = c_int\n'
+        'mkstemps64.argtypes = [STRING, c_int]'
+        ),
+    'mkdtemp': (None, (),
+        "mkdtemp = _libraries['/usr/lib/libFLAC.so'].mkdtemp\n"
+        'mkdtemp.restype = STRING\n'
+        'mkdtemp.argtypes = [STRING]'
+        ),
+    'mkostemp': (None, (),
+        "mkostemp = _libraries['/usr/lib/libFLAC.so'].mkostemp\n"
+        'mkostemp.restype = c_int\n'
+        'mkostemp.argtypes = [STRING, c_int]'
+        ),
+    'mkostemp64': (None, (),
+        "mkostemp64 = _libraries['/usr/lib/libFLAC.so'].mkostemp64\n"
+        'mkostemp64.restype = c_int\n'
+        'mkostemp64.argtypes = [STRING, c_int]'
+        ),
+    'mkostemps': (None, (),
+        "mkostemps = _libraries['/usr/lib/libFLAC.so'].mkostemps\n"
+        'mkostemps.restype = c_int\n'
+        'mkostemps.argtypes = [STRING, c_int, c_int]'
+        ),
+    'mkostemps64': (None, (),
+        "mkostemps64 = _libraries['/usr/lib/libFLAC.so'].mkostemps64\n"
+        'mkostemps64.restype = c_int\n'
+        'mkostemps64.argtypes = [STRING, c_int, c_int]'
+        ),
+    'system': (None, (),
+        "system = _libraries['/usr/lib/libFLAC.so'].system\n"
+        'system.restype = c_int\n'
+        'system.argtypes = [STRING]'
+        ),
+    'canonicalize_file_name': (None, (),
+        "canonicalize_file_name = _libraries['/usr/lib/libFLAC.so'].canonicalize_file_name\n"
+        'canonicalize_file_name.restype = STRING\n'
+        'canonicalize_file_name.argtypes = [STRING]'
+        ),
+    'qsort': (None, (),
+        "qsort = _libraries['/usr/lib/libFLAC.so'].qsort\n"
+        'qsort.restype = None\n'
+        'qsort.argtypes = [c_void_p, size_t, size_t, __compar_fn_t]'
+        ),
+    'qsort_r': (None, (),
+        "qsort_r = _libraries['/usr/lib/libFLAC.so'].qsort_r\n"
+        'qsort_r.restype = None\n'
+        'qsort_r.argtypes = [c_void_p, size_t, size_t, __compar_d_fn_t, c_void_p]'
+        ),
+    'abs': (None, (),
+        "abs = _libraries['/usr/lib/libFLAC.so'].abs\n"
+        'abs.restype = c_int\n'
+        'abs.argtypes = [c_int]'
+        ),
+    'labs': (None, (),
+        "labs = _libraries['/usr/lib/libFLAC.so'].labs\n"
+        'labs.restype = c_long\n'
+        'labs.argtypes = [c_long]'
+        ),
+    'llabs': (None, (),
+        "llabs = _libraries['/usr/lib/libFLAC.so'].llabs\n"
+        'llabs.restype = c_longlong\n'
+        'llabs.argtypes = [c_longlong]'
+        ),
+    'div': (None, ('div_t',),
+        "div = _libraries['/usr/lib/libFLAC.so'].div\n"
+        'div.restype = div_t\n'
+        'div.argtypes = [c_int, c_int]'
+        ),
+    'ldiv': (None, ('ldiv_t',),
+        "ldiv = _libraries['/usr/lib/libFLAC.so'].ldiv\n"
+        'ldiv.restype = ldiv_t\n'
+        'ldiv.argtypes = [c_long, c_long]'
+        ),
+    'lldiv': (None, ('lldiv_t',),
+        "lldiv = _libraries['/usr/lib/libFLAC.so'].lldiv\n"
+        'lldiv.restype = lldiv_t\n'
+        'lldiv.argtypes = [c_longlong, c_longlong]'
+        ),
+    'ecvt': (None, (),
+        "ecvt = _libraries['/usr/lib/libFLAC.so'].ecvt\n"
+        'ecvt.restype = STRING\n'
+        'ecvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'fcvt': (None, (),
+        "fcvt = _libraries['/usr/lib/libFLAC.so'].fcvt\n"
+        'fcvt.restype = STRING\n'
+        'fcvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'gcvt': (None, (),
+        "gcvt = _libraries['/usr/lib/libFLAC.so'].gcvt\n"
+        'gcvt.restype = STRING\n'
+        'gcvt.argtypes = [c_double, c_int, STRING]'
+        ),
+    'qecvt': (None, (),
+        "qecvt = _libraries['/usr/lib/libFLAC.so'].qecvt\n"
+        'qecvt.restype = STRING\n'
+        'qecvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'qfcvt': (None, (),
+        "qfcvt = _libraries['/usr/lib/libFLAC.so'].qfcvt\n"
+        'qfcvt.restype = STRING\n'
+        'qfcvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'qgcvt': (None, (),
+        "qgcvt = _libraries['/usr/lib/libFLAC.so'].qgcvt\n"
+        'qgcvt.restype = STRING\n'
+        'qgcvt.argtypes = [c_longdouble, c_int, STRING]'
+        ),
+    'ecvt_r': (None, (),
+        "ecvt_r = _libraries['/usr/lib/libFLAC.so'].ecvt_r\n"
+        'ecvt_r.restype = c_int\n'
+        'ecvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'fcvt_r': (None, (),
+        "fcvt_r = _libraries['/usr/lib/libFLAC.so'].fcvt_r\n"
+        'fcvt_r.restype = c_int\n'
+        'fcvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'qecvt_r': (None, (),
+        "qecvt_r = _libraries['/usr/lib/libFLAC.so'].qecvt_r\n"
+        'qecvt_r.restype = c_int\n'
+        'qecvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'qfcvt_r': (None, (),
+        "qfcvt_r = _libraries['/usr/lib/libFLAC.so'].qfcvt_r\n"
+        'qfcvt_r.restype = c_int\n'
+        'qfcvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'mblen': (None, (),
+        "mblen = _libraries['/usr/lib/libFLAC.so'].mblen\n"
+        'mblen.restype = c_int\n'
+        'mblen.argtypes = [STRING, size_t]'
+        ),
+    'mbtowc': (None, (),
+        "mbtowc = _libraries['/usr/lib/libFLAC.so'].mbtowc\n"
+        'mbtowc.restype = c_int\n'
+        'mbtowc.argtypes = [WSTRING, STRING, size_t]'
+        ),
+    'rpmatch': (None, (),
+        "rpmatch = _libraries['/usr/lib/libFLAC.so'].rpmatch\n"
+        'rpmatch.restype = c_int\n'
+        'rpmatch.argtypes = [STRING]'
+        ),
+    'getsubopt': (None, (),
+        "getsubopt = _libraries['/usr/lib/libFLAC.so'].getsubopt\n"
+        'getsubopt.restype = c_int\n'
+        'getsubopt.argtypes = [POINTER(STRING), POINTER(STRING), POINTER(STRING)]'
+        ),
+    'posix_openpt': (None, (),
+        "posix_openpt = _libraries['/usr/lib/libFLAC.so'].posix_openpt\n"
+        'posix_openpt.restype = c_int\n'
+        'posix_openpt.argtypes = [c_int]'
+        ),
+    'grantpt': (None, (),
+        "grantpt = _libraries['/usr/lib/libFLAC.so'].grantpt\n"
+        'grantpt.restype = c_int\n'
+        'grantpt.argtypes = [c_int]'
+        ),
+    'unlockpt': (None, (),
+        "unlockpt = _libraries['/usr/lib/libFLAC.so'].unlockpt\n"
+        'unlockpt.restype = c_int\n'
+        'unlockpt.argtypes = [c_int]'
+        ),
+    'ptsname': (None, (),
+        "ptsname = _libraries['/usr/lib/libFLAC.so'].ptsname\n"
+        'ptsname.restype = STRING\n'
+        'ptsname.argtypes = [c_int]'
+        ),
+    'getpt': (None, (),
+        "getpt = _libraries['/usr/lib/libFLAC.so'].getpt\n"
+        'getpt.restype = c_int\n'
+        'getpt.argtypes = []'
+        ),
+    'getloadavg': (None, (),
+        "getloadavg = _libraries['/usr/lib/libFLAC.so'].getloadavg\n"
+        'getloadavg.restype = c_int\n'
+        'getloadavg.argtypes = [POINTER(c_double), c_int]'
+        ),
+    'sigset_t': (None, ('__sigset_t',),
+        'sigset_t = __sigset_t'
+        ),
+    'fd_set': ('Structure', (),
+        'fd_set._fields_ = [\n'
+        "    ('fds_bits', __fd_mask * 16),\n"
+        ']'
+        ),
+    'select': (None, ('fd_set', 'timeval'),
+        "select = _libraries['/usr/lib/libFLAC.so'].select\n"
+        'select.restype = c_int\n'
+        'select.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timeval)]'
+        ),
+    'timespec': ('Structure', (),
+        'timespec._fields_ = [\n'
+        "    ('tv_sec', __time_t),\n"
+        "    ('tv_nsec', __syscall_slong_t),\n"
+        ']'
+        ),
+    'pselect': (None, ('__sigset_t', 'fd_set', 'timespec'),
+        "pselect = _libraries['/usr/lib/libFLAC.so'].pselect\n"
+        'pselect.restype = c_int\n'
+        'pselect.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timespec), POINTER(__sigset_t)]'
+        ),
+    'gnu_dev_major': (None, (),
+        "gnu_dev_major = _libraries['/usr/lib/libFLAC.so'].gnu_dev_major\n"
+        'gnu_dev_major.restype = c_uint\n'
+        'gnu_dev_major.argtypes = [c_ulonglong]'
+        ),
+    'gnu_dev_minor': (None, (),
+        "gnu_dev_minor = _libraries['/usr/lib/libFLAC.so'].gnu_dev_minor\n"
+        'gnu_dev_minor.restype = c_uint\n'
+        'gnu_dev_minor.argtypes = [c_ulonglong]'
+        ),
+    'gnu_dev_makedev': (None, (),
+        "gnu_dev_makedev = _libraries['/usr/lib/libFLAC.so'].gnu_dev_makedev\n"
+        'gnu_dev_makedev.restype = c_ulonglong\n'
+        'gnu_dev_makedev.argtypes = [c_uint, c_uint]'
+        ),
+    'fsid_t': (None, ('__fsid_t',),
+        'fsid_t = __fsid_t'
+        ),
+    '__locale_data': ('Structure', (),
+        '__locale_data._fields_ = [\n'
+        ']'
+        ),
+    'locale_t': (None, ('__locale_t',),
+        'locale_t = __locale_t'
+        ),
+}
+
+_bind_lazily(__name__, _definitions)
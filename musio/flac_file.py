@@ -19,15 +19,20 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 
-""" A module for reading FLAC files.
+""" A module for reading and writing FLAC files.
 
 """
 
-from itertools import compress, cycle
-from array import array
+from bisect import bisect_right
+from collections import deque
+from struct import pack as struct_pack
 
 from .io_base import AudioIO, io_wrapper
 from .io_util import msg_out
+from .buffer_util import RingBuffer, reuse_array
+from .conversion_util import interleave, pack_three_byte, unpack_three_byte
+from .conversion_util import sample_dtype
+from .crc_util import crc8, crc16, crc16_shift
 
 from .import_util import LazyImport
 
@@ -42,26 +47,286 @@ __supported_dict = {
     }
 }
 
-class FlacFile(AudioIO):
-    """ A file like object for reading media files with ffmpeg.
+# The block size libFLAC uses at each compression level.
+_LEVEL_BLOCKSIZES = (1152, 1152, 1152, 4096, 4096, 4096, 4096, 4096, 4096)
+
+# How many blocks each segment encoded in the process pool has.
+_SEGMENT_BLOCKS = 64
+
+
+def _utf8_number(number):
+    """ _utf8_number(number) -> Return number coded like UTF-8 the way FLAC
+    frame headers code frame numbers.
+
+    """
+
+    if number < 0x80:
+        return bytearray((number, ))
+
+    for length, limit in ((2, 0x800), (3, 0x10000), (4, 0x200000),
+                          (5, 0x4000000), (6, 0x80000000)):
+        if number < limit:
+            break
+
+    coded = bytearray(length)
+    for i in range(length - 1, 0, -1):
+        coded[i] = 0x80 | (number & 0x3f)
+        number >>= 6
+    coded[0] = ((0xff00 >> length) & 0xff) | number
+
+    return coded
+
+
+def _renumber_frame(frame, number):
+    """ _renumber_frame(frame, number) -> Return the encoded frame with its
+    frame number changed to number and its CRCs fixed.
+
+    """
+
+    frame = bytearray(frame)
+
+    # The number is coded after the four fixed bytes, with as many bytes as
+    # the first one has leading ones.
+    length = 1
+    if frame[4] & 0x80:
+        while frame[4] & (0x80 >> length):
+            length += 1
+    end = 4 + length
+
+    # A blocksize or sample rate that has no code follows the number.
+    end += {6: 1, 7: 2}.get(frame[2] >> 4, 0)
+    end += {12: 1, 13: 2, 14: 2}.get(frame[2] & 0x0f, 0)
+
+    old_header = frame[:end + 1]
+    header = frame[:4] + _utf8_number(number) + frame[4 + length:end]
+    header.append(crc8(header))
+
+    # The CRC-16 is linear, so only the change in the header has to be
+    # carried across the rest of the frame.
+    body_size = len(frame) - len(old_header) - 2
+    crc = (frame[-2] << 8) | frame[-1]
+    crc ^= crc16_shift(crc16(old_header) ^ crc16(header), body_size)
+
+    frame[:end + 1] = header
+    frame[-2:] = bytearray((crc >> 8, crc & 0xff))
+
+    return bytes(frame)
+
+
+def _status_string(strings, status):
+    """ _status_string(strings, status) -> Return the string for status from
+    one of libFLAC's arrays of status strings.
+
+    """
+
+    string = _flac.cast(strings, _flac.POINTER(_flac.c_char_p))[status]
+
+    return string.decode('utf-8', 'replace')
+
+
+def _new_encoder(channels, depth, rate, compression_level, blocksize):
+    """ _new_encoder(channels, depth, rate, compression_level, blocksize) ->
+    Return a new libFLAC stream encoder with the stream settings.
+
+    """
+
+    encoder = _flac.FLAC__stream_encoder_new()
+    if not encoder:
+        raise IOError("Unable to allocate a FLAC encoder")
+
+    _flac.FLAC__stream_encoder_set_channels(encoder, channels)
+    _flac.FLAC__stream_encoder_set_bits_per_sample(encoder, depth)
+    _flac.FLAC__stream_encoder_set_sample_rate(encoder, rate)
+    _flac.FLAC__stream_encoder_set_compression_level(encoder,
+                                                     compression_level)
+    if blocksize:
+        _flac.FLAC__stream_encoder_set_blocksize(encoder, blocksize)
+
+    return encoder
+
+
+def _encode_segment(args):
+    """ _encode_segment((data, channels, depth, rate, compression_level,
+    blocksize, first_frame)) -> Encode the interleaved 32-bit samples in data
+    as frames numbered from first_frame, and return them with the size of
+    each frame.  The process pool runs this.
+
+    """
+
+    data, channels, depth, rate, compression_level, blocksize, \
+        first_frame = args
+
+    import numpy
+
+    samples = numpy.frombuffer(data, numpy.int32)
+
+    # The bytes of each frame by its number in the segment.
+    frame_dict = {}
+
+    def write(encoder, buf, size, sample_count, current_frame, client_data):
+        """ Keep the frames and skip the metadata.
+
+        """
+
+        if sample_count:
+            frame_dict.setdefault(current_frame, []).append(
+                _flac.string_at(buf, size))
+
+        return _flac.FLAC__STREAM_ENCODER_WRITE_STATUS_OK
+
+    write_callback = _flac.FLAC__StreamEncoderWriteCallback(write)
+
+    encoder = _new_encoder(channels, depth, rate, compression_level,
+                           blocksize)
+    try:
+        init = _flac.FLAC__stream_encoder_init_stream(
+            encoder, write_callback, _flac.FLAC__StreamEncoderSeekCallback(),
+            _flac.FLAC__StreamEncoderTellCallback(),
+            _flac.FLAC__StreamEncoderMetadataCallback(), None)
+        if init != _flac.FLAC__STREAM_ENCODER_INIT_STATUS_OK:
+            raise IOError(_status_string(
+                _flac.FLAC__StreamEncoderInitStatusString, init))
+
+        buf = samples.ctypes.data_as(_flac.POINTER(_flac.FLAC__int32))
+        if not _flac.FLAC__stream_encoder_process_interleaved(
+                encoder, buf, len(samples) // channels):
+            state = _flac.FLAC__stream_encoder_get_state(encoder)
+            raise IOError(_status_string(
+                _flac.FLAC__StreamEncoderStateString, state))
+
+        _flac.FLAC__stream_encoder_finish(encoder)
+    finally:
+        _flac.FLAC__stream_encoder_delete(encoder)
+
+    frame_list = [_renumber_frame(b''.join(frame_dict[number]),
+                                  first_frame + number)
+                  for number in sorted(frame_dict)]
+
+    return b''.join(frame_list), [len(frame) for frame in frame_list]
+
+
+def _metadata_block(block_type, data, last=False):
+    """ _metadata_block(block_type, data, last=False) -> Return data with a
+    metadata block header.
+
+    """
+
+    return struct_pack('>I', (last << 31) | (block_type << 24) |
+                       len(data)) + data
+
+
+def _stream_info(blocksize, min_frame, max_frame, rate, channels, depth,
+                 total_samples, md5):
+    """ _stream_info(blocksize, min_frame, max_frame, rate, channels, depth,
+    total_samples, md5) -> Return a STREAMINFO metadata block.
+
+    """
+
+    return struct_pack('>HH', blocksize, blocksize) + \
+        struct_pack('>I', min_frame)[1:] + \
+        struct_pack('>I', max_frame)[1:] + \
+        struct_pack('>Q', (rate << 44) | ((channels - 1) << 41) |
+                    ((depth - 1) << 36) | total_samples) + md5
+
+
+def _seek_table(points, count):
+    """ _seek_table(points, count) -> Return a SEEKTABLE of count points, the
+    (sample number, offset, samples) tuples in points followed by
+    placeholders.
 
     """
 
-    # Only reading is supported
-    _supported_modes = 'r'
+    data = [struct_pack('>QQH', *point) for point in points[:count]]
+    data.extend([struct_pack('>QQH', 0xffffffffffffffff, 0, 0)] *
+                (count - len(data)))
+
+    return b''.join(data)
+
+
+def _vorbis_comment(vendor, comment_dict):
+    """ _vorbis_comment(vendor, comment_dict) -> Return a VORBIS_COMMENT
+    metadata block of the comments in comment_dict.
+
+    """
+
+    entries = [_comment_entry(name, value)
+               for name, value in comment_dict.items()]
+
+    data = [struct_pack('<I', len(vendor)), vendor,
+            struct_pack('<I', len(entries))]
+    for entry in entries:
+        data.extend((struct_pack('<I', len(entry)), entry))
+
+    return b''.join(data)
 
-    def __init__(self, filename, depth=16, rate=44100, channels=2, **kwargs):
-        """ FlacFile(filename, depth=16, rate=44100, channels=2) ->
-        Initialize the playback settings of the player.
+
+def _comment_entry(name, value):
+    """ _comment_entry(name, value) -> Return the 'NAME=value' bytes of a
+    comment.
+
+    """
+
+    entry = u'%s=%s' % (name.upper(), value)
+
+    return entry.encode('utf-8')
+
+
+class FlacFile(AudioIO):
+    """ Read and write FLAC files.
+
+    """
+
+    # Valid bit depths
+    _valid_depth = (32, 24, 16, 8)
+
+    # Both reading and writing are supported
+    _supported_modes = 'rw'
+
+    def __init__(self, filename, mode='r', depth=16, rate=44100, channels=2,
+                 bigendian=False, unsigned=False, compression_level=5,
+                 blocksize=0, comment_dict={}, threads=1, length=0,
+                 seek_spacing=10, **kwargs):
+        """ FlacFile(filename, mode='r', depth=16, rate=44100, channels=2,
+        bigendian=False, unsigned=False, compression_level=5, blocksize=0,
+        comment_dict={}, threads=1, length=0, seek_spacing=10) -> Initialize
+        the playback settings of the player, or the encoder for writing.
+
+        When writing, compression_level is 0 to 8, a blocksize of 0 lets
+        libFLAC choose, and comment_dict is written as Vorbis comments.
+        24-bit data is written packed three bytes per sample.  With more
+        than one thread (0 for one per cpu) libFLAC encodes in that many
+        threads if it can, otherwise a process pool encodes segments of the
+        stream in parallel.  If the number of frames that will be written,
+        length, is given a SEEKTABLE with a point every seek_spacing seconds
+        is written.
 
         """
 
-        super(FlacFile, self).__init__(filename, 'r', depth, rate, channels)
+        super(FlacFile, self).__init__(filename, mode, depth, rate, channels)
+
+        if mode == 'w':
+            self._write_setup(filename, bigendian, unsigned,
+                              compression_level, blocksize, comment_dict,
+                              threads, length, seek_spacing)
+            return
 
         self._total_samples = 0
         self._decoder = None
-        self._data_buffer = b''
-        self._position = 0
+        self._data_buffer = RingBuffer()
+
+        # The sample after the last one decoded, which with what is still
+        # in the data buffer gives the position in samples.
+        self._decoded_end = 0
+
+        # The sample numbers of the seek points in the SEEKTABLE.
+        self._seek_points = []
+
+        # The blocksize of every frame, or 0 if it varies.
+        self._fixed_blocksize = 0
+
+        # Reused arrays to interleave and pack decoded blocks in.
+        self._interleaved = None
+        self._packed = None
 
         # Setup the decoder callbacks.
         self._write_callback = _flac.FLAC__StreamDecoderWriteCallback(self._write_status)
@@ -74,20 +339,93 @@ class FlacFile(AudioIO):
         else:
             raise(OSError("Failed to open FLAC: %s." % filename))
 
+    def __repr__(self):
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        if self._mode == 'r':
+            repr_str = "filename='%(_filename)s', mode='%(_mode)s', depth=%(_depth)s, rate=%(_rate)s, channels=%(_channels)s" % self
+        else:
+            repr_str = "filename='%(_filename)s', mode='%(_mode)s', depth=%(_depth)s, rate=%(_rate)s, channels=%(_channels)s, bigendian=%(_bigendian)s, unsigned=%(_unsigned)s, compression_level=%(_compression_level)s, blocksize=%(_blocksize)s, comment_dict=%(_comment_dict)s, threads=%(_threads)s, length=%(_expected_length)s, seek_spacing=%(_seek_spacing)s" % self
+
+        return '%s(%s)' % (self.__class__.__name__, repr_str)
+
+    def _frame_size(self):
+        """ _frame_size() -> Return the size in bytes of a decoded frame.
+
+        """
+
+        return (3 if self.three_byte else self._depth // 8) * self._channels
+
     def _get_position(self):
-        """ Updates the position variable.
+        """ Returns the sample that will be read next.
 
         """
 
-        # Update the position.
-        return self._position
+        return self._decoded_end - len(self._data_buffer) // self._frame_size()
 
     def _set_position(self, position):
-        """ Change the position of playback.
+        """ Change the position of playback to the sample position.  libFLAC
+        uses the SEEKTABLE to get near it, and the decoded data starts at
+        exactly that sample.
 
         """
 
-        _flac.FLAC__stream_decoder_seek_absolute(self._decoder, position)
+        position = max(0, position)
+
+        # The end of the stream is reached by decoding its last sample and
+        # dropping it.
+        at_end = self._total_samples and position >= self._total_samples
+        if at_end:
+            position = self._total_samples - 1
+
+        # Drop what was decoded from the old position.
+        self._data_buffer.clear()
+
+        if not _flac.FLAC__stream_decoder_seek_absolute(self._decoder,
+                                                        position):
+            state = _flac.FLAC__stream_decoder_get_state(self._decoder)
+            if state == _flac.FLAC__STREAM_DECODER_SEEK_ERROR:
+                # The decoder has to be flushed before it can decode again.
+                _flac.FLAC__stream_decoder_flush(self._decoder)
+            raise IOError("Unable to seek to sample %d." % position)
+
+        if at_end:
+            self._data_buffer.clear()
+            self._decoded_end = self._total_samples
+
+    def _set_position_fast(self, position):
+        """ Change the position of playback to the last seek point at or
+        before position, or the start of its frame if there are no seek
+        points there and the blocksize is fixed, so nothing has to be
+        decoded and dropped to get to it.
+
+        """
+
+        position = max(0, position)
+        if self._total_samples and position >= self._total_samples:
+            return self._set_position(position)
+
+        index = bisect_right(self._seek_points, position)
+        if index:
+            target = self._seek_points[index - 1]
+        else:
+            target = 0
+
+        if self._fixed_blocksize:
+            target = max(target, position - position % self._fixed_blocksize)
+
+        self._set_position(target)
+
+    @property
+    def seek_points(self):
+        """ The sample numbers of the points in the SEEKTABLE.  Seeking is
+        faster with them since libFLAC only has to search between two.
+
+        """
+
+        return self._seek_points
 
     def _open(self, filename):
         """ Open a flac file.
@@ -102,6 +440,10 @@ class FlacFile(AudioIO):
 
         decoder = _flac.FLAC__stream_decoder_new()
 
+        # Have the SEEKTABLE sent to the metadata callback too.
+        _flac.FLAC__stream_decoder_set_metadata_respond(
+            decoder, _flac.FLAC__METADATA_TYPE_SEEKTABLE)
+
         init = _flac.FLAC__stream_decoder_init_file(decoder, filename,
                                                     self._write_callback,
                                                     self._metadata_callback,
@@ -112,16 +454,19 @@ class FlacFile(AudioIO):
             msg_out(_flac.FLAC__StreamDecoderInitStatusString(init))
             return None
 
-        # Decode the first sample to get the metadata
-        _flac.FLAC__stream_decoder_process_single(decoder)
+        # Read all the metadata.
+        _flac.FLAC__stream_decoder_process_until_end_of_metadata(decoder)
 
         return decoder
 
     def close(self):
-        """ Close and finish the flac decoder.
+        """ Close and finish the flac decoder or encoder.
 
         """
 
+        if self._mode == 'w':
+            return self._write_close()
+
         if not self.closed and self._decoder:
             _flac.FLAC__stream_decoder_finish(self._decoder)
             _flac.FLAC__stream_decoder_delete(self._decoder)
@@ -135,46 +480,36 @@ class FlacFile(AudioIO):
 
         """
 
-        channels = frame.contents.header.channels
-        size = frame.contents.header.blocksize
-        depth = frame.contents.header.bits_per_sample
-        rate = frame.contents.header.sample_rate
-        size = frame.contents.header.blocksize
+        import numpy
 
-        # Only 1 and 2 channels are supported.
-        if channels > 2:
-            return _flac.FLAC__STREAM_DECODER_WRITE_STATUS_ABORT
+        header = frame.contents.header
+        channels = header.channels
+        size = header.blocksize
+        depth = header.bits_per_sample
 
-        if depth == 16:
-            data = array('h', bytearray((size * channels) * 2))
-        elif depth == 24:
-            data = array('i', bytearray((size * channels) * 4))
-        elif depth == 8:
-            data = array('b', bytearray(size * channels))
-        else:
+        # 24-bit samples are interleaved as 32-bit and then packed.
+        dtype = {8: '<i1', 16: '<i2', 24: '<i4'}.get(depth, None)
+        if not dtype:
             return _flac.FLAC__STREAM_DECODER_WRITE_STATUS_ABORT
 
-        # Compute the sample size
-        sample_size = size * channels
-
-        # Interleave the data.
-        for i in range(size):
-            for j in range(channels):
-                data[i * channels + j] = buf[j][i]
+        count = size * channels
+        self._interleaved = reuse_array(self._interleaved, count, dtype)
 
-        data = bytearray(data)
+        # Interleave the samples straight from the decoder's channel
+        # buffers.
+        channel_list = [numpy.ctypeslib.as_array(buf[i], (size, ))
+                        for i in range(channels)]
+        data = interleave(channel_list, self._interleaved[:count])
 
         if depth == 24:
-            # Discard every 4th byte to make 3-byte 24-bit.
-            data = compress(data, cycle([1,1,1,0]))
-            data = bytes(data)[:sample_size * 3]
-        else:
-            data = bytes(data)
+            self._packed = reuse_array(self._packed, count * 3, numpy.uint8)
+            data = pack_three_byte(data, out=self._packed[:count * 3])
 
-        # Update the position
-        self._position = frame.contents.header.number.sample_number
+        # libFLAC gives the sample number of the frame, and after a seek the
+        # frame starts at the sample sought.
+        self._decoded_end = header.number.sample_number + size
 
-        self._data_buffer += data
+        self._data_buffer.append(data.view(numpy.uint8))
 
         return _flac.FLAC__STREAM_DECODER_WRITE_STATUS_CONTINUE
 
@@ -183,12 +518,26 @@ class FlacFile(AudioIO):
 
         """
 
+        if metadata.contents.type == _flac.FLAC__METADATA_TYPE_SEEKTABLE:
+            seek_table = metadata.contents.data.seek_table
+
+            # Placeholder points have the largest sample number.
+            self._seek_points = [seek_table.points[i].sample_number
+                                 for i in range(seek_table.num_points)
+                                 if seek_table.points[i].sample_number !=
+                                 0xffffffffffffffff]
+            return
+
         self._channels = metadata.contents.data.stream_info.channels
         self._rate = metadata.contents.data.stream_info.sample_rate
         self._total_samples = metadata.contents.data.stream_info.total_samples
         self._depth = metadata.contents.data.stream_info.bits_per_sample
         self._length = self._total_samples
 
+        stream_info = metadata.contents.data.stream_info
+        if stream_info.min_blocksize == stream_info.max_blocksize:
+            self._fixed_blocksize = stream_info.max_blocksize
+
         if self._depth == 24:
             self.three_byte = True
 
@@ -206,34 +555,432 @@ class FlacFile(AudioIO):
 
         """
 
-        while len(self._data_buffer) < size:
+        data = self._data_buffer
+
+        while len(data) < size:
             # Get the current decoder state.
             decode_state = _flac.FLAC__stream_decoder_get_state(self._decoder)
 
             # Check for the end of the stream.
             if decode_state == _flac.FLAC__STREAM_DECODER_END_OF_STREAM:
-                # Get the last sample so we can pad it for output.
-                data = self._data_buffer
                 if self._loops != -1 and self._loop_count >= self._loops:
                     # Fill the data buffer with nothing so it will be a
                     # frame size for output.
                     if len(data) != 0:
-                        data += b'\x00' * (size - len(data))
+                        data.pad(size)
                 else:
                     # Fill the buffer so we return the requested size.
-                    data += b'\x00' * (size - len(data))
+                    data.pad(size)
+                    chunk = data.read(size)
 
-                    # Update the loop count and seek to the start.
+                    # Update the loop count and seek to the start, which
+                    # empties the data buffer.
                     self._loop_count += 1
                     self.seek(0)
+
+                    return chunk
                 break
             else:
                 # Decode the next sample.
                 _flac.FLAC__stream_decoder_process_single(self._decoder)
 
+        return data.read(size)
+    read.__annotations__ = {'size': int, 'return': bytes}
 
-        data = self._data_buffer[:size]
-        self._data_buffer =  self._data_buffer[size:]
+    def _write_setup(self, filename, bigendian, unsigned, compression_level,
+                     blocksize, comment_dict, threads, length, seek_spacing):
+        """ _write_setup(filename, bigendian, unsigned, compression_level,
+        blocksize, comment_dict, threads, length, seek_spacing) -> Set up the
+        encoder and open the file for writing.
 
-        return data
-    read.__annotations__ = {'size': int, 'return': bytes}
+        """
+
+        if self._depth > 24:
+            raise ValueError("(%s) FLAC can only encode up to 24 bits." %
+                             self.__class__.__name__)
+
+        self._bigendian = bigendian
+        self._unsigned = unsigned
+        self.three_byte = self._depth == 24
+
+        if compression_level not in range(0, 9):
+            compression_level = 5
+
+        self._compression_level = compression_level
+        self._blocksize = blocksize
+        self._comment_dict = comment_dict
+        self._info_dict.update(comment_dict)
+        self._info_dict['encoder'] = __name__
+
+        # The samples between seek points, or 0 for no SEEKTABLE.
+        self._expected_length = length
+        self._seek_spacing = seek_spacing
+        self._seek_samples = int(seek_spacing * self._rate) if length else 0
+
+        if not threads:
+            from multiprocessing import cpu_count
+            threads = cpu_count()
+        self._threads = threads
+
+        sample_size = 3 if self.three_byte else self._width
+        self._frame_size = sample_size * self._channels
+
+        # The bytes of a frame the last write ended with, and the reused
+        # array of 32-bit samples libFLAC encodes.
+        self._partial = b''
+        self._samples = None
+
+        self._encoder = None
+        self._metadata_objects = []
+        self._pool = None
+
+        try:
+            # Convert filename to bytes.
+            filename = filename.encode('utf-8', 'surrogateescape')
+        except AttributeError:
+            pass
+
+        self._encoder = _new_encoder(self._channels, self._depth, self._rate,
+                                     compression_level, blocksize)
+
+        if threads > 1 and not self._set_threads(threads):
+            # libFLAC can't use threads so encode segments in processes.
+            _flac.FLAC__stream_encoder_delete(self._encoder)
+            self._encoder = None
+            self._out_file = self._pool_open(filename)
+        else:
+            self._encoder_open(filename)
+
+        self._closed = False
+
+    def _set_threads(self, threads):
+        """ _set_threads(threads) -> Have libFLAC encode in threads threads
+        and return True, or False if this libFLAC can't.
+
+        """
+
+        try:
+            status = _flac.FLAC__stream_encoder_set_num_threads(self._encoder,
+                                                                threads)
+        except AttributeError:
+            # Only libFLAC 1.5 and later has threads.
+            return False
+
+        return status == _flac.FLAC__STREAM_ENCODER_SET_NUM_THREADS_OK
+
+    def _comment_items(self):
+        """ _comment_items() -> Return the comments to write.
+
+        """
+
+        comment_dict = dict(self._comment_dict)
+        comment_dict.setdefault('encoder', __name__)
+
+        return comment_dict.items()
+
+    def _encoder_open(self, filename):
+        """ _encoder_open(filename) -> Start libFLAC encoding to filename.
+
+        """
+
+        comments = _flac.FLAC__metadata_object_new(
+            _flac.FLAC__METADATA_TYPE_VORBIS_COMMENT)
+
+        for name, value in self._comment_items():
+            name, value = _comment_entry(name, value).split(b'=', 1)
+            entry = _flac.FLAC__StreamMetadata_VorbisComment_Entry()
+            if _flac.FLAC__metadata_object_vorbiscomment_entry_from_name_value_pair(
+                    _flac.byref(entry), name, value):
+                # The comment takes the entry.
+                _flac.FLAC__metadata_object_vorbiscomment_append_comment(
+                    comments, entry, False)
+
+        self._metadata_objects.append(comments)
+
+        if self._seek_samples:
+            # libFLAC fills in the points as it encodes the frames.
+            seek_table = _flac.FLAC__metadata_object_new(
+                _flac.FLAC__METADATA_TYPE_SEEKTABLE)
+            self._metadata_objects.insert(0, seek_table)
+            _flac.FLAC__metadata_object_seektable_template_append_spaced_points_by_samples(
+                seek_table, self._seek_samples, self._expected_length)
+            _flac.FLAC__metadata_object_seektable_template_sort(seek_table,
+                                                                True)
+
+        # libFLAC uses the metadata until the encoder is finished.
+        count = len(self._metadata_objects)
+        self._metadata = (_flac.POINTER(_flac.FLAC__StreamMetadata) * count)(
+            *self._metadata_objects)
+        _flac.FLAC__stream_encoder_set_metadata(self._encoder, self._metadata,
+                                                count)
+
+        init = _flac.FLAC__stream_encoder_init_file(
+            self._encoder, filename,
+            _flac.FLAC__StreamEncoderProgressCallback(), None)
+
+        if init != _flac.FLAC__STREAM_ENCODER_INIT_STATUS_OK:
+            self._encoder_close()
+            raise IOError("Failed to open FLAC %s: %s." %
+                          (self._filename,
+                           _status_string(
+                               _flac.FLAC__StreamEncoderInitStatusString,
+                               init)))
+
+    def _pool_open(self, filename):
+        """ _pool_open(filename) -> Start the process pool and write the
+        metadata to filename, and return the open file.
+
+        """
+
+        from hashlib import md5
+        from multiprocessing import Pool
+
+        import numpy
+
+        blocksize = self._blocksize or \
+            _LEVEL_BLOCKSIZES[self._compression_level]
+        self._blocksize = blocksize
+
+        # Segments are whole blocks so only the last frame of the stream is
+        # short.
+        self._segment = numpy.empty(_SEGMENT_BLOCKS * blocksize *
+                                    self._channels, numpy.int32)
+        self._segment_fill = 0
+
+        # The results of the segments being encoded with the sample they
+        # start at and how many samples they have, in order.
+        self._pending = deque()
+        self._frame_number = 0
+        self._total_samples = 0
+        self._min_frame = 0
+        self._max_frame = 0
+        self._md5 = md5()
+
+        # The seek points, how many there is room for, and the bytes of
+        # frames written.
+        self._seek_points = []
+        self._seek_count = 0
+        if self._seek_samples:
+            self._seek_count = -(-self._expected_length //
+                                 self._seek_samples)
+        self._audio_size = 0
+
+        out_file = open(filename, 'wb')
+
+        # The stream info and seek table are written again when the stream
+        # is finished.
+        vendor = __name__.encode('utf-8')
+        out_file.write(b'fLaC')
+        out_file.write(_metadata_block(0, self._pool_stream_info()))
+        if self._seek_count:
+            self._seek_table_offset = out_file.tell() + 4
+            out_file.write(_metadata_block(3, _seek_table([],
+                                                          self._seek_count)))
+        out_file.write(_metadata_block(4, _vorbis_comment(
+            vendor, dict(self._comment_items())), last=True))
+
+        self._pool = Pool(self._threads)
+
+        return out_file
+
+    def _pool_stream_info(self):
+        """ _pool_stream_info() -> Return the STREAMINFO of what has been
+        written by the process pool.
+
+        """
+
+        md5 = self._md5.digest() if self._total_samples else b'\0' * 16
+
+        return _stream_info(self._blocksize, self._min_frame,
+                            self._max_frame, self._rate, self._channels,
+                            self._depth, self._total_samples, md5)
+
+    def _to_samples(self, data):
+        """ _to_samples(data) -> Return the whole frames in data, after any
+        left from the last write, as signed 32-bit samples.
+
+        """
+
+        import numpy
+
+        raw = numpy.frombuffer(data, numpy.uint8)
+
+        if self._partial:
+            raw = numpy.concatenate((numpy.frombuffer(self._partial,
+                                                      numpy.uint8), raw))
+
+        # Keep the bytes of a partial frame for the next write.
+        extra = len(raw) % self._frame_size
+        self._partial = raw[len(raw) - extra:].tobytes() if extra else b''
+        raw = raw[:len(raw) - extra]
+
+        count = len(raw) // (self._frame_size // self._channels)
+        self._samples = reuse_array(self._samples, count, numpy.int32)
+        samples = self._samples[:count]
+
+        if self.three_byte:
+            unpack_three_byte(raw, self._bigendian, self._unsigned,
+                              samples.view(numpy.uint32)
+                              if self._unsigned else samples)
+        else:
+            samples[:] = raw.view(sample_dtype(self._depth, self._unsigned,
+                                               self._bigendian))
+
+        if self._unsigned:
+            samples -= 1 << (self._depth - 1)
+
+        return samples
+
+    @io_wrapper
+    def write(self, data):
+        """ write(data) -> Encode data and write it to the FLAC file, and
+        return the number of bytes of data used.
+
+        """
+
+        samples = self._to_samples(data)
+
+        if self._pool:
+            self._pool_write(samples)
+        elif len(samples):
+            # libFLAC reads the samples straight from the array.
+            buf = samples.ctypes.data_as(_flac.POINTER(_flac.FLAC__int32))
+            if not _flac.FLAC__stream_encoder_process_interleaved(
+                    self._encoder, buf, len(samples) // self._channels):
+                state = _flac.FLAC__stream_encoder_get_state(self._encoder)
+                raise IOError("Error encoding FLAC: %s" % _status_string(
+                    _flac.FLAC__StreamEncoderStateString, state))
+
+        return len(data)
+    write.__annotations__ = {'data': bytes, 'return': int}
+
+    def _pool_write(self, samples):
+        """ _pool_write(samples) -> Add samples to the segment, and send each
+        full segment to the process pool.
+
+        """
+
+        import numpy
+
+        # The MD5 is of the samples little-endian in as few bytes as hold
+        # them.
+        if self._depth == 24:
+            self._md5.update(pack_three_byte(samples).tobytes())
+        else:
+            self._md5.update(samples.astype(sample_dtype(self._depth))
+                             .tobytes())
+
+        segment = self._segment
+
+        offset = 0
+        while offset < len(samples):
+            count = min(len(samples) - offset,
+                        len(segment) - self._segment_fill)
+            segment[self._segment_fill:self._segment_fill + count] = \
+                samples[offset:offset + count]
+            self._segment_fill += count
+            offset += count
+
+            if self._segment_fill == len(segment):
+                self._pool_encode()
+
+        # Write what has been encoded, and don't let more than two segments
+        # per process wait.
+        while self._pending and (self._pending[0][0].ready() or
+                                 len(self._pending) > 2 * self._threads):
+            self._pool_finish_segment()
+
+    def _pool_encode(self):
+        """ _pool_encode() -> Send the segment to the process pool.
+
+        """
+
+        frames = self._segment_fill // self._channels
+        if not frames:
+            return
+
+        args = (self._segment[:self._segment_fill].tobytes(), self._channels,
+                self._depth, self._rate, self._compression_level,
+                self._blocksize, self._frame_number)
+        self._pending.append((self._pool.apply_async(_encode_segment,
+                                                     (args, )),
+                              self._total_samples, frames))
+
+        self._frame_number += -(-frames // self._blocksize)
+        self._total_samples += frames
+        self._segment_fill = 0
+
+    def _pool_finish_segment(self):
+        """ _pool_finish_segment() -> Wait for the oldest segment and write
+        its frames.
+
+        """
+
+        result, sample, samples = self._pending.popleft()
+        data, sizes = result.get()
+
+        self._out_file.write(data)
+
+        if sizes:
+            if not self._min_frame or min(sizes) < self._min_frame:
+                self._min_frame = min(sizes)
+            self._max_frame = max(self._max_frame, max(sizes))
+
+        end = sample + samples
+        for size in sizes:
+            frame_samples = min(self._blocksize, end - sample)
+
+            # Point at the frame each seek point falls in.
+            seek_sample = len(self._seek_points) * self._seek_samples
+            if self._seek_samples and seek_sample < sample + frame_samples:
+                self._seek_points.append((sample, self._audio_size,
+                                          frame_samples))
+
+            sample += frame_samples
+            self._audio_size += size
+
+    def _encoder_close(self):
+        """ _encoder_close() -> Finish and free the encoder and its
+        metadata.
+
+        """
+
+        if self._encoder:
+            _flac.FLAC__stream_encoder_finish(self._encoder)
+            _flac.FLAC__stream_encoder_delete(self._encoder)
+            self._encoder = None
+
+        for metadata in self._metadata_objects:
+            _flac.FLAC__metadata_object_delete(metadata)
+        self._metadata_objects = []
+
+    def _write_close(self):
+        """ _write_close() -> Finish the stream and close the file.
+
+        """
+
+        if self.closed:
+            return
+
+        if self._pool:
+            try:
+                self._pool_encode()
+                while self._pending:
+                    self._pool_finish_segment()
+            finally:
+                self._pool.close()
+                self._pool.join()
+                self._pool = None
+
+            # Fill in the stream info now the stream is finished.
+            self._out_file.seek(8)
+            self._out_file.write(self._pool_stream_info())
+            if self._seek_count:
+                self._out_file.seek(self._seek_table_offset)
+                self._out_file.write(_seek_table(self._seek_points,
+                                                 self._seek_count))
+            self._out_file.close()
+        else:
+            self._encoder_close()
+
+        self._closed = True
@@ -248,14 +248,14 @@ class Synth(object):
         return _fluidsynth.string_at(buf, _fluidsynth.sizeof(buf))
 
     def read_float(self, size):
-        """ read_float(size) -> Read size amount of floating point data and
+        """ read_float(size) -> Read size frames of floating point data and
         return it.
 
         """
 
         multiplier = self._settings.get('synth.audio-channels') * 2
-        buf = (_fluidsynth.c_float * size)()
-        self.write_float(size / multiplier, buf, 0, 2, buf, 1, 2)
+        buf = (_fluidsynth.c_float * (size * multiplier))()
+        self.write_float(size, buf, 0, 2, buf, 1, 2)
         return _fluidsynth.string_at(buf, _fluidsynth.sizeof(buf))
 
     @property
@@ -511,17 +511,21 @@ class FluidsynthFile(AudioIO):
                  reverb={'roomsize': 0.2, 'damping': 0.0, 'width': 0.5,
                          'level': 0.9},
                  chorus={'nr': 3, 'level': 2.0, 'speed': 0.3, 'depth_ms': 8.0,
-                         'type': 0}, **kwargs):
+                         'type': 0}, floatp=False, **kwargs):
         """ FluidsynthFile(filename, soundfont, rate=44100, gain=0.2,
-        reverb=(0.2, 0.0, 0.5, 0.9), chorus=(3, 2.0, 0.3, 8.0, 0)) ->
-        Initialize the playback settings of the player.
+        reverb=(0.2, 0.0, 0.5, 0.9), chorus=(3, 2.0, 0.3, 8.0, 0),
+        floatp=False) -> Initialize the playback settings of the player.  If
+        floatp is True the synth renders 32-bit floats.
 
         """
 
         super(FluidsynthFile, self).__init__(filename=filename, mode='r',
-                                             rate=rate, depth=16,
+                                             rate=rate,
+                                             depth=32 if floatp else 16,
                                              channels=2)
 
+        self._floatp = floatp
+
         self._soundfont = soundfont
 
         self._gain = gain
@@ -687,7 +691,11 @@ class FluidsynthFile(AudioIO):
             # we want it.
             self._player.play()
 
-        size //= self._channels * 2
+        # Convert the size to frames.
+        size //= self._channels * self._width
+
+        if self._floatp:
+            return self._synth.read_float(size)
 
         return self._synth.read_s16(size)
     read.__annotations__ = {'size': int, 'return': bytes}
@@ -26,6 +26,7 @@
 from functools import partial
 
 from .io_base import AudioIO, io_wrapper
+from .io_util import c_array_from
 # from .gme import _gme
 
 from .import_util import LazyImport
@@ -204,27 +205,35 @@ class GMEFile(AudioIO):
         self._info_dict = info_dict
 
     @io_wrapper
-    def read(self, size):
-        """ read(size=None) -> Reads size amount of data and returns it.
+    def readinto(self, barray):
+        """ readinto(barray) -> Play up to len(barray) bytes straight into
+        the bytearray barray and return the number of bytes read.
 
         """
 
-        size //= self._channels
-
-        c_buffer = (_gme.c_short * size)()
+        # gme plays a whole number of stereo 16-bit samples.
+        count = (len(barray) // 4) * 2
 
-        _gme.gme_play(self._music_emu, size, c_buffer)
+        out_buffer = c_array_from(_gme.c_short, barray)
 
-        data = _gme.string_at(c_buffer, _gme.sizeof(c_buffer))
+        _gme.gme_play(self._music_emu, count, out_buffer)
 
         if _gme.gme_track_ended(self._music_emu):
             if self._loops == -1 or self._loops > self._loop_count:
                 self._loop_count += 1
                 self.seek(0)
             else:
-                data = b''
+                return 0
+
+        return count * 2
+
+    @io_wrapper
+    def read(self, size):
+        """ read(size=None) -> Reads size amount of data and returns it.
+
+        """
 
-        return data
+        return self._read_with_readinto(size)
     read.__annotations__ = {'size': int, 'return': bytes}
 
     def close(self):
@@ -22,301 +22,209 @@
 """ Import utility functions and classes
 
     LazyImport      Import modules when they are accessed
-    OnDemand        Load modules when they are accessed
+    LazyLibraries   Load native libraries when they are looked up
+    LazyBindings    Define ctypes bindings when they are accessed
+    bind_lazily     Make a generated binding module lazy
 
 """
 
 
-from os import walk as os_walk
-from os.path import isdir as os_isdir
-from os.path import abspath as os_abspath
-from os.path import dirname as os_dirname
-from os.path import basename as os_basename
+from importlib import import_module
 from types import ModuleType as types_ModuleType
-import sys
-
-
-class Module(types_ModuleType):
-    pass
 
 
 class LazyImport(types_ModuleType):
-    """ LazyImport only loads the module when one of its attributes is
-    accessed.
+    """ LazyImport stands in for a module and only imports it when one of its
+    attributes is accessed.  The binding modules load their native libraries
+    when they are imported, so those are not loaded until they are used
+    either.
 
     """
 
     def __init__(self, name, globals={}, locals={}, fromlist=[], level=0):
         """ LazyImport(module_name, globals={}, locals={}, fromlist=[],
-        level=0) -> Load module only when it is needed.
+        level=0) -> Load module only when it is needed.  The arguments are
+        the same as for __import__.
 
         """
 
         super(LazyImport, self).__init__(name)
 
-        # package = os_basename(os_dirname(__file__))
-        # print(package, name)
-        # if name.startswith('.'):
-        #     name = '%s%s' % (package, name)
-
-        self._globals = globals
-        self._locals = locals
-
-        if not fromlist:
-            # Build the sub-modules list from the name.
-            fromlist = name.split('.')[1:]
-
-        self._fromlist = fromlist
-
-        self._level = level
-        self.__mod__ = None
-        # self.__name__ = name
-
-    def __getattribute__(self, attr):
-        """ Import the module and set __getattribute__ so this method is not
-        called again.
-
-        """
-
-        # Set the class to a new empty module so getattr will work.
-        self.__class__ = type('Module', (types_ModuleType,), {})
-
-        # print('__getattribute__: ', self.__name__, attr)
-        # if attr == "__package__":
-        #     return getattr(self, "__package__", None)
-
-        # Test if this method has been called.
-        if not getattr(self, '__mod__', None):
-            # Remove previous occurance of module from sys.modules.
-            if self.__name__ in sys.modules:
-                sys.modules.pop(self.__name__)
+        package = None
+        if level:
+            # Resolve relative names against the importing package like
+            # __import__ does.
+            package = globals.get('__package__', None)
+            if not package:
+                package = globals.get('__name__', '')
+                if '__path__' not in globals:
+                    package = package.rpartition('.')[0]
 
-            # Import the module.
-            self.__mod__ = __import__(self.__name__, self._globals,
-                                      self._locals, self._fromlist,
-                                      self._level)
+        self.__target = '%s%s' % ('.' * level, name)
+        self.__package = package
+        self.__module = None
 
-            # Add the modules dict items to this module.
-            self.__dict__.update(self.__mod__.__dict__)
-
-            # The next time getattribute is called it will be for the
-            # loaded module not this one.
-            self.__getattribute__ = self.__mod__.__getattribute__
-
-            # Add the module back into sys.modules.
-            sys.modules[self.__name__] = self.__mod__
-
-        # Return the item.
-        return getattr(self, attr)
-
-
-class OnDemand(object):
-    """ Load modules when accessed.
-
-    """
-
-    def __init__(self, module_name, globals={}, locals={}, fromlist=[],
-                 level=0):
-        """ OnDemand(module_name, globals={}, locals={}, fromlist=[], level=0)
-        -> Load module only when it is needed.
+    def __load(self):
+        """ __load() -> Import the module the first time it is needed and
+        return it.
 
         """
 
-        self._module_name = module_name
-        self._globals = globals
-        self._locals = locals
-        self._fromlist = fromlist
-        self._level = level
-        self._module = None
-
-    def _import(self):
-        """ Import the module.
+        if self.__module is None:
+            self.__module = import_module(self.__target, self.__package)
 
-        """
-
-        self._module = __import__(self._module_name, self._globals,
-                                  self._locals, self._fromlist, self._level)
+        return self.__module
 
     def __getattr__(self, attr):
-        """ Load the module if it is not already loaded.  Returns the modules
-        attributes.
-
-        """
-
-        if not self._module:
-            self._import()
-
-        return getattr(self._module, attr)
-
-    @property
-    def __dict__(self):
-        """ Load the module if it is not already loaded.  Returns the modules
-        __dict__.
+        """ Import the module and return its attribute attr.  This is only
+        called for attributes that are not already on the stand-in.
 
         """
 
-        if not self._module:
-            self._import()
-
-        return vars(self._module)
-
+        value = getattr(self.__load(), attr)
 
-# Try to make a lazy module.
-class LazyModule(types_ModuleType):
-    """ LazyModule only loads the module when one of its attributes is
-    accessed.
+        # Keep the attribute so the next access is a plain lookup.
+        setattr(self, attr, value)
 
-    """
+        return value
 
-    def __getattribute__(self, attr):
-        """ Initialize the module and add it to sys.modules.
+    def __dir__(self):
+        """ __dir__ -> Returns the attributes of the module.
 
         """
 
-        self.__class__ = Module
-        print(self.__name__, 'get', attr)
-        exec('import %s' % self.__name__)
-        # self.__mod__ = __import__(self.__name__, {}, {}, [])
-        # self.__loader__ = super(LazyImporter, self.__loader__)
-        # self.__loader__.load_module(self.__name__)
-        return getattr(self, attr, None)
+        return dir(self.__load())
 
 
-# Test class
-class LazyImp(object):
-    """ LazyImporter uses LazyModule to load the module when one of its
-    attributes is accessed.
+class LazyLibraries(dict):
+    """ A dictionary of native libraries by path that only loads each
+    library the first time it is looked up.
 
     """
 
-    def __init__(self):
-        self._loaded = []
-
-    def find_module(self, fullname, path=None):
-        """ Used LazyLoader.
-
-        """
-
-        if fullname in self._loaded:
-            return None
-
-        print(self, fullname, path)
-        return self
-
-    # @importlib_util.module_for_loader
-    def load_module(self, fullname):
-        """ Load the module.
+    def __missing__(self, path):
+        """ Load the library at path and keep it.
 
         """
 
-        print(fullname, dir(fullname))
-        self._loaded.append(fullname)
+        from ctypes import CDLL
 
-        if fullname in sys.modules:
-            return sys.modules[fullname]
+        library = self[path] = CDLL(path)
 
-        __import__(fullname, {}, {}, [])
-        return sys.modules[fullname]
+        return library
 
 
-def _build_mod_list(mod_path):
-    """ _build_mod_list(mod_path, suffix) -> Add all the paths in mod_path to
-    sys.path and return a list of all modules in sys.path ending in suffix.
+class LazyBindings(types_ModuleType):
+    """ LazyBindings replaces a generated ctypes binding module in
+    sys.modules.  The constants are defined when the module is imported, but
+    the functions, structures and the types that use them are only defined
+    the first time they are accessed.
 
     """
 
-    mod_path = [mod_path] if type(mod_path) is str else mod_path
+    def __init__(self, module, definitions):
+        """ LazyBindings(module, definitions) -> Stand in for module, defining
+        the names in the definitions dictionary when they are accessed.
 
-    # Add the path of this file to the search path.
-    mod_path.append(os_abspath(os_dirname(__file__)))
+        Each definition is a tuple of the name of the base class to create
+        the name from or None, the lazy names it uses, and the source of the
+        code that defines it or finishes defining it, which is run in the
+        module's namespace.
 
-    # Build the list of modules in mod_path(s).
-    mod_list = ('{0}.{1}.{2}'.format(os_basename(path), \
-                    os_basename(root).replace(os_basename(path), ''), \
-                    name.rsplit('.', 1)[0]).replace('..', '.') \
-                    for path in mod_path \
-                        if os_isdir(path) \
-                            for root, dirs, files in os_walk(path) \
-                                for name in files \
-                                    if name.endswith('.py'))
+        """
 
-    return mod_list
+        super(LazyBindings, self).__init__(module.__name__, module.__doc__)
 
+        from threading import RLock
 
-class LazyImporter(object):
-    """ LazyImporter uses LazyImport to load the module when one of its
-    attributes is accessed.
+        # Keep the module so its globals are not cleared when it is
+        # replaced in sys.modules.
+        self.__module = module
+        self.__namespace = vars(module)
+        self.__definitions = definitions
+        self.__resolving = set()
+        self.__lock = RLock()
 
-    """
+        # The module's names are not copied here, __getattr__ looks each one
+        # up the first time it is accessed.  Copying thousands of names took
+        # a good part of the import, and names the module got from
+        # elsewhere, like memmove from 'from ctypes import *', would have
+        # hidden the lazy definitions of the same names.
 
-    def __init__(self, skip=[], mod_path=[]):
-        """ LazyImporter() -> Initialize the lazy importer.
+        if '__all__' not in self.__namespace:
+            # Make 'from module import *' define the lazy names too.
+            self.__all__ = [name for name in
+                            set(self.__namespace) | set(definitions)
+                            if not name.startswith('_')]
 
-        """
+    def __define(self, name):
+        """ __define(name) -> Define name and the lazy names it uses.
 
-        # List to hold module names that were already loaded.
-        self._loaded = skip
+        """
 
-        self._mods = tuple(_build_mod_list(mod_path))
+        base, uses, define = self.__definitions[name]
 
-    def find_module(self, fullname, path=None):
-        """ Use self.
+        self.__resolving.add(name)
+        try:
+            if base:
+                # Create the class first so the names it uses can refer to
+                # it before its fields are set.
+                if base in self.__definitions:
+                    self.__define(base)
+                self.__namespace[name] = type(name,
+                                              (self.__namespace[base], ),
+                                              {'__module__': self.__name__})
 
-        """
+            for used in uses:
+                if used in self.__definitions and \
+                        used not in self.__resolving:
+                    self.__define(used)
 
-        # Use pythons importer if fullname is asked for more than once,
-        # because it will mean that an attribute was requested from the
-        # lazy module.
-        if fullname in self._loaded or fullname not in self._mods:
-            return None
+            if define:
+                filename = self.__namespace.get('__file__', self.__name__)
+                exec (compile(define, filename, 'exec'), self.__namespace)
+        finally:
+            self.__resolving.discard(name)
 
-        return self
+        del self.__definitions[name]
 
-    def load_module(self, fullname):
-        """ Load the module.
+    def __dir__(self):
+        """ List the module's names and the lazy names.
 
         """
 
-        # Log that this module has been handled so it can load.
-        self._loaded.append(fullname)
+        return sorted(set(self.__dict__) | set(self.__namespace) |
+                      set(self.__definitions))
 
-        # Return the module if it is already loaded.
-        if fullname in sys.modules:
-            return sys.modules[fullname]
+    def __getattr__(self, attr):
+        """ Define attr the first time it is accessed.
 
-        # Create a new lazy module.
-        module = LazyImport(fullname)
+        """
 
-        module.__loader__ = self
+        with self.__lock:
+            if attr in self.__definitions:
+                self.__define(attr)
 
-        # Add the usual stuff.
-        module.__file__ = self.__class__.__name__
-        if '.' not in fullname:
-            module.__package__ = None
-        else:
-            module.__package__ == fullname.rpartition('.')[0]
-            module.__path__ = []
+        try:
+            value = self.__namespace[attr]
+        except KeyError:
+            raise AttributeError("'module' object has no attribute '%s'" %
+                                 attr)
 
-        # Add the module to sys.modules.
-        sys.modules[fullname] = module
+        # Keep the attribute so the next access is a plain lookup.
+        setattr(self, attr, value)
 
-        # Return the lazy module.
-        return module
+        return value
 
 
-def load_lazy_import(skip=[], mod_path=[]):
-    """ Insert the lazy importer.
+def bind_lazily(name, definitions):
+    """ bind_lazily(name, definitions) -> Replace the module name in
+    sys.modules with a LazyBindings that defines the names in the
+    definitions dictionary when they are accessed.  Generated binding modules
+    call this at the end.
 
     """
 
-    # Make LazyImporter the default importer.
-    sys.meta_path.insert(0, LazyImporter(skip, mod_path))
-
-
-def unload_lazy_import():
-    """ Remove lazy importer.
-
-    """
+    import sys
 
-    # Remove LazyImporter from sys.meta_path.
-    [sys.meta_path.remove(i) for i in sys.meta_path if type(i) is LazyImporter]
+    sys.modules[name] = LazyBindings(sys.modules[name], definitions)
@@ -34,71 +34,286 @@ from os.path import isfile as os_isfile
 # If True errors will only print a message.
 IO_SOFT_ERRORS = True
 
+# How exactly seek lands on the position asked for.  A fast seek goes to
+# the nearest point before it the codec can get to cheaply (a page,
+# keyframe or seek point), and an exact one decodes to the frame.
+SEEK_PRECISIONS = ('fast', 'exact')
 
-def io_wrapper(func):
-    """ Wrap io methods.
+
+def _io_error(self, func_name, need_mode):
+    """ _io_error(self, func_name, need_mode) -> Raise the IOError for a call
+    that failed the closed or mode checks in io_wrapper.
 
     """
 
-    @functools_wraps(func)
-    def wrapper(self, *args):
-        """ Call the wrapped function.
+    class_name = self.__class__.__name__
 
-        """
+    if need_mode and need_mode not in self._mode:
+        if need_mode == 'r':
+            err_str = "(%s) Write-only stream.  Unable to read."
+        else:
+            err_str = "(%s) Read-only stream.  Unable to write."
+        raise IOError(err_str % class_name)
+
+    # Don't close the stream more than once.
+    if func_name == 'close': return None
+
+    # Don't operate on a closed stream.
+    raise IOError("(%s) Can't %s, stream is closed." % (class_name, func_name))
+
+
+def _soft_error(self, wrapper, func_name, err):
+    """ _soft_error(self, wrapper, func_name, err) -> Print err if
+    IO_SOFT_ERRORS is set otherwise re-raise it.  Returns an empty value of
+    the wrapped function's return type.
+
+    """
+
+    if not IO_SOFT_ERRORS:
+        raise err
+
+    # Only print the error message.
+    print("(%s.%s) %s" % (self.__class__.__name__, func_name, err))
+
+    # Always return the correct return type.
+    return _annotation(wrapper, 'return', int)(0)
 
-        class_name = self.__class__.__name__
-        func_name = func.__name__
-        func_annotations = getattr(func, '__annotations__', {})
 
-        # No Errors at the start.
-        err_str = ''
+def _annotation(wrapper, name, default):
+    """ _annotation(wrapper, name, default) -> Return the annotation name of
+    the wrapped function or default.
 
-        if self._closed:
-            # Don't close the stream more than once.
-            if func_name == 'close': return None
+    The annotations are assigned after the wrapper is created (i.e.
+    read.__annotations__ = {...}), so they are looked up when needed.
 
-            # Don't operate on a closed stream.
-            err_str = "({class_name}) Can't {func_name}, stream is closed."
+    """
+
+    return getattr(wrapper, '__annotations__', {}).get(name, default)
+
+
+def io_wrapper(func):
+    """ Wrap io methods.
+
+    Everything that depends on the function (its name, whether it reads or
+    writes, and the special handling of read and write) is worked out here
+    when the class is created, so each call only has to check that the
+    stream is open and in the right mode before calling func.  read and write
+    get wrappers with fixed signatures since they are called for every
+    buffer.
 
-        # Validate the mode and function.
-        if 'read' in func_name and 'r' not in self._mode:
-            err_str = "({class_name}) Write-only stream.  Unable to read."
-        elif 'write' in func_name and 'w' not in self._mode:
-            err_str = "({class_name}) Read-only stream.  Unable to write."
+    """
+
+    func_name = func.__name__
+
+    # The mode the stream has to be in to call func.  An empty string is in
+    # every mode.
+    if 'read' in func_name:
+        need_mode = 'r'
+    elif 'write' in func_name:
+        need_mode = 'w'
+    else:
+        need_mode = ''
+
+    if func_name == 'read':
+        @functools_wraps(func)
+        def wrapper(self, size=None):
+            """ Call the wrapped read function.
 
-        # Raise any errors detected.
-        if err_str:
-            raise IOError(err_str.format(**locals()))
+            """
+
+            if self._closed or need_mode not in self._mode:
+                return _io_error(self, func_name, need_mode)
 
-        if func_name == 'read':
             # No size was given or size is -1, so read until EOF.
-            if not args or args[1:] == -1:
+            if size is None or size < 0:
                 return self.readall()
-        elif func_name == 'write':
-            if not args:
-                # Don't even call the function if there is no data to write.
-                return func_annotations.get('return', int)(0)
-            elif not args[0]:
+
+            try:
+                return func(self, size)
+            except IOError as err:
+                return _soft_error(self, wrapper, func_name, err)
+    elif func_name == 'write':
+        @functools_wraps(func)
+        def wrapper(self, data=None):
+            """ Call the wrapped write function.
+
+            """
+
+            if self._closed or need_mode not in self._mode:
+                return _io_error(self, func_name, need_mode)
+
+            if not data:
+                if data is None:
+                    # Don't even call the function if there is no data to
+                    # write.
+                    return _annotation(wrapper, 'return', int)(0)
+
                 # Send the appropriate data type.
-                args = (func_annotations.get('data', bytes)(), )
+                data = _annotation(wrapper, 'data', bytes)()
 
-        # Finaly call the function and catch any IOErrors.
-        try:
-            return func(self, *args)
-        except IOError as err:
-            if IO_SOFT_ERRORS:
-                # Only print the error message.
-                print("(%s.%s) %s" % (class_name, func_name, err))
-            else:
-                # Re-raise the error.
-                raise
-
-            # Always return the correct return type.
-            return func_annotations.get('return', int)(0)
+            try:
+                return func(self, data)
+            except IOError as err:
+                return _soft_error(self, wrapper, func_name, err)
+    else:
+        @functools_wraps(func)
+        def wrapper(self, *args, **kwargs):
+            """ Call the wrapped function.
+
+            """
+
+            if self._closed or need_mode not in self._mode:
+                return _io_error(self, func_name, need_mode)
+
+            try:
+                return func(self, *args, **kwargs)
+            except IOError as err:
+                return _soft_error(self, wrapper, func_name, err)
 
     return wrapper
 
 
+def _sample_format(stream):
+    """ _sample_format(stream) -> Return the native numpy dtype of the samples
+    in stream and the size of a frame in bytes.
+
+    """
+
+    from .conversion_util import sample_dtype
+
+    floatp = getattr(stream, '_floatp', False)
+    three_byte = getattr(stream, 'three_byte',
+                         getattr(stream, '_three_byte', False))
+
+    dtype = sample_dtype(stream._depth, stream._unsigned, stream._bigendian,
+                         floatp, three_byte)
+
+    # Three byte samples are unpacked so they take less room in the stream
+    # than in memory.
+    sample_size = 3 if three_byte and not floatp else dtype.itemsize
+
+    return dtype, three_byte and not floatp, sample_size * stream._channels
+
+
+def _read_frames(stream, count, dtype=None, out=None):
+    """ _read_frames(stream, count, dtype=None, out=None) -> Read up to count
+    frames from stream into a (frames, channels) numpy array.
+
+    """
+
+    import numpy
+
+    from .conversion_util import convert_samples, unpack_three_byte
+
+    native_dtype, three_byte, frame_size = _sample_format(stream)
+    channels = stream._channels
+
+    if count is not None and count <= 0:
+        return numpy.empty((0, channels), dtype or native_dtype)
+
+    if out is not None:
+        if out.ndim != 2 or out.shape[1] != channels:
+            raise ValueError("(%s) out must have the shape (frames, %s)." %
+                             (stream.__class__.__name__, channels))
+        if not out.flags.c_contiguous:
+            raise ValueError("(%s) out must be C contiguous." %
+                             stream.__class__.__name__)
+        if dtype is not None and numpy.dtype(dtype) != out.dtype:
+            raise ValueError("(%s) out has dtype %s not %s." %
+                             (stream.__class__.__name__, out.dtype, dtype))
+        count = len(out) if count is None else min(count, len(out))
+        dtype = out.dtype
+    elif count is None:
+        raise ValueError("(%s) count is needed when out is not given." %
+                         stream.__class__.__name__)
+    else:
+        dtype = numpy.dtype(dtype) if dtype is not None else native_dtype
+        out = numpy.empty((count, channels), dtype)
+
+    # Read native samples straight into out, otherwise read them into a
+    # scratch buffer that is kept for the next call.
+    direct = dtype == native_dtype and not three_byte
+    if direct:
+        raw = out[:count].reshape(-1).view(numpy.uint8)
+    else:
+        if stream._frame_buffer is None or \
+                len(stream._frame_buffer) < count * frame_size:
+            stream._frame_buffer = numpy.empty(count * frame_size,
+                                               numpy.uint8)
+        raw = stream._frame_buffer[:count * frame_size]
+
+    # Start with the bytes of the frame the last read stopped in.
+    partial = stream._partial_frame
+    raw[:len(partial)] = numpy.frombuffer(partial, numpy.uint8)
+    size = len(partial)
+
+    while size < len(raw):
+        bytes_read = stream.readinto(raw[size:])
+        if not bytes_read:
+            break
+        size += bytes_read
+
+    # Keep the bytes that don't make a whole frame for the next call.
+    frames = size // frame_size
+    stream._partial_frame = raw[frames * frame_size:size].tobytes()
+    raw = raw[:frames * frame_size]
+
+    if direct:
+        return out[:frames]
+
+    if three_byte:
+        samples = unpack_three_byte(raw, stream._bigendian,
+                                    stream._unsigned)
+    else:
+        samples = raw.view(native_dtype)
+
+    convert_samples(samples.reshape(frames, channels), stream._depth,
+                    stream._unsigned, dtype, out[:frames])
+
+    return out[:frames]
+
+
+def _write_frames(stream, frames):
+    """ _write_frames(stream, frames) -> Convert the (frames, channels) numpy
+    array frames to the format of stream, write them, and return the number
+    of frames written.
+
+    """
+
+    import numpy
+
+    from .conversion_util import convert_samples, pack_three_byte
+
+    frames = numpy.asarray(frames)
+    if frames.ndim == 1 and stream._channels == 1:
+        frames = frames.reshape(-1, 1)
+
+    if frames.ndim != 2 or frames.shape[1] != stream._channels:
+        raise ValueError("(%s) frames must have the shape (frames, %s)." %
+                         (stream.__class__.__name__, stream._channels))
+
+    native_dtype, three_byte, _ = _sample_format(stream)
+
+    if frames.dtype.kind == 'f':
+        depth = 32
+    else:
+        depth = frames.dtype.itemsize * 8
+
+    if three_byte:
+        samples = convert_samples(frames, depth, frames.dtype.kind == 'u',
+                                  native_dtype, out_depth=stream._depth)
+        data = pack_three_byte(samples, stream._bigendian)
+    elif frames.dtype != native_dtype:
+        data = convert_samples(frames, depth, frames.dtype.kind == 'u',
+                               native_dtype)
+    else:
+        data = frames
+
+    stream.write(numpy.ascontiguousarray(data).tobytes())
+
+    return len(frames)
+
+
 class AudioIO(RawIOBase):
     """ File like access for audio files.
 
@@ -147,6 +362,9 @@ class AudioIO(RawIOBase):
         self._channels = channels
         self._floatp = False
 
+        # The names of the channels in order, or None for the usual order.
+        self._layout = None
+
         self._width = self._depth // 8
 
         self._length = 1
@@ -157,6 +375,11 @@ class AudioIO(RawIOBase):
         self._loops = -1
         self._loop_count = 0
 
+        # The bytes of a frame that read_frames could not finish, and the
+        # buffer it converts samples from.
+        self._partial_frame = b''
+        self._frame_buffer = None
+
         self._closed = True
 
         # The default name is the filename minus the extension.
@@ -289,17 +512,31 @@ class AudioIO(RawIOBase):
         return self._length >= 0
 
     @io_wrapper
-    def seek(self, offset, whence=SEEK_SET):
-        """ seek(offset, whence) -> Seek to position in mod.
+    def seek(self, offset, whence=SEEK_SET, precision='exact'):
+        """ seek(offset, whence=SEEK_SET, precision='exact') -> Seek to the
+        frame offset and return the new position.  With precision 'fast'
+        the position can be before offset, wherever the codec could get to
+        quickly.
 
         """
 
+        if precision not in SEEK_PRECISIONS:
+            raise ValueError("(%s) Seek precision has to be one of %s." %
+                             (self.__class__.__name__, SEEK_PRECISIONS))
+
         if whence == SEEK_CUR:
-            self.position += offset
+            position = self.position + offset
         elif whence == SEEK_END:
-            self.position = self._length - offset
+            position = self._length - offset
+        else:
+            position = offset
+
+        if precision == 'fast':
+            # A partly read frame is from the old position.
+            self._partial_frame = b''
+            self._set_position_fast(int(position))
         else:
-            self.position = offset
+            self.position = position
 
         return self.position
 
@@ -357,15 +594,39 @@ class AudioIO(RawIOBase):
 
         bytes_read = len(data)
 
-        # Convert string data to bytes
-        if type(data) is str: data = data.encode()
+        # Convert string data to bytes (str is bytes in python 2).
+        if type(data) is str and str is not bytes: data = data.encode()
 
         # Set barray to data.
-        barray[:bytes_read] = data
+        barray[:bytes_read] = memoryview(data)
 
         # Return the number of bytes read
         return bytes_read
 
+    @io_wrapper
+    def read_frames(self, count=None, dtype=None, out=None):
+        """ read_frames(count=None, dtype=None, out=None) -> Read up to count
+        whole frames and return them as a (frames, channels) numpy array of
+        dtype, or the native sample type.  Integer samples are scaled to the
+        size of dtype and float samples are between -1.0 and 1.0.  If out is
+        given the frames are read into it and a view of it is returned.
+
+        """
+
+        return _read_frames(self, count, dtype, out)
+
+    def _read_with_readinto(self, size):
+        """ _read_with_readinto(size) -> Read size bytes with readinto and
+        return them.  Codecs that decode straight into the callers buffer
+        implement readinto and use this for read.
+
+        """
+
+        data = bytearray(size)
+
+        # Only copy the bytes that were read.
+        return memoryview(data)[:self.readinto(data) or 0].tobytes()
+
     @io_wrapper
     def readline(self, size=-1):
         """ readline(size=-1) -> Returns the next line or size bytes.
@@ -387,6 +648,16 @@ class AudioIO(RawIOBase):
 
         raise NotImplementedError("Write method not implemented.")
 
+    @io_wrapper
+    def write_frames(self, frames):
+        """ write_frames(frames) -> Write the (frames, channels) numpy array
+        frames, converting the samples to the stream format, and return the
+        number of frames written.
+
+        """
+
+        return _write_frames(self, frames)
+
     @property
     def closed(self):
         """ Return true if closed.
@@ -424,6 +695,15 @@ class AudioIO(RawIOBase):
 
         return 0
 
+    def _set_position_fast(self, position):
+        """ Change the position of playback to position or the nearest
+        point before it that is quick to get to.  Codecs that can seek
+        roughly faster than exactly override this.
+
+        """
+
+        self._set_position(position)
+
     @property
     def loops(self):
         """ How many times the file should loop.
@@ -458,6 +738,9 @@ class AudioIO(RawIOBase):
 
         """
 
+        # A partly read frame is from the old position.
+        self._partial_frame = b''
+
         self._set_position(int(position))
 
     @property
@@ -516,6 +799,15 @@ class AudioIO(RawIOBase):
 
         return self._channels
 
+    @property
+    def layout(self):
+        """ The channel names in order, or None if they are in the order in
+        conversion_util.CHANNEL_LAYOUTS.
+
+        """
+
+        return self._layout
+
     @property
     def buffer_size(self):
         """ Get the current buffer size.
@@ -580,6 +872,7 @@ class DevIO(RawIOBase):
         self._channels = channels
         self._bigendian = bigendian
         self._unsigned = unsigned
+        self._floatp = False
 
         if not buffer_size:
             # Set buffer_size to a sane default.
@@ -589,6 +882,11 @@ class DevIO(RawIOBase):
 
         self._latency = latency
 
+        # The bytes of a frame that read_frames could not finish, and the
+        # buffer it converts samples from.
+        self._partial_frame = b''
+        self._frame_buffer = None
+
         self._closed = True
 
     def __repr__(self):
@@ -705,11 +1003,23 @@ class DevIO(RawIOBase):
         bytes_read = len(data)
 
         # Set barray to data.
-        barray[:bytes_read] = data
+        barray[:bytes_read] = memoryview(data)
 
         # Return the number of bytes read
         return bytes_read
 
+    @io_wrapper
+    def read_frames(self, count=None, dtype=None, out=None):
+        """ read_frames(count=None, dtype=None, out=None) -> Read up to count
+        whole frames and return them as a (frames, channels) numpy array of
+        dtype, or the native sample type.  Integer samples are scaled to the
+        size of dtype and float samples are between -1.0 and 1.0.  If out is
+        given the frames are read into it and a view of it is returned.
+
+        """
+
+        return _read_frames(self, count, dtype, out)
+
     @io_wrapper
     def write(self, data):
         """ write(data) -> Write to the pcm device.
@@ -718,6 +1028,16 @@ class DevIO(RawIOBase):
 
         raise NotImplementedError("Write method not implemented.")
 
+    @io_wrapper
+    def write_frames(self, frames):
+        """ write_frames(frames) -> Write the (frames, channels) numpy array
+        frames, converting the samples to the stream format, and return the
+        number of frames written.
+
+        """
+
+        return _write_frames(self, frames)
+
     @property
     def mode(self):
         """ Get the mode.
@@ -742,6 +1062,14 @@ class DevIO(RawIOBase):
 
         return self._unsigned
 
+    @property
+    def floatp(self):
+        """ Whether the device takes floating point data.
+
+        """
+
+        return self._floatp
+
     @property
     def rate(self):
         """ The sample current sample rate.
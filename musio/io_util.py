@@ -21,6 +21,9 @@
 
 """ get_codec       Function for loading the default/first filetype codecs
     get_io       Function for loading the default/first device
+    sniff_format    Guess the format of a file from its first bytes
+    find_library    Cached ctypes.util.find_library
+    refresh         Forget cached libraries and codecs
 
 """
 
@@ -33,18 +36,70 @@ from os import listdir as os_listdir
 from os.path import isdir as os_isdir
 from os.path import abspath as os_abspath
 from os.path import dirname as os_dirname
-from ctypes.util import find_library as ctypes_find_library
-
-try:
-    from .magic import magic as _magic
-except OSError:
-    _magic = None
+from ctypes import sizeof as ctypes_sizeof
+from ctypes import memset as ctypes_memset
+from ctypes import c_char, c_void_p
 
 from .io_base import AudioIO, DevIO
+from .import_util import LazyImport
+
+# libmagic is only loaded when a Magic object is made.
+_magic = LazyImport('magic.magic', globals(), locals(), ['magic'], 1)
 
 # Codec cache dictionary
 __codec_cache = {}
 
+# Codec registry entries by module path
+__codec_registry = {}
+
+# Sniffed formats by path
+__format_cache = {}
+
+# How much of a file to read to sniff its format
+_SNIFF_SIZE = 4096
+
+# The extension of each format and the (offset, bytes) that must all match.
+# An offset of None matches anywhere in the header.
+_MAGIC_NUMBERS = (
+    ('.wav', ((0, b'RIFF'), (8, b'WAVE'))),
+    ('.flac', ((0, b'fLaC'), )),
+    ('.ogg', ((0, b'OggS'), (None, b'\x01vorbis'))),
+    ('.mp3', ((0, b'ID3'), )),
+    ('.m4a', ((4, b'ftyp'), )),
+    ('.mp4', ((4, b'ftyp'), )),
+    ('.mid', ((0, b'MThd'), )),
+    ('.it', ((0, b'IMPM'), )),
+    ('.xm', ((0, b'Extended Module:'), )),
+    ('.s3m', ((44, b'SCRM'), )),
+    ('.mod', ((1080, b'M.K.'), )),
+    ('.mod', ((1080, b'M!K!'), )),
+    ('.mod', ((1080, b'FLT4'), )),
+    ('.mod', ((1080, b'4CHN'), )),
+    ('.mod', ((1080, b'6CHN'), )),
+    ('.mod', ((1080, b'8CHN'), )),
+    ('.nsf', ((0, b'NESM\x1a'), )),
+    ('.nsfe', ((0, b'NSFE'), )),
+    ('.spc', ((0, b'SNES-SPC700'), )),
+    ('.gbs', ((0, b'GBS'), )),
+    ('.vgm', ((0, b'Vgm '), )),
+    ('.gym', ((0, b'GYMX'), )),
+    ('.hes', ((0, b'HESM'), )),
+    ('.kss', ((0, b'KSCC'), )),
+    ('.kss', ((0, b'KSSX'), )),
+    ('.ay', ((0, b'ZXAYEMUL'), )),
+    ('.sap', ((0, b'SAP\r\n'), )),
+    ('.wma', ((0, b'\x30\x26\xb2\x75\x8e\x66\xcf\x11'), )),
+    ('.flv', ((0, b'FLV'), )),
+    ('.webm', ((0, b'\x1a\x45\xdf\xa3'), )),
+    ('.avi', ((0, b'RIFF'), (8, b'AVI '))),
+)
+
+# Native library sonames by name
+__library_cache = {}
+
+# The libraries listed by 'ldconfig -p'
+__ldconfig_libraries = None
+
 # Audio IO device cache dictionary
 __io_cache = {}
 
@@ -71,6 +126,28 @@ def slice_buffer(data, size):
         yield data[i:i + size]
 
 
+def c_array_from(c_type, buf, offset=0):
+    """ c_array_from(c_type, buf, offset=0) -> Return a ctypes array of c_type
+    that shares the memory of the writable buffer buf from offset to the end,
+    so a C function can write straight into buf.
+
+    """
+
+    count = (len(buf) - offset) // ctypes_sizeof(c_type)
+
+    return (c_type * count).from_buffer(buf, offset)
+
+
+def zero_fill(buf, offset=0):
+    """ zero_fill(buf, offset=0) -> Set the bytes in the writable buffer buf
+    from offset to the end to zero.
+
+    """
+
+    if len(buf) > offset:
+        ctypes_memset(c_array_from(c_char, buf, offset), 0, len(buf) - offset)
+
+
 def _build_mod_list(mod_path, suffix, blacklist):
     """ _build_mod_list(mod_path, suffix) -> Add all the paths in mod_path to
     sys.path and return a list of all modules in sys.path ending in suffix.
@@ -105,6 +182,133 @@ def _build_mod_list(mod_path, suffix, blacklist):
     return mod_list
 
 
+def _ld_cache_key():
+    """ _ld_cache_key() -> Return what the saved library paths depend on,
+    the mtime of the ld cache and LD_LIBRARY_PATH.
+
+    """
+
+    from os import environ
+    from os.path import getmtime as os_getmtime
+
+    try:
+        mtime = os_getmtime('/etc/ld.so.cache')
+    except OSError:
+        mtime = 0
+
+    return [mtime, environ.get('LD_LIBRARY_PATH', '')]
+
+
+def _ldconfig_libraries():
+    """ _ldconfig_libraries() -> Run 'ldconfig -p' once and return a
+    dictionary of the sonames of all the libraries for this architecture by
+    their names without the 'lib' prefix.
+
+    """
+
+    import re
+    from os import devnull, environ, uname
+    from subprocess import Popen, PIPE
+
+    # Only use libraries for the word size of this python like
+    # ctypes.util.find_library.
+    machine = '%s-%s' % (uname()[4], ctypes_sizeof(c_void_p) * 8)
+    abi_type = {
+        'x86_64-64': 'libc6,x86-64',
+        'ppc64-64': 'libc6,64bit',
+        'sparc64-64': 'libc6,64bit',
+        's390x-64': 'libc6,64bit',
+        'ia64-64': 'libc6,IA-64',
+    }.get(machine, 'libc6')
+
+    env = dict(environ)
+    env['LC_ALL'] = 'C'
+    env['LANG'] = 'C'
+
+    data = b''
+    for ldconfig in ('/sbin/ldconfig', 'ldconfig'):
+        try:
+            with open(devnull, 'wb') as null:
+                proc = Popen([ldconfig, '-p'], stdout=PIPE, stderr=null,
+                             env=env)
+                data = proc.communicate()[0]
+            break
+        except OSError:
+            continue
+
+    # Lines look like 'libz.so.1 (libc6,x86-64) => /lib/libz.so.1'.
+    expr = re.compile(r'^\s+(lib(\S+?)\.so\S*)\s+\(([^)]*)\)', re.M)
+
+    libraries = {}
+    for soname, name, abi in expr.findall(data.decode('utf8', 'replace')):
+        # The first one listed is the one find_library would use.
+        if abi.startswith(abi_type) and name not in libraries:
+            libraries[name] = soname
+
+    return libraries
+
+
+def find_library(name):
+    """ find_library(name) -> Return the soname of the native library name
+    like ctypes.util.find_library, or None if it is not installed.
+
+    Results are kept for the life of the process and saved in the cache
+    until the ld cache or LD_LIBRARY_PATH changes.  All the libraries known
+    to the ld cache are found with one 'ldconfig -p' call and only the
+    others are looked up with ctypes.util.find_library.
+
+    """
+
+    global __library_cache
+
+    if name in __library_cache:
+        return __library_cache[name]
+
+    if not __library_cache:
+        # Load the saved libraries if the ld cache hasn't changed.
+        saved = _load_cache('libraries.json')
+        if saved.get('key') == _ld_cache_key():
+            __library_cache.update(saved.get('libraries', {}))
+            if name in __library_cache:
+                return __library_cache[name]
+
+    global __ldconfig_libraries
+
+    if __ldconfig_libraries is None:
+        __ldconfig_libraries = _ldconfig_libraries()
+
+    soname = __ldconfig_libraries.get(name, None)
+    if not soname:
+        # ctypes.util is slow to import so only import it when needed.
+        from ctypes.util import find_library as ctypes_find_library
+
+        soname = ctypes_find_library(name)
+
+    # Remember missing libraries too, they are the slowest to look up.
+    __library_cache[name] = soname
+    _save_cache('libraries.json', {'key': _ld_cache_key(),
+                                   'libraries': __library_cache})
+
+    return soname
+
+
+def refresh():
+    """ refresh() -> Forget the saved native libraries and codec registry so
+    newly installed libraries and codecs are found.
+
+    """
+
+    global __ldconfig_libraries
+
+    __library_cache.clear()
+    __ldconfig_libraries = None
+    __codec_registry.clear()
+    __codec_cache.clear()
+
+    _save_cache('libraries.json', {})
+    _save_cache('codecs.json', {})
+
+
 def _check_dependencies(dependencies):
     """ Returns True if all the dependencies pass.
 
@@ -114,7 +318,7 @@ def _check_dependencies(dependencies):
     for key, value in dependencies.items():
         if key == 'ctypes':
             # Check for c libraries.
-            if not all((ctypes_find_library(lib) for lib in value)):
+            if not all((find_library(lib) for lib in value)):
                 return False
         elif key == 'python':
             # Check for python modules.
@@ -127,114 +331,361 @@ def _check_dependencies(dependencies):
     return True
 
 
-def get_codec(filename, mod_path=[], cached=True,
-              blacklist=[]):
-    """ get_codec(filename, mod_path=[], cached=True, blacklist=[]) -> Load the
-    codecs in the path and return the first one that can play the file, or the
-    one with the default attribute set.
+def _cache_path(name):
+    """ _cache_path(name) -> Return the path of the cache file name in the
+    musio cache directory, creating the directory if needed.
 
-        filename        The file the codec needs to handle
-        mod_path        Additional search paths for modules
-        cached          Use cached codecs if available
-        blacklist       Modules not to load
+    """
+
+    from os import environ, makedirs
+    from os.path import expanduser as os_expanduser
+
+    cache_home = environ.get('XDG_CACHE_HOME',
+                             os_join(os_expanduser('~'), '.cache'))
+    cache_dir = os_join(cache_home, 'musio')
+
+    if not os_isdir(cache_dir):
+        try:
+            makedirs(cache_dir)
+        except OSError as err:
+            msg_out("Unable to create cache directory %s: %s" % (cache_dir,
+                                                                 err))
+
+    return os_join(cache_dir, name)
+
+
+def _load_cache(name):
+    """ _load_cache(name) -> Return the dictionary saved in the cache file
+    name, or an empty one if it can't be read.
 
     """
 
-    # Codec cache dictionary
-    global __codec_cache
+    import json
 
-    from urlparse import urlparse
+    try:
+        with open(_cache_path(name), 'r') as cache_file:
+            return json.load(cache_file)
+    except (IOError, OSError, ValueError) as err:
+        msg_out("Unable to load cache %s: %s" % (name, err))
+        return {}
 
-    from .import_util import load_lazy_import, unload_lazy_import
 
-    # Get the file extension.
-    file_ext = os_splitext(filename)[1].lower()
+def _save_cache(name, data):
+    """ _save_cache(name, data) -> Save the dictionary data in the cache file
+    name.  The file is replaced in one step so other processes never read a
+    partly written cache.
 
-    # Get protocol.
-    file_prot = urlparse(filename).scheme
+    """
 
-    if cached:
-        # Load and already cached codec.
-        if file_ext in __codec_cache:
-            return __codec_cache[file_ext]
-        elif file_prot in __codec_cache:
-            return __codec_cache[file_prot]
+    import json
+    from os import getpid, rename
 
-    # Get a list of modules ending in '_file.py'
-    mod_list = _build_mod_list(mod_path, '_file.py', blacklist)
+    path = _cache_path(name)
+    temp_path = '%s.%s' % (path, getpid())
 
-    codec = None
-    dummy = None
+    try:
+        with open(temp_path, 'w') as cache_file:
+            json.dump(data, cache_file)
+        rename(temp_path, path)
+    except (IOError, OSError) as err:
+        msg_out("Unable to save cache %s: %s" % (name, err))
+
+
+def _touch_cache(name):
+    """ _touch_cache(name) -> Mark the cache file name as just used so
+    _prune_cache keeps it longer.
+
+    """
+
+    from os import utime
+
+    try:
+        utime(_cache_path(name), None)
+    except (IOError, OSError):
+        pass
 
-    # Make importing lazy.
-    # load_lazy_import(mod_path=mod_path)
+
+def _prune_cache(prefix, keep):
+    """ _prune_cache(prefix, keep) -> Remove all but the keep most recently
+    used cache files whose names start with prefix.
+
+    """
+
+    from os import remove, stat
+
+    cache_dir = os_dirname(_cache_path(prefix))
+
+    try:
+        names = [name for name in os_listdir(cache_dir)
+                 if name.startswith(prefix) and name.endswith('.json')]
+    except (IOError, OSError):
+        return
+
+    if len(names) <= keep:
+        return
+
+    used = []
+    for name in names:
+        path = os_join(cache_dir, name)
+        try:
+            used.append((stat(path).st_mtime, path))
+        except (IOError, OSError):
+            pass
+
+    used.sort(reverse=True)
+    for _, path in used[keep:]:
+        try:
+            remove(path)
+        except (IOError, OSError) as err:
+            msg_out("Unable to remove cache %s: %s" % (path, err))
+
+
+def _registry_entry(path, name):
+    """ _registry_entry(path, name) -> Import the module name from the
+    directory path and return the codec registry entry for its
+    __supported_dict, or None if it can't be imported or has no handler.
+
+    """
+
+    module = _import_mod(path, name)
+    if not module:
+        return None
+
+    supported_dict = getattr(module, '__supported_dict', {})
+
+    # Don't even register this module if it does not have a handler.
+    handler = supported_dict.get('handler', 'dummy')
+    if not getattr(module, handler, None):
+        return None
+
+    # Functions can't be saved so only remember that there is one.
+    return {
+        'path': path,
+        'name': name,
+        'handler': handler,
+        'ext': supported_dict.get('ext', []),
+        'protocol': supported_dict.get('protocol', []),
+        'default': supported_dict.get('default', False),
+        'dependencies': supported_dict.get('dependencies', {}),
+        'issupported': 'issupported' in supported_dict,
+    }
+
+
+def _import_mod(path, name):
+    """ _import_mod(path, name) -> Import and return the module name (a file
+    name) from the package in the directory path, or None on errors.
+
+    """
+
+    # Get the package name from path.
+    pkgname = str(os_basename(path.rstrip('/')))
 
     # This packages name.
     this_pkgname = __name__.split('.', 1)[0]
 
-    # Load the codec module that can handle file.
-    for path, name in mod_list:
-        # Get the package name from path.
-        pkgname = os_basename(path.rstrip('/'))
+    # Import the package if it is different from this one.
+    if pkgname != this_pkgname and pkgname:
+        try:
+            __import__(pkgname)
+        except ImportError as err:
+            return None
 
-        # Import the package if it is different from this one.
-        if pkgname != this_pkgname and pkgname:
-            try:
-                __import__(pkgname)
-            except ImportError as err:
-                continue
+    # Load the module.
+    try:
+        return import_module('.%s' % str(os_splitext(name)[0]), pkgname)
+    except ImportError as err:
+        print("Skipping module: (%s) because of error: %s" % (name, err))
+        return None
 
-        # Load the module.
+
+def _codec_registry(mod_path=[]):
+    """ _codec_registry(mod_path=[]) -> Return the registry entries of all
+    the codec modules in mod_path and sys.path.
+
+    The entries are kept for the life of the process and saved in the cache
+    so modules are only imported to build an entry when they are new or
+    their mtime has changed.
+
+    """
+
+    global __codec_registry
+
+    key = tuple(mod_path)
+    if key in __codec_registry:
+        return __codec_registry[key]
+
+    from os.path import getmtime as os_getmtime
+
+    saved = _load_cache('codecs.json')
+    changed = False
+
+    registry = []
+    for path, name in _build_mod_list(list(mod_path), '_file.py', []):
+        filename = os_join(path, name)
         try:
-            module = import_module('.%s' % os_splitext(name)[0], pkgname)
-        except ImportError as err:
-            print("Skipping module: (%s) because of error: %s" % (name, err))
+            mtime = os_getmtime(filename)
+        except OSError:
             continue
 
-        # Get the filetypes and handler from module.
-        supported_dict = getattr(module, '__supported_dict', {})
+        entry = saved.get(filename)
+        if not entry or entry.get('mtime') != mtime:
+            entry = _registry_entry(path, name)
+            if not entry:
+                continue
 
-        # Get the handler.
-        handler = getattr(module, supported_dict.get('handler', 'dummy'), None)
+            entry['mtime'] = mtime
+            saved[filename] = entry
+            changed = True
 
-        # Don't even check this module if it does not have a handler.
-        if not handler:
+        registry.append(entry)
+
+    if changed:
+        _save_cache('codecs.json', saved)
+
+    __codec_registry[key] = registry
+
+    return registry
+
+
+def _load_handler(entry):
+    """ _load_handler(entry) -> Import the module of the registry entry and
+    return its handler, or None.
+
+    """
+
+    module = _import_mod(entry['path'], entry['name'])
+
+    return getattr(module, str(entry['handler']), None) if module else None
+
+
+def _blacklist_names(blacklist):
+    """ _blacklist_names(blacklist) -> Return the set of codec module file
+    names in blacklist, which can have names with or without the '_file.py'
+    suffix.
+
+    """
+
+    blacklist = [blacklist] if type(blacklist) is str else blacklist
+
+    # Add the suffix to all names in blacklist.
+    blacklist_names = set()
+    for name in blacklist:
+        # Compiled modules are blacklisted by their source file.
+        name = name[:-1] if name.endswith('.pyc') else name
+        if name.endswith('_file'):
+            name += '.py'
+        elif not name.endswith('.py'):
+            name += '_file.py'
+        blacklist_names.add(name)
+
+    return blacklist_names
+
+
+def _codec_candidates(filename, file_ext, file_prot, mod_path=[],
+                      blacklist_names=(), exact=False):
+    """ _codec_candidates(filename, file_ext, file_prot, mod_path=[],
+    blacklist_names=(), exact=False) -> Return the registry entries of the
+    codecs that can handle file_ext or file_prot, best first.  Default codecs
+    come first, then the others last found first, then the '.*' codec and the
+    dummy codec.  If exact is True only codecs for file_ext are returned.
+
+    """
+
+    defaults = []
+    matches = []
+    wildcard = None
+    dummy = None
+
+    for entry in _codec_registry(mod_path):
+        if entry['name'] in blacklist_names:
             continue
 
         # Try not to use the dummy handler.
-        if 'dummy' in name:
-            dummy = handler
+        if 'dummy' in entry['name']:
+            dummy = entry
             continue
 
         # Check the module dependencies.
-        dependencies = supported_dict.get('dependencies', {})
-        if not _check_dependencies(dependencies):
+        if not _check_dependencies(entry['dependencies']):
             continue
 
-        issupported = supported_dict.get('issupported', lambda *a: False)
-        ext = supported_dict.get('ext', [])
-        protocol = supported_dict.get('protocol', [])
+        if exact:
+            supported = file_ext in entry['ext']
+        else:
+            supported = file_ext in entry['ext'] or \
+                file_prot in entry['protocol']
 
-        default = supported_dict.get('default', False)
+        if not (supported or exact) and entry['issupported']:
+            # Only modules with an issupported function have to be imported
+            # to check.
+            module = _import_mod(entry['path'], entry['name'])
+            supported_dict = getattr(module, '__supported_dict', {})
+            issupported = supported_dict.get('issupported', lambda *a: False)
+            supported = issupported(filename)
 
-        # Add filetype handlers to the codec cache.
-        __codec_cache.update(((key, handler) for key in ext))
+        # Check if filename is supported.
+        if supported:
+            if entry['default']:
+                defaults.append(entry)
+            else:
+                matches.append(entry)
+        elif not (defaults or matches or wildcard) and '.*' in entry['ext']:
+            wildcard = entry
 
-        # Add protocol handlers to the codec cache.
-        __codec_cache.update(((key, handler) for key in protocol))
+    candidates = defaults + matches[::-1]
 
-        # Check if filename is supported.
-        if issupported(filename) or file_ext in ext or file_prot in protocol:
-            codec = handler
-            if default: break
-        elif not codec and '.*' in ext:
-            codec = handler
+    if not exact:
+        # Fall back to the '.*' codec, then the dummy codec.
+        candidates.extend(entry for entry in (wildcard, dummy) if entry)
 
-    # Turn off lazy imports.
-    # unload_lazy_import()
+    return candidates
 
-    # No codec was found so default to the dummy codec.
-    if not codec: codec = dummy
+
+def get_codec(filename, mod_path=[], cached=True,
+              blacklist=[]):
+    """ get_codec(filename, mod_path=[], cached=True, blacklist=[]) -> Load the
+    codecs in the path and return the first one that can play the file, or the
+    one with the default attribute set.
+
+        filename        The file the codec needs to handle
+        mod_path        Additional search paths for modules
+        cached          Use cached codecs if available
+        blacklist       Modules not to load
+
+    Codecs are chosen from the codec registry so only the chosen module (and
+    modules with an issupported function) are imported.
+
+    """
+
+    # Codec cache dictionary
+    global __codec_cache
+
+    from urlparse import urlparse
+
+    # Get the file extension.
+    file_ext = os_splitext(filename)[1].lower()
+
+    # Get protocol.
+    file_prot = urlparse(filename).scheme
+
+    if cached:
+        # Load and already cached codec.
+        if file_ext in __codec_cache:
+            return __codec_cache[file_ext]
+        elif file_prot in __codec_cache:
+            return __codec_cache[file_prot]
+
+    candidates = _codec_candidates(filename, file_ext, file_prot, mod_path,
+                                   _blacklist_names(blacklist))
+
+    codec = None
+    for entry in candidates:
+        codec = _load_handler(entry)
+        if codec:
+            # Add the filetype and protocol handlers to the codec cache.
+            __codec_cache.update(((key, codec) for key in entry['ext']))
+            __codec_cache.update(((key, codec) for key in entry['protocol']))
+            break
 
     return codec
 
@@ -249,8 +700,6 @@ def get_io(fileobj, mod_path=[], cached=True,
     # IO device cache dictionary
     global __io_cache
 
-    from .import_util import load_lazy_import, unload_lazy_import
-
     # Get the file input data type.
     annotations = getattr(getattr(fileobj, 'read'), '__annotations__', {})
     file_input = annotations.get('return', unicode)
@@ -272,9 +721,6 @@ def get_io(fileobj, mod_path=[], cached=True,
     device = None
     dummy = None
 
-    # Make importing lazy.
-    # load_lazy_import(mod_path=mod_path)
-
     # This packages name.
     this_pkgname = __name__.split('.', 1)[0]
 
@@ -330,45 +776,126 @@ def get_io(fileobj, mod_path=[], cached=True,
             device = handler
             if default: break
 
-    # Turn off lazy imports.
-    # unload_lazy_import()
-
     # No device was found so use the dummy_io.
     if not device: device = dummy
 
     return device
 
 
+def _sniff_header(header):
+    """ _sniff_header(header) -> Return the extensions of the formats the
+    bytes at the start of a file look like, most likely first.
+
+    """
+
+    extensions = []
+
+    for ext, magic_list in _MAGIC_NUMBERS:
+        for offset, magic in magic_list:
+            if offset is None:
+                # It can be anywhere in the header.
+                if magic not in header:
+                    break
+            elif header[offset:offset + len(magic)] != magic:
+                break
+        else:
+            extensions.append(ext)
+
+    # MPEG audio frames start with 11 set sync bits.
+    sync = bytearray(header[:2])
+    if len(sync) == 2 and sync[0] == 0xFF and (sync[1] & 0xE0) == 0xE0:
+        if (sync[1] & 0xF6) == 0xF0:
+            # Layer 0 is an ADTS AAC header.
+            extensions.append('.aac')
+        elif sync[1] & 0x06:
+            extensions.append('.mp3')
+
+    return extensions
+
+
+def sniff_format(filename):
+    """ sniff_format(filename) -> Return the extensions of the formats the
+    file looks like from the magic bytes at its start, most likely first.
+    Results are cached by path and mtime.
+
+    """
+
+    from os.path import getmtime as os_getmtime
+
+    try:
+        mtime = os_getmtime(filename)
+    except (OSError, TypeError, ValueError):
+        # Not a local file.
+        return []
+
+    cached = __format_cache.get(filename)
+    if cached and cached[0] == mtime:
+        return list(cached[1])
+
+    try:
+        with open(filename, 'rb') as in_file:
+            header = in_file.read(_SNIFF_SIZE)
+    except (IOError, OSError):
+        return []
+
+    extensions = _sniff_header(header)
+    __format_cache[filename] = (mtime, extensions)
+
+    return list(extensions)
+
+
 def open_file(filename, mode='r', mod_path=[],
               **kwargs):
     """ open_file(filename, mode='r') -> Returns the open file.
 
+    When reading, the codecs for the format sniffed from the start of the
+    file are tried first, then the codecs for its extension, so a misnamed
+    file doesn't have to fail in the wrong codecs first.
+
     """
 
+    from urlparse import urlparse
+
     blacklist = kwargs.get('blacklist', [])
+    blacklist_names = _blacklist_names(blacklist)
 
-    open_codec = None
+    file_ext = os_splitext(filename)[1].lower()
+    file_prot = urlparse(filename).scheme
 
-    # Loop until a codec is found that can open the file.
-    while not open_codec:
-        codec = get_codec(filename, mod_path=mod_path, blacklist=blacklist,
-                          cached=False)
+    # Rank the codecs before constructing any of them.
+    candidates = []
+    if 'r' in mode:
+        for ext in sniff_format(filename):
+            candidates.extend(_codec_candidates(filename, ext, '', mod_path,
+                                                blacklist_names, exact=True))
+    candidates.extend(_codec_candidates(filename, file_ext, file_prot,
+                                        mod_path, blacklist_names))
+
+    return_err = None
+    tried = set()
+
+    # Use the first codec that can open the file.
+    for entry in candidates:
+        if entry['name'] in tried:
+            continue
+        tried.add(entry['name'])
+
+        codec = _load_handler(entry)
         if not codec:
-            raise IOError("Error opening codec %s." % codec)
+            continue
 
         try:
             open_codec = codec(filename, mode=mode, **kwargs)
             open_codec.loops = kwargs.get('loops', -1)
+            return open_codec
         except IOError as err:
             return_err = err
             print('Blacklisting (%s) because of error: %s' % (codec, err))
 
-            mod_name = '%s.py' % codec.__module__.split('.')[-1]
-
             # Add the module to the blacklist.
-            blacklist.append(mod_name)
+            blacklist.append(entry['name'])
 
-    return open_codec
+    raise IOError("Error opening %s: %s" % (filename, return_err))
 
 
 def open_device(fileobj, mode='w', mod_path=[],
@@ -498,10 +1025,15 @@ class Magic(object):
 
         """
 
-        if not _magic:
+        self._magic = None
+
+        try:
+            magic_open = _magic.magic_open
+        except OSError:
+            # libmagic is not installed.
             return None
 
-        self._magic = _magic.magic_open(flags)
+        self._magic = magic_open(flags)
         if _magic.magic_load(self._magic, None) != 0:
             print("Error: %s" % _magic.magic_error(self._magic).decode())
 
@@ -510,7 +1042,7 @@ class Magic(object):
 
         """
 
-        if not _magic:
+        if not self._magic:
             return b'utf8'
 
         return _magic.magic_buffer(self._magic, data, len(data))
@@ -1,7 +1,8 @@
 from ctypes import *
+from ..import_util import LazyLibraries as _LazyLibraries
+from ..import_util import bind_lazily as _bind_lazily
 
-_libraries = {}
-_libraries['/usr/lib/libmp3lame.so'] = CDLL('/usr/lib/libmp3lame.so')
+_libraries = _LazyLibraries()
 STRING = c_char_p
 
 
@@ -42,17 +43,8 @@ def __attribute_format_strfmon__(a,b): return __attribute__ ((__format__ (__strf
 def va_arg(v,l): return __builtin_va_arg(v,l) # macro
 # __SYSCALL_SLONG_TYPE = __SLONGWORD_TYPE # alias
 def __REDIRECT_NTH_LDBL(name,proto,alias): return __REDIRECT_NTH (name, proto, alias) # macro
-def putc(_ch,_fp): return _IO_putc (_ch, _fp) # macro
 def __REDIRECT_LDBL(name,proto,alias): return __REDIRECT (name, proto, alias) # macro
 LAME_INTERNALERROR = -13
-class _IO_FILE(Structure):
-    pass
-stdout = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmp3lame.so'], 'stdout')
-stdout = stdout # alias
-stdin = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmp3lame.so'], 'stdin')
-stdin = stdin # alias
-stderr = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmp3lame.so'], 'stderr')
-stderr = stderr # alias
 # __wur = __attribute_warn_unused_result__ # alias
 # __SLONG32_TYPE = int # alias
 # __UID_T_TYPE = __U32_TYPE # alias
@@ -79,39 +71,13 @@ MAX_INDICATOR = 5
 # __USECONDS_T_TYPE = __U32_TYPE # alias
 MEDIUM_FAST = 1007
 # __OFF64_T_TYPE = __SQUAD_TYPE # alias
-def getc(_fp): return _IO_getc (_fp) # macro
 size_t = c_ulong
 _IO_size_t = size_t # alias
-class _G_fpos_t(Structure):
-    pass
 __off_t = c_long
-class __mbstate_t(Structure):
-    pass
-class N11__mbstate_t3DOT_2E(Union):
-    pass
-N11__mbstate_t3DOT_2E._fields_ = [
-    ('__wch', c_uint),
-    ('__wchb', c_char * 4),
-]
-__mbstate_t._fields_ = [
-    ('__count', c_int),
-    ('__value', N11__mbstate_t3DOT_2E),
-]
-_G_fpos_t._fields_ = [
-    ('__pos', __off_t),
-    ('__state', __mbstate_t),
-]
-_IO_fpos_t = _G_fpos_t # alias
 # def __errordecl(name,msg): return extern void name (void) __attribute__((__error__ (msg))) # macro
 FRONTEND_FILETOOLARGE = -82
 def __STRING(x): return #x # macro
 FRONTEND_WRITEERROR = -81
-class __va_list_tag(Structure):
-    pass
-__va_list_tag._fields_ = [
-]
-__gnuc_va_list = __va_list_tag * 1
-_G_va_list = __gnuc_va_list # alias
 # _IO_iconv_t = _G_iconv_t # alias
 # __MODE_T_TYPE = __U32_TYPE # alias
 LAME_GENERICERROR = -1
@@ -178,7 +144,6 @@ VBR_10 = 410
 V9 = 410
 ABR_320 = 320
 ABR_8 = 8
-_IO_va_list = __gnuc_va_list # alias
 PAD_NO = 0
 __uid_t = c_uint
 _IO_uid_t = __uid_t # alias
@@ -198,13 +163,6 @@ PAD_MAX_INDICATOR = 3
 PAD_ADJUST = 2
 PAD_ALL = 1
 SSE = 3
-class _G_fpos64_t(Structure):
-    pass
-_G_fpos64_t._fields_ = [
-    ('__pos', __off64_t),
-    ('__state', __mbstate_t),
-]
-_IO_fpos64_t = _G_fpos64_t # alias
 AMD_3DNOW = 2
 MMX = 1
 # _IO_file_flags = _flags # alias
@@ -341,157 +299,6 @@ __USE_ISOC11 = 1 # Variable c_int '1'
 _G_IO_IO_FILE_VERSION = 131073 # Variable c_int '131073'
 _BSD_SOURCE = 1 # Variable c_int '1'
 _IOLBF = 1 # Variable c_int '1'
-getchar = _libraries['/usr/lib/libmp3lame.so'].getchar
-getchar.restype = c_int
-getchar.argtypes = []
-FILE = _IO_FILE
-fgetc_unlocked = _libraries['/usr/lib/libmp3lame.so'].fgetc_unlocked
-fgetc_unlocked.restype = c_int
-fgetc_unlocked.argtypes = [POINTER(FILE)]
-getc_unlocked = _libraries['/usr/lib/libmp3lame.so'].getc_unlocked
-getc_unlocked.restype = c_int
-getc_unlocked.argtypes = [POINTER(FILE)]
-getchar_unlocked = _libraries['/usr/lib/libmp3lame.so'].getchar_unlocked
-getchar_unlocked.restype = c_int
-getchar_unlocked.argtypes = []
-putchar = _libraries['/usr/lib/libmp3lame.so'].putchar
-putchar.restype = c_int
-putchar.argtypes = [c_int]
-fputc_unlocked = _libraries['/usr/lib/libmp3lame.so'].fputc_unlocked
-fputc_unlocked.restype = c_int
-fputc_unlocked.argtypes = [c_int, POINTER(FILE)]
-putc_unlocked = _libraries['/usr/lib/libmp3lame.so'].putc_unlocked
-putc_unlocked.restype = c_int
-putc_unlocked.argtypes = [c_int, POINTER(FILE)]
-putchar_unlocked = _libraries['/usr/lib/libmp3lame.so'].putchar_unlocked
-putchar_unlocked.restype = c_int
-putchar_unlocked.argtypes = [c_int]
-getline = _libraries['/usr/lib/libmp3lame.so'].getline
-getline.restype = __ssize_t
-getline.argtypes = [POINTER(STRING), POINTER(size_t), POINTER(FILE)]
-feof_unlocked = _libraries['/usr/lib/libmp3lame.so'].feof_unlocked
-feof_unlocked.restype = c_int
-feof_unlocked.argtypes = [POINTER(FILE)]
-ferror_unlocked = _libraries['/usr/lib/libmp3lame.so'].ferror_unlocked
-ferror_unlocked.restype = c_int
-ferror_unlocked.argtypes = [POINTER(FILE)]
-__sprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__sprintf_chk
-__sprintf_chk.restype = c_int
-__sprintf_chk.argtypes = [STRING, c_int, size_t, STRING]
-__vsprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__vsprintf_chk
-__vsprintf_chk.restype = c_int
-__vsprintf_chk.argtypes = [STRING, c_int, size_t, STRING, POINTER(__va_list_tag)]
-sprintf = _libraries['/usr/lib/libmp3lame.so'].sprintf
-sprintf.restype = c_int
-sprintf.argtypes = [STRING, STRING]
-vsprintf = _libraries['/usr/lib/libmp3lame.so'].vsprintf
-vsprintf.restype = c_int
-vsprintf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]
-__snprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__snprintf_chk
-__snprintf_chk.restype = c_int
-__snprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING]
-__vsnprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__vsnprintf_chk
-__vsnprintf_chk.restype = c_int
-__vsnprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING, POINTER(__va_list_tag)]
-snprintf = _libraries['/usr/lib/libmp3lame.so'].snprintf
-snprintf.restype = c_int
-snprintf.argtypes = [STRING, size_t, STRING]
-vsnprintf = _libraries['/usr/lib/libmp3lame.so'].vsnprintf
-vsnprintf.restype = c_int
-vsnprintf.argtypes = [STRING, size_t, STRING, POINTER(__va_list_tag)]
-__fprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__fprintf_chk
-__fprintf_chk.restype = c_int
-__fprintf_chk.argtypes = [POINTER(FILE), c_int, STRING]
-__printf_chk = _libraries['/usr/lib/libmp3lame.so'].__printf_chk
-__printf_chk.restype = c_int
-__printf_chk.argtypes = [c_int, STRING]
-__vfprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__vfprintf_chk
-__vfprintf_chk.restype = c_int
-__vfprintf_chk.argtypes = [POINTER(FILE), c_int, STRING, POINTER(__va_list_tag)]
-__vprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__vprintf_chk
-__vprintf_chk.restype = c_int
-__vprintf_chk.argtypes = [c_int, STRING, POINTER(__va_list_tag)]
-fprintf = _libraries['/usr/lib/libmp3lame.so'].fprintf
-fprintf.restype = c_int
-fprintf.argtypes = [POINTER(FILE), STRING]
-printf = _libraries['/usr/lib/libmp3lame.so'].printf
-printf.restype = c_int
-printf.argtypes = [STRING]
-vprintf = _libraries['/usr/lib/libmp3lame.so'].vprintf
-vprintf.restype = c_int
-vprintf.argtypes = [STRING, POINTER(__va_list_tag)]
-vfprintf = _libraries['/usr/lib/libmp3lame.so'].vfprintf
-vfprintf.restype = c_int
-vfprintf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]
-__dprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__dprintf_chk
-__dprintf_chk.restype = c_int
-__dprintf_chk.argtypes = [c_int, c_int, STRING]
-__vdprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__vdprintf_chk
-__vdprintf_chk.restype = c_int
-__vdprintf_chk.argtypes = [c_int, c_int, STRING, POINTER(__va_list_tag)]
-dprintf = _libraries['/usr/lib/libmp3lame.so'].dprintf
-dprintf.restype = c_int
-dprintf.argtypes = [c_int, STRING]
-vdprintf = _libraries['/usr/lib/libmp3lame.so'].vdprintf
-vdprintf.restype = c_int
-vdprintf.argtypes = [c_int, STRING, POINTER(__va_list_tag)]
-__asprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__asprintf_chk
-__asprintf_chk.restype = c_int
-__asprintf_chk.argtypes = [POINTER(STRING), c_int, STRING]
-__vasprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__vasprintf_chk
-__vasprintf_chk.restype = c_int
-__vasprintf_chk.argtypes = [POINTER(STRING), c_int, STRING, POINTER(__va_list_tag)]
-class obstack(Structure):
-    pass
-__obstack_printf_chk = _libraries['/usr/lib/libmp3lame.so'].__obstack_printf_chk
-__obstack_printf_chk.restype = c_int
-__obstack_printf_chk.argtypes = [POINTER(obstack), c_int, STRING]
-__obstack_vprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__obstack_vprintf_chk
-__obstack_vprintf_chk.restype = c_int
-__obstack_vprintf_chk.argtypes = [POINTER(obstack), c_int, STRING, POINTER(__va_list_tag)]
-asprintf = _libraries['/usr/lib/libmp3lame.so'].asprintf
-asprintf.restype = c_int
-asprintf.argtypes = [POINTER(STRING), STRING]
-__asprintf = _libraries['/usr/lib/libmp3lame.so'].__asprintf
-__asprintf.restype = c_int
-__asprintf.argtypes = [POINTER(STRING), STRING]
-obstack_printf = _libraries['/usr/lib/libmp3lame.so'].obstack_printf
-obstack_printf.restype = c_int
-obstack_printf.argtypes = [POINTER(obstack), STRING]
-vasprintf = _libraries['/usr/lib/libmp3lame.so'].vasprintf
-vasprintf.restype = c_int
-vasprintf.argtypes = [POINTER(STRING), STRING, POINTER(__va_list_tag)]
-obstack_vprintf = _libraries['/usr/lib/libmp3lame.so'].obstack_vprintf
-obstack_vprintf.restype = c_int
-obstack_vprintf.argtypes = [POINTER(obstack), STRING, POINTER(__va_list_tag)]
-__fgets_chk = _libraries['/usr/lib/libmp3lame.so'].__fgets_chk
-__fgets_chk.restype = STRING
-__fgets_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]
-fgets = _libraries['/usr/lib/libmp3lame.so'].fgets
-fgets.restype = STRING
-fgets.argtypes = [STRING, c_int, POINTER(FILE)]
-__fread_chk = _libraries['/usr/lib/libmp3lame.so'].__fread_chk
-__fread_chk.restype = size_t
-__fread_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]
-fread = _libraries['/usr/lib/libmp3lame.so'].fread
-fread.restype = size_t
-fread.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-__fgets_unlocked_chk = _libraries['/usr/lib/libmp3lame.so'].__fgets_unlocked_chk
-__fgets_unlocked_chk.restype = STRING
-__fgets_unlocked_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]
-fgets_unlocked = _libraries['/usr/lib/libmp3lame.so'].fgets_unlocked
-fgets_unlocked.restype = STRING
-fgets_unlocked.argtypes = [STRING, c_int, POINTER(FILE)]
-__fread_unlocked_chk = _libraries['/usr/lib/libmp3lame.so'].__fread_unlocked_chk
-__fread_unlocked_chk.restype = size_t
-__fread_unlocked_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]
-fread_unlocked = _libraries['/usr/lib/libmp3lame.so'].fread_unlocked
-fread_unlocked.restype = size_t
-fread_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libmp3lame.so'], 'sys_nerr')
-sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libmp3lame.so'], 'sys_errlist')
-_sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libmp3lame.so'], '_sys_nerr')
-_sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libmp3lame.so'], '_sys_errlist')
 __u_char = c_ubyte
 __u_short = c_ushort
 __u_int = c_uint
@@ -512,11 +319,6 @@ __ino_t = c_ulong
 __ino64_t = c_ulong
 __mode_t = c_uint
 __nlink_t = c_ulong
-class __fsid_t(Structure):
-    pass
-__fsid_t._fields_ = [
-    ('__val', c_int * 2),
-]
 __clock_t = c_long
 __rlim_t = c_ulong
 __rlim64_t = c_ulong
@@ -543,7 +345,6 @@ __qaddr_t = POINTER(__quad_t)
 __caddr_t = STRING
 __intptr_t = c_long
 __socklen_t = c_uint
-lame_report_function = CFUNCTYPE(None, STRING, POINTER(__va_list_tag))
 
 # values for enumeration 'vbr_mode_e'
 vbr_mode_e = c_int # enum
@@ -572,712 +373,13 @@ Psy_model = Psy_model_e
 # values for enumeration 'buffer_constraint_e'
 buffer_constraint_e = c_int # enum
 buffer_constraint = buffer_constraint_e
-class lame_global_struct(Structure):
-    pass
-lame_global_struct._fields_ = [
-]
-lame_global_flags = lame_global_struct
-lame_t = POINTER(lame_global_flags)
-lame_init = _libraries['/usr/lib/libmp3lame.so'].lame_init
-lame_init.restype = POINTER(lame_global_flags)
-lame_init.argtypes = []
-lame_set_num_samples = _libraries['/usr/lib/libmp3lame.so'].lame_set_num_samples
-lame_set_num_samples.restype = c_int
-lame_set_num_samples.argtypes = [POINTER(lame_global_flags), c_ulong]
-lame_get_num_samples = _libraries['/usr/lib/libmp3lame.so'].lame_get_num_samples
-lame_get_num_samples.restype = c_ulong
-lame_get_num_samples.argtypes = [POINTER(lame_global_flags)]
-lame_set_in_samplerate = _libraries['/usr/lib/libmp3lame.so'].lame_set_in_samplerate
-lame_set_in_samplerate.restype = c_int
-lame_set_in_samplerate.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_in_samplerate = _libraries['/usr/lib/libmp3lame.so'].lame_get_in_samplerate
-lame_get_in_samplerate.restype = c_int
-lame_get_in_samplerate.argtypes = [POINTER(lame_global_flags)]
-lame_set_num_channels = _libraries['/usr/lib/libmp3lame.so'].lame_set_num_channels
-lame_set_num_channels.restype = c_int
-lame_set_num_channels.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_num_channels = _libraries['/usr/lib/libmp3lame.so'].lame_get_num_channels
-lame_get_num_channels.restype = c_int
-lame_get_num_channels.argtypes = [POINTER(lame_global_flags)]
-lame_set_scale = _libraries['/usr/lib/libmp3lame.so'].lame_set_scale
-lame_set_scale.restype = c_int
-lame_set_scale.argtypes = [POINTER(lame_global_flags), c_float]
-lame_get_scale = _libraries['/usr/lib/libmp3lame.so'].lame_get_scale
-lame_get_scale.restype = c_float
-lame_get_scale.argtypes = [POINTER(lame_global_flags)]
-lame_set_scale_left = _libraries['/usr/lib/libmp3lame.so'].lame_set_scale_left
-lame_set_scale_left.restype = c_int
-lame_set_scale_left.argtypes = [POINTER(lame_global_flags), c_float]
-lame_get_scale_left = _libraries['/usr/lib/libmp3lame.so'].lame_get_scale_left
-lame_get_scale_left.restype = c_float
-lame_get_scale_left.argtypes = [POINTER(lame_global_flags)]
-lame_set_scale_right = _libraries['/usr/lib/libmp3lame.so'].lame_set_scale_right
-lame_set_scale_right.restype = c_int
-lame_set_scale_right.argtypes = [POINTER(lame_global_flags), c_float]
-lame_get_scale_right = _libraries['/usr/lib/libmp3lame.so'].lame_get_scale_right
-lame_get_scale_right.restype = c_float
-lame_get_scale_right.argtypes = [POINTER(lame_global_flags)]
-lame_set_out_samplerate = _libraries['/usr/lib/libmp3lame.so'].lame_set_out_samplerate
-lame_set_out_samplerate.restype = c_int
-lame_set_out_samplerate.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_out_samplerate = _libraries['/usr/lib/libmp3lame.so'].lame_get_out_samplerate
-lame_get_out_samplerate.restype = c_int
-lame_get_out_samplerate.argtypes = [POINTER(lame_global_flags)]
-lame_set_analysis = _libraries['/usr/lib/libmp3lame.so'].lame_set_analysis
-lame_set_analysis.restype = c_int
-lame_set_analysis.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_analysis = _libraries['/usr/lib/libmp3lame.so'].lame_get_analysis
-lame_get_analysis.restype = c_int
-lame_get_analysis.argtypes = [POINTER(lame_global_flags)]
-lame_set_bWriteVbrTag = _libraries['/usr/lib/libmp3lame.so'].lame_set_bWriteVbrTag
-lame_set_bWriteVbrTag.restype = c_int
-lame_set_bWriteVbrTag.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_bWriteVbrTag = _libraries['/usr/lib/libmp3lame.so'].lame_get_bWriteVbrTag
-lame_get_bWriteVbrTag.restype = c_int
-lame_get_bWriteVbrTag.argtypes = [POINTER(lame_global_flags)]
-lame_set_decode_only = _libraries['/usr/lib/libmp3lame.so'].lame_set_decode_only
-lame_set_decode_only.restype = c_int
-lame_set_decode_only.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_decode_only = _libraries['/usr/lib/libmp3lame.so'].lame_get_decode_only
-lame_get_decode_only.restype = c_int
-lame_get_decode_only.argtypes = [POINTER(lame_global_flags)]
-lame_set_quality = _libraries['/usr/lib/libmp3lame.so'].lame_set_quality
-lame_set_quality.restype = c_int
-lame_set_quality.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_quality = _libraries['/usr/lib/libmp3lame.so'].lame_get_quality
-lame_get_quality.restype = c_int
-lame_get_quality.argtypes = [POINTER(lame_global_flags)]
-lame_set_mode = _libraries['/usr/lib/libmp3lame.so'].lame_set_mode
-lame_set_mode.restype = c_int
-lame_set_mode.argtypes = [POINTER(lame_global_flags), MPEG_mode]
-lame_get_mode = _libraries['/usr/lib/libmp3lame.so'].lame_get_mode
-lame_get_mode.restype = MPEG_mode
-lame_get_mode.argtypes = [POINTER(lame_global_flags)]
-lame_set_force_ms = _libraries['/usr/lib/libmp3lame.so'].lame_set_force_ms
-lame_set_force_ms.restype = c_int
-lame_set_force_ms.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_force_ms = _libraries['/usr/lib/libmp3lame.so'].lame_get_force_ms
-lame_get_force_ms.restype = c_int
-lame_get_force_ms.argtypes = [POINTER(lame_global_flags)]
-lame_set_free_format = _libraries['/usr/lib/libmp3lame.so'].lame_set_free_format
-lame_set_free_format.restype = c_int
-lame_set_free_format.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_free_format = _libraries['/usr/lib/libmp3lame.so'].lame_get_free_format
-lame_get_free_format.restype = c_int
-lame_get_free_format.argtypes = [POINTER(lame_global_flags)]
-lame_set_findReplayGain = _libraries['/usr/lib/libmp3lame.so'].lame_set_findReplayGain
-lame_set_findReplayGain.restype = c_int
-lame_set_findReplayGain.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_findReplayGain = _libraries['/usr/lib/libmp3lame.so'].lame_get_findReplayGain
-lame_get_findReplayGain.restype = c_int
-lame_get_findReplayGain.argtypes = [POINTER(lame_global_flags)]
-lame_set_decode_on_the_fly = _libraries['/usr/lib/libmp3lame.so'].lame_set_decode_on_the_fly
-lame_set_decode_on_the_fly.restype = c_int
-lame_set_decode_on_the_fly.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_decode_on_the_fly = _libraries['/usr/lib/libmp3lame.so'].lame_get_decode_on_the_fly
-lame_get_decode_on_the_fly.restype = c_int
-lame_get_decode_on_the_fly.argtypes = [POINTER(lame_global_flags)]
-lame_set_nogap_total = _libraries['/usr/lib/libmp3lame.so'].lame_set_nogap_total
-lame_set_nogap_total.restype = c_int
-lame_set_nogap_total.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_nogap_total = _libraries['/usr/lib/libmp3lame.so'].lame_get_nogap_total
-lame_get_nogap_total.restype = c_int
-lame_get_nogap_total.argtypes = [POINTER(lame_global_flags)]
-lame_set_nogap_currentindex = _libraries['/usr/lib/libmp3lame.so'].lame_set_nogap_currentindex
-lame_set_nogap_currentindex.restype = c_int
-lame_set_nogap_currentindex.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_nogap_currentindex = _libraries['/usr/lib/libmp3lame.so'].lame_get_nogap_currentindex
-lame_get_nogap_currentindex.restype = c_int
-lame_get_nogap_currentindex.argtypes = [POINTER(lame_global_flags)]
-lame_set_errorf = _libraries['/usr/lib/libmp3lame.so'].lame_set_errorf
-lame_set_errorf.restype = c_int
-lame_set_errorf.argtypes = [POINTER(lame_global_flags), lame_report_function]
-lame_set_debugf = _libraries['/usr/lib/libmp3lame.so'].lame_set_debugf
-lame_set_debugf.restype = c_int
-lame_set_debugf.argtypes = [POINTER(lame_global_flags), lame_report_function]
-lame_set_msgf = _libraries['/usr/lib/libmp3lame.so'].lame_set_msgf
-lame_set_msgf.restype = c_int
-lame_set_msgf.argtypes = [POINTER(lame_global_flags), lame_report_function]
-lame_set_brate = _libraries['/usr/lib/libmp3lame.so'].lame_set_brate
-lame_set_brate.restype = c_int
-lame_set_brate.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_brate = _libraries['/usr/lib/libmp3lame.so'].lame_get_brate
-lame_get_brate.restype = c_int
-lame_get_brate.argtypes = [POINTER(lame_global_flags)]
-lame_set_compression_ratio = _libraries['/usr/lib/libmp3lame.so'].lame_set_compression_ratio
-lame_set_compression_ratio.restype = c_int
-lame_set_compression_ratio.argtypes = [POINTER(lame_global_flags), c_float]
-lame_get_compression_ratio = _libraries['/usr/lib/libmp3lame.so'].lame_get_compression_ratio
-lame_get_compression_ratio.restype = c_float
-lame_get_compression_ratio.argtypes = [POINTER(lame_global_flags)]
-lame_set_preset = _libraries['/usr/lib/libmp3lame.so'].lame_set_preset
-lame_set_preset.restype = c_int
-lame_set_preset.argtypes = [POINTER(lame_global_flags), c_int]
-lame_set_asm_optimizations = _libraries['/usr/lib/libmp3lame.so'].lame_set_asm_optimizations
-lame_set_asm_optimizations.restype = c_int
-lame_set_asm_optimizations.argtypes = [POINTER(lame_global_flags), c_int, c_int]
-lame_set_copyright = _libraries['/usr/lib/libmp3lame.so'].lame_set_copyright
-lame_set_copyright.restype = c_int
-lame_set_copyright.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_copyright = _libraries['/usr/lib/libmp3lame.so'].lame_get_copyright
-lame_get_copyright.restype = c_int
-lame_get_copyright.argtypes = [POINTER(lame_global_flags)]
-lame_set_original = _libraries['/usr/lib/libmp3lame.so'].lame_set_original
-lame_set_original.restype = c_int
-lame_set_original.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_original = _libraries['/usr/lib/libmp3lame.so'].lame_get_original
-lame_get_original.restype = c_int
-lame_get_original.argtypes = [POINTER(lame_global_flags)]
-lame_set_error_protection = _libraries['/usr/lib/libmp3lame.so'].lame_set_error_protection
-lame_set_error_protection.restype = c_int
-lame_set_error_protection.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_error_protection = _libraries['/usr/lib/libmp3lame.so'].lame_get_error_protection
-lame_get_error_protection.restype = c_int
-lame_get_error_protection.argtypes = [POINTER(lame_global_flags)]
-lame_set_extension = _libraries['/usr/lib/libmp3lame.so'].lame_set_extension
-lame_set_extension.restype = c_int
-lame_set_extension.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_extension = _libraries['/usr/lib/libmp3lame.so'].lame_get_extension
-lame_get_extension.restype = c_int
-lame_get_extension.argtypes = [POINTER(lame_global_flags)]
-lame_set_strict_ISO = _libraries['/usr/lib/libmp3lame.so'].lame_set_strict_ISO
-lame_set_strict_ISO.restype = c_int
-lame_set_strict_ISO.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_strict_ISO = _libraries['/usr/lib/libmp3lame.so'].lame_get_strict_ISO
-lame_get_strict_ISO.restype = c_int
-lame_get_strict_ISO.argtypes = [POINTER(lame_global_flags)]
-lame_set_disable_reservoir = _libraries['/usr/lib/libmp3lame.so'].lame_set_disable_reservoir
-lame_set_disable_reservoir.restype = c_int
-lame_set_disable_reservoir.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_disable_reservoir = _libraries['/usr/lib/libmp3lame.so'].lame_get_disable_reservoir
-lame_get_disable_reservoir.restype = c_int
-lame_get_disable_reservoir.argtypes = [POINTER(lame_global_flags)]
-lame_set_quant_comp = _libraries['/usr/lib/libmp3lame.so'].lame_set_quant_comp
-lame_set_quant_comp.restype = c_int
-lame_set_quant_comp.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_quant_comp = _libraries['/usr/lib/libmp3lame.so'].lame_get_quant_comp
-lame_get_quant_comp.restype = c_int
-lame_get_quant_comp.argtypes = [POINTER(lame_global_flags)]
-lame_set_quant_comp_short = _libraries['/usr/lib/libmp3lame.so'].lame_set_quant_comp_short
-lame_set_quant_comp_short.restype = c_int
-lame_set_quant_comp_short.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_quant_comp_short = _libraries['/usr/lib/libmp3lame.so'].lame_get_quant_comp_short
-lame_get_quant_comp_short.restype = c_int
-lame_get_quant_comp_short.argtypes = [POINTER(lame_global_flags)]
-lame_set_experimentalX = _libraries['/usr/lib/libmp3lame.so'].lame_set_experimentalX
-lame_set_experimentalX.restype = c_int
-lame_set_experimentalX.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_experimentalX = _libraries['/usr/lib/libmp3lame.so'].lame_get_experimentalX
-lame_get_experimentalX.restype = c_int
-lame_get_experimentalX.argtypes = [POINTER(lame_global_flags)]
-lame_set_experimentalY = _libraries['/usr/lib/libmp3lame.so'].lame_set_experimentalY
-lame_set_experimentalY.restype = c_int
-lame_set_experimentalY.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_experimentalY = _libraries['/usr/lib/libmp3lame.so'].lame_get_experimentalY
-lame_get_experimentalY.restype = c_int
-lame_get_experimentalY.argtypes = [POINTER(lame_global_flags)]
-lame_set_experimentalZ = _libraries['/usr/lib/libmp3lame.so'].lame_set_experimentalZ
-lame_set_experimentalZ.restype = c_int
-lame_set_experimentalZ.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_experimentalZ = _libraries['/usr/lib/libmp3lame.so'].lame_get_experimentalZ
-lame_get_experimentalZ.restype = c_int
-lame_get_experimentalZ.argtypes = [POINTER(lame_global_flags)]
-lame_set_exp_nspsytune = _libraries['/usr/lib/libmp3lame.so'].lame_set_exp_nspsytune
-lame_set_exp_nspsytune.restype = c_int
-lame_set_exp_nspsytune.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_exp_nspsytune = _libraries['/usr/lib/libmp3lame.so'].lame_get_exp_nspsytune
-lame_get_exp_nspsytune.restype = c_int
-lame_get_exp_nspsytune.argtypes = [POINTER(lame_global_flags)]
-lame_set_msfix = _libraries['/usr/lib/libmp3lame.so'].lame_set_msfix
-lame_set_msfix.restype = None
-lame_set_msfix.argtypes = [POINTER(lame_global_flags), c_double]
-lame_get_msfix = _libraries['/usr/lib/libmp3lame.so'].lame_get_msfix
-lame_get_msfix.restype = c_float
-lame_get_msfix.argtypes = [POINTER(lame_global_flags)]
-lame_set_VBR = _libraries['/usr/lib/libmp3lame.so'].lame_set_VBR
-lame_set_VBR.restype = c_int
-lame_set_VBR.argtypes = [POINTER(lame_global_flags), vbr_mode]
-lame_get_VBR = _libraries['/usr/lib/libmp3lame.so'].lame_get_VBR
-lame_get_VBR.restype = vbr_mode
-lame_get_VBR.argtypes = [POINTER(lame_global_flags)]
-lame_set_VBR_q = _libraries['/usr/lib/libmp3lame.so'].lame_set_VBR_q
-lame_set_VBR_q.restype = c_int
-lame_set_VBR_q.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_VBR_q = _libraries['/usr/lib/libmp3lame.so'].lame_get_VBR_q
-lame_get_VBR_q.restype = c_int
-lame_get_VBR_q.argtypes = [POINTER(lame_global_flags)]
-lame_set_VBR_quality = _libraries['/usr/lib/libmp3lame.so'].lame_set_VBR_quality
-lame_set_VBR_quality.restype = c_int
-lame_set_VBR_quality.argtypes = [POINTER(lame_global_flags), c_float]
-lame_get_VBR_quality = _libraries['/usr/lib/libmp3lame.so'].lame_get_VBR_quality
-lame_get_VBR_quality.restype = c_float
-lame_get_VBR_quality.argtypes = [POINTER(lame_global_flags)]
-lame_set_VBR_mean_bitrate_kbps = _libraries['/usr/lib/libmp3lame.so'].lame_set_VBR_mean_bitrate_kbps
-lame_set_VBR_mean_bitrate_kbps.restype = c_int
-lame_set_VBR_mean_bitrate_kbps.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_VBR_mean_bitrate_kbps = _libraries['/usr/lib/libmp3lame.so'].lame_get_VBR_mean_bitrate_kbps
-lame_get_VBR_mean_bitrate_kbps.restype = c_int
-lame_get_VBR_mean_bitrate_kbps.argtypes = [POINTER(lame_global_flags)]
-lame_set_VBR_min_bitrate_kbps = _libraries['/usr/lib/libmp3lame.so'].lame_set_VBR_min_bitrate_kbps
-lame_set_VBR_min_bitrate_kbps.restype = c_int
-lame_set_VBR_min_bitrate_kbps.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_VBR_min_bitrate_kbps = _libraries['/usr/lib/libmp3lame.so'].lame_get_VBR_min_bitrate_kbps
-lame_get_VBR_min_bitrate_kbps.restype = c_int
-lame_get_VBR_min_bitrate_kbps.argtypes = [POINTER(lame_global_flags)]
-lame_set_VBR_max_bitrate_kbps = _libraries['/usr/lib/libmp3lame.so'].lame_set_VBR_max_bitrate_kbps
-lame_set_VBR_max_bitrate_kbps.restype = c_int
-lame_set_VBR_max_bitrate_kbps.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_VBR_max_bitrate_kbps = _libraries['/usr/lib/libmp3lame.so'].lame_get_VBR_max_bitrate_kbps
-lame_get_VBR_max_bitrate_kbps.restype = c_int
-lame_get_VBR_max_bitrate_kbps.argtypes = [POINTER(lame_global_flags)]
-lame_set_VBR_hard_min = _libraries['/usr/lib/libmp3lame.so'].lame_set_VBR_hard_min
-lame_set_VBR_hard_min.restype = c_int
-lame_set_VBR_hard_min.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_VBR_hard_min = _libraries['/usr/lib/libmp3lame.so'].lame_get_VBR_hard_min
-lame_get_VBR_hard_min.restype = c_int
-lame_get_VBR_hard_min.argtypes = [POINTER(lame_global_flags)]
-lame_set_lowpassfreq = _libraries['/usr/lib/libmp3lame.so'].lame_set_lowpassfreq
-lame_set_lowpassfreq.restype = c_int
-lame_set_lowpassfreq.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_lowpassfreq = _libraries['/usr/lib/libmp3lame.so'].lame_get_lowpassfreq
-lame_get_lowpassfreq.restype = c_int
-lame_get_lowpassfreq.argtypes = [POINTER(lame_global_flags)]
-lame_set_lowpasswidth = _libraries['/usr/lib/libmp3lame.so'].lame_set_lowpasswidth
-lame_set_lowpasswidth.restype = c_int
-lame_set_lowpasswidth.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_lowpasswidth = _libraries['/usr/lib/libmp3lame.so'].lame_get_lowpasswidth
-lame_get_lowpasswidth.restype = c_int
-lame_get_lowpasswidth.argtypes = [POINTER(lame_global_flags)]
-lame_set_highpassfreq = _libraries['/usr/lib/libmp3lame.so'].lame_set_highpassfreq
-lame_set_highpassfreq.restype = c_int
-lame_set_highpassfreq.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_highpassfreq = _libraries['/usr/lib/libmp3lame.so'].lame_get_highpassfreq
-lame_get_highpassfreq.restype = c_int
-lame_get_highpassfreq.argtypes = [POINTER(lame_global_flags)]
-lame_set_highpasswidth = _libraries['/usr/lib/libmp3lame.so'].lame_set_highpasswidth
-lame_set_highpasswidth.restype = c_int
-lame_set_highpasswidth.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_highpasswidth = _libraries['/usr/lib/libmp3lame.so'].lame_get_highpasswidth
-lame_get_highpasswidth.restype = c_int
-lame_get_highpasswidth.argtypes = [POINTER(lame_global_flags)]
-lame_set_ATHonly = _libraries['/usr/lib/libmp3lame.so'].lame_set_ATHonly
-lame_set_ATHonly.restype = c_int
-lame_set_ATHonly.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_ATHonly = _libraries['/usr/lib/libmp3lame.so'].lame_get_ATHonly
-lame_get_ATHonly.restype = c_int
-lame_get_ATHonly.argtypes = [POINTER(lame_global_flags)]
-lame_set_ATHshort = _libraries['/usr/lib/libmp3lame.so'].lame_set_ATHshort
-lame_set_ATHshort.restype = c_int
-lame_set_ATHshort.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_ATHshort = _libraries['/usr/lib/libmp3lame.so'].lame_get_ATHshort
-lame_get_ATHshort.restype = c_int
-lame_get_ATHshort.argtypes = [POINTER(lame_global_flags)]
-lame_set_noATH = _libraries['/usr/lib/libmp3lame.so'].lame_set_noATH
-lame_set_noATH.restype = c_int
-lame_set_noATH.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_noATH = _libraries['/usr/lib/libmp3lame.so'].lame_get_noATH
-lame_get_noATH.restype = c_int
-lame_get_noATH.argtypes = [POINTER(lame_global_flags)]
-lame_set_ATHtype = _libraries['/usr/lib/libmp3lame.so'].lame_set_ATHtype
-lame_set_ATHtype.restype = c_int
-lame_set_ATHtype.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_ATHtype = _libraries['/usr/lib/libmp3lame.so'].lame_get_ATHtype
-lame_get_ATHtype.restype = c_int
-lame_get_ATHtype.argtypes = [POINTER(lame_global_flags)]
-lame_set_ATHlower = _libraries['/usr/lib/libmp3lame.so'].lame_set_ATHlower
-lame_set_ATHlower.restype = c_int
-lame_set_ATHlower.argtypes = [POINTER(lame_global_flags), c_float]
-lame_get_ATHlower = _libraries['/usr/lib/libmp3lame.so'].lame_get_ATHlower
-lame_get_ATHlower.restype = c_float
-lame_get_ATHlower.argtypes = [POINTER(lame_global_flags)]
-lame_set_athaa_type = _libraries['/usr/lib/libmp3lame.so'].lame_set_athaa_type
-lame_set_athaa_type.restype = c_int
-lame_set_athaa_type.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_athaa_type = _libraries['/usr/lib/libmp3lame.so'].lame_get_athaa_type
-lame_get_athaa_type.restype = c_int
-lame_get_athaa_type.argtypes = [POINTER(lame_global_flags)]
-lame_set_athaa_sensitivity = _libraries['/usr/lib/libmp3lame.so'].lame_set_athaa_sensitivity
-lame_set_athaa_sensitivity.restype = c_int
-lame_set_athaa_sensitivity.argtypes = [POINTER(lame_global_flags), c_float]
-lame_get_athaa_sensitivity = _libraries['/usr/lib/libmp3lame.so'].lame_get_athaa_sensitivity
-lame_get_athaa_sensitivity.restype = c_float
-lame_get_athaa_sensitivity.argtypes = [POINTER(lame_global_flags)]
-lame_set_allow_diff_short = _libraries['/usr/lib/libmp3lame.so'].lame_set_allow_diff_short
-lame_set_allow_diff_short.restype = c_int
-lame_set_allow_diff_short.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_allow_diff_short = _libraries['/usr/lib/libmp3lame.so'].lame_get_allow_diff_short
-lame_get_allow_diff_short.restype = c_int
-lame_get_allow_diff_short.argtypes = [POINTER(lame_global_flags)]
-lame_set_useTemporal = _libraries['/usr/lib/libmp3lame.so'].lame_set_useTemporal
-lame_set_useTemporal.restype = c_int
-lame_set_useTemporal.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_useTemporal = _libraries['/usr/lib/libmp3lame.so'].lame_get_useTemporal
-lame_get_useTemporal.restype = c_int
-lame_get_useTemporal.argtypes = [POINTER(lame_global_flags)]
-lame_set_interChRatio = _libraries['/usr/lib/libmp3lame.so'].lame_set_interChRatio
-lame_set_interChRatio.restype = c_int
-lame_set_interChRatio.argtypes = [POINTER(lame_global_flags), c_float]
-lame_get_interChRatio = _libraries['/usr/lib/libmp3lame.so'].lame_get_interChRatio
-lame_get_interChRatio.restype = c_float
-lame_get_interChRatio.argtypes = [POINTER(lame_global_flags)]
-lame_set_no_short_blocks = _libraries['/usr/lib/libmp3lame.so'].lame_set_no_short_blocks
-lame_set_no_short_blocks.restype = c_int
-lame_set_no_short_blocks.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_no_short_blocks = _libraries['/usr/lib/libmp3lame.so'].lame_get_no_short_blocks
-lame_get_no_short_blocks.restype = c_int
-lame_get_no_short_blocks.argtypes = [POINTER(lame_global_flags)]
-lame_set_force_short_blocks = _libraries['/usr/lib/libmp3lame.so'].lame_set_force_short_blocks
-lame_set_force_short_blocks.restype = c_int
-lame_set_force_short_blocks.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_force_short_blocks = _libraries['/usr/lib/libmp3lame.so'].lame_get_force_short_blocks
-lame_get_force_short_blocks.restype = c_int
-lame_get_force_short_blocks.argtypes = [POINTER(lame_global_flags)]
-lame_set_emphasis = _libraries['/usr/lib/libmp3lame.so'].lame_set_emphasis
-lame_set_emphasis.restype = c_int
-lame_set_emphasis.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_emphasis = _libraries['/usr/lib/libmp3lame.so'].lame_get_emphasis
-lame_get_emphasis.restype = c_int
-lame_get_emphasis.argtypes = [POINTER(lame_global_flags)]
-lame_get_version = _libraries['/usr/lib/libmp3lame.so'].lame_get_version
-lame_get_version.restype = c_int
-lame_get_version.argtypes = [POINTER(lame_global_flags)]
-lame_get_encoder_delay = _libraries['/usr/lib/libmp3lame.so'].lame_get_encoder_delay
-lame_get_encoder_delay.restype = c_int
-lame_get_encoder_delay.argtypes = [POINTER(lame_global_flags)]
-lame_get_encoder_padding = _libraries['/usr/lib/libmp3lame.so'].lame_get_encoder_padding
-lame_get_encoder_padding.restype = c_int
-lame_get_encoder_padding.argtypes = [POINTER(lame_global_flags)]
-lame_get_framesize = _libraries['/usr/lib/libmp3lame.so'].lame_get_framesize
-lame_get_framesize.restype = c_int
-lame_get_framesize.argtypes = [POINTER(lame_global_flags)]
-lame_get_mf_samples_to_encode = _libraries['/usr/lib/libmp3lame.so'].lame_get_mf_samples_to_encode
-lame_get_mf_samples_to_encode.restype = c_int
-lame_get_mf_samples_to_encode.argtypes = [POINTER(lame_global_flags)]
-lame_get_size_mp3buffer = _libraries['/usr/lib/libmp3lame.so'].lame_get_size_mp3buffer
-lame_get_size_mp3buffer.restype = c_int
-lame_get_size_mp3buffer.argtypes = [POINTER(lame_global_flags)]
-lame_get_frameNum = _libraries['/usr/lib/libmp3lame.so'].lame_get_frameNum
-lame_get_frameNum.restype = c_int
-lame_get_frameNum.argtypes = [POINTER(lame_global_flags)]
-lame_get_totalframes = _libraries['/usr/lib/libmp3lame.so'].lame_get_totalframes
-lame_get_totalframes.restype = c_int
-lame_get_totalframes.argtypes = [POINTER(lame_global_flags)]
-lame_get_RadioGain = _libraries['/usr/lib/libmp3lame.so'].lame_get_RadioGain
-lame_get_RadioGain.restype = c_int
-lame_get_RadioGain.argtypes = [POINTER(lame_global_flags)]
-lame_get_AudiophileGain = _libraries['/usr/lib/libmp3lame.so'].lame_get_AudiophileGain
-lame_get_AudiophileGain.restype = c_int
-lame_get_AudiophileGain.argtypes = [POINTER(lame_global_flags)]
-lame_get_PeakSample = _libraries['/usr/lib/libmp3lame.so'].lame_get_PeakSample
-lame_get_PeakSample.restype = c_float
-lame_get_PeakSample.argtypes = [POINTER(lame_global_flags)]
-lame_get_noclipGainChange = _libraries['/usr/lib/libmp3lame.so'].lame_get_noclipGainChange
-lame_get_noclipGainChange.restype = c_int
-lame_get_noclipGainChange.argtypes = [POINTER(lame_global_flags)]
-lame_get_noclipScale = _libraries['/usr/lib/libmp3lame.so'].lame_get_noclipScale
-lame_get_noclipScale.restype = c_float
-lame_get_noclipScale.argtypes = [POINTER(lame_global_flags)]
-lame_init_params = _libraries['/usr/lib/libmp3lame.so'].lame_init_params
-lame_init_params.restype = c_int
-lame_init_params.argtypes = [POINTER(lame_global_flags)]
-get_lame_version = _libraries['/usr/lib/libmp3lame.so'].get_lame_version
-get_lame_version.restype = STRING
-get_lame_version.argtypes = []
-get_lame_short_version = _libraries['/usr/lib/libmp3lame.so'].get_lame_short_version
-get_lame_short_version.restype = STRING
-get_lame_short_version.argtypes = []
-get_lame_very_short_version = _libraries['/usr/lib/libmp3lame.so'].get_lame_very_short_version
-get_lame_very_short_version.restype = STRING
-get_lame_very_short_version.argtypes = []
-get_psy_version = _libraries['/usr/lib/libmp3lame.so'].get_psy_version
-get_psy_version.restype = STRING
-get_psy_version.argtypes = []
-get_lame_url = _libraries['/usr/lib/libmp3lame.so'].get_lame_url
-get_lame_url.restype = STRING
-get_lame_url.argtypes = []
-get_lame_os_bitness = _libraries['/usr/lib/libmp3lame.so'].get_lame_os_bitness
-get_lame_os_bitness.restype = STRING
-get_lame_os_bitness.argtypes = []
-class lame_version_t(Structure):
-    pass
-lame_version_t._fields_ = [
-    ('major', c_int),
-    ('minor', c_int),
-    ('alpha', c_int),
-    ('beta', c_int),
-    ('psy_major', c_int),
-    ('psy_minor', c_int),
-    ('psy_alpha', c_int),
-    ('psy_beta', c_int),
-    ('features', STRING),
-]
-get_lame_version_numerical = _libraries['/usr/lib/libmp3lame.so'].get_lame_version_numerical
-get_lame_version_numerical.restype = None
-get_lame_version_numerical.argtypes = [POINTER(lame_version_t)]
-lame_print_config = _libraries['/usr/lib/libmp3lame.so'].lame_print_config
-lame_print_config.restype = None
-lame_print_config.argtypes = [POINTER(lame_global_flags)]
-lame_print_internals = _libraries['/usr/lib/libmp3lame.so'].lame_print_internals
-lame_print_internals.restype = None
-lame_print_internals.argtypes = [POINTER(lame_global_flags)]
-lame_encode_buffer = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer
-lame_encode_buffer.restype = c_int
-lame_encode_buffer.argtypes = [POINTER(lame_global_flags), POINTER(c_short), POINTER(c_short), c_int, POINTER(c_ubyte), c_int]
-lame_encode_buffer_interleaved = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_interleaved
-lame_encode_buffer_interleaved.restype = c_int
-lame_encode_buffer_interleaved.argtypes = [POINTER(lame_global_flags), POINTER(c_short), c_int, POINTER(c_ubyte), c_int]
-lame_encode_buffer_float = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_float
-lame_encode_buffer_float.restype = c_int
-lame_encode_buffer_float.argtypes = [POINTER(lame_global_flags), POINTER(c_float), POINTER(c_float), c_int, POINTER(c_ubyte), c_int]
-lame_encode_buffer_ieee_float = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_ieee_float
-lame_encode_buffer_ieee_float.restype = c_int
-lame_encode_buffer_ieee_float.argtypes = [lame_t, POINTER(c_float), POINTER(c_float), c_int, POINTER(c_ubyte), c_int]
-lame_encode_buffer_interleaved_ieee_float = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_interleaved_ieee_float
-lame_encode_buffer_interleaved_ieee_float.restype = c_int
-lame_encode_buffer_interleaved_ieee_float.argtypes = [lame_t, POINTER(c_float), c_int, POINTER(c_ubyte), c_int]
-lame_encode_buffer_ieee_double = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_ieee_double
-lame_encode_buffer_ieee_double.restype = c_int
-lame_encode_buffer_ieee_double.argtypes = [lame_t, POINTER(c_double), POINTER(c_double), c_int, POINTER(c_ubyte), c_int]
-lame_encode_buffer_interleaved_ieee_double = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_interleaved_ieee_double
-lame_encode_buffer_interleaved_ieee_double.restype = c_int
-lame_encode_buffer_interleaved_ieee_double.argtypes = [lame_t, POINTER(c_double), c_int, POINTER(c_ubyte), c_int]
-lame_encode_buffer_long = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_long
-lame_encode_buffer_long.restype = c_int
-lame_encode_buffer_long.argtypes = [POINTER(lame_global_flags), POINTER(c_long), POINTER(c_long), c_int, POINTER(c_ubyte), c_int]
-lame_encode_buffer_long2 = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_long2
-lame_encode_buffer_long2.restype = c_int
-lame_encode_buffer_long2.argtypes = [POINTER(lame_global_flags), POINTER(c_long), POINTER(c_long), c_int, POINTER(c_ubyte), c_int]
-lame_encode_buffer_int = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_int
-lame_encode_buffer_int.restype = c_int
-lame_encode_buffer_int.argtypes = [POINTER(lame_global_flags), POINTER(c_int), POINTER(c_int), c_int, POINTER(c_ubyte), c_int]
-lame_encode_flush = _libraries['/usr/lib/libmp3lame.so'].lame_encode_flush
-lame_encode_flush.restype = c_int
-lame_encode_flush.argtypes = [POINTER(lame_global_flags), POINTER(c_ubyte), c_int]
-lame_encode_flush_nogap = _libraries['/usr/lib/libmp3lame.so'].lame_encode_flush_nogap
-lame_encode_flush_nogap.restype = c_int
-lame_encode_flush_nogap.argtypes = [POINTER(lame_global_flags), POINTER(c_ubyte), c_int]
-lame_init_bitstream = _libraries['/usr/lib/libmp3lame.so'].lame_init_bitstream
-lame_init_bitstream.restype = c_int
-lame_init_bitstream.argtypes = [POINTER(lame_global_flags)]
-lame_bitrate_hist = _libraries['/usr/lib/libmp3lame.so'].lame_bitrate_hist
-lame_bitrate_hist.restype = None
-lame_bitrate_hist.argtypes = [POINTER(lame_global_flags), POINTER(c_int)]
-lame_bitrate_kbps = _libraries['/usr/lib/libmp3lame.so'].lame_bitrate_kbps
-lame_bitrate_kbps.restype = None
-lame_bitrate_kbps.argtypes = [POINTER(lame_global_flags), POINTER(c_int)]
-lame_stereo_mode_hist = _libraries['/usr/lib/libmp3lame.so'].lame_stereo_mode_hist
-lame_stereo_mode_hist.restype = None
-lame_stereo_mode_hist.argtypes = [POINTER(lame_global_flags), POINTER(c_int)]
-lame_bitrate_stereo_mode_hist = _libraries['/usr/lib/libmp3lame.so'].lame_bitrate_stereo_mode_hist
-lame_bitrate_stereo_mode_hist.restype = None
-lame_bitrate_stereo_mode_hist.argtypes = [POINTER(lame_global_flags), POINTER(c_int * 4)]
-lame_block_type_hist = _libraries['/usr/lib/libmp3lame.so'].lame_block_type_hist
-lame_block_type_hist.restype = None
-lame_block_type_hist.argtypes = [POINTER(lame_global_flags), POINTER(c_int)]
-lame_bitrate_block_type_hist = _libraries['/usr/lib/libmp3lame.so'].lame_bitrate_block_type_hist
-lame_bitrate_block_type_hist.restype = None
-lame_bitrate_block_type_hist.argtypes = [POINTER(lame_global_flags), POINTER(c_int * 6)]
-lame_mp3_tags_fid = _libraries['/usr/lib/libmp3lame.so'].lame_mp3_tags_fid
-lame_mp3_tags_fid.restype = None
-lame_mp3_tags_fid.argtypes = [POINTER(lame_global_flags), POINTER(FILE)]
-lame_get_lametag_frame = _libraries['/usr/lib/libmp3lame.so'].lame_get_lametag_frame
-lame_get_lametag_frame.restype = size_t
-lame_get_lametag_frame.argtypes = [POINTER(lame_global_flags), POINTER(c_ubyte), size_t]
-lame_close = _libraries['/usr/lib/libmp3lame.so'].lame_close
-lame_close.restype = c_int
-lame_close.argtypes = [POINTER(lame_global_flags)]
-class hip_global_struct(Structure):
-    pass
-hip_global_struct._fields_ = [
-]
-hip_global_flags = hip_global_struct
-hip_t = POINTER(hip_global_flags)
-class mp3data_struct(Structure):
-    pass
-mp3data_struct._fields_ = [
-    ('header_parsed', c_int),
-    ('stereo', c_int),
-    ('samplerate', c_int),
-    ('bitrate', c_int),
-    ('mode', c_int),
-    ('mode_ext', c_int),
-    ('framesize', c_int),
-    ('nsamp', c_ulong),
-    ('totalframes', c_int),
-    ('framenum', c_int),
-]
-hip_decode_init = _libraries['/usr/lib/libmp3lame.so'].hip_decode_init
-hip_decode_init.restype = hip_t
-hip_decode_init.argtypes = []
-hip_decode_exit = _libraries['/usr/lib/libmp3lame.so'].hip_decode_exit
-hip_decode_exit.restype = c_int
-hip_decode_exit.argtypes = [hip_t]
-hip_set_errorf = _libraries['/usr/lib/libmp3lame.so'].hip_set_errorf
-hip_set_errorf.restype = None
-hip_set_errorf.argtypes = [hip_t, lame_report_function]
-hip_set_debugf = _libraries['/usr/lib/libmp3lame.so'].hip_set_debugf
-hip_set_debugf.restype = None
-hip_set_debugf.argtypes = [hip_t, lame_report_function]
-hip_set_msgf = _libraries['/usr/lib/libmp3lame.so'].hip_set_msgf
-hip_set_msgf.restype = None
-hip_set_msgf.argtypes = [hip_t, lame_report_function]
-hip_decode = _libraries['/usr/lib/libmp3lame.so'].hip_decode
-hip_decode.restype = c_int
-hip_decode.argtypes = [hip_t, POINTER(c_ubyte), size_t, POINTER(c_short), POINTER(c_short)]
-hip_decode_headers = _libraries['/usr/lib/libmp3lame.so'].hip_decode_headers
-hip_decode_headers.restype = c_int
-hip_decode_headers.argtypes = [hip_t, POINTER(c_ubyte), size_t, POINTER(c_short), POINTER(c_short), POINTER(mp3data_struct)]
-hip_decode1 = _libraries['/usr/lib/libmp3lame.so'].hip_decode1
-hip_decode1.restype = c_int
-hip_decode1.argtypes = [hip_t, POINTER(c_ubyte), size_t, POINTER(c_short), POINTER(c_short)]
-hip_decode1_headers = _libraries['/usr/lib/libmp3lame.so'].hip_decode1_headers
-hip_decode1_headers.restype = c_int
-hip_decode1_headers.argtypes = [hip_t, POINTER(c_ubyte), size_t, POINTER(c_short), POINTER(c_short), POINTER(mp3data_struct)]
-hip_decode1_headersB = _libraries['/usr/lib/libmp3lame.so'].hip_decode1_headersB
-hip_decode1_headersB.restype = c_int
-hip_decode1_headersB.argtypes = [hip_t, POINTER(c_ubyte), size_t, POINTER(c_short), POINTER(c_short), POINTER(mp3data_struct), POINTER(c_int), POINTER(c_int)]
-id3tag_genre_list = _libraries['/usr/lib/libmp3lame.so'].id3tag_genre_list
-id3tag_genre_list.restype = None
-id3tag_genre_list.argtypes = [CFUNCTYPE(None, c_int, STRING, c_void_p), c_void_p]
-id3tag_init = _libraries['/usr/lib/libmp3lame.so'].id3tag_init
-id3tag_init.restype = None
-id3tag_init.argtypes = [lame_t]
-id3tag_add_v2 = _libraries['/usr/lib/libmp3lame.so'].id3tag_add_v2
-id3tag_add_v2.restype = None
-id3tag_add_v2.argtypes = [lame_t]
-id3tag_v1_only = _libraries['/usr/lib/libmp3lame.so'].id3tag_v1_only
-id3tag_v1_only.restype = None
-id3tag_v1_only.argtypes = [lame_t]
-id3tag_v2_only = _libraries['/usr/lib/libmp3lame.so'].id3tag_v2_only
-id3tag_v2_only.restype = None
-id3tag_v2_only.argtypes = [lame_t]
-id3tag_space_v1 = _libraries['/usr/lib/libmp3lame.so'].id3tag_space_v1
-id3tag_space_v1.restype = None
-id3tag_space_v1.argtypes = [lame_t]
-id3tag_pad_v2 = _libraries['/usr/lib/libmp3lame.so'].id3tag_pad_v2
-id3tag_pad_v2.restype = None
-id3tag_pad_v2.argtypes = [lame_t]
-id3tag_set_pad = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_pad
-id3tag_set_pad.restype = None
-id3tag_set_pad.argtypes = [lame_t, size_t]
-id3tag_set_title = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_title
-id3tag_set_title.restype = None
-id3tag_set_title.argtypes = [lame_t, STRING]
-id3tag_set_artist = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_artist
-id3tag_set_artist.restype = None
-id3tag_set_artist.argtypes = [lame_t, STRING]
-id3tag_set_album = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_album
-id3tag_set_album.restype = None
-id3tag_set_album.argtypes = [lame_t, STRING]
-id3tag_set_year = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_year
-id3tag_set_year.restype = None
-id3tag_set_year.argtypes = [lame_t, STRING]
-id3tag_set_comment = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_comment
-id3tag_set_comment.restype = None
-id3tag_set_comment.argtypes = [lame_t, STRING]
-id3tag_set_track = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_track
-id3tag_set_track.restype = c_int
-id3tag_set_track.argtypes = [lame_t, STRING]
-id3tag_set_genre = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_genre
-id3tag_set_genre.restype = c_int
-id3tag_set_genre.argtypes = [lame_t, STRING]
-id3tag_set_fieldvalue = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_fieldvalue
-id3tag_set_fieldvalue.restype = c_int
-id3tag_set_fieldvalue.argtypes = [lame_t, STRING]
-id3tag_set_albumart = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_albumart
-id3tag_set_albumart.restype = c_int
-id3tag_set_albumart.argtypes = [lame_t, STRING, size_t]
-lame_get_id3v1_tag = _libraries['/usr/lib/libmp3lame.so'].lame_get_id3v1_tag
-lame_get_id3v1_tag.restype = size_t
-lame_get_id3v1_tag.argtypes = [lame_t, POINTER(c_ubyte), size_t]
-lame_get_id3v2_tag = _libraries['/usr/lib/libmp3lame.so'].lame_get_id3v2_tag
-lame_get_id3v2_tag.restype = size_t
-lame_get_id3v2_tag.argtypes = [lame_t, POINTER(c_ubyte), size_t]
-lame_set_write_id3tag_automatic = _libraries['/usr/lib/libmp3lame.so'].lame_set_write_id3tag_automatic
-lame_set_write_id3tag_automatic.restype = None
-lame_set_write_id3tag_automatic.argtypes = [POINTER(lame_global_flags), c_int]
-lame_get_write_id3tag_automatic = _libraries['/usr/lib/libmp3lame.so'].lame_get_write_id3tag_automatic
-lame_get_write_id3tag_automatic.restype = c_int
-lame_get_write_id3tag_automatic.argtypes = [POINTER(lame_global_flags)]
-id3tag_set_textinfo_latin1 = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_textinfo_latin1
-id3tag_set_textinfo_latin1.restype = c_int
-id3tag_set_textinfo_latin1.argtypes = [lame_t, STRING, STRING]
-id3tag_set_comment_latin1 = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_comment_latin1
-id3tag_set_comment_latin1.restype = c_int
-id3tag_set_comment_latin1.argtypes = [lame_t, STRING, STRING, STRING]
-id3tag_set_fieldvalue_utf16 = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_fieldvalue_utf16
-id3tag_set_fieldvalue_utf16.restype = c_int
-id3tag_set_fieldvalue_utf16.argtypes = [lame_t, POINTER(c_ushort)]
-id3tag_set_textinfo_utf16 = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_textinfo_utf16
-id3tag_set_textinfo_utf16.restype = c_int
-id3tag_set_textinfo_utf16.argtypes = [lame_t, STRING, POINTER(c_ushort)]
-id3tag_set_comment_utf16 = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_comment_utf16
-id3tag_set_comment_utf16.restype = c_int
-id3tag_set_comment_utf16.argtypes = [lame_t, STRING, POINTER(c_ushort), POINTER(c_ushort)]
-bitrate_table = (c_int * 16 * 3).in_dll(_libraries['/usr/lib/libmp3lame.so'], 'bitrate_table')
-samplerate_table = (c_int * 4 * 3).in_dll(_libraries['/usr/lib/libmp3lame.so'], 'samplerate_table')
-lame_get_bitrate = _libraries['/usr/lib/libmp3lame.so'].lame_get_bitrate
-lame_get_bitrate.restype = c_int
-lame_get_bitrate.argtypes = [c_int, c_int]
-lame_get_samplerate = _libraries['/usr/lib/libmp3lame.so'].lame_get_samplerate
-lame_get_samplerate.restype = c_int
-lame_get_samplerate.argtypes = [c_int, c_int]
 
 # values for enumeration 'lame_errorcodes_t'
 lame_errorcodes_t = c_int # enum
-class _IO_jump_t(Structure):
-    pass
-_IO_jump_t._fields_ = [
-]
 _IO_lock_t = None
-class _IO_marker(Structure):
-    pass
-_IO_marker._fields_ = [
-    ('_next', POINTER(_IO_marker)),
-    ('_sbuf', POINTER(_IO_FILE)),
-    ('_pos', c_int),
-]
 
 # values for enumeration '__codecvt_result'
 __codecvt_result = c_int # enum
-_IO_FILE._fields_ = [
-    ('_flags', c_int),
-    ('_IO_read_ptr', STRING),
-    ('_IO_read_end', STRING),
-    ('_IO_read_base', STRING),
-    ('_IO_write_base', STRING),
-    ('_IO_write_ptr', STRING),
-    ('_IO_write_end', STRING),
-    ('_IO_buf_base', STRING),
-    ('_IO_buf_end', STRING),
-    ('_IO_save_base', STRING),
-    ('_IO_backup_base', STRING),
-    ('_IO_save_end', STRING),
-    ('_markers', POINTER(_IO_marker)),
-    ('_chain', POINTER(_IO_FILE)),
-    ('_fileno', c_int),
-    ('_flags2', c_int),
-    ('_old_offset', __off_t),
-    ('_cur_column', c_ushort),
-    ('_vtable_offset', c_byte),
-    ('_shortbuf', c_char * 1),
-    ('_lock', POINTER(_IO_lock_t)),
-    ('_offset', __off64_t),
-    ('__pad1', c_void_p),
-    ('__pad2', c_void_p),
-    ('__pad3', c_void_p),
-    ('__pad4', c_void_p),
-    ('__pad5', size_t),
-    ('_mode', c_int),
-    ('_unused2', c_char * 20),
-]
-class _IO_FILE_plus(Structure):
-    pass
-_IO_FILE_plus._fields_ = [
-]
-_IO_2_1_stdin_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmp3lame.so'], '_IO_2_1_stdin_')
-_IO_2_1_stdout_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmp3lame.so'], '_IO_2_1_stdout_')
-_IO_2_1_stderr_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmp3lame.so'], '_IO_2_1_stderr_')
 __io_read_fn = CFUNCTYPE(__ssize_t, c_void_p, STRING, size_t)
 __io_write_fn = CFUNCTYPE(__ssize_t, c_void_p, STRING, size_t)
 __io_seek_fn = CFUNCTYPE(c_int, c_void_p, POINTER(__off64_t), c_int)
@@ -1286,292 +388,9 @@ cookie_read_function_t = __io_read_fn
 cookie_write_function_t = __io_write_fn
 cookie_seek_function_t = __io_seek_fn
 cookie_close_function_t = __io_close_fn
-class _IO_cookie_io_functions_t(Structure):
-    pass
-_IO_cookie_io_functions_t._fields_ = [
-    ('read', POINTER(__io_read_fn)),
-    ('write', POINTER(__io_write_fn)),
-    ('seek', POINTER(__io_seek_fn)),
-    ('close', POINTER(__io_close_fn)),
-]
-cookie_io_functions_t = _IO_cookie_io_functions_t
-class _IO_cookie_file(Structure):
-    pass
-_IO_cookie_file._fields_ = [
-]
-__underflow = _libraries['/usr/lib/libmp3lame.so'].__underflow
-__underflow.restype = c_int
-__underflow.argtypes = [POINTER(_IO_FILE)]
-__uflow = _libraries['/usr/lib/libmp3lame.so'].__uflow
-__uflow.restype = c_int
-__uflow.argtypes = [POINTER(_IO_FILE)]
-__overflow = _libraries['/usr/lib/libmp3lame.so'].__overflow
-__overflow.restype = c_int
-__overflow.argtypes = [POINTER(_IO_FILE), c_int]
-_IO_getc = _libraries['/usr/lib/libmp3lame.so']._IO_getc
-_IO_getc.restype = c_int
-_IO_getc.argtypes = [POINTER(_IO_FILE)]
-_IO_putc = _libraries['/usr/lib/libmp3lame.so']._IO_putc
-_IO_putc.restype = c_int
-_IO_putc.argtypes = [c_int, POINTER(_IO_FILE)]
-_IO_feof = _libraries['/usr/lib/libmp3lame.so']._IO_feof
-_IO_feof.restype = c_int
-_IO_feof.argtypes = [POINTER(_IO_FILE)]
-_IO_ferror = _libraries['/usr/lib/libmp3lame.so']._IO_ferror
-_IO_ferror.restype = c_int
-_IO_ferror.argtypes = [POINTER(_IO_FILE)]
-_IO_peekc_locked = _libraries['/usr/lib/libmp3lame.so']._IO_peekc_locked
-_IO_peekc_locked.restype = c_int
-_IO_peekc_locked.argtypes = [POINTER(_IO_FILE)]
-_IO_flockfile = _libraries['/usr/lib/libmp3lame.so']._IO_flockfile
-_IO_flockfile.restype = None
-_IO_flockfile.argtypes = [POINTER(_IO_FILE)]
-_IO_funlockfile = _libraries['/usr/lib/libmp3lame.so']._IO_funlockfile
-_IO_funlockfile.restype = None
-_IO_funlockfile.argtypes = [POINTER(_IO_FILE)]
-_IO_ftrylockfile = _libraries['/usr/lib/libmp3lame.so']._IO_ftrylockfile
-_IO_ftrylockfile.restype = c_int
-_IO_ftrylockfile.argtypes = [POINTER(_IO_FILE)]
-_IO_vfscanf = _libraries['/usr/lib/libmp3lame.so']._IO_vfscanf
-_IO_vfscanf.restype = c_int
-_IO_vfscanf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag), POINTER(c_int)]
-_IO_vfprintf = _libraries['/usr/lib/libmp3lame.so']._IO_vfprintf
-_IO_vfprintf.restype = c_int
-_IO_vfprintf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag)]
-_IO_padn = _libraries['/usr/lib/libmp3lame.so']._IO_padn
-_IO_padn.restype = __ssize_t
-_IO_padn.argtypes = [POINTER(_IO_FILE), c_int, __ssize_t]
-_IO_sgetn = _libraries['/usr/lib/libmp3lame.so']._IO_sgetn
-_IO_sgetn.restype = size_t
-_IO_sgetn.argtypes = [POINTER(_IO_FILE), c_void_p, size_t]
-_IO_seekoff = _libraries['/usr/lib/libmp3lame.so']._IO_seekoff
-_IO_seekoff.restype = __off64_t
-_IO_seekoff.argtypes = [POINTER(_IO_FILE), __off64_t, c_int, c_int]
-_IO_seekpos = _libraries['/usr/lib/libmp3lame.so']._IO_seekpos
-_IO_seekpos.restype = __off64_t
-_IO_seekpos.argtypes = [POINTER(_IO_FILE), __off64_t, c_int]
-_IO_free_backup_area = _libraries['/usr/lib/libmp3lame.so']._IO_free_backup_area
-_IO_free_backup_area.restype = None
-_IO_free_backup_area.argtypes = [POINTER(_IO_FILE)]
-__FILE = _IO_FILE
 off_t = __off_t
 off64_t = __off64_t
 ssize_t = __ssize_t
-fpos_t = _G_fpos_t
-fpos64_t = _G_fpos64_t
-remove = _libraries['/usr/lib/libmp3lame.so'].remove
-remove.restype = c_int
-remove.argtypes = [STRING]
-rename = _libraries['/usr/lib/libmp3lame.so'].rename
-rename.restype = c_int
-rename.argtypes = [STRING, STRING]
-renameat = _libraries['/usr/lib/libmp3lame.so'].renameat
-renameat.restype = c_int
-renameat.argtypes = [c_int, STRING, c_int, STRING]
-tmpfile = _libraries['/usr/lib/libmp3lame.so'].tmpfile
-tmpfile.restype = POINTER(FILE)
-tmpfile.argtypes = []
-tmpfile64 = _libraries['/usr/lib/libmp3lame.so'].tmpfile64
-tmpfile64.restype = POINTER(FILE)
-tmpfile64.argtypes = []
-tmpnam = _libraries['/usr/lib/libmp3lame.so'].tmpnam
-tmpnam.restype = STRING
-tmpnam.argtypes = [STRING]
-tmpnam_r = _libraries['/usr/lib/libmp3lame.so'].tmpnam_r
-tmpnam_r.restype = STRING
-tmpnam_r.argtypes = [STRING]
-tempnam = _libraries['/usr/lib/libmp3lame.so'].tempnam
-tempnam.restype = STRING
-tempnam.argtypes = [STRING, STRING]
-fclose = _libraries['/usr/lib/libmp3lame.so'].fclose
-fclose.restype = c_int
-fclose.argtypes = [POINTER(FILE)]
-fflush = _libraries['/usr/lib/libmp3lame.so'].fflush
-fflush.restype = c_int
-fflush.argtypes = [POINTER(FILE)]
-fflush_unlocked = _libraries['/usr/lib/libmp3lame.so'].fflush_unlocked
-fflush_unlocked.restype = c_int
-fflush_unlocked.argtypes = [POINTER(FILE)]
-fcloseall = _libraries['/usr/lib/libmp3lame.so'].fcloseall
-fcloseall.restype = c_int
-fcloseall.argtypes = []
-fopen = _libraries['/usr/lib/libmp3lame.so'].fopen
-fopen.restype = POINTER(FILE)
-fopen.argtypes = [STRING, STRING]
-freopen = _libraries['/usr/lib/libmp3lame.so'].freopen
-freopen.restype = POINTER(FILE)
-freopen.argtypes = [STRING, STRING, POINTER(FILE)]
-fopen64 = _libraries['/usr/lib/libmp3lame.so'].fopen64
-fopen64.restype = POINTER(FILE)
-fopen64.argtypes = [STRING, STRING]
-freopen64 = _libraries['/usr/lib/libmp3lame.so'].freopen64
-freopen64.restype = POINTER(FILE)
-freopen64.argtypes = [STRING, STRING, POINTER(FILE)]
-fdopen = _libraries['/usr/lib/libmp3lame.so'].fdopen
-fdopen.restype = POINTER(FILE)
-fdopen.argtypes = [c_int, STRING]
-fopencookie = _libraries['/usr/lib/libmp3lame.so'].fopencookie
-fopencookie.restype = POINTER(FILE)
-fopencookie.argtypes = [c_void_p, STRING, _IO_cookie_io_functions_t]
-fmemopen = _libraries['/usr/lib/libmp3lame.so'].fmemopen
-fmemopen.restype = POINTER(FILE)
-fmemopen.argtypes = [c_void_p, size_t, STRING]
-open_memstream = _libraries['/usr/lib/libmp3lame.so'].open_memstream
-open_memstream.restype = POINTER(FILE)
-open_memstream.argtypes = [POINTER(STRING), POINTER(size_t)]
-setbuf = _libraries['/usr/lib/libmp3lame.so'].setbuf
-setbuf.restype = None
-setbuf.argtypes = [POINTER(FILE), STRING]
-setvbuf = _libraries['/usr/lib/libmp3lame.so'].setvbuf
-setvbuf.restype = c_int
-setvbuf.argtypes = [POINTER(FILE), STRING, c_int, size_t]
-setbuffer = _libraries['/usr/lib/libmp3lame.so'].setbuffer
-setbuffer.restype = None
-setbuffer.argtypes = [POINTER(FILE), STRING, size_t]
-setlinebuf = _libraries['/usr/lib/libmp3lame.so'].setlinebuf
-setlinebuf.restype = None
-setlinebuf.argtypes = [POINTER(FILE)]
-fscanf = _libraries['/usr/lib/libmp3lame.so'].fscanf
-fscanf.restype = c_int
-fscanf.argtypes = [POINTER(FILE), STRING]
-scanf = _libraries['/usr/lib/libmp3lame.so'].scanf
-scanf.restype = c_int
-scanf.argtypes = [STRING]
-sscanf = _libraries['/usr/lib/libmp3lame.so'].sscanf
-sscanf.restype = c_int
-sscanf.argtypes = [STRING, STRING]
-vfscanf = _libraries['/usr/lib/libmp3lame.so'].vfscanf
-vfscanf.restype = c_int
-vfscanf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]
-vscanf = _libraries['/usr/lib/libmp3lame.so'].vscanf
-vscanf.restype = c_int
-vscanf.argtypes = [STRING, POINTER(__va_list_tag)]
-vsscanf = _libraries['/usr/lib/libmp3lame.so'].vsscanf
-vsscanf.restype = c_int
-vsscanf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]
-fgetc = _libraries['/usr/lib/libmp3lame.so'].fgetc
-fgetc.restype = c_int
-fgetc.argtypes = [POINTER(FILE)]
-getc = _libraries['/usr/lib/libmp3lame.so'].getc
-getc.restype = c_int
-getc.argtypes = [POINTER(FILE)]
-fputc = _libraries['/usr/lib/libmp3lame.so'].fputc
-fputc.restype = c_int
-fputc.argtypes = [c_int, POINTER(FILE)]
-putc = _libraries['/usr/lib/libmp3lame.so'].putc
-putc.restype = c_int
-putc.argtypes = [c_int, POINTER(FILE)]
-getw = _libraries['/usr/lib/libmp3lame.so'].getw
-getw.restype = c_int
-getw.argtypes = [POINTER(FILE)]
-putw = _libraries['/usr/lib/libmp3lame.so'].putw
-putw.restype = c_int
-putw.argtypes = [c_int, POINTER(FILE)]
-gets = _libraries['/usr/lib/libmp3lame.so'].gets
-gets.restype = STRING
-gets.argtypes = [STRING]
-__getdelim = _libraries['/usr/lib/libmp3lame.so'].__getdelim
-__getdelim.restype = __ssize_t
-__getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]
-getdelim = _libraries['/usr/lib/libmp3lame.so'].getdelim
-getdelim.restype = __ssize_t
-getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]
-fputs = _libraries['/usr/lib/libmp3lame.so'].fputs
-fputs.restype = c_int
-fputs.argtypes = [STRING, POINTER(FILE)]
-puts = _libraries['/usr/lib/libmp3lame.so'].puts
-puts.restype = c_int
-puts.argtypes = [STRING]
-ungetc = _libraries['/usr/lib/libmp3lame.so'].ungetc
-ungetc.restype = c_int
-ungetc.argtypes = [c_int, POINTER(FILE)]
-fwrite = _libraries['/usr/lib/libmp3lame.so'].fwrite
-fwrite.restype = size_t
-fwrite.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-fputs_unlocked = _libraries['/usr/lib/libmp3lame.so'].fputs_unlocked
-fputs_unlocked.restype = c_int
-fputs_unlocked.argtypes = [STRING, POINTER(FILE)]
-fwrite_unlocked = _libraries['/usr/lib/libmp3lame.so'].fwrite_unlocked
-fwrite_unlocked.restype = size_t
-fwrite_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-fseek = _libraries['/usr/lib/libmp3lame.so'].fseek
-fseek.restype = c_int
-fseek.argtypes = [POINTER(FILE), c_long, c_int]
-ftell = _libraries['/usr/lib/libmp3lame.so'].ftell
-ftell.restype = c_long
-ftell.argtypes = [POINTER(FILE)]
-rewind = _libraries['/usr/lib/libmp3lame.so'].rewind
-rewind.restype = None
-rewind.argtypes = [POINTER(FILE)]
-fseeko = _libraries['/usr/lib/libmp3lame.so'].fseeko
-fseeko.restype = c_int
-fseeko.argtypes = [POINTER(FILE), __off_t, c_int]
-ftello = _libraries['/usr/lib/libmp3lame.so'].ftello
-ftello.restype = __off_t
-ftello.argtypes = [POINTER(FILE)]
-fgetpos = _libraries['/usr/lib/libmp3lame.so'].fgetpos
-fgetpos.restype = c_int
-fgetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]
-fsetpos = _libraries['/usr/lib/libmp3lame.so'].fsetpos
-fsetpos.restype = c_int
-fsetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]
-fseeko64 = _libraries['/usr/lib/libmp3lame.so'].fseeko64
-fseeko64.restype = c_int
-fseeko64.argtypes = [POINTER(FILE), __off64_t, c_int]
-ftello64 = _libraries['/usr/lib/libmp3lame.so'].ftello64
-ftello64.restype = __off64_t
-ftello64.argtypes = [POINTER(FILE)]
-fgetpos64 = _libraries['/usr/lib/libmp3lame.so'].fgetpos64
-fgetpos64.restype = c_int
-fgetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]
-fsetpos64 = _libraries['/usr/lib/libmp3lame.so'].fsetpos64
-fsetpos64.restype = c_int
-fsetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]
-clearerr = _libraries['/usr/lib/libmp3lame.so'].clearerr
-clearerr.restype = None
-clearerr.argtypes = [POINTER(FILE)]
-feof = _libraries['/usr/lib/libmp3lame.so'].feof
-feof.restype = c_int
-feof.argtypes = [POINTER(FILE)]
-ferror = _libraries['/usr/lib/libmp3lame.so'].ferror
-ferror.restype = c_int
-ferror.argtypes = [POINTER(FILE)]
-clearerr_unlocked = _libraries['/usr/lib/libmp3lame.so'].clearerr_unlocked
-clearerr_unlocked.restype = None
-clearerr_unlocked.argtypes = [POINTER(FILE)]
-perror = _libraries['/usr/lib/libmp3lame.so'].perror
-perror.restype = None
-perror.argtypes = [STRING]
-fileno = _libraries['/usr/lib/libmp3lame.so'].fileno
-fileno.restype = c_int
-fileno.argtypes = [POINTER(FILE)]
-fileno_unlocked = _libraries['/usr/lib/libmp3lame.so'].fileno_unlocked
-fileno_unlocked.restype = c_int
-fileno_unlocked.argtypes = [POINTER(FILE)]
-popen = _libraries['/usr/lib/libmp3lame.so'].popen
-popen.restype = POINTER(FILE)
-popen.argtypes = [STRING, STRING]
-pclose = _libraries['/usr/lib/libmp3lame.so'].pclose
-pclose.restype = c_int
-pclose.argtypes = [POINTER(FILE)]
-ctermid = _libraries['/usr/lib/libmp3lame.so'].ctermid
-ctermid.restype = STRING
-ctermid.argtypes = [STRING]
-cuserid = _libraries['/usr/lib/libmp3lame.so'].cuserid
-cuserid.restype = STRING
-cuserid.argtypes = [STRING]
-obstack._fields_ = [
-]
-flockfile = _libraries['/usr/lib/libmp3lame.so'].flockfile
-flockfile.restype = None
-flockfile.argtypes = [POINTER(FILE)]
-ftrylockfile = _libraries['/usr/lib/libmp3lame.so'].ftrylockfile
-ftrylockfile.restype = c_int
-ftrylockfile.argtypes = [POINTER(FILE)]
-funlockfile = _libraries['/usr/lib/libmp3lame.so'].funlockfile
-funlockfile.restype = None
-funlockfile.argtypes = [POINTER(FILE)]
-va_list = __gnuc_va_list
 ptrdiff_t = c_long
 __all__ = ['lame_set_VBR_quality', '_ATFILE_SOURCE', 'EOF',
            '__glibc_unlikely', 'getc_unlocked', '_IO_USER_LOCK',
@@ -1817,3 +636,1927 @@ __all__ = ['lame_set_VBR_quality', '_ATFILE_SOURCE', 'EOF',
            'lame_get_encoder_delay', '__socklen_t', '__USE_ISOC11',
            'get_lame_version', 'MDB_DEFAULT', '_IOLBF', 'offsetof',
            'vbr_mode_e']
+
+
+# The base class, lazy names used and code that finishes defining each
+# lazy name.
+_definitions = {
+    'putc': (None, ('FILE', '_IO_putc'),
+        'def putc(_ch,_fp): return _IO_putc (_ch, _fp) # macro\n'
+        "putc = _libraries['/usr/lib/libmp3lame.so'].putc\n"
+        'putc.restype = c_int\n'
+        'putc.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    '_IO_FILE': ('Structure', ('_IO_marker',),
+        '_IO_FILE._fields_ = [\n'
+        "    ('_flags', c_int),\n"
+        "    ('_IO_read_ptr', STRING),\n"
+        "    ('_IO_read_end', STRING),\n"
+        "    ('_IO_read_base', STRING),\n"
+        "    ('_IO_write_base', STRING),\n"
+        "    ('_IO_write_ptr', STRING),\n"
+        "    ('_IO_write_end', STRING),\n"
+        "    ('_IO_buf_base', STRING),\n"
+        "    ('_IO_buf_end', STRING),\n"
+        "    ('_IO_save_base', STRING),\n"
+        "    ('_IO_backup_base', STRING),\n"
+        "    ('_IO_save_end', STRING),\n"
+        "    ('_markers', POINTER(_IO_marker)),\n"
+        "    ('_chain', POINTER(_IO_FILE)),\n"
+        "    ('_fileno', c_int),\n"
+        "    ('_flags2', c_int),\n"
+        "    ('_old_offset', __off_t),\n"
+        "    ('_cur_column', c_ushort),\n"
+        "    ('_vtable_offset', c_byte),\n"
+        "    ('_shortbuf', c_char * 1),\n"
+        "    ('_lock', POINTER(_IO_lock_t)),\n"
+        "    ('_offset', __off64_t),\n"
+        "    ('__pad1', c_void_p),\n"
+        "    ('__pad2', c_void_p),\n"
+        "    ('__pad3', c_void_p),\n"
+        "    ('__pad4', c_void_p),\n"
+        "    ('__pad5', size_t),\n"
+        "    ('_mode', c_int),\n"
+        "    ('_unused2', c_char * 20),\n"
+        ']'
+        ),
+    'stdout': (None, ('_IO_FILE',),
+        "stdout = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmp3lame.so'], 'stdout')\n"
+        'stdout = stdout # alias'
+        ),
+    'stdin': (None, ('_IO_FILE',),
+        "stdin = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmp3lame.so'], 'stdin')\n"
+        'stdin = stdin # alias'
+        ),
+    'stderr': (None, ('_IO_FILE',),
+        "stderr = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmp3lame.so'], 'stderr')\n"
+        'stderr = stderr # alias'
+        ),
+    'getc': (None, ('FILE', '_IO_getc'),
+        'def getc(_fp): return _IO_getc (_fp) # macro\n'
+        "getc = _libraries['/usr/lib/libmp3lame.so'].getc\n"
+        'getc.restype = c_int\n'
+        'getc.argtypes = [POINTER(FILE)]'
+        ),
+    '_G_fpos_t': ('Structure', ('__mbstate_t',),
+        '_G_fpos_t._fields_ = [\n'
+        "    ('__pos', __off_t),\n"
+        "    ('__state', __mbstate_t),\n"
+        ']'
+        ),
+    '__mbstate_t': ('Structure', ('N11__mbstate_t3DOT_2E',),
+        '__mbstate_t._fields_ = [\n'
+        "    ('__count', c_int),\n"
+        "    ('__value', N11__mbstate_t3DOT_2E),\n"
+        ']'
+        ),
+    'N11__mbstate_t3DOT_2E': ('Union', (),
+        'N11__mbstate_t3DOT_2E._fields_ = [\n'
+        "    ('__wch', c_uint),\n"
+        "    ('__wchb', c_char * 4),\n"
+        ']'
+        ),
+    '_IO_fpos_t': (None, ('_G_fpos_t',),
+        '_IO_fpos_t = _G_fpos_t # alias'
+        ),
+    '__va_list_tag': ('Structure', (),
+        '__va_list_tag._fields_ = [\n'
+        ']'
+        ),
+    '__gnuc_va_list': (None, ('__va_list_tag',),
+        '__gnuc_va_list = __va_list_tag * 1'
+        ),
+    '_G_va_list': (None, ('__gnuc_va_list',),
+        '_G_va_list = __gnuc_va_list # alias'
+        ),
+    '_IO_va_list': (None, ('__gnuc_va_list',),
+        '_IO_va_list = __gnuc_va_list # alias'
+        ),
+    '_G_fpos64_t': ('Structure', ('__mbstate_t',),
+        '_G_fpos64_t._fields_ = [\n'
+        "    ('__pos', __off64_t),\n"
+        "    ('__state', __mbstate_t),\n"
+        ']'
+        ),
+    '_IO_fpos64_t': (None, ('_G_fpos64_t',),
+        '_IO_fpos64_t = _G_fpos64_t # alias'
+        ),
+    'getchar': (None, (),
+        "getchar = _libraries['/usr/lib/libmp3lame.so'].getchar\n"
+        'getchar.restype = c_int\n'
+        'getchar.argtypes = []'
+        ),
+    'FILE': (None, ('_IO_FILE',),
+        'FILE = _IO_FILE'
+        ),
+    'fgetc_unlocked': (None, ('FILE',),
+        "fgetc_unlocked = _libraries['/usr/lib/libmp3lame.so'].fgetc_unlocked\n"
+        'fgetc_unlocked.restype = c_int\n'
+        'fgetc_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'getc_unlocked': (None, ('FILE',),
+        "getc_unlocked = _libraries['/usr/lib/libmp3lame.so'].getc_unlocked\n"
+        'getc_unlocked.restype = c_int\n'
+        'getc_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'getchar_unlocked': (None, (),
+        "getchar_unlocked = _libraries['/usr/lib/libmp3lame.so'].getchar_unlocked\n"
+        'getchar_unlocked.restype = c_int\n'
+        'getchar_unlocked.argtypes = []'
+        ),
+    'putchar': (None, (),
+        "putchar = _libraries['/usr/lib/libmp3lame.so'].putchar\n"
+        'putchar.restype = c_int\n'
+        'putchar.argtypes = [c_int]'
+        ),
+    'fputc_unlocked': (None, ('FILE',),
+        "fputc_unlocked = _libraries['/usr/lib/libmp3lame.so'].fputc_unlocked\n"
+        'fputc_unlocked.restype = c_int\n'
+        'fputc_unlocked.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'putc_unlocked': (None, ('FILE',),
+        "putc_unlocked = _libraries['/usr/lib/libmp3lame.so'].putc_unlocked\n"
+        'putc_unlocked.restype = c_int\n'
+        'putc_unlocked.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'putchar_unlocked': (None, (),
+        "putchar_unlocked = _libraries['/usr/lib/libmp3lame.so'].putchar_unlocked\n"
+        'putchar_unlocked.restype = c_int\n'
+        'putchar_unlocked.argtypes = [c_int]'
+        ),
+    'getline': (None, ('FILE',),
+        "getline = _libraries['/usr/lib/libmp3lame.so'].getline\n"
+        'getline.restype = __ssize_t\n'
+        'getline.argtypes = [POINTER(STRING), POINTER(size_t), POINTER(FILE)]'
+        ),
+    'feof_unlocked': (None, ('FILE',),
+        "feof_unlocked = _libraries['/usr/lib/libmp3lame.so'].feof_unlocked\n"
+        'feof_unlocked.restype = c_int\n'
+        'feof_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'ferror_unlocked': (None, ('FILE',),
+        "ferror_unlocked = _libraries['/usr/lib/libmp3lame.so'].ferror_unlocked\n"
+        'ferror_unlocked.restype = c_int\n'
+        'ferror_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    '__sprintf_chk': (None, (),
+        "__sprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__sprintf_chk\n"
+        '__sprintf_chk.restype = c_int\n'
+        '__sprintf_chk.argtypes = [STRING, c_int, size_t, STRING]'
+        ),
+    '__vsprintf_chk': (None, ('__va_list_tag',),
+        "__vsprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__vsprintf_chk\n"
+        '__vsprintf_chk.restype = c_int\n'
+        '__vsprintf_chk.argtypes = [STRING, c_int, size_t, STRING, POINTER(__va_list_tag)]'
+        ),
+    'sprintf': (None, (),
+        "sprintf = _libraries['/usr/lib/libmp3lame.so'].sprintf\n"
+        'sprintf.restype = c_int\n'
+        'sprintf.argtypes = [STRING, STRING]'
+        ),
+    'vsprintf': (None, ('__va_list_tag',),
+        "vsprintf = _libraries['/usr/lib/libmp3lame.so'].vsprintf\n"
+        'vsprintf.restype = c_int\n'
+        'vsprintf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__snprintf_chk': (None, (),
+        "__snprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__snprintf_chk\n"
+        '__snprintf_chk.restype = c_int\n'
+        '__snprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING]'
+        ),
+    '__vsnprintf_chk': (None, ('__va_list_tag',),
+        "__vsnprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__vsnprintf_chk\n"
+        '__vsnprintf_chk.restype = c_int\n'
+        '__vsnprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING, POINTER(__va_list_tag)]'
+        ),
+    'snprintf': (None, (),
+        "snprintf = _libraries['/usr/lib/libmp3lame.so'].snprintf\n"
+        'snprintf.restype = c_int\n'
+        'snprintf.argtypes = [STRING, size_t, STRING]'
+        ),
+    'vsnprintf': (None, ('__va_list_tag',),
+        "vsnprintf = _libraries['/usr/lib/libmp3lame.so'].vsnprintf\n"
+        'vsnprintf.restype = c_int\n'
+        'vsnprintf.argtypes = [STRING, size_t, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__fprintf_chk': (None, ('FILE',),
+        "__fprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__fprintf_chk\n"
+        '__fprintf_chk.restype = c_int\n'
+        '__fprintf_chk.argtypes = [POINTER(FILE), c_int, STRING]'
+        ),
+    '__printf_chk': (None, (),
+        "__printf_chk = _libraries['/usr/lib/libmp3lame.so'].__printf_chk\n"
+        '__printf_chk.restype = c_int\n'
+        '__printf_chk.argtypes = [c_int, STRING]'
+        ),
+    '__vfprintf_chk': (None, ('FILE', '__va_list_tag'),
+        "__vfprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__vfprintf_chk\n"
+        '__vfprintf_chk.restype = c_int\n'
+        '__vfprintf_chk.argtypes = [POINTER(FILE), c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__vprintf_chk': (None, ('__va_list_tag',),
+        "__vprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__vprintf_chk\n"
+        '__vprintf_chk.restype = c_int\n'
+        '__vprintf_chk.argtypes = [c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'fprintf': (None, ('FILE',),
+        "fprintf = _libraries['/usr/lib/libmp3lame.so'].fprintf\n"
+        'fprintf.restype = c_int\n'
+        'fprintf.argtypes = [POINTER(FILE), STRING]'
+        ),
+    'printf': (None, (),
+        "printf = _libraries['/usr/lib/libmp3lame.so'].printf\n"
+        'printf.restype = c_int\n'
+        'printf.argtypes = [STRING]'
+        ),
+    'vprintf': (None, ('__va_list_tag',),
+        "vprintf = _libraries['/usr/lib/libmp3lame.so'].vprintf\n"
+        'vprintf.restype = c_int\n'
+        'vprintf.argtypes = [STRING, POINTER(__va_list_tag)]'
+        ),
+    'vfprintf': (None, ('FILE', '__va_list_tag'),
+        "vfprintf = _libraries['/usr/lib/libmp3lame.so'].vfprintf\n"
+        'vfprintf.restype = c_int\n'
+        'vfprintf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]'
+        ),
+    '__dprintf_chk': (None, (),
+        "__dprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__dprintf_chk\n"
+        '__dprintf_chk.restype = c_int\n'
+        '__dprintf_chk.argtypes = [c_int, c_int, STRING]'
+        ),
+    '__vdprintf_chk': (None, ('__va_list_tag',),
+        "__vdprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__vdprintf_chk\n"
+        '__vdprintf_chk.restype = c_int\n'
+        '__vdprintf_chk.argtypes = [c_int, c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'dprintf': (None, (),
+        "dprintf = _libraries['/usr/lib/libmp3lame.so'].dprintf\n"
+        'dprintf.restype = c_int\n'
+        'dprintf.argtypes = [c_int, STRING]'
+        ),
+    'vdprintf': (None, ('__va_list_tag',),
+        "vdprintf = _libraries['/usr/lib/libmp3lame.so'].vdprintf\n"
+        'vdprintf.restype = c_int\n'
+        'vdprintf.argtypes = [c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__asprintf_chk': (None, (),
+        "__asprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__asprintf_chk\n"
+        '__asprintf_chk.restype = c_int\n'
+        '__asprintf_chk.argtypes = [POINTER(STRING), c_int, STRING]'
+        ),
+    '__vasprintf_chk': (None, ('__va_list_tag',),
+        "__vasprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__vasprintf_chk\n"
+        '__vasprintf_chk.restype = c_int\n'
+        '__vasprintf_chk.argtypes = [POINTER(STRING), c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'obstack': ('Structure', (),
+        'obstack._fields_ = [\n'
+        ']'
+        ),
+    '__obstack_printf_chk': (None, ('obstack',),
+        "__obstack_printf_chk = _libraries['/usr/lib/libmp3lame.so'].__obstack_printf_chk\n"
+        '__obstack_printf_chk.restype = c_int\n'
+        '__obstack_printf_chk.argtypes = [POINTER(obstack), c_int, STRING]'
+        ),
+    '__obstack_vprintf_chk': (None, ('__va_list_tag', 'obstack'),
+        "__obstack_vprintf_chk = _libraries['/usr/lib/libmp3lame.so'].__obstack_vprintf_chk\n"
+        '__obstack_vprintf_chk.restype = c_int\n'
+        '__obstack_vprintf_chk.argtypes = [POINTER(obstack), c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'asprintf': (None, (),
+        "asprintf = _libraries['/usr/lib/libmp3lame.so'].asprintf\n"
+        'asprintf.restype = c_int\n'
+        'asprintf.argtypes = [POINTER(STRING), STRING]'
+        ),
+    '__asprintf': (None, (),
+        "__asprintf = _libraries['/usr/lib/libmp3lame.so'].__asprintf\n"
+        '__asprintf.restype = c_int\n'
+        '__asprintf.argtypes = [POINTER(STRING), STRING]'
+        ),
+    'obstack_printf': (None, ('obstack',),
+        "obstack_printf = _libraries['/usr/lib/libmp3lame.so'].obstack_printf\n"
+        'obstack_printf.restype = c_int\n'
+        'obstack_printf.argtypes = [POINTER(obstack), STRING]'
+        ),
+    'vasprintf': (None, ('__va_list_tag',),
+        "vasprintf = _libraries['/usr/lib/libmp3lame.so'].vasprintf\n"
+        'vasprintf.restype = c_int\n'
+        'vasprintf.argtypes = [POINTER(STRING), STRING, POINTER(__va_list_tag)]'
+        ),
+    'obstack_vprintf': (None, ('__va_list_tag', 'obstack'),
+        "obstack_vprintf = _libraries['/usr/lib/libmp3lame.so'].obstack_vprintf\n"
+        'obstack_vprintf.restype = c_int\n'
+        'obstack_vprintf.argtypes = [POINTER(obstack), STRING, POINTER(__va_list_tag)]'
+        ),
+    '__fgets_chk': (None, ('FILE',),
+        "__fgets_chk = _libraries['/usr/lib/libmp3lame.so'].__fgets_chk\n"
+        '__fgets_chk.restype = STRING\n'
+        '__fgets_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]'
+        ),
+    'fgets': (None, ('FILE',),
+        "fgets = _libraries['/usr/lib/libmp3lame.so'].fgets\n"
+        'fgets.restype = STRING\n'
+        'fgets.argtypes = [STRING, c_int, POINTER(FILE)]'
+        ),
+    '__fread_chk': (None, ('FILE',),
+        "__fread_chk = _libraries['/usr/lib/libmp3lame.so'].__fread_chk\n"
+        '__fread_chk.restype = size_t\n'
+        '__fread_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fread': (None, ('FILE',),
+        "fread = _libraries['/usr/lib/libmp3lame.so'].fread\n"
+        'fread.restype = size_t\n'
+        'fread.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    '__fgets_unlocked_chk': (None, ('FILE',),
+        "__fgets_unlocked_chk = _libraries['/usr/lib/libmp3lame.so'].__fgets_unlocked_chk\n"
+        '__fgets_unlocked_chk.restype = STRING\n'
+        '__fgets_unlocked_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]'
+        ),
+    'fgets_unlocked': (None, ('FILE',),
+        "fgets_unlocked = _libraries['/usr/lib/libmp3lame.so'].fgets_unlocked\n"
+        'fgets_unlocked.restype = STRING\n'
+        'fgets_unlocked.argtypes = [STRING, c_int, POINTER(FILE)]'
+        ),
+    '__fread_unlocked_chk': (None, ('FILE',),
+        "__fread_unlocked_chk = _libraries['/usr/lib/libmp3lame.so'].__fread_unlocked_chk\n"
+        '__fread_unlocked_chk.restype = size_t\n'
+        '__fread_unlocked_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fread_unlocked': (None, ('FILE',),
+        "fread_unlocked = _libraries['/usr/lib/libmp3lame.so'].fread_unlocked\n"
+        'fread_unlocked.restype = size_t\n'
+        'fread_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'sys_nerr': (None, (),
+        "sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libmp3lame.so'], 'sys_nerr')"
+        ),
+    'sys_errlist': (None, (),
+        "sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libmp3lame.so'], 'sys_errlist')"
+        ),
+    '_sys_nerr': (None, (),
+        "_sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libmp3lame.so'], '_sys_nerr')"
+        ),
+    '_sys_errlist': (None, (),
+        "_sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libmp3lame.so'], '_sys_errlist')"
+        ),
+    '__fsid_t': ('Structure', (),
+        '__fsid_t._fields_ = [\n'
+        "    ('__val', c_int * 2),\n"
+        ']'
+        ),
+    'lame_report_function': (None, ('__va_list_tag',),
+        'lame_report_function = CFUNCTYPE(None, STRING, POINTER(__va_list_tag))'
+        ),
+    'lame_global_struct': ('Structure', (),
+        'lame_global_struct._fields_ = [\n'
+        ']'
+        ),
+    'lame_global_flags': (None, ('lame_global_struct',),
+        'lame_global_flags = lame_global_struct'
+        ),
+    'lame_t': (None, ('lame_global_flags',),
+        'lame_t = POINTER(lame_global_flags)'
+        ),
+    'lame_init': (None, ('lame_global_flags',),
+        "lame_init = _libraries['/usr/lib/libmp3lame.so'].lame_init\n"
+        'lame_init.restype = POINTER(lame_global_flags)\n'
+        'lame_init.argtypes = []'
+        ),
+    'lame_set_num_samples': (None, ('lame_global_flags',),
+        "lame_set_num_samples = _libraries['/usr/lib/libmp3lame.so'].lame_set_num_samples\n"
+        'lame_set_num_samples.restype = c_int\n'
+        'lame_set_num_samples.argtypes = [POINTER(lame_global_flags), c_ulong]'
+        ),
+    'lame_get_num_samples': (None, ('lame_global_flags',),
+        "lame_get_num_samples = _libraries['/usr/lib/libmp3lame.so'].lame_get_num_samples\n"
+        'lame_get_num_samples.restype = c_ulong\n'
+        'lame_get_num_samples.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_in_samplerate': (None, ('lame_global_flags',),
+        "lame_set_in_samplerate = _libraries['/usr/lib/libmp3lame.so'].lame_set_in_samplerate\n"
+        'lame_set_in_samplerate.restype = c_int\n'
+        'lame_set_in_samplerate.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_in_samplerate': (None, ('lame_global_flags',),
+        "lame_get_in_samplerate = _libraries['/usr/lib/libmp3lame.so'].lame_get_in_samplerate\n"
+        'lame_get_in_samplerate.restype = c_int\n'
+        'lame_get_in_samplerate.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_num_channels': (None, ('lame_global_flags',),
+        "lame_set_num_channels = _libraries['/usr/lib/libmp3lame.so'].lame_set_num_channels\n"
+        'lame_set_num_channels.restype = c_int\n'
+        'lame_set_num_channels.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_num_channels': (None, ('lame_global_flags',),
+        "lame_get_num_channels = _libraries['/usr/lib/libmp3lame.so'].lame_get_num_channels\n"
+        'lame_get_num_channels.restype = c_int\n'
+        'lame_get_num_channels.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_scale': (None, ('lame_global_flags',),
+        "lame_set_scale = _libraries['/usr/lib/libmp3lame.so'].lame_set_scale\n"
+        'lame_set_scale.restype = c_int\n'
+        'lame_set_scale.argtypes = [POINTER(lame_global_flags), c_float]'
+        ),
+    'lame_get_scale': (None, ('lame_global_flags',),
+        "lame_get_scale = _libraries['/usr/lib/libmp3lame.so'].lame_get_scale\n"
+        'lame_get_scale.restype = c_float\n'
+        'lame_get_scale.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_scale_left': (None, ('lame_global_flags',),
+        "lame_set_scale_left = _libraries['/usr/lib/libmp3lame.so'].lame_set_scale_left\n"
+        'lame_set_scale_left.restype = c_int\n'
+        'lame_set_scale_left.argtypes = [POINTER(lame_global_flags), c_float]'
+        ),
+    'lame_get_scale_left': (None, ('lame_global_flags',),
+        "lame_get_scale_left = _libraries['/usr/lib/libmp3lame.so'].lame_get_scale_left\n"
+        'lame_get_scale_left.restype = c_float\n'
+        'lame_get_scale_left.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_scale_right': (None, ('lame_global_flags',),
+        "lame_set_scale_right = _libraries['/usr/lib/libmp3lame.so'].lame_set_scale_right\n"
+        'lame_set_scale_right.restype = c_int\n'
+        'lame_set_scale_right.argtypes = [POINTER(lame_global_flags), c_float]'
+        ),
+    'lame_get_scale_right': (None, ('lame_global_flags',),
+        "lame_get_scale_right = _libraries['/usr/lib/libmp3lame.so'].lame_get_scale_right\n"
+        'lame_get_scale_right.restype = c_float\n'
+        'lame_get_scale_right.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_out_samplerate': (None, ('lame_global_flags',),
+        "lame_set_out_samplerate = _libraries['/usr/lib/libmp3lame.so'].lame_set_out_samplerate\n"
+        'lame_set_out_samplerate.restype = c_int\n'
+        'lame_set_out_samplerate.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_out_samplerate': (None, ('lame_global_flags',),
+        "lame_get_out_samplerate = _libraries['/usr/lib/libmp3lame.so'].lame_get_out_samplerate\n"
+        'lame_get_out_samplerate.restype = c_int\n'
+        'lame_get_out_samplerate.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_analysis': (None, ('lame_global_flags',),
+        "lame_set_analysis = _libraries['/usr/lib/libmp3lame.so'].lame_set_analysis\n"
+        'lame_set_analysis.restype = c_int\n'
+        'lame_set_analysis.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_analysis': (None, ('lame_global_flags',),
+        "lame_get_analysis = _libraries['/usr/lib/libmp3lame.so'].lame_get_analysis\n"
+        'lame_get_analysis.restype = c_int\n'
+        'lame_get_analysis.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_bWriteVbrTag': (None, ('lame_global_flags',),
+        "lame_set_bWriteVbrTag = _libraries['/usr/lib/libmp3lame.so'].lame_set_bWriteVbrTag\n"
+        'lame_set_bWriteVbrTag.restype = c_int\n'
+        'lame_set_bWriteVbrTag.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_bWriteVbrTag': (None, ('lame_global_flags',),
+        "lame_get_bWriteVbrTag = _libraries['/usr/lib/libmp3lame.so'].lame_get_bWriteVbrTag\n"
+        'lame_get_bWriteVbrTag.restype = c_int\n'
+        'lame_get_bWriteVbrTag.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_decode_only': (None, ('lame_global_flags',),
+        "lame_set_decode_only = _libraries['/usr/lib/libmp3lame.so'].lame_set_decode_only\n"
+        'lame_set_decode_only.restype = c_int\n'
+        'lame_set_decode_only.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_decode_only': (None, ('lame_global_flags',),
+        "lame_get_decode_only = _libraries['/usr/lib/libmp3lame.so'].lame_get_decode_only\n"
+        'lame_get_decode_only.restype = c_int\n'
+        'lame_get_decode_only.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_quality': (None, ('lame_global_flags',),
+        "lame_set_quality = _libraries['/usr/lib/libmp3lame.so'].lame_set_quality\n"
+        'lame_set_quality.restype = c_int\n'
+        'lame_set_quality.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_quality': (None, ('lame_global_flags',),
+        "lame_get_quality = _libraries['/usr/lib/libmp3lame.so'].lame_get_quality\n"
+        'lame_get_quality.restype = c_int\n'
+        'lame_get_quality.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_mode': (None, ('lame_global_flags',),
+        "lame_set_mode = _libraries['/usr/lib/libmp3lame.so'].lame_set_mode\n"
+        'lame_set_mode.restype = c_int\n'
+        'lame_set_mode.argtypes = [POINTER(lame_global_flags), MPEG_mode]'
+        ),
+    'lame_get_mode': (None, ('lame_global_flags',),
+        "lame_get_mode = _libraries['/usr/lib/libmp3lame.so'].lame_get_mode\n"
+        'lame_get_mode.restype = MPEG_mode\n'
+        'lame_get_mode.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_force_ms': (None, ('lame_global_flags',),
+        "lame_set_force_ms = _libraries['/usr/lib/libmp3lame.so'].lame_set_force_ms\n"
+        'lame_set_force_ms.restype = c_int\n'
+        'lame_set_force_ms.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_force_ms': (None, ('lame_global_flags',),
+        "lame_get_force_ms = _libraries['/usr/lib/libmp3lame.so'].lame_get_force_ms\n"
+        'lame_get_force_ms.restype = c_int\n'
+        'lame_get_force_ms.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_free_format': (None, ('lame_global_flags',),
+        "lame_set_free_format = _libraries['/usr/lib/libmp3lame.so'].lame_set_free_format\n"
+        'lame_set_free_format.restype = c_int\n'
+        'lame_set_free_format.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_free_format': (None, ('lame_global_flags',),
+        "lame_get_free_format = _libraries['/usr/lib/libmp3lame.so'].lame_get_free_format\n"
+        'lame_get_free_format.restype = c_int\n'
+        'lame_get_free_format.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_findReplayGain': (None, ('lame_global_flags',),
+        "lame_set_findReplayGain = _libraries['/usr/lib/libmp3lame.so'].lame_set_findReplayGain\n"
+        'lame_set_findReplayGain.restype = c_int\n'
+        'lame_set_findReplayGain.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_findReplayGain': (None, ('lame_global_flags',),
+        "lame_get_findReplayGain = _libraries['/usr/lib/libmp3lame.so'].lame_get_findReplayGain\n"
+        'lame_get_findReplayGain.restype = c_int\n'
+        'lame_get_findReplayGain.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_decode_on_the_fly': (None, ('lame_global_flags',),
+        "lame_set_decode_on_the_fly = _libraries['/usr/lib/libmp3lame.so'].lame_set_decode_on_the_fly\n"
+        'lame_set_decode_on_the_fly.restype = c_int\n'
+        'lame_set_decode_on_the_fly.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_decode_on_the_fly': (None, ('lame_global_flags',),
+        "lame_get_decode_on_the_fly = _libraries['/usr/lib/libmp3lame.so'].lame_get_decode_on_the_fly\n"
+        'lame_get_decode_on_the_fly.restype = c_int\n'
+        'lame_get_decode_on_the_fly.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_nogap_total': (None, ('lame_global_flags',),
+        "lame_set_nogap_total = _libraries['/usr/lib/libmp3lame.so'].lame_set_nogap_total\n"
+        'lame_set_nogap_total.restype = c_int\n'
+        'lame_set_nogap_total.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_nogap_total': (None, ('lame_global_flags',),
+        "lame_get_nogap_total = _libraries['/usr/lib/libmp3lame.so'].lame_get_nogap_total\n"
+        'lame_get_nogap_total.restype = c_int\n'
+        'lame_get_nogap_total.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_nogap_currentindex': (None, ('lame_global_flags',),
+        "lame_set_nogap_currentindex = _libraries['/usr/lib/libmp3lame.so'].lame_set_nogap_currentindex\n"
+        'lame_set_nogap_currentindex.restype = c_int\n'
+        'lame_set_nogap_currentindex.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_nogap_currentindex': (None, ('lame_global_flags',),
+        "lame_get_nogap_currentindex = _libraries['/usr/lib/libmp3lame.so'].lame_get_nogap_currentindex\n"
+        'lame_get_nogap_currentindex.restype = c_int\n'
+        'lame_get_nogap_currentindex.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_errorf': (None, ('lame_global_flags', 'lame_report_function'),
+        "lame_set_errorf = _libraries['/usr/lib/libmp3lame.so'].lame_set_errorf\n"
+        'lame_set_errorf.restype = c_int\n'
+        'lame_set_errorf.argtypes = [POINTER(lame_global_flags), lame_report_function]'
+        ),
+    'lame_set_debugf': (None, ('lame_global_flags', 'lame_report_function'),
+        "lame_set_debugf = _libraries['/usr/lib/libmp3lame.so'].lame_set_debugf\n"
+        'lame_set_debugf.restype = c_int\n'
+        'lame_set_debugf.argtypes = [POINTER(lame_global_flags), lame_report_function]'
+        ),
+    'lame_set_msgf': (None, ('lame_global_flags', 'lame_report_function'),
+        "lame_set_msgf = _libraries['/usr/lib/libmp3lame.so'].lame_set_msgf\n"
+        'lame_set_msgf.restype = c_int\n'
+        'lame_set_msgf.argtypes = [POINTER(lame_global_flags), lame_report_function]'
+        ),
+    'lame_set_brate': (None, ('lame_global_flags',),
+        "lame_set_brate = _libraries['/usr/lib/libmp3lame.so'].lame_set_brate\n"
+        'lame_set_brate.restype = c_int\n'
+        'lame_set_brate.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_brate': (None, ('lame_global_flags',),
+        "lame_get_brate = _libraries['/usr/lib/libmp3lame.so'].lame_get_brate\n"
+        'lame_get_brate.restype = c_int\n'
+        'lame_get_brate.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_compression_ratio': (None, ('lame_global_flags',),
+        "lame_set_compression_ratio = _libraries['/usr/lib/libmp3lame.so'].lame_set_compression_ratio\n"
+        'lame_set_compression_ratio.restype = c_int\n'
+        'lame_set_compression_ratio.argtypes = [POINTER(lame_global_flags), c_float]'
+        ),
+    'lame_get_compression_ratio': (None, ('lame_global_flags',),
+        "lame_get_compression_ratio = _libraries['/usr/lib/libmp3lame.so'].lame_get_compression_ratio\n"
+        'lame_get_compression_ratio.restype = c_float\n'
+        'lame_get_compression_ratio.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_preset': (None, ('lame_global_flags',),
+        "lame_set_preset = _libraries['/usr/lib/libmp3lame.so'].lame_set_preset\n"
+        'lame_set_preset.restype = c_int\n'
+        'lame_set_preset.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_set_asm_optimizations': (None, ('lame_global_flags',),
+        "lame_set_asm_optimizations = _libraries['/usr/lib/libmp3lame.so'].lame_set_asm_optimizations\n"
+        'lame_set_asm_optimizations.restype = c_int\n'
+        'lame_set_asm_optimizations.argtypes = [POINTER(lame_global_flags), c_int, c_int]'
+        ),
+    'lame_set_copyright': (None, ('lame_global_flags',),
+        "lame_set_copyright = _libraries['/usr/lib/libmp3lame.so'].lame_set_copyright\n"
+        'lame_set_copyright.restype = c_int\n'
+        'lame_set_copyright.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_copyright': (None, ('lame_global_flags',),
+        "lame_get_copyright = _libraries['/usr/lib/libmp3lame.so'].lame_get_copyright\n"
+        'lame_get_copyright.restype = c_int\n'
+        'lame_get_copyright.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_original': (None, ('lame_global_flags',),
+        "lame_set_original = _libraries['/usr/lib/libmp3lame.so'].lame_set_original\n"
+        'lame_set_original.restype = c_int\n'
+        'lame_set_original.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_original': (None, ('lame_global_flags',),
+        "lame_get_original = _libraries['/usr/lib/libmp3lame.so'].lame_get_original\n"
+        'lame_get_original.restype = c_int\n'
+        'lame_get_original.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_error_protection': (None, ('lame_global_flags',),
+        "lame_set_error_protection = _libraries['/usr/lib/libmp3lame.so'].lame_set_error_protection\n"
+        'lame_set_error_protection.restype = c_int\n'
+        'lame_set_error_protection.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_error_protection': (None, ('lame_global_flags',),
+        "lame_get_error_protection = _libraries['/usr/lib/libmp3lame.so'].lame_get_error_protection\n"
+        'lame_get_error_protection.restype = c_int\n'
+        'lame_get_error_protection.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_extension': (None, ('lame_global_flags',),
+        "lame_set_extension = _libraries['/usr/lib/libmp3lame.so'].lame_set_extension\n"
+        'lame_set_extension.restype = c_int\n'
+        'lame_set_extension.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_extension': (None, ('lame_global_flags',),
+        "lame_get_extension = _libraries['/usr/lib/libmp3lame.so'].lame_get_extension\n"
+        'lame_get_extension.restype = c_int\n'
+        'lame_get_extension.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_strict_ISO': (None, ('lame_global_flags',),
+        "lame_set_strict_ISO = _libraries['/usr/lib/libmp3lame.so'].lame_set_strict_ISO\n"
+        'lame_set_strict_ISO.restype = c_int\n'
+        'lame_set_strict_ISO.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_strict_ISO': (None, ('lame_global_flags',),
+        "lame_get_strict_ISO = _libraries['/usr/lib/libmp3lame.so'].lame_get_strict_ISO\n"
+        'lame_get_strict_ISO.restype = c_int\n'
+        'lame_get_strict_ISO.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_disable_reservoir': (None, ('lame_global_flags',),
+        "lame_set_disable_reservoir = _libraries['/usr/lib/libmp3lame.so'].lame_set_disable_reservoir\n"
+        'lame_set_disable_reservoir.restype = c_int\n'
+        'lame_set_disable_reservoir.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_disable_reservoir': (None, ('lame_global_flags',),
+        "lame_get_disable_reservoir = _libraries['/usr/lib/libmp3lame.so'].lame_get_disable_reservoir\n"
+        'lame_get_disable_reservoir.restype = c_int\n'
+        'lame_get_disable_reservoir.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_quant_comp': (None, ('lame_global_flags',),
+        "lame_set_quant_comp = _libraries['/usr/lib/libmp3lame.so'].lame_set_quant_comp\n"
+        'lame_set_quant_comp.restype = c_int\n'
+        'lame_set_quant_comp.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_quant_comp': (None, ('lame_global_flags',),
+        "lame_get_quant_comp = _libraries['/usr/lib/libmp3lame.so'].lame_get_quant_comp\n"
+        'lame_get_quant_comp.restype = c_int\n'
+        'lame_get_quant_comp.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_quant_comp_short': (None, ('lame_global_flags',),
+        "lame_set_quant_comp_short = _libraries['/usr/lib/libmp3lame.so'].lame_set_quant_comp_short\n"
+        'lame_set_quant_comp_short.restype = c_int\n'
+        'lame_set_quant_comp_short.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_quant_comp_short': (None, ('lame_global_flags',),
+        "lame_get_quant_comp_short = _libraries['/usr/lib/libmp3lame.so'].lame_get_quant_comp_short\n"
+        'lame_get_quant_comp_short.restype = c_int\n'
+        'lame_get_quant_comp_short.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_experimentalX': (None, ('lame_global_flags',),
+        "lame_set_experimentalX = _libraries['/usr/lib/libmp3lame.so'].lame_set_experimentalX\n"
+        'lame_set_experimentalX.restype = c_int\n'
+        'lame_set_experimentalX.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_experimentalX': (None, ('lame_global_flags',),
+        "lame_get_experimentalX = _libraries['/usr/lib/libmp3lame.so'].lame_get_experimentalX\n"
+        'lame_get_experimentalX.restype = c_int\n'
+        'lame_get_experimentalX.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_experimentalY': (None, ('lame_global_flags',),
+        "lame_set_experimentalY = _libraries['/usr/lib/libmp3lame.so'].lame_set_experimentalY\n"
+        'lame_set_experimentalY.restype = c_int\n'
+        'lame_set_experimentalY.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_experimentalY': (None, ('lame_global_flags',),
+        "lame_get_experimentalY = _libraries['/usr/lib/libmp3lame.so'].lame_get_experimentalY\n"
+        'lame_get_experimentalY.restype = c_int\n'
+        'lame_get_experimentalY.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_experimentalZ': (None, ('lame_global_flags',),
+        "lame_set_experimentalZ = _libraries['/usr/lib/libmp3lame.so'].lame_set_experimentalZ\n"
+        'lame_set_experimentalZ.restype = c_int\n'
+        'lame_set_experimentalZ.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_experimentalZ': (None, ('lame_global_flags',),
+        "lame_get_experimentalZ = _libraries['/usr/lib/libmp3lame.so'].lame_get_experimentalZ\n"
+        'lame_get_experimentalZ.restype = c_int\n'
+        'lame_get_experimentalZ.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_exp_nspsytune': (None, ('lame_global_flags',),
+        "lame_set_exp_nspsytune = _libraries['/usr/lib/libmp3lame.so'].lame_set_exp_nspsytune\n"
+        'lame_set_exp_nspsytune.restype = c_int\n'
+        'lame_set_exp_nspsytune.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_exp_nspsytune': (None, ('lame_global_flags',),
+        "lame_get_exp_nspsytune = _libraries['/usr/lib/libmp3lame.so'].lame_get_exp_nspsytune\n"
+        'lame_get_exp_nspsytune.restype = c_int\n'
+        'lame_get_exp_nspsytune.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_msfix': (None, ('lame_global_flags',),
+        "lame_set_msfix = _libraries['/usr/lib/libmp3lame.so'].lame_set_msfix\n"
+        'lame_set_msfix.restype = None\n'
+        'lame_set_msfix.argtypes = [POINTER(lame_global_flags), c_double]'
+        ),
+    'lame_get_msfix': (None, ('lame_global_flags',),
+        "lame_get_msfix = _libraries['/usr/lib/libmp3lame.so'].lame_get_msfix\n"
+        'lame_get_msfix.restype = c_float\n'
+        'lame_get_msfix.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_VBR': (None, ('lame_global_flags',),
+        "lame_set_VBR = _libraries['/usr/lib/libmp3lame.so'].lame_set_VBR\n"
+        'lame_set_VBR.restype = c_int\n'
+        'lame_set_VBR.argtypes = [POINTER(lame_global_flags), vbr_mode]'
+        ),
+    'lame_get_VBR': (None, ('lame_global_flags',),
+        "lame_get_VBR = _libraries['/usr/lib/libmp3lame.so'].lame_get_VBR\n"
+        'lame_get_VBR.restype = vbr_mode\n'
+        'lame_get_VBR.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_VBR_q': (None, ('lame_global_flags',),
+        "lame_set_VBR_q = _libraries['/usr/lib/libmp3lame.so'].lame_set_VBR_q\n"
+        'lame_set_VBR_q.restype = c_int\n'
+        'lame_set_VBR_q.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_VBR_q': (None, ('lame_global_flags',),
+        "lame_get_VBR_q = _libraries['/usr/lib/libmp3lame.so'].lame_get_VBR_q\n"
+        'lame_get_VBR_q.restype = c_int\n'
+        'lame_get_VBR_q.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_VBR_quality': (None, ('lame_global_flags',),
+        "lame_set_VBR_quality = _libraries['/usr/lib/libmp3lame.so'].lame_set_VBR_quality\n"
+        'lame_set_VBR_quality.restype = c_int\n'
+        'lame_set_VBR_quality.argtypes = [POINTER(lame_global_flags), c_float]'
+        ),
+    'lame_get_VBR_quality': (None, ('lame_global_flags',),
+        "lame_get_VBR_quality = _libraries['/usr/lib/libmp3lame.so'].lame_get_VBR_quality\n"
+        'lame_get_VBR_quality.restype = c_float\n'
+        'lame_get_VBR_quality.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_VBR_mean_bitrate_kbps': (None, ('lame_global_flags',),
+        "lame_set_VBR_mean_bitrate_kbps = _libraries['/usr/lib/libmp3lame.so'].lame_set_VBR_mean_bitrate_kbps\n"
+        'lame_set_VBR_mean_bitrate_kbps.restype = c_int\n'
+        'lame_set_VBR_mean_bitrate_kbps.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_VBR_mean_bitrate_kbps': (None, ('lame_global_flags',),
+        "lame_get_VBR_mean_bitrate_kbps = _libraries['/usr/lib/libmp3lame.so'].lame_get_VBR_mean_bitrate_kbps\n"
+        'lame_get_VBR_mean_bitrate_kbps.restype = c_int\n'
+        'lame_get_VBR_mean_bitrate_kbps.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_VBR_min_bitrate_kbps': (None, ('lame_global_flags',),
+        "lame_set_VBR_min_bitrate_kbps = _libraries['/usr/lib/libmp3lame.so'].lame_set_VBR_min_bitrate_kbps\n"
+        'lame_set_VBR_min_bitrate_kbps.restype = c_int\n'
+        'lame_set_VBR_min_bitrate_kbps.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_VBR_min_bitrate_kbps': (None, ('lame_global_flags',),
+        "lame_get_VBR_min_bitrate_kbps = _libraries['/usr/lib/libmp3lame.so'].lame_get_VBR_min_bitrate_kbps\n"
+        'lame_get_VBR_min_bitrate_kbps.restype = c_int\n'
+        'lame_get_VBR_min_bitrate_kbps.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_VBR_max_bitrate_kbps': (None, ('lame_global_flags',),
+        "lame_set_VBR_max_bitrate_kbps = _libraries['/usr/lib/libmp3lame.so'].lame_set_VBR_max_bitrate_kbps\n"
+        'lame_set_VBR_max_bitrate_kbps.restype = c_int\n'
+        'lame_set_VBR_max_bitrate_kbps.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_VBR_max_bitrate_kbps': (None, ('lame_global_flags',),
+        "lame_get_VBR_max_bitrate_kbps = _libraries['/usr/lib/libmp3lame.so'].lame_get_VBR_max_bitrate_kbps\n"
+        'lame_get_VBR_max_bitrate_kbps.restype = c_int\n'
+        'lame_get_VBR_max_bitrate_kbps.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_VBR_hard_min': (None, ('lame_global_flags',),
+        "lame_set_VBR_hard_min = _libraries['/usr/lib/libmp3lame.so'].lame_set_VBR_hard_min\n"
+        'lame_set_VBR_hard_min.restype = c_int\n'
+        'lame_set_VBR_hard_min.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_VBR_hard_min': (None, ('lame_global_flags',),
+        "lame_get_VBR_hard_min = _libraries['/usr/lib/libmp3lame.so'].lame_get_VBR_hard_min\n"
+        'lame_get_VBR_hard_min.restype = c_int\n'
+        'lame_get_VBR_hard_min.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_lowpassfreq': (None, ('lame_global_flags',),
+        "lame_set_lowpassfreq = _libraries['/usr/lib/libmp3lame.so'].lame_set_lowpassfreq\n"
+        'lame_set_lowpassfreq.restype = c_int\n'
+        'lame_set_lowpassfreq.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_lowpassfreq': (None, ('lame_global_flags',),
+        "lame_get_lowpassfreq = _libraries['/usr/lib/libmp3lame.so'].lame_get_lowpassfreq\n"
+        'lame_get_lowpassfreq.restype = c_int\n'
+        'lame_get_lowpassfreq.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_lowpasswidth': (None, ('lame_global_flags',),
+        "lame_set_lowpasswidth = _libraries['/usr/lib/libmp3lame.so'].lame_set_lowpasswidth\n"
+        'lame_set_lowpasswidth.restype = c_int\n'
+        'lame_set_lowpasswidth.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_lowpasswidth': (None, ('lame_global_flags',),
+        "lame_get_lowpasswidth = _libraries['/usr/lib/libmp3lame.so'].lame_get_lowpasswidth\n"
+        'lame_get_lowpasswidth.restype = c_int\n'
+        'lame_get_lowpasswidth.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_highpassfreq': (None, ('lame_global_flags',),
+        "lame_set_highpassfreq = _libraries['/usr/lib/libmp3lame.so'].lame_set_highpassfreq\n"
+        'lame_set_highpassfreq.restype = c_int\n'
+        'lame_set_highpassfreq.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_highpassfreq': (None, ('lame_global_flags',),
+        "lame_get_highpassfreq = _libraries['/usr/lib/libmp3lame.so'].lame_get_highpassfreq\n"
+        'lame_get_highpassfreq.restype = c_int\n'
+        'lame_get_highpassfreq.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_highpasswidth': (None, ('lame_global_flags',),
+        "lame_set_highpasswidth = _libraries['/usr/lib/libmp3lame.so'].lame_set_highpasswidth\n"
+        'lame_set_highpasswidth.restype = c_int\n'
+        'lame_set_highpasswidth.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_highpasswidth': (None, ('lame_global_flags',),
+        "lame_get_highpasswidth = _libraries['/usr/lib/libmp3lame.so'].lame_get_highpasswidth\n"
+        'lame_get_highpasswidth.restype = c_int\n'
+        'lame_get_highpasswidth.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_ATHonly': (None, ('lame_global_flags',),
+        "lame_set_ATHonly = _libraries['/usr/lib/libmp3lame.so'].lame_set_ATHonly\n"
+        'lame_set_ATHonly.restype = c_int\n'
+        'lame_set_ATHonly.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_ATHonly': (None, ('lame_global_flags',),
+        "lame_get_ATHonly = _libraries['/usr/lib/libmp3lame.so'].lame_get_ATHonly\n"
+        'lame_get_ATHonly.restype = c_int\n'
+        'lame_get_ATHonly.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_ATHshort': (None, ('lame_global_flags',),
+        "lame_set_ATHshort = _libraries['/usr/lib/libmp3lame.so'].lame_set_ATHshort\n"
+        'lame_set_ATHshort.restype = c_int\n'
+        'lame_set_ATHshort.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_ATHshort': (None, ('lame_global_flags',),
+        "lame_get_ATHshort = _libraries['/usr/lib/libmp3lame.so'].lame_get_ATHshort\n"
+        'lame_get_ATHshort.restype = c_int\n'
+        'lame_get_ATHshort.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_noATH': (None, ('lame_global_flags',),
+        "lame_set_noATH = _libraries['/usr/lib/libmp3lame.so'].lame_set_noATH\n"
+        'lame_set_noATH.restype = c_int\n'
+        'lame_set_noATH.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_noATH': (None, ('lame_global_flags',),
+        "lame_get_noATH = _libraries['/usr/lib/libmp3lame.so'].lame_get_noATH\n"
+        'lame_get_noATH.restype = c_int\n'
+        'lame_get_noATH.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_ATHtype': (None, ('lame_global_flags',),
+        "lame_set_ATHtype = _libraries['/usr/lib/libmp3lame.so'].lame_set_ATHtype\n"
+        'lame_set_ATHtype.restype = c_int\n'
+        'lame_set_ATHtype.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_ATHtype': (None, ('lame_global_flags',),
+        "lame_get_ATHtype = _libraries['/usr/lib/libmp3lame.so'].lame_get_ATHtype\n"
+        'lame_get_ATHtype.restype = c_int\n'
+        'lame_get_ATHtype.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_ATHlower': (None, ('lame_global_flags',),
+        "lame_set_ATHlower = _libraries['/usr/lib/libmp3lame.so'].lame_set_ATHlower\n"
+        'lame_set_ATHlower.restype = c_int\n'
+        'lame_set_ATHlower.argtypes = [POINTER(lame_global_flags), c_float]'
+        ),
+    'lame_get_ATHlower': (None, ('lame_global_flags',),
+        "lame_get_ATHlower = _libraries['/usr/lib/libmp3lame.so'].lame_get_ATHlower\n"
+        'lame_get_ATHlower.restype = c_float\n'
+        'lame_get_ATHlower.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_athaa_type': (None, ('lame_global_flags',),
+        "lame_set_athaa_type = _libraries['/usr/lib/libmp3lame.so'].lame_set_athaa_type\n"
+        'lame_set_athaa_type.restype = c_int\n'
+        'lame_set_athaa_type.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_athaa_type': (None, ('lame_global_flags',),
+        "lame_get_athaa_type = _libraries['/usr/lib/libmp3lame.so'].lame_get_athaa_type\n"
+        'lame_get_athaa_type.restype = c_int\n'
+        'lame_get_athaa_type.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_athaa_sensitivity': (None, ('lame_global_flags',),
+        "lame_set_athaa_sensitivity = _libraries['/usr/lib/libmp3lame.so'].lame_set_athaa_sensitivity\n"
+        'lame_set_athaa_sensitivity.restype = c_int\n'
+        'lame_set_athaa_sensitivity.argtypes = [POINTER(lame_global_flags), c_float]'
+        ),
+    'lame_get_athaa_sensitivity': (None, ('lame_global_flags',),
+        "lame_get_athaa_sensitivity = _libraries['/usr/lib/libmp3lame.so'].lame_get_athaa_sensitivity\n"
+        'lame_get_athaa_sensitivity.restype = c_float\n'
+        'lame_get_athaa_sensitivity.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_allow_diff_short': (None, ('lame_global_flags',),
+        "lame_set_allow_diff_short = _libraries['/usr/lib/libmp3lame.so'].lame_set_allow_diff_short\n"
+        'lame_set_allow_diff_short.restype = c_int\n'
+        'lame_set_allow_diff_short.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_allow_diff_short': (None, ('lame_global_flags',),
+        "lame_get_allow_diff_short = _libraries['/usr/lib/libmp3lame.so'].lame_get_allow_diff_short\n"
+        'lame_get_allow_diff_short.restype = c_int\n'
+        'lame_get_allow_diff_short.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_useTemporal': (None, ('lame_global_flags',),
+        "lame_set_useTemporal = _libraries['/usr/lib/libmp3lame.so'].lame_set_useTemporal\n"
+        'lame_set_useTemporal.restype = c_int\n'
+        'lame_set_useTemporal.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_useTemporal': (None, ('lame_global_flags',),
+        "lame_get_useTemporal = _libraries['/usr/lib/libmp3lame.so'].lame_get_useTemporal\n"
+        'lame_get_useTemporal.restype = c_int\n'
+        'lame_get_useTemporal.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_interChRatio': (None, ('lame_global_flags',),
+        "lame_set_interChRatio = _libraries['/usr/lib/libmp3lame.so'].lame_set_interChRatio\n"
+        'lame_set_interChRatio.restype = c_int\n'
+        'lame_set_interChRatio.argtypes = [POINTER(lame_global_flags), c_float]'
+        ),
+    'lame_get_interChRatio': (None, ('lame_global_flags',),
+        "lame_get_interChRatio = _libraries['/usr/lib/libmp3lame.so'].lame_get_interChRatio\n"
+        'lame_get_interChRatio.restype = c_float\n'
+        'lame_get_interChRatio.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_no_short_blocks': (None, ('lame_global_flags',),
+        "lame_set_no_short_blocks = _libraries['/usr/lib/libmp3lame.so'].lame_set_no_short_blocks\n"
+        'lame_set_no_short_blocks.restype = c_int\n'
+        'lame_set_no_short_blocks.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_no_short_blocks': (None, ('lame_global_flags',),
+        "lame_get_no_short_blocks = _libraries['/usr/lib/libmp3lame.so'].lame_get_no_short_blocks\n"
+        'lame_get_no_short_blocks.restype = c_int\n'
+        'lame_get_no_short_blocks.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_force_short_blocks': (None, ('lame_global_flags',),
+        "lame_set_force_short_blocks = _libraries['/usr/lib/libmp3lame.so'].lame_set_force_short_blocks\n"
+        'lame_set_force_short_blocks.restype = c_int\n'
+        'lame_set_force_short_blocks.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_force_short_blocks': (None, ('lame_global_flags',),
+        "lame_get_force_short_blocks = _libraries['/usr/lib/libmp3lame.so'].lame_get_force_short_blocks\n"
+        'lame_get_force_short_blocks.restype = c_int\n'
+        'lame_get_force_short_blocks.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_set_emphasis': (None, ('lame_global_flags',),
+        "lame_set_emphasis = _libraries['/usr/lib/libmp3lame.so'].lame_set_emphasis\n"
+        'lame_set_emphasis.restype = c_int\n'
+        'lame_set_emphasis.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_emphasis': (None, ('lame_global_flags',),
+        "lame_get_emphasis = _libraries['/usr/lib/libmp3lame.so'].lame_get_emphasis\n"
+        'lame_get_emphasis.restype = c_int\n'
+        'lame_get_emphasis.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_get_version': (None, ('lame_global_flags',),
+        "lame_get_version = _libraries['/usr/lib/libmp3lame.so'].lame_get_version\n"
+        'lame_get_version.restype = c_int\n'
+        'lame_get_version.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_get_encoder_delay': (None, ('lame_global_flags',),
+        "lame_get_encoder_delay = _libraries['/usr/lib/libmp3lame.so'].lame_get_encoder_delay\n"
+        'lame_get_encoder_delay.restype = c_int\n'
+        'lame_get_encoder_delay.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_get_encoder_padding': (None, ('lame_global_flags',),
+        "lame_get_encoder_padding = _libraries['/usr/lib/libmp3lame.so'].lame_get_encoder_padding\n"
+        'lame_get_encoder_padding.restype = c_int\n'
+        'lame_get_encoder_padding.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_get_framesize': (None, ('lame_global_flags',),
+        "lame_get_framesize = _libraries['/usr/lib/libmp3lame.so'].lame_get_framesize\n"
+        'lame_get_framesize.restype = c_int\n'
+        'lame_get_framesize.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_get_mf_samples_to_encode': (None, ('lame_global_flags',),
+        "lame_get_mf_samples_to_encode = _libraries['/usr/lib/libmp3lame.so'].lame_get_mf_samples_to_encode\n"
+        'lame_get_mf_samples_to_encode.restype = c_int\n'
+        'lame_get_mf_samples_to_encode.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_get_size_mp3buffer': (None, ('lame_global_flags',),
+        "lame_get_size_mp3buffer = _libraries['/usr/lib/libmp3lame.so'].lame_get_size_mp3buffer\n"
+        'lame_get_size_mp3buffer.restype = c_int\n'
+        'lame_get_size_mp3buffer.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_get_frameNum': (None, ('lame_global_flags',),
+        "lame_get_frameNum = _libraries['/usr/lib/libmp3lame.so'].lame_get_frameNum\n"
+        'lame_get_frameNum.restype = c_int\n'
+        'lame_get_frameNum.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_get_totalframes': (None, ('lame_global_flags',),
+        "lame_get_totalframes = _libraries['/usr/lib/libmp3lame.so'].lame_get_totalframes\n"
+        'lame_get_totalframes.restype = c_int\n'
+        'lame_get_totalframes.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_get_RadioGain': (None, ('lame_global_flags',),
+        "lame_get_RadioGain = _libraries['/usr/lib/libmp3lame.so'].lame_get_RadioGain\n"
+        'lame_get_RadioGain.restype = c_int\n'
+        'lame_get_RadioGain.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_get_AudiophileGain': (None, ('lame_global_flags',),
+        "lame_get_AudiophileGain = _libraries['/usr/lib/libmp3lame.so'].lame_get_AudiophileGain\n"
+        'lame_get_AudiophileGain.restype = c_int\n'
+        'lame_get_AudiophileGain.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_get_PeakSample': (None, ('lame_global_flags',),
+        "lame_get_PeakSample = _libraries['/usr/lib/libmp3lame.so'].lame_get_PeakSample\n"
+        'lame_get_PeakSample.restype = c_float\n'
+        'lame_get_PeakSample.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_get_noclipGainChange': (None, ('lame_global_flags',),
+        "lame_get_noclipGainChange = _libraries['/usr/lib/libmp3lame.so'].lame_get_noclipGainChange\n"
+        'lame_get_noclipGainChange.restype = c_int\n'
+        'lame_get_noclipGainChange.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_get_noclipScale': (None, ('lame_global_flags',),
+        "lame_get_noclipScale = _libraries['/usr/lib/libmp3lame.so'].lame_get_noclipScale\n"
+        'lame_get_noclipScale.restype = c_float\n'
+        'lame_get_noclipScale.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_init_params': (None, ('lame_global_flags',),
+        "lame_init_params = _libraries['/usr/lib/libmp3lame.so'].lame_init_params\n"
+        'lame_init_params.restype = c_int\n'
+        'lame_init_params.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'get_lame_version': (None, (),
+        "get_lame_version = _libraries['/usr/lib/libmp3lame.so'].get_lame_version\n"
+        'get_lame_version.restype = STRING\n'
+        'get_lame_version.argtypes = []'
+        ),
+    'get_lame_short_version': (None, (),
+        "get_lame_short_version = _libraries['/usr/lib/libmp3lame.so'].get_lame_short_version\n"
+        'get_lame_short_version.restype = STRING\n'
+        'get_lame_short_version.argtypes = []'
+        ),
+    'get_lame_very_short_version': (None, (),
+        "get_lame_very_short_version = _libraries['/usr/lib/libmp3lame.so'].get_lame_very_short_version\n"
+        'get_lame_very_short_version.restype = STRING\n'
+        'get_lame_very_short_version.argtypes = []'
+        ),
+    'get_psy_version': (None, (),
+        "get_psy_version = _libraries['/usr/lib/libmp3lame.so'].get_psy_version\n"
+        'get_psy_version.restype = STRING\n'
+        'get_psy_version.argtypes = []'
+        ),
+    'get_lame_url': (None, (),
+        "get_lame_url = _libraries['/usr/lib/libmp3lame.so'].get_lame_url\n"
+        'get_lame_url.restype = STRING\n'
+        'get_lame_url.argtypes = []'
+        ),
+    'get_lame_os_bitness': (None, (),
+        "get_lame_os_bitness = _libraries['/usr/lib/libmp3lame.so'].get_lame_os_bitness\n"
+        'get_lame_os_bitness.restype = STRING\n'
+        'get_lame_os_bitness.argtypes = []'
+        ),
+    'lame_version_t': ('Structure', (),
+        'lame_version_t._fields_ = [\n'
+        "    ('major', c_int),\n"
+        "    ('minor', c_int),\n"
+        "    ('alpha', c_int),\n"
+        "    ('beta', c_int),\n"
+        "    ('psy_major', c_int),\n"
+        "    ('psy_minor', c_int),\n"
+        "    ('psy_alpha', c_int),\n"
+        "    ('psy_beta', c_int),\n"
+        "    ('features', STRING),\n"
+        ']'
+        ),
+    'get_lame_version_numerical': (None, ('lame_version_t',),
+        "get_lame_version_numerical = _libraries['/usr/lib/libmp3lame.so'].get_lame_version_numerical\n"
+        'get_lame_version_numerical.restype = None\n'
+        'get_lame_version_numerical.argtypes = [POINTER(lame_version_t)]'
+        ),
+    'lame_print_config': (None, ('lame_global_flags',),
+        "lame_print_config = _libraries['/usr/lib/libmp3lame.so'].lame_print_config\n"
+        'lame_print_config.restype = None\n'
+        'lame_print_config.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_print_internals': (None, ('lame_global_flags',),
+        "lame_print_internals = _libraries['/usr/lib/libmp3lame.so'].lame_print_internals\n"
+        'lame_print_internals.restype = None\n'
+        'lame_print_internals.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_encode_buffer': (None, ('lame_global_flags',),
+        "lame_encode_buffer = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer\n"
+        'lame_encode_buffer.restype = c_int\n'
+        'lame_encode_buffer.argtypes = [POINTER(lame_global_flags), POINTER(c_short), POINTER(c_short), c_int, POINTER(c_ubyte), c_int]'
+        ),
+    'lame_encode_buffer_interleaved': (None, ('lame_global_flags',),
+        "lame_encode_buffer_interleaved = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_interleaved\n"
+        'lame_encode_buffer_interleaved.restype = c_int\n'
+        'lame_encode_buffer_interleaved.argtypes = [POINTER(lame_global_flags), POINTER(c_short), c_int, POINTER(c_ubyte), c_int]'
+        ),
+    'lame_encode_buffer_float': (None, ('lame_global_flags',),
+        "lame_encode_buffer_float = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_float\n"
+        'lame_encode_buffer_float.restype = c_int\n'
+        'lame_encode_buffer_float.argtypes = [POINTER(lame_global_flags), POINTER(c_float), POINTER(c_float), c_int, POINTER(c_ubyte), c_int]'
+        ),
+    'lame_encode_buffer_ieee_float': (None, ('lame_t',),
+        "lame_encode_buffer_ieee_float = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_ieee_float\n"
+        'lame_encode_buffer_ieee_float.restype = c_int\n'
+        'lame_encode_buffer_ieee_float.argtypes = [lame_t, POINTER(c_float), POINTER(c_float), c_int, POINTER(c_ubyte), c_int]'
+        ),
+    'lame_encode_buffer_interleaved_ieee_float': (None, ('lame_t',),
+        "lame_encode_buffer_interleaved_ieee_float = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_interleaved_ieee_float\n"
+        'lame_encode_buffer_interleaved_ieee_float.restype = c_int\n'
+        'lame_encode_buffer_interleaved_ieee_float.argtypes = [lame_t, POINTER(c_float), c_int, POINTER(c_ubyte), c_int]'
+        ),
+    'lame_encode_buffer_ieee_double': (None, ('lame_t',),
+        "lame_encode_buffer_ieee_double = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_ieee_double\n"
+        'lame_encode_buffer_ieee_double.restype = c_int\n'
+        'lame_encode_buffer_ieee_double.argtypes = [lame_t, POINTER(c_double), POINTER(c_double), c_int, POINTER(c_ubyte), c_int]'
+        ),
+    'lame_encode_buffer_interleaved_ieee_double': (None, ('lame_t',),
+        "lame_encode_buffer_interleaved_ieee_double = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_interleaved_ieee_double\n"
+        'lame_encode_buffer_interleaved_ieee_double.restype = c_int\n'
+        'lame_encode_buffer_interleaved_ieee_double.argtypes = [lame_t, POINTER(c_double), c_int, POINTER(c_ubyte), c_int]'
+        ),
+    'lame_encode_buffer_long': (None, ('lame_global_flags',),
+        "lame_encode_buffer_long = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_long\n"
+        'lame_encode_buffer_long.restype = c_int\n'
+        'lame_encode_buffer_long.argtypes = [POINTER(lame_global_flags), POINTER(c_long), POINTER(c_long), c_int, POINTER(c_ubyte), c_int]'
+        ),
+    'lame_encode_buffer_long2': (None, ('lame_global_flags',),
+        "lame_encode_buffer_long2 = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_long2\n"
+        'lame_encode_buffer_long2.restype = c_int\n'
+        'lame_encode_buffer_long2.argtypes = [POINTER(lame_global_flags), POINTER(c_long), POINTER(c_long), c_int, POINTER(c_ubyte), c_int]'
+        ),
+    'lame_encode_buffer_int': (None, ('lame_global_flags',),
+        "lame_encode_buffer_int = _libraries['/usr/lib/libmp3lame.so'].lame_encode_buffer_int\n"
+        'lame_encode_buffer_int.restype = c_int\n'
+        'lame_encode_buffer_int.argtypes = [POINTER(lame_global_flags), POINTER(c_int), POINTER(c_int), c_int, POINTER(c_ubyte), c_int]'
+        ),
+    'lame_encode_flush': (None, ('lame_global_flags',),
+        "lame_encode_flush = _libraries['/usr/lib/libmp3lame.so'].lame_encode_flush\n"
+        'lame_encode_flush.restype = c_int\n'
+        'lame_encode_flush.argtypes = [POINTER(lame_global_flags), POINTER(c_ubyte), c_int]'
+        ),
+    'lame_encode_flush_nogap': (None, ('lame_global_flags',),
+        "lame_encode_flush_nogap = _libraries['/usr/lib/libmp3lame.so'].lame_encode_flush_nogap\n"
+        'lame_encode_flush_nogap.restype = c_int\n'
+        'lame_encode_flush_nogap.argtypes = [POINTER(lame_global_flags), POINTER(c_ubyte), c_int]'
+        ),
+    'lame_init_bitstream': (None, ('lame_global_flags',),
+        "lame_init_bitstream = _libraries['/usr/lib/libmp3lame.so'].lame_init_bitstream\n"
+        'lame_init_bitstream.restype = c_int\n'
+        'lame_init_bitstream.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'lame_bitrate_hist': (None, ('lame_global_flags',),
+        "lame_bitrate_hist = _libraries['/usr/lib/libmp3lame.so'].lame_bitrate_hist\n"
+        'lame_bitrate_hist.restype = None\n'
+        'lame_bitrate_hist.argtypes = [POINTER(lame_global_flags), POINTER(c_int)]'
+        ),
+    'lame_bitrate_kbps': (None, ('lame_global_flags',),
+        "lame_bitrate_kbps = _libraries['/usr/lib/libmp3lame.so'].lame_bitrate_kbps\n"
+        'lame_bitrate_kbps.restype = None\n'
+        'lame_bitrate_kbps.argtypes = [POINTER(lame_global_flags), POINTER(c_int)]'
+        ),
+    'lame_stereo_mode_hist': (None, ('lame_global_flags',),
+        "lame_stereo_mode_hist = _libraries['/usr/lib/libmp3lame.so'].lame_stereo_mode_hist\n"
+        'lame_stereo_mode_hist.restype = None\n'
+        'lame_stereo_mode_hist.argtypes = [POINTER(lame_global_flags), POINTER(c_int)]'
+        ),
+    'lame_bitrate_stereo_mode_hist': (None, ('lame_global_flags',),
+        "lame_bitrate_stereo_mode_hist = _libraries['/usr/lib/libmp3lame.so'].lame_bitrate_stereo_mode_hist\n"
+        'lame_bitrate_stereo_mode_hist.restype = None\n'
+        'lame_bitrate_stereo_mode_hist.argtypes = [POINTER(lame_global_flags), POINTER(c_int * 4)]'
+        ),
+    'lame_block_type_hist': (None, ('lame_global_flags',),
+        "lame_block_type_hist = _libraries['/usr/lib/libmp3lame.so'].lame_block_type_hist\n"
+        'lame_block_type_hist.restype = None\n'
+        'lame_block_type_hist.argtypes = [POINTER(lame_global_flags), POINTER(c_int)]'
+        ),
+    'lame_bitrate_block_type_hist': (None, ('lame_global_flags',),
+        "lame_bitrate_block_type_hist = _libraries['/usr/lib/libmp3lame.so'].lame_bitrate_block_type_hist\n"
+        'lame_bitrate_block_type_hist.restype = None\n'
+        'lame_bitrate_block_type_hist.argtypes = [POINTER(lame_global_flags), POINTER(c_int * 6)]'
+        ),
+    'lame_mp3_tags_fid': (None, ('FILE', 'lame_global_flags'),
+        "lame_mp3_tags_fid = _libraries['/usr/lib/libmp3lame.so'].lame_mp3_tags_fid\n"
+        'lame_mp3_tags_fid.restype = None\n'
+        'lame_mp3_tags_fid.argtypes = [POINTER(lame_global_flags), POINTER(FILE)]'
+        ),
+    'lame_get_lametag_frame': (None, ('lame_global_flags',),
+        "lame_get_lametag_frame = _libraries['/usr/lib/libmp3lame.so'].lame_get_lametag_frame\n"
+        'lame_get_lametag_frame.restype = size_t\n'
+        'lame_get_lametag_frame.argtypes = [POINTER(lame_global_flags), POINTER(c_ubyte), size_t]'
+        ),
+    'lame_close': (None, ('lame_global_flags',),
+        "lame_close = _libraries['/usr/lib/libmp3lame.so'].lame_close\n"
+        'lame_close.restype = c_int\n'
+        'lame_close.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'hip_global_struct': ('Structure', (),
+        'hip_global_struct._fields_ = [\n'
+        ']'
+        ),
+    'hip_global_flags': (None, ('hip_global_struct',),
+        'hip_global_flags = hip_global_struct'
+        ),
+    'hip_t': (None, ('hip_global_flags',),
+        'hip_t = POINTER(hip_global_flags)'
+        ),
+    'mp3data_struct': ('Structure', (),
+        'mp3data_struct._fields_ = [\n'
+        "    ('header_parsed', c_int),\n"
+        "    ('stereo', c_int),\n"
+        "    ('samplerate', c_int),\n"
+        "    ('bitrate', c_int),\n"
+        "    ('mode', c_int),\n"
+        "    ('mode_ext', c_int),\n"
+        "    ('framesize', c_int),\n"
+        "    ('nsamp', c_ulong),\n"
+        "    ('totalframes', c_int),\n"
+        "    ('framenum', c_int),\n"
+        ']'
+        ),
+    'hip_decode_init': (None, ('hip_t',),
+        "hip_decode_init = _libraries['/usr/lib/libmp3lame.so'].hip_decode_init\n"
+        'hip_decode_init.restype = hip_t\n'
+        'hip_decode_init.argtypes = []'
+        ),
+    'hip_decode_exit': (None, ('hip_t',),
+        "hip_decode_exit = _libraries['/usr/lib/libmp3lame.so'].hip_decode_exit\n"
+        'hip_decode_exit.restype = c_int\n'
+        'hip_decode_exit.argtypes = [hip_t]'
+        ),
+    'hip_set_errorf': (None, ('hip_t', 'lame_report_function'),
+        "hip_set_errorf = _libraries['/usr/lib/libmp3lame.so'].hip_set_errorf\n"
+        'hip_set_errorf.restype = None\n'
+        'hip_set_errorf.argtypes = [hip_t, lame_report_function]'
+        ),
+    'hip_set_debugf': (None, ('hip_t', 'lame_report_function'),
+        "hip_set_debugf = _libraries['/usr/lib/libmp3lame.so'].hip_set_debugf\n"
+        'hip_set_debugf.restype = None\n'
+        'hip_set_debugf.argtypes = [hip_t, lame_report_function]'
+        ),
+    'hip_set_msgf': (None, ('hip_t', 'lame_report_function'),
+        "hip_set_msgf = _libraries['/usr/lib/libmp3lame.so'].hip_set_msgf\n"
+        'hip_set_msgf.restype = None\n'
+        'hip_set_msgf.argtypes = [hip_t, lame_report_function]'
+        ),
+    'hip_decode': (None, ('hip_t',),
+        "hip_decode = _libraries['/usr/lib/libmp3lame.so'].hip_decode\n"
+        'hip_decode.restype = c_int\n'
+        'hip_decode.argtypes = [hip_t, POINTER(c_ubyte), size_t, POINTER(c_short), POINTER(c_short)]'
+        ),
+    'hip_decode_headers': (None, ('hip_t', 'mp3data_struct'),
+        "hip_decode_headers = _libraries['/usr/lib/libmp3lame.so'].hip_decode_headers\n"
+        'hip_decode_headers.restype = c_int\n'
+        'hip_decode_headers.argtypes = [hip_t, POINTER(c_ubyte), size_t, POINTER(c_short), POINTER(c_short), POINTER(mp3data_struct)]'
+        ),
+    'hip_decode1': (None, ('hip_t',),
+        "hip_decode1 = _libraries['/usr/lib/libmp3lame.so'].hip_decode1\n"
+        'hip_decode1.restype = c_int\n'
+        'hip_decode1.argtypes = [hip_t, POINTER(c_ubyte), size_t, POINTER(c_short), POINTER(c_short)]'
+        ),
+    'hip_decode1_headers': (None, ('hip_t', 'mp3data_struct'),
+        "hip_decode1_headers = _libraries['/usr/lib/libmp3lame.so'].hip_decode1_headers\n"
+        'hip_decode1_headers.restype = c_int\n'
+        'hip_decode1_headers.argtypes = [hip_t, POINTER(c_ubyte), size_t, POINTER(c_short), POINTER(c_short), POINTER(mp3data_struct)]'
+        ),
+    'hip_decode1_headersB': (None, ('hip_t', 'mp3data_struct'),
+        "hip_decode1_headersB = _libraries['/usr/lib/libmp3lame.so'].hip_decode1_headersB\n"
+        'hip_decode1_headersB.restype = c_int\n'
+        'hip_decode1_headersB.argtypes = [hip_t, POINTER(c_ubyte), size_t, POINTER(c_short), POINTER(c_short), POINTER(mp3data_struct), POINTER(c_int), POINTER(c_int)]'
+        ),
+    'id3tag_genre_list': (None, (),
+        "id3tag_genre_list = _libraries['/usr/lib/libmp3lame.so'].id3tag_genre_list\n"
+        'id3tag_genre_list.restype = None\n'
+        'id3tag_genre_list.argtypes = [CFUNCTYPE(None, c_int, STRING, c_void_p), c_void_p]'
+        ),
+    'id3tag_init': (None, ('lame_t',),
+        "id3tag_init = _libraries['/usr/lib/libmp3lame.so'].id3tag_init\n"
+        'id3tag_init.restype = None\n'
+        'id3tag_init.argtypes = [lame_t]'
+        ),
+    'id3tag_add_v2': (None, ('lame_t',),
+        "id3tag_add_v2 = _libraries['/usr/lib/libmp3lame.so'].id3tag_add_v2\n"
+        'id3tag_add_v2.restype = None\n'
+        'id3tag_add_v2.argtypes = [lame_t]'
+        ),
+    'id3tag_v1_only': (None, ('lame_t',),
+        "id3tag_v1_only = _libraries['/usr/lib/libmp3lame.so'].id3tag_v1_only\n"
+        'id3tag_v1_only.restype = None\n'
+        'id3tag_v1_only.argtypes = [lame_t]'
+        ),
+    'id3tag_v2_only': (None, ('lame_t',),
+        "id3tag_v2_only = _libraries['/usr/lib/libmp3lame.so'].id3tag_v2_only\n"
+        'id3tag_v2_only.restype = None\n'
+        'id3tag_v2_only.argtypes = [lame_t]'
+        ),
+    'id3tag_space_v1': (None, ('lame_t',),
+        "id3tag_space_v1 = _libraries['/usr/lib/libmp3lame.so'].id3tag_space_v1\n"
+        'id3tag_space_v1.restype = None\n'
+        'id3tag_space_v1.argtypes = [lame_t]'
+        ),
+    'id3tag_pad_v2': (None, ('lame_t',),
+        "id3tag_pad_v2 = _libraries['/usr/lib/libmp3lame.so'].id3tag_pad_v2\n"
+        'id3tag_pad_v2.restype = None\n'
+        'id3tag_pad_v2.argtypes = [lame_t]'
+        ),
+    'id3tag_set_pad': (None, ('lame_t',),
+        "id3tag_set_pad = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_pad\n"
+        'id3tag_set_pad.restype = None\n'
+        'id3tag_set_pad.argtypes = [lame_t, size_t]'
+        ),
+    'id3tag_set_title': (None, ('lame_t',),
+        "id3tag_set_title = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_title\n"
+        'id3tag_set_title.restype = None\n'
+        'id3tag_set_title.argtypes = [lame_t, STRING]'
+        ),
+    'id3tag_set_artist': (None, ('lame_t',),
+        "id3tag_set_artist = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_artist\n"
+        'id3tag_set_artist.restype = None\n'
+        'id3tag_set_artist.argtypes = [lame_t, STRING]'
+        ),
+    'id3tag_set_album': (None, ('lame_t',),
+        "id3tag_set_album = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_album\n"
+        'id3tag_set_album.restype = None\n'
+        'id3tag_set_album.argtypes = [lame_t, STRING]'
+        ),
+    'id3tag_set_year': (None, ('lame_t',),
+        "id3tag_set_year = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_year\n"
+        'id3tag_set_year.restype = None\n'
+        'id3tag_set_year.argtypes = [lame_t, STRING]'
+        ),
+    'id3tag_set_comment': (None, ('lame_t',),
+        "id3tag_set_comment = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_comment\n"
+        'id3tag_set_comment.restype = None\n'
+        'id3tag_set_comment.argtypes = [lame_t, STRING]'
+        ),
+    'id3tag_set_track': (None, ('lame_t',),
+        "id3tag_set_track = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_track\n"
+        'id3tag_set_track.restype = c_int\n'
+        'id3tag_set_track.argtypes = [lame_t, STRING]'
+        ),
+    'id3tag_set_genre': (None, ('lame_t',),
+        "id3tag_set_genre = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_genre\n"
+        'id3tag_set_genre.restype = c_int\n'
+        'id3tag_set_genre.argtypes = [lame_t, STRING]'
+        ),
+    'id3tag_set_fieldvalue': (None, ('lame_t',),
+        "id3tag_set_fieldvalue = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_fieldvalue\n"
+        'id3tag_set_fieldvalue.restype = c_int\n'
+        'id3tag_set_fieldvalue.argtypes = [lame_t, STRING]'
+        ),
+    'id3tag_set_albumart': (None, ('lame_t',),
+        "id3tag_set_albumart = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_albumart\n"
+        'id3tag_set_albumart.restype = c_int\n'
+        'id3tag_set_albumart.argtypes = [lame_t, STRING, size_t]'
+        ),
+    'lame_get_id3v1_tag': (None, ('lame_t',),
+        "lame_get_id3v1_tag = _libraries['/usr/lib/libmp3lame.so'].lame_get_id3v1_tag\n"
+        'lame_get_id3v1_tag.restype = size_t\n'
+        'lame_get_id3v1_tag.argtypes = [lame_t, POINTER(c_ubyte), size_t]'
+        ),
+    'lame_get_id3v2_tag': (None, ('lame_t',),
+        "lame_get_id3v2_tag = _libraries['/usr/lib/libmp3lame.so'].lame_get_id3v2_tag\n"
+        'lame_get_id3v2_tag.restype = size_t\n'
+        'lame_get_id3v2_tag.argtypes = [lame_t, POINTER(c_ubyte), size_t]'
+        ),
+    'lame_set_write_id3tag_automatic': (None, ('lame_global_flags',),
+        "lame_set_write_id3tag_automatic = _libraries['/usr/lib/libmp3lame.so'].lame_set_write_id3tag_automatic\n"
+        'lame_set_write_id3tag_automatic.restype = None\n'
+        'lame_set_write_id3tag_automatic.argtypes = [POINTER(lame_global_flags), c_int]'
+        ),
+    'lame_get_write_id3tag_automatic': (None, ('lame_global_flags',),
+        "lame_get_write_id3tag_automatic = _libraries['/usr/lib/libmp3lame.so'].lame_get_write_id3tag_automatic\n"
+        'lame_get_write_id3tag_automatic.restype = c_int\n'
+        'lame_get_write_id3tag_automatic.argtypes = [POINTER(lame_global_flags)]'
+        ),
+    'id3tag_set_textinfo_latin1': (None, ('lame_t',),
+        "id3tag_set_textinfo_latin1 = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_textinfo_latin1\n"
+        'id3tag_set_textinfo_latin1.restype = c_int\n'
+        'id3tag_set_textinfo_latin1.argtypes = [lame_t, STRING, STRING]'
+        ),
+    'id3tag_set_comment_latin1': (None, ('lame_t',),
+        "id3tag_set_comment_latin1 = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_comment_latin1\n"
+        'id3tag_set_comment_latin1.restype = c_int\n'
+        'id3tag_set_comment_latin1.argtypes = [lame_t, STRING, STRING, STRING]'
+        ),
+    'id3tag_set_fieldvalue_utf16': (None, ('lame_t',),
+        "id3tag_set_fieldvalue_utf16 = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_fieldvalue_utf16\n"
+        'id3tag_set_fieldvalue_utf16.restype = c_int\n'
+        'id3tag_set_fieldvalue_utf16.argtypes = [lame_t, POINTER(c_ushort)]'
+        ),
+    'id3tag_set_textinfo_utf16': (None, ('lame_t',),
+        "id3tag_set_textinfo_utf16 = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_textinfo_utf16\n"
+        'id3tag_set_textinfo_utf16.restype = c_int\n'
+        'id3tag_set_textinfo_utf16.argtypes = [lame_t, STRING, POINTER(c_ushort)]'
+        ),
+    'id3tag_set_comment_utf16': (None, ('lame_t',),
+        "id3tag_set_comment_utf16 = _libraries['/usr/lib/libmp3lame.so'].id3tag_set_comment_utf16\n"
+        'id3tag_set_comment_utf16.restype = c_int\n'
+        'id3tag_set_comment_utf16.argtypes = [lame_t, STRING, POINTER(c_ushort), POINTER(c_ushort)]'
+        ),
+    'bitrate_table': (None, (),
+        "bitrate_table = (c_int * 16 * 3).in_dll(_libraries['/usr/lib/libmp3lame.so'], 'bitrate_table')"
+        ),
+    'samplerate_table': (None, (),
+        "samplerate_table = (c_int * 4 * 3).in_dll(_libraries['/usr/lib/libmp3lame.so'], 'samplerate_table')"
+        ),
+    'lame_get_bitrate': (None, (),
+        "lame_get_bitrate = _libraries['/usr/lib/libmp3lame.so'].lame_get_bitrate\n"
+        'lame_get_bitrate.restype = c_int\n'
+        'lame_get_bitrate.argtypes = [c_int, c_int]'
+        ),
+    'lame_get_samplerate': (None, (),
+        "lame_get_samplerate = _libraries['/usr/lib/libmp3lame.so'].lame_get_samplerate\n"
+        'lame_get_samplerate.restype = c_int\n'
+        'lame_get_samplerate.argtypes = [c_int, c_int]'
+        ),
+    '_IO_jump_t': ('Structure', (),
+        '_IO_jump_t._fields_ = [\n'
+        ']'
+        ),
+    '_IO_marker': ('Structure', ('_IO_FILE',),
+        '_IO_marker._fields_ = [\n'
+        "    ('_next', POINTER(_IO_marker)),\n"
+        "    ('_sbuf', POINTER(_IO_FILE)),\n"
+        "    ('_pos', c_int),\n"
+        ']'
+        ),
+    '_IO_FILE_plus': ('Structure', (),
+        '_IO_FILE_plus._fields_ = [\n'
+        ']'
+        ),
+    '_IO_2_1_stdin_': (None, ('_IO_FILE_plus',),
+        "_IO_2_1_stdin_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmp3lame.so'], '_IO_2_1_stdin_')"
+        ),
+    '_IO_2_1_stdout_': (None, ('_IO_FILE_plus',),
+        "_IO_2_1_stdout_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmp3lame.so'], '_IO_2_1_stdout_')"
+        ),
+    '_IO_2_1_stderr_': (None, ('_IO_FILE_plus',),
+        "_IO_2_1_stderr_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmp3lame.so'], '_IO_2_1_stderr_')"
+        ),
+    '_IO_cookie_io_functions_t': ('Structure', (),
+        '_IO_cookie_io_functions_t._fields_ = [\n'
+        "    ('read', POINTER(__io_read_fn)),\n"
+        "    ('write', POINTER(__io_write_fn)),\n"
+        "    ('seek', POINTER(__io_seek_fn)),\n"
+        "    ('close', POINTER(__io_close_fn)),\n"
+        ']'
+        ),
+    'cookie_io_functions_t': (None, ('_IO_cookie_io_functions_t',),
+        'cookie_io_functions_t = _IO_cookie_io_functions_t'
+        ),
+    '_IO_cookie_file': ('Structure', (),
+        '_IO_cookie_file._fields_ = [\n'
+        ']'
+        ),
+    '__underflow': (None, ('_IO_FILE',),
+        "__underflow = _libraries['/usr/lib/libmp3lame.so'].__underflow\n"
+        '__underflow.restype = c_int\n'
+        '__underflow.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '__uflow': (None, ('_IO_FILE',),
+        "__uflow = _libraries['/usr/lib/libmp3lame.so'].__uflow\n"
+        '__uflow.restype = c_int\n'
+        '__uflow.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '__overflow': (None, ('_IO_FILE',),
+        "__overflow = _libraries['/usr/lib/libmp3lame.so'].__overflow\n"
+        '__overflow.restype = c_int\n'
+        '__overflow.argtypes = [POINTER(_IO_FILE), c_int]'
+        ),
+    '_IO_getc': (None, ('_IO_FILE',),
+        "_IO_getc = _libraries['/usr/lib/libmp3lame.so']._IO_getc\n"
+        '_IO_getc.restype = c_int\n'
+        '_IO_getc.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_putc': (None, ('_IO_FILE',),
+        "_IO_putc = _libraries['/usr/lib/libmp3lame.so']._IO_putc\n"
+        '_IO_putc.restype = c_int\n'
+        '_IO_putc.argtypes = [c_int, POINTER(_IO_FILE)]'
+        ),
+    '_IO_feof': (None, ('_IO_FILE',),
+        "_IO_feof = _libraries['/usr/lib/libmp3lame.so']._IO_feof\n"
+        '_IO_feof.restype = c_int\n'
+        '_IO_feof.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_ferror': (None, ('_IO_FILE',),
+        "_IO_ferror = _libraries['/usr/lib/libmp3lame.so']._IO_ferror\n"
+        '_IO_ferror.restype = c_int\n'
+        '_IO_ferror.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_peekc_locked': (None, ('_IO_FILE',),
+        "_IO_peekc_locked = _libraries['/usr/lib/libmp3lame.so']._IO_peekc_locked\n"
+        '_IO_peekc_locked.restype = c_int\n'
+        '_IO_peekc_locked.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_flockfile': (None, ('_IO_FILE',),
+        "_IO_flockfile = _libraries['/usr/lib/libmp3lame.so']._IO_flockfile\n"
+        '_IO_flockfile.restype = None\n'
+        '_IO_flockfile.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_funlockfile': (None, ('_IO_FILE',),
+        "_IO_funlockfile = _libraries['/usr/lib/libmp3lame.so']._IO_funlockfile\n"
+        '_IO_funlockfile.restype = None\n'
+        '_IO_funlockfile.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_ftrylockfile': (None, ('_IO_FILE',),
+        "_IO_ftrylockfile = _libraries['/usr/lib/libmp3lame.so']._IO_ftrylockfile\n"
+        '_IO_ftrylockfile.restype = c_int\n'
+        '_IO_ftrylockfile.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_vfscanf': (None, ('_IO_FILE', '__va_list_tag'),
+        "_IO_vfscanf = _libraries['/usr/lib/libmp3lame.so']._IO_vfscanf\n"
+        '_IO_vfscanf.restype = c_int\n'
+        '_IO_vfscanf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag), POINTER(c_int)]'
+        ),
+    '_IO_vfprintf': (None, ('_IO_FILE', '__va_list_tag'),
+        "_IO_vfprintf = _libraries['/usr/lib/libmp3lame.so']._IO_vfprintf\n"
+        '_IO_vfprintf.restype = c_int\n'
+        '_IO_vfprintf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag)]'
+        ),
+    '_IO_padn': (None, ('_IO_FILE',),
+        "_IO_padn = _libraries['/usr/lib/libmp3lame.so']._IO_padn\n"
+        '_IO_padn.restype = __ssize_t\n'
+        '_IO_padn.argtypes = [POINTER(_IO_FILE), c_int, __ssize_t]'
+        ),
+    '_IO_sgetn': (None, ('_IO_FILE',),
+        "_IO_sgetn = _libraries['/usr/lib/libmp3lame.so']._IO_sgetn\n"
+        '_IO_sgetn.restype = size_t\n'
+        '_IO_sgetn.argtypes = [POINTER(_IO_FILE), c_void_p, size_t]'
+        ),
+    '_IO_seekoff': (None, ('_IO_FILE',),
+        "_IO_seekoff = _libraries['/usr/lib/libmp3lame.so']._IO_seekoff\n"
+        '_IO_seekoff.restype = __off64_t\n'
+        '_IO_seekoff.argtypes = [POINTER(_IO_FILE), __off64_t, c_int, c_int]'
+        ),
+    '_IO_seekpos': (None, ('_IO_FILE',),
+        "_IO_seekpos = _libraries['/usr/lib/libmp3lame.so']._IO_seekpos\n"
+        '_IO_seekpos.restype = __off64_t\n'
+        '_IO_seekpos.argtypes = [POINTER(_IO_FILE), __off64_t, c_int]'
+        ),
+    '_IO_free_backup_area': (None, ('_IO_FILE',),
+        "_IO_free_backup_area = _libraries['/usr/lib/libmp3lame.so']._IO_free_backup_area\n"
+        '_IO_free_backup_area.restype = None\n'
+        '_IO_free_backup_area.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '__FILE': (None, ('_IO_FILE',),
+        '__FILE = _IO_FILE'
+        ),
+    'fpos_t': (None, ('_G_fpos_t',),
+        'fpos_t = _G_fpos_t'
+        ),
+    'fpos64_t': (None, ('_G_fpos64_t',),
+        'fpos64_t = _G_fpos64_t'
+        ),
+    'remove': (None, (),
+        "remove = _libraries['/usr/lib/libmp3lame.so'].remove\n"
+        'remove.restype = c_int\n'
+        'remove.argtypes = [STRING]'
+        ),
+    'rename': (None, (),
+        "rename = _libraries['/usr/lib/libmp3lame.so'].rename\n"
+        'rename.restype = c_int\n'
+        'rename.argtypes = [STRING, STRING]'
+        ),
+    'renameat': (None, (),
+        "renameat = _libraries['/usr/lib/libmp3lame.so'].renameat\n"
+        'renameat.restype = c_int\n'
+        'renameat.argtypes = [c_int, STRING, c_int, STRING]'
+        ),
+    'tmpfile': (None, ('FILE',),
+        "tmpfile = _libraries['/usr/lib/libmp3lame.so'].tmpfile\n"
+        'tmpfile.restype = POINTER(FILE)\n'
+        'tmpfile.argtypes = []'
+        ),
+    'tmpfile64': (None, ('FILE',),
+        "tmpfile64 = _libraries['/usr/lib/libmp3lame.so'].tmpfile64\n"
+        'tmpfile64.restype = POINTER(FILE)\n'
+        'tmpfile64.argtypes = []'
+        ),
+    'tmpnam': (None, (),
+        "tmpnam = _libraries['/usr/lib/libmp3lame.so'].tmpnam\n"
+        'tmpnam.restype = STRING\n'
+        'tmpnam.argtypes = [STRING]'
+        ),
+    'tmpnam_r': (None, (),
+        "tmpnam_r = _libraries['/usr/lib/libmp3lame.so'].tmpnam_r\n"
+        'tmpnam_r.restype = STRING\n'
+        'tmpnam_r.argtypes = [STRING]'
+        ),
+    'tempnam': (None, (),
+        "tempnam = _libraries['/usr/lib/libmp3lame.so'].tempnam\n"
+        'tempnam.restype = STRING\n'
+        'tempnam.argtypes = [STRING, STRING]'
+        ),
+    'fclose': (None, ('FILE',),
+        "fclose = _libraries['/usr/lib/libmp3lame.so'].fclose\n"
+        'fclose.restype = c_int\n'
+        'fclose.argtypes = [POINTER(FILE)]'
+        ),
+    'fflush': (None, ('FILE',),
+        "fflush = _libraries['/usr/lib/libmp3lame.so'].fflush\n"
+        'fflush.restype = c_int\n'
+        'fflush.argtypes = [POINTER(FILE)]'
+        ),
+    'fflush_unlocked': (None, ('FILE',),
+        "fflush_unlocked = _libraries['/usr/lib/libmp3lame.so'].fflush_unlocked\n"
+        'fflush_unlocked.restype = c_int\n'
+        'fflush_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'fcloseall': (None, (),
+        "fcloseall = _libraries['/usr/lib/libmp3lame.so'].fcloseall\n"
+        'fcloseall.restype = c_int\n'
+        'fcloseall.argtypes = []'
+        ),
+    'fopen': (None, ('FILE',),
+        "fopen = _libraries['/usr/lib/libmp3lame.so'].fopen\n"
+        'fopen.restype = POINTER(FILE)\n'
+        'fopen.argtypes = [STRING, STRING]'
+        ),
+    'freopen': (None, ('FILE',),
+        "freopen = _libraries['/usr/lib/libmp3lame.so'].freopen\n"
+        'freopen.restype = POINTER(FILE)\n'
+        'freopen.argtypes = [STRING, STRING, POINTER(FILE)]'
+        ),
+    'fopen64': (None, ('FILE',),
+        "fopen64 = _libraries['/usr/lib/libmp3lame.so'].fopen64\n"
+        'fopen64.restype = POINTER(FILE)\n'
+        'fopen64.argtypes = [STRING, STRING]'
+        ),
+    'freopen64': (None, ('FILE',),
+        "freopen64 = _libraries['/usr/lib/libmp3lame.so'].freopen64\n"
+        'freopen64.restype = POINTER(FILE)\n'
+        'freopen64.argtypes = [STRING, STRING, POINTER(FILE)]'
+        ),
+    'fdopen': (None, ('FILE',),
+        "fdopen = _libraries['/usr/lib/libmp3lame.so'].fdopen\n"
+        'fdopen.restype = POINTER(FILE)\n'
+        'fdopen.argtypes = [c_int, STRING]'
+        ),
+    'fopencookie': (None, ('FILE', '_IO_cookie_io_functions_t'),
+        "fopencookie = _libraries['/usr/lib/libmp3lame.so'].fopencookie\n"
+        'fopencookie.restype = POINTER(FILE)\n'
+        'fopencookie.argtypes = [c_void_p, STRING, _IO_cookie_io_functions_t]'
+        ),
+    'fmemopen': (None, ('FILE',),
+        "fmemopen = _libraries['/usr/lib/libmp3lame.so'].fmemopen\n"
+        'fmemopen.restype = POINTER(FILE)\n'
+        'fmemopen.argtypes = [c_void_p, size_t, STRING]'
+        ),
+    'open_memstream': (None, ('FILE',),
+        "open_memstream = _libraries['/usr/lib/libmp3lame.so'].open_memstream\n"
+        'open_memstream.restype = POINTER(FILE)\n'
+        'open_memstream.argtypes = [POINTER(STRING), POINTER(size_t)]'
+        ),
+    'setbuf': (None, ('FILE',),
+        "setbuf = _libraries['/usr/lib/libmp3lame.so'].setbuf\n"
+        'setbuf.restype = None\n'
+        'setbuf.argtypes = [POINTER(FILE), STRING]'
+        ),
+    'setvbuf': (None, ('FILE',),
+        "setvbuf = _libraries['/usr/lib/libmp3lame.so'].setvbuf\n"
+        'setvbuf.restype = c_int\n'
+        'setvbuf.argtypes = [POINTER(FILE), STRING, c_int, size_t]'
+        ),
+    'setbuffer': (None, ('FILE',),
+        "setbuffer = _libraries['/usr/lib/libmp3lame.so'].setbuffer\n"
+        'setbuffer.restype = None\n'
+        'setbuffer.argtypes = [POINTER(FILE), STRING, size_t]'
+        ),
+    'setlinebuf': (None, ('FILE',),
+        "setlinebuf = _libraries['/usr/lib/libmp3lame.so'].setlinebuf\n"
+        'setlinebuf.restype = None\n'
+        'setlinebuf.argtypes = [POINTER(FILE)]'
+        ),
+    'fscanf': (None, ('FILE',),
+        "fscanf = _libraries['/usr/lib/libmp3lame.so'].fscanf\n"
+        'fscanf.restype = c_int\n'
+        'fscanf.argtypes = [POINTER(FILE), STRING]'
+        ),
+    'scanf': (None, (),
+        "scanf = _libraries['/usr/lib/libmp3lame.so'].scanf\n"
+        'scanf.restype = c_int\n'
+        'scanf.argtypes = [STRING]'
+        ),
+    'sscanf': (None, (),
+        "sscanf = _libraries['/usr/lib/libmp3lame.so'].sscanf\n"
+        'sscanf.restype = c_int\n'
+        'sscanf.argtypes = [STRING, STRING]'
+        ),
+    'vfscanf': (None, ('FILE', '__va_list_tag'),
+        "vfscanf = _libraries['/usr/lib/libmp3lame.so'].vfscanf\n"
+        'vfscanf.restype = c_int\n'
+        'vfscanf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]'
+        ),
+    'vscanf': (None, ('__va_list_tag',),
+        "vscanf = _libraries['/usr/lib/libmp3lame.so'].vscanf\n"
+        'vscanf.restype = c_int\n'
+        'vscanf.argtypes = [STRING, POINTER(__va_list_tag)]'
+        ),
+    'vsscanf': (None, ('__va_list_tag',),
+        "vsscanf = _libraries['/usr/lib/libmp3lame.so'].vsscanf\n"
+        'vsscanf.restype = c_int\n'
+        'vsscanf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]'
+        ),
+    'fgetc': (None, ('FILE',),
+        "fgetc = _libraries['/usr/lib/libmp3lame.so'].fgetc\n"
+        'fgetc.restype = c_int\n'
+        'fgetc.argtypes = [POINTER(FILE)]'
+        ),
+    'fputc': (None, ('FILE',),
+        "fputc = _libraries['/usr/lib/libmp3lame.so'].fputc\n"
+        'fputc.restype = c_int\n'
+        'fputc.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'getw': (None, ('FILE',),
+        "getw = _libraries['/usr/lib/libmp3lame.so'].getw\n"
+        'getw.restype = c_int\n'
+        'getw.argtypes = [POINTER(FILE)]'
+        ),
+    'putw': (None, ('FILE',),
+        "putw = _libraries['/usr/lib/libmp3lame.so'].putw\n"
+        'putw.restype = c_int\n'
+        'putw.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'gets': (None, (),
+        "gets = _libraries['/usr/lib/libmp3lame.so'].gets\n"
+        'gets.restype = STRING\n'
+        'gets.argtypes = [STRING]'
+        ),
+    '__getdelim': (None, ('FILE',),
+        "__getdelim = _libraries['/usr/lib/libmp3lame.so'].__getdelim\n"
+        '__getdelim.restype = __ssize_t\n'
+        '__getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]'
+        ),
+    'getdelim': (None, ('FILE',),
+        "getdelim = _libraries['/usr/lib/libmp3lame.so'].getdelim\n"
+        'getdelim.restype = __ssize_t\n'
+        'getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]'
+        ),
+    'fputs': (None, ('FILE',),
+        "fputs = _libraries['/usr/lib/libmp3lame.so'].fputs\n"
+        'fputs.restype = c_int\n'
+        'fputs.argtypes = [STRING, POINTER(FILE)]'
+        ),
+    'puts': (None, (),
+        "puts = _libraries['/usr/lib/libmp3lame.so'].puts\n"
+        'puts.restype = c_int\n'
+        'puts.argtypes = [STRING]'
+        ),
+    'ungetc': (None, ('FILE',),
+        "ungetc = _libraries['/usr/lib/libmp3lame.so'].ungetc\n"
+        'ungetc.restype = c_int\n'
+        'ungetc.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'fwrite': (None, ('FILE',),
+        "fwrite = _libraries['/usr/lib/libmp3lame.so'].fwrite\n"
+        'fwrite.restype = size_t\n'
+        'fwrite.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fputs_unlocked': (None, ('FILE',),
+        "fputs_unlocked = _libraries['/usr/lib/libmp3lame.so'].fputs_unlocked\n"
+        'fputs_unlocked.restype = c_int\n'
+        'fputs_unlocked.argtypes = [STRING, POINTER(FILE)]'
+        ),
+    'fwrite_unlocked': (None, ('FILE',),
+        "fwrite_unlocked = _libraries['/usr/lib/libmp3lame.so'].fwrite_unlocked\n"
+        'fwrite_unlocked.restype = size_t\n'
+        'fwrite_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fseek': (None, ('FILE',),
+        "fseek = _libraries['/usr/lib/libmp3lame.so'].fseek\n"
+        'fseek.restype = c_int\n'
+        'fseek.argtypes = [POINTER(FILE), c_long, c_int]'
+        ),
+    'ftell': (None, ('FILE',),
+        "ftell = _libraries['/usr/lib/libmp3lame.so'].ftell\n"
+        'ftell.restype = c_long\n'
+        'ftell.argtypes = [POINTER(FILE)]'
+        ),
+    'rewind': (None, ('FILE',),
+        "rewind = _libraries['/usr/lib/libmp3lame.so'].rewind\n"
+        'rewind.restype = None\n'
+        'rewind.argtypes = [POINTER(FILE)]'
+        ),
+    'fseeko': (None, ('FILE',),
+        "fseeko = _libraries['/usr/lib/libmp3lame.so'].fseeko\n"
+        'fseeko.restype = c_int\n'
+        'fseeko.argtypes = [POINTER(FILE), __off_t, c_int]'
+        ),
+    'ftello': (None, ('FILE',),
+        "ftello = _libraries['/usr/lib/libmp3lame.so'].ftello\n"
+        'ftello.restype = __off_t\n'
+        'ftello.argtypes = [POINTER(FILE)]'
+        ),
+    'fgetpos': (None, ('FILE', 'fpos_t'),
+        "fgetpos = _libraries['/usr/lib/libmp3lame.so'].fgetpos\n"
+        'fgetpos.restype = c_int\n'
+        'fgetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]'
+        ),
+    'fsetpos': (None, ('FILE', 'fpos_t'),
+        "fsetpos = _libraries['/usr/lib/libmp3lame.so'].fsetpos\n"
+        'fsetpos.restype = c_int\n'
+        'fsetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]'
+        ),
+    'fseeko64': (None, ('FILE',),
+        "fseeko64 = _libraries['/usr/lib/libmp3lame.so'].fseeko64\n"
+        'fseeko64.restype = c_int\n'
+        'fseeko64.argtypes = [POINTER(FILE), __off64_t, c_int]'
+        ),
+    'ftello64': (None, ('FILE',),
+        "ftello64 = _libraries['/usr/lib/libmp3lame.so'].ftello64\n"
+        'ftello64.restype = __off64_t\n'
+        'ftello64.argtypes = [POINTER(FILE)]'
+        ),
+    'fgetpos64': (None, ('FILE', 'fpos64_t'),
+        "fgetpos64 = _libraries['/usr/lib/libmp3lame.so'].fgetpos64\n"
+        'fgetpos64.restype = c_int\n'
+        'fgetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]'
+        ),
+    'fsetpos64': (None, ('FILE', 'fpos64_t'),
+        "fsetpos64 = _libraries['/usr/lib/libmp3lame.so'].fsetpos64\n"
+        'fsetpos64.restype = c_int\n'
+        'fsetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]'
+        ),
+    'clearerr': (None, ('FILE',),
+        "clearerr = _libraries['/usr/lib/libmp3lame.so'].clearerr\n"
+        'clearerr.restype = None\n'
+        'clearerr.argtypes = [POINTER(FILE)]'
+        ),
+    'feof': (None, ('FILE',),
+        "feof = _libraries['/usr/lib/libmp3lame.so'].feof\n"
+        'feof.restype = c_int\n'
+        'feof.argtypes = [POINTER(FILE)]'
+        ),
+    'ferror': (None, ('FILE',),
+        "ferror = _libraries['/usr/lib/libmp3lame.so'].ferror\n"
+        'ferror.restype = c_int\n'
+        'ferror.argtypes = [POINTER(FILE)]'
+        ),
+    'clearerr_unlocked': (None, ('FILE',),
+        "clearerr_unlocked = _libraries['/usr/lib/libmp3lame.so'].clearerr_unlocked\n"
+        'clearerr_unlocked.restype = None\n'
+        'clearerr_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'perror': (None, (),
+        "perror = _libraries['/usr/lib/libmp3lame.so'].perror\n"
+        'perror.restype = None\n'
+        'perror.argtypes = [STRING]'
+        ),
+    'fileno': (None, ('FILE',),
+        "fileno = _libraries['/usr/lib/libmp3lame.so'].fileno\n"
+        'fileno.restype = c_int\n'
+        'fileno.argtypes = [POINTER(FILE)]'
+        ),
+    'fileno_unlocked': (None, ('FILE',),
+        "fileno_unlocked = _libraries['/usr/lib/libmp3lame.so'].fileno_unlocked\n"
+        'fileno_unlocked.restype = c_int\n'
+        'fileno_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'popen': (None, ('FILE',),
+        "popen = _libraries['/usr/lib/libmp3lame.so'].popen\n"
+        'popen.restype = POINTER(FILE)\n'
+        'popen.argtypes = [STRING, STRING]'
+        ),
+    'pclose': (None, ('FILE',),
+        "pclose = _libraries['/usr/lib/libmp3lame.so'].pclose\n"
+        'pclose.restype = c_int\n'
+        'pclose.argtypes = [POINTER(FILE)]'
+        ),
+    'ctermid': (None, (),
+        "ctermid = _libraries['/usr/lib/libmp3lame.so'].ctermid\n"
+        'ctermid.restype = STRING\n'
+        'ctermid.argtypes = [STRING]'
+        ),
+    'cuserid': (None, (),
+        "cuserid = _libraries['/usr/lib/libmp3lame.so'].cuserid\n"
+        'cuserid.restype = STRING\n'
+        'cuserid.argtypes = [STRING]'
+        ),
+    'flockfile': (None, ('FILE',),
+        "flockfile = _libraries['/usr/lib/libmp3lame.so'].flockfile\n"
+        'flockfile.restype = None\n'
+        'flockfile.argtypes = [POINTER(FILE)]'
+        ),
+    'ftrylockfile': (None, ('FILE',),
+        "ftrylockfile = _libraries['/usr/lib/libmp3lame.so'].ftrylockfile\n"
+        'ftrylockfile.restype = c_int\n'
+        'ftrylockfile.argtypes = [POINTER(FILE)]'
+        ),
+    'funlockfile': (None, ('FILE',),
+        "funlockfile = _libraries['/usr/lib/libmp3lame.so'].funlockfile\n"
+        'funlockfile.restype = None\n'
+        'funlockfile.argtypes = [POINTER(FILE)]'
+        ),
+    'va_list': (None, ('__gnuc_va_list',),
+        'va_list = __gnuc_va_list'
+        ),
+}
+
+_bind_lazily(__name__, _definitions)
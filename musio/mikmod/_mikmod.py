@@ -1,12 +1,12 @@
 from ctypes import *
+from ..import_util import LazyLibraries as _LazyLibraries
+from ..import_util import bind_lazily as _bind_lazily
 
-_libraries = {}
-_libraries['/usr/lib/libmikmod.so'] = CDLL('/usr/lib/libmikmod.so')
+_libraries = _LazyLibraries()
 STRING = c_char_p
 WSTRING = c_wchar_p
 
 
-def putc(_ch,_fp): return _IO_putc (_ch, _fp) # macro
 MD_SOFTWARE = 1
 MMERR_MAX = 96
 MMERR_ALSA_SETCHANNELS = 91
@@ -21,26 +21,7 @@ MMERR_OPENAL_GETSOURCE = 84
 MMERR_OS2_TIMER = 49
 MMERR_OPENAL_QUEUEBUFFERS = 81
 def _IO_peekc(_fp): return _IO_peekc_unlocked (_fp) # macro
-class _G_fpos_t(Structure):
-    pass
 __off_t = c_long
-class __mbstate_t(Structure):
-    pass
-class N11__mbstate_t3DOT_2E(Union):
-    pass
-N11__mbstate_t3DOT_2E._fields_ = [
-    ('__wch', c_uint),
-    ('__wchb', c_char * 4),
-]
-__mbstate_t._fields_ = [
-    ('__count', c_int),
-    ('__value', N11__mbstate_t3DOT_2E),
-]
-_G_fpos_t._fields_ = [
-    ('__pos', __off_t),
-    ('__state', __mbstate_t),
-]
-_IO_fpos_t = _G_fpos_t # alias
 MMERR_NO_FLOAT32 = 75
 MMERR_DOSSB_STARTDMA = 74
 # __SUSECONDS_T_TYPE = __SYSCALL_SLONG_TYPE # alias
@@ -70,14 +51,7 @@ MD_HARDWARE = 0
 MMERR_DS_THREAD = 56
 MMERR_DS_BUFFER = 52
 MMERR_DS_PRIORITY = 51
-class _G_fpos64_t(Structure):
-    pass
 __off64_t = c_long
-_G_fpos64_t._fields_ = [
-    ('__pos', __off64_t),
-    ('__state', __mbstate_t),
-]
-_IO_fpos64_t = _G_fpos64_t # alias
 MMERR_OS2_SEMAPHORE = 48
 MMERR_OS2_MIXSETUP = 47
 # __S32_TYPE = int # alias
@@ -116,12 +90,6 @@ __BYTE_ORDER = __LITTLE_ENDIAN # alias
 MMERR_INVALID_DEVICE = 16
 # __SYSCALL_ULONG_TYPE = __ULONGWORD_TYPE # alias
 # __RLIM_T_TYPE = __SYSCALL_ULONG_TYPE # alias
-class __va_list_tag(Structure):
-    pass
-__va_list_tag._fields_ = [
-]
-__gnuc_va_list = __va_list_tag * 1
-_G_va_list = __gnuc_va_list # alias
 # def __FDS_BITS(set): return ((set)->fds_bits) # macro
 MMERR_ALSA_NOCONFIG = 87
 MMERR_OUT_OF_MEMORY = 2
@@ -137,13 +105,7 @@ MMERR_MAC_START = 64
 def FD_CLR(fd,fdsetp): return __FD_CLR (fd, fdsetp) # macro
 MMERR_OPENAL_SOURCESTOP = 86
 # __NLINK_T_TYPE = __SYSCALL_ULONG_TYPE # alias
-class _IO_FILE(Structure):
-    pass
-stdout = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmikmod.so'], 'stdout')
-stdout = stdout # alias
 MMERR_GUS_TIMER = 30
-stderr = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmikmod.so'], 'stderr')
-stderr = stderr # alias
 # __wur = __attribute_warn_unused_result__ # alias
 # __USECONDS_T_TYPE = __U32_TYPE # alias
 # __TIME_T_TYPE = __SYSCALL_SLONG_TYPE # alias
@@ -173,7 +135,6 @@ MMERR_NOT_A_STREAM = 12
 def be32toh(x): return __bswap_32 (x) # macro
 # def __warndecl(name,msg): return extern void name (void) __attribute__((__warning__ (msg))) # macro
 MMERR_OPENAL_GENSOURCES = 79
-_IO_va_list = __gnuc_va_list # alias
 __uid_t = c_uint
 _IO_uid_t = __uid_t # alias
 # def __u_intN_t(N,MODE): return typedef unsigned int u_int ##N ##_t __attribute__ ((__mode__ (MODE))) # macro
@@ -191,8 +152,6 @@ def WSTOPSIG(status): return __WSTOPSIG (__WAIT_INT (status)) # macro
 __codecvt_noconv = 3
 BYTE_ORDER = __BYTE_ORDER # alias
 BUFSIZ = _IO_BUFSIZ # alias
-stdin = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmikmod.so'], 'stdin')
-stdin = stdin # alias
 def __WTERMSIG(status): return ((status) & 0x7f) # macro
 MMERR_NOT_A_MODULE = 11
 MMERR_AIX_CONFIG_START = 27
@@ -203,7 +162,6 @@ def le16toh(x): return (x) # macro
 __PDP_ENDIAN = 3412 # Variable c_int '3412'
 PDP_ENDIAN = __PDP_ENDIAN # alias
 MMERR_DETECTING_DEVICE = 15
-def minor(dev): return gnu_dev_minor (dev) # macro
 def htole32(x): return (x) # macro
 def WIFSTOPPED(status): return __WIFSTOPPED (__WAIT_INT (status)) # macro
 MMERR_ITPACK_INVALID_DATA = 14
@@ -269,10 +227,8 @@ size_t = c_ulong
 _IO_size_t = size_t # alias
 def __LONG_LONG_PAIR(HI,LO): return LO, HI # macro
 def __bos0(ptr): return __builtin_object_size (ptr, 0) # macro
-def getc(_fp): return _IO_getc (_fp) # macro
 # __FSFILCNT64_T_TYPE = __UQUAD_TYPE # alias
 MMERR_OSX_PTHREAD = 72
-def makedev(maj,min): return gnu_dev_makedev (maj, min) # macro
 def __attribute_format_strfmon__(a,b): return __attribute__ ((__format__ (__strfmon__, a, b))) # macro
 def WIFEXITED(status): return __WIFEXITED (__WAIT_INT (status)) # macro
 __NFDBITS = 64 # Variable c_int '64'
@@ -286,7 +242,6 @@ __BIG_ENDIAN = 4321 # Variable c_int '4321'
 BIG_ENDIAN = __BIG_ENDIAN # alias
 def __WCOREDUMP(status): return ((status) & __WCOREFLAG) # macro
 def FD_SET(fd,fdsetp): return __FD_SET (fd, fdsetp) # macro
-def major(dev): return gnu_dev_major (dev) # macro
 def __bswap_constant_32(x): return ((((x) & 0xff000000) >> 24) | (((x) & 0x00ff0000) >> 8) | (((x) & 0x0000ff00) << 8) | (((x) & 0x000000ff) << 24)) # macro
 MMERR_SAMPLE_TOO_BIG = 4
 # def __REDIRECT_NTHNL(name,proto,alias): return name proto __THROWNL __asm__ (__ASMNAME (#alias)) # macro
@@ -535,320 +490,13 @@ _IOLBF = 1 # Variable c_int '1'
 _XLOCALE_H = 1 # Variable c_int '1'
 __FD_ZERO_STOS = 'stosq' # Variable STRING '(const char*)"stosq"'
 pthread_t = c_ulong
-class pthread_attr_t(Union):
-    pass
-pthread_attr_t._fields_ = [
-    ('__size', c_char * 56),
-    ('__align', c_long),
-]
-class __pthread_internal_list(Structure):
-    pass
-__pthread_internal_list._fields_ = [
-    ('__prev', POINTER(__pthread_internal_list)),
-    ('__next', POINTER(__pthread_internal_list)),
-]
-__pthread_list_t = __pthread_internal_list
-class __pthread_mutex_s(Structure):
-    pass
-__pthread_mutex_s._fields_ = [
-    ('__lock', c_int),
-    ('__count', c_uint),
-    ('__owner', c_int),
-    ('__nusers', c_uint),
-    ('__kind', c_int),
-    ('__spins', c_short),
-    ('__elision', c_short),
-    ('__list', __pthread_list_t),
-]
-class pthread_mutex_t(Union):
-    pass
-pthread_mutex_t._fields_ = [
-    ('__data', __pthread_mutex_s),
-    ('__size', c_char * 40),
-    ('__align', c_long),
-]
-class pthread_mutexattr_t(Union):
-    pass
-pthread_mutexattr_t._fields_ = [
-    ('__size', c_char * 4),
-    ('__align', c_int),
-]
-class N14pthread_cond_t4DOT_16E(Structure):
-    pass
-N14pthread_cond_t4DOT_16E._fields_ = [
-    ('__lock', c_int),
-    ('__futex', c_uint),
-    ('__total_seq', c_ulonglong),
-    ('__wakeup_seq', c_ulonglong),
-    ('__woken_seq', c_ulonglong),
-    ('__mutex', c_void_p),
-    ('__nwaiters', c_uint),
-    ('__broadcast_seq', c_uint),
-]
-class pthread_cond_t(Union):
-    pass
-pthread_cond_t._fields_ = [
-    ('__data', N14pthread_cond_t4DOT_16E),
-    ('__size', c_char * 48),
-    ('__align', c_longlong),
-]
-class pthread_condattr_t(Union):
-    pass
-pthread_condattr_t._fields_ = [
-    ('__size', c_char * 4),
-    ('__align', c_int),
-]
 pthread_key_t = c_uint
 pthread_once_t = c_int
-class N16pthread_rwlock_t4DOT_19E(Structure):
-    pass
-N16pthread_rwlock_t4DOT_19E._fields_ = [
-    ('__lock', c_int),
-    ('__nr_readers', c_uint),
-    ('__readers_wakeup', c_uint),
-    ('__writer_wakeup', c_uint),
-    ('__nr_readers_queued', c_uint),
-    ('__nr_writers_queued', c_uint),
-    ('__writer', c_int),
-    ('__shared', c_int),
-    ('__pad1', c_ulong),
-    ('__pad2', c_ulong),
-    ('__flags', c_uint),
-]
-class pthread_rwlock_t(Union):
-    pass
-pthread_rwlock_t._fields_ = [
-    ('__data', N16pthread_rwlock_t4DOT_19E),
-    ('__size', c_char * 56),
-    ('__align', c_long),
-]
-class pthread_rwlockattr_t(Union):
-    pass
-pthread_rwlockattr_t._fields_ = [
-    ('__size', c_char * 8),
-    ('__align', c_long),
-]
 pthread_spinlock_t = c_int
-class pthread_barrier_t(Union):
-    pass
-pthread_barrier_t._fields_ = [
-    ('__size', c_char * 32),
-    ('__align', c_long),
-]
-class pthread_barrierattr_t(Union):
-    pass
-pthread_barrierattr_t._fields_ = [
-    ('__size', c_char * 4),
-    ('__align', c_int),
-]
-__fdelt_chk = _libraries['/usr/lib/libmikmod.so'].__fdelt_chk
-__fdelt_chk.restype = c_long
-__fdelt_chk.argtypes = [c_long]
-__fdelt_warn = _libraries['/usr/lib/libmikmod.so'].__fdelt_warn
-__fdelt_warn.restype = c_long
-__fdelt_warn.argtypes = [c_long]
 __sig_atomic_t = c_int
-class __sigset_t(Structure):
-    pass
-__sigset_t._fields_ = [
-    ('__val', c_ulong * 16),
-]
-getchar = _libraries['/usr/lib/libmikmod.so'].getchar
-getchar.restype = c_int
-getchar.argtypes = []
-FILE = _IO_FILE
-fgetc_unlocked = _libraries['/usr/lib/libmikmod.so'].fgetc_unlocked
-fgetc_unlocked.restype = c_int
-fgetc_unlocked.argtypes = [POINTER(FILE)]
-getc_unlocked = _libraries['/usr/lib/libmikmod.so'].getc_unlocked
-getc_unlocked.restype = c_int
-getc_unlocked.argtypes = [POINTER(FILE)]
-getchar_unlocked = _libraries['/usr/lib/libmikmod.so'].getchar_unlocked
-getchar_unlocked.restype = c_int
-getchar_unlocked.argtypes = []
-putchar = _libraries['/usr/lib/libmikmod.so'].putchar
-putchar.restype = c_int
-putchar.argtypes = [c_int]
-fputc_unlocked = _libraries['/usr/lib/libmikmod.so'].fputc_unlocked
-fputc_unlocked.restype = c_int
-fputc_unlocked.argtypes = [c_int, POINTER(FILE)]
-putc_unlocked = _libraries['/usr/lib/libmikmod.so'].putc_unlocked
-putc_unlocked.restype = c_int
-putc_unlocked.argtypes = [c_int, POINTER(FILE)]
-putchar_unlocked = _libraries['/usr/lib/libmikmod.so'].putchar_unlocked
-putchar_unlocked.restype = c_int
-putchar_unlocked.argtypes = [c_int]
-getline = _libraries['/usr/lib/libmikmod.so'].getline
-getline.restype = __ssize_t
-getline.argtypes = [POINTER(STRING), POINTER(size_t), POINTER(FILE)]
-feof_unlocked = _libraries['/usr/lib/libmikmod.so'].feof_unlocked
-feof_unlocked.restype = c_int
-feof_unlocked.argtypes = [POINTER(FILE)]
-ferror_unlocked = _libraries['/usr/lib/libmikmod.so'].ferror_unlocked
-ferror_unlocked.restype = c_int
-ferror_unlocked.argtypes = [POINTER(FILE)]
-__sprintf_chk = _libraries['/usr/lib/libmikmod.so'].__sprintf_chk
-__sprintf_chk.restype = c_int
-__sprintf_chk.argtypes = [STRING, c_int, size_t, STRING]
-__vsprintf_chk = _libraries['/usr/lib/libmikmod.so'].__vsprintf_chk
-__vsprintf_chk.restype = c_int
-__vsprintf_chk.argtypes = [STRING, c_int, size_t, STRING, POINTER(__va_list_tag)]
-sprintf = _libraries['/usr/lib/libmikmod.so'].sprintf
-sprintf.restype = c_int
-sprintf.argtypes = [STRING, STRING]
-vsprintf = _libraries['/usr/lib/libmikmod.so'].vsprintf
-vsprintf.restype = c_int
-vsprintf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]
-__snprintf_chk = _libraries['/usr/lib/libmikmod.so'].__snprintf_chk
-__snprintf_chk.restype = c_int
-__snprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING]
-__vsnprintf_chk = _libraries['/usr/lib/libmikmod.so'].__vsnprintf_chk
-__vsnprintf_chk.restype = c_int
-__vsnprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING, POINTER(__va_list_tag)]
-snprintf = _libraries['/usr/lib/libmikmod.so'].snprintf
-snprintf.restype = c_int
-snprintf.argtypes = [STRING, size_t, STRING]
-vsnprintf = _libraries['/usr/lib/libmikmod.so'].vsnprintf
-vsnprintf.restype = c_int
-vsnprintf.argtypes = [STRING, size_t, STRING, POINTER(__va_list_tag)]
-__fprintf_chk = _libraries['/usr/lib/libmikmod.so'].__fprintf_chk
-__fprintf_chk.restype = c_int
-__fprintf_chk.argtypes = [POINTER(FILE), c_int, STRING]
-__printf_chk = _libraries['/usr/lib/libmikmod.so'].__printf_chk
-__printf_chk.restype = c_int
-__printf_chk.argtypes = [c_int, STRING]
-__vfprintf_chk = _libraries['/usr/lib/libmikmod.so'].__vfprintf_chk
-__vfprintf_chk.restype = c_int
-__vfprintf_chk.argtypes = [POINTER(FILE), c_int, STRING, POINTER(__va_list_tag)]
-__vprintf_chk = _libraries['/usr/lib/libmikmod.so'].__vprintf_chk
-__vprintf_chk.restype = c_int
-__vprintf_chk.argtypes = [c_int, STRING, POINTER(__va_list_tag)]
-fprintf = _libraries['/usr/lib/libmikmod.so'].fprintf
-fprintf.restype = c_int
-fprintf.argtypes = [POINTER(FILE), STRING]
-printf = _libraries['/usr/lib/libmikmod.so'].printf
-printf.restype = c_int
-printf.argtypes = [STRING]
-vprintf = _libraries['/usr/lib/libmikmod.so'].vprintf
-vprintf.restype = c_int
-vprintf.argtypes = [STRING, POINTER(__va_list_tag)]
-vfprintf = _libraries['/usr/lib/libmikmod.so'].vfprintf
-vfprintf.restype = c_int
-vfprintf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]
-__dprintf_chk = _libraries['/usr/lib/libmikmod.so'].__dprintf_chk
-__dprintf_chk.restype = c_int
-__dprintf_chk.argtypes = [c_int, c_int, STRING]
-__vdprintf_chk = _libraries['/usr/lib/libmikmod.so'].__vdprintf_chk
-__vdprintf_chk.restype = c_int
-__vdprintf_chk.argtypes = [c_int, c_int, STRING, POINTER(__va_list_tag)]
-dprintf = _libraries['/usr/lib/libmikmod.so'].dprintf
-dprintf.restype = c_int
-dprintf.argtypes = [c_int, STRING]
-vdprintf = _libraries['/usr/lib/libmikmod.so'].vdprintf
-vdprintf.restype = c_int
-vdprintf.argtypes = [c_int, STRING, POINTER(__va_list_tag)]
-__asprintf_chk = _libraries['/usr/lib/libmikmod.so'].__asprintf_chk
-__asprintf_chk.restype = c_int
-__asprintf_chk.argtypes = [POINTER(STRING), c_int, STRING]
-__vasprintf_chk = _libraries['/usr/lib/libmikmod.so'].__vasprintf_chk
-__vasprintf_chk.restype = c_int
-__vasprintf_chk.argtypes = [POINTER(STRING), c_int, STRING, POINTER(__va_list_tag)]
-class obstack(Structure):
-    pass
-__obstack_printf_chk = _libraries['/usr/lib/libmikmod.so'].__obstack_printf_chk
-__obstack_printf_chk.restype = c_int
-__obstack_printf_chk.argtypes = [POINTER(obstack), c_int, STRING]
-__obstack_vprintf_chk = _libraries['/usr/lib/libmikmod.so'].__obstack_vprintf_chk
-__obstack_vprintf_chk.restype = c_int
-__obstack_vprintf_chk.argtypes = [POINTER(obstack), c_int, STRING, POINTER(__va_list_tag)]
-asprintf = _libraries['/usr/lib/libmikmod.so'].asprintf
-asprintf.restype = c_int
-asprintf.argtypes = [POINTER(STRING), STRING]
-__asprintf = _libraries['/usr/lib/libmikmod.so'].__asprintf
-__asprintf.restype = c_int
-__asprintf.argtypes = [POINTER(STRING), STRING]
-obstack_printf = _libraries['/usr/lib/libmikmod.so'].obstack_printf
-obstack_printf.restype = c_int
-obstack_printf.argtypes = [POINTER(obstack), STRING]
-vasprintf = _libraries['/usr/lib/libmikmod.so'].vasprintf
-vasprintf.restype = c_int
-vasprintf.argtypes = [POINTER(STRING), STRING, POINTER(__va_list_tag)]
-obstack_vprintf = _libraries['/usr/lib/libmikmod.so'].obstack_vprintf
-obstack_vprintf.restype = c_int
-obstack_vprintf.argtypes = [POINTER(obstack), STRING, POINTER(__va_list_tag)]
-__fgets_chk = _libraries['/usr/lib/libmikmod.so'].__fgets_chk
-__fgets_chk.restype = STRING
-__fgets_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]
-fgets = _libraries['/usr/lib/libmikmod.so'].fgets
-fgets.restype = STRING
-fgets.argtypes = [STRING, c_int, POINTER(FILE)]
-__fread_chk = _libraries['/usr/lib/libmikmod.so'].__fread_chk
-__fread_chk.restype = size_t
-__fread_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]
-fread = _libraries['/usr/lib/libmikmod.so'].fread
-fread.restype = size_t
-fread.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-__fgets_unlocked_chk = _libraries['/usr/lib/libmikmod.so'].__fgets_unlocked_chk
-__fgets_unlocked_chk.restype = STRING
-__fgets_unlocked_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]
-fgets_unlocked = _libraries['/usr/lib/libmikmod.so'].fgets_unlocked
-fgets_unlocked.restype = STRING
-fgets_unlocked.argtypes = [STRING, c_int, POINTER(FILE)]
-__fread_unlocked_chk = _libraries['/usr/lib/libmikmod.so'].__fread_unlocked_chk
-__fread_unlocked_chk.restype = size_t
-__fread_unlocked_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]
-fread_unlocked = _libraries['/usr/lib/libmikmod.so'].fread_unlocked
-fread_unlocked.restype = size_t
-fread_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
 __compar_fn_t = CFUNCTYPE(c_int, c_void_p, c_void_p)
-bsearch = _libraries['/usr/lib/libmikmod.so'].bsearch
-bsearch.restype = c_void_p
-bsearch.argtypes = [c_void_p, c_void_p, size_t, size_t, __compar_fn_t]
-atof = _libraries['/usr/lib/libmikmod.so'].atof
-atof.restype = c_double
-atof.argtypes = [STRING]
-__realpath_chk = _libraries['/usr/lib/libmikmod.so'].__realpath_chk
-__realpath_chk.restype = STRING
-__realpath_chk.argtypes = [STRING, STRING, size_t]
-realpath = _libraries['/usr/lib/libmikmod.so'].realpath
-realpath.restype = STRING
-realpath.argtypes = [STRING, STRING]
-__ptsname_r_chk = _libraries['/usr/lib/libmikmod.so'].__ptsname_r_chk
-__ptsname_r_chk.restype = c_int
-__ptsname_r_chk.argtypes = [c_int, STRING, size_t, size_t]
-ptsname_r = _libraries['/usr/lib/libmikmod.so'].ptsname_r
-ptsname_r.restype = c_int
-ptsname_r.argtypes = [c_int, STRING, size_t]
-__wctomb_chk = _libraries['/usr/lib/libmikmod.so'].__wctomb_chk
-__wctomb_chk.restype = c_int
-__wctomb_chk.argtypes = [STRING, c_wchar, size_t]
-wctomb = _libraries['/usr/lib/libmikmod.so'].wctomb
-wctomb.restype = c_int
-wctomb.argtypes = [STRING, c_wchar]
-__mbstowcs_chk = _libraries['/usr/lib/libmikmod.so'].__mbstowcs_chk
-__mbstowcs_chk.restype = size_t
-__mbstowcs_chk.argtypes = [WSTRING, STRING, size_t, size_t]
-mbstowcs = _libraries['/usr/lib/libmikmod.so'].mbstowcs
-mbstowcs.restype = size_t
-mbstowcs.argtypes = [WSTRING, STRING, size_t]
-__wcstombs_chk = _libraries['/usr/lib/libmikmod.so'].__wcstombs_chk
-__wcstombs_chk.restype = size_t
-__wcstombs_chk.argtypes = [STRING, WSTRING, size_t, size_t]
-wcstombs = _libraries['/usr/lib/libmikmod.so'].wcstombs
-wcstombs.restype = size_t
-wcstombs.argtypes = [STRING, WSTRING, size_t]
-sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libmikmod.so'], 'sys_nerr')
-sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libmikmod.so'], 'sys_errlist')
-_sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libmikmod.so'], '_sys_nerr')
-_sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libmikmod.so'], '_sys_errlist')
-class timeval(Structure):
-    pass
 __time_t = c_long
 __suseconds_t = c_long
-timeval._fields_ = [
-    ('tv_sec', __time_t),
-    ('tv_usec', __suseconds_t),
-]
 __u_char = c_ubyte
 __u_short = c_ushort
 __u_int = c_uint
@@ -869,11 +517,6 @@ __ino_t = c_ulong
 __ino64_t = c_ulong
 __mode_t = c_uint
 __nlink_t = c_ulong
-class __fsid_t(Structure):
-    pass
-__fsid_t._fields_ = [
-    ('__val', c_int * 2),
-]
 __clock_t = c_long
 __rlim_t = c_ulong
 __rlim64_t = c_ulong
@@ -898,81 +541,10 @@ __qaddr_t = POINTER(__quad_t)
 __caddr_t = STRING
 __intptr_t = c_long
 __socklen_t = c_uint
-class wait(Union):
-    pass
-class N4wait3DOT_6E(Structure):
-    pass
-N4wait3DOT_6E._fields_ = [
-    ('__w_termsig', c_uint, 7),
-    ('__w_coredump', c_uint, 1),
-    ('__w_retcode', c_uint, 8),
-    ('', c_uint, 16),
-]
-class N4wait3DOT_7E(Structure):
-    pass
-N4wait3DOT_7E._fields_ = [
-    ('__w_stopval', c_uint, 8),
-    ('__w_stopsig', c_uint, 8),
-    ('', c_uint, 16),
-]
-wait._fields_ = [
-    ('w_status', c_int),
-    ('__wait_terminated', N4wait3DOT_6E),
-    ('__wait_stopped', N4wait3DOT_7E),
-]
-class _IO_jump_t(Structure):
-    pass
-_IO_jump_t._fields_ = [
-]
 _IO_lock_t = None
-class _IO_marker(Structure):
-    pass
-_IO_marker._fields_ = [
-    ('_next', POINTER(_IO_marker)),
-    ('_sbuf', POINTER(_IO_FILE)),
-    ('_pos', c_int),
-]
 
 # values for enumeration '__codecvt_result'
 __codecvt_result = c_int # enum
-_IO_FILE._fields_ = [
-    ('_flags', c_int),
-    ('_IO_read_ptr', STRING),
-    ('_IO_read_end', STRING),
-    ('_IO_read_base', STRING),
-    ('_IO_write_base', STRING),
-    ('_IO_write_ptr', STRING),
-    ('_IO_write_end', STRING),
-    ('_IO_buf_base', STRING),
-    ('_IO_buf_end', STRING),
-    ('_IO_save_base', STRING),
-    ('_IO_backup_base', STRING),
-    ('_IO_save_end', STRING),
-    ('_markers', POINTER(_IO_marker)),
-    ('_chain', POINTER(_IO_FILE)),
-    ('_fileno', c_int),
-    ('_flags2', c_int),
-    ('_old_offset', __off_t),
-    ('_cur_column', c_ushort),
-    ('_vtable_offset', c_byte),
-    ('_shortbuf', c_char * 1),
-    ('_lock', POINTER(_IO_lock_t)),
-    ('_offset', __off64_t),
-    ('__pad1', c_void_p),
-    ('__pad2', c_void_p),
-    ('__pad3', c_void_p),
-    ('__pad4', c_void_p),
-    ('__pad5', size_t),
-    ('_mode', c_int),
-    ('_unused2', c_char * 20),
-]
-class _IO_FILE_plus(Structure):
-    pass
-_IO_FILE_plus._fields_ = [
-]
-_IO_2_1_stdin_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmikmod.so'], '_IO_2_1_stdin_')
-_IO_2_1_stdout_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmikmod.so'], '_IO_2_1_stdout_')
-_IO_2_1_stderr_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmikmod.so'], '_IO_2_1_stderr_')
 __io_read_fn = CFUNCTYPE(__ssize_t, c_void_p, STRING, size_t)
 __io_write_fn = CFUNCTYPE(__ssize_t, c_void_p, STRING, size_t)
 __io_seek_fn = CFUNCTYPE(c_int, c_void_p, POINTER(__off64_t), c_int)
@@ -981,76 +553,6 @@ cookie_read_function_t = __io_read_fn
 cookie_write_function_t = __io_write_fn
 cookie_seek_function_t = __io_seek_fn
 cookie_close_function_t = __io_close_fn
-class _IO_cookie_io_functions_t(Structure):
-    pass
-_IO_cookie_io_functions_t._fields_ = [
-    ('read', POINTER(__io_read_fn)),
-    ('write', POINTER(__io_write_fn)),
-    ('seek', POINTER(__io_seek_fn)),
-    ('close', POINTER(__io_close_fn)),
-]
-cookie_io_functions_t = _IO_cookie_io_functions_t
-class _IO_cookie_file(Structure):
-    pass
-_IO_cookie_file._fields_ = [
-]
-__underflow = _libraries['/usr/lib/libmikmod.so'].__underflow
-__underflow.restype = c_int
-__underflow.argtypes = [POINTER(_IO_FILE)]
-__uflow = _libraries['/usr/lib/libmikmod.so'].__uflow
-__uflow.restype = c_int
-__uflow.argtypes = [POINTER(_IO_FILE)]
-__overflow = _libraries['/usr/lib/libmikmod.so'].__overflow
-__overflow.restype = c_int
-__overflow.argtypes = [POINTER(_IO_FILE), c_int]
-_IO_getc = _libraries['/usr/lib/libmikmod.so']._IO_getc
-_IO_getc.restype = c_int
-_IO_getc.argtypes = [POINTER(_IO_FILE)]
-_IO_putc = _libraries['/usr/lib/libmikmod.so']._IO_putc
-_IO_putc.restype = c_int
-_IO_putc.argtypes = [c_int, POINTER(_IO_FILE)]
-_IO_feof = _libraries['/usr/lib/libmikmod.so']._IO_feof
-_IO_feof.restype = c_int
-_IO_feof.argtypes = [POINTER(_IO_FILE)]
-_IO_ferror = _libraries['/usr/lib/libmikmod.so']._IO_ferror
-_IO_ferror.restype = c_int
-_IO_ferror.argtypes = [POINTER(_IO_FILE)]
-_IO_peekc_locked = _libraries['/usr/lib/libmikmod.so']._IO_peekc_locked
-_IO_peekc_locked.restype = c_int
-_IO_peekc_locked.argtypes = [POINTER(_IO_FILE)]
-_IO_flockfile = _libraries['/usr/lib/libmikmod.so']._IO_flockfile
-_IO_flockfile.restype = None
-_IO_flockfile.argtypes = [POINTER(_IO_FILE)]
-_IO_funlockfile = _libraries['/usr/lib/libmikmod.so']._IO_funlockfile
-_IO_funlockfile.restype = None
-_IO_funlockfile.argtypes = [POINTER(_IO_FILE)]
-_IO_ftrylockfile = _libraries['/usr/lib/libmikmod.so']._IO_ftrylockfile
-_IO_ftrylockfile.restype = c_int
-_IO_ftrylockfile.argtypes = [POINTER(_IO_FILE)]
-_IO_vfscanf = _libraries['/usr/lib/libmikmod.so']._IO_vfscanf
-_IO_vfscanf.restype = c_int
-_IO_vfscanf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag), POINTER(c_int)]
-_IO_vfprintf = _libraries['/usr/lib/libmikmod.so']._IO_vfprintf
-_IO_vfprintf.restype = c_int
-_IO_vfprintf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag)]
-_IO_padn = _libraries['/usr/lib/libmikmod.so']._IO_padn
-_IO_padn.restype = __ssize_t
-_IO_padn.argtypes = [POINTER(_IO_FILE), c_int, __ssize_t]
-_IO_sgetn = _libraries['/usr/lib/libmikmod.so']._IO_sgetn
-_IO_sgetn.restype = size_t
-_IO_sgetn.argtypes = [POINTER(_IO_FILE), c_void_p, size_t]
-_IO_seekoff = _libraries['/usr/lib/libmikmod.so']._IO_seekoff
-_IO_seekoff.restype = __off64_t
-_IO_seekoff.argtypes = [POINTER(_IO_FILE), __off64_t, c_int, c_int]
-_IO_seekpos = _libraries['/usr/lib/libmikmod.so']._IO_seekpos
-_IO_seekpos.restype = __off64_t
-_IO_seekpos.argtypes = [POINTER(_IO_FILE), __off64_t, c_int]
-_IO_free_backup_area = _libraries['/usr/lib/libmikmod.so']._IO_free_backup_area
-_IO_free_backup_area.restype = None
-_IO_free_backup_area.argtypes = [POINTER(_IO_FILE)]
-MikMod_GetVersion = _libraries['/usr/lib/libmikmod.so'].MikMod_GetVersion
-MikMod_GetVersion.restype = c_long
-MikMod_GetVersion.argtypes = []
 CHAR = c_char
 SBYTE = c_byte
 UBYTE = c_ubyte
@@ -1063,1213 +565,26 @@ BOOL = c_int
 # values for unnamed enumeration
 MikMod_handler = CFUNCTYPE(None)
 MikMod_handler_t = POINTER(MikMod_handler)
-MikMod_errno = (c_int).in_dll(_libraries['/usr/lib/libmikmod.so'], 'MikMod_errno')
-MikMod_critical = (BOOL).in_dll(_libraries['/usr/lib/libmikmod.so'], 'MikMod_critical')
-MikMod_strerror = _libraries['/usr/lib/libmikmod.so'].MikMod_strerror
-MikMod_strerror.restype = STRING
-MikMod_strerror.argtypes = [c_int]
-MikMod_RegisterErrorHandler = _libraries['/usr/lib/libmikmod.so'].MikMod_RegisterErrorHandler
-MikMod_RegisterErrorHandler.restype = MikMod_handler_t
-MikMod_RegisterErrorHandler.argtypes = [MikMod_handler_t]
-MikMod_RegisterAllDrivers = _libraries['/usr/lib/libmikmod.so'].MikMod_RegisterAllDrivers
-MikMod_RegisterAllDrivers.restype = None
-MikMod_RegisterAllDrivers.argtypes = []
-MikMod_InfoDriver = _libraries['/usr/lib/libmikmod.so'].MikMod_InfoDriver
-MikMod_InfoDriver.restype = STRING
-MikMod_InfoDriver.argtypes = []
-class MDRIVER(Structure):
-    pass
-MikMod_RegisterDriver = _libraries['/usr/lib/libmikmod.so'].MikMod_RegisterDriver
-MikMod_RegisterDriver.restype = None
-MikMod_RegisterDriver.argtypes = [POINTER(MDRIVER)]
-MikMod_DriverFromAlias = _libraries['/usr/lib/libmikmod.so'].MikMod_DriverFromAlias
-MikMod_DriverFromAlias.restype = c_int
-MikMod_DriverFromAlias.argtypes = [STRING]
-MikMod_DriverByOrdinal = _libraries['/usr/lib/libmikmod.so'].MikMod_DriverByOrdinal
-MikMod_DriverByOrdinal.restype = POINTER(MDRIVER)
-MikMod_DriverByOrdinal.argtypes = [c_int]
-MikMod_Init = _libraries['/usr/lib/libmikmod.so'].MikMod_Init
-MikMod_Init.restype = c_int
-MikMod_Init.argtypes = [STRING]
-MikMod_Exit = _libraries['/usr/lib/libmikmod.so'].MikMod_Exit
-MikMod_Exit.restype = None
-MikMod_Exit.argtypes = []
-MikMod_Reset = _libraries['/usr/lib/libmikmod.so'].MikMod_Reset
-MikMod_Reset.restype = c_int
-MikMod_Reset.argtypes = [STRING]
-MikMod_SetNumVoices = _libraries['/usr/lib/libmikmod.so'].MikMod_SetNumVoices
-MikMod_SetNumVoices.restype = c_int
-MikMod_SetNumVoices.argtypes = [c_int, c_int]
-MikMod_Active = _libraries['/usr/lib/libmikmod.so'].MikMod_Active
-MikMod_Active.restype = BOOL
-MikMod_Active.argtypes = []
-MikMod_EnableOutput = _libraries['/usr/lib/libmikmod.so'].MikMod_EnableOutput
-MikMod_EnableOutput.restype = c_int
-MikMod_EnableOutput.argtypes = []
-MikMod_DisableOutput = _libraries['/usr/lib/libmikmod.so'].MikMod_DisableOutput
-MikMod_DisableOutput.restype = None
-MikMod_DisableOutput.argtypes = []
-MikMod_Update = _libraries['/usr/lib/libmikmod.so'].MikMod_Update
-MikMod_Update.restype = None
-MikMod_Update.argtypes = []
-MikMod_InitThreads = _libraries['/usr/lib/libmikmod.so'].MikMod_InitThreads
-MikMod_InitThreads.restype = BOOL
-MikMod_InitThreads.argtypes = []
-MikMod_Lock = _libraries['/usr/lib/libmikmod.so'].MikMod_Lock
-MikMod_Lock.restype = None
-MikMod_Lock.argtypes = []
-MikMod_Unlock = _libraries['/usr/lib/libmikmod.so'].MikMod_Unlock
-MikMod_Unlock.restype = None
-MikMod_Unlock.argtypes = []
-MikMod_malloc = _libraries['/usr/lib/libmikmod.so'].MikMod_malloc
-MikMod_malloc.restype = c_void_p
-MikMod_malloc.argtypes = [size_t]
-MikMod_calloc = _libraries['/usr/lib/libmikmod.so'].MikMod_calloc
-MikMod_calloc.restype = c_void_p
-MikMod_calloc.argtypes = [size_t, size_t]
-MikMod_realloc = _libraries['/usr/lib/libmikmod.so'].MikMod_realloc
-MikMod_realloc.restype = c_void_p
-MikMod_realloc.argtypes = [c_void_p, size_t]
-MikMod_strdup = _libraries['/usr/lib/libmikmod.so'].MikMod_strdup
-MikMod_strdup.restype = STRING
-MikMod_strdup.argtypes = [STRING]
-MikMod_free = _libraries['/usr/lib/libmikmod.so'].MikMod_free
-MikMod_free.restype = None
-MikMod_free.argtypes = [c_void_p]
-class MREADER(Structure):
-    pass
-MREADER._fields_ = [
-    ('Seek', CFUNCTYPE(c_int, POINTER(MREADER), c_long, c_int)),
-    ('Tell', CFUNCTYPE(c_long, POINTER(MREADER))),
-    ('Read', CFUNCTYPE(BOOL, POINTER(MREADER), c_void_p, size_t)),
-    ('Get', CFUNCTYPE(c_int, POINTER(MREADER))),
-    ('Eof', CFUNCTYPE(BOOL, POINTER(MREADER))),
-    ('iobase', c_long),
-    ('prev_iobase', c_long),
-]
-class MWRITER(Structure):
-    pass
-MWRITER._fields_ = [
-    ('Seek', CFUNCTYPE(c_int, POINTER(MWRITER), c_long, c_int)),
-    ('Tell', CFUNCTYPE(c_long, POINTER(MWRITER))),
-    ('Write', CFUNCTYPE(BOOL, POINTER(MWRITER), c_void_p, size_t)),
-    ('Put', CFUNCTYPE(c_int, POINTER(MWRITER), c_int)),
-]
-class SAMPLE(Structure):
-    pass
-SAMPLE._fields_ = [
-    ('panning', SWORD),
-    ('speed', ULONG),
-    ('volume', UBYTE),
-    ('inflags', UWORD),
-    ('flags', UWORD),
-    ('length', ULONG),
-    ('loopstart', ULONG),
-    ('loopend', ULONG),
-    ('susbegin', ULONG),
-    ('susend', ULONG),
-    ('globvol', UBYTE),
-    ('vibflags', UBYTE),
-    ('vibtype', UBYTE),
-    ('vibsweep', UBYTE),
-    ('vibdepth', UBYTE),
-    ('vibrate', UBYTE),
-    ('samplename', STRING),
-    ('avibpos', UWORD),
-    ('divfactor', UBYTE),
-    ('seekpos', ULONG),
-    ('handle', SWORD),
-    ('onfree', CFUNCTYPE(None, c_void_p)),
-    ('ctx', c_void_p),
-]
-Sample_LoadRaw = _libraries['/usr/lib/libmikmod.so'].Sample_LoadRaw
-Sample_LoadRaw.restype = POINTER(SAMPLE)
-Sample_LoadRaw.argtypes = [STRING, ULONG, ULONG, ULONG]
-Sample_LoadRawFP = _libraries['/usr/lib/libmikmod.so'].Sample_LoadRawFP
-Sample_LoadRawFP.restype = POINTER(SAMPLE)
-Sample_LoadRawFP.argtypes = [POINTER(FILE), ULONG, ULONG, ULONG]
-Sample_LoadRawMem = _libraries['/usr/lib/libmikmod.so'].Sample_LoadRawMem
-Sample_LoadRawMem.restype = POINTER(SAMPLE)
-Sample_LoadRawMem.argtypes = [STRING, c_int, ULONG, ULONG, ULONG]
-Sample_LoadRawGeneric = _libraries['/usr/lib/libmikmod.so'].Sample_LoadRawGeneric
-Sample_LoadRawGeneric.restype = POINTER(SAMPLE)
-Sample_LoadRawGeneric.argtypes = [POINTER(MREADER), ULONG, ULONG, ULONG]
-Sample_Load = _libraries['/usr/lib/libmikmod.so'].Sample_Load
-Sample_Load.restype = POINTER(SAMPLE)
-Sample_Load.argtypes = [STRING]
-Sample_LoadFP = _libraries['/usr/lib/libmikmod.so'].Sample_LoadFP
-Sample_LoadFP.restype = POINTER(SAMPLE)
-Sample_LoadFP.argtypes = [POINTER(FILE)]
-Sample_LoadMem = _libraries['/usr/lib/libmikmod.so'].Sample_LoadMem
-Sample_LoadMem.restype = POINTER(SAMPLE)
-Sample_LoadMem.argtypes = [STRING, c_int]
-Sample_LoadGeneric = _libraries['/usr/lib/libmikmod.so'].Sample_LoadGeneric
-Sample_LoadGeneric.restype = POINTER(SAMPLE)
-Sample_LoadGeneric.argtypes = [POINTER(MREADER)]
-Sample_Free = _libraries['/usr/lib/libmikmod.so'].Sample_Free
-Sample_Free.restype = None
-Sample_Free.argtypes = [POINTER(SAMPLE)]
-Sample_Play = _libraries['/usr/lib/libmikmod.so'].Sample_Play
-Sample_Play.restype = SBYTE
-Sample_Play.argtypes = [POINTER(SAMPLE), ULONG, UBYTE]
-Voice_SetVolume = _libraries['/usr/lib/libmikmod.so'].Voice_SetVolume
-Voice_SetVolume.restype = None
-Voice_SetVolume.argtypes = [SBYTE, UWORD]
-Voice_GetVolume = _libraries['/usr/lib/libmikmod.so'].Voice_GetVolume
-Voice_GetVolume.restype = UWORD
-Voice_GetVolume.argtypes = [SBYTE]
-Voice_SetFrequency = _libraries['/usr/lib/libmikmod.so'].Voice_SetFrequency
-Voice_SetFrequency.restype = None
-Voice_SetFrequency.argtypes = [SBYTE, ULONG]
-Voice_GetFrequency = _libraries['/usr/lib/libmikmod.so'].Voice_GetFrequency
-Voice_GetFrequency.restype = ULONG
-Voice_GetFrequency.argtypes = [SBYTE]
-Voice_SetPanning = _libraries['/usr/lib/libmikmod.so'].Voice_SetPanning
-Voice_SetPanning.restype = None
-Voice_SetPanning.argtypes = [SBYTE, ULONG]
-Voice_GetPanning = _libraries['/usr/lib/libmikmod.so'].Voice_GetPanning
-Voice_GetPanning.restype = ULONG
-Voice_GetPanning.argtypes = [SBYTE]
-Voice_Play = _libraries['/usr/lib/libmikmod.so'].Voice_Play
-Voice_Play.restype = None
-Voice_Play.argtypes = [SBYTE, POINTER(SAMPLE), ULONG]
-Voice_Stop = _libraries['/usr/lib/libmikmod.so'].Voice_Stop
-Voice_Stop.restype = None
-Voice_Stop.argtypes = [SBYTE]
-Voice_Stopped = _libraries['/usr/lib/libmikmod.so'].Voice_Stopped
-Voice_Stopped.restype = BOOL
-Voice_Stopped.argtypes = [SBYTE]
-Voice_GetPosition = _libraries['/usr/lib/libmikmod.so'].Voice_GetPosition
-Voice_GetPosition.restype = SLONG
-Voice_GetPosition.argtypes = [SBYTE]
-Voice_RealVolume = _libraries['/usr/lib/libmikmod.so'].Voice_RealVolume
-Voice_RealVolume.restype = ULONG
-Voice_RealVolume.argtypes = [SBYTE]
-class ENVPT(Structure):
-    pass
-ENVPT._fields_ = [
-    ('pos', SWORD),
-    ('val', SWORD),
-]
-class INSTRUMENT(Structure):
-    pass
-INSTRUMENT._fields_ = [
-    ('insname', STRING),
-    ('flags', UBYTE),
-    ('samplenumber', UWORD * 120),
-    ('samplenote', UBYTE * 120),
-    ('nnatype', UBYTE),
-    ('dca', UBYTE),
-    ('dct', UBYTE),
-    ('globvol', UBYTE),
-    ('volfade', UWORD),
-    ('panning', SWORD),
-    ('pitpansep', UBYTE),
-    ('pitpancenter', UBYTE),
-    ('rvolvar', UBYTE),
-    ('rpanvar', UBYTE),
-    ('volflg', UBYTE),
-    ('volpts', UBYTE),
-    ('volsusbeg', UBYTE),
-    ('volsusend', UBYTE),
-    ('volbeg', UBYTE),
-    ('volend', UBYTE),
-    ('volenv', ENVPT * 32),
-    ('panflg', UBYTE),
-    ('panpts', UBYTE),
-    ('pansusbeg', UBYTE),
-    ('pansusend', UBYTE),
-    ('panbeg', UBYTE),
-    ('panend', UBYTE),
-    ('panenv', ENVPT * 32),
-    ('pitflg', UBYTE),
-    ('pitpts', UBYTE),
-    ('pitsusbeg', UBYTE),
-    ('pitsusend', UBYTE),
-    ('pitbeg', UBYTE),
-    ('pitend', UBYTE),
-    ('pitenv', ENVPT * 32),
-]
-class MP_CONTROL(Structure):
-    pass
-MP_CONTROL._fields_ = [
-]
-class MP_VOICE(Structure):
-    pass
-MP_VOICE._fields_ = [
-]
-class MODULE(Structure):
-    pass
-MODULE._fields_ = [
-    ('songname', STRING),
-    ('modtype', STRING),
-    ('comment', STRING),
-    ('flags', UWORD),
-    ('numchn', UBYTE),
-    ('numvoices', UBYTE),
-    ('numpos', UWORD),
-    ('numpat', UWORD),
-    ('numins', UWORD),
-    ('numsmp', UWORD),
-    ('instruments', POINTER(INSTRUMENT)),
-    ('samples', POINTER(SAMPLE)),
-    ('realchn', UBYTE),
-    ('totalchn', UBYTE),
-    ('reppos', UWORD),
-    ('initspeed', UBYTE),
-    ('inittempo', UWORD),
-    ('initvolume', UBYTE),
-    ('panning', UWORD * 64),
-    ('chanvol', UBYTE * 64),
-    ('bpm', UWORD),
-    ('sngspd', UWORD),
-    ('volume', SWORD),
-    ('extspd', BOOL),
-    ('panflag', BOOL),
-    ('wrap', BOOL),
-    ('loop', BOOL),
-    ('fadeout', BOOL),
-    ('patpos', UWORD),
-    ('sngpos', SWORD),
-    ('sngtime', ULONG),
-    ('relspd', SWORD),
-    ('numtrk', UWORD),
-    ('tracks', POINTER(POINTER(UBYTE))),
-    ('patterns', POINTER(UWORD)),
-    ('pattrows', POINTER(UWORD)),
-    ('positions', POINTER(UWORD)),
-    ('forbid', BOOL),
-    ('numrow', UWORD),
-    ('vbtick', UWORD),
-    ('sngremainder', UWORD),
-    ('control', POINTER(MP_CONTROL)),
-    ('voice', POINTER(MP_VOICE)),
-    ('globalslide', UBYTE),
-    ('pat_repcrazy', UBYTE),
-    ('patbrk', UWORD),
-    ('patdly', UBYTE),
-    ('patdly2', UBYTE),
-    ('posjmp', SWORD),
-    ('bpmlimit', UWORD),
-]
-class VOICEINFO(Structure):
-    pass
-VOICEINFO._fields_ = [
-    ('i', POINTER(INSTRUMENT)),
-    ('s', POINTER(SAMPLE)),
-    ('panning', SWORD),
-    ('volume', SBYTE),
-    ('period', UWORD),
-    ('kick', UBYTE),
-]
-class MLOADER(Structure):
-    pass
-MLOADER._fields_ = [
-]
-MikMod_InfoLoader = _libraries['/usr/lib/libmikmod.so'].MikMod_InfoLoader
-MikMod_InfoLoader.restype = STRING
-MikMod_InfoLoader.argtypes = []
-MikMod_RegisterAllLoaders = _libraries['/usr/lib/libmikmod.so'].MikMod_RegisterAllLoaders
-MikMod_RegisterAllLoaders.restype = None
-MikMod_RegisterAllLoaders.argtypes = []
-MikMod_RegisterLoader = _libraries['/usr/lib/libmikmod.so'].MikMod_RegisterLoader
-MikMod_RegisterLoader.restype = None
-MikMod_RegisterLoader.argtypes = [POINTER(MLOADER)]
-load_669 = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_669')
-load_amf = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_amf')
-load_asy = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_asy')
-load_dsm = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_dsm')
-load_far = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_far')
-load_gdm = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_gdm')
-load_gt2 = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_gt2')
-load_it = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_it')
-load_imf = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_imf')
-load_med = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_med')
-load_m15 = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_m15')
-load_mod = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_mod')
-load_mtm = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_mtm')
-load_okt = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_okt')
-load_stm = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_stm')
-load_stx = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_stx')
-load_s3m = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_s3m')
-load_ult = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_ult')
-load_umx = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_umx')
-load_uni = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_uni')
-load_xm = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_xm')
-Player_Load = _libraries['/usr/lib/libmikmod.so'].Player_Load
-Player_Load.restype = POINTER(MODULE)
-Player_Load.argtypes = [STRING, c_int, BOOL]
-Player_LoadFP = _libraries['/usr/lib/libmikmod.so'].Player_LoadFP
-Player_LoadFP.restype = POINTER(MODULE)
-Player_LoadFP.argtypes = [POINTER(FILE), c_int, BOOL]
-Player_LoadMem = _libraries['/usr/lib/libmikmod.so'].Player_LoadMem
-Player_LoadMem.restype = POINTER(MODULE)
-Player_LoadMem.argtypes = [STRING, c_int, c_int, BOOL]
-Player_LoadGeneric = _libraries['/usr/lib/libmikmod.so'].Player_LoadGeneric
-Player_LoadGeneric.restype = POINTER(MODULE)
-Player_LoadGeneric.argtypes = [POINTER(MREADER), c_int, BOOL]
-Player_LoadTitle = _libraries['/usr/lib/libmikmod.so'].Player_LoadTitle
-Player_LoadTitle.restype = STRING
-Player_LoadTitle.argtypes = [STRING]
-Player_LoadTitleFP = _libraries['/usr/lib/libmikmod.so'].Player_LoadTitleFP
-Player_LoadTitleFP.restype = STRING
-Player_LoadTitleFP.argtypes = [POINTER(FILE)]
-Player_LoadTitleMem = _libraries['/usr/lib/libmikmod.so'].Player_LoadTitleMem
-Player_LoadTitleMem.restype = STRING
-Player_LoadTitleMem.argtypes = [STRING, c_int]
-Player_LoadTitleGeneric = _libraries['/usr/lib/libmikmod.so'].Player_LoadTitleGeneric
-Player_LoadTitleGeneric.restype = STRING
-Player_LoadTitleGeneric.argtypes = [POINTER(MREADER)]
-Player_Free = _libraries['/usr/lib/libmikmod.so'].Player_Free
-Player_Free.restype = None
-Player_Free.argtypes = [POINTER(MODULE)]
-Player_Start = _libraries['/usr/lib/libmikmod.so'].Player_Start
-Player_Start.restype = None
-Player_Start.argtypes = [POINTER(MODULE)]
-Player_Active = _libraries['/usr/lib/libmikmod.so'].Player_Active
-Player_Active.restype = BOOL
-Player_Active.argtypes = []
-Player_Stop = _libraries['/usr/lib/libmikmod.so'].Player_Stop
-Player_Stop.restype = None
-Player_Stop.argtypes = []
-Player_TogglePause = _libraries['/usr/lib/libmikmod.so'].Player_TogglePause
-Player_TogglePause.restype = None
-Player_TogglePause.argtypes = []
-Player_Paused = _libraries['/usr/lib/libmikmod.so'].Player_Paused
-Player_Paused.restype = BOOL
-Player_Paused.argtypes = []
-Player_NextPosition = _libraries['/usr/lib/libmikmod.so'].Player_NextPosition
-Player_NextPosition.restype = None
-Player_NextPosition.argtypes = []
-Player_PrevPosition = _libraries['/usr/lib/libmikmod.so'].Player_PrevPosition
-Player_PrevPosition.restype = None
-Player_PrevPosition.argtypes = []
-Player_SetPosition = _libraries['/usr/lib/libmikmod.so'].Player_SetPosition
-Player_SetPosition.restype = None
-Player_SetPosition.argtypes = [UWORD]
-Player_Muted = _libraries['/usr/lib/libmikmod.so'].Player_Muted
-Player_Muted.restype = BOOL
-Player_Muted.argtypes = [UBYTE]
-Player_SetVolume = _libraries['/usr/lib/libmikmod.so'].Player_SetVolume
-Player_SetVolume.restype = None
-Player_SetVolume.argtypes = [SWORD]
-Player_GetModule = _libraries['/usr/lib/libmikmod.so'].Player_GetModule
-Player_GetModule.restype = POINTER(MODULE)
-Player_GetModule.argtypes = []
-Player_SetSpeed = _libraries['/usr/lib/libmikmod.so'].Player_SetSpeed
-Player_SetSpeed.restype = None
-Player_SetSpeed.argtypes = [UWORD]
-Player_SetTempo = _libraries['/usr/lib/libmikmod.so'].Player_SetTempo
-Player_SetTempo.restype = None
-Player_SetTempo.argtypes = [UWORD]
-Player_Unmute = _libraries['/usr/lib/libmikmod.so'].Player_Unmute
-Player_Unmute.restype = None
-Player_Unmute.argtypes = [SLONG]
-Player_Mute = _libraries['/usr/lib/libmikmod.so'].Player_Mute
-Player_Mute.restype = None
-Player_Mute.argtypes = [SLONG]
-Player_ToggleMute = _libraries['/usr/lib/libmikmod.so'].Player_ToggleMute
-Player_ToggleMute.restype = None
-Player_ToggleMute.argtypes = [SLONG]
-Player_GetChannelVoice = _libraries['/usr/lib/libmikmod.so'].Player_GetChannelVoice
-Player_GetChannelVoice.restype = c_int
-Player_GetChannelVoice.argtypes = [UBYTE]
-Player_GetChannelPeriod = _libraries['/usr/lib/libmikmod.so'].Player_GetChannelPeriod
-Player_GetChannelPeriod.restype = UWORD
-Player_GetChannelPeriod.argtypes = [UBYTE]
-Player_QueryVoices = _libraries['/usr/lib/libmikmod.so'].Player_QueryVoices
-Player_QueryVoices.restype = c_int
-Player_QueryVoices.argtypes = [UWORD, POINTER(VOICEINFO)]
-Player_GetRow = _libraries['/usr/lib/libmikmod.so'].Player_GetRow
-Player_GetRow.restype = c_int
-Player_GetRow.argtypes = []
-Player_GetOrder = _libraries['/usr/lib/libmikmod.so'].Player_GetOrder
-Player_GetOrder.restype = c_int
-Player_GetOrder.argtypes = []
 MikMod_player_t = CFUNCTYPE(None)
 MikMod_callback_t = CFUNCTYPE(None, POINTER(c_ubyte), size_t)
-MikMod_RegisterPlayer = _libraries['/usr/lib/libmikmod.so'].MikMod_RegisterPlayer
-MikMod_RegisterPlayer.restype = MikMod_player_t
-MikMod_RegisterPlayer.argtypes = [MikMod_player_t]
 
 # values for unnamed enumeration
 
 # values for unnamed enumeration
-class SAMPLOAD(Structure):
-    pass
-SAMPLOAD._fields_ = [
-]
-MDRIVER._fields_ = [
-    ('next', POINTER(MDRIVER)),
-    ('Name', STRING),
-    ('Version', STRING),
-    ('HardVoiceLimit', UBYTE),
-    ('SoftVoiceLimit', UBYTE),
-    ('Alias', STRING),
-    ('CmdLineHelp', STRING),
-    ('CommandLine', CFUNCTYPE(None, STRING)),
-    ('IsPresent', CFUNCTYPE(BOOL)),
-    ('SampleLoad', CFUNCTYPE(SWORD, POINTER(SAMPLOAD), c_int)),
-    ('SampleUnload', CFUNCTYPE(None, SWORD)),
-    ('FreeSampleSpace', CFUNCTYPE(ULONG, c_int)),
-    ('RealSampleLength', CFUNCTYPE(ULONG, c_int, POINTER(SAMPLE))),
-    ('Init', CFUNCTYPE(c_int)),
-    ('Exit', CFUNCTYPE(None)),
-    ('Reset', CFUNCTYPE(c_int)),
-    ('SetNumVoices', CFUNCTYPE(c_int)),
-    ('PlayStart', CFUNCTYPE(c_int)),
-    ('PlayStop', CFUNCTYPE(None)),
-    ('Update', CFUNCTYPE(None)),
-    ('Pause', CFUNCTYPE(None)),
-    ('VoiceSetVolume', CFUNCTYPE(None, UBYTE, UWORD)),
-    ('VoiceGetVolume', CFUNCTYPE(UWORD, UBYTE)),
-    ('VoiceSetFrequency', CFUNCTYPE(None, UBYTE, ULONG)),
-    ('VoiceGetFrequency', CFUNCTYPE(ULONG, UBYTE)),
-    ('VoiceSetPanning', CFUNCTYPE(None, UBYTE, ULONG)),
-    ('VoiceGetPanning', CFUNCTYPE(ULONG, UBYTE)),
-    ('VoicePlay', CFUNCTYPE(None, UBYTE, SWORD, ULONG, ULONG, ULONG, ULONG, UWORD)),
-    ('VoiceStop', CFUNCTYPE(None, UBYTE)),
-    ('VoiceStopped', CFUNCTYPE(BOOL, UBYTE)),
-    ('VoiceGetPosition', CFUNCTYPE(SLONG, UBYTE)),
-    ('VoiceRealVolume', CFUNCTYPE(ULONG, UBYTE)),
-]
-md_volume = (UBYTE).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_volume')
-md_musicvolume = (UBYTE).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_musicvolume')
-md_sndfxvolume = (UBYTE).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_sndfxvolume')
-md_reverb = (UBYTE).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_reverb')
-md_pansep = (UBYTE).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_pansep')
-md_device = (UWORD).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_device')
-md_mixfreq = (UWORD).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_mixfreq')
-md_mode = (UWORD).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_mode')
-md_driver = (POINTER(MDRIVER)).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_driver')
-drv_nos = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_nos')
-drv_pipe = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_pipe')
-drv_raw = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_raw')
-drv_stdout = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_stdout')
-drv_wav = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_wav')
-drv_aiff = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_aiff')
-drv_ultra = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_ultra')
-drv_sam9407 = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_sam9407')
-drv_AF = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_AF')
-drv_aix = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_aix')
-drv_alsa = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_alsa')
-drv_esd = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_esd')
-drv_pulseaudio = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_pulseaudio')
-drv_hp = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_hp')
-drv_nas = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_nas')
-drv_oss = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_oss')
-drv_openal = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_openal')
-drv_sdl = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_sdl')
-drv_sgi = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_sgi')
-drv_sun = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_sun')
-drv_dart = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_dart')
-drv_os2 = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_os2')
-drv_ds = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_ds')
-drv_xaudio2 = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_xaudio2')
-drv_win = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_win')
-drv_mac = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_mac')
-drv_osx = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_osx')
-drv_gp32 = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_gp32')
-drv_wss = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_wss')
-drv_sb = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_sb')
-VC_Init = _libraries['/usr/lib/libmikmod.so'].VC_Init
-VC_Init.restype = c_int
-VC_Init.argtypes = []
-VC_Exit = _libraries['/usr/lib/libmikmod.so'].VC_Exit
-VC_Exit.restype = None
-VC_Exit.argtypes = []
-VC_SetCallback = _libraries['/usr/lib/libmikmod.so'].VC_SetCallback
-VC_SetCallback.restype = None
-VC_SetCallback.argtypes = [MikMod_callback_t]
-VC_SetNumVoices = _libraries['/usr/lib/libmikmod.so'].VC_SetNumVoices
-VC_SetNumVoices.restype = c_int
-VC_SetNumVoices.argtypes = []
-VC_SampleSpace = _libraries['/usr/lib/libmikmod.so'].VC_SampleSpace
-VC_SampleSpace.restype = ULONG
-VC_SampleSpace.argtypes = [c_int]
-VC_SampleLength = _libraries['/usr/lib/libmikmod.so'].VC_SampleLength
-VC_SampleLength.restype = ULONG
-VC_SampleLength.argtypes = [c_int, POINTER(SAMPLE)]
-VC_PlayStart = _libraries['/usr/lib/libmikmod.so'].VC_PlayStart
-VC_PlayStart.restype = c_int
-VC_PlayStart.argtypes = []
-VC_PlayStop = _libraries['/usr/lib/libmikmod.so'].VC_PlayStop
-VC_PlayStop.restype = None
-VC_PlayStop.argtypes = []
-VC_SampleLoad = _libraries['/usr/lib/libmikmod.so'].VC_SampleLoad
-VC_SampleLoad.restype = SWORD
-VC_SampleLoad.argtypes = [POINTER(SAMPLOAD), c_int]
-VC_SampleUnload = _libraries['/usr/lib/libmikmod.so'].VC_SampleUnload
-VC_SampleUnload.restype = None
-VC_SampleUnload.argtypes = [SWORD]
-VC_WriteBytes = _libraries['/usr/lib/libmikmod.so'].VC_WriteBytes
-VC_WriteBytes.restype = ULONG
-VC_WriteBytes.argtypes = [POINTER(SBYTE), ULONG]
-VC_SilenceBytes = _libraries['/usr/lib/libmikmod.so'].VC_SilenceBytes
-VC_SilenceBytes.restype = ULONG
-VC_SilenceBytes.argtypes = [POINTER(SBYTE), ULONG]
-VC_VoiceSetVolume = _libraries['/usr/lib/libmikmod.so'].VC_VoiceSetVolume
-VC_VoiceSetVolume.restype = None
-VC_VoiceSetVolume.argtypes = [UBYTE, UWORD]
-VC_VoiceGetVolume = _libraries['/usr/lib/libmikmod.so'].VC_VoiceGetVolume
-VC_VoiceGetVolume.restype = UWORD
-VC_VoiceGetVolume.argtypes = [UBYTE]
-VC_VoiceSetFrequency = _libraries['/usr/lib/libmikmod.so'].VC_VoiceSetFrequency
-VC_VoiceSetFrequency.restype = None
-VC_VoiceSetFrequency.argtypes = [UBYTE, ULONG]
-VC_VoiceGetFrequency = _libraries['/usr/lib/libmikmod.so'].VC_VoiceGetFrequency
-VC_VoiceGetFrequency.restype = ULONG
-VC_VoiceGetFrequency.argtypes = [UBYTE]
-VC_VoiceSetPanning = _libraries['/usr/lib/libmikmod.so'].VC_VoiceSetPanning
-VC_VoiceSetPanning.restype = None
-VC_VoiceSetPanning.argtypes = [UBYTE, ULONG]
-VC_VoiceGetPanning = _libraries['/usr/lib/libmikmod.so'].VC_VoiceGetPanning
-VC_VoiceGetPanning.restype = ULONG
-VC_VoiceGetPanning.argtypes = [UBYTE]
-VC_VoicePlay = _libraries['/usr/lib/libmikmod.so'].VC_VoicePlay
-VC_VoicePlay.restype = None
-VC_VoicePlay.argtypes = [UBYTE, SWORD, ULONG, ULONG, ULONG, ULONG, UWORD]
-VC_VoiceStop = _libraries['/usr/lib/libmikmod.so'].VC_VoiceStop
-VC_VoiceStop.restype = None
-VC_VoiceStop.argtypes = [UBYTE]
-VC_VoiceStopped = _libraries['/usr/lib/libmikmod.so'].VC_VoiceStopped
-VC_VoiceStopped.restype = BOOL
-VC_VoiceStopped.argtypes = [UBYTE]
-VC_VoiceGetPosition = _libraries['/usr/lib/libmikmod.so'].VC_VoiceGetPosition
-VC_VoiceGetPosition.restype = SLONG
-VC_VoiceGetPosition.argtypes = [UBYTE]
-VC_VoiceRealVolume = _libraries['/usr/lib/libmikmod.so'].VC_VoiceRealVolume
-VC_VoiceRealVolume.restype = ULONG
-VC_VoiceRealVolume.argtypes = [UBYTE]
-__FILE = _IO_FILE
-va_list = __gnuc_va_list
 off_t = __off_t
 off64_t = __off64_t
 ssize_t = __ssize_t
-fpos_t = _G_fpos_t
-fpos64_t = _G_fpos64_t
-remove = _libraries['/usr/lib/libmikmod.so'].remove
-remove.restype = c_int
-remove.argtypes = [STRING]
-rename = _libraries['/usr/lib/libmikmod.so'].rename
-rename.restype = c_int
-rename.argtypes = [STRING, STRING]
-renameat = _libraries['/usr/lib/libmikmod.so'].renameat
-renameat.restype = c_int
-renameat.argtypes = [c_int, STRING, c_int, STRING]
-tmpfile = _libraries['/usr/lib/libmikmod.so'].tmpfile
-tmpfile.restype = POINTER(FILE)
-tmpfile.argtypes = []
-tmpfile64 = _libraries['/usr/lib/libmikmod.so'].tmpfile64
-tmpfile64.restype = POINTER(FILE)
-tmpfile64.argtypes = []
-tmpnam = _libraries['/usr/lib/libmikmod.so'].tmpnam
-tmpnam.restype = STRING
-tmpnam.argtypes = [STRING]
-tmpnam_r = _libraries['/usr/lib/libmikmod.so'].tmpnam_r
-tmpnam_r.restype = STRING
-tmpnam_r.argtypes = [STRING]
-tempnam = _libraries['/usr/lib/libmikmod.so'].tempnam
-tempnam.restype = STRING
-tempnam.argtypes = [STRING, STRING]
-fclose = _libraries['/usr/lib/libmikmod.so'].fclose
-fclose.restype = c_int
-fclose.argtypes = [POINTER(FILE)]
-fflush = _libraries['/usr/lib/libmikmod.so'].fflush
-fflush.restype = c_int
-fflush.argtypes = [POINTER(FILE)]
-fflush_unlocked = _libraries['/usr/lib/libmikmod.so'].fflush_unlocked
-fflush_unlocked.restype = c_int
-fflush_unlocked.argtypes = [POINTER(FILE)]
-fcloseall = _libraries['/usr/lib/libmikmod.so'].fcloseall
-fcloseall.restype = c_int
-fcloseall.argtypes = []
-fopen = _libraries['/usr/lib/libmikmod.so'].fopen
-fopen.restype = POINTER(FILE)
-fopen.argtypes = [STRING, STRING]
-freopen = _libraries['/usr/lib/libmikmod.so'].freopen
-freopen.restype = POINTER(FILE)
-freopen.argtypes = [STRING, STRING, POINTER(FILE)]
-fopen64 = _libraries['/usr/lib/libmikmod.so'].fopen64
-fopen64.restype = POINTER(FILE)
-fopen64.argtypes = [STRING, STRING]
-freopen64 = _libraries['/usr/lib/libmikmod.so'].freopen64
-freopen64.restype = POINTER(FILE)
-freopen64.argtypes = [STRING, STRING, POINTER(FILE)]
-fdopen = _libraries['/usr/lib/libmikmod.so'].fdopen
-fdopen.restype = POINTER(FILE)
-fdopen.argtypes = [c_int, STRING]
-fopencookie = _libraries['/usr/lib/libmikmod.so'].fopencookie
-fopencookie.restype = POINTER(FILE)
-fopencookie.argtypes = [c_void_p, STRING, _IO_cookie_io_functions_t]
-fmemopen = _libraries['/usr/lib/libmikmod.so'].fmemopen
-fmemopen.restype = POINTER(FILE)
-fmemopen.argtypes = [c_void_p, size_t, STRING]
-open_memstream = _libraries['/usr/lib/libmikmod.so'].open_memstream
-open_memstream.restype = POINTER(FILE)
-open_memstream.argtypes = [POINTER(STRING), POINTER(size_t)]
-setbuf = _libraries['/usr/lib/libmikmod.so'].setbuf
-setbuf.restype = None
-setbuf.argtypes = [POINTER(FILE), STRING]
-setvbuf = _libraries['/usr/lib/libmikmod.so'].setvbuf
-setvbuf.restype = c_int
-setvbuf.argtypes = [POINTER(FILE), STRING, c_int, size_t]
-setbuffer = _libraries['/usr/lib/libmikmod.so'].setbuffer
-setbuffer.restype = None
-setbuffer.argtypes = [POINTER(FILE), STRING, size_t]
-setlinebuf = _libraries['/usr/lib/libmikmod.so'].setlinebuf
-setlinebuf.restype = None
-setlinebuf.argtypes = [POINTER(FILE)]
-fscanf = _libraries['/usr/lib/libmikmod.so'].fscanf
-fscanf.restype = c_int
-fscanf.argtypes = [POINTER(FILE), STRING]
-scanf = _libraries['/usr/lib/libmikmod.so'].scanf
-scanf.restype = c_int
-scanf.argtypes = [STRING]
-sscanf = _libraries['/usr/lib/libmikmod.so'].sscanf
-sscanf.restype = c_int
-sscanf.argtypes = [STRING, STRING]
-vfscanf = _libraries['/usr/lib/libmikmod.so'].vfscanf
-vfscanf.restype = c_int
-vfscanf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]
-vscanf = _libraries['/usr/lib/libmikmod.so'].vscanf
-vscanf.restype = c_int
-vscanf.argtypes = [STRING, POINTER(__va_list_tag)]
-vsscanf = _libraries['/usr/lib/libmikmod.so'].vsscanf
-vsscanf.restype = c_int
-vsscanf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]
-fgetc = _libraries['/usr/lib/libmikmod.so'].fgetc
-fgetc.restype = c_int
-fgetc.argtypes = [POINTER(FILE)]
-getc = _libraries['/usr/lib/libmikmod.so'].getc
-getc.restype = c_int
-getc.argtypes = [POINTER(FILE)]
-fputc = _libraries['/usr/lib/libmikmod.so'].fputc
-fputc.restype = c_int
-fputc.argtypes = [c_int, POINTER(FILE)]
-putc = _libraries['/usr/lib/libmikmod.so'].putc
-putc.restype = c_int
-putc.argtypes = [c_int, POINTER(FILE)]
-getw = _libraries['/usr/lib/libmikmod.so'].getw
-getw.restype = c_int
-getw.argtypes = [POINTER(FILE)]
-putw = _libraries['/usr/lib/libmikmod.so'].putw
-putw.restype = c_int
-putw.argtypes = [c_int, POINTER(FILE)]
-gets = _libraries['/usr/lib/libmikmod.so'].gets
-gets.restype = STRING
-gets.argtypes = [STRING]
-__getdelim = _libraries['/usr/lib/libmikmod.so'].__getdelim
-__getdelim.restype = __ssize_t
-__getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]
-getdelim = _libraries['/usr/lib/libmikmod.so'].getdelim
-getdelim.restype = __ssize_t
-getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]
-fputs = _libraries['/usr/lib/libmikmod.so'].fputs
-fputs.restype = c_int
-fputs.argtypes = [STRING, POINTER(FILE)]
-puts = _libraries['/usr/lib/libmikmod.so'].puts
-puts.restype = c_int
-puts.argtypes = [STRING]
-ungetc = _libraries['/usr/lib/libmikmod.so'].ungetc
-ungetc.restype = c_int
-ungetc.argtypes = [c_int, POINTER(FILE)]
-fwrite = _libraries['/usr/lib/libmikmod.so'].fwrite
-fwrite.restype = size_t
-fwrite.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-fputs_unlocked = _libraries['/usr/lib/libmikmod.so'].fputs_unlocked
-fputs_unlocked.restype = c_int
-fputs_unlocked.argtypes = [STRING, POINTER(FILE)]
-fwrite_unlocked = _libraries['/usr/lib/libmikmod.so'].fwrite_unlocked
-fwrite_unlocked.restype = size_t
-fwrite_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-fseek = _libraries['/usr/lib/libmikmod.so'].fseek
-fseek.restype = c_int
-fseek.argtypes = [POINTER(FILE), c_long, c_int]
-ftell = _libraries['/usr/lib/libmikmod.so'].ftell
-ftell.restype = c_long
-ftell.argtypes = [POINTER(FILE)]
-rewind = _libraries['/usr/lib/libmikmod.so'].rewind
-rewind.restype = None
-rewind.argtypes = [POINTER(FILE)]
-fseeko = _libraries['/usr/lib/libmikmod.so'].fseeko
-fseeko.restype = c_int
-fseeko.argtypes = [POINTER(FILE), __off_t, c_int]
-ftello = _libraries['/usr/lib/libmikmod.so'].ftello
-ftello.restype = __off_t
-ftello.argtypes = [POINTER(FILE)]
-fgetpos = _libraries['/usr/lib/libmikmod.so'].fgetpos
-fgetpos.restype = c_int
-fgetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]
-fsetpos = _libraries['/usr/lib/libmikmod.so'].fsetpos
-fsetpos.restype = c_int
-fsetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]
-fseeko64 = _libraries['/usr/lib/libmikmod.so'].fseeko64
-fseeko64.restype = c_int
-fseeko64.argtypes = [POINTER(FILE), __off64_t, c_int]
-ftello64 = _libraries['/usr/lib/libmikmod.so'].ftello64
-ftello64.restype = __off64_t
-ftello64.argtypes = [POINTER(FILE)]
-fgetpos64 = _libraries['/usr/lib/libmikmod.so'].fgetpos64
-fgetpos64.restype = c_int
-fgetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]
-fsetpos64 = _libraries['/usr/lib/libmikmod.so'].fsetpos64
-fsetpos64.restype = c_int
-fsetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]
-clearerr = _libraries['/usr/lib/libmikmod.so'].clearerr
-clearerr.restype = None
-clearerr.argtypes = [POINTER(FILE)]
-feof = _libraries['/usr/lib/libmikmod.so'].feof
-feof.restype = c_int
-feof.argtypes = [POINTER(FILE)]
-ferror = _libraries['/usr/lib/libmikmod.so'].ferror
-ferror.restype = c_int
-ferror.argtypes = [POINTER(FILE)]
-clearerr_unlocked = _libraries['/usr/lib/libmikmod.so'].clearerr_unlocked
-clearerr_unlocked.restype = None
-clearerr_unlocked.argtypes = [POINTER(FILE)]
-perror = _libraries['/usr/lib/libmikmod.so'].perror
-perror.restype = None
-perror.argtypes = [STRING]
-fileno = _libraries['/usr/lib/libmikmod.so'].fileno
-fileno.restype = c_int
-fileno.argtypes = [POINTER(FILE)]
-fileno_unlocked = _libraries['/usr/lib/libmikmod.so'].fileno_unlocked
-fileno_unlocked.restype = c_int
-fileno_unlocked.argtypes = [POINTER(FILE)]
-popen = _libraries['/usr/lib/libmikmod.so'].popen
-popen.restype = POINTER(FILE)
-popen.argtypes = [STRING, STRING]
-pclose = _libraries['/usr/lib/libmikmod.so'].pclose
-pclose.restype = c_int
-pclose.argtypes = [POINTER(FILE)]
-ctermid = _libraries['/usr/lib/libmikmod.so'].ctermid
-ctermid.restype = STRING
-ctermid.argtypes = [STRING]
-cuserid = _libraries['/usr/lib/libmikmod.so'].cuserid
-cuserid.restype = STRING
-cuserid.argtypes = [STRING]
-obstack._fields_ = [
-]
-flockfile = _libraries['/usr/lib/libmikmod.so'].flockfile
-flockfile.restype = None
-flockfile.argtypes = [POINTER(FILE)]
-ftrylockfile = _libraries['/usr/lib/libmikmod.so'].ftrylockfile
-ftrylockfile.restype = c_int
-ftrylockfile.argtypes = [POINTER(FILE)]
-funlockfile = _libraries['/usr/lib/libmikmod.so'].funlockfile
-funlockfile.restype = None
-funlockfile.argtypes = [POINTER(FILE)]
-class div_t(Structure):
-    pass
-div_t._fields_ = [
-    ('quot', c_int),
-    ('rem', c_int),
-]
-class ldiv_t(Structure):
-    pass
-ldiv_t._fields_ = [
-    ('quot', c_long),
-    ('rem', c_long),
-]
-class lldiv_t(Structure):
-    pass
-lldiv_t._fields_ = [
-    ('quot', c_longlong),
-    ('rem', c_longlong),
-]
-__ctype_get_mb_cur_max = _libraries['/usr/lib/libmikmod.so'].__ctype_get_mb_cur_max
-__ctype_get_mb_cur_max.restype = size_t
-__ctype_get_mb_cur_max.argtypes = []
-strtod = _libraries['/usr/lib/libmikmod.so'].strtod
-strtod.restype = c_double
-strtod.argtypes = [STRING, POINTER(STRING)]
-strtof = _libraries['/usr/lib/libmikmod.so'].strtof
-strtof.restype = c_float
-strtof.argtypes = [STRING, POINTER(STRING)]
-strtold = _libraries['/usr/lib/libmikmod.so'].strtold
-strtold.restype = c_longdouble
-strtold.argtypes = [STRING, POINTER(STRING)]
-strtol = _libraries['/usr/lib/libmikmod.so'].strtol
-strtol.restype = c_long
-strtol.argtypes = [STRING, POINTER(STRING), c_int]
-strtoul = _libraries['/usr/lib/libmikmod.so'].strtoul
-strtoul.restype = c_ulong
-strtoul.argtypes = [STRING, POINTER(STRING), c_int]
-strtoq = _libraries['/usr/lib/libmikmod.so'].strtoq
-strtoq.restype = c_longlong
-strtoq.argtypes = [STRING, POINTER(STRING), c_int]
-strtouq = _libraries['/usr/lib/libmikmod.so'].strtouq
-strtouq.restype = c_ulonglong
-strtouq.argtypes = [STRING, POINTER(STRING), c_int]
-strtoll = _libraries['/usr/lib/libmikmod.so'].strtoll
-strtoll.restype = c_longlong
-strtoll.argtypes = [STRING, POINTER(STRING), c_int]
-strtoull = _libraries['/usr/lib/libmikmod.so'].strtoull
-strtoull.restype = c_ulonglong
-strtoull.argtypes = [STRING, POINTER(STRING), c_int]
-class __locale_struct(Structure):
-    pass
-__locale_t = POINTER(__locale_struct)
-strtol_l = _libraries['/usr/lib/libmikmod.so'].strtol_l
-strtol_l.restype = c_long
-strtol_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtoul_l = _libraries['/usr/lib/libmikmod.so'].strtoul_l
-strtoul_l.restype = c_ulong
-strtoul_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtoll_l = _libraries['/usr/lib/libmikmod.so'].strtoll_l
-strtoll_l.restype = c_longlong
-strtoll_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtoull_l = _libraries['/usr/lib/libmikmod.so'].strtoull_l
-strtoull_l.restype = c_ulonglong
-strtoull_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtod_l = _libraries['/usr/lib/libmikmod.so'].strtod_l
-strtod_l.restype = c_double
-strtod_l.argtypes = [STRING, POINTER(STRING), __locale_t]
-strtof_l = _libraries['/usr/lib/libmikmod.so'].strtof_l
-strtof_l.restype = c_float
-strtof_l.argtypes = [STRING, POINTER(STRING), __locale_t]
-strtold_l = _libraries['/usr/lib/libmikmod.so'].strtold_l
-strtold_l.restype = c_longdouble
-strtold_l.argtypes = [STRING, POINTER(STRING), __locale_t]
-atoi = _libraries['/usr/lib/libmikmod.so'].atoi
-atoi.restype = c_int
-atoi.argtypes = [STRING]
-atol = _libraries['/usr/lib/libmikmod.so'].atol
-atol.restype = c_long
-atol.argtypes = [STRING]
-atoll = _libraries['/usr/lib/libmikmod.so'].atoll
-atoll.restype = c_longlong
-atoll.argtypes = [STRING]
-l64a = _libraries['/usr/lib/libmikmod.so'].l64a
-l64a.restype = STRING
-l64a.argtypes = [c_long]
-a64l = _libraries['/usr/lib/libmikmod.so'].a64l
-a64l.restype = c_long
-a64l.argtypes = [STRING]
-random = _libraries['/usr/lib/libmikmod.so'].random
-random.restype = c_long
-random.argtypes = []
-srandom = _libraries['/usr/lib/libmikmod.so'].srandom
-srandom.restype = None
-srandom.argtypes = [c_uint]
-initstate = _libraries['/usr/lib/libmikmod.so'].initstate
-initstate.restype = STRING
-initstate.argtypes = [c_uint, STRING, size_t]
-setstate = _libraries['/usr/lib/libmikmod.so'].setstate
-setstate.restype = STRING
-setstate.argtypes = [STRING]
-class random_data(Structure):
-    pass
 int32_t = c_int32
-random_data._fields_ = [
-    ('fptr', POINTER(int32_t)),
-    ('rptr', POINTER(int32_t)),
-    ('state', POINTER(int32_t)),
-    ('rand_type', c_int),
-    ('rand_deg', c_int),
-    ('rand_sep', c_int),
-    ('end_ptr', POINTER(int32_t)),
-]
-random_r = _libraries['/usr/lib/libmikmod.so'].random_r
-random_r.restype = c_int
-random_r.argtypes = [POINTER(random_data), POINTER(int32_t)]
-srandom_r = _libraries['/usr/lib/libmikmod.so'].srandom_r
-srandom_r.restype = c_int
-srandom_r.argtypes = [c_uint, POINTER(random_data)]
-initstate_r = _libraries['/usr/lib/libmikmod.so'].initstate_r
-initstate_r.restype = c_int
-initstate_r.argtypes = [c_uint, STRING, size_t, POINTER(random_data)]
-setstate_r = _libraries['/usr/lib/libmikmod.so'].setstate_r
-setstate_r.restype = c_int
-setstate_r.argtypes = [STRING, POINTER(random_data)]
-rand = _libraries['/usr/lib/libmikmod.so'].rand
-rand.restype = c_int
-rand.argtypes = []
-srand = _libraries['/usr/lib/libmikmod.so'].srand
-srand.restype = None
-srand.argtypes = [c_uint]
-rand_r = _libraries['/usr/lib/libmikmod.so'].rand_r
-rand_r.restype = c_int
-rand_r.argtypes = [POINTER(c_uint)]
-drand48 = _libraries['/usr/lib/libmikmod.so'].drand48
-drand48.restype = c_double
-drand48.argtypes = []
-erand48 = _libraries['/usr/lib/libmikmod.so'].erand48
-erand48.restype = c_double
-erand48.argtypes = [POINTER(c_ushort)]
-lrand48 = _libraries['/usr/lib/libmikmod.so'].lrand48
-lrand48.restype = c_long
-lrand48.argtypes = []
-nrand48 = _libraries['/usr/lib/libmikmod.so'].nrand48
-nrand48.restype = c_long
-nrand48.argtypes = [POINTER(c_ushort)]
-mrand48 = _libraries['/usr/lib/libmikmod.so'].mrand48
-mrand48.restype = c_long
-mrand48.argtypes = []
-jrand48 = _libraries['/usr/lib/libmikmod.so'].jrand48
-jrand48.restype = c_long
-jrand48.argtypes = [POINTER(c_ushort)]
-srand48 = _libraries['/usr/lib/libmikmod.so'].srand48
-srand48.restype = None
-srand48.argtypes = [c_long]
-seed48 = _libraries['/usr/lib/libmikmod.so'].seed48
-seed48.restype = POINTER(c_ushort)
-seed48.argtypes = [POINTER(c_ushort)]
-lcong48 = _libraries['/usr/lib/libmikmod.so'].lcong48
-lcong48.restype = None
-lcong48.argtypes = [POINTER(c_ushort)]
-class drand48_data(Structure):
-    pass
-drand48_data._fields_ = [
-    ('__x', c_ushort * 3),
-    ('__old_x', c_ushort * 3),
-    ('__c', c_ushort),
-    ('__init', c_ushort),
-    ('__a', c_ulonglong),
-]
-drand48_r = _libraries['/usr/lib/libmikmod.so'].drand48_r
-drand48_r.restype = c_int
-drand48_r.argtypes = [POINTER(drand48_data), POINTER(c_double)]
-erand48_r = _libraries['/usr/lib/libmikmod.so'].erand48_r
-erand48_r.restype = c_int
-erand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_double)]
-lrand48_r = _libraries['/usr/lib/libmikmod.so'].lrand48_r
-lrand48_r.restype = c_int
-lrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]
-nrand48_r = _libraries['/usr/lib/libmikmod.so'].nrand48_r
-nrand48_r.restype = c_int
-nrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]
-mrand48_r = _libraries['/usr/lib/libmikmod.so'].mrand48_r
-mrand48_r.restype = c_int
-mrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]
-jrand48_r = _libraries['/usr/lib/libmikmod.so'].jrand48_r
-jrand48_r.restype = c_int
-jrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]
-srand48_r = _libraries['/usr/lib/libmikmod.so'].srand48_r
-srand48_r.restype = c_int
-srand48_r.argtypes = [c_long, POINTER(drand48_data)]
-seed48_r = _libraries['/usr/lib/libmikmod.so'].seed48_r
-seed48_r.restype = c_int
-seed48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]
-lcong48_r = _libraries['/usr/lib/libmikmod.so'].lcong48_r
-lcong48_r.restype = c_int
-lcong48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]
-malloc = _libraries['/usr/lib/libmikmod.so'].malloc
-malloc.restype = c_void_p
-malloc.argtypes = [size_t]
-calloc = _libraries['/usr/lib/libmikmod.so'].calloc
-calloc.restype = c_void_p
-calloc.argtypes = [size_t, size_t]
-realloc = _libraries['/usr/lib/libmikmod.so'].realloc
-realloc.restype = c_void_p
-realloc.argtypes = [c_void_p, size_t]
-free = _libraries['/usr/lib/libmikmod.so'].free
-free.restype = None
-free.argtypes = [c_void_p]
-cfree = _libraries['/usr/lib/libmikmod.so'].cfree
-cfree.restype = None
-cfree.argtypes = [c_void_p]
-valloc = _libraries['/usr/lib/libmikmod.so'].valloc
-valloc.restype = c_void_p
-valloc.argtypes = [size_t]
-posix_memalign = _libraries['/usr/lib/libmikmod.so'].posix_memalign
-posix_memalign.restype = c_int
-posix_memalign.argtypes = [POINTER(c_void_p), size_t, size_t]
-aligned_alloc = _libraries['/usr/lib/libmikmod.so'].aligned_alloc
-aligned_alloc.restype = c_void_p
-aligned_alloc.argtypes = [size_t, size_t]
-abort = _libraries['/usr/lib/libmikmod.so'].abort
-abort.restype = None
-abort.argtypes = []
-on_exit = _libraries['/usr/lib/libmikmod.so'].on_exit
-on_exit.restype = c_int
-on_exit.argtypes = [CFUNCTYPE(None, c_int, c_void_p), c_void_p]
-exit = _libraries['/usr/lib/libmikmod.so'].exit
-exit.restype = None
-exit.argtypes = [c_int]
-quick_exit = _libraries['/usr/lib/libmikmod.so'].quick_exit
-quick_exit.restype = None
-quick_exit.argtypes = [c_int]
-_Exit = _libraries['/usr/lib/libmikmod.so']._Exit
-_Exit.restype = None
-_Exit.argtypes = [c_int]
-getenv = _libraries['/usr/lib/libmikmod.so'].getenv
-getenv.restype = STRING
-getenv.argtypes = [STRING]
-secure_getenv = _libraries['/usr/lib/libmikmod.so'].secure_getenv
-secure_getenv.restype = STRING
-secure_getenv.argtypes = [STRING]
-putenv = _libraries['/usr/lib/libmikmod.so'].putenv
-putenv.restype = c_int
-putenv.argtypes = [STRING]
-setenv = _libraries['/usr/lib/libmikmod.so'].setenv
-setenv.restype = c_int
-setenv.argtypes = [STRING, STRING, c_int]
-unsetenv = _libraries['/usr/lib/libmikmod.so'].unsetenv
-unsetenv.restype = c_int
-unsetenv.argtypes = [STRING]
-clearenv = _libraries['/usr/lib/libmikmod.so'].clearenv
-clearenv.restype = c_int
-clearenv.argtypes = []
-mktemp = _libraries['/usr/lib/libmikmod.so'].mktemp
-mktemp.restype = STRING
-mktemp.argtypes = [STRING]
-mkstemp = _libraries['/usr/lib/libmikmod.so'].mkstemp
-mkstemp.restype = c_int
-mkstemp.argtypes = [STRING]
-mkstemp64 = _libraries['/usr/lib/libmikmod.so'].mkstemp64
-mkstemp64.restype = c_int
-mkstemp64.argtypes = [STRING]
-mkstemps = _libraries['/usr/lib/libmikmod.so'].mkstemps
-mkstemps.restype = c_int
-mkstemps.argtypes = [STRING, c_int]
-mkstemps64 = _libraries['/usr/lib/libmikmod.so'].mkstemps64
-mkstemps64.restype = c_int
-mkstemps64.argtypes = [STRING, c_int]
-mkdtemp = _libraries['/usr/lib/libmikmod.so'].mkdtemp
-mkdtemp.restype = STRING
-mkdtemp.argtypes = [STRING]
-mkostemp = _libraries['/usr/lib/libmikmod.so'].mkostemp
-mkostemp.restype = c_int
-mkostemp.argtypes = [STRING, c_int]
-mkostemp64 = _libraries['/usr/lib/libmikmod.so'].mkostemp64
-mkostemp64.restype = c_int
-mkostemp64.argtypes = [STRING, c_int]
-mkostemps = _libraries['/usr/lib/libmikmod.so'].mkostemps
-mkostemps.restype = c_int
-mkostemps.argtypes = [STRING, c_int, c_int]
-mkostemps64 = _libraries['/usr/lib/libmikmod.so'].mkostemps64
-mkostemps64.restype = c_int
-mkostemps64.argtypes = [STRING, c_int, c_int]
-system = _libraries['/usr/lib/libmikmod.so'].system
-system.restype = c_int
-system.argtypes = [STRING]
-canonicalize_file_name = _libraries['/usr/lib/libmikmod.so'].canonicalize_file_name
-canonicalize_file_name.restype = STRING
-canonicalize_file_name.argtypes = [STRING]
 comparison_fn_t = __compar_fn_t
 __compar_d_fn_t = CFUNCTYPE(c_int, c_void_p, c_void_p, c_void_p)
-qsort = _libraries['/usr/lib/libmikmod.so'].qsort
-qsort.restype = None
-qsort.argtypes = [c_void_p, size_t, size_t, __compar_fn_t]
-qsort_r = _libraries['/usr/lib/libmikmod.so'].qsort_r
-qsort_r.restype = None
-qsort_r.argtypes = [c_void_p, size_t, size_t, __compar_d_fn_t, c_void_p]
-abs = _libraries['/usr/lib/libmikmod.so'].abs
-abs.restype = c_int
-abs.argtypes = [c_int]
-labs = _libraries['/usr/lib/libmikmod.so'].labs
-labs.restype = c_long
-labs.argtypes = [c_long]
-llabs = _libraries['/usr/lib/libmikmod.so'].llabs
-llabs.restype = c_longlong
-llabs.argtypes = [c_longlong]
-div = _libraries['/usr/lib/libmikmod.so'].div
-div.restype = div_t
-div.argtypes = [c_int, c_int]
-ldiv = _libraries['/usr/lib/libmikmod.so'].ldiv
-ldiv.restype = ldiv_t
-ldiv.argtypes = [c_long, c_long]
-lldiv = _libraries['/usr/lib/libmikmod.so'].lldiv
-lldiv.restype = lldiv_t
-lldiv.argtypes = [c_longlong, c_longlong]
-ecvt = _libraries['/usr/lib/libmikmod.so'].ecvt
-ecvt.restype = STRING
-ecvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]
-fcvt = _libraries['/usr/lib/libmikmod.so'].fcvt
-fcvt.restype = STRING
-fcvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]
-gcvt = _libraries['/usr/lib/libmikmod.so'].gcvt
-gcvt.restype = STRING
-gcvt.argtypes = [c_double, c_int, STRING]
-qecvt = _libraries['/usr/lib/libmikmod.so'].qecvt
-qecvt.restype = STRING
-qecvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]
-qfcvt = _libraries['/usr/lib/libmikmod.so'].qfcvt
-qfcvt.restype = STRING
-qfcvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]
-qgcvt = _libraries['/usr/lib/libmikmod.so'].qgcvt
-qgcvt.restype = STRING
-qgcvt.argtypes = [c_longdouble, c_int, STRING]
-ecvt_r = _libraries['/usr/lib/libmikmod.so'].ecvt_r
-ecvt_r.restype = c_int
-ecvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-fcvt_r = _libraries['/usr/lib/libmikmod.so'].fcvt_r
-fcvt_r.restype = c_int
-fcvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-qecvt_r = _libraries['/usr/lib/libmikmod.so'].qecvt_r
-qecvt_r.restype = c_int
-qecvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-qfcvt_r = _libraries['/usr/lib/libmikmod.so'].qfcvt_r
-qfcvt_r.restype = c_int
-qfcvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-mblen = _libraries['/usr/lib/libmikmod.so'].mblen
-mblen.restype = c_int
-mblen.argtypes = [STRING, size_t]
-mbtowc = _libraries['/usr/lib/libmikmod.so'].mbtowc
-mbtowc.restype = c_int
-mbtowc.argtypes = [WSTRING, STRING, size_t]
-rpmatch = _libraries['/usr/lib/libmikmod.so'].rpmatch
-rpmatch.restype = c_int
-rpmatch.argtypes = [STRING]
-getsubopt = _libraries['/usr/lib/libmikmod.so'].getsubopt
-getsubopt.restype = c_int
-getsubopt.argtypes = [POINTER(STRING), POINTER(STRING), POINTER(STRING)]
-posix_openpt = _libraries['/usr/lib/libmikmod.so'].posix_openpt
-posix_openpt.restype = c_int
-posix_openpt.argtypes = [c_int]
-grantpt = _libraries['/usr/lib/libmikmod.so'].grantpt
-grantpt.restype = c_int
-grantpt.argtypes = [c_int]
-unlockpt = _libraries['/usr/lib/libmikmod.so'].unlockpt
-unlockpt.restype = c_int
-unlockpt.argtypes = [c_int]
-ptsname = _libraries['/usr/lib/libmikmod.so'].ptsname
-ptsname.restype = STRING
-ptsname.argtypes = [c_int]
-getpt = _libraries['/usr/lib/libmikmod.so'].getpt
-getpt.restype = c_int
-getpt.argtypes = []
-getloadavg = _libraries['/usr/lib/libmikmod.so'].getloadavg
-getloadavg.restype = c_int
-getloadavg.argtypes = [POINTER(c_double), c_int]
-sigset_t = __sigset_t
 __fd_mask = c_long
-class fd_set(Structure):
-    pass
-fd_set._fields_ = [
-    ('fds_bits', __fd_mask * 16),
-]
 fd_mask = __fd_mask
-select = _libraries['/usr/lib/libmikmod.so'].select
-select.restype = c_int
-select.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timeval)]
-class timespec(Structure):
-    pass
-timespec._fields_ = [
-    ('tv_sec', __time_t),
-    ('tv_nsec', __syscall_slong_t),
-]
-pselect = _libraries['/usr/lib/libmikmod.so'].pselect
-pselect.restype = c_int
-pselect.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timespec), POINTER(__sigset_t)]
-gnu_dev_major = _libraries['/usr/lib/libmikmod.so'].gnu_dev_major
-gnu_dev_major.restype = c_uint
-gnu_dev_major.argtypes = [c_ulonglong]
-gnu_dev_minor = _libraries['/usr/lib/libmikmod.so'].gnu_dev_minor
-gnu_dev_minor.restype = c_uint
-gnu_dev_minor.argtypes = [c_ulonglong]
-gnu_dev_makedev = _libraries['/usr/lib/libmikmod.so'].gnu_dev_makedev
-gnu_dev_makedev.restype = c_ulonglong
-gnu_dev_makedev.argtypes = [c_uint, c_uint]
 u_char = __u_char
 u_short = __u_short
 u_int = __u_int
 u_long = __u_long
 quad_t = __quad_t
 u_quad_t = __u_quad_t
-fsid_t = __fsid_t
 loff_t = __loff_t
 ino_t = __ino_t
 ino64_t = __ino64_t
@@ -2307,18 +622,6 @@ clock_t = __clock_t
 time_t = __time_t
 clockid_t = __clockid_t
 timer_t = __timer_t
-class __locale_data(Structure):
-    pass
-__locale_struct._fields_ = [
-    ('__locales', POINTER(__locale_data) * 13),
-    ('__ctype_b', POINTER(c_ushort)),
-    ('__ctype_tolower', POINTER(c_int)),
-    ('__ctype_toupper', POINTER(c_int)),
-    ('__names', STRING * 13),
-]
-__locale_data._fields_ = [
-]
-locale_t = __locale_t
 __all__ = ['__uint16_t', '_ATFILE_SOURCE', 'EOF', '__glibc_unlikely',
            'wctomb', 'getc_unlocked', 'MMERR_OPENAL_CREATECTX',
            '_IO_USER_LOCK', 'MikMod_calloc', 'u_short',
@@ -2639,3 +942,2625 @@ __all__ = ['__uint16_t', '_ATFILE_SOURCE', 'EOF', '__glibc_unlikely',
            'EXIT_FAILURE', 'fcvt_r', 'pid_t', 'drv_gp32',
            '__codecvt_noconv', '_IOLBF', 'MMERR_DOSSB_STARTDMA',
            'NFDBITS']
+
+
+# The base class, lazy names used and code that finishes defining each
+# lazy name.
+_definitions = {
+    'putc': (None, ('FILE', '_IO_putc'),
+        'def putc(_ch,_fp): return _IO_putc (_ch, _fp) # macro\n'
+        "putc = _libraries['/usr/lib/libmikmod.so'].putc\n"
+        'putc.restype = c_int\n'
+        'putc.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    '_G_fpos_t': ('Structure', ('__mbstate_t',),
+        '_G_fpos_t._fields_ = [\n'
+        "    ('__pos', __off_t),\n"
+        "    ('__state', __mbstate_t),\n"
+        ']'
+        ),
+    '__mbstate_t': ('Structure', ('N11__mbstate_t3DOT_2E',),
+        '__mbstate_t._fields_ = [\n'
+        "    ('__count', c_int),\n"
+        "    ('__value', N11__mbstate_t3DOT_2E),\n"
+        ']'
+        ),
+    'N11__mbstate_t3DOT_2E': ('Union', (),
+        'N11__mbstate_t3DOT_2E._fields_ = [\n'
+        "    ('__wch', c_uint),\n"
+        "    ('__wchb', c_char * 4),\n"
+        ']'
+        ),
+    '_IO_fpos_t': (None, ('_G_fpos_t',),
+        '_IO_fpos_t = _G_fpos_t # alias'
+        ),
+    '_G_fpos64_t': ('Structure', ('__mbstate_t',),
+        '_G_fpos64_t._fields_ = [\n'
+        "    ('__pos', __off64_t),\n"
+        "    ('__state', __mbstate_t),\n"
+        ']'
+        ),
+    '_IO_fpos64_t': (None, ('_G_fpos64_t',),
+        '_IO_fpos64_t = _G_fpos64_t # alias'
+        ),
+    '__va_list_tag': ('Structure', (),
+        '__va_list_tag._fields_ = [\n'
+        ']'
+        ),
+    '__gnuc_va_list': (None, ('__va_list_tag',),
+        '__gnuc_va_list = __va_list_tag * 1'
+        ),
+    '_G_va_list': (None, ('__gnuc_va_list',),
+        '_G_va_list = __gnuc_va_list # alias'
+        ),
+    '_IO_FILE': ('Structure', ('_IO_marker',),
+        '_IO_FILE._fields_ = [\n'
+        "    ('_flags', c_int),\n"
+        "    ('_IO_read_ptr', STRING),\n"
+        "    ('_IO_read_end', STRING),\n"
+        "    ('_IO_read_base', STRING),\n"
+        "    ('_IO_write_base', STRING),\n"
+        "    ('_IO_write_ptr', STRING),\n"
+        "    ('_IO_write_end', STRING),\n"
+        "    ('_IO_buf_base', STRING),\n"
+        "    ('_IO_buf_end', STRING),\n"
+        "    ('_IO_save_base', STRING),\n"
+        "    ('_IO_backup_base', STRING),\n"
+        "    ('_IO_save_end', STRING),\n"
+        "    ('_markers', POINTER(_IO_marker)),\n"
+        "    ('_chain', POINTER(_IO_FILE)),\n"
+        "    ('_fileno', c_int),\n"
+        "    ('_flags2', c_int),\n"
+        "    ('_old_offset', __off_t),\n"
+        "    ('_cur_column', c_ushort),\n"
+        "    ('_vtable_offset', c_byte),\n"
+        "    ('_shortbuf', c_char * 1),\n"
+        "    ('_lock', POINTER(_IO_lock_t)),\n"
+        "    ('_offset', __off64_t),\n"
+        "    ('__pad1', c_void_p),\n"
+        "    ('__pad2', c_void_p),\n"
+        "    ('__pad3', c_void_p),\n"
+        "    ('__pad4', c_void_p),\n"
+        "    ('__pad5', size_t),\n"
+        "    ('_mode', c_int),\n"
+        "    ('_unused2', c_char * 20),\n"
+        ']'
+        ),
+    'stdout': (None, ('_IO_FILE',),
+        "stdout = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmikmod.so'], 'stdout')\n"
+        'stdout = stdout # alias'
+        ),
+    'stderr': (None, ('_IO_FILE',),
+        "stderr = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmikmod.so'], 'stderr')\n"
+        'stderr = stderr # alias'
+        ),
+    '_IO_va_list': (None, ('__gnuc_va_list',),
+        '_IO_va_list = __gnuc_va_list # alias'
+        ),
+    'stdin': (None, ('_IO_FILE',),
+        "stdin = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmikmod.so'], 'stdin')\n"
+        'stdin = stdin # alias'
+        ),
+    'minor': (None, ('gnu_dev_minor',),
+        'def minor(dev): return gnu_dev_minor (dev) # macro'
+        ),
+    'getc': (None, ('FILE', '_IO_getc'),
+        'def getc(_fp): return _IO_getc (_fp) # macro\n'
+        "getc = _libraries['/usr/lib/libmikmod.so'].getc\n"
+        'getc.restype = c_int\n'
+        'getc.argtypes = [POINTER(FILE)]'
+        ),
+    'makedev': (None, ('gnu_dev_makedev',),
+        'def makedev(maj,min): return gnu_dev_makedev (maj, min) # macro'
+        ),
+    'major': (None, ('gnu_dev_major',),
+        'def major(dev): return gnu_dev_major (dev) # macro'
+        ),
+    'pthread_attr_t': ('Union', (),
+        'pthread_attr_t._fields_ = [\n'
+        "    ('__size', c_char * 56),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    '__pthread_internal_list': ('Structure', (),
+        '__pthread_internal_list._fields_ = [\n'
+        "    ('__prev', POINTER(__pthread_internal_list)),\n"
+        "    ('__next', POINTER(__pthread_internal_list)),\n"
+        ']'
+        ),
+    '__pthread_list_t': (None, ('__pthread_internal_list',),
+        '__pthread_list_t = __pthread_internal_list'
+        ),
+    '__pthread_mutex_s': ('Structure', ('__pthread_list_t',),
+        '__pthread_mutex_s._fields_ = [\n'
+        "    ('__lock', c_int),\n"
+        "    ('__count', c_uint),\n"
+        "    ('__owner', c_int),\n"
+        "    ('__nusers', c_uint),\n"
+        "    ('__kind', c_int),\n"
+        "    ('__spins', c_short),\n"
+        "    ('__elision', c_short),\n"
+        "    ('__list', __pthread_list_t),\n"
+        ']'
+        ),
+    'pthread_mutex_t': ('Union', ('__pthread_mutex_s',),
+        'pthread_mutex_t._fields_ = [\n'
+        "    ('__data', __pthread_mutex_s),\n"
+        "    ('__size', c_char * 40),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_mutexattr_t': ('Union', (),
+        'pthread_mutexattr_t._fields_ = [\n'
+        "    ('__size', c_char * 4),\n"
+        "    ('__align', c_int),\n"
+        ']'
+        ),
+    'N14pthread_cond_t4DOT_16E': ('Structure', (),
+        'N14pthread_cond_t4DOT_16E._fields_ = [\n'
+        "    ('__lock', c_int),\n"
+        "    ('__futex', c_uint),\n"
+        "    ('__total_seq', c_ulonglong),\n"
+        "    ('__wakeup_seq', c_ulonglong),\n"
+        "    ('__woken_seq', c_ulonglong),\n"
+        "    ('__mutex', c_void_p),\n"
+        "    ('__nwaiters', c_uint),\n"
+        "    ('__broadcast_seq', c_uint),\n"
+        ']'
+        ),
+    'pthread_cond_t': ('Union', ('N14pthread_cond_t4DOT_16E',),
+        'pthread_cond_t._fields_ = [\n'
+        "    ('__data', N14pthread_cond_t4DOT_16E),\n"
+        "    ('__size', c_char * 48),\n"
+        "    ('__align', c_longlong),\n"
+        ']'
+        ),
+    'pthread_condattr_t': ('Union', (),
+        'pthread_condattr_t._fields_ = [\n'
+        "    ('__size', c_char * 4),\n"
+        "    ('__align', c_int),\n"
+        ']'
+        ),
+    'N16pthread_rwlock_t4DOT_19E': ('Structure', (),
+        'N16pthread_rwlock_t4DOT_19E._fields_ = [\n'
+        "    ('__lock', c_int),\n"
+        "    ('__nr_readers', c_uint),\n"
+        "    ('__readers_wakeup', c_uint),\n"
+        "    ('__writer_wakeup', c_uint),\n"
+        "    ('__nr_readers_queued', c_uint),\n"
+        "    ('__nr_writers_queued', c_uint),\n"
+        "    ('__writer', c_int),\n"
+        "    ('__shared', c_int),\n"
+        "    ('__pad1', c_ulong),\n"
+        "    ('__pad2', c_ulong),\n"
+        "    ('__flags', c_uint),\n"
+        ']'
+        ),
+    'pthread_rwlock_t': ('Union', ('N16pthread_rwlock_t4DOT_19E',),
+        'pthread_rwlock_t._fields_ = [\n'
+        "    ('__data', N16pthread_rwlock_t4DOT_19E),\n"
+        "    ('__size', c_char * 56),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_rwlockattr_t': ('Union', (),
+        'pthread_rwlockattr_t._fields_ = [\n'
+        "    ('__size', c_char * 8),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_barrier_t': ('Union', (),
+        'pthread_barrier_t._fields_ = [\n'
+        "    ('__size', c_char * 32),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_barrierattr_t': ('Union', (),
+        'pthread_barrierattr_t._fields_ = [\n'
+        "    ('__size', c_char * 4),\n"
+        "    ('__align', c_int),\n"
+        ']'
+        ),
+    '__fdelt_chk': (None, (),
+        "__fdelt_chk = _libraries['/usr/lib/libmikmod.so'].__fdelt_chk\n"
+        '__fdelt_chk.restype = c_long\n'
+        '__fdelt_chk.argtypes = [c_long]'
+        ),
+    '__fdelt_warn': (None, (),
+        "__fdelt_warn = _libraries['/usr/lib/libmikmod.so'].__fdelt_warn\n"
+        '__fdelt_warn.restype = c_long\n'
+        '__fdelt_warn.argtypes = [c_long]'
+        ),
+    '__sigset_t': ('Structure', (),
+        '__sigset_t._fields_ = [\n'
+        "    ('__val', c_ulong * 16),\n"
+        ']'
+        ),
+    'getchar': (None, (),
+        "getchar = _libraries['/usr/lib/libmikmod.so'].getchar\n"
+        'getchar.restype = c_int\n'
+        'getchar.argtypes = []'
+        ),
+    'FILE': (None, ('_IO_FILE',),
+        'FILE = _IO_FILE'
+        ),
+    'fgetc_unlocked': (None, ('FILE',),
+        "fgetc_unlocked = _libraries['/usr/lib/libmikmod.so'].fgetc_unlocked\n"
+        'fgetc_unlocked.restype = c_int\n'
+        'fgetc_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'getc_unlocked': (None, ('FILE',),
+        "getc_unlocked = _libraries['/usr/lib/libmikmod.so'].getc_unlocked\n"
+        'getc_unlocked.restype = c_int\n'
+        'getc_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'getchar_unlocked': (None, (),
+        "getchar_unlocked = _libraries['/usr/lib/libmikmod.so'].getchar_unlocked\n"
+        'getchar_unlocked.restype = c_int\n'
+        'getchar_unlocked.argtypes = []'
+        ),
+    'putchar': (None, (),
+        "putchar = _libraries['/usr/lib/libmikmod.so'].putchar\n"
+        'putchar.restype = c_int\n'
+        'putchar.argtypes = [c_int]'
+        ),
+    'fputc_unlocked': (None, ('FILE',),
+        "fputc_unlocked = _libraries['/usr/lib/libmikmod.so'].fputc_unlocked\n"
+        'fputc_unlocked.restype = c_int\n'
+        'fputc_unlocked.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'putc_unlocked': (None, ('FILE',),
+        "putc_unlocked = _libraries['/usr/lib/libmikmod.so'].putc_unlocked\n"
+        'putc_unlocked.restype = c_int\n'
+        'putc_unlocked.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'putchar_unlocked': (None, (),
+        "putchar_unlocked = _libraries['/usr/lib/libmikmod.so'].putchar_unlocked\n"
+        'putchar_unlocked.restype = c_int\n'
+        'putchar_unlocked.argtypes = [c_int]'
+        ),
+    'getline': (None, ('FILE',),
+        "getline = _libraries['/usr/lib/libmikmod.so'].getline\n"
+        'getline.restype = __ssize_t\n'
+        'getline.argtypes = [POINTER(STRING), POINTER(size_t), POINTER(FILE)]'
+        ),
+    'feof_unlocked': (None, ('FILE',),
+        "feof_unlocked = _libraries['/usr/lib/libmikmod.so'].feof_unlocked\n"
+        'feof_unlocked.restype = c_int\n'
+        'feof_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'ferror_unlocked': (None, ('FILE',),
+        "ferror_unlocked = _libraries['/usr/lib/libmikmod.so'].ferror_unlocked\n"
+        'ferror_unlocked.restype = c_int\n'
+        'ferror_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    '__sprintf_chk': (None, (),
+        "__sprintf_chk = _libraries['/usr/lib/libmikmod.so'].__sprintf_chk\n"
+        '__sprintf_chk.restype = c_int\n'
+        '__sprintf_chk.argtypes = [STRING, c_int, size_t, STRING]'
+        ),
+    '__vsprintf_chk': (None, ('__va_list_tag',),
+        "__vsprintf_chk = _libraries['/usr/lib/libmikmod.so'].__vsprintf_chk\n"
+        '__vsprintf_chk.restype = c_int\n'
+        '__vsprintf_chk.argtypes = [STRING, c_int, size_t, STRING, POINTER(__va_list_tag)]'
+        ),
+    'sprintf': (None, (),
+        "sprintf = _libraries['/usr/lib/libmikmod.so'].sprintf\n"
+        'sprintf.restype = c_int\n'
+        'sprintf.argtypes = [STRING, STRING]'
+        ),
+    'vsprintf': (None, ('__va_list_tag',),
+        "vsprintf = _libraries['/usr/lib/libmikmod.so'].vsprintf\n"
+        'vsprintf.restype = c_int\n'
+        'vsprintf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__snprintf_chk': (None, (),
+        "__snprintf_chk = _libraries['/usr/lib/libmikmod.so'].__snprintf_chk\n"
+        '__snprintf_chk.restype = c_int\n'
+        '__snprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING]'
+        ),
+    '__vsnprintf_chk': (None, ('__va_list_tag',),
+        "__vsnprintf_chk = _libraries['/usr/lib/libmikmod.so'].__vsnprintf_chk\n"
+        '__vsnprintf_chk.restype = c_int\n'
+        '__vsnprintf_chk.argtypes = [STRING, size_t, c_int, size_t, STRING, POINTER(__va_list_tag)]'
+        ),
+    'snprintf': (None, (),
+        "snprintf = _libraries['/usr/lib/libmikmod.so'].snprintf\n"
+        'snprintf.restype = c_int\n'
+        'snprintf.argtypes = [STRING, size_t, STRING]'
+        ),
+    'vsnprintf': (None, ('__va_list_tag',),
+        "vsnprintf = _libraries['/usr/lib/libmikmod.so'].vsnprintf\n"
+        'vsnprintf.restype = c_int\n'
+        'vsnprintf.argtypes = [STRING, size_t, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__fprintf_chk': (None, ('FILE',),
+        "__fprintf_chk = _libraries['/usr/lib/libmikmod.so'].__fprintf_chk\n"
+        '__fprintf_chk.restype = c_int\n'
+        '__fprintf_chk.argtypes = [POINTER(FILE), c_int, STRING]'
+        ),
+    '__printf_chk': (None, (),
+        "__printf_chk = _libraries['/usr/lib/libmikmod.so'].__printf_chk\n"
+        '__printf_chk.restype = c_int\n'
+        '__printf_chk.argtypes = [c_int, STRING]'
+        ),
+    '__vfprintf_chk': (None, ('FILE', '__va_list_tag'),
+        "__vfprintf_chk = _libraries['/usr/lib/libmikmod.so'].__vfprintf_chk\n"
+        '__vfprintf_chk.restype = c_int\n'
+        '__vfprintf_chk.argtypes = [POINTER(FILE), c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__vprintf_chk': (None, ('__va_list_tag',),
+        "__vprintf_chk = _libraries['/usr/lib/libmikmod.so'].__vprintf_chk\n"
+        '__vprintf_chk.restype = c_int\n'
+        '__vprintf_chk.argtypes = [c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'fprintf': (None, ('FILE',),
+        "fprintf = _libraries['/usr/lib/libmikmod.so'].fprintf\n"
+        'fprintf.restype = c_int\n'
+        'fprintf.argtypes = [POINTER(FILE), STRING]'
+        ),
+    'printf': (None, (),
+        "printf = _libraries['/usr/lib/libmikmod.so'].printf\n"
+        'printf.restype = c_int\n'
+        'printf.argtypes = [STRING]'
+        ),
+    'vprintf': (None, ('__va_list_tag',),
+        "vprintf = _libraries['/usr/lib/libmikmod.so'].vprintf\n"
+        'vprintf.restype = c_int\n'
+        'vprintf.argtypes = [STRING, POINTER(__va_list_tag)]'
+        ),
+    'vfprintf': (None, ('FILE', '__va_list_tag'),
+        "vfprintf = _libraries['/usr/lib/libmikmod.so'].vfprintf\n"
+        'vfprintf.restype = c_int\n'
+        'vfprintf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]'
+        ),
+    '__dprintf_chk': (None, (),
+        "__dprintf_chk = _libraries['/usr/lib/libmikmod.so'].__dprintf_chk\n"
+        '__dprintf_chk.restype = c_int\n'
+        '__dprintf_chk.argtypes = [c_int, c_int, STRING]'
+        ),
+    '__vdprintf_chk': (None, ('__va_list_tag',),
+        "__vdprintf_chk = _libraries['/usr/lib/libmikmod.so'].__vdprintf_chk\n"
+        '__vdprintf_chk.restype = c_int\n'
+        '__vdprintf_chk.argtypes = [c_int, c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'dprintf': (None, (),
+        "dprintf = _libraries['/usr/lib/libmikmod.so'].dprintf\n"
+        'dprintf.restype = c_int\n'
+        'dprintf.argtypes = [c_int, STRING]'
+        ),
+    'vdprintf': (None, ('__va_list_tag',),
+        "vdprintf = _libraries['/usr/lib/libmikmod.so'].vdprintf\n"
+        'vdprintf.restype = c_int\n'
+        'vdprintf.argtypes = [c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    '__asprintf_chk': (None, (),
+        "__asprintf_chk = _libraries['/usr/lib/libmikmod.so'].__asprintf_chk\n"
+        '__asprintf_chk.restype = c_int\n'
+        '__asprintf_chk.argtypes = [POINTER(STRING), c_int, STRING]'
+        ),
+    '__vasprintf_chk': (None, ('__va_list_tag',),
+        "__vasprintf_chk = _libraries['/usr/lib/libmikmod.so'].__vasprintf_chk\n"
+        '__vasprintf_chk.restype = c_int\n'
+        '__vasprintf_chk.argtypes = [POINTER(STRING), c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'obstack': ('Structure', (),
+        'obstack._fields_ = [\n'
+        ']'
+        ),
+    '__obstack_printf_chk': (None, ('obstack',),
+        "__obstack_printf_chk = _libraries['/usr/lib/libmikmod.so'].__obstack_printf_chk\n"
+        '__obstack_printf_chk.restype = c_int\n'
+        '__obstack_printf_chk.argtypes = [POINTER(obstack), c_int, STRING]'
+        ),
+    '__obstack_vprintf_chk': (None, ('__va_list_tag', 'obstack'),
+        "__obstack_vprintf_chk = _libraries['/usr/lib/libmikmod.so'].__obstack_vprintf_chk\n"
+        '__obstack_vprintf_chk.restype = c_int\n'
+        '__obstack_vprintf_chk.argtypes = [POINTER(obstack), c_int, STRING, POINTER(__va_list_tag)]'
+        ),
+    'asprintf': (None, (),
+        "asprintf = _libraries['/usr/lib/libmikmod.so'].asprintf\n"
+        'asprintf.restype = c_int\n'
+        'asprintf.argtypes = [POINTER(STRING), STRING]'
+        ),
+    '__asprintf': (None, (),
+        "__asprintf = _libraries['/usr/lib/libmikmod.so'].__asprintf\n"
+        '__asprintf.restype = c_int\n'
+        '__asprintf.argtypes = [POINTER(STRING), STRING]'
+        ),
+    'obstack_printf': (None, ('obstack',),
+        "obstack_printf = _libraries['/usr/lib/libmikmod.so'].obstack_printf\n"
+        'obstack_printf.restype = c_int\n'
+        'obstack_printf.argtypes = [POINTER(obstack), STRING]'
+        ),
+    'vasprintf': (None, ('__va_list_tag',),
+        "vasprintf = _libraries['/usr/lib/libmikmod.so'].vasprintf\n"
+        'vasprintf.restype = c_int\n'
+        'vasprintf.argtypes = [POINTER(STRING), STRING, POINTER(__va_list_tag)]'
+        ),
+    'obstack_vprintf': (None, ('__va_list_tag', 'obstack'),
+        "obstack_vprintf = _libraries['/usr/lib/libmikmod.so'].obstack_vprintf\n"
+        'obstack_vprintf.restype = c_int\n'
+        'obstack_vprintf.argtypes = [POINTER(obstack), STRING, POINTER(__va_list_tag)]'
+        ),
+    '__fgets_chk': (None, ('FILE',),
+        "__fgets_chk = _libraries['/usr/lib/libmikmod.so'].__fgets_chk\n"
+        '__fgets_chk.restype = STRING\n'
+        '__fgets_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]'
+        ),
+    'fgets': (None, ('FILE',),
+        "fgets = _libraries['/usr/lib/libmikmod.so'].fgets\n"
+        'fgets.restype = STRING\n'
+        'fgets.argtypes = [STRING, c_int, POINTER(FILE)]'
+        ),
+    '__fread_chk': (None, ('FILE',),
+        "__fread_chk = _libraries['/usr/lib/libmikmod.so'].__fread_chk\n"
+        '__fread_chk.restype = size_t\n'
+        '__fread_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fread': (None, ('FILE',),
+        "fread = _libraries['/usr/lib/libmikmod.so'].fread\n"
+        'fread.restype = size_t\n'
+        'fread.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    '__fgets_unlocked_chk': (None, ('FILE',),
+        "__fgets_unlocked_chk = _libraries['/usr/lib/libmikmod.so'].__fgets_unlocked_chk\n"
+        '__fgets_unlocked_chk.restype = STRING\n'
+        '__fgets_unlocked_chk.argtypes = [STRING, size_t, c_int, POINTER(FILE)]'
+        ),
+    'fgets_unlocked': (None, ('FILE',),
+        "fgets_unlocked = _libraries['/usr/lib/libmikmod.so'].fgets_unlocked\n"
+        'fgets_unlocked.restype = STRING\n'
+        'fgets_unlocked.argtypes = [STRING, c_int, POINTER(FILE)]'
+        ),
+    '__fread_unlocked_chk': (None, ('FILE',),
+        "__fread_unlocked_chk = _libraries['/usr/lib/libmikmod.so'].__fread_unlocked_chk\n"
+        '__fread_unlocked_chk.restype = size_t\n'
+        '__fread_unlocked_chk.argtypes = [c_void_p, size_t, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fread_unlocked': (None, ('FILE',),
+        "fread_unlocked = _libraries['/usr/lib/libmikmod.so'].fread_unlocked\n"
+        'fread_unlocked.restype = size_t\n'
+        'fread_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'bsearch': (None, (),
+        "bsearch = _libraries['/usr/lib/libmikmod.so'].bsearch\n"
+        'bsearch.restype = c_void_p\n'
+        'bsearch.argtypes = [c_void_p, c_void_p, size_t, size_t, __compar_fn_t]'
+        ),
+    'atof': (None, (),
+        "atof = _libraries['/usr/lib/libmikmod.so'].atof\n"
+        'atof.restype = c_double\n'
+        'atof.argtypes = [STRING]'
+        ),
+    '__realpath_chk': (None, (),
+        "__realpath_chk = _libraries['/usr/lib/libmikmod.so'].__realpath_chk\n"
+        '__realpath_chk.restype = STRING\n'
+        '__realpath_chk.argtypes = [STRING, STRING, size_t]'
+        ),
+    'realpath': (None, (),
+        "realpath = _libraries['/usr/lib/libmikmod.so'].realpath\n"
+        'realpath.restype = STRING\n'
+        'realpath.argtypes = [STRING, STRING]'
+        ),
+    '__ptsname_r_chk': (None, (),
+        "__ptsname_r_chk = _libraries['/usr/lib/libmikmod.so'].__ptsname_r_chk\n"
+        '__ptsname_r_chk.restype = c_int\n'
+        '__ptsname_r_chk.argtypes = [c_int, STRING, size_t, size_t]'
+        ),
+    'ptsname_r': (None, (),
+        "ptsname_r = _libraries['/usr/lib/libmikmod.so'].ptsname_r\n"
+        'ptsname_r.restype = c_int\n'
+        'ptsname_r.argtypes = [c_int, STRING, size_t]'
+        ),
+    '__wctomb_chk': (None, (),
+        "__wctomb_chk = _libraries['/usr/lib/libmikmod.so'].__wctomb_chk\n"
+        '__wctomb_chk.restype = c_int\n'
+        '__wctomb_chk.argtypes = [STRING, c_wchar, size_t]'
+        ),
+    'wctomb': (None, (),
+        "wctomb = _libraries['/usr/lib/libmikmod.so'].wctomb\n"
+        'wctomb.restype = c_int\n'
+        'wctomb.argtypes = [STRING, c_wchar]'
+        ),
+    '__mbstowcs_chk': (None, (),
+        "__mbstowcs_chk = _libraries['/usr/lib/libmikmod.so'].__mbstowcs_chk\n"
+        '__mbstowcs_chk.restype = size_t\n'
+        '__mbstowcs_chk.argtypes = [WSTRING, STRING, size_t, size_t]'
+        ),
+    'mbstowcs': (None, (),
+        "mbstowcs = _libraries['/usr/lib/libmikmod.so'].mbstowcs\n"
+        'mbstowcs.restype = size_t\n'
+        'mbstowcs.argtypes = [WSTRING, STRING, size_t]'
+        ),
+    '__wcstombs_chk': (None, (),
+        "__wcstombs_chk = _libraries['/usr/lib/libmikmod.so'].__wcstombs_chk\n"
+        '__wcstombs_chk.restype = size_t\n'
+        '__wcstombs_chk.argtypes = [STRING, WSTRING, size_t, size_t]'
+        ),
+    'wcstombs': (None, (),
+        "wcstombs = _libraries['/usr/lib/libmikmod.so'].wcstombs\n"
+        'wcstombs.restype = size_t\n'
+        'wcstombs.argtypes = [STRING, WSTRING, size_t]'
+        ),
+    'sys_nerr': (None, (),
+        "sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libmikmod.so'], 'sys_nerr')"
+        ),
+    'sys_errlist': (None, (),
+        "sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libmikmod.so'], 'sys_errlist')"
+        ),
+    '_sys_nerr': (None, (),
+        "_sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libmikmod.so'], '_sys_nerr')"
+        ),
+    '_sys_errlist': (None, (),
+        "_sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libmikmod.so'], '_sys_errlist')"
+        ),
+    'timeval': ('Structure', (),
+        'timeval._fields_ = [\n'
+        "    ('tv_sec', __time_t),\n"
+        "    ('tv_usec', __suseconds_t),\n"
+        ']'
+        ),
+    '__fsid_t': ('Structure', (),
+        '__fsid_t._fields_ = [\n'
+        "    ('__val', c_int * 2),\n"
+        ']'
+        ),
+    'wait': ('Union', ('N4wait3DOT_6E', 'N4wait3DOT_7E'),
+        'wait._fields_ = [\n'
+        "    ('w_status', c_int),\n"
+        "    ('__wait_terminated', N4wait3DOT_6E),\n"
+        "    ('__wait_stopped', N4wait3DOT_7E),\n"
+        ']'
+        ),
+    'N4wait3DOT_6E': ('Structure', (),
+        'N4wait3DOT_6E._fields_ = [\n'
+        "    ('__w_termsig', c_uint, 7),\n"
+        "    ('__w_coredump', c_uint, 1),\n"
+        "    ('__w_retcode', c_uint, 8),\n"
+        "    ('', c_uint, 16),\n"
+        ']'
+        ),
+    'N4wait3DOT_7E': ('Structure', (),
+        'N4wait3DOT_7E._fields_ = [\n'
+        "    ('__w_stopval', c_uint, 8),\n"
+        "    ('__w_stopsig', c_uint, 8),\n"
+        "    ('', c_uint, 16),\n"
+        ']'
+        ),
+    '_IO_jump_t': ('Structure', (),
+        '_IO_jump_t._fields_ = [\n'
+        ']'
+        ),
+    '_IO_marker': ('Structure', ('_IO_FILE',),
+        '_IO_marker._fields_ = [\n'
+        "    ('_next', POINTER(_IO_marker)),\n"
+        "    ('_sbuf', POINTER(_IO_FILE)),\n"
+        "    ('_pos', c_int),\n"
+        ']'
+        ),
+    '_IO_FILE_plus': ('Structure', (),
+        '_IO_FILE_plus._fields_ = [\n'
+        ']'
+        ),
+    '_IO_2_1_stdin_': (None, ('_IO_FILE_plus',),
+        "_IO_2_1_stdin_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmikmod.so'], '_IO_2_1_stdin_')"
+        ),
+    '_IO_2_1_stdout_': (None, ('_IO_FILE_plus',),
+        "_IO_2_1_stdout_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmikmod.so'], '_IO_2_1_stdout_')"
+        ),
+    '_IO_2_1_stderr_': (None, ('_IO_FILE_plus',),
+        "_IO_2_1_stderr_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmikmod.so'], '_IO_2_1_stderr_')"
+        ),
+    '_IO_cookie_io_functions_t': ('Structure', (),
+        '_IO_cookie_io_functions_t._fields_ = [\n'
+        "    ('read', POINTER(__io_read_fn)),\n"
+        "    ('write', POINTER(__io_write_fn)),\n"
+        "    ('seek', POINTER(__io_seek_fn)),\n"
+        "    ('close', POINTER(__io_close_fn)),\n"
+        ']'
+        ),
+    'cookie_io_functions_t': (None, ('_IO_cookie_io_functions_t',),
+        'cookie_io_functions_t = _IO_cookie_io_functions_t'
+        ),
+    '_IO_cookie_file': ('Structure', (),
+        '_IO_cookie_file._fields_ = [\n'
+        ']'
+        ),
+    '__underflow': (None, ('_IO_FILE',),
+        "__underflow = _libraries['/usr/lib/libmikmod.so'].__underflow\n"
+        '__underflow.restype = c_int\n'
+        '__underflow.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '__uflow': (None, ('_IO_FILE',),
+        "__uflow = _libraries['/usr/lib/libmikmod.so'].__uflow\n"
+        '__uflow.restype = c_int\n'
+        '__uflow.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '__overflow': (None, ('_IO_FILE',),
+        "__overflow = _libraries['/usr/lib/libmikmod.so'].__overflow\n"
+        '__overflow.restype = c_int\n'
+        '__overflow.argtypes = [POINTER(_IO_FILE), c_int]'
+        ),
+    '_IO_getc': (None, ('_IO_FILE',),
+        "_IO_getc = _libraries['/usr/lib/libmikmod.so']._IO_getc\n"
+        '_IO_getc.restype = c_int\n'
+        '_IO_getc.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_putc': (None, ('_IO_FILE',),
+        "_IO_putc = _libraries['/usr/lib/libmikmod.so']._IO_putc\n"
+        '_IO_putc.restype = c_int\n'
+        '_IO_putc.argtypes = [c_int, POINTER(_IO_FILE)]'
+        ),
+    '_IO_feof': (None, ('_IO_FILE',),
+        "_IO_feof = _libraries['/usr/lib/libmikmod.so']._IO_feof\n"
+        '_IO_feof.restype = c_int\n'
+        '_IO_feof.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_ferror': (None, ('_IO_FILE',),
+        "_IO_ferror = _libraries['/usr/lib/libmikmod.so']._IO_ferror\n"
+        '_IO_ferror.restype = c_int\n'
+        '_IO_ferror.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_peekc_locked': (None, ('_IO_FILE',),
+        "_IO_peekc_locked = _libraries['/usr/lib/libmikmod.so']._IO_peekc_locked\n"
+        '_IO_peekc_locked.restype = c_int\n'
+        '_IO_peekc_locked.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_flockfile': (None, ('_IO_FILE',),
+        "_IO_flockfile = _libraries['/usr/lib/libmikmod.so']._IO_flockfile\n"
+        '_IO_flockfile.restype = None\n'
+        '_IO_flockfile.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_funlockfile': (None, ('_IO_FILE',),
+        "_IO_funlockfile = _libraries['/usr/lib/libmikmod.so']._IO_funlockfile\n"
+        '_IO_funlockfile.restype = None\n'
+        '_IO_funlockfile.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_ftrylockfile': (None, ('_IO_FILE',),
+        "_IO_ftrylockfile = _libraries['/usr/lib/libmikmod.so']._IO_ftrylockfile\n"
+        '_IO_ftrylockfile.restype = c_int\n'
+        '_IO_ftrylockfile.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_vfscanf': (None, ('_IO_FILE', '__va_list_tag'),
+        "_IO_vfscanf = _libraries['/usr/lib/libmikmod.so']._IO_vfscanf\n"
+        '_IO_vfscanf.restype = c_int\n'
+        '_IO_vfscanf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag), POINTER(c_int)]'
+        ),
+    '_IO_vfprintf': (None, ('_IO_FILE', '__va_list_tag'),
+        "_IO_vfprintf = _libraries['/usr/lib/libmikmod.so']._IO_vfprintf\n"
+        '_IO_vfprintf.restype = c_int\n'
+        '_IO_vfprintf.argtypes = [POINTER(_IO_FILE), STRING, POINTER(__va_list_tag)]'
+        ),
+    '_IO_padn': (None, ('_IO_FILE',),
+        "_IO_padn = _libraries['/usr/lib/libmikmod.so']._IO_padn\n"
+        '_IO_padn.restype = __ssize_t\n'
+        '_IO_padn.argtypes = [POINTER(_IO_FILE), c_int, __ssize_t]'
+        ),
+    '_IO_sgetn': (None, ('_IO_FILE',),
+        "_IO_sgetn = _libraries['/usr/lib/libmikmod.so']._IO_sgetn\n"
+        '_IO_sgetn.restype = size_t\n'
+        '_IO_sgetn.argtypes = [POINTER(_IO_FILE), c_void_p, size_t]'
+        ),
+    '_IO_seekoff': (None, ('_IO_FILE',),
+        "_IO_seekoff = _libraries['/usr/lib/libmikmod.so']._IO_seekoff\n"
+        '_IO_seekoff.restype = __off64_t\n'
+        '_IO_seekoff.argtypes = [POINTER(_IO_FILE), __off64_t, c_int, c_int]'
+        ),
+    '_IO_seekpos': (None, ('_IO_FILE',),
+        "_IO_seekpos = _libraries['/usr/lib/libmikmod.so']._IO_seekpos\n"
+        '_IO_seekpos.restype = __off64_t\n'
+        '_IO_seekpos.argtypes = [POINTER(_IO_FILE), __off64_t, c_int]'
+        ),
+    '_IO_free_backup_area': (None, ('_IO_FILE',),
+        "_IO_free_backup_area = _libraries['/usr/lib/libmikmod.so']._IO_free_backup_area\n"
+        '_IO_free_backup_area.restype = None\n'
+        '_IO_free_backup_area.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    'MikMod_GetVersion': (None, (),
+        "MikMod_GetVersion = _libraries['/usr/lib/libmikmod.so'].MikMod_GetVersion\n"
+        'MikMod_GetVersion.restype = c_long\n'
+        'MikMod_GetVersion.argtypes = []'
+        ),
+    'MikMod_errno': (None, (),
+        "MikMod_errno = (c_int).in_dll(_libraries['/usr/lib/libmikmod.so'], 'MikMod_errno')"
+        ),
+    'MikMod_critical': (None, (),
+        "MikMod_critical = (BOOL).in_dll(_libraries['/usr/lib/libmikmod.so'], 'MikMod_critical')"
+        ),
+    'MikMod_strerror': (None, (),
+        "MikMod_strerror = _libraries['/usr/lib/libmikmod.so'].MikMod_strerror\n"
+        'MikMod_strerror.restype = STRING\n'
+        'MikMod_strerror.argtypes = [c_int]'
+        ),
+    'MikMod_RegisterErrorHandler': (None, (),
+        "MikMod_RegisterErrorHandler = _libraries['/usr/lib/libmikmod.so'].MikMod_RegisterErrorHandler\n"
+        'MikMod_RegisterErrorHandler.restype = MikMod_handler_t\n'
+        'MikMod_RegisterErrorHandler.argtypes = [MikMod_handler_t]'
+        ),
+    'MikMod_RegisterAllDrivers': (None, (),
+        "MikMod_RegisterAllDrivers = _libraries['/usr/lib/libmikmod.so'].MikMod_RegisterAllDrivers\n"
+        'MikMod_RegisterAllDrivers.restype = None\n'
+        'MikMod_RegisterAllDrivers.argtypes = []'
+        ),
+    'MikMod_InfoDriver': (None, (),
+        "MikMod_InfoDriver = _libraries['/usr/lib/libmikmod.so'].MikMod_InfoDriver\n"
+        'MikMod_InfoDriver.restype = STRING\n'
+        'MikMod_InfoDriver.argtypes = []'
+        ),
+    'MDRIVER': ('Structure', ('SAMPLE', 'SAMPLOAD'),
+        'MDRIVER._fields_ = [\n'
+        "    ('next', POINTER(MDRIVER)),\n"
+        "    ('Name', STRING),\n"
+        "    ('Version', STRING),\n"
+        "    ('HardVoiceLimit', UBYTE),\n"
+        "    ('SoftVoiceLimit', UBYTE),\n"
+        "    ('Alias', STRING),\n"
+        "    ('CmdLineHelp', STRING),\n"
+        "    ('CommandLine', CFUNCTYPE(None, STRING)),\n"
+        "    ('IsPresent', CFUNCTYPE(BOOL)),\n"
+        "    ('SampleLoad', CFUNCTYPE(SWORD, POINTER(SAMPLOAD), c_int)),\n"
+        "    ('SampleUnload', CFUNCTYPE(None, SWORD)),\n"
+        "    ('FreeSampleSpace', CFUNCTYPE(ULONG, c_int)),\n"
+        "    ('RealSampleLength', CFUNCTYPE(ULONG, c_int, POINTER(SAMPLE))),\n"
+        "    ('Init', CFUNCTYPE(c_int)),\n"
+        "    ('Exit', CFUNCTYPE(None)),\n"
+        "    ('Reset', CFUNCTYPE(c_int)),\n"
+        "    ('SetNumVoices', CFUNCTYPE(c_int)),\n"
+        "    ('PlayStart', CFUNCTYPE(c_int)),\n"
+        "    ('PlayStop', CFUNCTYPE(None)),\n"
+        "    ('Update', CFUNCTYPE(None)),\n"
+        "    ('Pause', CFUNCTYPE(None)),\n"
+        "    ('VoiceSetVolume', CFUNCTYPE(None, UBYTE, UWORD)),\n"
+        "    ('VoiceGetVolume', CFUNCTYPE(UWORD, UBYTE)),\n"
+        "    ('VoiceSetFrequency', CFUNCTYPE(None, UBYTE, ULONG)),\n"
+        "    ('VoiceGetFrequency', CFUNCTYPE(ULONG, UBYTE)),\n"
+        "    ('VoiceSetPanning', CFUNCTYPE(None, UBYTE, ULONG)),\n"
+        "    ('VoiceGetPanning', CFUNCTYPE(ULONG, UBYTE)),\n"
+        "    ('VoicePlay', CFUNCTYPE(None, UBYTE, SWORD, ULONG, ULONG, ULONG, ULONG, UWORD)),\n"
+        "    ('VoiceStop', CFUNCTYPE(None, UBYTE)),\n"
+        "    ('VoiceStopped', CFUNCTYPE(BOOL, UBYTE)),\n"
+        "    ('VoiceGetPosition', CFUNCTYPE(SLONG, UBYTE)),\n"
+        "    ('VoiceRealVolume', CFUNCTYPE(ULONG, UBYTE)),\n"
+        ']'
+        ),
+    'MikMod_RegisterDriver': (None, ('MDRIVER',),
+        "MikMod_RegisterDriver = _libraries['/usr/lib/libmikmod.so'].MikMod_RegisterDriver\n"
+        'MikMod_RegisterDriver.restype = None\n'
+        'MikMod_RegisterDriver.argtypes = [POINTER(MDRIVER)]'
+        ),
+    'MikMod_DriverFromAlias': (None, (),
+        "MikMod_DriverFromAlias = _libraries['/usr/lib/libmikmod.so'].MikMod_DriverFromAlias\n"
+        'MikMod_DriverFromAlias.restype = c_int\n'
+        'MikMod_DriverFromAlias.argtypes = [STRING]'
+        ),
+    'MikMod_DriverByOrdinal': (None, ('MDRIVER',),
+        "MikMod_DriverByOrdinal = _libraries['/usr/lib/libmikmod.so'].MikMod_DriverByOrdinal\n"
+        'MikMod_DriverByOrdinal.restype = POINTER(MDRIVER)\n'
+        'MikMod_DriverByOrdinal.argtypes = [c_int]'
+        ),
+    'MikMod_Init': (None, (),
+        "MikMod_Init = _libraries['/usr/lib/libmikmod.so'].MikMod_Init\n"
+        'MikMod_Init.restype = c_int\n'
+        'MikMod_Init.argtypes = [STRING]'
+        ),
+    'MikMod_Exit': (None, (),
+        "MikMod_Exit = _libraries['/usr/lib/libmikmod.so'].MikMod_Exit\n"
+        'MikMod_Exit.restype = None\n'
+        'MikMod_Exit.argtypes = []'
+        ),
+    'MikMod_Reset': (None, (),
+        "MikMod_Reset = _libraries['/usr/lib/libmikmod.so'].MikMod_Reset\n"
+        'MikMod_Reset.restype = c_int\n'
+        'MikMod_Reset.argtypes = [STRING]'
+        ),
+    'MikMod_SetNumVoices': (None, (),
+        "MikMod_SetNumVoices = _libraries['/usr/lib/libmikmod.so'].MikMod_SetNumVoices\n"
+        'MikMod_SetNumVoices.restype = c_int\n'
+        'MikMod_SetNumVoices.argtypes = [c_int, c_int]'
+        ),
+    'MikMod_Active': (None, (),
+        "MikMod_Active = _libraries['/usr/lib/libmikmod.so'].MikMod_Active\n"
+        'MikMod_Active.restype = BOOL\n'
+        'MikMod_Active.argtypes = []'
+        ),
+    'MikMod_EnableOutput': (None, (),
+        "MikMod_EnableOutput = _libraries['/usr/lib/libmikmod.so'].MikMod_EnableOutput\n"
+        'MikMod_EnableOutput.restype = c_int\n'
+        'MikMod_EnableOutput.argtypes = []'
+        ),
+    'MikMod_DisableOutput': (None, (),
+        "MikMod_DisableOutput = _libraries['/usr/lib/libmikmod.so'].MikMod_DisableOutput\n"
+        'MikMod_DisableOutput.restype = None\n'
+        'MikMod_DisableOutput.argtypes = []'
+        ),
+    'MikMod_Update': (None, (),
+        "MikMod_Update = _libraries['/usr/lib/libmikmod.so'].MikMod_Update\n"
+        'MikMod_Update.restype = None\n'
+        'MikMod_Update.argtypes = []'
+        ),
+    'MikMod_InitThreads': (None, (),
+        "MikMod_InitThreads = _libraries['/usr/lib/libmikmod.so'].MikMod_InitThreads\n"
+        'MikMod_InitThreads.restype = BOOL\n'
+        'MikMod_InitThreads.argtypes = []'
+        ),
+    'MikMod_Lock': (None, (),
+        "MikMod_Lock = _libraries['/usr/lib/libmikmod.so'].MikMod_Lock\n"
+        'MikMod_Lock.restype = None\n'
+        'MikMod_Lock.argtypes = []'
+        ),
+    'MikMod_Unlock': (None, (),
+        "MikMod_Unlock = _libraries['/usr/lib/libmikmod.so'].MikMod_Unlock\n"
+        'MikMod_Unlock.restype = None\n'
+        'MikMod_Unlock.argtypes = []'
+        ),
+    'MikMod_malloc': (None, (),
+        "MikMod_malloc = _libraries['/usr/lib/libmikmod.so'].MikMod_malloc\n"
+        'MikMod_malloc.restype = c_void_p\n'
+        'MikMod_malloc.argtypes = [size_t]'
+        ),
+    'MikMod_calloc': (None, (),
+        "MikMod_calloc = _libraries['/usr/lib/libmikmod.so'].MikMod_calloc\n"
+        'MikMod_calloc.restype = c_void_p\n'
+        'MikMod_calloc.argtypes = [size_t, size_t]'
+        ),
+    'MikMod_realloc': (None, (),
+        "MikMod_realloc = _libraries['/usr/lib/libmikmod.so'].MikMod_realloc\n"
+        'MikMod_realloc.restype = c_void_p\n'
+        'MikMod_realloc.argtypes = [c_void_p, size_t]'
+        ),
+    'MikMod_strdup': (None, (),
+        "MikMod_strdup = _libraries['/usr/lib/libmikmod.so'].MikMod_strdup\n"
+        'MikMod_strdup.restype = STRING\n'
+        'MikMod_strdup.argtypes = [STRING]'
+        ),
+    'MikMod_free': (None, (),
+        "MikMod_free = _libraries['/usr/lib/libmikmod.so'].MikMod_free\n"
+        'MikMod_free.restype = None\n'
+        'MikMod_free.argtypes = [c_void_p]'
+        ),
+    'MREADER': ('Structure', (),
+        'MREADER._fields_ = [\n'
+        "    ('Seek', CFUNCTYPE(c_int, POINTER(MREADER), c_long, c_int)),\n"
+        "    ('Tell', CFUNCTYPE(c_long, POINTER(MREADER))),\n"
+        "    ('Read', CFUNCTYPE(BOOL, POINTER(MREADER), c_void_p, size_t)),\n"
+        "    ('Get', CFUNCTYPE(c_int, POINTER(MREADER))),\n"
+        "    ('Eof', CFUNCTYPE(BOOL, POINTER(MREADER))),\n"
+        "    ('iobase', c_long),\n"
+        "    ('prev_iobase', c_long),\n"
+        ']'
+        ),
+    'MWRITER': ('Structure', (),
+        'MWRITER._fields_ = [\n'
+        "    ('Seek', CFUNCTYPE(c_int, POINTER(MWRITER), c_long, c_int)),\n"
+        "    ('Tell', CFUNCTYPE(c_long, POINTER(MWRITER))),\n"
+        "    ('Write', CFUNCTYPE(BOOL, POINTER(MWRITER), c_void_p, size_t)),\n"
+        "    ('Put', CFUNCTYPE(c_int, POINTER(MWRITER), c_int)),\n"
+        ']'
+        ),
+    'SAMPLE': ('Structure', (),
+        'SAMPLE._fields_ = [\n'
+        "    ('panning', SWORD),\n"
+        "    ('speed', ULONG),\n"
+        "    ('volume', UBYTE),\n"
+        "    ('inflags', UWORD),\n"
+        "    ('flags', UWORD),\n"
+        "    ('length', ULONG),\n"
+        "    ('loopstart', ULONG),\n"
+        "    ('loopend', ULONG),\n"
+        "    ('susbegin', ULONG),\n"
+        "    ('susend', ULONG),\n"
+        "    ('globvol', UBYTE),\n"
+        "    ('vibflags', UBYTE),\n"
+        "    ('vibtype', UBYTE),\n"
+        "    ('vibsweep', UBYTE),\n"
+        "    ('vibdepth', UBYTE),\n"
+        "    ('vibrate', UBYTE),\n"
+        "    ('samplename', STRING),\n"
+        "    ('avibpos', UWORD),\n"
+        "    ('divfactor', UBYTE),\n"
+        "    ('seekpos', ULONG),\n"
+        "    ('handle', SWORD),\n"
+        "    ('onfree', CFUNCTYPE(None, c_void_p)),\n"
+        "    ('ctx', c_void_p),\n"
+        ']'
+        ),
+    'Sample_LoadRaw': (None, ('SAMPLE',),
+        "Sample_LoadRaw = _libraries['/usr/lib/libmikmod.so'].Sample_LoadRaw\n"
+        'Sample_LoadRaw.restype = POINTER(SAMPLE)\n'
+        'Sample_LoadRaw.argtypes = [STRING, ULONG, ULONG, ULONG]'
+        ),
+    'Sample_LoadRawFP': (None, ('FILE', 'SAMPLE'),
+        "Sample_LoadRawFP = _libraries['/usr/lib/libmikmod.so'].Sample_LoadRawFP\n"
+        'Sample_LoadRawFP.restype = POINTER(SAMPLE)\n'
+        'Sample_LoadRawFP.argtypes = [POINTER(FILE), ULONG, ULONG, ULONG]'
+        ),
+    'Sample_LoadRawMem': (None, ('SAMPLE',),
+        "Sample_LoadRawMem = _libraries['/usr/lib/libmikmod.so'].Sample_LoadRawMem\n"
+        'Sample_LoadRawMem.restype = POINTER(SAMPLE)\n'
+        'Sample_LoadRawMem.argtypes = [STRING, c_int, ULONG, ULONG, ULONG]'
+        ),
+    'Sample_LoadRawGeneric': (None, ('MREADER', 'SAMPLE'),
+        "Sample_LoadRawGeneric = _libraries['/usr/lib/libmikmod.so'].Sample_LoadRawGeneric\n"
+        'Sample_LoadRawGeneric.restype = POINTER(SAMPLE)\n'
+        'Sample_LoadRawGeneric.argtypes = [POINTER(MREADER), ULONG, ULONG, ULONG]'
+        ),
+    'Sample_Load': (None, ('SAMPLE',),
+        "Sample_Load = _libraries['/usr/lib/libmikmod.so'].Sample_Load\n"
+        'Sample_Load.restype = POINTER(SAMPLE)\n'
+        'Sample_Load.argtypes = [STRING]'
+        ),
+    'Sample_LoadFP': (None, ('FILE', 'SAMPLE'),
+        "Sample_LoadFP = _libraries['/usr/lib/libmikmod.so'].Sample_LoadFP\n"
+        'Sample_LoadFP.restype = POINTER(SAMPLE)\n'
+        'Sample_LoadFP.argtypes = [POINTER(FILE)]'
+        ),
+    'Sample_LoadMem': (None, ('SAMPLE',),
+        "Sample_LoadMem = _libraries['/usr/lib/libmikmod.so'].Sample_LoadMem\n"
+        'Sample_LoadMem.restype = POINTER(SAMPLE)\n'
+        'Sample_LoadMem.argtypes = [STRING, c_int]'
+        ),
+    'Sample_LoadGeneric': (None, ('MREADER', 'SAMPLE'),
+        "Sample_LoadGeneric = _libraries['/usr/lib/libmikmod.so'].Sample_LoadGeneric\n"
+        'Sample_LoadGeneric.restype = POINTER(SAMPLE)\n'
+        'Sample_LoadGeneric.argtypes = [POINTER(MREADER)]'
+        ),
+    'Sample_Free': (None, ('SAMPLE',),
+        "Sample_Free = _libraries['/usr/lib/libmikmod.so'].Sample_Free\n"
+        'Sample_Free.restype = None\n'
+        'Sample_Free.argtypes = [POINTER(SAMPLE)]'
+        ),
+    'Sample_Play': (None, ('SAMPLE',),
+        "Sample_Play = _libraries['/usr/lib/libmikmod.so'].Sample_Play\n"
+        'Sample_Play.restype = SBYTE\n'
+        'Sample_Play.argtypes = [POINTER(SAMPLE), ULONG, UBYTE]'
+        ),
+    'Voice_SetVolume': (None, (),
+        "Voice_SetVolume = _libraries['/usr/lib/libmikmod.so'].Voice_SetVolume\n"
+        'Voice_SetVolume.restype = None\n'
+        'Voice_SetVolume.argtypes = [SBYTE, UWORD]'
+        ),
+    'Voice_GetVolume': (None, (),
+        "Voice_GetVolume = _libraries['/usr/lib/libmikmod.so'].Voice_GetVolume\n"
+        'Voice_GetVolume.restype = UWORD\n'
+        'Voice_GetVolume.argtypes = [SBYTE]'
+        ),
+    'Voice_SetFrequency': (None, (),
+        "Voice_SetFrequency = _libraries['/usr/lib/libmikmod.so'].Voice_SetFrequency\n"
+        'Voice_SetFrequency.restype = None\n'
+        'Voice_SetFrequency.argtypes = [SBYTE, ULONG]'
+        ),
+    'Voice_GetFrequency': (None, (),
+        "Voice_GetFrequency = _libraries['/usr/lib/libmikmod.so'].Voice_GetFrequency\n"
+        'Voice_GetFrequency.restype = ULONG\n'
+        'Voice_GetFrequency.argtypes = [SBYTE]'
+        ),
+    'Voice_SetPanning': (None, (),
+        "Voice_SetPanning = _libraries['/usr/lib/libmikmod.so'].Voice_SetPanning\n"
+        'Voice_SetPanning.restype = None\n'
+        'Voice_SetPanning.argtypes = [SBYTE, ULONG]'
+        ),
+    'Voice_GetPanning': (None, (),
+        "Voice_GetPanning = _libraries['/usr/lib/libmikmod.so'].Voice_GetPanning\n"
+        'Voice_GetPanning.restype = ULONG\n'
+        'Voice_GetPanning.argtypes = [SBYTE]'
+        ),
+    'Voice_Play': (None, ('SAMPLE',),
+        "Voice_Play = _libraries['/usr/lib/libmikmod.so'].Voice_Play\n"
+        'Voice_Play.restype = None\n'
+        'Voice_Play.argtypes = [SBYTE, POINTER(SAMPLE), ULONG]'
+        ),
+    'Voice_Stop': (None, (),
+        "Voice_Stop = _libraries['/usr/lib/libmikmod.so'].Voice_Stop\n"
+        'Voice_Stop.restype = None\n'
+        'Voice_Stop.argtypes = [SBYTE]'
+        ),
+    'Voice_Stopped': (None, (),
+        "Voice_Stopped = _libraries['/usr/lib/libmikmod.so'].Voice_Stopped\n"
+        'Voice_Stopped.restype = BOOL\n'
+        'Voice_Stopped.argtypes = [SBYTE]'
+        ),
+    'Voice_GetPosition': (None, (),
+        "Voice_GetPosition = _libraries['/usr/lib/libmikmod.so'].Voice_GetPosition\n"
+        'Voice_GetPosition.restype = SLONG\n'
+        'Voice_GetPosition.argtypes = [SBYTE]'
+        ),
+    'Voice_RealVolume': (None, (),
+        "Voice_RealVolume = _libraries['/usr/lib/libmikmod.so'].Voice_RealVolume\n"
+        'Voice_RealVolume.restype = ULONG\n'
+        'Voice_RealVolume.argtypes = [SBYTE]'
+        ),
+    'ENVPT': ('Structure', (),
+        'ENVPT._fields_ = [\n'
+        "    ('pos', SWORD),\n"
+        "    ('val', SWORD),\n"
+        ']'
+        ),
+    'INSTRUMENT': ('Structure', ('ENVPT',),
+        'INSTRUMENT._fields_ = [\n'
+        "    ('insname', STRING),\n"
+        "    ('flags', UBYTE),\n"
+        "    ('samplenumber', UWORD * 120),\n"
+        "    ('samplenote', UBYTE * 120),\n"
+        "    ('nnatype', UBYTE),\n"
+        "    ('dca', UBYTE),\n"
+        "    ('dct', UBYTE),\n"
+        "    ('globvol', UBYTE),\n"
+        "    ('volfade', UWORD),\n"
+        "    ('panning', SWORD),\n"
+        "    ('pitpansep', UBYTE),\n"
+        "    ('pitpancenter', UBYTE),\n"
+        "    ('rvolvar', UBYTE),\n"
+        "    ('rpanvar', UBYTE),\n"
+        "    ('volflg', UBYTE),\n"
+        "    ('volpts', UBYTE),\n"
+        "    ('volsusbeg', UBYTE),\n"
+        "    ('volsusend', UBYTE),\n"
+        "    ('volbeg', UBYTE),\n"
+        "    ('volend', UBYTE),\n"
+        "    ('volenv', ENVPT * 32),\n"
+        "    ('panflg', UBYTE),\n"
+        "    ('panpts', UBYTE),\n"
+        "    ('pansusbeg', UBYTE),\n"
+        "    ('pansusend', UBYTE),\n"
+        "    ('panbeg', UBYTE),\n"
+        "    ('panend', UBYTE),\n"
+        "    ('panenv', ENVPT * 32),\n"
+        "    ('pitflg', UBYTE),\n"
+        "    ('pitpts', UBYTE),\n"
+        "    ('pitsusbeg', UBYTE),\n"
+        "    ('pitsusend', UBYTE),\n"
+        "    ('pitbeg', UBYTE),\n"
+        "    ('pitend', UBYTE),\n"
+        "    ('pitenv', ENVPT * 32),\n"
+        ']'
+        ),
+    'MP_CONTROL': ('Structure', (),
+        'MP_CONTROL._fields_ = [\n'
+        ']'
+        ),
+    'MP_VOICE': ('Structure', (),
+        'MP_VOICE._fields_ = [\n'
+        ']'
+        ),
+    'MODULE': ('Structure', ('INSTRUMENT', 'MP_CONTROL', 'MP_VOICE', 'SAMPLE'),
+        'MODULE._fields_ = [\n'
+        "    ('songname', STRING),\n"
+        "    ('modtype', STRING),\n"
+        "    ('comment', STRING),\n"
+        "    ('flags', UWORD),\n"
+        "    ('numchn', UBYTE),\n"
+        "    ('numvoices', UBYTE),\n"
+        "    ('numpos', UWORD),\n"
+        "    ('numpat', UWORD),\n"
+        "    ('numins', UWORD),\n"
+        "    ('numsmp', UWORD),\n"
+        "    ('instruments', POINTER(INSTRUMENT)),\n"
+        "    ('samples', POINTER(SAMPLE)),\n"
+        "    ('realchn', UBYTE),\n"
+        "    ('totalchn', UBYTE),\n"
+        "    ('reppos', UWORD),\n"
+        "    ('initspeed', UBYTE),\n"
+        "    ('inittempo', UWORD),\n"
+        "    ('initvolume', UBYTE),\n"
+        "    ('panning', UWORD * 64),\n"
+        "    ('chanvol', UBYTE * 64),\n"
+        "    ('bpm', UWORD),\n"
+        "    ('sngspd', UWORD),\n"
+        "    ('volume', SWORD),\n"
+        "    ('extspd', BOOL),\n"
+        "    ('panflag', BOOL),\n"
+        "    ('wrap', BOOL),\n"
+        "    ('loop', BOOL),\n"
+        "    ('fadeout', BOOL),\n"
+        "    ('patpos', UWORD),\n"
+        "    ('sngpos', SWORD),\n"
+        "    ('sngtime', ULONG),\n"
+        "    ('relspd', SWORD),\n"
+        "    ('numtrk', UWORD),\n"
+        "    ('tracks', POINTER(POINTER(UBYTE))),\n"
+        "    ('patterns', POINTER(UWORD)),\n"
+        "    ('pattrows', POINTER(UWORD)),\n"
+        "    ('positions', POINTER(UWORD)),\n"
+        "    ('forbid', BOOL),\n"
+        "    ('numrow', UWORD),\n"
+        "    ('vbtick', UWORD),\n"
+        "    ('sngremainder', UWORD),\n"
+        "    ('control', POINTER(MP_CONTROL)),\n"
+        "    ('voice', POINTER(MP_VOICE)),\n"
+        "    ('globalslide', UBYTE),\n"
+        "    ('pat_repcrazy', UBYTE),\n"
+        "    ('patbrk', UWORD),\n"
+        "    ('patdly', UBYTE),\n"
+        "    ('patdly2', UBYTE),\n"
+        "    ('posjmp', SWORD),\n"
+        "    ('bpmlimit', UWORD),\n"
+        ']'
+        ),
+    'VOICEINFO': ('Structure', ('INSTRUMENT', 'SAMPLE'),
+        'VOICEINFO._fields_ = [\n'
+        "    ('i', POINTER(INSTRUMENT)),\n"
+        "    ('s', POINTER(SAMPLE)),\n"
+        "    ('panning', SWORD),\n"
+        "    ('volume', SBYTE),\n"
+        "    ('period', UWORD),\n"
+        "    ('kick', UBYTE),\n"
+        ']'
+        ),
+    'MLOADER': ('Structure', (),
+        'MLOADER._fields_ = [\n'
+        ']'
+        ),
+    'MikMod_InfoLoader': (None, (),
+        "MikMod_InfoLoader = _libraries['/usr/lib/libmikmod.so'].MikMod_InfoLoader\n"
+        'MikMod_InfoLoader.restype = STRING\n'
+        'MikMod_InfoLoader.argtypes = []'
+        ),
+    'MikMod_RegisterAllLoaders': (None, (),
+        "MikMod_RegisterAllLoaders = _libraries['/usr/lib/libmikmod.so'].MikMod_RegisterAllLoaders\n"
+        'MikMod_RegisterAllLoaders.restype = None\n'
+        'MikMod_RegisterAllLoaders.argtypes = []'
+        ),
+    'MikMod_RegisterLoader': (None, ('MLOADER',),
+        "MikMod_RegisterLoader = _libraries['/usr/lib/libmikmod.so'].MikMod_RegisterLoader\n"
+        'MikMod_RegisterLoader.restype = None\n'
+        'MikMod_RegisterLoader.argtypes = [POINTER(MLOADER)]'
+        ),
+    'load_669': (None, ('MLOADER',),
+        "load_669 = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_669')"
+        ),
+    'load_amf': (None, ('MLOADER',),
+        "load_amf = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_amf')"
+        ),
+    'load_asy': (None, ('MLOADER',),
+        "load_asy = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_asy')"
+        ),
+    'load_dsm': (None, ('MLOADER',),
+        "load_dsm = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_dsm')"
+        ),
+    'load_far': (None, ('MLOADER',),
+        "load_far = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_far')"
+        ),
+    'load_gdm': (None, ('MLOADER',),
+        "load_gdm = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_gdm')"
+        ),
+    'load_gt2': (None, ('MLOADER',),
+        "load_gt2 = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_gt2')"
+        ),
+    'load_it': (None, ('MLOADER',),
+        "load_it = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_it')"
+        ),
+    'load_imf': (None, ('MLOADER',),
+        "load_imf = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_imf')"
+        ),
+    'load_med': (None, ('MLOADER',),
+        "load_med = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_med')"
+        ),
+    'load_m15': (None, ('MLOADER',),
+        "load_m15 = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_m15')"
+        ),
+    'load_mod': (None, ('MLOADER',),
+        "load_mod = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_mod')"
+        ),
+    'load_mtm': (None, ('MLOADER',),
+        "load_mtm = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_mtm')"
+        ),
+    'load_okt': (None, ('MLOADER',),
+        "load_okt = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_okt')"
+        ),
+    'load_stm': (None, ('MLOADER',),
+        "load_stm = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_stm')"
+        ),
+    'load_stx': (None, ('MLOADER',),
+        "load_stx = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_stx')"
+        ),
+    'load_s3m': (None, ('MLOADER',),
+        "load_s3m = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_s3m')"
+        ),
+    'load_ult': (None, ('MLOADER',),
+        "load_ult = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_ult')"
+        ),
+    'load_umx': (None, ('MLOADER',),
+        "load_umx = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_umx')"
+        ),
+    'load_uni': (None, ('MLOADER',),
+        "load_uni = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_uni')"
+        ),
+    'load_xm': (None, ('MLOADER',),
+        "load_xm = (MLOADER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'load_xm')"
+        ),
+    'Player_Load': (None, ('MODULE',),
+        "Player_Load = _libraries['/usr/lib/libmikmod.so'].Player_Load\n"
+        'Player_Load.restype = POINTER(MODULE)\n'
+        'Player_Load.argtypes = [STRING, c_int, BOOL]'
+        ),
+    'Player_LoadFP': (None, ('FILE', 'MODULE'),
+        "Player_LoadFP = _libraries['/usr/lib/libmikmod.so'].Player_LoadFP\n"
+        'Player_LoadFP.restype = POINTER(MODULE)\n'
+        'Player_LoadFP.argtypes = [POINTER(FILE), c_int, BOOL]'
+        ),
+    'Player_LoadMem': (None, ('MODULE',),
+        "Player_LoadMem = _libraries['/usr/lib/libmikmod.so'].Player_LoadMem\n"
+        'Player_LoadMem.restype = POINTER(MODULE)\n'
+        'Player_LoadMem.argtypes = [STRING, c_int, c_int, BOOL]'
+        ),
+    'Player_LoadGeneric': (None, ('MODULE', 'MREADER'),
+        "Player_LoadGeneric = _libraries['/usr/lib/libmikmod.so'].Player_LoadGeneric\n"
+        'Player_LoadGeneric.restype = POINTER(MODULE)\n'
+        'Player_LoadGeneric.argtypes = [POINTER(MREADER), c_int, BOOL]'
+        ),
+    'Player_LoadTitle': (None, (),
+        "Player_LoadTitle = _libraries['/usr/lib/libmikmod.so'].Player_LoadTitle\n"
+        'Player_LoadTitle.restype = STRING\n'
+        'Player_LoadTitle.argtypes = [STRING]'
+        ),
+    'Player_LoadTitleFP': (None, ('FILE',),
+        "Player_LoadTitleFP = _libraries['/usr/lib/libmikmod.so'].Player_LoadTitleFP\n"
+        'Player_LoadTitleFP.restype = STRING\n'
+        'Player_LoadTitleFP.argtypes = [POINTER(FILE)]'
+        ),
+    'Player_LoadTitleMem': (None, (),
+        "Player_LoadTitleMem = _libraries['/usr/lib/libmikmod.so'].Player_LoadTitleMem\n"
+        'Player_LoadTitleMem.restype = STRING\n'
+        'Player_LoadTitleMem.argtypes = [STRING, c_int]'
+        ),
+    'Player_LoadTitleGeneric': (None, ('MREADER',),
+        "Player_LoadTitleGeneric = _libraries['/usr/lib/libmikmod.so'].Player_LoadTitleGeneric\n"
+        'Player_LoadTitleGeneric.restype = STRING\n'
+        'Player_LoadTitleGeneric.argtypes = [POINTER(MREADER)]'
+        ),
+    'Player_Free': (None, ('MODULE',),
+        "Player_Free = _libraries['/usr/lib/libmikmod.so'].Player_Free\n"
+        'Player_Free.restype = None\n'
+        'Player_Free.argtypes = [POINTER(MODULE)]'
+        ),
+    'Player_Start': (None, ('MODULE',),
+        "Player_Start = _libraries['/usr/lib/libmikmod.so'].Player_Start\n"
+        'Player_Start.restype = None\n'
+        'Player_Start.argtypes = [POINTER(MODULE)]'
+        ),
+    'Player_Active': (None, (),
+        "Player_Active = _libraries['/usr/lib/libmikmod.so'].Player_Active\n"
+        'Player_Active.restype = BOOL\n'
+        'Player_Active.argtypes = []'
+        ),
+    'Player_Stop': (None, (),
+        "Player_Stop = _libraries['/usr/lib/libmikmod.so'].Player_Stop\n"
+        'Player_Stop.restype = None\n'
+        'Player_Stop.argtypes = []'
+        ),
+    'Player_TogglePause': (None, (),
+        "Player_TogglePause = _libraries['/usr/lib/libmikmod.so'].Player_TogglePause\n"
+        'Player_TogglePause.restype = None\n'
+        'Player_TogglePause.argtypes = []'
+        ),
+    'Player_Paused': (None, (),
+        "Player_Paused = _libraries['/usr/lib/libmikmod.so'].Player_Paused\n"
+        'Player_Paused.restype = BOOL\n'
+        'Player_Paused.argtypes = []'
+        ),
+    'Player_NextPosition': (None, (),
+        "Player_NextPosition = _libraries['/usr/lib/libmikmod.so'].Player_NextPosition\n"
+        'Player_NextPosition.restype = None\n'
+        'Player_NextPosition.argtypes = []'
+        ),
+    'Player_PrevPosition': (None, (),
+        "Player_PrevPosition = _libraries['/usr/lib/libmikmod.so'].Player_PrevPosition\n"
+        'Player_PrevPosition.restype = None\n'
+        'Player_PrevPosition.argtypes = []'
+        ),
+    'Player_SetPosition': (None, (),
+        "Player_SetPosition = _libraries['/usr/lib/libmikmod.so'].Player_SetPosition\n"
+        'Player_SetPosition.restype = None\n'
+        'Player_SetPosition.argtypes = [UWORD]'
+        ),
+    'Player_Muted': (None, (),
+        "Player_Muted = _libraries['/usr/lib/libmikmod.so'].Player_Muted\n"
+        'Player_Muted.restype = BOOL\n'
+        'Player_Muted.argtypes = [UBYTE]'
+        ),
+    'Player_SetVolume': (None, (),
+        "Player_SetVolume = _libraries['/usr/lib/libmikmod.so'].Player_SetVolume\n"
+        'Player_SetVolume.restype = None\n'
+        'Player_SetVolume.argtypes = [SWORD]'
+        ),
+    'Player_GetModule': (None, ('MODULE',),
+        "Player_GetModule = _libraries['/usr/lib/libmikmod.so'].Player_GetModule\n"
+        'Player_GetModule.restype = POINTER(MODULE)\n'
+        'Player_GetModule.argtypes = []'
+        ),
+    'Player_SetSpeed': (None, (),
+        "Player_SetSpeed = _libraries['/usr/lib/libmikmod.so'].Player_SetSpeed\n"
+        'Player_SetSpeed.restype = None\n'
+        'Player_SetSpeed.argtypes = [UWORD]'
+        ),
+    'Player_SetTempo': (None, (),
+        "Player_SetTempo = _libraries['/usr/lib/libmikmod.so'].Player_SetTempo\n"
+        'Player_SetTempo.restype = None\n'
+        'Player_SetTempo.argtypes = [UWORD]'
+        ),
+    'Player_Unmute': (None, (),
+        "Player_Unmute = _libraries['/usr/lib/libmikmod.so'].Player_Unmute\n"
+        'Player_Unmute.restype = None\n'
+        'Player_Unmute.argtypes = [SLONG]'
+        ),
+    'Player_Mute': (None, (),
+        "Player_Mute = _libraries['/usr/lib/libmikmod.so'].Player_Mute\n"
+        'Player_Mute.restype = None\n'
+        'Player_Mute.argtypes = [SLONG]'
+        ),
+    'Player_ToggleMute': (None, (),
+        "Player_ToggleMute = _libraries['/usr/lib/libmikmod.so'].Player_ToggleMute\n"
+        'Player_ToggleMute.restype = None\n'
+        'Player_ToggleMute.argtypes = [SLONG]'
+        ),
+    'Player_GetChannelVoice': (None, (),
+        "Player_GetChannelVoice = _libraries['/usr/lib/libmikmod.so'].Player_GetChannelVoice\n"
+        'Player_GetChannelVoice.restype = c_int\n'
+        'Player_GetChannelVoice.argtypes = [UBYTE]'
+        ),
+    'Player_GetChannelPeriod': (None, (),
+        "Player_GetChannelPeriod = _libraries['/usr/lib/libmikmod.so'].Player_GetChannelPeriod\n"
+        'Player_GetChannelPeriod.restype = UWORD\n'
+        'Player_GetChannelPeriod.argtypes = [UBYTE]'
+        ),
+    'Player_QueryVoices': (None, ('VOICEINFO',),
+        "Player_QueryVoices = _libraries['/usr/lib/libmikmod.so'].Player_QueryVoices\n"
+        'Player_QueryVoices.restype = c_int\n'
+        'Player_QueryVoices.argtypes = [UWORD, POINTER(VOICEINFO)]'
+        ),
+    'Player_GetRow': (None, (),
+        "Player_GetRow = _libraries['/usr/lib/libmikmod.so'].Player_GetRow\n"
+        'Player_GetRow.restype = c_int\n'
+        'Player_GetRow.argtypes = []'
+        ),
+    'Player_GetOrder': (None, (),
+        "Player_GetOrder = _libraries['/usr/lib/libmikmod.so'].Player_GetOrder\n"
+        'Player_GetOrder.restype = c_int\n'
+        'Player_GetOrder.argtypes = []'
+        ),
+    'MikMod_RegisterPlayer': (None, (),
+        "MikMod_RegisterPlayer = _libraries['/usr/lib/libmikmod.so'].MikMod_RegisterPlayer\n"
+        'MikMod_RegisterPlayer.restype = MikMod_player_t\n'
+        'MikMod_RegisterPlayer.argtypes = [MikMod_player_t]'
+        ),
+    'SAMPLOAD': ('Structure', (),
+        'SAMPLOAD._fields_ = [\n'
+        ']'
+        ),
+    'md_volume': (None, (),
+        "md_volume = (UBYTE).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_volume')"
+        ),
+    'md_musicvolume': (None, (),
+        "md_musicvolume = (UBYTE).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_musicvolume')"
+        ),
+    'md_sndfxvolume': (None, (),
+        "md_sndfxvolume = (UBYTE).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_sndfxvolume')"
+        ),
+    'md_reverb': (None, (),
+        "md_reverb = (UBYTE).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_reverb')"
+        ),
+    'md_pansep': (None, (),
+        "md_pansep = (UBYTE).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_pansep')"
+        ),
+    'md_device': (None, (),
+        "md_device = (UWORD).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_device')"
+        ),
+    'md_mixfreq': (None, (),
+        "md_mixfreq = (UWORD).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_mixfreq')"
+        ),
+    'md_mode': (None, (),
+        "md_mode = (UWORD).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_mode')"
+        ),
+    'md_driver': (None, ('MDRIVER',),
+        "md_driver = (POINTER(MDRIVER)).in_dll(_libraries['/usr/lib/libmikmod.so'], 'md_driver')"
+        ),
+    'drv_nos': (None, ('MDRIVER',),
+        "drv_nos = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_nos')"
+        ),
+    'drv_pipe': (None, ('MDRIVER',),
+        "drv_pipe = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_pipe')"
+        ),
+    'drv_raw': (None, ('MDRIVER',),
+        "drv_raw = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_raw')"
+        ),
+    'drv_stdout': (None, ('MDRIVER',),
+        "drv_stdout = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_stdout')"
+        ),
+    'drv_wav': (None, ('MDRIVER',),
+        "drv_wav = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_wav')"
+        ),
+    'drv_aiff': (None, ('MDRIVER',),
+        "drv_aiff = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_aiff')"
+        ),
+    'drv_ultra': (None, ('MDRIVER',),
+        "drv_ultra = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_ultra')"
+        ),
+    'drv_sam9407': (None, ('MDRIVER',),
+        "drv_sam9407 = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_sam9407')"
+        ),
+    'drv_AF': (None, ('MDRIVER',),
+        "drv_AF = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_AF')"
+        ),
+    'drv_aix': (None, ('MDRIVER',),
+        "drv_aix = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_aix')"
+        ),
+    'drv_alsa': (None, ('MDRIVER',),
+        "drv_alsa = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_alsa')"
+        ),
+    'drv_esd': (None, ('MDRIVER',),
+        "drv_esd = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_esd')"
+        ),
+    'drv_pulseaudio': (None, ('MDRIVER',),
+        "drv_pulseaudio = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_pulseaudio')"
+        ),
+    'drv_hp': (None, ('MDRIVER',),
+        "drv_hp = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_hp')"
+        ),
+    'drv_nas': (None, ('MDRIVER',),
+        "drv_nas = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_nas')"
+        ),
+    'drv_oss': (None, ('MDRIVER',),
+        "drv_oss = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_oss')"
+        ),
+    'drv_openal': (None, ('MDRIVER',),
+        "drv_openal = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_openal')"
+        ),
+    'drv_sdl': (None, ('MDRIVER',),
+        "drv_sdl = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_sdl')"
+        ),
+    'drv_sgi': (None, ('MDRIVER',),
+        "drv_sgi = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_sgi')"
+        ),
+    'drv_sun': (None, ('MDRIVER',),
+        "drv_sun = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_sun')"
+        ),
+    'drv_dart': (None, ('MDRIVER',),
+        "drv_dart = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_dart')"
+        ),
+    'drv_os2': (None, ('MDRIVER',),
+        "drv_os2 = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_os2')"
+        ),
+    'drv_ds': (None, ('MDRIVER',),
+        "drv_ds = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_ds')"
+        ),
+    'drv_xaudio2': (None, ('MDRIVER',),
+        "drv_xaudio2 = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_xaudio2')"
+        ),
+    'drv_win': (None, ('MDRIVER',),
+        "drv_win = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_win')"
+        ),
+    'drv_mac': (None, ('MDRIVER',),
+        "drv_mac = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_mac')"
+        ),
+    'drv_osx': (None, ('MDRIVER',),
+        "drv_osx = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_osx')"
+        ),
+    'drv_gp32': (None, ('MDRIVER',),
+        "drv_gp32 = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_gp32')"
+        ),
+    'drv_wss': (None, ('MDRIVER',),
+        "drv_wss = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_wss')"
+        ),
+    'drv_sb': (None, ('MDRIVER',),
+        "drv_sb = (MDRIVER).in_dll(_libraries['/usr/lib/libmikmod.so'], 'drv_sb')"
+        ),
+    'VC_Init': (None, (),
+        "VC_Init = _libraries['/usr/lib/libmikmod.so'].VC_Init\n"
+        'VC_Init.restype = c_int\n'
+        'VC_Init.argtypes = []'
+        ),
+    'VC_Exit': (None, (),
+        "VC_Exit = _libraries['/usr/lib/libmikmod.so'].VC_Exit\n"
+        'VC_Exit.restype = None\n'
+        'VC_Exit.argtypes = []'
+        ),
+    'VC_SetCallback': (None, (),
+        "VC_SetCallback = _libraries['/usr/lib/libmikmod.so'].VC_SetCallback\n"
+        'VC_SetCallback.restype = None\n'
+        'VC_SetCallback.argtypes = [MikMod_callback_t]'
+        ),
+    'VC_SetNumVoices': (None, (),
+        "VC_SetNumVoices = _libraries['/usr/lib/libmikmod.so'].VC_SetNumVoices\n"
+        'VC_SetNumVoices.restype = c_int\n'
+        'VC_SetNumVoices.argtypes = []'
+        ),
+    'VC_SampleSpace': (None, (),
+        "VC_SampleSpace = _libraries['/usr/lib/libmikmod.so'].VC_SampleSpace\n"
+        'VC_SampleSpace.restype = ULONG\n'
+        'VC_SampleSpace.argtypes = [c_int]'
+        ),
+    'VC_SampleLength': (None, ('SAMPLE',),
+        "VC_SampleLength = _libraries['/usr/lib/libmikmod.so'].VC_SampleLength\n"
+        'VC_SampleLength.restype = ULONG\n'
+        'VC_SampleLength.argtypes = [c_int, POINTER(SAMPLE)]'
+        ),
+    'VC_PlayStart': (None, (),
+        "VC_PlayStart = _libraries['/usr/lib/libmikmod.so'].VC_PlayStart\n"
+        'VC_PlayStart.restype = c_int\n'
+        'VC_PlayStart.argtypes = []'
+        ),
+    'VC_PlayStop': (None, (),
+        "VC_PlayStop = _libraries['/usr/lib/libmikmod.so'].VC_PlayStop\n"
+        'VC_PlayStop.restype = None\n'
+        'VC_PlayStop.argtypes = []'
+        ),
+    'VC_SampleLoad': (None, ('SAMPLOAD',),
+        "VC_SampleLoad = _libraries['/usr/lib/libmikmod.so'].VC_SampleLoad\n"
+        'VC_SampleLoad.restype = SWORD\n'
+        'VC_SampleLoad.argtypes = [POINTER(SAMPLOAD), c_int]'
+        ),
+    'VC_SampleUnload': (None, (),
+        "VC_SampleUnload = _libraries['/usr/lib/libmikmod.so'].VC_SampleUnload\n"
+        'VC_SampleUnload.restype = None\n'
+        'VC_SampleUnload.argtypes = [SWORD]'
+        ),
+    'VC_WriteBytes': (None, (),
+        "VC_WriteBytes = _libraries['/usr/lib/libmikmod.so'].VC_WriteBytes\n"
+        'VC_WriteBytes.restype = ULONG\n'
+        'VC_WriteBytes.argtypes = [POINTER(SBYTE), ULONG]'
+        ),
+    'VC_SilenceBytes': (None, (),
+        "VC_SilenceBytes = _libraries['/usr/lib/libmikmod.so'].VC_SilenceBytes\n"
+        'VC_SilenceBytes.restype = ULONG\n'
+        'VC_SilenceBytes.argtypes = [POINTER(SBYTE), ULONG]'
+        ),
+    'VC_VoiceSetVolume': (None, (),
+        "VC_VoiceSetVolume = _libraries['/usr/lib/libmikmod.so'].VC_VoiceSetVolume\n"
+        'VC_VoiceSetVolume.restype = None\n'
+        'VC_VoiceSetVolume.argtypes = [UBYTE, UWORD]'
+        ),
+    'VC_VoiceGetVolume': (None, (),
+        "VC_VoiceGetVolume = _libraries['/usr/lib/libmikmod.so'].VC_VoiceGetVolume\n"
+        'VC_VoiceGetVolume.restype = UWORD\n'
+        'VC_VoiceGetVolume.argtypes = [UBYTE]'
+        ),
+    'VC_VoiceSetFrequency': (None, (),
+        "VC_VoiceSetFrequency = _libraries['/usr/lib/libmikmod.so'].VC_VoiceSetFrequency\n"
+        'VC_VoiceSetFrequency.restype = None\n'
+        'VC_VoiceSetFrequency.argtypes = [UBYTE, ULONG]'
+        ),
+    'VC_VoiceGetFrequency': (None, (),
+        "VC_VoiceGetFrequency = _libraries['/usr/lib/libmikmod.so'].VC_VoiceGetFrequency\n"
+        'VC_VoiceGetFrequency.restype = ULONG\n'
+        'VC_VoiceGetFrequency.argtypes = [UBYTE]'
+        ),
+    'VC_VoiceSetPanning': (None, (),
+        "VC_VoiceSetPanning = _libraries['/usr/lib/libmikmod.so'].VC_VoiceSetPanning\n"
+        'VC_VoiceSetPanning.restype = None\n'
+        'VC_VoiceSetPanning.argtypes = [UBYTE, ULONG]'
+        ),
+    'VC_VoiceGetPanning': (None, (),
+        "VC_VoiceGetPanning = _libraries['/usr/lib/libmikmod.so'].VC_VoiceGetPanning\n"
+        'VC_VoiceGetPanning.restype = ULONG\n'
+        'VC_VoiceGetPanning.argtypes = [UBYTE]'
+        ),
+    'VC_VoicePlay': (None, (),
+        "VC_VoicePlay = _libraries['/usr/lib/libmikmod.so'].VC_VoicePlay\n"
+        'VC_VoicePlay.restype = None\n'
+        'VC_VoicePlay.argtypes = [UBYTE, SWORD, ULONG, ULONG, ULONG, ULONG, UWORD]'
+        ),
+    'VC_VoiceStop': (None, (),
+        "VC_VoiceStop = _libraries['/usr/lib/libmikmod.so'].VC_VoiceStop\n"
+        'VC_VoiceStop.restype = None\n'
+        'VC_VoiceStop.argtypes = [UBYTE]'
+        ),
+    'VC_VoiceStopped': (None, (),
+        "VC_VoiceStopped = _libraries['/usr/lib/libmikmod.so'].VC_VoiceStopped\n"
+        'VC_VoiceStopped.restype = BOOL\n'
+        'VC_VoiceStopped.argtypes = [UBYTE]'
+        ),
+    'VC_VoiceGetPosition': (None, (),
+        "VC_VoiceGetPosition = _libraries['/usr/lib/libmikmod.so'].VC_VoiceGetPosition\n"
+        'VC_VoiceGetPosition.restype = SLONG\n'
+        'VC_VoiceGetPosition.argtypes = [UBYTE]'
+        ),
+    'VC_VoiceRealVolume': (None, (),
+        "VC_VoiceRealVolume = _libraries['/usr/lib/libmikmod.so'].VC_VoiceRealVolume\n"
+        'VC_VoiceRealVolume.restype = ULONG\n'
+        'VC_VoiceRealVolume.argtypes = [UBYTE]'
+        ),
+    '__FILE': (None, ('_IO_FILE',),
+        '__FILE = _IO_FILE'
+        ),
+    'va_list': (None, ('__gnuc_va_list',),
+        'va_list = __gnuc_va_list'
+        ),
+    'fpos_t': (None, ('_G_fpos_t',),
+        'fpos_t = _G_fpos_t'
+        ),
+    'fpos64_t': (None, ('_G_fpos64_t',),
+        'fpos64_t = _G_fpos64_t'
+        ),
+    'remove': (None, (),
+        "remove = _libraries['/usr/lib/libmikmod.so'].remove\n"
+        'remove.restype = c_int\n'
+        'remove.argtypes = [STRING]'
+        ),
+    'rename': (None, (),
+        "rename = _libraries['/usr/lib/libmikmod.so'].rename\n"
+        'rename.restype = c_int\n'
+        'rename.argtypes = [STRING, STRING]'
+        ),
+    'renameat': (None, (),
+        "renameat = _libraries['/usr/lib/libmikmod.so'].renameat\n"
+        'renameat.restype = c_int\n'
+        'renameat.argtypes = [c_int, STRING, c_int, STRING]'
+        ),
+    'tmpfile': (None, ('FILE',),
+        "tmpfile = _libraries['/usr/lib/libmikmod.so'].tmpfile\n"
+        'tmpfile.restype = POINTER(FILE)\n'
+        'tmpfile.argtypes = []'
+        ),
+    'tmpfile64': (None, ('FILE',),
+        "tmpfile64 = _libraries['/usr/lib/libmikmod.so'].tmpfile64\n"
+        'tmpfile64.restype = POINTER(FILE)\n'
+        'tmpfile64.argtypes = []'
+        ),
+    'tmpnam': (None, (),
+        "tmpnam = _libraries['/usr/lib/libmikmod.so'].tmpnam\n"
+        'tmpnam.restype = STRING\n'
+        'tmpnam.argtypes = [STRING]'
+        ),
+    'tmpnam_r': (None, (),
+        "tmpnam_r = _libraries['/usr/lib/libmikmod.so'].tmpnam_r\n"
+        'tmpnam_r.restype = STRING\n'
+        'tmpnam_r.argtypes = [STRING]'
+        ),
+    'tempnam': (None, (),
+        "tempnam = _libraries['/usr/lib/libmikmod.so'].tempnam\n"
+        'tempnam.restype = STRING\n'
+        'tempnam.argtypes = [STRING, STRING]'
+        ),
+    'fclose': (None, ('FILE',),
+        "fclose = _libraries['/usr/lib/libmikmod.so'].fclose\n"
+        'fclose.restype = c_int\n'
+        'fclose.argtypes = [POINTER(FILE)]'
+        ),
+    'fflush': (None, ('FILE',),
+        "fflush = _libraries['/usr/lib/libmikmod.so'].fflush\n"
+        'fflush.restype = c_int\n'
+        'fflush.argtypes = [POINTER(FILE)]'
+        ),
+    'fflush_unlocked': (None, ('FILE',),
+        "fflush_unlocked = _libraries['/usr/lib/libmikmod.so'].fflush_unlocked\n"
+        'fflush_unlocked.restype = c_int\n'
+        'fflush_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'fcloseall': (None, (),
+        "fcloseall = _libraries['/usr/lib/libmikmod.so'].fcloseall\n"
+        'fcloseall.restype = c_int\n'
+        'fcloseall.argtypes = []'
+        ),
+    'fopen': (None, ('FILE',),
+        "fopen = _libraries['/usr/lib/libmikmod.so'].fopen\n"
+        'fopen.restype = POINTER(FILE)\n'
+        'fopen.argtypes = [STRING, STRING]'
+        ),
+    'freopen': (None, ('FILE',),
+        "freopen = _libraries['/usr/lib/libmikmod.so'].freopen\n"
+        'freopen.restype = POINTER(FILE)\n'
+        'freopen.argtypes = [STRING, STRING, POINTER(FILE)]'
+        ),
+    'fopen64': (None, ('FILE',),
+        "fopen64 = _libraries['/usr/lib/libmikmod.so'].fopen64\n"
+        'fopen64.restype = POINTER(FILE)\n'
+        'fopen64.argtypes = [STRING, STRING]'
+        ),
+    'freopen64': (None, ('FILE',),
+        "freopen64 = _libraries['/usr/lib/libmikmod.so'].freopen64\n"
+        'freopen64.restype = POINTER(FILE)\n'
+        'freopen64.argtypes = [STRING, STRING, POINTER(FILE)]'
+        ),
+    'fdopen': (None, ('FILE',),
+        "fdopen = _libraries['/usr/lib/libmikmod.so'].fdopen\n"
+        'fdopen.restype = POINTER(FILE)\n'
+        'fdopen.argtypes = [c_int, STRING]'
+        ),
+    'fopencookie': (None, ('FILE', '_IO_cookie_io_functions_t'),
+        "fopencookie = _libraries['/usr/lib/libmikmod.so'].fopencookie\n"
+        'fopencookie.restype = POINTER(FILE)\n'
+        'fopencookie.argtypes = [c_void_p, STRING, _IO_cookie_io_functions_t]'
+        ),
+    'fmemopen': (None, ('FILE',),
+        "fmemopen = _libraries['/usr/lib/libmikmod.so'].fmemopen\n"
+        'fmemopen.restype = POINTER(FILE)\n'
+        'fmemopen.argtypes = [c_void_p, size_t, STRING]'
+        ),
+    'open_memstream': (None, ('FILE',),
+        "open_memstream = _libraries['/usr/lib/libmikmod.so'].open_memstream\n"
+        'open_memstream.restype = POINTER(FILE)\n'
+        'open_memstream.argtypes = [POINTER(STRING), POINTER(size_t)]'
+        ),
+    'setbuf': (None, ('FILE',),
+        "setbuf = _libraries['/usr/lib/libmikmod.so'].setbuf\n"
+        'setbuf.restype = None\n'
+        'setbuf.argtypes = [POINTER(FILE), STRING]'
+        ),
+    'setvbuf': (None, ('FILE',),
+        "setvbuf = _libraries['/usr/lib/libmikmod.so'].setvbuf\n"
+        'setvbuf.restype = c_int\n'
+        'setvbuf.argtypes = [POINTER(FILE), STRING, c_int, size_t]'
+        ),
+    'setbuffer': (None, ('FILE',),
+        "setbuffer = _libraries['/usr/lib/libmikmod.so'].setbuffer\n"
+        'setbuffer.restype = None\n'
+        'setbuffer.argtypes = [POINTER(FILE), STRING, size_t]'
+        ),
+    'setlinebuf': (None, ('FILE',),
+        "setlinebuf = _libraries['/usr/lib/libmikmod.so'].setlinebuf\n"
+        'setlinebuf.restype = None\n'
+        'setlinebuf.argtypes = [POINTER(FILE)]'
+        ),
+    'fscanf': (None, ('FILE',),
+        "fscanf = _libraries['/usr/lib/libmikmod.so'].fscanf\n"
+        'fscanf.restype = c_int\n'
+        'fscanf.argtypes = [POINTER(FILE), STRING]'
+        ),
+    'scanf': (None, (),
+        "scanf = _libraries['/usr/lib/libmikmod.so'].scanf\n"
+        'scanf.restype = c_int\n'
+        'scanf.argtypes = [STRING]'
+        ),
+    'sscanf': (None, (),
+        "sscanf = _libraries['/usr/lib/libmikmod.so'].sscanf\n"
+        'sscanf.restype = c_int\n'
+        'sscanf.argtypes = [STRING, STRING]'
+        ),
+    'vfscanf': (None, ('FILE', '__va_list_tag'),
+        "vfscanf = _libraries['/usr/lib/libmikmod.so'].vfscanf\n"
+        'vfscanf.restype = c_int\n'
+        'vfscanf.argtypes = [POINTER(FILE), STRING, POINTER(__va_list_tag)]'
+        ),
+    'vscanf': (None, ('__va_list_tag',),
+        "vscanf = _libraries['/usr/lib/libmikmod.so'].vscanf\n"
+        'vscanf.restype = c_int\n'
+        'vscanf.argtypes = [STRING, POINTER(__va_list_tag)]'
+        ),
+    'vsscanf': (None, ('__va_list_tag',),
+        "vsscanf = _libraries['/usr/lib/libmikmod.so'].vsscanf\n"
+        'vsscanf.restype = c_int\n'
+        'vsscanf.argtypes = [STRING, STRING, POINTER(__va_list_tag)]'
+        ),
+    'fgetc': (None, ('FILE',),
+        "fgetc = _libraries['/usr/lib/libmikmod.so'].fgetc\n"
+        'fgetc.restype = c_int\n'
+        'fgetc.argtypes = [POINTER(FILE)]'
+        ),
+    'fputc': (None, ('FILE',),
+        "fputc = _libraries['/usr/lib/libmikmod.so'].fputc\n"
+        'fputc.restype = c_int\n'
+        'fputc.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'getw': (None, ('FILE',),
+        "getw = _libraries['/usr/lib/libmikmod.so'].getw\n"
+        'getw.restype = c_int\n'
+        'getw.argtypes = [POINTER(FILE)]'
+        ),
+    'putw': (None, ('FILE',),
+        "putw = _libraries['/usr/lib/libmikmod.so'].putw\n"
+        'putw.restype = c_int\n'
+        'putw.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'gets': (None, (),
+        "gets = _libraries['/usr/lib/libmikmod.so'].gets\n"
+        'gets.restype = STRING\n'
+        'gets.argtypes = [STRING]'
+        ),
+    '__getdelim': (None, ('FILE',),
+        "__getdelim = _libraries['/usr/lib/libmikmod.so'].__getdelim\n"
+        '__getdelim.restype = __ssize_t\n'
+        '__getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]'
+        ),
+    'getdelim': (None, ('FILE',),
+        "getdelim = _libraries['/usr/lib/libmikmod.so'].getdelim\n"
+        'getdelim.restype = __ssize_t\n'
+        'getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]'
+        ),
+    'fputs': (None, ('FILE',),
+        "fputs = _libraries['/usr/lib/libmikmod.so'].fputs\n"
+        'fputs.restype = c_int\n'
+        'fputs.argtypes = [STRING, POINTER(FILE)]'
+        ),
+    'puts': (None, (),
+        "puts = _libraries['/usr/lib/libmikmod.so'].puts\n"
+        'puts.restype = c_int\n'
+        'puts.argtypes = [STRING]'
+        ),
+    'ungetc': (None, ('FILE',),
+        "ungetc = _libraries['/usr/lib/libmikmod.so'].ungetc\n"
+        'ungetc.restype = c_int\n'
+        'ungetc.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'fwrite': (None, ('FILE',),
+        "fwrite = _libraries['/usr/lib/libmikmod.so'].fwrite\n"
+        'fwrite.restype = size_t\n'
+        'fwrite.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fputs_unlocked': (None, ('FILE',),
+        "fputs_unlocked = _libraries['/usr/lib/libmikmod.so'].fputs_unlocked\n"
+        'fputs_unlocked.restype = c_int\n'
+        'fputs_unlocked.argtypes = [STRING, POINTER(FILE)]'
+        ),
+    'fwrite_unlocked': (None, ('FILE',),
+        "fwrite_unlocked = _libraries['/usr/lib/libmikmod.so'].fwrite_unlocked\n"
+        'fwrite_unlocked.restype = size_t\n'
+        'fwrite_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fseek': (None, ('FILE',),
+        "fseek = _libraries['/usr/lib/libmikmod.so'].fseek\n"
+        'fseek.restype = c_int\n'
+        'fseek.argtypes = [POINTER(FILE), c_long, c_int]'
+        ),
+    'ftell': (None, ('FILE',),
+        "ftell = _libraries['/usr/lib/libmikmod.so'].ftell\n"
+        'ftell.restype = c_long\n'
+        'ftell.argtypes = [POINTER(FILE)]'
+        ),
+    'rewind': (None, ('FILE',),
+        "rewind = _libraries['/usr/lib/libmikmod.so'].rewind\n"
+        'rewind.restype = None\n'
+        'rewind.argtypes = [POINTER(FILE)]'
+        ),
+    'fseeko': (None, ('FILE',),
+        "fseeko = _libraries['/usr/lib/libmikmod.so'].fseeko\n"
+        'fseeko.restype = c_int\n'
+        'fseeko.argtypes = [POINTER(FILE), __off_t, c_int]'
+        ),
+    'ftello': (None, ('FILE',),
+        "ftello = _libraries['/usr/lib/libmikmod.so'].ftello\n"
+        'ftello.restype = __off_t\n'
+        'ftello.argtypes = [POINTER(FILE)]'
+        ),
+    'fgetpos': (None, ('FILE', 'fpos_t'),
+        "fgetpos = _libraries['/usr/lib/libmikmod.so'].fgetpos\n"
+        'fgetpos.restype = c_int\n'
+        'fgetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]'
+        ),
+    'fsetpos': (None, ('FILE', 'fpos_t'),
+        "fsetpos = _libraries['/usr/lib/libmikmod.so'].fsetpos\n"
+        'fsetpos.restype = c_int\n'
+        'fsetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]'
+        ),
+    'fseeko64': (None, ('FILE',),
+        "fseeko64 = _libraries['/usr/lib/libmikmod.so'].fseeko64\n"
+        'fseeko64.restype = c_int\n'
+        'fseeko64.argtypes = [POINTER(FILE), __off64_t, c_int]'
+        ),
+    'ftello64': (None, ('FILE',),
+        "ftello64 = _libraries['/usr/lib/libmikmod.so'].ftello64\n"
+        'ftello64.restype = __off64_t\n'
+        'ftello64.argtypes = [POINTER(FILE)]'
+        ),
+    'fgetpos64': (None, ('FILE', 'fpos64_t'),
+        "fgetpos64 = _libraries['/usr/lib/libmikmod.so'].fgetpos64\n"
+        'fgetpos64.restype = c_int\n'
+        'fgetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]'
+        ),
+    'fsetpos64': (None, ('FILE', 'fpos64_t'),
+        "fsetpos64 = _libraries['/usr/lib/libmikmod.so'].fsetpos64\n"
+        'fsetpos64.restype = c_int\n'
+        'fsetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]'
+        ),
+    'clearerr': (None, ('FILE',),
+        "clearerr = _libraries['/usr/lib/libmikmod.so'].clearerr\n"
+        'clearerr.restype = None\n'
+        'clearerr.argtypes = [POINTER(FILE)]'
+        ),
+    'feof': (None, ('FILE',),
+        "feof = _libraries['/usr/lib/libmikmod.so'].feof\n"
+        'feof.restype = c_int\n'
+        'feof.argtypes = [POINTER(FILE)]'
+        ),
+    'ferror': (None, ('FILE',),
+        "ferror = _libraries['/usr/lib/libmikmod.so'].ferror\n"
+        'ferror.restype = c_int\n'
+        'ferror.argtypes = [POINTER(FILE)]'
+        ),
+    'clearerr_unlocked': (None, ('FILE',),
+        "clearerr_unlocked = _libraries['/usr/lib/libmikmod.so'].clearerr_unlocked\n"
+        'clearerr_unlocked.restype = None\n'
+        'clearerr_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'perror': (None, (),
+        "perror = _libraries['/usr/lib/libmikmod.so'].perror\n"
+        'perror.restype = None\n'
+        'perror.argtypes = [STRING]'
+        ),
+    'fileno': (None, ('FILE',),
+        "fileno = _libraries['/usr/lib/libmikmod.so'].fileno\n"
+        'fileno.restype = c_int\n'
+        'fileno.argtypes = [POINTER(FILE)]'
+        ),
+    'fileno_unlocked': (None, ('FILE',),
+        "fileno_unlocked = _libraries['/usr/lib/libmikmod.so'].fileno_unlocked\n"
+        'fileno_unlocked.restype = c_int\n'
+        'fileno_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'popen': (None, ('FILE',),
+        "popen = _libraries['/usr/lib/libmikmod.so'].popen\n"
+        'popen.restype = POINTER(FILE)\n'
+        'popen.argtypes = [STRING, STRING]'
+        ),
+    'pclose': (None, ('FILE',),
+        "pclose = _libraries['/usr/lib/libmikmod.so'].pclose\n"
+        'pclose.restype = c_int\n'
+        'pclose.argtypes = [POINTER(FILE)]'
+        ),
+    'ctermid': (None, (),
+        "ctermid = _libraries['/usr/lib/libmikmod.so'].ctermid\n"
+        'ctermid.restype = STRING\n'
+        'ctermid.argtypes = [STRING]'
+        ),
+    'cuserid': (None, (),
+        "cuserid = _libraries['/usr/lib/libmikmod.so'].cuserid\n"
+        'cuserid.restype = STRING\n'
+        'cuserid.argtypes = [STRING]'
+        ),
+    'flockfile': (None, ('FILE',),
+        "flockfile = _libraries['/usr/lib/libmikmod.so'].flockfile\n"
+        'flockfile.restype = None\n'
+        'flockfile.argtypes = [POINTER(FILE)]'
+        ),
+    'ftrylockfile': (None, ('FILE',),
+        "ftrylockfile = _libraries['/usr/lib/libmikmod.so'].ftrylockfile\n"
+        'ftrylockfile.restype = c_int\n'
+        'ftrylockfile.argtypes = [POINTER(FILE)]'
+        ),
+    'funlockfile': (None, ('FILE',),
+        "funlockfile = _libraries['/usr/lib/libmikmod.so'].funlockfile\n"
+        'funlockfile.restype = None\n'
+        'funlockfile.argtypes = [POINTER(FILE)]'
+        ),
+    'div_t': ('Structure', (),
+        'div_t._fields_ = [\n'
+        "    ('quot', c_int),\n"
+        "    ('rem', c_int),\n"
+        ']'
+        ),
+    'ldiv_t': ('Structure', (),
+        'ldiv_t._fields_ = [\n'
+        "    ('quot', c_long),\n"
+        "    ('rem', c_long),\n"
+        ']'
+        ),
+    'lldiv_t': ('Structure', (),
+        'lldiv_t._fields_ = [\n'
+        "    ('quot', c_longlong),\n"
+        "    ('rem', c_longlong),\n"
+        ']'
+        ),
+    '__ctype_get_mb_cur_max': (None, (),
+        "__ctype_get_mb_cur_max = _libraries['/usr/lib/libmikmod.so'].__ctype_get_mb_cur_max\n"
+        '__ctype_get_mb_cur_max.restype = size_t\n'
+        '__ctype_get_mb_cur_max.argtypes = []'
+        ),
+    'strtod': (None, (),
+        "strtod = _libraries['/usr/lib/libmikmod.so'].strtod\n"
+        'strtod.restype = c_double\n'
+        'strtod.argtypes = [STRING, POINTER(STRING)]'
+        ),
+    'strtof': (None, (),
+        "strtof = _libraries['/usr/lib/libmikmod.so'].strtof\n"
+        'strtof.restype = c_float\n'
+        'strtof.argtypes = [STRING, POINTER(STRING)]'
+        ),
+    'strtold': (None, (),
+        "strtold = _libraries['/usr/lib/libmikmod.so'].strtold\n"
+        'strtold.restype = c_longdouble\n'
+        'strtold.argtypes = [STRING, POINTER(STRING)]'
+        ),
+    'strtol': (None, (),
+        "strtol = _libraries['/usr/lib/libmikmod.so'].strtol\n"
+        'strtol.restype = c_long\n'
+        'strtol.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoul': (None, (),
+        "strtoul = _libraries['/usr/lib/libmikmod.so'].strtoul\n"
+        'strtoul.restype = c_ulong\n'
+        'strtoul.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoq': (None, (),
+        "strtoq = _libraries['/usr/lib/libmikmod.so'].strtoq\n"
+        'strtoq.restype = c_longlong\n'
+        'strtoq.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtouq': (None, (),
+        "strtouq = _libraries['/usr/lib/libmikmod.so'].strtouq\n"
+        'strtouq.restype = c_ulonglong\n'
+        'strtouq.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoll': (None, (),
+        "strtoll = _libraries['/usr/lib/libmikmod.so'].strtoll\n"
+        'strtoll.restype = c_longlong\n'
+        'strtoll.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoull': (None, (),
+        "strtoull = _libraries['/usr/lib/libmikmod.so'].strtoull\n"
+        'strtoull.restype = c_ulonglong\n'
+        'strtoull.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    '__locale_struct': ('Structure', ('__locale_data',),
+        '__locale_struct._fields_ = [\n'
+        "    ('__locales', POINTER(__locale_data) * 13),\n"
+        "    ('__ctype_b', POINTER(c_ushort)),\n"
+        "    ('__ctype_tolower', POINTER(c_int)),\n"
+        "    ('__ctype_toupper', POINTER(c_int)),\n"
+        "    ('__names', STRING * 13),\n"
+        ']'
+        ),
+    '__locale_t': (None, ('__locale_struct',),
+        '__locale_t = POINTER(__locale_struct)'
+        ),
+    'strtol_l': (None, ('__locale_t',),
+        "strtol_l = _libraries['/usr/lib/libmikmod.so'].strtol_l\n"
+        'strtol_l.restype = c_long\n'
+        'strtol_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtoul_l': (None, ('__locale_t',),
+        "strtoul_l = _libraries['/usr/lib/libmikmod.so'].strtoul_l\n"
+        'strtoul_l.restype = c_ulong\n'
+        'strtoul_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtoll_l': (None, ('__locale_t',),
+        "strtoll_l = _libraries['/usr/lib/libmikmod.so'].strtoll_l\n"
+        'strtoll_l.restype = c_longlong\n'
+        'strtoll_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtoull_l': (None, ('__locale_t',),
+        "strtoull_l = _libraries['/usr/lib/libmikmod.so'].strtoull_l\n"
+        'strtoull_l.restype = c_ulonglong\n'
+        'strtoull_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtod_l': (None, ('__locale_t',),
+        "strtod_l = _libraries['/usr/lib/libmikmod.so'].strtod_l\n"
+        'strtod_l.restype = c_double\n'
+        'strtod_l.argtypes = [STRING, POINTER(STRING), __locale_t]'
+        ),
+    'strtof_l': (None, ('__locale_t',),
+        "strtof_l = _libraries['/usr/lib/libmikmod.so'].strtof_l\n"
+        'strtof_l.restype = c_float\n'
+        'strtof_l.argtypes = [STRING, POINTER(STRING), __locale_t]'
+        ),
+    'strtold_l': (None, ('__locale_t',),
+        "strtold_l = _libraries['/usr/lib/libmikmod.so'].strtold_l\n"
+        'strtold_l.restype = c_longdouble\n'
+        'strtold_l.argtypes = [STRING, POINTER(STRING), __locale_t]'
+        ),
+    'atoi': (None, (),
+        "atoi = _libraries['/usr/lib/libmikmod.so'].atoi\n"
+        'atoi.restype = c_int\n'
+        'atoi.argtypes = [STRING]'
+        ),
+    'atol': (None, (),
+        "atol = _libraries['/usr/lib/libmikmod.so'].atol\n"
+        'atol.restype = c_long\n'
+        'atol.argtypes = [STRING]'
+        ),
+    'atoll': (None, (),
+        "atoll = _libraries['/usr/lib/libmikmod.so'].atoll\n"
+        'atoll.restype = c_longlong\n'
+        'atoll.argtypes = [STRING]'
+        ),
+    'l64a': (None, (),
+        "l64a = _libraries['/usr/lib/libmikmod.so'].l64a\n"
+        'l64a.restype = STRING\n'
+        'l64a.argtypes = [c_long]'
+        ),
+    'a64l': (None, (),
+        "a64l = _libraries['/usr/lib/libmikmod.so'].a64l\n"
+        'a64l.restype = c_long\n'
+        'a64l.argtypes = [STRING]'
+        ),
+    'random': (None, (),
+        "random = _libraries['/usr/lib/libmikmod.so'].random\n"
+        'random.restype = c_long\n'
+        'random.argtypes = []'
+        ),
+    'srandom': (None, (),
+        "srandom = _libraries['/usr/lib/libmikmod.so'].srandom\n"
+        'srandom.restype = None\n'
+        'srandom.argtypes = [c_uint]'
+        ),
+    'initstate': (None, (),
+        "initstate = _libraries['/usr/lib/libmikmod.so'].initstate\n"
+        'initstate.restype = STRING\n'
+        'initstate.argtypes = [c_uint, STRING, size_t]'
+        ),
+    'setstate': (None, (),
+        "setstate = _libraries['/usr/lib/libmikmod.so'].setstate\n"
+        'setstate.restype = STRING\n'
+        'setstate.argtypes = [STRING]'
+        ),
+    'random_data': ('Structure', (),
+        'random_data._fields_ = [\n'
+        "    ('fptr', POINTER(int32_t)),\n"
+        "    ('rptr', POINTER(int32_t)),\n"
+        "    ('state', POINTER(int32_t)),\n"
+        "    ('rand_type', c_int),\n"
+        "    ('rand_deg', c_int),\n"
+        "    ('rand_sep', c_int),\n"
+        "    ('end_ptr', POINTER(int32_t)),\n"
+        ']'
+        ),
+    'random_r': (None, ('random_data',),
+        "random_r = _libraries['/usr/lib/libmikmod.so'].random_r\n"
+        'random_r.restype = c_int\n'
+        'random_r.argtypes = [POINTER(random_data), POINTER(int32_t)]'
+        ),
+    'srandom_r': (None, ('random_data',),
+        "srandom_r = _libraries['/usr/lib/libmikmod.so'].srandom_r\n"
+        'srandom_r.restype = c_int\n'
+        'srandom_r.argtypes = [c_uint, POINTER(random_data)]'
+        ),
+    'initstate_r': (None, ('random_data',),
+        "initstate_r = _libraries['/usr/lib/libmikmod.so'].initstate_r\n"
+        'initstate_r.restype = c_int\n'
+        'initstate_r.argtypes = [c_uint, STRING, size_t, POINTER(random_data)]'
+        ),
+    'setstate_r': (None, ('random_data',),
+        "setstate_r = _libraries['/usr/lib/libmikmod.so'].setstate_r\n"
+        'setstate_r.restype = c_int\n'
+        'setstate_r.argtypes = [STRING, POINTER(random_data)]'
+        ),
+    'rand': (None, (),
+        "rand = _libraries['/usr/lib/libmikmod.so'].rand\n"
+        'rand.restype = c_int\n'
+        'rand.argtypes = []'
+        ),
+    'srand': (None, (),
+        "srand = _libraries['/usr/lib/libmikmod.so'].srand\n"
+        'srand.restype = None\n'
+        'srand.argtypes = [c_uint]'
+        ),
+    'rand_r': (None, (),
+        "rand_r = _libraries['/usr/lib/libmikmod.so'].rand_r\n"
+        'rand_r.restype = c_int\n'
+        'rand_r.argtypes = [POINTER(c_uint)]'
+        ),
+    'drand48': (None, (),
+        "drand48 = _libraries['/usr/lib/libmikmod.so'].drand48\n"
+        'drand48.restype = c_double\n'
+        'drand48.argtypes = []'
+        ),
+    'erand48': (None, (),
+        "erand48 = _libraries['/usr/lib/libmikmod.so'].erand48\n"
+        'erand48.restype = c_double\n'
+        'erand48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'lrand48': (None, (),
+        "lrand48 = _libraries['/usr/lib/libmikmod.so'].lrand48\n"
+        'lrand48.restype = c_long\n'
+        'lrand48.argtypes = []'
+        ),
+    'nrand48': (None, (),
+        "nrand48 = _libraries['/usr/lib/libmikmod.so'].nrand48\n"
+        'nrand48.restype = c_long\n'
+        'nrand48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'mrand48': (None, (),
+        "mrand48 = _libraries['/usr/lib/libmikmod.so'].mrand48\n"
+        'mrand48.restype = c_long\n'
+        'mrand48.argtypes = []'
+        ),
+    'jrand48': (None, (),
+        "jrand48 = _libraries['/usr/lib/libmikmod.so'].jrand48\n"
+        'jrand48.restype = c_long\n'
+        'jrand48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'srand48': (None, (),
+        "srand48 = _libraries['/usr/lib/libmikmod.so'].srand48\n"
+        'srand48.restype = None\n'
+        'srand48.argtypes = [c_long]'
+        ),
+    'seed48': (None, (),
+        "seed48 = _libraries['/usr/lib/libmikmod.so'].seed48\n"
+        'seed48.restype = POINTER(c_ushort)\n'
+        'seed48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'lcong48': (None, (),
+        "lcong48 = _libraries['/usr/lib/libmikmod.so'].lcong48\n"
+        'lcong48.restype = None\n'
+        'lcong48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'drand48_data': ('Structure', (),
+        'drand48_data._fields_ = [\n'
+        "    ('__x', c_ushort * 3),\n"
+        "    ('__old_x', c_ushort * 3),\n"
+        "    ('__c', c_ushort),\n"
+        "    ('__init', c_ushort),\n"
+        "    ('__a', c_ulonglong),\n"
+        ']'
+        ),
+    'drand48_r': (None, ('drand48_data',),
+        "drand48_r = _libraries['/usr/lib/libmikmod.so'].drand48_r\n"
+        'drand48_r.restype = c_int\n'
+        'drand48_r.argtypes = [POINTER(drand48_data), POINTER(c_double)]'
+        ),
+    'erand48_r': (None, ('drand48_data',),
+        "erand48_r = _libraries['/usr/lib/libmikmod.so'].erand48_r\n"
+        'erand48_r.restype = c_int\n'
+        'erand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_double)]'
+        ),
+    'lrand48_r': (None, ('drand48_data',),
+        "lrand48_r = _libraries['/usr/lib/libmikmod.so'].lrand48_r\n"
+        'lrand48_r.restype = c_int\n'
+        'lrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'nrand48_r': (None, ('drand48_data',),
+        "nrand48_r = _libraries['/usr/lib/libmikmod.so'].nrand48_r\n"
+        'nrand48_r.restype = c_int\n'
+        'nrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'mrand48_r': (None, ('drand48_data',),
+        "mrand48_r = _libraries['/usr/lib/libmikmod.so'].mrand48_r\n"
+        'mrand48_r.restype = c_int\n'
+        'mrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'jrand48_r': (None, ('drand48_data',),
+        "jrand48_r = _libraries['/usr/lib/libmikmod.so'].jrand48_r\n"
+        'jrand48_r.restype = c_int\n'
+        'jrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'srand48_r': (None, ('drand48_data',),
+        "srand48_r = _libraries['/usr/lib/libmikmod.so'].srand48_r\n"
+        'srand48_r.restype = c_int\n'
+        'srand48_r.argtypes = [c_long, POINTER(drand48_data)]'
+        ),
+    'seed48_r': (None, ('drand48_data',),
+        "seed48_r = _libraries['/usr/lib/libmikmod.so'].seed48_r\n"
+        'seed48_r.restype = c_int\n'
+        'seed48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]'
+        ),
+    'lcong48_r': (None, ('drand48_data',),
+        "lcong48_r = _libraries['/usr/lib/libmikmod.so'].lcong48_r\n"
+        'lcong48_r.restype = c_int\n'
+        'lcong48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]'
+        ),
+    'malloc': (None, (),
+        "malloc = _libraries['/usr/lib/libmikmod.so'].malloc\n"
+        'malloc.restype = c_void_p\n'
+        'malloc.argtypes = [size_t]'
+        ),
+    'calloc': (None, (),
+        "calloc = _libraries['/usr/lib/libmikmod.so'].calloc\n"
+        'calloc.restype = c_void_p\n'
+        'calloc.argtypes = [size_t, size_t]'
+        ),
+    'realloc': (None, (),
+        "realloc = _libraries['/usr/lib/libmikmod.so'].realloc\n"
+        'realloc.restype = c_void_p\n'
+        'realloc.argtypes = [c_void_p, size_t]'
+        ),
+    'free': (None, (),
+        "free = _libraries['/usr/lib/libmikmod.so'].free\n"
+        'free.restype = None\n'
+        'free.argtypes = [c_void_p]'
+        ),
+    'cfree': (None, (),
+        "cfree = _libraries['/usr/lib/libmikmod.so'].cfree\n"
+        'cfree.restype = None\n'
+        'cfree.argtypes = [c_void_p]'
+        ),
+    'valloc': (None, (),
+        "valloc = _libraries['/usr/lib/libmikmod.so'].valloc\n"
+        'valloc.restype = c_void_p\n'
+        'valloc.argtypes = [size_t]'
+        ),
+    'posix_memalign': (None, (),
+        "posix_memalign = _libraries['/usr/lib/libmikmod.so'].posix_memalign\n"
+        'posix_memalign.restype = c_int\n'
+        'posix_memalign.argtypes = [POINTER(c_void_p), size_t, size_t]'
+        ),
+    'aligned_alloc': (None, (),
+        "aligned_alloc = _libraries['/usr/lib/libmikmod.so'].aligned_alloc\n"
+        'aligned_alloc.restype = c_void_p\n'
+        'aligned_alloc.argtypes = [size_t, size_t]'
+        ),
+    'abort': (None, (),
+        "abort = _libraries['/usr/lib/libmikmod.so'].abort\n"
+        'abort.restype = None\n'
+        'abort.argtypes = []'
+        ),
+    'on_exit': (None, (),
+        "on_exit = _libraries['/usr/lib/libmikmod.so'].on_exit\n"
+        'on_exit.restype = c_int\n'
+        'on_exit.argtypes = [CFUNCTYPE(None, c_int, c_void_p), c_void_p]'
+        ),
+    'exit': (None, (),
+        "exit = _libraries['/usr/lib/libmikmod.so'].exit\n"
+        'exit.restype = None\n'
+        'exit.argtypes = [c_int]'
+        ),
+    'quick_exit': (None, (),
+        "quick_exit = _libraries['/usr/lib/libmikmod.so'].quick_exit\n"
+        'quick_exit.restype = None\n'
+        'quick_exit.argtypes = [c_int]'
+        ),
+    '_Exit': (None, (),
+        "_Exit = _libraries['/usr/lib/libmikmod.so']._Exit\n"
+        '_Exit.restype = None\n'
+        '_Exit.argtypes = [c_int]'
+        ),
+    'getenv': (None, (),
+        "getenv = _libraries['/usr/lib/libmikmod.so'].getenv\n"
+        'getenv.restype = STRING\n'
+        'getenv.argtypes = [STRING]'
+        ),
+    'secure_getenv': (None, (),
+        "secure_getenv = _libraries['/usr/lib/libmikmod.so'].secure_getenv\n"
+        'secure_getenv.restype = STRING\n'
+        'secure_getenv.argtypes = [STRING]'
+        ),
+    'putenv': (None, (),
+        "putenv = _libraries['/usr/lib/libmikmod.so'].putenv\n"
+        'putenv.restype = c_int\n'
+        'putenv.argtypes = [STRING]'
+        ),
+    'setenv': (None, (),
+        "setenv = _libraries['/usr/lib/libmikmod.so'].setenv\n"
+        'setenv.restype = c_int\n'
+        'setenv.argtypes = [STRING, STRING, c_int]'
+        ),
+    'unsetenv': (None, (),
+        "unsetenv = _libraries['/usr/lib/libmikmod.so'].unsetenv\n"
+        'unsetenv.restype = c_int\n'
+        'unsetenv.argtypes = [STRING]'
+        ),
+    'clearenv': (None, (),
+        "clearenv = _libraries['/usr/lib/libmikmod.so'].clearenv\n"
+        'clearenv.restype = c_int\n'
+        'clearenv.argtypes = []'
+        ),
+    'mktemp': (None, (),
+        "mktemp = _libraries['/usr/lib/libmikmod.so'].mktemp\n"
+        'mktemp.restype = STRING\n'
+        'mktemp.argtypes = [STRING]'
+        ),
+    'mkstemp': (None, (),
+        "mkstemp = _libraries['/usr/lib/libmikmod.so'].mkstemp\n"
+        'mkstemp.restype = c_int\n'
+        'mkstemp.argtypes = [STRING]'
+        ),
+    'mkstemp64': (None, (),
+        "mkstemp64 = _libraries['/usr/lib/libmikmod.so'].mkstemp64\n"
+        'mkstemp64.restype = c_int\n'
+        'mkstemp64.argtypes = [STRING]'
+        ),
+    'mkstemps': (None, (),
+        "mkstemps = _libraries['/usr/lib/libmikmod.so'].mkstemps\n"
+        'mkstemps.restype = c_int\n'
+        'mkstemps.argtypes = [STRING, c_int]'
+        ),
+    'mkstemps64': (None, (),
+        "mkstemps64 = _libraries['/usr/lib/libmikmod.so'].mkstemps64\n"
+        'mkstemps64.restype = c_int\n'
+        'mkstemps64.argtypes = [STRING, c_int]'
+        ),
+    'mkdtemp': (None, (),
+        "mkdtemp = _libraries['/usr/lib/libmikmod.so'].mkdtemp\n"
+        'mkdtemp.restype = STRING\n'
+        'mkdtemp.argtypes = [STRING]'
+        ),
+    'mkostemp': (None, (),
+        "mkostemp = _libraries['/usr/lib/libmikmod.so'].mkostemp\n"
+        'mkostemp.restype = c_int\n'
+        'mkostemp.argtypes = [STRING, c_int]'
+        ),
+    'mkostemp64': (None, (),
+        "mkostemp64 = _libraries['/usr/lib/libmikmod.so'].mkostemp64\n"
+        'mkostemp64.restype = c_int\n'
+        'mkostemp64.argtypes = [STRING, c_int]'
+        ),
+    'mkostemps': (None, (),
+        "mkostemps = _libraries['/usr/lib/libmikmod.so'].mkostemps\n"
+        'mkostemps.restype = c_int\n'
+        'mkostemps.argtypes = [STRING, c_int, c_int]'
+        ),
+    'mkostemps64': (None, (),
+        "mkostemps64 = _libraries['/usr/lib/libmikmod.so'].mkostemps64\n"
+        'mkostemps64.restype = c_int\n'
+        'mkostemps64.argtypes = [STRING, c_int, c_int]'
+        ),
+    'system': (None, (),
+        "system = _libraries['/usr/lib/libmikmod.so'].system\n"
+        'system.restype = c_int\n'
+        'system.argtypes = [STRING]'
+        ),
+    'canonicalize_file_name': (None, (),
+        "canonicalize_file_name = _libraries['/usr/lib/libmikmod.so'].canonicalize_file_name\n"
+        'canonicalize_file_name.restype = STRING\n'
+        'canonicalize_file_name.argtypes = [STRING]'
+        ),
+    'qsort': (None, (),
+        "qsort = _libraries['/usr/lib/libmikmod.so'].qsort\n"
+        'qsort.restype = None\n'
+        'qsort.argtypes = [c_void_p, size_t, size_t, __compar_fn_t]'
+        ),
+    'qsort_r': (None, (),
+        "qsort_r = _libraries['/usr/lib/libmikmod.so'].qsort_r\n"
+        'qsort_r.restype = None\n'
+        'qsort_r.argtypes = [c_void_p, size_t, size_t, __compar_d_fn_t, c_void_p]'
+        ),
+    'abs': (None, (),
+        "abs = _libraries['/usr/lib/libmikmod.so'].abs\n"
+        'abs.restype = c_int\n'
+        'abs.argtypes = [c_int]'
+        ),
+    'labs': (None, (),
+        "labs = _libraries['/usr/lib/libmikmod.so'].labs\n"
+        'labs.restype = c_long\n'
+        'labs.argtypes = [c_long]'
+        ),
+    'llabs': (None, (),
+        "llabs = _libraries['/usr/lib/libmikmod.so'].llabs\n"
+        'llabs.restype = c_longlong\n'
+        'llabs.argtypes = [c_longlong]'
+        ),
+    'div': (None, ('div_t',),
+        "div = _libraries['/usr/lib/libmikmod.so'].div\n"
+        'div.restype = div_t\n'
+        'div.argtypes = [c_int, c_int]'
+        ),
+    'ldiv': (None, ('ldiv_t',),
+        "ldiv = _libraries['/usr/lib/libmikmod.so'].ldiv\n"
+        'ldiv.restype = ldiv_t\n'
+        'ldiv.argtypes = [c_long, c_long]'
+        ),
+    'lldiv': (None, ('lldiv_t',),
+        "lldiv = _libraries['/usr/lib/libmikmod.so'].lldiv\n"
+        'lldiv.restype = lldiv_t\n'
+        'lldiv.argtypes = [c_longlong, c_longlong]'
+        ),
+    'ecvt': (None, (),
+        "ecvt = _libraries['/usr/lib/libmikmod.so'].ecvt\n"
+        'ecvt.restype = STRING\n'
+        'ecvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'fcvt': (None, (),
+        "fcvt = _libraries['/usr/lib/libmikmod.so'].fcvt\n"
+        'fcvt.restype = STRING\n'
+        'fcvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'gcvt': (None, (),
+        "gcvt = _libraries['/usr/lib/libmikmod.so'].gcvt\n"
+        'gcvt.restype = STRING\n'
+        'gcvt.argtypes = [c_double, c_int, STRING]'
+        ),
+    'qecvt': (None, (),
+        "qecvt = _libraries['/usr/lib/libmikmod.so'].qecvt\n"
+        'qecvt.restype = STRING\n'
+        'qecvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'qfcvt': (None, (),
+        "qfcvt = _libraries['/usr/lib/libmikmod.so'].qfcvt\n"
+        'qfcvt.restype = STRING\n'
+        'qfcvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'qgcvt': (None, (),
+        "qgcvt = _libraries['/usr/lib/libmikmod.so'].qgcvt\n"
+        'qgcvt.restype = STRING\n'
+        'qgcvt.argtypes = [c_longdouble, c_int, STRING]'
+        ),
+    'ecvt_r': (None, (),
+        "ecvt_r = _libraries['/usr/lib/libmikmod.so'].ecvt_r\n"
+        'ecvt_r.restype = c_int\n'
+        'ecvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'fcvt_r': (None, (),
+        "fcvt_r = _libraries['/usr/lib/libmikmod.so'].fcvt_r\n"
+        'fcvt_r.restype = c_int\n'
+        'fcvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'qecvt_r': (None, (),
+        "qecvt_r = _libraries['/usr/lib/libmikmod.so'].qecvt_r\n"
+        'qecvt_r.restype = c_int\n'
+        'qecvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'qfcvt_r': (None, (),
+        "qfcvt_r = _libraries['/usr/lib/libmikmod.so'].qfcvt_r\n"
+        'qfcvt_r.restype = c_int\n'
+        'qfcvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'mblen': (None, (),
+        "mblen = _libraries['/usr/lib/libmikmod.so'].mblen\n"
+        'mblen.restype = c_int\n'
+        'mblen.argtypes = [STRING, size_t]'
+        ),
+    'mbtowc': (None, (),
+        "mbtowc = _libraries['/usr/lib/libmikmod.so'].mbtowc\n"
+        'mbtowc.restype = c_int\n'
+        'mbtowc.argtypes = [WSTRING, STRING, size_t]'
+        ),
+    'rpmatch': (None, (),
+        "rpmatch = _libraries['/usr/lib/libmikmod.so'].rpmatch\n"
+        'rpmatch.restype = c_int\n'
+        'rpmatch.argtypes = [STRING]'
+        ),
+    'getsubopt': (None, (),
+        "getsubopt = _libraries['/usr/lib/libmikmod.so'].getsubopt\n"
+        'getsubopt.restype = c_int\n'
+        'getsubopt.argtypes = [POINTER(STRING), POINTER(STRING), POINTER(STRING)]'
+        ),
+    'posix_openpt': (None, (),
+        "posix_openpt = _libraries['/usr/lib/libmikmod.so'].posix_openpt\n"
+        'posix_openpt.restype = c_int\n'
+        'posix_openpt.argtypes = [c_int]'
+        ),
+    'grantpt': (None, (),
+        "grantpt = _libraries['/usr/lib/libmikmod.so'].grantpt\n"
+        'grantpt.restype = c_int\n'
+        'grantpt.argtypes = [c_int]'
+        ),
+    'unlockpt': (None, (),
+        "unlockpt = _libraries['/usr/lib/libmikmod.so'].unlockpt\n"
+        'unlockpt.restype = c_int\n'
+        'unlockpt.argtypes = [c_int]'
+        ),
+    'ptsname': (None, (),
+        "ptsname = _libraries['/usr/lib/libmikmod.so'].ptsname\n"
+        'ptsname.restype = STRING\n'
+        'ptsname.argtypes = [c_int]'
+        ),
+    'getpt': (None, (),
+        "getpt = _libraries['/usr/lib/libmikmod.so'].getpt\n"
+        'getpt.restype = c_int\n'
+        'getpt.argtypes = []'
+        ),
+    'getloadavg': (None, (),
+        "getloadavg = _libraries['/usr/lib/libmikmod.so'].getloadavg\n"
+        'getloadavg.restype = c_int\n'
+        'getloadavg.argtypes = [POINTER(c_double), c_int]'
+        ),
+    'sigset_t': (None, ('__sigset_t',),
+        'sigset_t = __sigset_t'
+        ),
+    'fd_set': ('Structure', (),
+        'fd_set._fields_ = [\n'
+        "    ('fds_bits', __fd_mask * 16),\n"
+        ']'
+        ),
+    'select': (None, ('fd_set', 'timeval'),
+        "select = _libraries['/usr/lib/libmikmod.so'].select\n"
+        'select.restype = c_int\n'
+        'select.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timeval)]'
+        ),
+    'timespec': ('Structure', (),
+        'timespec._fields_ = [\n'
+        "    ('tv_sec', __time_t),\n"
+        "    ('tv_nsec', __syscall_slong_t),\n"
+        ']'
+        ),
+    'pselect': (None, ('__sigset_t', 'fd_set', 'timespec'),
+        "pselect = _libraries['/usr/lib/libmikmod.so'].pselect\n"
+        'pselect.restype = c_int\n'
+        'pselect.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timespec), POINTER(__sigset_t)]'
+        ),
+    'gnu_dev_major': (None, (),
+        "gnu_dev_major = _libraries['/usr/lib/libmikmod.so'].gnu_dev_major\n"
+        'gnu_dev_major.restype = c_uint\n'
+        'gnu_dev_major.argtypes = [c_ulonglong]'
+        ),
+    'gnu_dev_minor': (None, (),
+        "gnu_dev_minor = _libraries['/usr/lib/libmikmod.so'].gnu_dev_minor\n"
+        'gnu_dev_minor.restype = c_uint\n'
+        'gnu_dev_minor.argtypes = [c_ulonglong]'
+        ),
+    'gnu_dev_makedev': (None, (),
+        "gnu_dev_makedev = _libraries['/usr/lib/libmikmod.so'].gnu_dev_makedev\n"
+        'gnu_dev_makedev.restype = c_ulonglong\n'
+        'gnu_dev_makedev.argtypes = [c_uint, c_uint]'
+        ),
+    'fsid_t': (None, ('__fsid_t',),
+        'fsid_t = __fsid_t'
+        ),
+    '__locale_data': ('Structure', (),
+        '__locale_data._fields_ = [\n'
+        ']'
+        ),
+    'locale_t': (None, ('__locale_t',),
+        'locale_t = __locale_t'
+        ),
+}
+
+_bind_lazily(__name__, _definitions)
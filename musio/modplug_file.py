@@ -26,6 +26,7 @@
 from array import array
 
 from .io_base import AudioIO, io_wrapper
+from .io_util import c_array_from, zero_fill
 from .conversion_util import swap_endian
 
 # from .modplug import _modplug
@@ -206,38 +207,59 @@ class ModPlugFile(AudioIO):
         _modplug.ModPlug_SetSettings(_modplug.byref(self._modplug_settings))
 
     @io_wrapper
-    def read(self, size):
-        """ read(size) -> Reads size amount of data and returns it.
+    def readinto(self, barray):
+        """ readinto(barray) -> Render up to len(barray) bytes straight into
+        the bytearray barray and return the number of bytes read.
 
         """
 
-        str_buffer = _modplug.create_string_buffer(size)
-        data = b''
+        size = len(barray)
 
         # Don't loop past .01% of length.
         if self.position > (self.length + (.001 * self.length)):
             self._loop_count = self.position / self.length
             if self._loops != -1 and self._loop_count > self._loops:
-                return b''
+                return 0
+
+        out_buffer = c_array_from(_modplug.c_char, barray)
 
-        if _modplug.ModPlug_Read(self._modplug_file, str_buffer, size) != 0:
-            samples_read = len(str_buffer.raw) / (self._channels * self._depth >> 3)
+        bytes_read = _modplug.ModPlug_Read(self._modplug_file, out_buffer,
+                                           size)
+        if bytes_read > 0:
+            samples_read = bytes_read / (self._channels * self._depth >> 3)
             # Calculate the position in milliseconds.
             self._pos += samples_read // (self._rate / 1000)
-            data = self._proc_func(str_buffer.raw)
+
+            # Blank the end of a short read.
+            if bytes_read < size:
+                zero_fill(barray, bytes_read)
+
+            if self._bigendian and self._depth == 16:
+                swapped = self._proc_func(memoryview(barray).tobytes())
+                barray[:] = memoryview(swapped)
         else:
             # If no data was read then we have reached the end of the
             # file so restart or exit.
             if self._loops == -1 or self._loop_count < self._loops:
                 # Fill the buffer so we return the requested size.
-                data += b'\x00' * (size - len(data))
+                zero_fill(barray)
 
                 # Update the loop count and seek to the start.
                 self._loop_count += 1
                 self.seek(0)
+            else:
+                # Return 0 so the player will exit.
+                size = 0
+
+        return size
+
+    @io_wrapper
+    def read(self, size):
+        """ read(size) -> Reads size amount of data and returns it.
+
+        """
 
-        # Return the data if data = b'' then the player will exit.
-        return data
+        return self._read_with_readinto(size)
     read.__annotations__ = {'size': int, 'return': bytes}
 
     def close(self):
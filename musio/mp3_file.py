@@ -24,13 +24,20 @@
 """
 
 from os import getenv as os_getenv
-from sys import stderr as sys_stderr
 from array import array
+from collections import deque
+from struct import pack as struct_pack
 
-from .io_util import silence, msg_out
+from .io_util import msg_out, _load_cache, _save_cache
+from .io_util import _touch_cache, _prune_cache
 from .io_base import AudioIO, io_wrapper
-from .io_util import slice_buffer, Magic
+from .io_util import slice_buffer, Magic, c_array_from, zero_fill
+from .buffer_util import reuse_array
+from .conversion_util import convert_samples, sample_dtype
+from .conversion_util import unpack_three_byte
+from .crc_util import crc16_lame, crc16_lame_combine
 # from .mpg123 import _mpg123
+
 from .import_util import LazyImport
 
 _mpg123 = LazyImport('mpg123._mpg123', globals(), locals(),
@@ -51,6 +58,38 @@ SEEK_SET = 0 # Seek from beginning of file.
 SEEK_CUR = 1 # Seek from current position.
 SEEK_END = 2 # Seek from end of file.
 
+# The size of the buffer encoded frames are collected in before they are
+# written to the file.
+_WRITE_BUFFER_SIZE = 1 << 16
+
+# How many index cache files to keep.  The least recently used ones are
+# removed when a new one is saved.
+_INDEX_CACHE_FILES = 256
+
+# The layer III bitrates in kbps of MPEG-1, and of MPEG-2 and 2.5, by the
+# bitrate index in a frame header.
+_BITRATES = ((0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256,
+              320),
+             (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160))
+
+# The sample rates by the version bits and rate index in a frame header.
+_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000),
+                 0: (11025, 12000, 8000)}
+
+# The samples a decoder delays its output by.
+_DECODER_DELAY = 529
+
+# How many frames each segment encoded in the process pool has, and how
+# many frames before and after it are encoded with it so the encoder has
+# settled by the first frame kept and has the samples the last one
+# overlaps.
+_SEGMENT_FRAMES = 512
+_WARMUP_FRAMES = 3
+
+# The VBR method the LAME tag gives for each lame vbr mode.
+_VBR_METHODS = {0: 1, 1: 4, 2: 3, 3: 2, 4: 4}
+
+
 def get_genre_list():
     """ Returns a list of valid id3 genres.
 
@@ -90,22 +129,211 @@ def _check(err):
     return err
 
 
+def _frame_length(header):
+    """ _frame_length(header) -> Return the length of the layer III frame
+    that starts with the bytearray header, or 0 if it isn't one.
+
+    """
+
+    if len(header) < 4 or header[0] != 0xff or \
+            (header[1] & 0xe6) != 0xe2:
+        return 0
+
+    version = (header[1] >> 3) & 3
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 3
+
+    if version == 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return 0
+
+    mpeg1 = version == 3
+    bitrate = _BITRATES[0 if mpeg1 else 1][bitrate_index]
+    rate = _SAMPLE_RATES[version][rate_index]
+
+    return (144000 if mpeg1 else 72000) * bitrate // rate + \
+        ((header[2] >> 1) & 1)
+
+
+def _frame_sizes(data, size):
+    """ _frame_sizes(data, size) -> Return the sizes of the frames in the
+    first size bytes of the bytearray data.
+
+    """
+
+    sizes = []
+    offset = 0
+    while offset < size:
+        length = _frame_length(data[offset:offset + 4])
+        if not length or offset + length > size:
+            break
+        sizes.append(length)
+        offset += length
+
+    return sizes
+
+
+def _new_lame(channels, rate, quality, segmented=False):
+    """ _new_lame(channels, rate, quality, segmented=False) -> Return a new
+    lame set up to encode.  A segmented lame doesn't use the bit reservoir
+    or start with an empty frame for the VBR tag, so its frames can be
+    joined with the frames of other lames.
+
+    """
+
+    global_flags = _lame.lame_init()
+
+    if not global_flags:
+        raise(Exception("Error creating lame global structure"))
+
+    _lame.lame_set_num_channels(global_flags, channels)
+    _lame.lame_set_in_samplerate(global_flags, rate)
+    _lame.lame_set_quality(global_flags, quality)
+
+    # Disable auto id3 tag write.
+    _lame.lame_set_write_id3tag_automatic(global_flags, 0);
+
+    if segmented:
+        # Every lame has to use the same frames.
+        _lame.lame_set_out_samplerate(global_flags, rate)
+        _lame.lame_set_disable_reservoir(global_flags, 1)
+        _lame.lame_set_bWriteVbrTag(global_flags, 0)
+
+    if _lame.lame_init_params(global_flags) < 0:
+        raise(Exception("Error initializing lame"))
+
+    return global_flags
+
+
+def _encode_samples(global_flags, samples, channels, out_buffer):
+    """ _encode_samples(global_flags, samples, channels, out_buffer) ->
+    Encode the numpy array of interleaved 16-bit or float samples into the
+    ctypes array out_buffer, and return the number of bytes encoded.
+
+    """
+
+    import numpy
+
+    frames = len(samples) // channels
+
+    # lame reads the samples straight from the array.
+    if samples.dtype == numpy.float32:
+        in_buffer = samples.ctypes.data_as(_lame.POINTER(_lame.c_float))
+        if channels == 1:
+            encoded = _lame.lame_encode_buffer_ieee_float(
+                global_flags, in_buffer, in_buffer, frames, out_buffer,
+                len(out_buffer))
+        else:
+            encoded = _lame.lame_encode_buffer_interleaved_ieee_float(
+                global_flags, in_buffer, frames, out_buffer,
+                len(out_buffer))
+    else:
+        in_buffer = samples.ctypes.data_as(_lame.POINTER(_lame.c_short))
+        if channels == 1:
+            encoded = _lame.lame_encode_buffer(global_flags, in_buffer,
+                                               in_buffer, frames, out_buffer,
+                                               len(out_buffer))
+        else:
+            encoded = _lame.lame_encode_buffer_interleaved(
+                global_flags, in_buffer, frames, out_buffer,
+                len(out_buffer))
+
+    if encoded < 0:
+        raise IOError("Error encoding mp3: lame returned %d" % encoded)
+
+    return encoded
+
+
+def _encode_segment(args):
+    """ _encode_segment((data, floatp, channels, rate, quality, skip,
+    count)) -> Encode the samples in data with a lame of its own, and return
+    the count frames after the first skip, their sizes, and their CRC-16.
+
+    """
+
+    import numpy
+
+    data, floatp, channels, rate, quality, skip, count = args
+
+    samples = numpy.frombuffer(data, numpy.float32 if floatp
+                               else numpy.int16)
+
+    # Room for the samples and the flush.
+    encoded = bytearray(len(samples) // channels * 5 // 4 +
+                        2 * _lame.LAME_MAXMP3BUFFER)
+
+    global_flags = _new_lame(channels, rate, quality, segmented=True)
+    try:
+        size = _encode_samples(global_flags, samples, channels,
+                               c_array_from(_lame.c_ubyte, encoded))
+        size += max(_lame.lame_encode_flush(global_flags,
+                                            c_array_from(_lame.c_ubyte,
+                                                         encoded, size),
+                                            len(encoded) - size), 0)
+    finally:
+        _lame.lame_close(global_flags)
+
+    sizes = _frame_sizes(encoded, size)
+    start = sum(sizes[:skip])
+    sizes = sizes[skip:skip + count]
+    data = bytes(encoded[start:start + sum(sizes)])
+
+    return data, sizes, crc16_lame(data)
+
+
+def encode_parallel(source, dest, workers=0, quality=2, comment_dict={}):
+    """ encode_parallel(source, dest, workers=0, quality=2, comment_dict={})
+    -> Encode source, an AudioIO open for reading or the name of a file, to
+    the mp3 file dest with segments encoded in workers processes, or one per
+    cpu if workers is 0.
+
+    """
+
+    if not isinstance(source, AudioIO):
+        from .io_util import open_file
+
+        with open_file(source) as source_file:
+            return encode_parallel(source_file, dest, workers, quality,
+                                   comment_dict)
+
+    if source.depth not in MP3File._valid_depth:
+        raise ValueError("(MP3File) Can't encode %s bit samples, valid depths "
+                         "are %s" % (source.depth, MP3File._valid_depth))
+
+    source.loops = 0
+
+    with MP3File(dest, 'w', depth=source.depth, rate=source.rate,
+                 channels=source.channels, unsigned=source.unsigned,
+                 quality=quality, comment_dict=dict(comment_dict),
+                 floatp=source.floatp, workers=workers) as mp3_file:
+        for data in source:
+            mp3_file.write(data)
+
+
 class MP3File(AudioIO):
     """ A file like object for reading mp3s.
 
     """
 
     # Valid bit depths
-    _valid_depth = (32, 16, 8)
+    _valid_depth = (32, 24, 16, 8)
 
     # Only reading is supported
     _supported_modes = 'rw'
 
     def __init__(self, filename, mode='r', depth=16, rate=44100, channels=2,
-                 unsigned=False, quality=2, comment_dict={}, **kwargs):
+                 unsigned=False, quality=2, comment_dict={}, floatp=False,
+                 index_cache=False, workers=1, **kwargs):
         """ MP3File(filename, mode='r', depth=16, rate=44100, channels=2,
-        unsigned=False, quality=2, comment_dict={}) -> Initialize the playback
-        settings of the player.
+        unsigned=False, quality=2, comment_dict={}, floatp=False,
+        index_cache=False, workers=1) -> Initialize the playback settings of
+        the player.  If floatp is True the file is decoded to, or encoded
+        from, 32-bit floats.  If index_cache is True the file isn't scanned
+        when it is opened, the length comes from its Xing/Info header until
+        a scan in the background finds the exact length, and the frame index
+        from the scan is saved so the next open seeks exactly right away.
+        When writing with more than one worker (0 for one per cpu) segments
+        of the file are encoded in a process pool without the bit
+        reservoir.
 
         """
 
@@ -114,7 +342,10 @@ class MP3File(AudioIO):
         self._unsigned = unsigned
 
         if mode == 'r':
-            if depth in [8, 16, 32]:
+            if floatp:
+                # Let mpg123 produce floats directly.
+                encoding = _mpg123.MPG123_ENC_FLOAT_32
+            elif depth in [8, 16, 32]:
                 encoding = getattr(_mpg123, 'MPG123_ENC_%s_%s' %
                                 ('UNSIGNED' if unsigned else 'SIGNED',
                                     depth))
@@ -125,13 +356,25 @@ class MP3File(AudioIO):
 
             self._id3_dict = {}
 
+            # The buffer read decodes into, and the count mpg123_read
+            # fills, are kept for the life of the handle.
+            self._decode_buffer = bytearray()
+            self._bytes_read = _mpg123.c_size_t(0)
+            self._bytes_read_ref = _mpg123.byref(self._bytes_read)
+
+            # The frame index and length from a background scan waiting to
+            # be given to the handle.
+            self._index_cache = index_cache
+            self._scanned = None
+
             _check(_mpg123.mpg123_init())
             self._mpg123_handle = self._read_open(filename)
             self._length = _mpg123.mpg123_length(self._mpg123_handle)
 
-            self._update_info()
+            if index_cache:
+                self._open_index()
 
-            self._data = b''
+            self._update_info()
         else:
             if quality not in range(0, 10):
                 quality = 2
@@ -141,20 +384,37 @@ class MP3File(AudioIO):
             if not self._comment_dict.get('comment', ''):
                 self._comment_dict['comment'] = 'Encoded with %s' % __name__
 
-            self._global_flags = _lame.lame_init()
-
-            _lame.lame_set_quality(self._global_flags, quality)
-
-            # Disable auto id3 tag write.
-            _lame.lame_set_write_id3tag_automatic(self._global_flags, 0);
-
-            if not self._global_flags:
-                raise(Exception("Error creating lame global structure"))
-            if _lame.lame_init_params(self._global_flags) < 0:
-                raise(Exception("Error initializing lame"))
+            self._unsigned = unsigned
+            self._floatp = floatp
+            if floatp:
+                self._depth = 32
+                self._width = 4
+
+            # The bytes of a frame the last write ended with, the reused
+            # array of converted samples, and the reused buffer lame
+            # encodes into.
+            self.three_byte = self._depth == 24 and not floatp
+            sample_size = 3 if self.three_byte else self._width
+            self._frame_size = sample_size * self._channels
+            self._partial = b''
+            self._samples = None
+            self._encode_buffer = bytearray()
+
+            if not workers:
+                from multiprocessing import cpu_count
+                workers = cpu_count()
+            self._workers = workers
+            self._pool = None
+
+            # The segmented lame is only used for the tags and settings.
+            self._global_flags = _new_lame(self._channels, self._rate,
+                                           quality, segmented=workers > 1)
 
             self._out_file = self._write_open(filename)
 
+            if workers > 1:
+                self._pool_open()
+
     def __repr__(self):
         """ __repr__ -> Returns a python expression to recreate this instance.
 
@@ -179,9 +439,41 @@ class MP3File(AudioIO):
 
         """
 
+        if self._scanned:
+            self._use_index(self._scanned)
+
         _check(_mpg123.mpg123_seek(self._mpg123_handle, position,
                                    SEEK_SET))
 
+    def _set_position_fast(self, position):
+        """ Change the position of playback to the start of the frame
+        holding position, letting mpg123 guess the offset from the Xing
+        table of contents when it has not read that far.
+
+        """
+
+        handle = self._mpg123_handle
+        samples_per_frame = _mpg123.mpg123_spf(handle)
+        if samples_per_frame <= 0:
+            # Nothing decoded yet to know the frame size from.
+            return self._set_position(position)
+
+        if self._scanned:
+            self._use_index(self._scanned)
+
+        _check(_mpg123.mpg123_param(handle, _mpg123.MPG123_ADD_FLAGS,
+                                    _mpg123.MPG123_FUZZY, 0.0))
+        try:
+            # A negative offset is an error code.
+            frame = _mpg123.mpg123_seek_frame(handle,
+                                              position // samples_per_frame,
+                                              SEEK_SET)
+            if frame < 0:
+                _check(frame)
+        finally:
+            _check(_mpg123.mpg123_param(handle, _mpg123.MPG123_REMOVE_FLAGS,
+                                        _mpg123.MPG123_FUZZY, 0.0))
+
     def _get_position(self):
         """ Updates the position variable.
 
@@ -200,6 +492,11 @@ class MP3File(AudioIO):
         mpg123_handle = _mpg123.mpg123_new(None, _mpg123.byref(err))
         _check(err)
 
+        # Have mpg123 keep its messages to itself once here, instead of
+        # redirecting stderr around every call.
+        _check(_mpg123.mpg123_param(mpg123_handle, _mpg123.MPG123_ADD_FLAGS,
+                                    _mpg123.MPG123_QUIET, 0.0))
+
         try:
             bytes_filename = filename.encode('utf-8', 'surrogateescape')
         except AttributeError:
@@ -208,7 +505,9 @@ class MP3File(AudioIO):
         if _check(_mpg123.mpg123_open(mpg123_handle, bytes_filename)):
             raise IOError("There was an error opening %s" % filename)
 
-        with silence(sys_stderr):
+        # Reading the whole file for the exact length is left to the
+        # background scan when using the index cache.
+        if not self._index_cache:
             _check(_mpg123.mpg123_scan(mpg123_handle))
 
         _check(_mpg123.mpg123_format_none(mpg123_handle))
@@ -230,17 +529,154 @@ class MP3File(AudioIO):
         self._channels = channels.value
         self._encoding = encoding.value
 
-        # Grab the depth from the encoding.
-        for k, i in vars(_mpg123).items():
-            if i == encoding.value:
-                k_split = k.split('_')
-                self._depth = int(k_split[-1])
-                self._unsigned = k_split[-2] != 'SIGNED'
+        if encoding.value == _mpg123.MPG123_ENC_FLOAT_32:
+            self._floatp = True
+            self._depth = 32
+            self._unsigned = False
+        else:
+            # Grab the depth from the encoding.
+            for k, i in vars(_mpg123).items():
+                if i == encoding.value and k.startswith('MPG123_ENC_'):
+                    k_split = k.split('_')
+                    self._depth = int(k_split[-1])
+                    self._unsigned = k_split[-2] != 'SIGNED'
+
+        self._width = self._depth // 8
 
         self._closed = False
 
         return mpg123_handle
 
+    def _index_key(self):
+        """ _index_key() -> Return the name of the index cache file for this
+        file, its path as bytes, and the path, size and mtime the index is
+        only good for.
+
+        """
+
+        from hashlib import sha1
+        from os import stat as os_stat
+        from os.path import realpath as os_realpath
+        from sys import getfilesystemencoding
+
+        path = os_realpath(self._filename)
+        stat = os_stat(path)
+
+        # The key is compared with one read back from JSON, which always
+        # gives text, so keep the path in it as text too.
+        if isinstance(path, bytes):
+            path_bytes = path
+            encoding = getfilesystemencoding() or 'utf-8'
+            try:
+                path = path.decode(encoding, 'surrogateescape')
+            except LookupError:
+                path = path.decode(encoding, 'replace')
+        else:
+            try:
+                path_bytes = path.encode('utf-8', 'surrogateescape')
+            except LookupError:
+                path_bytes = path.encode(getfilesystemencoding() or 'utf-8')
+
+        name = 'mp3index-%s.json' % sha1(path_bytes).hexdigest()
+
+        return name, path_bytes, [path, stat.st_size, stat.st_mtime]
+
+    def _open_index(self):
+        """ _open_index() -> Use the saved frame index and exact length if
+        the file hasn't changed since they were saved, otherwise start
+        scanning the file in the background.
+
+        """
+
+        from threading import Thread
+
+        try:
+            name, path_bytes, key = self._index_key()
+        except (OSError, UnicodeError) as err:
+            msg_out("Unable to index %s: %s" % (self._filename, err))
+            return
+
+        saved = _load_cache(name)
+        if saved.get('key') == key:
+            _touch_cache(name)
+            self._use_index((saved['offsets'], saved['step'],
+                             saved['length']))
+            return
+
+        scan_thread = Thread(target=self._scan, args=(name, path_bytes, key))
+        scan_thread.daemon = True
+        scan_thread.start()
+
+    def _scan(self, name, path_bytes, key):
+        """ _scan(name, path_bytes, key) -> Scan the file at path_bytes with a
+        handle of its own, save its frame index and exact length with key in
+        the cache file name, and leave them for the reading handle to use.
+
+        """
+
+        err = _mpg123.c_int()
+        mpg123_handle = _mpg123.mpg123_new(None, _mpg123.byref(err))
+        if not mpg123_handle:
+            return
+
+        try:
+            _mpg123.mpg123_param(mpg123_handle, _mpg123.MPG123_ADD_FLAGS,
+                                 _mpg123.MPG123_QUIET, 0.0)
+
+            if _check(_mpg123.mpg123_open(mpg123_handle, path_bytes)):
+                return
+
+            # Decode to the same format so the length is in the same
+            # samples.
+            _mpg123.mpg123_format_none(mpg123_handle)
+            _mpg123.mpg123_format(mpg123_handle, self._rate, self._channels,
+                                  self._encoding)
+
+            if _check(_mpg123.mpg123_scan(mpg123_handle)):
+                return
+
+            offsets = _mpg123.POINTER(_mpg123.off_t)()
+            step = _mpg123.off_t()
+            fill = _mpg123.c_size_t()
+            if _check(_mpg123.mpg123_index(mpg123_handle,
+                                           _mpg123.byref(offsets),
+                                           _mpg123.byref(step),
+                                           _mpg123.byref(fill))):
+                return
+
+            index = (offsets[:fill.value], step.value,
+                     _mpg123.mpg123_length(mpg123_handle))
+
+            _mpg123.mpg123_close(mpg123_handle)
+        finally:
+            _mpg123.mpg123_delete(mpg123_handle)
+
+        _save_cache(name, {'key': key, 'offsets': index[0],
+                           'step': index[1], 'length': index[2]})
+        _prune_cache('mp3index-', _INDEX_CACHE_FILES)
+
+        # The reading handle isn't thread safe so it takes the index on
+        # the next read or seek.
+        self._scanned = index
+
+    def _use_index(self, index):
+        """ _use_index((offsets, step, length)) -> Give the handle the frame
+        index and use the exact length.
+
+        """
+
+        offsets, step, length = index
+        self._scanned = None
+
+        if self.closed:
+            return
+
+        offset_array = (_mpg123.off_t * len(offsets))(*offsets)
+        _check(_mpg123.mpg123_set_index(self._mpg123_handle, offset_array,
+                                        step, len(offsets)))
+
+        self._length = length
+
     def _write_open(self, filename):
         """ _write_open(filename) -> Load the specified file.
 
@@ -301,10 +737,13 @@ class MP3File(AudioIO):
                                              id3v2_size)
         out_data = _lame.string_at(id3v2_tag, id3v2_len)
 
-        out_file = open(filename, 'wb')
+        # Encoded frames are small so let the file collect them.
+        out_file = open(filename, 'wb', _WRITE_BUFFER_SIZE)
 
-        # Write out the id3v2 tags.
+        # Write out the id3v2 tags.  The lametag frame goes right after them
+        # when the file is closed.
         out_file.write(out_data)
+        self._id3v2_size = id3v2_len
 
         self._closed = False
 
@@ -468,83 +907,314 @@ class MP3File(AudioIO):
         self._id3_dict = self._info_dict = id3_dict
 
     @io_wrapper
-    def read(self, size):
-        """ read(size=None) -> Reads size amount of data and returns it.  If
-        size is None then read a buffer size.
+    def readinto(self, barray):
+        """ readinto(barray) -> Decode up to len(barray) bytes straight into
+        the bytearray barray and return the number of bytes read.
 
         """
 
-        byte_buffer = (_mpg123.c_ubyte * size)()
-        bytes_read = _mpg123.c_size_t(-1)
-        data = self._data
-        while len(data) < size:
-            with silence(sys_stderr):
-                err = _check(_mpg123.mpg123_read(self._mpg123_handle,
-                                                 byte_buffer, size,
-                                                 _mpg123.byref(bytes_read)))
+        if self._scanned:
+            self._use_index(self._scanned)
+
+        size = len(barray)
+        bytes_read = self._bytes_read
+        bytes_read_ref = self._bytes_read_ref
+        mpg123_read = _mpg123.mpg123_read
+        handle = self._mpg123_handle
+        offset = 0
+
+        # Decode straight into barray, only making a new view of it when
+        # a short read leaves part of it unfilled.
+        out_buffer = c_array_from(_mpg123.c_ubyte, barray)
+
+        while offset < size:
+            _check(mpg123_read(handle, out_buffer, size - offset,
+                               bytes_read_ref))
 
             if bytes_read.value == 0:
                 if self._loops != -1 and self._loop_count >= self._loops:
-                    if len(data) != 0:
-                        data += b'\x00' * (size - len(data))
+                    if offset != 0:
+                        zero_fill(barray, offset)
+                        offset = size
                     break
                 else:
                     self._loop_count += 1
                     self.seek(0)
                     continue
 
-            data += _mpg123.string_at(byte_buffer, bytes_read.value)
+            offset += bytes_read.value
+
+            if offset < size:
+                out_buffer = c_array_from(_mpg123.c_ubyte, barray, offset)
+
+        return offset
+
+    @io_wrapper
+    def read(self, size):
+        """ read(size=None) -> Reads size amount of data and returns it.  If
+        size is None then read a buffer size.
+
+        """
+
+        # Decode into the handle's buffer, which is kept while reads are
+        # the same size.
+        if len(self._decode_buffer) != size:
+            self._decode_buffer = bytearray(size)
 
-        # Make sure we return only the number of bytes requested.
-        self._data = data[size:]
+        # readinto gets the bytearray itself, since ctypes and numpy on
+        # Python 2 won't take a writable memoryview.
+        data = self._decode_buffer
 
-        return data[:size]
+        return memoryview(data)[:self.readinto(data) or 0].tobytes()
     read.__annotations__ = {'size': int, 'return': bytes}
 
+    def _to_samples(self, data):
+        """ _to_samples(data) -> Return the whole frames in data, after any
+        left from the last write, as a numpy array of the 16-bit or float
+        samples lame encodes.  Native 16-bit and float data is used as it
+        is.
+
+        """
+
+        import numpy
+
+        if self._partial:
+            data = self._partial + memoryview(data).tobytes()
+
+        # Keep the bytes of a partial frame for the next write.
+        extra = len(data) % self._frame_size
+        self._partial = memoryview(data)[len(data) - extra:].tobytes() \
+            if extra else b''
+
+        if self.three_byte:
+            # Unpack 24-bit samples to 32-bit integers holding 24 bits.
+            raw = numpy.frombuffer(data, numpy.uint8, len(data) - extra)
+            samples = unpack_three_byte(raw, self._bigendian, self._unsigned)
+        else:
+            dtype = sample_dtype(self._depth, self._unsigned,
+                                 self._bigendian, self._floatp)
+            samples = numpy.frombuffer(data, dtype,
+                                       (len(data) - extra) // dtype.itemsize)
+
+        if self._floatp or samples.dtype == numpy.int16:
+            return samples
+
+        # Convert 8-bit samples to 16-bit, and keep the precision of 32-bit
+        # samples by converting them to floats.
+        out_dtype = numpy.float32 if self._depth > 16 else numpy.int16
+        self._samples = reuse_array(self._samples, len(samples), out_dtype)
+
+        return convert_samples(samples, self._depth, self._unsigned,
+                               out_dtype, self._samples[:len(samples)])
+
     @io_wrapper
     def write(self, data):
-        """ write(str) -> Encodes and writes str to an mp3 file.
+        """ write(data) -> Encode data and write it to the mp3 file, and
+        return the number of bytes of data used.
 
         """
 
-        # Number of samples = bytes / ((bits per sample) / 8)
-        num_samples = len(data) // (self._depth // 8)
-        samples_per_chan = num_samples // self._channels
-
-        # Create a buffer to hold the encoded data.
-        encoded_data = (_lame.c_ubyte * _lame.LAME_MAXMP3BUFFER)()
-
-        # Split the data into samples.
-        if self._depth == 16:
-            # Two bytes per sample.
-            data_bytes = array('h', data)
-        elif self._depth == 8:
-            # One byte per sample.
-            data_bytes = array('b', data)
-
-        # in_buffer_l = (_lame.c_short * samples_per_chan)(*data_bytes[::2])
-        # in_buffer_r = (_lame.c_short * samples_per_chan)(*data_bytes[1::2])
-        # bytes_encoded = _lame.lame_encode_buffer(self._global_flags,
-        #                                             in_buffer_l,
-        #                                             in_buffer_r,
-        #                                             samples_per_chan,
-        #                                             encoded_data,
-        #                                             0)
-
-        in_buffer = (_lame.c_short * num_samples)(*data_bytes)
-        bytes_encoded = _lame.lame_encode_buffer_interleaved(self._global_flags,
-                                                    in_buffer,
-                                                    samples_per_chan,
-                                                    encoded_data,
-                                                    _lame.sizeof(encoded_data))
-
-        # Retrieve the encoded audio data from buffer.
-        out_data = _lame.string_at(encoded_data, bytes_encoded)
-
-        # Write data to the file.
-        return self._out_file.write(out_data)
+        samples = self._to_samples(data)
+
+        if self._pool:
+            self._pool_write(samples)
+            return len(data)
+
+        frames = len(samples) // self._channels
+        if not frames:
+            return len(data)
+
+        # The most lame can produce for frames samples.
+        size = frames * 5 // 4 + 7200
+        if len(self._encode_buffer) < size:
+            self._encode_buffer = bytearray(size)
+
+        encoded = _encode_samples(self._global_flags, samples,
+                                  self._channels,
+                                  c_array_from(_lame.c_ubyte,
+                                               self._encode_buffer))
+
+        self._out_file.write(memoryview(self._encode_buffer)[:encoded])
+
+        return len(data)
     write.__annotations__ = {'data': bytes, 'return': int}
 
+    def _pool_open(self):
+        """ _pool_open() -> Start the process pool the segments are encoded
+        in.
+
+        """
+
+        from multiprocessing import Pool
+
+        import numpy
+
+        # Segments are whole frames so every frame a worker encodes starts
+        # where the same frame of one lame encoding everything would.
+        self._frame_samples = _lame.lame_get_framesize(self._global_flags)
+        self._encoder_delay = _lame.lame_get_encoder_delay(self._global_flags)
+
+        dtype = numpy.float32 if self._floatp or self._depth > 16 \
+            else numpy.int16
+        self._segment = numpy.empty((_SEGMENT_FRAMES + 2 * _WARMUP_FRAMES) *
+                                    self._frame_samples * self._channels,
+                                    dtype)
+        self._segment_fill = 0
+        self._segment_skip = 0
+
+        # The results of the segments being encoded in order, how many
+        # frames have been sent and how many samples written, and the sizes
+        # and CRC-16 of the frames written.
+        self._pending = deque()
+        self._frames_sent = 0
+        self._total_samples = 0
+        self._frame_sizes = []
+        self._music_crc = 0
+
+        # Where the VBR tag goes, and the header of the first frame it is
+        # made from.
+        self._info_offset = None
+        self._info_header = None
+
+        self._pool = Pool(self._workers)
+
+    def _pool_write(self, samples):
+        """ _pool_write(samples) -> Add samples to the segment, and send each
+        full segment to the process pool.
+
+        """
+
+        self._total_samples += len(samples) // self._channels
+
+        frame_size = self._frame_samples * self._channels
+        segment = self._segment
+
+        offset = 0
+        while offset < len(samples):
+            # The segment is full when it has the frames after it too.
+            limit = (self._segment_skip + _SEGMENT_FRAMES + _WARMUP_FRAMES) * \
+                frame_size
+            count = min(len(samples) - offset, limit - self._segment_fill)
+            segment[self._segment_fill:self._segment_fill + count] = \
+                samples[offset:offset + count]
+            self._segment_fill += count
+            offset += count
+
+            if self._segment_fill == limit:
+                self._pool_encode(_SEGMENT_FRAMES)
+
+                # The next segment starts with the frames around the join.
+                keep = 2 * _WARMUP_FRAMES * frame_size
+                segment[:keep] = segment[limit - keep:limit]
+                self._segment_fill = keep
+                self._segment_skip = _WARMUP_FRAMES
+
+        # Write what has been encoded, and don't let more than two segments
+        # per process wait.
+        while self._pending and (self._pending[0].ready() or
+                                 len(self._pending) > 2 * self._workers):
+            self._pool_finish_segment()
+
+    def _pool_encode(self, count):
+        """ _pool_encode(count) -> Send the segment to the process pool to
+        encode count frames after the ones it skips.
+
+        """
+
+        args = (self._segment[:self._segment_fill].tobytes(),
+                self._segment.dtype.kind == 'f', self._channels, self._rate,
+                self._quality, self._segment_skip, count)
+        self._pending.append(self._pool.apply_async(_encode_segment,
+                                                    (args, )))
+
+        self._frames_sent += count
+
+    def _pool_finish_segment(self):
+        """ _pool_finish_segment() -> Wait for the oldest segment and write
+        its frames.
+
+        """
+
+        data, sizes, crc = self._pending.popleft().get()
+
+        if sizes and self._info_offset is None:
+            # Leave room for the VBR tag before the first frame.
+            self._info_header = bytearray(data[:4])
+            self._info_offset = self._out_file.tell()
+            self._out_file.write(b'\0' * len(self._info_frame()))
+
+        self._out_file.write(data)
+
+        self._frame_sizes.extend(sizes)
+        self._music_crc = crc16_lame_combine(self._music_crc, crc, len(data))
+
+    def _info_frame(self):
+        """ _info_frame() -> Return the frame with the Xing or Info tag and
+        the LAME tag for the frames written, so players know the length and
+        can seek and play it gapless.
+
+        """
+
+        header = bytearray(self._info_header)
+
+        # The tags go after the side info.
+        mpeg1 = (header[1] >> 3) & 3 == 3
+        mono = header[3] >> 6 == 3
+        if mpeg1:
+            offset = 4 + (17 if mono else 32)
+        else:
+            offset = 4 + (9 if mono else 17)
+
+        # Use the smallest bitrate the tags fit in, without a CRC or
+        # padding.
+        header[1] |= 0x01
+        for index in range(1, 15):
+            header[2] = (index << 4) | (header[2] & 0x0c)
+            if _frame_length(header) >= offset + 156:
+                break
+
+        frame = bytearray(_frame_length(header))
+        frame[:4] = header
+
+        count = len(self._frame_sizes)
+        total = len(frame) + sum(self._frame_sizes)
+
+        # The byte each percent of the frames starts at, out of 256.
+        toc = bytearray(100)
+        position = len(frame)
+        frame_index = 0
+        for percent in range(100):
+            while frame_index < percent * count // 100:
+                position += self._frame_sizes[frame_index]
+                frame_index += 1
+            toc[percent] = min(255, position * 256 // total)
+
+        global_flags = self._global_flags
+        vbr = _lame.lame_get_VBR(global_flags)
+        padding = count * self._frame_samples - self._encoder_delay - \
+            self._total_samples
+        version = (_lame.get_lame_very_short_version() or b'LAME')[:9]
+
+        tag = struct_pack('>4sIII', b'Xing' if vbr != _lame.vbr_off
+                          else b'Info', 0x0f, count, total) + bytes(toc)
+        tag += struct_pack('>I', max(0, 100 - 10 *
+                                     _lame.lame_get_VBR_q(global_flags) -
+                                     self._quality))
+        tag += version.ljust(9, b' ')
+        tag += struct_pack('>BB8xBB', _VBR_METHODS.get(vbr, 1),
+                           min(255, max(0, _lame.lame_get_lowpassfreq(
+                               global_flags) // 100)), 0,
+                           min(255, _lame.lame_get_brate(global_flags)))
+        tag += struct_pack('>I', (min(self._encoder_delay, 4095) << 12 |
+                                  min(max(padding, 0), 4095)))[1:]
+        tag += struct_pack('>BBHIH', 0, 0, 0, total, self._music_crc)
+
+        frame[offset:offset + len(tag)] = tag
+        end = offset + len(tag)
+        frame[end:end + 2] = struct_pack('>H', crc16_lame(frame[:end]))
+
+        return bytes(frame)
+
     def close(self):
         """ close -> Closes and cleans up.
 
@@ -579,19 +1249,21 @@ class MP3File(AudioIO):
 
         """
 
+        if self._out_file and not self._closed and self._pool:
+            return self._pool_close()
+
         if self._out_file and not self._closed:
-            # Create a buffer to hold the encoded data.
-            encoded_data = (_lame.c_ubyte * _lame.LAME_MAXMP3BUFFER)()
+            # Flush the last of the samples into the encode buffer.
+            if len(self._encode_buffer) < _lame.LAME_MAXMP3BUFFER:
+                self._encode_buffer = bytearray(_lame.LAME_MAXMP3BUFFER)
+            encoded_data = c_array_from(_lame.c_ubyte, self._encode_buffer)
 
-            # Flush the buffer and get the last buffer to write.
             ret = _lame.lame_encode_flush(self._global_flags, encoded_data,
-                                          _lame.sizeof(encoded_data))
-
-            # Retrieve the encoded audio data from buffer.
-            out_data = _lame.string_at(encoded_data, ret)
+                                          len(encoded_data))
 
             # Write it to the file.
-            self._out_file.write(out_data)
+            if ret > 0:
+                self._out_file.write(memoryview(self._encode_buffer)[:ret])
 
             # Write the v1 tag.
             id3v1_tag = (_lame.c_ubyte * 128)()
@@ -600,15 +1272,56 @@ class MP3File(AudioIO):
             out_data = _lame.string_at(id3v1_tag, id3v1_len)
             self._out_file.write(out_data)
 
-            # Write lametag.
-            lametag = (_lame.c_ubyte * _lame.LAME_MAXMP3BUFFER)()
+            # Write the lametag over the empty frame lame started the
+            # stream with.
             lametag_len = _lame.lame_get_lametag_frame(self._global_flags,
-                                                       lametag,
-                                                       _lame.sizeof(lametag))
-            out_data = _lame.string_at(lametag, lametag_len)
-            self._out_file.write(out_data)
+                                                       encoded_data,
+                                                       len(encoded_data))
+            if lametag_len:
+                self._out_file.seek(self._id3v2_size)
+                self._out_file.write(
+                    memoryview(self._encode_buffer)[:lametag_len])
 
             self._out_file.close()
             _lame.lame_close(self._global_flags)
 
+            self._closed = True
+
+        return self._closed
+
+    def _pool_close(self):
+        """ _pool_close() -> Encode the last segment, write the tags and
+        close the file.
+
+        """
+
+        # Enough frames for a decoder to play every sample.
+        frames = -(-(self._total_samples + self._encoder_delay +
+                     _DECODER_DELAY) // self._frame_samples)
+
+        try:
+            if frames > self._frames_sent:
+                self._pool_encode(frames - self._frames_sent)
+            while self._pending:
+                self._pool_finish_segment()
+        finally:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+        # Write the v1 tag.
+        id3v1_tag = (_lame.c_ubyte * 128)()
+        id3v1_len = _lame.lame_get_id3v1_tag(self._global_flags, id3v1_tag,
+                                            _lame.sizeof(id3v1_tag))
+        self._out_file.write(_lame.string_at(id3v1_tag, id3v1_len))
+
+        if self._info_offset is not None:
+            self._out_file.seek(self._info_offset)
+            self._out_file.write(self._info_frame())
+
+        self._out_file.close()
+        _lame.lame_close(self._global_flags)
+
+        self._closed = True
+
         return self._closed
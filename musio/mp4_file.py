@@ -28,6 +28,7 @@ from sys import stdout as sys_stdout
 from .aac_file import AACDecoder
 from .io_base import AudioIO, io_wrapper
 from .io_util import silence
+from .buffer_util import RingBuffer
 # from .mp4v2 import _mp4v2
 
 from .import_util import LazyImport
@@ -70,31 +71,68 @@ class Mp4File(AudioIO):
 
         self._update_info()
 
-        self._length = self._mp4_handle.sample_count
+        # The frames each AAC sample decodes to, which is more than 1024
+        # when implicit SBR is upsampled.
+        self._sample_frames = 1024
+        self._length = self._mp4_handle.sample_count * self._sample_frames
 
-        self._data = b''
+        self._data = RingBuffer()
+
+        # The frame after the last one decoded and the frame an exact seek
+        # drops decoded data up to.
+        self._decoded_end = 0
+        self._discard_to = -1
 
     def to_seconds(self, position):
         """ Convert the provided position/length to seconds.
 
         """
 
-        return (position * 1024) / self._rate
+        return position / self._rate
 
     def _set_position(self, position):
-        """ Change the position of playback.
+        """ Change the position of playback to exactly frame position.  The
+        AAC sample before the one holding it is decoded and dropped so the
+        decoder has warmed up by then.
+
+        """
+
+        position = max(0, position)
+        sample = position // self._sample_frames
+        self._seek_sample(max(0, sample - 1), position)
+
+    def _set_position_fast(self, position):
+        """ Change the position of playback to the start of the AAC sample
+        holding frame position.
+
+        """
+
+        self._seek_sample(max(0, position) // self._sample_frames, -1)
+
+    def _seek_sample(self, sample, discard_to):
+        """ _seek_sample(sample, discard_to) -> Start decoding at AAC sample
+        number sample, counting from 0, dropping decoded data up to frame
+        discard_to.
 
         """
 
-        self._mp4_handle.current_sample = position
+        # The mp4 numbers samples from 1.
+        self._mp4_handle.current_sample = sample + 1
+        sample = self._mp4_handle.current_sample - 1
+        self._aac_decoder.post_seek_reset(sample)
+
+        self._data.clear()
+        self._decoded_end = sample * self._sample_frames
+        self._discard_to = discard_to
 
     def _get_position(self):
-        """ Updates the position variable.
+        """ Returns the frame that will be read next.
 
         """
 
-        # Update the position.
-        return self._mp4_handle.current_sample
+        frame_size = self._channels * self._depth // 8
+
+        return self._decoded_end - len(self._data) // frame_size
 
     def _open(self, filename):
         """ _open(filename) -> Load the specified file.
@@ -151,6 +189,8 @@ class Mp4File(AudioIO):
 
         data = self._data
 
+        frame_size = self._channels * self._depth // 8
+
         while len(data) < size:
             # Read the next sample.
             sample = self._mp4_handle.read()
@@ -160,25 +200,41 @@ class Mp4File(AudioIO):
                     if len(data) != 0:
                         # Fill data buffer until it is the requested
                         # size.
-                        data += b'\x00' * (size - len(data))
+                        data.pad(size)
                     break
                 else:
                     self._loop_count += 1
-                    self.seek(1)
+
+                    # Go back to the start keeping what is in the buffer,
+                    # which is then counted as before it.
+                    self._mp4_handle.current_sample = 1
+                    self._aac_decoder.post_seek_reset(0)
+                    self._decoded_end = len(data) // frame_size
+                    self._discard_to = -1
                     continue
 
-            # Decode data into a temporary buffer.
-            temp_data = self._aac_decoder.decode(sample.data,
-                                                 sample.size.value)
+            # Decode straight into the data buffer.
+            decoded = self._aac_decoder.decode_into(sample.data,
+                                                    sample.size.value,
+                                                    data) // frame_size
+
+            if decoded > self._sample_frames:
+                self._sample_frames = decoded
+                self._length = self._mp4_handle.sample_count * decoded
 
-            # Append decoded data to the data buffer.
-            data += temp_data
+            start = self._decoded_end
+            self._decoded_end += decoded
 
-        # Store extra data for next read.
-        self._data = data[size:]
+            # Drop what decodes before the frame an exact seek was to.
+            if self._discard_to > start:
+                data.skip((min(self._discard_to, self._decoded_end) - start)
+                          * frame_size)
+                if self._discard_to <= self._decoded_end:
+                    self._discard_to = -1
 
-        # Only return the requested amount of data.
-        return data[:size]
+        # Only return the requested amount of data and keep the rest for
+        # the next read.
+        return data.read(size)
     read.__annotations__ = {'size': int, 'return': bytes}
 
     def close(self):
@@ -1,31 +1,12 @@
-# -*- coding: UTF8 -*-
-#
-# python mp4v2 wrapper library.
-# Generated with h2xml and xml2py then modified.
-# Copyright (C) 2011 Josiah Gordon <josiahg@gmail.com>
-# 
-# This program is free software: you can redistribute it and/or modify
-# it under the terms of the GNU General Public License as published by
-# the Free Software Foundation, either version 3 of the License, or
-# (at your option) any later version.
-# 
-# This program is distributed in the hope that it will be useful,
-# but WITHOUT ANY WARRANTY; without even the implied warranty of
-# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
-# GNU General Public License for more details.
-# 
-# You should have received a copy of the GNU General Public License
-# along with this program.  If not, see <http://www.gnu.org/licenses/>.
-
-
 """ python mp4v2 wrapper module.
 
 """
 
 from ctypes import *
+from ..import_util import LazyLibraries as _LazyLibraries
+from ..import_util import bind_lazily as _bind_lazily
 
-_libraries = {}
-_libraries['/usr/lib/libmp4v2.so'] = CDLL('/usr/lib/libmp4v2.so')
+_libraries = _LazyLibraries()
 STRING = c_char_p
 
 
@@ -39,49 +20,20 @@ def __REDIRECT_NTH_LDBL(name,proto,alias): return __REDIRECT_NTH (name, proto, a
 def __STRING(x): return #x # macro
 def __warnattr(msg): return __attribute__((__warning__ (msg))) # macro
 def __PMT(args): return args # macro
-class _IO_FILE(Structure):
-    pass
-stdout = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmp4v2.so'], 'stdout')
-stdout = stdout # alias
-stdin = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmp4v2.so'], 'stdin')
-stdin = stdin # alias
 # def __REDIRECT(name,proto,alias): return name proto __asm__ (__ASMNAME (#alias)) # macro
 def __REDIRECT_LDBL(name,proto,alias): return __REDIRECT (name, proto, alias) # macro
 _G_HAVE_SYS_WAIT = 1 # Variable c_int '1'
 _IO_HAVE_SYS_WAIT = _G_HAVE_SYS_WAIT # alias
 def MP4_IS_VALID_FILE_HANDLE(x): return ((x) != MP4_INVALID_FILE_HANDLE) # macro
-stderr = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmp4v2.so'], 'stderr')
-stderr = stderr # alias
 # __S32_TYPE = int # alias
 # __PID_T_TYPE = __S32_TYPE # alias
 # def MP4_IS_HINT_TRACK_TYPE(type): return (!strcasecmp(type, MP4_HINT_TRACK_TYPE)) # macro
 # def __nonnull(params): return __attribute__ ((__nonnull__ params)) # macro
 # def _IO_PENDING_OUTPUT_COUNT(_fp): return ((_fp)->_IO_write_ptr - (_fp)->_IO_write_base) # macro
 # _IO_file_flags = _flags # alias
-def putc(_ch,_fp): return _IO_putc (_ch, _fp) # macro
 def __GLIBC_PREREQ(maj,min): return ((__GLIBC__ << 16) + __GLIBC_MINOR__ >= ((maj) << 16) + (min)) # macro
-class _G_fpos64_t(Structure):
-    pass
 __quad_t = c_longlong
 __off64_t = __quad_t
-class __mbstate_t(Structure):
-    pass
-class N11__mbstate_t3DOT_2E(Union):
-    pass
-N11__mbstate_t3DOT_2E._fields_ = [
-    ('__wch', c_uint),
-    ('__wchb', c_char * 4),
-]
-__mbstate_t._fields_ = [
-    ('__count', c_int),
-    ('__value', N11__mbstate_t3DOT_2E),
-]
-_G_fpos64_t._pack_ = 4
-_G_fpos64_t._fields_ = [
-    ('__pos', __off64_t),
-    ('__state', __mbstate_t),
-]
-_IO_fpos64_t = _G_fpos64_t # alias
 # def __LDBL_REDIR(name,proto): return name proto # macro
 def va_arg(v,l): return __builtin_va_arg(v,l) # macro
 # _G_wint_t = wint_t # alias
@@ -114,13 +66,6 @@ __off_t = c_long
 _G_off_t = __off_t # alias
 _IO_off_t = _G_off_t # alias
 def __CONCAT(x,y): return x ## y # macro
-class _G_fpos_t(Structure):
-    pass
-_G_fpos_t._fields_ = [
-    ('__pos', __off_t),
-    ('__state', __mbstate_t),
-]
-_IO_fpos_t = _G_fpos_t # alias
 # _G_stat64 = stat64 # alias
 # def __LDBL_REDIR1_NTH(name,proto,alias): return name proto __THROW # macro
 # _IO_wint_t = _G_wint_t # alias
@@ -146,7 +91,6 @@ def __va_arg_pack(): return __builtin_va_arg_pack () # macro
 def __va_arg_pack_len(): return __builtin_va_arg_pack_len () # macro
 def __va_copy(d,s): return __builtin_va_copy(d,s) # macro
 # def __warndecl(name,msg): return extern void name (void) __attribute__((__warning__ (msg))) # macro
-def getc(_fp): return _IO_getc (_fp) # macro
 def offsetof(TYPE,MEMBER): return __builtin_offsetof (TYPE, MEMBER) # macro
 def _PARAMS(protos): return __P(protos) # macro
 def va_copy(d,s): return __builtin_va_copy(d,s) # macro
@@ -210,7 +154,6 @@ __SQUAD_TYPE = __quad_t # alias
 __BLKCNT64_T_TYPE = __SQUAD_TYPE # alias
 __codecvt_ok = 0
 # __MODE_T_TYPE = __U32_TYPE # alias
-_IO_pos_t = _G_fpos_t # alias
 __S64_TYPE = __quad_t # alias
 # def MP4_IS_VIDEO_TRACK_TYPE(type): return (!strcasecmp(type, MP4_VIDEO_TRACK_TYPE)) # macro
 FILEMODE_UNDEFINED = 0
@@ -570,47 +513,6 @@ _G_int16_t = c_short
 _G_int32_t = c_int
 _G_uint16_t = c_ushort
 _G_uint32_t = c_uint
-vprintf = _libraries['/usr/lib/libmp4v2.so'].vprintf
-vprintf.restype = c_int
-vprintf.argtypes = [STRING, __gnuc_va_list]
-getchar = _libraries['/usr/lib/libmp4v2.so'].getchar
-getchar.restype = c_int
-getchar.argtypes = []
-FILE = _IO_FILE
-fgetc_unlocked = _libraries['/usr/lib/libmp4v2.so'].fgetc_unlocked
-fgetc_unlocked.restype = c_int
-fgetc_unlocked.argtypes = [POINTER(FILE)]
-getc_unlocked = _libraries['/usr/lib/libmp4v2.so'].getc_unlocked
-getc_unlocked.restype = c_int
-getc_unlocked.argtypes = [POINTER(FILE)]
-getchar_unlocked = _libraries['/usr/lib/libmp4v2.so'].getchar_unlocked
-getchar_unlocked.restype = c_int
-getchar_unlocked.argtypes = []
-putchar = _libraries['/usr/lib/libmp4v2.so'].putchar
-putchar.restype = c_int
-putchar.argtypes = [c_int]
-fputc_unlocked = _libraries['/usr/lib/libmp4v2.so'].fputc_unlocked
-fputc_unlocked.restype = c_int
-fputc_unlocked.argtypes = [c_int, POINTER(FILE)]
-putc_unlocked = _libraries['/usr/lib/libmp4v2.so'].putc_unlocked
-putc_unlocked.restype = c_int
-putc_unlocked.argtypes = [c_int, POINTER(FILE)]
-putchar_unlocked = _libraries['/usr/lib/libmp4v2.so'].putchar_unlocked
-putchar_unlocked.restype = c_int
-putchar_unlocked.argtypes = [c_int]
-getline = _libraries['/usr/lib/libmp4v2.so'].getline
-getline.restype = __ssize_t
-getline.argtypes = [POINTER(STRING), POINTER(size_t), POINTER(FILE)]
-feof_unlocked = _libraries['/usr/lib/libmp4v2.so'].feof_unlocked
-feof_unlocked.restype = c_int
-feof_unlocked.argtypes = [POINTER(FILE)]
-ferror_unlocked = _libraries['/usr/lib/libmp4v2.so'].ferror_unlocked
-ferror_unlocked.restype = c_int
-ferror_unlocked.argtypes = [POINTER(FILE)]
-sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libmp4v2.so'], 'sys_nerr')
-sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libmp4v2.so'], 'sys_errlist')
-_sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libmp4v2.so'], '_sys_nerr')
-_sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libmp4v2.so'], '_sys_errlist')
 __u_char = c_ubyte
 __u_short = c_ushort
 __u_int = c_uint
@@ -629,11 +531,6 @@ __ino_t = c_ulong
 __ino64_t = __u_quad_t
 __mode_t = c_uint
 __nlink_t = c_uint
-class __fsid_t(Structure):
-    pass
-__fsid_t._fields_ = [
-    ('__val', c_int * 2),
-]
 __clock_t = c_long
 __rlim_t = c_ulong
 __rlim64_t = __u_quad_t
@@ -658,60 +555,10 @@ __qaddr_t = POINTER(__quad_t)
 __caddr_t = STRING
 __intptr_t = c_int
 __socklen_t = c_uint
-class _IO_jump_t(Structure):
-    pass
-_IO_jump_t._fields_ = [
-]
 _IO_lock_t = None
-class _IO_marker(Structure):
-    pass
-_IO_marker._fields_ = [
-    ('_next', POINTER(_IO_marker)),
-    ('_sbuf', POINTER(_IO_FILE)),
-    ('_pos', c_int),
-]
 
 # values for enumeration '__codecvt_result'
 __codecvt_result = c_int # enum
-_IO_FILE._pack_ = 4
-_IO_FILE._fields_ = [
-    ('_flags', c_int),
-    ('_IO_read_ptr', STRING),
-    ('_IO_read_end', STRING),
-    ('_IO_read_base', STRING),
-    ('_IO_write_base', STRING),
-    ('_IO_write_ptr', STRING),
-    ('_IO_write_end', STRING),
-    ('_IO_buf_base', STRING),
-    ('_IO_buf_end', STRING),
-    ('_IO_save_base', STRING),
-    ('_IO_backup_base', STRING),
-    ('_IO_save_end', STRING),
-    ('_markers', POINTER(_IO_marker)),
-    ('_chain', POINTER(_IO_FILE)),
-    ('_fileno', c_int),
-    ('_flags2', c_int),
-    ('_old_offset', __off_t),
-    ('_cur_column', c_ushort),
-    ('_vtable_offset', c_byte),
-    ('_shortbuf', c_char * 1),
-    ('_lock', POINTER(_IO_lock_t)),
-    ('_offset', __off64_t),
-    ('__pad1', c_void_p),
-    ('__pad2', c_void_p),
-    ('__pad3', c_void_p),
-    ('__pad4', c_void_p),
-    ('__pad5', size_t),
-    ('_mode', c_int),
-    ('_unused2', c_char * 40),
-]
-class _IO_FILE_plus(Structure):
-    pass
-_IO_FILE_plus._fields_ = [
-]
-_IO_2_1_stdin_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmp4v2.so'], '_IO_2_1_stdin_')
-_IO_2_1_stdout_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmp4v2.so'], '_IO_2_1_stdout_')
-_IO_2_1_stderr_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmp4v2.so'], '_IO_2_1_stderr_')
 __io_read_fn = CFUNCTYPE(__ssize_t, c_void_p, STRING, size_t)
 __io_write_fn = CFUNCTYPE(__ssize_t, c_void_p, STRING, size_t)
 __io_seek_fn = CFUNCTYPE(c_int, c_void_p, POINTER(__off64_t), c_int)
@@ -720,229 +567,21 @@ cookie_read_function_t = __io_read_fn
 cookie_write_function_t = __io_write_fn
 cookie_seek_function_t = __io_seek_fn
 cookie_close_function_t = __io_close_fn
-class _IO_cookie_io_functions_t(Structure):
-    pass
-_IO_cookie_io_functions_t._fields_ = [
-    ('read', POINTER(__io_read_fn)),
-    ('write', POINTER(__io_write_fn)),
-    ('seek', POINTER(__io_seek_fn)),
-    ('close', POINTER(__io_close_fn)),
-]
-cookie_io_functions_t = _IO_cookie_io_functions_t
-class _IO_cookie_file(Structure):
-    pass
-_IO_cookie_file._fields_ = [
-]
-__underflow = _libraries['/usr/lib/libmp4v2.so'].__underflow
-__underflow.restype = c_int
-__underflow.argtypes = [POINTER(_IO_FILE)]
-__uflow = _libraries['/usr/lib/libmp4v2.so'].__uflow
-__uflow.restype = c_int
-__uflow.argtypes = [POINTER(_IO_FILE)]
-__overflow = _libraries['/usr/lib/libmp4v2.so'].__overflow
-__overflow.restype = c_int
-__overflow.argtypes = [POINTER(_IO_FILE), c_int]
-_IO_getc = _libraries['/usr/lib/libmp4v2.so']._IO_getc
-_IO_getc.restype = c_int
-_IO_getc.argtypes = [POINTER(_IO_FILE)]
-_IO_putc = _libraries['/usr/lib/libmp4v2.so']._IO_putc
-_IO_putc.restype = c_int
-_IO_putc.argtypes = [c_int, POINTER(_IO_FILE)]
-_IO_feof = _libraries['/usr/lib/libmp4v2.so']._IO_feof
-_IO_feof.restype = c_int
-_IO_feof.argtypes = [POINTER(_IO_FILE)]
-_IO_ferror = _libraries['/usr/lib/libmp4v2.so']._IO_ferror
-_IO_ferror.restype = c_int
-_IO_ferror.argtypes = [POINTER(_IO_FILE)]
-_IO_peekc_locked = _libraries['/usr/lib/libmp4v2.so']._IO_peekc_locked
-_IO_peekc_locked.restype = c_int
-_IO_peekc_locked.argtypes = [POINTER(_IO_FILE)]
-_IO_flockfile = _libraries['/usr/lib/libmp4v2.so']._IO_flockfile
-_IO_flockfile.restype = None
-_IO_flockfile.argtypes = [POINTER(_IO_FILE)]
-_IO_funlockfile = _libraries['/usr/lib/libmp4v2.so']._IO_funlockfile
-_IO_funlockfile.restype = None
-_IO_funlockfile.argtypes = [POINTER(_IO_FILE)]
-_IO_ftrylockfile = _libraries['/usr/lib/libmp4v2.so']._IO_ftrylockfile
-_IO_ftrylockfile.restype = c_int
-_IO_ftrylockfile.argtypes = [POINTER(_IO_FILE)]
-_IO_vfscanf = _libraries['/usr/lib/libmp4v2.so']._IO_vfscanf
-_IO_vfscanf.restype = c_int
-_IO_vfscanf.argtypes = [POINTER(_IO_FILE), STRING, __gnuc_va_list, POINTER(c_int)]
-_IO_vfprintf = _libraries['/usr/lib/libmp4v2.so']._IO_vfprintf
-_IO_vfprintf.restype = c_int
-_IO_vfprintf.argtypes = [POINTER(_IO_FILE), STRING, __gnuc_va_list]
-_IO_padn = _libraries['/usr/lib/libmp4v2.so']._IO_padn
-_IO_padn.restype = __ssize_t
-_IO_padn.argtypes = [POINTER(_IO_FILE), c_int, __ssize_t]
-_IO_sgetn = _libraries['/usr/lib/libmp4v2.so']._IO_sgetn
-_IO_sgetn.restype = size_t
-_IO_sgetn.argtypes = [POINTER(_IO_FILE), c_void_p, size_t]
-_IO_seekoff = _libraries['/usr/lib/libmp4v2.so']._IO_seekoff
-_IO_seekoff.restype = __off64_t
-_IO_seekoff.argtypes = [POINTER(_IO_FILE), __off64_t, c_int, c_int]
-_IO_seekpos = _libraries['/usr/lib/libmp4v2.so']._IO_seekpos
-_IO_seekpos.restype = __off64_t
-_IO_seekpos.argtypes = [POINTER(_IO_FILE), __off64_t, c_int]
-_IO_free_backup_area = _libraries['/usr/lib/libmp4v2.so']._IO_free_backup_area
-_IO_free_backup_area.restype = None
-_IO_free_backup_area.argtypes = [POINTER(_IO_FILE)]
-class MP4Chapter_s(Structure):
-    pass
 uint64_t = c_uint64
 MP4Duration = uint64_t
-MP4Chapter_s._pack_ = 4
-MP4Chapter_s._fields_ = [
-    ('duration', MP4Duration),
-    ('title', c_char * 1024),
-]
-MP4Chapter_t = MP4Chapter_s
 
 # values for enumeration 'MP4ChapterType'
 MP4ChapterType = c_int # enum
 MP4FileHandle = c_void_p
 uint32_t = c_uint32
 MP4TrackId = uint32_t
-MP4AddChapter = _libraries['/usr/lib/libmp4v2.so'].MP4AddChapter
-MP4AddChapter.restype = None
-MP4AddChapter.argtypes = [MP4FileHandle, MP4TrackId, MP4Duration, STRING]
-MP4AddChapterTextTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddChapterTextTrack
-MP4AddChapterTextTrack.restype = MP4TrackId
-MP4AddChapterTextTrack.argtypes = [MP4FileHandle, MP4TrackId, uint32_t]
 MP4Timestamp = uint64_t
-MP4AddNeroChapter = _libraries['/usr/lib/libmp4v2.so'].MP4AddNeroChapter
-MP4AddNeroChapter.restype = None
-MP4AddNeroChapter.argtypes = [MP4FileHandle, MP4Timestamp, STRING]
-MP4ConvertChapters = _libraries['/usr/lib/libmp4v2.so'].MP4ConvertChapters
-MP4ConvertChapters.restype = MP4ChapterType
-MP4ConvertChapters.argtypes = [MP4FileHandle, MP4ChapterType]
-MP4DeleteChapters = _libraries['/usr/lib/libmp4v2.so'].MP4DeleteChapters
-MP4DeleteChapters.restype = MP4ChapterType
-MP4DeleteChapters.argtypes = [MP4FileHandle, MP4ChapterType, MP4TrackId]
-MP4GetChapters = _libraries['/usr/lib/libmp4v2.so'].MP4GetChapters
-MP4GetChapters.restype = MP4ChapterType
-MP4GetChapters.argtypes = [MP4FileHandle, POINTER(POINTER(MP4Chapter_t)), POINTER(uint32_t), MP4ChapterType]
-MP4SetChapters = _libraries['/usr/lib/libmp4v2.so'].MP4SetChapters
-MP4SetChapters.restype = MP4ChapterType
-MP4SetChapters.argtypes = [MP4FileHandle, POINTER(MP4Chapter_t), uint32_t, MP4ChapterType]
 
 # values for enumeration 'MP4FileMode_e'
 MP4FileMode_e = c_int # enum
 MP4FileMode = MP4FileMode_e
-class MP4FileProvider_s(Structure):
-    pass
 int64_t = c_int64
-MP4FileProvider_s._fields_ = [
-    ('open', CFUNCTYPE(c_void_p, STRING, MP4FileMode)),
-    ('seek', CFUNCTYPE(c_int, c_void_p, int64_t)),
-    ('read', CFUNCTYPE(c_int, c_void_p, c_void_p, int64_t, POINTER(int64_t), int64_t)),
-    ('write', CFUNCTYPE(c_int, c_void_p, c_void_p, int64_t, POINTER(int64_t), int64_t)),
-    ('close', CFUNCTYPE(c_int, c_void_p)),
-]
-MP4FileProvider = MP4FileProvider_s
-MP4Close = _libraries['/usr/lib/libmp4v2.so'].MP4Close
-MP4Close.restype = None
-MP4Close.argtypes = [MP4FileHandle, uint32_t]
-MP4Create = _libraries['/usr/lib/libmp4v2.so'].MP4Create
-MP4Create.restype = MP4FileHandle
-MP4Create.argtypes = [STRING, uint32_t]
-MP4CreateEx = _libraries['/usr/lib/libmp4v2.so'].MP4CreateEx
-MP4CreateEx.restype = MP4FileHandle
-MP4CreateEx.argtypes = [STRING, uint32_t, c_int, c_int, STRING, uint32_t, POINTER(STRING), uint32_t]
-MP4Dump = _libraries['/usr/lib/libmp4v2.so'].MP4Dump
-MP4Dump.restype = c_bool
-MP4Dump.argtypes = [MP4FileHandle, c_bool]
-MP4FileInfo = _libraries['/usr/lib/libmp4v2.so'].MP4FileInfo
-MP4FileInfo.restype = STRING
-MP4FileInfo.argtypes = [STRING, MP4TrackId]
-MP4GetFilename = _libraries['/usr/lib/libmp4v2.so'].MP4GetFilename
-MP4GetFilename.restype = STRING
-MP4GetFilename.argtypes = [MP4FileHandle]
-MP4Info = _libraries['/usr/lib/libmp4v2.so'].MP4Info
-MP4Info.restype = STRING
-MP4Info.argtypes = [MP4FileHandle, MP4TrackId]
-MP4Modify = _libraries['/usr/lib/libmp4v2.so'].MP4Modify
-MP4Modify.restype = MP4FileHandle
-MP4Modify.argtypes = [STRING, uint32_t]
-MP4Optimize = _libraries['/usr/lib/libmp4v2.so'].MP4Optimize
-MP4Optimize.restype = c_bool
-MP4Optimize.argtypes = [STRING, STRING]
-MP4Read = _libraries['/usr/lib/libmp4v2.so'].MP4Read
-MP4Read.restype = MP4FileHandle
-MP4Read.argtypes = [STRING]
-MP4ReadProvider = _libraries['/usr/lib/libmp4v2.so'].MP4ReadProvider
-MP4ReadProvider.restype = MP4FileHandle
-MP4ReadProvider.argtypes = [STRING, POINTER(MP4FileProvider)]
-MP4HaveAtom = _libraries['/usr/lib/libmp4v2.so'].MP4HaveAtom
-MP4HaveAtom.restype = c_bool
-MP4HaveAtom.argtypes = [MP4FileHandle, STRING]
-MP4GetIntegerProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetIntegerProperty
-MP4GetIntegerProperty.restype = c_bool
-MP4GetIntegerProperty.argtypes = [MP4FileHandle, STRING, POINTER(uint64_t)]
-MP4GetFloatProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetFloatProperty
-MP4GetFloatProperty.restype = c_bool
-MP4GetFloatProperty.argtypes = [MP4FileHandle, STRING, POINTER(c_float)]
-MP4GetStringProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetStringProperty
-MP4GetStringProperty.restype = c_bool
-MP4GetStringProperty.argtypes = [MP4FileHandle, STRING, POINTER(STRING)]
 uint8_t = c_uint8
-MP4GetBytesProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetBytesProperty
-MP4GetBytesProperty.restype = c_bool
-MP4GetBytesProperty.argtypes = [MP4FileHandle, STRING, POINTER(POINTER(uint8_t)), POINTER(uint32_t)]
-MP4SetIntegerProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetIntegerProperty
-MP4SetIntegerProperty.restype = c_bool
-MP4SetIntegerProperty.argtypes = [MP4FileHandle, STRING, int64_t]
-MP4SetFloatProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetFloatProperty
-MP4SetFloatProperty.restype = c_bool
-MP4SetFloatProperty.argtypes = [MP4FileHandle, STRING, c_float]
-MP4SetStringProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetStringProperty
-MP4SetStringProperty.restype = c_bool
-MP4SetStringProperty.argtypes = [MP4FileHandle, STRING, STRING]
-MP4SetBytesProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetBytesProperty
-MP4SetBytesProperty.restype = c_bool
-MP4SetBytesProperty.argtypes = [MP4FileHandle, STRING, POINTER(uint8_t), uint32_t]
-MP4GetDuration = _libraries['/usr/lib/libmp4v2.so'].MP4GetDuration
-MP4GetDuration.restype = MP4Duration
-MP4GetDuration.argtypes = [MP4FileHandle]
-MP4GetTimeScale = _libraries['/usr/lib/libmp4v2.so'].MP4GetTimeScale
-MP4GetTimeScale.restype = uint32_t
-MP4GetTimeScale.argtypes = [MP4FileHandle]
-MP4SetTimeScale = _libraries['/usr/lib/libmp4v2.so'].MP4SetTimeScale
-MP4SetTimeScale.restype = c_bool
-MP4SetTimeScale.argtypes = [MP4FileHandle, uint32_t]
-MP4ChangeMovieTimeScale = _libraries['/usr/lib/libmp4v2.so'].MP4ChangeMovieTimeScale
-MP4ChangeMovieTimeScale.restype = None
-MP4ChangeMovieTimeScale.argtypes = [MP4FileHandle, uint32_t]
-MP4GetODProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4GetODProfileLevel
-MP4GetODProfileLevel.restype = uint8_t
-MP4GetODProfileLevel.argtypes = [MP4FileHandle]
-MP4SetODProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4SetODProfileLevel
-MP4SetODProfileLevel.restype = c_bool
-MP4SetODProfileLevel.argtypes = [MP4FileHandle, uint8_t]
-MP4GetSceneProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4GetSceneProfileLevel
-MP4GetSceneProfileLevel.restype = uint8_t
-MP4GetSceneProfileLevel.argtypes = [MP4FileHandle]
-MP4SetSceneProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4SetSceneProfileLevel
-MP4SetSceneProfileLevel.restype = c_bool
-MP4SetSceneProfileLevel.argtypes = [MP4FileHandle, uint8_t]
-MP4GetVideoProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4GetVideoProfileLevel
-MP4GetVideoProfileLevel.restype = uint8_t
-MP4GetVideoProfileLevel.argtypes = [MP4FileHandle, MP4TrackId]
-MP4SetVideoProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4SetVideoProfileLevel
-MP4SetVideoProfileLevel.restype = None
-MP4SetVideoProfileLevel.argtypes = [MP4FileHandle, uint8_t]
-MP4GetAudioProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4GetAudioProfileLevel
-MP4GetAudioProfileLevel.restype = uint8_t
-MP4GetAudioProfileLevel.argtypes = [MP4FileHandle]
-MP4SetAudioProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4SetAudioProfileLevel
-MP4SetAudioProfileLevel.restype = None
-MP4SetAudioProfileLevel.argtypes = [MP4FileHandle, uint8_t]
-MP4GetGraphicsProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4GetGraphicsProfileLevel
-MP4GetGraphicsProfileLevel.restype = uint8_t
-MP4GetGraphicsProfileLevel.argtypes = [MP4FileHandle]
-MP4SetGraphicsProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4SetGraphicsProfileLevel
-MP4SetGraphicsProfileLevel.restype = c_bool
-MP4SetGraphicsProfileLevel.argtypes = [MP4FileHandle, uint8_t]
 MP4SampleId = uint32_t
 MP4EditId = uint32_t
 
@@ -951,768 +590,21 @@ MP4LogLevel = c_int # enum
 va_list = __gnuc_va_list
 MP4LogCallback = CFUNCTYPE(None, MP4LogLevel, STRING, va_list)
 encryptFunc_t = CFUNCTYPE(uint32_t, uint32_t, uint32_t, POINTER(uint8_t), POINTER(uint32_t), POINTER(POINTER(uint8_t)))
-MP4Make3GPCompliant = _libraries['/usr/lib/libmp4v2.so'].MP4Make3GPCompliant
-MP4Make3GPCompliant.restype = c_bool
-MP4Make3GPCompliant.argtypes = [STRING, STRING, uint32_t, POINTER(STRING), uint32_t, c_bool]
-MP4AddTrackEdit = _libraries['/usr/lib/libmp4v2.so'].MP4AddTrackEdit
-MP4AddTrackEdit.restype = MP4EditId
-MP4AddTrackEdit.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId, MP4Timestamp, MP4Duration, c_bool]
-MP4DeleteTrackEdit = _libraries['/usr/lib/libmp4v2.so'].MP4DeleteTrackEdit
-MP4DeleteTrackEdit.restype = c_bool
-MP4DeleteTrackEdit.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId]
-MP4GetTrackNumberOfEdits = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackNumberOfEdits
-MP4GetTrackNumberOfEdits.restype = uint32_t
-MP4GetTrackNumberOfEdits.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetTrackEditTotalDuration = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackEditTotalDuration
-MP4GetTrackEditTotalDuration.restype = MP4Duration
-MP4GetTrackEditTotalDuration.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId]
-MP4GetTrackEditMediaStart = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackEditMediaStart
-MP4GetTrackEditMediaStart.restype = MP4Timestamp
-MP4GetTrackEditMediaStart.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId]
-MP4SetTrackEditMediaStart = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackEditMediaStart
-MP4SetTrackEditMediaStart.restype = c_bool
-MP4SetTrackEditMediaStart.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId, MP4Timestamp]
-MP4GetTrackEditDuration = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackEditDuration
-MP4GetTrackEditDuration.restype = MP4Duration
-MP4GetTrackEditDuration.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId]
-MP4SetTrackEditDuration = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackEditDuration
-MP4SetTrackEditDuration.restype = c_bool
-MP4SetTrackEditDuration.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId, MP4Duration]
 int8_t = c_int8
-MP4GetTrackEditDwell = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackEditDwell
-MP4GetTrackEditDwell.restype = int8_t
-MP4GetTrackEditDwell.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId]
-MP4SetTrackEditDwell = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackEditDwell
-MP4SetTrackEditDwell.restype = c_bool
-MP4SetTrackEditDwell.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId, c_bool]
-MP4ReadSampleFromEditTime = _libraries['/usr/lib/libmp4v2.so'].MP4ReadSampleFromEditTime
-MP4ReadSampleFromEditTime.restype = c_bool
-MP4ReadSampleFromEditTime.argtypes = [MP4FileHandle, MP4TrackId, MP4Timestamp, POINTER(POINTER(uint8_t)), POINTER(uint32_t), POINTER(MP4Timestamp), POINTER(MP4Duration), POINTER(MP4Duration), POINTER(c_bool)]
-MP4GetSampleIdFromEditTime = _libraries['/usr/lib/libmp4v2.so'].MP4GetSampleIdFromEditTime
-MP4GetSampleIdFromEditTime.restype = MP4SampleId
-MP4GetSampleIdFromEditTime.argtypes = [MP4FileHandle, MP4TrackId, MP4Timestamp, POINTER(MP4Timestamp), POINTER(MP4Duration)]
-MP4ConvertFromMovieDuration = _libraries['/usr/lib/libmp4v2.so'].MP4ConvertFromMovieDuration
-MP4ConvertFromMovieDuration.restype = uint64_t
-MP4ConvertFromMovieDuration.argtypes = [MP4FileHandle, MP4Duration, uint32_t]
-MP4ConvertFromTrackTimestamp = _libraries['/usr/lib/libmp4v2.so'].MP4ConvertFromTrackTimestamp
-MP4ConvertFromTrackTimestamp.restype = uint64_t
-MP4ConvertFromTrackTimestamp.argtypes = [MP4FileHandle, MP4TrackId, MP4Timestamp, uint32_t]
-MP4ConvertToTrackTimestamp = _libraries['/usr/lib/libmp4v2.so'].MP4ConvertToTrackTimestamp
-MP4ConvertToTrackTimestamp.restype = MP4Timestamp
-MP4ConvertToTrackTimestamp.argtypes = [MP4FileHandle, MP4TrackId, uint64_t, uint32_t]
-MP4ConvertFromTrackDuration = _libraries['/usr/lib/libmp4v2.so'].MP4ConvertFromTrackDuration
-MP4ConvertFromTrackDuration.restype = uint64_t
-MP4ConvertFromTrackDuration.argtypes = [MP4FileHandle, MP4TrackId, MP4Duration, uint32_t]
-MP4ConvertToTrackDuration = _libraries['/usr/lib/libmp4v2.so'].MP4ConvertToTrackDuration
-MP4ConvertToTrackDuration.restype = MP4Duration
-MP4ConvertToTrackDuration.argtypes = [MP4FileHandle, MP4TrackId, uint64_t, uint32_t]
-MP4BinaryToBase16 = _libraries['/usr/lib/libmp4v2.so'].MP4BinaryToBase16
-MP4BinaryToBase16.restype = STRING
-MP4BinaryToBase16.argtypes = [POINTER(uint8_t), uint32_t]
-MP4BinaryToBase64 = _libraries['/usr/lib/libmp4v2.so'].MP4BinaryToBase64
-MP4BinaryToBase64.restype = STRING
-MP4BinaryToBase64.argtypes = [POINTER(uint8_t), uint32_t]
-MP4Free = _libraries['/usr/lib/libmp4v2.so'].MP4Free
-MP4Free.restype = None
-MP4Free.argtypes = [c_void_p]
-MP4SetLogCallback = _libraries['/usr/lib/libmp4v2.so'].MP4SetLogCallback
-MP4SetLogCallback.restype = None
-MP4SetLogCallback.argtypes = [MP4LogCallback]
-MP4LogGetLevel = _libraries['/usr/lib/libmp4v2.so'].MP4LogGetLevel
-MP4LogGetLevel.restype = MP4LogLevel
-MP4LogGetLevel.argtypes = []
-MP4LogSetLevel = _libraries['/usr/lib/libmp4v2.so'].MP4LogSetLevel
-MP4LogSetLevel.restype = None
-MP4LogSetLevel.argtypes = [MP4LogLevel]
-class mp4v2_ismacryp_session_params(Structure):
-    pass
 uint16_t = c_uint16
-mp4v2_ismacryp_session_params._fields_ = [
-    ('scheme_type', uint32_t),
-    ('scheme_version', uint16_t),
-    ('key_ind_len', uint8_t),
-    ('iv_len', uint8_t),
-    ('selective_enc', uint8_t),
-    ('kms_uri', STRING),
-]
-mp4v2_ismacrypParams = mp4v2_ismacryp_session_params
-MP4DefaultISMACrypParams = _libraries['/usr/lib/libmp4v2.so'].MP4DefaultISMACrypParams
-MP4DefaultISMACrypParams.restype = POINTER(mp4v2_ismacrypParams)
-MP4DefaultISMACrypParams.argtypes = [POINTER(mp4v2_ismacrypParams)]
-MP4AddEncAudioTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddEncAudioTrack
-MP4AddEncAudioTrack.restype = MP4TrackId
-MP4AddEncAudioTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, POINTER(mp4v2_ismacrypParams), uint8_t]
-MP4AddEncVideoTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddEncVideoTrack
-MP4AddEncVideoTrack.restype = MP4TrackId
-MP4AddEncVideoTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, uint16_t, uint16_t, POINTER(mp4v2_ismacrypParams), uint8_t, STRING]
-MP4AddEncH264VideoTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddEncH264VideoTrack
-MP4AddEncH264VideoTrack.restype = MP4TrackId
-MP4AddEncH264VideoTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, uint16_t, uint16_t, MP4FileHandle, MP4TrackId, POINTER(mp4v2_ismacrypParams)]
-MP4EncAndCloneTrack = _libraries['/usr/lib/libmp4v2.so'].MP4EncAndCloneTrack
-MP4EncAndCloneTrack.restype = MP4TrackId
-MP4EncAndCloneTrack.argtypes = [MP4FileHandle, MP4TrackId, POINTER(mp4v2_ismacrypParams), MP4FileHandle, MP4TrackId]
-MP4EncAndCopyTrack = _libraries['/usr/lib/libmp4v2.so'].MP4EncAndCopyTrack
-MP4EncAndCopyTrack.restype = MP4TrackId
-MP4EncAndCopyTrack.argtypes = [MP4FileHandle, MP4TrackId, POINTER(mp4v2_ismacrypParams), encryptFunc_t, uint32_t, MP4FileHandle, c_bool, MP4TrackId]
-MP4MakeIsmaCompliant = _libraries['/usr/lib/libmp4v2.so'].MP4MakeIsmaCompliant
-MP4MakeIsmaCompliant.restype = c_bool
-MP4MakeIsmaCompliant.argtypes = [STRING, c_bool]
-MP4MakeIsmaSdpIod = _libraries['/usr/lib/libmp4v2.so'].MP4MakeIsmaSdpIod
-MP4MakeIsmaSdpIod.restype = STRING
-MP4MakeIsmaSdpIod.argtypes = [uint8_t, uint32_t, POINTER(uint8_t), uint32_t, uint8_t, uint32_t, POINTER(uint8_t), uint32_t]
 
 # values for enumeration 'MP4ItmfBasicType_e'
 MP4ItmfBasicType_e = c_int # enum
 MP4ItmfBasicType = MP4ItmfBasicType_e
-class MP4ItmfData_s(Structure):
-    pass
-MP4ItmfData_s._fields_ = [
-    ('typeSetIdentifier', uint8_t),
-    ('typeCode', MP4ItmfBasicType),
-    ('locale', uint32_t),
-    ('value', POINTER(uint8_t)),
-    ('valueSize', uint32_t),
-]
-MP4ItmfData = MP4ItmfData_s
-class MP4ItmfDataList_s(Structure):
-    pass
-MP4ItmfDataList_s._fields_ = [
-    ('elements', POINTER(MP4ItmfData)),
-    ('size', uint32_t),
-]
-MP4ItmfDataList = MP4ItmfDataList_s
-class MP4ItmfItem_s(Structure):
-    pass
-MP4ItmfItem_s._fields_ = [
-    ('__handle', c_void_p),
-    ('code', STRING),
-    ('mean', STRING),
-    ('name', STRING),
-    ('dataList', MP4ItmfDataList),
-]
-MP4ItmfItem = MP4ItmfItem_s
-class MP4ItmfItemList_s(Structure):
-    pass
-MP4ItmfItemList_s._fields_ = [
-    ('elements', POINTER(MP4ItmfItem)),
-    ('size', uint32_t),
-]
-MP4ItmfItemList = MP4ItmfItemList_s
-MP4ItmfItemAlloc = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfItemAlloc
-MP4ItmfItemAlloc.restype = POINTER(MP4ItmfItem)
-MP4ItmfItemAlloc.argtypes = [STRING, uint32_t]
-MP4ItmfItemFree = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfItemFree
-MP4ItmfItemFree.restype = None
-MP4ItmfItemFree.argtypes = [POINTER(MP4ItmfItem)]
-MP4ItmfItemListFree = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfItemListFree
-MP4ItmfItemListFree.restype = None
-MP4ItmfItemListFree.argtypes = [POINTER(MP4ItmfItemList)]
-MP4ItmfGetItems = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfGetItems
-MP4ItmfGetItems.restype = POINTER(MP4ItmfItemList)
-MP4ItmfGetItems.argtypes = [MP4FileHandle]
-MP4ItmfGetItemsByCode = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfGetItemsByCode
-MP4ItmfGetItemsByCode.restype = POINTER(MP4ItmfItemList)
-MP4ItmfGetItemsByCode.argtypes = [MP4FileHandle, STRING]
-MP4ItmfGetItemsByMeaning = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfGetItemsByMeaning
-MP4ItmfGetItemsByMeaning.restype = POINTER(MP4ItmfItemList)
-MP4ItmfGetItemsByMeaning.argtypes = [MP4FileHandle, STRING, STRING]
-MP4ItmfAddItem = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfAddItem
-MP4ItmfAddItem.restype = c_bool
-MP4ItmfAddItem.argtypes = [MP4FileHandle, POINTER(MP4ItmfItem)]
-MP4ItmfSetItem = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfSetItem
-MP4ItmfSetItem.restype = c_bool
-MP4ItmfSetItem.argtypes = [MP4FileHandle, POINTER(MP4ItmfItem)]
-MP4ItmfRemoveItem = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfRemoveItem
-MP4ItmfRemoveItem.restype = c_bool
-MP4ItmfRemoveItem.argtypes = [MP4FileHandle, POINTER(MP4ItmfItem)]
 
 # values for enumeration 'MP4TagArtworkType_e'
 MP4TagArtworkType_e = c_int # enum
 MP4TagArtworkType = MP4TagArtworkType_e
-class MP4TagArtwork_s(Structure):
-    pass
-MP4TagArtwork_s._fields_ = [
-    ('data', c_void_p),
-    ('size', uint32_t),
-    ('type', MP4TagArtworkType),
-]
-MP4TagArtwork = MP4TagArtwork_s
-class MP4TagTrack_s(Structure):
-    pass
-MP4TagTrack_s._fields_ = [
-    ('index', uint16_t),
-    ('total', uint16_t),
-]
-MP4TagTrack = MP4TagTrack_s
-class MP4TagDisk_s(Structure):
-    pass
-MP4TagDisk_s._fields_ = [
-    ('index', uint16_t),
-    ('total', uint16_t),
-]
-MP4TagDisk = MP4TagDisk_s
-class MP4Tags_s(Structure):
-    pass
-MP4Tags_s._fields_ = [
-    ('__handle', c_void_p),
-    ('name', STRING),
-    ('artist', STRING),
-    ('albumArtist', STRING),
-    ('album', STRING),
-    ('grouping', STRING),
-    ('composer', STRING),
-    ('comments', STRING),
-    ('genre', STRING),
-    ('genreType', POINTER(uint16_t)),
-    ('releaseDate', STRING),
-    ('track', POINTER(MP4TagTrack)),
-    ('disk', POINTER(MP4TagDisk)),
-    ('tempo', POINTER(uint16_t)),
-    ('compilation', POINTER(uint8_t)),
-    ('tvShow', STRING),
-    ('tvNetwork', STRING),
-    ('tvEpisodeID', STRING),
-    ('tvSeason', POINTER(uint32_t)),
-    ('tvEpisode', POINTER(uint32_t)),
-    ('description', STRING),
-    ('longDescription', STRING),
-    ('lyrics', STRING),
-    ('sortName', STRING),
-    ('sortArtist', STRING),
-    ('sortAlbumArtist', STRING),
-    ('sortAlbum', STRING),
-    ('sortComposer', STRING),
-    ('sortTVShow', STRING),
-    ('artwork', POINTER(MP4TagArtwork)),
-    ('artworkCount', uint32_t),
-    ('copyright', STRING),
-    ('encodingTool', STRING),
-    ('encodedBy', STRING),
-    ('purchaseDate', STRING),
-    ('podcast', POINTER(uint8_t)),
-    ('keywords', STRING),
-    ('category', STRING),
-    ('hdVideo', POINTER(uint8_t)),
-    ('mediaType', POINTER(uint8_t)),
-    ('contentRating', POINTER(uint8_t)),
-    ('gapless', POINTER(uint8_t)),
-    ('iTunesAccount', STRING),
-    ('iTunesAccountType', POINTER(uint8_t)),
-    ('iTunesCountry', POINTER(uint32_t)),
-    ('contentID', POINTER(uint32_t)),
-    ('artistID', POINTER(uint32_t)),
-    ('playlistID', POINTER(uint64_t)),
-    ('genreID', POINTER(uint32_t)),
-    ('composerID', POINTER(uint32_t)),
-    ('xid', STRING),
-]
-MP4Tags = MP4Tags_s
-MP4TagsAlloc = _libraries['/usr/lib/libmp4v2.so'].MP4TagsAlloc
-MP4TagsAlloc.restype = POINTER(MP4Tags)
-MP4TagsAlloc.argtypes = []
-MP4TagsFetch = _libraries['/usr/lib/libmp4v2.so'].MP4TagsFetch
-MP4TagsFetch.restype = c_bool
-MP4TagsFetch.argtypes = [POINTER(MP4Tags), MP4FileHandle]
-MP4TagsStore = _libraries['/usr/lib/libmp4v2.so'].MP4TagsStore
-MP4TagsStore.restype = c_bool
-MP4TagsStore.argtypes = [POINTER(MP4Tags), MP4FileHandle]
-MP4TagsFree = _libraries['/usr/lib/libmp4v2.so'].MP4TagsFree
-MP4TagsFree.restype = None
-MP4TagsFree.argtypes = [POINTER(MP4Tags)]
-MP4TagsHasMetadata = _libraries['/usr/lib/libmp4v2.so'].MP4TagsHasMetadata
-MP4TagsHasMetadata.restype = c_bool
-MP4TagsHasMetadata.argtypes = [POINTER(MP4Tags), POINTER(c_bool)]
-MP4TagsSetName = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetName
-MP4TagsSetName.restype = c_bool
-MP4TagsSetName.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetArtist = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetArtist
-MP4TagsSetArtist.restype = c_bool
-MP4TagsSetArtist.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetAlbumArtist = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetAlbumArtist
-MP4TagsSetAlbumArtist.restype = c_bool
-MP4TagsSetAlbumArtist.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetAlbum = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetAlbum
-MP4TagsSetAlbum.restype = c_bool
-MP4TagsSetAlbum.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetGrouping = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetGrouping
-MP4TagsSetGrouping.restype = c_bool
-MP4TagsSetGrouping.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetComposer = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetComposer
-MP4TagsSetComposer.restype = c_bool
-MP4TagsSetComposer.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetComments = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetComments
-MP4TagsSetComments.restype = c_bool
-MP4TagsSetComments.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetGenre = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetGenre
-MP4TagsSetGenre.restype = c_bool
-MP4TagsSetGenre.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetGenreType = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetGenreType
-MP4TagsSetGenreType.restype = c_bool
-MP4TagsSetGenreType.argtypes = [POINTER(MP4Tags), POINTER(uint16_t)]
-MP4TagsSetReleaseDate = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetReleaseDate
-MP4TagsSetReleaseDate.restype = c_bool
-MP4TagsSetReleaseDate.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetTrack = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetTrack
-MP4TagsSetTrack.restype = c_bool
-MP4TagsSetTrack.argtypes = [POINTER(MP4Tags), POINTER(MP4TagTrack)]
-MP4TagsSetDisk = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetDisk
-MP4TagsSetDisk.restype = c_bool
-MP4TagsSetDisk.argtypes = [POINTER(MP4Tags), POINTER(MP4TagDisk)]
-MP4TagsSetTempo = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetTempo
-MP4TagsSetTempo.restype = c_bool
-MP4TagsSetTempo.argtypes = [POINTER(MP4Tags), POINTER(uint16_t)]
-MP4TagsSetCompilation = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetCompilation
-MP4TagsSetCompilation.restype = c_bool
-MP4TagsSetCompilation.argtypes = [POINTER(MP4Tags), POINTER(uint8_t)]
-MP4TagsSetTVShow = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetTVShow
-MP4TagsSetTVShow.restype = c_bool
-MP4TagsSetTVShow.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetTVNetwork = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetTVNetwork
-MP4TagsSetTVNetwork.restype = c_bool
-MP4TagsSetTVNetwork.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetTVEpisodeID = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetTVEpisodeID
-MP4TagsSetTVEpisodeID.restype = c_bool
-MP4TagsSetTVEpisodeID.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetTVSeason = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetTVSeason
-MP4TagsSetTVSeason.restype = c_bool
-MP4TagsSetTVSeason.argtypes = [POINTER(MP4Tags), POINTER(uint32_t)]
-MP4TagsSetTVEpisode = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetTVEpisode
-MP4TagsSetTVEpisode.restype = c_bool
-MP4TagsSetTVEpisode.argtypes = [POINTER(MP4Tags), POINTER(uint32_t)]
-MP4TagsSetDescription = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetDescription
-MP4TagsSetDescription.restype = c_bool
-MP4TagsSetDescription.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetLongDescription = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetLongDescription
-MP4TagsSetLongDescription.restype = c_bool
-MP4TagsSetLongDescription.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetLyrics = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetLyrics
-MP4TagsSetLyrics.restype = c_bool
-MP4TagsSetLyrics.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetSortName = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetSortName
-MP4TagsSetSortName.restype = c_bool
-MP4TagsSetSortName.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetSortArtist = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetSortArtist
-MP4TagsSetSortArtist.restype = c_bool
-MP4TagsSetSortArtist.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetSortAlbumArtist = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetSortAlbumArtist
-MP4TagsSetSortAlbumArtist.restype = c_bool
-MP4TagsSetSortAlbumArtist.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetSortAlbum = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetSortAlbum
-MP4TagsSetSortAlbum.restype = c_bool
-MP4TagsSetSortAlbum.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetSortComposer = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetSortComposer
-MP4TagsSetSortComposer.restype = c_bool
-MP4TagsSetSortComposer.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetSortTVShow = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetSortTVShow
-MP4TagsSetSortTVShow.restype = c_bool
-MP4TagsSetSortTVShow.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsAddArtwork = _libraries['/usr/lib/libmp4v2.so'].MP4TagsAddArtwork
-MP4TagsAddArtwork.restype = c_bool
-MP4TagsAddArtwork.argtypes = [POINTER(MP4Tags), POINTER(MP4TagArtwork)]
-MP4TagsSetArtwork = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetArtwork
-MP4TagsSetArtwork.restype = c_bool
-MP4TagsSetArtwork.argtypes = [POINTER(MP4Tags), uint32_t, POINTER(MP4TagArtwork)]
-MP4TagsRemoveArtwork = _libraries['/usr/lib/libmp4v2.so'].MP4TagsRemoveArtwork
-MP4TagsRemoveArtwork.restype = c_bool
-MP4TagsRemoveArtwork.argtypes = [POINTER(MP4Tags), uint32_t]
-MP4TagsSetCopyright = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetCopyright
-MP4TagsSetCopyright.restype = c_bool
-MP4TagsSetCopyright.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetEncodingTool = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetEncodingTool
-MP4TagsSetEncodingTool.restype = c_bool
-MP4TagsSetEncodingTool.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetEncodedBy = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetEncodedBy
-MP4TagsSetEncodedBy.restype = c_bool
-MP4TagsSetEncodedBy.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetPurchaseDate = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetPurchaseDate
-MP4TagsSetPurchaseDate.restype = c_bool
-MP4TagsSetPurchaseDate.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetPodcast = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetPodcast
-MP4TagsSetPodcast.restype = c_bool
-MP4TagsSetPodcast.argtypes = [POINTER(MP4Tags), POINTER(uint8_t)]
-MP4TagsSetKeywords = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetKeywords
-MP4TagsSetKeywords.restype = c_bool
-MP4TagsSetKeywords.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetCategory = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetCategory
-MP4TagsSetCategory.restype = c_bool
-MP4TagsSetCategory.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetHDVideo = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetHDVideo
-MP4TagsSetHDVideo.restype = c_bool
-MP4TagsSetHDVideo.argtypes = [POINTER(MP4Tags), POINTER(uint8_t)]
-MP4TagsSetMediaType = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetMediaType
-MP4TagsSetMediaType.restype = c_bool
-MP4TagsSetMediaType.argtypes = [POINTER(MP4Tags), POINTER(uint8_t)]
-MP4TagsSetContentRating = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetContentRating
-MP4TagsSetContentRating.restype = c_bool
-MP4TagsSetContentRating.argtypes = [POINTER(MP4Tags), POINTER(uint8_t)]
-MP4TagsSetGapless = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetGapless
-MP4TagsSetGapless.restype = c_bool
-MP4TagsSetGapless.argtypes = [POINTER(MP4Tags), POINTER(uint8_t)]
-MP4TagsSetITunesAccount = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetITunesAccount
-MP4TagsSetITunesAccount.restype = c_bool
-MP4TagsSetITunesAccount.argtypes = [POINTER(MP4Tags), STRING]
-MP4TagsSetITunesAccountType = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetITunesAccountType
-MP4TagsSetITunesAccountType.restype = c_bool
-MP4TagsSetITunesAccountType.argtypes = [POINTER(MP4Tags), POINTER(uint8_t)]
-MP4TagsSetITunesCountry = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetITunesCountry
-MP4TagsSetITunesCountry.restype = c_bool
-MP4TagsSetITunesCountry.argtypes = [POINTER(MP4Tags), POINTER(uint32_t)]
-MP4TagsSetContentID = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetContentID
-MP4TagsSetContentID.restype = c_bool
-MP4TagsSetContentID.argtypes = [POINTER(MP4Tags), POINTER(uint32_t)]
-MP4TagsSetArtistID = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetArtistID
-MP4TagsSetArtistID.restype = c_bool
-MP4TagsSetArtistID.argtypes = [POINTER(MP4Tags), POINTER(uint32_t)]
-MP4TagsSetPlaylistID = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetPlaylistID
-MP4TagsSetPlaylistID.restype = c_bool
-MP4TagsSetPlaylistID.argtypes = [POINTER(MP4Tags), POINTER(uint64_t)]
-MP4TagsSetGenreID = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetGenreID
-MP4TagsSetGenreID.restype = c_bool
-MP4TagsSetGenreID.argtypes = [POINTER(MP4Tags), POINTER(uint32_t)]
-MP4TagsSetComposerID = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetComposerID
-MP4TagsSetComposerID.restype = c_bool
-MP4TagsSetComposerID.argtypes = [POINTER(MP4Tags), POINTER(uint32_t)]
-MP4TagsSetXID = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetXID
-MP4TagsSetXID.restype = c_bool
-MP4TagsSetXID.argtypes = [POINTER(MP4Tags), STRING]
 
 # values for enumeration 'MP4SampleDependencyType_e'
 MP4SampleDependencyType_e = c_int # enum
 MP4SampleDependencyType = MP4SampleDependencyType_e
-MP4ReadSample = _libraries['/usr/lib/libmp4v2.so'].MP4ReadSample
-MP4ReadSample.restype = c_bool
-MP4ReadSample.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId, POINTER(POINTER(uint8_t)), POINTER(uint32_t), POINTER(MP4Timestamp), POINTER(MP4Duration), POINTER(MP4Duration), POINTER(c_bool)]
-MP4ReadSampleFromTime = _libraries['/usr/lib/libmp4v2.so'].MP4ReadSampleFromTime
-MP4ReadSampleFromTime.restype = c_bool
-MP4ReadSampleFromTime.argtypes = [MP4FileHandle, MP4TrackId, MP4Timestamp, POINTER(POINTER(uint8_t)), POINTER(uint32_t), POINTER(MP4Timestamp), POINTER(MP4Duration), POINTER(MP4Duration), POINTER(c_bool)]
-MP4WriteSample = _libraries['/usr/lib/libmp4v2.so'].MP4WriteSample
-MP4WriteSample.restype = c_bool
-MP4WriteSample.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint8_t), uint32_t, MP4Duration, MP4Duration, c_bool]
-MP4WriteSampleDependency = _libraries['/usr/lib/libmp4v2.so'].MP4WriteSampleDependency
-MP4WriteSampleDependency.restype = c_bool
-MP4WriteSampleDependency.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint8_t), uint32_t, MP4Duration, MP4Duration, c_bool, uint32_t]
-MP4CopySample = _libraries['/usr/lib/libmp4v2.so'].MP4CopySample
-MP4CopySample.restype = c_bool
-MP4CopySample.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId, MP4FileHandle, MP4TrackId, MP4Duration]
-MP4EncAndCopySample = _libraries['/usr/lib/libmp4v2.so'].MP4EncAndCopySample
-MP4EncAndCopySample.restype = c_bool
-MP4EncAndCopySample.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId, encryptFunc_t, uint32_t, MP4FileHandle, MP4TrackId, MP4Duration]
-MP4ReferenceSample = _libraries['/usr/lib/libmp4v2.so'].MP4ReferenceSample
-MP4ReferenceSample.restype = c_bool
-MP4ReferenceSample.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId, MP4FileHandle, MP4TrackId, MP4Duration]
-MP4GetSampleSize = _libraries['/usr/lib/libmp4v2.so'].MP4GetSampleSize
-MP4GetSampleSize.restype = uint32_t
-MP4GetSampleSize.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId]
-MP4GetTrackMaxSampleSize = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackMaxSampleSize
-MP4GetTrackMaxSampleSize.restype = uint32_t
-MP4GetTrackMaxSampleSize.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetSampleIdFromTime = _libraries['/usr/lib/libmp4v2.so'].MP4GetSampleIdFromTime
-MP4GetSampleIdFromTime.restype = MP4SampleId
-MP4GetSampleIdFromTime.argtypes = [MP4FileHandle, MP4TrackId, MP4Timestamp, c_bool]
-MP4GetSampleTime = _libraries['/usr/lib/libmp4v2.so'].MP4GetSampleTime
-MP4GetSampleTime.restype = MP4Timestamp
-MP4GetSampleTime.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId]
-MP4GetSampleDuration = _libraries['/usr/lib/libmp4v2.so'].MP4GetSampleDuration
-MP4GetSampleDuration.restype = MP4Duration
-MP4GetSampleDuration.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId]
-MP4GetSampleRenderingOffset = _libraries['/usr/lib/libmp4v2.so'].MP4GetSampleRenderingOffset
-MP4GetSampleRenderingOffset.restype = MP4Duration
-MP4GetSampleRenderingOffset.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId]
-MP4SetSampleRenderingOffset = _libraries['/usr/lib/libmp4v2.so'].MP4SetSampleRenderingOffset
-MP4SetSampleRenderingOffset.restype = c_bool
-MP4SetSampleRenderingOffset.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId, MP4Duration]
-MP4GetSampleSync = _libraries['/usr/lib/libmp4v2.so'].MP4GetSampleSync
-MP4GetSampleSync.restype = int8_t
-MP4GetSampleSync.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId]
-MP4GetHintTrackRtpPayload = _libraries['/usr/lib/libmp4v2.so'].MP4GetHintTrackRtpPayload
-MP4GetHintTrackRtpPayload.restype = c_bool
-MP4GetHintTrackRtpPayload.argtypes = [MP4FileHandle, MP4TrackId, POINTER(STRING), POINTER(uint8_t), POINTER(uint16_t), POINTER(STRING)]
-MP4SetHintTrackRtpPayload = _libraries['/usr/lib/libmp4v2.so'].MP4SetHintTrackRtpPayload
-MP4SetHintTrackRtpPayload.restype = c_bool
-MP4SetHintTrackRtpPayload.argtypes = [MP4FileHandle, MP4TrackId, STRING, POINTER(uint8_t), uint16_t, STRING, c_bool, c_bool]
-MP4GetSessionSdp = _libraries['/usr/lib/libmp4v2.so'].MP4GetSessionSdp
-MP4GetSessionSdp.restype = STRING
-MP4GetSessionSdp.argtypes = [MP4FileHandle]
-MP4SetSessionSdp = _libraries['/usr/lib/libmp4v2.so'].MP4SetSessionSdp
-MP4SetSessionSdp.restype = c_bool
-MP4SetSessionSdp.argtypes = [MP4FileHandle, STRING]
-MP4AppendSessionSdp = _libraries['/usr/lib/libmp4v2.so'].MP4AppendSessionSdp
-MP4AppendSessionSdp.restype = c_bool
-MP4AppendSessionSdp.argtypes = [MP4FileHandle, STRING]
-MP4GetHintTrackSdp = _libraries['/usr/lib/libmp4v2.so'].MP4GetHintTrackSdp
-MP4GetHintTrackSdp.restype = STRING
-MP4GetHintTrackSdp.argtypes = [MP4FileHandle, MP4TrackId]
-MP4SetHintTrackSdp = _libraries['/usr/lib/libmp4v2.so'].MP4SetHintTrackSdp
-MP4SetHintTrackSdp.restype = c_bool
-MP4SetHintTrackSdp.argtypes = [MP4FileHandle, MP4TrackId, STRING]
-MP4AppendHintTrackSdp = _libraries['/usr/lib/libmp4v2.so'].MP4AppendHintTrackSdp
-MP4AppendHintTrackSdp.restype = c_bool
-MP4AppendHintTrackSdp.argtypes = [MP4FileHandle, MP4TrackId, STRING]
-MP4GetHintTrackReferenceTrackId = _libraries['/usr/lib/libmp4v2.so'].MP4GetHintTrackReferenceTrackId
-MP4GetHintTrackReferenceTrackId.restype = MP4TrackId
-MP4GetHintTrackReferenceTrackId.argtypes = [MP4FileHandle, MP4TrackId]
-MP4ReadRtpHint = _libraries['/usr/lib/libmp4v2.so'].MP4ReadRtpHint
-MP4ReadRtpHint.restype = c_bool
-MP4ReadRtpHint.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId, POINTER(uint16_t)]
-MP4GetRtpHintNumberOfPackets = _libraries['/usr/lib/libmp4v2.so'].MP4GetRtpHintNumberOfPackets
-MP4GetRtpHintNumberOfPackets.restype = uint16_t
-MP4GetRtpHintNumberOfPackets.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetRtpPacketBFrame = _libraries['/usr/lib/libmp4v2.so'].MP4GetRtpPacketBFrame
-MP4GetRtpPacketBFrame.restype = int8_t
-MP4GetRtpPacketBFrame.argtypes = [MP4FileHandle, MP4TrackId, uint16_t]
 int32_t = c_int32
-MP4GetRtpPacketTransmitOffset = _libraries['/usr/lib/libmp4v2.so'].MP4GetRtpPacketTransmitOffset
-MP4GetRtpPacketTransmitOffset.restype = int32_t
-MP4GetRtpPacketTransmitOffset.argtypes = [MP4FileHandle, MP4TrackId, uint16_t]
-MP4ReadRtpPacket = _libraries['/usr/lib/libmp4v2.so'].MP4ReadRtpPacket
-MP4ReadRtpPacket.restype = c_bool
-MP4ReadRtpPacket.argtypes = [MP4FileHandle, MP4TrackId, uint16_t, POINTER(POINTER(uint8_t)), POINTER(uint32_t), uint32_t, c_bool, c_bool]
-MP4GetRtpTimestampStart = _libraries['/usr/lib/libmp4v2.so'].MP4GetRtpTimestampStart
-MP4GetRtpTimestampStart.restype = MP4Timestamp
-MP4GetRtpTimestampStart.argtypes = [MP4FileHandle, MP4TrackId]
-MP4SetRtpTimestampStart = _libraries['/usr/lib/libmp4v2.so'].MP4SetRtpTimestampStart
-MP4SetRtpTimestampStart.restype = c_bool
-MP4SetRtpTimestampStart.argtypes = [MP4FileHandle, MP4TrackId, MP4Timestamp]
-MP4AddRtpHint = _libraries['/usr/lib/libmp4v2.so'].MP4AddRtpHint
-MP4AddRtpHint.restype = c_bool
-MP4AddRtpHint.argtypes = [MP4FileHandle, MP4TrackId]
-MP4AddRtpVideoHint = _libraries['/usr/lib/libmp4v2.so'].MP4AddRtpVideoHint
-MP4AddRtpVideoHint.restype = c_bool
-MP4AddRtpVideoHint.argtypes = [MP4FileHandle, MP4TrackId, c_bool, uint32_t]
-MP4AddRtpPacket = _libraries['/usr/lib/libmp4v2.so'].MP4AddRtpPacket
-MP4AddRtpPacket.restype = c_bool
-MP4AddRtpPacket.argtypes = [MP4FileHandle, MP4TrackId, c_bool, int32_t]
-MP4AddRtpImmediateData = _libraries['/usr/lib/libmp4v2.so'].MP4AddRtpImmediateData
-MP4AddRtpImmediateData.restype = c_bool
-MP4AddRtpImmediateData.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint8_t), uint32_t]
-MP4AddRtpSampleData = _libraries['/usr/lib/libmp4v2.so'].MP4AddRtpSampleData
-MP4AddRtpSampleData.restype = c_bool
-MP4AddRtpSampleData.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId, uint32_t, uint32_t]
-MP4AddRtpESConfigurationPacket = _libraries['/usr/lib/libmp4v2.so'].MP4AddRtpESConfigurationPacket
-MP4AddRtpESConfigurationPacket.restype = c_bool
-MP4AddRtpESConfigurationPacket.argtypes = [MP4FileHandle, MP4TrackId]
-MP4WriteRtpHint = _libraries['/usr/lib/libmp4v2.so'].MP4WriteRtpHint
-MP4WriteRtpHint.restype = c_bool
-MP4WriteRtpHint.argtypes = [MP4FileHandle, MP4TrackId, MP4Duration, c_bool]
-MP4AddTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddTrack
-MP4AddTrack.restype = MP4TrackId
-MP4AddTrack.argtypes = [MP4FileHandle, STRING, uint32_t]
-MP4AddSystemsTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddSystemsTrack
-MP4AddSystemsTrack.restype = MP4TrackId
-MP4AddSystemsTrack.argtypes = [MP4FileHandle, STRING]
-MP4AddODTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddODTrack
-MP4AddODTrack.restype = MP4TrackId
-MP4AddODTrack.argtypes = [MP4FileHandle]
-MP4AddSceneTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddSceneTrack
-MP4AddSceneTrack.restype = MP4TrackId
-MP4AddSceneTrack.argtypes = [MP4FileHandle]
-MP4AddAudioTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddAudioTrack
-MP4AddAudioTrack.restype = MP4TrackId
-MP4AddAudioTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, uint8_t]
-MP4AddULawAudioTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddULawAudioTrack
-MP4AddULawAudioTrack.restype = MP4TrackId
-MP4AddULawAudioTrack.argtypes = [MP4FileHandle, uint32_t]
-MP4AddALawAudioTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddALawAudioTrack
-MP4AddALawAudioTrack.restype = MP4TrackId
-MP4AddALawAudioTrack.argtypes = [MP4FileHandle, uint32_t]
-MP4AddAC3AudioTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddAC3AudioTrack
-MP4AddAC3AudioTrack.restype = MP4TrackId
-MP4AddAC3AudioTrack.argtypes = [MP4FileHandle, uint32_t, uint8_t, uint8_t, uint8_t, uint8_t, uint8_t, uint8_t]
-MP4AddAmrAudioTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddAmrAudioTrack
-MP4AddAmrAudioTrack.restype = MP4TrackId
-MP4AddAmrAudioTrack.argtypes = [MP4FileHandle, uint32_t, uint16_t, uint8_t, uint8_t, c_bool]
-MP4SetAmrVendor = _libraries['/usr/lib/libmp4v2.so'].MP4SetAmrVendor
-MP4SetAmrVendor.restype = None
-MP4SetAmrVendor.argtypes = [MP4FileHandle, MP4TrackId, uint32_t]
-MP4SetAmrDecoderVersion = _libraries['/usr/lib/libmp4v2.so'].MP4SetAmrDecoderVersion
-MP4SetAmrDecoderVersion.restype = None
-MP4SetAmrDecoderVersion.argtypes = [MP4FileHandle, MP4TrackId, uint8_t]
-MP4SetAmrModeSet = _libraries['/usr/lib/libmp4v2.so'].MP4SetAmrModeSet
-MP4SetAmrModeSet.restype = None
-MP4SetAmrModeSet.argtypes = [MP4FileHandle, MP4TrackId, uint16_t]
-MP4GetAmrModeSet = _libraries['/usr/lib/libmp4v2.so'].MP4GetAmrModeSet
-MP4GetAmrModeSet.restype = uint16_t
-MP4GetAmrModeSet.argtypes = [MP4FileHandle, MP4TrackId]
-MP4AddHrefTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddHrefTrack
-MP4AddHrefTrack.restype = MP4TrackId
-MP4AddHrefTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, STRING]
-MP4GetHrefTrackBaseUrl = _libraries['/usr/lib/libmp4v2.so'].MP4GetHrefTrackBaseUrl
-MP4GetHrefTrackBaseUrl.restype = STRING
-MP4GetHrefTrackBaseUrl.argtypes = [MP4FileHandle, MP4TrackId]
-MP4AddVideoTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddVideoTrack
-MP4AddVideoTrack.restype = MP4TrackId
-MP4AddVideoTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, uint16_t, uint16_t, uint8_t]
-MP4AddH264VideoTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddH264VideoTrack
-MP4AddH264VideoTrack.restype = MP4TrackId
-MP4AddH264VideoTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, uint16_t, uint16_t, uint8_t, uint8_t, uint8_t, uint8_t]
-MP4AddH264SequenceParameterSet = _libraries['/usr/lib/libmp4v2.so'].MP4AddH264SequenceParameterSet
-MP4AddH264SequenceParameterSet.restype = None
-MP4AddH264SequenceParameterSet.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint8_t), uint16_t]
-MP4AddH264PictureParameterSet = _libraries['/usr/lib/libmp4v2.so'].MP4AddH264PictureParameterSet
-MP4AddH264PictureParameterSet.restype = None
-MP4AddH264PictureParameterSet.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint8_t), uint16_t]
-MP4SetH263Vendor = _libraries['/usr/lib/libmp4v2.so'].MP4SetH263Vendor
-MP4SetH263Vendor.restype = None
-MP4SetH263Vendor.argtypes = [MP4FileHandle, MP4TrackId, uint32_t]
-MP4SetH263DecoderVersion = _libraries['/usr/lib/libmp4v2.so'].MP4SetH263DecoderVersion
-MP4SetH263DecoderVersion.restype = None
-MP4SetH263DecoderVersion.argtypes = [MP4FileHandle, MP4TrackId, uint8_t]
-MP4SetH263Bitrates = _libraries['/usr/lib/libmp4v2.so'].MP4SetH263Bitrates
-MP4SetH263Bitrates.restype = None
-MP4SetH263Bitrates.argtypes = [MP4FileHandle, MP4TrackId, uint32_t, uint32_t]
-MP4AddH263VideoTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddH263VideoTrack
-MP4AddH263VideoTrack.restype = MP4TrackId
-MP4AddH263VideoTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, uint16_t, uint16_t, uint8_t, uint8_t, uint32_t, uint32_t]
-MP4AddHintTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddHintTrack
-MP4AddHintTrack.restype = MP4TrackId
-MP4AddHintTrack.argtypes = [MP4FileHandle, MP4TrackId]
-MP4AddTextTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddTextTrack
-MP4AddTextTrack.restype = MP4TrackId
-MP4AddTextTrack.argtypes = [MP4FileHandle, MP4TrackId]
-MP4AddSubtitleTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddSubtitleTrack
-MP4AddSubtitleTrack.restype = MP4TrackId
-MP4AddSubtitleTrack.argtypes = [MP4FileHandle, uint32_t, uint16_t, uint16_t]
-MP4AddSubpicTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddSubpicTrack
-MP4AddSubpicTrack.restype = MP4TrackId
-MP4AddSubpicTrack.argtypes = [MP4FileHandle, uint32_t, uint16_t, uint16_t]
-MP4AddPixelAspectRatio = _libraries['/usr/lib/libmp4v2.so'].MP4AddPixelAspectRatio
-MP4AddPixelAspectRatio.restype = MP4TrackId
-MP4AddPixelAspectRatio.argtypes = [MP4FileHandle, MP4TrackId, uint32_t, uint32_t]
-MP4AddColr = _libraries['/usr/lib/libmp4v2.so'].MP4AddColr
-MP4AddColr.restype = MP4TrackId
-MP4AddColr.argtypes = [MP4FileHandle, MP4TrackId, uint16_t, uint16_t, uint16_t]
-MP4CloneTrack = _libraries['/usr/lib/libmp4v2.so'].MP4CloneTrack
-MP4CloneTrack.restype = MP4TrackId
-MP4CloneTrack.argtypes = [MP4FileHandle, MP4TrackId, MP4FileHandle, MP4TrackId]
-MP4CopyTrack = _libraries['/usr/lib/libmp4v2.so'].MP4CopyTrack
-MP4CopyTrack.restype = MP4TrackId
-MP4CopyTrack.argtypes = [MP4FileHandle, MP4TrackId, MP4FileHandle, c_bool, MP4TrackId]
-MP4DeleteTrack = _libraries['/usr/lib/libmp4v2.so'].MP4DeleteTrack
-MP4DeleteTrack.restype = c_bool
-MP4DeleteTrack.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetNumberOfTracks = _libraries['/usr/lib/libmp4v2.so'].MP4GetNumberOfTracks
-MP4GetNumberOfTracks.restype = uint32_t
-MP4GetNumberOfTracks.argtypes = [MP4FileHandle, STRING, uint8_t]
-MP4FindTrackId = _libraries['/usr/lib/libmp4v2.so'].MP4FindTrackId
-MP4FindTrackId.restype = MP4TrackId
-MP4FindTrackId.argtypes = [MP4FileHandle, uint16_t, STRING, uint8_t]
-MP4FindTrackIndex = _libraries['/usr/lib/libmp4v2.so'].MP4FindTrackIndex
-MP4FindTrackIndex.restype = uint16_t
-MP4FindTrackIndex.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetTrackDurationPerChunk = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackDurationPerChunk
-MP4GetTrackDurationPerChunk.restype = c_bool
-MP4GetTrackDurationPerChunk.argtypes = [MP4FileHandle, MP4TrackId, POINTER(MP4Duration)]
-MP4SetTrackDurationPerChunk = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackDurationPerChunk
-MP4SetTrackDurationPerChunk.restype = c_bool
-MP4SetTrackDurationPerChunk.argtypes = [MP4FileHandle, MP4TrackId, MP4Duration]
-MP4AddIPodUUID = _libraries['/usr/lib/libmp4v2.so'].MP4AddIPodUUID
-MP4AddIPodUUID.restype = c_bool
-MP4AddIPodUUID.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetTrackType = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackType
-MP4GetTrackType.restype = STRING
-MP4GetTrackType.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetTrackMediaDataName = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackMediaDataName
-MP4GetTrackMediaDataName.restype = STRING
-MP4GetTrackMediaDataName.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetTrackMediaDataOriginalFormat = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackMediaDataOriginalFormat
-MP4GetTrackMediaDataOriginalFormat.restype = c_bool
-MP4GetTrackMediaDataOriginalFormat.argtypes = [MP4FileHandle, MP4TrackId, STRING, uint32_t]
-MP4GetTrackDuration = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackDuration
-MP4GetTrackDuration.restype = MP4Duration
-MP4GetTrackDuration.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetTrackTimeScale = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackTimeScale
-MP4GetTrackTimeScale.restype = uint32_t
-MP4GetTrackTimeScale.argtypes = [MP4FileHandle, MP4TrackId]
-MP4SetTrackTimeScale = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackTimeScale
-MP4SetTrackTimeScale.restype = c_bool
-MP4SetTrackTimeScale.argtypes = [MP4FileHandle, MP4TrackId, uint32_t]
-MP4GetTrackLanguage = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackLanguage
-MP4GetTrackLanguage.restype = c_bool
-MP4GetTrackLanguage.argtypes = [MP4FileHandle, MP4TrackId, STRING]
-MP4SetTrackLanguage = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackLanguage
-MP4SetTrackLanguage.restype = c_bool
-MP4SetTrackLanguage.argtypes = [MP4FileHandle, MP4TrackId, STRING]
-MP4GetTrackName = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackName
-MP4GetTrackName.restype = c_bool
-MP4GetTrackName.argtypes = [MP4FileHandle, MP4TrackId, POINTER(STRING)]
-MP4SetTrackName = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackName
-MP4SetTrackName.restype = c_bool
-MP4SetTrackName.argtypes = [MP4FileHandle, MP4TrackId, STRING]
-MP4GetTrackAudioMpeg4Type = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackAudioMpeg4Type
-MP4GetTrackAudioMpeg4Type.restype = uint8_t
-MP4GetTrackAudioMpeg4Type.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetTrackEsdsObjectTypeId = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackEsdsObjectTypeId
-MP4GetTrackEsdsObjectTypeId.restype = uint8_t
-MP4GetTrackEsdsObjectTypeId.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetTrackFixedSampleDuration = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackFixedSampleDuration
-MP4GetTrackFixedSampleDuration.restype = MP4Duration
-MP4GetTrackFixedSampleDuration.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetTrackBitRate = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackBitRate
-MP4GetTrackBitRate.restype = uint32_t
-MP4GetTrackBitRate.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetTrackVideoMetadata = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackVideoMetadata
-MP4GetTrackVideoMetadata.restype = c_bool
-MP4GetTrackVideoMetadata.argtypes = [MP4FileHandle, MP4TrackId, POINTER(POINTER(uint8_t)), POINTER(uint32_t)]
-MP4GetTrackESConfiguration = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackESConfiguration
-MP4GetTrackESConfiguration.restype = c_bool
-MP4GetTrackESConfiguration.argtypes = [MP4FileHandle, MP4TrackId, POINTER(POINTER(uint8_t)), POINTER(uint32_t)]
-MP4SetTrackESConfiguration = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackESConfiguration
-MP4SetTrackESConfiguration.restype = c_bool
-MP4SetTrackESConfiguration.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint8_t), uint32_t]
-MP4GetTrackH264ProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackH264ProfileLevel
-MP4GetTrackH264ProfileLevel.restype = c_bool
-MP4GetTrackH264ProfileLevel.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint8_t), POINTER(uint8_t)]
-MP4GetTrackH264SeqPictHeaders = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackH264SeqPictHeaders
-MP4GetTrackH264SeqPictHeaders.restype = c_bool
-MP4GetTrackH264SeqPictHeaders.argtypes = [MP4FileHandle, MP4TrackId, POINTER(POINTER(POINTER(uint8_t))), POINTER(POINTER(uint32_t)), POINTER(POINTER(POINTER(uint8_t))), POINTER(POINTER(uint32_t))]
-MP4GetTrackH264LengthSize = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackH264LengthSize
-MP4GetTrackH264LengthSize.restype = c_bool
-MP4GetTrackH264LengthSize.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint32_t)]
-MP4GetTrackNumberOfSamples = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackNumberOfSamples
-MP4GetTrackNumberOfSamples.restype = MP4SampleId
-MP4GetTrackNumberOfSamples.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetTrackVideoWidth = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackVideoWidth
-MP4GetTrackVideoWidth.restype = uint16_t
-MP4GetTrackVideoWidth.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetTrackVideoHeight = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackVideoHeight
-MP4GetTrackVideoHeight.restype = uint16_t
-MP4GetTrackVideoHeight.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetTrackVideoFrameRate = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackVideoFrameRate
-MP4GetTrackVideoFrameRate.restype = c_double
-MP4GetTrackVideoFrameRate.argtypes = [MP4FileHandle, MP4TrackId]
-MP4GetTrackAudioChannels = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackAudioChannels
-MP4GetTrackAudioChannels.restype = c_int
-MP4GetTrackAudioChannels.argtypes = [MP4FileHandle, MP4TrackId]
-MP4IsIsmaCrypMediaTrack = _libraries['/usr/lib/libmp4v2.so'].MP4IsIsmaCrypMediaTrack
-MP4IsIsmaCrypMediaTrack.restype = c_bool
-MP4IsIsmaCrypMediaTrack.argtypes = [MP4FileHandle, MP4TrackId]
-MP4HaveTrackAtom = _libraries['/usr/lib/libmp4v2.so'].MP4HaveTrackAtom
-MP4HaveTrackAtom.restype = c_bool
-MP4HaveTrackAtom.argtypes = [MP4FileHandle, MP4TrackId, STRING]
-MP4GetTrackIntegerProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackIntegerProperty
-MP4GetTrackIntegerProperty.restype = c_bool
-MP4GetTrackIntegerProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, POINTER(uint64_t)]
-MP4GetTrackFloatProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackFloatProperty
-MP4GetTrackFloatProperty.restype = c_bool
-MP4GetTrackFloatProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, POINTER(c_float)]
-MP4GetTrackStringProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackStringProperty
-MP4GetTrackStringProperty.restype = c_bool
-MP4GetTrackStringProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, POINTER(STRING)]
-MP4GetTrackBytesProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackBytesProperty
-MP4GetTrackBytesProperty.restype = c_bool
-MP4GetTrackBytesProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, POINTER(POINTER(uint8_t)), POINTER(uint32_t)]
-MP4SetTrackIntegerProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackIntegerProperty
-MP4SetTrackIntegerProperty.restype = c_bool
-MP4SetTrackIntegerProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, int64_t]
-MP4SetTrackFloatProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackFloatProperty
-MP4SetTrackFloatProperty.restype = c_bool
-MP4SetTrackFloatProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, c_float]
-MP4SetTrackStringProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackStringProperty
-MP4SetTrackStringProperty.restype = c_bool
-MP4SetTrackStringProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, STRING]
-MP4SetTrackBytesProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackBytesProperty
-MP4SetTrackBytesProperty.restype = c_bool
-MP4SetTrackBytesProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, POINTER(uint8_t), uint32_t]
 int16_t = c_int16
 int_least8_t = c_byte
 int_least16_t = c_short
@@ -1734,280 +626,9 @@ intptr_t = c_int
 uintptr_t = c_uint
 intmax_t = c_longlong
 uintmax_t = c_ulonglong
-__FILE = _IO_FILE
 off_t = __off_t
 off64_t = __off64_t
 ssize_t = __ssize_t
-fpos_t = _G_fpos_t
-fpos64_t = _G_fpos64_t
-remove = _libraries['/usr/lib/libmp4v2.so'].remove
-remove.restype = c_int
-remove.argtypes = [STRING]
-rename = _libraries['/usr/lib/libmp4v2.so'].rename
-rename.restype = c_int
-rename.argtypes = [STRING, STRING]
-renameat = _libraries['/usr/lib/libmp4v2.so'].renameat
-renameat.restype = c_int
-renameat.argtypes = [c_int, STRING, c_int, STRING]
-tmpfile = _libraries['/usr/lib/libmp4v2.so'].tmpfile
-tmpfile.restype = POINTER(FILE)
-tmpfile.argtypes = []
-tmpfile64 = _libraries['/usr/lib/libmp4v2.so'].tmpfile64
-tmpfile64.restype = POINTER(FILE)
-tmpfile64.argtypes = []
-tmpnam = _libraries['/usr/lib/libmp4v2.so'].tmpnam
-tmpnam.restype = STRING
-tmpnam.argtypes = [STRING]
-tmpnam_r = _libraries['/usr/lib/libmp4v2.so'].tmpnam_r
-tmpnam_r.restype = STRING
-tmpnam_r.argtypes = [STRING]
-tempnam = _libraries['/usr/lib/libmp4v2.so'].tempnam
-tempnam.restype = STRING
-tempnam.argtypes = [STRING, STRING]
-fclose = _libraries['/usr/lib/libmp4v2.so'].fclose
-fclose.restype = c_int
-fclose.argtypes = [POINTER(FILE)]
-fflush = _libraries['/usr/lib/libmp4v2.so'].fflush
-fflush.restype = c_int
-fflush.argtypes = [POINTER(FILE)]
-fflush_unlocked = _libraries['/usr/lib/libmp4v2.so'].fflush_unlocked
-fflush_unlocked.restype = c_int
-fflush_unlocked.argtypes = [POINTER(FILE)]
-fcloseall = _libraries['/usr/lib/libmp4v2.so'].fcloseall
-fcloseall.restype = c_int
-fcloseall.argtypes = []
-fopen = _libraries['/usr/lib/libmp4v2.so'].fopen
-fopen.restype = POINTER(FILE)
-fopen.argtypes = [STRING, STRING]
-freopen = _libraries['/usr/lib/libmp4v2.so'].freopen
-freopen.restype = POINTER(FILE)
-freopen.argtypes = [STRING, STRING, POINTER(FILE)]
-fopen64 = _libraries['/usr/lib/libmp4v2.so'].fopen64
-fopen64.restype = POINTER(FILE)
-fopen64.argtypes = [STRING, STRING]
-freopen64 = _libraries['/usr/lib/libmp4v2.so'].freopen64
-freopen64.restype = POINTER(FILE)
-freopen64.argtypes = [STRING, STRING, POINTER(FILE)]
-fdopen = _libraries['/usr/lib/libmp4v2.so'].fdopen
-fdopen.restype = POINTER(FILE)
-fdopen.argtypes = [c_int, STRING]
-fopencookie = _libraries['/usr/lib/libmp4v2.so'].fopencookie
-fopencookie.restype = POINTER(FILE)
-fopencookie.argtypes = [c_void_p, STRING, _IO_cookie_io_functions_t]
-fmemopen = _libraries['/usr/lib/libmp4v2.so'].fmemopen
-fmemopen.restype = POINTER(FILE)
-fmemopen.argtypes = [c_void_p, size_t, STRING]
-open_memstream = _libraries['/usr/lib/libmp4v2.so'].open_memstream
-open_memstream.restype = POINTER(FILE)
-open_memstream.argtypes = [POINTER(STRING), POINTER(size_t)]
-setbuf = _libraries['/usr/lib/libmp4v2.so'].setbuf
-setbuf.restype = None
-setbuf.argtypes = [POINTER(FILE), STRING]
-setvbuf = _libraries['/usr/lib/libmp4v2.so'].setvbuf
-setvbuf.restype = c_int
-setvbuf.argtypes = [POINTER(FILE), STRING, c_int, size_t]
-setbuffer = _libraries['/usr/lib/libmp4v2.so'].setbuffer
-setbuffer.restype = None
-setbuffer.argtypes = [POINTER(FILE), STRING, size_t]
-setlinebuf = _libraries['/usr/lib/libmp4v2.so'].setlinebuf
-setlinebuf.restype = None
-setlinebuf.argtypes = [POINTER(FILE)]
-fprintf = _libraries['/usr/lib/libmp4v2.so'].fprintf
-fprintf.restype = c_int
-fprintf.argtypes = [POINTER(FILE), STRING]
-printf = _libraries['/usr/lib/libmp4v2.so'].printf
-printf.restype = c_int
-printf.argtypes = [STRING]
-sprintf = _libraries['/usr/lib/libmp4v2.so'].sprintf
-sprintf.restype = c_int
-sprintf.argtypes = [STRING, STRING]
-vfprintf = _libraries['/usr/lib/libmp4v2.so'].vfprintf
-vfprintf.restype = c_int
-vfprintf.argtypes = [POINTER(FILE), STRING, __gnuc_va_list]
-vsprintf = _libraries['/usr/lib/libmp4v2.so'].vsprintf
-vsprintf.restype = c_int
-vsprintf.argtypes = [STRING, STRING, __gnuc_va_list]
-snprintf = _libraries['/usr/lib/libmp4v2.so'].snprintf
-snprintf.restype = c_int
-snprintf.argtypes = [STRING, size_t, STRING]
-vsnprintf = _libraries['/usr/lib/libmp4v2.so'].vsnprintf
-vsnprintf.restype = c_int
-vsnprintf.argtypes = [STRING, size_t, STRING, __gnuc_va_list]
-vasprintf = _libraries['/usr/lib/libmp4v2.so'].vasprintf
-vasprintf.restype = c_int
-vasprintf.argtypes = [POINTER(STRING), STRING, __gnuc_va_list]
-__asprintf = _libraries['/usr/lib/libmp4v2.so'].__asprintf
-__asprintf.restype = c_int
-__asprintf.argtypes = [POINTER(STRING), STRING]
-asprintf = _libraries['/usr/lib/libmp4v2.so'].asprintf
-asprintf.restype = c_int
-asprintf.argtypes = [POINTER(STRING), STRING]
-vdprintf = _libraries['/usr/lib/libmp4v2.so'].vdprintf
-vdprintf.restype = c_int
-vdprintf.argtypes = [c_int, STRING, __gnuc_va_list]
-dprintf = _libraries['/usr/lib/libmp4v2.so'].dprintf
-dprintf.restype = c_int
-dprintf.argtypes = [c_int, STRING]
-fscanf = _libraries['/usr/lib/libmp4v2.so'].fscanf
-fscanf.restype = c_int
-fscanf.argtypes = [POINTER(FILE), STRING]
-scanf = _libraries['/usr/lib/libmp4v2.so'].scanf
-scanf.restype = c_int
-scanf.argtypes = [STRING]
-sscanf = _libraries['/usr/lib/libmp4v2.so'].sscanf
-sscanf.restype = c_int
-sscanf.argtypes = [STRING, STRING]
-vfscanf = _libraries['/usr/lib/libmp4v2.so'].vfscanf
-vfscanf.restype = c_int
-vfscanf.argtypes = [POINTER(FILE), STRING, __gnuc_va_list]
-vscanf = _libraries['/usr/lib/libmp4v2.so'].vscanf
-vscanf.restype = c_int
-vscanf.argtypes = [STRING, __gnuc_va_list]
-vsscanf = _libraries['/usr/lib/libmp4v2.so'].vsscanf
-vsscanf.restype = c_int
-vsscanf.argtypes = [STRING, STRING, __gnuc_va_list]
-fgetc = _libraries['/usr/lib/libmp4v2.so'].fgetc
-fgetc.restype = c_int
-fgetc.argtypes = [POINTER(FILE)]
-getc = _libraries['/usr/lib/libmp4v2.so'].getc
-getc.restype = c_int
-getc.argtypes = [POINTER(FILE)]
-fputc = _libraries['/usr/lib/libmp4v2.so'].fputc
-fputc.restype = c_int
-fputc.argtypes = [c_int, POINTER(FILE)]
-putc = _libraries['/usr/lib/libmp4v2.so'].putc
-putc.restype = c_int
-putc.argtypes = [c_int, POINTER(FILE)]
-getw = _libraries['/usr/lib/libmp4v2.so'].getw
-getw.restype = c_int
-getw.argtypes = [POINTER(FILE)]
-putw = _libraries['/usr/lib/libmp4v2.so'].putw
-putw.restype = c_int
-putw.argtypes = [c_int, POINTER(FILE)]
-fgets = _libraries['/usr/lib/libmp4v2.so'].fgets
-fgets.restype = STRING
-fgets.argtypes = [STRING, c_int, POINTER(FILE)]
-gets = _libraries['/usr/lib/libmp4v2.so'].gets
-gets.restype = STRING
-gets.argtypes = [STRING]
-fgets_unlocked = _libraries['/usr/lib/libmp4v2.so'].fgets_unlocked
-fgets_unlocked.restype = STRING
-fgets_unlocked.argtypes = [STRING, c_int, POINTER(FILE)]
-__getdelim = _libraries['/usr/lib/libmp4v2.so'].__getdelim
-__getdelim.restype = __ssize_t
-__getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]
-getdelim = _libraries['/usr/lib/libmp4v2.so'].getdelim
-getdelim.restype = __ssize_t
-getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]
-fputs = _libraries['/usr/lib/libmp4v2.so'].fputs
-fputs.restype = c_int
-fputs.argtypes = [STRING, POINTER(FILE)]
-puts = _libraries['/usr/lib/libmp4v2.so'].puts
-puts.restype = c_int
-puts.argtypes = [STRING]
-ungetc = _libraries['/usr/lib/libmp4v2.so'].ungetc
-ungetc.restype = c_int
-ungetc.argtypes = [c_int, POINTER(FILE)]
-fread = _libraries['/usr/lib/libmp4v2.so'].fread
-fread.restype = size_t
-fread.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-fwrite = _libraries['/usr/lib/libmp4v2.so'].fwrite
-fwrite.restype = size_t
-fwrite.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-fputs_unlocked = _libraries['/usr/lib/libmp4v2.so'].fputs_unlocked
-fputs_unlocked.restype = c_int
-fputs_unlocked.argtypes = [STRING, POINTER(FILE)]
-fread_unlocked = _libraries['/usr/lib/libmp4v2.so'].fread_unlocked
-fread_unlocked.restype = size_t
-fread_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-fwrite_unlocked = _libraries['/usr/lib/libmp4v2.so'].fwrite_unlocked
-fwrite_unlocked.restype = size_t
-fwrite_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]
-fseek = _libraries['/usr/lib/libmp4v2.so'].fseek
-fseek.restype = c_int
-fseek.argtypes = [POINTER(FILE), c_long, c_int]
-ftell = _libraries['/usr/lib/libmp4v2.so'].ftell
-ftell.restype = c_long
-ftell.argtypes = [POINTER(FILE)]
-rewind = _libraries['/usr/lib/libmp4v2.so'].rewind
-rewind.restype = None
-rewind.argtypes = [POINTER(FILE)]
-fseeko = _libraries['/usr/lib/libmp4v2.so'].fseeko
-fseeko.restype = c_int
-fseeko.argtypes = [POINTER(FILE), __off_t, c_int]
-ftello = _libraries['/usr/lib/libmp4v2.so'].ftello
-ftello.restype = __off_t
-ftello.argtypes = [POINTER(FILE)]
-fgetpos = _libraries['/usr/lib/libmp4v2.so'].fgetpos
-fgetpos.restype = c_int
-fgetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]
-fsetpos = _libraries['/usr/lib/libmp4v2.so'].fsetpos
-fsetpos.restype = c_int
-fsetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]
-fseeko64 = _libraries['/usr/lib/libmp4v2.so'].fseeko64
-fseeko64.restype = c_int
-fseeko64.argtypes = [POINTER(FILE), __off64_t, c_int]
-ftello64 = _libraries['/usr/lib/libmp4v2.so'].ftello64
-ftello64.restype = __off64_t
-ftello64.argtypes = [POINTER(FILE)]
-fgetpos64 = _libraries['/usr/lib/libmp4v2.so'].fgetpos64
-fgetpos64.restype = c_int
-fgetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]
-fsetpos64 = _libraries['/usr/lib/libmp4v2.so'].fsetpos64
-fsetpos64.restype = c_int
-fsetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]
-clearerr = _libraries['/usr/lib/libmp4v2.so'].clearerr
-clearerr.restype = None
-clearerr.argtypes = [POINTER(FILE)]
-feof = _libraries['/usr/lib/libmp4v2.so'].feof
-feof.restype = c_int
-feof.argtypes = [POINTER(FILE)]
-ferror = _libraries['/usr/lib/libmp4v2.so'].ferror
-ferror.restype = c_int
-ferror.argtypes = [POINTER(FILE)]
-clearerr_unlocked = _libraries['/usr/lib/libmp4v2.so'].clearerr_unlocked
-clearerr_unlocked.restype = None
-clearerr_unlocked.argtypes = [POINTER(FILE)]
-perror = _libraries['/usr/lib/libmp4v2.so'].perror
-perror.restype = None
-perror.argtypes = [STRING]
-fileno = _libraries['/usr/lib/libmp4v2.so'].fileno
-fileno.restype = c_int
-fileno.argtypes = [POINTER(FILE)]
-fileno_unlocked = _libraries['/usr/lib/libmp4v2.so'].fileno_unlocked
-fileno_unlocked.restype = c_int
-fileno_unlocked.argtypes = [POINTER(FILE)]
-popen = _libraries['/usr/lib/libmp4v2.so'].popen
-popen.restype = POINTER(FILE)
-popen.argtypes = [STRING, STRING]
-pclose = _libraries['/usr/lib/libmp4v2.so'].pclose
-pclose.restype = c_int
-pclose.argtypes = [POINTER(FILE)]
-ctermid = _libraries['/usr/lib/libmp4v2.so'].ctermid
-ctermid.restype = STRING
-ctermid.argtypes = [STRING]
-cuserid = _libraries['/usr/lib/libmp4v2.so'].cuserid
-cuserid.restype = STRING
-cuserid.argtypes = [STRING]
-class obstack(Structure):
-    pass
-obstack._fields_ = [
-]
-obstack_printf = _libraries['/usr/lib/libmp4v2.so'].obstack_printf
-obstack_printf.restype = c_int
-obstack_printf.argtypes = [POINTER(obstack), STRING]
-obstack_vprintf = _libraries['/usr/lib/libmp4v2.so'].obstack_vprintf
-obstack_vprintf.restype = c_int
-obstack_vprintf.argtypes = [POINTER(obstack), STRING, __gnuc_va_list]
-flockfile = _libraries['/usr/lib/libmp4v2.so'].flockfile
-flockfile.restype = None
-flockfile.argtypes = [POINTER(FILE)]
-ftrylockfile = _libraries['/usr/lib/libmp4v2.so'].ftrylockfile
-ftrylockfile.restype = c_int
-ftrylockfile.argtypes = [POINTER(FILE)]
-funlockfile = _libraries['/usr/lib/libmp4v2.so'].funlockfile
-funlockfile.restype = None
-funlockfile.argtypes = [POINTER(FILE)]
 ptrdiff_t = c_int
 __all__ = ['MP4_ITMF_BT_ISRC', '_ATFILE_SOURCE', 'EOF',
            'MP4V2_PROJECT_repo_root', 'MP4GetTrackEditDuration',
@@ -2376,3 +997,2163 @@ __all__ = ['MP4_ITMF_BT_ISRC', '_ATFILE_SOURCE', 'EOF',
            'MP4_MPEG4_AAC_SSR_AUDIO_TYPE', 'MP4TagsSetSortComposer',
            'MP4_ITMF_BT_JPEG', '__codecvt_noconv', '_IOLBF',
            '_G_int32_t', 'offsetof', 'FILEMODE_MODIFY']
+
+
+# The base class, lazy names used and code that finishes defining each
+# lazy name.
+_definitions = {
+    '_IO_FILE': ('Structure', ('_IO_marker',),
+        '_IO_FILE._pack_ = 4\n'
+        '_IO_FILE._fields_ = [\n'
+        "    ('_flags', c_int),\n"
+        "    ('_IO_read_ptr', STRING),\n"
+        "    ('_IO_read_end', STRING),\n"
+        "    ('_IO_read_base', STRING),\n"
+        "    ('_IO_write_base', STRING),\n"
+        "    ('_IO_write_ptr', STRING),\n"
+        "    ('_IO_write_end', STRING),\n"
+        "    ('_IO_buf_base', STRING),\n"
+        "    ('_IO_buf_end', STRING),\n"
+        "    ('_IO_save_base', STRING),\n"
+        "    ('_IO_backup_base', STRING),\n"
+        "    ('_IO_save_end', STRING),\n"
+        "    ('_markers', POINTER(_IO_marker)),\n"
+        "    ('_chain', POINTER(_IO_FILE)),\n"
+        "    ('_fileno', c_int),\n"
+        "    ('_flags2', c_int),\n"
+        "    ('_old_offset', __off_t),\n"
+        "    ('_cur_column', c_ushort),\n"
+        "    ('_vtable_offset', c_byte),\n"
+        "    ('_shortbuf', c_char * 1),\n"
+        "    ('_lock', POINTER(_IO_lock_t)),\n"
+        "    ('_offset', __off64_t),\n"
+        "    ('__pad1', c_void_p),\n"
+        "    ('__pad2', c_void_p),\n"
+        "    ('__pad3', c_void_p),\n"
+        "    ('__pad4', c_void_p),\n"
+        "    ('__pad5', size_t),\n"
+        "    ('_mode', c_int),\n"
+        "    ('_unused2', c_char * 40),\n"
+        ']'
+        ),
+    'stdout': (None, ('_IO_FILE',),
+        "stdout = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmp4v2.so'], 'stdout')\n"
+        'stdout = stdout # alias'
+        ),
+    'stdin': (None, ('_IO_FILE',),
+        "stdin = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmp4v2.so'], 'stdin')\n"
+        'stdin = stdin # alias'
+        ),
+    'stderr': (None, ('_IO_FILE',),
+        "stderr = (POINTER(_IO_FILE)).in_dll(_libraries['/usr/lib/libmp4v2.so'], 'stderr')\n"
+        'stderr = stderr # alias'
+        ),
+    'putc': (None, ('FILE', '_IO_putc'),
+        'def putc(_ch,_fp): return _IO_putc (_ch, _fp) # macro\n'
+        "putc = _libraries['/usr/lib/libmp4v2.so'].putc\n"
+        'putc.restype = c_int\n'
+        'putc.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    '_G_fpos64_t': ('Structure', ('__mbstate_t',),
+        '_G_fpos64_t._pack_ = 4\n'
+        '_G_fpos64_t._fields_ = [\n'
+        "    ('__pos', __off64_t),\n"
+        "    ('__state', __mbstate_t),\n"
+        ']'
+        ),
+    '__mbstate_t': ('Structure', ('N11__mbstate_t3DOT_2E',),
+        '__mbstate_t._fields_ = [\n'
+        "    ('__count', c_int),\n"
+        "    ('__value', N11__mbstate_t3DOT_2E),\n"
+        ']'
+        ),
+    'N11__mbstate_t3DOT_2E': ('Union', (),
+        'N11__mbstate_t3DOT_2E._fields_ = [\n'
+        "    ('__wch', c_uint),\n"
+        "    ('__wchb', c_char * 4),\n"
+        ']'
+        ),
+    '_IO_fpos64_t': (None, ('_G_fpos64_t',),
+        '_IO_fpos64_t = _G_fpos64_t # alias'
+        ),
+    '_G_fpos_t': ('Structure', ('__mbstate_t',),
+        '_G_fpos_t._fields_ = [\n'
+        "    ('__pos', __off_t),\n"
+        "    ('__state', __mbstate_t),\n"
+        ']'
+        ),
+    '_IO_fpos_t': (None, ('_G_fpos_t',),
+        '_IO_fpos_t = _G_fpos_t # alias'
+        ),
+    'getc': (None, ('FILE', '_IO_getc'),
+        'def getc(_fp): return _IO_getc (_fp) # macro\n'
+        "getc = _libraries['/usr/lib/libmp4v2.so'].getc\n"
+        'getc.restype = c_int\n'
+        'getc.argtypes = [POINTER(FILE)]'
+        ),
+    '_IO_pos_t': (None, ('_G_fpos_t',),
+        '_IO_pos_t = _G_fpos_t # alias'
+        ),
+    'vprintf': (None, (),
+        "vprintf = _libraries['/usr/lib/libmp4v2.so'].vprintf\n"
+        'vprintf.restype = c_int\n'
+        'vprintf.argtypes = [STRING, __gnuc_va_list]'
+        ),
+    'getchar': (None, (),
+        "getchar = _libraries['/usr/lib/libmp4v2.so'].getchar\n"
+        'getchar.restype = c_int\n'
+        'getchar.argtypes = []'
+        ),
+    'FILE': (None, ('_IO_FILE',),
+        'FILE = _IO_FILE'
+        ),
+    'fgetc_unlocked': (None, ('FILE',),
+        "fgetc_unlocked = _libraries['/usr/lib/libmp4v2.so'].fgetc_unlocked\n"
+        'fgetc_unlocked.restype = c_int\n'
+        'fgetc_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'getc_unlocked': (None, ('FILE',),
+        "getc_unlocked = _libraries['/usr/lib/libmp4v2.so'].getc_unlocked\n"
+        'getc_unlocked.restype = c_int\n'
+        'getc_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'getchar_unlocked': (None, (),
+        "getchar_unlocked = _libraries['/usr/lib/libmp4v2.so'].getchar_unlocked\n"
+        'getchar_unlocked.restype = c_int\n'
+        'getchar_unlocked.argtypes = []'
+        ),
+    'putchar': (None, (),
+        "putchar = _libraries['/usr/lib/libmp4v2.so'].putchar\n"
+        'putchar.restype = c_int\n'
+        'putchar.argtypes = [c_int]'
+        ),
+    'fputc_unlocked': (None, ('FILE',),
+        "fputc_unlocked = _libraries['/usr/lib/libmp4v2.so'].fputc_unlocked\n"
+        'fputc_unlocked.restype = c_int\n'
+        'fputc_unlocked.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'putc_unlocked': (None, ('FILE',),
+        "putc_unlocked = _libraries['/usr/lib/libmp4v2.so'].putc_unlocked\n"
+        'putc_unlocked.restype = c_int\n'
+        'putc_unlocked.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'putchar_unlocked': (None, (),
+        "putchar_unlocked = _libraries['/usr/lib/libmp4v2.so'].putchar_unlocked\n"
+        'putchar_unlocked.restype = c_int\n'
+        'putchar_unlocked.argtypes = [c_int]'
+        ),
+    'getline': (None, ('FILE',),
+        "getline = _libraries['/usr/lib/libmp4v2.so'].getline\n"
+        'getline.restype = __ssize_t\n'
+        'getline.argtypes = [POINTER(STRING), POINTER(size_t), POINTER(FILE)]'
+        ),
+    'feof_unlocked': (None, ('FILE',),
+        "feof_unlocked = _libraries['/usr/lib/libmp4v2.so'].feof_unlocked\n"
+        'feof_unlocked.restype = c_int\n'
+        'feof_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'ferror_unlocked': (None, ('FILE',),
+        "ferror_unlocked = _libraries['/usr/lib/libmp4v2.so'].ferror_unlocked\n"
+        'ferror_unlocked.restype = c_int\n'
+        'ferror_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'sys_nerr': (None, (),
+        "sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libmp4v2.so'], 'sys_nerr')"
+        ),
+    'sys_errlist': (None, (),
+        "sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libmp4v2.so'], 'sys_errlist')"
+        ),
+    '_sys_nerr': (None, (),
+        "_sys_nerr = (c_int).in_dll(_libraries['/usr/lib/libmp4v2.so'], '_sys_nerr')"
+        ),
+    '_sys_errlist': (None, (),
+        "_sys_errlist = (STRING * 0).in_dll(_libraries['/usr/lib/libmp4v2.so'], '_sys_errlist')"
+        ),
+    '__fsid_t': ('Structure', (),
+        '__fsid_t._fields_ = [\n'
+        "    ('__val', c_int * 2),\n"
+        ']'
+        ),
+    '_IO_jump_t': ('Structure', (),
+        '_IO_jump_t._fields_ = [\n'
+        ']'
+        ),
+    '_IO_marker': ('Structure', ('_IO_FILE',),
+        '_IO_marker._fields_ = [\n'
+        "    ('_next', POINTER(_IO_marker)),\n"
+        "    ('_sbuf', POINTER(_IO_FILE)),\n"
+        "    ('_pos', c_int),\n"
+        ']'
+        ),
+    '_IO_FILE_plus': ('Structure', (),
+        '_IO_FILE_plus._fields_ = [\n'
+        ']'
+        ),
+    '_IO_2_1_stdin_': (None, ('_IO_FILE_plus',),
+        "_IO_2_1_stdin_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmp4v2.so'], '_IO_2_1_stdin_')"
+        ),
+    '_IO_2_1_stdout_': (None, ('_IO_FILE_plus',),
+        "_IO_2_1_stdout_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmp4v2.so'], '_IO_2_1_stdout_')"
+        ),
+    '_IO_2_1_stderr_': (None, ('_IO_FILE_plus',),
+        "_IO_2_1_stderr_ = (_IO_FILE_plus).in_dll(_libraries['/usr/lib/libmp4v2.so'], '_IO_2_1_stderr_')"
+        ),
+    '_IO_cookie_io_functions_t': ('Structure', (),
+        '_IO_cookie_io_functions_t._fields_ = [\n'
+        "    ('read', POINTER(__io_read_fn)),\n"
+        "    ('write', POINTER(__io_write_fn)),\n"
+        "    ('seek', POINTER(__io_seek_fn)),\n"
+        "    ('close', POINTER(__io_close_fn)),\n"
+        ']'
+        ),
+    'cookie_io_functions_t': (None, ('_IO_cookie_io_functions_t',),
+        'cookie_io_functions_t = _IO_cookie_io_functions_t'
+        ),
+    '_IO_cookie_file': ('Structure', (),
+        '_IO_cookie_file._fields_ = [\n'
+        ']'
+        ),
+    '__underflow': (None, ('_IO_FILE',),
+        "__underflow = _libraries['/usr/lib/libmp4v2.so'].__underflow\n"
+        '__underflow.restype = c_int\n'
+        '__underflow.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '__uflow': (None, ('_IO_FILE',),
+        "__uflow = _libraries['/usr/lib/libmp4v2.so'].__uflow\n"
+        '__uflow.restype = c_int\n'
+        '__uflow.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '__overflow': (None, ('_IO_FILE',),
+        "__overflow = _libraries['/usr/lib/libmp4v2.so'].__overflow\n"
+        '__overflow.restype = c_int\n'
+        '__overflow.argtypes = [POINTER(_IO_FILE), c_int]'
+        ),
+    '_IO_getc': (None, ('_IO_FILE',),
+        "_IO_getc = _libraries['/usr/lib/libmp4v2.so']._IO_getc\n"
+        '_IO_getc.restype = c_int\n'
+        '_IO_getc.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_putc': (None, ('_IO_FILE',),
+        "_IO_putc = _libraries['/usr/lib/libmp4v2.so']._IO_putc\n"
+        '_IO_putc.restype = c_int\n'
+        '_IO_putc.argtypes = [c_int, POINTER(_IO_FILE)]'
+        ),
+    '_IO_feof': (None, ('_IO_FILE',),
+        "_IO_feof = _libraries['/usr/lib/libmp4v2.so']._IO_feof\n"
+        '_IO_feof.restype = c_int\n'
+        '_IO_feof.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_ferror': (None, ('_IO_FILE',),
+        "_IO_ferror = _libraries['/usr/lib/libmp4v2.so']._IO_ferror\n"
+        '_IO_ferror.restype = c_int\n'
+        '_IO_ferror.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_peekc_locked': (None, ('_IO_FILE',),
+        "_IO_peekc_locked = _libraries['/usr/lib/libmp4v2.so']._IO_peekc_locked\n"
+        '_IO_peekc_locked.restype = c_int\n'
+        '_IO_peekc_locked.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_flockfile': (None, ('_IO_FILE',),
+        "_IO_flockfile = _libraries['/usr/lib/libmp4v2.so']._IO_flockfile\n"
+        '_IO_flockfile.restype = None\n'
+        '_IO_flockfile.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_funlockfile': (None, ('_IO_FILE',),
+        "_IO_funlockfile = _libraries['/usr/lib/libmp4v2.so']._IO_funlockfile\n"
+        '_IO_funlockfile.restype = None\n'
+        '_IO_funlockfile.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_ftrylockfile': (None, ('_IO_FILE',),
+        "_IO_ftrylockfile = _libraries['/usr/lib/libmp4v2.so']._IO_ftrylockfile\n"
+        '_IO_ftrylockfile.restype = c_int\n'
+        '_IO_ftrylockfile.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    '_IO_vfscanf': (None, ('_IO_FILE',),
+        "_IO_vfscanf = _libraries['/usr/lib/libmp4v2.so']._IO_vfscanf\n"
+        '_IO_vfscanf.restype = c_int\n'
+        '_IO_vfscanf.argtypes = [POINTER(_IO_FILE), STRING, __gnuc_va_list, POINTER(c_int)]'
+        ),
+    '_IO_vfprintf': (None, ('_IO_FILE',),
+        "_IO_vfprintf = _libraries['/usr/lib/libmp4v2.so']._IO_vfprintf\n"
+        '_IO_vfprintf.restype = c_int\n'
+        '_IO_vfprintf.argtypes = [POINTER(_IO_FILE), STRING, __gnuc_va_list]'
+        ),
+    '_IO_padn': (None, ('_IO_FILE',),
+        "_IO_padn = _libraries['/usr/lib/libmp4v2.so']._IO_padn\n"
+        '_IO_padn.restype = __ssize_t\n'
+        '_IO_padn.argtypes = [POINTER(_IO_FILE), c_int, __ssize_t]'
+        ),
+    '_IO_sgetn': (None, ('_IO_FILE',),
+        "_IO_sgetn = _libraries['/usr/lib/libmp4v2.so']._IO_sgetn\n"
+        '_IO_sgetn.restype = size_t\n'
+        '_IO_sgetn.argtypes = [POINTER(_IO_FILE), c_void_p, size_t]'
+        ),
+    '_IO_seekoff': (None, ('_IO_FILE',),
+        "_IO_seekoff = _libraries['/usr/lib/libmp4v2.so']._IO_seekoff\n"
+        '_IO_seekoff.restype = __off64_t\n'
+        '_IO_seekoff.argtypes = [POINTER(_IO_FILE), __off64_t, c_int, c_int]'
+        ),
+    '_IO_seekpos': (None, ('_IO_FILE',),
+        "_IO_seekpos = _libraries['/usr/lib/libmp4v2.so']._IO_seekpos\n"
+        '_IO_seekpos.restype = __off64_t\n'
+        '_IO_seekpos.argtypes = [POINTER(_IO_FILE), __off64_t, c_int]'
+        ),
+    '_IO_free_backup_area': (None, ('_IO_FILE',),
+        "_IO_free_backup_area = _libraries['/usr/lib/libmp4v2.so']._IO_free_backup_area\n"
+        '_IO_free_backup_area.restype = None\n'
+        '_IO_free_backup_area.argtypes = [POINTER(_IO_FILE)]'
+        ),
+    'MP4Chapter_s': ('Structure', (),
+        'MP4Chapter_s._pack_ = 4\n'
+        'MP4Chapter_s._fields_ = [\n'
+        "    ('duration', MP4Duration),\n"
+        "    ('title', c_char * 1024),\n"
+        ']'
+        ),
+    'MP4Chapter_t': (None, ('MP4Chapter_s',),
+        'MP4Chapter_t = MP4Chapter_s'
+        ),
+    'MP4AddChapter': (None, (),
+        "MP4AddChapter = _libraries['/usr/lib/libmp4v2.so'].MP4AddChapter\n"
+        'MP4AddChapter.restype = None\n'
+        'MP4AddChapter.argtypes = [MP4FileHandle, MP4TrackId, MP4Duration, STRING]'
+        ),
+    'MP4AddChapterTextTrack': (None, (),
+        "MP4AddChapterTextTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddChapterTextTrack\n"
+        'MP4AddChapterTextTrack.restype = MP4TrackId\n'
+        'MP4AddChapterTextTrack.argtypes = [MP4FileHandle, MP4TrackId, uint32_t]'
+        ),
+    'MP4AddNeroChapter': (None, (),
+        "MP4AddNeroChapter = _libraries['/usr/lib/libmp4v2.so'].MP4AddNeroChapter\n"
+        'MP4AddNeroChapter.restype = None\n'
+        'MP4AddNeroChapter.argtypes = [MP4FileHandle, MP4Timestamp, STRING]'
+        ),
+    'MP4ConvertChapters': (None, (),
+        "MP4ConvertChapters = _libraries['/usr/lib/libmp4v2.so'].MP4ConvertChapters\n"
+        'MP4ConvertChapters.restype = MP4ChapterType\n'
+        'MP4ConvertChapters.argtypes = [MP4FileHandle, MP4ChapterType]'
+        ),
+    'MP4DeleteChapters': (None, (),
+        "MP4DeleteChapters = _libraries['/usr/lib/libmp4v2.so'].MP4DeleteChapters\n"
+        'MP4DeleteChapters.restype = MP4ChapterType\n'
+        'MP4DeleteChapters.argtypes = [MP4FileHandle, MP4ChapterType, MP4TrackId]'
+        ),
+    'MP4GetChapters': (None, ('MP4Chapter_t',),
+        "MP4GetChapters = _libraries['/usr/lib/libmp4v2.so'].MP4GetChapters\n"
+        'MP4GetChapters.restype = MP4ChapterType\n'
+        'MP4GetChapters.argtypes = [MP4FileHandle, POINTER(POINTER(MP4Chapter_t)), POINTER(uint32_t), MP4ChapterType]'
+        ),
+    'MP4SetChapters': (None, ('MP4Chapter_t',),
+        "MP4SetChapters = _libraries['/usr/lib/libmp4v2.so'].MP4SetChapters\n"
+        'MP4SetChapters.restype = MP4ChapterType\n'
+        'MP4SetChapters.argtypes = [MP4FileHandle, POINTER(MP4Chapter_t), uint32_t, MP4ChapterType]'
+        ),
+    'MP4FileProvider_s': ('Structure', (),
+        'MP4FileProvider_s._fields_ = [\n'
+        "    ('open', CFUNCTYPE(c_void_p, STRING, MP4FileMode)),\n"
+        "    ('seek', CFUNCTYPE(c_int, c_void_p, int64_t)),\n"
+        "    ('read', CFUNCTYPE(c_int, c_void_p, c_void_p, int64_t, POINTER(int64_t), int64_t)),\n"
+        "    ('write', CFUNCTYPE(c_int, c_void_p, c_void_p, int64_t, POINTER(int64_t), int64_t)),\n"
+        "    ('close', CFUNCTYPE(c_int, c_void_p)),\n"
+        ']'
+        ),
+    'MP4FileProvider': (None, ('MP4FileProvider_s',),
+        'MP4FileProvider = MP4FileProvider_s'
+        ),
+    'MP4Close': (None, (),
+        "MP4Close = _libraries['/usr/lib/libmp4v2.so'].MP4Close\n"
+        'MP4Close.restype = None\n'
+        'MP4Close.argtypes = [MP4FileHandle, uint32_t]'
+        ),
+    'MP4Create': (None, (),
+        "MP4Create = _libraries['/usr/lib/libmp4v2.so'].MP4Create\n"
+        'MP4Create.restype = MP4FileHandle\n'
+        'MP4Create.argtypes = [STRING, uint32_t]'
+        ),
+    'MP4CreateEx': (None, (),
+        "MP4CreateEx = _libraries['/usr/lib/libmp4v2.so'].MP4CreateEx\n"
+        'MP4CreateEx.restype = MP4FileHandle\n'
+        'MP4CreateEx.argtypes = [STRING, uint32_t, c_int, c_int, STRING, uint32_t, POINTER(STRING), uint32_t]'
+        ),
+    'MP4Dump': (None, (),
+        "MP4Dump = _libraries['/usr/lib/libmp4v2.so'].MP4Dump\n"
+        'MP4Dump.restype = c_bool\n'
+        'MP4Dump.argtypes = [MP4FileHandle, c_bool]'
+        ),
+    'MP4FileInfo': (None, (),
+        "MP4FileInfo = _libraries['/usr/lib/libmp4v2.so'].MP4FileInfo\n"
+        'MP4FileInfo.restype = STRING\n'
+        'MP4FileInfo.argtypes = [STRING, MP4TrackId]'
+        ),
+    'MP4GetFilename': (None, (),
+        "MP4GetFilename = _libraries['/usr/lib/libmp4v2.so'].MP4GetFilename\n"
+        'MP4GetFilename.restype = STRING\n'
+        'MP4GetFilename.argtypes = [MP4FileHandle]'
+        ),
+    'MP4Info': (None, (),
+        "MP4Info = _libraries['/usr/lib/libmp4v2.so'].MP4Info\n"
+        'MP4Info.restype = STRING\n'
+        'MP4Info.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4Modify': (None, (),
+        "MP4Modify = _libraries['/usr/lib/libmp4v2.so'].MP4Modify\n"
+        'MP4Modify.restype = MP4FileHandle\n'
+        'MP4Modify.argtypes = [STRING, uint32_t]'
+        ),
+    'MP4Optimize': (None, (),
+        "MP4Optimize = _libraries['/usr/lib/libmp4v2.so'].MP4Optimize\n"
+        'MP4Optimize.restype = c_bool\n'
+        'MP4Optimize.argtypes = [STRING, STRING]'
+        ),
+    'MP4Read': (None, (),
+        "MP4Read = _libraries['/usr/lib/libmp4v2.so'].MP4Read\n"
+        'MP4Read.restype = MP4FileHandle\n'
+        'MP4Read.argtypes = [STRING]'
+        ),
+    'MP4ReadProvider': (None, ('MP4FileProvider',),
+        "MP4ReadProvider = _libraries['/usr/lib/libmp4v2.so'].MP4ReadProvider\n"
+        'MP4ReadProvider.restype = MP4FileHandle\n'
+        'MP4ReadProvider.argtypes = [STRING, POINTER(MP4FileProvider)]'
+        ),
+    'MP4HaveAtom': (None, (),
+        "MP4HaveAtom = _libraries['/usr/lib/libmp4v2.so'].MP4HaveAtom\n"
+        'MP4HaveAtom.restype = c_bool\n'
+        'MP4HaveAtom.argtypes = [MP4FileHandle, STRING]'
+        ),
+    'MP4GetIntegerProperty': (None, (),
+        "MP4GetIntegerProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetIntegerProperty\n"
+        'MP4GetIntegerProperty.restype = c_bool\n'
+        'MP4GetIntegerProperty.argtypes = [MP4FileHandle, STRING, POINTER(uint64_t)]'
+        ),
+    'MP4GetFloatProperty': (None, (),
+        "MP4GetFloatProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetFloatProperty\n"
+        'MP4GetFloatProperty.restype = c_bool\n'
+        'MP4GetFloatProperty.argtypes = [MP4FileHandle, STRING, POINTER(c_float)]'
+        ),
+    'MP4GetStringProperty': (None, (),
+        "MP4GetStringProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetStringProperty\n"
+        'MP4GetStringProperty.restype = c_bool\n'
+        'MP4GetStringProperty.argtypes = [MP4FileHandle, STRING, POINTER(STRING)]'
+        ),
+    'MP4GetBytesProperty': (None, (),
+        "MP4GetBytesProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetBytesProperty\n"
+        'MP4GetBytesProperty.restype = c_bool\n'
+        'MP4GetBytesProperty.argtypes = [MP4FileHandle, STRING, POINTER(POINTER(uint8_t)), POINTER(uint32_t)]'
+        ),
+    'MP4SetIntegerProperty': (None, (),
+        "MP4SetIntegerProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetIntegerProperty\n"
+        'MP4SetIntegerProperty.restype = c_bool\n'
+        'MP4SetIntegerProperty.argtypes = [MP4FileHandle, STRING, int64_t]'
+        ),
+    'MP4SetFloatProperty': (None, (),
+        "MP4SetFloatProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetFloatProperty\n"
+        'MP4SetFloatProperty.restype = c_bool\n'
+        'MP4SetFloatProperty.argtypes = [MP4FileHandle, STRING, c_float]'
+        ),
+    'MP4SetStringProperty': (None, (),
+        "MP4SetStringProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetStringProperty\n"
+        'MP4SetStringProperty.restype = c_bool\n'
+        'MP4SetStringProperty.argtypes = [MP4FileHandle, STRING, STRING]'
+        ),
+    'MP4SetBytesProperty': (None, (),
+        "MP4SetBytesProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetBytesProperty\n"
+        'MP4SetBytesProperty.restype = c_bool\n'
+        'MP4SetBytesProperty.argtypes = [MP4FileHandle, STRING, POINTER(uint8_t), uint32_t]'
+        ),
+    'MP4GetDuration': (None, (),
+        "MP4GetDuration = _libraries['/usr/lib/libmp4v2.so'].MP4GetDuration\n"
+        'MP4GetDuration.restype = MP4Duration\n'
+        'MP4GetDuration.argtypes = [MP4FileHandle]'
+        ),
+    'MP4GetTimeScale': (None, (),
+        "MP4GetTimeScale = _libraries['/usr/lib/libmp4v2.so'].MP4GetTimeScale\n"
+        'MP4GetTimeScale.restype = uint32_t\n'
+        'MP4GetTimeScale.argtypes = [MP4FileHandle]'
+        ),
+    'MP4SetTimeScale': (None, (),
+        "MP4SetTimeScale = _libraries['/usr/lib/libmp4v2.so'].MP4SetTimeScale\n"
+        'MP4SetTimeScale.restype = c_bool\n'
+        'MP4SetTimeScale.argtypes = [MP4FileHandle, uint32_t]'
+        ),
+    'MP4ChangeMovieTimeScale': (None, (),
+        "MP4ChangeMovieTimeScale = _libraries['/usr/lib/libmp4v2.so'].MP4ChangeMovieTimeScale\n"
+        'MP4ChangeMovieTimeScale.restype = None\n'
+        'MP4ChangeMovieTimeScale.argtypes = [MP4FileHandle, uint32_t]'
+        ),
+    'MP4GetODProfileLevel': (None, (),
+        "MP4GetODProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4GetODProfileLevel\n"
+        'MP4GetODProfileLevel.restype = uint8_t\n'
+        'MP4GetODProfileLevel.argtypes = [MP4FileHandle]'
+        ),
+    'MP4SetODProfileLevel': (None, (),
+        "MP4SetODProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4SetODProfileLevel\n"
+        'MP4SetODProfileLevel.restype = c_bool\n'
+        'MP4SetODProfileLevel.argtypes = [MP4FileHandle, uint8_t]'
+        ),
+    'MP4GetSceneProfileLevel': (None, (),
+        "MP4GetSceneProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4GetSceneProfileLevel\n"
+        'MP4GetSceneProfileLevel.restype = uint8_t\n'
+        'MP4GetSceneProfileLevel.argtypes = [MP4FileHandle]'
+        ),
+    'MP4SetSceneProfileLevel': (None, (),
+        "MP4SetSceneProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4SetSceneProfileLevel\n"
+        'MP4SetSceneProfileLevel.restype = c_bool\n'
+        'MP4SetSceneProfileLevel.argtypes = [MP4FileHandle, uint8_t]'
+        ),
+    'MP4GetVideoProfileLevel': (None, (),
+        "MP4GetVideoProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4GetVideoProfileLevel\n"
+        'MP4GetVideoProfileLevel.restype = uint8_t\n'
+        'MP4GetVideoProfileLevel.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4SetVideoProfileLevel': (None, (),
+        "MP4SetVideoProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4SetVideoProfileLevel\n"
+        'MP4SetVideoProfileLevel.restype = None\n'
+        'MP4SetVideoProfileLevel.argtypes = [MP4FileHandle, uint8_t]'
+        ),
+    'MP4GetAudioProfileLevel': (None, (),
+        "MP4GetAudioProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4GetAudioProfileLevel\n"
+        'MP4GetAudioProfileLevel.restype = uint8_t\n'
+        'MP4GetAudioProfileLevel.argtypes = [MP4FileHandle]'
+        ),
+    'MP4SetAudioProfileLevel': (None, (),
+        "MP4SetAudioProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4SetAudioProfileLevel\n"
+        'MP4SetAudioProfileLevel.restype = None\n'
+        'MP4SetAudioProfileLevel.argtypes = [MP4FileHandle, uint8_t]'
+        ),
+    'MP4GetGraphicsProfileLevel': (None, (),
+        "MP4GetGraphicsProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4GetGraphicsProfileLevel\n"
+        'MP4GetGraphicsProfileLevel.restype = uint8_t\n'
+        'MP4GetGraphicsProfileLevel.argtypes = [MP4FileHandle]'
+        ),
+    'MP4SetGraphicsProfileLevel': (None, (),
+        "MP4SetGraphicsProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4SetGraphicsProfileLevel\n"
+        'MP4SetGraphicsProfileLevel.restype = c_bool\n'
+        'MP4SetGraphicsProfileLevel.argtypes = [MP4FileHandle, uint8_t]'
+        ),
+    'MP4Make3GPCompliant': (None, (),
+        "MP4Make3GPCompliant = _libraries['/usr/lib/libmp4v2.so'].MP4Make3GPCompliant\n"
+        'MP4Make3GPCompliant.restype = c_bool\n'
+        'MP4Make3GPCompliant.argtypes = [STRING, STRING, uint32_t, POINTER(STRING), uint32_t, c_bool]'
+        ),
+    'MP4AddTrackEdit': (None, (),
+        "MP4AddTrackEdit = _libraries['/usr/lib/libmp4v2.so'].MP4AddTrackEdit\n"
+        'MP4AddTrackEdit.restype = MP4EditId\n'
+        'MP4AddTrackEdit.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId, MP4Timestamp, MP4Duration, c_bool]'
+        ),
+    'MP4DeleteTrackEdit': (None, (),
+        "MP4DeleteTrackEdit = _libraries['/usr/lib/libmp4v2.so'].MP4DeleteTrackEdit\n"
+        'MP4DeleteTrackEdit.restype = c_bool\n'
+        'MP4DeleteTrackEdit.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId]'
+        ),
+    'MP4GetTrackNumberOfEdits': (None, (),
+        "MP4GetTrackNumberOfEdits = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackNumberOfEdits\n"
+        'MP4GetTrackNumberOfEdits.restype = uint32_t\n'
+        'MP4GetTrackNumberOfEdits.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetTrackEditTotalDuration': (None, (),
+        "MP4GetTrackEditTotalDuration = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackEditTotalDuration\n"
+        'MP4GetTrackEditTotalDuration.restype = MP4Duration\n'
+        'MP4GetTrackEditTotalDuration.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId]'
+        ),
+    'MP4GetTrackEditMediaStart': (None, (),
+        "MP4GetTrackEditMediaStart = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackEditMediaStart\n"
+        'MP4GetTrackEditMediaStart.restype = MP4Timestamp\n'
+        'MP4GetTrackEditMediaStart.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId]'
+        ),
+    'MP4SetTrackEditMediaStart': (None, (),
+        "MP4SetTrackEditMediaStart = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackEditMediaStart\n"
+        'MP4SetTrackEditMediaStart.restype = c_bool\n'
+        'MP4SetTrackEditMediaStart.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId, MP4Timestamp]'
+        ),
+    'MP4GetTrackEditDuration': (None, (),
+        "MP4GetTrackEditDuration = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackEditDuration\n"
+        'MP4GetTrackEditDuration.restype = MP4Duration\n'
+        'MP4GetTrackEditDuration.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId]'
+        ),
+    'MP4SetTrackEditDuration': (None, (),
+        "MP4SetTrackEditDuration = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackEditDuration\n"
+        'MP4SetTrackEditDuration.restype = c_bool\n'
+        'MP4SetTrackEditDuration.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId, MP4Duration]'
+        ),
+    'MP4GetTrackEditDwell': (None, (),
+        "MP4GetTrackEditDwell = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackEditDwell\n"
+        'MP4GetTrackEditDwell.restype = int8_t\n'
+        'MP4GetTrackEditDwell.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId]'
+        ),
+    'MP4SetTrackEditDwell': (None, (),
+        "MP4SetTrackEditDwell = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackEditDwell\n"
+        'MP4SetTrackEditDwell.restype = c_bool\n'
+        'MP4SetTrackEditDwell.argtypes = [MP4FileHandle, MP4TrackId, MP4EditId, c_bool]'
+        ),
+    'MP4ReadSampleFromEditTime': (None, (),
+        "MP4ReadSampleFromEditTime = _libraries['/usr/lib/libmp4v2.so'].MP4ReadSampleFromEditTime\n"
+        'MP4ReadSampleFromEditTime.restype = c_bool\n'
+        'MP4ReadSampleFromEditTime.argtypes = [MP4FileHandle, MP4TrackId, MP4Timestamp, POINTER(POINTER(uint8_t)), POINTER(uint32_t), POINTER(MP4Timestamp), POINTER(MP4Duration), POINTER(MP4Duration), POINTER(c_bool)]'
+        ),
+    'MP4GetSampleIdFromEditTime': (None, (),
+        "MP4GetSampleIdFromEditTime = _libraries['/usr/lib/libmp4v2.so'].MP4GetSampleIdFromEditTime\n"
+        'MP4GetSampleIdFromEditTime.restype = MP4SampleId\n'
+        'MP4GetSampleIdFromEditTime.argtypes = [MP4FileHandle, MP4TrackId, MP4Timestamp, POINTER(MP4Timestamp), POINTER(MP4Duration)]'
+        ),
+    'MP4ConvertFromMovieDuration': (None, (),
+        "MP4ConvertFromMovieDuration = _libraries['/usr/lib/libmp4v2.so'].MP4ConvertFromMovieDuration\n"
+        'MP4ConvertFromMovieDuration.restype = uint64_t\n'
+        'MP4ConvertFromMovieDuration.argtypes = [MP4FileHandle, MP4Duration, uint32_t]'
+        ),
+    'MP4ConvertFromTrackTimestamp': (None, (),
+        "MP4ConvertFromTrackTimestamp = _libraries['/usr/lib/libmp4v2.so'].MP4ConvertFromTrackTimestamp\n"
+        'MP4ConvertFromTrackTimestamp.restype = uint64_t\n'
+        'MP4ConvertFromTrackTimestamp.argtypes = [MP4FileHandle, MP4TrackId, MP4Timestamp, uint32_t]'
+        ),
+    'MP4ConvertToTrackTimestamp': (None, (),
+        "MP4ConvertToTrackTimestamp = _libraries['/usr/lib/libmp4v2.so'].MP4ConvertToTrackTimestamp\n"
+        'MP4ConvertToTrackTimestamp.restype = MP4Timestamp\n'
+        'MP4ConvertToTrackTimestamp.argtypes = [MP4FileHandle, MP4TrackId, uint64_t, uint32_t]'
+        ),
+    'MP4ConvertFromTrackDuration': (None, (),
+        "MP4ConvertFromTrackDuration = _libraries['/usr/lib/libmp4v2.so'].MP4ConvertFromTrackDuration\n"
+        'MP4ConvertFromTrackDuration.restype = uint64_t\n'
+        'MP4ConvertFromTrackDuration.argtypes = [MP4FileHandle, MP4TrackId, MP4Duration, uint32_t]'
+        ),
+    'MP4ConvertToTrackDuration': (None, (),
+        "MP4ConvertToTrackDuration = _libraries['/usr/lib/libmp4v2.so'].MP4ConvertToTrackDuration\n"
+        'MP4ConvertToTrackDuration.restype = MP4Duration\n'
+        'MP4ConvertToTrackDuration.argtypes = [MP4FileHandle, MP4TrackId, uint64_t, uint32_t]'
+        ),
+    'MP4BinaryToBase16': (None, (),
+        "MP4BinaryToBase16 = _libraries['/usr/lib/libmp4v2.so'].MP4BinaryToBase16\n"
+        'MP4BinaryToBase16.restype = STRING\n'
+        'MP4BinaryToBase16.argtypes = [POINTER(uint8_t), uint32_t]'
+        ),
+    'MP4BinaryToBase64': (None, (),
+        "MP4BinaryToBase64 = _libraries['/usr/lib/libmp4v2.so'].MP4BinaryToBase64\n"
+        'MP4BinaryToBase64.restype = STRING\n'
+        'MP4BinaryToBase64.argtypes = [POINTER(uint8_t), uint32_t]'
+        ),
+    'MP4Free': (None, (),
+        "MP4Free = _libraries['/usr/lib/libmp4v2.so'].MP4Free\n"
+        'MP4Free.restype = None\n'
+        'MP4Free.argtypes = [c_void_p]'
+        ),
+    'MP4SetLogCallback': (None, (),
+        "MP4SetLogCallback = _libraries['/usr/lib/libmp4v2.so'].MP4SetLogCallback\n"
+        'MP4SetLogCallback.restype = None\n'
+        'MP4SetLogCallback.argtypes = [MP4LogCallback]'
+        ),
+    'MP4LogGetLevel': (None, (),
+        "MP4LogGetLevel = _libraries['/usr/lib/libmp4v2.so'].MP4LogGetLevel\n"
+        'MP4LogGetLevel.restype = MP4LogLevel\n'
+        'MP4LogGetLevel.argtypes = []'
+        ),
+    'MP4LogSetLevel': (None, (),
+        "MP4LogSetLevel = _libraries['/usr/lib/libmp4v2.so'].MP4LogSetLevel\n"
+        'MP4LogSetLevel.restype = None\n'
+        'MP4LogSetLevel.argtypes = [MP4LogLevel]'
+        ),
+    'mp4v2_ismacryp_session_params': ('Structure', (),
+        'mp4v2_ismacryp_session_params._fields_ = [\n'
+        "    ('scheme_type', uint32_t),\n"
+        "    ('scheme_version', uint16_t),\n"
+        "    ('key_ind_len', uint8_t),\n"
+        "    ('iv_len', uint8_t),\n"
+        "    ('selective_enc', uint8_t),\n"
+        "    ('kms_uri', STRING),\n"
+        ']'
+        ),
+    'mp4v2_ismacrypParams': (None, ('mp4v2_ismacryp_session_params',),
+        'mp4v2_ismacrypParams = mp4v2_ismacryp_session_params'
+        ),
+    'MP4DefaultISMACrypParams': (None, ('mp4v2_ismacrypParams',),
+        "MP4DefaultISMACrypParams = _libraries['/usr/lib/libmp4v2.so'].MP4DefaultISMACrypParams\n"
+        'MP4DefaultISMACrypParams.restype = POINTER(mp4v2_ismacrypParams)\n'
+        'MP4DefaultISMACrypParams.argtypes = [POINTER(mp4v2_ismacrypParams)]'
+        ),
+    'MP4AddEncAudioTrack': (None, ('mp4v2_ismacrypParams',),
+        "MP4AddEncAudioTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddEncAudioTrack\n"
+        'MP4AddEncAudioTrack.restype = MP4TrackId\n'
+        'MP4AddEncAudioTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, POINTER(mp4v2_ismacrypParams), uint8_t]'
+        ),
+    'MP4AddEncVideoTrack': (None, ('mp4v2_ismacrypParams',),
+        "MP4AddEncVideoTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddEncVideoTrack\n"
+        'MP4AddEncVideoTrack.restype = MP4TrackId\n'
+        'MP4AddEncVideoTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, uint16_t, uint16_t, POINTER(mp4v2_ismacrypParams), uint8_t, STRING]'
+        ),
+    'MP4AddEncH264VideoTrack': (None, ('mp4v2_ismacrypParams',),
+        "MP4AddEncH264VideoTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddEncH264VideoTrack\n"
+        'MP4AddEncH264VideoTrack.restype = MP4TrackId\n'
+        'MP4AddEncH264VideoTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, uint16_t, uint16_t, MP4FileHandle, MP4TrackId, POINTER(mp4v2_ismacrypParams)]'
+        ),
+    'MP4EncAndCloneTrack': (None, ('mp4v2_ismacrypParams',),
+        "MP4EncAndCloneTrack = _libraries['/usr/lib/libmp4v2.so'].MP4EncAndCloneTrack\n"
+        'MP4EncAndCloneTrack.restype = MP4TrackId\n'
+        'MP4EncAndCloneTrack.argtypes = [MP4FileHandle, MP4TrackId, POINTER(mp4v2_ismacrypParams), MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4EncAndCopyTrack': (None, ('mp4v2_ismacrypParams',),
+        "MP4EncAndCopyTrack = _libraries['/usr/lib/libmp4v2.so'].MP4EncAndCopyTrack\n"
+        'MP4EncAndCopyTrack.restype = MP4TrackId\n'
+        'MP4EncAndCopyTrack.argtypes = [MP4FileHandle, MP4TrackId, POINTER(mp4v2_ismacrypParams), encryptFunc_t, uint32_t, MP4FileHandle, c_bool, MP4TrackId]'
+        ),
+    'MP4MakeIsmaCompliant': (None, (),
+        "MP4MakeIsmaCompliant = _libraries['/usr/lib/libmp4v2.so'].MP4MakeIsmaCompliant\n"
+        'MP4MakeIsmaCompliant.restype = c_bool\n'
+        'MP4MakeIsmaCompliant.argtypes = [STRING, c_bool]'
+        ),
+    'MP4MakeIsmaSdpIod': (None, (),
+        "MP4MakeIsmaSdpIod = _libraries['/usr/lib/libmp4v2.so'].MP4MakeIsmaSdpIod\n"
+        'MP4MakeIsmaSdpIod.restype = STRING\n'
+        'MP4MakeIsmaSdpIod.argtypes = [uint8_t, uint32_t, POINTER(uint8_t), uint32_t, uint8_t, uint32_t, POINTER(uint8_t), uint32_t]'
+        ),
+    'MP4ItmfData_s': ('Structure', (),
+        'MP4ItmfData_s._fields_ = [\n'
+        "    ('typeSetIdentifier', uint8_t),\n"
+        "    ('typeCode', MP4ItmfBasicType),\n"
+        "    ('locale', uint32_t),\n"
+        "    ('value', POINTER(uint8_t)),\n"
+        "    ('valueSize', uint32_t),\n"
+        ']'
+        ),
+    'MP4ItmfData': (None, ('MP4ItmfData_s',),
+        'MP4ItmfData = MP4ItmfData_s'
+        ),
+    'MP4ItmfDataList_s': ('Structure', ('MP4ItmfData',),
+        'MP4ItmfDataList_s._fields_ = [\n'
+        "    ('elements', POINTER(MP4ItmfData)),\n"
+        "    ('size', uint32_t),\n"
+        ']'
+        ),
+    'MP4ItmfDataList': (None, ('MP4ItmfDataList_s',),
+        'MP4ItmfDataList = MP4ItmfDataList_s'
+        ),
+    'MP4ItmfItem_s': ('Structure', ('MP4ItmfDataList',),
+        'MP4ItmfItem_s._fields_ = [\n'
+        "    ('__handle', c_void_p),\n"
+        "    ('code', STRING),\n"
+        "    ('mean', STRING),\n"
+        "    ('name', STRING),\n"
+        "    ('dataList', MP4ItmfDataList),\n"
+        ']'
+        ),
+    'MP4ItmfItem': (None, ('MP4ItmfItem_s',),
+        'MP4ItmfItem = MP4ItmfItem_s'
+        ),
+    'MP4ItmfItemList_s': ('Structure', ('MP4ItmfItem',),
+        'MP4ItmfItemList_s._fields_ = [\n'
+        "    ('elements', POINTER(MP4ItmfItem)),\n"
+        "    ('size', uint32_t),\n"
+        ']'
+        ),
+    'MP4ItmfItemList': (None, ('MP4ItmfItemList_s',),
+        'MP4ItmfItemList = MP4ItmfItemList_s'
+        ),
+    'MP4ItmfItemAlloc': (None, ('MP4ItmfItem',),
+        "MP4ItmfItemAlloc = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfItemAlloc\n"
+        'MP4ItmfItemAlloc.restype = POINTER(MP4ItmfItem)\n'
+        'MP4ItmfItemAlloc.argtypes = [STRING, uint32_t]'
+        ),
+    'MP4ItmfItemFree': (None, ('MP4ItmfItem',),
+        "MP4ItmfItemFree = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfItemFree\n"
+        'MP4ItmfItemFree.restype = None\n'
+        'MP4ItmfItemFree.argtypes = [POINTER(MP4ItmfItem)]'
+        ),
+    'MP4ItmfItemListFree': (None, ('MP4ItmfItemList',),
+        "MP4ItmfItemListFree = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfItemListFree\n"
+        'MP4ItmfItemListFree.restype = None\n'
+        'MP4ItmfItemListFree.argtypes = [POINTER(MP4ItmfItemList)]'
+        ),
+    'MP4ItmfGetItems': (None, ('MP4ItmfItemList',),
+        "MP4ItmfGetItems = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfGetItems\n"
+        'MP4ItmfGetItems.restype = POINTER(MP4ItmfItemList)\n'
+        'MP4ItmfGetItems.argtypes = [MP4FileHandle]'
+        ),
+    'MP4ItmfGetItemsByCode': (None, ('MP4ItmfItemList',),
+        "MP4ItmfGetItemsByCode = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfGetItemsByCode\n"
+        'MP4ItmfGetItemsByCode.restype = POINTER(MP4ItmfItemList)\n'
+        'MP4ItmfGetItemsByCode.argtypes = [MP4FileHandle, STRING]'
+        ),
+    'MP4ItmfGetItemsByMeaning': (None, ('MP4ItmfItemList',),
+        "MP4ItmfGetItemsByMeaning = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfGetItemsByMeaning\n"
+        'MP4ItmfGetItemsByMeaning.restype = POINTER(MP4ItmfItemList)\n'
+        'MP4ItmfGetItemsByMeaning.argtypes = [MP4FileHandle, STRING, STRING]'
+        ),
+    'MP4ItmfAddItem': (None, ('MP4ItmfItem',),
+        "MP4ItmfAddItem = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfAddItem\n"
+        'MP4ItmfAddItem.restype = c_bool\n'
+        'MP4ItmfAddItem.argtypes = [MP4FileHandle, POINTER(MP4ItmfItem)]'
+        ),
+    'MP4ItmfSetItem': (None, ('MP4ItmfItem',),
+        "MP4ItmfSetItem = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfSetItem\n"
+        'MP4ItmfSetItem.restype = c_bool\n'
+        'MP4ItmfSetItem.argtypes = [MP4FileHandle, POINTER(MP4ItmfItem)]'
+        ),
+    'MP4ItmfRemoveItem': (None, ('MP4ItmfItem',),
+        "MP4ItmfRemoveItem = _libraries['/usr/lib/libmp4v2.so'].MP4ItmfRemoveItem\n"
+        'MP4ItmfRemoveItem.restype = c_bool\n'
+        'MP4ItmfRemoveItem.argtypes = [MP4FileHandle, POINTER(MP4ItmfItem)]'
+        ),
+    'MP4TagArtwork_s': ('Structure', (),
+        'MP4TagArtwork_s._fields_ = [\n'
+        "    ('data', c_void_p),\n"
+        "    ('size', uint32_t),\n"
+        "    ('type', MP4TagArtworkType),\n"
+        ']'
+        ),
+    'MP4TagArtwork': (None, ('MP4TagArtwork_s',),
+        'MP4TagArtwork = MP4TagArtwork_s'
+        ),
+    'MP4TagTrack_s': ('Structure', (),
+        'MP4TagTrack_s._fields_ = [\n'
+        "    ('index', uint16_t),\n"
+        "    ('total', uint16_t),\n"
+        ']'
+        ),
+    'MP4TagTrack': (None, ('MP4TagTrack_s',),
+        'MP4TagTrack = MP4TagTrack_s'
+        ),
+    'MP4TagDisk_s': ('Structure', (),
+        'MP4TagDisk_s._fields_ = [\n'
+        "    ('index', uint16_t),\n"
+        "    ('total', uint16_t),\n"
+        ']'
+        ),
+    'MP4TagDisk': (None, ('MP4TagDisk_s',),
+        'MP4TagDisk = MP4TagDisk_s'
+        ),
+    'MP4Tags_s': ('Structure', ('MP4TagArtwork', 'MP4TagDisk', 'MP4TagTrack'),
+        'MP4Tags_s._fields_ = [\n'
+        "    ('__handle', c_void_p),\n"
+        "    ('name', STRING),\n"
+        "    ('artist', STRING),\n"
+        "    ('albumArtist', STRING),\n"
+        "    ('album', STRING),\n"
+        "    ('grouping', STRING),\n"
+        "    ('composer', STRING),\n"
+        "    ('comments', STRING),\n"
+        "    ('genre', STRING),\n"
+        "    ('genreType', POINTER(uint16_t)),\n"
+        "    ('releaseDate', STRING),\n"
+        "    ('track', POINTER(MP4TagTrack)),\n"
+        "    ('disk', POINTER(MP4TagDisk)),\n"
+        "    ('tempo', POINTER(uint16_t)),\n"
+        "    ('compilation', POINTER(uint8_t)),\n"
+        "    ('tvShow', STRING),\n"
+        "    ('tvNetwork', STRING),\n"
+        "    ('tvEpisodeID', STRING),\n"
+        "    ('tvSeason', POINTER(uint32_t)),\n"
+        "    ('tvEpisode', POINTER(uint32_t)),\n"
+        "    ('description', STRING),\n"
+        "    ('longDescription', STRING),\n"
+        "    ('lyrics', STRING),\n"
+        "    ('sortName', STRING),\n"
+        "    ('sortArtist', STRING),\n"
+        "    ('sortAlbumArtist', STRING),\n"
+        "    ('sortAlbum', STRING),\n"
+        "    ('sortComposer', STRING),\n"
+        "    ('sortTVShow', STRING),\n"
+        "    ('artwork', POINTER(MP4TagArtwork)),\n"
+        "    ('artworkCount', uint32_t),\n"
+        "    ('copyright', STRING),\n"
+        "    ('encodingTool', STRING),\n"
+        "    ('encodedBy', STRING),\n"
+        "    ('purchaseDate', STRING),\n"
+        "    ('podcast', POINTER(uint8_t)),\n"
+        "    ('keywords', STRING),\n"
+        "    ('category', STRING),\n"
+        "    ('hdVideo', POINTER(uint8_t)),\n"
+        "    ('mediaType', POINTER(uint8_t)),\n"
+        "    ('contentRating', POINTER(uint8_t)),\n"
+        "    ('gapless', POINTER(uint8_t)),\n"
+        "    ('iTunesAccount', STRING),\n"
+        "    ('iTunesAccountType', POINTER(uint8_t)),\n"
+        "    ('iTunesCountry', POINTER(uint32_t)),\n"
+        "    ('contentID', POINTER(uint32_t)),\n"
+        "    ('artistID', POINTER(uint32_t)),\n"
+        "    ('playlistID', POINTER(uint64_t)),\n"
+        "    ('genreID', POINTER(uint32_t)),\n"
+        "    ('composerID', POINTER(uint32_t)),\n"
+        "    ('xid', STRING),\n"
+        ']'
+        ),
+    'MP4Tags': (None, ('MP4Tags_s',),
+        'MP4Tags = MP4Tags_s'
+        ),
+    'MP4TagsAlloc': (None, ('MP4Tags',),
+        "MP4TagsAlloc = _libraries['/usr/lib/libmp4v2.so'].MP4TagsAlloc\n"
+        'MP4TagsAlloc.restype = POINTER(MP4Tags)\n'
+        'MP4TagsAlloc.argtypes = []'
+        ),
+    'MP4TagsFetch': (None, ('MP4Tags',),
+        "MP4TagsFetch = _libraries['/usr/lib/libmp4v2.so'].MP4TagsFetch\n"
+        'MP4TagsFetch.restype = c_bool\n'
+        'MP4TagsFetch.argtypes = [POINTER(MP4Tags), MP4FileHandle]'
+        ),
+    'MP4TagsStore': (None, ('MP4Tags',),
+        "MP4TagsStore = _libraries['/usr/lib/libmp4v2.so'].MP4TagsStore\n"
+        'MP4TagsStore.restype = c_bool\n'
+        'MP4TagsStore.argtypes = [POINTER(MP4Tags), MP4FileHandle]'
+        ),
+    'MP4TagsFree': (None, ('MP4Tags',),
+        "MP4TagsFree = _libraries['/usr/lib/libmp4v2.so'].MP4TagsFree\n"
+        'MP4TagsFree.restype = None\n'
+        'MP4TagsFree.argtypes = [POINTER(MP4Tags)]'
+        ),
+    'MP4TagsHasMetadata': (None, ('MP4Tags',),
+        "MP4TagsHasMetadata = _libraries['/usr/lib/libmp4v2.so'].MP4TagsHasMetadata\n"
+        'MP4TagsHasMetadata.restype = c_bool\n'
+        'MP4TagsHasMetadata.argtypes = [POINTER(MP4Tags), POINTER(c_bool)]'
+        ),
+    'MP4TagsSetName': (None, ('MP4Tags',),
+        "MP4TagsSetName = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetName\n"
+        'MP4TagsSetName.restype = c_bool\n'
+        'MP4TagsSetName.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetArtist': (None, ('MP4Tags',),
+        "MP4TagsSetArtist = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetArtist\n"
+        'MP4TagsSetArtist.restype = c_bool\n'
+        'MP4TagsSetArtist.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetAlbumArtist': (None, ('MP4Tags',),
+        "MP4TagsSetAlbumArtist = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetAlbumArtist\n"
+        'MP4TagsSetAlbumArtist.restype = c_bool\n'
+        'MP4TagsSetAlbumArtist.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetAlbum': (None, ('MP4Tags',),
+        "MP4TagsSetAlbum = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetAlbum\n"
+        'MP4TagsSetAlbum.restype = c_bool\n'
+        'MP4TagsSetAlbum.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetGrouping': (None, ('MP4Tags',),
+        "MP4TagsSetGrouping = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetGrouping\n"
+        'MP4TagsSetGrouping.restype = c_bool\n'
+        'MP4TagsSetGrouping.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetComposer': (None, ('MP4Tags',),
+        "MP4TagsSetComposer = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetComposer\n"
+        'MP4TagsSetComposer.restype = c_bool\n'
+        'MP4TagsSetComposer.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetComments': (None, ('MP4Tags',),
+        "MP4TagsSetComments = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetComments\n"
+        'MP4TagsSetComments.restype = c_bool\n'
+        'MP4TagsSetComments.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetGenre': (None, ('MP4Tags',),
+        "MP4TagsSetGenre = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetGenre\n"
+        'MP4TagsSetGenre.restype = c_bool\n'
+        'MP4TagsSetGenre.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetGenreType': (None, ('MP4Tags',),
+        "MP4TagsSetGenreType = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetGenreType\n"
+        'MP4TagsSetGenreType.restype = c_bool\n'
+        'MP4TagsSetGenreType.argtypes = [POINTER(MP4Tags), POINTER(uint16_t)]'
+        ),
+    'MP4TagsSetReleaseDate': (None, ('MP4Tags',),
+        "MP4TagsSetReleaseDate = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetReleaseDate\n"
+        'MP4TagsSetReleaseDate.restype = c_bool\n'
+        'MP4TagsSetReleaseDate.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetTrack': (None, ('MP4TagTrack', 'MP4Tags'),
+        "MP4TagsSetTrack = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetTrack\n"
+        'MP4TagsSetTrack.restype = c_bool\n'
+        'MP4TagsSetTrack.argtypes = [POINTER(MP4Tags), POINTER(MP4TagTrack)]'
+        ),
+    'MP4TagsSetDisk': (None, ('MP4TagDisk', 'MP4Tags'),
+        "MP4TagsSetDisk = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetDisk\n"
+        'MP4TagsSetDisk.restype = c_bool\n'
+        'MP4TagsSetDisk.argtypes = [POINTER(MP4Tags), POINTER(MP4TagDisk)]'
+        ),
+    'MP4TagsSetTempo': (None, ('MP4Tags',),
+        "MP4TagsSetTempo = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetTempo\n"
+        'MP4TagsSetTempo.restype = c_bool\n'
+        'MP4TagsSetTempo.argtypes = [POINTER(MP4Tags), POINTER(uint16_t)]'
+        ),
+    'MP4TagsSetCompilation': (None, ('MP4Tags',),
+        "MP4TagsSetCompilation = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetCompilation\n"
+        'MP4TagsSetCompilation.restype = c_bool\n'
+        'MP4TagsSetCompilation.argtypes = [POINTER(MP4Tags), POINTER(uint8_t)]'
+        ),
+    'MP4TagsSetTVShow': (None, ('MP4Tags',),
+        "MP4TagsSetTVShow = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetTVShow\n"
+        'MP4TagsSetTVShow.restype = c_bool\n'
+        'MP4TagsSetTVShow.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetTVNetwork': (None, ('MP4Tags',),
+        "MP4TagsSetTVNetwork = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetTVNetwork\n"
+        'MP4TagsSetTVNetwork.restype = c_bool\n'
+        'MP4TagsSetTVNetwork.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetTVEpisodeID': (None, ('MP4Tags',),
+        "MP4TagsSetTVEpisodeID = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetTVEpisodeID\n"
+        'MP4TagsSetTVEpisodeID.restype = c_bool\n'
+        'MP4TagsSetTVEpisodeID.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetTVSeason': (None, ('MP4Tags',),
+        "MP4TagsSetTVSeason = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetTVSeason\n"
+        'MP4TagsSetTVSeason.restype = c_bool\n'
+        'MP4TagsSetTVSeason.argtypes = [POINTER(MP4Tags), POINTER(uint32_t)]'
+        ),
+    'MP4TagsSetTVEpisode': (None, ('MP4Tags',),
+        "MP4TagsSetTVEpisode = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetTVEpisode\n"
+        'MP4TagsSetTVEpisode.restype = c_bool\n'
+        'MP4TagsSetTVEpisode.argtypes = [POINTER(MP4Tags), POINTER(uint32_t)]'
+        ),
+    'MP4TagsSetDescription': (None, ('MP4Tags',),
+        "MP4TagsSetDescription = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetDescription\n"
+        'MP4TagsSetDescription.restype = c_bool\n'
+        'MP4TagsSetDescription.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetLongDescription': (None, ('MP4Tags',),
+        "MP4TagsSetLongDescription = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetLongDescription\n"
+        'MP4TagsSetLongDescription.restype = c_bool\n'
+        'MP4TagsSetLongDescription.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetLyrics': (None, ('MP4Tags',),
+        "MP4TagsSetLyrics = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetLyrics\n"
+        'MP4TagsSetLyrics.restype = c_bool\n'
+        'MP4TagsSetLyrics.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetSortName': (None, ('MP4Tags',),
+        "MP4TagsSetSortName = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetSortName\n"
+        'MP4TagsSetSortName.restype = c_bool\n'
+        'MP4TagsSetSortName.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetSortArtist': (None, ('MP4Tags',),
+        "MP4TagsSetSortArtist = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetSortArtist\n"
+        'MP4TagsSetSortArtist.restype = c_bool\n'
+        'MP4TagsSetSortArtist.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetSortAlbumArtist': (None, ('MP4Tags',),
+        "MP4TagsSetSortAlbumArtist = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetSortAlbumArtist\n"
+        'MP4TagsSetSortAlbumArtist.restype = c_bool\n'
+        'MP4TagsSetSortAlbumArtist.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetSortAlbum': (None, ('MP4Tags',),
+        "MP4TagsSetSortAlbum = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetSortAlbum\n"
+        'MP4TagsSetSortAlbum.restype = c_bool\n'
+        'MP4TagsSetSortAlbum.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetSortComposer': (None, ('MP4Tags',),
+        "MP4TagsSetSortComposer = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetSortComposer\n"
+        'MP4TagsSetSortComposer.restype = c_bool\n'
+        'MP4TagsSetSortComposer.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetSortTVShow': (None, ('MP4Tags',),
+        "MP4TagsSetSortTVShow = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetSortTVShow\n"
+        'MP4TagsSetSortTVShow.restype = c_bool\n'
+        'MP4TagsSetSortTVShow.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsAddArtwork': (None, ('MP4TagArtwork', 'MP4Tags'),
+        "MP4TagsAddArtwork = _libraries['/usr/lib/libmp4v2.so'].MP4TagsAddArtwork\n"
+        'MP4TagsAddArtwork.restype = c_bool\n'
+        'MP4TagsAddArtwork.argtypes = [POINTER(MP4Tags), POINTER(MP4TagArtwork)]'
+        ),
+    'MP4TagsSetArtwork': (None, ('MP4TagArtwork', 'MP4Tags'),
+        "MP4TagsSetArtwork = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetArtwork\n"
+        'MP4TagsSetArtwork.restype = c_bool\n'
+        'MP4TagsSetArtwork.argtypes = [POINTER(MP4Tags), uint32_t, POINTER(MP4TagArtwork)]'
+        ),
+    'MP4TagsRemoveArtwork': (None, ('MP4Tags',),
+        "MP4TagsRemoveArtwork = _libraries['/usr/lib/libmp4v2.so'].MP4TagsRemoveArtwork\n"
+        'MP4TagsRemoveArtwork.restype = c_bool\n'
+        'MP4TagsRemoveArtwork.argtypes = [POINTER(MP4Tags), uint32_t]'
+        ),
+    'MP4TagsSetCopyright': (None, ('MP4Tags',),
+        "MP4TagsSetCopyright = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetCopyright\n"
+        'MP4TagsSetCopyright.restype = c_bool\n'
+        'MP4TagsSetCopyright.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetEncodingTool': (None, ('MP4Tags',),
+        "MP4TagsSetEncodingTool = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetEncodingTool\n"
+        'MP4TagsSetEncodingTool.restype = c_bool\n'
+        'MP4TagsSetEncodingTool.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetEncodedBy': (None, ('MP4Tags',),
+        "MP4TagsSetEncodedBy = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetEncodedBy\n"
+        'MP4TagsSetEncodedBy.restype = c_bool\n'
+        'MP4TagsSetEncodedBy.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetPurchaseDate': (None, ('MP4Tags',),
+        "MP4TagsSetPurchaseDate = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetPurchaseDate\n"
+        'MP4TagsSetPurchaseDate.restype = c_bool\n'
+        'MP4TagsSetPurchaseDate.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetPodcast': (None, ('MP4Tags',),
+        "MP4TagsSetPodcast = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetPodcast\n"
+        'MP4TagsSetPodcast.restype = c_bool\n'
+        'MP4TagsSetPodcast.argtypes = [POINTER(MP4Tags), POINTER(uint8_t)]'
+        ),
+    'MP4TagsSetKeywords': (None, ('MP4Tags',),
+        "MP4TagsSetKeywords = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetKeywords\n"
+        'MP4TagsSetKeywords.restype = c_bool\n'
+        'MP4TagsSetKeywords.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetCategory': (None, ('MP4Tags',),
+        "MP4TagsSetCategory = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetCategory\n"
+        'MP4TagsSetCategory.restype = c_bool\n'
+        'MP4TagsSetCategory.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetHDVideo': (None, ('MP4Tags',),
+        "MP4TagsSetHDVideo = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetHDVideo\n"
+        'MP4TagsSetHDVideo.restype = c_bool\n'
+        'MP4TagsSetHDVideo.argtypes = [POINTER(MP4Tags), POINTER(uint8_t)]'
+        ),
+    'MP4TagsSetMediaType': (None, ('MP4Tags',),
+        "MP4TagsSetMediaType = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetMediaType\n"
+        'MP4TagsSetMediaType.restype = c_bool\n'
+        'MP4TagsSetMediaType.argtypes = [POINTER(MP4Tags), POINTER(uint8_t)]'
+        ),
+    'MP4TagsSetContentRating': (None, ('MP4Tags',),
+        "MP4TagsSetContentRating = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetContentRating\n"
+        'MP4TagsSetContentRating.restype = c_bool\n'
+        'MP4TagsSetContentRating.argtypes = [POINTER(MP4Tags), POINTER(uint8_t)]'
+        ),
+    'MP4TagsSetGapless': (None, ('MP4Tags',),
+        "MP4TagsSetGapless = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetGapless\n"
+        'MP4TagsSetGapless.restype = c_bool\n'
+        'MP4TagsSetGapless.argtypes = [POINTER(MP4Tags), POINTER(uint8_t)]'
+        ),
+    'MP4TagsSetITunesAccount': (None, ('MP4Tags',),
+        "MP4TagsSetITunesAccount = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetITunesAccount\n"
+        'MP4TagsSetITunesAccount.restype = c_bool\n'
+        'MP4TagsSetITunesAccount.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4TagsSetITunesAccountType': (None, ('MP4Tags',),
+        "MP4TagsSetITunesAccountType = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetITunesAccountType\n"
+        'MP4TagsSetITunesAccountType.restype = c_bool\n'
+        'MP4TagsSetITunesAccountType.argtypes = [POINTER(MP4Tags), POINTER(uint8_t)]'
+        ),
+    'MP4TagsSetITunesCountry': (None, ('MP4Tags',),
+        "MP4TagsSetITunesCountry = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetITunesCountry\n"
+        'MP4TagsSetITunesCountry.restype = c_bool\n'
+        'MP4TagsSetITunesCountry.argtypes = [POINTER(MP4Tags), POINTER(uint32_t)]'
+        ),
+    'MP4TagsSetContentID': (None, ('MP4Tags',),
+        "MP4TagsSetContentID = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetContentID\n"
+        'MP4TagsSetContentID.restype = c_bool\n'
+        'MP4TagsSetContentID.argtypes = [POINTER(MP4Tags), POINTER(uint32_t)]'
+        ),
+    'MP4TagsSetArtistID': (None, ('MP4Tags',),
+        "MP4TagsSetArtistID = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetArtistID\n"
+        'MP4TagsSetArtistID.restype = c_bool\n'
+        'MP4TagsSetArtistID.argtypes = [POINTER(MP4Tags), POINTER(uint32_t)]'
+        ),
+    'MP4TagsSetPlaylistID': (None, ('MP4Tags',),
+        "MP4TagsSetPlaylistID = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetPlaylistID\n"
+        'MP4TagsSetPlaylistID.restype = c_bool\n'
+        'MP4TagsSetPlaylistID.argtypes = [POINTER(MP4Tags), POINTER(uint64_t)]'
+        ),
+    'MP4TagsSetGenreID': (None, ('MP4Tags',),
+        "MP4TagsSetGenreID = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetGenreID\n"
+        'MP4TagsSetGenreID.restype = c_bool\n'
+        'MP4TagsSetGenreID.argtypes = [POINTER(MP4Tags), POINTER(uint32_t)]'
+        ),
+    'MP4TagsSetComposerID': (None, ('MP4Tags',),
+        "MP4TagsSetComposerID = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetComposerID\n"
+        'MP4TagsSetComposerID.restype = c_bool\n'
+        'MP4TagsSetComposerID.argtypes = [POINTER(MP4Tags), POINTER(uint32_t)]'
+        ),
+    'MP4TagsSetXID': (None, ('MP4Tags',),
+        "MP4TagsSetXID = _libraries['/usr/lib/libmp4v2.so'].MP4TagsSetXID\n"
+        'MP4TagsSetXID.restype = c_bool\n'
+        'MP4TagsSetXID.argtypes = [POINTER(MP4Tags), STRING]'
+        ),
+    'MP4ReadSample': (None, (),
+        "MP4ReadSample = _libraries['/usr/lib/libmp4v2.so'].MP4ReadSample\n"
+        'MP4ReadSample.restype = c_bool\n'
+        'MP4ReadSample.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId, POINTER(POINTER(uint8_t)), POINTER(uint32_t), POINTER(MP4Timestamp), POINTER(MP4Duration), POINTER(MP4Duration), POINTER(c_bool)]'
+        ),
+    'MP4ReadSampleFromTime': (None, (),
+        "MP4ReadSampleFromTime = _libraries['/usr/lib/libmp4v2.so'].MP4ReadSampleFromTime\n"
+        'MP4ReadSampleFromTime.restype = c_bool\n'
+        'MP4ReadSampleFromTime.argtypes = [MP4FileHandle, MP4TrackId, MP4Timestamp, POINTER(POINTER(uint8_t)), POINTER(uint32_t), POINTER(MP4Timestamp), POINTER(MP4Duration), POINTER(MP4Duration), POINTER(c_bool)]'
+        ),
+    'MP4WriteSample': (None, (),
+        "MP4WriteSample = _libraries['/usr/lib/libmp4v2.so'].MP4WriteSample\n"
+        'MP4WriteSample.restype = c_bool\n'
+        'MP4WriteSample.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint8_t), uint32_t, MP4Duration, MP4Duration, c_bool]'
+        ),
+    'MP4WriteSampleDependency': (None, (),
+        "MP4WriteSampleDependency = _libraries['/usr/lib/libmp4v2.so'].MP4WriteSampleDependency\n"
+        'MP4WriteSampleDependency.restype = c_bool\n'
+        'MP4WriteSampleDependency.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint8_t), uint32_t, MP4Duration, MP4Duration, c_bool, uint32_t]'
+        ),
+    'MP4CopySample': (None, (),
+        "MP4CopySample = _libraries['/usr/lib/libmp4v2.so'].MP4CopySample\n"
+        'MP4CopySample.restype = c_bool\n'
+        'MP4CopySample.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId, MP4FileHandle, MP4TrackId, MP4Duration]'
+        ),
+    'MP4EncAndCopySample': (None, (),
+        "MP4EncAndCopySample = _libraries['/usr/lib/libmp4v2.so'].MP4EncAndCopySample\n"
+        'MP4EncAndCopySample.restype = c_bool\n'
+        'MP4EncAndCopySample.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId, encryptFunc_t, uint32_t, MP4FileHandle, MP4TrackId, MP4Duration]'
+        ),
+    'MP4ReferenceSample': (None, (),
+        "MP4ReferenceSample = _libraries['/usr/lib/libmp4v2.so'].MP4ReferenceSample\n"
+        'MP4ReferenceSample.restype = c_bool\n'
+        'MP4ReferenceSample.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId, MP4FileHandle, MP4TrackId, MP4Duration]'
+        ),
+    'MP4GetSampleSize': (None, (),
+        "MP4GetSampleSize = _libraries['/usr/lib/libmp4v2.so'].MP4GetSampleSize\n"
+        'MP4GetSampleSize.restype = uint32_t\n'
+        'MP4GetSampleSize.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId]'
+        ),
+    'MP4GetTrackMaxSampleSize': (None, (),
+        "MP4GetTrackMaxSampleSize = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackMaxSampleSize\n"
+        'MP4GetTrackMaxSampleSize.restype = uint32_t\n'
+        'MP4GetTrackMaxSampleSize.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetSampleIdFromTime': (None, (),
+        "MP4GetSampleIdFromTime = _libraries['/usr/lib/libmp4v2.so'].MP4GetSampleIdFromTime\n"
+        'MP4GetSampleIdFromTime.restype = MP4SampleId\n'
+        'MP4GetSampleIdFromTime.argtypes = [MP4FileHandle, MP4TrackId, MP4Timestamp, c_bool]'
+        ),
+    'MP4GetSampleTime': (None, (),
+        "MP4GetSampleTime = _libraries['/usr/lib/libmp4v2.so'].MP4GetSampleTime\n"
+        'MP4GetSampleTime.restype = MP4Timestamp\n'
+        'MP4GetSampleTime.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId]'
+        ),
+    'MP4GetSampleDuration': (None, (),
+        "MP4GetSampleDuration = _libraries['/usr/lib/libmp4v2.so'].MP4GetSampleDuration\n"
+        'MP4GetSampleDuration.restype = MP4Duration\n'
+        'MP4GetSampleDuration.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId]'
+        ),
+    'MP4GetSampleRenderingOffset': (None, (),
+        "MP4GetSampleRenderingOffset = _libraries['/usr/lib/libmp4v2.so'].MP4GetSampleRenderingOffset\n"
+        'MP4GetSampleRenderingOffset.restype = MP4Duration\n'
+        'MP4GetSampleRenderingOffset.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId]'
+        ),
+    'MP4SetSampleRenderingOffset': (None, (),
+        "MP4SetSampleRenderingOffset = _libraries['/usr/lib/libmp4v2.so'].MP4SetSampleRenderingOffset\n"
+        'MP4SetSampleRenderingOffset.restype = c_bool\n'
+        'MP4SetSampleRenderingOffset.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId, MP4Duration]'
+        ),
+    'MP4GetSampleSync': (None, (),
+        "MP4GetSampleSync = _libraries['/usr/lib/libmp4v2.so'].MP4GetSampleSync\n"
+        'MP4GetSampleSync.restype = int8_t\n'
+        'MP4GetSampleSync.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId]'
+        ),
+    'MP4GetHintTrackRtpPayload': (None, (),
+        "MP4GetHintTrackRtpPayload = _libraries['/usr/lib/libmp4v2.so'].MP4GetHintTrackRtpPayload\n"
+        'MP4GetHintTrackRtpPayload.restype = c_bool\n'
+        'MP4GetHintTrackRtpPayload.argtypes = [MP4FileHandle, MP4TrackId, POINTER(STRING), POINTER(uint8_t), POINTER(uint16_t), POINTER(STRING)]'
+        ),
+    'MP4SetHintTrackRtpPayload': (None, (),
+        "MP4SetHintTrackRtpPayload = _libraries['/usr/lib/libmp4v2.so'].MP4SetHintTrackRtpPayload\n"
+        'MP4SetHintTrackRtpPayload.restype = c_bool\n'
+        'MP4SetHintTrackRtpPayload.argtypes = [MP4FileHandle, MP4TrackId, STRING, POINTER(uint8_t), uint16_t, STRING, c_bool, c_bool]'
+        ),
+    'MP4GetSessionSdp': (None, (),
+        "MP4GetSessionSdp = _libraries['/usr/lib/libmp4v2.so'].MP4GetSessionSdp\n"
+        'MP4GetSessionSdp.restype = STRING\n'
+        'MP4GetSessionSdp.argtypes = [MP4FileHandle]'
+        ),
+    'MP4SetSessionSdp': (None, (),
+        "MP4SetSessionSdp = _libraries['/usr/lib/libmp4v2.so'].MP4SetSessionSdp\n"
+        'MP4SetSessionSdp.restype = c_bool\n'
+        'MP4SetSessionSdp.argtypes = [MP4FileHandle, STRING]'
+        ),
+    'MP4AppendSessionSdp': (None, (),
+        "MP4AppendSessionSdp = _libraries['/usr/lib/libmp4v2.so'].MP4AppendSessionSdp\n"
+        'MP4AppendSessionSdp.restype = c_bool\n'
+        'MP4AppendSessionSdp.argtypes = [MP4FileHandle, STRING]'
+        ),
+    'MP4GetHintTrackSdp': (None, (),
+        "MP4GetHintTrackSdp = _libraries['/usr/lib/libmp4v2.so'].MP4GetHintTrackSdp\n"
+        'MP4GetHintTrackSdp.restype = STRING\n'
+        'MP4GetHintTrackSdp.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4SetHintTrackSdp': (None, (),
+        "MP4SetHintTrackSdp = _libraries['/usr/lib/libmp4v2.so'].MP4SetHintTrackSdp\n"
+        'MP4SetHintTrackSdp.restype = c_bool\n'
+        'MP4SetHintTrackSdp.argtypes = [MP4FileHandle, MP4TrackId, STRING]'
+        ),
+    'MP4AppendHintTrackSdp': (None, (),
+        "MP4AppendHintTrackSdp = _libraries['/usr/lib/libmp4v2.so'].MP4AppendHintTrackSdp\n"
+        'MP4AppendHintTrackSdp.restype = c_bool\n'
+        'MP4AppendHintTrackSdp.argtypes = [MP4FileHandle, MP4TrackId, STRING]'
+        ),
+    'MP4GetHintTrackReferenceTrackId': (None, (),
+        "MP4GetHintTrackReferenceTrackId = _libraries['/usr/lib/libmp4v2.so'].MP4GetHintTrackReferenceTrackId\n"
+        'MP4GetHintTrackReferenceTrackId.restype = MP4TrackId\n'
+        'MP4GetHintTrackReferenceTrackId.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4ReadRtpHint': (None, (),
+        "MP4ReadRtpHint = _libraries['/usr/lib/libmp4v2.so'].MP4ReadRtpHint\n"
+        'MP4ReadRtpHint.restype = c_bool\n'
+        'MP4ReadRtpHint.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId, POINTER(uint16_t)]'
+        ),
+    'MP4GetRtpHintNumberOfPackets': (None, (),
+        "MP4GetRtpHintNumberOfPackets = _libraries['/usr/lib/libmp4v2.so'].MP4GetRtpHintNumberOfPackets\n"
+        'MP4GetRtpHintNumberOfPackets.restype = uint16_t\n'
+        'MP4GetRtpHintNumberOfPackets.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetRtpPacketBFrame': (None, (),
+        "MP4GetRtpPacketBFrame = _libraries['/usr/lib/libmp4v2.so'].MP4GetRtpPacketBFrame\n"
+        'MP4GetRtpPacketBFrame.restype = int8_t\n'
+        'MP4GetRtpPacketBFrame.argtypes = [MP4FileHandle, MP4TrackId, uint16_t]'
+        ),
+    'MP4GetRtpPacketTransmitOffset': (None, (),
+        "MP4GetRtpPacketTransmitOffset = _libraries['/usr/lib/libmp4v2.so'].MP4GetRtpPacketTransmitOffset\n"
+        'MP4GetRtpPacketTransmitOffset.restype = int32_t\n'
+        'MP4GetRtpPacketTransmitOffset.argtypes = [MP4FileHandle, MP4TrackId, uint16_t]'
+        ),
+    'MP4ReadRtpPacket': (None, (),
+        "MP4ReadRtpPacket = _libraries['/usr/lib/libmp4v2.so'].MP4ReadRtpPacket\n"
+        'MP4ReadRtpPacket.restype = c_bool\n'
+        'MP4ReadRtpPacket.argtypes = [MP4FileHandle, MP4TrackId, uint16_t, POINTER(POINTER(uint8_t)), POINTER(uint32_t), uint32_t, c_bool, c_bool]'
+        ),
+    'MP4GetRtpTimestampStart': (None, (),
+        "MP4GetRtpTimestampStart = _libraries['/usr/lib/libmp4v2.so'].MP4GetRtpTimestampStart\n"
+        'MP4GetRtpTimestampStart.restype = MP4Timestamp\n'
+        'MP4GetRtpTimestampStart.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4SetRtpTimestampStart': (None, (),
+        "MP4SetRtpTimestampStart = _libraries['/usr/lib/libmp4v2.so'].MP4SetRtpTimestampStart\n"
+        'MP4SetRtpTimestampStart.restype = c_bool\n'
+        'MP4SetRtpTimestampStart.argtypes = [MP4FileHandle, MP4TrackId, MP4Timestamp]'
+        ),
+    'MP4AddRtpHint': (None, (),
+        "MP4AddRtpHint = _libraries['/usr/lib/libmp4v2.so'].MP4AddRtpHint\n"
+        'MP4AddRtpHint.restype = c_bool\n'
+        'MP4AddRtpHint.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4AddRtpVideoHint': (None, (),
+        "MP4AddRtpVideoHint = _libraries['/usr/lib/libmp4v2.so'].MP4AddRtpVideoHint\n"
+        'MP4AddRtpVideoHint.restype = c_bool\n'
+        'MP4AddRtpVideoHint.argtypes = [MP4FileHandle, MP4TrackId, c_bool, uint32_t]'
+        ),
+    'MP4AddRtpPacket': (None, (),
+        "MP4AddRtpPacket = _libraries['/usr/lib/libmp4v2.so'].MP4AddRtpPacket\n"
+        'MP4AddRtpPacket.restype = c_bool\n'
+        'MP4AddRtpPacket.argtypes = [MP4FileHandle, MP4TrackId, c_bool, int32_t]'
+        ),
+    'MP4AddRtpImmediateData': (None, (),
+        "MP4AddRtpImmediateData = _libraries['/usr/lib/libmp4v2.so'].MP4AddRtpImmediateData\n"
+        'MP4AddRtpImmediateData.restype = c_bool\n'
+        'MP4AddRtpImmediateData.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint8_t), uint32_t]'
+        ),
+    'MP4AddRtpSampleData': (None, (),
+        "MP4AddRtpSampleData = _libraries['/usr/lib/libmp4v2.so'].MP4AddRtpSampleData\n"
+        'MP4AddRtpSampleData.restype = c_bool\n'
+        'MP4AddRtpSampleData.argtypes = [MP4FileHandle, MP4TrackId, MP4SampleId, uint32_t, uint32_t]'
+        ),
+    'MP4AddRtpESConfigurationPacket': (None, (),
+        "MP4AddRtpESConfigurationPacket = _libraries['/usr/lib/libmp4v2.so'].MP4AddRtpESConfigurationPacket\n"
+        'MP4AddRtpESConfigurationPacket.restype = c_bool\n'
+        'MP4AddRtpESConfigurationPacket.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4WriteRtpHint': (None, (),
+        "MP4WriteRtpHint = _libraries['/usr/lib/libmp4v2.so'].MP4WriteRtpHint\n"
+        'MP4WriteRtpHint.restype = c_bool\n'
+        'MP4WriteRtpHint.argtypes = [MP4FileHandle, MP4TrackId, MP4Duration, c_bool]'
+        ),
+    'MP4AddTrack': (None, (),
+        "MP4AddTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddTrack\n"
+        'MP4AddTrack.restype = MP4TrackId\n'
+        'MP4AddTrack.argtypes = [MP4FileHandle, STRING, uint32_t]'
+        ),
+    'MP4AddSystemsTrack': (None, (),
+        "MP4AddSystemsTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddSystemsTrack\n"
+        'MP4AddSystemsTrack.restype = MP4TrackId\n'
+        'MP4AddSystemsTrack.argtypes = [MP4FileHandle, STRING]'
+        ),
+    'MP4AddODTrack': (None, (),
+        "MP4AddODTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddODTrack\n"
+        'MP4AddODTrack.restype = MP4TrackId\n'
+        'MP4AddODTrack.argtypes = [MP4FileHandle]'
+        ),
+    'MP4AddSceneTrack': (None, (),
+        "MP4AddSceneTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddSceneTrack\n"
+        'MP4AddSceneTrack.restype = MP4TrackId\n'
+        'MP4AddSceneTrack.argtypes = [MP4FileHandle]'
+        ),
+    'MP4AddAudioTrack': (None, (),
+        "MP4AddAudioTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddAudioTrack\n"
+        'MP4AddAudioTrack.restype = MP4TrackId\n'
+        'MP4AddAudioTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, uint8_t]'
+        ),
+    'MP4AddULawAudioTrack': (None, (),
+        "MP4AddULawAudioTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddULawAudioTrack\n"
+        'MP4AddULawAudioTrack.restype = MP4TrackId\n'
+        'MP4AddULawAudioTrack.argtypes = [MP4FileHandle, uint32_t]'
+        ),
+    'MP4AddALawAudioTrack': (None, (),
+        "MP4AddALawAudioTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddALawAudioTrack\n"
+        'MP4AddALawAudioTrack.restype = MP4TrackId\n'
+        'MP4AddALawAudioTrack.argtypes = [MP4FileHandle, uint32_t]'
+        ),
+    'MP4AddAC3AudioTrack': (None, (),
+        "MP4AddAC3AudioTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddAC3AudioTrack\n"
+        'MP4AddAC3AudioTrack.restype = MP4TrackId\n'
+        'MP4AddAC3AudioTrack.argtypes = [MP4FileHandle, uint32_t, uint8_t, uint8_t, uint8_t, uint8_t, uint8_t, uint8_t]'
+        ),
+    'MP4AddAmrAudioTrack': (None, (),
+        "MP4AddAmrAudioTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddAmrAudioTrack\n"
+        'MP4AddAmrAudioTrack.restype = MP4TrackId\n'
+        'MP4AddAmrAudioTrack.argtypes = [MP4FileHandle, uint32_t, uint16_t, uint8_t, uint8_t, c_bool]'
+        ),
+    'MP4SetAmrVendor': (None, (),
+        "MP4SetAmrVendor = _libraries['/usr/lib/libmp4v2.so'].MP4SetAmrVendor\n"
+        'MP4SetAmrVendor.restype = None\n'
+        'MP4SetAmrVendor.argtypes = [MP4FileHandle, MP4TrackId, uint32_t]'
+        ),
+    'MP4SetAmrDecoderVersion': (None, (),
+        "MP4SetAmrDecoderVersion = _libraries['/usr/lib/libmp4v2.so'].MP4SetAmrDecoderVersion\n"
+        'MP4SetAmrDecoderVersion.restype = None\n'
+        'MP4SetAmrDecoderVersion.argtypes = [MP4FileHandle, MP4TrackId, uint8_t]'
+        ),
+    'MP4SetAmrModeSet': (None, (),
+        "MP4SetAmrModeSet = _libraries['/usr/lib/libmp4v2.so'].MP4SetAmrModeSet\n"
+        'MP4SetAmrModeSet.restype = None\n'
+        'MP4SetAmrModeSet.argtypes = [MP4FileHandle, MP4TrackId, uint16_t]'
+        ),
+    'MP4GetAmrModeSet': (None, (),
+        "MP4GetAmrModeSet = _libraries['/usr/lib/libmp4v2.so'].MP4GetAmrModeSet\n"
+        'MP4GetAmrModeSet.restype = uint16_t\n'
+        'MP4GetAmrModeSet.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4AddHrefTrack': (None, (),
+        "MP4AddHrefTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddHrefTrack\n"
+        'MP4AddHrefTrack.restype = MP4TrackId\n'
+        'MP4AddHrefTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, STRING]'
+        ),
+    'MP4GetHrefTrackBaseUrl': (None, (),
+        "MP4GetHrefTrackBaseUrl = _libraries['/usr/lib/libmp4v2.so'].MP4GetHrefTrackBaseUrl\n"
+        'MP4GetHrefTrackBaseUrl.restype = STRING\n'
+        'MP4GetHrefTrackBaseUrl.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4AddVideoTrack': (None, (),
+        "MP4AddVideoTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddVideoTrack\n"
+        'MP4AddVideoTrack.restype = MP4TrackId\n'
+        'MP4AddVideoTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, uint16_t, uint16_t, uint8_t]'
+        ),
+    'MP4AddH264VideoTrack': (None, (),
+        "MP4AddH264VideoTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddH264VideoTrack\n"
+        'MP4AddH264VideoTrack.restype = MP4TrackId\n'
+        'MP4AddH264VideoTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, uint16_t, uint16_t, uint8_t, uint8_t, uint8_t, uint8_t]'
+        ),
+    'MP4AddH264SequenceParameterSet': (None, (),
+        "MP4AddH264SequenceParameterSet = _libraries['/usr/lib/libmp4v2.so'].MP4AddH264SequenceParameterSet\n"
+        'MP4AddH264SequenceParameterSet.restype = None\n'
+        'MP4AddH264SequenceParameterSet.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint8_t), uint16_t]'
+        ),
+    'MP4AddH264PictureParameterSet': (None, (),
+        "MP4AddH264PictureParameterSet = _libraries['/usr/lib/libmp4v2.so'].MP4AddH264PictureParameterSet\n"
+        'MP4AddH264PictureParameterSet.restype = None\n'
+        'MP4AddH264PictureParameterSet.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint8_t), uint16_t]'
+        ),
+    'MP4SetH263Vendor': (None, (),
+        "MP4SetH263Vendor = _libraries['/usr/lib/libmp4v2.so'].MP4SetH263Vendor\n"
+        'MP4SetH263Vendor.restype = None\n'
+        'MP4SetH263Vendor.argtypes = [MP4FileHandle, MP4TrackId, uint32_t]'
+        ),
+    'MP4SetH263DecoderVersion': (None, (),
+        "MP4SetH263DecoderVersion = _libraries['/usr/lib/libmp4v2.so'].MP4SetH263DecoderVersion\n"
+        'MP4SetH263DecoderVersion.restype = None\n'
+        'MP4SetH263DecoderVersion.argtypes = [MP4FileHandle, MP4TrackId, uint8_t]'
+        ),
+    'MP4SetH263Bitrates': (None, (),
+        "MP4SetH263Bitrates = _libraries['/usr/lib/libmp4v2.so'].MP4SetH263Bitrates\n"
+        'MP4SetH263Bitrates.restype = None\n'
+        'MP4SetH263Bitrates.argtypes = [MP4FileHandle, MP4TrackId, uint32_t, uint32_t]'
+        ),
+    'MP4AddH263VideoTrack': (None, (),
+        "MP4AddH263VideoTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddH263VideoTrack\n"
+        'MP4AddH263VideoTrack.restype = MP4TrackId\n'
+        'MP4AddH263VideoTrack.argtypes = [MP4FileHandle, uint32_t, MP4Duration, uint16_t, uint16_t, uint8_t, uint8_t, uint32_t, uint32_t]'
+        ),
+    'MP4AddHintTrack': (None, (),
+        "MP4AddHintTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddHintTrack\n"
+        'MP4AddHintTrack.restype = MP4TrackId\n'
+        'MP4AddHintTrack.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4AddTextTrack': (None, (),
+        "MP4AddTextTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddTextTrack\n"
+        'MP4AddTextTrack.restype = MP4TrackId\n'
+        'MP4AddTextTrack.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4AddSubtitleTrack': (None, (),
+        "MP4AddSubtitleTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddSubtitleTrack\n"
+        'MP4AddSubtitleTrack.restype = MP4TrackId\n'
+        'MP4AddSubtitleTrack.argtypes = [MP4FileHandle, uint32_t, uint16_t, uint16_t]'
+        ),
+    'MP4AddSubpicTrack': (None, (),
+        "MP4AddSubpicTrack = _libraries['/usr/lib/libmp4v2.so'].MP4AddSubpicTrack\n"
+        'MP4AddSubpicTrack.restype = MP4TrackId\n'
+        'MP4AddSubpicTrack.argtypes = [MP4FileHandle, uint32_t, uint16_t, uint16_t]'
+        ),
+    'MP4AddPixelAspectRatio': (None, (),
+        "MP4AddPixelAspectRatio = _libraries['/usr/lib/libmp4v2.so'].MP4AddPixelAspectRatio\n"
+        'MP4AddPixelAspectRatio.restype = MP4TrackId\n'
+        'MP4AddPixelAspectRatio.argtypes = [MP4FileHandle, MP4TrackId, uint32_t, uint32_t]'
+        ),
+    'MP4AddColr': (None, (),
+        "MP4AddColr = _libraries['/usr/lib/libmp4v2.so'].MP4AddColr\n"
+        'MP4AddColr.restype = MP4TrackId\n'
+        'MP4AddColr.argtypes = [MP4FileHandle, MP4TrackId, uint16_t, uint16_t, uint16_t]'
+        ),
+    'MP4CloneTrack': (None, (),
+        "MP4CloneTrack = _libraries['/usr/lib/libmp4v2.so'].MP4CloneTrack\n"
+        'MP4CloneTrack.restype = MP4TrackId\n'
+        'MP4CloneTrack.argtypes = [MP4FileHandle, MP4TrackId, MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4CopyTrack': (None, (),
+        "MP4CopyTrack = _libraries['/usr/lib/libmp4v2.so'].MP4CopyTrack\n"
+        'MP4CopyTrack.restype = MP4TrackId\n'
+        'MP4CopyTrack.argtypes = [MP4FileHandle, MP4TrackId, MP4FileHandle, c_bool, MP4TrackId]'
+        ),
+    'MP4DeleteTrack': (None, (),
+        "MP4DeleteTrack = _libraries['/usr/lib/libmp4v2.so'].MP4DeleteTrack\n"
+        'MP4DeleteTrack.restype = c_bool\n'
+        'MP4DeleteTrack.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetNumberOfTracks': (None, (),
+        "MP4GetNumberOfTracks = _libraries['/usr/lib/libmp4v2.so'].MP4GetNumberOfTracks\n"
+        'MP4GetNumberOfTracks.restype = uint32_t\n'
+        'MP4GetNumberOfTracks.argtypes = [MP4FileHandle, STRING, uint8_t]'
+        ),
+    'MP4FindTrackId': (None, (),
+        "MP4FindTrackId = _libraries['/usr/lib/libmp4v2.so'].MP4FindTrackId\n"
+        'MP4FindTrackId.restype = MP4TrackId\n'
+        'MP4FindTrackId.argtypes = [MP4FileHandle, uint16_t, STRING, uint8_t]'
+        ),
+    'MP4FindTrackIndex': (None, (),
+        "MP4FindTrackIndex = _libraries['/usr/lib/libmp4v2.so'].MP4FindTrackIndex\n"
+        'MP4FindTrackIndex.restype = uint16_t\n'
+        'MP4FindTrackIndex.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetTrackDurationPerChunk': (None, (),
+        "MP4GetTrackDurationPerChunk = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackDurationPerChunk\n"
+        'MP4GetTrackDurationPerChunk.restype = c_bool\n'
+        'MP4GetTrackDurationPerChunk.argtypes = [MP4FileHandle, MP4TrackId, POINTER(MP4Duration)]'
+        ),
+    'MP4SetTrackDurationPerChunk': (None, (),
+        "MP4SetTrackDurationPerChunk = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackDurationPerChunk\n"
+        'MP4SetTrackDurationPerChunk.restype = c_bool\n'
+        'MP4SetTrackDurationPerChunk.argtypes = [MP4FileHandle, MP4TrackId, MP4Duration]'
+        ),
+    'MP4AddIPodUUID': (None, (),
+        "MP4AddIPodUUID = _libraries['/usr/lib/libmp4v2.so'].MP4AddIPodUUID\n"
+        'MP4AddIPodUUID.restype = c_bool\n'
+        'MP4AddIPodUUID.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetTrackType': (None, (),
+        "MP4GetTrackType = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackType\n"
+        'MP4GetTrackType.restype = STRING\n'
+        'MP4GetTrackType.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetTrackMediaDataName': (None, (),
+        "MP4GetTrackMediaDataName = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackMediaDataName\n"
+        'MP4GetTrackMediaDataName.restype = STRING\n'
+        'MP4GetTrackMediaDataName.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetTrackMediaDataOriginalFormat': (None, (),
+        "MP4GetTrackMediaDataOriginalFormat = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackMediaDataOriginalFormat\n"
+        'MP4GetTrackMediaDataOriginalFormat.restype = c_bool\n'
+        'MP4GetTrackMediaDataOriginalFormat.argtypes = [MP4FileHandle, MP4TrackId, STRING, uint32_t]'
+        ),
+    'MP4GetTrackDuration': (None, (),
+        "MP4GetTrackDuration = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackDuration\n"
+        'MP4GetTrackDuration.restype = MP4Duration\n'
+        'MP4GetTrackDuration.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetTrackTimeScale': (None, (),
+        "MP4GetTrackTimeScale = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackTimeScale\n"
+        'MP4GetTrackTimeScale.restype = uint32_t\n'
+        'MP4GetTrackTimeScale.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4SetTrackTimeScale': (None, (),
+        "MP4SetTrackTimeScale = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackTimeScale\n"
+        'MP4SetTrackTimeScale.restype = c_bool\n'
+        'MP4SetTrackTimeScale.argtypes = [MP4FileHandle, MP4TrackId, uint32_t]'
+        ),
+    'MP4GetTrackLanguage': (None, (),
+        "MP4GetTrackLanguage = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackLanguage\n"
+        'MP4GetTrackLanguage.restype = c_bool\n'
+        'MP4GetTrackLanguage.argtypes = [MP4FileHandle, MP4TrackId, STRING]'
+        ),
+    'MP4SetTrackLanguage': (None, (),
+        "MP4SetTrackLanguage = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackLanguage\n"
+        'MP4SetTrackLanguage.restype = c_bool\n'
+        'MP4SetTrackLanguage.argtypes = [MP4FileHandle, MP4TrackId, STRING]'
+        ),
+    'MP4GetTrackName': (None, (),
+        "MP4GetTrackName = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackName\n"
+        'MP4GetTrackName.restype = c_bool\n'
+        'MP4GetTrackName.argtypes = [MP4FileHandle, MP4TrackId, POINTER(STRING)]'
+        ),
+    'MP4SetTrackName': (None, (),
+        "MP4SetTrackName = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackName\n"
+        'MP4SetTrackName.restype = c_bool\n'
+        'MP4SetTrackName.argtypes = [MP4FileHandle, MP4TrackId, STRING]'
+        ),
+    'MP4GetTrackAudioMpeg4Type': (None, (),
+        "MP4GetTrackAudioMpeg4Type = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackAudioMpeg4Type\n"
+        'MP4GetTrackAudioMpeg4Type.restype = uint8_t\n'
+        'MP4GetTrackAudioMpeg4Type.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetTrackEsdsObjectTypeId': (None, (),
+        "MP4GetTrackEsdsObjectTypeId = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackEsdsObjectTypeId\n"
+        'MP4GetTrackEsdsObjectTypeId.restype = uint8_t\n'
+        'MP4GetTrackEsdsObjectTypeId.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetTrackFixedSampleDuration': (None, (),
+        "MP4GetTrackFixedSampleDuration = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackFixedSampleDuration\n"
+        'MP4GetTrackFixedSampleDuration.restype = MP4Duration\n'
+        'MP4GetTrackFixedSampleDuration.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetTrackBitRate': (None, (),
+        "MP4GetTrackBitRate = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackBitRate\n"
+        'MP4GetTrackBitRate.restype = uint32_t\n'
+        'MP4GetTrackBitRate.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetTrackVideoMetadata': (None, (),
+        "MP4GetTrackVideoMetadata = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackVideoMetadata\n"
+        'MP4GetTrackVideoMetadata.restype = c_bool\n'
+        'MP4GetTrackVideoMetadata.argtypes = [MP4FileHandle, MP4TrackId, POINTER(POINTER(uint8_t)), POINTER(uint32_t)]'
+        ),
+    'MP4GetTrackESConfiguration': (None, (),
+        "MP4GetTrackESConfiguration = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackESConfiguration\n"
+        'MP4GetTrackESConfiguration.restype = c_bool\n'
+        'MP4GetTrackESConfiguration.argtypes = [MP4FileHandle, MP4TrackId, POINTER(POINTER(uint8_t)), POINTER(uint32_t)]'
+        ),
+    'MP4SetTrackESConfiguration': (None, (),
+        "MP4SetTrackESConfiguration = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackESConfiguration\n"
+        'MP4SetTrackESConfiguration.restype = c_bool\n'
+        'MP4SetTrackESConfiguration.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint8_t), uint32_t]'
+        ),
+    'MP4GetTrackH264ProfileLevel': (None, (),
+        "MP4GetTrackH264ProfileLevel = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackH264ProfileLevel\n"
+        'MP4GetTrackH264ProfileLevel.restype = c_bool\n'
+        'MP4GetTrackH264ProfileLevel.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint8_t), POINTER(uint8_t)]'
+        ),
+    'MP4GetTrackH264SeqPictHeaders': (None, (),
+        "MP4GetTrackH264SeqPictHeaders = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackH264SeqPictHeaders\n"
+        'MP4GetTrackH264SeqPictHeaders.restype = c_bool\n'
+        'MP4GetTrackH264SeqPictHeaders.argtypes = [MP4FileHandle, MP4TrackId, POINTER(POINTER(POINTER(uint8_t))), POINTER(POINTER(uint32_t)), POINTER(POINTER(POINTER(uint8_t))), POINTER(POINTER(uint32_t))]'
+        ),
+    'MP4GetTrackH264LengthSize': (None, (),
+        "MP4GetTrackH264LengthSize = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackH264LengthSize\n"
+        'MP4GetTrackH264LengthSize.restype = c_bool\n'
+        'MP4GetTrackH264LengthSize.argtypes = [MP4FileHandle, MP4TrackId, POINTER(uint32_t)]'
+        ),
+    'MP4GetTrackNumberOfSamples': (None, (),
+        "MP4GetTrackNumberOfSamples = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackNumberOfSamples\n"
+        'MP4GetTrackNumberOfSamples.restype = MP4SampleId\n'
+        'MP4GetTrackNumberOfSamples.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetTrackVideoWidth': (None, (),
+        "MP4GetTrackVideoWidth = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackVideoWidth\n"
+        'MP4GetTrackVideoWidth.restype = uint16_t\n'
+        'MP4GetTrackVideoWidth.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetTrackVideoHeight': (None, (),
+        "MP4GetTrackVideoHeight = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackVideoHeight\n"
+        'MP4GetTrackVideoHeight.restype = uint16_t\n'
+        'MP4GetTrackVideoHeight.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetTrackVideoFrameRate': (None, (),
+        "MP4GetTrackVideoFrameRate = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackVideoFrameRate\n"
+        'MP4GetTrackVideoFrameRate.restype = c_double\n'
+        'MP4GetTrackVideoFrameRate.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4GetTrackAudioChannels': (None, (),
+        "MP4GetTrackAudioChannels = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackAudioChannels\n"
+        'MP4GetTrackAudioChannels.restype = c_int\n'
+        'MP4GetTrackAudioChannels.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4IsIsmaCrypMediaTrack': (None, (),
+        "MP4IsIsmaCrypMediaTrack = _libraries['/usr/lib/libmp4v2.so'].MP4IsIsmaCrypMediaTrack\n"
+        'MP4IsIsmaCrypMediaTrack.restype = c_bool\n'
+        'MP4IsIsmaCrypMediaTrack.argtypes = [MP4FileHandle, MP4TrackId]'
+        ),
+    'MP4HaveTrackAtom': (None, (),
+        "MP4HaveTrackAtom = _libraries['/usr/lib/libmp4v2.so'].MP4HaveTrackAtom\n"
+        'MP4HaveTrackAtom.restype = c_bool\n'
+        'MP4HaveTrackAtom.argtypes = [MP4FileHandle, MP4TrackId, STRING]'
+        ),
+    'MP4GetTrackIntegerProperty': (None, (),
+        "MP4GetTrackIntegerProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackIntegerProperty\n"
+        'MP4GetTrackIntegerProperty.restype = c_bool\n'
+        'MP4GetTrackIntegerProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, POINTER(uint64_t)]'
+        ),
+    'MP4GetTrackFloatProperty': (None, (),
+        "MP4GetTrackFloatProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackFloatProperty\n"
+        'MP4GetTrackFloatProperty.restype = c_bool\n'
+        'MP4GetTrackFloatProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, POINTER(c_float)]'
+        ),
+    'MP4GetTrackStringProperty': (None, (),
+        "MP4GetTrackStringProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackStringProperty\n"
+        'MP4GetTrackStringProperty.restype = c_bool\n'
+        'MP4GetTrackStringProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, POINTER(STRING)]'
+        ),
+    'MP4GetTrackBytesProperty': (None, (),
+        "MP4GetTrackBytesProperty = _libraries['/usr/lib/libmp4v2.so'].MP4GetTrackBytesProperty\n"
+        'MP4GetTrackBytesProperty.restype = c_bool\n'
+        'MP4GetTrackBytesProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, POINTER(POINTER(uint8_t)), POINTER(uint32_t)]'
+        ),
+    'MP4SetTrackIntegerProperty': (None, (),
+        "MP4SetTrackIntegerProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackIntegerProperty\n"
+        'MP4SetTrackIntegerProperty.restype = c_bool\n'
+        'MP4SetTrackIntegerProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, int64_t]'
+        ),
+    'MP4SetTrackFloatProperty': (None, (),
+        "MP4SetTrackFloatProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackFloatProperty\n"
+        'MP4SetTrackFloatProperty.restype = c_bool\n'
+        'MP4SetTrackFloatProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, c_float]'
+        ),
+    'MP4SetTrackStringProperty': (None, (),
+        "MP4SetTrackStringProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackStringProperty\n"
+        'MP4SetTrackStringProperty.restype = c_bool\n'
+        'MP4SetTrackStringProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, STRING]'
+        ),
+    'MP4SetTrackBytesProperty': (None, (),
+        "MP4SetTrackBytesProperty = _libraries['/usr/lib/libmp4v2.so'].MP4SetTrackBytesProperty\n"
+        'MP4SetTrackBytesProperty.restype = c_bool\n'
+        'MP4SetTrackBytesProperty.argtypes = [MP4FileHandle, MP4TrackId, STRING, POINTER(uint8_t), uint32_t]'
+        ),
+    '__FILE': (None, ('_IO_FILE',),
+        '__FILE = _IO_FILE'
+        ),
+    'fpos_t': (None, ('_G_fpos_t',),
+        'fpos_t = _G_fpos_t'
+        ),
+    'fpos64_t': (None, ('_G_fpos64_t',),
+        'fpos64_t = _G_fpos64_t'
+        ),
+    'remove': (None, (),
+        "remove = _libraries['/usr/lib/libmp4v2.so'].remove\n"
+        'remove.restype = c_int\n'
+        'remove.argtypes = [STRING]'
+        ),
+    'rename': (None, (),
+        "rename = _libraries['/usr/lib/libmp4v2.so'].rename\n"
+        'rename.restype = c_int\n'
+        'rename.argtypes = [STRING, STRING]'
+        ),
+    'renameat': (None, (),
+        "renameat = _libraries['/usr/lib/libmp4v2.so'].renameat\n"
+        'renameat.restype = c_int\n'
+        'renameat.argtypes = [c_int, STRING, c_int, STRING]'
+        ),
+    'tmpfile': (None, ('FILE',),
+        "tmpfile = _libraries['/usr/lib/libmp4v2.so'].tmpfile\n"
+        'tmpfile.restype = POINTER(FILE)\n'
+        'tmpfile.argtypes = []'
+        ),
+    'tmpfile64': (None, ('FILE',),
+        "tmpfile64 = _libraries['/usr/lib/libmp4v2.so'].tmpfile64\n"
+        'tmpfile64.restype = POINTER(FILE)\n'
+        'tmpfile64.argtypes = []'
+        ),
+    'tmpnam': (None, (),
+        "tmpnam = _libraries['/usr/lib/libmp4v2.so'].tmpnam\n"
+        'tmpnam.restype = STRING\n'
+        'tmpnam.argtypes = [STRING]'
+        ),
+    'tmpnam_r': (None, (),
+        "tmpnam_r = _libraries['/usr/lib/libmp4v2.so'].tmpnam_r\n"
+        'tmpnam_r.restype = STRING\n'
+        'tmpnam_r.argtypes = [STRING]'
+        ),
+    'tempnam': (None, (),
+        "tempnam = _libraries['/usr/lib/libmp4v2.so'].tempnam\n"
+        'tempnam.restype = STRING\n'
+        'tempnam.argtypes = [STRING, STRING]'
+        ),
+    'fclose': (None, ('FILE',),
+        "fclose = _libraries['/usr/lib/libmp4v2.so'].fclose\n"
+        'fclose.restype = c_int\n'
+        'fclose.argtypes = [POINTER(FILE)]'
+        ),
+    'fflush': (None, ('FILE',),
+        "fflush = _libraries['/usr/lib/libmp4v2.so'].fflush\n"
+        'fflush.restype = c_int\n'
+        'fflush.argtypes = [POINTER(FILE)]'
+        ),
+    'fflush_unlocked': (None, ('FILE',),
+        "fflush_unlocked = _libraries['/usr/lib/libmp4v2.so'].fflush_unlocked\n"
+        'fflush_unlocked.restype = c_int\n'
+        'fflush_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'fcloseall': (None, (),
+        "fcloseall = _libraries['/usr/lib/libmp4v2.so'].fcloseall\n"
+        'fcloseall.restype = c_int\n'
+        'fcloseall.argtypes = []'
+        ),
+    'fopen': (None, ('FILE',),
+        "fopen = _libraries['/usr/lib/libmp4v2.so'].fopen\n"
+        'fopen.restype = POINTER(FILE)\n'
+        'fopen.argtypes = [STRING, STRING]'
+        ),
+    'freopen': (None, ('FILE',),
+        "freopen = _libraries['/usr/lib/libmp4v2.so'].freopen\n"
+        'freopen.restype = POINTER(FILE)\n'
+        'freopen.argtypes = [STRING, STRING, POINTER(FILE)]'
+        ),
+    'fopen64': (None, ('FILE',),
+        "fopen64 = _libraries['/usr/lib/libmp4v2.so'].fopen64\n"
+        'fopen64.restype = POINTER(FILE)\n'
+        'fopen64.argtypes = [STRING, STRING]'
+        ),
+    'freopen64': (None, ('FILE',),
+        "freopen64 = _libraries['/usr/lib/libmp4v2.so'].freopen64\n"
+        'freopen64.restype = POINTER(FILE)\n'
+        'freopen64.argtypes = [STRING, STRING, POINTER(FILE)]'
+        ),
+    'fdopen': (None, ('FILE',),
+        "fdopen = _libraries['/usr/lib/libmp4v2.so'].fdopen\n"
+        'fdopen.restype = POINTER(FILE)\n'
+        'fdopen.argtypes = [c_int, STRING]'
+        ),
+    'fopencookie': (None, ('FILE', '_IO_cookie_io_functions_t'),
+        "fopencookie = _libraries['/usr/lib/libmp4v2.so'].fopencookie\n"
+        'fopencookie.restype = POINTER(FILE)\n'
+        'fopencookie.argtypes = [c_void_p, STRING, _IO_cookie_io_functions_t]'
+        ),
+    'fmemopen': (None, ('FILE',),
+        "fmemopen = _libraries['/usr/lib/libmp4v2.so'].fmemopen\n"
+        'fmemopen.restype = POINTER(FILE)\n'
+        'fmemopen.argtypes = [c_void_p, size_t, STRING]'
+        ),
+    'open_memstream': (None, ('FILE',),
+        "open_memstream = _libraries['/usr/lib/libmp4v2.so'].open_memstream\n"
+        'open_memstream.restype = POINTER(FILE)\n'
+        'open_memstream.argtypes = [POINTER(STRING), POINTER(size_t)]'
+        ),
+    'setbuf': (None, ('FILE',),
+        "setbuf = _libraries['/usr/lib/libmp4v2.so'].setbuf\n"
+        'setbuf.restype = None\n'
+        'setbuf.argtypes = [POINTER(FILE), STRING]'
+        ),
+    'setvbuf': (None, ('FILE',),
+        "setvbuf = _libraries['/usr/lib/libmp4v2.so'].setvbuf\n"
+        'setvbuf.restype = c_int\n'
+        'setvbuf.argtypes = [POINTER(FILE), STRING, c_int, size_t]'
+        ),
+    'setbuffer': (None, ('FILE',),
+        "setbuffer = _libraries['/usr/lib/libmp4v2.so'].setbuffer\n"
+        'setbuffer.restype = None\n'
+        'setbuffer.argtypes = [POINTER(FILE), STRING, size_t]'
+        ),
+    'setlinebuf': (None, ('FILE',),
+        "setlinebuf = _libraries['/usr/lib/libmp4v2.so'].setlinebuf\n"
+        'setlinebuf.restype = None\n'
+        'setlinebuf.argtypes = [POINTER(FILE)]'
+        ),
+    'fprintf': (None, ('FILE',),
+        "fprintf = _libraries['/usr/lib/libmp4v2.so'].fprintf\n"
+        'fprintf.restype = c_int\n'
+        'fprintf.argtypes = [POINTER(FILE), STRING]'
+        ),
+    'printf': (None, (),
+        "printf = _libraries['/usr/lib/libmp4v2.so'].printf\n"
+        'printf.restype = c_int\n'
+        'printf.argtypes = [STRING]'
+        ),
+    'sprintf': (None, (),
+        "sprintf = _libraries['/usr/lib/libmp4v2.so'].sprintf\n"
+        'sprintf.restype = c_int\n'
+        'sprintf.argtypes = [STRING, STRING]'
+        ),
+    'vfprintf': (None, ('FILE',),
+        "vfprintf = _libraries['/usr/lib/libmp4v2.so'].vfprintf\n"
+        'vfprintf.restype = c_int\n'
+        'vfprintf.argtypes = [POINTER(FILE), STRING, __gnuc_va_list]'
+        ),
+    'vsprintf': (None, (),
+        "vsprintf = _libraries['/usr/lib/libmp4v2.so'].vsprintf\n"
+        'vsprintf.restype = c_int\n'
+        'vsprintf.argtypes = [STRING, STRING, __gnuc_va_list]'
+        ),
+    'snprintf': (None, (),
+        "snprintf = _libraries['/usr/lib/libmp4v2.so'].snprintf\n"
+        'snprintf.restype = c_int\n'
+        'snprintf.argtypes = [STRING, size_t, STRING]'
+        ),
+    'vsnprintf': (None, (),
+        "vsnprintf = _libraries['/usr/lib/libmp4v2.so'].vsnprintf\n"
+        'vsnprintf.restype = c_int\n'
+        'vsnprintf.argtypes = [STRING, size_t, STRING, __gnuc_va_list]'
+        ),
+    'vasprintf': (None, (),
+        "vasprintf = _libraries['/usr/lib/libmp4v2.so'].vasprintf\n"
+        'vasprintf.restype = c_int\n'
+        'vasprintf.argtypes = [POINTER(STRING), STRING, __gnuc_va_list]'
+        ),
+    '__asprintf': (None, (),
+        "__asprintf = _libraries['/usr/lib/libmp4v2.so'].__asprintf\n"
+        '__asprintf.restype = c_int\n'
+        '__asprintf.argtypes = [POINTER(STRING), STRING]'
+        ),
+    'asprintf': (None, (),
+        "asprintf = _libraries['/usr/lib/libmp4v2.so'].asprintf\n"
+        'asprintf.restype = c_int\n'
+        'asprintf.argtypes = [POINTER(STRING), STRING]'
+        ),
+    'vdprintf': (None, (),
+        "vdprintf = _libraries['/usr/lib/libmp4v2.so'].vdprintf\n"
+        'vdprintf.restype = c_int\n'
+        'vdprintf.argtypes = [c_int, STRING, __gnuc_va_list]'
+        ),
+    'dprintf': (None, (),
+        "dprintf = _libraries['/usr/lib/libmp4v2.so'].dprintf\n"
+        'dprintf.restype = c_int\n'
+        'dprintf.argtypes = [c_int, STRING]'
+        ),
+    'fscanf': (None, ('FILE',),
+        "fscanf = _libraries['/usr/lib/libmp4v2.so'].fscanf\n"
+        'fscanf.restype = c_int\n'
+        'fscanf.argtypes = [POINTER(FILE), STRING]'
+        ),
+    'scanf': (None, (),
+        "scanf = _libraries['/usr/lib/libmp4v2.so'].scanf\n"
+        'scanf.restype = c_int\n'
+        'scanf.argtypes = [STRING]'
+        ),
+    'sscanf': (None, (),
+        "sscanf = _libraries['/usr/lib/libmp4v2.so'].sscanf\n"
+        'sscanf.restype = c_int\n'
+        'sscanf.argtypes = [STRING, STRING]'
+        ),
+    'vfscanf': (None, ('FILE',),
+        "vfscanf = _libraries['/usr/lib/libmp4v2.so'].vfscanf\n"
+        'vfscanf.restype = c_int\n'
+        'vfscanf.argtypes = [POINTER(FILE), STRING, __gnuc_va_list]'
+        ),
+    'vscanf': (None, (),
+        "vscanf = _libraries['/usr/lib/libmp4v2.so'].vscanf\n"
+        'vscanf.restype = c_int\n'
+        'vscanf.argtypes = [STRING, __gnuc_va_list]'
+        ),
+    'vsscanf': (None, (),
+        "vsscanf = _libraries['/usr/lib/libmp4v2.so'].vsscanf\n"
+        'vsscanf.restype = c_int\n'
+        'vsscanf.argtypes = [STRING, STRING, __gnuc_va_list]'
+        ),
+    'fgetc': (None, ('FILE',),
+        "fgetc = _libraries['/usr/lib/libmp4v2.so'].fgetc\n"
+        'fgetc.restype = c_int\n'
+        'fgetc.argtypes = [POINTER(FILE)]'
+        ),
+    'fputc': (None, ('FILE',),
+        "fputc = _libraries['/usr/lib/libmp4v2.so'].fputc\n"
+        'fputc.restype = c_int\n'
+        'fputc.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'getw': (None, ('FILE',),
+        "getw = _libraries['/usr/lib/libmp4v2.so'].getw\n"
+        'getw.restype = c_int\n'
+        'getw.argtypes = [POINTER(FILE)]'
+        ),
+    'putw': (None, ('FILE',),
+        "putw = _libraries['/usr/lib/libmp4v2.so'].putw\n"
+        'putw.restype = c_int\n'
+        'putw.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'fgets': (None, ('FILE',),
+        "fgets = _libraries['/usr/lib/libmp4v2.so'].fgets\n"
+        'fgets.restype = STRING\n'
+        'fgets.argtypes = [STRING, c_int, POINTER(FILE)]'
+        ),
+    'gets': (None, (),
+        "gets = _libraries['/usr/lib/libmp4v2.so'].gets\n"
+        'gets.restype = STRING\n'
+        'gets.argtypes = [STRING]'
+        ),
+    'fgets_unlocked': (None, ('FILE',),
+        "fgets_unlocked = _libraries['/usr/lib/libmp4v2.so'].fgets_unlocked\n"
+        'fgets_unlocked.restype = STRING\n'
+        'fgets_unlocked.argtypes = [STRING, c_int, POINTER(FILE)]'
+        ),
+    '__getdelim': (None, ('FILE',),
+        "__getdelim = _libraries['/usr/lib/libmp4v2.so'].__getdelim\n"
+        '__getdelim.restype = __ssize_t\n'
+        '__getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]'
+        ),
+    'getdelim': (None, ('FILE',),
+        "getdelim = _libraries['/usr/lib/libmp4v2.so'].getdelim\n"
+        'getdelim.restype = __ssize_t\n'
+        'getdelim.argtypes = [POINTER(STRING), POINTER(size_t), c_int, POINTER(FILE)]'
+        ),
+    'fputs': (None, ('FILE',),
+        "fputs = _libraries['/usr/lib/libmp4v2.so'].fputs\n"
+        'fputs.restype = c_int\n'
+        'fputs.argtypes = [STRING, POINTER(FILE)]'
+        ),
+    'puts': (None, (),
+        "puts = _libraries['/usr/lib/libmp4v2.so'].puts\n"
+        'puts.restype = c_int\n'
+        'puts.argtypes = [STRING]'
+        ),
+    'ungetc': (None, ('FILE',),
+        "ungetc = _libraries['/usr/lib/libmp4v2.so'].ungetc\n"
+        'ungetc.restype = c_int\n'
+        'ungetc.argtypes = [c_int, POINTER(FILE)]'
+        ),
+    'fread': (None, ('FILE',),
+        "fread = _libraries['/usr/lib/libmp4v2.so'].fread\n"
+        'fread.restype = size_t\n'
+        'fread.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fwrite': (None, ('FILE',),
+        "fwrite = _libraries['/usr/lib/libmp4v2.so'].fwrite\n"
+        'fwrite.restype = size_t\n'
+        'fwrite.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fputs_unlocked': (None, ('FILE',),
+        "fputs_unlocked = _libraries['/usr/lib/libmp4v2.so'].fputs_unlocked\n"
+        'fputs_unlocked.restype = c_int\n'
+        'fputs_unlocked.argtypes = [STRING, POINTER(FILE)]'
+        ),
+    'fread_unlocked': (None, ('FILE',),
+        "fread_unlocked = _libraries['/usr/lib/libmp4v2.so'].fread_unlocked\n"
+        'fread_unlocked.restype = size_t\n'
+        'fread_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fwrite_unlocked': (None, ('FILE',),
+        "fwrite_unlocked = _libraries['/usr/lib/libmp4v2.so'].fwrite_unlocked\n"
+        'fwrite_unlocked.restype = size_t\n'
+        'fwrite_unlocked.argtypes = [c_void_p, size_t, size_t, POINTER(FILE)]'
+        ),
+    'fseek': (None, ('FILE',),
+        "fseek = _libraries['/usr/lib/libmp4v2.so'].fseek\n"
+        'fseek.restype = c_int\n'
+        'fseek.argtypes = [POINTER(FILE), c_long, c_int]'
+        ),
+    'ftell': (None, ('FILE',),
+        "ftell = _libraries['/usr/lib/libmp4v2.so'].ftell\n"
+        'ftell.restype = c_long\n'
+        'ftell.argtypes = [POINTER(FILE)]'
+        ),
+    'rewind': (None, ('FILE',),
+        "rewind = _libraries['/usr/lib/libmp4v2.so'].rewind\n"
+        'rewind.restype = None\n'
+        'rewind.argtypes = [POINTER(FILE)]'
+        ),
+    'fseeko': (None, ('FILE',),
+        "fseeko = _libraries['/usr/lib/libmp4v2.so'].fseeko\n"
+        'fseeko.restype = c_int\n'
+        'fseeko.argtypes = [POINTER(FILE), __off_t, c_int]'
+        ),
+    'ftello': (None, ('FILE',),
+        "ftello = _libraries['/usr/lib/libmp4v2.so'].ftello\n"
+        'ftello.restype = __off_t\n'
+        'ftello.argtypes = [POINTER(FILE)]'
+        ),
+    'fgetpos': (None, ('FILE', 'fpos_t'),
+        "fgetpos = _libraries['/usr/lib/libmp4v2.so'].fgetpos\n"
+        'fgetpos.restype = c_int\n'
+        'fgetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]'
+        ),
+    'fsetpos': (None, ('FILE', 'fpos_t'),
+        "fsetpos = _libraries['/usr/lib/libmp4v2.so'].fsetpos\n"
+        'fsetpos.restype = c_int\n'
+        'fsetpos.argtypes = [POINTER(FILE), POINTER(fpos_t)]'
+        ),
+    'fseeko64': (None, ('FILE',),
+        "fseeko64 = _libraries['/usr/lib/libmp4v2.so'].fseeko64\n"
+        'fseeko64.restype = c_int\n'
+        'fseeko64.argtypes = [POINTER(FILE), __off64_t, c_int]'
+        ),
+    'ftello64': (None, ('FILE',),
+        "ftello64 = _libraries['/usr/lib/libmp4v2.so'].ftello64\n"
+        'ftello64.restype = __off64_t\n'
+        'ftello64.argtypes = [POINTER(FILE)]'
+        ),
+    'fgetpos64': (None, ('FILE', 'fpos64_t'),
+        "fgetpos64 = _libraries['/usr/lib/libmp4v2.so'].fgetpos64\n"
+        'fgetpos64.restype = c_int\n'
+        'fgetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]'
+        ),
+    'fsetpos64': (None, ('FILE', 'fpos64_t'),
+        "fsetpos64 = _libraries['/usr/lib/libmp4v2.so'].fsetpos64\n"
+        'fsetpos64.restype = c_int\n'
+        'fsetpos64.argtypes = [POINTER(FILE), POINTER(fpos64_t)]'
+        ),
+    'clearerr': (None, ('FILE',),
+        "clearerr = _libraries['/usr/lib/libmp4v2.so'].clearerr\n"
+        'clearerr.restype = None\n'
+        'clearerr.argtypes = [POINTER(FILE)]'
+        ),
+    'feof': (None, ('FILE',),
+        "feof = _libraries['/usr/lib/libmp4v2.so'].feof\n"
+        'feof.restype = c_int\n'
+        'feof.argtypes = [POINTER(FILE)]'
+        ),
+    'ferror': (None, ('FILE',),
+        "ferror = _libraries['/usr/lib/libmp4v2.so'].ferror\n"
+        'ferror.restype = c_int\n'
+        'ferror.argtypes = [POINTER(FILE)]'
+        ),
+    'clearerr_unlocked': (None, ('FILE',),
+        "clearerr_unlocked = _libraries['/usr/lib/libmp4v2.so'].clearerr_unlocked\n"
+        'clearerr_unlocked.restype = None\n'
+        'clearerr_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'perror': (None, (),
+        "perror = _libraries['/usr/lib/libmp4v2.so'].perror\n"
+        'perror.restype = None\n'
+        'perror.argtypes = [STRING]'
+        ),
+    'fileno': (None, ('FILE',),
+        "fileno = _libraries['/usr/lib/libmp4v2.so'].fileno\n"
+        'fileno.restype = c_int\n'
+        'fileno.argtypes = [POINTER(FILE)]'
+        ),
+    'fileno_unlocked': (None, ('FILE',),
+        "fileno_unlocked = _libraries['/usr/lib/libmp4v2.so'].fileno_unlocked\n"
+        'fileno_unlocked.restype = c_int\n'
+        'fileno_unlocked.argtypes = [POINTER(FILE)]'
+        ),
+    'popen': (None, ('FILE',),
+        "popen = _libraries['/usr/lib/libmp4v2.so'].popen\n"
+        'popen.restype = POINTER(FILE)\n'
+        'popen.argtypes = [STRING, STRING]'
+        ),
+    'pclose': (None, ('FILE',),
+        "pclose = _libraries['/usr/lib/libmp4v2.so'].pclose\n"
+        'pclose.restype = c_int\n'
+        'pclose.argtypes = [POINTER(FILE)]'
+        ),
+    'ctermid': (None, (),
+        "ctermid = _libraries['/usr/lib/libmp4v2.so'].ctermid\n"
+        'ctermid.restype = STRING\n'
+        'ctermid.argtypes = [STRING]'
+        ),
+    'cuserid': (None, (),
+        "cuserid = _libraries['/usr/lib/libmp4v2.so'].cuserid\n"
+        'cuserid.restype = STRING\n'
+        'cuserid.argtypes = [STRING]'
+        ),
+    'obstack': ('Structure', (),
+        'obstack._fields_ = [\n'
+        ']'
+        ),
+    'obstack_printf': (None, ('obstack',),
+        "obstack_printf = _libraries['/usr/lib/libmp4v2.so'].obstack_printf\n"
+        'obstack_printf.restype = c_int\n'
+        'obstack_printf.argtypes = [POINTER(obstack), STRING]'
+        ),
+    'obstack_vprintf': (None, ('obstack',),
+        "obstack_vprintf = _libraries['/usr/lib/libmp4v2.so'].obstack_vprintf\n"
+        'obstack_vprintf.restype = c_int\n'
+        'obstack_vprintf.argtypes = [POINTER(obstack), STRING, __gnuc_va_list]'
+        ),
+    'flockfile': (None, ('FILE',),
+        "flockfile = _libraries['/usr/lib/libmp4v2.so'].flockfile\n"
+        'flockfile.restype = None\n'
+        'flockfile.argtypes = [POINTER(FILE)]'
+        ),
+    'ftrylockfile': (None, ('FILE',),
+        "ftrylockfile = _libraries['/usr/lib/libmp4v2.so'].ftrylockfile\n"
+        'ftrylockfile.restype = c_int\n'
+        'ftrylockfile.argtypes = [POINTER(FILE)]'
+        ),
+    'funlockfile': (None, ('FILE',),
+        "funlockfile = _libraries['/usr/lib/libmp4v2.so'].funlockfile\n"
+        'funlockfile.restype = None\n'
+        'funlockfile.argtypes = [POINTER(FILE)]'
+        ),
+}
+
+_bind_lazily(__name__, _definitions)
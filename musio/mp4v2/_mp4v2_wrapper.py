@@ -368,7 +368,7 @@ class Mp4(object):
 
         """
 
-        if value in range(1, self._sample_count):
+        if 1 <= value <= self._sample_count:
             self._current_sample = value
         else:
             self._current_sample = 1
@@ -1,8 +1,9 @@
 from ctypes import *
+from ..import_util import LazyLibraries as _LazyLibraries
+from ..import_util import bind_lazily as _bind_lazily
 
 STRING = c_char_p
-_libraries = {}
-_libraries['/usr/lib/libmpg123.so'] = CDLL('/usr/lib/libmpg123.so')
+_libraries = _LazyLibraries()
 WSTRING = c_wchar_p
 
 
@@ -29,7 +30,6 @@ MPG123_BAD_INDEX_PAR = 26
 MPG123_BAD_PARS = 25
 MPG123_M_STEREO = 0
 MPG123_NO_READER = 24
-def minor(dev): return gnu_dev_minor (dev) # macro
 def WIFCONTINUED(status): return __WIFCONTINUED (__WAIT_INT (status)) # macro
 def WEXITSTATUS(status): return __WEXITSTATUS (__WAIT_INT (status)) # macro
 def FD_ZERO(fdsetp): return __FD_ZERO (fdsetp) # macro
@@ -78,7 +78,6 @@ MPG123_ORIGINAL = 8
 mpg123_id3_utf16bom = 1
 def __P(args): return args # macro
 # def __NTH(fct): return __LEAF_ATTR fct throw () # macro
-def major(dev): return gnu_dev_major (dev) # macro
 mpg123_id3_pic_composer = 11
 # __SYSCALL_ULONG_TYPE = __ULONGWORD_TYPE # alias
 # __RLIM_T_TYPE = __SYSCALL_ULONG_TYPE # alias
@@ -129,7 +128,6 @@ MPG123_CRC = 1
 # __USECONDS_T_TYPE = __U32_TYPE # alias
 # __UID_T_TYPE = __U32_TYPE # alias
 MPG123_NOT_INITIALIZED = 8
-def makedev(maj,min): return gnu_dev_makedev (maj, min) # macro
 MPG123_NO_GAPLESS = 13
 def le32toh(x): return (x) # macro
 def FD_CLR(fd,fdsetp): return __FD_CLR (fd, fdsetp) # macro
@@ -421,170 +419,14 @@ _XLOCALE_H = 1 # Variable c_int '1'
 _LARGEFILE_SOURCE = 1 # Variable c_int '1'
 __FD_ZERO_STOS = 'stosq' # Variable STRING '(const char*)"stosq"'
 pthread_t = c_ulong
-class pthread_attr_t(Union):
-    pass
-pthread_attr_t._fields_ = [
-    ('__size', c_char * 56),
-    ('__align', c_long),
-]
-class __pthread_internal_list(Structure):
-    pass
-__pthread_internal_list._fields_ = [
-    ('__prev', POINTER(__pthread_internal_list)),
-    ('__next', POINTER(__pthread_internal_list)),
-]
-__pthread_list_t = __pthread_internal_list
-class __pthread_mutex_s(Structure):
-    pass
-__pthread_mutex_s._fields_ = [
-    ('__lock', c_int),
-    ('__count', c_uint),
-    ('__owner', c_int),
-    ('__nusers', c_uint),
-    ('__kind', c_int),
-    ('__spins', c_short),
-    ('__elision', c_short),
-    ('__list', __pthread_list_t),
-]
-class pthread_mutex_t(Union):
-    pass
-pthread_mutex_t._fields_ = [
-    ('__data', __pthread_mutex_s),
-    ('__size', c_char * 40),
-    ('__align', c_long),
-]
-class pthread_mutexattr_t(Union):
-    pass
-pthread_mutexattr_t._fields_ = [
-    ('__size', c_char * 4),
-    ('__align', c_int),
-]
-class N14pthread_cond_t4DOT_11E(Structure):
-    pass
-N14pthread_cond_t4DOT_11E._fields_ = [
-    ('__lock', c_int),
-    ('__futex', c_uint),
-    ('__total_seq', c_ulonglong),
-    ('__wakeup_seq', c_ulonglong),
-    ('__woken_seq', c_ulonglong),
-    ('__mutex', c_void_p),
-    ('__nwaiters', c_uint),
-    ('__broadcast_seq', c_uint),
-]
-class pthread_cond_t(Union):
-    pass
-pthread_cond_t._fields_ = [
-    ('__data', N14pthread_cond_t4DOT_11E),
-    ('__size', c_char * 48),
-    ('__align', c_longlong),
-]
-class pthread_condattr_t(Union):
-    pass
-pthread_condattr_t._fields_ = [
-    ('__size', c_char * 4),
-    ('__align', c_int),
-]
 pthread_key_t = c_uint
 pthread_once_t = c_int
-class N16pthread_rwlock_t4DOT_14E(Structure):
-    pass
-N16pthread_rwlock_t4DOT_14E._fields_ = [
-    ('__lock', c_int),
-    ('__nr_readers', c_uint),
-    ('__readers_wakeup', c_uint),
-    ('__writer_wakeup', c_uint),
-    ('__nr_readers_queued', c_uint),
-    ('__nr_writers_queued', c_uint),
-    ('__writer', c_int),
-    ('__shared', c_int),
-    ('__pad1', c_ulong),
-    ('__pad2', c_ulong),
-    ('__flags', c_uint),
-]
-class pthread_rwlock_t(Union):
-    pass
-pthread_rwlock_t._fields_ = [
-    ('__data', N16pthread_rwlock_t4DOT_14E),
-    ('__size', c_char * 56),
-    ('__align', c_long),
-]
-class pthread_rwlockattr_t(Union):
-    pass
-pthread_rwlockattr_t._fields_ = [
-    ('__size', c_char * 8),
-    ('__align', c_long),
-]
 pthread_spinlock_t = c_int
-class pthread_barrier_t(Union):
-    pass
-pthread_barrier_t._fields_ = [
-    ('__size', c_char * 32),
-    ('__align', c_long),
-]
-class pthread_barrierattr_t(Union):
-    pass
-pthread_barrierattr_t._fields_ = [
-    ('__size', c_char * 4),
-    ('__align', c_int),
-]
-__fdelt_chk = _libraries['/usr/lib/libmpg123.so'].__fdelt_chk
-__fdelt_chk.restype = c_long
-__fdelt_chk.argtypes = [c_long]
-__fdelt_warn = _libraries['/usr/lib/libmpg123.so'].__fdelt_warn
-__fdelt_warn.restype = c_long
-__fdelt_warn.argtypes = [c_long]
 __sig_atomic_t = c_int
-class __sigset_t(Structure):
-    pass
-__sigset_t._fields_ = [
-    ('__val', c_ulong * 16),
-]
 size_t = c_ulong
 __compar_fn_t = CFUNCTYPE(c_int, c_void_p, c_void_p)
-bsearch = _libraries['/usr/lib/libmpg123.so'].bsearch
-bsearch.restype = c_void_p
-bsearch.argtypes = [c_void_p, c_void_p, size_t, size_t, __compar_fn_t]
-atof = _libraries['/usr/lib/libmpg123.so'].atof
-atof.restype = c_double
-atof.argtypes = [STRING]
-__realpath_chk = _libraries['/usr/lib/libmpg123.so'].__realpath_chk
-__realpath_chk.restype = STRING
-__realpath_chk.argtypes = [STRING, STRING, size_t]
-realpath = _libraries['/usr/lib/libmpg123.so'].realpath
-realpath.restype = STRING
-realpath.argtypes = [STRING, STRING]
-__ptsname_r_chk = _libraries['/usr/lib/libmpg123.so'].__ptsname_r_chk
-__ptsname_r_chk.restype = c_int
-__ptsname_r_chk.argtypes = [c_int, STRING, size_t, size_t]
-ptsname_r = _libraries['/usr/lib/libmpg123.so'].ptsname_r
-ptsname_r.restype = c_int
-ptsname_r.argtypes = [c_int, STRING, size_t]
-__wctomb_chk = _libraries['/usr/lib/libmpg123.so'].__wctomb_chk
-__wctomb_chk.restype = c_int
-__wctomb_chk.argtypes = [STRING, c_wchar, size_t]
-wctomb = _libraries['/usr/lib/libmpg123.so'].wctomb
-wctomb.restype = c_int
-wctomb.argtypes = [STRING, c_wchar]
-__mbstowcs_chk = _libraries['/usr/lib/libmpg123.so'].__mbstowcs_chk
-__mbstowcs_chk.restype = size_t
-__mbstowcs_chk.argtypes = [WSTRING, STRING, size_t, size_t]
-mbstowcs = _libraries['/usr/lib/libmpg123.so'].mbstowcs
-mbstowcs.restype = size_t
-mbstowcs.argtypes = [WSTRING, STRING, size_t]
-__wcstombs_chk = _libraries['/usr/lib/libmpg123.so'].__wcstombs_chk
-__wcstombs_chk.restype = size_t
-__wcstombs_chk.argtypes = [STRING, WSTRING, size_t, size_t]
-wcstombs = _libraries['/usr/lib/libmpg123.so'].wcstombs
-wcstombs.restype = size_t
-wcstombs.argtypes = [STRING, WSTRING, size_t]
-class timeval(Structure):
-    pass
 __time_t = c_long
 __suseconds_t = c_long
-timeval._fields_ = [
-    ('tv_sec', __time_t),
-    ('tv_usec', __suseconds_t),
-]
 __u_char = c_ubyte
 __u_short = c_ushort
 __u_int = c_uint
@@ -609,11 +451,6 @@ __nlink_t = c_ulong
 __off_t = c_long
 __off64_t = c_long
 __pid_t = c_int
-class __fsid_t(Structure):
-    pass
-__fsid_t._fields_ = [
-    ('__val', c_int * 2),
-]
 __clock_t = c_long
 __rlim_t = c_ulong
 __rlim64_t = c_ulong
@@ -639,45 +476,6 @@ __qaddr_t = POINTER(__quad_t)
 __caddr_t = STRING
 __intptr_t = c_long
 __socklen_t = c_uint
-class wait(Union):
-    pass
-class N4wait3DOT_1E(Structure):
-    pass
-N4wait3DOT_1E._fields_ = [
-    ('__w_termsig', c_uint, 7),
-    ('__w_coredump', c_uint, 1),
-    ('__w_retcode', c_uint, 8),
-    ('', c_uint, 16),
-]
-class N4wait3DOT_2E(Structure):
-    pass
-N4wait3DOT_2E._fields_ = [
-    ('__w_stopval', c_uint, 8),
-    ('__w_stopsig', c_uint, 8),
-    ('', c_uint, 16),
-]
-wait._fields_ = [
-    ('w_status', c_int),
-    ('__wait_terminated', N4wait3DOT_1E),
-    ('__wait_stopped', N4wait3DOT_2E),
-]
-class mpg123_handle_struct(Structure):
-    pass
-mpg123_handle_struct._fields_ = [
-]
-mpg123_handle = mpg123_handle_struct
-mpg123_init = _libraries['/usr/lib/libmpg123.so'].mpg123_init
-mpg123_init.restype = c_int
-mpg123_init.argtypes = []
-mpg123_exit = _libraries['/usr/lib/libmpg123.so'].mpg123_exit
-mpg123_exit.restype = None
-mpg123_exit.argtypes = []
-mpg123_new = _libraries['/usr/lib/libmpg123.so'].mpg123_new
-mpg123_new.restype = POINTER(mpg123_handle)
-mpg123_new.argtypes = [STRING, POINTER(c_int)]
-mpg123_delete = _libraries['/usr/lib/libmpg123.so'].mpg123_delete
-mpg123_delete.restype = None
-mpg123_delete.argtypes = [POINTER(mpg123_handle)]
 
 # values for enumeration 'mpg123_parms'
 mpg123_parms = c_int # enum
@@ -687,163 +485,22 @@ mpg123_param_flags = c_int # enum
 
 # values for enumeration 'mpg123_param_rva'
 mpg123_param_rva = c_int # enum
-mpg123_param = _libraries['/usr/lib/libmpg123.so'].mpg123_param
-mpg123_param.restype = c_int
-mpg123_param.argtypes = [POINTER(mpg123_handle), mpg123_parms, c_long, c_double]
-mpg123_getparam = _libraries['/usr/lib/libmpg123.so'].mpg123_getparam
-mpg123_getparam.restype = c_int
-mpg123_getparam.argtypes = [POINTER(mpg123_handle), mpg123_parms, POINTER(c_long), POINTER(c_double)]
 
 # values for enumeration 'mpg123_feature_set'
 mpg123_feature_set = c_int # enum
-mpg123_feature = _libraries['/usr/lib/libmpg123.so'].mpg123_feature
-mpg123_feature.restype = c_int
-mpg123_feature.argtypes = [mpg123_feature_set]
 
 # values for enumeration 'mpg123_errors'
 mpg123_errors = c_int # enum
-mpg123_plain_strerror = _libraries['/usr/lib/libmpg123.so'].mpg123_plain_strerror
-mpg123_plain_strerror.restype = STRING
-mpg123_plain_strerror.argtypes = [c_int]
-mpg123_strerror = _libraries['/usr/lib/libmpg123.so'].mpg123_strerror
-mpg123_strerror.restype = STRING
-mpg123_strerror.argtypes = [POINTER(mpg123_handle)]
-mpg123_errcode = _libraries['/usr/lib/libmpg123.so'].mpg123_errcode
-mpg123_errcode.restype = c_int
-mpg123_errcode.argtypes = [POINTER(mpg123_handle)]
-mpg123_decoders = _libraries['/usr/lib/libmpg123.so'].mpg123_decoders
-mpg123_decoders.restype = POINTER(STRING)
-mpg123_decoders.argtypes = []
-mpg123_supported_decoders = _libraries['/usr/lib/libmpg123.so'].mpg123_supported_decoders
-mpg123_supported_decoders.restype = POINTER(STRING)
-mpg123_supported_decoders.argtypes = []
-mpg123_decoder = _libraries['/usr/lib/libmpg123.so'].mpg123_decoder
-mpg123_decoder.restype = c_int
-mpg123_decoder.argtypes = [POINTER(mpg123_handle), STRING]
-mpg123_current_decoder = _libraries['/usr/lib/libmpg123.so'].mpg123_current_decoder
-mpg123_current_decoder.restype = STRING
-mpg123_current_decoder.argtypes = [POINTER(mpg123_handle)]
 
 # values for enumeration 'mpg123_enc_enum'
 mpg123_enc_enum = c_int # enum
 
 # values for enumeration 'mpg123_channelcount'
 mpg123_channelcount = c_int # enum
-mpg123_rates = _libraries['/usr/lib/libmpg123.so'].mpg123_rates
-mpg123_rates.restype = None
-mpg123_rates.argtypes = [POINTER(POINTER(c_long)), POINTER(size_t)]
-mpg123_encodings = _libraries['/usr/lib/libmpg123.so'].mpg123_encodings
-mpg123_encodings.restype = None
-mpg123_encodings.argtypes = [POINTER(POINTER(c_int)), POINTER(size_t)]
-mpg123_encsize = _libraries['/usr/lib/libmpg123.so'].mpg123_encsize
-mpg123_encsize.restype = c_int
-mpg123_encsize.argtypes = [c_int]
-mpg123_format_none = _libraries['/usr/lib/libmpg123.so'].mpg123_format_none
-mpg123_format_none.restype = c_int
-mpg123_format_none.argtypes = [POINTER(mpg123_handle)]
-mpg123_format_all = _libraries['/usr/lib/libmpg123.so'].mpg123_format_all
-mpg123_format_all.restype = c_int
-mpg123_format_all.argtypes = [POINTER(mpg123_handle)]
-mpg123_format = _libraries['/usr/lib/libmpg123.so'].mpg123_format
-mpg123_format.restype = c_int
-mpg123_format.argtypes = [POINTER(mpg123_handle), c_long, c_int, c_int]
-mpg123_format_support = _libraries['/usr/lib/libmpg123.so'].mpg123_format_support
-mpg123_format_support.restype = c_int
-mpg123_format_support.argtypes = [POINTER(mpg123_handle), c_long, c_int]
-mpg123_getformat = _libraries['/usr/lib/libmpg123.so'].mpg123_getformat
-mpg123_getformat.restype = c_int
-mpg123_getformat.argtypes = [POINTER(mpg123_handle), POINTER(c_long), POINTER(c_int), POINTER(c_int)]
-mpg123_open = _libraries['/usr/lib/libmpg123.so'].mpg123_open
-mpg123_open.restype = c_int
-mpg123_open.argtypes = [POINTER(mpg123_handle), STRING]
-mpg123_open_fd = _libraries['/usr/lib/libmpg123.so'].mpg123_open_fd
-mpg123_open_fd.restype = c_int
-mpg123_open_fd.argtypes = [POINTER(mpg123_handle), c_int]
-mpg123_open_handle = _libraries['/usr/lib/libmpg123.so'].mpg123_open_handle
-mpg123_open_handle.restype = c_int
-mpg123_open_handle.argtypes = [POINTER(mpg123_handle), c_void_p]
-mpg123_open_feed = _libraries['/usr/lib/libmpg123.so'].mpg123_open_feed
-mpg123_open_feed.restype = c_int
-mpg123_open_feed.argtypes = [POINTER(mpg123_handle)]
-mpg123_close = _libraries['/usr/lib/libmpg123.so'].mpg123_close
-mpg123_close.restype = c_int
-mpg123_close.argtypes = [POINTER(mpg123_handle)]
-mpg123_read = _libraries['/usr/lib/libmpg123.so'].mpg123_read
-mpg123_read.restype = c_int
-mpg123_read.argtypes = [POINTER(mpg123_handle), POINTER(c_ubyte), size_t, POINTER(size_t)]
-mpg123_feed = _libraries['/usr/lib/libmpg123.so'].mpg123_feed
-mpg123_feed.restype = c_int
-mpg123_feed.argtypes = [POINTER(mpg123_handle), POINTER(c_ubyte), size_t]
-mpg123_decode = _libraries['/usr/lib/libmpg123.so'].mpg123_decode
-mpg123_decode.restype = c_int
-mpg123_decode.argtypes = [POINTER(mpg123_handle), POINTER(c_ubyte), size_t, POINTER(c_ubyte), size_t, POINTER(size_t)]
 off_t = __off_t
-mpg123_decode_frame = _libraries['/usr/lib/libmpg123.so'].mpg123_decode_frame
-mpg123_decode_frame.restype = c_int
-mpg123_decode_frame.argtypes = [POINTER(mpg123_handle), POINTER(off_t), POINTER(POINTER(c_ubyte)), POINTER(size_t)]
-mpg123_framebyframe_decode = _libraries['/usr/lib/libmpg123.so'].mpg123_framebyframe_decode
-mpg123_framebyframe_decode.restype = c_int
-mpg123_framebyframe_decode.argtypes = [POINTER(mpg123_handle), POINTER(off_t), POINTER(POINTER(c_ubyte)), POINTER(size_t)]
-mpg123_framebyframe_next = _libraries['/usr/lib/libmpg123.so'].mpg123_framebyframe_next
-mpg123_framebyframe_next.restype = c_int
-mpg123_framebyframe_next.argtypes = [POINTER(mpg123_handle)]
-mpg123_framedata = _libraries['/usr/lib/libmpg123.so'].mpg123_framedata
-mpg123_framedata.restype = c_int
-mpg123_framedata.argtypes = [POINTER(mpg123_handle), POINTER(c_ulong), POINTER(POINTER(c_ubyte)), POINTER(size_t)]
-mpg123_framepos = _libraries['/usr/lib/libmpg123.so'].mpg123_framepos
-mpg123_framepos.restype = off_t
-mpg123_framepos.argtypes = [POINTER(mpg123_handle)]
-mpg123_tell = _libraries['/usr/lib/libmpg123.so'].mpg123_tell
-mpg123_tell.restype = off_t
-mpg123_tell.argtypes = [POINTER(mpg123_handle)]
-mpg123_tellframe = _libraries['/usr/lib/libmpg123.so'].mpg123_tellframe
-mpg123_tellframe.restype = off_t
-mpg123_tellframe.argtypes = [POINTER(mpg123_handle)]
-mpg123_tell_stream = _libraries['/usr/lib/libmpg123.so'].mpg123_tell_stream
-mpg123_tell_stream.restype = off_t
-mpg123_tell_stream.argtypes = [POINTER(mpg123_handle)]
-mpg123_seek = _libraries['/usr/lib/libmpg123.so'].mpg123_seek
-mpg123_seek.restype = off_t
-mpg123_seek.argtypes = [POINTER(mpg123_handle), off_t, c_int]
-mpg123_feedseek = _libraries['/usr/lib/libmpg123.so'].mpg123_feedseek
-mpg123_feedseek.restype = off_t
-mpg123_feedseek.argtypes = [POINTER(mpg123_handle), off_t, c_int, POINTER(off_t)]
-mpg123_seek_frame = _libraries['/usr/lib/libmpg123.so'].mpg123_seek_frame
-mpg123_seek_frame.restype = off_t
-mpg123_seek_frame.argtypes = [POINTER(mpg123_handle), off_t, c_int]
-mpg123_timeframe = _libraries['/usr/lib/libmpg123.so'].mpg123_timeframe
-mpg123_timeframe.restype = off_t
-mpg123_timeframe.argtypes = [POINTER(mpg123_handle), c_double]
-mpg123_index = _libraries['/usr/lib/libmpg123.so'].mpg123_index
-mpg123_index.restype = c_int
-mpg123_index.argtypes = [POINTER(mpg123_handle), POINTER(POINTER(off_t)), POINTER(off_t), POINTER(size_t)]
-mpg123_set_index = _libraries['/usr/lib/libmpg123.so'].mpg123_set_index
-mpg123_set_index.restype = c_int
-mpg123_set_index.argtypes = [POINTER(mpg123_handle), POINTER(off_t), off_t, size_t]
-mpg123_position = _libraries['/usr/lib/libmpg123.so'].mpg123_position
-mpg123_position.restype = c_int
-mpg123_position.argtypes = [POINTER(mpg123_handle), off_t, off_t, POINTER(off_t), POINTER(off_t), POINTER(c_double), POINTER(c_double)]
 
 # values for enumeration 'mpg123_channels'
 mpg123_channels = c_int # enum
-mpg123_eq = _libraries['/usr/lib/libmpg123.so'].mpg123_eq
-mpg123_eq.restype = c_int
-mpg123_eq.argtypes = [POINTER(mpg123_handle), mpg123_channels, c_int, c_double]
-mpg123_geteq = _libraries['/usr/lib/libmpg123.so'].mpg123_geteq
-mpg123_geteq.restype = c_double
-mpg123_geteq.argtypes = [POINTER(mpg123_handle), mpg123_channels, c_int]
-mpg123_reset_eq = _libraries['/usr/lib/libmpg123.so'].mpg123_reset_eq
-mpg123_reset_eq.restype = c_int
-mpg123_reset_eq.argtypes = [POINTER(mpg123_handle)]
-mpg123_volume = _libraries['/usr/lib/libmpg123.so'].mpg123_volume
-mpg123_volume.restype = c_int
-mpg123_volume.argtypes = [POINTER(mpg123_handle), c_double]
-mpg123_volume_change = _libraries['/usr/lib/libmpg123.so'].mpg123_volume_change
-mpg123_volume_change.restype = c_int
-mpg123_volume_change.argtypes = [POINTER(mpg123_handle), c_double]
-mpg123_getvolume = _libraries['/usr/lib/libmpg123.so'].mpg123_getvolume
-mpg123_getvolume.restype = c_int
-mpg123_getvolume.argtypes = [POINTER(mpg123_handle), POINTER(c_double), POINTER(c_double), POINTER(c_double)]
 
 # values for enumeration 'mpg123_vbr'
 mpg123_vbr = c_int # enum
@@ -856,623 +513,30 @@ mpg123_mode = c_int # enum
 
 # values for enumeration 'mpg123_flags'
 mpg123_flags = c_int # enum
-class mpg123_frameinfo(Structure):
-    pass
-mpg123_frameinfo._fields_ = [
-    ('version', mpg123_version),
-    ('layer', c_int),
-    ('rate', c_long),
-    ('mode', mpg123_mode),
-    ('mode_ext', c_int),
-    ('framesize', c_int),
-    ('flags', mpg123_flags),
-    ('emphasis', c_int),
-    ('bitrate', c_int),
-    ('abr_rate', c_int),
-    ('vbr', mpg123_vbr),
-]
-mpg123_info = _libraries['/usr/lib/libmpg123.so'].mpg123_info
-mpg123_info.restype = c_int
-mpg123_info.argtypes = [POINTER(mpg123_handle), POINTER(mpg123_frameinfo)]
-mpg123_safe_buffer = _libraries['/usr/lib/libmpg123.so'].mpg123_safe_buffer
-mpg123_safe_buffer.restype = size_t
-mpg123_safe_buffer.argtypes = []
-mpg123_scan = _libraries['/usr/lib/libmpg123.so'].mpg123_scan
-mpg123_scan.restype = c_int
-mpg123_scan.argtypes = [POINTER(mpg123_handle)]
-mpg123_length = _libraries['/usr/lib/libmpg123.so'].mpg123_length
-mpg123_length.restype = off_t
-mpg123_length.argtypes = [POINTER(mpg123_handle)]
-mpg123_set_filesize = _libraries['/usr/lib/libmpg123.so'].mpg123_set_filesize
-mpg123_set_filesize.restype = c_int
-mpg123_set_filesize.argtypes = [POINTER(mpg123_handle), off_t]
-mpg123_tpf = _libraries['/usr/lib/libmpg123.so'].mpg123_tpf
-mpg123_tpf.restype = c_double
-mpg123_tpf.argtypes = [POINTER(mpg123_handle)]
-mpg123_spf = _libraries['/usr/lib/libmpg123.so'].mpg123_spf
-mpg123_spf.restype = c_int
-mpg123_spf.argtypes = [POINTER(mpg123_handle)]
-mpg123_clip = _libraries['/usr/lib/libmpg123.so'].mpg123_clip
-mpg123_clip.restype = c_long
-mpg123_clip.argtypes = [POINTER(mpg123_handle)]
 
 # values for enumeration 'mpg123_state'
 mpg123_state = c_int # enum
-mpg123_getstate = _libraries['/usr/lib/libmpg123.so'].mpg123_getstate
-mpg123_getstate.restype = c_int
-mpg123_getstate.argtypes = [POINTER(mpg123_handle), mpg123_state, POINTER(c_long), POINTER(c_double)]
-class mpg123_string(Structure):
-    pass
-mpg123_string._fields_ = [
-    ('p', STRING),
-    ('size', size_t),
-    ('fill', size_t),
-]
-mpg123_init_string = _libraries['/usr/lib/libmpg123.so'].mpg123_init_string
-mpg123_init_string.restype = None
-mpg123_init_string.argtypes = [POINTER(mpg123_string)]
-mpg123_free_string = _libraries['/usr/lib/libmpg123.so'].mpg123_free_string
-mpg123_free_string.restype = None
-mpg123_free_string.argtypes = [POINTER(mpg123_string)]
-mpg123_resize_string = _libraries['/usr/lib/libmpg123.so'].mpg123_resize_string
-mpg123_resize_string.restype = c_int
-mpg123_resize_string.argtypes = [POINTER(mpg123_string), size_t]
-mpg123_grow_string = _libraries['/usr/lib/libmpg123.so'].mpg123_grow_string
-mpg123_grow_string.restype = c_int
-mpg123_grow_string.argtypes = [POINTER(mpg123_string), size_t]
-mpg123_copy_string = _libraries['/usr/lib/libmpg123.so'].mpg123_copy_string
-mpg123_copy_string.restype = c_int
-mpg123_copy_string.argtypes = [POINTER(mpg123_string), POINTER(mpg123_string)]
-mpg123_add_string = _libraries['/usr/lib/libmpg123.so'].mpg123_add_string
-mpg123_add_string.restype = c_int
-mpg123_add_string.argtypes = [POINTER(mpg123_string), STRING]
-mpg123_add_substring = _libraries['/usr/lib/libmpg123.so'].mpg123_add_substring
-mpg123_add_substring.restype = c_int
-mpg123_add_substring.argtypes = [POINTER(mpg123_string), STRING, size_t, size_t]
-mpg123_set_string = _libraries['/usr/lib/libmpg123.so'].mpg123_set_string
-mpg123_set_string.restype = c_int
-mpg123_set_string.argtypes = [POINTER(mpg123_string), STRING]
-mpg123_set_substring = _libraries['/usr/lib/libmpg123.so'].mpg123_set_substring
-mpg123_set_substring.restype = c_int
-mpg123_set_substring.argtypes = [POINTER(mpg123_string), STRING, size_t, size_t]
-mpg123_strlen = _libraries['/usr/lib/libmpg123.so'].mpg123_strlen
-mpg123_strlen.restype = size_t
-mpg123_strlen.argtypes = [POINTER(mpg123_string), c_int]
-mpg123_chomp_string = _libraries['/usr/lib/libmpg123.so'].mpg123_chomp_string
-mpg123_chomp_string.restype = c_int
-mpg123_chomp_string.argtypes = [POINTER(mpg123_string)]
 
 # values for enumeration 'mpg123_text_encoding'
 mpg123_text_encoding = c_int # enum
 
 # values for enumeration 'mpg123_id3_enc'
 mpg123_id3_enc = c_int # enum
-mpg123_enc_from_id3 = _libraries['/usr/lib/libmpg123.so'].mpg123_enc_from_id3
-mpg123_enc_from_id3.restype = mpg123_text_encoding
-mpg123_enc_from_id3.argtypes = [c_ubyte]
-mpg123_store_utf8 = _libraries['/usr/lib/libmpg123.so'].mpg123_store_utf8
-mpg123_store_utf8.restype = c_int
-mpg123_store_utf8.argtypes = [POINTER(mpg123_string), mpg123_text_encoding, POINTER(c_ubyte), size_t]
-class mpg123_text(Structure):
-    pass
-mpg123_text._fields_ = [
-    ('lang', c_char * 3),
-    ('id', c_char * 4),
-    ('description', mpg123_string),
-    ('text', mpg123_string),
-]
 
 # values for enumeration 'mpg123_id3_pic_type'
 mpg123_id3_pic_type = c_int # enum
-class mpg123_picture(Structure):
-    pass
-mpg123_picture._fields_ = [
-    ('type', c_char),
-    ('description', mpg123_string),
-    ('mime_type', mpg123_string),
-    ('size', size_t),
-    ('data', POINTER(c_ubyte)),
-]
-class mpg123_id3v2(Structure):
-    pass
-mpg123_id3v2._fields_ = [
-    ('version', c_ubyte),
-    ('title', POINTER(mpg123_string)),
-    ('artist', POINTER(mpg123_string)),
-    ('album', POINTER(mpg123_string)),
-    ('year', POINTER(mpg123_string)),
-    ('genre', POINTER(mpg123_string)),
-    ('comment', POINTER(mpg123_string)),
-    ('comment_list', POINTER(mpg123_text)),
-    ('comments', size_t),
-    ('text', POINTER(mpg123_text)),
-    ('texts', size_t),
-    ('extra', POINTER(mpg123_text)),
-    ('extras', size_t),
-    ('picture', POINTER(mpg123_picture)),
-    ('pictures', size_t),
-]
-class mpg123_id3v1(Structure):
-    pass
-mpg123_id3v1._fields_ = [
-    ('tag', c_char * 3),
-    ('title', c_char * 30),
-    ('artist', c_char * 30),
-    ('album', c_char * 30),
-    ('year', c_char * 4),
-    ('comment', c_char * 30),
-    ('genre', c_ubyte),
-]
-mpg123_meta_check = _libraries['/usr/lib/libmpg123.so'].mpg123_meta_check
-mpg123_meta_check.restype = c_int
-mpg123_meta_check.argtypes = [POINTER(mpg123_handle)]
-mpg123_meta_free = _libraries['/usr/lib/libmpg123.so'].mpg123_meta_free
-mpg123_meta_free.restype = None
-mpg123_meta_free.argtypes = [POINTER(mpg123_handle)]
-mpg123_id3 = _libraries['/usr/lib/libmpg123.so'].mpg123_id3
-mpg123_id3.restype = c_int
-mpg123_id3.argtypes = [POINTER(mpg123_handle), POINTER(POINTER(mpg123_id3v1)), POINTER(POINTER(mpg123_id3v2))]
-mpg123_icy = _libraries['/usr/lib/libmpg123.so'].mpg123_icy
-mpg123_icy.restype = c_int
-mpg123_icy.argtypes = [POINTER(mpg123_handle), POINTER(STRING)]
-mpg123_icy2utf8 = _libraries['/usr/lib/libmpg123.so'].mpg123_icy2utf8
-mpg123_icy2utf8.restype = STRING
-mpg123_icy2utf8.argtypes = [STRING]
-class mpg123_pars_struct(Structure):
-    pass
-mpg123_pars_struct._fields_ = [
-]
-mpg123_pars = mpg123_pars_struct
-mpg123_parnew = _libraries['/usr/lib/libmpg123.so'].mpg123_parnew
-mpg123_parnew.restype = POINTER(mpg123_handle)
-mpg123_parnew.argtypes = [POINTER(mpg123_pars), STRING, POINTER(c_int)]
-mpg123_new_pars = _libraries['/usr/lib/libmpg123.so'].mpg123_new_pars
-mpg123_new_pars.restype = POINTER(mpg123_pars)
-mpg123_new_pars.argtypes = [POINTER(c_int)]
-mpg123_delete_pars = _libraries['/usr/lib/libmpg123.so'].mpg123_delete_pars
-mpg123_delete_pars.restype = None
-mpg123_delete_pars.argtypes = [POINTER(mpg123_pars)]
-mpg123_fmt_none = _libraries['/usr/lib/libmpg123.so'].mpg123_fmt_none
-mpg123_fmt_none.restype = c_int
-mpg123_fmt_none.argtypes = [POINTER(mpg123_pars)]
-mpg123_fmt_all = _libraries['/usr/lib/libmpg123.so'].mpg123_fmt_all
-mpg123_fmt_all.restype = c_int
-mpg123_fmt_all.argtypes = [POINTER(mpg123_pars)]
-mpg123_fmt = _libraries['/usr/lib/libmpg123.so'].mpg123_fmt
-mpg123_fmt.restype = c_int
-mpg123_fmt.argtypes = [POINTER(mpg123_pars), c_long, c_int, c_int]
-mpg123_fmt_support = _libraries['/usr/lib/libmpg123.so'].mpg123_fmt_support
-mpg123_fmt_support.restype = c_int
-mpg123_fmt_support.argtypes = [POINTER(mpg123_pars), c_long, c_int]
-mpg123_par = _libraries['/usr/lib/libmpg123.so'].mpg123_par
-mpg123_par.restype = c_int
-mpg123_par.argtypes = [POINTER(mpg123_pars), mpg123_parms, c_long, c_double]
-mpg123_getpar = _libraries['/usr/lib/libmpg123.so'].mpg123_getpar
-mpg123_getpar.restype = c_int
-mpg123_getpar.argtypes = [POINTER(mpg123_pars), mpg123_parms, POINTER(c_long), POINTER(c_double)]
-mpg123_replace_buffer = _libraries['/usr/lib/libmpg123.so'].mpg123_replace_buffer
-mpg123_replace_buffer.restype = c_int
-mpg123_replace_buffer.argtypes = [POINTER(mpg123_handle), POINTER(c_ubyte), size_t]
-mpg123_outblock = _libraries['/usr/lib/libmpg123.so'].mpg123_outblock
-mpg123_outblock.restype = size_t
-mpg123_outblock.argtypes = [POINTER(mpg123_handle)]
 ssize_t = __ssize_t
-mpg123_replace_reader = _libraries['/usr/lib/libmpg123.so'].mpg123_replace_reader
-mpg123_replace_reader.restype = c_int
-mpg123_replace_reader.argtypes = [POINTER(mpg123_handle), CFUNCTYPE(ssize_t, c_int, c_void_p, size_t), CFUNCTYPE(off_t, c_int, off_t, c_int)]
-mpg123_replace_reader_handle = _libraries['/usr/lib/libmpg123.so'].mpg123_replace_reader_handle
-mpg123_replace_reader_handle.restype = c_int
-mpg123_replace_reader_handle.argtypes = [POINTER(mpg123_handle), CFUNCTYPE(ssize_t, c_void_p, c_void_p, size_t), CFUNCTYPE(off_t, c_void_p, off_t, c_int), CFUNCTYPE(None, c_void_p)]
-class div_t(Structure):
-    pass
-div_t._fields_ = [
-    ('quot', c_int),
-    ('rem', c_int),
-]
-class ldiv_t(Structure):
-    pass
-ldiv_t._fields_ = [
-    ('quot', c_long),
-    ('rem', c_long),
-]
-class lldiv_t(Structure):
-    pass
-lldiv_t._fields_ = [
-    ('quot', c_longlong),
-    ('rem', c_longlong),
-]
-__ctype_get_mb_cur_max = _libraries['/usr/lib/libmpg123.so'].__ctype_get_mb_cur_max
-__ctype_get_mb_cur_max.restype = size_t
-__ctype_get_mb_cur_max.argtypes = []
-strtod = _libraries['/usr/lib/libmpg123.so'].strtod
-strtod.restype = c_double
-strtod.argtypes = [STRING, POINTER(STRING)]
-strtof = _libraries['/usr/lib/libmpg123.so'].strtof
-strtof.restype = c_float
-strtof.argtypes = [STRING, POINTER(STRING)]
-strtold = _libraries['/usr/lib/libmpg123.so'].strtold
-strtold.restype = c_longdouble
-strtold.argtypes = [STRING, POINTER(STRING)]
-strtol = _libraries['/usr/lib/libmpg123.so'].strtol
-strtol.restype = c_long
-strtol.argtypes = [STRING, POINTER(STRING), c_int]
-strtoul = _libraries['/usr/lib/libmpg123.so'].strtoul
-strtoul.restype = c_ulong
-strtoul.argtypes = [STRING, POINTER(STRING), c_int]
-strtoq = _libraries['/usr/lib/libmpg123.so'].strtoq
-strtoq.restype = c_longlong
-strtoq.argtypes = [STRING, POINTER(STRING), c_int]
-strtouq = _libraries['/usr/lib/libmpg123.so'].strtouq
-strtouq.restype = c_ulonglong
-strtouq.argtypes = [STRING, POINTER(STRING), c_int]
-strtoll = _libraries['/usr/lib/libmpg123.so'].strtoll
-strtoll.restype = c_longlong
-strtoll.argtypes = [STRING, POINTER(STRING), c_int]
-strtoull = _libraries['/usr/lib/libmpg123.so'].strtoull
-strtoull.restype = c_ulonglong
-strtoull.argtypes = [STRING, POINTER(STRING), c_int]
-class __locale_struct(Structure):
-    pass
-__locale_t = POINTER(__locale_struct)
-strtol_l = _libraries['/usr/lib/libmpg123.so'].strtol_l
-strtol_l.restype = c_long
-strtol_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtoul_l = _libraries['/usr/lib/libmpg123.so'].strtoul_l
-strtoul_l.restype = c_ulong
-strtoul_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtoll_l = _libraries['/usr/lib/libmpg123.so'].strtoll_l
-strtoll_l.restype = c_longlong
-strtoll_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtoull_l = _libraries['/usr/lib/libmpg123.so'].strtoull_l
-strtoull_l.restype = c_ulonglong
-strtoull_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]
-strtod_l = _libraries['/usr/lib/libmpg123.so'].strtod_l
-strtod_l.restype = c_double
-strtod_l.argtypes = [STRING, POINTER(STRING), __locale_t]
-strtof_l = _libraries['/usr/lib/libmpg123.so'].strtof_l
-strtof_l.restype = c_float
-strtof_l.argtypes = [STRING, POINTER(STRING), __locale_t]
-strtold_l = _libraries['/usr/lib/libmpg123.so'].strtold_l
-strtold_l.restype = c_longdouble
-strtold_l.argtypes = [STRING, POINTER(STRING), __locale_t]
-atoi = _libraries['/usr/lib/libmpg123.so'].atoi
-atoi.restype = c_int
-atoi.argtypes = [STRING]
-atol = _libraries['/usr/lib/libmpg123.so'].atol
-atol.restype = c_long
-atol.argtypes = [STRING]
-atoll = _libraries['/usr/lib/libmpg123.so'].atoll
-atoll.restype = c_longlong
-atoll.argtypes = [STRING]
-l64a = _libraries['/usr/lib/libmpg123.so'].l64a
-l64a.restype = STRING
-l64a.argtypes = [c_long]
-a64l = _libraries['/usr/lib/libmpg123.so'].a64l
-a64l.restype = c_long
-a64l.argtypes = [STRING]
-random = _libraries['/usr/lib/libmpg123.so'].random
-random.restype = c_long
-random.argtypes = []
-srandom = _libraries['/usr/lib/libmpg123.so'].srandom
-srandom.restype = None
-srandom.argtypes = [c_uint]
-initstate = _libraries['/usr/lib/libmpg123.so'].initstate
-initstate.restype = STRING
-initstate.argtypes = [c_uint, STRING, size_t]
-setstate = _libraries['/usr/lib/libmpg123.so'].setstate
-setstate.restype = STRING
-setstate.argtypes = [STRING]
-class random_data(Structure):
-    pass
 int32_t = c_int32
-random_data._fields_ = [
-    ('fptr', POINTER(int32_t)),
-    ('rptr', POINTER(int32_t)),
-    ('state', POINTER(int32_t)),
-    ('rand_type', c_int),
-    ('rand_deg', c_int),
-    ('rand_sep', c_int),
-    ('end_ptr', POINTER(int32_t)),
-]
-random_r = _libraries['/usr/lib/libmpg123.so'].random_r
-random_r.restype = c_int
-random_r.argtypes = [POINTER(random_data), POINTER(int32_t)]
-srandom_r = _libraries['/usr/lib/libmpg123.so'].srandom_r
-srandom_r.restype = c_int
-srandom_r.argtypes = [c_uint, POINTER(random_data)]
-initstate_r = _libraries['/usr/lib/libmpg123.so'].initstate_r
-initstate_r.restype = c_int
-initstate_r.argtypes = [c_uint, STRING, size_t, POINTER(random_data)]
-setstate_r = _libraries['/usr/lib/libmpg123.so'].setstate_r
-setstate_r.restype = c_int
-setstate_r.argtypes = [STRING, POINTER(random_data)]
-rand = _libraries['/usr/lib/libmpg123.so'].rand
-rand.restype = c_int
-rand.argtypes = []
-srand = _libraries['/usr/lib/libmpg123.so'].srand
-srand.restype = None
-srand.argtypes = [c_uint]
-rand_r = _libraries['/usr/lib/libmpg123.so'].rand_r
-rand_r.restype = c_int
-rand_r.argtypes = [POINTER(c_uint)]
-drand48 = _libraries['/usr/lib/libmpg123.so'].drand48
-drand48.restype = c_double
-drand48.argtypes = []
-erand48 = _libraries['/usr/lib/libmpg123.so'].erand48
-erand48.restype = c_double
-erand48.argtypes = [POINTER(c_ushort)]
-lrand48 = _libraries['/usr/lib/libmpg123.so'].lrand48
-lrand48.restype = c_long
-lrand48.argtypes = []
-nrand48 = _libraries['/usr/lib/libmpg123.so'].nrand48
-nrand48.restype = c_long
-nrand48.argtypes = [POINTER(c_ushort)]
-mrand48 = _libraries['/usr/lib/libmpg123.so'].mrand48
-mrand48.restype = c_long
-mrand48.argtypes = []
-jrand48 = _libraries['/usr/lib/libmpg123.so'].jrand48
-jrand48.restype = c_long
-jrand48.argtypes = [POINTER(c_ushort)]
-srand48 = _libraries['/usr/lib/libmpg123.so'].srand48
-srand48.restype = None
-srand48.argtypes = [c_long]
-seed48 = _libraries['/usr/lib/libmpg123.so'].seed48
-seed48.restype = POINTER(c_ushort)
-seed48.argtypes = [POINTER(c_ushort)]
-lcong48 = _libraries['/usr/lib/libmpg123.so'].lcong48
-lcong48.restype = None
-lcong48.argtypes = [POINTER(c_ushort)]
-class drand48_data(Structure):
-    pass
-drand48_data._fields_ = [
-    ('__x', c_ushort * 3),
-    ('__old_x', c_ushort * 3),
-    ('__c', c_ushort),
-    ('__init', c_ushort),
-    ('__a', c_ulonglong),
-]
-drand48_r = _libraries['/usr/lib/libmpg123.so'].drand48_r
-drand48_r.restype = c_int
-drand48_r.argtypes = [POINTER(drand48_data), POINTER(c_double)]
-erand48_r = _libraries['/usr/lib/libmpg123.so'].erand48_r
-erand48_r.restype = c_int
-erand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_double)]
-lrand48_r = _libraries['/usr/lib/libmpg123.so'].lrand48_r
-lrand48_r.restype = c_int
-lrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]
-nrand48_r = _libraries['/usr/lib/libmpg123.so'].nrand48_r
-nrand48_r.restype = c_int
-nrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]
-mrand48_r = _libraries['/usr/lib/libmpg123.so'].mrand48_r
-mrand48_r.restype = c_int
-mrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]
-jrand48_r = _libraries['/usr/lib/libmpg123.so'].jrand48_r
-jrand48_r.restype = c_int
-jrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]
-srand48_r = _libraries['/usr/lib/libmpg123.so'].srand48_r
-srand48_r.restype = c_int
-srand48_r.argtypes = [c_long, POINTER(drand48_data)]
-seed48_r = _libraries['/usr/lib/libmpg123.so'].seed48_r
-seed48_r.restype = c_int
-seed48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]
-lcong48_r = _libraries['/usr/lib/libmpg123.so'].lcong48_r
-lcong48_r.restype = c_int
-lcong48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]
-malloc = _libraries['/usr/lib/libmpg123.so'].malloc
-malloc.restype = c_void_p
-malloc.argtypes = [size_t]
-calloc = _libraries['/usr/lib/libmpg123.so'].calloc
-calloc.restype = c_void_p
-calloc.argtypes = [size_t, size_t]
-realloc = _libraries['/usr/lib/libmpg123.so'].realloc
-realloc.restype = c_void_p
-realloc.argtypes = [c_void_p, size_t]
-free = _libraries['/usr/lib/libmpg123.so'].free
-free.restype = None
-free.argtypes = [c_void_p]
-cfree = _libraries['/usr/lib/libmpg123.so'].cfree
-cfree.restype = None
-cfree.argtypes = [c_void_p]
-valloc = _libraries['/usr/lib/libmpg123.so'].valloc
-valloc.restype = c_void_p
-valloc.argtypes = [size_t]
-posix_memalign = _libraries['/usr/lib/libmpg123.so'].posix_memalign
-posix_memalign.restype = c_int
-posix_memalign.argtypes = [POINTER(c_void_p), size_t, size_t]
-aligned_alloc = _libraries['/usr/lib/libmpg123.so'].aligned_alloc
-aligned_alloc.restype = c_void_p
-aligned_alloc.argtypes = [size_t, size_t]
-abort = _libraries['/usr/lib/libmpg123.so'].abort
-abort.restype = None
-abort.argtypes = []
-on_exit = _libraries['/usr/lib/libmpg123.so'].on_exit
-on_exit.restype = c_int
-on_exit.argtypes = [CFUNCTYPE(None, c_int, c_void_p), c_void_p]
-exit = _libraries['/usr/lib/libmpg123.so'].exit
-exit.restype = None
-exit.argtypes = [c_int]
-quick_exit = _libraries['/usr/lib/libmpg123.so'].quick_exit
-quick_exit.restype = None
-quick_exit.argtypes = [c_int]
-_Exit = _libraries['/usr/lib/libmpg123.so']._Exit
-_Exit.restype = None
-_Exit.argtypes = [c_int]
-getenv = _libraries['/usr/lib/libmpg123.so'].getenv
-getenv.restype = STRING
-getenv.argtypes = [STRING]
-secure_getenv = _libraries['/usr/lib/libmpg123.so'].secure_getenv
-secure_getenv.restype = STRING
-secure_getenv.argtypes = [STRING]
-putenv = _libraries['/usr/lib/libmpg123.so'].putenv
-putenv.restype = c_int
-putenv.argtypes = [STRING]
-setenv = _libraries['/usr/lib/libmpg123.so'].setenv
-setenv.restype = c_int
-setenv.argtypes = [STRING, STRING, c_int]
-unsetenv = _libraries['/usr/lib/libmpg123.so'].unsetenv
-unsetenv.restype = c_int
-unsetenv.argtypes = [STRING]
-clearenv = _libraries['/usr/lib/libmpg123.so'].clearenv
-clearenv.restype = c_int
-clearenv.argtypes = []
-mktemp = _libraries['/usr/lib/libmpg123.so'].mktemp
-mktemp.restype = STRING
-mktemp.argtypes = [STRING]
-mkstemp = _libraries['/usr/lib/libmpg123.so'].mkstemp
-mkstemp.restype = c_int
-mkstemp.argtypes = [STRING]
-mkstemp64 = _libraries['/usr/lib/libmpg123.so'].mkstemp64
-mkstemp64.restype = c_int
-mkstemp64.argtypes = [STRING]
-mkstemps = _libraries['/usr/lib/libmpg123.so'].mkstemps
-mkstemps.restype = c_int
-mkstemps.argtypes = [STRING, c_int]
-mkstemps64 = _libraries['/usr/lib/libmpg123.so'].mkstemps64
-mkstemps64.restype = c_int
-mkstemps64.argtypes = [STRING, c_int]
-mkdtemp = _libraries['/usr/lib/libmpg123.so'].mkdtemp
-mkdtemp.restype = STRING
-mkdtemp.argtypes = [STRING]
-mkostemp = _libraries['/usr/lib/libmpg123.so'].mkostemp
-mkostemp.restype = c_int
-mkostemp.argtypes = [STRING, c_int]
-mkostemp64 = _libraries['/usr/lib/libmpg123.so'].mkostemp64
-mkostemp64.restype = c_int
-mkostemp64.argtypes = [STRING, c_int]
-mkostemps = _libraries['/usr/lib/libmpg123.so'].mkostemps
-mkostemps.restype = c_int
-mkostemps.argtypes = [STRING, c_int, c_int]
-mkostemps64 = _libraries['/usr/lib/libmpg123.so'].mkostemps64
-mkostemps64.restype = c_int
-mkostemps64.argtypes = [STRING, c_int, c_int]
-system = _libraries['/usr/lib/libmpg123.so'].system
-system.restype = c_int
-system.argtypes = [STRING]
-canonicalize_file_name = _libraries['/usr/lib/libmpg123.so'].canonicalize_file_name
-canonicalize_file_name.restype = STRING
-canonicalize_file_name.argtypes = [STRING]
 comparison_fn_t = __compar_fn_t
 __compar_d_fn_t = CFUNCTYPE(c_int, c_void_p, c_void_p, c_void_p)
-qsort = _libraries['/usr/lib/libmpg123.so'].qsort
-qsort.restype = None
-qsort.argtypes = [c_void_p, size_t, size_t, __compar_fn_t]
-qsort_r = _libraries['/usr/lib/libmpg123.so'].qsort_r
-qsort_r.restype = None
-qsort_r.argtypes = [c_void_p, size_t, size_t, __compar_d_fn_t, c_void_p]
-abs = _libraries['/usr/lib/libmpg123.so'].abs
-abs.restype = c_int
-abs.argtypes = [c_int]
-labs = _libraries['/usr/lib/libmpg123.so'].labs
-labs.restype = c_long
-labs.argtypes = [c_long]
-llabs = _libraries['/usr/lib/libmpg123.so'].llabs
-llabs.restype = c_longlong
-llabs.argtypes = [c_longlong]
-div = _libraries['/usr/lib/libmpg123.so'].div
-div.restype = div_t
-div.argtypes = [c_int, c_int]
-ldiv = _libraries['/usr/lib/libmpg123.so'].ldiv
-ldiv.restype = ldiv_t
-ldiv.argtypes = [c_long, c_long]
-lldiv = _libraries['/usr/lib/libmpg123.so'].lldiv
-lldiv.restype = lldiv_t
-lldiv.argtypes = [c_longlong, c_longlong]
-ecvt = _libraries['/usr/lib/libmpg123.so'].ecvt
-ecvt.restype = STRING
-ecvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]
-fcvt = _libraries['/usr/lib/libmpg123.so'].fcvt
-fcvt.restype = STRING
-fcvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]
-gcvt = _libraries['/usr/lib/libmpg123.so'].gcvt
-gcvt.restype = STRING
-gcvt.argtypes = [c_double, c_int, STRING]
-qecvt = _libraries['/usr/lib/libmpg123.so'].qecvt
-qecvt.restype = STRING
-qecvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]
-qfcvt = _libraries['/usr/lib/libmpg123.so'].qfcvt
-qfcvt.restype = STRING
-qfcvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]
-qgcvt = _libraries['/usr/lib/libmpg123.so'].qgcvt
-qgcvt.restype = STRING
-qgcvt.argtypes = [c_longdouble, c_int, STRING]
-ecvt_r = _libraries['/usr/lib/libmpg123.so'].ecvt_r
-ecvt_r.restype = c_int
-ecvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-fcvt_r = _libraries['/usr/lib/libmpg123.so'].fcvt_r
-fcvt_r.restype = c_int
-fcvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-qecvt_r = _libraries['/usr/lib/libmpg123.so'].qecvt_r
-qecvt_r.restype = c_int
-qecvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-qfcvt_r = _libraries['/usr/lib/libmpg123.so'].qfcvt_r
-qfcvt_r.restype = c_int
-qfcvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]
-mblen = _libraries['/usr/lib/libmpg123.so'].mblen
-mblen.restype = c_int
-mblen.argtypes = [STRING, size_t]
-mbtowc = _libraries['/usr/lib/libmpg123.so'].mbtowc
-mbtowc.restype = c_int
-mbtowc.argtypes = [WSTRING, STRING, size_t]
-rpmatch = _libraries['/usr/lib/libmpg123.so'].rpmatch
-rpmatch.restype = c_int
-rpmatch.argtypes = [STRING]
-getsubopt = _libraries['/usr/lib/libmpg123.so'].getsubopt
-getsubopt.restype = c_int
-getsubopt.argtypes = [POINTER(STRING), POINTER(STRING), POINTER(STRING)]
-posix_openpt = _libraries['/usr/lib/libmpg123.so'].posix_openpt
-posix_openpt.restype = c_int
-posix_openpt.argtypes = [c_int]
-grantpt = _libraries['/usr/lib/libmpg123.so'].grantpt
-grantpt.restype = c_int
-grantpt.argtypes = [c_int]
-unlockpt = _libraries['/usr/lib/libmpg123.so'].unlockpt
-unlockpt.restype = c_int
-unlockpt.argtypes = [c_int]
-ptsname = _libraries['/usr/lib/libmpg123.so'].ptsname
-ptsname.restype = STRING
-ptsname.argtypes = [c_int]
-getpt = _libraries['/usr/lib/libmpg123.so'].getpt
-getpt.restype = c_int
-getpt.argtypes = []
-getloadavg = _libraries['/usr/lib/libmpg123.so'].getloadavg
-getloadavg.restype = c_int
-getloadavg.argtypes = [POINTER(c_double), c_int]
-sigset_t = __sigset_t
 __fd_mask = c_long
-class fd_set(Structure):
-    pass
-fd_set._fields_ = [
-    ('fds_bits', __fd_mask * 16),
-]
 fd_mask = __fd_mask
-select = _libraries['/usr/lib/libmpg123.so'].select
-select.restype = c_int
-select.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timeval)]
-class timespec(Structure):
-    pass
-timespec._fields_ = [
-    ('tv_sec', __time_t),
-    ('tv_nsec', __syscall_slong_t),
-]
-pselect = _libraries['/usr/lib/libmpg123.so'].pselect
-pselect.restype = c_int
-pselect.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timespec), POINTER(__sigset_t)]
-gnu_dev_major = _libraries['/usr/lib/libmpg123.so'].gnu_dev_major
-gnu_dev_major.restype = c_uint
-gnu_dev_major.argtypes = [c_ulonglong]
-gnu_dev_minor = _libraries['/usr/lib/libmpg123.so'].gnu_dev_minor
-gnu_dev_minor.restype = c_uint
-gnu_dev_minor.argtypes = [c_ulonglong]
-gnu_dev_makedev = _libraries['/usr/lib/libmpg123.so'].gnu_dev_makedev
-gnu_dev_makedev.restype = c_ulonglong
-gnu_dev_makedev.argtypes = [c_uint, c_uint]
 u_char = __u_char
 u_short = __u_short
 u_int = __u_int
 u_long = __u_long
 quad_t = __quad_t
 u_quad_t = __u_quad_t
-fsid_t = __fsid_t
 loff_t = __loff_t
 ino_t = __ino_t
 ino64_t = __ino64_t
@@ -1511,18 +575,6 @@ clock_t = __clock_t
 time_t = __time_t
 clockid_t = __clockid_t
 timer_t = __timer_t
-class __locale_data(Structure):
-    pass
-__locale_struct._fields_ = [
-    ('__locales', POINTER(__locale_data) * 13),
-    ('__ctype_b', POINTER(c_ushort)),
-    ('__ctype_tolower', POINTER(c_int)),
-    ('__ctype_toupper', POINTER(c_int)),
-    ('__names', STRING * 13),
-]
-__locale_data._fields_ = [
-]
-locale_t = __locale_t
 __all__ = ['__uint16_t', 'MPG123_NO_8BIT', '__glibc_unlikely',
            'wctomb', 'mpg123_text_icy', 'mkstemps', 'mkostemp64',
            '__off64_t', '_ATFILE_SOURCE', '__WCOREFLAG',
@@ -1772,3 +824,1420 @@ __all__ = ['__uint16_t', 'MPG123_NO_8BIT', '__glibc_unlikely',
            'locale_t', '__socklen_t', '__USE_ISOC11', 'EXIT_FAILURE',
            'mpg123_replace_reader_handle', 'mpg123_new',
            'mpg123_feature_set', 'NFDBITS']
+
+
+# The base class, lazy names used and code that finishes defining each
+# lazy name.
+_definitions = {
+    'minor': (None, ('gnu_dev_minor',),
+        'def minor(dev): return gnu_dev_minor (dev) # macro'
+        ),
+    'major': (None, ('gnu_dev_major',),
+        'def major(dev): return gnu_dev_major (dev) # macro'
+        ),
+    'makedev': (None, ('gnu_dev_makedev',),
+        'def makedev(maj,min): return gnu_dev_makedev (maj, min) # macro'
+        ),
+    'pthread_attr_t': ('Union', (),
+        'pthread_attr_t._fields_ = [\n'
+        "    ('__size', c_char * 56),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    '__pthread_internal_list': ('Structure', (),
+        '__pthread_internal_list._fields_ = [\n'
+        "    ('__prev', POINTER(__pthread_internal_list)),\n"
+        "    ('__next', POINTER(__pthread_internal_list)),\n"
+        ']'
+        ),
+    '__pthread_list_t': (None, ('__pthread_internal_list',),
+        '__pthread_list_t = __pthread_internal_list'
+        ),
+    '__pthread_mutex_s': ('Structure', ('__pthread_list_t',),
+        '__pthread_mutex_s._fields_ = [\n'
+        "    ('__lock', c_int),\n"
+        "    ('__count', c_uint),\n"
+        "    ('__owner', c_int),\n"
+        "    ('__nusers', c_uint),\n"
+        "    ('__kind', c_int),\n"
+        "    ('__spins', c_short),\n"
+        "    ('__elision', c_short),\n"
+        "    ('__list', __pthread_list_t),\n"
+        ']'
+        ),
+    'pthread_mutex_t': ('Union', ('__pthread_mutex_s',),
+        'pthread_mutex_t._fields_ = [\n'
+        "    ('__data', __pthread_mutex_s),\n"
+        "    ('__size', c_char * 40),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_mutexattr_t': ('Union', (),
+        'pthread_mutexattr_t._fields_ = [\n'
+        "    ('__size', c_char * 4),\n"
+        "    ('__align', c_int),\n"
+        ']'
+        ),
+    'N14pthread_cond_t4DOT_11E': ('Structure', (),
+        'N14pthread_cond_t4DOT_11E._fields_ = [\n'
+        "    ('__lock', c_int),\n"
+        "    ('__futex', c_uint),\n"
+        "    ('__total_seq', c_ulonglong),\n"
+        "    ('__wakeup_seq', c_ulonglong),\n"
+        "    ('__woken_seq', c_ulonglong),\n"
+        "    ('__mutex', c_void_p),\n"
+        "    ('__nwaiters', c_uint),\n"
+        "    ('__broadcast_seq', c_uint),\n"
+        ']'
+        ),
+    'pthread_cond_t': ('Union', ('N14pthread_cond_t4DOT_11E',),
+        'pthread_cond_t._fields_ = [\n'
+        "    ('__data', N14pthread_cond_t4DOT_11E),\n"
+        "    ('__size', c_char * 48),\n"
+        "    ('__align', c_longlong),\n"
+        ']'
+        ),
+    'pthread_condattr_t': ('Union', (),
+        'pthread_condattr_t._fields_ = [\n'
+        "    ('__size', c_char * 4),\n"
+        "    ('__align', c_int),\n"
+        ']'
+        ),
+    'N16pthread_rwlock_t4DOT_14E': ('Structure', (),
+        'N16pthread_rwlock_t4DOT_14E._fields_ = [\n'
+        "    ('__lock', c_int),\n"
+        "    ('__nr_readers', c_uint),\n"
+        "    ('__readers_wakeup', c_uint),\n"
+        "    ('__writer_wakeup', c_uint),\n"
+        "    ('__nr_readers_queued', c_uint),\n"
+        "    ('__nr_writers_queued', c_uint),\n"
+        "    ('__writer', c_int),\n"
+        "    ('__shared', c_int),\n"
+        "    ('__pad1', c_ulong),\n"
+        "    ('__pad2', c_ulong),\n"
+        "    ('__flags', c_uint),\n"
+        ']'
+        ),
+    'pthread_rwlock_t': ('Union', ('N16pthread_rwlock_t4DOT_14E',),
+        'pthread_rwlock_t._fields_ = [\n'
+        "    ('__data', N16pthread_rwlock_t4DOT_14E),\n"
+        "    ('__size', c_char * 56),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_rwlockattr_t': ('Union', (),
+        'pthread_rwlockattr_t._fields_ = [\n'
+        "    ('__size', c_char * 8),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_barrier_t': ('Union', (),
+        'pthread_barrier_t._fields_ = [\n'
+        "    ('__size', c_char * 32),\n"
+        "    ('__align', c_long),\n"
+        ']'
+        ),
+    'pthread_barrierattr_t': ('Union', (),
+        'pthread_barrierattr_t._fields_ = [\n'
+        "    ('__size', c_char * 4),\n"
+        "    ('__align', c_int),\n"
+        ']'
+        ),
+    '__fdelt_chk': (None, (),
+        "__fdelt_chk = _libraries['/usr/lib/libmpg123.so'].__fdelt_chk\n"
+        '__fdelt_chk.restype = c_long\n'
+        '__fdelt_chk.argtypes = [c_long]'
+        ),
+    '__fdelt_warn': (None, (),
+        "__fdelt_warn = _libraries['/usr/lib/libmpg123.so'].__fdelt_warn\n"
+        '__fdelt_warn.restype = c_long\n'
+        '__fdelt_warn.argtypes = [c_long]'
+        ),
+    '__sigset_t': ('Structure', (),
+        '__sigset_t._fields_ = [\n'
+        "    ('__val', c_ulong * 16),\n"
+        ']'
+        ),
+    'bsearch': (None, (),
+        "bsearch = _libraries['/usr/lib/libmpg123.so'].bsearch\n"
+        'bsearch.restype = c_void_p\n'
+        'bsearch.argtypes = [c_void_p, c_void_p, size_t, size_t, __compar_fn_t]'
+        ),
+    'atof': (None, (),
+        "atof = _libraries['/usr/lib/libmpg123.so'].atof\n"
+        'atof.restype = c_double\n'
+        'atof.argtypes = [STRING]'
+        ),
+    '__realpath_chk': (None, (),
+        "__realpath_chk = _libraries['/usr/lib/libmpg123.so'].__realpath_chk\n"
+        '__realpath_chk.restype = STRING\n'
+        '__realpath_chk.argtypes = [STRING, STRING, size_t]'
+        ),
+    'realpath': (None, (),
+        "realpath = _libraries['/usr/lib/libmpg123.so'].realpath\n"
+        'realpath.restype = STRING\n'
+        'realpath.argtypes = [STRING, STRING]'
+        ),
+    '__ptsname_r_chk': (None, (),
+        "__ptsname_r_chk = _libraries['/usr/lib/libmpg123.so'].__ptsname_r_chk\n"
+        '__ptsname_r_chk.restype = c_int\n'
+        '__ptsname_r_chk.argtypes = [c_int, STRING, size_t, size_t]'
+        ),
+    'ptsname_r': (None, (),
+        "ptsname_r = _libraries['/usr/lib/libmpg123.so'].ptsname_r\n"
+        'ptsname_r.restype = c_int\n'
+        'ptsname_r.argtypes = [c_int, STRING, size_t]'
+        ),
+    '__wctomb_chk': (None, (),
+        "__wctomb_chk = _libraries['/usr/lib/libmpg123.so'].__wctomb_chk\n"
+        '__wctomb_chk.restype = c_int\n'
+        '__wctomb_chk.argtypes = [STRING, c_wchar, size_t]'
+        ),
+    'wctomb': (None, (),
+        "wctomb = _libraries['/usr/lib/libmpg123.so'].wctomb\n"
+        'wctomb.restype = c_int\n'
+        'wctomb.argtypes = [STRING, c_wchar]'
+        ),
+    '__mbstowcs_chk': (None, (),
+        "__mbstowcs_chk = _libraries['/usr/lib/libmpg123.so'].__mbstowcs_chk\n"
+        '__mbstowcs_chk.restype = size_t\n'
+        '__mbstowcs_chk.argtypes = [WSTRING, STRING, size_t, size_t]'
+        ),
+    'mbstowcs': (None, (),
+        "mbstowcs = _libraries['/usr/lib/libmpg123.so'].mbstowcs\n"
+        'mbstowcs.restype = size_t\n'
+        'mbstowcs.argtypes = [WSTRING, STRING, size_t]'
+        ),
+    '__wcstombs_chk': (None, (),
+        "__wcstombs_chk = _libraries['/usr/lib/libmpg123.so'].__wcstombs_chk\n"
+        '__wcstombs_chk.restype = size_t\n'
+        '__wcstombs_chk.argtypes = [STRING, WSTRING, size_t, size_t]'
+        ),
+    'wcstombs': (None, (),
+        "wcstombs = _libraries['/usr/lib/libmpg123.so'].wcstombs\n"
+        'wcstombs.restype = size_t\n'
+        'wcstombs.argtypes = [STRING, WSTRING, size_t]'
+        ),
+    'timeval': ('Structure', (),
+        'timeval._fields_ = [\n'
+        "    ('tv_sec', __time_t),\n"
+        "    ('tv_usec', __suseconds_t),\n"
+        ']'
+        ),
+    '__fsid_t': ('Structure', (),
+        '__fsid_t._fields_ = [\n'
+        "    ('__val', c_int * 2),\n"
+        ']'
+        ),
+    'wait': ('Union', ('N4wait3DOT_1E', 'N4wait3DOT_2E'),
+        'wait._fields_ = [\n'
+        "    ('w_status', c_int),\n"
+        "    ('__wait_terminated', N4wait3DOT_1E),\n"
+        "    ('__wait_stopped', N4wait3DOT_2E),\n"
+        ']'
+        ),
+    'N4wait3DOT_1E': ('Structure', (),
+        'N4wait3DOT_1E._fields_ = [\n'
+        "    ('__w_termsig', c_uint, 7),\n"
+        "    ('__w_coredump', c_uint, 1),\n"
+        "    ('__w_retcode', c_uint, 8),\n"
+        "    ('', c_uint, 16),\n"
+        ']'
+        ),
+    'N4wait3DOT_2E': ('Structure', (),
+        'N4wait3DOT_2E._fields_ = [\n'
+        "    ('__w_stopval', c_uint, 8),\n"
+        "    ('__w_stopsig', c_uint, 8),\n"
+        "    ('', c_uint, 16),\n"
+        ']'
+        ),
+    'mpg123_handle_struct': ('Structure', (),
+        'mpg123_handle_struct._fields_ = [\n'
+        ']'
+        ),
+    'mpg123_handle': (None, ('mpg123_handle_struct',),
+        'mpg123_handle = mpg123_handle_struct'
+        ),
+    'mpg123_init': (None, (),
+        "mpg123_init = _libraries['/usr/lib/libmpg123.so'].mpg123_init\n"
+        'mpg123_init.restype = c_int\n'
+        'mpg123_init.argtypes = []'
+        ),
+    'mpg123_exit': (None, (),
+        "mpg123_exit = _libraries['/usr/lib/libmpg123.so'].mpg123_exit\n"
+        'mpg123_exit.restype = None\n'
+        'mpg123_exit.argtypes = []'
+        ),
+    'mpg123_new': (None, ('mpg123_handle',),
+        "mpg123_new = _libraries['/usr/lib/libmpg123.so'].mpg123_new\n"
+        'mpg123_new.restype = POINTER(mpg123_handle)\n'
+        'mpg123_new.argtypes = [STRING, POINTER(c_int)]'
+        ),
+    'mpg123_delete': (None, ('mpg123_handle',),
+        "mpg123_delete = _libraries['/usr/lib/libmpg123.so'].mpg123_delete\n"
+        'mpg123_delete.restype = None\n'
+        'mpg123_delete.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_param': (None, ('mpg123_handle',),
+        "mpg123_param = _libraries['/usr/lib/libmpg123.so'].mpg123_param\n"
+        'mpg123_param.restype = c_int\n'
+        'mpg123_param.argtypes = [POINTER(mpg123_handle), mpg123_parms, c_long, c_double]'
+        ),
+    'mpg123_getparam': (None, ('mpg123_handle',),
+        "mpg123_getparam = _libraries['/usr/lib/libmpg123.so'].mpg123_getparam\n"
+        'mpg123_getparam.restype = c_int\n'
+        'mpg123_getparam.argtypes = [POINTER(mpg123_handle), mpg123_parms, POINTER(c_long), POINTER(c_double)]'
+        ),
+    'mpg123_feature': (None, (),
+        "mpg123_feature = _libraries['/usr/lib/libmpg123.so'].mpg123_feature\n"
+        'mpg123_feature.restype = c_int\n'
+        'mpg123_feature.argtypes = [mpg123_feature_set]'
+        ),
+    'mpg123_plain_strerror': (None, (),
+        "mpg123_plain_strerror = _libraries['/usr/lib/libmpg123.so'].mpg123_plain_strerror\n"
+        'mpg123_plain_strerror.restype = STRING\n'
+        'mpg123_plain_strerror.argtypes = [c_int]'
+        ),
+    'mpg123_strerror': (None, ('mpg123_handle',),
+        "mpg123_strerror = _libraries['/usr/lib/libmpg123.so'].mpg123_strerror\n"
+        'mpg123_strerror.restype = STRING\n'
+        'mpg123_strerror.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_errcode': (None, ('mpg123_handle',),
+        "mpg123_errcode = _libraries['/usr/lib/libmpg123.so'].mpg123_errcode\n"
+        'mpg123_errcode.restype = c_int\n'
+        'mpg123_errcode.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_decoders': (None, (),
+        "mpg123_decoders = _libraries['/usr/lib/libmpg123.so'].mpg123_decoders\n"
+        'mpg123_decoders.restype = POINTER(STRING)\n'
+        'mpg123_decoders.argtypes = []'
+        ),
+    'mpg123_supported_decoders': (None, (),
+        "mpg123_supported_decoders = _libraries['/usr/lib/libmpg123.so'].mpg123_supported_decoders\n"
+        'mpg123_supported_decoders.restype = POINTER(STRING)\n'
+        'mpg123_supported_decoders.argtypes = []'
+        ),
+    'mpg123_decoder': (None, ('mpg123_handle',),
+        "mpg123_decoder = _libraries['/usr/lib/libmpg123.so'].mpg123_decoder\n"
+        'mpg123_decoder.restype = c_int\n'
+        'mpg123_decoder.argtypes = [POINTER(mpg123_handle), STRING]'
+        ),
+    'mpg123_current_decoder': (None, ('mpg123_handle',),
+        "mpg123_current_decoder = _libraries['/usr/lib/libmpg123.so'].mpg123_current_decoder\n"
+        'mpg123_current_decoder.restype = STRING\n'
+        'mpg123_current_decoder.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_rates': (None, (),
+        "mpg123_rates = _libraries['/usr/lib/libmpg123.so'].mpg123_rates\n"
+        'mpg123_rates.restype = None\n'
+        'mpg123_rates.argtypes = [POINTER(POINTER(c_long)), POINTER(size_t)]'
+        ),
+    'mpg123_encodings': (None, (),
+        "mpg123_encodings = _libraries['/usr/lib/libmpg123.so'].mpg123_encodings\n"
+        'mpg123_encodings.restype = None\n'
+        'mpg123_encodings.argtypes = [POINTER(POINTER(c_int)), POINTER(size_t)]'
+        ),
+    'mpg123_encsize': (None, (),
+        "mpg123_encsize = _libraries['/usr/lib/libmpg123.so'].mpg123_encsize\n"
+        'mpg123_encsize.restype = c_int\n'
+        'mpg123_encsize.argtypes = [c_int]'
+        ),
+    'mpg123_format_none': (None, ('mpg123_handle',),
+        "mpg123_format_none = _libraries['/usr/lib/libmpg123.so'].mpg123_format_none\n"
+        'mpg123_format_none.restype = c_int\n'
+        'mpg123_format_none.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_format_all': (None, ('mpg123_handle',),
+        "mpg123_format_all = _libraries['/usr/lib/libmpg123.so'].mpg123_format_all\n"
+        'mpg123_format_all.restype = c_int\n'
+        'mpg123_format_all.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_format': (None, ('mpg123_handle',),
+        "mpg123_format = _libraries['/usr/lib/libmpg123.so'].mpg123_format\n"
+        'mpg123_format.restype = c_int\n'
+        'mpg123_format.argtypes = [POINTER(mpg123_handle), c_long, c_int, c_int]'
+        ),
+    'mpg123_format_support': (None, ('mpg123_handle',),
+        "mpg123_format_support = _libraries['/usr/lib/libmpg123.so'].mpg123_format_support\n"
+        'mpg123_format_support.restype = c_int\n'
+        'mpg123_format_support.argtypes = [POINTER(mpg123_handle), c_long, c_int]'
+        ),
+    'mpg123_getformat': (None, ('mpg123_handle',),
+        "mpg123_getformat = _libraries['/usr/lib/libmpg123.so'].mpg123_getformat\n"
+        'mpg123_getformat.restype = c_int\n'
+        'mpg123_getformat.argtypes = [POINTER(mpg123_handle), POINTER(c_long), POINTER(c_int), POINTER(c_int)]'
+        ),
+    'mpg123_open': (None, ('mpg123_handle',),
+        "mpg123_open = _libraries['/usr/lib/libmpg123.so'].mpg123_open\n"
+        'mpg123_open.restype = c_int\n'
+        'mpg123_open.argtypes = [POINTER(mpg123_handle), STRING]'
+        ),
+    'mpg123_open_fd': (None, ('mpg123_handle',),
+        "mpg123_open_fd = _libraries['/usr/lib/libmpg123.so'].mpg123_open_fd\n"
+        'mpg123_open_fd.restype = c_int\n'
+        'mpg123_open_fd.argtypes = [POINTER(mpg123_handle), c_int]'
+        ),
+    'mpg123_open_handle': (None, ('mpg123_handle',),
+        "mpg123_open_handle = _libraries['/usr/lib/libmpg123.so'].mpg123_open_handle\n"
+        'mpg123_open_handle.restype = c_int\n'
+        'mpg123_open_handle.argtypes = [POINTER(mpg123_handle), c_void_p]'
+        ),
+    'mpg123_open_feed': (None, ('mpg123_handle',),
+        "mpg123_open_feed = _libraries['/usr/lib/libmpg123.so'].mpg123_open_feed\n"
+        'mpg123_open_feed.restype = c_int\n'
+        'mpg123_open_feed.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_close': (None, ('mpg123_handle',),
+        "mpg123_close = _libraries['/usr/lib/libmpg123.so'].mpg123_close\n"
+        'mpg123_close.restype = c_int\n'
+        'mpg123_close.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_read': (None, ('mpg123_handle',),
+        "mpg123_read = _libraries['/usr/lib/libmpg123.so'].mpg123_read\n"
+        'mpg123_read.restype = c_int\n'
+        'mpg123_read.argtypes = [POINTER(mpg123_handle), POINTER(c_ubyte), size_t, POINTER(size_t)]'
+        ),
+    'mpg123_feed': (None, ('mpg123_handle',),
+        "mpg123_feed = _libraries['/usr/lib/libmpg123.so'].mpg123_feed\n"
+        'mpg123_feed.restype = c_int\n'
+        'mpg123_feed.argtypes = [POINTER(mpg123_handle), POINTER(c_ubyte), size_t]'
+        ),
+    'mpg123_decode': (None, ('mpg123_handle',),
+        "mpg123_decode = _libraries['/usr/lib/libmpg123.so'].mpg123_decode\n"
+        'mpg123_decode.restype = c_int\n'
+        'mpg123_decode.argtypes = [POINTER(mpg123_handle), POINTER(c_ubyte), size_t, POINTER(c_ubyte), size_t, POINTER(size_t)]'
+        ),
+    'mpg123_decode_frame': (None, ('mpg123_handle',),
+        "mpg123_decode_frame = _libraries['/usr/lib/libmpg123.so'].mpg123_decode_frame\n"
+        'mpg123_decode_frame.restype = c_int\n'
+        'mpg123_decode_frame.argtypes = [POINTER(mpg123_handle), POINTER(off_t), POINTER(POINTER(c_ubyte)), POINTER(size_t)]'
+        ),
+    'mpg123_framebyframe_decode': (None, ('mpg123_handle',),
+        "mpg123_framebyframe_decode = _libraries['/usr/lib/libmpg123.so'].mpg123_framebyframe_decode\n"
+        'mpg123_framebyframe_decode.restype = c_int\n'
+        'mpg123_framebyframe_decode.argtypes = [POINTER(mpg123_handle), POINTER(off_t), POINTER(POINTER(c_ubyte)), POINTER(size_t)]'
+        ),
+    'mpg123_framebyframe_next': (None, ('mpg123_handle',),
+        "mpg123_framebyframe_next = _libraries['/usr/lib/libmpg123.so'].mpg123_framebyframe_next\n"
+        'mpg123_framebyframe_next.restype = c_int\n'
+        'mpg123_framebyframe_next.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_framedata': (None, ('mpg123_handle',),
+        "mpg123_framedata = _libraries['/usr/lib/libmpg123.so'].mpg123_framedata\n"
+        'mpg123_framedata.restype = c_int\n'
+        'mpg123_framedata.argtypes = [POINTER(mpg123_handle), POINTER(c_ulong), POINTER(POINTER(c_ubyte)), POINTER(size_t)]'
+        ),
+    'mpg123_framepos': (None, ('mpg123_handle',),
+        "mpg123_framepos = _libraries['/usr/lib/libmpg123.so'].mpg123_framepos\n"
+        'mpg123_framepos.restype = off_t\n'
+        'mpg123_framepos.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_tell': (None, ('mpg123_handle',),
+        "mpg123_tell = _libraries['/usr/lib/libmpg123.so'].mpg123_tell\n"
+        'mpg123_tell.restype = off_t\n'
+        'mpg123_tell.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_tellframe': (None, ('mpg123_handle',),
+        "mpg123_tellframe = _libraries['/usr/lib/libmpg123.so'].mpg123_tellframe\n"
+        'mpg123_tellframe.restype = off_t\n'
+        'mpg123_tellframe.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_tell_stream': (None, ('mpg123_handle',),
+        "mpg123_tell_stream = _libraries['/usr/lib/libmpg123.so'].mpg123_tell_stream\n"
+        'mpg123_tell_stream.restype = off_t\n'
+        'mpg123_tell_stream.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_seek': (None, ('mpg123_handle',),
+        "mpg123_seek = _libraries['/usr/lib/libmpg123.so'].mpg123_seek\n"
+        'mpg123_seek.restype = off_t\n'
+        'mpg123_seek.argtypes = [POINTER(mpg123_handle), off_t, c_int]'
+        ),
+    'mpg123_feedseek': (None, ('mpg123_handle',),
+        "mpg123_feedseek = _libraries['/usr/lib/libmpg123.so'].mpg123_feedseek\n"
+        'mpg123_feedseek.restype = off_t\n'
+        'mpg123_feedseek.argtypes = [POINTER(mpg123_handle), off_t, c_int, POINTER(off_t)]'
+        ),
+    'mpg123_seek_frame': (None, ('mpg123_handle',),
+        "mpg123_seek_frame = _libraries['/usr/lib/libmpg123.so'].mpg123_seek_frame\n"
+        'mpg123_seek_frame.restype = off_t\n'
+        'mpg123_seek_frame.argtypes = [POINTER(mpg123_handle), off_t, c_int]'
+        ),
+    'mpg123_timeframe': (None, ('mpg123_handle',),
+        "mpg123_timeframe = _libraries['/usr/lib/libmpg123.so'].mpg123_timeframe\n"
+        'mpg123_timeframe.restype = off_t\n'
+        'mpg123_timeframe.argtypes = [POINTER(mpg123_handle), c_double]'
+        ),
+    'mpg123_index': (None, ('mpg123_handle',),
+        "mpg123_index = _libraries['/usr/lib/libmpg123.so'].mpg123_index\n"
+        'mpg123_index.restype = c_int\n'
+        'mpg123_index.argtypes = [POINTER(mpg123_handle), POINTER(POINTER(off_t)), POINTER(off_t), POINTER(size_t)]'
+        ),
+    'mpg123_set_index': (None, ('mpg123_handle',),
+        "mpg123_set_index = _libraries['/usr/lib/libmpg123.so'].mpg123_set_index\n"
+        'mpg123_set_index.restype = c_int\n'
+        'mpg123_set_index.argtypes = [POINTER(mpg123_handle), POINTER(off_t), off_t, size_t]'
+        ),
+    'mpg123_position': (None, ('mpg123_handle',),
+        "mpg123_position = _libraries['/usr/lib/libmpg123.so'].mpg123_position\n"
+        'mpg123_position.restype = c_int\n'
+        'mpg123_position.argtypes = [POINTER(mpg123_handle), off_t, off_t, POINTER(off_t), POINTER(off_t), POINTER(c_double), POINTER(c_double)]'
+        ),
+    'mpg123_eq': (None, ('mpg123_handle',),
+        "mpg123_eq = _libraries['/usr/lib/libmpg123.so'].mpg123_eq\n"
+        'mpg123_eq.restype = c_int\n'
+        'mpg123_eq.argtypes = [POINTER(mpg123_handle), mpg123_channels, c_int, c_double]'
+        ),
+    'mpg123_geteq': (None, ('mpg123_handle',),
+        "mpg123_geteq = _libraries['/usr/lib/libmpg123.so'].mpg123_geteq\n"
+        'mpg123_geteq.restype = c_double\n'
+        'mpg123_geteq.argtypes = [POINTER(mpg123_handle), mpg123_channels, c_int]'
+        ),
+    'mpg123_reset_eq': (None, ('mpg123_handle',),
+        "mpg123_reset_eq = _libraries['/usr/lib/libmpg123.so'].mpg123_reset_eq\n"
+        'mpg123_reset_eq.restype = c_int\n'
+        'mpg123_reset_eq.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_volume': (None, ('mpg123_handle',),
+        "mpg123_volume = _libraries['/usr/lib/libmpg123.so'].mpg123_volume\n"
+        'mpg123_volume.restype = c_int\n'
+        'mpg123_volume.argtypes = [POINTER(mpg123_handle), c_double]'
+        ),
+    'mpg123_volume_change': (None, ('mpg123_handle',),
+        "mpg123_volume_change = _libraries['/usr/lib/libmpg123.so'].mpg123_volume_change\n"
+        'mpg123_volume_change.restype = c_int\n'
+        'mpg123_volume_change.argtypes = [POINTER(mpg123_handle), c_double]'
+        ),
+    'mpg123_getvolume': (None, ('mpg123_handle',),
+        "mpg123_getvolume = _libraries['/usr/lib/libmpg123.so'].mpg123_getvolume\n"
+        'mpg123_getvolume.restype = c_int\n'
+        'mpg123_getvolume.argtypes = [POINTER(mpg123_handle), POINTER(c_double), POINTER(c_double), POINTER(c_double)]'
+        ),
+    'mpg123_frameinfo': ('Structure', (),
+        'mpg123_frameinfo._fields_ = [\n'
+        "    ('version', mpg123_version),\n"
+        "    ('layer', c_int),\n"
+        "    ('rate', c_long),\n"
+        "    ('mode', mpg123_mode),\n"
+        "    ('mode_ext', c_int),\n"
+        "    ('framesize', c_int),\n"
+        "    ('flags', mpg123_flags),\n"
+        "    ('emphasis', c_int),\n"
+        "    ('bitrate', c_int),\n"
+        "    ('abr_rate', c_int),\n"
+        "    ('vbr', mpg123_vbr),\n"
+        ']'
+        ),
+    'mpg123_info': (None, ('mpg123_frameinfo', 'mpg123_handle'),
+        "mpg123_info = _libraries['/usr/lib/libmpg123.so'].mpg123_info\n"
+        'mpg123_info.restype = c_int\n'
+        'mpg123_info.argtypes = [POINTER(mpg123_handle), POINTER(mpg123_frameinfo)]'
+        ),
+    'mpg123_safe_buffer': (None, (),
+        "mpg123_safe_buffer = _libraries['/usr/lib/libmpg123.so'].mpg123_safe_buffer\n"
+        'mpg123_safe_buffer.restype = size_t\n'
+        'mpg123_safe_buffer.argtypes = []'
+        ),
+    'mpg123_scan': (None, ('mpg123_handle',),
+        "mpg123_scan = _libraries['/usr/lib/libmpg123.so'].mpg123_scan\n"
+        'mpg123_scan.restype = c_int\n'
+        'mpg123_scan.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_length': (None, ('mpg123_handle',),
+        "mpg123_length = _libraries['/usr/lib/libmpg123.so'].mpg123_length\n"
+        'mpg123_length.restype = off_t\n'
+        'mpg123_length.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_set_filesize': (None, ('mpg123_handle',),
+        "mpg123_set_filesize = _libraries['/usr/lib/libmpg123.so'].mpg123_set_filesize\n"
+        'mpg123_set_filesize.restype = c_int\n'
+        'mpg123_set_filesize.argtypes = [POINTER(mpg123_handle), off_t]'
+        ),
+    'mpg123_tpf': (None, ('mpg123_handle',),
+        "mpg123_tpf = _libraries['/usr/lib/libmpg123.so'].mpg123_tpf\n"
+        'mpg123_tpf.restype = c_double\n'
+        'mpg123_tpf.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_spf': (None, ('mpg123_handle',),
+        "mpg123_spf = _libraries['/usr/lib/libmpg123.so'].mpg123_spf\n"
+        'mpg123_spf.restype = c_int\n'
+        'mpg123_spf.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_clip': (None, ('mpg123_handle',),
+        "mpg123_clip = _libraries['/usr/lib/libmpg123.so'].mpg123_clip\n"
+        'mpg123_clip.restype = c_long\n'
+        'mpg123_clip.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_getstate': (None, ('mpg123_handle',),
+        "mpg123_getstate = _libraries['/usr/lib/libmpg123.so'].mpg123_getstate\n"
+        'mpg123_getstate.restype = c_int\n'
+        'mpg123_getstate.argtypes = [POINTER(mpg123_handle), mpg123_state, POINTER(c_long), POINTER(c_double)]'
+        ),
+    'mpg123_string': ('Structure', (),
+        'mpg123_string._fields_ = [\n'
+        "    ('p', STRING),\n"
+        "    ('size', size_t),\n"
+        "    ('fill', size_t),\n"
+        ']'
+        ),
+    'mpg123_init_string': (None, ('mpg123_string',),
+        "mpg123_init_string = _libraries['/usr/lib/libmpg123.so'].mpg123_init_string\n"
+        'mpg123_init_string.restype = None\n'
+        'mpg123_init_string.argtypes = [POINTER(mpg123_string)]'
+        ),
+    'mpg123_free_string': (None, ('mpg123_string',),
+        "mpg123_free_string = _libraries['/usr/lib/libmpg123.so'].mpg123_free_string\n"
+        'mpg123_free_string.restype = None\n'
+        'mpg123_free_string.argtypes = [POINTER(mpg123_string)]'
+        ),
+    'mpg123_resize_string': (None, ('mpg123_string',),
+        "mpg123_resize_string = _libraries['/usr/lib/libmpg123.so'].mpg123_resize_string\n"
+        'mpg123_resize_string.restype = c_int\n'
+        'mpg123_resize_string.argtypes = [POINTER(mpg123_string), size_t]'
+        ),
+    'mpg123_grow_string': (None, ('mpg123_string',),
+        "mpg123_grow_string = _libraries['/usr/lib/libmpg123.so'].mpg123_grow_string\n"
+        'mpg123_grow_string.restype = c_int\n'
+        'mpg123_grow_string.argtypes = [POINTER(mpg123_string), size_t]'
+        ),
+    'mpg123_copy_string': (None, ('mpg123_string',),
+        "mpg123_copy_string = _libraries['/usr/lib/libmpg123.so'].mpg123_copy_string\n"
+        'mpg123_copy_string.restype = c_int\n'
+        'mpg123_copy_string.argtypes = [POINTER(mpg123_string), POINTER(mpg123_string)]'
+        ),
+    'mpg123_add_string': (None, ('mpg123_string',),
+        "mpg123_add_string = _libraries['/usr/lib/libmpg123.so'].mpg123_add_string\n"
+        'mpg123_add_string.restype = c_int\n'
+        'mpg123_add_string.argtypes = [POINTER(mpg123_string), STRING]'
+        ),
+    'mpg123_add_substring': (None, ('mpg123_string',),
+        "mpg123_add_substring = _libraries['/usr/lib/libmpg123.so'].mpg123_add_substring\n"
+        'mpg123_add_substring.restype = c_int\n'
+        'mpg123_add_substring.argtypes = [POINTER(mpg123_string), STRING, size_t, size_t]'
+        ),
+    'mpg123_set_string': (None, ('mpg123_string',),
+        "mpg123_set_string = _libraries['/usr/lib/libmpg123.so'].mpg123_set_string\n"
+        'mpg123_set_string.restype = c_int\n'
+        'mpg123_set_string.argtypes = [POINTER(mpg123_string), STRING]'
+        ),
+    'mpg123_set_substring': (None, ('mpg123_string',),
+        "mpg123_set_substring = _libraries['/usr/lib/libmpg123.so'].mpg123_set_substring\n"
+        'mpg123_set_substring.restype = c_int\n'
+        'mpg123_set_substring.argtypes = [POINTER(mpg123_string), STRING, size_t, size_t]'
+        ),
+    'mpg123_strlen': (None, ('mpg123_string',),
+        "mpg123_strlen = _libraries['/usr/lib/libmpg123.so'].mpg123_strlen\n"
+        'mpg123_strlen.restype = size_t\n'
+        'mpg123_strlen.argtypes = [POINTER(mpg123_string), c_int]'
+        ),
+    'mpg123_chomp_string': (None, ('mpg123_string',),
+        "mpg123_chomp_string = _libraries['/usr/lib/libmpg123.so'].mpg123_chomp_string\n"
+        'mpg123_chomp_string.restype = c_int\n'
+        'mpg123_chomp_string.argtypes = [POINTER(mpg123_string)]'
+        ),
+    'mpg123_enc_from_id3': (None, (),
+        "mpg123_enc_from_id3 = _libraries['/usr/lib/libmpg123.so'].mpg123_enc_from_id3\n"
+        'mpg123_enc_from_id3.restype = mpg123_text_encoding\n'
+        'mpg123_enc_from_id3.argtypes = [c_ubyte]'
+        ),
+    'mpg123_store_utf8': (None, ('mpg123_string',),
+        "mpg123_store_utf8 = _libraries['/usr/lib/libmpg123.so'].mpg123_store_utf8\n"
+        'mpg123_store_utf8.restype = c_int\n'
+        'mpg123_store_utf8.argtypes = [POINTER(mpg123_string), mpg123_text_encoding, POINTER(c_ubyte), size_t]'
+        ),
+    'mpg123_text': ('Structure', ('mpg123_string',),
+        'mpg123_text._fields_ = [\n'
+        "    ('lang', c_char * 3),\n"
+        "    ('id', c_char * 4),\n"
+        "    ('description', mpg123_string),\n"
+        "    ('text', mpg123_string),\n"
+        ']'
+        ),
+    'mpg123_picture': ('Structure', ('mpg123_string',),
+        'mpg123_picture._fields_ = [\n'
+        "    ('type', c_char),\n"
+        "    ('description', mpg123_string),\n"
+        "    ('mime_type', mpg123_string),\n"
+        "    ('size', size_t),\n"
+        "    ('data', POINTER(c_ubyte)),\n"
+        ']'
+        ),
+    'mpg123_id3v2': ('Structure', ('mpg123_picture', 'mpg123_string', 'mpg123_text'),
+        'mpg123_id3v2._fields_ = [\n'
+        "    ('version', c_ubyte),\n"
+        "    ('title', POINTER(mpg123_string)),\n"
+        "    ('artist', POINTER(mpg123_string)),\n"
+        "    ('album', POINTER(mpg123_string)),\n"
+        "    ('year', POINTER(mpg123_string)),\n"
+        "    ('genre', POINTER(mpg123_string)),\n"
+        "    ('comment', POINTER(mpg123_string)),\n"
+        "    ('comment_list', POINTER(mpg123_text)),\n"
+        "    ('comments', size_t),\n"
+        "    ('text', POINTER(mpg123_text)),\n"
+        "    ('texts', size_t),\n"
+        "    ('extra', POINTER(mpg123_text)),\n"
+        "    ('extras', size_t),\n"
+        "    ('picture', POINTER(mpg123_picture)),\n"
+        "    ('pictures', size_t),\n"
+        ']'
+        ),
+    'mpg123_id3v1': ('Structure', (),
+        'mpg123_id3v1._fields_ = [\n'
+        "    ('tag', c_char * 3),\n"
+        "    ('title', c_char * 30),\n"
+        "    ('artist', c_char * 30),\n"
+        "    ('album', c_char * 30),\n"
+        "    ('year', c_char * 4),\n"
+        "    ('comment', c_char * 30),\n"
+        "    ('genre', c_ubyte),\n"
+        ']'
+        ),
+    'mpg123_meta_check': (None, ('mpg123_handle',),
+        "mpg123_meta_check = _libraries['/usr/lib/libmpg123.so'].mpg123_meta_check\n"
+        'mpg123_meta_check.restype = c_int\n'
+        'mpg123_meta_check.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_meta_free': (None, ('mpg123_handle',),
+        "mpg123_meta_free = _libraries['/usr/lib/libmpg123.so'].mpg123_meta_free\n"
+        'mpg123_meta_free.restype = None\n'
+        'mpg123_meta_free.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_id3': (None, ('mpg123_handle', 'mpg123_id3v1', 'mpg123_id3v2'),
+        "mpg123_id3 = _libraries['/usr/lib/libmpg123.so'].mpg123_id3\n"
+        'mpg123_id3.restype = c_int\n'
+        'mpg123_id3.argtypes = [POINTER(mpg123_handle), POINTER(POINTER(mpg123_id3v1)), POINTER(POINTER(mpg123_id3v2))]'
+        ),
+    'mpg123_icy': (None, ('mpg123_handle',),
+        "mpg123_icy = _libraries['/usr/lib/libmpg123.so'].mpg123_icy\n"
+        'mpg123_icy.restype = c_int\n'
+        'mpg123_icy.argtypes = [POINTER(mpg123_handle), POINTER(STRING)]'
+        ),
+    'mpg123_icy2utf8': (None, (),
+        "mpg123_icy2utf8 = _libraries['/usr/lib/libmpg123.so'].mpg123_icy2utf8\n"
+        'mpg123_icy2utf8.restype = STRING\n'
+        'mpg123_icy2utf8.argtypes = [STRING]'
+        ),
+    'mpg123_pars_struct': ('Structure', (),
+        'mpg123_pars_struct._fields_ = [\n'
+        ']'
+        ),
+    'mpg123_pars': (None, ('mpg123_pars_struct',),
+        'mpg123_pars = mpg123_pars_struct'
+        ),
+    'mpg123_parnew': (None, ('mpg123_handle', 'mpg123_pars'),
+        "mpg123_parnew = _libraries['/usr/lib/libmpg123.so'].mpg123_parnew\n"
+        'mpg123_parnew.restype = POINTER(mpg123_handle)\n'
+        'mpg123_parnew.argtypes = [POINTER(mpg123_pars), STRING, POINTER(c_int)]'
+        ),
+    'mpg123_new_pars': (None, ('mpg123_pars',),
+        "mpg123_new_pars = _libraries['/usr/lib/libmpg123.so'].mpg123_new_pars\n"
+        'mpg123_new_pars.restype = POINTER(mpg123_pars)\n'
+        'mpg123_new_pars.argtypes = [POINTER(c_int)]'
+        ),
+    'mpg123_delete_pars': (None, ('mpg123_pars',),
+        "mpg123_delete_pars = _libraries['/usr/lib/libmpg123.so'].mpg123_delete_pars\n"
+        'mpg123_delete_pars.restype = None\n'
+        'mpg123_delete_pars.argtypes = [POINTER(mpg123_pars)]'
+        ),
+    'mpg123_fmt_none': (None, ('mpg123_pars',),
+        "mpg123_fmt_none = _libraries['/usr/lib/libmpg123.so'].mpg123_fmt_none\n"
+        'mpg123_fmt_none.restype = c_int\n'
+        'mpg123_fmt_none.argtypes = [POINTER(mpg123_pars)]'
+        ),
+    'mpg123_fmt_all': (None, ('mpg123_pars',),
+        "mpg123_fmt_all = _libraries['/usr/lib/libmpg123.so'].mpg123_fmt_all\n"
+        'mpg123_fmt_all.restype = c_int\n'
+        'mpg123_fmt_all.argtypes = [POINTER(mpg123_pars)]'
+        ),
+    'mpg123_fmt': (None, ('mpg123_pars',),
+        "mpg123_fmt = _libraries['/usr/lib/libmpg123.so'].mpg123_fmt\n"
+        'mpg123_fmt.restype = c_int\n'
+        'mpg123_fmt.argtypes = [POINTER(mpg123_pars), c_long, c_int, c_int]'
+        ),
+    'mpg123_fmt_support': (None, ('mpg123_pars',),
+        "mpg123_fmt_support = _libraries['/usr/lib/libmpg123.so'].mpg123_fmt_support\n"
+        'mpg123_fmt_support.restype = c_int\n'
+        'mpg123_fmt_support.argtypes = [POINTER(mpg123_pars), c_long, c_int]'
+        ),
+    'mpg123_par': (None, ('mpg123_pars',),
+        "mpg123_par = _libraries['/usr/lib/libmpg123.so'].mpg123_par\n"
+        'mpg123_par.restype = c_int\n'
+        'mpg123_par.argtypes = [POINTER(mpg123_pars), mpg123_parms, c_long, c_double]'
+        ),
+    'mpg123_getpar': (None, ('mpg123_pars',),
+        "mpg123_getpar = _libraries['/usr/lib/libmpg123.so'].mpg123_getpar\n"
+        'mpg123_getpar.restype = c_int\n'
+        'mpg123_getpar.argtypes = [POINTER(mpg123_pars), mpg123_parms, POINTER(c_long), POINTER(c_double)]'
+        ),
+    'mpg123_replace_buffer': (None, ('mpg123_handle',),
+        "mpg123_replace_buffer = _libraries['/usr/lib/libmpg123.so'].mpg123_replace_buffer\n"
+        'mpg123_replace_buffer.restype = c_int\n'
+        'mpg123_replace_buffer.argtypes = [POINTER(mpg123_handle), POINTER(c_ubyte), size_t]'
+        ),
+    'mpg123_outblock': (None, ('mpg123_handle',),
+        "mpg123_outblock = _libraries['/usr/lib/libmpg123.so'].mpg123_outblock\n"
+        'mpg123_outblock.restype = size_t\n'
+        'mpg123_outblock.argtypes = [POINTER(mpg123_handle)]'
+        ),
+    'mpg123_replace_reader': (None, ('mpg123_handle',),
+        "mpg123_replace_reader = _libraries['/usr/lib/libmpg123.so'].mpg123_replace_reader\n"
+        'mpg123_replace_reader.restype = c_int\n'
+        'mpg123_replace_reader.argtypes = [POINTER(mpg123_handle), CFUNCTYPE(ssize_t, c_int, c_void_p, size_t), CFUNCTYPE(off_t, c_int, off_t, c_int)]'
+        ),
+    'mpg123_replace_reader_handle': (None, ('mpg123_handle',),
+        "mpg123_replace_reader_handle = _libraries['/usr/lib/libmpg123.so'].mpg123_replace_reader_handle\n"
+        'mpg123_replace_reader_handle.restype = c_int\n'
+        'mpg123_replace_reader_handle.argtypes = [POINTER(mpg123_handle), CFUNCTYPE(ssize_t, c_void_p, c_void_p, size_t), CFUNCTYPE(off_t, c_void_p, off_t, c_int), CFUNCTYPE(None, c_void_p)]'
+        ),
+    'div_t': ('Structure', (),
+        'div_t._fields_ = [\n'
+        "    ('quot', c_int),\n"
+        "    ('rem', c_int),\n"
+        ']'
+        ),
+    'ldiv_t': ('Structure', (),
+        'ldiv_t._fields_ = [\n'
+        "    ('quot', c_long),\n"
+        "    ('rem', c_long),\n"
+        ']'
+        ),
+    'lldiv_t': ('Structure', (),
+        'lldiv_t._fields_ = [\n'
+        "    ('quot', c_longlong),\n"
+        "    ('rem', c_longlong),\n"
+        ']'
+        ),
+    '__ctype_get_mb_cur_max': (None, (),
+        "__ctype_get_mb_cur_max = _libraries['/usr/lib/libmpg123.so'].__ctype_get_mb_cur_max\n"
+        '__ctype_get_mb_cur_max.restype = size_t\n'
+        '__ctype_get_mb_cur_max.argtypes = []'
+        ),
+    'strtod': (None, (),
+        "strtod = _libraries['/usr/lib/libmpg123.so'].strtod\n"
+        'strtod.restype = c_double\n'
+        'strtod.argtypes = [STRING, POINTER(STRING)]'
+        ),
+    'strtof': (None, (),
+        "strtof = _libraries['/usr/lib/libmpg123.so'].strtof\n"
+        'strtof.restype = c_float\n'
+        'strtof.argtypes = [STRING, POINTER(STRING)]'
+        ),
+    'strtold': (None, (),
+        "strtold = _libraries['/usr/lib/libmpg123.so'].strtold\n"
+        'strtold.restype = c_longdouble\n'
+        'strtold.argtypes = [STRING, POINTER(STRING)]'
+        ),
+    'strtol': (None, (),
+        "strtol = _libraries['/usr/lib/libmpg123.so'].strtol\n"
+        'strtol.restype = c_long\n'
+        'strtol.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoul': (None, (),
+        "strtoul = _libraries['/usr/lib/libmpg123.so'].strtoul\n"
+        'strtoul.restype = c_ulong\n'
+        'strtoul.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoq': (None, (),
+        "strtoq = _libraries['/usr/lib/libmpg123.so'].strtoq\n"
+        'strtoq.restype = c_longlong\n'
+        'strtoq.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtouq': (None, (),
+        "strtouq = _libraries['/usr/lib/libmpg123.so'].strtouq\n"
+        'strtouq.restype = c_ulonglong\n'
+        'strtouq.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoll': (None, (),
+        "strtoll = _libraries['/usr/lib/libmpg123.so'].strtoll\n"
+        'strtoll.restype = c_longlong\n'
+        'strtoll.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    'strtoull': (None, (),
+        "strtoull = _libraries['/usr/lib/libmpg123.so'].strtoull\n"
+        'strtoull.restype = c_ulonglong\n'
+        'strtoull.argtypes = [STRING, POINTER(STRING), c_int]'
+        ),
+    '__locale_struct': ('Structure', ('__locale_data',),
+        '__locale_struct._fields_ = [\n'
+        "    ('__locales', POINTER(__locale_data) * 13),\n"
+        "    ('__ctype_b', POINTER(c_ushort)),\n"
+        "    ('__ctype_tolower', POINTER(c_int)),\n"
+        "    ('__ctype_toupper', POINTER(c_int)),\n"
+        "    ('__names', STRING * 13),\n"
+        ']'
+        ),
+    '__locale_t': (None, ('__locale_struct',),
+        '__locale_t = POINTER(__locale_struct)'
+        ),
+    'strtol_l': (None, ('__locale_t',),
+        "strtol_l = _libraries['/usr/lib/libmpg123.so'].strtol_l\n"
+        'strtol_l.restype = c_long\n'
+        'strtol_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtoul_l': (None, ('__locale_t',),
+        "strtoul_l = _libraries['/usr/lib/libmpg123.so'].strtoul_l\n"
+        'strtoul_l.restype = c_ulong\n'
+        'strtoul_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtoll_l': (None, ('__locale_t',),
+        "strtoll_l = _libraries['/usr/lib/libmpg123.so'].strtoll_l\n"
+        'strtoll_l.restype = c_longlong\n'
+        'strtoll_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtoull_l': (None, ('__locale_t',),
+        "strtoull_l = _libraries['/usr/lib/libmpg123.so'].strtoull_l\n"
+        'strtoull_l.restype = c_ulonglong\n'
+        'strtoull_l.argtypes = [STRING, POINTER(STRING), c_int, __locale_t]'
+        ),
+    'strtod_l': (None, ('__locale_t',),
+        "strtod_l = _libraries['/usr/lib/libmpg123.so'].strtod_l\n"
+        'strtod_l.restype = c_double\n'
+        'strtod_l.argtypes = [STRING, POINTER(STRING), __locale_t]'
+        ),
+    'strtof_l': (None, ('__locale_t',),
+        "strtof_l = _libraries['/usr/lib/libmpg123.so'].strtof_l\n"
+        'strtof_l.restype = c_float\n'
+        'strtof_l.argtypes = [STRING, POINTER(STRING), __locale_t]'
+        ),
+    'strtold_l': (None, ('__locale_t',),
+        "strtold_l = _libraries['/usr/lib/libmpg123.so'].strtold_l\n"
+        'strtold_l.restype = c_longdouble\n'
+        'strtold_l.argtypes = [STRING, POINTER(STRING), __locale_t]'
+        ),
+    'atoi': (None, (),
+        "atoi = _libraries['/usr/lib/libmpg123.so'].atoi\n"
+        'atoi.restype = c_int\n'
+        'atoi.argtypes = [STRING]'
+        ),
+    'atol': (None, (),
+        "atol = _libraries['/usr/lib/libmpg123.so'].atol\n"
+        'atol.restype = c_long\n'
+        'atol.argtypes = [STRING]'
+        ),
+    'atoll': (None, (),
+        "atoll = _libraries['/usr/lib/libmpg123.so'].atoll\n"
+        'atoll.restype = c_longlong\n'
+        'atoll.argtypes = [STRING]'
+        ),
+    'l64a': (None, (),
+        "l64a = _libraries['/usr/lib/libmpg123.so'].l64a\n"
+        'l64a.restype = STRING\n'
+        'l64a.argtypes = [c_long]'
+        ),
+    'a64l': (None, (),
+        "a64l = _libraries['/usr/lib/libmpg123.so'].a64l\n"
+        'a64l.restype = c_long\n'
+        'a64l.argtypes = [STRING]'
+        ),
+    'random': (None, (),
+        "random = _libraries['/usr/lib/libmpg123.so'].random\n"
+        'random.restype = c_long\n'
+        'random.argtypes = []'
+        ),
+    'srandom': (None, (),
+        "srandom = _libraries['/usr/lib/libmpg123.so'].srandom\n"
+        'srandom.restype = None\n'
+        'srandom.argtypes = [c_uint]'
+        ),
+    'initstate': (None, (),
+        "initstate = _libraries['/usr/lib/libmpg123.so'].initstate\n"
+        'initstate.restype = STRING\n'
+        'initstate.argtypes = [c_uint, STRING, size_t]'
+        ),
+    'setstate': (None, (),
+        "setstate = _libraries['/usr/lib/libmpg123.so'].setstate\n"
+        'setstate.restype = STRING\n'
+        'setstate.argtypes = [STRING]'
+        ),
+    'random_data': ('Structure', (),
+        'random_data._fields_ = [\n'
+        "    ('fptr', POINTER(int32_t)),\n"
+        "    ('rptr', POINTER(int32_t)),\n"
+        "    ('state', POINTER(int32_t)),\n"
+        "    ('rand_type', c_int),\n"
+        "    ('rand_deg', c_int),\n"
+        "    ('rand_sep', c_int),\n"
+        "    ('end_ptr', POINTER(int32_t)),\n"
+        ']'
+        ),
+    'random_r': (None, ('random_data',),
+        "random_r = _libraries['/usr/lib/libmpg123.so'].random_r\n"
+        'random_r.restype = c_int\n'
+        'random_r.argtypes = [POINTER(random_data), POINTER(int32_t)]'
+        ),
+    'srandom_r': (None, ('random_data',),
+        "srandom_r = _libraries['/usr/lib/libmpg123.so'].srandom_r\n"
+        'srandom_r.restype = c_int\n'
+        'srandom_r.argtypes = [c_uint, POINTER(random_data)]'
+        ),
+    'initstate_r': (None, ('random_data',),
+        "initstate_r = _libraries['/usr/lib/libmpg123.so'].initstate_r\n"
+        'initstate_r.restype = c_int\n'
+        'initstate_r.argtypes = [c_uint, STRING, size_t, POINTER(random_data)]'
+        ),
+    'setstate_r': (None, ('random_data',),
+        "setstate_r = _libraries['/usr/lib/libmpg123.so'].setstate_r\n"
+        'setstate_r.restype = c_int\n'
+        'setstate_r.argtypes = [STRING, POINTER(random_data)]'
+        ),
+    'rand': (None, (),
+        "rand = _libraries['/usr/lib/libmpg123.so'].rand\n"
+        'rand.restype = c_int\n'
+        'rand.argtypes = []'
+        ),
+    'srand': (None, (),
+        "srand = _libraries['/usr/lib/libmpg123.so'].srand\n"
+        'srand.restype = None\n'
+        'srand.argtypes = [c_uint]'
+        ),
+    'rand_r': (None, (),
+        "rand_r = _libraries['/usr/lib/libmpg123.so'].rand_r\n"
+        'rand_r.restype = c_int\n'
+        'rand_r.argtypes = [POINTER(c_uint)]'
+        ),
+    'drand48': (None, (),
+        "drand48 = _libraries['/usr/lib/libmpg123.so'].drand48\n"
+        'drand48.restype = c_double\n'
+        'drand48.argtypes = []'
+        ),
+    'erand48': (None, (),
+        "erand48 = _libraries['/usr/lib/libmpg123.so'].erand48\n"
+        'erand48.restype = c_double\n'
+        'erand48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'lrand48': (None, (),
+        "lrand48 = _libraries['/usr/lib/libmpg123.so'].lrand48\n"
+        'lrand48.restype = c_long\n'
+        'lrand48.argtypes = []'
+        ),
+    'nrand48': (None, (),
+        "nrand48 = _libraries['/usr/lib/libmpg123.so'].nrand48\n"
+        'nrand48.restype = c_long\n'
+        'nrand48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'mrand48': (None, (),
+        "mrand48 = _libraries['/usr/lib/libmpg123.so'].mrand48\n"
+        'mrand48.restype = c_long\n'
+        'mrand48.argtypes = []'
+        ),
+    'jrand48': (None, (),
+        "jrand48 = _libraries['/usr/lib/libmpg123.so'].jrand48\n"
+        'jrand48.restype = c_long\n'
+        'jrand48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'srand48': (None, (),
+        "srand48 = _libraries['/usr/lib/libmpg123.so'].srand48\n"
+        'srand48.restype = None\n'
+        'srand48.argtypes = [c_long]'
+        ),
+    'seed48': (None, (),
+        "seed48 = _libraries['/usr/lib/libmpg123.so'].seed48\n"
+        'seed48.restype = POINTER(c_ushort)\n'
+        'seed48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'lcong48': (None, (),
+        "lcong48 = _libraries['/usr/lib/libmpg123.so'].lcong48\n"
+        'lcong48.restype = None\n'
+        'lcong48.argtypes = [POINTER(c_ushort)]'
+        ),
+    'drand48_data': ('Structure', (),
+        'drand48_data._fields_ = [\n'
+        "    ('__x', c_ushort * 3),\n"
+        "    ('__old_x', c_ushort * 3),\n"
+        "    ('__c', c_ushort),\n"
+        "    ('__init', c_ushort),\n"
+        "    ('__a', c_ulonglong),\n"
+        ']'
+        ),
+    'drand48_r': (None, ('drand48_data',),
+        "drand48_r = _libraries['/usr/lib/libmpg123.so'].drand48_r\n"
+        'drand48_r.restype = c_int\n'
+        'drand48_r.argtypes = [POINTER(drand48_data), POINTER(c_double)]'
+        ),
+    'erand48_r': (None, ('drand48_data',),
+        "erand48_r = _libraries['/usr/lib/libmpg123.so'].erand48_r\n"
+        'erand48_r.restype = c_int\n'
+        'erand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_double)]'
+        ),
+    'lrand48_r': (None, ('drand48_data',),
+        "lrand48_r = _libraries['/usr/lib/libmpg123.so'].lrand48_r\n"
+        'lrand48_r.restype = c_int\n'
+        'lrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'nrand48_r': (None, ('drand48_data',),
+        "nrand48_r = _libraries['/usr/lib/libmpg123.so'].nrand48_r\n"
+        'nrand48_r.restype = c_int\n'
+        'nrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'mrand48_r': (None, ('drand48_data',),
+        "mrand48_r = _libraries['/usr/lib/libmpg123.so'].mrand48_r\n"
+        'mrand48_r.restype = c_int\n'
+        'mrand48_r.argtypes = [POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'jrand48_r': (None, ('drand48_data',),
+        "jrand48_r = _libraries['/usr/lib/libmpg123.so'].jrand48_r\n"
+        'jrand48_r.restype = c_int\n'
+        'jrand48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data), POINTER(c_long)]'
+        ),
+    'srand48_r': (None, ('drand48_data',),
+        "srand48_r = _libraries['/usr/lib/libmpg123.so'].srand48_r\n"
+        'srand48_r.restype = c_int\n'
+        'srand48_r.argtypes = [c_long, POINTER(drand48_data)]'
+        ),
+    'seed48_r': (None, ('drand48_data',),
+        "seed48_r = _libraries['/usr/lib/libmpg123.so'].seed48_r\n"
+        'seed48_r.restype = c_int\n'
+        'seed48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]'
+        ),
+    'lcong48_r': (None, ('drand48_data',),
+        "lcong48_r = _libraries['/usr/lib/libmpg123.so'].lcong48_r\n"
+        'lcong48_r.restype = c_int\n'
+        'lcong48_r.argtypes = [POINTER(c_ushort), POINTER(drand48_data)]'
+        ),
+    'malloc': (None, (),
+        "malloc = _libraries['/usr/lib/libmpg123.so'].malloc\n"
+        'malloc.restype = c_void_p\n'
+        'malloc.argtypes = [size_t]'
+        ),
+    'calloc': (None, (),
+        "calloc = _libraries['/usr/lib/libmpg123.so'].calloc\n"
+        'calloc.restype = c_void_p\n'
+        'calloc.argtypes = [size_t, size_t]'
+        ),
+    'realloc': (None, (),
+        "realloc = _libraries['/usr/lib/libmpg123.so'].realloc\n"
+        'realloc.restype = c_void_p\n'
+        'realloc.argtypes = [c_void_p, size_t]'
+        ),
+    'free': (None, (),
+        "free = _libraries['/usr/lib/libmpg123.so'].free\n"
+        'free.restype = None\n'
+        'free.argtypes = [c_void_p]'
+        ),
+    'cfree': (None, (),
+        "cfree = _libraries['/usr/lib/libmpg123.so'].cfree\n"
+        'cfree.restype = None\n'
+        'cfree.argtypes = [c_void_p]'
+        ),
+    'valloc': (None, (),
+        "valloc = _libraries['/usr/lib/libmpg123.so'].valloc\n"
+        'valloc.restype = c_void_p\n'
+        'valloc.argtypes = [size_t]'
+        ),
+    'posix_memalign': (None, (),
+        "posix_memalign = _libraries['/usr/lib/libmpg123.so'].posix_memalign\n"
+        'posix_memalign.restype = c_int\n'
+        'posix_memalign.argtypes = [POINTER(c_void_p), size_t, size_t]'
+        ),
+    'aligned_alloc': (None, (),
+        "aligned_alloc = _libraries['/usr/lib/libmpg123.so'].aligned_alloc\n"
+        'aligned_alloc.restype = c_void_p\n'
+        'aligned_alloc.argtypes = [size_t, size_t]'
+        ),
+    'abort': (None, (),
+        "abort = _libraries['/usr/lib/libmpg123.so'].abort\n"
+        'abort.restype = None\n'
+        'abort.argtypes = []'
+        ),
+    'on_exit': (None, (),
+        "on_exit = _libraries['/usr/lib/libmpg123.so'].on_exit\n"
+        'on_exit.restype = c_int\n'
+        'on_exit.argtypes = [CFUNCTYPE(None, c_int, c_void_p), c_void_p]'
+        ),
+    'exit': (None, (),
+        "exit = _libraries['/usr/lib/libmpg123.so'].exit\n"
+        'exit.restype = None\n'
+        'exit.argtypes = [c_int]'
+        ),
+    'quick_exit': (None, (),
+        "quick_exit = _libraries['/usr/lib/libmpg123.so'].quick_exit\n"
+        'quick_exit.restype = None\n'
+        'quick_exit.argtypes = [c_int]'
+        ),
+    '_Exit': (None, (),
+        "_Exit = _libraries['/usr/lib/libmpg123.so']._Exit\n"
+        '_Exit.restype = None\n'
+        '_Exit.argtypes = [c_int]'
+        ),
+    'getenv': (None, (),
+        "getenv = _libraries['/usr/lib/libmpg123.so'].getenv\n"
+        'getenv.restype = STRING\n'
+        'getenv.argtypes = [STRING]'
+        ),
+    'secure_getenv': (None, (),
+        "secure_getenv = _libraries['/usr/lib/libmpg123.so'].secure_getenv\n"
+        'secure_getenv.restype = STRING\n'
+        'secure_getenv.argtypes = [STRING]'
+        ),
+    'putenv': (None, (),
+        "putenv = _libraries['/usr/lib/libmpg123.so'].putenv\n"
+        'putenv.restype = c_int\n'
+        'putenv.argtypes = [STRING]'
+        ),
+    'setenv': (None, (),
+        "setenv = _libraries['/usr/lib/libmpg123.so'].setenv\n"
+        'setenv.restype = c_int\n'
+        'setenv.argtypes = [STRING, STRING, c_int]'
+        ),
+    'unsetenv': (None, (),
+        "unsetenv = _libraries['/usr/lib/libmpg123.so'].unsetenv\n"
+        'unsetenv.restype = c_int\n'
+        'unsetenv.argtypes = [STRING]'
+        ),
+    'clearenv': (None, (),
+        "clearenv = _libraries['/usr/lib/libmpg123.so'].clearenv\n"
+        'clearenv.restype = c_int\n'
+        'clearenv.argtypes = []'
+        ),
+    'mktemp': (None, (),
+        "mktemp = _libraries['/usr/lib/libmpg123.so'].mktemp\n"
+        'mktemp.restype = STRING\n'
+        'mktemp.argtypes = [STRING]'
+        ),
+    'mkstemp': (None, (),
+        "mkstemp = _libraries['/usr/lib/libmpg123.so'].mkstemp\n"
+        'mkstemp.restype = c_int\n'
+        'mkstemp.argtypes = [STRING]'
+        ),
+    'mkstemp64': (None, (),
+        "mkstemp64 = _libraries['/usr/lib/libmpg123.so'].mkstemp64\n"
+        'mkstemp64.restype = c_int\n'
+        'mkstemp64.argtypes = [STRING]'
+        ),
+    'mkstemps': (None, (),
+        "mkstemps = _libraries['/usr/lib/libmpg123.so'].mkstemps\n"
+        'mkstemps.restype = c_int\n'
+        'mkstemps.argtypes = [STRING, c_int]'
+        ),
+    'mkstemps64': (None, (),
+        "mkstemps64 = _libraries['/usr/lib/libmpg123.so'].mkstemps64\n"
+        'mkstemps64.restype = c_int\n'
+        'mkstemps64.argtypes = [STRING, c_int]'
+        ),
+    'mkdtemp': (None, (),
+        "mkdtemp = _libraries['/usr/lib/libmpg123.so'].mkdtemp\n"
+        'mkdtemp.restype = STRING\n'
+        'mkdtemp.argtypes = [STRING]'
+        ),
+    'mkostemp': (None, (),
+        "mkostemp = _libraries['/usr/lib/libmpg123.so'].mkostemp\n"
+        'mkostemp.restype = c_int\n'
+        'mkostemp.argtypes = [STRING, c_int]'
+        ),
+    'mkostemp64': (None, (),
+        "mkostemp64 = _libraries['/usr/lib/libmpg123.so'].mkostemp64\n"
+        'mkostemp64.restype = c_int\n'
+        'mkostemp64.argtypes = [STRING, c_int]'
+        ),
+    'mkostemps': (None, (),
+        "mkostemps = _libraries['/usr/lib/libmpg123.so'].mkostemps\n"
+        'mkostemps.restype = c_int\n'
+        'mkostemps.argtypes = [STRING, c_int, c_int]'
+        ),
+    'mkostemps64': (None, (),
+        "mkostemps64 = _libraries['/usr/lib/libmpg123.so'].mkostemps64\n"
+        'mkostemps64.restype = c_int\n'
+        'mkostemps64.argtypes = [STRING, c_int, c_int]'
+        ),
+    'system': (None, (),
+        "system = _libraries['/usr/lib/libmpg123.so'].system\n"
+        'system.restype = c_int\n'
+        'system.argtypes = [STRING]'
+        ),
+    'canonicalize_file_name': (None, (),
+        "canonicalize_file_name = _libraries['/usr/lib/libmpg123.so'].canonicalize_file_name\n"
+        'canonicalize_file_name.restype = STRING\n'
+        'canonicalize_file_name.argtypes = [STRING]'
+        ),
+    'qsort': (None, (),
+        "qsort = _libraries['/usr/lib/libmpg123.so'].qsort\n"
+        'qsort.restype = None\n'
+        'qsort.argtypes = [c_void_p, size_t, size_t, __compar_fn_t]'
+        ),
+    'qsort_r': (None, (),
+        "qsort_r = _libraries['/usr/lib/libmpg123.so'].qsort_r\n"
+        'qsort_r.restype = None\n'
+        'qsort_r.argtypes = [c_void_p, size_t, size_t, __compar_d_fn_t, c_void_p]'
+        ),
+    'abs': (None, (),
+        "abs = _libraries['/usr/lib/libmpg123.so'].abs\n"
+        'abs.restype = c_int\n'
+        'abs.argtypes = [c_int]'
+        ),
+    'labs': (None, (),
+        "labs = _libraries['/usr/lib/libmpg123.so'].labs\n"
+        'labs.restype = c_long\n'
+        'labs.argtypes = [c_long]'
+        ),
+    'llabs': (None, (),
+        "llabs = _libraries['/usr/lib/libmpg123.so'].llabs\n"
+        'llabs.restype = c_longlong\n'
+        'llabs.argtypes = [c_longlong]'
+        ),
+    'div': (None, ('div_t',),
+        "div = _libraries['/usr/lib/libmpg123.so'].div\n"
+        'div.restype = div_t\n'
+        'div.argtypes = [c_int, c_int]'
+        ),
+    'ldiv': (None, ('ldiv_t',),
+        "ldiv = _libraries['/usr/lib/libmpg123.so'].ldiv\n"
+        'ldiv.restype = ldiv_t\n'
+        'ldiv.argtypes = [c_long, c_long]'
+        ),
+    'lldiv': (None, ('lldiv_t',),
+        "lldiv = _libraries['/usr/lib/libmpg123.so'].lldiv\n"
+        'lldiv.restype = lldiv_t\n'
+        'lldiv.argtypes = [c_longlong, c_longlong]'
+        ),
+    'ecvt': (None, (),
+        "ecvt = _libraries['/usr/lib/libmpg123.so'].ecvt\n"
+        'ecvt.restype = STRING\n'
+        'ecvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'fcvt': (None, (),
+        "fcvt = _libraries['/usr/lib/libmpg123.so'].fcvt\n"
+        'fcvt.restype = STRING\n'
+        'fcvt.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'gcvt': (None, (),
+        "gcvt = _libraries['/usr/lib/libmpg123.so'].gcvt\n"
+        'gcvt.restype = STRING\n'
+        'gcvt.argtypes = [c_double, c_int, STRING]'
+        ),
+    'qecvt': (None, (),
+        "qecvt = _libraries['/usr/lib/libmpg123.so'].qecvt\n"
+        'qecvt.restype = STRING\n'
+        'qecvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'qfcvt': (None, (),
+        "qfcvt = _libraries['/usr/lib/libmpg123.so'].qfcvt\n"
+        'qfcvt.restype = STRING\n'
+        'qfcvt.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int)]'
+        ),
+    'qgcvt': (None, (),
+        "qgcvt = _libraries['/usr/lib/libmpg123.so'].qgcvt\n"
+        'qgcvt.restype = STRING\n'
+        'qgcvt.argtypes = [c_longdouble, c_int, STRING]'
+        ),
+    'ecvt_r': (None, (),
+        "ecvt_r = _libraries['/usr/lib/libmpg123.so'].ecvt_r\n"
+        'ecvt_r.restype = c_int\n'
+        'ecvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'fcvt_r': (None, (),
+        "fcvt_r = _libraries['/usr/lib/libmpg123.so'].fcvt_r\n"
+        'fcvt_r.restype = c_int\n'
+        'fcvt_r.argtypes = [c_double, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'qecvt_r': (None, (),
+        "qecvt_r = _libraries['/usr/lib/libmpg123.so'].qecvt_r\n"
+        'qecvt_r.restype = c_int\n'
+        'qecvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'qfcvt_r': (None, (),
+        "qfcvt_r = _libraries['/usr/lib/libmpg123.so'].qfcvt_r\n"
+        'qfcvt_r.restype = c_int\n'
+        'qfcvt_r.argtypes = [c_longdouble, c_int, POINTER(c_int), POINTER(c_int), STRING, size_t]'
+        ),
+    'mblen': (None, (),
+        "mblen = _libraries['/usr/lib/libmpg123.so'].mblen\n"
+        'mblen.restype = c_int\n'
+        'mblen.argtypes = [STRING, size_t]'
+        ),
+    'mbtowc': (None, (),
+        "mbtowc = _libraries['/usr/lib/libmpg123.so'].mbtowc\n"
+        'mbtowc.restype = c_int\n'
+        'mbtowc.argtypes = [WSTRING, STRING, size_t]'
+        ),
+    'rpmatch': (None, (),
+        "rpmatch = _libraries['/usr/lib/libmpg123.so'].rpmatch\n"
+        'rpmatch.restype = c_int\n'
+        'rpmatch.argtypes = [STRING]'
+        ),
+    'getsubopt': (None, (),
+        "getsubopt = _libraries['/usr/lib/libmpg123.so'].getsubopt\n"
+        'getsubopt.restype = c_int\n'
+        'getsubopt.argtypes = [POINTER(STRING), POINTER(STRING), POINTER(STRING)]'
+        ),
+    'posix_openpt': (None, (),
+        "posix_openpt = _libraries['/usr/lib/libmpg123.so'].posix_openpt\n"
+        'posix_openpt.restype = c_int\n'
+        'posix_openpt.argtypes = [c_int]'
+        ),
+    'grantpt': (None, (),
+        "grantpt = _libraries['/usr/lib/libmpg123.so'].grantpt\n"
+        'grantpt.restype = c_int\n'
+        'grantpt.argtypes = [c_int]'
+        ),
+    'unlockpt': (None, (),
+        "unlockpt = _libraries['/usr/lib/libmpg123.so'].unlockpt\n"
+        'unlockpt.restype = c_int\n'
+        'unlockpt.argtypes = [c_int]'
+        ),
+    'ptsname': (None, (),
+        "ptsname = _libraries['/usr/lib/libmpg123.so'].ptsname\n"
+        'ptsname.restype = STRING\n'
+        'ptsname.argtypes = [c_int]'
+        ),
+    'getpt': (None, (),
+        "getpt = _libraries['/usr/lib/libmpg123.so'].getpt\n"
+        'getpt.restype = c_int\n'
+        'getpt.argtypes = []'
+        ),
+    'getloadavg': (None, (),
+        "getloadavg = _libraries['/usr/lib/libmpg123.so'].getloadavg\n"
+        'getloadavg.restype = c_int\n'
+        'getloadavg.argtypes = [POINTER(c_double), c_int]'
+        ),
+    'sigset_t': (None, ('__sigset_t',),
+        'sigset_t = __sigset_t'
+        ),
+    'fd_set': ('Structure', (),
+        'fd_set._fields_ = [\n'
+        "    ('fds_bits', __fd_mask * 16),\n"
+        ']'
+        ),
+    'select': (None, ('fd_set', 'timeval'),
+        "select = _libraries['/usr/lib/libmpg123.so'].select\n"
+        'select.restype = c_int\n'
+        'select.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timeval)]'
+        ),
+    'timespec': ('Structure', (),
+        'timespec._fields_ = [\n'
+        "    ('tv_sec', __time_t),\n"
+        "    ('tv_nsec', __syscall_slong_t),\n"
+        ']'
+        ),
+    'pselect': (None, ('__sigset_t', 'fd_set', 'timespec'),
+        "pselect = _libraries['/usr/lib/libmpg123.so'].pselect\n"
+        'pselect.restype = c_int\n'
+        'pselect.argtypes = [c_int, POINTER(fd_set), POINTER(fd_set), POINTER(fd_set), POINTER(timespec), POINTER(__sigset_t)]'
+        ),
+    'gnu_dev_major': (None, (),
+        "gnu_dev_major = _libraries['/usr/lib/libmpg123.so'].gnu_dev_major\n"
+        'gnu_dev_major.restype = c_uint\n'
+        'gnu_dev_major.argtypes = [c_ulonglong]'
+        ),
+    'gnu_dev_minor': (None, (),
+        "gnu_dev_minor = _libraries['/usr/lib/libmpg123.so'].gnu_dev_minor\n"
+        'gnu_dev_minor.restype = c_uint\n'
+        'gnu_dev_minor.argtypes = [c_ulonglong]'
+        ),
+    'gnu_dev_makedev': (None, (),
+        "gnu_dev_makedev = _libraries['/usr/lib/libmpg123.so'].gnu_dev_makedev\n"
+        'gnu_dev_makedev.restype = c_ulonglong\n'
+        'gnu_dev_makedev.argtypes = [c_uint, c_uint]'
+        ),
+    'fsid_t': (None, ('__fsid_t',),
+        'fsid_t = __fsid_t'
+        ),
+    '__locale_data': ('Structure', (),
+        '__locale_data._fields_ = [\n'
+        ']'
+        ),
+    'locale_t': (None, ('__locale_t',),
+        'locale_t = __locale_t'
+        ),
+}
+
+_bind_lazily(__name__, _definitions)
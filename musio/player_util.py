@@ -35,6 +35,8 @@ py_imp = python_implementation()
 from sys import stdout as sys_stdout
 
 from .io_util import open_file, open_device
+from .queued_io import PrefetchReader
+from .conversion_util import ConversionPlan, audio_format
 
 
 def _play_proc(msg_dict):
@@ -214,16 +216,14 @@ class AudioPlayer(object):
                 msg_dict['info'] = str(fileobj)
                 msg_dict['length'] = fileobj.length
 
-                if fileobj._rate < 44100:
-                    # if py_imp == 'PyPy':
-                    #     blacklist = msg_dict.get('blacklist', [])
-                    #     blacklist.append('portaudio')
-                    #     msg_dict['blacklist'] = blacklist
-                    # else:
-                    import audioop
+                # Decode ahead in a thread so slow blocks don't starve the
+                # device.
+                prefetch = msg_dict.get('prefetch', 0)
+                if prefetch:
+                    fileobj = PrefetchReader(fileobj, blocks=prefetch)
 
-                    # msg_dict['rate'] = 44100
-                    state = None
+                # The plan to resample the data to the device rate.
+                plan = None
 
                 # Open an audio output device that can handle the data
                 # from fileobj.
@@ -278,18 +278,22 @@ class AudioPlayer(object):
                             except KeyboardInterrupt:
                                 break
 
-                            # if device._rate != fileobj._rate \
-                            #         and py_imp != 'PyPy' and fileobj._rate != 0:
                             if device._rate != fileobj._rate \
                                     and fileobj._rate != 0:
+                                if not plan or plan.target['rate'] != \
+                                        int(device._rate):
+                                    plan = ConversionPlan(
+                                        audio_format(fileobj),
+                                        audio_format(fileobj,
+                                                     rate=int(device._rate)))
+
                                 # Convert the input sample rate to that of
-                                # the output device.
-                                buf, state = audioop.ratecv(buf,
-                                                            fileobj._width,
-                                                            fileobj._channels,
-                                                            fileobj._rate,
-                                                            int(device._rate),
-                                                            state)
+                                # the output device, and play what the
+                                # resampler holds back at the end.
+                                if buf:
+                                    buf = plan.convert(buf).tobytes()
+                                else:
+                                    buf = plan.flush().tobytes()
 
                             # Filler for end of partial buffer to elminiate
                             # end of audio noise.
@@ -324,7 +328,13 @@ class AudioPlayer(object):
                             if 'getposition' in command:
                                 pipe.send(fileobj.position)
                             elif 'setposition' in command:
-                                fileobj.position = command['setposition']
+                                fileobj.seek(command['setposition'],
+                                             precision=command.get(
+                                                 'precision', 'exact'))
+
+                                # Don't resample across the seek.
+                                if plan:
+                                    plan.reset()
                             elif 'getloops' in command:
                                 pipe.send(fileobj.loops)
                             elif 'setloops' in command:
@@ -337,6 +347,10 @@ class AudioPlayer(object):
                     if not device.closed:
                         device.close()
 
+                    # Stop the prefetch thread.
+                    if prefetch:
+                        fileobj.close()
+
         except IOError as err:
             from time import sleep
             msg_dict['error'] = err
@@ -509,17 +523,20 @@ class AudioPlayer(object):
         return self._control_conn.recv()
 
     @playing_wrapper
-    def seek(self, offset, whence=SEEK_SET):
-        """ seek(position) -> Seek to position in mod.
+    def seek(self, offset, whence=SEEK_SET, precision='exact'):
+        """ seek(offset, whence=SEEK_SET, precision='exact') -> Seek to the
+        frame offset.  Scrubbing can use precision 'fast' to land on the
+        nearest point before offset the codec can get to quickly.
 
         """
 
         if whence == SEEK_CUR:
-            self.position += offset
+            offset += self.position
         elif whence == SEEK_END:
-            self.position = self.length - offset
-        else:
-            self.position = offset
+            offset = self.length - offset
+
+        self._control_conn.send({'setposition': int(offset),
+                                 'precision': precision})
 
         return self.position
 
@@ -3,7 +3,7 @@
 # -*- coding: UTF8 -*-
 #
 # A queued writer object for when the writing takes longer than the
-# reading.
+# reading, and a prefetching reader for when decoding is uneven.
 # Copyright (C) 2010 Josiah Gordon <josiahg@gmail.com>
 #
 # This program is free software: you can redistribute it and/or modify
@@ -23,10 +23,16 @@
 """ QueuedWriter An object for using multiprocesses to write instead of
 blocking and clogging up the read.
 
+    PrefetchReader  An AudioIO wrapper that decodes ahead in a thread.
+
 """
 
+from collections import deque
 from multiprocessing import Queue, Process, Manager
 from Queue import Empty as queue_Empty
+from threading import Condition, Lock, Thread
+
+from .io_base import AudioIO, io_wrapper
 
 
 def _queue_writer(func, in_queue, out_queue):
@@ -147,3 +153,326 @@ class QueuedWriter(object):
         except Exception as err:
             print(err)
             return False
+
+
+class PrefetchReader(AudioIO):
+    """ Reads ahead from an AudioIO source in a background thread.  ctypes
+    releases the GIL while the decoder runs, so decoding overlaps with
+    whatever is done with the data, and a slow block is covered by the
+    blocks already decoded.
+
+    """
+
+    # Any depth the source has.
+    _valid_depth = (32, 24, 16, 8)
+
+    # Only reading
+    _supported_modes = 'r'
+
+    def __init__(self, source, blocks=8, block_size=None):
+        """ PrefetchReader(source, blocks=8, block_size=None) -> Decode up to
+        blocks blocks of block_size bytes (the source buffer size by default)
+        from source ahead of the reads.  The source is closed with the
+        reader.
+
+        """
+
+        super(PrefetchReader, self).__init__(source._filename, 'r',
+                                             source.depth, source.rate,
+                                             source.channels)
+
+        self._source = source
+
+        self._bigendian = source.bigendian
+        self._unsigned = source.unsigned
+        self._floatp = source.floatp
+        self.three_byte = source.three_byte
+
+        self._length = source.length
+        self._info_dict = source._info_dict
+        self._buffer_size = source.buffer_size
+
+        if not block_size:
+            block_size = source.buffer_size
+
+        # Keep blocks a whole number of frames.
+        frame_size = (3 if self.three_byte else self._depth // 8) * \
+            self._channels
+        block_size = max(block_size - block_size % frame_size, frame_size)
+
+        self._blocks = blocks
+        self._block_size = block_size
+
+        # The empty buffers and the (buffer, size, position) decoded blocks.
+        self._free = deque(bytearray(block_size) for _ in range(blocks))
+        self._filled = deque()
+
+        # The block being read and how far into it the reads are.
+        self._block = None
+        self._block_offset = 0
+
+        # The condition guards the deques and state, the lock guards the
+        # source.
+        self._condition = Condition()
+        self._source_lock = Lock()
+
+        # Incremented on seek so blocks decoded before it are dropped.
+        self._generation = 0
+        self._eof = False
+        self._running = True
+
+        # Fill level statistics.
+        self._min_filled = blocks
+        self._underruns = 0
+        self._blocks_read = 0
+
+        self._thread = Thread(target=self._prefetch)
+        self._thread.daemon = True
+        self._thread.start()
+
+        self._closed = False
+
+    def __repr__(self):
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        repr_str = "source=%(_source)r, blocks=%(_blocks)s, block_size=%(_block_size)s" % self
+
+        return '%s(%s)' % (self.__class__.__name__, repr_str)
+
+    def _prefetch(self):
+        """ _prefetch() -> Decode blocks into the free buffers until closed.
+
+        """
+
+        condition = self._condition
+
+        while True:
+            with condition:
+                # Wait for a free buffer, or to be restarted after the end
+                # of the source.
+                while self._running and (self._eof or not self._free):
+                    condition.wait()
+
+                if not self._running:
+                    break
+
+                buf = self._free.popleft()
+                generation = self._generation
+
+            size = 0
+            position = 0
+
+            with self._source_lock:
+                # Don't read from the old position after a seek.
+                if generation == self._generation:
+                    try:
+                        position = self._source.position
+                        size = self._source.readinto(buf) or 0
+                    except Exception as err:
+                        print("Error prefetching %s: %s" % (self._source,
+                                                            err))
+
+            with condition:
+                if generation != self._generation:
+                    # It was decoded before a seek so drop it.
+                    self._free.append(buf)
+                elif size:
+                    self._filled.append((buf, size, position))
+                    self._blocks_read += 1
+                else:
+                    self._free.append(buf)
+                    self._eof = True
+
+                condition.notify_all()
+
+    def _flush(self):
+        """ _flush() -> Drop all the decoded blocks.  The condition must be
+        held.
+
+        """
+
+        self._generation += 1
+
+        if self._block:
+            self._free.append(self._block[0])
+            self._block = None
+
+        while self._filled:
+            self._free.append(self._filled.popleft()[0])
+
+        self._eof = False
+        self._condition.notify_all()
+
+    def _set_position(self, position):
+        """ Change the position of playback, and decode from there.
+
+        """
+
+        with self._source_lock:
+            with self._condition:
+                self._flush()
+
+            self._source.position = position
+
+    def _set_position_fast(self, position):
+        """ Change the position of playback to a point near position that
+        the source can get to quickly, and decode from there.
+
+        """
+
+        with self._source_lock:
+            with self._condition:
+                self._flush()
+
+            self._source.seek(position, precision='fast')
+
+    def _get_position(self):
+        """ Returns the position of the block being read.
+
+        """
+
+        if self._block:
+            return self._block[2]
+
+        with self._condition:
+            if self._filled:
+                return self._filled[0][2]
+
+        with self._source_lock:
+            return self._source.position
+
+    @property
+    def loops(self):
+        """ How many times the source should loop.
+
+        """
+
+        return self._source.loops
+
+    @loops.setter
+    def loops(self, value):
+        """ Set how many times the source should loop.  If the source had
+        ended decoding starts again.
+
+        To play forever use a value of -1.
+
+        """
+
+        with self._source_lock:
+            self._source.loops = value
+
+        with self._condition:
+            self._eof = False
+            self._condition.notify_all()
+
+    @property
+    def loop_count(self):
+        """ How many times the source has looped.
+
+        """
+
+        return self._source.loop_count
+
+    @property
+    def stats(self):
+        """ A dict of the number of blocks, how many are decoded now, the
+        fewest there have been when a read took one, how many reads had to
+        wait for the decoder, and how many blocks have been decoded.
+
+        """
+
+        with self._condition:
+            return {
+                'blocks': self._blocks,
+                'filled': len(self._filled),
+                'min_filled': self._min_filled,
+                'underruns': self._underruns,
+                'blocks_read': self._blocks_read,
+            }
+
+    def _next_block(self):
+        """ _next_block() -> Wait for the next decoded block and make it the
+        current block.  Returns False at the end of the source.
+
+        """
+
+        condition = self._condition
+
+        with condition:
+            if not self._filled and not self._eof:
+                # The decoder fell behind.
+                self._underruns += 1
+
+                while not self._filled and not self._eof:
+                    condition.wait()
+
+            if not self._filled:
+                return False
+
+            self._block = self._filled.popleft()
+            self._block_offset = 0
+
+            self._min_filled = min(self._min_filled, len(self._filled))
+
+        return True
+
+    @io_wrapper
+    def readinto(self, barray):
+        """ readinto(barray) -> Copy up to len(barray) decoded bytes into
+        barray and return the number of bytes read.
+
+        """
+
+        size = len(barray)
+        offset = 0
+
+        while offset < size:
+            if not self._block and not self._next_block():
+                break
+
+            buf, block_size, _ = self._block
+            block_offset = self._block_offset
+
+            count = min(size - offset, block_size - block_offset)
+            barray[offset:offset + count] = \
+                memoryview(buf)[block_offset:block_offset + count]
+
+            offset += count
+            self._block_offset += count
+
+            if self._block_offset == block_size:
+                # Give the buffer back to the decoder.
+                with self._condition:
+                    self._free.append(buf)
+                    self._block = None
+                    self._condition.notify_all()
+
+        return offset
+
+    @io_wrapper
+    def read(self, size):
+        """ read(size) -> Reads size amount of data and returns it.
+
+        """
+
+        return self._read_with_readinto(size)
+    read.__annotations__ = {'size': int, 'return': bytes}
+
+    def close(self):
+        """ close -> Stop the decoder thread and close the source.
+
+        """
+
+        if not self.closed:
+            with self._condition:
+                self._running = False
+                self._condition.notify_all()
+
+            self._thread.join()
+
+            self._source.close()
+
+            self._closed = True
+
@@ -92,9 +92,9 @@ class RawFile(AudioIO):
     write.__annotations__ = {'data': bytes, 'return': int}
 
     @io_wrapper
-    def read(self, size):
-        """ read(size=None) -> Reads size amount of data and returns it.  If
-        size is None then read a buffer size.
+    def readinto(self, barray):
+        """ readinto(barray) -> Read up to len(barray) bytes straight into the
+        bytearray barray and return the number of bytes read.
 
         """
 
@@ -103,7 +103,16 @@ class RawFile(AudioIO):
                 self._loop_count += 1
                 self.seek(0)
 
-        return self._file.read(size)
+        return self._file.readinto(barray)
+
+    @io_wrapper
+    def read(self, size):
+        """ read(size=None) -> Reads size amount of data and returns it.  If
+        size is None then read a buffer size.
+
+        """
+
+        return self._read_with_readinto(size)
     read.__annotations__ = {'size': int, 'return': bytes}
 
     def close(self):
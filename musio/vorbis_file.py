@@ -24,10 +24,12 @@
 """
 
 from os.path import isfile as os_isfile
-from array import array
 
 from .io_base import AudioIO, io_wrapper
-from .io_util import slice_buffer
+from .io_util import c_array_from, zero_fill
+from .buffer_util import reuse_array
+from .conversion_util import VORBIS_LAYOUTS, convert_samples, sample_dtype
+from .conversion_util import unpack_three_byte
 # from .ogg import vorbisfile as _vorbisfile
 # from .ogg import vorbisenc as _vorbisenc
 from .import_util import LazyImport
@@ -53,17 +55,19 @@ class VorbisFile(AudioIO):
     """
 
     # Valid bit depths
-    _valid_depth = (32, 16, 8)
+    _valid_depth = (32, 24, 16, 8)
 
     # Both reading and writing are supported
     _supported_modes = 'rw'
 
     def __init__(self, filename, mode='r', depth=16, rate=44100, channels=2,
                  bigendian=False, unsigned=False, quality=.5, comment_dict={},
-                 **kwargs):
+                 floatp=False, **kwargs):
         """ VorbisFile(filename, mode='r', depth=16, channels=2,
-        bigendian=False, unsigned=False,) -> Initialize the file object for
-        reading and writing.
+        bigendian=False, unsigned=False, floatp=False) -> Initialize the file
+        object for reading and writing.  If floatp is True the file is decoded
+        to, or encoded from, 32-bit floats.  24-bit samples are written
+        packed in three bytes.
 
         """
 
@@ -79,17 +83,50 @@ class VorbisFile(AudioIO):
             if not os_isfile(filename):
                 raise OSError("File not found: %s" % filename)
 
+            if floatp:
+                # Decode with ov_read_float to native 32-bit floats.
+                self._floatp = True
+                self._depth = 32
+                self._width = 4
+                self._unsigned = False
+                self._signed = True
+            elif self._depth not in (8, 16):
+                # ov_read only decodes to 8 or 16-bit samples.
+                self._depth = 16
+                self._width = 2
+
             self._vorbis_file = self._read_open(filename)
 
-            file_pointer = _vorbisfile.pointer(self._vorbis_file)
-            self._length = _vorbisfile.ov_pcm_total(file_pointer, -1)
+            # The pointers the decoder is called with, and the buffer read
+            # decodes into, are kept for the life of the file.
+            self._file_pointer = _vorbisfile.pointer(self._vorbis_file)
+            self._bitstream = _vorbisfile.pointer(_vorbisfile.c_int())
+            self._pcm = _vorbisfile.POINTER(_vorbisfile.POINTER(
+                _vorbisfile.c_float))()
+            self._pcm_ref = _vorbisfile.byref(self._pcm)
+            self._decode_buffer = bytearray()
 
-            self._data = b''
+            self._length = _vorbisfile.ov_pcm_total(self._file_pointer, -1)
         else:
             self._quality = quality
             self._comment_dict = comment_dict
             self._info_dict.update(self._comment_dict)
 
+            if floatp:
+                self._floatp = True
+                self._depth = 32
+                self._width = 4
+                self._unsigned = False
+                self._signed = True
+            self.three_byte = self._depth == 24 and not floatp
+
+            # The bytes of a frame the last write ended with, and the
+            # reused array 24-bit samples are unpacked into.
+            sample_size = 3 if self.three_byte else self._width
+            self._frame_size = sample_size * self._channels
+            self._partial = b''
+            self._samples = None
+
             self._stream_state = _vorbisenc.OggStreamState()
             self._page = _vorbisenc.OggPage()
             self._packet = _vorbisenc.OggPacket()
@@ -126,20 +163,25 @@ class VorbisFile(AudioIO):
 
         """
 
-        file_pointer = _vorbisfile.pointer(self._vorbis_file)
+        if _vorbisfile.ov_seekable(self._file_pointer):
+            _vorbisfile.ov_pcm_seek_lap(self._file_pointer, position)
+
+    def _set_position_fast(self, position):
+        """ Change the position of playback to the start of the page
+        containing position, without decoding up to it.
+
+        """
 
-        if _vorbisfile.ov_seekable(file_pointer):
-            _vorbisfile.ov_pcm_seek_lap(file_pointer, position)
+        if _vorbisfile.ov_seekable(self._file_pointer):
+            _vorbisfile.ov_pcm_seek_page_lap(self._file_pointer, position)
 
     def _get_position(self):
         """ Updates the position variable.
 
         """
 
-        file_pointer = _vorbisfile.pointer(self._vorbis_file)
-
         # Update the position.
-        return _vorbisfile.ov_pcm_tell(file_pointer)
+        return _vorbisfile.ov_pcm_tell(self._file_pointer)
 
     def __repr__(self):
         """ __repr__ -> Returns a python expression to recreate this instance.
@@ -171,6 +213,9 @@ class VorbisFile(AudioIO):
         self._channels = info.contents.channels
         self._rate = info.contents.rate
 
+        # Vorbis orders the channels differently from WAVE files.
+        self._layout = VORBIS_LAYOUTS.get(self._channels, None)
+
         vendor = comments.contents.vendor
         self._info_dict['Vendor'] = vendor
 
@@ -212,38 +257,107 @@ class VorbisFile(AudioIO):
         return vorbis_file
 
     @io_wrapper
-    def read(self, size):
-        """ read(size) -> Reads size amount of data and returns it.  If
-        size is None then read a buffer size.
+    def readinto(self, barray):
+        """ readinto(barray) -> Decode up to len(barray) bytes straight into
+        the bytearray barray and return the number of bytes read.
 
         """
 
-        bytesread = -1
+        if self._floatp:
+            return self._readinto_float(barray)
 
-        bitstream = _vorbisfile.pointer(_vorbisfile.c_int())
+        size = len(barray)
+        offset = 0
 
-        # Create the read buffer.
-        str_buf = _vorbisfile.create_string_buffer(size)
+        # ov_read decodes at most a packet per call so keep the loop to
+        # locals.
+        ov_read = _vorbisfile.ov_read
+        c_char = _vorbisfile.c_char
+        file_pointer = self._file_pointer
+        bitstream = self._bitstream
+        bigendian = int(self._bigendian)
+        width = self._width
+        signed = int(self._signed)
+        hole = _vorbisfile.OV_HOLE
 
-        # Start with any unused data from the last read.
-        data = self._data
+        while offset < size:
+            # Decode into the unused part of barray.
+            out_buffer = c_array_from(c_char, barray, offset)
 
-        file_pointer = _vorbisfile.pointer(self._vorbis_file)
-
-        while len(data) < size:
             # Read the data from the file.
-            bytesread = _vorbisfile.ov_read(file_pointer, str_buf, size,
-                                            int(self._bigendian), self._width,
-                                            int(self._signed), bitstream)
+            bytesread = ov_read(file_pointer, out_buffer, size - offset,
+                                bigendian, width, signed, bitstream)
+
+            # Skip over holes in the data.
+            if bytesread == hole:
+                continue
 
             # Check how many bytes were read.
-            if bytesread == 0:
+            if bytesread <= 0:
+                # Check if we should loop.
+                if self._loops != -1 and self._loop_count >= self._loops:
+                    # Fill the rest of the buffer with blank data and
+                    # exit.
+                    if offset != 0:
+                        zero_fill(barray, offset)
+                        offset = size
+                    break
+                else:
+                    # Increment the loop counter.
+                    self._loop_count += 1
+
+                    # Seek to the start and continue reading.
+                    self.seek(0)
+                    continue
+
+            offset += bytesread
+
+        return offset
+
+    def _readinto_float(self, barray):
+        """ _readinto_float(barray) -> Decode whole frames of 32-bit floats
+        into barray with ov_read_float and return the number of bytes read.
+
+        """
+
+        import numpy
+
+        channels = self._channels
+        frame_size = channels * 4
+        frames = len(barray) // frame_size
+
+        # View barray as interleaved float frames.
+        out = numpy.frombuffer(barray, numpy.float32, frames * channels)
+        out = out.reshape(frames, channels)
+
+        offset = 0
+
+        ov_read_float = _vorbisfile.ov_read_float
+        as_array = numpy.ctypeslib.as_array
+        file_pointer = self._file_pointer
+        bitstream = self._bitstream
+        pcm = self._pcm
+        pcm_ref = self._pcm_ref
+        hole = _vorbisfile.OV_HOLE
+
+        while offset < frames:
+            # pcm is set to an array of pointers to each channel's block of
+            # decoded floats.
+            samples = ov_read_float(file_pointer, pcm_ref, frames - offset,
+                                    bitstream)
+
+            # Skip over holes in the data.
+            if samples == hole:
+                continue
+
+            if samples <= 0:
                 # Check if we should loop.
                 if self._loops != -1 and self._loop_count >= self._loops:
                     # Fill the rest of the buffer with blank data and
                     # exit.
-                    if len(data) != 0:
-                        data += b'\x00' * (size - len(data))
+                    if offset != 0:
+                        out[offset:] = 0
+                        offset = frames
                     break
                 else:
                     # Increment the loop counter.
@@ -253,14 +367,32 @@ class VorbisFile(AudioIO):
                     self.seek(0)
                     continue
 
-            # append the data read to the buffer.
-            data += _vorbisfile.string_at(str_buf, bytesread)
+            # Interleave the channels into out.
+            for channel in range(channels):
+                out[offset:offset + samples, channel] = \
+                    as_array(pcm[channel], (samples, ))
+
+            offset += samples
+
+        return offset * frame_size
+
+    @io_wrapper
+    def read(self, size):
+        """ read(size) -> Reads size amount of data and returns it.  If
+        size is None then read a buffer size.
 
-        # Store extra data for the next read.
-        self._data = data[size:]
+        """
+
+        # Decode into the file's buffer, which is kept while reads are the
+        # same size.
+        if len(self._decode_buffer) != size:
+            self._decode_buffer = bytearray(size)
 
-        # Only return the amount asked for.
-        return data[:size]
+        # readinto gets the bytearray itself, since ctypes and numpy on
+        # Python 2 won't take a writable memoryview.
+        data = self._decode_buffer
+
+        return memoryview(data)[:self.readinto(data) or 0].tobytes()
     read.__annotations__ = {'size': int, 'return': bytes}
 
     def _read_close(self):
@@ -269,7 +401,8 @@ class VorbisFile(AudioIO):
         """
 
         if not self.closed:
-            _vorbisfile.ov_clear(_vorbisfile.byref(self._vorbis_file))
+            _vorbisfile.ov_clear(self._file_pointer)
+            self._file_pointer = None
             self._vorbis_file = None
 
             self._closed = True
@@ -302,10 +435,11 @@ class VorbisFile(AudioIO):
         self._stream_state.packetin(header_code)
 
         vorbis_file = open(filename, 'wb')
+        self._vorbis_file = vorbis_file
 
         # Initialize the file.
         while self._stream_state.flush(self._page):
-            vorbis_file.write(bytes(self._page))
+            self._write_page()
 
         # The file is now open.
         self._closed = False
@@ -314,55 +448,91 @@ class VorbisFile(AudioIO):
 
     @io_wrapper
     def write(self, data):
-        """ write(str) -> Encodes and writes str to an ogg file.
+        """ write(data) -> Encode data and write it to the ogg file, and
+        return the number of bytes of data used.
 
         """
 
-        written = 0
-
-        for data_buffer in slice_buffer(data, self.buffer_size):
-            out_data = self._encode(data_buffer)
-            self._vorbis_file.write(out_data)
-            written += len(out_data)
+        self._encode(data)
 
-        return written
+        return len(data)
     write.__annotations__ = {'data': bytes, 'return': int}
 
+    def _to_samples(self, data):
+        """ _to_samples(data) -> Return the whole frames in data, after any
+        left from the last write, as a (frames, channels) numpy array.
+
+        """
+
+        import numpy
+
+        if self._partial:
+            data = self._partial + memoryview(data).tobytes()
+
+        # Keep the bytes of a partial frame for the next write.
+        extra = len(data) % self._frame_size
+        self._partial = memoryview(data)[len(data) - extra:].tobytes() \
+            if extra else b''
+
+        raw = numpy.frombuffer(data, numpy.uint8, len(data) - extra)
+
+        if self.three_byte:
+            self._samples = reuse_array(self._samples, len(raw) // 3,
+                                        'u4' if self._unsigned else 'i4')
+            samples = unpack_three_byte(raw, self._bigendian, self._unsigned,
+                                        self._samples[:len(raw) // 3])
+        else:
+            samples = raw.view(sample_dtype(self._depth, self._unsigned,
+                                            self._bigendian, self._floatp))
+
+        return samples.reshape(-1, self._channels)
+
     def _fill_buffer(self, data):
-        """ fill_buffer(data) -> Fill the dsp buffer with data.
-        De-interleaves the data in 'data', and puts it in the dsps two
-        dimensional floating point array.
+        """ _fill_buffer(data) -> De-interleave the samples in data into the
+        dsp's float buffer, scaled to between -1.0 and 1.0, and return the
+        number of frames.
 
         """
 
-        data_size = len(data) // (self._depth // (8 // self._channels))
+        import numpy
+
+        samples = self._to_samples(data)
+        frames = len(samples)
+        if not frames:
+            return 0
+
+        # One float array per channel.
+        dsp_buffer = self._dsp_state.get_buffer(frames)
 
-        dsp_buffer = self._dsp_state.get_buffer(data_size)
+        for channel in range(self._channels):
+            out = numpy.ctypeslib.as_array(dsp_buffer[channel], (frames, ))
+            convert_samples(samples[:, channel], self._depth, self._unsigned,
+                            numpy.float32, out)
 
-        bytebuffer = array('h', data)
+        return frames
 
-        for i in range(data_size):
-            for j in range(self._channels):
-                dsp_buffer[j][i] = bytebuffer[i * self._channels + j] / 32768.0
-            # dsp_buffer[0][i] = (bytebuffer[i * self._channels] |
-            #                     (bytebuffer[i] % 255)) / 32768.0
-            # if self._channels != 1:
-            #     dsp_buffer[1][i] = (bytebuffer[i * 2 + 1] |
-            #                         (bytebuffer[i + 1] % 255)) / 32768.0
+    def _write_page(self):
+        """ _write_page() -> Write the header and body of the current page to
+        the file.
 
-        return data_size
+        """
+
+        page = self._page
+        self._vorbis_file.write(_vorbisenc.string_at(page.header,
+                                                     page.header_len))
+        self._vorbis_file.write(_vorbisenc.string_at(page.body,
+                                                     page.body_len))
 
     def _encode(self, data):
-        """ _encode(str) -> Returns the vorbis encoded str.
+        """ _encode(data) -> Encode data, or finish the stream if data is
+        None, and write the pages to the file.
 
         """
 
         data_size = self._fill_buffer(data) if data else 0
 
-        self._dsp_state.wrote(data_size)
-
-        # Vorbis data buffer
-        page_buffer = b''
+        if data_size or data is None:
+            self._dsp_state.wrote(data_size)
 
         while self._dsp_state.blockout(self._block) == 1:
             self._block.analysis(None)
@@ -371,9 +541,7 @@ class VorbisFile(AudioIO):
                 self._stream_state.packetin(self._packet)
                 while not self._page.eos:
                     if not self._stream_state.pageout(self._page): break
-                    page_buffer += bytes(self._page)
-
-        return page_buffer
+                    self._write_page()
 
     def _write_close(self):
         """ close -> Closes and cleans up.
@@ -382,7 +550,7 @@ class VorbisFile(AudioIO):
 
         if not self.closed:
             # Finalize the file.
-            self._vorbis_file.write(self._encode(None))
+            self._encode(None)
 
             # Close and clear everything.
             self._vorbis_file.close()
@@ -108,19 +108,32 @@ class WaveFile(AudioIO):
     write.__annotations__ = {'data': bytes, 'return': int}
 
     @io_wrapper
-    def read(self, size):
-        """ read(size=None) -> Reads size amount of data and returns it.
+    def readinto(self, barray):
+        """ readinto(barray) -> Read up to len(barray) bytes of whole frames
+        into the bytearray barray and return the number of bytes read.
 
         """
 
-        size //= self._channels * (self._depth >> 3)
+        frame_size = self._channels * (self._depth >> 3)
 
         if self.position >= self._length:
             if self._loops == -1 or self._loop_count < self._loops:
                 self._loop_count += 1
                 self.seek(0)
 
-        return self._wave.readframes(size)
+        # The wave module only returns new strings, so this is the one copy.
+        data = self._wave.readframes(len(barray) // frame_size)
+        barray[:len(data)] = memoryview(data)
+
+        return len(data)
+
+    @io_wrapper
+    def read(self, size):
+        """ read(size=None) -> Reads size amount of data and returns it.
+
+        """
+
+        return self._read_with_readinto(size)
     read.__annotations__ = {'size': int, 'return': bytes}
 
     def _open(self, filename):
@@ -24,6 +24,7 @@
 """
 
 from musio.io_base import AudioIO, io_wrapper
+from .io_util import c_array_from, zero_fill
 # from .xmp import _xmp
 from .import_util import LazyImport
 
@@ -86,8 +87,6 @@ class XMPFile(AudioIO):
 
         self._length = self.__frame_info.total_time
 
-        self._data = b''
-
         self._load_info()
 
     def to_seconds(self, position):
@@ -195,6 +194,42 @@ class XMPFile(AudioIO):
         if comment:
             self._info_dict['comment'] = comment.decode('cp437', 'replace')
 
+    @io_wrapper
+    def readinto(self, barray):
+        """ readinto(barray) -> Play up to len(barray) bytes straight into
+        the bytearray barray and return the number of bytes read.
+
+        """
+
+        size = len(barray)
+
+        out_buffer = c_array_from(_xmp.c_char, barray)
+
+        # Play one loop of the module at a time so the loops can be counted
+        # here.
+        ret = _xmp.xmp_play_buffer(self.__xmp_context, out_buffer, size, 1)
+
+        # Update the position.
+        _xmp.xmp_get_frame_info(self.__xmp_context,
+                                _xmp.byref(self.__frame_info))
+
+        if ret != 0:
+            if self._loops != -1 and self._loop_count >= self._loops:
+                return 0
+
+            # Restart the player.
+            _xmp.xmp_end_player(self.__xmp_context)
+            _xmp.xmp_start_player(self.__xmp_context, self._rate,
+                                  self._flags)
+
+            # Fill the buffer so we return the requested size.
+            zero_fill(barray)
+
+            # Update the loop count.
+            self._loop_count += 1
+
+        return size
+
     @io_wrapper
     def read(self, size):
         """ read(size=None) -> Reads size amount of data and returns it.  If
@@ -202,45 +237,7 @@ class XMPFile(AudioIO):
 
         """
 
-        # Only update the global data buffer.
-        data = self._data
-        old_count = 0
-
-        while not data or len(data) < size:
-            # Get the next data block.
-            _xmp.xmp_get_frame_info(self.__xmp_context,
-                                    _xmp.byref(self.__frame_info))
-
-            if self.__frame_info.loop_count > old_count or \
-                    _xmp.xmp_play_frame(self.__xmp_context) != 0:
-                old_count = self.__frame_info.loop_count
-                if self._loops != -1 and self._loop_count >= self._loops:
-                    # Fill the data buffer with nothing so it will be a
-                    # frame size for output.
-                    if len(data) != 0:
-                        data += b'\x00' * (size - len(data))
-                else:
-                    # self.seek(0)
-                    _xmp.xmp_end_player(self.__xmp_context)
-                    _xmp.xmp_start_player(self.__xmp_context, self._rate, 0)
-
-                    # Fill the buffer so we return the requested size.
-                    data += b'\x00' * (size - len(data))
-
-                    # Update the loop count and seek to the start.
-                    self._loop_count += 1
-
-                break
-
-            # Append the decoded data to the buffer.
-            data += _xmp.string_at(self.__frame_info.buffer,
-                                   self.__frame_info.buffer_size)
-
-        # Store extra data for next time.
-        self._data = data[size:]
-
-        # Make sure we return only the number of bytes requested.
-        return data[:size]
+        return self._read_with_readinto(size)
     read.__annotations__ = {'size': int, 'return': bytes}
 
     def close(self):
@@ -40,6 +40,7 @@ setup(
     url='http://www.github.com/zepto/musio',
     download_url='http://www.github.com/zepto/musio/downloads',
     license='LICENSE.txt',
+    requires=['numpy'],
     keywords=['audio', 'portaudio', 'alsa', 'ffmpeg'],
     classifiers=[
         'Programming Language :: Python :: 3',
@@ -12,6 +12,8 @@ if __name__ == '__main__':
             help="Remove list")
     opts.add_option("-o", "--output", action="store", type="string", dest="output", 
             help="Output File")
+    opts.add_option("-z", "--lazy", action="store_true", dest="lazy",
+            default=False, help="Only bind the functions when they are used")
 
     options, args = opts.parse_args()
     if args:
@@ -52,6 +54,7 @@ if __name__ == '__main__':
             'char': 'c_char',
             }
 
+    output = []
     with open(options.input, 'r') as infile:
         for line in infile.readlines():
             m = fr.match(line)
@@ -134,7 +137,14 @@ if __name__ == '__main__':
                 #print str2
                 #print str3
             if c_str:
-                print c_str
+                output.append('%s\n' % c_str)
             else:
-                print line,
+                output.append(line)
+
+    output = ''.join(output)
+    if options.lazy:
+        from lazybind import lazy_bindings
+        output = lazy_bindings(output, options.input)
+
+    sys.stdout.write(output)
 
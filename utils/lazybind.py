@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+# vim: sw=4:ts=4:sts=4:fdm=indent:fdl=0:
+# -*- coding: UTF8 -*-
+#
+# Make generated ctypes bindings lazy.
+# Copyright (C) 2013 Josiah Gordon <josiahg@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" Rewrite a ctypes binding module made by xml2py or convh.py so its
+functions, structures and the types that use them are only defined when they
+are first accessed.
+
+Constants and plain ctypes typedefs are still defined when the module is
+imported.  The code for everything else is kept as a string with the name it
+defines and the other lazy names it uses, and the module ends with a call to
+musio.import_util.bind_lazily.
+
+"""
+
+from __future__ import print_function
+
+import ast
+import sys
+from optparse import OptionParser
+
+# Calls that load a native library.
+_LOADERS = ('CDLL', 'cdll', 'find_library', 'LoadLibrary')
+
+
+def _names(node):
+    """ _names(node) -> Return the set of names node loads.
+
+    """
+
+    return set(child.id for child in ast.walk(node)
+               if isinstance(child, ast.Name) and
+               not isinstance(child.ctx, ast.Store))
+
+
+def _loads_library(node):
+    """ _loads_library(node) -> True if node loads a native library or looks
+    up a symbol in one.
+
+    """
+
+    for child in ast.walk(node):
+        if isinstance(child, ast.Call):
+            func = child.func
+            name = getattr(func, 'id', getattr(func, 'attr', ''))
+            if name in _LOADERS:
+                return True
+        elif isinstance(child, ast.Subscript):
+            if getattr(child.value, 'id', '') == '_libraries':
+                return True
+
+    return False
+
+
+def _target(node):
+    """ _target(node) -> Return the name the statement node defines or
+    changes an attribute of, or None if it isn't one that can be lazy.
+
+    """
+
+    if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+        return node.name
+
+    if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+        return None
+
+    target = node.targets[0]
+    if isinstance(target, ast.Name):
+        return target.id
+    elif isinstance(target, ast.Attribute) and \
+            isinstance(target.value, ast.Name):
+        return target.value.id
+
+    return None
+
+
+def _is_empty_class(node):
+    """ _is_empty_class(node) -> True if node defines a class with one base
+    and no body.
+
+    """
+
+    return isinstance(node, ast.ClassDef) and len(node.bases) == 1 and \
+        isinstance(node.bases[0], ast.Name) and not node.decorator_list and \
+        not getattr(node, 'keywords', None) and \
+        all(isinstance(child, ast.Pass) for child in node.body)
+
+
+def _is_libraries(node):
+    """ _is_libraries(node) -> True if node creates or fills the _libraries
+    dictionary.
+
+    """
+
+    if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+        return False
+
+    target = node.targets[0]
+    if isinstance(target, ast.Name):
+        return target.id == '_libraries'
+    elif isinstance(target, ast.Subscript):
+        return getattr(target.value, 'id', '') == '_libraries'
+
+    return False
+
+
+def lazy_bindings(source, filename='<bindings>'):
+    """ lazy_bindings(source, filename='<bindings>') -> Return the lazy
+    version of the binding module source.
+
+    """
+
+    lines = source.splitlines(True)
+    body = ast.parse(source, filename).body
+
+    # The lines of each statement, and the comments and blank lines after
+    # it kept separately so they stay where they are.
+    statements = []
+    for index, node in enumerate(body):
+        end = body[index + 1].lineno - 1 if index + 1 < len(body) \
+            else len(lines)
+        text = lines[node.lineno - 1:end]
+
+        trailing = []
+        while text and (not text[-1].strip() or
+                        text[-1].lstrip().startswith('#')):
+            trailing.insert(0, text.pop())
+
+        statements.append((node, ''.join(text), ''.join(trailing)))
+
+    # Start with what has to be lazy, then make everything that refers to
+    # a lazy name lazy too.
+    lazy = set()
+    for node, _, _ in statements:
+        name = _target(node)
+        if name and (isinstance(node, ast.ClassDef) or _loads_library(node)):
+            lazy.add(name)
+
+    changed = True
+    while changed:
+        changed = False
+        for node, _, _ in statements:
+            name = _target(node)
+            if name and name not in lazy and _names(node) & lazy:
+                lazy.add(name)
+                changed = True
+
+    eager = []
+    definitions = {}
+    order = []
+    for node, text, trailing in statements:
+        name = _target(node)
+        if _is_libraries(node):
+            # The libraries are loaded by LazyLibraries when they are
+            # first looked up.
+            if isinstance(node.targets[0], ast.Name):
+                eager.append('_libraries = _LazyLibraries()\n')
+        elif name in lazy:
+            if name not in definitions:
+                definitions[name] = [None, set(), []]
+                order.append(name)
+            base, uses, texts = definitions[name]
+
+            if _is_empty_class(node) and not texts and base is None:
+                # Empty classes are created by bind_lazily so the names
+                # that refer to them can be defined first.
+                definitions[name][0] = node.bases[0].id
+            else:
+                texts.append(text)
+            uses.update(_names(node) & lazy)
+        else:
+            if _names(node) & lazy:
+                raise ValueError("line %d uses a lazy name at import" %
+                                 node.lineno)
+            eager.append(text)
+
+        eager.append(trailing)
+
+    helpers = ['from ..import_util import LazyLibraries as _LazyLibraries\n',
+               'from ..import_util import bind_lazily as _bind_lazily\n']
+
+    output = []
+    for text in eager:
+        # Import the helpers after the ctypes import.
+        output.append(text)
+        if helpers and text.startswith('from ctypes import *'):
+            output.extend(helpers)
+            helpers = []
+
+    # Output from convh.py doesn't import ctypes.
+    output[:0] = helpers
+
+    # The code that finishes defining each name is kept as a string and only
+    # compiled when the name is first accessed, since unmarshalling a code
+    # object for every name is most of the time an import takes.
+    output.append('\n\n# The base class, lazy names used and code that finishes '
+                  'defining each\n# lazy name.\n')
+    output.append('_definitions = {\n')
+    for name in order:
+        base, uses, texts = definitions[name]
+        uses.discard(name)
+        output.append('    %r: (%r, %r,' % (name, base, tuple(sorted(uses))))
+        if texts:
+            output.append('\n')
+            for line in ''.join(texts).rstrip('\n').splitlines(True):
+                output.append('        %r\n' % line)
+            output.append('        ),\n')
+        else:
+            output.append(' None),\n')
+    output.append('}\n\n')
+    output.append('_bind_lazily(__name__, _definitions)\n')
+
+    return ''.join(output)
+
+
+if __name__ == '__main__':
+    opts = OptionParser("usage: %prog [options]")
+    opts.add_option("-i", "--input", action="store", type="string",
+                    dest="input", help="Input File")
+    opts.add_option("-o", "--output", action="store", type="string",
+                    dest="output", help="Output File")
+
+    options, args = opts.parse_args()
+    if args or not options.input:
+        opts.print_help()
+        sys.exit(1)
+
+    with open(options.input, 'r') as infile:
+        source = infile.read()
+
+    result = lazy_bindings(source, options.input)
+
+    if options.output:
+        with open(options.output, 'w') as outfile:
+            outfile.write(result)
+    else:
+        sys.stdout.write(result)
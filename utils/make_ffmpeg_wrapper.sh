@@ -2,3 +2,4 @@
 h2xml.py -c -I/usr/include/libavcodec -I/usr/include/libavformat -I/usr/include/libavdevice -I/usr/include/libswscale -I/usr/include/libavfilter -I/usr/include/libpostproc -I/usr/include/libavresample -I/usr/include/libavutil /usr/include/libavcodec/avcodec.h /usr/include/libavformat/avformat.h /usr/include/libswscale/swscale.h /usr/include/libavdevice/avdevice.h /usr/include/libavfilter/avfilter.h /usr/include/libpostproc/postprocess.h /usr/include/libavresample/avresample.h /usr/include/libavutil/avutil.h /usr/include/libavutil/opt.h /usr/include/libavutil/mathematics.h -o av.xml -D __STDC_CONSTANT_MACROS
 xml2py av.xml -o av.py -l /usr/lib/libavcodec.so -l /usr/lib/libavformat.so -l /usr/lib/libswscale.so -l /usr/lib/libavdevice.so -l /usr/lib/libavfilter.so -l /usr/lib/libpostproc.so -l /usr/lib/libavresample.so -l /usr/lib/libavutil.so
 sed -i 's/\([[:digit:]]\)L\>/\1/g' av.py
+python "$(dirname "$0")/lazybind.py" -i av.py -o av.py
@@ -2,3 +2,4 @@
 h2xml.py -c /usr/include/mikmod.h -o mikmod.xml -D __STDC_CONSTANT_MACROS
 xml2py mikmod.xml -o mikmod.py -l /usr/lib/libmikmod.so
 sed -i 's/\([[:digit:]]\)L\>/\1/g' mikmod.py
+python "$(dirname "$0")/lazybind.py" -i mikmod.py -o mikmod.py
@@ -2,3 +2,4 @@
 h2xml.py -c -I/usr/include/mp4v2 /usr/include/mp4v2/mp4v2.h -o mp4v2.xml -D __STDC_CONSTANT_MACROS
 xml2py mp4v2.xml -o mp4v2.py -l /usr/lib/libmp4v2.so
 sed -i 's/\([[:digit:]]\)L\>/\1/g' mp4v2.py
+python "$(dirname "$0")/lazybind.py" -i mp4v2.py -o mp4v2.py